@@ -0,0 +1,708 @@
+
+
+# tuple of Unicode Bidi_Class (short) names. The index of the class in the tuple is the bidi class id.
+bidi_class_names = (
+ "L",
+ "R",
+ "AL",
+ "EN",
+ "ES",
+ "ET",
+ "AN",
+ "CS",
+ "NSM",
+ "BN",
+ "B",
+ "S",
+ "WS",
+ "ON",
+ "LRE",
+ "LRO",
+ "RLE",
+ "RLO",
+ "PDF",
+ "LRI",
+ "RLI",
+ "FSI",
+ "PDI",
+)
+
+
+# dictionary of Unicode bidi classes
+# entries are: key: (f, l, bc), where
+#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.
+#     bc - the bidi class id.
+# code points not in the map have bidi class L.
+bidi_class_map = {
+ 0x0000: (0x0000, 0x0008, 9),  #  BN
+ 0x0009: (0x0009, 0x0009, 11),  #  S
+ 0x000a: (0x000a, 0x000a, 10),  #  B
+ 0x000b: (0x000b, 0x000b, 11),  #  S
+ 0x000c: (0x000c, 0x000c, 12),  #  WS
+ 0x000d: (0x000d, 0x000d, 10),  #  B
+ 0x000e: (0x000e, 0x001b, 9),  #  BN
+ 0x001c: (0x001c, 0x001e, 10),  #  B
+ 0x001f: (0x001f, 0x001f, 11),  #  S
+ 0x0020: (0x0020, 0x0020, 12),  #  WS
+ 0x0021: (0x0021, 0x0022, 13),  #  ON
+ 0x0023: (0x0023, 0x0025, 5),  #  ET
+ 0x0026: (0x0026, 0x002a, 13),  #  ON
+ 0x002b: (0x002b, 0x002b, 4),  #  ES
+ 0x002c: (0x002c, 0x002c, 7),  #  CS
+ 0x002d: (0x002d, 0x002d, 4),  #  ES
+ 0x002e: (0x002e, 0x002f, 7),  #  CS
+ 0x0030: (0x0030, 0x0039, 3),  #  EN
+ 0x003a: (0x003a, 0x003a, 7),  #  CS
+ 0x003b: (0x003b, 0x0040, 13),  #  ON
+ 0x005b: (0x005b, 0x0060, 13),  #  ON
+ 0x007b: (0x007b, 0x007e, 13),  #  ON
+ 0x007f: (0x007f, 0x0084, 9),  #  BN
+ 0x0085: (0x0085, 0x0085, 10),  #  B
+ 0x0086: (0x0086, 0x009f, 9),  #  BN
+ 0x00a0: (0x00a0, 0x00a0, 7),  #  CS
+ 0x00a1: (0x00a1, 0x00a1, 13),  #  ON
+ 0x00a2: (0x00a2, 0x00a5, 5),  #  ET
+ 0x00a6: (0x00a6, 0x00a9, 13),  #  ON
+ 0x00ab: (0x00ab, 0x00ac, 13),  #  ON
+ 0x00ad: (0x00ad, 0x00ad, 9),  #  BN
+ 0x00ae: (0x00ae, 0x00af, 13),  #  ON
+ 0x00b0: (0x00b0, 0x00b1, 5),  #  ET
+ 0x00b2: (0x00b2, 0x00b3, 3),  #  EN
+ 0x00b4: (0x00b4, 0x00b4, 13),  #  ON
+ 0x00b6: (0x00b6, 0x00b8, 13),  #  ON
+ 0x00b9: (0x00b9, 0x00b9, 3),  #  EN
+ 0x00bb: (0x00bb, 0x00bf, 13),  #  ON
+ 0x00d7: (0x00d7, 0x00d7, 13),  #  ON
+ 0x00f7: (0x00f7, 0x00f7, 13),  #  ON
+ 0x02b9: (0x02b9, 0x02ba, 13),  #  ON
+ 0x02c2: (0x02c2, 0x02cf, 13),  #  ON
+ 0x02d2: (0x02d2, 0x02df, 13),  #  ON
+ 0x02e5: (0x02e5, 0x02ed, 13),  #  ON
+ 0x02ef: (0x02ef, 0x02ff, 13),  #  ON
+ 0x0300: (0x0300, 0x036f, 8),  #  NSM
+ 0x0374: (0x0374, 0x0375, 13),  #  ON
+ 0x037e: (0x037e, 0x037e, 13),  #  ON
+ 0x0384: (0x0384, 0x0385, 13),  #  ON
+ 0x0387: (0x0387, 0x0387, 13),  #  ON
+ 0x03f6: (0x03f6, 0x03f6, 13),  #  ON
+ 0x0483: (0x0483, 0x0489, 8),  #  NSM
+ 0x058a: (0x058a, 0x058a, 13),  #  ON
+ 0x058d: (0x058d, 0x058e, 13),  #  ON
+ 0x058f: (0x058f, 0x058f, 5),  #  ET
+ 0x0590: (0x0590, 0x0590, 1),  #  R
+ 0x0591: (0x0591, 0x05bd, 8),  #  NSM
+ 0x05be: (0x05be, 0x05be, 1),  #  R
+ 0x05bf: (0x05bf, 0x05bf, 8),  #  NSM
+ 0x05c0: (0x05c0, 0x05c0, 1),  #  R
+ 0x05c1: (0x05c1, 0x05c2, 8),  #  NSM
+ 0x05c3: (0x05c3, 0x05c3, 1),  #  R
+ 0x05c4: (0x05c4, 0x05c5, 8),  #  NSM
+ 0x05c6: (0x05c6, 0x05c6, 1),  #  R
+ 0x05c7: (0x05c7, 0x05c7, 8),  #  NSM
+ 0x05c8: (0x05c8, 0x05ff, 1),  #  R
+ 0x0600: (0x0600, 0x0605, 6),  #  AN
+ 0x0606: (0x0606, 0x0607, 13),  #  ON
+ 0x0608: (0x0608, 0x0608, 2),  #  AL
+ 0x0609: (0x0609, 0x060a, 5),  #  ET
+ 0x060b: (0x060b, 0x060b, 2),  #  AL
+ 0x060c: (0x060c, 0x060c, 7),  #  CS
+ 0x060d: (0x060d, 0x060d, 2),  #  AL
+ 0x060e: (0x060e, 0x060f, 13),  #  ON
+ 0x0610: (0x0610, 0x061a, 8),  #  NSM
+ 0x061b: (0x061b, 0x064a, 2),  #  AL
+ 0x064b: (0x064b, 0x065f, 8),  #  NSM
+ 0x0660: (0x0660, 0x0669, 6),  #  AN
+ 0x066a: (0x066a, 0x066a, 5),  #  ET
+ 0x066b: (0x066b, 0x066c, 6),  #  AN
+ 0x066d: (0x066d, 0x066f, 2),  #  AL
+ 0x0670: (0x0670, 0x0670, 8),  #  NSM
+ 0x0671: (0x0671, 0x06d5, 2),  #  AL
+ 0x06d6: (0x06d6, 0x06dc, 8),  #  NSM
+ 0x06dd: (0x06dd, 0x06dd, 6),  #  AN
+ 0x06de: (0x06de, 0x06de, 13),  #  ON
+ 0x06df: (0x06df, 0x06e4, 8),  #  NSM
+ 0x06e5: (0x06e5, 0x06e6, 2),  #  AL
+ 0x06e7: (0x06e7, 0x06e8, 8),  #  NSM
+ 0x06e9: (0x06e9, 0x06e9, 13),  #  ON
+ 0x06ea: (0x06ea, 0x06ed, 8),  #  NSM
+ 0x06ee: (0x06ee, 0x06ef, 2),  #  AL
+ 0x06f0: (0x06f0, 0x06f9, 3),  #  EN
+ 0x06fa: (0x06fa, 0x0710, 2),  #  AL
+ 0x0711: (0x0711, 0x0711, 8),  #  NSM
+ 0x0712: (0x0712, 0x072f, 2),  #  AL
+ 0x0730: (0x0730, 0x074a, 8),  #  NSM
+ 0x074b: (0x074b, 0x07a5, 2),  #  AL
+ 0x07a6: (0x07a6, 0x07b0, 8),  #  NSM
+ 0x07b1: (0x07b1, 0x07bf, 2),  #  AL
+ 0x07c0: (0x07c0, 0x07ea, 1),  #  R
+ 0x07eb: (0x07eb, 0x07f3, 8),  #  NSM
+ 0x07f4: (0x07f4, 0x07f5, 1),  #  R
+ 0x07f6: (0x07f6, 0x07f9, 13),  #  ON
+ 0x07fa: (0x07fa, 0x07fc, 1),  #  R
+ 0x07fd: (0x07fd, 0x07fd, 8),  #  NSM
+ 0x07fe: (0x07fe, 0x0815, 1),  #  R
+ 0x0816: (0x0816, 0x0819, 8),  #  NSM
+ 0x081a: (0x081a, 0x081a, 1),  #  R
+ 0x081b: (0x081b, 0x0823, 8),  #  NSM
+ 0x0824: (0x0824, 0x0824, 1),  #  R
+ 0x0825: (0x0825, 0x0827, 8),  #  NSM
+ 0x0828: (0x0828, 0x0828, 1),  #  R
+ 0x0829: (0x0829, 0x082d, 8),  #  NSM
+ 0x082e: (0x082e, 0x0858, 1),  #  R
+ 0x0859: (0x0859, 0x085b, 8),  #  NSM
+ 0x085c: (0x085c, 0x085f, 1),  #  R
+ 0x0860: (0x0860, 0x086f, 2),  #  AL
+ 0x0870: (0x0870, 0x089f, 1),  #  R
+ 0x08a0: (0x08a0, 0x08d2, 2),  #  AL
+ 0x08d3: (0x08d3, 0x08e1, 8),  #  NSM
+ 0x08e2: (0x08e2, 0x08e2, 6),  #  AN
+ 0x08e3: (0x08e3, 0x0902, 8),  #  NSM
+ 0x093a: (0x093a, 0x093a, 8),  #  NSM
+ 0x093c: (0x093c, 0x093c, 8),  #  NSM
+ 0x0941: (0x0941, 0x0948, 8),  #  NSM
+ 0x094d: (0x094d, 0x094d, 8),  #  NSM
+ 0x0951: (0x0951, 0x0957, 8),  #  NSM
+ 0x0962: (0x0962, 0x0963, 8),  #  NSM
+ 0x0981: (0x0981, 0x0981, 8),  #  NSM
+ 0x09bc: (0x09bc, 0x09bc, 8),  #  NSM
+ 0x09c1: (0x09c1, 0x09c4, 8),  #  NSM
+ 0x09cd: (0x09cd, 0x09cd, 8),  #  NSM
+ 0x09e2: (0x09e2, 0x09e3, 8),  #  NSM
+ 0x09f2: (0x09f2, 0x09f3, 5),  #  ET
+ 0x09fb: (0x09fb, 0x09fb, 5),  #  ET
+ 0x09fe: (0x09fe, 0x09fe, 8),  #  NSM
+ 0x0a01: (0x0a01, 0x0a02, 8),  #  NSM
+ 0x0a3c: (0x0a3c, 0x0a3c, 8),  #  NSM
+ 0x0a41: (0x0a41, 0x0a42, 8),  #  NSM
+ 0x0a47: (0x0a47, 0x0a48, 8),  #  NSM
+ 0x0a4b: (0x0a4b, 0x0a4d, 8),  #  NSM
+ 0x0a51: (0x0a51, 0x0a51, 8),  #  NSM
+ 0x0a70: (0x0a70, 0x0a71, 8),  #  NSM
+ 0x0a75: (0x0a75, 0x0a75, 8),  #  NSM
+ 0x0a81: (0x0a81, 0x0a82, 8),  #  NSM
+ 0x0abc: (0x0abc, 0x0abc, 8),  #  NSM
+ 0x0ac1: (0x0ac1, 0x0ac5, 8),  #  NSM
+ 0x0ac7: (0x0ac7, 0x0ac8, 8),  #  NSM
+ 0x0acd: (0x0acd, 0x0acd, 8),  #  NSM
+ 0x0ae2: (0x0ae2, 0x0ae3, 8),  #  NSM
+ 0x0af1: (0x0af1, 0x0af1, 5),  #  ET
+ 0x0afa: (0x0afa, 0x0aff, 8),  #  NSM
+ 0x0b01: (0x0b01, 0x0b01, 8),  #  NSM
+ 0x0b3c: (0x0b3c, 0x0b3c, 8),  #  NSM
+ 0x0b3f: (0x0b3f, 0x0b3f, 8),  #  NSM
+ 0x0b41: (0x0b41, 0x0b44, 8),  #  NSM
+ 0x0b4d: (0x0b4d, 0x0b4d, 8),  #  NSM
+ 0x0b56: (0x0b56, 0x0b56, 8),  #  NSM
+ 0x0b62: (0x0b62, 0x0b63, 8),  #  NSM
+ 0x0b82: (0x0b82, 0x0b82, 8),  #  NSM
+ 0x0bc0: (0x0bc0, 0x0bc0, 8),  #  NSM
+ 0x0bcd: (0x0bcd, 0x0bcd, 8),  #  NSM
+ 0x0bf3: (0x0bf3, 0x0bf8, 13),  #  ON
+ 0x0bf9: (0x0bf9, 0x0bf9, 5),  #  ET
+ 0x0bfa: (0x0bfa, 0x0bfa, 13),  #  ON
+ 0x0c00: (0x0c00, 0x0c00, 8),  #  NSM
+ 0x0c04: (0x0c04, 0x0c04, 8),  #  NSM
+ 0x0c3e: (0x0c3e, 0x0c40, 8),  #  NSM
+ 0x0c46: (0x0c46, 0x0c48, 8),  #  NSM
+ 0x0c4a: (0x0c4a, 0x0c4d, 8),  #  NSM
+ 0x0c55: (0x0c55, 0x0c56, 8),  #  NSM
+ 0x0c62: (0x0c62, 0x0c63, 8),  #  NSM
+ 0x0c78: (0x0c78, 0x0c7e, 13),  #  ON
+ 0x0c81: (0x0c81, 0x0c81, 8),  #  NSM
+ 0x0cbc: (0x0cbc, 0x0cbc, 8),  #  NSM
+ 0x0ccc: (0x0ccc, 0x0ccd, 8),  #  NSM
+ 0x0ce2: (0x0ce2, 0x0ce3, 8),  #  NSM
+ 0x0d00: (0x0d00, 0x0d01, 8),  #  NSM
+ 0x0d3b: (0x0d3b, 0x0d3c, 8),  #  NSM
+ 0x0d41: (0x0d41, 0x0d44, 8),  #  NSM
+ 0x0d4d: (0x0d4d, 0x0d4d, 8),  #  NSM
+ 0x0d62: (0x0d62, 0x0d63, 8),  #  NSM
+ 0x0dca: (0x0dca, 0x0dca, 8),  #  NSM
+ 0x0dd2: (0x0dd2, 0x0dd4, 8),  #  NSM
+ 0x0dd6: (0x0dd6, 0x0dd6, 8),  #  NSM
+ 0x0e31: (0x0e31, 0x0e31, 8),  #  NSM
+ 0x0e34: (0x0e34, 0x0e3a, 8),  #  NSM
+ 0x0e3f: (0x0e3f, 0x0e3f, 5),  #  ET
+ 0x0e47: (0x0e47, 0x0e4e, 8),  #  NSM
+ 0x0eb1: (0x0eb1, 0x0eb1, 8),  #  NSM
+ 0x0eb4: (0x0eb4, 0x0eb9, 8),  #  NSM
+ 0x0ebb: (0x0ebb, 0x0ebc, 8),  #  NSM
+ 0x0ec8: (0x0ec8, 0x0ecd, 8),  #  NSM
+ 0x0f18: (0x0f18, 0x0f19, 8),  #  NSM
+ 0x0f35: (0x0f35, 0x0f35, 8),  #  NSM
+ 0x0f37: (0x0f37, 0x0f37, 8),  #  NSM
+ 0x0f39: (0x0f39, 0x0f39, 8),  #  NSM
+ 0x0f3a: (0x0f3a, 0x0f3d, 13),  #  ON
+ 0x0f71: (0x0f71, 0x0f7e, 8),  #  NSM
+ 0x0f80: (0x0f80, 0x0f84, 8),  #  NSM
+ 0x0f86: (0x0f86, 0x0f87, 8),  #  NSM
+ 0x0f8d: (0x0f8d, 0x0f97, 8),  #  NSM
+ 0x0f99: (0x0f99, 0x0fbc, 8),  #  NSM
+ 0x0fc6: (0x0fc6, 0x0fc6, 8),  #  NSM
+ 0x102d: (0x102d, 0x1030, 8),  #  NSM
+ 0x1032: (0x1032, 0x1037, 8),  #  NSM
+ 0x1039: (0x1039, 0x103a, 8),  #  NSM
+ 0x103d: (0x103d, 0x103e, 8),  #  NSM
+ 0x1058: (0x1058, 0x1059, 8),  #  NSM
+ 0x105e: (0x105e, 0x1060, 8),  #  NSM
+ 0x1071: (0x1071, 0x1074, 8),  #  NSM
+ 0x1082: (0x1082, 0x1082, 8),  #  NSM
+ 0x1085: (0x1085, 0x1086, 8),  #  NSM
+ 0x108d: (0x108d, 0x108d, 8),  #  NSM
+ 0x109d: (0x109d, 0x109d, 8),  #  NSM
+ 0x135d: (0x135d, 0x135f, 8),  #  NSM
+ 0x1390: (0x1390, 0x1399, 13),  #  ON
+ 0x1400: (0x1400, 0x1400, 13),  #  ON
+ 0x1680: (0x1680, 0x1680, 12),  #  WS
+ 0x169b: (0x169b, 0x169c, 13),  #  ON
+ 0x1712: (0x1712, 0x1714, 8),  #  NSM
+ 0x1732: (0x1732, 0x1734, 8),  #  NSM
+ 0x1752: (0x1752, 0x1753, 8),  #  NSM
+ 0x1772: (0x1772, 0x1773, 8),  #  NSM
+ 0x17b4: (0x17b4, 0x17b5, 8),  #  NSM
+ 0x17b7: (0x17b7, 0x17bd, 8),  #  NSM
+ 0x17c6: (0x17c6, 0x17c6, 8),  #  NSM
+ 0x17c9: (0x17c9, 0x17d3, 8),  #  NSM
+ 0x17db: (0x17db, 0x17db, 5),  #  ET
+ 0x17dd: (0x17dd, 0x17dd, 8),  #  NSM
+ 0x17f0: (0x17f0, 0x17f9, 13),  #  ON
+ 0x1800: (0x1800, 0x180a, 13),  #  ON
+ 0x180b: (0x180b, 0x180d, 8),  #  NSM
+ 0x180e: (0x180e, 0x180e, 9),  #  BN
+ 0x1885: (0x1885, 0x1886, 8),  #  NSM
+ 0x18a9: (0x18a9, 0x18a9, 8),  #  NSM
+ 0x1920: (0x1920, 0x1922, 8),  #  NSM
+ 0x1927: (0x1927, 0x1928, 8),  #  NSM
+ 0x1932: (0x1932, 0x1932, 8),  #  NSM
+ 0x1939: (0x1939, 0x193b, 8),  #  NSM
+ 0x1940: (0x1940, 0x1940, 13),  #  ON
+ 0x1944: (0x1944, 0x1945, 13),  #  ON
+ 0x19de: (0x19de, 0x19ff, 13),  #  ON
+ 0x1a17: (0x1a17, 0x1a18, 8),  #  NSM
+ 0x1a1b: (0x1a1b, 0x1a1b, 8),  #  NSM
+ 0x1a56: (0x1a56, 0x1a56, 8),  #  NSM
+ 0x1a58: (0x1a58, 0x1a5e, 8),  #  NSM
+ 0x1a60: (0x1a60, 0x1a60, 8),  #  NSM
+ 0x1a62: (0x1a62, 0x1a62, 8),  #  NSM
+ 0x1a65: (0x1a65, 0x1a6c, 8),  #  NSM
+ 0x1a73: (0x1a73, 0x1a7c, 8),  #  NSM
+ 0x1a7f: (0x1a7f, 0x1a7f, 8),  #  NSM
+ 0x1ab0: (0x1ab0, 0x1abe, 8),  #  NSM
+ 0x1b00: (0x1b00, 0x1b03, 8),  #  NSM
+ 0x1b34: (0x1b34, 0x1b34, 8),  #  NSM
+ 0x1b36: (0x1b36, 0x1b3a, 8),  #  NSM
+ 0x1b3c: (0x1b3c, 0x1b3c, 8),  #  NSM
+ 0x1b42: (0x1b42, 0x1b42, 8),  #  NSM
+ 0x1b6b: (0x1b6b, 0x1b73, 8),  #  NSM
+ 0x1b80: (0x1b80, 0x1b81, 8),  #  NSM
+ 0x1ba2: (0x1ba2, 0x1ba5, 8),  #  NSM
+ 0x1ba8: (0x1ba8, 0x1ba9, 8),  #  NSM
+ 0x1bab: (0x1bab, 0x1bad, 8),  #  NSM
+ 0x1be6: (0x1be6, 0x1be6, 8),  #  NSM
+ 0x1be8: (0x1be8, 0x1be9, 8),  #  NSM
+ 0x1bed: (0x1bed, 0x1bed, 8),  #  NSM
+ 0x1bef: (0x1bef, 0x1bf1, 8),  #  NSM
+ 0x1c2c: (0x1c2c, 0x1c33, 8),  #  NSM
+ 0x1c36: (0x1c36, 0x1c37, 8),  #  NSM
+ 0x1cd0: (0x1cd0, 0x1cd2, 8),  #  NSM
+ 0x1cd4: (0x1cd4, 0x1ce0, 8),  #  NSM
+ 0x1ce2: (0x1ce2, 0x1ce8, 8),  #  NSM
+ 0x1ced: (0x1ced, 0x1ced, 8),  #  NSM
+ 0x1cf4: (0x1cf4, 0x1cf4, 8),  #  NSM
+ 0x1cf8: (0x1cf8, 0x1cf9, 8),  #  NSM
+ 0x1dc0: (0x1dc0, 0x1df9, 8),  #  NSM
+ 0x1dfb: (0x1dfb, 0x1dff, 8),  #  NSM
+ 0x1fbd: (0x1fbd, 0x1fbd, 13),  #  ON
+ 0x1fbf: (0x1fbf, 0x1fc1, 13),  #  ON
+ 0x1fcd: (0x1fcd, 0x1fcf, 13),  #  ON
+ 0x1fdd: (0x1fdd, 0x1fdf, 13),  #  ON
+ 0x1fed: (0x1fed, 0x1fef, 13),  #  ON
+ 0x1ffd: (0x1ffd, 0x1ffe, 13),  #  ON
+ 0x2000: (0x2000, 0x200a, 12),  #  WS
+ 0x200b: (0x200b, 0x200d, 9),  #  BN
+ 0x200f: (0x200f, 0x200f, 1),  #  R
+ 0x2010: (0x2010, 0x2027, 13),  #  ON
+ 0x2028: (0x2028, 0x2028, 12),  #  WS
+ 0x2029: (0x2029, 0x2029, 10),  #  B
+ 0x202a: (0x202a, 0x202a, 14),  #  LRE
+ 0x202b: (0x202b, 0x202b, 16),  #  RLE
+ 0x202c: (0x202c, 0x202c, 18),  #  PDF
+ 0x202d: (0x202d, 0x202d, 15),  #  LRO
+ 0x202e: (0x202e, 0x202e, 17),  #  RLO
+ 0x202f: (0x202f, 0x202f, 7),  #  CS
+ 0x2030: (0x2030, 0x2034, 5),  #  ET
+ 0x2035: (0x2035, 0x2043, 13),  #  ON
+ 0x2044: (0x2044, 0x2044, 7),  #  CS
+ 0x2045: (0x2045, 0x205e, 13),  #  ON
+ 0x205f: (0x205f, 0x205f, 12),  #  WS
+ 0x2060: (0x2060, 0x2065, 9),  #  BN
+ 0x2066: (0x2066, 0x2066, 19),  #  LRI
+ 0x2067: (0x2067, 0x2067, 20),  #  RLI
+ 0x2068: (0x2068, 0x2068, 21),  #  FSI
+ 0x2069: (0x2069, 0x2069, 22),  #  PDI
+ 0x206a: (0x206a, 0x206f, 9),  #  BN
+ 0x2070: (0x2070, 0x2070, 3),  #  EN
+ 0x2074: (0x2074, 0x2079, 3),  #  EN
+ 0x207a: (0x207a, 0x207b, 4),  #  ES
+ 0x207c: (0x207c, 0x207e, 13),  #  ON
+ 0x2080: (0x2080, 0x2089, 3),  #  EN
+ 0x208a: (0x208a, 0x208b, 4),  #  ES
+ 0x208c: (0x208c, 0x208e, 13),  #  ON
+ 0x20a0: (0x20a0, 0x20cf, 5),  #  ET
+ 0x20d0: (0x20d0, 0x20f0, 8),  #  NSM
+ 0x2100: (0x2100, 0x2101, 13),  #  ON
+ 0x2103: (0x2103, 0x2106, 13),  #  ON
+ 0x2108: (0x2108, 0x2109, 13),  #  ON
+ 0x2114: (0x2114, 0x2114, 13),  #  ON
+ 0x2116: (0x2116, 0x2118, 13),  #  ON
+ 0x211e: (0x211e, 0x2123, 13),  #  ON
+ 0x2125: (0x2125, 0x2125, 13),  #  ON
+ 0x2127: (0x2127, 0x2127, 13),  #  ON
+ 0x2129: (0x2129, 0x2129, 13),  #  ON
+ 0x212e: (0x212e, 0x212e, 5),  #  ET
+ 0x213a: (0x213a, 0x213b, 13),  #  ON
+ 0x2140: (0x2140, 0x2144, 13),  #  ON
+ 0x214a: (0x214a, 0x214d, 13),  #  ON
+ 0x2150: (0x2150, 0x215f, 13),  #  ON
+ 0x2189: (0x2189, 0x218b, 13),  #  ON
+ 0x2190: (0x2190, 0x2211, 13),  #  ON
+ 0x2212: (0x2212, 0x2212, 4),  #  ES
+ 0x2213: (0x2213, 0x2213, 5),  #  ET
+ 0x2214: (0x2214, 0x2335, 13),  #  ON
+ 0x237b: (0x237b, 0x2394, 13),  #  ON
+ 0x2396: (0x2396, 0x2426, 13),  #  ON
+ 0x2440: (0x2440, 0x244a, 13),  #  ON
+ 0x2460: (0x2460, 0x2487, 13),  #  ON
+ 0x2488: (0x2488, 0x249b, 3),  #  EN
+ 0x24ea: (0x24ea, 0x26ab, 13),  #  ON
+ 0x26ad: (0x26ad, 0x27ff, 13),  #  ON
+ 0x2900: (0x2900, 0x2b73, 13),  #  ON
+ 0x2b76: (0x2b76, 0x2b95, 13),  #  ON
+ 0x2b98: (0x2b98, 0x2bc8, 13),  #  ON
+ 0x2bca: (0x2bca, 0x2bfe, 13),  #  ON
+ 0x2ce5: (0x2ce5, 0x2cea, 13),  #  ON
+ 0x2cef: (0x2cef, 0x2cf1, 8),  #  NSM
+ 0x2cf9: (0x2cf9, 0x2cff, 13),  #  ON
+ 0x2d7f: (0x2d7f, 0x2d7f, 8),  #  NSM
+ 0x2de0: (0x2de0, 0x2dff, 8),  #  NSM
+ 0x2e00: (0x2e00, 0x2e4e, 13),  #  ON
+ 0x2e80: (0x2e80, 0x2e99, 13),  #  ON
+ 0x2e9b: (0x2e9b, 0x2ef3, 13),  #  ON
+ 0x2f00: (0x2f00, 0x2fd5, 13),  #  ON
+ 0x2ff0: (0x2ff0, 0x2ffb, 13),  #  ON
+ 0x3000: (0x3000, 0x3000, 12),  #  WS
+ 0x3001: (0x3001, 0x3004, 13),  #  ON
+ 0x3008: (0x3008, 0x3020, 13),  #  ON
+ 0x302a: (0x302a, 0x302d, 8),  #  NSM
+ 0x3030: (0x3030, 0x3030, 13),  #  ON
+ 0x3036: (0x3036, 0x3037, 13),  #  ON
+ 0x303d: (0x303d, 0x303f, 13),  #  ON
+ 0x3099: (0x3099, 0x309a, 8),  #  NSM
+ 0x309b: (0x309b, 0x309c, 13),  #  ON
+ 0x30a0: (0x30a0, 0x30a0, 13),  #  ON
+ 0x30fb: (0x30fb, 0x30fb, 13),  #  ON
+ 0x31c0: (0x31c0, 0x31e3, 13),  #  ON
+ 0x321d: (0x321d, 0x321e, 13),  #  ON
+ 0x3250: (0x3250, 0x325f, 13),  #  ON
+ 0x327c: (0x327c, 0x327e, 13),  #  ON
+ 0x32b1: (0x32b1, 0x32bf, 13),  #  ON
+ 0x32cc: (0x32cc, 0x32cf, 13),  #  ON
+ 0x3377: (0x3377, 0x337a, 13),  #  ON
+ 0x33de: (0x33de, 0x33df, 13),  #  ON
+ 0x33ff: (0x33ff, 0x33ff, 13),  #  ON
+ 0x4dc0: (0x4dc0, 0x4dff, 13),  #  ON
+ 0xa490: (0xa490, 0xa4c6, 13),  #  ON
+ 0xa60d: (0xa60d, 0xa60f, 13),  #  ON
+ 0xa66f: (0xa66f, 0xa672, 8),  #  NSM
+ 0xa673: (0xa673, 0xa673, 13),  #  ON
+ 0xa674: (0xa674, 0xa67d, 8),  #  NSM
+ 0xa67e: (0xa67e, 0xa67f, 13),  #  ON
+ 0xa69e: (0xa69e, 0xa69f, 8),  #  NSM
+ 0xa6f0: (0xa6f0, 0xa6f1, 8),  #  NSM
+ 0xa700: (0xa700, 0xa721, 13),  #  ON
+ 0xa788: (0xa788, 0xa788, 13),  #  ON
+ 0xa802: (0xa802, 0xa802, 8),  #  NSM
+ 0xa806: (0xa806, 0xa806, 8),  #  NSM
+ 0xa80b: (0xa80b, 0xa80b, 8),  #  NSM
+ 0xa825: (0xa825, 0xa826, 8),  #  NSM
+ 0xa828: (0xa828, 0xa82b, 13),  #  ON
+ 0xa838: (0xa838, 0xa839, 5),  #  ET
+ 0xa874: (0xa874, 0xa877, 13),  #  ON
+ 0xa8c4: (0xa8c4, 0xa8c5, 8),  #  NSM
+ 0xa8e0: (0xa8e0, 0xa8f1, 8),  #  NSM
+ 0xa8ff: (0xa8ff, 0xa8ff, 8),  #  NSM
+ 0xa926: (0xa926, 0xa92d, 8),  #  NSM
+ 0xa947: (0xa947, 0xa951, 8),  #  NSM
+ 0xa980: (0xa980, 0xa982, 8),  #  NSM
+ 0xa9b3: (0xa9b3, 0xa9b3, 8),  #  NSM
+ 0xa9b6: (0xa9b6, 0xa9b9, 8),  #  NSM
+ 0xa9bc: (0xa9bc, 0xa9bc, 8),  #  NSM
+ 0xa9e5: (0xa9e5, 0xa9e5, 8),  #  NSM
+ 0xaa29: (0xaa29, 0xaa2e, 8),  #  NSM
+ 0xaa31: (0xaa31, 0xaa32, 8),  #  NSM
+ 0xaa35: (0xaa35, 0xaa36, 8),  #  NSM
+ 0xaa43: (0xaa43, 0xaa43, 8),  #  NSM
+ 0xaa4c: (0xaa4c, 0xaa4c, 8),  #  NSM
+ 0xaa7c: (0xaa7c, 0xaa7c, 8),  #  NSM
+ 0xaab0: (0xaab0, 0xaab0, 8),  #  NSM
+ 0xaab2: (0xaab2, 0xaab4, 8),  #  NSM
+ 0xaab7: (0xaab7, 0xaab8, 8),  #  NSM
+ 0xaabe: (0xaabe, 0xaabf, 8),  #  NSM
+ 0xaac1: (0xaac1, 0xaac1, 8),  #  NSM
+ 0xaaec: (0xaaec, 0xaaed, 8),  #  NSM
+ 0xaaf6: (0xaaf6, 0xaaf6, 8),  #  NSM
+ 0xabe5: (0xabe5, 0xabe5, 8),  #  NSM
+ 0xabe8: (0xabe8, 0xabe8, 8),  #  NSM
+ 0xabed: (0xabed, 0xabed, 8),  #  NSM
+ 0xfb1d: (0xfb1d, 0xfb1d, 1),  #  R
+ 0xfb1e: (0xfb1e, 0xfb1e, 8),  #  NSM
+ 0xfb1f: (0xfb1f, 0xfb28, 1),  #  R
+ 0xfb29: (0xfb29, 0xfb29, 4),  #  ES
+ 0xfb2a: (0xfb2a, 0xfb4f, 1),  #  R
+ 0xfb50: (0xfb50, 0xfd3d, 2),  #  AL
+ 0xfd3e: (0xfd3e, 0xfd3f, 13),  #  ON
+ 0xfd40: (0xfd40, 0xfdcf, 2),  #  AL
+ 0xfdd0: (0xfdd0, 0xfdef, 9),  #  BN
+ 0xfdf0: (0xfdf0, 0xfdfc, 2),  #  AL
+ 0xfdfd: (0xfdfd, 0xfdfd, 13),  #  ON
+ 0xfdfe: (0xfdfe, 0xfdff, 2),  #  AL
+ 0xfe00: (0xfe00, 0xfe0f, 8),  #  NSM
+ 0xfe10: (0xfe10, 0xfe19, 13),  #  ON
+ 0xfe20: (0xfe20, 0xfe2f, 8),  #  NSM
+ 0xfe30: (0xfe30, 0xfe4f, 13),  #  ON
+ 0xfe50: (0xfe50, 0xfe50, 7),  #  CS
+ 0xfe51: (0xfe51, 0xfe51, 13),  #  ON
+ 0xfe52: (0xfe52, 0xfe52, 7),  #  CS
+ 0xfe54: (0xfe54, 0xfe54, 13),  #  ON
+ 0xfe55: (0xfe55, 0xfe55, 7),  #  CS
+ 0xfe56: (0xfe56, 0xfe5e, 13),  #  ON
+ 0xfe5f: (0xfe5f, 0xfe5f, 5),  #  ET
+ 0xfe60: (0xfe60, 0xfe61, 13),  #  ON
+ 0xfe62: (0xfe62, 0xfe63, 4),  #  ES
+ 0xfe64: (0xfe64, 0xfe66, 13),  #  ON
+ 0xfe68: (0xfe68, 0xfe68, 13),  #  ON
+ 0xfe69: (0xfe69, 0xfe6a, 5),  #  ET
+ 0xfe6b: (0xfe6b, 0xfe6b, 13),  #  ON
+ 0xfe70: (0xfe70, 0xfefe, 2),  #  AL
+ 0xfeff: (0xfeff, 0xfeff, 9),  #  BN
+ 0xff01: (0xff01, 0xff02, 13),  #  ON
+ 0xff03: (0xff03, 0xff05, 5),  #  ET
+ 0xff06: (0xff06, 0xff0a, 13),  #  ON
+ 0xff0b: (0xff0b, 0xff0b, 4),  #  ES
+ 0xff0c: (0xff0c, 0xff0c, 7),  #  CS
+ 0xff0d: (0xff0d, 0xff0d, 4),  #  ES
+ 0xff0e: (0xff0e, 0xff0f, 7),  #  CS
+ 0xff10: (0xff10, 0xff19, 3),  #  EN
+ 0xff1a: (0xff1a, 0xff1a, 7),  #  CS
+ 0xff1b: (0xff1b, 0xff20, 13),  #  ON
+ 0xff3b: (0xff3b, 0xff40, 13),  #  ON
+ 0xff5b: (0xff5b, 0xff65, 13),  #  ON
+ 0xffe0: (0xffe0, 0xffe1, 5),  #  ET
+ 0xffe2: (0xffe2, 0xffe4, 13),  #  ON
+ 0xffe5: (0xffe5, 0xffe6, 5),  #  ET
+ 0xffe8: (0xffe8, 0xffee, 13),  #  ON
+ 0xfff0: (0xfff0, 0xfff8, 9),  #  BN
+ 0xfff9: (0xfff9, 0xfffd, 13),  #  ON
+ 0xfffe: (0xfffe, 0xffff, 9),  #  BN
+ 0x10101: (0x10101, 0x10101, 13),  #  ON
+ 0x10140: (0x10140, 0x1018c, 13),  #  ON
+ 0x10190: (0x10190, 0x1019b, 13),  #  ON
+ 0x101a0: (0x101a0, 0x101a0, 13),  #  ON
+ 0x101fd: (0x101fd, 0x101fd, 8),  #  NSM
+ 0x102e0: (0x102e0, 0x102e0, 8),  #  NSM
+ 0x102e1: (0x102e1, 0x102fb, 3),  #  EN
+ 0x10376: (0x10376, 0x1037a, 8),  #  NSM
+ 0x10800: (0x10800, 0x1091e, 1),  #  R
+ 0x1091f: (0x1091f, 0x1091f, 13),  #  ON
+ 0x10920: (0x10920, 0x10a00, 1),  #  R
+ 0x10a01: (0x10a01, 0x10a03, 8),  #  NSM
+ 0x10a04: (0x10a04, 0x10a04, 1),  #  R
+ 0x10a05: (0x10a05, 0x10a06, 8),  #  NSM
+ 0x10a07: (0x10a07, 0x10a0b, 1),  #  R
+ 0x10a0c: (0x10a0c, 0x10a0f, 8),  #  NSM
+ 0x10a10: (0x10a10, 0x10a37, 1),  #  R
+ 0x10a38: (0x10a38, 0x10a3a, 8),  #  NSM
+ 0x10a3b: (0x10a3b, 0x10a3e, 1),  #  R
+ 0x10a3f: (0x10a3f, 0x10a3f, 8),  #  NSM
+ 0x10a40: (0x10a40, 0x10ae4, 1),  #  R
+ 0x10ae5: (0x10ae5, 0x10ae6, 8),  #  NSM
+ 0x10ae7: (0x10ae7, 0x10b38, 1),  #  R
+ 0x10b39: (0x10b39, 0x10b3f, 13),  #  ON
+ 0x10b40: (0x10b40, 0x10cff, 1),  #  R
+ 0x10d00: (0x10d00, 0x10d23, 2),  #  AL
+ 0x10d24: (0x10d24, 0x10d27, 8),  #  NSM
+ 0x10d28: (0x10d28, 0x10d2f, 2),  #  AL
+ 0x10d30: (0x10d30, 0x10d39, 6),  #  AN
+ 0x10d3a: (0x10d3a, 0x10d3f, 2),  #  AL
+ 0x10d40: (0x10d40, 0x10e5f, 1),  #  R
+ 0x10e60: (0x10e60, 0x10e7e, 6),  #  AN
+ 0x10e7f: (0x10e7f, 0x10f2f, 1),  #  R
+ 0x10f30: (0x10f30, 0x10f45, 2),  #  AL
+ 0x10f46: (0x10f46, 0x10f50, 8),  #  NSM
+ 0x10f51: (0x10f51, 0x10f6f, 2),  #  AL
+ 0x10f70: (0x10f70, 0x10fff, 1),  #  R
+ 0x11001: (0x11001, 0x11001, 8),  #  NSM
+ 0x11038: (0x11038, 0x11046, 8),  #  NSM
+ 0x11052: (0x11052, 0x11065, 13),  #  ON
+ 0x1107f: (0x1107f, 0x11081, 8),  #  NSM
+ 0x110b3: (0x110b3, 0x110b6, 8),  #  NSM
+ 0x110b9: (0x110b9, 0x110ba, 8),  #  NSM
+ 0x11100: (0x11100, 0x11102, 8),  #  NSM
+ 0x11127: (0x11127, 0x1112b, 8),  #  NSM
+ 0x1112d: (0x1112d, 0x11134, 8),  #  NSM
+ 0x11173: (0x11173, 0x11173, 8),  #  NSM
+ 0x11180: (0x11180, 0x11181, 8),  #  NSM
+ 0x111b6: (0x111b6, 0x111be, 8),  #  NSM
+ 0x111c9: (0x111c9, 0x111cc, 8),  #  NSM
+ 0x1122f: (0x1122f, 0x11231, 8),  #  NSM
+ 0x11234: (0x11234, 0x11234, 8),  #  NSM
+ 0x11236: (0x11236, 0x11237, 8),  #  NSM
+ 0x1123e: (0x1123e, 0x1123e, 8),  #  NSM
+ 0x112df: (0x112df, 0x112df, 8),  #  NSM
+ 0x112e3: (0x112e3, 0x112ea, 8),  #  NSM
+ 0x11300: (0x11300, 0x11301, 8),  #  NSM
+ 0x1133b: (0x1133b, 0x1133c, 8),  #  NSM
+ 0x11340: (0x11340, 0x11340, 8),  #  NSM
+ 0x11366: (0x11366, 0x1136c, 8),  #  NSM
+ 0x11370: (0x11370, 0x11374, 8),  #  NSM
+ 0x11438: (0x11438, 0x1143f, 8),  #  NSM
+ 0x11442: (0x11442, 0x11444, 8),  #  NSM
+ 0x11446: (0x11446, 0x11446, 8),  #  NSM
+ 0x1145e: (0x1145e, 0x1145e, 8),  #  NSM
+ 0x114b3: (0x114b3, 0x114b8, 8),  #  NSM
+ 0x114ba: (0x114ba, 0x114ba, 8),  #  NSM
+ 0x114bf: (0x114bf, 0x114c0, 8),  #  NSM
+ 0x114c2: (0x114c2, 0x114c3, 8),  #  NSM
+ 0x115b2: (0x115b2, 0x115b5, 8),  #  NSM
+ 0x115bc: (0x115bc, 0x115bd, 8),  #  NSM
+ 0x115bf: (0x115bf, 0x115c0, 8),  #  NSM
+ 0x115dc: (0x115dc, 0x115dd, 8),  #  NSM
+ 0x11633: (0x11633, 0x1163a, 8),  #  NSM
+ 0x1163d: (0x1163d, 0x1163d, 8),  #  NSM
+ 0x1163f: (0x1163f, 0x11640, 8),  #  NSM
+ 0x11660: (0x11660, 0x1166c, 13),  #  ON
+ 0x116ab: (0x116ab, 0x116ab, 8),  #  NSM
+ 0x116ad: (0x116ad, 0x116ad, 8),  #  NSM
+ 0x116b0: (0x116b0, 0x116b5, 8),  #  NSM
+ 0x116b7: (0x116b7, 0x116b7, 8),  #  NSM
+ 0x1171d: (0x1171d, 0x1171f, 8),  #  NSM
+ 0x11722: (0x11722, 0x11725, 8),  #  NSM
+ 0x11727: (0x11727, 0x1172b, 8),  #  NSM
+ 0x1182f: (0x1182f, 0x11837, 8),  #  NSM
+ 0x11839: (0x11839, 0x1183a, 8),  #  NSM
+ 0x11a01: (0x11a01, 0x11a06, 8),  #  NSM
+ 0x11a09: (0x11a09, 0x11a0a, 8),  #  NSM
+ 0x11a33: (0x11a33, 0x11a38, 8),  #  NSM
+ 0x11a3b: (0x11a3b, 0x11a3e, 8),  #  NSM
+ 0x11a47: (0x11a47, 0x11a47, 8),  #  NSM
+ 0x11a51: (0x11a51, 0x11a56, 8),  #  NSM
+ 0x11a59: (0x11a59, 0x11a5b, 8),  #  NSM
+ 0x11a8a: (0x11a8a, 0x11a96, 8),  #  NSM
+ 0x11a98: (0x11a98, 0x11a99, 8),  #  NSM
+ 0x11c30: (0x11c30, 0x11c36, 8),  #  NSM
+ 0x11c38: (0x11c38, 0x11c3d, 8),  #  NSM
+ 0x11c92: (0x11c92, 0x11ca7, 8),  #  NSM
+ 0x11caa: (0x11caa, 0x11cb0, 8),  #  NSM
+ 0x11cb2: (0x11cb2, 0x11cb3, 8),  #  NSM
+ 0x11cb5: (0x11cb5, 0x11cb6, 8),  #  NSM
+ 0x11d31: (0x11d31, 0x11d36, 8),  #  NSM
+ 0x11d3a: (0x11d3a, 0x11d3a, 8),  #  NSM
+ 0x11d3c: (0x11d3c, 0x11d3d, 8),  #  NSM
+ 0x11d3f: (0x11d3f, 0x11d45, 8),  #  NSM
+ 0x11d47: (0x11d47, 0x11d47, 8),  #  NSM
+ 0x11d90: (0x11d90, 0x11d91, 8),  #  NSM
+ 0x11d95: (0x11d95, 0x11d95, 8),  #  NSM
+ 0x11d97: (0x11d97, 0x11d97, 8),  #  NSM
+ 0x11ef3: (0x11ef3, 0x11ef4, 8),  #  NSM
+ 0x16af0: (0x16af0, 0x16af4, 8),  #  NSM
+ 0x16b30: (0x16b30, 0x16b36, 8),  #  NSM
+ 0x16f8f: (0x16f8f, 0x16f92, 8),  #  NSM
+ 0x1bc9d: (0x1bc9d, 0x1bc9e, 8),  #  NSM
+ 0x1bca0: (0x1bca0, 0x1bca3, 9),  #  BN
+ 0x1d167: (0x1d167, 0x1d169, 8),  #  NSM
+ 0x1d173: (0x1d173, 0x1d17a, 9),  #  BN
+ 0x1d17b: (0x1d17b, 0x1d182, 8),  #  NSM
+ 0x1d185: (0x1d185, 0x1d18b, 8),  #  NSM
+ 0x1d1aa: (0x1d1aa, 0x1d1ad, 8),  #  NSM
+ 0x1d200: (0x1d200, 0x1d241, 13),  #  ON
+ 0x1d242: (0x1d242, 0x1d244, 8),  #  NSM
+ 0x1d245: (0x1d245, 0x1d245, 13),  #  ON
+ 0x1d300: (0x1d300, 0x1d356, 13),  #  ON
+ 0x1d6db: (0x1d6db, 0x1d6db, 13),  #  ON
+ 0x1d715: (0x1d715, 0x1d715, 13),  #  ON
+ 0x1d74f: (0x1d74f, 0x1d74f, 13),  #  ON
+ 0x1d789: (0x1d789, 0x1d789, 13),  #  ON
+ 0x1d7c3: (0x1d7c3, 0x1d7c3, 13),  #  ON
+ 0x1d7ce: (0x1d7ce, 0x1d7ff, 3),  #  EN
+ 0x1da00: (0x1da00, 0x1da36, 8),  #  NSM
+ 0x1da3b: (0x1da3b, 0x1da6c, 8),  #  NSM
+ 0x1da75: (0x1da75, 0x1da75, 8),  #  NSM
+ 0x1da84: (0x1da84, 0x1da84, 8),  #  NSM
+ 0x1da9b: (0x1da9b, 0x1da9f, 8),  #  NSM
+ 0x1daa1: (0x1daa1, 0x1daaf, 8),  #  NSM
+ 0x1e000: (0x1e000, 0x1e006, 8),  #  NSM
+ 0x1e008: (0x1e008, 0x1e018, 8),  #  NSM
+ 0x1e01b: (0x1e01b, 0x1e021, 8),  #  NSM
+ 0x1e023: (0x1e023, 0x1e024, 8),  #  NSM
+ 0x1e026: (0x1e026, 0x1e02a, 8),  #  NSM
+ 0x1e800: (0x1e800, 0x1e8cf, 1),  #  R
+ 0x1e8d0: (0x1e8d0, 0x1e8d6, 8),  #  NSM
+ 0x1e8d7: (0x1e8d7, 0x1e943, 1),  #  R
+ 0x1e944: (0x1e944, 0x1e94a, 8),  #  NSM
+ 0x1e94b: (0x1e94b, 0x1ec6f, 1),  #  R
+ 0x1ec70: (0x1ec70, 0x1ecbf, 2),  #  AL
+ 0x1ecc0: (0x1ecc0, 0x1edff, 1),  #  R
+ 0x1ee00: (0x1ee00, 0x1eeef, 2),  #  AL
+ 0x1eef0: (0x1eef0, 0x1eef1, 13),  #  ON
+ 0x1eef2: (0x1eef2, 0x1eeff, 2),  #  AL
+ 0x1ef00: (0x1ef00, 0x1efff, 1),  #  R
+ 0x1f000: (0x1f000, 0x1f02b, 13),  #  ON
+ 0x1f030: (0x1f030, 0x1f093, 13),  #  ON
+ 0x1f0a0: (0x1f0a0, 0x1f0ae, 13),  #  ON
+ 0x1f0b1: (0x1f0b1, 0x1f0bf, 13),  #  ON
+ 0x1f0c1: (0x1f0c1, 0x1f0cf, 13),  #  ON
+ 0x1f0d1: (0x1f0d1, 0x1f0f5, 13),  #  ON
+ 0x1f100: (0x1f100, 0x1f10a, 3),  #  EN
+ 0x1f10b: (0x1f10b, 0x1f10c, 13),  #  ON
+ 0x1f12f: (0x1f12f, 0x1f12f, 13),  #  ON
+ 0x1f16a: (0x1f16a, 0x1f16b, 13),  #  ON
+ 0x1f260: (0x1f260, 0x1f265, 13),  #  ON
+ 0x1f300: (0x1f300, 0x1f6d4, 13),  #  ON
+ 0x1f6e0: (0x1f6e0, 0x1f6ec, 13),  #  ON
+ 0x1f6f0: (0x1f6f0, 0x1f6f9, 13),  #  ON
+ 0x1f700: (0x1f700, 0x1f773, 13),  #  ON
+ 0x1f780: (0x1f780, 0x1f7d8, 13),  #  ON
+ 0x1f800: (0x1f800, 0x1f80b, 13),  #  ON
+ 0x1f810: (0x1f810, 0x1f847, 13),  #  ON
+ 0x1f850: (0x1f850, 0x1f859, 13),  #  ON
+ 0x1f860: (0x1f860, 0x1f887, 13),  #  ON
+ 0x1f890: (0x1f890, 0x1f8ad, 13),  #  ON
+ 0x1f900: (0x1f900, 0x1f90b, 13),  #  ON
+ 0x1f910: (0x1f910, 0x1f93e, 13),  #  ON
+ 0x1f940: (0x1f940, 0x1f970, 13),  #  ON
+ 0x1f973: (0x1f973, 0x1f976, 13),  #  ON
+ 0x1f97a: (0x1f97a, 0x1f97a, 13),  #  ON
+ 0x1f97c: (0x1f97c, 0x1f9a2, 13),  #  ON
+ 0x1f9b0: (0x1f9b0, 0x1f9b9, 13),  #  ON
+ 0x1f9c0: (0x1f9c0, 0x1f9c2, 13),  #  ON
+ 0x1f9d0: (0x1f9d0, 0x1f9ff, 13),  #  ON
+ 0x1fa60: (0x1fa60, 0x1fa6d, 13),  #  ON
+ 0x1fffe: (0x1fffe, 0x1ffff, 9),  #  BN
+ 0x2fffe: (0x2fffe, 0x2ffff, 9),  #  BN
+ 0x3fffe: (0x3fffe, 0x3ffff, 9),  #  BN
+ 0x4fffe: (0x4fffe, 0x4ffff, 9),  #  BN
+ 0x5fffe: (0x5fffe, 0x5ffff, 9),  #  BN
+ 0x6fffe: (0x6fffe, 0x6ffff, 9),  #  BN
+ 0x7fffe: (0x7fffe, 0x7ffff, 9),  #  BN
+ 0x8fffe: (0x8fffe, 0x8ffff, 9),  #  BN
+ 0x9fffe: (0x9fffe, 0x9ffff, 9),  #  BN
+ 0xafffe: (0xafffe, 0xaffff, 9),  #  BN
+ 0xbfffe: (0xbfffe, 0xbffff, 9),  #  BN
+ 0xcfffe: (0xcfffe, 0xcffff, 9),  #  BN
+ 0xdfffe: (0xdfffe, 0xe00ff, 9),  #  BN
+ 0xe0100: (0xe0100, 0xe01ef, 8),  #  NSM
+ 0xe01f0: (0xe01f0, 0xe0fff, 9),  #  BN
+ 0xefffe: (0xefffe, 0xeffff, 9),  #  BN
+ 0xffffe: (0xffffe, 0xfffff, 9),  #  BN
+ 0x10fffe: (0x10fffe, 0x10ffff, 9),  #  BN
+}
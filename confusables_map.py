@@ -0,0 +1,6304 @@
+
+
+# dictionary of TR39 confusable mappings (from confusables.txt)
+# entries are: key: (cp, ...), where
+#     key - the code point of the confusable character, (cp, ...) - the code point(s) of its prototype.
+# The skeleton of a string is made by mapping each character to its prototype (see TR39 section 4).
+confusables_map = {
+ 0x05ad: (0x0596,), #  HEBREW ACCENT DEHI → HEBREW ACCENT TIPEHA
+ 0x05ae: (0x0598,), #  HEBREW ACCENT ZINOR → HEBREW ACCENT ZARQA
+ 0x05a8: (0x0599,), #  HEBREW ACCENT QADMA → HEBREW ACCENT PASHTA
+ 0x05a4: (0x059a,), #  HEBREW ACCENT MAHAPAKH → HEBREW ACCENT YETIV
+ 0x1ab4: (0x06db,), #  COMBINING TRIPLE DOT → ARABIC SMALL HIGH THREE DOTS
+ 0x20db: (0x06db,), #  COMBINING THREE DOTS ABOVE → ARABIC SMALL HIGH THREE DOTS	# →᪴→
+ 0x0619: (0x0313,), #  ARABIC SMALL DAMMA → COMBINING COMMA ABOVE	# →ُ→
+ 0x08f3: (0x0313,), #  ARABIC SMALL HIGH WAW → COMBINING COMMA ABOVE	# →ُ→
+ 0x0343: (0x0313,), #  COMBINING GREEK KORONIS → COMBINING COMMA ABOVE
+ 0x0315: (0x0313,), #  COMBINING COMMA ABOVE RIGHT → COMBINING COMMA ABOVE
+ 0x064f: (0x0313,), #  ARABIC DAMMA → COMBINING COMMA ABOVE
+ 0x065d: (0x0314,), #  ARABIC REVERSED DAMMA → COMBINING REVERSED COMMA ABOVE
+ 0x059c: (0x0301,), #  HEBREW ACCENT GERESH → COMBINING ACUTE ACCENT
+ 0x059d: (0x0301,), #  HEBREW ACCENT GERESH MUQDAM → COMBINING ACUTE ACCENT	# →֜→
+ 0x0618: (0x0301,), #  ARABIC SMALL FATHA → COMBINING ACUTE ACCENT	# →َ→
+ 0x0747: (0x0301,), #  SYRIAC OBLIQUE LINE ABOVE → COMBINING ACUTE ACCENT
+ 0x0341: (0x0301,), #  COMBINING ACUTE TONE MARK → COMBINING ACUTE ACCENT
+ 0x0954: (0x0301,), #  DEVANAGARI ACUTE ACCENT → COMBINING ACUTE ACCENT
+ 0x064e: (0x0301,), #  ARABIC FATHA → COMBINING ACUTE ACCENT
+ 0x0340: (0x0300,), #  COMBINING GRAVE TONE MARK → COMBINING GRAVE ACCENT
+ 0x0953: (0x0300,), #  DEVANAGARI GRAVE ACCENT → COMBINING GRAVE ACCENT
+ 0x030c: (0x0306,), #  COMBINING CARON → COMBINING BREVE
+ 0xa67c: (0x0306,), #  COMBINING CYRILLIC KAVYKA → COMBINING BREVE
+ 0x0658: (0x0306,), #  ARABIC MARK NOON GHUNNA → COMBINING BREVE
+ 0x065a: (0x0306,), #  ARABIC VOWEL SIGN SMALL V ABOVE → COMBINING BREVE	# →̌→
+ 0x036e: (0x0306,), #  COMBINING LATIN SMALL LETTER V → COMBINING BREVE	# →̌→
+ 0x06e8: (0x0306, 0x0307,), #  ARABIC SMALL HIGH NOON → COMBINING BREVE, COMBINING DOT ABOVE	# →̐→
+ 0x0310: (0x0306, 0x0307,), #  COMBINING CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE
+ 0x0901: (0x0306, 0x0307,), #  DEVANAGARI SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →̐→
+ 0x0981: (0x0306, 0x0307,), #  BENGALI SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →̐→
+ 0x0a81: (0x0306, 0x0307,), #  GUJARATI SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →̐→
+ 0x0b01: (0x0306, 0x0307,), #  ORIYA SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →̐→
+ 0x0c00: (0x0306, 0x0307,), #  TELUGU SIGN COMBINING CANDRABINDU ABOVE → COMBINING BREVE, COMBINING DOT ABOVE	# →ँ→→̐→
+ 0x0c81: (0x0306, 0x0307,), #  KANNADA SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →ँ→→̐→
+ 0x0d01: (0x0306, 0x0307,), #  MALAYALAM SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →ँ→→̐→
+ 0x114bf: (0x0306, 0x0307,), #  TIRHUTA SIGN CANDRABINDU → COMBINING BREVE, COMBINING DOT ABOVE	# →ঁ→→̐→
+ 0x1cd0: (0x0302,), #  VEDIC TONE KARSHANA → COMBINING CIRCUMFLEX ACCENT
+ 0x0311: (0x0302,), #  COMBINING INVERTED BREVE → COMBINING CIRCUMFLEX ACCENT
+ 0x065b: (0x0302,), #  ARABIC VOWEL SIGN INVERTED SMALL V ABOVE → COMBINING CIRCUMFLEX ACCENT
+ 0x07ee: (0x0302,), #  NKO COMBINING LONG DESCENDING TONE → COMBINING CIRCUMFLEX ACCENT
+ 0xa6f0: (0x0302,), #  BAMUM COMBINING MARK KOQNDON → COMBINING CIRCUMFLEX ACCENT
+ 0x05af: (0x030a,), #  HEBREW MARK MASORA CIRCLE → COMBINING RING ABOVE
+ 0x06df: (0x030a,), #  ARABIC SMALL HIGH ROUNDED ZERO → COMBINING RING ABOVE	# →ْ→
+ 0x17d3: (0x030a,), #  KHMER SIGN BATHAMASAT → COMBINING RING ABOVE
+ 0x309a: (0x030a,), #  COMBINING KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK → COMBINING RING ABOVE
+ 0x0652: (0x030a,), #  ARABIC SUKUN → COMBINING RING ABOVE
+ 0x0b82: (0x030a,), #  TAMIL SIGN ANUSVARA → COMBINING RING ABOVE
+ 0x1036: (0x030a,), #  MYANMAR SIGN ANUSVARA → COMBINING RING ABOVE
+ 0x17c6: (0x030a,), #  KHMER SIGN NIKAHIT → COMBINING RING ABOVE
+ 0x11300: (0x030a,), #  GRANTHA SIGN COMBINING ANUSVARA ABOVE → COMBINING RING ABOVE	# →ஂ→
+ 0x0e4d: (0x030a,), #  THAI CHARACTER NIKHAHIT → COMBINING RING ABOVE
+ 0x0ecd: (0x030a,), #  LAO NIGGAHITA → COMBINING RING ABOVE
+ 0x0366: (0x030a,), #  COMBINING LATIN SMALL LETTER O → COMBINING RING ABOVE
+ 0x2dea: (0x030a,), #  COMBINING CYRILLIC LETTER O → COMBINING RING ABOVE	# →ͦ→
+ 0x08eb: (0x0308,), #  ARABIC TONE TWO DOTS ABOVE → COMBINING DIAERESIS
+ 0x07f3: (0x0308,), #  NKO COMBINING DOUBLE DOT ABOVE → COMBINING DIAERESIS
+ 0x064b: (0x030b,), #  ARABIC FATHATAN → COMBINING DOUBLE ACUTE ACCENT
+ 0x08f0: (0x030b,), #  ARABIC OPEN FATHATAN → COMBINING DOUBLE ACUTE ACCENT	# →ً→
+ 0x0342: (0x0303,), #  COMBINING GREEK PERISPOMENI → COMBINING TILDE
+ 0x0653: (0x0303,), #  ARABIC MADDAH ABOVE → COMBINING TILDE
+ 0x05c4: (0x0307,), #  HEBREW MARK UPPER DOT → COMBINING DOT ABOVE
+ 0x06ec: (0x0307,), #  ARABIC ROUNDED HIGH STOP WITH FILLED CENTRE → COMBINING DOT ABOVE
+ 0x0740: (0x0307,), #  SYRIAC FEMININE DOT → COMBINING DOT ABOVE	# →݁→
+ 0x08ea: (0x0307,), #  ARABIC TONE ONE DOT ABOVE → COMBINING DOT ABOVE
+ 0x0741: (0x0307,), #  SYRIAC QUSHSHAYA → COMBINING DOT ABOVE
+ 0x0358: (0x0307,), #  COMBINING DOT ABOVE RIGHT → COMBINING DOT ABOVE
+ 0x05b9: (0x0307,), #  HEBREW POINT HOLAM → COMBINING DOT ABOVE
+ 0x05ba: (0x0307,), #  HEBREW POINT HOLAM HASER FOR VAV → COMBINING DOT ABOVE	# →ׁ→
+ 0x05c2: (0x0307,), #  HEBREW POINT SIN DOT → COMBINING DOT ABOVE
+ 0x05c1: (0x0307,), #  HEBREW POINT SHIN DOT → COMBINING DOT ABOVE
+ 0x07ed: (0x0307,), #  NKO COMBINING SHORT RISING TONE → COMBINING DOT ABOVE
+ 0x0902: (0x0307,), #  DEVANAGARI SIGN ANUSVARA → COMBINING DOT ABOVE
+ 0x0a02: (0x0307,), #  GURMUKHI SIGN BINDI → COMBINING DOT ABOVE
+ 0x0a82: (0x0307,), #  GUJARATI SIGN ANUSVARA → COMBINING DOT ABOVE
+ 0x0bcd: (0x0307,), #  TAMIL SIGN VIRAMA → COMBINING DOT ABOVE
+ 0x0337: (0x0338,), #  COMBINING SHORT SOLIDUS OVERLAY → COMBINING LONG SOLIDUS OVERLAY
+ 0x1ab7: (0x0328,), #  COMBINING OPEN MARK BELOW → COMBINING OGONEK
+ 0x0322: (0x0328,), #  COMBINING RETROFLEX HOOK BELOW → COMBINING OGONEK
+ 0x0345: (0x0328,), #  COMBINING GREEK YPOGEGRAMMENI → COMBINING OGONEK
+ 0x1cd2: (0x0304,), #  VEDIC TONE PRENKHA → COMBINING MACRON
+ 0x0305: (0x0304,), #  COMBINING OVERLINE → COMBINING MACRON
+ 0x0659: (0x0304,), #  ARABIC ZWARAKAY → COMBINING MACRON
+ 0x07eb: (0x0304,), #  NKO COMBINING SHORT HIGH TONE → COMBINING MACRON
+ 0xa6f1: (0x0304,), #  BAMUM COMBINING MARK TUKWENTIS → COMBINING MACRON
+ 0x1cda: (0x030e,), #  VEDIC TONE DOUBLE SVARITA → COMBINING DOUBLE VERTICAL LINE ABOVE
+ 0x0657: (0x0312,), #  ARABIC INVERTED DAMMA → COMBINING TURNED COMMA ABOVE
+ 0x0357: (0x0350,), #  COMBINING RIGHT HALF RING ABOVE → COMBINING RIGHT ARROWHEAD ABOVE	# →ࣿ→→ࣸ→
+ 0x08ff: (0x0350,), #  ARABIC MARK SIDEWAYS NOON GHUNNA → COMBINING RIGHT ARROWHEAD ABOVE	# →ࣸ→
+ 0x08f8: (0x0350,), #  ARABIC RIGHT ARROWHEAD ABOVE → COMBINING RIGHT ARROWHEAD ABOVE
+ 0x0900: (0x0352,), #  DEVANAGARI SIGN INVERTED CANDRABINDU → COMBINING FERMATA
+ 0x1ced: (0x0316,), #  VEDIC SIGN TIRYAK → COMBINING GRAVE ACCENT BELOW
+ 0x1cdc: (0x0329,), #  VEDIC TONE KATHAKA ANUDATTA → COMBINING VERTICAL LINE BELOW
+ 0x0656: (0x0329,), #  ARABIC SUBSCRIPT ALEF → COMBINING VERTICAL LINE BELOW
+ 0x1cd5: (0x032b,), #  VEDIC TONE YAJURVEDIC AGGRAVATED INDEPENDENT SVARITA → COMBINING INVERTED DOUBLE ARCH BELOW
+ 0x0347: (0x0333,), #  COMBINING EQUALS SIGN BELOW → COMBINING DOUBLE LOW LINE
+ 0x08f9: (0x0354,), #  ARABIC LEFT ARROWHEAD BELOW → COMBINING LEFT ARROWHEAD BELOW
+ 0x08fa: (0x0355,), #  ARABIC RIGHT ARROWHEAD BELOW → COMBINING RIGHT ARROWHEAD BELOW
+ 0x309b: (0xff9e,), #  KATAKANA-HIRAGANA VOICED SOUND MARK → HALFWIDTH KATAKANA VOICED SOUND MARK
+ 0x309c: (0xff9f,), #  KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK → HALFWIDTH KATAKANA SEMI-VOICED SOUND MARK
+ 0x0336: (0x0335,), #  COMBINING LONG STROKE OVERLAY → COMBINING SHORT STROKE OVERLAY
+ 0x302c: (0x0309,), #  IDEOGRAPHIC DEPARTING TONE MARK → COMBINING HOOK ABOVE
+ 0x05c5: (0x0323,), #  HEBREW MARK LOWER DOT → COMBINING DOT BELOW
+ 0x08ed: (0x0323,), #  ARABIC TONE ONE DOT BELOW → COMBINING DOT BELOW
+ 0x1cdd: (0x0323,), #  VEDIC TONE DOT BELOW → COMBINING DOT BELOW
+ 0x05b4: (0x0323,), #  HEBREW POINT HIRIQ → COMBINING DOT BELOW
+ 0x065c: (0x0323,), #  ARABIC VOWEL SIGN DOT BELOW → COMBINING DOT BELOW
+ 0x093c: (0x0323,), #  DEVANAGARI SIGN NUKTA → COMBINING DOT BELOW
+ 0x09bc: (0x0323,), #  BENGALI SIGN NUKTA → COMBINING DOT BELOW
+ 0x0a3c: (0x0323,), #  GURMUKHI SIGN NUKTA → COMBINING DOT BELOW
+ 0x0abc: (0x0323,), #  GUJARATI SIGN NUKTA → COMBINING DOT BELOW
+ 0x0b3c: (0x0323,), #  ORIYA SIGN NUKTA → COMBINING DOT BELOW
+ 0x111ca: (0x0323,), #  SHARADA SIGN NUKTA → COMBINING DOT BELOW	# →़→
+ 0x114c3: (0x0323,), #  TIRHUTA SIGN NUKTA → COMBINING DOT BELOW	# →়→
+ 0x10a3a: (0x0323,), #  KHAROSHTHI SIGN DOT BELOW → COMBINING DOT BELOW
+ 0x08ee: (0x0324,), #  ARABIC TONE TWO DOTS BELOW → COMBINING DIAERESIS BELOW
+ 0x1cde: (0x0324,), #  VEDIC TONE TWO DOTS BELOW → COMBINING DIAERESIS BELOW
+ 0x0f37: (0x0325,), #  TIBETAN MARK NGAS BZUNG SGOR RTAGS → COMBINING RING BELOW
+ 0x302d: (0x0325,), #  IDEOGRAPHIC ENTERING TONE MARK → COMBINING RING BELOW
+ 0x0327: (0x0326,), #  COMBINING CEDILLA → COMBINING COMMA BELOW	# →̡→
+ 0x0321: (0x0326,), #  COMBINING PALATALIZED HOOK BELOW → COMBINING COMMA BELOW
+ 0x0339: (0x0326,), #  COMBINING RIGHT HALF RING BELOW → COMBINING COMMA BELOW	# →̧→→̡→
+ 0x1cd9: (0x032d,), #  VEDIC TONE YAJURVEDIC KATHAKA INDEPENDENT SVARITA SCHROEDER → COMBINING CIRCUMFLEX ACCENT BELOW
+ 0x1cd8: (0x032e,), #  VEDIC TONE CANDRA BELOW → COMBINING BREVE BELOW
+ 0x0952: (0x0331,), #  DEVANAGARI STRESS SIGN ANUDATTA → COMBINING MACRON BELOW
+ 0x0320: (0x0331,), #  COMBINING MINUS SIGN BELOW → COMBINING MACRON BELOW
+ 0x08f1: (0x064c,), #  ARABIC OPEN DAMMATAN → ARABIC DAMMATAN
+ 0x08e8: (0x064c,), #  ARABIC CURLY DAMMATAN → ARABIC DAMMATAN
+ 0x08e5: (0x064c,), #  ARABIC CURLY DAMMA → ARABIC DAMMATAN
+ 0xfc5e: (0xfe72, 0x0651,), #  ARABIC LIGATURE SHADDA WITH DAMMATAN ISOLATED FORM → ARABIC DAMMATAN ISOLATED FORM, ARABIC SHADDA
+ 0x08f2: (0x064d,), #  ARABIC OPEN KASRATAN → ARABIC KASRATAN
+ 0xfc5f: (0xfe74, 0x0651,), #  ARABIC LIGATURE SHADDA WITH KASRATAN ISOLATED FORM → ARABIC KASRATAN ISOLATED FORM, ARABIC SHADDA
+ 0xfcf2: (0xfe77, 0x0651,), #  ARABIC LIGATURE SHADDA WITH FATHA MEDIAL FORM → ARABIC FATHA MEDIAL FORM, ARABIC SHADDA
+ 0xfc60: (0xfe76, 0x0651,), #  ARABIC LIGATURE SHADDA WITH FATHA ISOLATED FORM → ARABIC FATHA ISOLATED FORM, ARABIC SHADDA
+ 0xfcf3: (0xfe79, 0x0651,), #  ARABIC LIGATURE SHADDA WITH DAMMA MEDIAL FORM → ARABIC DAMMA MEDIAL FORM, ARABIC SHADDA
+ 0xfc61: (0xfe78, 0x0651,), #  ARABIC LIGATURE SHADDA WITH DAMMA ISOLATED FORM → ARABIC DAMMA ISOLATED FORM, ARABIC SHADDA
+ 0x061a: (0x0650,), #  ARABIC SMALL KASRA → ARABIC KASRA
+ 0x0317: (0x0650,), #  COMBINING ACUTE ACCENT BELOW → ARABIC KASRA
+ 0xfcf4: (0xfe7b, 0x0651,), #  ARABIC LIGATURE SHADDA WITH KASRA MEDIAL FORM → ARABIC KASRA MEDIAL FORM, ARABIC SHADDA
+ 0xfc62: (0xfe7a, 0x0651,), #  ARABIC LIGATURE SHADDA WITH KASRA ISOLATED FORM → ARABIC KASRA ISOLATED FORM, ARABIC SHADDA
+ 0xfc63: (0xfe7c, 0x0670,), #  ARABIC LIGATURE SHADDA WITH SUPERSCRIPT ALEF ISOLATED FORM → ARABIC SHADDA ISOLATED FORM, ARABIC LETTER SUPERSCRIPT ALEF
+ 0x065f: (0x0655,), #  ARABIC WAVY HAMZA BELOW → ARABIC HAMZA BELOW
+ 0x030d: (0x0670,), #  COMBINING VERTICAL LINE ABOVE → ARABIC LETTER SUPERSCRIPT ALEF
+ 0x0742: (0x073c,), #  SYRIAC RUKKAKHA → SYRIAC HBASA-ESASA DOTTED
+ 0x0a03: (0x0983,), #  GURMUKHI SIGN VISARGA → BENGALI SIGN VISARGA
+ 0x0c03: (0x0983,), #  TELUGU SIGN VISARGA → BENGALI SIGN VISARGA	# →ਃ→
+ 0x0c83: (0x0983,), #  KANNADA SIGN VISARGA → BENGALI SIGN VISARGA	# →ః→→ਃ→
+ 0x0d03: (0x0983,), #  MALAYALAM SIGN VISARGA → BENGALI SIGN VISARGA	# →ಃ→→ః→→ਃ→
+ 0x0d83: (0x0983,), #  SINHALA SIGN VISARGAYA → BENGALI SIGN VISARGA	# →ഃ→→ಃ→→ః→→ਃ→
+ 0x1038: (0x0983,), #  MYANMAR SIGN VISARGA → BENGALI SIGN VISARGA	# →ඃ→→ഃ→→ಃ→→ః→→ਃ→
+ 0x114c1: (0x0983,), #  TIRHUTA SIGN VISARGA → BENGALI SIGN VISARGA
+ 0x17cb: (0x0e48,), #  KHMER SIGN BANTOC → THAI CHARACTER MAI EK
+ 0x0ec8: (0x0e48,), #  LAO TONE MAI EK → THAI CHARACTER MAI EK
+ 0x0ec9: (0x0e49,), #  LAO TONE MAI THO → THAI CHARACTER MAI THO
+ 0x0eca: (0x0e4a,), #  LAO TONE MAI TI → THAI CHARACTER MAI TRI
+ 0x0ecb: (0x0e4b,), #  LAO TONE MAI CATAWA → THAI CHARACTER MAI CHATTAWA
+ 0xa66f: (0x20e9,), #  COMBINING CYRILLIC VZMET → COMBINING WIDE BRIDGE ABOVE
+ 0x2028: (0x0020,), #  LINE SEPARATOR → SPACE
+ 0x2029: (0x0020,), #  PARAGRAPH SEPARATOR → SPACE
+ 0x1680: (0x0020,), #  OGHAM SPACE MARK → SPACE
+ 0x2000: (0x0020,), #  EN QUAD → SPACE
+ 0x2001: (0x0020,), #  EM QUAD → SPACE
+ 0x2002: (0x0020,), #  EN SPACE → SPACE
+ 0x2003: (0x0020,), #  EM SPACE → SPACE
+ 0x2004: (0x0020,), #  THREE-PER-EM SPACE → SPACE
+ 0x2005: (0x0020,), #  FOUR-PER-EM SPACE → SPACE
+ 0x2006: (0x0020,), #  SIX-PER-EM SPACE → SPACE
+ 0x2008: (0x0020,), #  PUNCTUATION SPACE → SPACE
+ 0x2009: (0x0020,), #  THIN SPACE → SPACE
+ 0x200a: (0x0020,), #  HAIR SPACE → SPACE
+ 0x205f: (0x0020,), #  MEDIUM MATHEMATICAL SPACE → SPACE
+ 0x00a0: (0x0020,), #  NO-BREAK SPACE → SPACE
+ 0x2007: (0x0020,), #  FIGURE SPACE → SPACE
+ 0x202f: (0x0020,), #  NARROW NO-BREAK SPACE → SPACE
+ 0x07fa: (0x005f,), #  NKO LAJANYALAN → LOW LINE
+ 0xfe4d: (0x005f,), #  DASHED LOW LINE → LOW LINE
+ 0xfe4e: (0x005f,), #  CENTRELINE LOW LINE → LOW LINE
+ 0xfe4f: (0x005f,), #  WAVY LOW LINE → LOW LINE
+ 0x2010: (0x002d,), #  HYPHEN → HYPHEN-MINUS
+ 0x2011: (0x002d,), #  NON-BREAKING HYPHEN → HYPHEN-MINUS
+ 0x2012: (0x002d,), #  FIGURE DASH → HYPHEN-MINUS
+ 0x2013: (0x002d,), #  EN DASH → HYPHEN-MINUS
+ 0xfe58: (0x002d,), #  SMALL EM DASH → HYPHEN-MINUS
+ 0x06d4: (0x002d,), #  ARABIC FULL STOP → HYPHEN-MINUS	# →‐→
+ 0x2043: (0x002d,), #  HYPHEN BULLET → HYPHEN-MINUS	# →‐→
+ 0x02d7: (0x002d,), #  MODIFIER LETTER MINUS SIGN → HYPHEN-MINUS
+ 0x2212: (0x002d,), #  MINUS SIGN → HYPHEN-MINUS
+ 0x2796: (0x002d,), #  HEAVY MINUS SIGN → HYPHEN-MINUS	# →−→
+ 0x2cba: (0x002d,), #  COPTIC CAPITAL LETTER DIALECT-P NI → HYPHEN-MINUS	# →‒→
+ 0x2a29: (0x002d, 0x0313,), #  MINUS SIGN WITH COMMA ABOVE → HYPHEN-MINUS, COMBINING COMMA ABOVE	# →−̓→
+ 0x2e1a: (0x002d, 0x0308,), #  HYPHEN WITH DIAERESIS → HYPHEN-MINUS, COMBINING DIAERESIS
+ 0xfb29: (0x002d, 0x0307,), #  HEBREW LETTER ALTERNATIVE PLUS SIGN → HYPHEN-MINUS, COMBINING DOT ABOVE	# →∸→→−̇→
+ 0x2238: (0x002d, 0x0307,), #  DOT MINUS → HYPHEN-MINUS, COMBINING DOT ABOVE	# →−̇→
+ 0x2a2a: (0x002d, 0x0323,), #  MINUS SIGN WITH DOT BELOW → HYPHEN-MINUS, COMBINING DOT BELOW	# →−̣→
+ 0xa4fe: (0x002d, 0x002e,), #  LISU PUNCTUATION COMMA → HYPHEN-MINUS, FULL STOP
+ 0xff5e: (0x301c,), #  FULLWIDTH TILDE → WAVE DASH
+ 0x060d: (0x002c,), #  ARABIC DATE SEPARATOR → COMMA	# →‎٫‎→
+ 0x066b: (0x002c,), #  ARABIC DECIMAL SEPARATOR → COMMA
+ 0x201a: (0x002c,), #  SINGLE LOW-9 QUOTATION MARK → COMMA
+ 0x00b8: (0x002c,), #  CEDILLA → COMMA
+ 0xa4f9: (0x002c,), #  LISU LETTER TONE NA PO → COMMA
+ 0x2e32: (0x060c,), #  TURNED COMMA → ARABIC COMMA
+ 0x066c: (0x060c,), #  ARABIC THOUSANDS SEPARATOR → ARABIC COMMA
+ 0x037e: (0x003b,), #  GREEK QUESTION MARK → SEMICOLON
+ 0x2e35: (0x061b,), #  TURNED SEMICOLON → ARABIC SEMICOLON
+ 0x0903: (0x003a,), #  DEVANAGARI SIGN VISARGA → COLON
+ 0x0a83: (0x003a,), #  GUJARATI SIGN VISARGA → COLON
+ 0xff1a: (0x003a,), #  FULLWIDTH COLON → COLON	# →︰→
+ 0x0589: (0x003a,), #  ARMENIAN FULL STOP → COLON
+ 0x0703: (0x003a,), #  SYRIAC SUPRALINEAR COLON → COLON
+ 0x0704: (0x003a,), #  SYRIAC SUBLINEAR COLON → COLON
+ 0x16ec: (0x003a,), #  RUNIC MULTIPLE PUNCTUATION → COLON
+ 0xfe30: (0x003a,), #  PRESENTATION FORM FOR VERTICAL TWO DOT LEADER → COLON
+ 0x1803: (0x003a,), #  MONGOLIAN FULL STOP → COLON
+ 0x1809: (0x003a,), #  MONGOLIAN MANCHU FULL STOP → COLON
+ 0x205a: (0x003a,), #  TWO DOT PUNCTUATION → COLON
+ 0x05c3: (0x003a,), #  HEBREW PUNCTUATION SOF PASUQ → COLON
+ 0x02f8: (0x003a,), #  MODIFIER LETTER RAISED COLON → COLON
+ 0xa789: (0x003a,), #  MODIFIER LETTER COLON → COLON
+ 0x2236: (0x003a,), #  RATIO → COLON
+ 0x02d0: (0x003a,), #  MODIFIER LETTER TRIANGULAR COLON → COLON
+ 0xa4fd: (0x003a,), #  LISU LETTER TONE MYA JEU → COLON
+ 0x2a74: (0x003a, 0x003a, 0x003d,), #  DOUBLE COLON EQUAL → COLON, COLON, EQUALS SIGN
+ 0x29f4: (0x003a, 0x2192,), #  RULE-DELAYED → COLON, RIGHTWARDS ARROW
+ 0xff01: (0x0021,), #  FULLWIDTH EXCLAMATION MARK → EXCLAMATION MARK	# →ǃ→
+ 0x01c3: (0x0021,), #  LATIN LETTER RETROFLEX CLICK → EXCLAMATION MARK
+ 0x2d51: (0x0021,), #  TIFINAGH LETTER TUAREG YANG → EXCLAMATION MARK
+ 0x203c: (0x0021, 0x0021,), #  DOUBLE EXCLAMATION MARK → EXCLAMATION MARK, EXCLAMATION MARK
+ 0x2049: (0x0021, 0x003f,), #  EXCLAMATION QUESTION MARK → EXCLAMATION MARK, QUESTION MARK
+ 0x0294: (0x003f,), #  LATIN LETTER GLOTTAL STOP → QUESTION MARK
+ 0x0241: (0x003f,), #  LATIN CAPITAL LETTER GLOTTAL STOP → QUESTION MARK	# →ʔ→
+ 0x097d: (0x003f,), #  DEVANAGARI LETTER GLOTTAL STOP → QUESTION MARK
+ 0x13ae: (0x003f,), #  CHEROKEE LETTER HE → QUESTION MARK	# →Ɂ→→ʔ→
+ 0xa6eb: (0x003f,), #  BAMUM LETTER NTUU → QUESTION MARK	# →ʔ→
+ 0x2048: (0x003f, 0x0021,), #  QUESTION EXCLAMATION MARK → QUESTION MARK, EXCLAMATION MARK
+ 0x2047: (0x003f, 0x003f,), #  DOUBLE QUESTION MARK → QUESTION MARK, QUESTION MARK
+ 0x2e2e: (0x061f,), #  REVERSED QUESTION MARK → ARABIC QUESTION MARK
+ 0x1d16d: (0x002e,), #  MUSICAL SYMBOL COMBINING AUGMENTATION DOT → FULL STOP
+ 0x2024: (0x002e,), #  ONE DOT LEADER → FULL STOP
+ 0x0701: (0x002e,), #  SYRIAC SUPRALINEAR FULL STOP → FULL STOP
+ 0x0702: (0x002e,), #  SYRIAC SUBLINEAR FULL STOP → FULL STOP
+ 0xa60e: (0x002e,), #  VAI FULL STOP → FULL STOP
+ 0x10a50: (0x002e,), #  KHAROSHTHI PUNCTUATION DOT → FULL STOP
+ 0x0660: (0x002e,), #  ARABIC-INDIC DIGIT ZERO → FULL STOP
+ 0x06f0: (0x002e,), #  EXTENDED ARABIC-INDIC DIGIT ZERO → FULL STOP	# →‎٠‎→
+ 0xa4f8: (0x002e,), #  LISU LETTER TONE MYA TI → FULL STOP
+ 0xa4fb: (0x002e, 0x002c,), #  LISU LETTER TONE MYA BO → FULL STOP, COMMA
+ 0x2025: (0x002e, 0x002e,), #  TWO DOT LEADER → FULL STOP, FULL STOP
+ 0xa4fa: (0x002e, 0x002e,), #  LISU LETTER TONE MYA CYA → FULL STOP, FULL STOP
+ 0x2026: (0x002e, 0x002e, 0x002e,), #  HORIZONTAL ELLIPSIS → FULL STOP, FULL STOP, FULL STOP
+ 0xa6f4: (0xa6f3, 0xa6f3,), #  BAMUM COLON → BAMUM FULL STOP, BAMUM FULL STOP
+ 0x30fb: (0x00b7,), #  KATAKANA MIDDLE DOT → MIDDLE DOT	# →•→
+ 0xff65: (0x00b7,), #  HALFWIDTH KATAKANA MIDDLE DOT → MIDDLE DOT	# →•→
+ 0x16eb: (0x00b7,), #  RUNIC SINGLE PUNCTUATION → MIDDLE DOT
+ 0x0387: (0x00b7,), #  GREEK ANO TELEIA → MIDDLE DOT
+ 0x2e31: (0x00b7,), #  WORD SEPARATOR MIDDLE DOT → MIDDLE DOT
+ 0x10101: (0x00b7,), #  AEGEAN WORD SEPARATOR DOT → MIDDLE DOT
+ 0x2022: (0x00b7,), #  BULLET → MIDDLE DOT
+ 0x2027: (0x00b7,), #  HYPHENATION POINT → MIDDLE DOT
+ 0x2219: (0x00b7,), #  BULLET OPERATOR → MIDDLE DOT
+ 0x22c5: (0x00b7,), #  DOT OPERATOR → MIDDLE DOT
+ 0xa78f: (0x00b7,), #  LATIN LETTER SINOLOGICAL DOT → MIDDLE DOT
+ 0x1427: (0x00b7,), #  CANADIAN SYLLABICS FINAL MIDDLE DOT → MIDDLE DOT
+ 0x22ef: (0x00b7, 0x00b7, 0x00b7,), #  MIDLINE HORIZONTAL ELLIPSIS → MIDDLE DOT, MIDDLE DOT, MIDDLE DOT
+ 0x2d48: (0x00b7, 0x00b7, 0x00b7,), #  TIFINAGH LETTER TUAREG YAQ → MIDDLE DOT, MIDDLE DOT, MIDDLE DOT	# →⋯→
+ 0x1444: (0x00b7, 0x003c,), #  CANADIAN SYLLABICS PWA → MIDDLE DOT, LESS-THAN SIGN	# →ᐧᐸ→
+ 0x22d7: (0x00b7, 0x003e,), #  GREATER-THAN WITH DOT → MIDDLE DOT, GREATER-THAN SIGN	# →ᑀ→→ᐧᐳ→
+ 0x1437: (0x00b7, 0x003e,), #  CANADIAN SYLLABICS CARRIER HI → MIDDLE DOT, GREATER-THAN SIGN	# →ᑀ→→ᐧᐳ→
+ 0x1440: (0x00b7, 0x003e,), #  CANADIAN SYLLABICS PWO → MIDDLE DOT, GREATER-THAN SIGN	# →ᐧᐳ→
+ 0x152f: (0x00b7, 0x0034,), #  CANADIAN SYLLABICS YWE → MIDDLE DOT, DIGIT FOUR	# →ᐧ4→
+ 0x147e: (0x00b7, 0x0062,), #  CANADIAN SYLLABICS KWA → MIDDLE DOT, LATIN SMALL LETTER B	# →ᐧᑲ→
+ 0x1480: (0x00b7, 0x0062, 0x0307,), #  CANADIAN SYLLABICS KWAA → MIDDLE DOT, LATIN SMALL LETTER B, COMBINING DOT ABOVE	# →ᐧᑳ→
+ 0x147a: (0x00b7, 0x0064,), #  CANADIAN SYLLABICS KWO → MIDDLE DOT, LATIN SMALL LETTER D	# →ᐧᑯ→
+ 0x1498: (0x00b7, 0x004a,), #  CANADIAN SYLLABICS CWO → MIDDLE DOT, LATIN CAPITAL LETTER J	# →ᐧᒍ→
+ 0x14b6: (0x00b7, 0x004c,), #  CANADIAN SYLLABICS MWA → MIDDLE DOT, LATIN CAPITAL LETTER L	# →ᐧL→
+ 0x1476: (0x00b7, 0x0050,), #  CANADIAN SYLLABICS KWI → MIDDLE DOT, LATIN CAPITAL LETTER P	# →ᐧᑭ→
+ 0x1457: (0x00b7, 0x0055,), #  CANADIAN SYLLABICS TWE → MIDDLE DOT, LATIN CAPITAL LETTER U	# →ᐧᑌ→→·ᑌ→
+ 0x143a: (0x00b7, 0x0056,), #  CANADIAN SYLLABICS PWE → MIDDLE DOT, LATIN CAPITAL LETTER V	# →ᐧᐯ→
+ 0x143c: (0x00b7, 0x0245,), #  CANADIAN SYLLABICS PWI → MIDDLE DOT, LATIN CAPITAL LETTER TURNED V	# →ᐧᐱ→→·ᐱ→
+ 0x14ae: (0x00b7, 0x0393,), #  CANADIAN SYLLABICS MWI → MIDDLE DOT, GREEK CAPITAL LETTER GAMMA	# →ᐧᒥ→→·ᒥ→
+ 0x140e: (0x00b7, 0x0394,), #  CANADIAN SYLLABICS WI → MIDDLE DOT, GREEK CAPITAL LETTER DELTA	# →ᐧᐃ→
+ 0x1459: (0x00b7, 0x0548,), #  CANADIAN SYLLABICS TWI → MIDDLE DOT, ARMENIAN CAPITAL LETTER VO	# →ᐧᑎ→→·ᑎ→
+ 0x140c: (0x00b7, 0x1401,), #  CANADIAN SYLLABICS WE → MIDDLE DOT, CANADIAN SYLLABICS E	# →ᐧᐁ→
+ 0x1410: (0x00b7, 0x1404,), #  CANADIAN SYLLABICS WII → MIDDLE DOT, CANADIAN SYLLABICS II	# →ᐧᐄ→
+ 0x1412: (0x00b7, 0x1405,), #  CANADIAN SYLLABICS WO → MIDDLE DOT, CANADIAN SYLLABICS O	# →ᐧᐅ→
+ 0x1414: (0x00b7, 0x1406,), #  CANADIAN SYLLABICS WOO → MIDDLE DOT, CANADIAN SYLLABICS OO	# →ᐧᐆ→
+ 0x1417: (0x00b7, 0x140a,), #  CANADIAN SYLLABICS WA → MIDDLE DOT, CANADIAN SYLLABICS A	# →ᐧᐊ→
+ 0x1419: (0x00b7, 0x140b,), #  CANADIAN SYLLABICS WAA → MIDDLE DOT, CANADIAN SYLLABICS AA	# →ᐧᐋ→
+ 0x143e: (0x00b7, 0x1432,), #  CANADIAN SYLLABICS PWII → MIDDLE DOT, CANADIAN SYLLABICS PII	# →ᐧᐲ→
+ 0x1442: (0x00b7, 0x1434,), #  CANADIAN SYLLABICS PWOO → MIDDLE DOT, CANADIAN SYLLABICS POO	# →ᐧᐴ→
+ 0x1446: (0x00b7, 0x1439,), #  CANADIAN SYLLABICS PWAA → MIDDLE DOT, CANADIAN SYLLABICS PAA	# →ᐧᐹ→
+ 0x145b: (0x00b7, 0x144f,), #  CANADIAN SYLLABICS TWII → MIDDLE DOT, CANADIAN SYLLABICS TII	# →ᐧᑏ→
+ 0x1454: (0x00b7, 0x1450,), #  CANADIAN SYLLABICS CARRIER DI → MIDDLE DOT, CANADIAN SYLLABICS TO	# →ᑝ→→ᐧᑐ→
+ 0x145d: (0x00b7, 0x1450,), #  CANADIAN SYLLABICS TWO → MIDDLE DOT, CANADIAN SYLLABICS TO	# →ᐧᑐ→
+ 0x145f: (0x00b7, 0x1451,), #  CANADIAN SYLLABICS TWOO → MIDDLE DOT, CANADIAN SYLLABICS TOO	# →ᐧᑑ→
+ 0x1461: (0x00b7, 0x1455,), #  CANADIAN SYLLABICS TWA → MIDDLE DOT, CANADIAN SYLLABICS TA	# →ᐧᑕ→
+ 0x1463: (0x00b7, 0x1456,), #  CANADIAN SYLLABICS TWAA → MIDDLE DOT, CANADIAN SYLLABICS TAA	# →ᐧᑖ→
+ 0x1474: (0x00b7, 0x146b,), #  CANADIAN SYLLABICS KWE → MIDDLE DOT, CANADIAN SYLLABICS KE	# →ᐧᑫ→
+ 0x1478: (0x00b7, 0x146e,), #  CANADIAN SYLLABICS KWII → MIDDLE DOT, CANADIAN SYLLABICS KII	# →ᐧᑮ→
+ 0x147c: (0x00b7, 0x1470,), #  CANADIAN SYLLABICS KWOO → MIDDLE DOT, CANADIAN SYLLABICS KOO	# →ᐧᑰ→
+ 0x1492: (0x00b7, 0x1489,), #  CANADIAN SYLLABICS CWE → MIDDLE DOT, CANADIAN SYLLABICS CE	# →ᐧᒉ→
+ 0x1494: (0x00b7, 0x148b,), #  CANADIAN SYLLABICS CWI → MIDDLE DOT, CANADIAN SYLLABICS CI	# →ᐧᒋ→
+ 0x1496: (0x00b7, 0x148c,), #  CANADIAN SYLLABICS CWII → MIDDLE DOT, CANADIAN SYLLABICS CII	# →ᐧᒌ→
+ 0x149a: (0x00b7, 0x148e,), #  CANADIAN SYLLABICS CWOO → MIDDLE DOT, CANADIAN SYLLABICS COO	# →ᐧᒎ→
+ 0x149c: (0x00b7, 0x1490,), #  CANADIAN SYLLABICS CWA → MIDDLE DOT, CANADIAN SYLLABICS CA	# →ᐧᒐ→
+ 0x149e: (0x00b7, 0x1491,), #  CANADIAN SYLLABICS CWAA → MIDDLE DOT, CANADIAN SYLLABICS CAA	# →ᐧᒑ→
+ 0x14ac: (0x00b7, 0x14a3,), #  CANADIAN SYLLABICS MWE → MIDDLE DOT, CANADIAN SYLLABICS ME	# →ᐧᒣ→
+ 0x14b0: (0x00b7, 0x14a6,), #  CANADIAN SYLLABICS MWII → MIDDLE DOT, CANADIAN SYLLABICS MII	# →ᐧᒦ→
+ 0x14b2: (0x00b7, 0x14a7,), #  CANADIAN SYLLABICS MWO → MIDDLE DOT, CANADIAN SYLLABICS MO	# →ᐧᒧ→
+ 0x14b4: (0x00b7, 0x14a8,), #  CANADIAN SYLLABICS MWOO → MIDDLE DOT, CANADIAN SYLLABICS MOO	# →ᐧᒨ→
+ 0x14b8: (0x00b7, 0x14ab,), #  CANADIAN SYLLABICS MWAA → MIDDLE DOT, CANADIAN SYLLABICS MAA	# →ᐧᒫ→
+ 0x14c9: (0x00b7, 0x14c0,), #  CANADIAN SYLLABICS NWE → MIDDLE DOT, CANADIAN SYLLABICS NE	# →ᐧᓀ→
+ 0x18c6: (0x00b7, 0x14c2,), #  CANADIAN SYLLABICS NWI → MIDDLE DOT, CANADIAN SYLLABICS NI	# →ᐧᓂ→
+ 0x18c8: (0x00b7, 0x14c3,), #  CANADIAN SYLLABICS NWII → MIDDLE DOT, CANADIAN SYLLABICS NII	# →ᐧᓃ→
+ 0x18ca: (0x00b7, 0x14c4,), #  CANADIAN SYLLABICS NWO → MIDDLE DOT, CANADIAN SYLLABICS NO	# →ᐧᓄ→
+ 0x18cc: (0x00b7, 0x14c5,), #  CANADIAN SYLLABICS NWOO → MIDDLE DOT, CANADIAN SYLLABICS NOO	# →ᐧᓅ→
+ 0x14cb: (0x00b7, 0x14c7,), #  CANADIAN SYLLABICS NWA → MIDDLE DOT, CANADIAN SYLLABICS NA	# →ᐧᓇ→
+ 0x14cd: (0x00b7, 0x14c8,), #  CANADIAN SYLLABICS NWAA → MIDDLE DOT, CANADIAN SYLLABICS NAA	# →ᐧᓈ→
+ 0x14dc: (0x00b7, 0x14d3,), #  CANADIAN SYLLABICS LWE → MIDDLE DOT, CANADIAN SYLLABICS LE	# →ᐧᓓ→
+ 0x14de: (0x00b7, 0x14d5,), #  CANADIAN SYLLABICS LWI → MIDDLE DOT, CANADIAN SYLLABICS LI	# →ᐧᓕ→
+ 0x14e0: (0x00b7, 0x14d6,), #  CANADIAN SYLLABICS LWII → MIDDLE DOT, CANADIAN SYLLABICS LII	# →ᐧᓖ→
+ 0x14e2: (0x00b7, 0x14d7,), #  CANADIAN SYLLABICS LWO → MIDDLE DOT, CANADIAN SYLLABICS LO	# →ᐧᓗ→
+ 0x14e4: (0x00b7, 0x14d8,), #  CANADIAN SYLLABICS LWOO → MIDDLE DOT, CANADIAN SYLLABICS LOO	# →ᐧᓘ→
+ 0x14e6: (0x00b7, 0x14da,), #  CANADIAN SYLLABICS LWA → MIDDLE DOT, CANADIAN SYLLABICS LA	# →ᐧᓚ→
+ 0x14e8: (0x00b7, 0x14db,), #  CANADIAN SYLLABICS LWAA → MIDDLE DOT, CANADIAN SYLLABICS LAA	# →ᐧᓛ→
+ 0x14f6: (0x00b7, 0x14ed,), #  CANADIAN SYLLABICS SWE → MIDDLE DOT, CANADIAN SYLLABICS SE	# →ᐧᓭ→
+ 0x14f8: (0x00b7, 0x14ef,), #  CANADIAN SYLLABICS SWI → MIDDLE DOT, CANADIAN SYLLABICS SI	# →ᐧᓯ→
+ 0x14fa: (0x00b7, 0x14f0,), #  CANADIAN SYLLABICS SWII → MIDDLE DOT, CANADIAN SYLLABICS SII	# →ᐧᓰ→
+ 0x14fc: (0x00b7, 0x14f1,), #  CANADIAN SYLLABICS SWO → MIDDLE DOT, CANADIAN SYLLABICS SO	# →ᐧᓱ→
+ 0x14fe: (0x00b7, 0x14f2,), #  CANADIAN SYLLABICS SWOO → MIDDLE DOT, CANADIAN SYLLABICS SOO	# →ᐧᓲ→
+ 0x1500: (0x00b7, 0x14f4,), #  CANADIAN SYLLABICS SWA → MIDDLE DOT, CANADIAN SYLLABICS SA	# →ᐧᓴ→
+ 0x1502: (0x00b7, 0x14f5,), #  CANADIAN SYLLABICS SWAA → MIDDLE DOT, CANADIAN SYLLABICS SAA	# →ᐧᓵ→
+ 0x1517: (0x00b7, 0x1510,), #  CANADIAN SYLLABICS SHWE → MIDDLE DOT, CANADIAN SYLLABICS SHE	# →ᐧᔐ→
+ 0x1519: (0x00b7, 0x1511,), #  CANADIAN SYLLABICS SHWI → MIDDLE DOT, CANADIAN SYLLABICS SHI	# →ᐧᔑ→
+ 0x151b: (0x00b7, 0x1512,), #  CANADIAN SYLLABICS SHWII → MIDDLE DOT, CANADIAN SYLLABICS SHII	# →ᐧᔒ→
+ 0x151d: (0x00b7, 0x1513,), #  CANADIAN SYLLABICS SHWO → MIDDLE DOT, CANADIAN SYLLABICS SHO	# →ᐧᔓ→
+ 0x151f: (0x00b7, 0x1514,), #  CANADIAN SYLLABICS SHWOO → MIDDLE DOT, CANADIAN SYLLABICS SHOO	# →ᐧᔔ→
+ 0x1521: (0x00b7, 0x1515,), #  CANADIAN SYLLABICS SHWA → MIDDLE DOT, CANADIAN SYLLABICS SHA	# →ᐧᔕ→
+ 0x1523: (0x00b7, 0x1516,), #  CANADIAN SYLLABICS SHWAA → MIDDLE DOT, CANADIAN SYLLABICS SHAA	# →ᐧᔖ→
+ 0x1531: (0x00b7, 0x1528,), #  CANADIAN SYLLABICS YWI → MIDDLE DOT, CANADIAN SYLLABICS YI	# →ᐧᔨ→
+ 0x1533: (0x00b7, 0x1529,), #  CANADIAN SYLLABICS YWII → MIDDLE DOT, CANADIAN SYLLABICS YII	# →ᐧᔩ→
+ 0x1535: (0x00b7, 0x152a,), #  CANADIAN SYLLABICS YWO → MIDDLE DOT, CANADIAN SYLLABICS YO	# →ᐧᔪ→
+ 0x1537: (0x00b7, 0x152b,), #  CANADIAN SYLLABICS YWOO → MIDDLE DOT, CANADIAN SYLLABICS YOO	# →ᐧᔫ→
+ 0x1539: (0x00b7, 0x152d,), #  CANADIAN SYLLABICS YWA → MIDDLE DOT, CANADIAN SYLLABICS YA	# →ᐧᔭ→
+ 0x153b: (0x00b7, 0x152e,), #  CANADIAN SYLLABICS YWAA → MIDDLE DOT, CANADIAN SYLLABICS YAA	# →ᐧᔮ→
+ 0x18ce: (0x00b7, 0x1543,), #  CANADIAN SYLLABICS RWEE → MIDDLE DOT, CANADIAN SYLLABICS R-CREE RE	# →ᐧᕃ→
+ 0x18cf: (0x00b7, 0x1546,), #  CANADIAN SYLLABICS RWI → MIDDLE DOT, CANADIAN SYLLABICS RI	# →ᐧᕆ→
+ 0x18d0: (0x00b7, 0x1547,), #  CANADIAN SYLLABICS RWII → MIDDLE DOT, CANADIAN SYLLABICS RII	# →ᐧᕇ→
+ 0x18d1: (0x00b7, 0x1548,), #  CANADIAN SYLLABICS RWO → MIDDLE DOT, CANADIAN SYLLABICS RO	# →ᐧᕈ→
+ 0x18d2: (0x00b7, 0x1549,), #  CANADIAN SYLLABICS RWOO → MIDDLE DOT, CANADIAN SYLLABICS ROO	# →ᐧᕉ→
+ 0x18d3: (0x00b7, 0x154b,), #  CANADIAN SYLLABICS RWA → MIDDLE DOT, CANADIAN SYLLABICS RA	# →ᐧᕋ→
+ 0x154e: (0x00b7, 0x154c,), #  CANADIAN SYLLABICS RWAA → MIDDLE DOT, CANADIAN SYLLABICS RAA	# →ᐧᕌ→
+ 0x155b: (0x00b7, 0x155a,), #  CANADIAN SYLLABICS FWAA → MIDDLE DOT, CANADIAN SYLLABICS FAA	# →ᐧᕚ→
+ 0x1568: (0x00b7, 0x1567,), #  CANADIAN SYLLABICS THWAA → MIDDLE DOT, CANADIAN SYLLABICS THAA	# →ᐧᕧ→
+ 0x18b3: (0x00b7, 0x18b1,), #  CANADIAN SYLLABICS WAY → MIDDLE DOT, CANADIAN SYLLABICS AY	# →ᐧᢱ→
+ 0x18b6: (0x00b7, 0x18b4,), #  CANADIAN SYLLABICS PWOY → MIDDLE DOT, CANADIAN SYLLABICS POY	# →ᐧᢴ→
+ 0x18b9: (0x00b7, 0x18b8,), #  CANADIAN SYLLABICS KWAY → MIDDLE DOT, CANADIAN SYLLABICS KAY	# →ᐧᢸ→
+ 0x18c2: (0x00b7, 0x18c0,), #  CANADIAN SYLLABICS SHWOY → MIDDLE DOT, CANADIAN SYLLABICS SHOY	# →ᐧᣀ→
+ 0xa830: (0x0964,), #  NORTH INDIC FRACTION ONE QUARTER → DEVANAGARI DANDA
+ 0x0965: (0x0964, 0x0964,), #  DEVANAGARI DOUBLE DANDA → DEVANAGARI DANDA, DEVANAGARI DANDA
+ 0x1c3c: (0x1c3b, 0x1c3b,), #  LEPCHA PUNCTUATION NYET THYOOM TA-ROL → LEPCHA PUNCTUATION TA-ROL, LEPCHA PUNCTUATION TA-ROL
+ 0x104b: (0x104a, 0x104a,), #  MYANMAR SIGN SECTION → MYANMAR SIGN LITTLE SECTION, MYANMAR SIGN LITTLE SECTION
+ 0x1aa9: (0x1aa8, 0x1aa8,), #  TAI THAM SIGN KAANKUU → TAI THAM SIGN KAAN, TAI THAM SIGN KAAN
+ 0x1aab: (0x1aaa, 0x1aa8,), #  TAI THAM SIGN SATKAANKUU → TAI THAM SIGN SATKAAN, TAI THAM SIGN KAAN
+ 0x1b5f: (0x1b5e, 0x1b5e,), #  BALINESE CARIK PAREREN → BALINESE CARIK SIKI, BALINESE CARIK SIKI
+ 0x10a57: (0x10a56, 0x10a56,), #  KHAROSHTHI PUNCTUATION DOUBLE DANDA → KHAROSHTHI PUNCTUATION DANDA, KHAROSHTHI PUNCTUATION DANDA
+ 0x1144c: (0x1144b, 0x1144b,), #  NEWA DOUBLE DANDA → NEWA DANDA, NEWA DANDA
+ 0x11642: (0x11641, 0x11641,), #  MODI DOUBLE DANDA → MODI DANDA, MODI DANDA
+ 0x11c42: (0x11c41, 0x11c41,), #  BHAIKSUKI DOUBLE DANDA → BHAIKSUKI DANDA, BHAIKSUKI DANDA
+ 0x1c7f: (0x1c7e, 0x1c7e,), #  OL CHIKI PUNCTUATION DOUBLE MUCAAD → OL CHIKI PUNCTUATION MUCAAD, OL CHIKI PUNCTUATION MUCAAD
+ 0x055d: (0x0027,), #  ARMENIAN COMMA → APOSTROPHE	# →ˋ→→｀→→‘→
+ 0xff07: (0x0027,), #  FULLWIDTH APOSTROPHE → APOSTROPHE	# →’→
+ 0x2018: (0x0027,), #  LEFT SINGLE QUOTATION MARK → APOSTROPHE
+ 0x2019: (0x0027,), #  RIGHT SINGLE QUOTATION MARK → APOSTROPHE
+ 0x201b: (0x0027,), #  SINGLE HIGH-REVERSED-9 QUOTATION MARK → APOSTROPHE	# →′→
+ 0x2032: (0x0027,), #  PRIME → APOSTROPHE
+ 0x2035: (0x0027,), #  REVERSED PRIME → APOSTROPHE	# →ʽ→→‘→
+ 0x055a: (0x0027,), #  ARMENIAN APOSTROPHE → APOSTROPHE	# →’→
+ 0x05f3: (0x0027,), #  HEBREW PUNCTUATION GERESH → APOSTROPHE
+ 0x0060: (0x0027,), #  GRAVE ACCENT → APOSTROPHE	# →ˋ→→｀→→‘→
+ 0x1fef: (0x0027,), #  GREEK VARIA → APOSTROPHE	# →ˋ→→｀→→‘→
+ 0xff40: (0x0027,), #  FULLWIDTH GRAVE ACCENT → APOSTROPHE	# →‘→
+ 0x00b4: (0x0027,), #  ACUTE ACCENT → APOSTROPHE	# →΄→→ʹ→
+ 0x0384: (0x0027,), #  GREEK TONOS → APOSTROPHE	# →ʹ→
+ 0x1ffd: (0x0027,), #  GREEK OXIA → APOSTROPHE	# →´→→΄→→ʹ→
+ 0x1fbd: (0x0027,), #  GREEK KORONIS → APOSTROPHE	# →’→
+ 0x1fbf: (0x0027,), #  GREEK PSILI → APOSTROPHE	# →’→
+ 0x1ffe: (0x0027,), #  GREEK DASIA → APOSTROPHE	# →‛→→′→
+ 0x02b9: (0x0027,), #  MODIFIER LETTER PRIME → APOSTROPHE
+ 0x0374: (0x0027,), #  GREEK NUMERAL SIGN → APOSTROPHE	# →′→
+ 0x02c8: (0x0027,), #  MODIFIER LETTER VERTICAL LINE → APOSTROPHE
+ 0x02ca: (0x0027,), #  MODIFIER LETTER ACUTE ACCENT → APOSTROPHE	# →΄→→ʹ→
+ 0x02cb: (0x0027,), #  MODIFIER LETTER GRAVE ACCENT → APOSTROPHE	# →｀→→‘→
+ 0x02f4: (0x0027,), #  MODIFIER LETTER MIDDLE GRAVE ACCENT → APOSTROPHE	# →ˋ→→｀→→‘→
+ 0x02bb: (0x0027,), #  MODIFIER LETTER TURNED COMMA → APOSTROPHE	# →‘→
+ 0x02bd: (0x0027,), #  MODIFIER LETTER REVERSED COMMA → APOSTROPHE	# →‘→
+ 0x02bc: (0x0027,), #  MODIFIER LETTER APOSTROPHE → APOSTROPHE	# →′→
+ 0x02be: (0x0027,), #  MODIFIER LETTER RIGHT HALF RING → APOSTROPHE	# →ʼ→→′→
+ 0xa78c: (0x0027,), #  LATIN SMALL LETTER SALTILLO → APOSTROPHE
+ 0x05d9: (0x0027,), #  HEBREW LETTER YOD → APOSTROPHE
+ 0x07f4: (0x0027,), #  NKO HIGH TONE APOSTROPHE → APOSTROPHE	# →’→
+ 0x07f5: (0x0027,), #  NKO LOW TONE APOSTROPHE → APOSTROPHE	# →‘→
+ 0x144a: (0x0027,), #  CANADIAN SYLLABICS WEST-CREE P → APOSTROPHE	# →ˈ→
+ 0x16cc: (0x0027,), #  RUNIC LETTER SHORT-TWIG-SOL S → APOSTROPHE
+ 0x16f51: (0x0027,), #  MIAO SIGN ASPIRATION → APOSTROPHE	# →ʼ→→′→
+ 0x16f52: (0x0027,), #  MIAO SIGN REFORMED VOICING → APOSTROPHE	# →ʻ→→‘→
+ 0x1cd3: (0x0027, 0x0027,), #  VEDIC SIGN NIHSHVASA → APOSTROPHE, APOSTROPHE	# →″→→"→
+ 0x0022: (0x0027, 0x0027,), #  QUOTATION MARK → APOSTROPHE, APOSTROPHE
+ 0xff02: (0x0027, 0x0027,), #  FULLWIDTH QUOTATION MARK → APOSTROPHE, APOSTROPHE	# →”→→"→
+ 0x201c: (0x0027, 0x0027,), #  LEFT DOUBLE QUOTATION MARK → APOSTROPHE, APOSTROPHE	# →"→
+ 0x201d: (0x0027, 0x0027,), #  RIGHT DOUBLE QUOTATION MARK → APOSTROPHE, APOSTROPHE	# →"→
+ 0x201f: (0x0027, 0x0027,), #  DOUBLE HIGH-REVERSED-9 QUOTATION MARK → APOSTROPHE, APOSTROPHE	# →“→→"→
+ 0x2033: (0x0027, 0x0027,), #  DOUBLE PRIME → APOSTROPHE, APOSTROPHE	# →"→
+ 0x2036: (0x0027, 0x0027,), #  REVERSED DOUBLE PRIME → APOSTROPHE, APOSTROPHE	# →‵‵→
+ 0x3003: (0x0027, 0x0027,), #  DITTO MARK → APOSTROPHE, APOSTROPHE	# →″→→"→
+ 0x05f4: (0x0027, 0x0027,), #  HEBREW PUNCTUATION GERSHAYIM → APOSTROPHE, APOSTROPHE	# →"→
+ 0x02dd: (0x0027, 0x0027,), #  DOUBLE ACUTE ACCENT → APOSTROPHE, APOSTROPHE	# →"→
+ 0x02ba: (0x0027, 0x0027,), #  MODIFIER LETTER DOUBLE PRIME → APOSTROPHE, APOSTROPHE	# →"→
+ 0x02f6: (0x0027, 0x0027,), #  MODIFIER LETTER MIDDLE DOUBLE ACUTE ACCENT → APOSTROPHE, APOSTROPHE	# →˝→→"→
+ 0x02ee: (0x0027, 0x0027,), #  MODIFIER LETTER DOUBLE APOSTROPHE → APOSTROPHE, APOSTROPHE	# →″→→"→
+ 0x05f2: (0x0027, 0x0027,), #  HEBREW LIGATURE YIDDISH DOUBLE YOD → APOSTROPHE, APOSTROPHE	# →‎יי‎→
+ 0x2034: (0x0027, 0x0027, 0x0027,), #  TRIPLE PRIME → APOSTROPHE, APOSTROPHE, APOSTROPHE	# →′′′→
+ 0x2037: (0x0027, 0x0027, 0x0027,), #  REVERSED TRIPLE PRIME → APOSTROPHE, APOSTROPHE, APOSTROPHE	# →‵‵‵→
+ 0x2057: (0x0027, 0x0027, 0x0027, 0x0027,), #  QUADRUPLE PRIME → APOSTROPHE, APOSTROPHE, APOSTROPHE, APOSTROPHE	# →′′′′→
+ 0x0181: (0x0027, 0x0042,), #  LATIN CAPITAL LETTER B WITH HOOK → APOSTROPHE, LATIN CAPITAL LETTER B	# →ʽB→
+ 0x018a: (0x0027, 0x0044,), #  LATIN CAPITAL LETTER D WITH HOOK → APOSTROPHE, LATIN CAPITAL LETTER D	# →ʽD→
+ 0x0149: (0x0027, 0x006e,), #  LATIN SMALL LETTER N PRECEDED BY APOSTROPHE → APOSTROPHE, LATIN SMALL LETTER N	# →ʼn→
+ 0x01a4: (0x0027, 0x0050,), #  LATIN CAPITAL LETTER P WITH HOOK → APOSTROPHE, LATIN CAPITAL LETTER P	# →ʽP→
+ 0x01ac: (0x0027, 0x0054,), #  LATIN CAPITAL LETTER T WITH HOOK → APOSTROPHE, LATIN CAPITAL LETTER T	# →ʽT→
+ 0x01b3: (0x0027, 0x0059,), #  LATIN CAPITAL LETTER Y WITH HOOK → APOSTROPHE, LATIN CAPITAL LETTER Y	# →ʽY→
+ 0xff3b: (0x0028,), #  FULLWIDTH LEFT SQUARE BRACKET → LEFT PARENTHESIS	# →〔→
+ 0x2768: (0x0028,), #  MEDIUM LEFT PARENTHESIS ORNAMENT → LEFT PARENTHESIS
+ 0x2772: (0x0028,), #  LIGHT LEFT TORTOISE SHELL BRACKET ORNAMENT → LEFT PARENTHESIS	# →〔→
+ 0x3014: (0x0028,), #  LEFT TORTOISE SHELL BRACKET → LEFT PARENTHESIS
+ 0xfd3e: (0x0028,), #  ORNATE LEFT PARENTHESIS → LEFT PARENTHESIS
+ 0x2e28: (0x0028, 0x0028,), #  LEFT DOUBLE PARENTHESIS → LEFT PARENTHESIS, LEFT PARENTHESIS
+ 0x3220: (0x0028, 0x30fc, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH ONE → LEFT PARENTHESIS, KATAKANA-HIRAGANA PROLONGED SOUND MARK, RIGHT PARENTHESIS	# →(一)→
+ 0x2475: (0x0028, 0x0032, 0x0029,), #  ) PARENTHESIZED DIGIT TWO → LEFT PARENTHESIS, DIGIT TWO, RIGHT PARENTHESIS
+ 0x2487: (0x0028, 0x0032, 0x004f, 0x0029,), #  ) PARENTHESIZED NUMBER TWENTY → LEFT PARENTHESIS, DIGIT TWO, LATIN CAPITAL LETTER O, RIGHT PARENTHESIS	# →(20)→
+ 0x2476: (0x0028, 0x0033, 0x0029,), #  ) PARENTHESIZED DIGIT THREE → LEFT PARENTHESIS, DIGIT THREE, RIGHT PARENTHESIS
+ 0x2477: (0x0028, 0x0034, 0x0029,), #  ) PARENTHESIZED DIGIT FOUR → LEFT PARENTHESIS, DIGIT FOUR, RIGHT PARENTHESIS
+ 0x2478: (0x0028, 0x0035, 0x0029,), #  ) PARENTHESIZED DIGIT FIVE → LEFT PARENTHESIS, DIGIT FIVE, RIGHT PARENTHESIS
+ 0x2479: (0x0028, 0x0036, 0x0029,), #  ) PARENTHESIZED DIGIT SIX → LEFT PARENTHESIS, DIGIT SIX, RIGHT PARENTHESIS
+ 0x247a: (0x0028, 0x0037, 0x0029,), #  ) PARENTHESIZED DIGIT SEVEN → LEFT PARENTHESIS, DIGIT SEVEN, RIGHT PARENTHESIS
+ 0x247b: (0x0028, 0x0038, 0x0029,), #  ) PARENTHESIZED DIGIT EIGHT → LEFT PARENTHESIS, DIGIT EIGHT, RIGHT PARENTHESIS
+ 0x247c: (0x0028, 0x0039, 0x0029,), #  ) PARENTHESIZED DIGIT NINE → LEFT PARENTHESIS, DIGIT NINE, RIGHT PARENTHESIS
+ 0x249c: (0x0028, 0x0061, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER A → LEFT PARENTHESIS, LATIN SMALL LETTER A, RIGHT PARENTHESIS
+ 0x1f110: (0x0028, 0x0041, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER A → LEFT PARENTHESIS, LATIN CAPITAL LETTER A, RIGHT PARENTHESIS
+ 0x249d: (0x0028, 0x0062, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER B → LEFT PARENTHESIS, LATIN SMALL LETTER B, RIGHT PARENTHESIS
+ 0x1f111: (0x0028, 0x0042, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER B → LEFT PARENTHESIS, LATIN CAPITAL LETTER B, RIGHT PARENTHESIS
+ 0x249e: (0x0028, 0x0063, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER C → LEFT PARENTHESIS, LATIN SMALL LETTER C, RIGHT PARENTHESIS
+ 0x1f112: (0x0028, 0x0043, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER C → LEFT PARENTHESIS, LATIN CAPITAL LETTER C, RIGHT PARENTHESIS
+ 0x249f: (0x0028, 0x0064, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER D → LEFT PARENTHESIS, LATIN SMALL LETTER D, RIGHT PARENTHESIS
+ 0x1f113: (0x0028, 0x0044, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER D → LEFT PARENTHESIS, LATIN CAPITAL LETTER D, RIGHT PARENTHESIS
+ 0x24a0: (0x0028, 0x0065, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER E → LEFT PARENTHESIS, LATIN SMALL LETTER E, RIGHT PARENTHESIS
+ 0x1f114: (0x0028, 0x0045, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER E → LEFT PARENTHESIS, LATIN CAPITAL LETTER E, RIGHT PARENTHESIS
+ 0x24a1: (0x0028, 0x0066, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER F → LEFT PARENTHESIS, LATIN SMALL LETTER F, RIGHT PARENTHESIS
+ 0x1f115: (0x0028, 0x0046, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER F → LEFT PARENTHESIS, LATIN CAPITAL LETTER F, RIGHT PARENTHESIS
+ 0x24a2: (0x0028, 0x0067, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER G → LEFT PARENTHESIS, LATIN SMALL LETTER G, RIGHT PARENTHESIS
+ 0x1f116: (0x0028, 0x0047, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER G → LEFT PARENTHESIS, LATIN CAPITAL LETTER G, RIGHT PARENTHESIS
+ 0x24a3: (0x0028, 0x0068, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER H → LEFT PARENTHESIS, LATIN SMALL LETTER H, RIGHT PARENTHESIS
+ 0x1f117: (0x0028, 0x0048, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER H → LEFT PARENTHESIS, LATIN CAPITAL LETTER H, RIGHT PARENTHESIS
+ 0x24a4: (0x0028, 0x0069, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER I → LEFT PARENTHESIS, LATIN SMALL LETTER I, RIGHT PARENTHESIS
+ 0x24a5: (0x0028, 0x006a, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER J → LEFT PARENTHESIS, LATIN SMALL LETTER J, RIGHT PARENTHESIS
+ 0x1f119: (0x0028, 0x004a, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER J → LEFT PARENTHESIS, LATIN CAPITAL LETTER J, RIGHT PARENTHESIS
+ 0x24a6: (0x0028, 0x006b, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER K → LEFT PARENTHESIS, LATIN SMALL LETTER K, RIGHT PARENTHESIS
+ 0x1f11a: (0x0028, 0x004b, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER K → LEFT PARENTHESIS, LATIN CAPITAL LETTER K, RIGHT PARENTHESIS
+ 0x2474: (0x0028, 0x006c, 0x0029,), #  ) PARENTHESIZED DIGIT ONE → LEFT PARENTHESIS, LATIN SMALL LETTER L, RIGHT PARENTHESIS	# →(1)→
+ 0x1f118: (0x0028, 0x006c, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER I → LEFT PARENTHESIS, LATIN SMALL LETTER L, RIGHT PARENTHESIS	# →(I)→
+ 0x24a7: (0x0028, 0x006c, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER L → LEFT PARENTHESIS, LATIN SMALL LETTER L, RIGHT PARENTHESIS
+ 0x1f11b: (0x0028, 0x004c, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER L → LEFT PARENTHESIS, LATIN CAPITAL LETTER L, RIGHT PARENTHESIS
+ 0x247f: (0x0028, 0x006c, 0x0032, 0x0029,), #  ) PARENTHESIZED NUMBER TWELVE → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT TWO, RIGHT PARENTHESIS	# →(12)→
+ 0x2480: (0x0028, 0x006c, 0x0033, 0x0029,), #  ) PARENTHESIZED NUMBER THIRTEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT THREE, RIGHT PARENTHESIS	# →(13)→
+ 0x2481: (0x0028, 0x006c, 0x0034, 0x0029,), #  ) PARENTHESIZED NUMBER FOURTEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT FOUR, RIGHT PARENTHESIS	# →(14)→
+ 0x2482: (0x0028, 0x006c, 0x0035, 0x0029,), #  ) PARENTHESIZED NUMBER FIFTEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT FIVE, RIGHT PARENTHESIS	# →(15)→
+ 0x2483: (0x0028, 0x006c, 0x0036, 0x0029,), #  ) PARENTHESIZED NUMBER SIXTEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT SIX, RIGHT PARENTHESIS	# →(16)→
+ 0x2484: (0x0028, 0x006c, 0x0037, 0x0029,), #  ) PARENTHESIZED NUMBER SEVENTEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT SEVEN, RIGHT PARENTHESIS	# →(17)→
+ 0x2485: (0x0028, 0x006c, 0x0038, 0x0029,), #  ) PARENTHESIZED NUMBER EIGHTEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT EIGHT, RIGHT PARENTHESIS	# →(18)→
+ 0x2486: (0x0028, 0x006c, 0x0039, 0x0029,), #  ) PARENTHESIZED NUMBER NINETEEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, DIGIT NINE, RIGHT PARENTHESIS	# →(19)→
+ 0x247e: (0x0028, 0x006c, 0x006c, 0x0029,), #  ) PARENTHESIZED NUMBER ELEVEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, LATIN SMALL LETTER L, RIGHT PARENTHESIS	# →(11)→
+ 0x247d: (0x0028, 0x006c, 0x004f, 0x0029,), #  ) PARENTHESIZED NUMBER TEN → LEFT PARENTHESIS, LATIN SMALL LETTER L, LATIN CAPITAL LETTER O, RIGHT PARENTHESIS	# →(10)→
+ 0x1f11c: (0x0028, 0x004d, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER M → LEFT PARENTHESIS, LATIN CAPITAL LETTER M, RIGHT PARENTHESIS
+ 0x24a9: (0x0028, 0x006e, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER N → LEFT PARENTHESIS, LATIN SMALL LETTER N, RIGHT PARENTHESIS
+ 0x1f11d: (0x0028, 0x004e, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER N → LEFT PARENTHESIS, LATIN CAPITAL LETTER N, RIGHT PARENTHESIS
+ 0x24aa: (0x0028, 0x006f, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER O → LEFT PARENTHESIS, LATIN SMALL LETTER O, RIGHT PARENTHESIS
+ 0x1f11e: (0x0028, 0x004f, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER O → LEFT PARENTHESIS, LATIN CAPITAL LETTER O, RIGHT PARENTHESIS
+ 0x24ab: (0x0028, 0x0070, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER P → LEFT PARENTHESIS, LATIN SMALL LETTER P, RIGHT PARENTHESIS
+ 0x1f11f: (0x0028, 0x0050, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER P → LEFT PARENTHESIS, LATIN CAPITAL LETTER P, RIGHT PARENTHESIS
+ 0x24ac: (0x0028, 0x0071, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER Q → LEFT PARENTHESIS, LATIN SMALL LETTER Q, RIGHT PARENTHESIS
+ 0x1f120: (0x0028, 0x0051, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER Q → LEFT PARENTHESIS, LATIN CAPITAL LETTER Q, RIGHT PARENTHESIS
+ 0x24ad: (0x0028, 0x0072, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER R → LEFT PARENTHESIS, LATIN SMALL LETTER R, RIGHT PARENTHESIS
+ 0x1f121: (0x0028, 0x0052, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER R → LEFT PARENTHESIS, LATIN CAPITAL LETTER R, RIGHT PARENTHESIS
+ 0x24a8: (0x0028, 0x0072, 0x006e, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER M → LEFT PARENTHESIS, LATIN SMALL LETTER R, LATIN SMALL LETTER N, RIGHT PARENTHESIS	# →(m)→
+ 0x24ae: (0x0028, 0x0073, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER S → LEFT PARENTHESIS, LATIN SMALL LETTER S, RIGHT PARENTHESIS
+ 0x1f122: (0x0028, 0x0053, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER S → LEFT PARENTHESIS, LATIN CAPITAL LETTER S, RIGHT PARENTHESIS
+ 0x1f12a: (0x0028, 0x0053, 0x0029,), #  ) TORTOISE SHELL BRACKETED LATIN CAPITAL LETTER S → LEFT PARENTHESIS, LATIN CAPITAL LETTER S, RIGHT PARENTHESIS	# →〔S〕→
+ 0x24af: (0x0028, 0x0074, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER T → LEFT PARENTHESIS, LATIN SMALL LETTER T, RIGHT PARENTHESIS
+ 0x1f123: (0x0028, 0x0054, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER T → LEFT PARENTHESIS, LATIN CAPITAL LETTER T, RIGHT PARENTHESIS
+ 0x24b0: (0x0028, 0x0075, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER U → LEFT PARENTHESIS, LATIN SMALL LETTER U, RIGHT PARENTHESIS
+ 0x1f124: (0x0028, 0x0055, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER U → LEFT PARENTHESIS, LATIN CAPITAL LETTER U, RIGHT PARENTHESIS
+ 0x24b1: (0x0028, 0x0076, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER V → LEFT PARENTHESIS, LATIN SMALL LETTER V, RIGHT PARENTHESIS
+ 0x1f125: (0x0028, 0x0056, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER V → LEFT PARENTHESIS, LATIN CAPITAL LETTER V, RIGHT PARENTHESIS
+ 0x24b2: (0x0028, 0x0077, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER W → LEFT PARENTHESIS, LATIN SMALL LETTER W, RIGHT PARENTHESIS
+ 0x1f126: (0x0028, 0x0057, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER W → LEFT PARENTHESIS, LATIN CAPITAL LETTER W, RIGHT PARENTHESIS
+ 0x24b3: (0x0028, 0x0078, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER X → LEFT PARENTHESIS, LATIN SMALL LETTER X, RIGHT PARENTHESIS
+ 0x1f127: (0x0028, 0x0058, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER X → LEFT PARENTHESIS, LATIN CAPITAL LETTER X, RIGHT PARENTHESIS
+ 0x24b4: (0x0028, 0x0079, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER Y → LEFT PARENTHESIS, LATIN SMALL LETTER Y, RIGHT PARENTHESIS
+ 0x1f128: (0x0028, 0x0059, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER Y → LEFT PARENTHESIS, LATIN CAPITAL LETTER Y, RIGHT PARENTHESIS
+ 0x24b5: (0x0028, 0x007a, 0x0029,), #  ) PARENTHESIZED LATIN SMALL LETTER Z → LEFT PARENTHESIS, LATIN SMALL LETTER Z, RIGHT PARENTHESIS
+ 0x1f129: (0x0028, 0x005a, 0x0029,), #  ) PARENTHESIZED LATIN CAPITAL LETTER Z → LEFT PARENTHESIS, LATIN CAPITAL LETTER Z, RIGHT PARENTHESIS
+ 0x3200: (0x0028, 0x1100, 0x0029,), #  ) PARENTHESIZED HANGUL KIYEOK → LEFT PARENTHESIS, HANGUL CHOSEONG KIYEOK, RIGHT PARENTHESIS
+ 0x320e: (0x0028, 0xac00, 0x0029,), #  ) PARENTHESIZED HANGUL KIYEOK A → LEFT PARENTHESIS, HANGUL SYLLABLE GA, RIGHT PARENTHESIS
+ 0x3201: (0x0028, 0x1102, 0x0029,), #  ) PARENTHESIZED HANGUL NIEUN → LEFT PARENTHESIS, HANGUL CHOSEONG NIEUN, RIGHT PARENTHESIS
+ 0x320f: (0x0028, 0xb098, 0x0029,), #  ) PARENTHESIZED HANGUL NIEUN A → LEFT PARENTHESIS, HANGUL SYLLABLE NA, RIGHT PARENTHESIS
+ 0x3202: (0x0028, 0x1103, 0x0029,), #  ) PARENTHESIZED HANGUL TIKEUT → LEFT PARENTHESIS, HANGUL CHOSEONG TIKEUT, RIGHT PARENTHESIS
+ 0x3210: (0x0028, 0xb2e4, 0x0029,), #  ) PARENTHESIZED HANGUL TIKEUT A → LEFT PARENTHESIS, HANGUL SYLLABLE DA, RIGHT PARENTHESIS
+ 0x3203: (0x0028, 0x1105, 0x0029,), #  ) PARENTHESIZED HANGUL RIEUL → LEFT PARENTHESIS, HANGUL CHOSEONG RIEUL, RIGHT PARENTHESIS
+ 0x3211: (0x0028, 0xb77c, 0x0029,), #  ) PARENTHESIZED HANGUL RIEUL A → LEFT PARENTHESIS, HANGUL SYLLABLE RA, RIGHT PARENTHESIS
+ 0x3204: (0x0028, 0x1106, 0x0029,), #  ) PARENTHESIZED HANGUL MIEUM → LEFT PARENTHESIS, HANGUL CHOSEONG MIEUM, RIGHT PARENTHESIS
+ 0x3212: (0x0028, 0xb9c8, 0x0029,), #  ) PARENTHESIZED HANGUL MIEUM A → LEFT PARENTHESIS, HANGUL SYLLABLE MA, RIGHT PARENTHESIS
+ 0x3205: (0x0028, 0x1107, 0x0029,), #  ) PARENTHESIZED HANGUL PIEUP → LEFT PARENTHESIS, HANGUL CHOSEONG PIEUP, RIGHT PARENTHESIS
+ 0x3213: (0x0028, 0xbc14, 0x0029,), #  ) PARENTHESIZED HANGUL PIEUP A → LEFT PARENTHESIS, HANGUL SYLLABLE BA, RIGHT PARENTHESIS
+ 0x3206: (0x0028, 0x1109, 0x0029,), #  ) PARENTHESIZED HANGUL SIOS → LEFT PARENTHESIS, HANGUL CHOSEONG SIOS, RIGHT PARENTHESIS
+ 0x3214: (0x0028, 0xc0ac, 0x0029,), #  ) PARENTHESIZED HANGUL SIOS A → LEFT PARENTHESIS, HANGUL SYLLABLE SA, RIGHT PARENTHESIS
+ 0x3207: (0x0028, 0x110b, 0x0029,), #  ) PARENTHESIZED HANGUL IEUNG → LEFT PARENTHESIS, HANGUL CHOSEONG IEUNG, RIGHT PARENTHESIS
+ 0x3215: (0x0028, 0xc544, 0x0029,), #  ) PARENTHESIZED HANGUL IEUNG A → LEFT PARENTHESIS, HANGUL SYLLABLE A, RIGHT PARENTHESIS
+ 0x321d: (0x0028, 0xc624, 0xc804, 0x0029,), #  ) PARENTHESIZED KOREAN CHARACTER OJEON → LEFT PARENTHESIS, HANGUL SYLLABLE O, HANGUL SYLLABLE JEON, RIGHT PARENTHESIS
+ 0x321e: (0x0028, 0xc624, 0xd6c4, 0x0029,), #  ) PARENTHESIZED KOREAN CHARACTER O HU → LEFT PARENTHESIS, HANGUL SYLLABLE O, HANGUL SYLLABLE HU, RIGHT PARENTHESIS
+ 0x3208: (0x0028, 0x110c, 0x0029,), #  ) PARENTHESIZED HANGUL CIEUC → LEFT PARENTHESIS, HANGUL CHOSEONG CIEUC, RIGHT PARENTHESIS
+ 0x3216: (0x0028, 0xc790, 0x0029,), #  ) PARENTHESIZED HANGUL CIEUC A → LEFT PARENTHESIS, HANGUL SYLLABLE JA, RIGHT PARENTHESIS
+ 0x321c: (0x0028, 0xc8fc, 0x0029,), #  ) PARENTHESIZED HANGUL CIEUC U → LEFT PARENTHESIS, HANGUL SYLLABLE JU, RIGHT PARENTHESIS
+ 0x3209: (0x0028, 0x110e, 0x0029,), #  ) PARENTHESIZED HANGUL CHIEUCH → LEFT PARENTHESIS, HANGUL CHOSEONG CHIEUCH, RIGHT PARENTHESIS
+ 0x3217: (0x0028, 0xcc28, 0x0029,), #  ) PARENTHESIZED HANGUL CHIEUCH A → LEFT PARENTHESIS, HANGUL SYLLABLE CA, RIGHT PARENTHESIS
+ 0x320a: (0x0028, 0x110f, 0x0029,), #  ) PARENTHESIZED HANGUL KHIEUKH → LEFT PARENTHESIS, HANGUL CHOSEONG KHIEUKH, RIGHT PARENTHESIS
+ 0x3218: (0x0028, 0xce74, 0x0029,), #  ) PARENTHESIZED HANGUL KHIEUKH A → LEFT PARENTHESIS, HANGUL SYLLABLE KA, RIGHT PARENTHESIS
+ 0x320b: (0x0028, 0x1110, 0x0029,), #  ) PARENTHESIZED HANGUL THIEUTH → LEFT PARENTHESIS, HANGUL CHOSEONG THIEUTH, RIGHT PARENTHESIS
+ 0x3219: (0x0028, 0xd0c0, 0x0029,), #  ) PARENTHESIZED HANGUL THIEUTH A → LEFT PARENTHESIS, HANGUL SYLLABLE TA, RIGHT PARENTHESIS
+ 0x320c: (0x0028, 0x1111, 0x0029,), #  ) PARENTHESIZED HANGUL PHIEUPH → LEFT PARENTHESIS, HANGUL CHOSEONG PHIEUPH, RIGHT PARENTHESIS
+ 0x321a: (0x0028, 0xd30c, 0x0029,), #  ) PARENTHESIZED HANGUL PHIEUPH A → LEFT PARENTHESIS, HANGUL SYLLABLE PA, RIGHT PARENTHESIS
+ 0x320d: (0x0028, 0x1112, 0x0029,), #  ) PARENTHESIZED HANGUL HIEUH → LEFT PARENTHESIS, HANGUL CHOSEONG HIEUH, RIGHT PARENTHESIS
+ 0x321b: (0x0028, 0xd558, 0x0029,), #  ) PARENTHESIZED HANGUL HIEUH A → LEFT PARENTHESIS, HANGUL SYLLABLE HA, RIGHT PARENTHESIS
+ 0x3226: (0x0028, 0x4e03, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SEVEN → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E03, RIGHT PARENTHESIS
+ 0x3222: (0x0028, 0x4e09, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH THREE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E09, RIGHT PARENTHESIS
+ 0x1f241: (0x0028, 0x4e09, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-4E09 → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E09, RIGHT PARENTHESIS	# →〔三〕→
+ 0x3228: (0x0028, 0x4e5d, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH NINE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E5D, RIGHT PARENTHESIS
+ 0x3221: (0x0028, 0x4e8c, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH TWO → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E8C, RIGHT PARENTHESIS
+ 0x1f242: (0x0028, 0x4e8c, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-4E8C → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E8C, RIGHT PARENTHESIS	# →〔二〕→
+ 0x3224: (0x0028, 0x4e94, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH FIVE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4E94, RIGHT PARENTHESIS
+ 0x3239: (0x0028, 0x4ee3, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH REPRESENT → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4EE3, RIGHT PARENTHESIS
+ 0x323d: (0x0028, 0x4f01, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH ENTERPRISE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4F01, RIGHT PARENTHESIS
+ 0x3241: (0x0028, 0x4f11, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH REST → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-4F11, RIGHT PARENTHESIS
+ 0x3227: (0x0028, 0x516b, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH EIGHT → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-516B, RIGHT PARENTHESIS
+ 0x3225: (0x0028, 0x516d, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SIX → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-516D, RIGHT PARENTHESIS
+ 0x3238: (0x0028, 0x52b4, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH LABOR → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-52B4, RIGHT PARENTHESIS
+ 0x1f247: (0x0028, 0x52dd, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-52DD → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-52DD, RIGHT PARENTHESIS	# →〔勝〕→
+ 0x3229: (0x0028, 0x5341, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH TEN → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-5341, RIGHT PARENTHESIS
+ 0x323f: (0x0028, 0x5354, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH ALLIANCE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-5354, RIGHT PARENTHESIS
+ 0x3234: (0x0028, 0x540d, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH NAME → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-540D, RIGHT PARENTHESIS
+ 0x323a: (0x0028, 0x547c, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH CALL → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-547C, RIGHT PARENTHESIS
+ 0x3223: (0x0028, 0x56db, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH FOUR → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-56DB, RIGHT PARENTHESIS
+ 0x322f: (0x0028, 0x571f, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH EARTH → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-571F, RIGHT PARENTHESIS
+ 0x323b: (0x0028, 0x5b66, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH STUDY → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-5B66, RIGHT PARENTHESIS
+ 0x1f243: (0x0028, 0x5b89, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-5B89 → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-5B89, RIGHT PARENTHESIS	# →〔安〕→
+ 0x1f245: (0x0028, 0x6253, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-6253 → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-6253, RIGHT PARENTHESIS	# →〔打〕→
+ 0x1f248: (0x0028, 0x6557, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-6557 → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-6557, RIGHT PARENTHESIS	# →〔敗〕→
+ 0x3230: (0x0028, 0x65e5, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SUN → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-65E5, RIGHT PARENTHESIS
+ 0x322a: (0x0028, 0x6708, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH MOON → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-6708, RIGHT PARENTHESIS
+ 0x3232: (0x0028, 0x6709, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH HAVE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-6709, RIGHT PARENTHESIS
+ 0x322d: (0x0028, 0x6728, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH WOOD → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-6728, RIGHT PARENTHESIS
+ 0x1f240: (0x0028, 0x672c, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-672C → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-672C, RIGHT PARENTHESIS	# →〔本〕→
+ 0x3231: (0x0028, 0x682a, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH STOCK → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-682A, RIGHT PARENTHESIS
+ 0x322c: (0x0028, 0x6c34, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH WATER → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-6C34, RIGHT PARENTHESIS
+ 0x322b: (0x0028, 0x706b, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH FIRE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-706B, RIGHT PARENTHESIS
+ 0x1f244: (0x0028, 0x70b9, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-70B9 → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-70B9, RIGHT PARENTHESIS	# →〔点〕→
+ 0x3235: (0x0028, 0x7279, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SPECIAL → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-7279, RIGHT PARENTHESIS
+ 0x1f246: (0x0028, 0x76d7, 0x0029,), #  ) TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-76D7 → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-76D7, RIGHT PARENTHESIS	# →〔盗〕→
+ 0x323c: (0x0028, 0x76e3, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SUPERVISE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-76E3, RIGHT PARENTHESIS
+ 0x3233: (0x0028, 0x793e, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SOCIETY → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-793E, RIGHT PARENTHESIS
+ 0x3237: (0x0028, 0x795d, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH CONGRATULATION → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-795D, RIGHT PARENTHESIS
+ 0x3240: (0x0028, 0x796d, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH FESTIVAL → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-796D, RIGHT PARENTHESIS
+ 0x3242: (0x0028, 0x81ea, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH SELF → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-81EA, RIGHT PARENTHESIS
+ 0x3243: (0x0028, 0x81f3, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH REACH → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-81F3, RIGHT PARENTHESIS
+ 0x3236: (0x0028, 0x8ca1, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH FINANCIAL → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-8CA1, RIGHT PARENTHESIS
+ 0x323e: (0x0028, 0x8cc7, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH RESOURCE → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-8CC7, RIGHT PARENTHESIS
+ 0x322e: (0x0028, 0x91d1, 0x0029,), #  ) PARENTHESIZED IDEOGRAPH METAL → LEFT PARENTHESIS, CJK UNIFIED IDEOGRAPH-91D1, RIGHT PARENTHESIS
+ 0xff3d: (0x0029,), #  ) FULLWIDTH RIGHT SQUARE BRACKET → RIGHT PARENTHESIS	# →〕→
+ 0x2769: (0x0029,), #  ) MEDIUM RIGHT PARENTHESIS ORNAMENT → RIGHT PARENTHESIS
+ 0x2773: (0x0029,), #  ) LIGHT RIGHT TORTOISE SHELL BRACKET ORNAMENT → RIGHT PARENTHESIS	# →〕→
+ 0x3015: (0x0029,), #  ) RIGHT TORTOISE SHELL BRACKET → RIGHT PARENTHESIS
+ 0xfd3f: (0x0029,), #  ) ORNATE RIGHT PARENTHESIS → RIGHT PARENTHESIS
+ 0x2e29: (0x0029, 0x0029,), #  ) ) RIGHT DOUBLE PARENTHESIS → RIGHT PARENTHESIS, RIGHT PARENTHESIS
+ 0x2774: (0x007b,), #  MEDIUM LEFT CURLY BRACKET ORNAMENT → LEFT CURLY BRACKET
+ 0x1d114: (0x007b,), #  MUSICAL SYMBOL BRACE → LEFT CURLY BRACKET
+ 0x2775: (0x007d,), #  MEDIUM RIGHT CURLY BRACKET ORNAMENT → RIGHT CURLY BRACKET
+ 0x301a: (0x27e6,), #  LEFT WHITE SQUARE BRACKET → MATHEMATICAL LEFT WHITE SQUARE BRACKET
+ 0x301b: (0x27e7,), #  RIGHT WHITE SQUARE BRACKET → MATHEMATICAL RIGHT WHITE SQUARE BRACKET
+ 0x27e8: (0x276c,), #  MATHEMATICAL LEFT ANGLE BRACKET → MEDIUM LEFT-POINTING ANGLE BRACKET ORNAMENT	# →〈→
+ 0x2329: (0x276c,), #  LEFT-POINTING ANGLE BRACKET → MEDIUM LEFT-POINTING ANGLE BRACKET ORNAMENT	# →〈→
+ 0x3008: (0x276c,), #  LEFT ANGLE BRACKET → MEDIUM LEFT-POINTING ANGLE BRACKET ORNAMENT
+ 0x31db: (0x276c,), #  CJK STROKE PD → MEDIUM LEFT-POINTING ANGLE BRACKET ORNAMENT	# →⟨→→〈→
+ 0x304f: (0x276c,), #  HIRAGANA LETTER KU → MEDIUM LEFT-POINTING ANGLE BRACKET ORNAMENT	# →㇛→→⟨→→〈→
+ 0x21fe8: (0x276c,), #  CJK UNIFIED IDEOGRAPH-21FE8 → MEDIUM LEFT-POINTING ANGLE BRACKET ORNAMENT	# →㇛→→⟨→→〈→
+ 0x27e9: (0x276d,), #  MATHEMATICAL RIGHT ANGLE BRACKET → MEDIUM RIGHT-POINTING ANGLE BRACKET ORNAMENT	# →〉→
+ 0x232a: (0x276d,), #  RIGHT-POINTING ANGLE BRACKET → MEDIUM RIGHT-POINTING ANGLE BRACKET ORNAMENT	# →〉→
+ 0x3009: (0x276d,), #  RIGHT ANGLE BRACKET → MEDIUM RIGHT-POINTING ANGLE BRACKET ORNAMENT
+ 0xff3e: (0xfe3f,), #  FULLWIDTH CIRCUMFLEX ACCENT → PRESENTATION FORM FOR VERTICAL LEFT ANGLE BRACKET
+ 0x2e3f: (0x00b6,), #  CAPITULUM → PILCROW SIGN
+ 0x204e: (0x002a,), #  LOW ASTERISK → ASTERISK
+ 0x066d: (0x002a,), #  ARABIC FIVE POINTED STAR → ASTERISK
+ 0x2217: (0x002a,), #  ASTERISK OPERATOR → ASTERISK
+ 0x1031f: (0x002a,), #  OLD ITALIC LETTER ESS → ASTERISK
+ 0x1735: (0x002f,), #  PHILIPPINE SINGLE PUNCTUATION → SOLIDUS
+ 0x2041: (0x002f,), #  CARET INSERTION POINT → SOLIDUS
+ 0x2215: (0x002f,), #  DIVISION SLASH → SOLIDUS
+ 0x2044: (0x002f,), #  FRACTION SLASH → SOLIDUS
+ 0x2571: (0x002f,), #  BOX DRAWINGS LIGHT DIAGONAL UPPER RIGHT TO LOWER LEFT → SOLIDUS
+ 0x27cb: (0x002f,), #  MATHEMATICAL RISING DIAGONAL → SOLIDUS
+ 0x29f8: (0x002f,), #  BIG SOLIDUS → SOLIDUS
+ 0x1d23a: (0x002f,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-47 → SOLIDUS
+ 0x31d3: (0x002f,), #  CJK STROKE SP → SOLIDUS	# →⼃→
+ 0x3033: (0x002f,), #  VERTICAL KANA REPEAT MARK UPPER HALF → SOLIDUS
+ 0x2cc6: (0x002f,), #  COPTIC CAPITAL LETTER OLD COPTIC ESH → SOLIDUS
+ 0x30ce: (0x002f,), #  KATAKANA LETTER NO → SOLIDUS	# →⼃→
+ 0x4e3f: (0x002f,), #  CJK UNIFIED IDEOGRAPH-4E3F → SOLIDUS	# →⼃→
+ 0x2f03: (0x002f,), #  KANGXI RADICAL SLASH → SOLIDUS
+ 0x29f6: (0x002f, 0x0304,), #  SOLIDUS WITH OVERBAR → SOLIDUS, COMBINING MACRON
+ 0x2afd: (0x002f, 0x002f,), #  DOUBLE SOLIDUS OPERATOR → SOLIDUS, SOLIDUS
+ 0x2afb: (0x002f, 0x002f, 0x002f,), #  TRIPLE SOLIDUS BINARY RELATION → SOLIDUS, SOLIDUS, SOLIDUS
+ 0xff3c: (0x005c,), #  FULLWIDTH REVERSE SOLIDUS → REVERSE SOLIDUS	# →∖→
+ 0xfe68: (0x005c,), #  SMALL REVERSE SOLIDUS → REVERSE SOLIDUS	# →∖→
+ 0x2216: (0x005c,), #  SET MINUS → REVERSE SOLIDUS
+ 0x27cd: (0x005c,), #  MATHEMATICAL FALLING DIAGONAL → REVERSE SOLIDUS
+ 0x29f5: (0x005c,), #  REVERSE SOLIDUS OPERATOR → REVERSE SOLIDUS
+ 0x29f9: (0x005c,), #  BIG REVERSE SOLIDUS → REVERSE SOLIDUS
+ 0x1d20f: (0x005c,), #  GREEK VOCAL NOTATION SYMBOL-16 → REVERSE SOLIDUS
+ 0x1d23b: (0x005c,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-48 → REVERSE SOLIDUS	# →𝈏→
+ 0x31d4: (0x005c,), #  CJK STROKE D → REVERSE SOLIDUS	# →⼂→
+ 0x4e36: (0x005c,), #  CJK UNIFIED IDEOGRAPH-4E36 → REVERSE SOLIDUS	# →⼂→
+ 0x2f02: (0x005c,), #  KANGXI RADICAL DOT → REVERSE SOLIDUS
+ 0x2cf9: (0x005c, 0x005c,), #  COPTIC OLD NUBIAN FULL STOP → REVERSE SOLIDUS, REVERSE SOLIDUS
+ 0x244a: (0x005c, 0x005c,), #  OCR DOUBLE BACKSLASH → REVERSE SOLIDUS, REVERSE SOLIDUS
+ 0x27c8: (0x005c, 0x1455,), #  REVERSE SOLIDUS PRECEDING SUBSET → REVERSE SOLIDUS, CANADIAN SYLLABICS TA	# →\⊂→
+ 0xa778: (0x0026,), #  LATIN SMALL LETTER UM → AMPERSAND
+ 0x0af0: (0x0970,), #  GUJARATI ABBREVIATION SIGN → DEVANAGARI ABBREVIATION SIGN
+ 0x110bb: (0x0970,), #  KAITHI ABBREVIATION SIGN → DEVANAGARI ABBREVIATION SIGN
+ 0x111c7: (0x0970,), #  SHARADA ABBREVIATION SIGN → DEVANAGARI ABBREVIATION SIGN
+ 0x26ac: (0x0970,), #  MEDIUM SMALL WHITE CIRCLE → DEVANAGARI ABBREVIATION SIGN
+ 0x111db: (0xa8fc,), #  SHARADA SIGN SIDDHAM → DEVANAGARI SIGN SIDDHAM
+ 0x17d9: (0x0e4f,), #  KHMER SIGN PHNAEK MUAN → THAI CHARACTER FONGMAN
+ 0x17d5: (0x0e5a,), #  KHMER SIGN BARIYOOSAN → THAI CHARACTER ANGKHANKHU
+ 0x17da: (0x0e5b,), #  KHMER SIGN KOOMUUT → THAI CHARACTER KHOMUT
+ 0x0f0c: (0x0f0b,), #  TIBETAN MARK DELIMITER TSHEG BSTAR → TIBETAN MARK INTERSYLLABIC TSHEG
+ 0x0f0e: (0x0f0d, 0x0f0d,), #  TIBETAN MARK NYIS SHAD → TIBETAN MARK SHAD, TIBETAN MARK SHAD
+ 0x02c4: (0x005e,), #  MODIFIER LETTER UP ARROWHEAD → CIRCUMFLEX ACCENT
+ 0x02c6: (0x005e,), #  MODIFIER LETTER CIRCUMFLEX ACCENT → CIRCUMFLEX ACCENT
+ 0xa67e: (0x02c7,), #  CYRILLIC KAVYKA → CARON	# →˘→
+ 0x02d8: (0x02c7,), #  BREVE → CARON
+ 0x203e: (0x02c9,), #  OVERLINE → MODIFIER LETTER MACRON
+ 0xfe49: (0x02c9,), #  DASHED OVERLINE → MODIFIER LETTER MACRON	# →‾→
+ 0xfe4a: (0x02c9,), #  CENTRELINE OVERLINE → MODIFIER LETTER MACRON	# →‾→
+ 0xfe4b: (0x02c9,), #  WAVY OVERLINE → MODIFIER LETTER MACRON	# →‾→
+ 0xfe4c: (0x02c9,), #  DOUBLE WAVY OVERLINE → MODIFIER LETTER MACRON	# →‾→
+ 0x00af: (0x02c9,), #  MACRON → MODIFIER LETTER MACRON
+ 0xffe3: (0x02c9,), #  FULLWIDTH MACRON → MODIFIER LETTER MACRON	# →‾→
+ 0x2594: (0x02c9,), #  UPPER ONE EIGHTH BLOCK → MODIFIER LETTER MACRON	# →¯→
+ 0x044a: (0x02c9, 0x0062,), #  CYRILLIC SMALL LETTER HARD SIGN → MODIFIER LETTER MACRON, LATIN SMALL LETTER B	# →¯b→
+ 0xa651: (0x02c9, 0x0062, 0x0069,), #  CYRILLIC SMALL LETTER YERU WITH BACK YER → MODIFIER LETTER MACRON, LATIN SMALL LETTER B, LATIN SMALL LETTER I	# →ъı→
+ 0x0375: (0x02cf,), #  GREEK LOWER NUMERAL SIGN → MODIFIER LETTER LOW ACUTE ACCENT
+ 0x02fb: (0x02ea,), #  MODIFIER LETTER BEGIN LOW TONE → MODIFIER LETTER YIN DEPARTING TONE MARK
+ 0xa716: (0x02ea,), #  MODIFIER LETTER EXTRA-LOW LEFT-STEM TONE BAR → MODIFIER LETTER YIN DEPARTING TONE MARK
+ 0xa714: (0x02eb,), #  MODIFIER LETTER MID LEFT-STEM TONE BAR → MODIFIER LETTER YANG DEPARTING TONE MARK
+ 0x3002: (0x02f3,), #  IDEOGRAPHIC FULL STOP → MODIFIER LETTER LOW RING
+ 0x2e30: (0x00b0,), #  RING POINT → DEGREE SIGN	# →∘→
+ 0x02da: (0x00b0,), #  RING ABOVE → DEGREE SIGN
+ 0x2218: (0x00b0,), #  RING OPERATOR → DEGREE SIGN
+ 0x25cb: (0x00b0,), #  WHITE CIRCLE → DEGREE SIGN	# →◦→→∘→
+ 0x25e6: (0x00b0,), #  WHITE BULLET → DEGREE SIGN	# →∘→
+ 0x235c: (0x00b0, 0x0332,), #  APL FUNCTIONAL SYMBOL CIRCLE UNDERBAR → DEGREE SIGN, COMBINING LOW LINE	# →○̲→
+ 0x2364: (0x00b0, 0x0308,), #  APL FUNCTIONAL SYMBOL JOT DIAERESIS → DEGREE SIGN, COMBINING DIAERESIS	# →◦̈→→∘̈→
+ 0x2103: (0x00b0, 0x0043,), #  DEGREE CELSIUS → DEGREE SIGN, LATIN CAPITAL LETTER C
+ 0x2109: (0x00b0, 0x0046,), #  DEGREE FAHRENHEIT → DEGREE SIGN, LATIN CAPITAL LETTER F
+ 0x0bf5: (0x0bf3,), #  TAMIL YEAR SIGN → TAMIL DAY SIGN
+ 0x0f1b: (0x0f1a, 0x0f1a,), #  TIBETAN SIGN RDEL DKAR GNYIS → TIBETAN SIGN RDEL DKAR GCIG, TIBETAN SIGN RDEL DKAR GCIG
+ 0x0f1f: (0x0f1a, 0x0f1d,), #  TIBETAN SIGN RDEL DKAR RDEL NAG → TIBETAN SIGN RDEL DKAR GCIG, TIBETAN SIGN RDEL NAG GCIG
+ 0x0fce: (0x0f1d, 0x0f1a,), #  TIBETAN SIGN RDEL NAG RDEL DKAR → TIBETAN SIGN RDEL NAG GCIG, TIBETAN SIGN RDEL DKAR GCIG
+ 0x0f1e: (0x0f1d, 0x0f1d,), #  TIBETAN SIGN RDEL NAG GNYIS → TIBETAN SIGN RDEL NAG GCIG, TIBETAN SIGN RDEL NAG GCIG
+ 0x24b8: (0x00a9,), #  CIRCLED LATIN CAPITAL LETTER C → COPYRIGHT SIGN
+ 0x24c7: (0x00ae,), #  CIRCLED LATIN CAPITAL LETTER R → REGISTERED SIGN
+ 0x24c5: (0x2117,), #  CIRCLED LATIN CAPITAL LETTER P → SOUND RECORDING COPYRIGHT
+ 0x1d21b: (0x2144,), #  GREEK VOCAL NOTATION SYMBOL-53 → TURNED SANS-SERIF CAPITAL Y
+ 0x2bec: (0x219e,), #  LEFTWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS → LEFTWARDS TWO HEADED ARROW
+ 0x2bed: (0x219f,), #  UPWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS → UPWARDS TWO HEADED ARROW
+ 0x2bee: (0x21a0,), #  RIGHTWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS → RIGHTWARDS TWO HEADED ARROW
+ 0x2bef: (0x21a1,), #  DOWNWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS → DOWNWARDS TWO HEADED ARROW
+ 0x21b5: (0x21b2,), #  DOWNWARDS ARROW WITH CORNER LEFTWARDS → DOWNWARDS ARROW WITH TIP LEFTWARDS
+ 0x2965: (0x21c3, 0x21c2,), #  DOWNWARDS HARPOON WITH BARB LEFT BESIDE DOWNWARDS HARPOON WITH BARB RIGHT → DOWNWARDS HARPOON WITH BARB LEFTWARDS, DOWNWARDS HARPOON WITH BARB RIGHTWARDS
+ 0x296f: (0x21c3, 0x16da,), #  DOWNWARDS HARPOON WITH BARB LEFT BESIDE UPWARDS HARPOON WITH BARB RIGHT → DOWNWARDS HARPOON WITH BARB LEFTWARDS, RUNIC LETTER LAUKAZ LAGU LOGR L	# →⇃↾→
+ 0x1d6db: (0x2202,), #  MATHEMATICAL BOLD PARTIAL DIFFERENTIAL → PARTIAL DIFFERENTIAL
+ 0x1d715: (0x2202,), #  MATHEMATICAL ITALIC PARTIAL DIFFERENTIAL → PARTIAL DIFFERENTIAL
+ 0x1d74f: (0x2202,), #  MATHEMATICAL BOLD ITALIC PARTIAL DIFFERENTIAL → PARTIAL DIFFERENTIAL
+ 0x1d789: (0x2202,), #  MATHEMATICAL SANS-SERIF BOLD PARTIAL DIFFERENTIAL → PARTIAL DIFFERENTIAL
+ 0x1d7c3: (0x2202,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC PARTIAL DIFFERENTIAL → PARTIAL DIFFERENTIAL
+ 0x1e8cc: (0x2202,), #  MENDE KIKAKUI DIGIT SIX → PARTIAL DIFFERENTIAL
+ 0x1e8cd: (0x2202, 0x0335,), #  MENDE KIKAKUI DIGIT SEVEN → PARTIAL DIFFERENTIAL, COMBINING SHORT STROKE OVERLAY	# →ð→
+ 0x00f0: (0x2202, 0x0335,), #  LATIN SMALL LETTER ETH → PARTIAL DIFFERENTIAL, COMBINING SHORT STROKE OVERLAY
+ 0x2300: (0x2205,), #  DIAMETER SIGN → EMPTY SET
+ 0x1d6c1: (0x2207,), #  MATHEMATICAL BOLD NABLA → NABLA
+ 0x1d6fb: (0x2207,), #  MATHEMATICAL ITALIC NABLA → NABLA
+ 0x1d735: (0x2207,), #  MATHEMATICAL BOLD ITALIC NABLA → NABLA
+ 0x1d76f: (0x2207,), #  MATHEMATICAL SANS-SERIF BOLD NABLA → NABLA
+ 0x1d7a9: (0x2207,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC NABLA → NABLA
+ 0x118a8: (0x2207,), #  WARANG CITI CAPITAL LETTER E → NABLA
+ 0x2362: (0x2207, 0x0308,), #  APL FUNCTIONAL SYMBOL DEL DIAERESIS → NABLA, COMBINING DIAERESIS
+ 0x236b: (0x2207, 0x0334,), #  APL FUNCTIONAL SYMBOL DEL TILDE → NABLA, COMBINING TILDE OVERLAY
+ 0x2588: (0x220e,), #  FULL BLOCK → END OF PROOF	# →■→
+ 0x25a0: (0x220e,), #  BLACK SQUARE → END OF PROOF
+ 0x2a3f: (0x2210,), #  AMALGAMATION OR COPRODUCT → N-ARY COPRODUCT
+ 0x16ed: (0x002b,), #  RUNIC CROSS PUNCTUATION → PLUS SIGN
+ 0x2795: (0x002b,), #  HEAVY PLUS SIGN → PLUS SIGN
+ 0x1029b: (0x002b,), #  LYCIAN LETTER H → PLUS SIGN
+ 0x2a23: (0x002b, 0x0302,), #  PLUS SIGN WITH CIRCUMFLEX ACCENT ABOVE → PLUS SIGN, COMBINING CIRCUMFLEX ACCENT
+ 0x2a22: (0x002b, 0x030a,), #  PLUS SIGN WITH SMALL CIRCLE ABOVE → PLUS SIGN, COMBINING RING ABOVE
+ 0x2a24: (0x002b, 0x0303,), #  PLUS SIGN WITH TILDE ABOVE → PLUS SIGN, COMBINING TILDE
+ 0x2214: (0x002b, 0x0307,), #  DOT PLUS → PLUS SIGN, COMBINING DOT ABOVE
+ 0x2a25: (0x002b, 0x0323,), #  PLUS SIGN WITH DOT BELOW → PLUS SIGN, COMBINING DOT BELOW
+ 0x2a26: (0x002b, 0x0330,), #  PLUS SIGN WITH TILDE BELOW → PLUS SIGN, COMBINING TILDE BELOW
+ 0x2a27: (0x002b, 0x2082,), #  PLUS SIGN WITH SUBSCRIPT TWO → PLUS SIGN, SUBSCRIPT TWO
+ 0x2797: (0x00f7,), #  HEAVY DIVISION SIGN → DIVISION SIGN
+ 0x2039: (0x003c,), #  SINGLE LEFT-POINTING ANGLE QUOTATION MARK → LESS-THAN SIGN
+ 0x276e: (0x003c,), #  HEAVY LEFT-POINTING ANGLE QUOTATION MARK ORNAMENT → LESS-THAN SIGN	# →‹→
+ 0x02c2: (0x003c,), #  MODIFIER LETTER LEFT ARROWHEAD → LESS-THAN SIGN
+ 0x1d236: (0x003c,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-40 → LESS-THAN SIGN
+ 0x1438: (0x003c,), #  CANADIAN SYLLABICS PA → LESS-THAN SIGN
+ 0x16b2: (0x003c,), #  RUNIC LETTER KAUNA → LESS-THAN SIGN
+ 0x22d6: (0x003c, 0x00b7,), #  LESS-THAN WITH DOT → LESS-THAN SIGN, MIDDLE DOT	# →ᑅ→→ᐸᐧ→
+ 0x2cb4: (0x003c, 0x00b7,), #  COPTIC CAPITAL LETTER OLD COPTIC AIN → LESS-THAN SIGN, MIDDLE DOT	# →ᑅ→→ᐸᐧ→
+ 0x1445: (0x003c, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWA → LESS-THAN SIGN, MIDDLE DOT	# →ᐸᐧ→
+ 0x226a: (0x003c, 0x003c,), #  MUCH LESS-THAN → LESS-THAN SIGN, LESS-THAN SIGN
+ 0x22d8: (0x003c, 0x003c, 0x003c,), #  VERY MUCH LESS-THAN → LESS-THAN SIGN, LESS-THAN SIGN, LESS-THAN SIGN
+ 0x1400: (0x003d,), #  CANADIAN SYLLABICS HYPHEN → EQUALS SIGN
+ 0x2e40: (0x003d,), #  DOUBLE HYPHEN → EQUALS SIGN
+ 0x30a0: (0x003d,), #  KATAKANA-HIRAGANA DOUBLE HYPHEN → EQUALS SIGN
+ 0xa4ff: (0x003d,), #  LISU PUNCTUATION FULL STOP → EQUALS SIGN
+ 0x225a: (0x003d, 0x0306,), #  EQUIANGULAR TO → EQUALS SIGN, COMBINING BREVE	# →=̌→
+ 0x2259: (0x003d, 0x0302,), #  ESTIMATES → EQUALS SIGN, COMBINING CIRCUMFLEX ACCENT
+ 0x2257: (0x003d, 0x030a,), #  RING EQUAL TO → EQUALS SIGN, COMBINING RING ABOVE
+ 0x2250: (0x003d, 0x0307,), #  APPROACHES THE LIMIT → EQUALS SIGN, COMBINING DOT ABOVE
+ 0x2251: (0x003d, 0x0307, 0x0323,), #  GEOMETRICALLY EQUAL TO → EQUALS SIGN, COMBINING DOT ABOVE, COMBINING DOT BELOW	# →≐̣→
+ 0x2a6e: (0x003d, 0x20f0,), #  EQUALS WITH ASTERISK → EQUALS SIGN, COMBINING ASTERISK ABOVE
+ 0x2a75: (0x003d, 0x003d,), #  TWO CONSECUTIVE EQUALS SIGNS → EQUALS SIGN, EQUALS SIGN
+ 0x2a76: (0x003d, 0x003d, 0x003d,), #  THREE CONSECUTIVE EQUALS SIGNS → EQUALS SIGN, EQUALS SIGN, EQUALS SIGN
+ 0x225e: (0x003d, 0x036b,), #  MEASURED BY → EQUALS SIGN, COMBINING LATIN SMALL LETTER M
+ 0x203a: (0x003e,), #  SINGLE RIGHT-POINTING ANGLE QUOTATION MARK → GREATER-THAN SIGN
+ 0x276f: (0x003e,), #  HEAVY RIGHT-POINTING ANGLE QUOTATION MARK ORNAMENT → GREATER-THAN SIGN	# →›→
+ 0x02c3: (0x003e,), #  MODIFIER LETTER RIGHT ARROWHEAD → GREATER-THAN SIGN
+ 0x1d237: (0x003e,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-42 → GREATER-THAN SIGN
+ 0x1433: (0x003e,), #  CANADIAN SYLLABICS PO → GREATER-THAN SIGN
+ 0x16f3f: (0x003e,), #  MIAO LETTER ARCHAIC ZZA → GREATER-THAN SIGN
+ 0x1441: (0x003e, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWO → GREATER-THAN SIGN, MIDDLE DOT	# →ᐳᐧ→
+ 0x2aa5: (0x003e, 0x003c,), #  GREATER-THAN BESIDE LESS-THAN → GREATER-THAN SIGN, LESS-THAN SIGN
+ 0x226b: (0x003e, 0x003e,), #  MUCH GREATER-THAN → GREATER-THAN SIGN, GREATER-THAN SIGN
+ 0x2a20: (0x003e, 0x003e,), #  Z NOTATION SCHEMA PIPING → GREATER-THAN SIGN, GREATER-THAN SIGN	# →≫→
+ 0x22d9: (0x003e, 0x003e, 0x003e,), #  VERY MUCH GREATER-THAN → GREATER-THAN SIGN, GREATER-THAN SIGN, GREATER-THAN SIGN
+ 0x2053: (0x007e,), #  SWUNG DASH → TILDE
+ 0x02dc: (0x007e,), #  SMALL TILDE → TILDE
+ 0x1fc0: (0x007e,), #  GREEK PERISPOMENI → TILDE	# →˜→
+ 0x223c: (0x007e,), #  TILDE OPERATOR → TILDE
+ 0x2368: (0x007e, 0x0308,), #  APL FUNCTIONAL SYMBOL TILDE DIAERESIS → TILDE, COMBINING DIAERESIS
+ 0x2e1e: (0x007e, 0x0307,), #  TILDE WITH DOT ABOVE → TILDE, COMBINING DOT ABOVE	# →⩪→→∼̇→→⁓̇→
+ 0x2a6a: (0x007e, 0x0307,), #  TILDE OPERATOR WITH DOT ABOVE → TILDE, COMBINING DOT ABOVE	# →∼̇→→⁓̇→
+ 0x2e1f: (0x007e, 0x0323,), #  TILDE WITH DOT BELOW → TILDE, COMBINING DOT BELOW
+ 0x1e8c8: (0x2220,), #  MENDE KIKAKUI DIGIT TWO → ANGLE
+ 0x22c0: (0x2227,), #  N-ARY LOGICAL AND → LOGICAL AND
+ 0x222f: (0x222e, 0x222e,), #  SURFACE INTEGRAL → CONTOUR INTEGRAL, CONTOUR INTEGRAL
+ 0x2230: (0x222e, 0x222e, 0x222e,), #  VOLUME INTEGRAL → CONTOUR INTEGRAL, CONTOUR INTEGRAL, CONTOUR INTEGRAL
+ 0x2e2b: (0x2234,), #  ONE DOT OVER TWO DOTS PUNCTUATION → THEREFORE
+ 0x2e2a: (0x2235,), #  TWO DOTS OVER ONE DOT PUNCTUATION → BECAUSE
+ 0x2e2c: (0x2237,), #  SQUARED FOUR DOT PUNCTUATION → PROPORTION
+ 0x111de: (0x2248,), #  SHARADA SECTION MARK-1 → ALMOST EQUAL TO
+ 0x264e: (0x224f,), #  LIBRA → DIFFERENCE BETWEEN
+ 0x1f75e: (0x224f,), #  ALCHEMICAL SYMBOL FOR SUBLIMATION → DIFFERENCE BETWEEN	# →♎→
+ 0x2263: (0x2261,), #  STRICTLY EQUIVALENT TO → IDENTICAL TO
+ 0x2a03: (0x228d,), #  N-ARY UNION OPERATOR WITH DOT → MULTISET MULTIPLICATION
+ 0x2a04: (0x228e,), #  N-ARY UNION OPERATOR WITH PLUS → MULTISET UNION
+ 0x1d238: (0x228f,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-43 → SQUARE IMAGE OF
+ 0x1d239: (0x2290,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-45 → SQUARE ORIGINAL OF
+ 0x2a05: (0x2293,), #  N-ARY SQUARE INTERSECTION OPERATOR → SQUARE CAP
+ 0x2a06: (0x2294,), #  N-ARY SQUARE UNION OPERATOR → SQUARE CUP
+ 0x2a02: (0x2297,), #  N-ARY CIRCLED TIMES OPERATOR → CIRCLED TIMES
+ 0x235f: (0x229b,), #  APL FUNCTIONAL SYMBOL CIRCLE STAR → CIRCLED ASTERISK OPERATOR
+ 0x1f771: (0x22a0,), #  ALCHEMICAL SYMBOL FOR MONTH → SQUARED TIMES
+ 0x1f755: (0x22a1,), #  ALCHEMICAL SYMBOL FOR URINE → SQUARED DOT OPERATOR
+ 0x25c1: (0x22b2,), #  WHITE LEFT-POINTING TRIANGLE → NORMAL SUBGROUP OF
+ 0x25b7: (0x22b3,), #  WHITE RIGHT-POINTING TRIANGLE → CONTAINS AS NORMAL SUBGROUP
+ 0x2363: (0x22c6, 0x0308,), #  APL FUNCTIONAL SYMBOL STAR DIAERESIS → STAR OPERATOR, COMBINING DIAERESIS
+ 0xfe34: (0x2307,), #  PRESENTATION FORM FOR VERTICAL WAVY LOW LINE → WAVY LINE
+ 0x25e0: (0x2312,), #  UPPER HALF CIRCLE → ARC
+ 0x2a3d: (0x2319,), #  RIGHTHAND INTERIOR PRODUCT → TURNED NOT SIGN
+ 0x2325: (0x2324,), #  OPTION KEY → UP ARROWHEAD BETWEEN TWO HORIZONTAL BARS
+ 0x29c7: (0x233b,), #  SQUARED SMALL CIRCLE → APL FUNCTIONAL SYMBOL QUAD JOT
+ 0x25ce: (0x233e,), #  BULLSEYE → APL FUNCTIONAL SYMBOL CIRCLE JOT	# →⦾→
+ 0x29be: (0x233e,), #  CIRCLED WHITE BULLET → APL FUNCTIONAL SYMBOL CIRCLE JOT
+ 0x29c5: (0x2342,), #  SQUARED FALLING DIAGONAL SLASH → APL FUNCTIONAL SYMBOL QUAD BACKSLASH
+ 0x29b0: (0x2349,), #  REVERSED EMPTY SET → APL FUNCTIONAL SYMBOL CIRCLE BACKSLASH
+ 0x23c3: (0x234b,), #  DENTISTRY SYMBOL LIGHT VERTICAL WITH TRIANGLE → APL FUNCTIONAL SYMBOL DELTA STILE
+ 0x23c2: (0x234e,), #  DENTISTRY SYMBOL LIGHT UP AND HORIZONTAL WITH CIRCLE → APL FUNCTIONAL SYMBOL DOWN TACK JOT
+ 0x23c1: (0x2355,), #  DENTISTRY SYMBOL LIGHT DOWN AND HORIZONTAL WITH CIRCLE → APL FUNCTIONAL SYMBOL UP TACK JOT
+ 0x23c6: (0x236d,), #  DENTISTRY SYMBOL LIGHT VERTICAL AND WAVE → APL FUNCTIONAL SYMBOL STILE TILDE
+ 0x2638: (0x2388,), #  WHEEL OF DHARMA → HELM SYMBOL
+ 0xfe35: (0x23dc,), #  PRESENTATION FORM FOR VERTICAL LEFT PARENTHESIS → TOP PARENTHESIS
+ 0xfe36: (0x23dd,), #  PRESENTATION FORM FOR VERTICAL RIGHT PARENTHESIS → BOTTOM PARENTHESIS
+ 0xfe37: (0x23de,), #  PRESENTATION FORM FOR VERTICAL LEFT CURLY BRACKET → TOP CURLY BRACKET
+ 0xfe38: (0x23df,), #  PRESENTATION FORM FOR VERTICAL RIGHT CURLY BRACKET → BOTTOM CURLY BRACKET
+ 0xfe39: (0x23e0,), #  PRESENTATION FORM FOR VERTICAL LEFT TORTOISE SHELL BRACKET → TOP TORTOISE SHELL BRACKET
+ 0xfe3a: (0x23e1,), #  PRESENTATION FORM FOR VERTICAL RIGHT TORTOISE SHELL BRACKET → BOTTOM TORTOISE SHELL BRACKET
+ 0x25b1: (0x23e5,), #  WHITE PARALLELOGRAM → FLATNESS
+ 0x23fc: (0x23fb,), #  POWER ON-OFF SYMBOL → POWER SYMBOL
+ 0xfe31: (0x2502,), #  PRESENTATION FORM FOR VERTICAL EM DASH → BOX DRAWINGS LIGHT VERTICAL	# →｜→
+ 0xff5c: (0x2502,), #  FULLWIDTH VERTICAL LINE → BOX DRAWINGS LIGHT VERTICAL
+ 0x2503: (0x2502,), #  BOX DRAWINGS HEAVY VERTICAL → BOX DRAWINGS LIGHT VERTICAL
+ 0x250f: (0x250c,), #  BOX DRAWINGS HEAVY DOWN AND RIGHT → BOX DRAWINGS LIGHT DOWN AND RIGHT
+ 0x2523: (0x251c,), #  BOX DRAWINGS HEAVY VERTICAL AND RIGHT → BOX DRAWINGS LIGHT VERTICAL AND RIGHT
+ 0x2590: (0x258c,), #  RIGHT HALF BLOCK → LEFT HALF BLOCK
+ 0x2597: (0x2596,), #  QUADRANT LOWER RIGHT → QUADRANT LOWER LEFT
+ 0x259d: (0x2598,), #  QUADRANT UPPER RIGHT → QUADRANT UPPER LEFT
+ 0x2610: (0x25a1,), #  BALLOT BOX → WHITE SQUARE
+ 0xffed: (0x25aa,), #  HALFWIDTH BLACK SQUARE → BLACK SMALL SQUARE
+ 0x25b8: (0x25b6,), #  BLACK RIGHT-POINTING SMALL TRIANGLE → BLACK RIGHT-POINTING TRIANGLE	# →►→
+ 0x25ba: (0x25b6,), #  BLACK RIGHT-POINTING POINTER → BLACK RIGHT-POINTING TRIANGLE
+ 0x2ce9: (0x2627,), #  COPTIC SYMBOL KHI RO → CHI RHO
+ 0x1f70a: (0x2629,), #  ALCHEMICAL SYMBOL FOR VINEGAR → CROSS OF JERUSALEM
+ 0x1f312: (0x263d,), #  WAXING CRESCENT MOON SYMBOL → FIRST QUARTER MOON
+ 0x1f319: (0x263d,), #  CRESCENT MOON → FIRST QUARTER MOON
+ 0x23fe: (0x263e,), #  POWER SLEEP SYMBOL → LAST QUARTER MOON
+ 0x1f318: (0x263e,), #  WANING CRESCENT MOON SYMBOL → LAST QUARTER MOON
+ 0x29d9: (0x299a,), #  RIGHT WIGGLY FENCE → VERTICAL ZIGZAG LINE
+ 0x1f73a: (0x29df,), #  ALCHEMICAL SYMBOL FOR ARSENIC → DOUBLE-ENDED MULTIMAP
+ 0x2a3e: (0x2a1f,), #  Z NOTATION RELATIONAL COMPOSITION → Z NOTATION SCHEMA COMPOSITION
+ 0x101a0: (0x2ce8,), #  GREEK SYMBOL TAU RHO → COPTIC SYMBOL TAU RO
+ 0x2669: (0x1d158, 0x1d165,), #  QUARTER NOTE → MUSICAL SYMBOL NOTEHEAD BLACK, MUSICAL SYMBOL COMBINING STEM
+ 0x266a: (0x1d158, 0x1d165, 0x1d16e,), #  EIGHTH NOTE → MUSICAL SYMBOL NOTEHEAD BLACK, MUSICAL SYMBOL COMBINING STEM, MUSICAL SYMBOL COMBINING FLAG-1
+ 0x02d9: (0x0971,), #  DOT ABOVE → DEVANAGARI SIGN HIGH SPACING DOT
+ 0x0d4e: (0x0971,), #  MALAYALAM LETTER DOT REPH → DEVANAGARI SIGN HIGH SPACING DOT	# →˙→
+ 0xff0d: (0x30fc,), #  FULLWIDTH HYPHEN-MINUS → KATAKANA-HIRAGANA PROLONGED SOUND MARK
+ 0x2014: (0x30fc,), #  EM DASH → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →一→
+ 0x2015: (0x30fc,), #  HORIZONTAL BAR → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →—→→一→
+ 0x2500: (0x30fc,), #  BOX DRAWINGS LIGHT HORIZONTAL → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →━→→—→→一→
+ 0x2501: (0x30fc,), #  BOX DRAWINGS HEAVY HORIZONTAL → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →—→→一→
+ 0x31d0: (0x30fc,), #  CJK STROKE H → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →一→
+ 0xa7f7: (0x30fc,), #  LATIN EPIGRAPHIC LETTER SIDEWAYS I → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →—→→一→
+ 0x1173: (0x30fc,), #  HANGUL JUNGSEONG EU → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →ㅡ→→—→→一→
+ 0x3161: (0x30fc,), #  HANGUL LETTER EU → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →—→→一→
+ 0x4e00: (0x30fc,), #  CJK UNIFIED IDEOGRAPH-4E00 → KATAKANA-HIRAGANA PROLONGED SOUND MARK
+ 0x2f00: (0x30fc,), #  KANGXI RADICAL ONE → KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →一→
+ 0x1196: (0x30fc, 0x30fc,), #  HANGUL JUNGSEONG EU-EU → KATAKANA-HIRAGANA PROLONGED SOUND MARK, KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →ᅳᅳ→
+ 0xd7b9: (0x30fc, 0x1161,), #  HANGUL JUNGSEONG EU-A → KATAKANA-HIRAGANA PROLONGED SOUND MARK, HANGUL JUNGSEONG A	# →ᅳᅡ→
+ 0xd7ba: (0x30fc, 0x1165,), #  HANGUL JUNGSEONG EU-EO → KATAKANA-HIRAGANA PROLONGED SOUND MARK, HANGUL JUNGSEONG EO	# →ᅳᅥ→
+ 0xd7bb: (0x30fc, 0x1165, 0x4e28,), #  HANGUL JUNGSEONG EU-E → KATAKANA-HIRAGANA PROLONGED SOUND MARK, HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅳᅥᅵ→
+ 0xd7bc: (0x30fc, 0x1169,), #  HANGUL JUNGSEONG EU-O → KATAKANA-HIRAGANA PROLONGED SOUND MARK, HANGUL JUNGSEONG O	# →ᅳᅩ→
+ 0x1195: (0x30fc, 0x116e,), #  HANGUL JUNGSEONG EU-U → KATAKANA-HIRAGANA PROLONGED SOUND MARK, HANGUL JUNGSEONG U	# →ᅳᅮ→
+ 0x1174: (0x30fc, 0x4e28,), #  HANGUL JUNGSEONG YI → KATAKANA-HIRAGANA PROLONGED SOUND MARK, CJK UNIFIED IDEOGRAPH-4E28	# →ᅳᅵ→
+ 0x3162: (0x30fc, 0x4e28,), #  HANGUL LETTER YI → KATAKANA-HIRAGANA PROLONGED SOUND MARK, CJK UNIFIED IDEOGRAPH-4E28	# →ᅴ→→ᅳᅵ→
+ 0x1197: (0x30fc, 0x4e28, 0x116e,), #  HANGUL JUNGSEONG YI-U → KATAKANA-HIRAGANA PROLONGED SOUND MARK, CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG U	# →ᅳᅵᅮ→
+ 0x20a4: (0x00a3,), #  LIRA SIGN → POUND SIGN
+ 0x3012: (0x20b8,), #  POSTAL MARK → TENGE SIGN
+ 0x3036: (0x20b8,), #  CIRCLED POSTAL MARK → TENGE SIGN	# →〒→
+ 0x1b5c: (0x1b50,), #  BALINESE WINDU → BALINESE DIGIT ZERO
+ 0xa9c6: (0xa9d0,), #  JAVANESE PADA WINDU → JAVANESE DIGIT ZERO
+ 0x114d1: (0x09e7,), #  TIRHUTA DIGIT ONE → BENGALI DIGIT ONE
+ 0x0ce7: (0x0c67,), #  KANNADA DIGIT ONE → TELUGU DIGIT ONE
+ 0x1065: (0x1041,), #  MYANMAR LETTER WESTERN PWO KAREN THA → MYANMAR DIGIT ONE
+ 0x2460: (0x2780,), #  CIRCLED DIGIT ONE → DINGBAT CIRCLED SANS-SERIF DIGIT ONE
+ 0x2469: (0x2789,), #  CIRCLED NUMBER TEN → DINGBAT CIRCLED SANS-SERIF NUMBER TEN
+ 0x23e8: (0x2081, 0x2080,), #  DECIMAL EXPONENT SYMBOL → SUBSCRIPT ONE, SUBSCRIPT ZERO
+ 0x1d7d0: (0x0032,), #  MATHEMATICAL BOLD DIGIT TWO → DIGIT TWO
+ 0x1d7da: (0x0032,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT TWO → DIGIT TWO
+ 0x1d7e4: (0x0032,), #  MATHEMATICAL SANS-SERIF DIGIT TWO → DIGIT TWO
+ 0x1d7ee: (0x0032,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT TWO → DIGIT TWO
+ 0x1d7f8: (0x0032,), #  MATHEMATICAL MONOSPACE DIGIT TWO → DIGIT TWO
+ 0xa75a: (0x0032,), #  LATIN CAPITAL LETTER R ROTUNDA → DIGIT TWO
+ 0x01a7: (0x0032,), #  LATIN CAPITAL LETTER TONE TWO → DIGIT TWO
+ 0x03e8: (0x0032,), #  COPTIC CAPITAL LETTER HORI → DIGIT TWO	# →Ƨ→
+ 0xa644: (0x0032,), #  CYRILLIC CAPITAL LETTER REVERSED DZE → DIGIT TWO	# →Ƨ→
+ 0x14bf: (0x0032,), #  CANADIAN SYLLABICS SAYISI M → DIGIT TWO
+ 0xa6ef: (0x0032,), #  BAMUM LETTER KOGHOM → DIGIT TWO	# →Ƨ→
+ 0xa9cf: (0x0662,), #  JAVANESE PANGRANGKEP → ARABIC-INDIC DIGIT TWO
+ 0x06f2: (0x0662,), #  EXTENDED ARABIC-INDIC DIGIT TWO → ARABIC-INDIC DIGIT TWO
+ 0x0ae8: (0x0968,), #  GUJARATI DIGIT TWO → DEVANAGARI DIGIT TWO
+ 0x114d2: (0x09e8,), #  TIRHUTA DIGIT TWO → BENGALI DIGIT TWO
+ 0x0ce8: (0x0c68,), #  KANNADA DIGIT TWO → TELUGU DIGIT TWO
+ 0x2461: (0x2781,), #  CIRCLED DIGIT TWO → DINGBAT CIRCLED SANS-SERIF DIGIT TWO
+ 0x01bb: (0x0032, 0x0335,), #  LATIN LETTER TWO WITH STROKE → DIGIT TWO, COMBINING SHORT STROKE OVERLAY
+ 0x1f103: (0x0032, 0x002c,), #  DIGIT TWO COMMA → DIGIT TWO, COMMA
+ 0x2489: (0x0032, 0x002e,), #  DIGIT TWO FULL STOP → DIGIT TWO, FULL STOP
+ 0x33f5: (0x0032, 0x0032, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-TWO → DIGIT TWO, DIGIT TWO, CJK UNIFIED IDEOGRAPH-65E5
+ 0x336e: (0x0032, 0x0032, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWENTY-TWO → DIGIT TWO, DIGIT TWO, CJK UNIFIED IDEOGRAPH-70B9
+ 0x33f6: (0x0032, 0x0033, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-THREE → DIGIT TWO, DIGIT THREE, CJK UNIFIED IDEOGRAPH-65E5
+ 0x336f: (0x0032, 0x0033, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWENTY-THREE → DIGIT TWO, DIGIT THREE, CJK UNIFIED IDEOGRAPH-70B9
+ 0x33f7: (0x0032, 0x0034, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-FOUR → DIGIT TWO, DIGIT FOUR, CJK UNIFIED IDEOGRAPH-65E5
+ 0x3370: (0x0032, 0x0034, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWENTY-FOUR → DIGIT TWO, DIGIT FOUR, CJK UNIFIED IDEOGRAPH-70B9
+ 0x33f8: (0x0032, 0x0035, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-FIVE → DIGIT TWO, DIGIT FIVE, CJK UNIFIED IDEOGRAPH-65E5
+ 0x33f9: (0x0032, 0x0036, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-SIX → DIGIT TWO, DIGIT SIX, CJK UNIFIED IDEOGRAPH-65E5
+ 0x33fa: (0x0032, 0x0037, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-SEVEN → DIGIT TWO, DIGIT SEVEN, CJK UNIFIED IDEOGRAPH-65E5
+ 0x33fb: (0x0032, 0x0038, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-EIGHT → DIGIT TWO, DIGIT EIGHT, CJK UNIFIED IDEOGRAPH-65E5
+ 0x33fc: (0x0032, 0x0039, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-NINE → DIGIT TWO, DIGIT NINE, CJK UNIFIED IDEOGRAPH-65E5
+ 0x33f4: (0x0032, 0x006c, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY-ONE → DIGIT TWO, LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-65E5	# →21日→
+ 0x336d: (0x0032, 0x006c, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWENTY-ONE → DIGIT TWO, LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-70B9	# →21点→
+ 0x249b: (0x0032, 0x004f, 0x002e,), #  NUMBER TWENTY FULL STOP → DIGIT TWO, LATIN CAPITAL LETTER O, FULL STOP	# →20.→
+ 0x33f3: (0x0032, 0x004f, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWENTY → DIGIT TWO, LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-65E5	# →20日→
+ 0x336c: (0x0032, 0x004f, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWENTY → DIGIT TWO, LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-70B9	# →20点→
+ 0x0de9: (0x0de8, 0x0dcf,), #  SINHALA LITH DIGIT THREE → SINHALA LITH DIGIT TWO, SINHALA VOWEL SIGN AELA-PILLA
+ 0x0def: (0x0de8, 0x0dd3,), #  SINHALA LITH DIGIT NINE → SINHALA LITH DIGIT TWO, SINHALA VOWEL SIGN DIGA IS-PILLA
+ 0x33e1: (0x0032, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWO → DIGIT TWO, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c1: (0x0032, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR FEBRUARY → DIGIT TWO, CJK UNIFIED IDEOGRAPH-6708
+ 0x335a: (0x0032, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWO → DIGIT TWO, CJK UNIFIED IDEOGRAPH-70B9
+ 0x1d206: (0x0033,), #  GREEK VOCAL NOTATION SYMBOL-7 → DIGIT THREE
+ 0x1d7d1: (0x0033,), #  MATHEMATICAL BOLD DIGIT THREE → DIGIT THREE
+ 0x1d7db: (0x0033,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT THREE → DIGIT THREE
+ 0x1d7e5: (0x0033,), #  MATHEMATICAL SANS-SERIF DIGIT THREE → DIGIT THREE
+ 0x1d7ef: (0x0033,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT THREE → DIGIT THREE
+ 0x1d7f9: (0x0033,), #  MATHEMATICAL MONOSPACE DIGIT THREE → DIGIT THREE
+ 0xa7ab: (0x0033,), #  LATIN CAPITAL LETTER REVERSED OPEN E → DIGIT THREE
+ 0x021c: (0x0033,), #  LATIN CAPITAL LETTER YOGH → DIGIT THREE	# →Ʒ→
+ 0x01b7: (0x0033,), #  LATIN CAPITAL LETTER EZH → DIGIT THREE
+ 0xa76a: (0x0033,), #  LATIN CAPITAL LETTER ET → DIGIT THREE
+ 0x2ccc: (0x0033,), #  COPTIC CAPITAL LETTER OLD COPTIC HORI → DIGIT THREE	# →Ȝ→→Ʒ→
+ 0x0417: (0x0033,), #  CYRILLIC CAPITAL LETTER ZE → DIGIT THREE
+ 0x04e0: (0x0033,), #  CYRILLIC CAPITAL LETTER ABKHASIAN DZE → DIGIT THREE	# →Ʒ→
+ 0x16f3b: (0x0033,), #  MIAO LETTER ZA → DIGIT THREE	# →Ʒ→
+ 0x118ca: (0x0033,), #  WARANG CITI SMALL LETTER ANG → DIGIT THREE
+ 0x06f3: (0x0663,), #  EXTENDED ARABIC-INDIC DIGIT THREE → ARABIC-INDIC DIGIT THREE
+ 0x1e8c9: (0x0663,), #  MENDE KIKAKUI DIGIT THREE → ARABIC-INDIC DIGIT THREE
+ 0x0ae9: (0x0969,), #  GUJARATI DIGIT THREE → DEVANAGARI DIGIT THREE
+ 0x2462: (0x2782,), #  CIRCLED DIGIT THREE → DINGBAT CIRCLED SANS-SERIF DIGIT THREE
+ 0x0498: (0x0033, 0x0326,), #  CYRILLIC CAPITAL LETTER ZE WITH DESCENDER → DIGIT THREE, COMBINING COMMA BELOW	# →З̧→
+ 0x1f104: (0x0033, 0x002c,), #  DIGIT THREE COMMA → DIGIT THREE, COMMA
+ 0x248a: (0x0033, 0x002e,), #  DIGIT THREE FULL STOP → DIGIT THREE, FULL STOP
+ 0x33fe: (0x0033, 0x006c, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY THIRTY-ONE → DIGIT THREE, LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-65E5	# →31日→
+ 0x33fd: (0x0033, 0x004f, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY THIRTY → DIGIT THREE, LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-65E5	# →30日→
+ 0x33e2: (0x0033, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY THREE → DIGIT THREE, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c2: (0x0033, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR MARCH → DIGIT THREE, CJK UNIFIED IDEOGRAPH-6708
+ 0x335b: (0x0033, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR THREE → DIGIT THREE, CJK UNIFIED IDEOGRAPH-70B9
+ 0x1d7d2: (0x0034,), #  MATHEMATICAL BOLD DIGIT FOUR → DIGIT FOUR
+ 0x1d7dc: (0x0034,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT FOUR → DIGIT FOUR
+ 0x1d7e6: (0x0034,), #  MATHEMATICAL SANS-SERIF DIGIT FOUR → DIGIT FOUR
+ 0x1d7f0: (0x0034,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT FOUR → DIGIT FOUR
+ 0x1d7fa: (0x0034,), #  MATHEMATICAL MONOSPACE DIGIT FOUR → DIGIT FOUR
+ 0x13ce: (0x0034,), #  CHEROKEE LETTER SE → DIGIT FOUR
+ 0x118af: (0x0034,), #  WARANG CITI CAPITAL LETTER UC → DIGIT FOUR
+ 0x06f4: (0x0664,), #  EXTENDED ARABIC-INDIC DIGIT FOUR → ARABIC-INDIC DIGIT FOUR
+ 0x0aea: (0x096a,), #  GUJARATI DIGIT FOUR → DEVANAGARI DIGIT FOUR
+ 0x2463: (0x2783,), #  CIRCLED DIGIT FOUR → DINGBAT CIRCLED SANS-SERIF DIGIT FOUR
+ 0x1f105: (0x0034, 0x002c,), #  DIGIT FOUR COMMA → DIGIT FOUR, COMMA
+ 0x248b: (0x0034, 0x002e,), #  DIGIT FOUR FULL STOP → DIGIT FOUR, FULL STOP
+ 0x1530: (0x0034, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWE → DIGIT FOUR, MIDDLE DOT	# →4ᐧ→
+ 0x33e3: (0x0034, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY FOUR → DIGIT FOUR, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c3: (0x0034, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR APRIL → DIGIT FOUR, CJK UNIFIED IDEOGRAPH-6708
+ 0x335c: (0x0034, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR FOUR → DIGIT FOUR, CJK UNIFIED IDEOGRAPH-70B9
+ 0x1d7d3: (0x0035,), #  MATHEMATICAL BOLD DIGIT FIVE → DIGIT FIVE
+ 0x1d7dd: (0x0035,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT FIVE → DIGIT FIVE
+ 0x1d7e7: (0x0035,), #  MATHEMATICAL SANS-SERIF DIGIT FIVE → DIGIT FIVE
+ 0x1d7f1: (0x0035,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT FIVE → DIGIT FIVE
+ 0x1d7fb: (0x0035,), #  MATHEMATICAL MONOSPACE DIGIT FIVE → DIGIT FIVE
+ 0x01bc: (0x0035,), #  LATIN CAPITAL LETTER TONE FIVE → DIGIT FIVE
+ 0x118bb: (0x0035,), #  WARANG CITI CAPITAL LETTER HORR → DIGIT FIVE
+ 0x2464: (0x2784,), #  CIRCLED DIGIT FIVE → DINGBAT CIRCLED SANS-SERIF DIGIT FIVE
+ 0x1f106: (0x0035, 0x002c,), #  DIGIT FIVE COMMA → DIGIT FIVE, COMMA
+ 0x248c: (0x0035, 0x002e,), #  DIGIT FIVE FULL STOP → DIGIT FIVE, FULL STOP
+ 0x33e4: (0x0035, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY FIVE → DIGIT FIVE, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c4: (0x0035, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR MAY → DIGIT FIVE, CJK UNIFIED IDEOGRAPH-6708
+ 0x335d: (0x0035, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR FIVE → DIGIT FIVE, CJK UNIFIED IDEOGRAPH-70B9
+ 0x1d7d4: (0x0036,), #  MATHEMATICAL BOLD DIGIT SIX → DIGIT SIX
+ 0x1d7de: (0x0036,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT SIX → DIGIT SIX
+ 0x1d7e8: (0x0036,), #  MATHEMATICAL SANS-SERIF DIGIT SIX → DIGIT SIX
+ 0x1d7f2: (0x0036,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT SIX → DIGIT SIX
+ 0x1d7fc: (0x0036,), #  MATHEMATICAL MONOSPACE DIGIT SIX → DIGIT SIX
+ 0x2cd2: (0x0036,), #  COPTIC CAPITAL LETTER OLD COPTIC HEI → DIGIT SIX
+ 0x0431: (0x0036,), #  CYRILLIC SMALL LETTER BE → DIGIT SIX
+ 0x13ee: (0x0036,), #  CHEROKEE LETTER WV → DIGIT SIX
+ 0x118d5: (0x0036,), #  WARANG CITI SMALL LETTER AT → DIGIT SIX
+ 0x06f6: (0x0666,), #  EXTENDED ARABIC-INDIC DIGIT SIX → ARABIC-INDIC DIGIT SIX
+ 0x114d6: (0x09ec,), #  TIRHUTA DIGIT SIX → BENGALI DIGIT SIX
+ 0x2465: (0x2785,), #  CIRCLED DIGIT SIX → DINGBAT CIRCLED SANS-SERIF DIGIT SIX
+ 0x1f107: (0x0036, 0x002c,), #  DIGIT SIX COMMA → DIGIT SIX, COMMA
+ 0x248d: (0x0036, 0x002e,), #  DIGIT SIX FULL STOP → DIGIT SIX, FULL STOP
+ 0x33e5: (0x0036, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY SIX → DIGIT SIX, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c5: (0x0036, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR JUNE → DIGIT SIX, CJK UNIFIED IDEOGRAPH-6708
+ 0x335e: (0x0036, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR SIX → DIGIT SIX, CJK UNIFIED IDEOGRAPH-70B9
+ 0x1d212: (0x0037,), #  GREEK VOCAL NOTATION SYMBOL-19 → DIGIT SEVEN
+ 0x1d7d5: (0x0037,), #  MATHEMATICAL BOLD DIGIT SEVEN → DIGIT SEVEN
+ 0x1d7df: (0x0037,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT SEVEN → DIGIT SEVEN
+ 0x1d7e9: (0x0037,), #  MATHEMATICAL SANS-SERIF DIGIT SEVEN → DIGIT SEVEN
+ 0x1d7f3: (0x0037,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT SEVEN → DIGIT SEVEN
+ 0x1d7fd: (0x0037,), #  MATHEMATICAL MONOSPACE DIGIT SEVEN → DIGIT SEVEN
+ 0x104d2: (0x0037,), #  OSAGE CAPITAL LETTER ZA → DIGIT SEVEN
+ 0x118c6: (0x0037,), #  WARANG CITI SMALL LETTER II → DIGIT SEVEN
+ 0x2466: (0x2786,), #  CIRCLED DIGIT SEVEN → DINGBAT CIRCLED SANS-SERIF DIGIT SEVEN
+ 0x1f108: (0x0037, 0x002c,), #  DIGIT SEVEN COMMA → DIGIT SEVEN, COMMA
+ 0x248e: (0x0037, 0x002e,), #  DIGIT SEVEN FULL STOP → DIGIT SEVEN, FULL STOP
+ 0x33e6: (0x0037, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY SEVEN → DIGIT SEVEN, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c6: (0x0037, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR JULY → DIGIT SEVEN, CJK UNIFIED IDEOGRAPH-6708
+ 0x335f: (0x0037, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR SEVEN → DIGIT SEVEN, CJK UNIFIED IDEOGRAPH-70B9
+ 0x0b03: (0x0038,), #  ORIYA SIGN VISARGA → DIGIT EIGHT
+ 0x09ea: (0x0038,), #  BENGALI DIGIT FOUR → DIGIT EIGHT
+ 0x0a6a: (0x0038,), #  GURMUKHI DIGIT FOUR → DIGIT EIGHT
+ 0x1e8cb: (0x0038,), #  MENDE KIKAKUI DIGIT FIVE → DIGIT EIGHT
+ 0x1d7d6: (0x0038,), #  MATHEMATICAL BOLD DIGIT EIGHT → DIGIT EIGHT
+ 0x1d7e0: (0x0038,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT EIGHT → DIGIT EIGHT
+ 0x1d7ea: (0x0038,), #  MATHEMATICAL SANS-SERIF DIGIT EIGHT → DIGIT EIGHT
+ 0x1d7f4: (0x0038,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT EIGHT → DIGIT EIGHT
+ 0x1d7fe: (0x0038,), #  MATHEMATICAL MONOSPACE DIGIT EIGHT → DIGIT EIGHT
+ 0x0223: (0x0038,), #  LATIN SMALL LETTER OU → DIGIT EIGHT
+ 0x0222: (0x0038,), #  LATIN CAPITAL LETTER OU → DIGIT EIGHT
+ 0x1031a: (0x0038,), #  OLD ITALIC LETTER EF → DIGIT EIGHT
+ 0x0aee: (0x096e,), #  GUJARATI DIGIT EIGHT → DEVANAGARI DIGIT EIGHT
+ 0x2467: (0x2787,), #  CIRCLED DIGIT EIGHT → DINGBAT CIRCLED SANS-SERIF DIGIT EIGHT
+ 0x1f109: (0x0038, 0x002c,), #  DIGIT EIGHT COMMA → DIGIT EIGHT, COMMA
+ 0x248f: (0x0038, 0x002e,), #  DIGIT EIGHT FULL STOP → DIGIT EIGHT, FULL STOP
+ 0x33e7: (0x0038, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY EIGHT → DIGIT EIGHT, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c7: (0x0038, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR AUGUST → DIGIT EIGHT, CJK UNIFIED IDEOGRAPH-6708
+ 0x3360: (0x0038, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR EIGHT → DIGIT EIGHT, CJK UNIFIED IDEOGRAPH-70B9
+ 0x0a67: (0x0039,), #  GURMUKHI DIGIT ONE → DIGIT NINE
+ 0x0b68: (0x0039,), #  ORIYA DIGIT TWO → DIGIT NINE
+ 0x09ed: (0x0039,), #  BENGALI DIGIT SEVEN → DIGIT NINE
+ 0x0d6d: (0x0039,), #  MALAYALAM DIGIT SEVEN → DIGIT NINE
+ 0x1d7d7: (0x0039,), #  MATHEMATICAL BOLD DIGIT NINE → DIGIT NINE
+ 0x1d7e1: (0x0039,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT NINE → DIGIT NINE
+ 0x1d7eb: (0x0039,), #  MATHEMATICAL SANS-SERIF DIGIT NINE → DIGIT NINE
+ 0x1d7f5: (0x0039,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT NINE → DIGIT NINE
+ 0x1d7ff: (0x0039,), #  MATHEMATICAL MONOSPACE DIGIT NINE → DIGIT NINE
+ 0xa76e: (0x0039,), #  LATIN CAPITAL LETTER CON → DIGIT NINE
+ 0x2cca: (0x0039,), #  COPTIC CAPITAL LETTER DIALECT-P HORI → DIGIT NINE
+ 0x118cc: (0x0039,), #  WARANG CITI SMALL LETTER KO → DIGIT NINE
+ 0x118ac: (0x0039,), #  WARANG CITI CAPITAL LETTER KO → DIGIT NINE
+ 0x118d6: (0x0039,), #  WARANG CITI SMALL LETTER AM → DIGIT NINE
+ 0x0967: (0x0669,), #  DEVANAGARI DIGIT ONE → ARABIC-INDIC DIGIT NINE
+ 0x118e4: (0x0669,), #  WARANG CITI DIGIT FOUR → ARABIC-INDIC DIGIT NINE
+ 0x06f9: (0x0669,), #  EXTENDED ARABIC-INDIC DIGIT NINE → ARABIC-INDIC DIGIT NINE
+ 0x0cef: (0x0c6f,), #  KANNADA DIGIT NINE → TELUGU DIGIT NINE
+ 0x2468: (0x2788,), #  CIRCLED DIGIT NINE → DINGBAT CIRCLED SANS-SERIF DIGIT NINE
+ 0x1f10a: (0x0039, 0x002c,), #  DIGIT NINE COMMA → DIGIT NINE, COMMA
+ 0x2490: (0x0039, 0x002e,), #  DIGIT NINE FULL STOP → DIGIT NINE, FULL STOP
+ 0x33e8: (0x0039, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY NINE → DIGIT NINE, CJK UNIFIED IDEOGRAPH-65E5
+ 0x32c8: (0x0039, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR SEPTEMBER → DIGIT NINE, CJK UNIFIED IDEOGRAPH-6708
+ 0x3361: (0x0039, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR NINE → DIGIT NINE, CJK UNIFIED IDEOGRAPH-70B9
+ 0x237a: (0x0061,), #  APL FUNCTIONAL SYMBOL ALPHA → LATIN SMALL LETTER A	# →α→
+ 0xff41: (0x0061,), #  FULLWIDTH LATIN SMALL LETTER A → LATIN SMALL LETTER A	# →а→
+ 0x1d41a: (0x0061,), #  MATHEMATICAL BOLD SMALL A → LATIN SMALL LETTER A
+ 0x1d44e: (0x0061,), #  MATHEMATICAL ITALIC SMALL A → LATIN SMALL LETTER A
+ 0x1d482: (0x0061,), #  MATHEMATICAL BOLD ITALIC SMALL A → LATIN SMALL LETTER A
+ 0x1d4b6: (0x0061,), #  MATHEMATICAL SCRIPT SMALL A → LATIN SMALL LETTER A
+ 0x1d4ea: (0x0061,), #  MATHEMATICAL BOLD SCRIPT SMALL A → LATIN SMALL LETTER A
+ 0x1d51e: (0x0061,), #  MATHEMATICAL FRAKTUR SMALL A → LATIN SMALL LETTER A
+ 0x1d552: (0x0061,), #  MATHEMATICAL DOUBLE-STRUCK SMALL A → LATIN SMALL LETTER A
+ 0x1d586: (0x0061,), #  MATHEMATICAL BOLD FRAKTUR SMALL A → LATIN SMALL LETTER A
+ 0x1d5ba: (0x0061,), #  MATHEMATICAL SANS-SERIF SMALL A → LATIN SMALL LETTER A
+ 0x1d5ee: (0x0061,), #  MATHEMATICAL SANS-SERIF BOLD SMALL A → LATIN SMALL LETTER A
+ 0x1d622: (0x0061,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL A → LATIN SMALL LETTER A
+ 0x1d656: (0x0061,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL A → LATIN SMALL LETTER A
+ 0x1d68a: (0x0061,), #  MATHEMATICAL MONOSPACE SMALL A → LATIN SMALL LETTER A
+ 0x0251: (0x0061,), #  LATIN SMALL LETTER ALPHA → LATIN SMALL LETTER A
+ 0x03b1: (0x0061,), #  GREEK SMALL LETTER ALPHA → LATIN SMALL LETTER A
+ 0x1d6c2: (0x0061,), #  MATHEMATICAL BOLD SMALL ALPHA → LATIN SMALL LETTER A	# →α→
+ 0x1d6fc: (0x0061,), #  MATHEMATICAL ITALIC SMALL ALPHA → LATIN SMALL LETTER A	# →α→
+ 0x1d736: (0x0061,), #  MATHEMATICAL BOLD ITALIC SMALL ALPHA → LATIN SMALL LETTER A	# →α→
+ 0x1d770: (0x0061,), #  MATHEMATICAL SANS-SERIF BOLD SMALL ALPHA → LATIN SMALL LETTER A	# →α→
+ 0x1d7aa: (0x0061,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL ALPHA → LATIN SMALL LETTER A	# →α→
+ 0x0430: (0x0061,), #  CYRILLIC SMALL LETTER A → LATIN SMALL LETTER A
+ 0x2df6: (0x0363,), #  COMBINING CYRILLIC LETTER A → COMBINING LATIN SMALL LETTER A
+ 0xff21: (0x0041,), #  FULLWIDTH LATIN CAPITAL LETTER A → LATIN CAPITAL LETTER A	# →А→
+ 0x1d400: (0x0041,), #  MATHEMATICAL BOLD CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d434: (0x0041,), #  MATHEMATICAL ITALIC CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d468: (0x0041,), #  MATHEMATICAL BOLD ITALIC CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d49c: (0x0041,), #  MATHEMATICAL SCRIPT CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d4d0: (0x0041,), #  MATHEMATICAL BOLD SCRIPT CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d504: (0x0041,), #  MATHEMATICAL FRAKTUR CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d538: (0x0041,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d56c: (0x0041,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d5a0: (0x0041,), #  MATHEMATICAL SANS-SERIF CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d5d4: (0x0041,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d608: (0x0041,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d63c: (0x0041,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL A → LATIN CAPITAL LETTER A
+ 0x1d670: (0x0041,), #  MATHEMATICAL MONOSPACE CAPITAL A → LATIN CAPITAL LETTER A
+ 0x0391: (0x0041,), #  GREEK CAPITAL LETTER ALPHA → LATIN CAPITAL LETTER A
+ 0x1d6a8: (0x0041,), #  MATHEMATICAL BOLD CAPITAL ALPHA → LATIN CAPITAL LETTER A	# →𝐀→
+ 0x1d6e2: (0x0041,), #  MATHEMATICAL ITALIC CAPITAL ALPHA → LATIN CAPITAL LETTER A	# →Α→
+ 0x1d71c: (0x0041,), #  MATHEMATICAL BOLD ITALIC CAPITAL ALPHA → LATIN CAPITAL LETTER A	# →Α→
+ 0x1d756: (0x0041,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL ALPHA → LATIN CAPITAL LETTER A	# →Α→
+ 0x1d790: (0x0041,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL ALPHA → LATIN CAPITAL LETTER A	# →Α→
+ 0x0410: (0x0041,), #  CYRILLIC CAPITAL LETTER A → LATIN CAPITAL LETTER A
+ 0x13aa: (0x0041,), #  CHEROKEE LETTER GO → LATIN CAPITAL LETTER A
+ 0x15c5: (0x0041,), #  CANADIAN SYLLABICS CARRIER GHO → LATIN CAPITAL LETTER A
+ 0xa4ee: (0x0041,), #  LISU LETTER A → LATIN CAPITAL LETTER A
+ 0x16f40: (0x0041,), #  MIAO LETTER ZZYA → LATIN CAPITAL LETTER A
+ 0x102a0: (0x0041,), #  CARIAN LETTER A → LATIN CAPITAL LETTER A
+ 0x2376: (0x0061, 0x0332,), #  APL FUNCTIONAL SYMBOL ALPHA UNDERBAR → LATIN SMALL LETTER A, COMBINING LOW LINE	# →α̲→→ɑ̲→
+ 0x01ce: (0x0103,), #  LATIN SMALL LETTER A WITH CARON → LATIN SMALL LETTER A WITH BREVE
+ 0x01cd: (0x0102,), #  LATIN CAPITAL LETTER A WITH CARON → LATIN CAPITAL LETTER A WITH BREVE
+ 0x0227: (0x00e5,), #  LATIN SMALL LETTER A WITH DOT ABOVE → LATIN SMALL LETTER A WITH RING ABOVE
+ 0x0226: (0x00c5,), #  LATIN CAPITAL LETTER A WITH DOT ABOVE → LATIN CAPITAL LETTER A WITH RING ABOVE
+ 0x1e9a: (0x1ea3,), #  LATIN SMALL LETTER A WITH RIGHT HALF RING → LATIN SMALL LETTER A WITH HOOK ABOVE
+ 0x2100: (0x0061, 0x002f, 0x0063,), #  ACCOUNT OF → LATIN SMALL LETTER A, SOLIDUS, LATIN SMALL LETTER C
+ 0x2101: (0x0061, 0x002f, 0x0073,), #  ADDRESSED TO THE SUBJECT → LATIN SMALL LETTER A, SOLIDUS, LATIN SMALL LETTER S
+ 0xa733: (0x0061, 0x0061,), #  LATIN SMALL LETTER AA → LATIN SMALL LETTER A, LATIN SMALL LETTER A
+ 0xa732: (0x0041, 0x0041,), #  LATIN CAPITAL LETTER AA → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER A
+ 0x00e6: (0x0061, 0x0065,), #  LATIN SMALL LETTER AE → LATIN SMALL LETTER A, LATIN SMALL LETTER E
+ 0x04d5: (0x0061, 0x0065,), #  CYRILLIC SMALL LIGATURE A IE → LATIN SMALL LETTER A, LATIN SMALL LETTER E	# →ае→
+ 0x00c6: (0x0041, 0x0045,), #  LATIN CAPITAL LETTER AE → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER E
+ 0x04d4: (0x0041, 0x0045,), #  CYRILLIC CAPITAL LIGATURE A IE → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER E	# →Æ→
+ 0xa735: (0x0061, 0x006f,), #  LATIN SMALL LETTER AO → LATIN SMALL LETTER A, LATIN SMALL LETTER O
+ 0xa734: (0x0041, 0x004f,), #  LATIN CAPITAL LETTER AO → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER O
+ 0x1f707: (0x0041, 0x0052,), #  ALCHEMICAL SYMBOL FOR AQUA REGIA-2 → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER R
+ 0xa737: (0x0061, 0x0075,), #  LATIN SMALL LETTER AU → LATIN SMALL LETTER A, LATIN SMALL LETTER U
+ 0xa736: (0x0041, 0x0055,), #  LATIN CAPITAL LETTER AU → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER U
+ 0xa739: (0x0061, 0x0076,), #  LATIN SMALL LETTER AV → LATIN SMALL LETTER A, LATIN SMALL LETTER V
+ 0xa73b: (0x0061, 0x0076,), #  LATIN SMALL LETTER AV WITH HORIZONTAL BAR → LATIN SMALL LETTER A, LATIN SMALL LETTER V
+ 0xa738: (0x0041, 0x0056,), #  LATIN CAPITAL LETTER AV → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER V
+ 0xa73a: (0x0041, 0x0056,), #  LATIN CAPITAL LETTER AV WITH HORIZONTAL BAR → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER V
+ 0xa73d: (0x0061, 0x0079,), #  LATIN SMALL LETTER AY → LATIN SMALL LETTER A, LATIN SMALL LETTER Y
+ 0xa73c: (0x0041, 0x0059,), #  LATIN CAPITAL LETTER AY → LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER Y
+ 0xab7a: (0x1d00,), #  CHEROKEE SMALL LETTER GO → LATIN LETTER SMALL CAPITAL A
+ 0x2200: (0x2c6f,), #  FOR ALL → LATIN CAPITAL LETTER TURNED A
+ 0x1d217: (0x2c6f,), #  GREEK VOCAL NOTATION SYMBOL-24 → LATIN CAPITAL LETTER TURNED A
+ 0x15c4: (0x2c6f,), #  CANADIAN SYLLABICS CARRIER GHU → LATIN CAPITAL LETTER TURNED A	# →∀→
+ 0xa4ef: (0x2c6f,), #  LISU LETTER AE → LATIN CAPITAL LETTER TURNED A
+ 0x1041f: (0x2c70,), #  DESERET CAPITAL LETTER ESH → LATIN CAPITAL LETTER TURNED ALPHA
+ 0x1d41b: (0x0062,), #  MATHEMATICAL BOLD SMALL B → LATIN SMALL LETTER B
+ 0x1d44f: (0x0062,), #  MATHEMATICAL ITALIC SMALL B → LATIN SMALL LETTER B
+ 0x1d483: (0x0062,), #  MATHEMATICAL BOLD ITALIC SMALL B → LATIN SMALL LETTER B
+ 0x1d4b7: (0x0062,), #  MATHEMATICAL SCRIPT SMALL B → LATIN SMALL LETTER B
+ 0x1d4eb: (0x0062,), #  MATHEMATICAL BOLD SCRIPT SMALL B → LATIN SMALL LETTER B
+ 0x1d51f: (0x0062,), #  MATHEMATICAL FRAKTUR SMALL B → LATIN SMALL LETTER B
+ 0x1d553: (0x0062,), #  MATHEMATICAL DOUBLE-STRUCK SMALL B → LATIN SMALL LETTER B
+ 0x1d587: (0x0062,), #  MATHEMATICAL BOLD FRAKTUR SMALL B → LATIN SMALL LETTER B
+ 0x1d5bb: (0x0062,), #  MATHEMATICAL SANS-SERIF SMALL B → LATIN SMALL LETTER B
+ 0x1d5ef: (0x0062,), #  MATHEMATICAL SANS-SERIF BOLD SMALL B → LATIN SMALL LETTER B
+ 0x1d623: (0x0062,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL B → LATIN SMALL LETTER B
+ 0x1d657: (0x0062,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL B → LATIN SMALL LETTER B
+ 0x1d68b: (0x0062,), #  MATHEMATICAL MONOSPACE SMALL B → LATIN SMALL LETTER B
+ 0x0184: (0x0062,), #  LATIN CAPITAL LETTER TONE SIX → LATIN SMALL LETTER B
+ 0x042c: (0x0062,), #  CYRILLIC CAPITAL LETTER SOFT SIGN → LATIN SMALL LETTER B	# →Ƅ→
+ 0x13cf: (0x0062,), #  CHEROKEE LETTER SI → LATIN SMALL LETTER B
+ 0x1472: (0x0062,), #  CANADIAN SYLLABICS KA → LATIN SMALL LETTER B
+ 0x15af: (0x0062,), #  CANADIAN SYLLABICS AIVILIK B → LATIN SMALL LETTER B
+ 0xff22: (0x0042,), #  FULLWIDTH LATIN CAPITAL LETTER B → LATIN CAPITAL LETTER B	# →Β→
+ 0x212c: (0x0042,), #  SCRIPT CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d401: (0x0042,), #  MATHEMATICAL BOLD CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d435: (0x0042,), #  MATHEMATICAL ITALIC CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d469: (0x0042,), #  MATHEMATICAL BOLD ITALIC CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d4d1: (0x0042,), #  MATHEMATICAL BOLD SCRIPT CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d505: (0x0042,), #  MATHEMATICAL FRAKTUR CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d539: (0x0042,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d56d: (0x0042,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d5a1: (0x0042,), #  MATHEMATICAL SANS-SERIF CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d5d5: (0x0042,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d609: (0x0042,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d63d: (0x0042,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL B → LATIN CAPITAL LETTER B
+ 0x1d671: (0x0042,), #  MATHEMATICAL MONOSPACE CAPITAL B → LATIN CAPITAL LETTER B
+ 0xa7b4: (0x0042,), #  LATIN CAPITAL LETTER BETA → LATIN CAPITAL LETTER B
+ 0x0392: (0x0042,), #  GREEK CAPITAL LETTER BETA → LATIN CAPITAL LETTER B
+ 0x1d6a9: (0x0042,), #  MATHEMATICAL BOLD CAPITAL BETA → LATIN CAPITAL LETTER B	# →Β→
+ 0x1d6e3: (0x0042,), #  MATHEMATICAL ITALIC CAPITAL BETA → LATIN CAPITAL LETTER B	# →Β→
+ 0x1d71d: (0x0042,), #  MATHEMATICAL BOLD ITALIC CAPITAL BETA → LATIN CAPITAL LETTER B	# →Β→
+ 0x1d757: (0x0042,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL BETA → LATIN CAPITAL LETTER B	# →Β→
+ 0x1d791: (0x0042,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL BETA → LATIN CAPITAL LETTER B	# →Β→
+ 0x0412: (0x0042,), #  CYRILLIC CAPITAL LETTER VE → LATIN CAPITAL LETTER B
+ 0x13f4: (0x0042,), #  CHEROKEE LETTER YV → LATIN CAPITAL LETTER B
+ 0x15f7: (0x0042,), #  CANADIAN SYLLABICS CARRIER KHE → LATIN CAPITAL LETTER B
+ 0xa4d0: (0x0042,), #  LISU LETTER BA → LATIN CAPITAL LETTER B
+ 0x10282: (0x0042,), #  LYCIAN LETTER B → LATIN CAPITAL LETTER B
+ 0x102a1: (0x0042,), #  CARIAN LETTER P2 → LATIN CAPITAL LETTER B
+ 0x10301: (0x0042,), #  OLD ITALIC LETTER BE → LATIN CAPITAL LETTER B
+ 0x0253: (0x0062, 0x0314,), #  LATIN SMALL LETTER B WITH HOOK → LATIN SMALL LETTER B, COMBINING REVERSED COMMA ABOVE
+ 0x1473: (0x0062, 0x0307,), #  CANADIAN SYLLABICS KAA → LATIN SMALL LETTER B, COMBINING DOT ABOVE
+ 0x0183: (0x0062, 0x0304,), #  LATIN SMALL LETTER B WITH TOPBAR → LATIN SMALL LETTER B, COMBINING MACRON
+ 0x0182: (0x0062, 0x0304,), #  LATIN CAPITAL LETTER B WITH TOPBAR → LATIN SMALL LETTER B, COMBINING MACRON
+ 0x0411: (0x0062, 0x0304,), #  CYRILLIC CAPITAL LETTER BE → LATIN SMALL LETTER B, COMBINING MACRON	# →Ƃ→
+ 0x0180: (0x0062, 0x0335,), #  LATIN SMALL LETTER B WITH STROKE → LATIN SMALL LETTER B, COMBINING SHORT STROKE OVERLAY
+ 0x048d: (0x0062, 0x0335,), #  CYRILLIC SMALL LETTER SEMISOFT SIGN → LATIN SMALL LETTER B, COMBINING SHORT STROKE OVERLAY	# →ѣ→→Ь̵→
+ 0x048c: (0x0062, 0x0335,), #  CYRILLIC CAPITAL LETTER SEMISOFT SIGN → LATIN SMALL LETTER B, COMBINING SHORT STROKE OVERLAY	# →Ѣ→→Ь̵→
+ 0x0463: (0x0062, 0x0335,), #  CYRILLIC SMALL LETTER YAT → LATIN SMALL LETTER B, COMBINING SHORT STROKE OVERLAY	# →Ь̵→
+ 0x0462: (0x0062, 0x0335,), #  CYRILLIC CAPITAL LETTER YAT → LATIN SMALL LETTER B, COMBINING SHORT STROKE OVERLAY	# →Ь̵→
+ 0x147f: (0x0062, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWA → LATIN SMALL LETTER B, MIDDLE DOT	# →ᑲᐧ→
+ 0x1481: (0x0062, 0x0307, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWAA → LATIN SMALL LETTER B, COMBINING DOT ABOVE, MIDDLE DOT	# →ᑳᐧ→
+ 0x1488: (0x0062, 0x0027,), #  CANADIAN SYLLABICS SOUTH-SLAVEY KAH → LATIN SMALL LETTER B, APOSTROPHE	# →ᑲᑊ→
+ 0x042b: (0x0062, 0x006c,), #  CYRILLIC CAPITAL LETTER YERU → LATIN SMALL LETTER B, LATIN SMALL LETTER L	# →ЬІ→→Ь1→
+ 0x0432: (0x0299,), #  CYRILLIC SMALL LETTER VE → LATIN LETTER SMALL CAPITAL B
+ 0x13fc: (0x0299,), #  CHEROKEE SMALL LETTER YV → LATIN LETTER SMALL CAPITAL B
+ 0xff43: (0x0063,), #  FULLWIDTH LATIN SMALL LETTER C → LATIN SMALL LETTER C	# →с→
+ 0x217d: (0x0063,), #  SMALL ROMAN NUMERAL ONE HUNDRED → LATIN SMALL LETTER C
+ 0x1d41c: (0x0063,), #  MATHEMATICAL BOLD SMALL C → LATIN SMALL LETTER C
+ 0x1d450: (0x0063,), #  MATHEMATICAL ITALIC SMALL C → LATIN SMALL LETTER C
+ 0x1d484: (0x0063,), #  MATHEMATICAL BOLD ITALIC SMALL C → LATIN SMALL LETTER C
+ 0x1d4b8: (0x0063,), #  MATHEMATICAL SCRIPT SMALL C → LATIN SMALL LETTER C
+ 0x1d4ec: (0x0063,), #  MATHEMATICAL BOLD SCRIPT SMALL C → LATIN SMALL LETTER C
+ 0x1d520: (0x0063,), #  MATHEMATICAL FRAKTUR SMALL C → LATIN SMALL LETTER C
+ 0x1d554: (0x0063,), #  MATHEMATICAL DOUBLE-STRUCK SMALL C → LATIN SMALL LETTER C
+ 0x1d588: (0x0063,), #  MATHEMATICAL BOLD FRAKTUR SMALL C → LATIN SMALL LETTER C
+ 0x1d5bc: (0x0063,), #  MATHEMATICAL SANS-SERIF SMALL C → LATIN SMALL LETTER C
+ 0x1d5f0: (0x0063,), #  MATHEMATICAL SANS-SERIF BOLD SMALL C → LATIN SMALL LETTER C
+ 0x1d624: (0x0063,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL C → LATIN SMALL LETTER C
+ 0x1d658: (0x0063,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL C → LATIN SMALL LETTER C
+ 0x1d68c: (0x0063,), #  MATHEMATICAL MONOSPACE SMALL C → LATIN SMALL LETTER C
+ 0x1d04: (0x0063,), #  LATIN LETTER SMALL CAPITAL C → LATIN SMALL LETTER C
+ 0x03f2: (0x0063,), #  GREEK LUNATE SIGMA SYMBOL → LATIN SMALL LETTER C
+ 0x2ca5: (0x0063,), #  COPTIC SMALL LETTER SIMA → LATIN SMALL LETTER C	# →ϲ→
+ 0x0441: (0x0063,), #  CYRILLIC SMALL LETTER ES → LATIN SMALL LETTER C
+ 0xabaf: (0x0063,), #  CHEROKEE SMALL LETTER TLI → LATIN SMALL LETTER C	# →ᴄ→
+ 0x1043d: (0x0063,), #  DESERET SMALL LETTER CHEE → LATIN SMALL LETTER C
+ 0x2ded: (0x0368,), #  COMBINING CYRILLIC LETTER ES → COMBINING LATIN SMALL LETTER C
+ 0x1f74c: (0x0043,), #  ALCHEMICAL SYMBOL FOR CALX → LATIN CAPITAL LETTER C
+ 0x118f2: (0x0043,), #  WARANG CITI NUMBER NINETY → LATIN CAPITAL LETTER C
+ 0x118e9: (0x0043,), #  WARANG CITI DIGIT NINE → LATIN CAPITAL LETTER C
+ 0xff23: (0x0043,), #  FULLWIDTH LATIN CAPITAL LETTER C → LATIN CAPITAL LETTER C	# →С→
+ 0x216d: (0x0043,), #  ROMAN NUMERAL ONE HUNDRED → LATIN CAPITAL LETTER C
+ 0x2102: (0x0043,), #  DOUBLE-STRUCK CAPITAL C → LATIN CAPITAL LETTER C
+ 0x212d: (0x0043,), #  BLACK-LETTER CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d402: (0x0043,), #  MATHEMATICAL BOLD CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d436: (0x0043,), #  MATHEMATICAL ITALIC CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d46a: (0x0043,), #  MATHEMATICAL BOLD ITALIC CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d49e: (0x0043,), #  MATHEMATICAL SCRIPT CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d4d2: (0x0043,), #  MATHEMATICAL BOLD SCRIPT CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d56e: (0x0043,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d5a2: (0x0043,), #  MATHEMATICAL SANS-SERIF CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d5d6: (0x0043,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d60a: (0x0043,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d63e: (0x0043,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL C → LATIN CAPITAL LETTER C
+ 0x1d672: (0x0043,), #  MATHEMATICAL MONOSPACE CAPITAL C → LATIN CAPITAL LETTER C
+ 0x03f9: (0x0043,), #  GREEK CAPITAL LUNATE SIGMA SYMBOL → LATIN CAPITAL LETTER C
+ 0x2ca4: (0x0043,), #  COPTIC CAPITAL LETTER SIMA → LATIN CAPITAL LETTER C	# →Ϲ→
+ 0x0421: (0x0043,), #  CYRILLIC CAPITAL LETTER ES → LATIN CAPITAL LETTER C
+ 0x13df: (0x0043,), #  CHEROKEE LETTER TLI → LATIN CAPITAL LETTER C
+ 0xa4da: (0x0043,), #  LISU LETTER CA → LATIN CAPITAL LETTER C
+ 0x102a2: (0x0043,), #  CARIAN LETTER D → LATIN CAPITAL LETTER C
+ 0x10302: (0x0043,), #  OLD ITALIC LETTER KE → LATIN CAPITAL LETTER C
+ 0x10415: (0x0043,), #  DESERET CAPITAL LETTER CHEE → LATIN CAPITAL LETTER C
+ 0x1051c: (0x0043,), #  ELBASAN LETTER SHE → LATIN CAPITAL LETTER C
+ 0x00a2: (0x0063, 0x0338,), #  CENT SIGN → LATIN SMALL LETTER C, COMBINING LONG SOLIDUS OVERLAY
+ 0x023c: (0x0063, 0x0338,), #  LATIN SMALL LETTER C WITH STROKE → LATIN SMALL LETTER C, COMBINING LONG SOLIDUS OVERLAY	# →¢→
+ 0x20a1: (0x0043, 0x20eb,), #  COLON SIGN → LATIN CAPITAL LETTER C, COMBINING LONG DOUBLE SOLIDUS OVERLAY
+ 0x00e7: (0x0063, 0x0326,), #  LATIN SMALL LETTER C WITH CEDILLA → LATIN SMALL LETTER C, COMBINING COMMA BELOW	# →ҫ→→с̡→
+ 0x04ab: (0x0063, 0x0326,), #  CYRILLIC SMALL LETTER ES WITH DESCENDER → LATIN SMALL LETTER C, COMBINING COMMA BELOW	# →с̡→
+ 0x00c7: (0x0043, 0x0326,), #  LATIN CAPITAL LETTER C WITH CEDILLA → LATIN CAPITAL LETTER C, COMBINING COMMA BELOW	# →Ҫ→→С̡→
+ 0x04aa: (0x0043, 0x0326,), #  CYRILLIC CAPITAL LETTER ES WITH DESCENDER → LATIN CAPITAL LETTER C, COMBINING COMMA BELOW	# →С̡→
+ 0x0187: (0x0043, 0x0027,), #  LATIN CAPITAL LETTER C WITH HOOK → LATIN CAPITAL LETTER C, APOSTROPHE	# →Cʽ→
+ 0x2105: (0x0063, 0x002f, 0x006f,), #  CARE OF → LATIN SMALL LETTER C, SOLIDUS, LATIN SMALL LETTER O
+ 0x2106: (0x0063, 0x002f, 0x0075,), #  CADA UNA → LATIN SMALL LETTER C, SOLIDUS, LATIN SMALL LETTER U
+ 0x22f4: (0xa793,), #  SMALL ELEMENT OF WITH VERTICAL BAR AT END OF HORIZONTAL STROKE → LATIN SMALL LETTER C WITH BAR	# →ɛ→→є→
+ 0x025b: (0xa793,), #  LATIN SMALL LETTER OPEN E → LATIN SMALL LETTER C WITH BAR	# →є→
+ 0x03b5: (0xa793,), #  GREEK SMALL LETTER EPSILON → LATIN SMALL LETTER C WITH BAR	# →є→
+ 0x03f5: (0xa793,), #  GREEK LUNATE EPSILON SYMBOL → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d6c6: (0xa793,), #  MATHEMATICAL BOLD SMALL EPSILON → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d6dc: (0xa793,), #  MATHEMATICAL BOLD EPSILON SYMBOL → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d700: (0xa793,), #  MATHEMATICAL ITALIC SMALL EPSILON → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d716: (0xa793,), #  MATHEMATICAL ITALIC EPSILON SYMBOL → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d73a: (0xa793,), #  MATHEMATICAL BOLD ITALIC SMALL EPSILON → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d750: (0xa793,), #  MATHEMATICAL BOLD ITALIC EPSILON SYMBOL → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d774: (0xa793,), #  MATHEMATICAL SANS-SERIF BOLD SMALL EPSILON → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d78a: (0xa793,), #  MATHEMATICAL SANS-SERIF BOLD EPSILON SYMBOL → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d7ae: (0xa793,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL EPSILON → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x1d7c4: (0xa793,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC EPSILON SYMBOL → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x2c89: (0xa793,), #  COPTIC SMALL LETTER EIE → LATIN SMALL LETTER C WITH BAR	# →є→
+ 0x0454: (0xa793,), #  CYRILLIC SMALL LETTER UKRAINIAN IE → LATIN SMALL LETTER C WITH BAR
+ 0x0511: (0xa793,), #  CYRILLIC SMALL LETTER REVERSED ZE → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0xab9b: (0xa793,), #  CHEROKEE SMALL LETTER QUV → LATIN SMALL LETTER C WITH BAR	# →ɛ→→є→
+ 0x118ce: (0xa793,), #  WARANG CITI SMALL LETTER YUJ → LATIN SMALL LETTER C WITH BAR	# →ε→→є→
+ 0x10429: (0xa793,), #  DESERET SMALL LETTER LONG E → LATIN SMALL LETTER C WITH BAR	# →ɛ→→є→
+ 0x20ac: (0xa792,), #  EURO SIGN → LATIN CAPITAL LETTER C WITH BAR	# →Є→
+ 0x2c88: (0xa792,), #  COPTIC CAPITAL LETTER EIE → LATIN CAPITAL LETTER C WITH BAR	# →Є→
+ 0x0404: (0xa792,), #  CYRILLIC CAPITAL LETTER UKRAINIAN IE → LATIN CAPITAL LETTER C WITH BAR
+ 0x2377: (0xa793, 0x0332,), #  APL FUNCTIONAL SYMBOL EPSILON UNDERBAR → LATIN SMALL LETTER C WITH BAR, COMBINING LOW LINE	# →ε̲→
+ 0x037d: (0xa73f,), #  GREEK SMALL REVERSED DOTTED LUNATE SIGMA SYMBOL → LATIN SMALL LETTER REVERSED C WITH DOT
+ 0x03ff: (0xa73e,), #  GREEK CAPITAL REVERSED DOTTED LUNATE SIGMA SYMBOL → LATIN CAPITAL LETTER REVERSED C WITH DOT
+ 0x217e: (0x0064,), #  SMALL ROMAN NUMERAL FIVE HUNDRED → LATIN SMALL LETTER D
+ 0x2146: (0x0064,), #  DOUBLE-STRUCK ITALIC SMALL D → LATIN SMALL LETTER D
+ 0x1d41d: (0x0064,), #  MATHEMATICAL BOLD SMALL D → LATIN SMALL LETTER D
+ 0x1d451: (0x0064,), #  MATHEMATICAL ITALIC SMALL D → LATIN SMALL LETTER D
+ 0x1d485: (0x0064,), #  MATHEMATICAL BOLD ITALIC SMALL D → LATIN SMALL LETTER D
+ 0x1d4b9: (0x0064,), #  MATHEMATICAL SCRIPT SMALL D → LATIN SMALL LETTER D
+ 0x1d4ed: (0x0064,), #  MATHEMATICAL BOLD SCRIPT SMALL D → LATIN SMALL LETTER D
+ 0x1d521: (0x0064,), #  MATHEMATICAL FRAKTUR SMALL D → LATIN SMALL LETTER D
+ 0x1d555: (0x0064,), #  MATHEMATICAL DOUBLE-STRUCK SMALL D → LATIN SMALL LETTER D
+ 0x1d589: (0x0064,), #  MATHEMATICAL BOLD FRAKTUR SMALL D → LATIN SMALL LETTER D
+ 0x1d5bd: (0x0064,), #  MATHEMATICAL SANS-SERIF SMALL D → LATIN SMALL LETTER D
+ 0x1d5f1: (0x0064,), #  MATHEMATICAL SANS-SERIF BOLD SMALL D → LATIN SMALL LETTER D
+ 0x1d625: (0x0064,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL D → LATIN SMALL LETTER D
+ 0x1d659: (0x0064,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL D → LATIN SMALL LETTER D
+ 0x1d68d: (0x0064,), #  MATHEMATICAL MONOSPACE SMALL D → LATIN SMALL LETTER D
+ 0x0501: (0x0064,), #  CYRILLIC SMALL LETTER KOMI DE → LATIN SMALL LETTER D
+ 0x13e7: (0x0064,), #  CHEROKEE LETTER TSU → LATIN SMALL LETTER D
+ 0x146f: (0x0064,), #  CANADIAN SYLLABICS KO → LATIN SMALL LETTER D
+ 0xa4d2: (0x0064,), #  LISU LETTER PHA → LATIN SMALL LETTER D
+ 0x216e: (0x0044,), #  ROMAN NUMERAL FIVE HUNDRED → LATIN CAPITAL LETTER D
+ 0x2145: (0x0044,), #  DOUBLE-STRUCK ITALIC CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d403: (0x0044,), #  MATHEMATICAL BOLD CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d437: (0x0044,), #  MATHEMATICAL ITALIC CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d46b: (0x0044,), #  MATHEMATICAL BOLD ITALIC CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d49f: (0x0044,), #  MATHEMATICAL SCRIPT CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d4d3: (0x0044,), #  MATHEMATICAL BOLD SCRIPT CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d507: (0x0044,), #  MATHEMATICAL FRAKTUR CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d53b: (0x0044,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d56f: (0x0044,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d5a3: (0x0044,), #  MATHEMATICAL SANS-SERIF CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d5d7: (0x0044,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d60b: (0x0044,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d63f: (0x0044,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL D → LATIN CAPITAL LETTER D
+ 0x1d673: (0x0044,), #  MATHEMATICAL MONOSPACE CAPITAL D → LATIN CAPITAL LETTER D
+ 0x13a0: (0x0044,), #  CHEROKEE LETTER A → LATIN CAPITAL LETTER D
+ 0x15de: (0x0044,), #  CANADIAN SYLLABICS CARRIER THE → LATIN CAPITAL LETTER D
+ 0x15ea: (0x0044,), #  CANADIAN SYLLABICS CARRIER PE → LATIN CAPITAL LETTER D	# →ᗞ→
+ 0xa4d3: (0x0044,), #  LISU LETTER DA → LATIN CAPITAL LETTER D
+ 0x0257: (0x0064, 0x0314,), #  LATIN SMALL LETTER D WITH HOOK → LATIN SMALL LETTER D, COMBINING REVERSED COMMA ABOVE
+ 0x0256: (0x0064, 0x0328,), #  LATIN SMALL LETTER D WITH TAIL → LATIN SMALL LETTER D, COMBINING OGONEK	# →d̢→
+ 0x018c: (0x0064, 0x0304,), #  LATIN SMALL LETTER D WITH TOPBAR → LATIN SMALL LETTER D, COMBINING MACRON
+ 0x0111: (0x0064, 0x0335,), #  LATIN SMALL LETTER D WITH STROKE → LATIN SMALL LETTER D, COMBINING SHORT STROKE OVERLAY
+ 0x0110: (0x0044, 0x0335,), #  LATIN CAPITAL LETTER D WITH STROKE → LATIN CAPITAL LETTER D, COMBINING SHORT STROKE OVERLAY
+ 0x00d0: (0x0044, 0x0335,), #  LATIN CAPITAL LETTER ETH → LATIN CAPITAL LETTER D, COMBINING SHORT STROKE OVERLAY	# →Đ→
+ 0x0189: (0x0044, 0x0335,), #  LATIN CAPITAL LETTER AFRICAN D → LATIN CAPITAL LETTER D, COMBINING SHORT STROKE OVERLAY	# →Đ→
+ 0x20ab: (0x0064, 0x0335, 0x0331,), #  DONG SIGN → LATIN SMALL LETTER D, COMBINING SHORT STROKE OVERLAY, COMBINING MACRON BELOW	# →đ̱→
+ 0xa77a: (0xa779,), #  LATIN SMALL LETTER INSULAR D → LATIN CAPITAL LETTER INSULAR D
+ 0x147b: (0x0064, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWO → LATIN SMALL LETTER D, MIDDLE DOT	# →ᑯᐧ→
+ 0x1487: (0x0064, 0x0027,), #  CANADIAN SYLLABICS SOUTH-SLAVEY KOH → LATIN SMALL LETTER D, APOSTROPHE	# →ᑯᑊ→
+ 0x02a4: (0x0064, 0x021d,), #  LATIN SMALL LETTER DEZH DIGRAPH → LATIN SMALL LETTER D, LATIN SMALL LETTER YOGH	# →dʒ→
+ 0x01f3: (0x0064, 0x007a,), #  LATIN SMALL LETTER DZ → LATIN SMALL LETTER D, LATIN SMALL LETTER Z
+ 0x02a3: (0x0064, 0x007a,), #  LATIN SMALL LETTER DZ DIGRAPH → LATIN SMALL LETTER D, LATIN SMALL LETTER Z
+ 0x01f2: (0x0044, 0x007a,), #  LATIN CAPITAL LETTER D WITH SMALL LETTER Z → LATIN CAPITAL LETTER D, LATIN SMALL LETTER Z
+ 0x01f1: (0x0044, 0x005a,), #  LATIN CAPITAL LETTER DZ → LATIN CAPITAL LETTER D, LATIN CAPITAL LETTER Z
+ 0x01c6: (0x0064, 0x017e,), #  LATIN SMALL LETTER DZ WITH CARON → LATIN SMALL LETTER D, LATIN SMALL LETTER Z WITH CARON
+ 0x01c5: (0x0044, 0x017e,), #  LATIN CAPITAL LETTER D WITH SMALL LETTER Z WITH CARON → LATIN CAPITAL LETTER D, LATIN SMALL LETTER Z WITH CARON
+ 0x01c4: (0x0044, 0x017d,), #  LATIN CAPITAL LETTER DZ WITH CARON → LATIN CAPITAL LETTER D, LATIN CAPITAL LETTER Z WITH CARON
+ 0x02a5: (0x0064, 0x0291,), #  LATIN SMALL LETTER DZ DIGRAPH WITH CURL → LATIN SMALL LETTER D, LATIN SMALL LETTER Z WITH CURL
+ 0xab70: (0x1d05,), #  CHEROKEE SMALL LETTER A → LATIN LETTER SMALL CAPITAL D
+ 0x2e39: (0x1e9f,), #  TOP HALF SECTION SIGN → LATIN SMALL LETTER DELTA	# →δ→
+ 0x03b4: (0x1e9f,), #  GREEK SMALL LETTER DELTA → LATIN SMALL LETTER DELTA
+ 0x1d6c5: (0x1e9f,), #  MATHEMATICAL BOLD SMALL DELTA → LATIN SMALL LETTER DELTA	# →δ→
+ 0x1d6ff: (0x1e9f,), #  MATHEMATICAL ITALIC SMALL DELTA → LATIN SMALL LETTER DELTA	# →δ→
+ 0x1d739: (0x1e9f,), #  MATHEMATICAL BOLD ITALIC SMALL DELTA → LATIN SMALL LETTER DELTA	# →δ→
+ 0x1d773: (0x1e9f,), #  MATHEMATICAL SANS-SERIF BOLD SMALL DELTA → LATIN SMALL LETTER DELTA	# →δ→
+ 0x1d7ad: (0x1e9f,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL DELTA → LATIN SMALL LETTER DELTA	# →δ→
+ 0x056e: (0x1e9f,), #  ARMENIAN SMALL LETTER CA → LATIN SMALL LETTER DELTA	# →δ→
+ 0x1577: (0x1e9f,), #  CANADIAN SYLLABICS NUNAVIK HO → LATIN SMALL LETTER DELTA	# →δ→
+ 0x212e: (0x0065,), #  ESTIMATED SYMBOL → LATIN SMALL LETTER E
+ 0xff45: (0x0065,), #  FULLWIDTH LATIN SMALL LETTER E → LATIN SMALL LETTER E	# →е→
+ 0x212f: (0x0065,), #  SCRIPT SMALL E → LATIN SMALL LETTER E
+ 0x2147: (0x0065,), #  DOUBLE-STRUCK ITALIC SMALL E → LATIN SMALL LETTER E
+ 0x1d41e: (0x0065,), #  MATHEMATICAL BOLD SMALL E → LATIN SMALL LETTER E
+ 0x1d452: (0x0065,), #  MATHEMATICAL ITALIC SMALL E → LATIN SMALL LETTER E
+ 0x1d486: (0x0065,), #  MATHEMATICAL BOLD ITALIC SMALL E → LATIN SMALL LETTER E
+ 0x1d4ee: (0x0065,), #  MATHEMATICAL BOLD SCRIPT SMALL E → LATIN SMALL LETTER E
+ 0x1d522: (0x0065,), #  MATHEMATICAL FRAKTUR SMALL E → LATIN SMALL LETTER E
+ 0x1d556: (0x0065,), #  MATHEMATICAL DOUBLE-STRUCK SMALL E → LATIN SMALL LETTER E
+ 0x1d58a: (0x0065,), #  MATHEMATICAL BOLD FRAKTUR SMALL E → LATIN SMALL LETTER E
+ 0x1d5be: (0x0065,), #  MATHEMATICAL SANS-SERIF SMALL E → LATIN SMALL LETTER E
+ 0x1d5f2: (0x0065,), #  MATHEMATICAL SANS-SERIF BOLD SMALL E → LATIN SMALL LETTER E
+ 0x1d626: (0x0065,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL E → LATIN SMALL LETTER E
+ 0x1d65a: (0x0065,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL E → LATIN SMALL LETTER E
+ 0x1d68e: (0x0065,), #  MATHEMATICAL MONOSPACE SMALL E → LATIN SMALL LETTER E
+ 0xab32: (0x0065,), #  LATIN SMALL LETTER BLACKLETTER E → LATIN SMALL LETTER E
+ 0x0435: (0x0065,), #  CYRILLIC SMALL LETTER IE → LATIN SMALL LETTER E
+ 0x04bd: (0x0065,), #  CYRILLIC SMALL LETTER ABKHASIAN CHE → LATIN SMALL LETTER E
+ 0x2df7: (0x0364,), #  COMBINING CYRILLIC LETTER IE → COMBINING LATIN SMALL LETTER E
+ 0x22ff: (0x0045,), #  Z NOTATION BAG MEMBERSHIP → LATIN CAPITAL LETTER E
+ 0xff25: (0x0045,), #  FULLWIDTH LATIN CAPITAL LETTER E → LATIN CAPITAL LETTER E	# →Ε→
+ 0x2130: (0x0045,), #  SCRIPT CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d404: (0x0045,), #  MATHEMATICAL BOLD CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d438: (0x0045,), #  MATHEMATICAL ITALIC CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d46c: (0x0045,), #  MATHEMATICAL BOLD ITALIC CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d4d4: (0x0045,), #  MATHEMATICAL BOLD SCRIPT CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d508: (0x0045,), #  MATHEMATICAL FRAKTUR CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d53c: (0x0045,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d570: (0x0045,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d5a4: (0x0045,), #  MATHEMATICAL SANS-SERIF CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d5d8: (0x0045,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d60c: (0x0045,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d640: (0x0045,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL E → LATIN CAPITAL LETTER E
+ 0x1d674: (0x0045,), #  MATHEMATICAL MONOSPACE CAPITAL E → LATIN CAPITAL LETTER E
+ 0x0395: (0x0045,), #  GREEK CAPITAL LETTER EPSILON → LATIN CAPITAL LETTER E
+ 0x1d6ac: (0x0045,), #  MATHEMATICAL BOLD CAPITAL EPSILON → LATIN CAPITAL LETTER E	# →𝐄→
+ 0x1d6e6: (0x0045,), #  MATHEMATICAL ITALIC CAPITAL EPSILON → LATIN CAPITAL LETTER E	# →Ε→
+ 0x1d720: (0x0045,), #  MATHEMATICAL BOLD ITALIC CAPITAL EPSILON → LATIN CAPITAL LETTER E	# →Ε→
+ 0x1d75a: (0x0045,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL EPSILON → LATIN CAPITAL LETTER E	# →Ε→
+ 0x1d794: (0x0045,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL EPSILON → LATIN CAPITAL LETTER E	# →Ε→
+ 0x0415: (0x0045,), #  CYRILLIC CAPITAL LETTER IE → LATIN CAPITAL LETTER E
+ 0x2d39: (0x0045,), #  TIFINAGH LETTER YADD → LATIN CAPITAL LETTER E
+ 0x13ac: (0x0045,), #  CHEROKEE LETTER GV → LATIN CAPITAL LETTER E
+ 0xa4f0: (0x0045,), #  LISU LETTER E → LATIN CAPITAL LETTER E
+ 0x118a6: (0x0045,), #  WARANG CITI CAPITAL LETTER II → LATIN CAPITAL LETTER E
+ 0x118ae: (0x0045,), #  WARANG CITI CAPITAL LETTER YUJ → LATIN CAPITAL LETTER E
+ 0x10286: (0x0045,), #  LYCIAN LETTER I → LATIN CAPITAL LETTER E
+ 0x011b: (0x0115,), #  LATIN SMALL LETTER E WITH CARON → LATIN SMALL LETTER E WITH BREVE
+ 0x011a: (0x0114,), #  LATIN CAPITAL LETTER E WITH CARON → LATIN CAPITAL LETTER E WITH BREVE
+ 0x0247: (0x0065, 0x0338,), #  LATIN SMALL LETTER E WITH STROKE → LATIN SMALL LETTER E, COMBINING LONG SOLIDUS OVERLAY	# →e̷→
+ 0x0246: (0x0045, 0x0338,), #  LATIN CAPITAL LETTER E WITH STROKE → LATIN CAPITAL LETTER E, COMBINING LONG SOLIDUS OVERLAY
+ 0x04bf: (0x0065, 0x0328,), #  CYRILLIC SMALL LETTER ABKHASIAN CHE WITH DESCENDER → LATIN SMALL LETTER E, COMBINING OGONEK	# →ҽ̢→
+ 0xab7c: (0x1d07,), #  CHEROKEE SMALL LETTER GV → LATIN LETTER SMALL CAPITAL E
+ 0x0259: (0x01dd,), #  LATIN SMALL LETTER SCHWA → LATIN SMALL LETTER TURNED E
+ 0x04d9: (0x01dd,), #  CYRILLIC SMALL LETTER SCHWA → LATIN SMALL LETTER TURNED E
+ 0x2203: (0x018e,), #  THERE EXISTS → LATIN CAPITAL LETTER REVERSED E
+ 0x2d3a: (0x018e,), #  TIFINAGH LETTER YADDH → LATIN CAPITAL LETTER REVERSED E
+ 0xa4f1: (0x018e,), #  LISU LETTER EU → LATIN CAPITAL LETTER REVERSED E
+ 0x025a: (0x01dd, 0x02de,), #  LATIN SMALL LETTER SCHWA WITH HOOK → LATIN SMALL LETTER TURNED E, MODIFIER LETTER RHOTIC HOOK	# →ə˞→
+ 0x1d14: (0x01dd, 0x006f,), #  LATIN SMALL LETTER TURNED OE → LATIN SMALL LETTER TURNED E, LATIN SMALL LETTER O	# →əo→
+ 0xab41: (0x01dd, 0x006f, 0x0338,), #  LATIN SMALL LETTER TURNED OE WITH STROKE → LATIN SMALL LETTER TURNED E, LATIN SMALL LETTER O, COMBINING LONG SOLIDUS OVERLAY	# →ǝø→
+ 0xab42: (0x01dd, 0x006f, 0x0335,), #  LATIN SMALL LETTER TURNED OE WITH HORIZONTAL STROKE → LATIN SMALL LETTER TURNED E, LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY	# →ǝɵ→
+ 0x04d8: (0x018f,), #  CYRILLIC CAPITAL LETTER SCHWA → LATIN CAPITAL LETTER SCHWA
+ 0x1d221: (0x0190,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-7 → LATIN CAPITAL LETTER OPEN E
+ 0x2107: (0x0190,), #  EULER CONSTANT → LATIN CAPITAL LETTER OPEN E
+ 0x0510: (0x0190,), #  CYRILLIC CAPITAL LETTER REVERSED ZE → LATIN CAPITAL LETTER OPEN E
+ 0x13cb: (0x0190,), #  CHEROKEE LETTER QUV → LATIN CAPITAL LETTER OPEN E
+ 0x16f2d: (0x0190,), #  MIAO LETTER NYHA → LATIN CAPITAL LETTER OPEN E
+ 0x10401: (0x0190,), #  DESERET CAPITAL LETTER LONG E → LATIN CAPITAL LETTER OPEN E
+ 0x1d9f: (0x1d4b,), #  MODIFIER LETTER SMALL REVERSED OPEN E → MODIFIER LETTER SMALL OPEN E
+ 0x1d08: (0x025c,), #  LATIN SMALL LETTER TURNED OPEN E → LATIN SMALL LETTER REVERSED OPEN E
+ 0x0437: (0x025c,), #  CYRILLIC SMALL LETTER ZE → LATIN SMALL LETTER REVERSED OPEN E
+ 0x0499: (0x025c, 0x0326,), #  CYRILLIC SMALL LETTER ZE WITH DESCENDER → LATIN SMALL LETTER REVERSED OPEN E, COMBINING COMMA BELOW	# →з̡→
+ 0x10442: (0x025e,), #  DESERET SMALL LETTER VEE → LATIN SMALL LETTER CLOSED REVERSED OPEN E
+ 0xa79d: (0x029a,), #  LATIN SMALL LETTER VOLAPUK OE → LATIN SMALL LETTER CLOSED OPEN E
+ 0x1042a: (0x029a,), #  DESERET SMALL LETTER LONG A → LATIN SMALL LETTER CLOSED OPEN E
+ 0x1d41f: (0x0066,), #  MATHEMATICAL BOLD SMALL F → LATIN SMALL LETTER F
+ 0x1d453: (0x0066,), #  MATHEMATICAL ITALIC SMALL F → LATIN SMALL LETTER F
+ 0x1d487: (0x0066,), #  MATHEMATICAL BOLD ITALIC SMALL F → LATIN SMALL LETTER F
+ 0x1d4bb: (0x0066,), #  MATHEMATICAL SCRIPT SMALL F → LATIN SMALL LETTER F
+ 0x1d4ef: (0x0066,), #  MATHEMATICAL BOLD SCRIPT SMALL F → LATIN SMALL LETTER F
+ 0x1d523: (0x0066,), #  MATHEMATICAL FRAKTUR SMALL F → LATIN SMALL LETTER F
+ 0x1d557: (0x0066,), #  MATHEMATICAL DOUBLE-STRUCK SMALL F → LATIN SMALL LETTER F
+ 0x1d58b: (0x0066,), #  MATHEMATICAL BOLD FRAKTUR SMALL F → LATIN SMALL LETTER F
+ 0x1d5bf: (0x0066,), #  MATHEMATICAL SANS-SERIF SMALL F → LATIN SMALL LETTER F
+ 0x1d5f3: (0x0066,), #  MATHEMATICAL SANS-SERIF BOLD SMALL F → LATIN SMALL LETTER F
+ 0x1d627: (0x0066,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL F → LATIN SMALL LETTER F
+ 0x1d65b: (0x0066,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL F → LATIN SMALL LETTER F
+ 0x1d68f: (0x0066,), #  MATHEMATICAL MONOSPACE SMALL F → LATIN SMALL LETTER F
+ 0xab35: (0x0066,), #  LATIN SMALL LETTER LENIS F → LATIN SMALL LETTER F
+ 0xa799: (0x0066,), #  LATIN SMALL LETTER F WITH STROKE → LATIN SMALL LETTER F
+ 0x017f: (0x0066,), #  LATIN SMALL LETTER LONG S → LATIN SMALL LETTER F
+ 0x1e9d: (0x0066,), #  LATIN SMALL LETTER LONG S WITH HIGH STROKE → LATIN SMALL LETTER F
+ 0x0584: (0x0066,), #  ARMENIAN SMALL LETTER KEH → LATIN SMALL LETTER F
+ 0x1d213: (0x0046,), #  GREEK VOCAL NOTATION SYMBOL-20 → LATIN CAPITAL LETTER F	# →Ϝ→
+ 0x2131: (0x0046,), #  SCRIPT CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d405: (0x0046,), #  MATHEMATICAL BOLD CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d439: (0x0046,), #  MATHEMATICAL ITALIC CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d46d: (0x0046,), #  MATHEMATICAL BOLD ITALIC CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d4d5: (0x0046,), #  MATHEMATICAL BOLD SCRIPT CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d509: (0x0046,), #  MATHEMATICAL FRAKTUR CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d53d: (0x0046,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d571: (0x0046,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d5a5: (0x0046,), #  MATHEMATICAL SANS-SERIF CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d5d9: (0x0046,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d60d: (0x0046,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d641: (0x0046,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL F → LATIN CAPITAL LETTER F
+ 0x1d675: (0x0046,), #  MATHEMATICAL MONOSPACE CAPITAL F → LATIN CAPITAL LETTER F
+ 0xa798: (0x0046,), #  LATIN CAPITAL LETTER F WITH STROKE → LATIN CAPITAL LETTER F
+ 0x03dc: (0x0046,), #  GREEK LETTER DIGAMMA → LATIN CAPITAL LETTER F
+ 0x1d7ca: (0x0046,), #  MATHEMATICAL BOLD CAPITAL DIGAMMA → LATIN CAPITAL LETTER F	# →Ϝ→
+ 0x15b4: (0x0046,), #  CANADIAN SYLLABICS BLACKFOOT WE → LATIN CAPITAL LETTER F
+ 0xa4dd: (0x0046,), #  LISU LETTER TSA → LATIN CAPITAL LETTER F
+ 0x118c2: (0x0046,), #  WARANG CITI SMALL LETTER WI → LATIN CAPITAL LETTER F
+ 0x118a2: (0x0046,), #  WARANG CITI CAPITAL LETTER WI → LATIN CAPITAL LETTER F
+ 0x10287: (0x0046,), #  LYCIAN LETTER W → LATIN CAPITAL LETTER F
+ 0x102a5: (0x0046,), #  CARIAN LETTER R → LATIN CAPITAL LETTER F
+ 0x10525: (0x0046,), #  ELBASAN LETTER GHE → LATIN CAPITAL LETTER F
+ 0x0192: (0x0066, 0x0326,), #  LATIN SMALL LETTER F WITH HOOK → LATIN SMALL LETTER F, COMBINING COMMA BELOW	# →f̡→
+ 0x0191: (0x0046, 0x0326,), #  LATIN CAPITAL LETTER F WITH HOOK → LATIN CAPITAL LETTER F, COMBINING COMMA BELOW	# →F̡→
+ 0x1d6e: (0x0066, 0x0334,), #  LATIN SMALL LETTER F WITH MIDDLE TILDE → LATIN SMALL LETTER F, COMBINING TILDE OVERLAY
+ 0x213b: (0x0046, 0x0041, 0x0058,), #  FACSIMILE SIGN → LATIN CAPITAL LETTER F, LATIN CAPITAL LETTER A, LATIN CAPITAL LETTER X
+ 0xfb00: (0x0066, 0x0066,), #  LATIN SMALL LIGATURE FF → LATIN SMALL LETTER F, LATIN SMALL LETTER F
+ 0xfb03: (0x0066, 0x0066, 0x0069,), #  LATIN SMALL LIGATURE FFI → LATIN SMALL LETTER F, LATIN SMALL LETTER F, LATIN SMALL LETTER I
+ 0xfb04: (0x0066, 0x0066, 0x006c,), #  LATIN SMALL LIGATURE FFL → LATIN SMALL LETTER F, LATIN SMALL LETTER F, LATIN SMALL LETTER L
+ 0xfb01: (0x0066, 0x0069,), #  LATIN SMALL LIGATURE FI → LATIN SMALL LETTER F, LATIN SMALL LETTER I
+ 0xfb02: (0x0066, 0x006c,), #  LATIN SMALL LIGATURE FL → LATIN SMALL LETTER F, LATIN SMALL LETTER L
+ 0x02a9: (0x0066, 0x014b,), #  LATIN SMALL LETTER FENG DIGRAPH → LATIN SMALL LETTER F, LATIN SMALL LETTER ENG
+ 0x15b5: (0x2132,), #  CANADIAN SYLLABICS BLACKFOOT WI → TURNED CAPITAL F
+ 0xa4de: (0x2132,), #  LISU LETTER TSHA → TURNED CAPITAL F
+ 0x1d230: (0xa7fb,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-30 → LATIN EPIGRAPHIC LETTER REVERSED F
+ 0x15b7: (0xa7fb,), #  CANADIAN SYLLABICS BLACKFOOT WA → LATIN EPIGRAPHIC LETTER REVERSED F
+ 0xff47: (0x0067,), #  FULLWIDTH LATIN SMALL LETTER G → LATIN SMALL LETTER G	# →ɡ→
+ 0x210a: (0x0067,), #  SCRIPT SMALL G → LATIN SMALL LETTER G
+ 0x1d420: (0x0067,), #  MATHEMATICAL BOLD SMALL G → LATIN SMALL LETTER G
+ 0x1d454: (0x0067,), #  MATHEMATICAL ITALIC SMALL G → LATIN SMALL LETTER G
+ 0x1d488: (0x0067,), #  MATHEMATICAL BOLD ITALIC SMALL G → LATIN SMALL LETTER G
+ 0x1d4f0: (0x0067,), #  MATHEMATICAL BOLD SCRIPT SMALL G → LATIN SMALL LETTER G
+ 0x1d524: (0x0067,), #  MATHEMATICAL FRAKTUR SMALL G → LATIN SMALL LETTER G
+ 0x1d558: (0x0067,), #  MATHEMATICAL DOUBLE-STRUCK SMALL G → LATIN SMALL LETTER G
+ 0x1d58c: (0x0067,), #  MATHEMATICAL BOLD FRAKTUR SMALL G → LATIN SMALL LETTER G
+ 0x1d5c0: (0x0067,), #  MATHEMATICAL SANS-SERIF SMALL G → LATIN SMALL LETTER G
+ 0x1d5f4: (0x0067,), #  MATHEMATICAL SANS-SERIF BOLD SMALL G → LATIN SMALL LETTER G
+ 0x1d628: (0x0067,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL G → LATIN SMALL LETTER G
+ 0x1d65c: (0x0067,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL G → LATIN SMALL LETTER G
+ 0x1d690: (0x0067,), #  MATHEMATICAL MONOSPACE SMALL G → LATIN SMALL LETTER G
+ 0x0261: (0x0067,), #  LATIN SMALL LETTER SCRIPT G → LATIN SMALL LETTER G
+ 0x1d83: (0x0067,), #  LATIN SMALL LETTER G WITH PALATAL HOOK → LATIN SMALL LETTER G
+ 0x018d: (0x0067,), #  LATIN SMALL LETTER TURNED DELTA → LATIN SMALL LETTER G
+ 0x0581: (0x0067,), #  ARMENIAN SMALL LETTER CO → LATIN SMALL LETTER G
+ 0x1d406: (0x0047,), #  MATHEMATICAL BOLD CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d43a: (0x0047,), #  MATHEMATICAL ITALIC CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d46e: (0x0047,), #  MATHEMATICAL BOLD ITALIC CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d4a2: (0x0047,), #  MATHEMATICAL SCRIPT CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d4d6: (0x0047,), #  MATHEMATICAL BOLD SCRIPT CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d50a: (0x0047,), #  MATHEMATICAL FRAKTUR CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d53e: (0x0047,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d572: (0x0047,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d5a6: (0x0047,), #  MATHEMATICAL SANS-SERIF CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d5da: (0x0047,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d60e: (0x0047,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d642: (0x0047,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL G → LATIN CAPITAL LETTER G
+ 0x1d676: (0x0047,), #  MATHEMATICAL MONOSPACE CAPITAL G → LATIN CAPITAL LETTER G
+ 0x050c: (0x0047,), #  CYRILLIC CAPITAL LETTER KOMI SJE → LATIN CAPITAL LETTER G
+ 0x13c0: (0x0047,), #  CHEROKEE LETTER NAH → LATIN CAPITAL LETTER G
+ 0x13f3: (0x0047,), #  CHEROKEE LETTER YU → LATIN CAPITAL LETTER G
+ 0xa4d6: (0x0047,), #  LISU LETTER GA → LATIN CAPITAL LETTER G
+ 0x1da2: (0x1d4d,), #  MODIFIER LETTER SMALL SCRIPT G → MODIFIER LETTER SMALL G
+ 0x0260: (0x0067, 0x0314,), #  LATIN SMALL LETTER G WITH HOOK → LATIN SMALL LETTER G, COMBINING REVERSED COMMA ABOVE
+ 0x01e7: (0x011f,), #  LATIN SMALL LETTER G WITH CARON → LATIN SMALL LETTER G WITH BREVE
+ 0x01e6: (0x011e,), #  LATIN CAPITAL LETTER G WITH CARON → LATIN CAPITAL LETTER G WITH BREVE
+ 0x01f5: (0x0123,), #  LATIN SMALL LETTER G WITH ACUTE → LATIN SMALL LETTER G WITH CEDILLA
+ 0x01e5: (0x0067, 0x0335,), #  LATIN SMALL LETTER G WITH STROKE → LATIN SMALL LETTER G, COMBINING SHORT STROKE OVERLAY
+ 0x01e4: (0x0047, 0x0335,), #  LATIN CAPITAL LETTER G WITH STROKE → LATIN CAPITAL LETTER G, COMBINING SHORT STROKE OVERLAY
+ 0x0193: (0x0047, 0x0027,), #  LATIN CAPITAL LETTER G WITH HOOK → LATIN CAPITAL LETTER G, APOSTROPHE	# →Gʽ→
+ 0x050d: (0x0262,), #  CYRILLIC SMALL LETTER KOMI SJE → LATIN LETTER SMALL CAPITAL G
+ 0xab90: (0x0262,), #  CHEROKEE SMALL LETTER NAH → LATIN LETTER SMALL CAPITAL G
+ 0x13fb: (0x0262,), #  CHEROKEE SMALL LETTER YU → LATIN LETTER SMALL CAPITAL G
+ 0xff48: (0x0068,), #  FULLWIDTH LATIN SMALL LETTER H → LATIN SMALL LETTER H	# →һ→
+ 0x210e: (0x0068,), #  PLANCK CONSTANT → LATIN SMALL LETTER H
+ 0x1d421: (0x0068,), #  MATHEMATICAL BOLD SMALL H → LATIN SMALL LETTER H
+ 0x1d489: (0x0068,), #  MATHEMATICAL BOLD ITALIC SMALL H → LATIN SMALL LETTER H
+ 0x1d4bd: (0x0068,), #  MATHEMATICAL SCRIPT SMALL H → LATIN SMALL LETTER H
+ 0x1d4f1: (0x0068,), #  MATHEMATICAL BOLD SCRIPT SMALL H → LATIN SMALL LETTER H
+ 0x1d525: (0x0068,), #  MATHEMATICAL FRAKTUR SMALL H → LATIN SMALL LETTER H
+ 0x1d559: (0x0068,), #  MATHEMATICAL DOUBLE-STRUCK SMALL H → LATIN SMALL LETTER H
+ 0x1d58d: (0x0068,), #  MATHEMATICAL BOLD FRAKTUR SMALL H → LATIN SMALL LETTER H
+ 0x1d5c1: (0x0068,), #  MATHEMATICAL SANS-SERIF SMALL H → LATIN SMALL LETTER H
+ 0x1d5f5: (0x0068,), #  MATHEMATICAL SANS-SERIF BOLD SMALL H → LATIN SMALL LETTER H
+ 0x1d629: (0x0068,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL H → LATIN SMALL LETTER H
+ 0x1d65d: (0x0068,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL H → LATIN SMALL LETTER H
+ 0x1d691: (0x0068,), #  MATHEMATICAL MONOSPACE SMALL H → LATIN SMALL LETTER H
+ 0x04bb: (0x0068,), #  CYRILLIC SMALL LETTER SHHA → LATIN SMALL LETTER H
+ 0x0570: (0x0068,), #  ARMENIAN SMALL LETTER HO → LATIN SMALL LETTER H
+ 0x13c2: (0x0068,), #  CHEROKEE LETTER NI → LATIN SMALL LETTER H
+ 0xff28: (0x0048,), #  FULLWIDTH LATIN CAPITAL LETTER H → LATIN CAPITAL LETTER H	# →Η→
+ 0x210b: (0x0048,), #  SCRIPT CAPITAL H → LATIN CAPITAL LETTER H
+ 0x210c: (0x0048,), #  BLACK-LETTER CAPITAL H → LATIN CAPITAL LETTER H
+ 0x210d: (0x0048,), #  DOUBLE-STRUCK CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d407: (0x0048,), #  MATHEMATICAL BOLD CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d43b: (0x0048,), #  MATHEMATICAL ITALIC CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d46f: (0x0048,), #  MATHEMATICAL BOLD ITALIC CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d4d7: (0x0048,), #  MATHEMATICAL BOLD SCRIPT CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d573: (0x0048,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d5a7: (0x0048,), #  MATHEMATICAL SANS-SERIF CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d5db: (0x0048,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d60f: (0x0048,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d643: (0x0048,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL H → LATIN CAPITAL LETTER H
+ 0x1d677: (0x0048,), #  MATHEMATICAL MONOSPACE CAPITAL H → LATIN CAPITAL LETTER H
+ 0x0397: (0x0048,), #  GREEK CAPITAL LETTER ETA → LATIN CAPITAL LETTER H
+ 0x1d6ae: (0x0048,), #  MATHEMATICAL BOLD CAPITAL ETA → LATIN CAPITAL LETTER H	# →Η→
+ 0x1d6e8: (0x0048,), #  MATHEMATICAL ITALIC CAPITAL ETA → LATIN CAPITAL LETTER H	# →Η→
+ 0x1d722: (0x0048,), #  MATHEMATICAL BOLD ITALIC CAPITAL ETA → LATIN CAPITAL LETTER H	# →𝑯→
+ 0x1d75c: (0x0048,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL ETA → LATIN CAPITAL LETTER H	# →Η→
+ 0x1d796: (0x0048,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL ETA → LATIN CAPITAL LETTER H	# →Η→
+ 0x2c8e: (0x0048,), #  COPTIC CAPITAL LETTER HATE → LATIN CAPITAL LETTER H	# →Η→
+ 0x041d: (0x0048,), #  CYRILLIC CAPITAL LETTER EN → LATIN CAPITAL LETTER H
+ 0x13bb: (0x0048,), #  CHEROKEE LETTER MI → LATIN CAPITAL LETTER H
+ 0x157c: (0x0048,), #  CANADIAN SYLLABICS NUNAVUT H → LATIN CAPITAL LETTER H
+ 0xa4e7: (0x0048,), #  LISU LETTER XA → LATIN CAPITAL LETTER H
+ 0x102cf: (0x0048,), #  CARIAN LETTER E2 → LATIN CAPITAL LETTER H
+ 0x1d78: (0x1d34,), #  MODIFIER LETTER CYRILLIC EN → MODIFIER LETTER CAPITAL H
+ 0x0266: (0x0068, 0x0314,), #  LATIN SMALL LETTER H WITH HOOK → LATIN SMALL LETTER H, COMBINING REVERSED COMMA ABOVE
+ 0xa695: (0x0068, 0x0314,), #  CYRILLIC SMALL LETTER HWE → LATIN SMALL LETTER H, COMBINING REVERSED COMMA ABOVE	# →ɦ→
+ 0x13f2: (0x0068, 0x0314,), #  CHEROKEE LETTER YO → LATIN SMALL LETTER H, COMBINING REVERSED COMMA ABOVE
+ 0x2c67: (0x0048, 0x0329,), #  LATIN CAPITAL LETTER H WITH DESCENDER → LATIN CAPITAL LETTER H, COMBINING VERTICAL LINE BELOW	# →Ң→→Н̩→
+ 0x04a2: (0x0048, 0x0329,), #  CYRILLIC CAPITAL LETTER EN WITH DESCENDER → LATIN CAPITAL LETTER H, COMBINING VERTICAL LINE BELOW	# →Н̩→
+ 0x0127: (0x0068, 0x0335,), #  LATIN SMALL LETTER H WITH STROKE → LATIN SMALL LETTER H, COMBINING SHORT STROKE OVERLAY
+ 0x210f: (0x0068, 0x0335,), #  PLANCK CONSTANT OVER TWO PI → LATIN SMALL LETTER H, COMBINING SHORT STROKE OVERLAY	# →ħ→
+ 0x045b: (0x0068, 0x0335,), #  CYRILLIC SMALL LETTER TSHE → LATIN SMALL LETTER H, COMBINING SHORT STROKE OVERLAY	# →ħ→
+ 0x0126: (0x0048, 0x0335,), #  LATIN CAPITAL LETTER H WITH STROKE → LATIN CAPITAL LETTER H, COMBINING SHORT STROKE OVERLAY
+ 0x04c9: (0x0048, 0x0326,), #  CYRILLIC CAPITAL LETTER EN WITH TAIL → LATIN CAPITAL LETTER H, COMBINING COMMA BELOW	# →Н̡→
+ 0x04c7: (0x0048, 0x0326,), #  CYRILLIC CAPITAL LETTER EN WITH HOOK → LATIN CAPITAL LETTER H, COMBINING COMMA BELOW	# →Н̡→
+ 0x043d: (0x029c,), #  CYRILLIC SMALL LETTER EN → LATIN LETTER SMALL CAPITAL H
+ 0xab8b: (0x029c,), #  CHEROKEE SMALL LETTER MI → LATIN LETTER SMALL CAPITAL H
+ 0x04a3: (0x029c, 0x0329,), #  CYRILLIC SMALL LETTER EN WITH DESCENDER → LATIN LETTER SMALL CAPITAL H, COMBINING VERTICAL LINE BELOW	# →н̩→
+ 0x04ca: (0x029c, 0x0326,), #  CYRILLIC SMALL LETTER EN WITH TAIL → LATIN LETTER SMALL CAPITAL H, COMBINING COMMA BELOW	# →н̡→
+ 0x04c8: (0x029c, 0x0326,), #  CYRILLIC SMALL LETTER EN WITH HOOK → LATIN LETTER SMALL CAPITAL H, COMBINING COMMA BELOW	# →н̡→
+ 0x050a: (0x01f6,), #  CYRILLIC CAPITAL LETTER KOMI NJE → LATIN CAPITAL LETTER HWAIR
+ 0xab80: (0x2c76,), #  CHEROKEE SMALL LETTER HO → LATIN SMALL LETTER HALF H
+ 0x0370: (0x2c75,), #  GREEK CAPITAL LETTER HETA → LATIN CAPITAL LETTER HALF H	# →Ꮀ→
+ 0x13a8: (0x2c75,), #  CHEROKEE LETTER GE → LATIN CAPITAL LETTER HALF H	# →Ͱ→→Ꮀ→
+ 0x13b0: (0x2c75,), #  CHEROKEE LETTER HO → LATIN CAPITAL LETTER HALF H
+ 0xa6b1: (0x2c75,), #  BAMUM LETTER NDAA → LATIN CAPITAL LETTER HALF H	# →Ͱ→→Ꮀ→
+ 0xa795: (0xa727,), #  LATIN SMALL LETTER H WITH PALATAL HOOK → LATIN SMALL LETTER HENG
+ 0x02db: (0x0069,), #  OGONEK → LATIN SMALL LETTER I	# →ͺ→→ι→→ι→
+ 0x2373: (0x0069,), #  APL FUNCTIONAL SYMBOL IOTA → LATIN SMALL LETTER I	# →ι→
+ 0xff49: (0x0069,), #  FULLWIDTH LATIN SMALL LETTER I → LATIN SMALL LETTER I	# →і→
+ 0x2170: (0x0069,), #  SMALL ROMAN NUMERAL ONE → LATIN SMALL LETTER I
+ 0x2139: (0x0069,), #  INFORMATION SOURCE → LATIN SMALL LETTER I
+ 0x2148: (0x0069,), #  DOUBLE-STRUCK ITALIC SMALL I → LATIN SMALL LETTER I
+ 0x1d422: (0x0069,), #  MATHEMATICAL BOLD SMALL I → LATIN SMALL LETTER I
+ 0x1d456: (0x0069,), #  MATHEMATICAL ITALIC SMALL I → LATIN SMALL LETTER I
+ 0x1d48a: (0x0069,), #  MATHEMATICAL BOLD ITALIC SMALL I → LATIN SMALL LETTER I
+ 0x1d4be: (0x0069,), #  MATHEMATICAL SCRIPT SMALL I → LATIN SMALL LETTER I
+ 0x1d4f2: (0x0069,), #  MATHEMATICAL BOLD SCRIPT SMALL I → LATIN SMALL LETTER I
+ 0x1d526: (0x0069,), #  MATHEMATICAL FRAKTUR SMALL I → LATIN SMALL LETTER I
+ 0x1d55a: (0x0069,), #  MATHEMATICAL DOUBLE-STRUCK SMALL I → LATIN SMALL LETTER I
+ 0x1d58e: (0x0069,), #  MATHEMATICAL BOLD FRAKTUR SMALL I → LATIN SMALL LETTER I
+ 0x1d5c2: (0x0069,), #  MATHEMATICAL SANS-SERIF SMALL I → LATIN SMALL LETTER I
+ 0x1d5f6: (0x0069,), #  MATHEMATICAL SANS-SERIF BOLD SMALL I → LATIN SMALL LETTER I
+ 0x1d62a: (0x0069,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL I → LATIN SMALL LETTER I
+ 0x1d65e: (0x0069,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL I → LATIN SMALL LETTER I
+ 0x1d692: (0x0069,), #  MATHEMATICAL MONOSPACE SMALL I → LATIN SMALL LETTER I
+ 0x0131: (0x0069,), #  LATIN SMALL LETTER DOTLESS I → LATIN SMALL LETTER I
+ 0x1d6a4: (0x0069,), #  MATHEMATICAL ITALIC SMALL DOTLESS I → LATIN SMALL LETTER I	# →ı→
+ 0x026a: (0x0069,), #  LATIN LETTER SMALL CAPITAL I → LATIN SMALL LETTER I	# →ı→
+ 0x0269: (0x0069,), #  LATIN SMALL LETTER IOTA → LATIN SMALL LETTER I
+ 0x03b9: (0x0069,), #  GREEK SMALL LETTER IOTA → LATIN SMALL LETTER I
+ 0x1fbe: (0x0069,), #  GREEK PROSGEGRAMMENI → LATIN SMALL LETTER I	# →ι→
+ 0x037a: (0x0069,), #  GREEK YPOGEGRAMMENI → LATIN SMALL LETTER I	# →ι→→ι→
+ 0x1d6ca: (0x0069,), #  MATHEMATICAL BOLD SMALL IOTA → LATIN SMALL LETTER I	# →ι→
+ 0x1d704: (0x0069,), #  MATHEMATICAL ITALIC SMALL IOTA → LATIN SMALL LETTER I	# →ι→
+ 0x1d73e: (0x0069,), #  MATHEMATICAL BOLD ITALIC SMALL IOTA → LATIN SMALL LETTER I	# →ι→
+ 0x1d778: (0x0069,), #  MATHEMATICAL SANS-SERIF BOLD SMALL IOTA → LATIN SMALL LETTER I	# →ι→
+ 0x1d7b2: (0x0069,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL IOTA → LATIN SMALL LETTER I	# →ι→
+ 0x0456: (0x0069,), #  CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I → LATIN SMALL LETTER I
+ 0xa647: (0x0069,), #  CYRILLIC SMALL LETTER IOTA → LATIN SMALL LETTER I	# →ι→
+ 0x04cf: (0x0069,), #  CYRILLIC SMALL LETTER PALOCHKA → LATIN SMALL LETTER I	# →ı→
+ 0xab75: (0x0069,), #  CHEROKEE SMALL LETTER V → LATIN SMALL LETTER I
+ 0x13a5: (0x0069,), #  CHEROKEE LETTER V → LATIN SMALL LETTER I
+ 0x118c3: (0x0069,), #  WARANG CITI SMALL LETTER YU → LATIN SMALL LETTER I	# →ι→
+ 0x24db: (0x24be,), #  CIRCLED LATIN SMALL LETTER L → CIRCLED LATIN CAPITAL LETTER I
+ 0x2378: (0x0069, 0x0332,), #  APL FUNCTIONAL SYMBOL IOTA UNDERBAR → LATIN SMALL LETTER I, COMBINING LOW LINE	# →ι̲→
+ 0x01d0: (0x012d,), #  LATIN SMALL LETTER I WITH CARON → LATIN SMALL LETTER I WITH BREVE
+ 0x01cf: (0x012c,), #  LATIN CAPITAL LETTER I WITH CARON → LATIN CAPITAL LETTER I WITH BREVE
+ 0x0268: (0x0069, 0x0335,), #  LATIN SMALL LETTER I WITH STROKE → LATIN SMALL LETTER I, COMBINING SHORT STROKE OVERLAY
+ 0x1d7b: (0x0069, 0x0335,), #  LATIN SMALL CAPITAL LETTER I WITH STROKE → LATIN SMALL LETTER I, COMBINING SHORT STROKE OVERLAY	# →ɪ̵→
+ 0x1d7c: (0x0069, 0x0335,), #  LATIN SMALL LETTER IOTA WITH STROKE → LATIN SMALL LETTER I, COMBINING SHORT STROKE OVERLAY	# →ɩ̵→
+ 0x2171: (0x0069, 0x0069,), #  SMALL ROMAN NUMERAL TWO → LATIN SMALL LETTER I, LATIN SMALL LETTER I
+ 0x2172: (0x0069, 0x0069, 0x0069,), #  SMALL ROMAN NUMERAL THREE → LATIN SMALL LETTER I, LATIN SMALL LETTER I, LATIN SMALL LETTER I
+ 0x0133: (0x0069, 0x006a,), #  LATIN SMALL LIGATURE IJ → LATIN SMALL LETTER I, LATIN SMALL LETTER J
+ 0x2173: (0x0069, 0x0076,), #  SMALL ROMAN NUMERAL FOUR → LATIN SMALL LETTER I, LATIN SMALL LETTER V
+ 0x2178: (0x0069, 0x0078,), #  SMALL ROMAN NUMERAL NINE → LATIN SMALL LETTER I, LATIN SMALL LETTER X
+ 0xff4a: (0x006a,), #  FULLWIDTH LATIN SMALL LETTER J → LATIN SMALL LETTER J	# →ϳ→
+ 0x2149: (0x006a,), #  DOUBLE-STRUCK ITALIC SMALL J → LATIN SMALL LETTER J
+ 0x1d423: (0x006a,), #  MATHEMATICAL BOLD SMALL J → LATIN SMALL LETTER J
+ 0x1d457: (0x006a,), #  MATHEMATICAL ITALIC SMALL J → LATIN SMALL LETTER J
+ 0x1d48b: (0x006a,), #  MATHEMATICAL BOLD ITALIC SMALL J → LATIN SMALL LETTER J
+ 0x1d4bf: (0x006a,), #  MATHEMATICAL SCRIPT SMALL J → LATIN SMALL LETTER J
+ 0x1d4f3: (0x006a,), #  MATHEMATICAL BOLD SCRIPT SMALL J → LATIN SMALL LETTER J
+ 0x1d527: (0x006a,), #  MATHEMATICAL FRAKTUR SMALL J → LATIN SMALL LETTER J
+ 0x1d55b: (0x006a,), #  MATHEMATICAL DOUBLE-STRUCK SMALL J → LATIN SMALL LETTER J
+ 0x1d58f: (0x006a,), #  MATHEMATICAL BOLD FRAKTUR SMALL J → LATIN SMALL LETTER J
+ 0x1d5c3: (0x006a,), #  MATHEMATICAL SANS-SERIF SMALL J → LATIN SMALL LETTER J
+ 0x1d5f7: (0x006a,), #  MATHEMATICAL SANS-SERIF BOLD SMALL J → LATIN SMALL LETTER J
+ 0x1d62b: (0x006a,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL J → LATIN SMALL LETTER J
+ 0x1d65f: (0x006a,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL J → LATIN SMALL LETTER J
+ 0x1d693: (0x006a,), #  MATHEMATICAL MONOSPACE SMALL J → LATIN SMALL LETTER J
+ 0x03f3: (0x006a,), #  GREEK LETTER YOT → LATIN SMALL LETTER J
+ 0x0458: (0x006a,), #  CYRILLIC SMALL LETTER JE → LATIN SMALL LETTER J
+ 0xff2a: (0x004a,), #  FULLWIDTH LATIN CAPITAL LETTER J → LATIN CAPITAL LETTER J	# →Ј→
+ 0x1d409: (0x004a,), #  MATHEMATICAL BOLD CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d43d: (0x004a,), #  MATHEMATICAL ITALIC CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d471: (0x004a,), #  MATHEMATICAL BOLD ITALIC CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d4a5: (0x004a,), #  MATHEMATICAL SCRIPT CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d4d9: (0x004a,), #  MATHEMATICAL BOLD SCRIPT CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d50d: (0x004a,), #  MATHEMATICAL FRAKTUR CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d541: (0x004a,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d575: (0x004a,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d5a9: (0x004a,), #  MATHEMATICAL SANS-SERIF CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d5dd: (0x004a,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d611: (0x004a,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d645: (0x004a,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL J → LATIN CAPITAL LETTER J
+ 0x1d679: (0x004a,), #  MATHEMATICAL MONOSPACE CAPITAL J → LATIN CAPITAL LETTER J
+ 0xa7b2: (0x004a,), #  LATIN CAPITAL LETTER J WITH CROSSED-TAIL → LATIN CAPITAL LETTER J
+ 0x037f: (0x004a,), #  GREEK CAPITAL LETTER YOT → LATIN CAPITAL LETTER J
+ 0x0408: (0x004a,), #  CYRILLIC CAPITAL LETTER JE → LATIN CAPITAL LETTER J
+ 0x13ab: (0x004a,), #  CHEROKEE LETTER GU → LATIN CAPITAL LETTER J
+ 0x148d: (0x004a,), #  CANADIAN SYLLABICS CO → LATIN CAPITAL LETTER J
+ 0xa4d9: (0x004a,), #  LISU LETTER JA → LATIN CAPITAL LETTER J
+ 0x0249: (0x006a, 0x0335,), #  LATIN SMALL LETTER J WITH STROKE → LATIN SMALL LETTER J, COMBINING SHORT STROKE OVERLAY
+ 0x0248: (0x004a, 0x0335,), #  LATIN CAPITAL LETTER J WITH STROKE → LATIN CAPITAL LETTER J, COMBINING SHORT STROKE OVERLAY
+ 0x1499: (0x004a, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWO → LATIN CAPITAL LETTER J, MIDDLE DOT	# →ᒍᐧ→
+ 0x1d6a5: (0x0237,), #  MATHEMATICAL ITALIC SMALL DOTLESS J → LATIN SMALL LETTER DOTLESS J
+ 0x0575: (0x0237,), #  ARMENIAN SMALL LETTER YI → LATIN SMALL LETTER DOTLESS J
+ 0xab7b: (0x1d0a,), #  CHEROKEE SMALL LETTER GU → LATIN LETTER SMALL CAPITAL J
+ 0x1d424: (0x006b,), #  MATHEMATICAL BOLD SMALL K → LATIN SMALL LETTER K
+ 0x1d458: (0x006b,), #  MATHEMATICAL ITALIC SMALL K → LATIN SMALL LETTER K
+ 0x1d48c: (0x006b,), #  MATHEMATICAL BOLD ITALIC SMALL K → LATIN SMALL LETTER K
+ 0x1d4c0: (0x006b,), #  MATHEMATICAL SCRIPT SMALL K → LATIN SMALL LETTER K
+ 0x1d4f4: (0x006b,), #  MATHEMATICAL BOLD SCRIPT SMALL K → LATIN SMALL LETTER K
+ 0x1d528: (0x006b,), #  MATHEMATICAL FRAKTUR SMALL K → LATIN SMALL LETTER K
+ 0x1d55c: (0x006b,), #  MATHEMATICAL DOUBLE-STRUCK SMALL K → LATIN SMALL LETTER K
+ 0x1d590: (0x006b,), #  MATHEMATICAL BOLD FRAKTUR SMALL K → LATIN SMALL LETTER K
+ 0x1d5c4: (0x006b,), #  MATHEMATICAL SANS-SERIF SMALL K → LATIN SMALL LETTER K
+ 0x1d5f8: (0x006b,), #  MATHEMATICAL SANS-SERIF BOLD SMALL K → LATIN SMALL LETTER K
+ 0x1d62c: (0x006b,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL K → LATIN SMALL LETTER K
+ 0x1d660: (0x006b,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL K → LATIN SMALL LETTER K
+ 0x1d694: (0x006b,), #  MATHEMATICAL MONOSPACE SMALL K → LATIN SMALL LETTER K
+ 0x212a: (0x004b,), #  KELVIN SIGN → LATIN CAPITAL LETTER K
+ 0xff2b: (0x004b,), #  FULLWIDTH LATIN CAPITAL LETTER K → LATIN CAPITAL LETTER K	# →Κ→
+ 0x1d40a: (0x004b,), #  MATHEMATICAL BOLD CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d43e: (0x004b,), #  MATHEMATICAL ITALIC CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d472: (0x004b,), #  MATHEMATICAL BOLD ITALIC CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d4a6: (0x004b,), #  MATHEMATICAL SCRIPT CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d4da: (0x004b,), #  MATHEMATICAL BOLD SCRIPT CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d50e: (0x004b,), #  MATHEMATICAL FRAKTUR CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d542: (0x004b,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d576: (0x004b,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d5aa: (0x004b,), #  MATHEMATICAL SANS-SERIF CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d5de: (0x004b,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d612: (0x004b,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d646: (0x004b,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL K → LATIN CAPITAL LETTER K
+ 0x1d67a: (0x004b,), #  MATHEMATICAL MONOSPACE CAPITAL K → LATIN CAPITAL LETTER K
+ 0x039a: (0x004b,), #  GREEK CAPITAL LETTER KAPPA → LATIN CAPITAL LETTER K
+ 0x1d6b1: (0x004b,), #  MATHEMATICAL BOLD CAPITAL KAPPA → LATIN CAPITAL LETTER K	# →Κ→
+ 0x1d6eb: (0x004b,), #  MATHEMATICAL ITALIC CAPITAL KAPPA → LATIN CAPITAL LETTER K	# →𝐾→
+ 0x1d725: (0x004b,), #  MATHEMATICAL BOLD ITALIC CAPITAL KAPPA → LATIN CAPITAL LETTER K	# →𝑲→
+ 0x1d75f: (0x004b,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL KAPPA → LATIN CAPITAL LETTER K	# →Κ→
+ 0x1d799: (0x004b,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL KAPPA → LATIN CAPITAL LETTER K	# →Κ→
+ 0x2c94: (0x004b,), #  COPTIC CAPITAL LETTER KAPA → LATIN CAPITAL LETTER K	# →Κ→
+ 0x041a: (0x004b,), #  CYRILLIC CAPITAL LETTER KA → LATIN CAPITAL LETTER K
+ 0x13e6: (0x004b,), #  CHEROKEE LETTER TSO → LATIN CAPITAL LETTER K
+ 0x16d5: (0x004b,), #  RUNIC LETTER OPEN-P → LATIN CAPITAL LETTER K
+ 0xa4d7: (0x004b,), #  LISU LETTER KA → LATIN CAPITAL LETTER K
+ 0x10518: (0x004b,), #  ELBASAN LETTER QE → LATIN CAPITAL LETTER K
+ 0x0199: (0x006b, 0x0314,), #  LATIN SMALL LETTER K WITH HOOK → LATIN SMALL LETTER K, COMBINING REVERSED COMMA ABOVE
+ 0x2c69: (0x004b, 0x0329,), #  LATIN CAPITAL LETTER K WITH DESCENDER → LATIN CAPITAL LETTER K, COMBINING VERTICAL LINE BELOW	# →Қ→→К̩→
+ 0x049a: (0x004b, 0x0329,), #  CYRILLIC CAPITAL LETTER KA WITH DESCENDER → LATIN CAPITAL LETTER K, COMBINING VERTICAL LINE BELOW	# →К̩→
+ 0x20ad: (0x004b, 0x0335,), #  KIP SIGN → LATIN CAPITAL LETTER K, COMBINING SHORT STROKE OVERLAY	# →K̶→
+ 0xa740: (0x004b, 0x0335,), #  LATIN CAPITAL LETTER K WITH STROKE → LATIN CAPITAL LETTER K, COMBINING SHORT STROKE OVERLAY	# →Ҟ→→К̵→
+ 0x049e: (0x004b, 0x0335,), #  CYRILLIC CAPITAL LETTER KA WITH STROKE → LATIN CAPITAL LETTER K, COMBINING SHORT STROKE OVERLAY	# →К̵→
+ 0x0198: (0x004b, 0x0027,), #  LATIN CAPITAL LETTER K WITH HOOK → LATIN CAPITAL LETTER K, APOSTROPHE	# →Kʽ→
+ 0x05c0: (0x006c,), #  HEBREW PUNCTUATION PASEQ → LATIN SMALL LETTER L	# →|→
+ 0x007c: (0x006c,), #  VERTICAL LINE → LATIN SMALL LETTER L
+ 0x2223: (0x006c,), #  DIVIDES → LATIN SMALL LETTER L	# →ǀ→
+ 0x23fd: (0x006c,), #  POWER ON SYMBOL → LATIN SMALL LETTER L	# →I→
+ 0xffe8: (0x006c,), #  HALFWIDTH FORMS LIGHT VERTICAL → LATIN SMALL LETTER L	# →|→
+ 0x0031: (0x006c,), #  DIGIT ONE → LATIN SMALL LETTER L
+ 0x0661: (0x006c,), #  ARABIC-INDIC DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x06f1: (0x006c,), #  EXTENDED ARABIC-INDIC DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x10320: (0x006c,), #  OLD ITALIC NUMERAL ONE → LATIN SMALL LETTER L	# →𐌉→→I→
+ 0x1e8c7: (0x006c,), #  MENDE KIKAKUI DIGIT ONE → LATIN SMALL LETTER L
+ 0x1d7cf: (0x006c,), #  MATHEMATICAL BOLD DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x1d7d9: (0x006c,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x1d7e3: (0x006c,), #  MATHEMATICAL SANS-SERIF DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x1d7ed: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x1d7f7: (0x006c,), #  MATHEMATICAL MONOSPACE DIGIT ONE → LATIN SMALL LETTER L	# →1→
+ 0x0049: (0x006c,), #  LATIN CAPITAL LETTER I → LATIN SMALL LETTER L
+ 0xff29: (0x006c,), #  FULLWIDTH LATIN CAPITAL LETTER I → LATIN SMALL LETTER L	# →Ӏ→
+ 0x2160: (0x006c,), #  ROMAN NUMERAL ONE → LATIN SMALL LETTER L	# →Ӏ→
+ 0x2110: (0x006c,), #  SCRIPT CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x2111: (0x006c,), #  BLACK-LETTER CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d408: (0x006c,), #  MATHEMATICAL BOLD CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d43c: (0x006c,), #  MATHEMATICAL ITALIC CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d470: (0x006c,), #  MATHEMATICAL BOLD ITALIC CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d4d8: (0x006c,), #  MATHEMATICAL BOLD SCRIPT CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d540: (0x006c,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d574: (0x006c,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d5a8: (0x006c,), #  MATHEMATICAL SANS-SERIF CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d5dc: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d610: (0x006c,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d644: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x1d678: (0x006c,), #  MATHEMATICAL MONOSPACE CAPITAL I → LATIN SMALL LETTER L	# →I→
+ 0x0196: (0x006c,), #  LATIN CAPITAL LETTER IOTA → LATIN SMALL LETTER L
+ 0xff4c: (0x006c,), #  FULLWIDTH LATIN SMALL LETTER L → LATIN SMALL LETTER L	# →Ⅰ→→Ӏ→
+ 0x217c: (0x006c,), #  SMALL ROMAN NUMERAL FIFTY → LATIN SMALL LETTER L
+ 0x2113: (0x006c,), #  SCRIPT SMALL L → LATIN SMALL LETTER L
+ 0x1d425: (0x006c,), #  MATHEMATICAL BOLD SMALL L → LATIN SMALL LETTER L
+ 0x1d459: (0x006c,), #  MATHEMATICAL ITALIC SMALL L → LATIN SMALL LETTER L
+ 0x1d48d: (0x006c,), #  MATHEMATICAL BOLD ITALIC SMALL L → LATIN SMALL LETTER L
+ 0x1d4c1: (0x006c,), #  MATHEMATICAL SCRIPT SMALL L → LATIN SMALL LETTER L
+ 0x1d4f5: (0x006c,), #  MATHEMATICAL BOLD SCRIPT SMALL L → LATIN SMALL LETTER L
+ 0x1d529: (0x006c,), #  MATHEMATICAL FRAKTUR SMALL L → LATIN SMALL LETTER L
+ 0x1d55d: (0x006c,), #  MATHEMATICAL DOUBLE-STRUCK SMALL L → LATIN SMALL LETTER L
+ 0x1d591: (0x006c,), #  MATHEMATICAL BOLD FRAKTUR SMALL L → LATIN SMALL LETTER L
+ 0x1d5c5: (0x006c,), #  MATHEMATICAL SANS-SERIF SMALL L → LATIN SMALL LETTER L
+ 0x1d5f9: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD SMALL L → LATIN SMALL LETTER L
+ 0x1d62d: (0x006c,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL L → LATIN SMALL LETTER L
+ 0x1d661: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL L → LATIN SMALL LETTER L
+ 0x1d695: (0x006c,), #  MATHEMATICAL MONOSPACE SMALL L → LATIN SMALL LETTER L
+ 0x01c0: (0x006c,), #  LATIN LETTER DENTAL CLICK → LATIN SMALL LETTER L
+ 0x0399: (0x006c,), #  GREEK CAPITAL LETTER IOTA → LATIN SMALL LETTER L
+ 0x1d6b0: (0x006c,), #  MATHEMATICAL BOLD CAPITAL IOTA → LATIN SMALL LETTER L	# →Ι→
+ 0x1d6ea: (0x006c,), #  MATHEMATICAL ITALIC CAPITAL IOTA → LATIN SMALL LETTER L	# →Ι→
+ 0x1d724: (0x006c,), #  MATHEMATICAL BOLD ITALIC CAPITAL IOTA → LATIN SMALL LETTER L	# →Ι→
+ 0x1d75e: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL IOTA → LATIN SMALL LETTER L	# →Ι→
+ 0x1d798: (0x006c,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL IOTA → LATIN SMALL LETTER L	# →Ι→
+ 0x2c92: (0x006c,), #  COPTIC CAPITAL LETTER IAUDA → LATIN SMALL LETTER L	# →Ӏ→
+ 0x0406: (0x006c,), #  CYRILLIC CAPITAL LETTER BYELORUSSIAN-UKRAINIAN I → LATIN SMALL LETTER L
+ 0x04c0: (0x006c,), #  CYRILLIC LETTER PALOCHKA → LATIN SMALL LETTER L
+ 0x05d5: (0x006c,), #  HEBREW LETTER VAV → LATIN SMALL LETTER L
+ 0x05df: (0x006c,), #  HEBREW LETTER FINAL NUN → LATIN SMALL LETTER L
+ 0x0627: (0x006c,), #  ARABIC LETTER ALEF → LATIN SMALL LETTER L	# →1→
+ 0x1ee00: (0x006c,), #  ARABIC MATHEMATICAL ALEF → LATIN SMALL LETTER L	# →‎ا‎→→1→
+ 0x1ee80: (0x006c,), #  ARABIC MATHEMATICAL LOOPED ALEF → LATIN SMALL LETTER L	# →‎ا‎→→1→
+ 0xfe8e: (0x006c,), #  ARABIC LETTER ALEF FINAL FORM → LATIN SMALL LETTER L	# →‎ا‎→→1→
+ 0xfe8d: (0x006c,), #  ARABIC LETTER ALEF ISOLATED FORM → LATIN SMALL LETTER L	# →‎ا‎→→1→
+ 0x07ca: (0x006c,), #  NKO LETTER A → LATIN SMALL LETTER L	# →∣→→ǀ→
+ 0x2d4f: (0x006c,), #  TIFINAGH LETTER YAN → LATIN SMALL LETTER L	# →Ӏ→
+ 0x16c1: (0x006c,), #  RUNIC LETTER ISAZ IS ISS I → LATIN SMALL LETTER L	# →I→
+ 0xa4f2: (0x006c,), #  LISU LETTER I → LATIN SMALL LETTER L	# →I→
+ 0x16f28: (0x006c,), #  MIAO LETTER GHA → LATIN SMALL LETTER L	# →I→
+ 0x1028a: (0x006c,), #  LYCIAN LETTER J → LATIN SMALL LETTER L	# →I→
+ 0x10309: (0x006c,), #  OLD ITALIC LETTER I → LATIN SMALL LETTER L	# →I→
+ 0x1d22a: (0x004c,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-23 → LATIN CAPITAL LETTER L
+ 0x216c: (0x004c,), #  ROMAN NUMERAL FIFTY → LATIN CAPITAL LETTER L
+ 0x2112: (0x004c,), #  SCRIPT CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d40b: (0x004c,), #  MATHEMATICAL BOLD CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d43f: (0x004c,), #  MATHEMATICAL ITALIC CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d473: (0x004c,), #  MATHEMATICAL BOLD ITALIC CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d4db: (0x004c,), #  MATHEMATICAL BOLD SCRIPT CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d50f: (0x004c,), #  MATHEMATICAL FRAKTUR CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d543: (0x004c,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d577: (0x004c,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d5ab: (0x004c,), #  MATHEMATICAL SANS-SERIF CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d5df: (0x004c,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d613: (0x004c,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d647: (0x004c,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL L → LATIN CAPITAL LETTER L
+ 0x1d67b: (0x004c,), #  MATHEMATICAL MONOSPACE CAPITAL L → LATIN CAPITAL LETTER L
+ 0x2cd0: (0x004c,), #  COPTIC CAPITAL LETTER L-SHAPED HA → LATIN CAPITAL LETTER L
+ 0x13de: (0x004c,), #  CHEROKEE LETTER TLE → LATIN CAPITAL LETTER L
+ 0x14aa: (0x004c,), #  CANADIAN SYLLABICS MA → LATIN CAPITAL LETTER L
+ 0xa4e1: (0x004c,), #  LISU LETTER LA → LATIN CAPITAL LETTER L
+ 0x16f16: (0x004c,), #  MIAO LETTER LA → LATIN CAPITAL LETTER L
+ 0x118a3: (0x004c,), #  WARANG CITI CAPITAL LETTER YU → LATIN CAPITAL LETTER L
+ 0x118b2: (0x004c,), #  WARANG CITI CAPITAL LETTER TTE → LATIN CAPITAL LETTER L
+ 0x1041b: (0x004c,), #  DESERET CAPITAL LETTER ETH → LATIN CAPITAL LETTER L
+ 0x10526: (0x004c,), #  ELBASAN LETTER GHAMMA → LATIN CAPITAL LETTER L
+ 0xfd3c: (0x006c, 0x030b,), #  ARABIC LIGATURE ALEF WITH FATHATAN FINAL FORM → LATIN SMALL LETTER L, COMBINING DOUBLE ACUTE ACCENT	# →‎اً‎→
+ 0xfd3d: (0x006c, 0x030b,), #  ARABIC LIGATURE ALEF WITH FATHATAN ISOLATED FORM → LATIN SMALL LETTER L, COMBINING DOUBLE ACUTE ACCENT	# →‎اً‎→
+ 0x0142: (0x006c, 0x0338,), #  LATIN SMALL LETTER L WITH STROKE → LATIN SMALL LETTER L, COMBINING LONG SOLIDUS OVERLAY	# →l̷→
+ 0x0141: (0x004c, 0x0338,), #  LATIN CAPITAL LETTER L WITH STROKE → LATIN CAPITAL LETTER L, COMBINING LONG SOLIDUS OVERLAY	# →L̷→
+ 0x026d: (0x006c, 0x0328,), #  LATIN SMALL LETTER L WITH RETROFLEX HOOK → LATIN SMALL LETTER L, COMBINING OGONEK	# →l̢→
+ 0x0197: (0x006c, 0x0335,), #  LATIN CAPITAL LETTER I WITH STROKE → LATIN SMALL LETTER L, COMBINING SHORT STROKE OVERLAY	# →ƚ→
+ 0x019a: (0x006c, 0x0335,), #  LATIN SMALL LETTER L WITH BAR → LATIN SMALL LETTER L, COMBINING SHORT STROKE OVERLAY
+ 0x026b: (0x006c, 0x0334,), #  LATIN SMALL LETTER L WITH MIDDLE TILDE → LATIN SMALL LETTER L, COMBINING TILDE OVERLAY
+ 0x0625: (0x006c, 0x0655,), #  ARABIC LETTER ALEF WITH HAMZA BELOW → LATIN SMALL LETTER L, ARABIC HAMZA BELOW	# →‎ٳ‎→→‎اٟ‎→
+ 0xfe88: (0x006c, 0x0655,), #  ARABIC LETTER ALEF WITH HAMZA BELOW FINAL FORM → LATIN SMALL LETTER L, ARABIC HAMZA BELOW	# →‎إ‎→→‎ٳ‎→→‎اٟ‎→
+ 0xfe87: (0x006c, 0x0655,), #  ARABIC LETTER ALEF WITH HAMZA BELOW ISOLATED FORM → LATIN SMALL LETTER L, ARABIC HAMZA BELOW	# →‎إ‎→→‎ٳ‎→→‎اٟ‎→
+ 0x0673: (0x006c, 0x0655,), #  ARABIC LETTER ALEF WITH WAVY HAMZA BELOW → LATIN SMALL LETTER L, ARABIC HAMZA BELOW	# →‎اٟ‎→
+ 0x0140: (0x006c, 0x00b7,), #  LATIN SMALL LETTER L WITH MIDDLE DOT → LATIN SMALL LETTER L, MIDDLE DOT
+ 0x013f: (0x006c, 0x00b7,), #  LATIN CAPITAL LETTER L WITH MIDDLE DOT → LATIN SMALL LETTER L, MIDDLE DOT	# →L·→→ᒪ·→→ᒪᐧ→→ᒷ→→1ᐧ→
+ 0x14b7: (0x006c, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWA → LATIN SMALL LETTER L, MIDDLE DOT	# →1ᐧ→
+ 0x1f102: (0x006c, 0x002c,), #  DIGIT ONE COMMA → LATIN SMALL LETTER L, COMMA	# →1,→
+ 0x2488: (0x006c, 0x002e,), #  DIGIT ONE FULL STOP → LATIN SMALL LETTER L, FULL STOP	# →1.→
+ 0x05f1: (0x006c, 0x0027,), #  HEBREW LIGATURE YIDDISH VAV YOD → LATIN SMALL LETTER L, APOSTROPHE	# →‎וי‎→
+ 0x2493: (0x006c, 0x0032, 0x002e,), #  NUMBER TWELVE FULL STOP → LATIN SMALL LETTER L, DIGIT TWO, FULL STOP	# →12.→
+ 0x33eb: (0x006c, 0x0032, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TWELVE → LATIN SMALL LETTER L, DIGIT TWO, CJK UNIFIED IDEOGRAPH-65E5	# →12日→
+ 0x32cb: (0x006c, 0x0032, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DECEMBER → LATIN SMALL LETTER L, DIGIT TWO, CJK UNIFIED IDEOGRAPH-6708	# →12月→
+ 0x3364: (0x006c, 0x0032, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TWELVE → LATIN SMALL LETTER L, DIGIT TWO, CJK UNIFIED IDEOGRAPH-70B9	# →12点→
+ 0x2494: (0x006c, 0x0033, 0x002e,), #  NUMBER THIRTEEN FULL STOP → LATIN SMALL LETTER L, DIGIT THREE, FULL STOP	# →13.→
+ 0x33ec: (0x006c, 0x0033, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY THIRTEEN → LATIN SMALL LETTER L, DIGIT THREE, CJK UNIFIED IDEOGRAPH-65E5	# →13日→
+ 0x3365: (0x006c, 0x0033, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR THIRTEEN → LATIN SMALL LETTER L, DIGIT THREE, CJK UNIFIED IDEOGRAPH-70B9	# →13点→
+ 0x2495: (0x006c, 0x0034, 0x002e,), #  NUMBER FOURTEEN FULL STOP → LATIN SMALL LETTER L, DIGIT FOUR, FULL STOP	# →14.→
+ 0x33ed: (0x006c, 0x0034, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY FOURTEEN → LATIN SMALL LETTER L, DIGIT FOUR, CJK UNIFIED IDEOGRAPH-65E5	# →14日→
+ 0x3366: (0x006c, 0x0034, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR FOURTEEN → LATIN SMALL LETTER L, DIGIT FOUR, CJK UNIFIED IDEOGRAPH-70B9	# →14点→
+ 0x2496: (0x006c, 0x0035, 0x002e,), #  NUMBER FIFTEEN FULL STOP → LATIN SMALL LETTER L, DIGIT FIVE, FULL STOP	# →15.→
+ 0x33ee: (0x006c, 0x0035, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY FIFTEEN → LATIN SMALL LETTER L, DIGIT FIVE, CJK UNIFIED IDEOGRAPH-65E5	# →15日→
+ 0x3367: (0x006c, 0x0035, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR FIFTEEN → LATIN SMALL LETTER L, DIGIT FIVE, CJK UNIFIED IDEOGRAPH-70B9	# →15点→
+ 0x2497: (0x006c, 0x0036, 0x002e,), #  NUMBER SIXTEEN FULL STOP → LATIN SMALL LETTER L, DIGIT SIX, FULL STOP	# →16.→
+ 0x33ef: (0x006c, 0x0036, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY SIXTEEN → LATIN SMALL LETTER L, DIGIT SIX, CJK UNIFIED IDEOGRAPH-65E5	# →16日→
+ 0x3368: (0x006c, 0x0036, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR SIXTEEN → LATIN SMALL LETTER L, DIGIT SIX, CJK UNIFIED IDEOGRAPH-70B9	# →16点→
+ 0x2498: (0x006c, 0x0037, 0x002e,), #  NUMBER SEVENTEEN FULL STOP → LATIN SMALL LETTER L, DIGIT SEVEN, FULL STOP	# →17.→
+ 0x33f0: (0x006c, 0x0037, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY SEVENTEEN → LATIN SMALL LETTER L, DIGIT SEVEN, CJK UNIFIED IDEOGRAPH-65E5	# →17日→
+ 0x3369: (0x006c, 0x0037, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR SEVENTEEN → LATIN SMALL LETTER L, DIGIT SEVEN, CJK UNIFIED IDEOGRAPH-70B9	# →17点→
+ 0x2499: (0x006c, 0x0038, 0x002e,), #  NUMBER EIGHTEEN FULL STOP → LATIN SMALL LETTER L, DIGIT EIGHT, FULL STOP	# →18.→
+ 0x33f1: (0x006c, 0x0038, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY EIGHTEEN → LATIN SMALL LETTER L, DIGIT EIGHT, CJK UNIFIED IDEOGRAPH-65E5	# →18日→
+ 0x336a: (0x006c, 0x0038, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR EIGHTEEN → LATIN SMALL LETTER L, DIGIT EIGHT, CJK UNIFIED IDEOGRAPH-70B9	# →18点→
+ 0x249a: (0x006c, 0x0039, 0x002e,), #  NUMBER NINETEEN FULL STOP → LATIN SMALL LETTER L, DIGIT NINE, FULL STOP	# →19.→
+ 0x33f2: (0x006c, 0x0039, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY NINETEEN → LATIN SMALL LETTER L, DIGIT NINE, CJK UNIFIED IDEOGRAPH-65E5	# →19日→
+ 0x336b: (0x006c, 0x0039, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR NINETEEN → LATIN SMALL LETTER L, DIGIT NINE, CJK UNIFIED IDEOGRAPH-70B9	# →19点→
+ 0x01c9: (0x006c, 0x006a,), #  LATIN SMALL LETTER LJ → LATIN SMALL LETTER L, LATIN SMALL LETTER J
+ 0x0132: (0x006c, 0x004a,), #  LATIN CAPITAL LIGATURE IJ → LATIN SMALL LETTER L, LATIN CAPITAL LETTER J	# →IJ→
+ 0x01c8: (0x004c, 0x006a,), #  LATIN CAPITAL LETTER L WITH SMALL LETTER J → LATIN CAPITAL LETTER L, LATIN SMALL LETTER J
+ 0x01c7: (0x004c, 0x004a,), #  LATIN CAPITAL LETTER LJ → LATIN CAPITAL LETTER L, LATIN CAPITAL LETTER J
+ 0x2016: (0x006c, 0x006c,), #  DOUBLE VERTICAL LINE → LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →∥→→||→
+ 0x2225: (0x006c, 0x006c,), #  PARALLEL TO → LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →||→
+ 0x2161: (0x006c, 0x006c,), #  ROMAN NUMERAL TWO → LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →II→
+ 0x01c1: (0x006c, 0x006c,), #  LATIN LETTER LATERAL CLICK → LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →‖→→∥→→||→
+ 0x05f0: (0x006c, 0x006c,), #  HEBREW LIGATURE YIDDISH DOUBLE VAV → LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →‎וו‎→
+ 0x10199: (0x006c, 0x0335, 0x006c, 0x0335,), #  ROMAN DUPONDIUS SIGN → LATIN SMALL LETTER L, COMBINING SHORT STROKE OVERLAY, LATIN SMALL LETTER L, COMBINING SHORT STROKE OVERLAY	# →I̶I̶→
+ 0x2492: (0x006c, 0x006c, 0x002e,), #  NUMBER ELEVEN FULL STOP → LATIN SMALL LETTER L, LATIN SMALL LETTER L, FULL STOP	# →11.→
+ 0x2162: (0x006c, 0x006c, 0x006c,), #  ROMAN NUMERAL THREE → LATIN SMALL LETTER L, LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →III→
+ 0x10198: (0x006c, 0x0335, 0x006c, 0x0335, 0x0053, 0x0335,), #  ROMAN SESTERTIUS SIGN → LATIN SMALL LETTER L, COMBINING SHORT STROKE OVERLAY, LATIN SMALL LETTER L, COMBINING SHORT STROKE OVERLAY, LATIN CAPITAL LETTER S, COMBINING SHORT STROKE OVERLAY	# →I̶I̶S̶→
+ 0x33ea: (0x006c, 0x006c, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY ELEVEN → LATIN SMALL LETTER L, LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-65E5	# →11日→
+ 0x32ca: (0x006c, 0x006c, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR NOVEMBER → LATIN SMALL LETTER L, LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-6708	# →11月→
+ 0x3363: (0x006c, 0x006c, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR ELEVEN → LATIN SMALL LETTER L, LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-70B9	# →11点→
+ 0x042e: (0x006c, 0x004f,), #  CYRILLIC CAPITAL LETTER YU → LATIN SMALL LETTER L, LATIN CAPITAL LETTER O	# →IO→
+ 0x2491: (0x006c, 0x004f, 0x002e,), #  NUMBER TEN FULL STOP → LATIN SMALL LETTER L, LATIN CAPITAL LETTER O, FULL STOP	# →10.→
+ 0x33e9: (0x006c, 0x004f, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY TEN → LATIN SMALL LETTER L, LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-65E5	# →10日→
+ 0x32c9: (0x006c, 0x004f, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR OCTOBER → LATIN SMALL LETTER L, LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-6708	# →10月→
+ 0x3362: (0x006c, 0x004f, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR TEN → LATIN SMALL LETTER L, LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-70B9	# →10点→
+ 0x02aa: (0x006c, 0x0073,), #  LATIN SMALL LETTER LS DIGRAPH → LATIN SMALL LETTER L, LATIN SMALL LETTER S
+ 0x20b6: (0x006c, 0x0074,), #  LIVRE TOURNOIS SIGN → LATIN SMALL LETTER L, LATIN SMALL LETTER T
+ 0x2163: (0x006c, 0x0056,), #  ROMAN NUMERAL FOUR → LATIN SMALL LETTER L, LATIN CAPITAL LETTER V	# →IV→
+ 0x2168: (0x006c, 0x0058,), #  ROMAN NUMERAL NINE → LATIN SMALL LETTER L, LATIN CAPITAL LETTER X	# →IX→
+ 0x026e: (0x006c, 0x021d,), #  LATIN SMALL LETTER LEZH → LATIN SMALL LETTER L, LATIN SMALL LETTER YOGH	# →lʒ→
+ 0x02ab: (0x006c, 0x007a,), #  LATIN SMALL LETTER LZ DIGRAPH → LATIN SMALL LETTER L, LATIN SMALL LETTER Z
+ 0x0623: (0x006c, 0x0674,), #  ARABIC LETTER ALEF WITH HAMZA ABOVE → LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎ٵ‎→→‎اٴ‎→
+ 0xfe84: (0x006c, 0x0674,), #  ARABIC LETTER ALEF WITH HAMZA ABOVE FINAL FORM → LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎أ‎→→‎ٵ‎→→‎اٴ‎→
+ 0xfe83: (0x006c, 0x0674,), #  ARABIC LETTER ALEF WITH HAMZA ABOVE ISOLATED FORM → LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎ٵ‎→→‎اٴ‎→
+ 0x0672: (0x006c, 0x0674,), #  ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE → LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎أ‎→→‎ٵ‎→→‎اٴ‎→
+ 0x0675: (0x006c, 0x0674,), #  ARABIC LETTER HIGH HAMZA ALEF → LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎اٴ‎→
+ 0xfdf3: (0x006c, 0x0643, 0x0628, 0x0631,), #  ARABIC LIGATURE AKBAR ISOLATED FORM → LATIN SMALL LETTER L, ARABIC LETTER KAF, ARABIC LETTER BEH, ARABIC LETTER REH	# →‎اكبر‎→
+ 0xfdf2: (0x006c, 0x0644, 0x0644, 0x0651, 0x0670, 0x006f,), #  ARABIC LIGATURE ALLAH ISOLATED FORM → LATIN SMALL LETTER L, ARABIC LETTER LAM, ARABIC LETTER LAM, ARABIC SHADDA, ARABIC LETTER SUPERSCRIPT ALEF, LATIN SMALL LETTER O	# →‎اللّٰه‎→
+ 0x33e0: (0x006c, 0x65e5,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY ONE → LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-65E5	# →1日→
+ 0x32c0: (0x006c, 0x6708,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR JANUARY → LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-6708	# →1月→
+ 0x3359: (0x006c, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR ONE → LATIN SMALL LETTER L, CJK UNIFIED IDEOGRAPH-70B9	# →1点→
+ 0x2cd1: (0x029f,), #  COPTIC SMALL LETTER L-SHAPED HA → LATIN LETTER SMALL CAPITAL L
+ 0xabae: (0x029f,), #  CHEROKEE SMALL LETTER TLE → LATIN LETTER SMALL CAPITAL L
+ 0x10443: (0x029f,), #  DESERET SMALL LETTER ETH → LATIN LETTER SMALL CAPITAL L
+ 0xff2d: (0x004d,), #  FULLWIDTH LATIN CAPITAL LETTER M → LATIN CAPITAL LETTER M	# →Μ→
+ 0x216f: (0x004d,), #  ROMAN NUMERAL ONE THOUSAND → LATIN CAPITAL LETTER M
+ 0x2133: (0x004d,), #  SCRIPT CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d40c: (0x004d,), #  MATHEMATICAL BOLD CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d440: (0x004d,), #  MATHEMATICAL ITALIC CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d474: (0x004d,), #  MATHEMATICAL BOLD ITALIC CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d4dc: (0x004d,), #  MATHEMATICAL BOLD SCRIPT CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d510: (0x004d,), #  MATHEMATICAL FRAKTUR CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d544: (0x004d,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d578: (0x004d,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d5ac: (0x004d,), #  MATHEMATICAL SANS-SERIF CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d5e0: (0x004d,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d614: (0x004d,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d648: (0x004d,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL M → LATIN CAPITAL LETTER M
+ 0x1d67c: (0x004d,), #  MATHEMATICAL MONOSPACE CAPITAL M → LATIN CAPITAL LETTER M
+ 0x039c: (0x004d,), #  GREEK CAPITAL LETTER MU → LATIN CAPITAL LETTER M
+ 0x1d6b3: (0x004d,), #  MATHEMATICAL BOLD CAPITAL MU → LATIN CAPITAL LETTER M	# →𝐌→
+ 0x1d6ed: (0x004d,), #  MATHEMATICAL ITALIC CAPITAL MU → LATIN CAPITAL LETTER M	# →𝑀→
+ 0x1d727: (0x004d,), #  MATHEMATICAL BOLD ITALIC CAPITAL MU → LATIN CAPITAL LETTER M	# →𝑴→
+ 0x1d761: (0x004d,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL MU → LATIN CAPITAL LETTER M	# →Μ→
+ 0x1d79b: (0x004d,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL MU → LATIN CAPITAL LETTER M	# →Μ→
+ 0x03fa: (0x004d,), #  GREEK CAPITAL LETTER SAN → LATIN CAPITAL LETTER M
+ 0x2c98: (0x004d,), #  COPTIC CAPITAL LETTER MI → LATIN CAPITAL LETTER M
+ 0x041c: (0x004d,), #  CYRILLIC CAPITAL LETTER EM → LATIN CAPITAL LETTER M
+ 0x13b7: (0x004d,), #  CHEROKEE LETTER LU → LATIN CAPITAL LETTER M
+ 0x15f0: (0x004d,), #  CANADIAN SYLLABICS CARRIER GO → LATIN CAPITAL LETTER M
+ 0x16d6: (0x004d,), #  RUNIC LETTER EHWAZ EH E → LATIN CAPITAL LETTER M
+ 0xa4df: (0x004d,), #  LISU LETTER MA → LATIN CAPITAL LETTER M
+ 0x102b0: (0x004d,), #  CARIAN LETTER S → LATIN CAPITAL LETTER M
+ 0x10311: (0x004d,), #  OLD ITALIC LETTER SHE → LATIN CAPITAL LETTER M
+ 0x04cd: (0x004d, 0x0326,), #  CYRILLIC CAPITAL LETTER EM WITH TAIL → LATIN CAPITAL LETTER M, COMBINING COMMA BELOW	# →М̡→
+ 0x1f76b: (0x004d, 0x0042,), #  ALCHEMICAL SYMBOL FOR BATH OF MARY → LATIN CAPITAL LETTER M, LATIN CAPITAL LETTER B
+ 0x2de8: (0x1ddf,), #  COMBINING CYRILLIC LETTER EM → COMBINING LATIN LETTER SMALL CAPITAL M
+ 0x1d427: (0x006e,), #  MATHEMATICAL BOLD SMALL N → LATIN SMALL LETTER N
+ 0x1d45b: (0x006e,), #  MATHEMATICAL ITALIC SMALL N → LATIN SMALL LETTER N
+ 0x1d48f: (0x006e,), #  MATHEMATICAL BOLD ITALIC SMALL N → LATIN SMALL LETTER N
+ 0x1d4c3: (0x006e,), #  MATHEMATICAL SCRIPT SMALL N → LATIN SMALL LETTER N
+ 0x1d4f7: (0x006e,), #  MATHEMATICAL BOLD SCRIPT SMALL N → LATIN SMALL LETTER N
+ 0x1d52b: (0x006e,), #  MATHEMATICAL FRAKTUR SMALL N → LATIN SMALL LETTER N
+ 0x1d55f: (0x006e,), #  MATHEMATICAL DOUBLE-STRUCK SMALL N → LATIN SMALL LETTER N
+ 0x1d593: (0x006e,), #  MATHEMATICAL BOLD FRAKTUR SMALL N → LATIN SMALL LETTER N
+ 0x1d5c7: (0x006e,), #  MATHEMATICAL SANS-SERIF SMALL N → LATIN SMALL LETTER N
+ 0x1d5fb: (0x006e,), #  MATHEMATICAL SANS-SERIF BOLD SMALL N → LATIN SMALL LETTER N
+ 0x1d62f: (0x006e,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL N → LATIN SMALL LETTER N
+ 0x1d663: (0x006e,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL N → LATIN SMALL LETTER N
+ 0x1d697: (0x006e,), #  MATHEMATICAL MONOSPACE SMALL N → LATIN SMALL LETTER N
+ 0x0578: (0x006e,), #  ARMENIAN SMALL LETTER VO → LATIN SMALL LETTER N
+ 0x057c: (0x006e,), #  ARMENIAN SMALL LETTER RA → LATIN SMALL LETTER N
+ 0xff2e: (0x004e,), #  FULLWIDTH LATIN CAPITAL LETTER N → LATIN CAPITAL LETTER N	# →Ν→
+ 0x2115: (0x004e,), #  DOUBLE-STRUCK CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d40d: (0x004e,), #  MATHEMATICAL BOLD CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d441: (0x004e,), #  MATHEMATICAL ITALIC CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d475: (0x004e,), #  MATHEMATICAL BOLD ITALIC CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d4a9: (0x004e,), #  MATHEMATICAL SCRIPT CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d4dd: (0x004e,), #  MATHEMATICAL BOLD SCRIPT CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d511: (0x004e,), #  MATHEMATICAL FRAKTUR CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d579: (0x004e,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d5ad: (0x004e,), #  MATHEMATICAL SANS-SERIF CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d5e1: (0x004e,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d615: (0x004e,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d649: (0x004e,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL N → LATIN CAPITAL LETTER N
+ 0x1d67d: (0x004e,), #  MATHEMATICAL MONOSPACE CAPITAL N → LATIN CAPITAL LETTER N
+ 0x039d: (0x004e,), #  GREEK CAPITAL LETTER NU → LATIN CAPITAL LETTER N
+ 0x1d6b4: (0x004e,), #  MATHEMATICAL BOLD CAPITAL NU → LATIN CAPITAL LETTER N	# →𝐍→
+ 0x1d6ee: (0x004e,), #  MATHEMATICAL ITALIC CAPITAL NU → LATIN CAPITAL LETTER N	# →𝑁→
+ 0x1d728: (0x004e,), #  MATHEMATICAL BOLD ITALIC CAPITAL NU → LATIN CAPITAL LETTER N	# →𝑵→
+ 0x1d762: (0x004e,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL NU → LATIN CAPITAL LETTER N	# →Ν→
+ 0x1d79c: (0x004e,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL NU → LATIN CAPITAL LETTER N	# →Ν→
+ 0x2c9a: (0x004e,), #  COPTIC CAPITAL LETTER NI → LATIN CAPITAL LETTER N
+ 0xa4e0: (0x004e,), #  LISU LETTER NA → LATIN CAPITAL LETTER N
+ 0x10513: (0x004e,), #  ELBASAN LETTER NE → LATIN CAPITAL LETTER N
+ 0x1018e: (0x004e, 0x030a,), #  NOMISMA SIGN → LATIN CAPITAL LETTER N, COMBINING RING ABOVE	# →Νͦ→
+ 0x0273: (0x006e, 0x0328,), #  LATIN SMALL LETTER N WITH RETROFLEX HOOK → LATIN SMALL LETTER N, COMBINING OGONEK	# →n̢→
+ 0x019e: (0x006e, 0x0329,), #  LATIN SMALL LETTER N WITH LONG RIGHT LEG → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW
+ 0x03b7: (0x006e, 0x0329,), #  GREEK SMALL LETTER ETA → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW	# →ƞ→
+ 0x1d6c8: (0x006e, 0x0329,), #  MATHEMATICAL BOLD SMALL ETA → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW	# →η→→ƞ→
+ 0x1d702: (0x006e, 0x0329,), #  MATHEMATICAL ITALIC SMALL ETA → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW	# →η→→ƞ→
+ 0x1d73c: (0x006e, 0x0329,), #  MATHEMATICAL BOLD ITALIC SMALL ETA → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW	# →η→→ƞ→
+ 0x1d776: (0x006e, 0x0329,), #  MATHEMATICAL SANS-SERIF BOLD SMALL ETA → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW	# →η→→ƞ→
+ 0x1d7b0: (0x006e, 0x0329,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL ETA → LATIN SMALL LETTER N, COMBINING VERTICAL LINE BELOW	# →η→→ƞ→
+ 0x019d: (0x004e, 0x0326,), #  LATIN CAPITAL LETTER N WITH LEFT HOOK → LATIN CAPITAL LETTER N, COMBINING COMMA BELOW	# →N̡→
+ 0x1d70: (0x006e, 0x0334,), #  LATIN SMALL LETTER N WITH MIDDLE TILDE → LATIN SMALL LETTER N, COMBINING TILDE OVERLAY
+ 0x01cc: (0x006e, 0x006a,), #  LATIN SMALL LETTER NJ → LATIN SMALL LETTER N, LATIN SMALL LETTER J
+ 0x01cb: (0x004e, 0x006a,), #  LATIN CAPITAL LETTER N WITH SMALL LETTER J → LATIN CAPITAL LETTER N, LATIN SMALL LETTER J
+ 0x01ca: (0x004e, 0x004a,), #  LATIN CAPITAL LETTER NJ → LATIN CAPITAL LETTER N, LATIN CAPITAL LETTER J
+ 0x2116: (0x004e, 0x006f,), #  NUMERO SIGN → LATIN CAPITAL LETTER N, LATIN SMALL LETTER O
+ 0x0377: (0x1d0e,), #  GREEK SMALL LETTER PAMPHYLIAN DIGAMMA → LATIN LETTER SMALL CAPITAL REVERSED N	# →и→
+ 0x0438: (0x1d0e,), #  CYRILLIC SMALL LETTER I → LATIN LETTER SMALL CAPITAL REVERSED N
+ 0x1044d: (0x1d0e,), #  DESERET SMALL LETTER ENG → LATIN LETTER SMALL CAPITAL REVERSED N	# →и→
+ 0x0146: (0x0272,), #  LATIN SMALL LETTER N WITH CEDILLA → LATIN SMALL LETTER N WITH LEFT HOOK
+ 0x0c02: (0x006f,), #  TELUGU SIGN ANUSVARA → LATIN SMALL LETTER O
+ 0x0c82: (0x006f,), #  KANNADA SIGN ANUSVARA → LATIN SMALL LETTER O
+ 0x0d02: (0x006f,), #  MALAYALAM SIGN ANUSVARA → LATIN SMALL LETTER O
+ 0x0d82: (0x006f,), #  SINHALA SIGN ANUSVARAYA → LATIN SMALL LETTER O
+ 0x0966: (0x006f,), #  DEVANAGARI DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0a66: (0x006f,), #  GURMUKHI DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0ae6: (0x006f,), #  GUJARATI DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0be6: (0x006f,), #  TAMIL DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0c66: (0x006f,), #  TELUGU DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0ce6: (0x006f,), #  KANNADA DIGIT ZERO → LATIN SMALL LETTER O	# →౦→
+ 0x0d66: (0x006f,), #  MALAYALAM DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0e50: (0x006f,), #  THAI DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0ed0: (0x006f,), #  LAO DIGIT ZERO → LATIN SMALL LETTER O
+ 0x1040: (0x006f,), #  MYANMAR DIGIT ZERO → LATIN SMALL LETTER O
+ 0x0665: (0x006f,), #  ARABIC-INDIC DIGIT FIVE → LATIN SMALL LETTER O
+ 0x06f5: (0x006f,), #  EXTENDED ARABIC-INDIC DIGIT FIVE → LATIN SMALL LETTER O	# →‎٥‎→
+ 0xff4f: (0x006f,), #  FULLWIDTH LATIN SMALL LETTER O → LATIN SMALL LETTER O	# →о→
+ 0x2134: (0x006f,), #  SCRIPT SMALL O → LATIN SMALL LETTER O
+ 0x1d428: (0x006f,), #  MATHEMATICAL BOLD SMALL O → LATIN SMALL LETTER O
+ 0x1d45c: (0x006f,), #  MATHEMATICAL ITALIC SMALL O → LATIN SMALL LETTER O
+ 0x1d490: (0x006f,), #  MATHEMATICAL BOLD ITALIC SMALL O → LATIN SMALL LETTER O
+ 0x1d4f8: (0x006f,), #  MATHEMATICAL BOLD SCRIPT SMALL O → LATIN SMALL LETTER O
+ 0x1d52c: (0x006f,), #  MATHEMATICAL FRAKTUR SMALL O → LATIN SMALL LETTER O
+ 0x1d560: (0x006f,), #  MATHEMATICAL DOUBLE-STRUCK SMALL O → LATIN SMALL LETTER O
+ 0x1d594: (0x006f,), #  MATHEMATICAL BOLD FRAKTUR SMALL O → LATIN SMALL LETTER O
+ 0x1d5c8: (0x006f,), #  MATHEMATICAL SANS-SERIF SMALL O → LATIN SMALL LETTER O
+ 0x1d5fc: (0x006f,), #  MATHEMATICAL SANS-SERIF BOLD SMALL O → LATIN SMALL LETTER O
+ 0x1d630: (0x006f,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL O → LATIN SMALL LETTER O
+ 0x1d664: (0x006f,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL O → LATIN SMALL LETTER O
+ 0x1d698: (0x006f,), #  MATHEMATICAL MONOSPACE SMALL O → LATIN SMALL LETTER O
+ 0x1d0f: (0x006f,), #  LATIN LETTER SMALL CAPITAL O → LATIN SMALL LETTER O
+ 0x1d11: (0x006f,), #  LATIN SMALL LETTER SIDEWAYS O → LATIN SMALL LETTER O
+ 0xab3d: (0x006f,), #  LATIN SMALL LETTER BLACKLETTER O → LATIN SMALL LETTER O
+ 0x03bf: (0x006f,), #  GREEK SMALL LETTER OMICRON → LATIN SMALL LETTER O
+ 0x1d6d0: (0x006f,), #  MATHEMATICAL BOLD SMALL OMICRON → LATIN SMALL LETTER O	# →𝐨→
+ 0x1d70a: (0x006f,), #  MATHEMATICAL ITALIC SMALL OMICRON → LATIN SMALL LETTER O	# →𝑜→
+ 0x1d744: (0x006f,), #  MATHEMATICAL BOLD ITALIC SMALL OMICRON → LATIN SMALL LETTER O	# →𝒐→
+ 0x1d77e: (0x006f,), #  MATHEMATICAL SANS-SERIF BOLD SMALL OMICRON → LATIN SMALL LETTER O	# →ο→
+ 0x1d7b8: (0x006f,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL OMICRON → LATIN SMALL LETTER O	# →ο→
+ 0x03c3: (0x006f,), #  GREEK SMALL LETTER SIGMA → LATIN SMALL LETTER O
+ 0x1d6d4: (0x006f,), #  MATHEMATICAL BOLD SMALL SIGMA → LATIN SMALL LETTER O	# →σ→
+ 0x1d70e: (0x006f,), #  MATHEMATICAL ITALIC SMALL SIGMA → LATIN SMALL LETTER O	# →σ→
+ 0x1d748: (0x006f,), #  MATHEMATICAL BOLD ITALIC SMALL SIGMA → LATIN SMALL LETTER O	# →σ→
+ 0x1d782: (0x006f,), #  MATHEMATICAL SANS-SERIF BOLD SMALL SIGMA → LATIN SMALL LETTER O	# →σ→
+ 0x1d7bc: (0x006f,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL SIGMA → LATIN SMALL LETTER O	# →σ→
+ 0x2c9f: (0x006f,), #  COPTIC SMALL LETTER O → LATIN SMALL LETTER O
+ 0x043e: (0x006f,), #  CYRILLIC SMALL LETTER O → LATIN SMALL LETTER O
+ 0x10ff: (0x006f,), #  GEORGIAN LETTER LABIAL SIGN → LATIN SMALL LETTER O
+ 0x0585: (0x006f,), #  ARMENIAN SMALL LETTER OH → LATIN SMALL LETTER O
+ 0x05e1: (0x006f,), #  HEBREW LETTER SAMEKH → LATIN SMALL LETTER O
+ 0x0647: (0x006f,), #  ARABIC LETTER HEH → LATIN SMALL LETTER O
+ 0x1ee24: (0x006f,), #  ARABIC MATHEMATICAL INITIAL HEH → LATIN SMALL LETTER O	# →‎ه‎→
+ 0x1ee64: (0x006f,), #  ARABIC MATHEMATICAL STRETCHED HEH → LATIN SMALL LETTER O	# →‎ه‎→
+ 0x1ee84: (0x006f,), #  ARABIC MATHEMATICAL LOOPED HEH → LATIN SMALL LETTER O	# →‎ه‎→
+ 0xfeeb: (0x006f,), #  ARABIC LETTER HEH INITIAL FORM → LATIN SMALL LETTER O	# →‎ه‎→
+ 0xfeec: (0x006f,), #  ARABIC LETTER HEH MEDIAL FORM → LATIN SMALL LETTER O	# →‎ه‎→
+ 0xfeea: (0x006f,), #  ARABIC LETTER HEH FINAL FORM → LATIN SMALL LETTER O	# →‎ه‎→
+ 0xfee9: (0x006f,), #  ARABIC LETTER HEH ISOLATED FORM → LATIN SMALL LETTER O	# →‎ه‎→
+ 0x06be: (0x006f,), #  ARABIC LETTER HEH DOACHASHMEE → LATIN SMALL LETTER O	# →‎ه‎→
+ 0xfbac: (0x006f,), #  ARABIC LETTER HEH DOACHASHMEE INITIAL FORM → LATIN SMALL LETTER O	# →‎ﻫ‎→→‎ه‎→
+ 0xfbad: (0x006f,), #  ARABIC LETTER HEH DOACHASHMEE MEDIAL FORM → LATIN SMALL LETTER O	# →‎ﻬ‎→→‎ه‎→
+ 0xfbab: (0x006f,), #  ARABIC LETTER HEH DOACHASHMEE FINAL FORM → LATIN SMALL LETTER O	# →‎ﻪ‎→→‎ه‎→
+ 0xfbaa: (0x006f,), #  ARABIC LETTER HEH DOACHASHMEE ISOLATED FORM → LATIN SMALL LETTER O	# →‎ه‎→
+ 0x06c1: (0x006f,), #  ARABIC LETTER HEH GOAL → LATIN SMALL LETTER O	# →‎ه‎→
+ 0xfba8: (0x006f,), #  ARABIC LETTER HEH GOAL INITIAL FORM → LATIN SMALL LETTER O	# →‎ہ‎→→‎ه‎→
+ 0xfba9: (0x006f,), #  ARABIC LETTER HEH GOAL MEDIAL FORM → LATIN SMALL LETTER O	# →‎ہ‎→→‎ه‎→
+ 0xfba7: (0x006f,), #  ARABIC LETTER HEH GOAL FINAL FORM → LATIN SMALL LETTER O	# →‎ہ‎→→‎ه‎→
+ 0xfba6: (0x006f,), #  ARABIC LETTER HEH GOAL ISOLATED FORM → LATIN SMALL LETTER O	# →‎ه‎→
+ 0x06d5: (0x006f,), #  ARABIC LETTER AE → LATIN SMALL LETTER O	# →‎ه‎→
+ 0x0d20: (0x006f,), #  MALAYALAM LETTER TTHA → LATIN SMALL LETTER O
+ 0x101d: (0x006f,), #  MYANMAR LETTER WA → LATIN SMALL LETTER O
+ 0x104ea: (0x006f,), #  OSAGE SMALL LETTER O → LATIN SMALL LETTER O
+ 0x118c8: (0x006f,), #  WARANG CITI SMALL LETTER E → LATIN SMALL LETTER O
+ 0x118d7: (0x006f,), #  WARANG CITI SMALL LETTER BU → LATIN SMALL LETTER O
+ 0x1042c: (0x006f,), #  DESERET SMALL LETTER LONG O → LATIN SMALL LETTER O
+ 0x0030: (0x004f,), #  DIGIT ZERO → LATIN CAPITAL LETTER O
+ 0x07c0: (0x004f,), #  NKO DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x09e6: (0x004f,), #  BENGALI DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x0b66: (0x004f,), #  ORIYA DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x3007: (0x004f,), #  IDEOGRAPHIC NUMBER ZERO → LATIN CAPITAL LETTER O
+ 0x114d0: (0x004f,), #  TIRHUTA DIGIT ZERO → LATIN CAPITAL LETTER O	# →০→→0→
+ 0x118e0: (0x004f,), #  WARANG CITI DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x1d7ce: (0x004f,), #  MATHEMATICAL BOLD DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x1d7d8: (0x004f,), #  MATHEMATICAL DOUBLE-STRUCK DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x1d7e2: (0x004f,), #  MATHEMATICAL SANS-SERIF DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x1d7ec: (0x004f,), #  MATHEMATICAL SANS-SERIF BOLD DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0x1d7f6: (0x004f,), #  MATHEMATICAL MONOSPACE DIGIT ZERO → LATIN CAPITAL LETTER O	# →0→
+ 0xff2f: (0x004f,), #  FULLWIDTH LATIN CAPITAL LETTER O → LATIN CAPITAL LETTER O	# →О→
+ 0x1d40e: (0x004f,), #  MATHEMATICAL BOLD CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d442: (0x004f,), #  MATHEMATICAL ITALIC CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d476: (0x004f,), #  MATHEMATICAL BOLD ITALIC CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d4aa: (0x004f,), #  MATHEMATICAL SCRIPT CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d4de: (0x004f,), #  MATHEMATICAL BOLD SCRIPT CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d512: (0x004f,), #  MATHEMATICAL FRAKTUR CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d546: (0x004f,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d57a: (0x004f,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d5ae: (0x004f,), #  MATHEMATICAL SANS-SERIF CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d5e2: (0x004f,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d616: (0x004f,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d64a: (0x004f,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL O → LATIN CAPITAL LETTER O
+ 0x1d67e: (0x004f,), #  MATHEMATICAL MONOSPACE CAPITAL O → LATIN CAPITAL LETTER O
+ 0x039f: (0x004f,), #  GREEK CAPITAL LETTER OMICRON → LATIN CAPITAL LETTER O
+ 0x1d6b6: (0x004f,), #  MATHEMATICAL BOLD CAPITAL OMICRON → LATIN CAPITAL LETTER O	# →𝐎→
+ 0x1d6f0: (0x004f,), #  MATHEMATICAL ITALIC CAPITAL OMICRON → LATIN CAPITAL LETTER O	# →𝑂→
+ 0x1d72a: (0x004f,), #  MATHEMATICAL BOLD ITALIC CAPITAL OMICRON → LATIN CAPITAL LETTER O	# →𝑶→
+ 0x1d764: (0x004f,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL OMICRON → LATIN CAPITAL LETTER O	# →Ο→
+ 0x1d79e: (0x004f,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL OMICRON → LATIN CAPITAL LETTER O	# →Ο→
+ 0x2c9e: (0x004f,), #  COPTIC CAPITAL LETTER O → LATIN CAPITAL LETTER O
+ 0x041e: (0x004f,), #  CYRILLIC CAPITAL LETTER O → LATIN CAPITAL LETTER O
+ 0x0555: (0x004f,), #  ARMENIAN CAPITAL LETTER OH → LATIN CAPITAL LETTER O
+ 0x2d54: (0x004f,), #  TIFINAGH LETTER YAR → LATIN CAPITAL LETTER O
+ 0x12d0: (0x004f,), #  ETHIOPIC SYLLABLE PHARYNGEAL A → LATIN CAPITAL LETTER O	# →Օ→
+ 0x0b20: (0x004f,), #  ORIYA LETTER TTHA → LATIN CAPITAL LETTER O	# →୦→→0→
+ 0x104c2: (0x004f,), #  OSAGE CAPITAL LETTER O → LATIN CAPITAL LETTER O
+ 0xa4f3: (0x004f,), #  LISU LETTER O → LATIN CAPITAL LETTER O
+ 0x118b5: (0x004f,), #  WARANG CITI CAPITAL LETTER AT → LATIN CAPITAL LETTER O
+ 0x10292: (0x004f,), #  LYCIAN LETTER U → LATIN CAPITAL LETTER O
+ 0x102ab: (0x004f,), #  CARIAN LETTER O → LATIN CAPITAL LETTER O
+ 0x10404: (0x004f,), #  DESERET CAPITAL LETTER LONG O → LATIN CAPITAL LETTER O
+ 0x10516: (0x004f,), #  ELBASAN LETTER O → LATIN CAPITAL LETTER O
+ 0x2070: (0x00ba,), #  SUPERSCRIPT ZERO → MASCULINE ORDINAL INDICATOR
+ 0x1d52: (0x00ba,), #  MODIFIER LETTER SMALL O → MASCULINE ORDINAL INDICATOR	# →⁰→
+ 0x01d2: (0x014f,), #  LATIN SMALL LETTER O WITH CARON → LATIN SMALL LETTER O WITH BREVE
+ 0x01d1: (0x014e,), #  LATIN CAPITAL LETTER O WITH CARON → LATIN CAPITAL LETTER O WITH BREVE
+ 0x06ff: (0x006f, 0x0302,), #  ARABIC LETTER HEH WITH INVERTED V → LATIN SMALL LETTER O, COMBINING CIRCUMFLEX ACCENT	# →‎ھٛ‎→
+ 0x0150: (0x00d6,), #  LATIN CAPITAL LETTER O WITH DOUBLE ACUTE → LATIN CAPITAL LETTER O WITH DIAERESIS
+ 0x00f8: (0x006f, 0x0338,), #  LATIN SMALL LETTER O WITH STROKE → LATIN SMALL LETTER O, COMBINING LONG SOLIDUS OVERLAY	# →o̷→
+ 0xab3e: (0x006f, 0x0338,), #  LATIN SMALL LETTER BLACKLETTER O WITH STROKE → LATIN SMALL LETTER O, COMBINING LONG SOLIDUS OVERLAY	# →ø→→o̷→
+ 0x00d8: (0x004f, 0x0338,), #  LATIN CAPITAL LETTER O WITH STROKE → LATIN CAPITAL LETTER O, COMBINING LONG SOLIDUS OVERLAY
+ 0x2d41: (0x004f, 0x0338,), #  TIFINAGH LETTER BERBER ACADEMY YAH → LATIN CAPITAL LETTER O, COMBINING LONG SOLIDUS OVERLAY	# →Ø→
+ 0x01fe: (0x004f, 0x0338, 0x0301,), #  LATIN CAPITAL LETTER O WITH STROKE AND ACUTE → LATIN CAPITAL LETTER O, COMBINING LONG SOLIDUS OVERLAY, COMBINING ACUTE ACCENT
+ 0x0275: (0x006f, 0x0335,), #  LATIN SMALL LETTER BARRED O → LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY
+ 0xa74b: (0x006f, 0x0335,), #  LATIN SMALL LETTER O WITH LONG STROKE OVERLAY → LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY	# →o̶→
+ 0x04e9: (0x006f, 0x0335,), #  CYRILLIC SMALL LETTER BARRED O → LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY	# →ѳ→
+ 0x0473: (0x006f, 0x0335,), #  CYRILLIC SMALL LETTER FITA → LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY
+ 0xab8e: (0x006f, 0x0335,), #  CHEROKEE SMALL LETTER NA → LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY	# →ɵ→
+ 0xabbb: (0x006f, 0x0335,), #  CHEROKEE SMALL LETTER WI → LATIN SMALL LETTER O, COMBINING SHORT STROKE OVERLAY	# →ѳ→
+ 0x2296: (0x004f, 0x0335,), #  CIRCLED MINUS → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x229d: (0x004f, 0x0335,), #  CIRCLED DASH → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →⊖→→θ→→Ꮎ→
+ 0x236c: (0x004f, 0x0335,), #  APL FUNCTIONAL SYMBOL ZILDE → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d21a: (0x004f, 0x0335,), #  GREEK VOCAL NOTATION SYMBOL-52 → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ꝋ→→O̶→
+ 0x1f714: (0x004f, 0x0335,), #  ALCHEMICAL SYMBOL FOR SALT → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ɵ→→O̶→
+ 0x019f: (0x004f, 0x0335,), #  LATIN CAPITAL LETTER O WITH MIDDLE TILDE → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →O̶→
+ 0xa74a: (0x004f, 0x0335,), #  LATIN CAPITAL LETTER O WITH LONG STROKE OVERLAY → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →O̶→
+ 0x03b8: (0x004f, 0x0335,), #  GREEK SMALL LETTER THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ꮎ→
+ 0x03d1: (0x004f, 0x0335,), #  GREEK THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d6c9: (0x004f, 0x0335,), #  MATHEMATICAL BOLD SMALL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d6dd: (0x004f, 0x0335,), #  MATHEMATICAL BOLD THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d703: (0x004f, 0x0335,), #  MATHEMATICAL ITALIC SMALL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d717: (0x004f, 0x0335,), #  MATHEMATICAL ITALIC THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d73d: (0x004f, 0x0335,), #  MATHEMATICAL BOLD ITALIC SMALL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d751: (0x004f, 0x0335,), #  MATHEMATICAL BOLD ITALIC THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d777: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD SMALL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d78b: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d7b1: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x1d7c5: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →θ→→Ꮎ→
+ 0x0398: (0x004f, 0x0335,), #  GREEK CAPITAL LETTER THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ꮎ→
+ 0x03f4: (0x004f, 0x0335,), #  GREEK CAPITAL THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ѳ→→О̵→
+ 0x1d6af: (0x004f, 0x0335,), #  MATHEMATICAL BOLD CAPITAL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d6b9: (0x004f, 0x0335,), #  MATHEMATICAL BOLD CAPITAL THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d6e9: (0x004f, 0x0335,), #  MATHEMATICAL ITALIC CAPITAL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d6f3: (0x004f, 0x0335,), #  MATHEMATICAL ITALIC CAPITAL THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d723: (0x004f, 0x0335,), #  MATHEMATICAL BOLD ITALIC CAPITAL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d72d: (0x004f, 0x0335,), #  MATHEMATICAL BOLD ITALIC CAPITAL THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d75d: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d767: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d797: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL THETA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x1d7a1: (0x004f, 0x0335,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL THETA SYMBOL → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Θ→→Ꮎ→
+ 0x04e8: (0x004f, 0x0335,), #  CYRILLIC CAPITAL LETTER BARRED O → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ѳ→→О̵→
+ 0x0472: (0x004f, 0x0335,), #  CYRILLIC CAPITAL LETTER FITA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →О̵→
+ 0x2d31: (0x004f, 0x0335,), #  TIFINAGH LETTER YAB → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ɵ→→O̶→
+ 0x13be: (0x004f, 0x0335,), #  CHEROKEE LETTER NA → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY
+ 0x13eb: (0x004f, 0x0335,), #  CHEROKEE LETTER WI → LATIN CAPITAL LETTER O, COMBINING SHORT STROKE OVERLAY	# →Ѳ→→О̵→
+ 0xab74: (0x006f, 0x031b,), #  CHEROKEE SMALL LETTER U → LATIN SMALL LETTER O, COMBINING HORN
+ 0xfcd9: (0x006f, 0x0670,), #  ARABIC LIGATURE HEH WITH SUPERSCRIPT ALEF INITIAL FORM → LATIN SMALL LETTER O, ARABIC LETTER SUPERSCRIPT ALEF	# →‎هٰ‎→
+ 0x1f101: (0x004f, 0x002c,), #  DIGIT ZERO COMMA → LATIN CAPITAL LETTER O, COMMA	# →0,→
+ 0x1f100: (0x004f, 0x002e,), #  DIGIT ZERO FULL STOP → LATIN CAPITAL LETTER O, FULL STOP	# →0.→
+ 0x01a1: (0x006f, 0x0027,), #  LATIN SMALL LETTER O WITH HORN → LATIN SMALL LETTER O, APOSTROPHE	# →oʼ→
+ 0x01a0: (0x004f, 0x0027,), #  LATIN CAPITAL LETTER O WITH HORN → LATIN CAPITAL LETTER O, APOSTROPHE	# →Oʼ→
+ 0x13a4: (0x004f, 0x0027,), #  CHEROKEE LETTER U → LATIN CAPITAL LETTER O, APOSTROPHE	# →Ơ→→Oʼ→
+ 0x0025: (0x00ba, 0x002f, 0x2080,), #  PERCENT SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO	# →⁰/₀→
+ 0x066a: (0x00ba, 0x002f, 0x2080,), #  ARABIC PERCENT SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO	# →%→→⁰/₀→
+ 0x2052: (0x00ba, 0x002f, 0x2080,), #  COMMERCIAL MINUS SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO	# →%→→⁰/₀→
+ 0x2030: (0x00ba, 0x002f, 0x2080, 0x2080,), #  PER MILLE SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO, SUBSCRIPT ZERO	# →⁰/₀₀→
+ 0x0609: (0x00ba, 0x002f, 0x2080, 0x2080,), #  ARABIC-INDIC PER MILLE SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO, SUBSCRIPT ZERO	# →‰→→⁰/₀₀→
+ 0x2031: (0x00ba, 0x002f, 0x2080, 0x2080, 0x2080,), #  PER TEN THOUSAND SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO, SUBSCRIPT ZERO, SUBSCRIPT ZERO	# →⁰/₀₀₀→
+ 0x060a: (0x00ba, 0x002f, 0x2080, 0x2080, 0x2080,), #  ARABIC-INDIC PER TEN THOUSAND SIGN → MASCULINE ORDINAL INDICATOR, SOLIDUS, SUBSCRIPT ZERO, SUBSCRIPT ZERO, SUBSCRIPT ZERO	# →‱→→⁰/₀₀₀→
+ 0x0153: (0x006f, 0x0065,), #  LATIN SMALL LIGATURE OE → LATIN SMALL LETTER O, LATIN SMALL LETTER E
+ 0x0152: (0x004f, 0x0045,), #  LATIN CAPITAL LIGATURE OE → LATIN CAPITAL LETTER O, LATIN CAPITAL LETTER E
+ 0x0276: (0x006f, 0x1d07,), #  LATIN LETTER SMALL CAPITAL OE → LATIN SMALL LETTER O, LATIN LETTER SMALL CAPITAL E
+ 0x221e: (0x006f, 0x006f,), #  INFINITY → LATIN SMALL LETTER O, LATIN SMALL LETTER O	# →ꝏ→
+ 0xa74f: (0x006f, 0x006f,), #  LATIN SMALL LETTER OO → LATIN SMALL LETTER O, LATIN SMALL LETTER O
+ 0xa699: (0x006f, 0x006f,), #  CYRILLIC SMALL LETTER DOUBLE O → LATIN SMALL LETTER O, LATIN SMALL LETTER O
+ 0xa74e: (0x004f, 0x004f,), #  LATIN CAPITAL LETTER OO → LATIN CAPITAL LETTER O, LATIN CAPITAL LETTER O
+ 0xa698: (0x004f, 0x004f,), #  CYRILLIC CAPITAL LETTER DOUBLE O → LATIN CAPITAL LETTER O, LATIN CAPITAL LETTER O
+ 0xfcd7: (0x006f, 0x062c,), #  ARABIC LIGATURE HEH WITH JEEM INITIAL FORM → LATIN SMALL LETTER O, ARABIC LETTER JEEM	# →‎هج‎→
+ 0xfc51: (0x006f, 0x062c,), #  ARABIC LIGATURE HEH WITH JEEM ISOLATED FORM → LATIN SMALL LETTER O, ARABIC LETTER JEEM	# →‎هج‎→
+ 0xfcd8: (0x006f, 0x0645,), #  ARABIC LIGATURE HEH WITH MEEM INITIAL FORM → LATIN SMALL LETTER O, ARABIC LETTER MEEM	# →‎هم‎→
+ 0xfc52: (0x006f, 0x0645,), #  ARABIC LIGATURE HEH WITH MEEM ISOLATED FORM → LATIN SMALL LETTER O, ARABIC LETTER MEEM	# →‎هم‎→
+ 0xfd93: (0x006f, 0x0645, 0x062c,), #  ARABIC LIGATURE HEH WITH MEEM WITH JEEM INITIAL FORM → LATIN SMALL LETTER O, ARABIC LETTER MEEM, ARABIC LETTER JEEM	# →‎همج‎→
+ 0xfd94: (0x006f, 0x0645, 0x0645,), #  ARABIC LIGATURE HEH WITH MEEM WITH MEEM INITIAL FORM → LATIN SMALL LETTER O, ARABIC LETTER MEEM, ARABIC LETTER MEEM	# →‎همم‎→
+ 0xfc53: (0x006f, 0x0649,), #  ARABIC LIGATURE HEH WITH ALEF MAKSURA ISOLATED FORM → LATIN SMALL LETTER O, ARABIC LETTER ALEF MAKSURA	# →‎هى‎→
+ 0xfc54: (0x006f, 0x0649,), #  ARABIC LIGATURE HEH WITH YEH ISOLATED FORM → LATIN SMALL LETTER O, ARABIC LETTER ALEF MAKSURA	# →‎هي‎→
+ 0x0d5f: (0x006f, 0x0d30, 0x006f,), #  MALAYALAM LETTER ARCHAIC II → LATIN SMALL LETTER O, MALAYALAM LETTER RA, LATIN SMALL LETTER O	# →ംരം→
+ 0x1010: (0x006f, 0x102c,), #  MYANMAR LETTER TA → LATIN SMALL LETTER O, MYANMAR VOWEL SIGN AA	# →ဝာ→
+ 0x3358: (0x004f, 0x70b9,), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR HOUR ZERO → LATIN CAPITAL LETTER O, CJK UNIFIED IDEOGRAPH-70B9	# →0点→
+ 0x2184: (0x0254,), #  LATIN SMALL LETTER REVERSED C → LATIN SMALL LETTER OPEN O
+ 0x1d10: (0x0254,), #  LATIN LETTER SMALL CAPITAL OPEN O → LATIN SMALL LETTER OPEN O
+ 0x037b: (0x0254,), #  GREEK SMALL REVERSED LUNATE SIGMA SYMBOL → LATIN SMALL LETTER OPEN O
+ 0x1044b: (0x0254,), #  DESERET SMALL LETTER EM → LATIN SMALL LETTER OPEN O
+ 0x2183: (0x0186,), #  ROMAN NUMERAL REVERSED ONE HUNDRED → LATIN CAPITAL LETTER OPEN O
+ 0x03fd: (0x0186,), #  GREEK CAPITAL REVERSED LUNATE SIGMA SYMBOL → LATIN CAPITAL LETTER OPEN O
+ 0xa4db: (0x0186,), #  LISU LETTER CHA → LATIN CAPITAL LETTER OPEN O
+ 0x10423: (0x0186,), #  DESERET CAPITAL LETTER EM → LATIN CAPITAL LETTER OPEN O
+ 0xab3f: (0x0254, 0x0338,), #  LATIN SMALL LETTER OPEN O WITH STROKE → LATIN SMALL LETTER OPEN O, COMBINING LONG SOLIDUS OVERLAY
+ 0xab62: (0x0254, 0x0065,), #  LATIN SMALL LETTER OPEN OE → LATIN SMALL LETTER OPEN O, LATIN SMALL LETTER E
+ 0x1043f: (0x0277,), #  DESERET SMALL LETTER KAY → LATIN SMALL LETTER CLOSED OMEGA
+ 0x2374: (0x0070,), #  APL FUNCTIONAL SYMBOL RHO → LATIN SMALL LETTER P	# →ρ→
+ 0xff50: (0x0070,), #  FULLWIDTH LATIN SMALL LETTER P → LATIN SMALL LETTER P	# →р→
+ 0x1d429: (0x0070,), #  MATHEMATICAL BOLD SMALL P → LATIN SMALL LETTER P
+ 0x1d45d: (0x0070,), #  MATHEMATICAL ITALIC SMALL P → LATIN SMALL LETTER P
+ 0x1d491: (0x0070,), #  MATHEMATICAL BOLD ITALIC SMALL P → LATIN SMALL LETTER P
+ 0x1d4c5: (0x0070,), #  MATHEMATICAL SCRIPT SMALL P → LATIN SMALL LETTER P
+ 0x1d4f9: (0x0070,), #  MATHEMATICAL BOLD SCRIPT SMALL P → LATIN SMALL LETTER P
+ 0x1d52d: (0x0070,), #  MATHEMATICAL FRAKTUR SMALL P → LATIN SMALL LETTER P
+ 0x1d561: (0x0070,), #  MATHEMATICAL DOUBLE-STRUCK SMALL P → LATIN SMALL LETTER P
+ 0x1d595: (0x0070,), #  MATHEMATICAL BOLD FRAKTUR SMALL P → LATIN SMALL LETTER P
+ 0x1d5c9: (0x0070,), #  MATHEMATICAL SANS-SERIF SMALL P → LATIN SMALL LETTER P
+ 0x1d5fd: (0x0070,), #  MATHEMATICAL SANS-SERIF BOLD SMALL P → LATIN SMALL LETTER P
+ 0x1d631: (0x0070,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL P → LATIN SMALL LETTER P
+ 0x1d665: (0x0070,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL P → LATIN SMALL LETTER P
+ 0x1d699: (0x0070,), #  MATHEMATICAL MONOSPACE SMALL P → LATIN SMALL LETTER P
+ 0x03c1: (0x0070,), #  GREEK SMALL LETTER RHO → LATIN SMALL LETTER P
+ 0x03f1: (0x0070,), #  GREEK RHO SYMBOL → LATIN SMALL LETTER P	# →ρ→
+ 0x1d6d2: (0x0070,), #  MATHEMATICAL BOLD SMALL RHO → LATIN SMALL LETTER P	# →ρ→
+ 0x1d6e0: (0x0070,), #  MATHEMATICAL BOLD RHO SYMBOL → LATIN SMALL LETTER P	# →ρ→
+ 0x1d70c: (0x0070,), #  MATHEMATICAL ITALIC SMALL RHO → LATIN SMALL LETTER P	# →ρ→
+ 0x1d71a: (0x0070,), #  MATHEMATICAL ITALIC RHO SYMBOL → LATIN SMALL LETTER P	# →ρ→
+ 0x1d746: (0x0070,), #  MATHEMATICAL BOLD ITALIC SMALL RHO → LATIN SMALL LETTER P	# →ρ→
+ 0x1d754: (0x0070,), #  MATHEMATICAL BOLD ITALIC RHO SYMBOL → LATIN SMALL LETTER P	# →ρ→
+ 0x1d780: (0x0070,), #  MATHEMATICAL SANS-SERIF BOLD SMALL RHO → LATIN SMALL LETTER P	# →ρ→
+ 0x1d78e: (0x0070,), #  MATHEMATICAL SANS-SERIF BOLD RHO SYMBOL → LATIN SMALL LETTER P	# →ρ→
+ 0x1d7ba: (0x0070,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL RHO → LATIN SMALL LETTER P	# →ρ→
+ 0x1d7c8: (0x0070,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC RHO SYMBOL → LATIN SMALL LETTER P	# →ρ→
+ 0x2ca3: (0x0070,), #  COPTIC SMALL LETTER RO → LATIN SMALL LETTER P	# →ρ→
+ 0x0440: (0x0070,), #  CYRILLIC SMALL LETTER ER → LATIN SMALL LETTER P
+ 0xff30: (0x0050,), #  FULLWIDTH LATIN CAPITAL LETTER P → LATIN CAPITAL LETTER P	# →Р→
+ 0x2119: (0x0050,), #  DOUBLE-STRUCK CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d40f: (0x0050,), #  MATHEMATICAL BOLD CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d443: (0x0050,), #  MATHEMATICAL ITALIC CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d477: (0x0050,), #  MATHEMATICAL BOLD ITALIC CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d4ab: (0x0050,), #  MATHEMATICAL SCRIPT CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d4df: (0x0050,), #  MATHEMATICAL BOLD SCRIPT CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d513: (0x0050,), #  MATHEMATICAL FRAKTUR CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d57b: (0x0050,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d5af: (0x0050,), #  MATHEMATICAL SANS-SERIF CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d5e3: (0x0050,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d617: (0x0050,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d64b: (0x0050,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL P → LATIN CAPITAL LETTER P
+ 0x1d67f: (0x0050,), #  MATHEMATICAL MONOSPACE CAPITAL P → LATIN CAPITAL LETTER P
+ 0x03a1: (0x0050,), #  GREEK CAPITAL LETTER RHO → LATIN CAPITAL LETTER P
+ 0x1d6b8: (0x0050,), #  MATHEMATICAL BOLD CAPITAL RHO → LATIN CAPITAL LETTER P	# →𝐏→
+ 0x1d6f2: (0x0050,), #  MATHEMATICAL ITALIC CAPITAL RHO → LATIN CAPITAL LETTER P	# →Ρ→
+ 0x1d72c: (0x0050,), #  MATHEMATICAL BOLD ITALIC CAPITAL RHO → LATIN CAPITAL LETTER P	# →Ρ→
+ 0x1d766: (0x0050,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL RHO → LATIN CAPITAL LETTER P	# →Ρ→
+ 0x1d7a0: (0x0050,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL RHO → LATIN CAPITAL LETTER P	# →Ρ→
+ 0x2ca2: (0x0050,), #  COPTIC CAPITAL LETTER RO → LATIN CAPITAL LETTER P
+ 0x0420: (0x0050,), #  CYRILLIC CAPITAL LETTER ER → LATIN CAPITAL LETTER P
+ 0x13e2: (0x0050,), #  CHEROKEE LETTER TLV → LATIN CAPITAL LETTER P
+ 0x146d: (0x0050,), #  CANADIAN SYLLABICS KI → LATIN CAPITAL LETTER P
+ 0xa4d1: (0x0050,), #  LISU LETTER PA → LATIN CAPITAL LETTER P
+ 0x10295: (0x0050,), #  LYCIAN LETTER R → LATIN CAPITAL LETTER P
+ 0x01a5: (0x0070, 0x0314,), #  LATIN SMALL LETTER P WITH HOOK → LATIN SMALL LETTER P, COMBINING REVERSED COMMA ABOVE
+ 0x1d7d: (0x0070, 0x0335,), #  LATIN SMALL LETTER P WITH STROKE → LATIN SMALL LETTER P, COMBINING SHORT STROKE OVERLAY
+ 0x1477: (0x0070, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWI → LATIN SMALL LETTER P, MIDDLE DOT	# →pᐧ→
+ 0x1486: (0x0050, 0x0027,), #  CANADIAN SYLLABICS SOUTH-SLAVEY KIH → LATIN CAPITAL LETTER P, APOSTROPHE	# →ᑭᑊ→
+ 0x1d29: (0x1d18,), #  GREEK LETTER SMALL CAPITAL RHO → LATIN LETTER SMALL CAPITAL P
+ 0xabb2: (0x1d18,), #  CHEROKEE SMALL LETTER TLV → LATIN LETTER SMALL CAPITAL P
+ 0x03c6: (0x0278,), #  GREEK SMALL LETTER PHI → LATIN SMALL LETTER PHI
+ 0x03d5: (0x0278,), #  GREEK PHI SYMBOL → LATIN SMALL LETTER PHI
+ 0x1d6d7: (0x0278,), #  MATHEMATICAL BOLD SMALL PHI → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d6df: (0x0278,), #  MATHEMATICAL BOLD PHI SYMBOL → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d711: (0x0278,), #  MATHEMATICAL ITALIC SMALL PHI → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d719: (0x0278,), #  MATHEMATICAL ITALIC PHI SYMBOL → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d74b: (0x0278,), #  MATHEMATICAL BOLD ITALIC SMALL PHI → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d753: (0x0278,), #  MATHEMATICAL BOLD ITALIC PHI SYMBOL → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d785: (0x0278,), #  MATHEMATICAL SANS-SERIF BOLD SMALL PHI → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d78d: (0x0278,), #  MATHEMATICAL SANS-SERIF BOLD PHI SYMBOL → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d7bf: (0x0278,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL PHI → LATIN SMALL LETTER PHI	# →φ→
+ 0x1d7c7: (0x0278,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC PHI SYMBOL → LATIN SMALL LETTER PHI	# →φ→
+ 0x2cab: (0x0278,), #  COPTIC SMALL LETTER FI → LATIN SMALL LETTER PHI	# →ϕ→
+ 0x0444: (0x0278,), #  CYRILLIC SMALL LETTER EF → LATIN SMALL LETTER PHI
+ 0x1d42a: (0x0071,), #  MATHEMATICAL BOLD SMALL Q → LATIN SMALL LETTER Q
+ 0x1d45e: (0x0071,), #  MATHEMATICAL ITALIC SMALL Q → LATIN SMALL LETTER Q
+ 0x1d492: (0x0071,), #  MATHEMATICAL BOLD ITALIC SMALL Q → LATIN SMALL LETTER Q
+ 0x1d4c6: (0x0071,), #  MATHEMATICAL SCRIPT SMALL Q → LATIN SMALL LETTER Q
+ 0x1d4fa: (0x0071,), #  MATHEMATICAL BOLD SCRIPT SMALL Q → LATIN SMALL LETTER Q
+ 0x1d52e: (0x0071,), #  MATHEMATICAL FRAKTUR SMALL Q → LATIN SMALL LETTER Q
+ 0x1d562: (0x0071,), #  MATHEMATICAL DOUBLE-STRUCK SMALL Q → LATIN SMALL LETTER Q
+ 0x1d596: (0x0071,), #  MATHEMATICAL BOLD FRAKTUR SMALL Q → LATIN SMALL LETTER Q
+ 0x1d5ca: (0x0071,), #  MATHEMATICAL SANS-SERIF SMALL Q → LATIN SMALL LETTER Q
+ 0x1d5fe: (0x0071,), #  MATHEMATICAL SANS-SERIF BOLD SMALL Q → LATIN SMALL LETTER Q
+ 0x1d632: (0x0071,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL Q → LATIN SMALL LETTER Q
+ 0x1d666: (0x0071,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL Q → LATIN SMALL LETTER Q
+ 0x1d69a: (0x0071,), #  MATHEMATICAL MONOSPACE SMALL Q → LATIN SMALL LETTER Q
+ 0x051b: (0x0071,), #  CYRILLIC SMALL LETTER QA → LATIN SMALL LETTER Q
+ 0x0563: (0x0071,), #  ARMENIAN SMALL LETTER GIM → LATIN SMALL LETTER Q
+ 0x0566: (0x0071,), #  ARMENIAN SMALL LETTER ZA → LATIN SMALL LETTER Q
+ 0x211a: (0x0051,), #  DOUBLE-STRUCK CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d410: (0x0051,), #  MATHEMATICAL BOLD CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d444: (0x0051,), #  MATHEMATICAL ITALIC CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d478: (0x0051,), #  MATHEMATICAL BOLD ITALIC CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d4ac: (0x0051,), #  MATHEMATICAL SCRIPT CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d4e0: (0x0051,), #  MATHEMATICAL BOLD SCRIPT CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d514: (0x0051,), #  MATHEMATICAL FRAKTUR CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d57c: (0x0051,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d5b0: (0x0051,), #  MATHEMATICAL SANS-SERIF CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d5e4: (0x0051,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d618: (0x0051,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d64c: (0x0051,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x1d680: (0x0051,), #  MATHEMATICAL MONOSPACE CAPITAL Q → LATIN CAPITAL LETTER Q
+ 0x2d55: (0x0051,), #  TIFINAGH LETTER YARR → LATIN CAPITAL LETTER Q
+ 0x02a0: (0x0071, 0x0314,), #  LATIN SMALL LETTER Q WITH HOOK → LATIN SMALL LETTER Q, COMBINING REVERSED COMMA ABOVE
+ 0x1f700: (0x0051, 0x0045,), #  ALCHEMICAL SYMBOL FOR QUINTESSENCE → LATIN CAPITAL LETTER Q, LATIN CAPITAL LETTER E
+ 0x1d90: (0x024b,), #  LATIN SMALL LETTER ALPHA WITH RETROFLEX HOOK → LATIN SMALL LETTER Q WITH HOOK TAIL
+ 0x1d0b: (0x0138,), #  LATIN LETTER SMALL CAPITAL K → LATIN SMALL LETTER KRA
+ 0x03ba: (0x0138,), #  GREEK SMALL LETTER KAPPA → LATIN SMALL LETTER KRA
+ 0x03f0: (0x0138,), #  GREEK KAPPA SYMBOL → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d6cb: (0x0138,), #  MATHEMATICAL BOLD SMALL KAPPA → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d6de: (0x0138,), #  MATHEMATICAL BOLD KAPPA SYMBOL → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d705: (0x0138,), #  MATHEMATICAL ITALIC SMALL KAPPA → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d718: (0x0138,), #  MATHEMATICAL ITALIC KAPPA SYMBOL → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d73f: (0x0138,), #  MATHEMATICAL BOLD ITALIC SMALL KAPPA → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d752: (0x0138,), #  MATHEMATICAL BOLD ITALIC KAPPA SYMBOL → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d779: (0x0138,), #  MATHEMATICAL SANS-SERIF BOLD SMALL KAPPA → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d78c: (0x0138,), #  MATHEMATICAL SANS-SERIF BOLD KAPPA SYMBOL → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d7b3: (0x0138,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL KAPPA → LATIN SMALL LETTER KRA	# →κ→
+ 0x1d7c6: (0x0138,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC KAPPA SYMBOL → LATIN SMALL LETTER KRA	# →κ→
+ 0x2c95: (0x0138,), #  COPTIC SMALL LETTER KAPA → LATIN SMALL LETTER KRA	# →κ→
+ 0x043a: (0x0138,), #  CYRILLIC SMALL LETTER KA → LATIN SMALL LETTER KRA
+ 0xabb6: (0x0138,), #  CHEROKEE SMALL LETTER TSO → LATIN SMALL LETTER KRA	# →ᴋ→
+ 0x049b: (0x0138, 0x0329,), #  CYRILLIC SMALL LETTER KA WITH DESCENDER → LATIN SMALL LETTER KRA, COMBINING VERTICAL LINE BELOW	# →к̩→
+ 0x049f: (0x0138, 0x0335,), #  CYRILLIC SMALL LETTER KA WITH STROKE → LATIN SMALL LETTER KRA, COMBINING SHORT STROKE OVERLAY	# →к̵→
+ 0x1d42b: (0x0072,), #  MATHEMATICAL BOLD SMALL R → LATIN SMALL LETTER R
+ 0x1d45f: (0x0072,), #  MATHEMATICAL ITALIC SMALL R → LATIN SMALL LETTER R
+ 0x1d493: (0x0072,), #  MATHEMATICAL BOLD ITALIC SMALL R → LATIN SMALL LETTER R
+ 0x1d4c7: (0x0072,), #  MATHEMATICAL SCRIPT SMALL R → LATIN SMALL LETTER R
+ 0x1d4fb: (0x0072,), #  MATHEMATICAL BOLD SCRIPT SMALL R → LATIN SMALL LETTER R
+ 0x1d52f: (0x0072,), #  MATHEMATICAL FRAKTUR SMALL R → LATIN SMALL LETTER R
+ 0x1d563: (0x0072,), #  MATHEMATICAL DOUBLE-STRUCK SMALL R → LATIN SMALL LETTER R
+ 0x1d597: (0x0072,), #  MATHEMATICAL BOLD FRAKTUR SMALL R → LATIN SMALL LETTER R
+ 0x1d5cb: (0x0072,), #  MATHEMATICAL SANS-SERIF SMALL R → LATIN SMALL LETTER R
+ 0x1d5ff: (0x0072,), #  MATHEMATICAL SANS-SERIF BOLD SMALL R → LATIN SMALL LETTER R
+ 0x1d633: (0x0072,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL R → LATIN SMALL LETTER R
+ 0x1d667: (0x0072,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL R → LATIN SMALL LETTER R
+ 0x1d69b: (0x0072,), #  MATHEMATICAL MONOSPACE SMALL R → LATIN SMALL LETTER R
+ 0xab47: (0x0072,), #  LATIN SMALL LETTER R WITHOUT HANDLE → LATIN SMALL LETTER R
+ 0xab48: (0x0072,), #  LATIN SMALL LETTER DOUBLE R → LATIN SMALL LETTER R
+ 0x1d26: (0x0072,), #  GREEK LETTER SMALL CAPITAL GAMMA → LATIN SMALL LETTER R	# →г→
+ 0x2c85: (0x0072,), #  COPTIC SMALL LETTER GAMMA → LATIN SMALL LETTER R	# →г→
+ 0x0433: (0x0072,), #  CYRILLIC SMALL LETTER GHE → LATIN SMALL LETTER R
+ 0xab81: (0x0072,), #  CHEROKEE SMALL LETTER HU → LATIN SMALL LETTER R	# →ᴦ→→г→
+ 0x1d216: (0x0052,), #  GREEK VOCAL NOTATION SYMBOL-23 → LATIN CAPITAL LETTER R
+ 0x211b: (0x0052,), #  SCRIPT CAPITAL R → LATIN CAPITAL LETTER R
+ 0x211c: (0x0052,), #  BLACK-LETTER CAPITAL R → LATIN CAPITAL LETTER R
+ 0x211d: (0x0052,), #  DOUBLE-STRUCK CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d411: (0x0052,), #  MATHEMATICAL BOLD CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d445: (0x0052,), #  MATHEMATICAL ITALIC CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d479: (0x0052,), #  MATHEMATICAL BOLD ITALIC CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d4e1: (0x0052,), #  MATHEMATICAL BOLD SCRIPT CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d57d: (0x0052,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d5b1: (0x0052,), #  MATHEMATICAL SANS-SERIF CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d5e5: (0x0052,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d619: (0x0052,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d64d: (0x0052,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL R → LATIN CAPITAL LETTER R
+ 0x1d681: (0x0052,), #  MATHEMATICAL MONOSPACE CAPITAL R → LATIN CAPITAL LETTER R
+ 0x01a6: (0x0052,), #  LATIN LETTER YR → LATIN CAPITAL LETTER R
+ 0x13a1: (0x0052,), #  CHEROKEE LETTER E → LATIN CAPITAL LETTER R
+ 0x13d2: (0x0052,), #  CHEROKEE LETTER SV → LATIN CAPITAL LETTER R
+ 0x104b4: (0x0052,), #  OSAGE CAPITAL LETTER BRA → LATIN CAPITAL LETTER R	# →Ʀ→
+ 0x1587: (0x0052,), #  CANADIAN SYLLABICS TLHI → LATIN CAPITAL LETTER R
+ 0xa4e3: (0x0052,), #  LISU LETTER ZHA → LATIN CAPITAL LETTER R
+ 0x16f35: (0x0052,), #  MIAO LETTER ZHA → LATIN CAPITAL LETTER R
+ 0x027d: (0x0072, 0x0328,), #  LATIN SMALL LETTER R WITH TAIL → LATIN SMALL LETTER R, COMBINING OGONEK
+ 0x027c: (0x0072, 0x0329,), #  LATIN SMALL LETTER R WITH LONG LEG → LATIN SMALL LETTER R, COMBINING VERTICAL LINE BELOW
+ 0x024d: (0x0072, 0x0335,), #  LATIN SMALL LETTER R WITH STROKE → LATIN SMALL LETTER R, COMBINING SHORT STROKE OVERLAY
+ 0x0493: (0x0072, 0x0335,), #  CYRILLIC SMALL LETTER GHE WITH STROKE → LATIN SMALL LETTER R, COMBINING SHORT STROKE OVERLAY	# →г̵→
+ 0x1d72: (0x0072, 0x0334,), #  LATIN SMALL LETTER R WITH MIDDLE TILDE → LATIN SMALL LETTER R, COMBINING TILDE OVERLAY
+ 0x0491: (0x0072, 0x0027,), #  CYRILLIC SMALL LETTER GHE WITH UPTURN → LATIN SMALL LETTER R, APOSTROPHE	# →гˈ→
+ 0x118e3: (0x0072, 0x006e,), #  WARANG CITI DIGIT THREE → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x006d: (0x0072, 0x006e,), #  LATIN SMALL LETTER M → LATIN SMALL LETTER R, LATIN SMALL LETTER N
+ 0x217f: (0x0072, 0x006e,), #  SMALL ROMAN NUMERAL ONE THOUSAND → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d426: (0x0072, 0x006e,), #  MATHEMATICAL BOLD SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d45a: (0x0072, 0x006e,), #  MATHEMATICAL ITALIC SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d48e: (0x0072, 0x006e,), #  MATHEMATICAL BOLD ITALIC SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d4c2: (0x0072, 0x006e,), #  MATHEMATICAL SCRIPT SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d4f6: (0x0072, 0x006e,), #  MATHEMATICAL BOLD SCRIPT SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d52a: (0x0072, 0x006e,), #  MATHEMATICAL FRAKTUR SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d55e: (0x0072, 0x006e,), #  MATHEMATICAL DOUBLE-STRUCK SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d592: (0x0072, 0x006e,), #  MATHEMATICAL BOLD FRAKTUR SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d5c6: (0x0072, 0x006e,), #  MATHEMATICAL SANS-SERIF SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d5fa: (0x0072, 0x006e,), #  MATHEMATICAL SANS-SERIF BOLD SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d62e: (0x0072, 0x006e,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d662: (0x0072, 0x006e,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x1d696: (0x0072, 0x006e,), #  MATHEMATICAL MONOSPACE SMALL M → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x11700: (0x0072, 0x006e,), #  AHOM LETTER KA → LATIN SMALL LETTER R, LATIN SMALL LETTER N	# →m→
+ 0x20a5: (0x0072, 0x006e, 0x0338,), #  MILL SIGN → LATIN SMALL LETTER R, LATIN SMALL LETTER N, COMBINING LONG SOLIDUS OVERLAY	# →m̷→
+ 0x0271: (0x0072, 0x006e, 0x0326,), #  LATIN SMALL LETTER M WITH HOOK → LATIN SMALL LETTER R, LATIN SMALL LETTER N, COMBINING COMMA BELOW	# →m̡→
+ 0x1d6f: (0x0072, 0x006e, 0x0334,), #  LATIN SMALL LETTER M WITH MIDDLE TILDE → LATIN SMALL LETTER R, LATIN SMALL LETTER N, COMBINING TILDE OVERLAY	# →m̴→
+ 0x20a8: (0x0052, 0x0073,), #  RUPEE SIGN → LATIN CAPITAL LETTER R, LATIN SMALL LETTER S
+ 0xab71: (0x0280,), #  CHEROKEE SMALL LETTER E → LATIN LETTER SMALL CAPITAL R
+ 0xaba2: (0x0280,), #  CHEROKEE SMALL LETTER SV → LATIN LETTER SMALL CAPITAL R
+ 0x044f: (0x1d19,), #  CYRILLIC SMALL LETTER YA → LATIN LETTER SMALL CAPITAL REVERSED R
+ 0x1d73: (0x027e, 0x0334,), #  LATIN SMALL LETTER R WITH FISHHOOK AND MIDDLE TILDE → LATIN SMALL LETTER R WITH FISHHOOK, COMBINING TILDE OVERLAY
+ 0x2129: (0x027f,), #  TURNED GREEK SMALL LETTER IOTA → LATIN SMALL LETTER REVERSED R WITH FISHHOOK
+ 0xff53: (0x0073,), #  FULLWIDTH LATIN SMALL LETTER S → LATIN SMALL LETTER S	# →ѕ→
+ 0x1d42c: (0x0073,), #  MATHEMATICAL BOLD SMALL S → LATIN SMALL LETTER S
+ 0x1d460: (0x0073,), #  MATHEMATICAL ITALIC SMALL S → LATIN SMALL LETTER S
+ 0x1d494: (0x0073,), #  MATHEMATICAL BOLD ITALIC SMALL S → LATIN SMALL LETTER S
+ 0x1d4c8: (0x0073,), #  MATHEMATICAL SCRIPT SMALL S → LATIN SMALL LETTER S
+ 0x1d4fc: (0x0073,), #  MATHEMATICAL BOLD SCRIPT SMALL S → LATIN SMALL LETTER S
+ 0x1d530: (0x0073,), #  MATHEMATICAL FRAKTUR SMALL S → LATIN SMALL LETTER S
+ 0x1d564: (0x0073,), #  MATHEMATICAL DOUBLE-STRUCK SMALL S → LATIN SMALL LETTER S
+ 0x1d598: (0x0073,), #  MATHEMATICAL BOLD FRAKTUR SMALL S → LATIN SMALL LETTER S
+ 0x1d5cc: (0x0073,), #  MATHEMATICAL SANS-SERIF SMALL S → LATIN SMALL LETTER S
+ 0x1d600: (0x0073,), #  MATHEMATICAL SANS-SERIF BOLD SMALL S → LATIN SMALL LETTER S
+ 0x1d634: (0x0073,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL S → LATIN SMALL LETTER S
+ 0x1d668: (0x0073,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL S → LATIN SMALL LETTER S
+ 0x1d69c: (0x0073,), #  MATHEMATICAL MONOSPACE SMALL S → LATIN SMALL LETTER S
+ 0xa731: (0x0073,), #  LATIN LETTER SMALL CAPITAL S → LATIN SMALL LETTER S
+ 0x01bd: (0x0073,), #  LATIN SMALL LETTER TONE FIVE → LATIN SMALL LETTER S
+ 0x0455: (0x0073,), #  CYRILLIC SMALL LETTER DZE → LATIN SMALL LETTER S
+ 0xabaa: (0x0073,), #  CHEROKEE SMALL LETTER DU → LATIN SMALL LETTER S	# →ꜱ→
+ 0x118c1: (0x0073,), #  WARANG CITI SMALL LETTER A → LATIN SMALL LETTER S
+ 0x10448: (0x0073,), #  DESERET SMALL LETTER ZHEE → LATIN SMALL LETTER S
+ 0xff33: (0x0053,), #  FULLWIDTH LATIN CAPITAL LETTER S → LATIN CAPITAL LETTER S	# →Ѕ→
+ 0x1d412: (0x0053,), #  MATHEMATICAL BOLD CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d446: (0x0053,), #  MATHEMATICAL ITALIC CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d47a: (0x0053,), #  MATHEMATICAL BOLD ITALIC CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d4ae: (0x0053,), #  MATHEMATICAL SCRIPT CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d4e2: (0x0053,), #  MATHEMATICAL BOLD SCRIPT CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d516: (0x0053,), #  MATHEMATICAL FRAKTUR CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d54a: (0x0053,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d57e: (0x0053,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d5b2: (0x0053,), #  MATHEMATICAL SANS-SERIF CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d5e6: (0x0053,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d61a: (0x0053,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d64e: (0x0053,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL S → LATIN CAPITAL LETTER S
+ 0x1d682: (0x0053,), #  MATHEMATICAL MONOSPACE CAPITAL S → LATIN CAPITAL LETTER S
+ 0x0405: (0x0053,), #  CYRILLIC CAPITAL LETTER DZE → LATIN CAPITAL LETTER S
+ 0x054f: (0x0053,), #  ARMENIAN CAPITAL LETTER TIWN → LATIN CAPITAL LETTER S
+ 0x13d5: (0x0053,), #  CHEROKEE LETTER DE → LATIN CAPITAL LETTER S
+ 0x13da: (0x0053,), #  CHEROKEE LETTER DU → LATIN CAPITAL LETTER S
+ 0xa4e2: (0x0053,), #  LISU LETTER SA → LATIN CAPITAL LETTER S
+ 0x16f3a: (0x0053,), #  MIAO LETTER SA → LATIN CAPITAL LETTER S
+ 0x10296: (0x0053,), #  LYCIAN LETTER S → LATIN CAPITAL LETTER S
+ 0x10420: (0x0053,), #  DESERET CAPITAL LETTER ZHEE → LATIN CAPITAL LETTER S
+ 0x0282: (0x0073, 0x0328,), #  LATIN SMALL LETTER S WITH HOOK → LATIN SMALL LETTER S, COMBINING OGONEK
+ 0x1d74: (0x0073, 0x0334,), #  LATIN SMALL LETTER S WITH MIDDLE TILDE → LATIN SMALL LETTER S, COMBINING TILDE OVERLAY
+ 0xa7b5: (0x00df,), #  LATIN SMALL LETTER BETA → LATIN SMALL LETTER SHARP S	# →β→
+ 0x03b2: (0x00df,), #  GREEK SMALL LETTER BETA → LATIN SMALL LETTER SHARP S
+ 0x03d0: (0x00df,), #  GREEK BETA SYMBOL → LATIN SMALL LETTER SHARP S	# →β→
+ 0x1d6c3: (0x00df,), #  MATHEMATICAL BOLD SMALL BETA → LATIN SMALL LETTER SHARP S	# →β→
+ 0x1d6fd: (0x00df,), #  MATHEMATICAL ITALIC SMALL BETA → LATIN SMALL LETTER SHARP S	# →β→
+ 0x1d737: (0x00df,), #  MATHEMATICAL BOLD ITALIC SMALL BETA → LATIN SMALL LETTER SHARP S	# →β→
+ 0x1d771: (0x00df,), #  MATHEMATICAL SANS-SERIF BOLD SMALL BETA → LATIN SMALL LETTER SHARP S	# →β→
+ 0x1d7ab: (0x00df,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL BETA → LATIN SMALL LETTER SHARP S	# →β→
+ 0x13f0: (0x00df,), #  CHEROKEE LETTER YE → LATIN SMALL LETTER SHARP S	# →β→
+ 0x1f75c: (0x0073, 0x0073, 0x0073,), #  ALCHEMICAL SYMBOL FOR STRATUM SUPER STRATUM → LATIN SMALL LETTER S, LATIN SMALL LETTER S, LATIN SMALL LETTER S
+ 0xfb06: (0x0073, 0x0074,), #  LATIN SMALL LIGATURE ST → LATIN SMALL LETTER S, LATIN SMALL LETTER T
+ 0x222b: (0x0283,), #  INTEGRAL → LATIN SMALL LETTER ESH
+ 0xab4d: (0x0283,), #  LATIN SMALL LETTER BASELINE ESH → LATIN SMALL LETTER ESH
+ 0x2211: (0x01a9,), #  N-ARY SUMMATION → LATIN CAPITAL LETTER ESH
+ 0x2140: (0x01a9,), #  DOUBLE-STRUCK N-ARY SUMMATION → LATIN CAPITAL LETTER ESH	# →∑→
+ 0x03a3: (0x01a9,), #  GREEK CAPITAL LETTER SIGMA → LATIN CAPITAL LETTER ESH
+ 0x1d6ba: (0x01a9,), #  MATHEMATICAL BOLD CAPITAL SIGMA → LATIN CAPITAL LETTER ESH	# →Σ→
+ 0x1d6f4: (0x01a9,), #  MATHEMATICAL ITALIC CAPITAL SIGMA → LATIN CAPITAL LETTER ESH	# →Σ→
+ 0x1d72e: (0x01a9,), #  MATHEMATICAL BOLD ITALIC CAPITAL SIGMA → LATIN CAPITAL LETTER ESH	# →Σ→
+ 0x1d768: (0x01a9,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL SIGMA → LATIN CAPITAL LETTER ESH	# →Σ→
+ 0x1d7a2: (0x01a9,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL SIGMA → LATIN CAPITAL LETTER ESH	# →Σ→
+ 0x2d49: (0x01a9,), #  TIFINAGH LETTER YI → LATIN CAPITAL LETTER ESH
+ 0x222c: (0x0283, 0x0283,), #  DOUBLE INTEGRAL → LATIN SMALL LETTER ESH, LATIN SMALL LETTER ESH	# →∫∫→
+ 0x222d: (0x0283, 0x0283, 0x0283,), #  TRIPLE INTEGRAL → LATIN SMALL LETTER ESH, LATIN SMALL LETTER ESH, LATIN SMALL LETTER ESH	# →∫∫∫→
+ 0x2a0c: (0x0283, 0x0283, 0x0283, 0x0283,), #  QUADRUPLE INTEGRAL OPERATOR → LATIN SMALL LETTER ESH, LATIN SMALL LETTER ESH, LATIN SMALL LETTER ESH, LATIN SMALL LETTER ESH	# →∫∫∫∫→
+ 0x1d42d: (0x0074,), #  MATHEMATICAL BOLD SMALL T → LATIN SMALL LETTER T
+ 0x1d461: (0x0074,), #  MATHEMATICAL ITALIC SMALL T → LATIN SMALL LETTER T
+ 0x1d495: (0x0074,), #  MATHEMATICAL BOLD ITALIC SMALL T → LATIN SMALL LETTER T
+ 0x1d4c9: (0x0074,), #  MATHEMATICAL SCRIPT SMALL T → LATIN SMALL LETTER T
+ 0x1d4fd: (0x0074,), #  MATHEMATICAL BOLD SCRIPT SMALL T → LATIN SMALL LETTER T
+ 0x1d531: (0x0074,), #  MATHEMATICAL FRAKTUR SMALL T → LATIN SMALL LETTER T
+ 0x1d565: (0x0074,), #  MATHEMATICAL DOUBLE-STRUCK SMALL T → LATIN SMALL LETTER T
+ 0x1d599: (0x0074,), #  MATHEMATICAL BOLD FRAKTUR SMALL T → LATIN SMALL LETTER T
+ 0x1d5cd: (0x0074,), #  MATHEMATICAL SANS-SERIF SMALL T → LATIN SMALL LETTER T
+ 0x1d601: (0x0074,), #  MATHEMATICAL SANS-SERIF BOLD SMALL T → LATIN SMALL LETTER T
+ 0x1d635: (0x0074,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL T → LATIN SMALL LETTER T
+ 0x1d669: (0x0074,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL T → LATIN SMALL LETTER T
+ 0x1d69d: (0x0074,), #  MATHEMATICAL MONOSPACE SMALL T → LATIN SMALL LETTER T
+ 0x22a4: (0x0054,), #  DOWN TACK → LATIN CAPITAL LETTER T
+ 0x27d9: (0x0054,), #  LARGE DOWN TACK → LATIN CAPITAL LETTER T
+ 0x1f768: (0x0054,), #  ALCHEMICAL SYMBOL FOR CRUCIBLE-4 → LATIN CAPITAL LETTER T
+ 0xff34: (0x0054,), #  FULLWIDTH LATIN CAPITAL LETTER T → LATIN CAPITAL LETTER T	# →Т→
+ 0x1d413: (0x0054,), #  MATHEMATICAL BOLD CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d447: (0x0054,), #  MATHEMATICAL ITALIC CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d47b: (0x0054,), #  MATHEMATICAL BOLD ITALIC CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d4af: (0x0054,), #  MATHEMATICAL SCRIPT CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d4e3: (0x0054,), #  MATHEMATICAL BOLD SCRIPT CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d517: (0x0054,), #  MATHEMATICAL FRAKTUR CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d54b: (0x0054,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d57f: (0x0054,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d5b3: (0x0054,), #  MATHEMATICAL SANS-SERIF CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d5e7: (0x0054,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d61b: (0x0054,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d64f: (0x0054,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL T → LATIN CAPITAL LETTER T
+ 0x1d683: (0x0054,), #  MATHEMATICAL MONOSPACE CAPITAL T → LATIN CAPITAL LETTER T
+ 0x03a4: (0x0054,), #  GREEK CAPITAL LETTER TAU → LATIN CAPITAL LETTER T
+ 0x1d6bb: (0x0054,), #  MATHEMATICAL BOLD CAPITAL TAU → LATIN CAPITAL LETTER T	# →Τ→
+ 0x1d6f5: (0x0054,), #  MATHEMATICAL ITALIC CAPITAL TAU → LATIN CAPITAL LETTER T	# →Τ→
+ 0x1d72f: (0x0054,), #  MATHEMATICAL BOLD ITALIC CAPITAL TAU → LATIN CAPITAL LETTER T	# →Τ→
+ 0x1d769: (0x0054,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL TAU → LATIN CAPITAL LETTER T	# →Τ→
+ 0x1d7a3: (0x0054,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL TAU → LATIN CAPITAL LETTER T	# →Τ→
+ 0x2ca6: (0x0054,), #  COPTIC CAPITAL LETTER TAU → LATIN CAPITAL LETTER T
+ 0x0422: (0x0054,), #  CYRILLIC CAPITAL LETTER TE → LATIN CAPITAL LETTER T
+ 0x13a2: (0x0054,), #  CHEROKEE LETTER I → LATIN CAPITAL LETTER T
+ 0xa4d4: (0x0054,), #  LISU LETTER TA → LATIN CAPITAL LETTER T
+ 0x16f0a: (0x0054,), #  MIAO LETTER TA → LATIN CAPITAL LETTER T
+ 0x118bc: (0x0054,), #  WARANG CITI CAPITAL LETTER HAR → LATIN CAPITAL LETTER T
+ 0x10297: (0x0054,), #  LYCIAN LETTER T → LATIN CAPITAL LETTER T
+ 0x102b1: (0x0054,), #  CARIAN LETTER C-18 → LATIN CAPITAL LETTER T
+ 0x10315: (0x0054,), #  OLD ITALIC LETTER TE → LATIN CAPITAL LETTER T
+ 0x01ad: (0x0074, 0x0314,), #  LATIN SMALL LETTER T WITH HOOK → LATIN SMALL LETTER T, COMBINING REVERSED COMMA ABOVE
+ 0x2361: (0x0054, 0x0308,), #  APL FUNCTIONAL SYMBOL UP TACK DIAERESIS → LATIN CAPITAL LETTER T, COMBINING DIAERESIS	# →⊤̈→
+ 0x023e: (0x0054, 0x0338,), #  LATIN CAPITAL LETTER T WITH DIAGONAL STROKE → LATIN CAPITAL LETTER T, COMBINING LONG SOLIDUS OVERLAY
+ 0x021a: (0x0162,), #  LATIN CAPITAL LETTER T WITH COMMA BELOW → LATIN CAPITAL LETTER T WITH CEDILLA
+ 0x01ae: (0x0054, 0x0328,), #  LATIN CAPITAL LETTER T WITH RETROFLEX HOOK → LATIN CAPITAL LETTER T, COMBINING OGONEK
+ 0x04ac: (0x0054, 0x0329,), #  CYRILLIC CAPITAL LETTER TE WITH DESCENDER → LATIN CAPITAL LETTER T, COMBINING VERTICAL LINE BELOW	# →Т̩→
+ 0x20ae: (0x0054, 0x20eb,), #  TUGRIK SIGN → LATIN CAPITAL LETTER T, COMBINING LONG DOUBLE SOLIDUS OVERLAY	# →Т⃫→
+ 0x0167: (0x0074, 0x0335,), #  LATIN SMALL LETTER T WITH STROKE → LATIN SMALL LETTER T, COMBINING SHORT STROKE OVERLAY
+ 0x0166: (0x0054, 0x0335,), #  LATIN CAPITAL LETTER T WITH STROKE → LATIN CAPITAL LETTER T, COMBINING SHORT STROKE OVERLAY
+ 0x1d75: (0x0074, 0x0334,), #  LATIN SMALL LETTER T WITH MIDDLE TILDE → LATIN SMALL LETTER T, COMBINING TILDE OVERLAY
+ 0x10a0: (0xa786,), #  GEORGIAN CAPITAL LETTER AN → LATIN CAPITAL LETTER INSULAR T
+ 0xa728: (0x0054, 0x0033,), #  LATIN CAPITAL LETTER TZ → LATIN CAPITAL LETTER T, DIGIT THREE	# →TƷ→
+ 0x02a8: (0x0074, 0x0255,), #  LATIN SMALL LETTER TC DIGRAPH WITH CURL → LATIN SMALL LETTER T, LATIN SMALL LETTER C WITH CURL
+ 0x2121: (0x0054, 0x0045, 0x004c,), #  TELEPHONE SIGN → LATIN CAPITAL LETTER T, LATIN CAPITAL LETTER E, LATIN CAPITAL LETTER L
+ 0xa777: (0x0074, 0x0066,), #  LATIN SMALL LETTER TUM → LATIN SMALL LETTER T, LATIN SMALL LETTER F
+ 0x02a6: (0x0074, 0x0073,), #  LATIN SMALL LETTER TS DIGRAPH → LATIN SMALL LETTER T, LATIN SMALL LETTER S
+ 0x02a7: (0x0074, 0x0283,), #  LATIN SMALL LETTER TESH DIGRAPH → LATIN SMALL LETTER T, LATIN SMALL LETTER ESH
+ 0xa729: (0x0074, 0x021d,), #  LATIN SMALL LETTER TZ → LATIN SMALL LETTER T, LATIN SMALL LETTER YOGH
+ 0x03c4: (0x1d1b,), #  GREEK SMALL LETTER TAU → LATIN LETTER SMALL CAPITAL T
+ 0x1d6d5: (0x1d1b,), #  MATHEMATICAL BOLD SMALL TAU → LATIN LETTER SMALL CAPITAL T
+ 0x1d70f: (0x1d1b,), #  MATHEMATICAL ITALIC SMALL TAU → LATIN LETTER SMALL CAPITAL T
+ 0x1d749: (0x1d1b,), #  MATHEMATICAL BOLD ITALIC SMALL TAU → LATIN LETTER SMALL CAPITAL T
+ 0x1d783: (0x1d1b,), #  MATHEMATICAL SANS-SERIF BOLD SMALL TAU → LATIN LETTER SMALL CAPITAL T
+ 0x1d7bd: (0x1d1b,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL TAU → LATIN LETTER SMALL CAPITAL T
+ 0x0442: (0x1d1b,), #  CYRILLIC SMALL LETTER TE → LATIN LETTER SMALL CAPITAL T
+ 0xab72: (0x1d1b,), #  CHEROKEE SMALL LETTER I → LATIN LETTER SMALL CAPITAL T
+ 0x04ad: (0x1d1b, 0x0329,), #  CYRILLIC SMALL LETTER TE WITH DESCENDER → LATIN LETTER SMALL CAPITAL T, COMBINING VERTICAL LINE BELOW	# →т̩→
+ 0x0163: (0x01ab,), #  LATIN SMALL LETTER T WITH CEDILLA → LATIN SMALL LETTER T WITH PALATAL HOOK
+ 0x021b: (0x01ab,), #  LATIN SMALL LETTER T WITH COMMA BELOW → LATIN SMALL LETTER T WITH PALATAL HOOK	# →ţ→
+ 0x13bf: (0x01ab,), #  CHEROKEE LETTER HNA → LATIN SMALL LETTER T WITH PALATAL HOOK
+ 0x1d42e: (0x0075,), #  MATHEMATICAL BOLD SMALL U → LATIN SMALL LETTER U
+ 0x1d462: (0x0075,), #  MATHEMATICAL ITALIC SMALL U → LATIN SMALL LETTER U
+ 0x1d496: (0x0075,), #  MATHEMATICAL BOLD ITALIC SMALL U → LATIN SMALL LETTER U
+ 0x1d4ca: (0x0075,), #  MATHEMATICAL SCRIPT SMALL U → LATIN SMALL LETTER U
+ 0x1d4fe: (0x0075,), #  MATHEMATICAL BOLD SCRIPT SMALL U → LATIN SMALL LETTER U
+ 0x1d532: (0x0075,), #  MATHEMATICAL FRAKTUR SMALL U → LATIN SMALL LETTER U
+ 0x1d566: (0x0075,), #  MATHEMATICAL DOUBLE-STRUCK SMALL U → LATIN SMALL LETTER U
+ 0x1d59a: (0x0075,), #  MATHEMATICAL BOLD FRAKTUR SMALL U → LATIN SMALL LETTER U
+ 0x1d5ce: (0x0075,), #  MATHEMATICAL SANS-SERIF SMALL U → LATIN SMALL LETTER U
+ 0x1d602: (0x0075,), #  MATHEMATICAL SANS-SERIF BOLD SMALL U → LATIN SMALL LETTER U
+ 0x1d636: (0x0075,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL U → LATIN SMALL LETTER U
+ 0x1d66a: (0x0075,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL U → LATIN SMALL LETTER U
+ 0x1d69e: (0x0075,), #  MATHEMATICAL MONOSPACE SMALL U → LATIN SMALL LETTER U
+ 0xa79f: (0x0075,), #  LATIN SMALL LETTER VOLAPUK UE → LATIN SMALL LETTER U
+ 0x1d1c: (0x0075,), #  LATIN LETTER SMALL CAPITAL U → LATIN SMALL LETTER U
+ 0xab4e: (0x0075,), #  LATIN SMALL LETTER U WITH SHORT RIGHT LEG → LATIN SMALL LETTER U
+ 0xab52: (0x0075,), #  LATIN SMALL LETTER U WITH LEFT HOOK → LATIN SMALL LETTER U
+ 0x028b: (0x0075,), #  LATIN SMALL LETTER V WITH HOOK → LATIN SMALL LETTER U
+ 0x03c5: (0x0075,), #  GREEK SMALL LETTER UPSILON → LATIN SMALL LETTER U	# →ʋ→
+ 0x1d6d6: (0x0075,), #  MATHEMATICAL BOLD SMALL UPSILON → LATIN SMALL LETTER U	# →υ→→ʋ→
+ 0x1d710: (0x0075,), #  MATHEMATICAL ITALIC SMALL UPSILON → LATIN SMALL LETTER U	# →υ→→ʋ→
+ 0x1d74a: (0x0075,), #  MATHEMATICAL BOLD ITALIC SMALL UPSILON → LATIN SMALL LETTER U	# →υ→→ʋ→
+ 0x1d784: (0x0075,), #  MATHEMATICAL SANS-SERIF BOLD SMALL UPSILON → LATIN SMALL LETTER U	# →υ→→ʋ→
+ 0x1d7be: (0x0075,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL UPSILON → LATIN SMALL LETTER U	# →υ→→ʋ→
+ 0x057d: (0x0075,), #  ARMENIAN SMALL LETTER SEH → LATIN SMALL LETTER U
+ 0x104f6: (0x0075,), #  OSAGE SMALL LETTER U → LATIN SMALL LETTER U	# →ᴜ→
+ 0x118d8: (0x0075,), #  WARANG CITI SMALL LETTER PU → LATIN SMALL LETTER U	# →υ→→ʋ→
+ 0x222a: (0x0055,), #  UNION → LATIN CAPITAL LETTER U	# →ᑌ→
+ 0x22c3: (0x0055,), #  N-ARY UNION → LATIN CAPITAL LETTER U	# →∪→→ᑌ→
+ 0x1d414: (0x0055,), #  MATHEMATICAL BOLD CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d448: (0x0055,), #  MATHEMATICAL ITALIC CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d47c: (0x0055,), #  MATHEMATICAL BOLD ITALIC CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d4b0: (0x0055,), #  MATHEMATICAL SCRIPT CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d4e4: (0x0055,), #  MATHEMATICAL BOLD SCRIPT CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d518: (0x0055,), #  MATHEMATICAL FRAKTUR CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d54c: (0x0055,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d580: (0x0055,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d5b4: (0x0055,), #  MATHEMATICAL SANS-SERIF CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d5e8: (0x0055,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d61c: (0x0055,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d650: (0x0055,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL U → LATIN CAPITAL LETTER U
+ 0x1d684: (0x0055,), #  MATHEMATICAL MONOSPACE CAPITAL U → LATIN CAPITAL LETTER U
+ 0x054d: (0x0055,), #  ARMENIAN CAPITAL LETTER SEH → LATIN CAPITAL LETTER U
+ 0x1200: (0x0055,), #  ETHIOPIC SYLLABLE HA → LATIN CAPITAL LETTER U	# →Ս→
+ 0x104ce: (0x0055,), #  OSAGE CAPITAL LETTER U → LATIN CAPITAL LETTER U
+ 0x144c: (0x0055,), #  CANADIAN SYLLABICS TE → LATIN CAPITAL LETTER U
+ 0xa4f4: (0x0055,), #  LISU LETTER U → LATIN CAPITAL LETTER U
+ 0x16f42: (0x0055,), #  MIAO LETTER WA → LATIN CAPITAL LETTER U
+ 0x118b8: (0x0055,), #  WARANG CITI CAPITAL LETTER PU → LATIN CAPITAL LETTER U
+ 0x01d4: (0x016d,), #  LATIN SMALL LETTER U WITH CARON → LATIN SMALL LETTER U WITH BREVE
+ 0x01d3: (0x016c,), #  LATIN CAPITAL LETTER U WITH CARON → LATIN CAPITAL LETTER U WITH BREVE
+ 0x1d7e: (0x0075, 0x0335,), #  LATIN SMALL CAPITAL LETTER U WITH STROKE → LATIN SMALL LETTER U, COMBINING SHORT STROKE OVERLAY	# →ᴜ̵→
+ 0xab9c: (0x0075, 0x0335,), #  CHEROKEE SMALL LETTER SA → LATIN SMALL LETTER U, COMBINING SHORT STROKE OVERLAY	# →ᴜ̵→
+ 0x0244: (0x0055, 0x0335,), #  LATIN CAPITAL LETTER U BAR → LATIN CAPITAL LETTER U, COMBINING SHORT STROKE OVERLAY	# →U̶→
+ 0x13cc: (0x0055, 0x0335,), #  CHEROKEE LETTER SA → LATIN CAPITAL LETTER U, COMBINING SHORT STROKE OVERLAY	# →Ʉ→→U̶→
+ 0x1458: (0x0055, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWE → LATIN CAPITAL LETTER U, MIDDLE DOT	# →ᑌᐧ→→ᑌ·→
+ 0x1467: (0x0055, 0x0027,), #  CANADIAN SYLLABICS TTE → LATIN CAPITAL LETTER U, APOSTROPHE	# →ᑌᑊ→→ᑌ'→
+ 0x1d6b: (0x0075, 0x0065,), #  LATIN SMALL LETTER UE → LATIN SMALL LETTER U, LATIN SMALL LETTER E
+ 0xab63: (0x0075, 0x006f,), #  LATIN SMALL LETTER UO → LATIN SMALL LETTER U, LATIN SMALL LETTER O
+ 0x1e43: (0xab51,), #  LATIN SMALL LETTER M WITH DOT BELOW → LATIN SMALL LETTER TURNED UI
+ 0x057a: (0x0270,), #  ARMENIAN SMALL LETTER PEH → LATIN SMALL LETTER TURNED M WITH LONG LEG
+ 0x1223: (0x0270,), #  ETHIOPIC SYLLABLE SZAA → LATIN SMALL LETTER TURNED M WITH LONG LEG	# →պ→
+ 0x2127: (0x01b1,), #  INVERTED OHM SIGN → LATIN CAPITAL LETTER UPSILON
+ 0x162e: (0x01b1,), #  CANADIAN SYLLABICS CARRIER LHU → LATIN CAPITAL LETTER UPSILON	# →℧→
+ 0x1634: (0x01b1,), #  CANADIAN SYLLABICS CARRIER TLHU → LATIN CAPITAL LETTER UPSILON	# →ᘮ→→℧→
+ 0x1d7f: (0x028a, 0x0335,), #  LATIN SMALL LETTER UPSILON WITH STROKE → LATIN SMALL LETTER UPSILON, COMBINING SHORT STROKE OVERLAY
+ 0x2228: (0x0076,), #  LOGICAL OR → LATIN SMALL LETTER V
+ 0x22c1: (0x0076,), #  N-ARY LOGICAL OR → LATIN SMALL LETTER V	# →∨→
+ 0xff56: (0x0076,), #  FULLWIDTH LATIN SMALL LETTER V → LATIN SMALL LETTER V	# →ν→
+ 0x2174: (0x0076,), #  SMALL ROMAN NUMERAL FIVE → LATIN SMALL LETTER V
+ 0x1d42f: (0x0076,), #  MATHEMATICAL BOLD SMALL V → LATIN SMALL LETTER V
+ 0x1d463: (0x0076,), #  MATHEMATICAL ITALIC SMALL V → LATIN SMALL LETTER V
+ 0x1d497: (0x0076,), #  MATHEMATICAL BOLD ITALIC SMALL V → LATIN SMALL LETTER V
+ 0x1d4cb: (0x0076,), #  MATHEMATICAL SCRIPT SMALL V → LATIN SMALL LETTER V
+ 0x1d4ff: (0x0076,), #  MATHEMATICAL BOLD SCRIPT SMALL V → LATIN SMALL LETTER V
+ 0x1d533: (0x0076,), #  MATHEMATICAL FRAKTUR SMALL V → LATIN SMALL LETTER V
+ 0x1d567: (0x0076,), #  MATHEMATICAL DOUBLE-STRUCK SMALL V → LATIN SMALL LETTER V
+ 0x1d59b: (0x0076,), #  MATHEMATICAL BOLD FRAKTUR SMALL V → LATIN SMALL LETTER V
+ 0x1d5cf: (0x0076,), #  MATHEMATICAL SANS-SERIF SMALL V → LATIN SMALL LETTER V
+ 0x1d603: (0x0076,), #  MATHEMATICAL SANS-SERIF BOLD SMALL V → LATIN SMALL LETTER V
+ 0x1d637: (0x0076,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL V → LATIN SMALL LETTER V
+ 0x1d66b: (0x0076,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL V → LATIN SMALL LETTER V
+ 0x1d69f: (0x0076,), #  MATHEMATICAL MONOSPACE SMALL V → LATIN SMALL LETTER V
+ 0x1d20: (0x0076,), #  LATIN LETTER SMALL CAPITAL V → LATIN SMALL LETTER V
+ 0x03bd: (0x0076,), #  GREEK SMALL LETTER NU → LATIN SMALL LETTER V
+ 0x1d6ce: (0x0076,), #  MATHEMATICAL BOLD SMALL NU → LATIN SMALL LETTER V	# →ν→
+ 0x1d708: (0x0076,), #  MATHEMATICAL ITALIC SMALL NU → LATIN SMALL LETTER V	# →ν→
+ 0x1d742: (0x0076,), #  MATHEMATICAL BOLD ITALIC SMALL NU → LATIN SMALL LETTER V	# →ν→
+ 0x1d77c: (0x0076,), #  MATHEMATICAL SANS-SERIF BOLD SMALL NU → LATIN SMALL LETTER V	# →ν→
+ 0x1d7b6: (0x0076,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL NU → LATIN SMALL LETTER V	# →ν→
+ 0x0475: (0x0076,), #  CYRILLIC SMALL LETTER IZHITSA → LATIN SMALL LETTER V
+ 0x05d8: (0x0076,), #  HEBREW LETTER TET → LATIN SMALL LETTER V
+ 0x11706: (0x0076,), #  AHOM LETTER PA → LATIN SMALL LETTER V
+ 0xaba9: (0x0076,), #  CHEROKEE SMALL LETTER DO → LATIN SMALL LETTER V	# →ᴠ→
+ 0x118c0: (0x0076,), #  WARANG CITI SMALL LETTER NGAA → LATIN SMALL LETTER V
+ 0x1d20d: (0x0056,), #  GREEK VOCAL NOTATION SYMBOL-14 → LATIN CAPITAL LETTER V
+ 0x0667: (0x0056,), #  ARABIC-INDIC DIGIT SEVEN → LATIN CAPITAL LETTER V
+ 0x06f7: (0x0056,), #  EXTENDED ARABIC-INDIC DIGIT SEVEN → LATIN CAPITAL LETTER V	# →‎٧‎→
+ 0x2164: (0x0056,), #  ROMAN NUMERAL FIVE → LATIN CAPITAL LETTER V
+ 0x1d415: (0x0056,), #  MATHEMATICAL BOLD CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d449: (0x0056,), #  MATHEMATICAL ITALIC CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d47d: (0x0056,), #  MATHEMATICAL BOLD ITALIC CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d4b1: (0x0056,), #  MATHEMATICAL SCRIPT CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d4e5: (0x0056,), #  MATHEMATICAL BOLD SCRIPT CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d519: (0x0056,), #  MATHEMATICAL FRAKTUR CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d54d: (0x0056,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d581: (0x0056,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d5b5: (0x0056,), #  MATHEMATICAL SANS-SERIF CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d5e9: (0x0056,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d61d: (0x0056,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d651: (0x0056,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL V → LATIN CAPITAL LETTER V
+ 0x1d685: (0x0056,), #  MATHEMATICAL MONOSPACE CAPITAL V → LATIN CAPITAL LETTER V
+ 0x0474: (0x0056,), #  CYRILLIC CAPITAL LETTER IZHITSA → LATIN CAPITAL LETTER V
+ 0x2d38: (0x0056,), #  TIFINAGH LETTER YADH → LATIN CAPITAL LETTER V
+ 0x13d9: (0x0056,), #  CHEROKEE LETTER DO → LATIN CAPITAL LETTER V
+ 0x142f: (0x0056,), #  CANADIAN SYLLABICS PE → LATIN CAPITAL LETTER V
+ 0xa6df: (0x0056,), #  BAMUM LETTER KO → LATIN CAPITAL LETTER V
+ 0xa4e6: (0x0056,), #  LISU LETTER HA → LATIN CAPITAL LETTER V
+ 0x16f08: (0x0056,), #  MIAO LETTER VA → LATIN CAPITAL LETTER V
+ 0x118a0: (0x0056,), #  WARANG CITI CAPITAL LETTER NGAA → LATIN CAPITAL LETTER V
+ 0x1051d: (0x0056,), #  ELBASAN LETTER TE → LATIN CAPITAL LETTER V
+ 0x10197: (0x0056, 0x0335,), #  ROMAN QUINARIUS SIGN → LATIN CAPITAL LETTER V, COMBINING SHORT STROKE OVERLAY	# →V̶→
+ 0x143b: (0x0056, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWE → LATIN CAPITAL LETTER V, MIDDLE DOT	# →ᐯᐧ→
+ 0x1f76c: (0x0056, 0x0042,), #  ALCHEMICAL SYMBOL FOR BATH OF VAPOURS → LATIN CAPITAL LETTER V, LATIN CAPITAL LETTER B
+ 0x2175: (0x0076, 0x0069,), #  SMALL ROMAN NUMERAL SIX → LATIN SMALL LETTER V, LATIN SMALL LETTER I
+ 0x2176: (0x0076, 0x0069, 0x0069,), #  SMALL ROMAN NUMERAL SEVEN → LATIN SMALL LETTER V, LATIN SMALL LETTER I, LATIN SMALL LETTER I
+ 0x2177: (0x0076, 0x0069, 0x0069, 0x0069,), #  SMALL ROMAN NUMERAL EIGHT → LATIN SMALL LETTER V, LATIN SMALL LETTER I, LATIN SMALL LETTER I, LATIN SMALL LETTER I
+ 0x2165: (0x0056, 0x006c,), #  ROMAN NUMERAL SIX → LATIN CAPITAL LETTER V, LATIN SMALL LETTER L	# →VI→
+ 0x2166: (0x0056, 0x006c, 0x006c,), #  ROMAN NUMERAL SEVEN → LATIN CAPITAL LETTER V, LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →VII→
+ 0x2167: (0x0056, 0x006c, 0x006c, 0x006c,), #  ROMAN NUMERAL EIGHT → LATIN CAPITAL LETTER V, LATIN SMALL LETTER L, LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →VIII→
+ 0x1f708: (0x0056, 0x1de4,), #  ALCHEMICAL SYMBOL FOR AQUA VITAE → LATIN CAPITAL LETTER V, COMBINING LATIN SMALL LETTER S
+ 0x1d27: (0x028c,), #  GREEK LETTER SMALL CAPITAL LAMDA → LATIN SMALL LETTER TURNED V
+ 0x104d8: (0x028c,), #  OSAGE SMALL LETTER A → LATIN SMALL LETTER TURNED V
+ 0x0668: (0x0245,), #  ARABIC-INDIC DIGIT EIGHT → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x06f8: (0x0245,), #  EXTENDED ARABIC-INDIC DIGIT EIGHT → LATIN CAPITAL LETTER TURNED V	# →‎٨‎→→Λ→
+ 0x039b: (0x0245,), #  GREEK CAPITAL LETTER LAMDA → LATIN CAPITAL LETTER TURNED V
+ 0x1d6b2: (0x0245,), #  MATHEMATICAL BOLD CAPITAL LAMDA → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x1d6ec: (0x0245,), #  MATHEMATICAL ITALIC CAPITAL LAMDA → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x1d726: (0x0245,), #  MATHEMATICAL BOLD ITALIC CAPITAL LAMDA → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x1d760: (0x0245,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL LAMDA → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x1d79a: (0x0245,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL LAMDA → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x041b: (0x0245,), #  CYRILLIC CAPITAL LETTER EL → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x2d37: (0x0245,), #  TIFINAGH LETTER YAD → LATIN CAPITAL LETTER TURNED V
+ 0x104b0: (0x0245,), #  OSAGE CAPITAL LETTER A → LATIN CAPITAL LETTER TURNED V
+ 0x1431: (0x0245,), #  CANADIAN SYLLABICS PI → LATIN CAPITAL LETTER TURNED V
+ 0xa6ce: (0x0245,), #  BAMUM LETTER MI → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0xa4e5: (0x0245,), #  LISU LETTER NGA → LATIN CAPITAL LETTER TURNED V
+ 0x16f3d: (0x0245,), #  MIAO LETTER ZZA → LATIN CAPITAL LETTER TURNED V
+ 0x1028d: (0x0245,), #  LYCIAN LETTER L → LATIN CAPITAL LETTER TURNED V	# →Λ→
+ 0x04c5: (0x0245, 0x0326,), #  CYRILLIC CAPITAL LETTER EL WITH TAIL → LATIN CAPITAL LETTER TURNED V, COMBINING COMMA BELOW	# →Л̡→
+ 0x143d: (0x0245, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWI → LATIN CAPITAL LETTER TURNED V, MIDDLE DOT	# →ᐱᐧ→→ᐱ·→
+ 0x026f: (0x0077,), #  LATIN SMALL LETTER TURNED M → LATIN SMALL LETTER W
+ 0x1d430: (0x0077,), #  MATHEMATICAL BOLD SMALL W → LATIN SMALL LETTER W
+ 0x1d464: (0x0077,), #  MATHEMATICAL ITALIC SMALL W → LATIN SMALL LETTER W
+ 0x1d498: (0x0077,), #  MATHEMATICAL BOLD ITALIC SMALL W → LATIN SMALL LETTER W
+ 0x1d4cc: (0x0077,), #  MATHEMATICAL SCRIPT SMALL W → LATIN SMALL LETTER W
+ 0x1d500: (0x0077,), #  MATHEMATICAL BOLD SCRIPT SMALL W → LATIN SMALL LETTER W
+ 0x1d534: (0x0077,), #  MATHEMATICAL FRAKTUR SMALL W → LATIN SMALL LETTER W
+ 0x1d568: (0x0077,), #  MATHEMATICAL DOUBLE-STRUCK SMALL W → LATIN SMALL LETTER W
+ 0x1d59c: (0x0077,), #  MATHEMATICAL BOLD FRAKTUR SMALL W → LATIN SMALL LETTER W
+ 0x1d5d0: (0x0077,), #  MATHEMATICAL SANS-SERIF SMALL W → LATIN SMALL LETTER W
+ 0x1d604: (0x0077,), #  MATHEMATICAL SANS-SERIF BOLD SMALL W → LATIN SMALL LETTER W
+ 0x1d638: (0x0077,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL W → LATIN SMALL LETTER W
+ 0x1d66c: (0x0077,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL W → LATIN SMALL LETTER W
+ 0x1d6a0: (0x0077,), #  MATHEMATICAL MONOSPACE SMALL W → LATIN SMALL LETTER W
+ 0x1d21: (0x0077,), #  LATIN LETTER SMALL CAPITAL W → LATIN SMALL LETTER W
+ 0x0461: (0x0077,), #  CYRILLIC SMALL LETTER OMEGA → LATIN SMALL LETTER W
+ 0x051d: (0x0077,), #  CYRILLIC SMALL LETTER WE → LATIN SMALL LETTER W
+ 0x0561: (0x0077,), #  ARMENIAN SMALL LETTER AYB → LATIN SMALL LETTER W	# →ɯ→
+ 0x1170a: (0x0077,), #  AHOM LETTER JA → LATIN SMALL LETTER W
+ 0x1170e: (0x0077,), #  AHOM LETTER LA → LATIN SMALL LETTER W
+ 0x1170f: (0x0077,), #  AHOM LETTER SA → LATIN SMALL LETTER W
+ 0xab83: (0x0077,), #  CHEROKEE SMALL LETTER LA → LATIN SMALL LETTER W	# →ᴡ→
+ 0x118ef: (0x0057,), #  WARANG CITI NUMBER SIXTY → LATIN CAPITAL LETTER W
+ 0x118e6: (0x0057,), #  WARANG CITI DIGIT SIX → LATIN CAPITAL LETTER W
+ 0x1d416: (0x0057,), #  MATHEMATICAL BOLD CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d44a: (0x0057,), #  MATHEMATICAL ITALIC CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d47e: (0x0057,), #  MATHEMATICAL BOLD ITALIC CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d4b2: (0x0057,), #  MATHEMATICAL SCRIPT CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d4e6: (0x0057,), #  MATHEMATICAL BOLD SCRIPT CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d51a: (0x0057,), #  MATHEMATICAL FRAKTUR CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d54e: (0x0057,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d582: (0x0057,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d5b6: (0x0057,), #  MATHEMATICAL SANS-SERIF CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d5ea: (0x0057,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d61e: (0x0057,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d652: (0x0057,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL W → LATIN CAPITAL LETTER W
+ 0x1d686: (0x0057,), #  MATHEMATICAL MONOSPACE CAPITAL W → LATIN CAPITAL LETTER W
+ 0x051c: (0x0057,), #  CYRILLIC CAPITAL LETTER WE → LATIN CAPITAL LETTER W
+ 0x13b3: (0x0057,), #  CHEROKEE LETTER LA → LATIN CAPITAL LETTER W
+ 0x13d4: (0x0057,), #  CHEROKEE LETTER TA → LATIN CAPITAL LETTER W
+ 0xa4ea: (0x0057,), #  LISU LETTER WA → LATIN CAPITAL LETTER W
+ 0x047d: (0x0077, 0x0486, 0x0487,), #  CYRILLIC SMALL LETTER OMEGA WITH TITLO → LATIN SMALL LETTER W, COMBINING CYRILLIC PSILI PNEUMATA, COMBINING CYRILLIC POKRYTIE	# →ѡ҆҇→
+ 0x114c5: (0x0077, 0x0307,), #  TIRHUTA GVANG → LATIN SMALL LETTER W, COMBINING DOT ABOVE
+ 0x20a9: (0x0057, 0x0335,), #  WON SIGN → LATIN CAPITAL LETTER W, COMBINING SHORT STROKE OVERLAY
+ 0xa761: (0x0077, 0x0326,), #  LATIN SMALL LETTER VY → LATIN SMALL LETTER W, COMBINING COMMA BELOW	# →w̡→
+ 0x1d0d: (0x028d,), #  LATIN LETTER SMALL CAPITAL M → LATIN SMALL LETTER TURNED W	# →м→
+ 0x043c: (0x028d,), #  CYRILLIC SMALL LETTER EM → LATIN SMALL LETTER TURNED W
+ 0xab87: (0x028d,), #  CHEROKEE SMALL LETTER LU → LATIN SMALL LETTER TURNED W	# →ᴍ→→м→
+ 0x04ce: (0x028d, 0x0326,), #  CYRILLIC SMALL LETTER EM WITH TAIL → LATIN SMALL LETTER TURNED W, COMBINING COMMA BELOW	# →м̡→
+ 0x166e: (0x0078,), #  CANADIAN SYLLABICS FULL STOP → LATIN SMALL LETTER X
+ 0x00d7: (0x0078,), #  MULTIPLICATION SIGN → LATIN SMALL LETTER X
+ 0x292b: (0x0078,), #  RISING DIAGONAL CROSSING FALLING DIAGONAL → LATIN SMALL LETTER X
+ 0x292c: (0x0078,), #  FALLING DIAGONAL CROSSING RISING DIAGONAL → LATIN SMALL LETTER X
+ 0x2a2f: (0x0078,), #  VECTOR OR CROSS PRODUCT → LATIN SMALL LETTER X	# →×→
+ 0xff58: (0x0078,), #  FULLWIDTH LATIN SMALL LETTER X → LATIN SMALL LETTER X	# →х→
+ 0x2179: (0x0078,), #  SMALL ROMAN NUMERAL TEN → LATIN SMALL LETTER X
+ 0x1d431: (0x0078,), #  MATHEMATICAL BOLD SMALL X → LATIN SMALL LETTER X
+ 0x1d465: (0x0078,), #  MATHEMATICAL ITALIC SMALL X → LATIN SMALL LETTER X
+ 0x1d499: (0x0078,), #  MATHEMATICAL BOLD ITALIC SMALL X → LATIN SMALL LETTER X
+ 0x1d4cd: (0x0078,), #  MATHEMATICAL SCRIPT SMALL X → LATIN SMALL LETTER X
+ 0x1d501: (0x0078,), #  MATHEMATICAL BOLD SCRIPT SMALL X → LATIN SMALL LETTER X
+ 0x1d535: (0x0078,), #  MATHEMATICAL FRAKTUR SMALL X → LATIN SMALL LETTER X
+ 0x1d569: (0x0078,), #  MATHEMATICAL DOUBLE-STRUCK SMALL X → LATIN SMALL LETTER X
+ 0x1d59d: (0x0078,), #  MATHEMATICAL BOLD FRAKTUR SMALL X → LATIN SMALL LETTER X
+ 0x1d5d1: (0x0078,), #  MATHEMATICAL SANS-SERIF SMALL X → LATIN SMALL LETTER X
+ 0x1d605: (0x0078,), #  MATHEMATICAL SANS-SERIF BOLD SMALL X → LATIN SMALL LETTER X
+ 0x1d639: (0x0078,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL X → LATIN SMALL LETTER X
+ 0x1d66d: (0x0078,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL X → LATIN SMALL LETTER X
+ 0x1d6a1: (0x0078,), #  MATHEMATICAL MONOSPACE SMALL X → LATIN SMALL LETTER X
+ 0x0445: (0x0078,), #  CYRILLIC SMALL LETTER HA → LATIN SMALL LETTER X
+ 0x1541: (0x0078,), #  CANADIAN SYLLABICS SAYISI YI → LATIN SMALL LETTER X	# →᙮→
+ 0x157d: (0x0078,), #  CANADIAN SYLLABICS HK → LATIN SMALL LETTER X	# →ᕁ→→᙮→
+ 0x2def: (0x036f,), #  COMBINING CYRILLIC LETTER HA → COMBINING LATIN SMALL LETTER X
+ 0x166d: (0x0058,), #  CANADIAN SYLLABICS CHI SIGN → LATIN CAPITAL LETTER X
+ 0x2573: (0x0058,), #  BOX DRAWINGS LIGHT DIAGONAL CROSS → LATIN CAPITAL LETTER X
+ 0x10322: (0x0058,), #  OLD ITALIC NUMERAL TEN → LATIN CAPITAL LETTER X	# →𐌗→
+ 0x118ec: (0x0058,), #  WARANG CITI NUMBER THIRTY → LATIN CAPITAL LETTER X
+ 0xff38: (0x0058,), #  FULLWIDTH LATIN CAPITAL LETTER X → LATIN CAPITAL LETTER X	# →Х→
+ 0x2169: (0x0058,), #  ROMAN NUMERAL TEN → LATIN CAPITAL LETTER X
+ 0x1d417: (0x0058,), #  MATHEMATICAL BOLD CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d44b: (0x0058,), #  MATHEMATICAL ITALIC CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d47f: (0x0058,), #  MATHEMATICAL BOLD ITALIC CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d4b3: (0x0058,), #  MATHEMATICAL SCRIPT CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d4e7: (0x0058,), #  MATHEMATICAL BOLD SCRIPT CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d51b: (0x0058,), #  MATHEMATICAL FRAKTUR CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d54f: (0x0058,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d583: (0x0058,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d5b7: (0x0058,), #  MATHEMATICAL SANS-SERIF CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d5eb: (0x0058,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d61f: (0x0058,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d653: (0x0058,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL X → LATIN CAPITAL LETTER X
+ 0x1d687: (0x0058,), #  MATHEMATICAL MONOSPACE CAPITAL X → LATIN CAPITAL LETTER X
+ 0xa7b3: (0x0058,), #  LATIN CAPITAL LETTER CHI → LATIN CAPITAL LETTER X
+ 0x03a7: (0x0058,), #  GREEK CAPITAL LETTER CHI → LATIN CAPITAL LETTER X
+ 0x1d6be: (0x0058,), #  MATHEMATICAL BOLD CAPITAL CHI → LATIN CAPITAL LETTER X	# →Χ→
+ 0x1d6f8: (0x0058,), #  MATHEMATICAL ITALIC CAPITAL CHI → LATIN CAPITAL LETTER X	# →Χ→
+ 0x1d732: (0x0058,), #  MATHEMATICAL BOLD ITALIC CAPITAL CHI → LATIN CAPITAL LETTER X	# →𝑿→
+ 0x1d76c: (0x0058,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL CHI → LATIN CAPITAL LETTER X	# →Χ→
+ 0x1d7a6: (0x0058,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL CHI → LATIN CAPITAL LETTER X	# →Χ→
+ 0x2cac: (0x0058,), #  COPTIC CAPITAL LETTER KHI → LATIN CAPITAL LETTER X	# →Х→
+ 0x0425: (0x0058,), #  CYRILLIC CAPITAL LETTER HA → LATIN CAPITAL LETTER X
+ 0x2d5d: (0x0058,), #  TIFINAGH LETTER YATH → LATIN CAPITAL LETTER X
+ 0x16b7: (0x0058,), #  RUNIC LETTER GEBO GYFU G → LATIN CAPITAL LETTER X
+ 0xa4eb: (0x0058,), #  LISU LETTER SHA → LATIN CAPITAL LETTER X
+ 0x10290: (0x0058,), #  LYCIAN LETTER MM → LATIN CAPITAL LETTER X
+ 0x102b4: (0x0058,), #  CARIAN LETTER X → LATIN CAPITAL LETTER X
+ 0x10317: (0x0058,), #  OLD ITALIC LETTER EKS → LATIN CAPITAL LETTER X
+ 0x10527: (0x0058,), #  ELBASAN LETTER KHE → LATIN CAPITAL LETTER X
+ 0x2a30: (0x0078, 0x0307,), #  MULTIPLICATION SIGN WITH DOT ABOVE → LATIN SMALL LETTER X, COMBINING DOT ABOVE	# →×̇→
+ 0x04b2: (0x0058, 0x0329,), #  CYRILLIC CAPITAL LETTER HA WITH DESCENDER → LATIN CAPITAL LETTER X, COMBINING VERTICAL LINE BELOW	# →Х̩→
+ 0x10196: (0x0058, 0x0335,), #  ROMAN DENARIUS SIGN → LATIN CAPITAL LETTER X, COMBINING SHORT STROKE OVERLAY	# →X̶→
+ 0x217a: (0x0078, 0x0069,), #  SMALL ROMAN NUMERAL ELEVEN → LATIN SMALL LETTER X, LATIN SMALL LETTER I
+ 0x217b: (0x0078, 0x0069, 0x0069,), #  SMALL ROMAN NUMERAL TWELVE → LATIN SMALL LETTER X, LATIN SMALL LETTER I, LATIN SMALL LETTER I
+ 0x216a: (0x0058, 0x006c,), #  ROMAN NUMERAL ELEVEN → LATIN CAPITAL LETTER X, LATIN SMALL LETTER L	# →XI→
+ 0x216b: (0x0058, 0x006c, 0x006c,), #  ROMAN NUMERAL TWELVE → LATIN CAPITAL LETTER X, LATIN SMALL LETTER L, LATIN SMALL LETTER L	# →XII→
+ 0x0263: (0x0079,), #  LATIN SMALL LETTER GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x1d8c: (0x0079,), #  LATIN SMALL LETTER V WITH PALATAL HOOK → LATIN SMALL LETTER Y
+ 0xff59: (0x0079,), #  FULLWIDTH LATIN SMALL LETTER Y → LATIN SMALL LETTER Y	# →у→
+ 0x1d432: (0x0079,), #  MATHEMATICAL BOLD SMALL Y → LATIN SMALL LETTER Y
+ 0x1d466: (0x0079,), #  MATHEMATICAL ITALIC SMALL Y → LATIN SMALL LETTER Y
+ 0x1d49a: (0x0079,), #  MATHEMATICAL BOLD ITALIC SMALL Y → LATIN SMALL LETTER Y
+ 0x1d4ce: (0x0079,), #  MATHEMATICAL SCRIPT SMALL Y → LATIN SMALL LETTER Y
+ 0x1d502: (0x0079,), #  MATHEMATICAL BOLD SCRIPT SMALL Y → LATIN SMALL LETTER Y
+ 0x1d536: (0x0079,), #  MATHEMATICAL FRAKTUR SMALL Y → LATIN SMALL LETTER Y
+ 0x1d56a: (0x0079,), #  MATHEMATICAL DOUBLE-STRUCK SMALL Y → LATIN SMALL LETTER Y
+ 0x1d59e: (0x0079,), #  MATHEMATICAL BOLD FRAKTUR SMALL Y → LATIN SMALL LETTER Y
+ 0x1d5d2: (0x0079,), #  MATHEMATICAL SANS-SERIF SMALL Y → LATIN SMALL LETTER Y
+ 0x1d606: (0x0079,), #  MATHEMATICAL SANS-SERIF BOLD SMALL Y → LATIN SMALL LETTER Y
+ 0x1d63a: (0x0079,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL Y → LATIN SMALL LETTER Y
+ 0x1d66e: (0x0079,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL Y → LATIN SMALL LETTER Y
+ 0x1d6a2: (0x0079,), #  MATHEMATICAL MONOSPACE SMALL Y → LATIN SMALL LETTER Y
+ 0x028f: (0x0079,), #  LATIN LETTER SMALL CAPITAL Y → LATIN SMALL LETTER Y	# →ү→→γ→
+ 0x1eff: (0x0079,), #  LATIN SMALL LETTER Y WITH LOOP → LATIN SMALL LETTER Y
+ 0xab5a: (0x0079,), #  LATIN SMALL LETTER Y WITH SHORT RIGHT LEG → LATIN SMALL LETTER Y
+ 0x03b3: (0x0079,), #  GREEK SMALL LETTER GAMMA → LATIN SMALL LETTER Y
+ 0x213d: (0x0079,), #  DOUBLE-STRUCK SMALL GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x1d6c4: (0x0079,), #  MATHEMATICAL BOLD SMALL GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x1d6fe: (0x0079,), #  MATHEMATICAL ITALIC SMALL GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x1d738: (0x0079,), #  MATHEMATICAL BOLD ITALIC SMALL GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x1d772: (0x0079,), #  MATHEMATICAL SANS-SERIF BOLD SMALL GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x1d7ac: (0x0079,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL GAMMA → LATIN SMALL LETTER Y	# →γ→
+ 0x0443: (0x0079,), #  CYRILLIC SMALL LETTER U → LATIN SMALL LETTER Y
+ 0x04af: (0x0079,), #  CYRILLIC SMALL LETTER STRAIGHT U → LATIN SMALL LETTER Y	# →γ→
+ 0x10e7: (0x0079,), #  GEORGIAN LETTER QAR → LATIN SMALL LETTER Y
+ 0x118dc: (0x0079,), #  WARANG CITI SMALL LETTER HAR → LATIN SMALL LETTER Y	# →ɣ→→γ→
+ 0xff39: (0x0059,), #  FULLWIDTH LATIN CAPITAL LETTER Y → LATIN CAPITAL LETTER Y	# →Υ→
+ 0x1d418: (0x0059,), #  MATHEMATICAL BOLD CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d44c: (0x0059,), #  MATHEMATICAL ITALIC CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d480: (0x0059,), #  MATHEMATICAL BOLD ITALIC CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d4b4: (0x0059,), #  MATHEMATICAL SCRIPT CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d4e8: (0x0059,), #  MATHEMATICAL BOLD SCRIPT CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d51c: (0x0059,), #  MATHEMATICAL FRAKTUR CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d550: (0x0059,), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d584: (0x0059,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d5b8: (0x0059,), #  MATHEMATICAL SANS-SERIF CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d5ec: (0x0059,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d620: (0x0059,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d654: (0x0059,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x1d688: (0x0059,), #  MATHEMATICAL MONOSPACE CAPITAL Y → LATIN CAPITAL LETTER Y
+ 0x03a5: (0x0059,), #  GREEK CAPITAL LETTER UPSILON → LATIN CAPITAL LETTER Y
+ 0x03d2: (0x0059,), #  GREEK UPSILON WITH HOOK SYMBOL → LATIN CAPITAL LETTER Y
+ 0x1d6bc: (0x0059,), #  MATHEMATICAL BOLD CAPITAL UPSILON → LATIN CAPITAL LETTER Y	# →Υ→
+ 0x1d6f6: (0x0059,), #  MATHEMATICAL ITALIC CAPITAL UPSILON → LATIN CAPITAL LETTER Y	# →Υ→
+ 0x1d730: (0x0059,), #  MATHEMATICAL BOLD ITALIC CAPITAL UPSILON → LATIN CAPITAL LETTER Y	# →Υ→
+ 0x1d76a: (0x0059,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL UPSILON → LATIN CAPITAL LETTER Y	# →Υ→
+ 0x1d7a4: (0x0059,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL UPSILON → LATIN CAPITAL LETTER Y	# →Υ→
+ 0x2ca8: (0x0059,), #  COPTIC CAPITAL LETTER UA → LATIN CAPITAL LETTER Y
+ 0x0423: (0x0059,), #  CYRILLIC CAPITAL LETTER U → LATIN CAPITAL LETTER Y
+ 0x04ae: (0x0059,), #  CYRILLIC CAPITAL LETTER STRAIGHT U → LATIN CAPITAL LETTER Y
+ 0x13a9: (0x0059,), #  CHEROKEE LETTER GI → LATIN CAPITAL LETTER Y
+ 0x13bd: (0x0059,), #  CHEROKEE LETTER MU → LATIN CAPITAL LETTER Y	# →Ꭹ→
+ 0xa4ec: (0x0059,), #  LISU LETTER YA → LATIN CAPITAL LETTER Y
+ 0x16f43: (0x0059,), #  MIAO LETTER AH → LATIN CAPITAL LETTER Y
+ 0x118a4: (0x0059,), #  WARANG CITI CAPITAL LETTER YA → LATIN CAPITAL LETTER Y
+ 0x102b2: (0x0059,), #  CARIAN LETTER U → LATIN CAPITAL LETTER Y
+ 0x01b4: (0x0079, 0x0314,), #  LATIN SMALL LETTER Y WITH HOOK → LATIN SMALL LETTER Y, COMBINING REVERSED COMMA ABOVE
+ 0x024f: (0x0079, 0x0335,), #  LATIN SMALL LETTER Y WITH STROKE → LATIN SMALL LETTER Y, COMBINING SHORT STROKE OVERLAY
+ 0x04b1: (0x0079, 0x0335,), #  CYRILLIC SMALL LETTER STRAIGHT U WITH STROKE → LATIN SMALL LETTER Y, COMBINING SHORT STROKE OVERLAY	# →ү̵→
+ 0x00a5: (0x0059, 0x0335,), #  YEN SIGN → LATIN CAPITAL LETTER Y, COMBINING SHORT STROKE OVERLAY
+ 0x024e: (0x0059, 0x0335,), #  LATIN CAPITAL LETTER Y WITH STROKE → LATIN CAPITAL LETTER Y, COMBINING SHORT STROKE OVERLAY
+ 0x04b0: (0x0059, 0x0335,), #  CYRILLIC CAPITAL LETTER STRAIGHT U WITH STROKE → LATIN CAPITAL LETTER Y, COMBINING SHORT STROKE OVERLAY	# →Ү̵→
+ 0x0292: (0x021d,), #  LATIN SMALL LETTER EZH → LATIN SMALL LETTER YOGH
+ 0xa76b: (0x021d,), #  LATIN SMALL LETTER ET → LATIN SMALL LETTER YOGH
+ 0x2ccd: (0x021d,), #  COPTIC SMALL LETTER OLD COPTIC HORI → LATIN SMALL LETTER YOGH
+ 0x04e1: (0x021d,), #  CYRILLIC SMALL LETTER ABKHASIAN DZE → LATIN SMALL LETTER YOGH	# →ʒ→
+ 0x10f3: (0x021d,), #  GEORGIAN LETTER WE → LATIN SMALL LETTER YOGH	# →ʒ→
+ 0x1d433: (0x007a,), #  MATHEMATICAL BOLD SMALL Z → LATIN SMALL LETTER Z
+ 0x1d467: (0x007a,), #  MATHEMATICAL ITALIC SMALL Z → LATIN SMALL LETTER Z
+ 0x1d49b: (0x007a,), #  MATHEMATICAL BOLD ITALIC SMALL Z → LATIN SMALL LETTER Z
+ 0x1d4cf: (0x007a,), #  MATHEMATICAL SCRIPT SMALL Z → LATIN SMALL LETTER Z
+ 0x1d503: (0x007a,), #  MATHEMATICAL BOLD SCRIPT SMALL Z → LATIN SMALL LETTER Z
+ 0x1d537: (0x007a,), #  MATHEMATICAL FRAKTUR SMALL Z → LATIN SMALL LETTER Z
+ 0x1d56b: (0x007a,), #  MATHEMATICAL DOUBLE-STRUCK SMALL Z → LATIN SMALL LETTER Z
+ 0x1d59f: (0x007a,), #  MATHEMATICAL BOLD FRAKTUR SMALL Z → LATIN SMALL LETTER Z
+ 0x1d5d3: (0x007a,), #  MATHEMATICAL SANS-SERIF SMALL Z → LATIN SMALL LETTER Z
+ 0x1d607: (0x007a,), #  MATHEMATICAL SANS-SERIF BOLD SMALL Z → LATIN SMALL LETTER Z
+ 0x1d63b: (0x007a,), #  MATHEMATICAL SANS-SERIF ITALIC SMALL Z → LATIN SMALL LETTER Z
+ 0x1d66f: (0x007a,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL Z → LATIN SMALL LETTER Z
+ 0x1d6a3: (0x007a,), #  MATHEMATICAL MONOSPACE SMALL Z → LATIN SMALL LETTER Z
+ 0x1d22: (0x007a,), #  LATIN LETTER SMALL CAPITAL Z → LATIN SMALL LETTER Z
+ 0xab93: (0x007a,), #  CHEROKEE SMALL LETTER NO → LATIN SMALL LETTER Z	# →ᴢ→
+ 0x118c4: (0x007a,), #  WARANG CITI SMALL LETTER YA → LATIN SMALL LETTER Z
+ 0x102f5: (0x005a,), #  COPTIC EPACT NUMBER THREE HUNDRED → LATIN CAPITAL LETTER Z
+ 0x118e5: (0x005a,), #  WARANG CITI DIGIT FIVE → LATIN CAPITAL LETTER Z
+ 0xff3a: (0x005a,), #  FULLWIDTH LATIN CAPITAL LETTER Z → LATIN CAPITAL LETTER Z	# →Ζ→
+ 0x2124: (0x005a,), #  DOUBLE-STRUCK CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x2128: (0x005a,), #  BLACK-LETTER CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d419: (0x005a,), #  MATHEMATICAL BOLD CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d44d: (0x005a,), #  MATHEMATICAL ITALIC CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d481: (0x005a,), #  MATHEMATICAL BOLD ITALIC CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d4b5: (0x005a,), #  MATHEMATICAL SCRIPT CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d4e9: (0x005a,), #  MATHEMATICAL BOLD SCRIPT CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d585: (0x005a,), #  MATHEMATICAL BOLD FRAKTUR CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d5b9: (0x005a,), #  MATHEMATICAL SANS-SERIF CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d5ed: (0x005a,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d621: (0x005a,), #  MATHEMATICAL SANS-SERIF ITALIC CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d655: (0x005a,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x1d689: (0x005a,), #  MATHEMATICAL MONOSPACE CAPITAL Z → LATIN CAPITAL LETTER Z
+ 0x0396: (0x005a,), #  GREEK CAPITAL LETTER ZETA → LATIN CAPITAL LETTER Z
+ 0x1d6ad: (0x005a,), #  MATHEMATICAL BOLD CAPITAL ZETA → LATIN CAPITAL LETTER Z	# →Ζ→
+ 0x1d6e7: (0x005a,), #  MATHEMATICAL ITALIC CAPITAL ZETA → LATIN CAPITAL LETTER Z	# →𝑍→
+ 0x1d721: (0x005a,), #  MATHEMATICAL BOLD ITALIC CAPITAL ZETA → LATIN CAPITAL LETTER Z	# →Ζ→
+ 0x1d75b: (0x005a,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL ZETA → LATIN CAPITAL LETTER Z	# →Ζ→
+ 0x1d795: (0x005a,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL ZETA → LATIN CAPITAL LETTER Z	# →Ζ→
+ 0x13c3: (0x005a,), #  CHEROKEE LETTER NO → LATIN CAPITAL LETTER Z
+ 0xa4dc: (0x005a,), #  LISU LETTER DZA → LATIN CAPITAL LETTER Z
+ 0x118a9: (0x005a,), #  WARANG CITI CAPITAL LETTER O → LATIN CAPITAL LETTER Z
+ 0x0290: (0x007a, 0x0328,), #  LATIN SMALL LETTER Z WITH RETROFLEX HOOK → LATIN SMALL LETTER Z, COMBINING OGONEK	# →z̢→
+ 0x01b6: (0x007a, 0x0335,), #  LATIN SMALL LETTER Z WITH STROKE → LATIN SMALL LETTER Z, COMBINING SHORT STROKE OVERLAY
+ 0x01b5: (0x005a, 0x0335,), #  LATIN CAPITAL LETTER Z WITH STROKE → LATIN CAPITAL LETTER Z, COMBINING SHORT STROKE OVERLAY
+ 0x0225: (0x007a, 0x0326,), #  LATIN SMALL LETTER Z WITH HOOK → LATIN SMALL LETTER Z, COMBINING COMMA BELOW	# →z̡→
+ 0x0224: (0x005a, 0x0326,), #  LATIN CAPITAL LETTER Z WITH HOOK → LATIN CAPITAL LETTER Z, COMBINING COMMA BELOW	# →Z̧→
+ 0x1d76: (0x007a, 0x0334,), #  LATIN SMALL LETTER Z WITH MIDDLE TILDE → LATIN SMALL LETTER Z, COMBINING TILDE OVERLAY
+ 0x01bf: (0x00fe,), #  LATIN LETTER WYNN → LATIN SMALL LETTER THORN
+ 0x03f8: (0x00fe,), #  GREEK SMALL LETTER SHO → LATIN SMALL LETTER THORN
+ 0x03f7: (0x00de,), #  GREEK CAPITAL LETTER SHO → LATIN CAPITAL LETTER THORN
+ 0x104c4: (0x00de,), #  OSAGE CAPITAL LETTER PA → LATIN CAPITAL LETTER THORN
+ 0x2079: (0xa770,), #  SUPERSCRIPT NINE → MODIFIER LETTER US
+ 0x1d24: (0x01a8,), #  LATIN LETTER VOICED LARYNGEAL SPIRANT → LATIN SMALL LETTER TONE TWO
+ 0x03e9: (0x01a8,), #  COPTIC SMALL LETTER HORI → LATIN SMALL LETTER TONE TWO
+ 0xa645: (0x01a8,), #  CYRILLIC SMALL LETTER REVERSED DZE → LATIN SMALL LETTER TONE TWO
+ 0x044c: (0x0185,), #  CYRILLIC SMALL LETTER SOFT SIGN → LATIN SMALL LETTER TONE SIX
+ 0xab9f: (0x0185,), #  CHEROKEE SMALL LETTER SI → LATIN SMALL LETTER TONE SIX	# →ь→
+ 0x044b: (0x0185, 0x0069,), #  CYRILLIC SMALL LETTER YERU → LATIN SMALL LETTER TONE SIX, LATIN SMALL LETTER I	# →ьı→
+ 0xab7e: (0x0242,), #  CHEROKEE SMALL LETTER HE → LATIN SMALL LETTER GLOTTAL STOP
+ 0x02e4: (0x02c1,), #  MODIFIER LETTER SMALL REVERSED GLOTTAL STOP → MODIFIER LETTER REVERSED GLOTTAL STOP
+ 0xa6cd: (0x02a1,), #  BAMUM LETTER LU → LATIN LETTER GLOTTAL STOP WITH STROKE
+ 0x2299: (0x0298,), #  CIRCLED DOT OPERATOR → LATIN LETTER BILABIAL CLICK
+ 0x2609: (0x0298,), #  SUN → LATIN LETTER BILABIAL CLICK	# →⊙→
+ 0x2a00: (0x0298,), #  N-ARY CIRCLED DOT OPERATOR → LATIN LETTER BILABIAL CLICK	# →⊙→
+ 0xa668: (0x0298,), #  CYRILLIC CAPITAL LETTER MONOCULAR O → LATIN LETTER BILABIAL CLICK
+ 0x2d59: (0x0298,), #  TIFINAGH LETTER YAS → LATIN LETTER BILABIAL CLICK	# →⊙→
+ 0x104c3: (0x0298,), #  OSAGE CAPITAL LETTER OIN → LATIN LETTER BILABIAL CLICK	# →Ꙩ→
+ 0x213e: (0x0393,), #  DOUBLE-STRUCK CAPITAL GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x1d6aa: (0x0393,), #  MATHEMATICAL BOLD CAPITAL GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x1d6e4: (0x0393,), #  MATHEMATICAL ITALIC CAPITAL GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x1d71e: (0x0393,), #  MATHEMATICAL BOLD ITALIC CAPITAL GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x1d758: (0x0393,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x1d792: (0x0393,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x2c84: (0x0393,), #  COPTIC CAPITAL LETTER GAMMA → GREEK CAPITAL LETTER GAMMA
+ 0x0413: (0x0393,), #  CYRILLIC CAPITAL LETTER GHE → GREEK CAPITAL LETTER GAMMA
+ 0x13b1: (0x0393,), #  CHEROKEE LETTER HU → GREEK CAPITAL LETTER GAMMA
+ 0x14a5: (0x0393,), #  CANADIAN SYLLABICS MI → GREEK CAPITAL LETTER GAMMA
+ 0x16f07: (0x0393,), #  MIAO LETTER FA → GREEK CAPITAL LETTER GAMMA
+ 0x0492: (0x0393, 0x0335,), #  CYRILLIC CAPITAL LETTER GHE WITH STROKE → GREEK CAPITAL LETTER GAMMA, COMBINING SHORT STROKE OVERLAY	# →Г̵→
+ 0x14af: (0x0393, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWI → GREEK CAPITAL LETTER GAMMA, MIDDLE DOT	# →ᒥᐧ→→ᒥ·→
+ 0x0490: (0x0393, 0x0027,), #  CYRILLIC CAPITAL LETTER GHE WITH UPTURN → GREEK CAPITAL LETTER GAMMA, APOSTROPHE	# →Гˈ→
+ 0x2206: (0x0394,), #  INCREMENT → GREEK CAPITAL LETTER DELTA
+ 0x25b3: (0x0394,), #  WHITE UP-POINTING TRIANGLE → GREEK CAPITAL LETTER DELTA
+ 0x1f702: (0x0394,), #  ALCHEMICAL SYMBOL FOR FIRE → GREEK CAPITAL LETTER DELTA	# →△→
+ 0x1d6ab: (0x0394,), #  MATHEMATICAL BOLD CAPITAL DELTA → GREEK CAPITAL LETTER DELTA
+ 0x1d6e5: (0x0394,), #  MATHEMATICAL ITALIC CAPITAL DELTA → GREEK CAPITAL LETTER DELTA
+ 0x1d71f: (0x0394,), #  MATHEMATICAL BOLD ITALIC CAPITAL DELTA → GREEK CAPITAL LETTER DELTA
+ 0x1d759: (0x0394,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL DELTA → GREEK CAPITAL LETTER DELTA
+ 0x1d793: (0x0394,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL DELTA → GREEK CAPITAL LETTER DELTA
+ 0x2c86: (0x0394,), #  COPTIC CAPITAL LETTER DALDA → GREEK CAPITAL LETTER DELTA
+ 0x2d60: (0x0394,), #  TIFINAGH LETTER YAV → GREEK CAPITAL LETTER DELTA
+ 0x1403: (0x0394,), #  CANADIAN SYLLABICS I → GREEK CAPITAL LETTER DELTA
+ 0x16f1a: (0x0394,), #  MIAO LETTER TLHA → GREEK CAPITAL LETTER DELTA
+ 0x10285: (0x0394,), #  LYCIAN LETTER D → GREEK CAPITAL LETTER DELTA
+ 0x102a3: (0x0394,), #  CARIAN LETTER L → GREEK CAPITAL LETTER DELTA
+ 0x2359: (0x0394, 0x0332,), #  APL FUNCTIONAL SYMBOL DELTA UNDERBAR → GREEK CAPITAL LETTER DELTA, COMBINING LOW LINE
+ 0x140f: (0x0394, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WI → GREEK CAPITAL LETTER DELTA, MIDDLE DOT	# →ᐃᐧ→
+ 0x142c: (0x0394, 0x1420,), #  CANADIAN SYLLABICS IN → GREEK CAPITAL LETTER DELTA, CANADIAN SYLLABICS FINAL GRAVE	# →ᐃᐠ→
+ 0x1d7cb: (0x03dd,), #  MATHEMATICAL BOLD SMALL DIGAMMA → GREEK SMALL LETTER DIGAMMA
+ 0x1d6c7: (0x03b6,), #  MATHEMATICAL BOLD SMALL ZETA → GREEK SMALL LETTER ZETA
+ 0x1d701: (0x03b6,), #  MATHEMATICAL ITALIC SMALL ZETA → GREEK SMALL LETTER ZETA
+ 0x1d73b: (0x03b6,), #  MATHEMATICAL BOLD ITALIC SMALL ZETA → GREEK SMALL LETTER ZETA
+ 0x1d775: (0x03b6,), #  MATHEMATICAL SANS-SERIF BOLD SMALL ZETA → GREEK SMALL LETTER ZETA
+ 0x1d7af: (0x03b6,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL ZETA → GREEK SMALL LETTER ZETA
+ 0x2ce4: (0x03d7,), #  COPTIC SYMBOL KAI → GREEK KAI SYMBOL
+ 0x1d6cc: (0x03bb,), #  MATHEMATICAL BOLD SMALL LAMDA → GREEK SMALL LETTER LAMDA
+ 0x1d706: (0x03bb,), #  MATHEMATICAL ITALIC SMALL LAMDA → GREEK SMALL LETTER LAMDA
+ 0x1d740: (0x03bb,), #  MATHEMATICAL BOLD ITALIC SMALL LAMDA → GREEK SMALL LETTER LAMDA
+ 0x1d77a: (0x03bb,), #  MATHEMATICAL SANS-SERIF BOLD SMALL LAMDA → GREEK SMALL LETTER LAMDA
+ 0x1d7b4: (0x03bb,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL LAMDA → GREEK SMALL LETTER LAMDA
+ 0x2c96: (0x03bb,), #  COPTIC CAPITAL LETTER LAULA → GREEK SMALL LETTER LAMDA
+ 0x104db: (0x03bb,), #  OSAGE SMALL LETTER AH → GREEK SMALL LETTER LAMDA
+ 0x00b5: (0x03bc,), #  MICRO SIGN → GREEK SMALL LETTER MU
+ 0x1d6cd: (0x03bc,), #  MATHEMATICAL BOLD SMALL MU → GREEK SMALL LETTER MU
+ 0x1d707: (0x03bc,), #  MATHEMATICAL ITALIC SMALL MU → GREEK SMALL LETTER MU
+ 0x1d741: (0x03bc,), #  MATHEMATICAL BOLD ITALIC SMALL MU → GREEK SMALL LETTER MU
+ 0x1d77b: (0x03bc,), #  MATHEMATICAL SANS-SERIF BOLD SMALL MU → GREEK SMALL LETTER MU
+ 0x1d7b5: (0x03bc,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL MU → GREEK SMALL LETTER MU
+ 0x1d6cf: (0x03be,), #  MATHEMATICAL BOLD SMALL XI → GREEK SMALL LETTER XI
+ 0x1d709: (0x03be,), #  MATHEMATICAL ITALIC SMALL XI → GREEK SMALL LETTER XI
+ 0x1d743: (0x03be,), #  MATHEMATICAL BOLD ITALIC SMALL XI → GREEK SMALL LETTER XI
+ 0x1d77d: (0x03be,), #  MATHEMATICAL SANS-SERIF BOLD SMALL XI → GREEK SMALL LETTER XI
+ 0x1d7b7: (0x03be,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL XI → GREEK SMALL LETTER XI
+ 0x1d6b5: (0x039e,), #  MATHEMATICAL BOLD CAPITAL XI → GREEK CAPITAL LETTER XI
+ 0x1d6ef: (0x039e,), #  MATHEMATICAL ITALIC CAPITAL XI → GREEK CAPITAL LETTER XI
+ 0x1d729: (0x039e,), #  MATHEMATICAL BOLD ITALIC CAPITAL XI → GREEK CAPITAL LETTER XI
+ 0x1d763: (0x039e,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL XI → GREEK CAPITAL LETTER XI
+ 0x1d79d: (0x039e,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL XI → GREEK CAPITAL LETTER XI
+ 0x03d6: (0x03c0,), #  GREEK PI SYMBOL → GREEK SMALL LETTER PI
+ 0x213c: (0x03c0,), #  DOUBLE-STRUCK SMALL PI → GREEK SMALL LETTER PI
+ 0x1d6d1: (0x03c0,), #  MATHEMATICAL BOLD SMALL PI → GREEK SMALL LETTER PI
+ 0x1d6e1: (0x03c0,), #  MATHEMATICAL BOLD PI SYMBOL → GREEK SMALL LETTER PI
+ 0x1d70b: (0x03c0,), #  MATHEMATICAL ITALIC SMALL PI → GREEK SMALL LETTER PI
+ 0x1d71b: (0x03c0,), #  MATHEMATICAL ITALIC PI SYMBOL → GREEK SMALL LETTER PI
+ 0x1d745: (0x03c0,), #  MATHEMATICAL BOLD ITALIC SMALL PI → GREEK SMALL LETTER PI
+ 0x1d755: (0x03c0,), #  MATHEMATICAL BOLD ITALIC PI SYMBOL → GREEK SMALL LETTER PI
+ 0x1d77f: (0x03c0,), #  MATHEMATICAL SANS-SERIF BOLD SMALL PI → GREEK SMALL LETTER PI
+ 0x1d78f: (0x03c0,), #  MATHEMATICAL SANS-SERIF BOLD PI SYMBOL → GREEK SMALL LETTER PI
+ 0x1d7b9: (0x03c0,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL PI → GREEK SMALL LETTER PI
+ 0x1d7c9: (0x03c0,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC PI SYMBOL → GREEK SMALL LETTER PI
+ 0x1d28: (0x03c0,), #  GREEK LETTER SMALL CAPITAL PI → GREEK SMALL LETTER PI	# →п→
+ 0x043f: (0x03c0,), #  CYRILLIC SMALL LETTER PE → GREEK SMALL LETTER PI
+ 0x220f: (0x03a0,), #  N-ARY PRODUCT → GREEK CAPITAL LETTER PI
+ 0x213f: (0x03a0,), #  DOUBLE-STRUCK CAPITAL PI → GREEK CAPITAL LETTER PI
+ 0x1d6b7: (0x03a0,), #  MATHEMATICAL BOLD CAPITAL PI → GREEK CAPITAL LETTER PI
+ 0x1d6f1: (0x03a0,), #  MATHEMATICAL ITALIC CAPITAL PI → GREEK CAPITAL LETTER PI
+ 0x1d72b: (0x03a0,), #  MATHEMATICAL BOLD ITALIC CAPITAL PI → GREEK CAPITAL LETTER PI
+ 0x1d765: (0x03a0,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL PI → GREEK CAPITAL LETTER PI
+ 0x1d79f: (0x03a0,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL PI → GREEK CAPITAL LETTER PI
+ 0x2ca0: (0x03a0,), #  COPTIC CAPITAL LETTER PI → GREEK CAPITAL LETTER PI
+ 0x041f: (0x03a0,), #  CYRILLIC CAPITAL LETTER PE → GREEK CAPITAL LETTER PI
+ 0xa6db: (0x03a0,), #  BAMUM LETTER NA → GREEK CAPITAL LETTER PI
+ 0x102ad: (0x03d8,), #  CARIAN LETTER T → GREEK LETTER ARCHAIC KOPPA
+ 0x10312: (0x03d8,), #  OLD ITALIC LETTER KU → GREEK LETTER ARCHAIC KOPPA
+ 0x03db: (0x03c2,), #  GREEK SMALL LETTER STIGMA → GREEK SMALL LETTER FINAL SIGMA
+ 0x1d6d3: (0x03c2,), #  MATHEMATICAL BOLD SMALL FINAL SIGMA → GREEK SMALL LETTER FINAL SIGMA
+ 0x1d70d: (0x03c2,), #  MATHEMATICAL ITALIC SMALL FINAL SIGMA → GREEK SMALL LETTER FINAL SIGMA
+ 0x1d747: (0x03c2,), #  MATHEMATICAL BOLD ITALIC SMALL FINAL SIGMA → GREEK SMALL LETTER FINAL SIGMA
+ 0x1d781: (0x03c2,), #  MATHEMATICAL SANS-SERIF BOLD SMALL FINAL SIGMA → GREEK SMALL LETTER FINAL SIGMA
+ 0x1d7bb: (0x03c2,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL FINAL SIGMA → GREEK SMALL LETTER FINAL SIGMA
+ 0x1d6bd: (0x03a6,), #  MATHEMATICAL BOLD CAPITAL PHI → GREEK CAPITAL LETTER PHI
+ 0x1d6f7: (0x03a6,), #  MATHEMATICAL ITALIC CAPITAL PHI → GREEK CAPITAL LETTER PHI
+ 0x1d731: (0x03a6,), #  MATHEMATICAL BOLD ITALIC CAPITAL PHI → GREEK CAPITAL LETTER PHI
+ 0x1d76b: (0x03a6,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL PHI → GREEK CAPITAL LETTER PHI
+ 0x1d7a5: (0x03a6,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL PHI → GREEK CAPITAL LETTER PHI
+ 0x2caa: (0x03a6,), #  COPTIC CAPITAL LETTER FI → GREEK CAPITAL LETTER PHI
+ 0x0424: (0x03a6,), #  CYRILLIC CAPITAL LETTER EF → GREEK CAPITAL LETTER PHI
+ 0x0553: (0x03a6,), #  ARMENIAN CAPITAL LETTER PIWR → GREEK CAPITAL LETTER PHI
+ 0x1240: (0x03a6,), #  ETHIOPIC SYLLABLE QA → GREEK CAPITAL LETTER PHI	# →Փ→
+ 0x16f0: (0x03a6,), #  RUNIC BELGTHOR SYMBOL → GREEK CAPITAL LETTER PHI
+ 0x102b3: (0x03a6,), #  CARIAN LETTER NN → GREEK CAPITAL LETTER PHI
+ 0xab53: (0x03c7,), #  LATIN SMALL LETTER CHI → GREEK SMALL LETTER CHI
+ 0xab55: (0x03c7,), #  LATIN SMALL LETTER CHI WITH LOW LEFT SERIF → GREEK SMALL LETTER CHI
+ 0x1d6d8: (0x03c7,), #  MATHEMATICAL BOLD SMALL CHI → GREEK SMALL LETTER CHI
+ 0x1d712: (0x03c7,), #  MATHEMATICAL ITALIC SMALL CHI → GREEK SMALL LETTER CHI
+ 0x1d74c: (0x03c7,), #  MATHEMATICAL BOLD ITALIC SMALL CHI → GREEK SMALL LETTER CHI
+ 0x1d786: (0x03c7,), #  MATHEMATICAL SANS-SERIF BOLD SMALL CHI → GREEK SMALL LETTER CHI
+ 0x1d7c0: (0x03c7,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL CHI → GREEK SMALL LETTER CHI
+ 0x2cad: (0x03c7,), #  COPTIC SMALL LETTER KHI → GREEK SMALL LETTER CHI
+ 0x1d6d9: (0x03c8,), #  MATHEMATICAL BOLD SMALL PSI → GREEK SMALL LETTER PSI
+ 0x1d713: (0x03c8,), #  MATHEMATICAL ITALIC SMALL PSI → GREEK SMALL LETTER PSI
+ 0x1d74d: (0x03c8,), #  MATHEMATICAL BOLD ITALIC SMALL PSI → GREEK SMALL LETTER PSI
+ 0x1d787: (0x03c8,), #  MATHEMATICAL SANS-SERIF BOLD SMALL PSI → GREEK SMALL LETTER PSI
+ 0x1d7c1: (0x03c8,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL PSI → GREEK SMALL LETTER PSI
+ 0x0471: (0x03c8,), #  CYRILLIC SMALL LETTER PSI → GREEK SMALL LETTER PSI
+ 0x104f9: (0x03c8,), #  OSAGE SMALL LETTER GHA → GREEK SMALL LETTER PSI
+ 0x1d6bf: (0x03a8,), #  MATHEMATICAL BOLD CAPITAL PSI → GREEK CAPITAL LETTER PSI
+ 0x1d6f9: (0x03a8,), #  MATHEMATICAL ITALIC CAPITAL PSI → GREEK CAPITAL LETTER PSI
+ 0x1d733: (0x03a8,), #  MATHEMATICAL BOLD ITALIC CAPITAL PSI → GREEK CAPITAL LETTER PSI
+ 0x1d76d: (0x03a8,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL PSI → GREEK CAPITAL LETTER PSI
+ 0x1d7a7: (0x03a8,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL PSI → GREEK CAPITAL LETTER PSI
+ 0x2cae: (0x03a8,), #  COPTIC CAPITAL LETTER PSI → GREEK CAPITAL LETTER PSI
+ 0x0470: (0x03a8,), #  CYRILLIC CAPITAL LETTER PSI → GREEK CAPITAL LETTER PSI
+ 0x104d1: (0x03a8,), #  OSAGE CAPITAL LETTER GHA → GREEK CAPITAL LETTER PSI
+ 0x16d8: (0x03a8,), #  RUNIC LETTER LONG-BRANCH-MADR M → GREEK CAPITAL LETTER PSI
+ 0x102b5: (0x03a8,), #  CARIAN LETTER N → GREEK CAPITAL LETTER PSI
+ 0x2375: (0x03c9,), #  APL FUNCTIONAL SYMBOL OMEGA → GREEK SMALL LETTER OMEGA
+ 0xa7b7: (0x03c9,), #  LATIN SMALL LETTER OMEGA → GREEK SMALL LETTER OMEGA
+ 0x1d6da: (0x03c9,), #  MATHEMATICAL BOLD SMALL OMEGA → GREEK SMALL LETTER OMEGA
+ 0x1d714: (0x03c9,), #  MATHEMATICAL ITALIC SMALL OMEGA → GREEK SMALL LETTER OMEGA
+ 0x1d74e: (0x03c9,), #  MATHEMATICAL BOLD ITALIC SMALL OMEGA → GREEK SMALL LETTER OMEGA
+ 0x1d788: (0x03c9,), #  MATHEMATICAL SANS-SERIF BOLD SMALL OMEGA → GREEK SMALL LETTER OMEGA
+ 0x1d7c2: (0x03c9,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL OMEGA → GREEK SMALL LETTER OMEGA
+ 0x2cb1: (0x03c9,), #  COPTIC SMALL LETTER OOU → GREEK SMALL LETTER OMEGA
+ 0xa64d: (0x03c9,), #  CYRILLIC SMALL LETTER BROAD OMEGA → GREEK SMALL LETTER OMEGA	# →ꞷ→
+ 0x2126: (0x03a9,), #  OHM SIGN → GREEK CAPITAL LETTER OMEGA
+ 0x1d6c0: (0x03a9,), #  MATHEMATICAL BOLD CAPITAL OMEGA → GREEK CAPITAL LETTER OMEGA
+ 0x1d6fa: (0x03a9,), #  MATHEMATICAL ITALIC CAPITAL OMEGA → GREEK CAPITAL LETTER OMEGA
+ 0x1d734: (0x03a9,), #  MATHEMATICAL BOLD ITALIC CAPITAL OMEGA → GREEK CAPITAL LETTER OMEGA
+ 0x1d76e: (0x03a9,), #  MATHEMATICAL SANS-SERIF BOLD CAPITAL OMEGA → GREEK CAPITAL LETTER OMEGA
+ 0x1d7a8: (0x03a9,), #  MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL OMEGA → GREEK CAPITAL LETTER OMEGA
+ 0x162f: (0x03a9,), #  CANADIAN SYLLABICS CARRIER LHO → GREEK CAPITAL LETTER OMEGA
+ 0x1635: (0x03a9,), #  CANADIAN SYLLABICS CARRIER TLHO → GREEK CAPITAL LETTER OMEGA	# →ᘯ→
+ 0x102b6: (0x03a9,), #  CARIAN LETTER TT2 → GREEK CAPITAL LETTER OMEGA
+ 0x2379: (0x03c9, 0x0332,), #  APL FUNCTIONAL SYMBOL OMEGA UNDERBAR → GREEK SMALL LETTER OMEGA, COMBINING LOW LINE
+ 0x1f7d: (0x1ff4,), #  GREEK SMALL LETTER OMEGA WITH OXIA → GREEK SMALL LETTER OMEGA WITH OXIA AND YPOGEGRAMMENI
+ 0x2630: (0x2cb6,), #  TRIGRAM FOR HEAVEN → COPTIC CAPITAL LETTER CRYPTOGRAMMIC EIE
+ 0x2cdc: (0x03ec,), #  COPTIC CAPITAL LETTER OLD NUBIAN SHIMA → COPTIC CAPITAL LETTER SHIMA
+ 0x0497: (0x0436, 0x0329,), #  CYRILLIC SMALL LETTER ZHE WITH DESCENDER → CYRILLIC SMALL LETTER ZHE, COMBINING VERTICAL LINE BELOW
+ 0x0496: (0x0416, 0x0329,), #  CYRILLIC CAPITAL LETTER ZHE WITH DESCENDER → CYRILLIC CAPITAL LETTER ZHE, COMBINING VERTICAL LINE BELOW
+ 0x1d20b: (0x0418,), #  GREEK VOCAL NOTATION SYMBOL-12 → CYRILLIC CAPITAL LETTER I	# →Ͷ→
+ 0x0376: (0x0418,), #  GREEK CAPITAL LETTER PAMPHYLIAN DIGAMMA → CYRILLIC CAPITAL LETTER I
+ 0xa6a1: (0x0418,), #  BAMUM LETTER KA → CYRILLIC CAPITAL LETTER I	# →Ͷ→
+ 0x10425: (0x0418,), #  DESERET CAPITAL LETTER ENG → CYRILLIC CAPITAL LETTER I
+ 0x0419: (0x040d,), #  CYRILLIC CAPITAL LETTER SHORT I → CYRILLIC CAPITAL LETTER I WITH GRAVE
+ 0x048a: (0x040d, 0x0326,), #  CYRILLIC CAPITAL LETTER SHORT I WITH TAIL → CYRILLIC CAPITAL LETTER I WITH GRAVE, COMBINING COMMA BELOW	# →Й̡→
+ 0x045d: (0x0439,), #  CYRILLIC SMALL LETTER I WITH GRAVE → CYRILLIC SMALL LETTER SHORT I
+ 0x048b: (0x0439, 0x0326,), #  CYRILLIC SMALL LETTER SHORT I WITH TAIL → CYRILLIC SMALL LETTER SHORT I, COMBINING COMMA BELOW	# →й̡→
+ 0x104bc: (0x04c3,), #  OSAGE CAPITAL LETTER KA → CYRILLIC CAPITAL LETTER KA WITH HOOK
+ 0x1d2b: (0x043b,), #  CYRILLIC LETTER SMALL CAPITAL EL → CYRILLIC SMALL LETTER EL
+ 0x04c6: (0x043b, 0x0326,), #  CYRILLIC SMALL LETTER EL WITH TAIL → CYRILLIC SMALL LETTER EL, COMBINING COMMA BELOW	# →л̡→
+ 0xab60: (0x0459,), #  LATIN SMALL LETTER SAKHA YAT → CYRILLIC SMALL LETTER LJE
+ 0x104eb: (0xa669,), #  OSAGE SMALL LETTER OIN → CYRILLIC SMALL LETTER MONOCULAR O
+ 0x1dee: (0x2dec,), #  COMBINING LATIN SMALL LETTER P → COMBINING CYRILLIC LETTER ER
+ 0x104cd: (0x040b,), #  OSAGE CAPITAL LETTER DHA → CYRILLIC CAPITAL LETTER TSHE
+ 0x1d202: (0x04fe,), #  GREEK VOCAL NOTATION SYMBOL-3 → CYRILLIC CAPITAL LETTER HA WITH STROKE
+ 0x1d222: (0x0460,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-8 → CYRILLIC CAPITAL LETTER OMEGA
+ 0x13c7: (0x0460,), #  CHEROKEE LETTER QUE → CYRILLIC CAPITAL LETTER OMEGA
+ 0x15ef: (0x0460,), #  CANADIAN SYLLABICS CARRIER GU → CYRILLIC CAPITAL LETTER OMEGA
+ 0x047c: (0x0460, 0x0486, 0x0487,), #  CYRILLIC CAPITAL LETTER OMEGA WITH TITLO → CYRILLIC CAPITAL LETTER OMEGA, COMBINING CYRILLIC PSILI PNEUMATA, COMBINING CYRILLIC POKRYTIE
+ 0x18ed: (0x0460, 0x00b7,), #  CANADIAN SYLLABICS CARRIER GWU → CYRILLIC CAPITAL LETTER OMEGA, MIDDLE DOT	# →ᗯᐧ→
+ 0xa7b6: (0xa64c,), #  LATIN CAPITAL LETTER OMEGA → CYRILLIC CAPITAL LETTER BROAD OMEGA
+ 0x04cc: (0x04b7,), #  CYRILLIC SMALL LETTER KHAKASSIAN CHE → CYRILLIC SMALL LETTER CHE WITH DESCENDER
+ 0x04cb: (0x04b6,), #  CYRILLIC CAPITAL LETTER KHAKASSIAN CHE → CYRILLIC CAPITAL LETTER CHE WITH DESCENDER
+ 0x04be: (0x04bc, 0x0328,), #  CYRILLIC CAPITAL LETTER ABKHASIAN CHE WITH DESCENDER → CYRILLIC CAPITAL LETTER ABKHASIAN CHE, COMBINING OGONEK
+ 0x2cbd: (0x0448,), #  COPTIC SMALL LETTER CRYPTOGRAMMIC NI → CYRILLIC SMALL LETTER SHA
+ 0x2cbc: (0x0428,), #  COPTIC CAPITAL LETTER CRYPTOGRAMMIC NI → CYRILLIC CAPITAL LETTER SHA
+ 0xa650: (0x042a, 0x006c,), #  CYRILLIC CAPITAL LETTER YERU WITH BACK YER → CYRILLIC CAPITAL LETTER HARD SIGN, LATIN SMALL LETTER L	# →ЪІ→
+ 0x2108: (0x042d,), #  SCRUPLE → CYRILLIC CAPITAL LETTER E
+ 0x1f701: (0xa658,), #  ALCHEMICAL SYMBOL FOR AIR → CYRILLIC CAPITAL LETTER CLOSED LITTLE YUS
+ 0x16f1c: (0xa658,), #  MIAO LETTER TLHYA → CYRILLIC CAPITAL LETTER CLOSED LITTLE YUS
+ 0xa992: (0x2c3f,), #  JAVANESE LETTER GA → GLAGOLITIC SMALL LETTER MYSLITE
+ 0x0587: (0x0565, 0x0582,), #  ARMENIAN SMALL LIGATURE ECH YIWN → ARMENIAN SMALL LETTER ECH, ARMENIAN SMALL LETTER YIWN
+ 0x1294: (0x0571,), #  ETHIOPIC SYLLABLE NEE → ARMENIAN SMALL LETTER JA
+ 0xfb14: (0x0574, 0x0565,), #  ARMENIAN SMALL LIGATURE MEN ECH → ARMENIAN SMALL LETTER MEN, ARMENIAN SMALL LETTER ECH
+ 0xfb15: (0x0574, 0x056b,), #  ARMENIAN SMALL LIGATURE MEN INI → ARMENIAN SMALL LETTER MEN, ARMENIAN SMALL LETTER INI
+ 0xfb17: (0x0574, 0x056d,), #  ARMENIAN SMALL LIGATURE MEN XEH → ARMENIAN SMALL LETTER MEN, ARMENIAN SMALL LETTER XEH
+ 0xfb13: (0x0574, 0x0576,), #  ARMENIAN SMALL LIGATURE MEN NOW → ARMENIAN SMALL LETTER MEN, ARMENIAN SMALL LETTER NOW
+ 0x2229: (0x0548,), #  INTERSECTION → ARMENIAN CAPITAL LETTER VO	# →ᑎ→
+ 0x22c2: (0x0548,), #  N-ARY INTERSECTION → ARMENIAN CAPITAL LETTER VO	# →∩→→ᑎ→
+ 0x1d245: (0x0548,), #  GREEK MUSICAL LEIMMA → ARMENIAN CAPITAL LETTER VO	# →∩→→ᑎ→
+ 0x1260: (0x0548,), #  ETHIOPIC SYLLABLE BA → ARMENIAN CAPITAL LETTER VO
+ 0x144e: (0x0548,), #  CANADIAN SYLLABICS TI → ARMENIAN CAPITAL LETTER VO
+ 0xa4f5: (0x0548,), #  LISU LETTER UE → ARMENIAN CAPITAL LETTER VO	# →∩→→ᑎ→
+ 0x145a: (0x0548, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWI → ARMENIAN CAPITAL LETTER VO, MIDDLE DOT	# →ᑎᐧ→→ᑎ·→
+ 0x1468: (0x0548, 0x0027,), #  CANADIAN SYLLABICS TTI → ARMENIAN CAPITAL LETTER VO, APOSTROPHE	# →ᑎᑊ→→ᑎ'→
+ 0xfb16: (0x057e, 0x0576,), #  ARMENIAN SMALL LIGATURE VEW NOW → ARMENIAN SMALL LETTER VEW, ARMENIAN SMALL LETTER NOW
+ 0x20bd: (0x0554,), #  RUBLE SIGN → ARMENIAN CAPITAL LETTER KEH
+ 0x02d3: (0x0559,), #  MODIFIER LETTER CENTRED LEFT HALF RING → ARMENIAN MODIFIER LETTER LEFT HALF RING
+ 0x02bf: (0x0559,), #  MODIFIER LETTER LEFT HALF RING → ARMENIAN MODIFIER LETTER LEFT HALF RING
+ 0x2135: (0x05d0,), #  ALEF SYMBOL → HEBREW LETTER ALEF
+ 0xfb21: (0x05d0,), #  HEBREW LETTER WIDE ALEF → HEBREW LETTER ALEF
+ 0xfb2f: (0xfb2e,), #  HEBREW LETTER ALEF WITH QAMATS → HEBREW LETTER ALEF WITH PATAH
+ 0xfb30: (0xfb2e,), #  HEBREW LETTER ALEF WITH MAPIQ → HEBREW LETTER ALEF WITH PATAH
+ 0xfb4f: (0x05d0, 0x05dc,), #  HEBREW LIGATURE ALEF LAMED → HEBREW LETTER ALEF, HEBREW LETTER LAMED
+ 0x2136: (0x05d1,), #  BET SYMBOL → HEBREW LETTER BET
+ 0x2137: (0x05d2,), #  GIMEL SYMBOL → HEBREW LETTER GIMEL
+ 0x2138: (0x05d3,), #  DALET SYMBOL → HEBREW LETTER DALET
+ 0xfb22: (0x05d3,), #  HEBREW LETTER WIDE DALET → HEBREW LETTER DALET
+ 0xfb23: (0x05d4,), #  HEBREW LETTER WIDE HE → HEBREW LETTER HE
+ 0xfb39: (0xfb1d,), #  HEBREW LETTER YOD WITH DAGESH → HEBREW LETTER YOD WITH HIRIQ
+ 0xfb24: (0x05db,), #  HEBREW LETTER WIDE KAF → HEBREW LETTER KAF
+ 0xfb25: (0x05dc,), #  HEBREW LETTER WIDE LAMED → HEBREW LETTER LAMED
+ 0xfb26: (0x05dd,), #  HEBREW LETTER WIDE FINAL MEM → HEBREW LETTER FINAL MEM
+ 0xfb20: (0x05e2,), #  HEBREW LETTER ALTERNATIVE AYIN → HEBREW LETTER AYIN
+ 0xfb27: (0x05e8,), #  HEBREW LETTER WIDE RESH → HEBREW LETTER RESH
+ 0xfb2b: (0xfb2a,), #  HEBREW LETTER SHIN WITH SIN DOT → HEBREW LETTER SHIN WITH SHIN DOT
+ 0xfb49: (0xfb2a,), #  HEBREW LETTER SHIN WITH DAGESH → HEBREW LETTER SHIN WITH SHIN DOT
+ 0xfb2d: (0xfb2c,), #  HEBREW LETTER SHIN WITH DAGESH AND SIN DOT → HEBREW LETTER SHIN WITH DAGESH AND SHIN DOT
+ 0xfb28: (0x05ea,), #  HEBREW LETTER WIDE TAV → HEBREW LETTER TAV
+ 0xfe80: (0x0621,), #  ARABIC LETTER HAMZA ISOLATED FORM → ARABIC LETTER HAMZA
+ 0x06fd: (0x0621, 0x0348,), #  ARABIC SIGN SINDHI AMPERSAND → ARABIC LETTER HAMZA, COMBINING DOUBLE VERTICAL LINE BELOW
+ 0xfe82: (0x0622,), #  ARABIC LETTER ALEF WITH MADDA ABOVE FINAL FORM → ARABIC LETTER ALEF WITH MADDA ABOVE
+ 0xfe81: (0x0622,), #  ARABIC LETTER ALEF WITH MADDA ABOVE ISOLATED FORM → ARABIC LETTER ALEF WITH MADDA ABOVE
+ 0xfb51: (0x0671,), #  ARABIC LETTER ALEF WASLA FINAL FORM → ARABIC LETTER ALEF WASLA
+ 0xfb50: (0x0671,), #  ARABIC LETTER ALEF WASLA ISOLATED FORM → ARABIC LETTER ALEF WASLA
+ 0x1ee01: (0x0628,), #  ARABIC MATHEMATICAL BEH → ARABIC LETTER BEH
+ 0x1ee21: (0x0628,), #  ARABIC MATHEMATICAL INITIAL BEH → ARABIC LETTER BEH
+ 0x1ee61: (0x0628,), #  ARABIC MATHEMATICAL STRETCHED BEH → ARABIC LETTER BEH
+ 0x1ee81: (0x0628,), #  ARABIC MATHEMATICAL LOOPED BEH → ARABIC LETTER BEH
+ 0x1eea1: (0x0628,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK BEH → ARABIC LETTER BEH
+ 0xfe91: (0x0628,), #  ARABIC LETTER BEH INITIAL FORM → ARABIC LETTER BEH
+ 0xfe92: (0x0628,), #  ARABIC LETTER BEH MEDIAL FORM → ARABIC LETTER BEH
+ 0xfe90: (0x0628,), #  ARABIC LETTER BEH FINAL FORM → ARABIC LETTER BEH
+ 0xfe8f: (0x0628,), #  ARABIC LETTER BEH ISOLATED FORM → ARABIC LETTER BEH
+ 0x0751: (0x0628, 0x06db,), #  ARABIC LETTER BEH WITH DOT BELOW AND THREE DOTS ABOVE → ARABIC LETTER BEH, ARABIC SMALL HIGH THREE DOTS
+ 0x08b6: (0x0628, 0x06e2,), #  ARABIC LETTER BEH WITH SMALL MEEM ABOVE → ARABIC LETTER BEH, ARABIC SMALL HIGH MEEM ISOLATED FORM
+ 0x08a1: (0x0628, 0x0654,), #  ARABIC LETTER BEH WITH HAMZA ABOVE → ARABIC LETTER BEH, ARABIC HAMZA ABOVE
+ 0xfca0: (0x0628, 0x006f,), #  ARABIC LIGATURE BEH WITH HEH INITIAL FORM → ARABIC LETTER BEH, LATIN SMALL LETTER O	# →‎به‎→
+ 0xfce2: (0x0628, 0x006f,), #  ARABIC LIGATURE BEH WITH HEH MEDIAL FORM → ARABIC LETTER BEH, LATIN SMALL LETTER O	# →‎به‎→
+ 0xfc9c: (0x0628, 0x062c,), #  ARABIC LIGATURE BEH WITH JEEM INITIAL FORM → ARABIC LETTER BEH, ARABIC LETTER JEEM
+ 0xfc05: (0x0628, 0x062c,), #  ARABIC LIGATURE BEH WITH JEEM ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER JEEM
+ 0xfc9d: (0x0628, 0x062d,), #  ARABIC LIGATURE BEH WITH HAH INITIAL FORM → ARABIC LETTER BEH, ARABIC LETTER HAH
+ 0xfc06: (0x0628, 0x062d,), #  ARABIC LIGATURE BEH WITH HAH ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER HAH
+ 0xfdc2: (0x0628, 0x062d, 0x0649,), #  ARABIC LIGATURE BEH WITH HAH WITH YEH FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎بحي‎→
+ 0xfc9e: (0x0628, 0x062e,), #  ARABIC LIGATURE BEH WITH KHAH INITIAL FORM → ARABIC LETTER BEH, ARABIC LETTER KHAH
+ 0xfc07: (0x0628, 0x062e,), #  ARABIC LIGATURE BEH WITH KHAH ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER KHAH
+ 0xfcd2: (0x0628, 0x062e,), #  ARABIC LIGATURE NOON WITH JEEM INITIAL FORM → ARABIC LETTER BEH, ARABIC LETTER KHAH	# →‎ﲞ‎→
+ 0xfc4b: (0x0628, 0x062e,), #  ARABIC LIGATURE NOON WITH JEEM ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER KHAH	# →‎نج‎→→‎ﳒ‎→→‎ﲞ‎→
+ 0xfd9e: (0x0628, 0x062e, 0x0649,), #  ARABIC LIGATURE BEH WITH KHAH WITH YEH FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA	# →‎بخي‎→
+ 0xfc6a: (0x0628, 0x0631,), #  ARABIC LIGATURE BEH WITH REH FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER REH
+ 0xfc6b: (0x0628, 0x0632,), #  ARABIC LIGATURE BEH WITH ZAIN FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER ZAIN
+ 0xfc9f: (0x0628, 0x0645,), #  ARABIC LIGATURE BEH WITH MEEM INITIAL FORM → ARABIC LETTER BEH, ARABIC LETTER MEEM
+ 0xfce1: (0x0628, 0x0645,), #  ARABIC LIGATURE BEH WITH MEEM MEDIAL FORM → ARABIC LETTER BEH, ARABIC LETTER MEEM
+ 0xfc6c: (0x0628, 0x0645,), #  ARABIC LIGATURE BEH WITH MEEM FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER MEEM
+ 0xfc08: (0x0628, 0x0645,), #  ARABIC LIGATURE BEH WITH MEEM ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER MEEM
+ 0xfc6d: (0x0628, 0x0646,), #  ARABIC LIGATURE BEH WITH NOON FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER NOON
+ 0xfc6e: (0x0628, 0x0649,), #  ARABIC LIGATURE BEH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER ALEF MAKSURA
+ 0xfc09: (0x0628, 0x0649,), #  ARABIC LIGATURE BEH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER ALEF MAKSURA
+ 0xfc6f: (0x0628, 0x0649,), #  ARABIC LIGATURE BEH WITH YEH FINAL FORM → ARABIC LETTER BEH, ARABIC LETTER ALEF MAKSURA	# →‎بي‎→
+ 0xfc0a: (0x0628, 0x0649,), #  ARABIC LIGATURE BEH WITH YEH ISOLATED FORM → ARABIC LETTER BEH, ARABIC LETTER ALEF MAKSURA	# →‎بي‎→
+ 0xfb54: (0x067b,), #  ARABIC LETTER BEEH INITIAL FORM → ARABIC LETTER BEEH
+ 0xfb55: (0x067b,), #  ARABIC LETTER BEEH MEDIAL FORM → ARABIC LETTER BEEH
+ 0xfb53: (0x067b,), #  ARABIC LETTER BEEH FINAL FORM → ARABIC LETTER BEEH
+ 0xfb52: (0x067b,), #  ARABIC LETTER BEEH ISOLATED FORM → ARABIC LETTER BEEH
+ 0x06d0: (0x067b,), #  ARABIC LETTER E → ARABIC LETTER BEEH
+ 0xfbe6: (0x067b,), #  ARABIC LETTER E INITIAL FORM → ARABIC LETTER BEEH	# →‎ې‎→
+ 0xfbe7: (0x067b,), #  ARABIC LETTER E MEDIAL FORM → ARABIC LETTER BEEH	# →‎ې‎→
+ 0xfbe5: (0x067b,), #  ARABIC LETTER E FINAL FORM → ARABIC LETTER BEEH	# →‎ې‎→
+ 0xfbe4: (0x067b,), #  ARABIC LETTER E ISOLATED FORM → ARABIC LETTER BEEH	# →‎ې‎→
+ 0xfb5c: (0x0680,), #  ARABIC LETTER BEHEH INITIAL FORM → ARABIC LETTER BEHEH
+ 0xfb5d: (0x0680,), #  ARABIC LETTER BEHEH MEDIAL FORM → ARABIC LETTER BEHEH
+ 0xfb5b: (0x0680,), #  ARABIC LETTER BEHEH FINAL FORM → ARABIC LETTER BEHEH
+ 0xfb5a: (0x0680,), #  ARABIC LETTER BEHEH ISOLATED FORM → ARABIC LETTER BEHEH
+ 0x08a9: (0x0754,), #  ARABIC LETTER YEH WITH TWO DOTS BELOW AND DOT ABOVE → ARABIC LETTER BEH WITH TWO DOTS BELOW AND DOT ABOVE
+ 0x0767: (0x0754,), #  ARABIC LETTER NOON WITH TWO DOTS BELOW → ARABIC LETTER BEH WITH TWO DOTS BELOW AND DOT ABOVE
+ 0x2365: (0x0629,), #  APL FUNCTIONAL SYMBOL CIRCLE DIAERESIS → ARABIC LETTER TEH MARBUTA	# →ö→
+ 0x00f6: (0x0629,), #  LATIN SMALL LETTER O WITH DIAERESIS → ARABIC LETTER TEH MARBUTA
+ 0xfe94: (0x0629,), #  ARABIC LETTER TEH MARBUTA FINAL FORM → ARABIC LETTER TEH MARBUTA
+ 0xfe93: (0x0629,), #  ARABIC LETTER TEH MARBUTA ISOLATED FORM → ARABIC LETTER TEH MARBUTA
+ 0x06c3: (0x0629,), #  ARABIC LETTER TEH MARBUTA GOAL → ARABIC LETTER TEH MARBUTA
+ 0x1ee15: (0x062a,), #  ARABIC MATHEMATICAL TEH → ARABIC LETTER TEH
+ 0x1ee35: (0x062a,), #  ARABIC MATHEMATICAL INITIAL TEH → ARABIC LETTER TEH
+ 0x1ee75: (0x062a,), #  ARABIC MATHEMATICAL STRETCHED TEH → ARABIC LETTER TEH
+ 0x1ee95: (0x062a,), #  ARABIC MATHEMATICAL LOOPED TEH → ARABIC LETTER TEH
+ 0x1eeb5: (0x062a,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK TEH → ARABIC LETTER TEH
+ 0xfe97: (0x062a,), #  ARABIC LETTER TEH INITIAL FORM → ARABIC LETTER TEH
+ 0xfe98: (0x062a,), #  ARABIC LETTER TEH MEDIAL FORM → ARABIC LETTER TEH
+ 0xfe96: (0x062a,), #  ARABIC LETTER TEH FINAL FORM → ARABIC LETTER TEH
+ 0xfe95: (0x062a,), #  ARABIC LETTER TEH ISOLATED FORM → ARABIC LETTER TEH
+ 0xfca5: (0x062a, 0x006f,), #  ARABIC LIGATURE TEH WITH HEH INITIAL FORM → ARABIC LETTER TEH, LATIN SMALL LETTER O	# →‎ته‎→
+ 0xfce4: (0x062a, 0x006f,), #  ARABIC LIGATURE TEH WITH HEH MEDIAL FORM → ARABIC LETTER TEH, LATIN SMALL LETTER O	# →‎ته‎→
+ 0xfca1: (0x062a, 0x062c,), #  ARABIC LIGATURE TEH WITH JEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER JEEM
+ 0xfc0b: (0x062a, 0x062c,), #  ARABIC LIGATURE TEH WITH JEEM ISOLATED FORM → ARABIC LETTER TEH, ARABIC LETTER JEEM
+ 0xfd50: (0x062a, 0x062c, 0x0645,), #  ARABIC LIGATURE TEH WITH JEEM WITH MEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfda0: (0x062a, 0x062c, 0x0649,), #  ARABIC LIGATURE TEH WITH JEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd9f: (0x062a, 0x062c, 0x0649,), #  ARABIC LIGATURE TEH WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎تجي‎→
+ 0xfca2: (0x062a, 0x062d,), #  ARABIC LIGATURE TEH WITH HAH INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER HAH
+ 0xfc0c: (0x062a, 0x062d,), #  ARABIC LIGATURE TEH WITH HAH ISOLATED FORM → ARABIC LETTER TEH, ARABIC LETTER HAH
+ 0xfd52: (0x062a, 0x062d, 0x062c,), #  ARABIC LIGATURE TEH WITH HAH WITH JEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER HAH, ARABIC LETTER JEEM
+ 0xfd51: (0x062a, 0x062d, 0x062c,), #  ARABIC LIGATURE TEH WITH HAH WITH JEEM FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER HAH, ARABIC LETTER JEEM
+ 0xfd53: (0x062a, 0x062d, 0x0645,), #  ARABIC LIGATURE TEH WITH HAH WITH MEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfca3: (0x062a, 0x062e,), #  ARABIC LIGATURE TEH WITH KHAH INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER KHAH
+ 0xfc0d: (0x062a, 0x062e,), #  ARABIC LIGATURE TEH WITH KHAH ISOLATED FORM → ARABIC LETTER TEH, ARABIC LETTER KHAH
+ 0xfd54: (0x062a, 0x062e, 0x0645,), #  ARABIC LIGATURE TEH WITH KHAH WITH MEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfda2: (0x062a, 0x062e, 0x0649,), #  ARABIC LIGATURE TEH WITH KHAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA
+ 0xfda1: (0x062a, 0x062e, 0x0649,), #  ARABIC LIGATURE TEH WITH KHAH WITH YEH FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA	# →‎تخي‎→
+ 0xfc70: (0x062a, 0x0631,), #  ARABIC LIGATURE TEH WITH REH FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER REH
+ 0xfc71: (0x062a, 0x0632,), #  ARABIC LIGATURE TEH WITH ZAIN FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER ZAIN
+ 0xfca4: (0x062a, 0x0645,), #  ARABIC LIGATURE TEH WITH MEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM
+ 0xfce3: (0x062a, 0x0645,), #  ARABIC LIGATURE TEH WITH MEEM MEDIAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM
+ 0xfc72: (0x062a, 0x0645,), #  ARABIC LIGATURE TEH WITH MEEM FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM
+ 0xfc0e: (0x062a, 0x0645,), #  ARABIC LIGATURE TEH WITH MEEM ISOLATED FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM
+ 0xfd55: (0x062a, 0x0645, 0x062c,), #  ARABIC LIGATURE TEH WITH MEEM WITH JEEM INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM, ARABIC LETTER JEEM
+ 0xfd56: (0x062a, 0x0645, 0x062d,), #  ARABIC LIGATURE TEH WITH MEEM WITH HAH INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd57: (0x062a, 0x0645, 0x062e,), #  ARABIC LIGATURE TEH WITH MEEM WITH KHAH INITIAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM, ARABIC LETTER KHAH
+ 0xfda4: (0x062a, 0x0645, 0x0649,), #  ARABIC LIGATURE TEH WITH MEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfda3: (0x062a, 0x0645, 0x0649,), #  ARABIC LIGATURE TEH WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎تمي‎→
+ 0xfc73: (0x062a, 0x0646,), #  ARABIC LIGATURE TEH WITH NOON FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER NOON
+ 0xfc74: (0x062a, 0x0649,), #  ARABIC LIGATURE TEH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER ALEF MAKSURA
+ 0xfc0f: (0x062a, 0x0649,), #  ARABIC LIGATURE TEH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER TEH, ARABIC LETTER ALEF MAKSURA
+ 0xfc75: (0x062a, 0x0649,), #  ARABIC LIGATURE TEH WITH YEH FINAL FORM → ARABIC LETTER TEH, ARABIC LETTER ALEF MAKSURA	# →‎تي‎→
+ 0xfc10: (0x062a, 0x0649,), #  ARABIC LIGATURE TEH WITH YEH ISOLATED FORM → ARABIC LETTER TEH, ARABIC LETTER ALEF MAKSURA	# →‎تي‎→
+ 0xfb60: (0x067a,), #  ARABIC LETTER TTEHEH INITIAL FORM → ARABIC LETTER TTEHEH
+ 0xfb61: (0x067a,), #  ARABIC LETTER TTEHEH MEDIAL FORM → ARABIC LETTER TTEHEH
+ 0xfb5f: (0x067a,), #  ARABIC LETTER TTEHEH FINAL FORM → ARABIC LETTER TTEHEH
+ 0xfb5e: (0x067a,), #  ARABIC LETTER TTEHEH ISOLATED FORM → ARABIC LETTER TTEHEH
+ 0xfb64: (0x067f,), #  ARABIC LETTER TEHEH INITIAL FORM → ARABIC LETTER TEHEH
+ 0xfb65: (0x067f,), #  ARABIC LETTER TEHEH MEDIAL FORM → ARABIC LETTER TEHEH
+ 0xfb63: (0x067f,), #  ARABIC LETTER TEHEH FINAL FORM → ARABIC LETTER TEHEH
+ 0xfb62: (0x067f,), #  ARABIC LETTER TEHEH ISOLATED FORM → ARABIC LETTER TEHEH
+ 0x1ee02: (0x062c,), #  ARABIC MATHEMATICAL JEEM → ARABIC LETTER JEEM
+ 0x1ee22: (0x062c,), #  ARABIC MATHEMATICAL INITIAL JEEM → ARABIC LETTER JEEM
+ 0x1ee42: (0x062c,), #  ARABIC MATHEMATICAL TAILED JEEM → ARABIC LETTER JEEM
+ 0x1ee62: (0x062c,), #  ARABIC MATHEMATICAL STRETCHED JEEM → ARABIC LETTER JEEM
+ 0x1ee82: (0x062c,), #  ARABIC MATHEMATICAL LOOPED JEEM → ARABIC LETTER JEEM
+ 0x1eea2: (0x062c,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK JEEM → ARABIC LETTER JEEM
+ 0xfe9f: (0x062c,), #  ARABIC LETTER JEEM INITIAL FORM → ARABIC LETTER JEEM
+ 0xfea0: (0x062c,), #  ARABIC LETTER JEEM MEDIAL FORM → ARABIC LETTER JEEM
+ 0xfe9e: (0x062c,), #  ARABIC LETTER JEEM FINAL FORM → ARABIC LETTER JEEM
+ 0xfe9d: (0x062c,), #  ARABIC LETTER JEEM ISOLATED FORM → ARABIC LETTER JEEM
+ 0xfca7: (0x062c, 0x062d,), #  ARABIC LIGATURE JEEM WITH HAH INITIAL FORM → ARABIC LETTER JEEM, ARABIC LETTER HAH
+ 0xfc15: (0x062c, 0x062d,), #  ARABIC LIGATURE JEEM WITH HAH ISOLATED FORM → ARABIC LETTER JEEM, ARABIC LETTER HAH
+ 0xfda6: (0x062c, 0x062d, 0x0649,), #  ARABIC LIGATURE JEEM WITH HAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA
+ 0xfdbe: (0x062c, 0x062d, 0x0649,), #  ARABIC LIGATURE JEEM WITH HAH WITH YEH FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎جحي‎→
+ 0xfdfb: (0x062c, 0x0644, 0x0020, 0x062c, 0x0644, 0x006c, 0x0644, 0x006f,), #  ARABIC LIGATURE JALLAJALALOUHOU → ARABIC LETTER JEEM, ARABIC LETTER LAM, SPACE, ARABIC LETTER JEEM, ARABIC LETTER LAM, LATIN SMALL LETTER L, ARABIC LETTER LAM, LATIN SMALL LETTER O	# →‎جل جلاله‎→
+ 0xfca8: (0x062c, 0x0645,), #  ARABIC LIGATURE JEEM WITH MEEM INITIAL FORM → ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfc16: (0x062c, 0x0645,), #  ARABIC LIGATURE JEEM WITH MEEM ISOLATED FORM → ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfd59: (0x062c, 0x0645, 0x062d,), #  ARABIC LIGATURE JEEM WITH MEEM WITH HAH INITIAL FORM → ARABIC LETTER JEEM, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd58: (0x062c, 0x0645, 0x062d,), #  ARABIC LIGATURE JEEM WITH MEEM WITH HAH FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfda7: (0x062c, 0x0645, 0x0649,), #  ARABIC LIGATURE JEEM WITH MEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfda5: (0x062c, 0x0645, 0x0649,), #  ARABIC LIGATURE JEEM WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎جمي‎→
+ 0xfd1d: (0x062c, 0x0649,), #  ARABIC LIGATURE JEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd01: (0x062c, 0x0649,), #  ARABIC LIGATURE JEEM WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd1e: (0x062c, 0x0649,), #  ARABIC LIGATURE JEEM WITH YEH FINAL FORM → ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎جي‎→
+ 0xfd02: (0x062c, 0x0649,), #  ARABIC LIGATURE JEEM WITH YEH ISOLATED FORM → ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎جي‎→
+ 0xfb78: (0x0683,), #  ARABIC LETTER NYEH INITIAL FORM → ARABIC LETTER NYEH
+ 0xfb79: (0x0683,), #  ARABIC LETTER NYEH MEDIAL FORM → ARABIC LETTER NYEH
+ 0xfb77: (0x0683,), #  ARABIC LETTER NYEH FINAL FORM → ARABIC LETTER NYEH
+ 0xfb76: (0x0683,), #  ARABIC LETTER NYEH ISOLATED FORM → ARABIC LETTER NYEH
+ 0xfb74: (0x0684,), #  ARABIC LETTER DYEH INITIAL FORM → ARABIC LETTER DYEH
+ 0xfb75: (0x0684,), #  ARABIC LETTER DYEH MEDIAL FORM → ARABIC LETTER DYEH
+ 0xfb73: (0x0684,), #  ARABIC LETTER DYEH FINAL FORM → ARABIC LETTER DYEH
+ 0xfb72: (0x0684,), #  ARABIC LETTER DYEH ISOLATED FORM → ARABIC LETTER DYEH
+ 0xfb7c: (0x0686,), #  ARABIC LETTER TCHEH INITIAL FORM → ARABIC LETTER TCHEH
+ 0xfb7d: (0x0686,), #  ARABIC LETTER TCHEH MEDIAL FORM → ARABIC LETTER TCHEH
+ 0xfb7b: (0x0686,), #  ARABIC LETTER TCHEH FINAL FORM → ARABIC LETTER TCHEH
+ 0xfb7a: (0x0686,), #  ARABIC LETTER TCHEH ISOLATED FORM → ARABIC LETTER TCHEH
+ 0xfb80: (0x0687,), #  ARABIC LETTER TCHEHEH INITIAL FORM → ARABIC LETTER TCHEHEH
+ 0xfb81: (0x0687,), #  ARABIC LETTER TCHEHEH MEDIAL FORM → ARABIC LETTER TCHEHEH
+ 0xfb7f: (0x0687,), #  ARABIC LETTER TCHEHEH FINAL FORM → ARABIC LETTER TCHEHEH
+ 0xfb7e: (0x0687,), #  ARABIC LETTER TCHEHEH ISOLATED FORM → ARABIC LETTER TCHEHEH
+ 0x1ee07: (0x062d,), #  ARABIC MATHEMATICAL HAH → ARABIC LETTER HAH
+ 0x1ee27: (0x062d,), #  ARABIC MATHEMATICAL INITIAL HAH → ARABIC LETTER HAH
+ 0x1ee47: (0x062d,), #  ARABIC MATHEMATICAL TAILED HAH → ARABIC LETTER HAH
+ 0x1ee67: (0x062d,), #  ARABIC MATHEMATICAL STRETCHED HAH → ARABIC LETTER HAH
+ 0x1ee87: (0x062d,), #  ARABIC MATHEMATICAL LOOPED HAH → ARABIC LETTER HAH
+ 0x1eea7: (0x062d,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK HAH → ARABIC LETTER HAH
+ 0xfea3: (0x062d,), #  ARABIC LETTER HAH INITIAL FORM → ARABIC LETTER HAH
+ 0xfea4: (0x062d,), #  ARABIC LETTER HAH MEDIAL FORM → ARABIC LETTER HAH
+ 0xfea2: (0x062d,), #  ARABIC LETTER HAH FINAL FORM → ARABIC LETTER HAH
+ 0xfea1: (0x062d,), #  ARABIC LETTER HAH ISOLATED FORM → ARABIC LETTER HAH
+ 0x0685: (0x062d, 0x06db,), #  ARABIC LETTER HAH WITH THREE DOTS ABOVE → ARABIC LETTER HAH, ARABIC SMALL HIGH THREE DOTS
+ 0x0681: (0x062d, 0x0654,), #  ARABIC LETTER HAH WITH HAMZA ABOVE → ARABIC LETTER HAH, ARABIC HAMZA ABOVE
+ 0x0772: (0x062d, 0x0654,), #  ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH ABOVE → ARABIC LETTER HAH, ARABIC HAMZA ABOVE
+ 0xfca9: (0x062d, 0x062c,), #  ARABIC LIGATURE HAH WITH JEEM INITIAL FORM → ARABIC LETTER HAH, ARABIC LETTER JEEM
+ 0xfc17: (0x062d, 0x062c,), #  ARABIC LIGATURE HAH WITH JEEM ISOLATED FORM → ARABIC LETTER HAH, ARABIC LETTER JEEM
+ 0xfdbf: (0x062d, 0x062c, 0x0649,), #  ARABIC LIGATURE HAH WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER HAH, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎حجي‎→
+ 0xfcaa: (0x062d, 0x0645,), #  ARABIC LIGATURE HAH WITH MEEM INITIAL FORM → ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfc18: (0x062d, 0x0645,), #  ARABIC LIGATURE HAH WITH MEEM ISOLATED FORM → ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfd5b: (0x062d, 0x0645, 0x0649,), #  ARABIC LIGATURE HAH WITH MEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER HAH, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd5a: (0x062d, 0x0645, 0x0649,), #  ARABIC LIGATURE HAH WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER HAH, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎حمي‎→
+ 0xfd1b: (0x062d, 0x0649,), #  ARABIC LIGATURE HAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA
+ 0xfcff: (0x062d, 0x0649,), #  ARABIC LIGATURE HAH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA
+ 0xfd1c: (0x062d, 0x0649,), #  ARABIC LIGATURE HAH WITH YEH FINAL FORM → ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎حي‎→
+ 0xfd00: (0x062d, 0x0649,), #  ARABIC LIGATURE HAH WITH YEH ISOLATED FORM → ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎حي‎→
+ 0x1ee17: (0x062e,), #  ARABIC MATHEMATICAL KHAH → ARABIC LETTER KHAH
+ 0x1ee37: (0x062e,), #  ARABIC MATHEMATICAL INITIAL KHAH → ARABIC LETTER KHAH
+ 0x1ee57: (0x062e,), #  ARABIC MATHEMATICAL TAILED KHAH → ARABIC LETTER KHAH
+ 0x1ee77: (0x062e,), #  ARABIC MATHEMATICAL STRETCHED KHAH → ARABIC LETTER KHAH
+ 0x1ee97: (0x062e,), #  ARABIC MATHEMATICAL LOOPED KHAH → ARABIC LETTER KHAH
+ 0x1eeb7: (0x062e,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK KHAH → ARABIC LETTER KHAH
+ 0xfea7: (0x062e,), #  ARABIC LETTER KHAH INITIAL FORM → ARABIC LETTER KHAH
+ 0xfea8: (0x062e,), #  ARABIC LETTER KHAH MEDIAL FORM → ARABIC LETTER KHAH
+ 0xfea6: (0x062e,), #  ARABIC LETTER KHAH FINAL FORM → ARABIC LETTER KHAH
+ 0xfea5: (0x062e,), #  ARABIC LETTER KHAH ISOLATED FORM → ARABIC LETTER KHAH
+ 0xfcab: (0x062e, 0x062c,), #  ARABIC LIGATURE KHAH WITH JEEM INITIAL FORM → ARABIC LETTER KHAH, ARABIC LETTER JEEM
+ 0xfc19: (0x062e, 0x062c,), #  ARABIC LIGATURE KHAH WITH JEEM ISOLATED FORM → ARABIC LETTER KHAH, ARABIC LETTER JEEM
+ 0xfc1a: (0x062e, 0x062d,), #  ARABIC LIGATURE KHAH WITH HAH ISOLATED FORM → ARABIC LETTER KHAH, ARABIC LETTER HAH
+ 0xfcac: (0x062e, 0x0645,), #  ARABIC LIGATURE KHAH WITH MEEM INITIAL FORM → ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfc1b: (0x062e, 0x0645,), #  ARABIC LIGATURE KHAH WITH MEEM ISOLATED FORM → ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfd1f: (0x062e, 0x0649,), #  ARABIC LIGATURE KHAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA
+ 0xfd03: (0x062e, 0x0649,), #  ARABIC LIGATURE KHAH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA
+ 0xfd20: (0x062e, 0x0649,), #  ARABIC LIGATURE KHAH WITH YEH FINAL FORM → ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA	# →‎خي‎→
+ 0xfd04: (0x062e, 0x0649,), #  ARABIC LIGATURE KHAH WITH YEH ISOLATED FORM → ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA	# →‎خي‎→
+ 0x102e1: (0x062f,), #  COPTIC EPACT DIGIT ONE → ARABIC LETTER DAL
+ 0x1ee03: (0x062f,), #  ARABIC MATHEMATICAL DAL → ARABIC LETTER DAL
+ 0x1ee83: (0x062f,), #  ARABIC MATHEMATICAL LOOPED DAL → ARABIC LETTER DAL
+ 0x1eea3: (0x062f,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK DAL → ARABIC LETTER DAL
+ 0xfeaa: (0x062f,), #  ARABIC LETTER DAL FINAL FORM → ARABIC LETTER DAL
+ 0xfea9: (0x062f,), #  ARABIC LETTER DAL ISOLATED FORM → ARABIC LETTER DAL
+ 0x0688: (0x062f, 0x0615,), #  ARABIC LETTER DDAL → ARABIC LETTER DAL, ARABIC SMALL HIGH TAH
+ 0xfb89: (0x062f, 0x0615,), #  ARABIC LETTER DDAL FINAL FORM → ARABIC LETTER DAL, ARABIC SMALL HIGH TAH	# →‎ڈ‎→
+ 0xfb88: (0x062f, 0x0615,), #  ARABIC LETTER DDAL ISOLATED FORM → ARABIC LETTER DAL, ARABIC SMALL HIGH TAH	# →‎ڈ‎→
+ 0x068e: (0x062f, 0x06db,), #  ARABIC LETTER DUL → ARABIC LETTER DAL, ARABIC SMALL HIGH THREE DOTS
+ 0xfb87: (0x062f, 0x06db,), #  ARABIC LETTER DUL FINAL FORM → ARABIC LETTER DAL, ARABIC SMALL HIGH THREE DOTS	# →‎ڎ‎→
+ 0xfb86: (0x062f, 0x06db,), #  ARABIC LETTER DUL ISOLATED FORM → ARABIC LETTER DAL, ARABIC SMALL HIGH THREE DOTS	# →‎ڎ‎→
+ 0x06ee: (0x062f, 0x0302,), #  ARABIC LETTER DAL WITH INVERTED V → ARABIC LETTER DAL, COMBINING CIRCUMFLEX ACCENT	# →‎دٛ‎→
+ 0x08ae: (0x062f, 0x0324, 0x0323,), #  ARABIC LETTER DAL WITH THREE DOTS BELOW → ARABIC LETTER DAL, COMBINING DIAERESIS BELOW, COMBINING DOT BELOW	# →‎د࣮࣭‎→
+ 0x1ee18: (0x0630,), #  ARABIC MATHEMATICAL THAL → ARABIC LETTER THAL
+ 0x1ee98: (0x0630,), #  ARABIC MATHEMATICAL LOOPED THAL → ARABIC LETTER THAL
+ 0x1eeb8: (0x0630,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK THAL → ARABIC LETTER THAL
+ 0xfeac: (0x0630,), #  ARABIC LETTER THAL FINAL FORM → ARABIC LETTER THAL
+ 0xfeab: (0x0630,), #  ARABIC LETTER THAL ISOLATED FORM → ARABIC LETTER THAL
+ 0xfc5b: (0x0630, 0x0670,), #  ARABIC LIGATURE THAL WITH SUPERSCRIPT ALEF ISOLATED FORM → ARABIC LETTER THAL, ARABIC LETTER SUPERSCRIPT ALEF
+ 0x068b: (0x068a, 0x0615,), #  ARABIC LETTER DAL WITH DOT BELOW AND SMALL TAH → ARABIC LETTER DAL WITH DOT BELOW, ARABIC SMALL HIGH TAH
+ 0xfb85: (0x068c,), #  ARABIC LETTER DAHAL FINAL FORM → ARABIC LETTER DAHAL
+ 0xfb84: (0x068c,), #  ARABIC LETTER DAHAL ISOLATED FORM → ARABIC LETTER DAHAL
+ 0xfb83: (0x068d,), #  ARABIC LETTER DDAHAL FINAL FORM → ARABIC LETTER DDAHAL
+ 0xfb82: (0x068d,), #  ARABIC LETTER DDAHAL ISOLATED FORM → ARABIC LETTER DDAHAL
+ 0x1ee13: (0x0631,), #  ARABIC MATHEMATICAL REH → ARABIC LETTER REH
+ 0x1ee93: (0x0631,), #  ARABIC MATHEMATICAL LOOPED REH → ARABIC LETTER REH
+ 0x1eeb3: (0x0631,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK REH → ARABIC LETTER REH
+ 0xfeae: (0x0631,), #  ARABIC LETTER REH FINAL FORM → ARABIC LETTER REH
+ 0xfead: (0x0631,), #  ARABIC LETTER REH ISOLATED FORM → ARABIC LETTER REH
+ 0x0691: (0x0631, 0x0615,), #  ARABIC LETTER RREH → ARABIC LETTER REH, ARABIC SMALL HIGH TAH
+ 0xfb8d: (0x0631, 0x0615,), #  ARABIC LETTER RREH FINAL FORM → ARABIC LETTER REH, ARABIC SMALL HIGH TAH	# →‎ڑ‎→
+ 0xfb8c: (0x0631, 0x0615,), #  ARABIC LETTER RREH ISOLATED FORM → ARABIC LETTER REH, ARABIC SMALL HIGH TAH	# →‎ڑ‎→
+ 0x0698: (0x0631, 0x06db,), #  ARABIC LETTER JEH → ARABIC LETTER REH, ARABIC SMALL HIGH THREE DOTS
+ 0xfb8b: (0x0631, 0x06db,), #  ARABIC LETTER JEH FINAL FORM → ARABIC LETTER REH, ARABIC SMALL HIGH THREE DOTS	# →‎ژ‎→
+ 0xfb8a: (0x0631, 0x06db,), #  ARABIC LETTER JEH ISOLATED FORM → ARABIC LETTER REH, ARABIC SMALL HIGH THREE DOTS	# →‎ژ‎→
+ 0x0692: (0x0631, 0x0306,), #  ARABIC LETTER REH WITH SMALL V → ARABIC LETTER REH, COMBINING BREVE	# →‎رٚ‎→
+ 0x08b9: (0x0631, 0x0306, 0x0307,), #  ARABIC LETTER REH WITH SMALL NOON ABOVE → ARABIC LETTER REH, COMBINING BREVE, COMBINING DOT ABOVE	# →‎رۨ‎→
+ 0x06ef: (0x0631, 0x0302,), #  ARABIC LETTER REH WITH INVERTED V → ARABIC LETTER REH, COMBINING CIRCUMFLEX ACCENT	# →‎رٛ‎→
+ 0x076c: (0x0631, 0x0654,), #  ARABIC LETTER REH WITH HAMZA ABOVE → ARABIC LETTER REH, ARABIC HAMZA ABOVE
+ 0xfc5c: (0x0631, 0x0670,), #  ARABIC LIGATURE REH WITH SUPERSCRIPT ALEF ISOLATED FORM → ARABIC LETTER REH, ARABIC LETTER SUPERSCRIPT ALEF
+ 0xfdf6: (0x0631, 0x0633, 0x0648, 0x0644,), #  ARABIC LIGATURE RASOUL ISOLATED FORM → ARABIC LETTER REH, ARABIC LETTER SEEN, ARABIC LETTER WAW, ARABIC LETTER LAM
+ 0xfdfc: (0x0631, 0x0649, 0x006c, 0x0644,), #  RIAL SIGN → ARABIC LETTER REH, ARABIC LETTER ALEF MAKSURA, LATIN SMALL LETTER L, ARABIC LETTER LAM	# →‎ریال‎→
+ 0x1ee06: (0x0632,), #  ARABIC MATHEMATICAL ZAIN → ARABIC LETTER ZAIN
+ 0x1ee86: (0x0632,), #  ARABIC MATHEMATICAL LOOPED ZAIN → ARABIC LETTER ZAIN
+ 0x1eea6: (0x0632,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK ZAIN → ARABIC LETTER ZAIN
+ 0xfeb0: (0x0632,), #  ARABIC LETTER ZAIN FINAL FORM → ARABIC LETTER ZAIN
+ 0xfeaf: (0x0632,), #  ARABIC LETTER ZAIN ISOLATED FORM → ARABIC LETTER ZAIN
+ 0x08b2: (0x0632, 0x0302,), #  ARABIC LETTER ZAIN WITH INVERTED V ABOVE → ARABIC LETTER ZAIN, COMBINING CIRCUMFLEX ACCENT	# →‎زٛ‎→
+ 0x0771: (0x0697, 0x0615,), #  ARABIC LETTER REH WITH SMALL ARABIC LETTER TAH AND TWO DOTS → ARABIC LETTER REH WITH TWO DOTS ABOVE, ARABIC SMALL HIGH TAH
+ 0x1ee0e: (0x0633,), #  ARABIC MATHEMATICAL SEEN → ARABIC LETTER SEEN
+ 0x1ee2e: (0x0633,), #  ARABIC MATHEMATICAL INITIAL SEEN → ARABIC LETTER SEEN
+ 0x1ee4e: (0x0633,), #  ARABIC MATHEMATICAL TAILED SEEN → ARABIC LETTER SEEN
+ 0x1ee6e: (0x0633,), #  ARABIC MATHEMATICAL STRETCHED SEEN → ARABIC LETTER SEEN
+ 0x1ee8e: (0x0633,), #  ARABIC MATHEMATICAL LOOPED SEEN → ARABIC LETTER SEEN
+ 0x1eeae: (0x0633,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK SEEN → ARABIC LETTER SEEN
+ 0xfeb3: (0x0633,), #  ARABIC LETTER SEEN INITIAL FORM → ARABIC LETTER SEEN
+ 0xfeb4: (0x0633,), #  ARABIC LETTER SEEN MEDIAL FORM → ARABIC LETTER SEEN
+ 0xfeb2: (0x0633,), #  ARABIC LETTER SEEN FINAL FORM → ARABIC LETTER SEEN
+ 0xfeb1: (0x0633,), #  ARABIC LETTER SEEN ISOLATED FORM → ARABIC LETTER SEEN
+ 0x0634: (0x0633, 0x06db,), #  ARABIC LETTER SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS
+ 0x1ee14: (0x0633, 0x06db,), #  ARABIC MATHEMATICAL SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0x1ee34: (0x0633, 0x06db,), #  ARABIC MATHEMATICAL INITIAL SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0x1ee54: (0x0633, 0x06db,), #  ARABIC MATHEMATICAL TAILED SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0x1ee74: (0x0633, 0x06db,), #  ARABIC MATHEMATICAL STRETCHED SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0x1ee94: (0x0633, 0x06db,), #  ARABIC MATHEMATICAL LOOPED SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0x1eeb4: (0x0633, 0x06db,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK SHEEN → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0xfeb7: (0x0633, 0x06db,), #  ARABIC LETTER SHEEN INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0xfeb8: (0x0633, 0x06db,), #  ARABIC LETTER SHEEN MEDIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0xfeb6: (0x0633, 0x06db,), #  ARABIC LETTER SHEEN FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0xfeb5: (0x0633, 0x06db,), #  ARABIC LETTER SHEEN ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS	# →‎ش‎→
+ 0x077e: (0x0633, 0x0302,), #  ARABIC LETTER SEEN WITH INVERTED V → ARABIC LETTER SEEN, COMBINING CIRCUMFLEX ACCENT	# →‎سٛ‎→
+ 0xfd31: (0x0633, 0x006f,), #  ARABIC LIGATURE SEEN WITH HEH INITIAL FORM → ARABIC LETTER SEEN, LATIN SMALL LETTER O	# →‎سه‎→
+ 0xfce8: (0x0633, 0x006f,), #  ARABIC LIGATURE SEEN WITH HEH MEDIAL FORM → ARABIC LETTER SEEN, LATIN SMALL LETTER O	# →‎سه‎→
+ 0xfd32: (0x0633, 0x06db, 0x006f,), #  ARABIC LIGATURE SHEEN WITH HEH INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, LATIN SMALL LETTER O	# →‎شه‎→
+ 0xfcea: (0x0633, 0x06db, 0x006f,), #  ARABIC LIGATURE SHEEN WITH HEH MEDIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, LATIN SMALL LETTER O	# →‎شه‎→
+ 0xfcad: (0x0633, 0x062c,), #  ARABIC LIGATURE SEEN WITH JEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER JEEM
+ 0xfd34: (0x0633, 0x062c,), #  ARABIC LIGATURE SEEN WITH JEEM MEDIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER JEEM
+ 0xfc1c: (0x0633, 0x062c,), #  ARABIC LIGATURE SEEN WITH JEEM ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER JEEM
+ 0xfd2d: (0x0633, 0x06db, 0x062c,), #  ARABIC LIGATURE SHEEN WITH JEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER JEEM	# →‎شج‎→
+ 0xfd37: (0x0633, 0x06db, 0x062c,), #  ARABIC LIGATURE SHEEN WITH JEEM MEDIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER JEEM	# →‎شج‎→
+ 0xfd25: (0x0633, 0x06db, 0x062c,), #  ARABIC LIGATURE SHEEN WITH JEEM FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER JEEM	# →‎شج‎→
+ 0xfd09: (0x0633, 0x06db, 0x062c,), #  ARABIC LIGATURE SHEEN WITH JEEM ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER JEEM	# →‎شج‎→
+ 0xfd5d: (0x0633, 0x062c, 0x062d,), #  ARABIC LIGATURE SEEN WITH JEEM WITH HAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER JEEM, ARABIC LETTER HAH
+ 0xfd5e: (0x0633, 0x062c, 0x0649,), #  ARABIC LIGATURE SEEN WITH JEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd69: (0x0633, 0x06db, 0x062c, 0x0649,), #  ARABIC LIGATURE SHEEN WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎شجي‎→
+ 0xfcae: (0x0633, 0x062d,), #  ARABIC LIGATURE SEEN WITH HAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER HAH
+ 0xfd35: (0x0633, 0x062d,), #  ARABIC LIGATURE SEEN WITH HAH MEDIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER HAH
+ 0xfc1d: (0x0633, 0x062d,), #  ARABIC LIGATURE SEEN WITH HAH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER HAH
+ 0xfd2e: (0x0633, 0x06db, 0x062d,), #  ARABIC LIGATURE SHEEN WITH HAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH	# →‎شح‎→
+ 0xfd38: (0x0633, 0x06db, 0x062d,), #  ARABIC LIGATURE SHEEN WITH HAH MEDIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH	# →‎شح‎→
+ 0xfd26: (0x0633, 0x06db, 0x062d,), #  ARABIC LIGATURE SHEEN WITH HAH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH	# →‎شح‎→
+ 0xfd0a: (0x0633, 0x06db, 0x062d,), #  ARABIC LIGATURE SHEEN WITH HAH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH	# →‎شح‎→
+ 0xfd5c: (0x0633, 0x062d, 0x062c,), #  ARABIC LIGATURE SEEN WITH HAH WITH JEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER HAH, ARABIC LETTER JEEM
+ 0xfd68: (0x0633, 0x06db, 0x062d, 0x0645,), #  ARABIC LIGATURE SHEEN WITH HAH WITH MEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH, ARABIC LETTER MEEM	# →‎شحم‎→
+ 0xfd67: (0x0633, 0x06db, 0x062d, 0x0645,), #  ARABIC LIGATURE SHEEN WITH HAH WITH MEEM FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH, ARABIC LETTER MEEM	# →‎شحم‎→
+ 0xfdaa: (0x0633, 0x06db, 0x062d, 0x0649,), #  ARABIC LIGATURE SHEEN WITH HAH WITH YEH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎شحي‎→
+ 0xfcaf: (0x0633, 0x062e,), #  ARABIC LIGATURE SEEN WITH KHAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER KHAH
+ 0xfd36: (0x0633, 0x062e,), #  ARABIC LIGATURE SEEN WITH KHAH MEDIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER KHAH
+ 0xfc1e: (0x0633, 0x062e,), #  ARABIC LIGATURE SEEN WITH KHAH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER KHAH
+ 0xfd2f: (0x0633, 0x06db, 0x062e,), #  ARABIC LIGATURE SHEEN WITH KHAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER KHAH	# →‎شخ‎→
+ 0xfd39: (0x0633, 0x06db, 0x062e,), #  ARABIC LIGATURE SHEEN WITH KHAH MEDIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER KHAH	# →‎شخ‎→
+ 0xfd27: (0x0633, 0x06db, 0x062e,), #  ARABIC LIGATURE SHEEN WITH KHAH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER KHAH	# →‎شخ‎→
+ 0xfd0b: (0x0633, 0x06db, 0x062e,), #  ARABIC LIGATURE SHEEN WITH KHAH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER KHAH	# →‎شخ‎→
+ 0xfda8: (0x0633, 0x062e, 0x0649,), #  ARABIC LIGATURE SEEN WITH KHAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA
+ 0xfdc6: (0x0633, 0x062e, 0x0649,), #  ARABIC LIGATURE SEEN WITH KHAH WITH YEH FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA	# →‎سخي‎→
+ 0xfd2a: (0x0633, 0x0631,), #  ARABIC LIGATURE SEEN WITH REH FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER REH
+ 0xfd0e: (0x0633, 0x0631,), #  ARABIC LIGATURE SEEN WITH REH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER REH
+ 0xfd29: (0x0633, 0x06db, 0x0631,), #  ARABIC LIGATURE SHEEN WITH REH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER REH	# →‎شر‎→
+ 0xfd0d: (0x0633, 0x06db, 0x0631,), #  ARABIC LIGATURE SHEEN WITH REH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER REH	# →‎شر‎→
+ 0xfcb0: (0x0633, 0x0645,), #  ARABIC LIGATURE SEEN WITH MEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM
+ 0xfce7: (0x0633, 0x0645,), #  ARABIC LIGATURE SEEN WITH MEEM MEDIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM
+ 0xfc1f: (0x0633, 0x0645,), #  ARABIC LIGATURE SEEN WITH MEEM ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM
+ 0xfd30: (0x0633, 0x06db, 0x0645,), #  ARABIC LIGATURE SHEEN WITH MEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎شم‎→
+ 0xfce9: (0x0633, 0x06db, 0x0645,), #  ARABIC LIGATURE SHEEN WITH MEEM MEDIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎شم‎→
+ 0xfd28: (0x0633, 0x06db, 0x0645,), #  ARABIC LIGATURE SHEEN WITH MEEM FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎شم‎→
+ 0xfd0c: (0x0633, 0x06db, 0x0645,), #  ARABIC LIGATURE SHEEN WITH MEEM ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎شم‎→
+ 0xfd61: (0x0633, 0x0645, 0x062c,), #  ARABIC LIGATURE SEEN WITH MEEM WITH JEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM, ARABIC LETTER JEEM
+ 0xfd60: (0x0633, 0x0645, 0x062d,), #  ARABIC LIGATURE SEEN WITH MEEM WITH HAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd5f: (0x0633, 0x0645, 0x062d,), #  ARABIC LIGATURE SEEN WITH MEEM WITH HAH FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd6b: (0x0633, 0x06db, 0x0645, 0x062e,), #  ARABIC LIGATURE SHEEN WITH MEEM WITH KHAH INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM, ARABIC LETTER KHAH	# →‎شمخ‎→
+ 0xfd6a: (0x0633, 0x06db, 0x0645, 0x062e,), #  ARABIC LIGATURE SHEEN WITH MEEM WITH KHAH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM, ARABIC LETTER KHAH	# →‎شمخ‎→
+ 0xfd63: (0x0633, 0x0645, 0x0645,), #  ARABIC LIGATURE SEEN WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd62: (0x0633, 0x0645, 0x0645,), #  ARABIC LIGATURE SEEN WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd6d: (0x0633, 0x06db, 0x0645, 0x0645,), #  ARABIC LIGATURE SHEEN WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM, ARABIC LETTER MEEM	# →‎شمم‎→
+ 0xfd6c: (0x0633, 0x06db, 0x0645, 0x0645,), #  ARABIC LIGATURE SHEEN WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM, ARABIC LETTER MEEM	# →‎شمم‎→
+ 0xfd17: (0x0633, 0x0649,), #  ARABIC LIGATURE SEEN WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER ALEF MAKSURA
+ 0xfcfb: (0x0633, 0x0649,), #  ARABIC LIGATURE SEEN WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER ALEF MAKSURA
+ 0xfd18: (0x0633, 0x0649,), #  ARABIC LIGATURE SEEN WITH YEH FINAL FORM → ARABIC LETTER SEEN, ARABIC LETTER ALEF MAKSURA	# →‎سي‎→
+ 0xfcfc: (0x0633, 0x0649,), #  ARABIC LIGATURE SEEN WITH YEH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC LETTER ALEF MAKSURA	# →‎سي‎→
+ 0xfd19: (0x0633, 0x06db, 0x0649,), #  ARABIC LIGATURE SHEEN WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎شى‎→
+ 0xfcfd: (0x0633, 0x06db, 0x0649,), #  ARABIC LIGATURE SHEEN WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎شى‎→
+ 0xfd1a: (0x0633, 0x06db, 0x0649,), #  ARABIC LIGATURE SHEEN WITH YEH FINAL FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎شي‎→
+ 0xfcfe: (0x0633, 0x06db, 0x0649,), #  ARABIC LIGATURE SHEEN WITH YEH ISOLATED FORM → ARABIC LETTER SEEN, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎شي‎→
+ 0x102f2: (0x0635,), #  COPTIC EPACT NUMBER NINETY → ARABIC LETTER SAD
+ 0x1ee11: (0x0635,), #  ARABIC MATHEMATICAL SAD → ARABIC LETTER SAD
+ 0x1ee31: (0x0635,), #  ARABIC MATHEMATICAL INITIAL SAD → ARABIC LETTER SAD
+ 0x1ee51: (0x0635,), #  ARABIC MATHEMATICAL TAILED SAD → ARABIC LETTER SAD
+ 0x1ee71: (0x0635,), #  ARABIC MATHEMATICAL STRETCHED SAD → ARABIC LETTER SAD
+ 0x1ee91: (0x0635,), #  ARABIC MATHEMATICAL LOOPED SAD → ARABIC LETTER SAD
+ 0x1eeb1: (0x0635,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK SAD → ARABIC LETTER SAD
+ 0xfebb: (0x0635,), #  ARABIC LETTER SAD INITIAL FORM → ARABIC LETTER SAD
+ 0xfebc: (0x0635,), #  ARABIC LETTER SAD MEDIAL FORM → ARABIC LETTER SAD
+ 0xfeba: (0x0635,), #  ARABIC LETTER SAD FINAL FORM → ARABIC LETTER SAD
+ 0xfeb9: (0x0635,), #  ARABIC LETTER SAD ISOLATED FORM → ARABIC LETTER SAD
+ 0x069e: (0x0635, 0x06db,), #  ARABIC LETTER SAD WITH THREE DOTS ABOVE → ARABIC LETTER SAD, ARABIC SMALL HIGH THREE DOTS
+ 0x08af: (0x0635, 0x0324, 0x0323,), #  ARABIC LETTER SAD WITH THREE DOTS BELOW → ARABIC LETTER SAD, COMBINING DIAERESIS BELOW, COMBINING DOT BELOW	# →‎ص࣮࣭‎→
+ 0xfcb1: (0x0635, 0x062d,), #  ARABIC LIGATURE SAD WITH HAH INITIAL FORM → ARABIC LETTER SAD, ARABIC LETTER HAH
+ 0xfc20: (0x0635, 0x062d,), #  ARABIC LIGATURE SAD WITH HAH ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER HAH
+ 0xfd65: (0x0635, 0x062d, 0x062d,), #  ARABIC LIGATURE SAD WITH HAH WITH HAH INITIAL FORM → ARABIC LETTER SAD, ARABIC LETTER HAH, ARABIC LETTER HAH
+ 0xfd64: (0x0635, 0x062d, 0x062d,), #  ARABIC LIGATURE SAD WITH HAH WITH HAH FINAL FORM → ARABIC LETTER SAD, ARABIC LETTER HAH, ARABIC LETTER HAH
+ 0xfda9: (0x0635, 0x062d, 0x0649,), #  ARABIC LIGATURE SAD WITH HAH WITH YEH FINAL FORM → ARABIC LETTER SAD, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎صحي‎→
+ 0xfcb2: (0x0635, 0x062e,), #  ARABIC LIGATURE SAD WITH KHAH INITIAL FORM → ARABIC LETTER SAD, ARABIC LETTER KHAH
+ 0xfd2b: (0x0635, 0x0631,), #  ARABIC LIGATURE SAD WITH REH FINAL FORM → ARABIC LETTER SAD, ARABIC LETTER REH
+ 0xfd0f: (0x0635, 0x0631,), #  ARABIC LIGATURE SAD WITH REH ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER REH
+ 0xfdf5: (0x0635, 0x0644, 0x0639, 0x0645,), #  ARABIC LIGATURE SALAM ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER LAM, ARABIC LETTER AIN, ARABIC LETTER MEEM
+ 0xfdf9: (0x0635, 0x0644, 0x0649,), #  ARABIC LIGATURE SALLA ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA
+ 0xfdf0: (0x0635, 0x0644, 0x0649,), #  ARABIC LIGATURE SALLA USED AS KORANIC STOP SIGN ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA	# →‎صلے‎→
+ 0xfdfa: (0x0635, 0x0644, 0x0649, 0x0020, 0x006c, 0x0644, 0x0644, 0x006f, 0x0020, 0x0639, 0x0644, 0x0649, 0x006f, 0x0020, 0x0648, 0x0633, 0x0644, 0x0645,), #  ARABIC LIGATURE SALLALLAHOU ALAYHE WASALLAM → ARABIC LETTER SAD, ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA, SPACE, LATIN SMALL LETTER L, ARABIC LETTER LAM, ARABIC LETTER LAM, LATIN SMALL LETTER O, SPACE, ARABIC LETTER AIN, ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA, LATIN SMALL LETTER O, SPACE, ARABIC LETTER WAW, ARABIC LETTER SEEN, ARABIC LETTER LAM, ARABIC LETTER MEEM	# →‎صلى الله عليه وسلم‎→
+ 0xfcb3: (0x0635, 0x0645,), #  ARABIC LIGATURE SAD WITH MEEM INITIAL FORM → ARABIC LETTER SAD, ARABIC LETTER MEEM
+ 0xfc21: (0x0635, 0x0645,), #  ARABIC LIGATURE SAD WITH MEEM ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER MEEM
+ 0xfdc5: (0x0635, 0x0645, 0x0645,), #  ARABIC LIGATURE SAD WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER SAD, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd66: (0x0635, 0x0645, 0x0645,), #  ARABIC LIGATURE SAD WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER SAD, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd21: (0x0635, 0x0649,), #  ARABIC LIGATURE SAD WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER SAD, ARABIC LETTER ALEF MAKSURA
+ 0xfd05: (0x0635, 0x0649,), #  ARABIC LIGATURE SAD WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER ALEF MAKSURA
+ 0xfd22: (0x0635, 0x0649,), #  ARABIC LIGATURE SAD WITH YEH FINAL FORM → ARABIC LETTER SAD, ARABIC LETTER ALEF MAKSURA	# →‎صي‎→
+ 0xfd06: (0x0635, 0x0649,), #  ARABIC LIGATURE SAD WITH YEH ISOLATED FORM → ARABIC LETTER SAD, ARABIC LETTER ALEF MAKSURA	# →‎صي‎→
+ 0x1ee19: (0x0636,), #  ARABIC MATHEMATICAL DAD → ARABIC LETTER DAD
+ 0x1ee39: (0x0636,), #  ARABIC MATHEMATICAL INITIAL DAD → ARABIC LETTER DAD
+ 0x1ee59: (0x0636,), #  ARABIC MATHEMATICAL TAILED DAD → ARABIC LETTER DAD
+ 0x1ee79: (0x0636,), #  ARABIC MATHEMATICAL STRETCHED DAD → ARABIC LETTER DAD
+ 0x1ee99: (0x0636,), #  ARABIC MATHEMATICAL LOOPED DAD → ARABIC LETTER DAD
+ 0x1eeb9: (0x0636,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK DAD → ARABIC LETTER DAD
+ 0xfebf: (0x0636,), #  ARABIC LETTER DAD INITIAL FORM → ARABIC LETTER DAD
+ 0xfec0: (0x0636,), #  ARABIC LETTER DAD MEDIAL FORM → ARABIC LETTER DAD
+ 0xfebe: (0x0636,), #  ARABIC LETTER DAD FINAL FORM → ARABIC LETTER DAD
+ 0xfebd: (0x0636,), #  ARABIC LETTER DAD ISOLATED FORM → ARABIC LETTER DAD
+ 0xfcb4: (0x0636, 0x062c,), #  ARABIC LIGATURE DAD WITH JEEM INITIAL FORM → ARABIC LETTER DAD, ARABIC LETTER JEEM
+ 0xfc22: (0x0636, 0x062c,), #  ARABIC LIGATURE DAD WITH JEEM ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER JEEM
+ 0xfcb5: (0x0636, 0x062d,), #  ARABIC LIGATURE DAD WITH HAH INITIAL FORM → ARABIC LETTER DAD, ARABIC LETTER HAH
+ 0xfc23: (0x0636, 0x062d,), #  ARABIC LIGATURE DAD WITH HAH ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER HAH
+ 0xfd6e: (0x0636, 0x062d, 0x0649,), #  ARABIC LIGATURE DAD WITH HAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER DAD, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA
+ 0xfdab: (0x0636, 0x062d, 0x0649,), #  ARABIC LIGATURE DAD WITH HAH WITH YEH FINAL FORM → ARABIC LETTER DAD, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎ضحي‎→
+ 0xfcb6: (0x0636, 0x062e,), #  ARABIC LIGATURE DAD WITH KHAH INITIAL FORM → ARABIC LETTER DAD, ARABIC LETTER KHAH
+ 0xfc24: (0x0636, 0x062e,), #  ARABIC LIGATURE DAD WITH KHAH ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER KHAH
+ 0xfd70: (0x0636, 0x062e, 0x0645,), #  ARABIC LIGATURE DAD WITH KHAH WITH MEEM INITIAL FORM → ARABIC LETTER DAD, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfd6f: (0x0636, 0x062e, 0x0645,), #  ARABIC LIGATURE DAD WITH KHAH WITH MEEM FINAL FORM → ARABIC LETTER DAD, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfd2c: (0x0636, 0x0631,), #  ARABIC LIGATURE DAD WITH REH FINAL FORM → ARABIC LETTER DAD, ARABIC LETTER REH
+ 0xfd10: (0x0636, 0x0631,), #  ARABIC LIGATURE DAD WITH REH ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER REH
+ 0xfcb7: (0x0636, 0x0645,), #  ARABIC LIGATURE DAD WITH MEEM INITIAL FORM → ARABIC LETTER DAD, ARABIC LETTER MEEM
+ 0xfc25: (0x0636, 0x0645,), #  ARABIC LIGATURE DAD WITH MEEM ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER MEEM
+ 0xfd23: (0x0636, 0x0649,), #  ARABIC LIGATURE DAD WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER DAD, ARABIC LETTER ALEF MAKSURA
+ 0xfd07: (0x0636, 0x0649,), #  ARABIC LIGATURE DAD WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER ALEF MAKSURA
+ 0xfd24: (0x0636, 0x0649,), #  ARABIC LIGATURE DAD WITH YEH FINAL FORM → ARABIC LETTER DAD, ARABIC LETTER ALEF MAKSURA	# →‎ضي‎→
+ 0xfd08: (0x0636, 0x0649,), #  ARABIC LIGATURE DAD WITH YEH ISOLATED FORM → ARABIC LETTER DAD, ARABIC LETTER ALEF MAKSURA	# →‎ضي‎→
+ 0x102e8: (0x0637,), #  COPTIC EPACT DIGIT EIGHT → ARABIC LETTER TAH
+ 0x1ee08: (0x0637,), #  ARABIC MATHEMATICAL TAH → ARABIC LETTER TAH
+ 0x1ee68: (0x0637,), #  ARABIC MATHEMATICAL STRETCHED TAH → ARABIC LETTER TAH
+ 0x1ee88: (0x0637,), #  ARABIC MATHEMATICAL LOOPED TAH → ARABIC LETTER TAH
+ 0x1eea8: (0x0637,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK TAH → ARABIC LETTER TAH
+ 0xfec3: (0x0637,), #  ARABIC LETTER TAH INITIAL FORM → ARABIC LETTER TAH
+ 0xfec4: (0x0637,), #  ARABIC LETTER TAH MEDIAL FORM → ARABIC LETTER TAH
+ 0xfec2: (0x0637,), #  ARABIC LETTER TAH FINAL FORM → ARABIC LETTER TAH
+ 0xfec1: (0x0637,), #  ARABIC LETTER TAH ISOLATED FORM → ARABIC LETTER TAH
+ 0x069f: (0x0637, 0x06db,), #  ARABIC LETTER TAH WITH THREE DOTS ABOVE → ARABIC LETTER TAH, ARABIC SMALL HIGH THREE DOTS
+ 0xfcb8: (0x0637, 0x062d,), #  ARABIC LIGATURE TAH WITH HAH INITIAL FORM → ARABIC LETTER TAH, ARABIC LETTER HAH
+ 0xfc26: (0x0637, 0x062d,), #  ARABIC LIGATURE TAH WITH HAH ISOLATED FORM → ARABIC LETTER TAH, ARABIC LETTER HAH
+ 0xfd33: (0x0637, 0x0645,), #  ARABIC LIGATURE TAH WITH MEEM INITIAL FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM
+ 0xfd3a: (0x0637, 0x0645,), #  ARABIC LIGATURE TAH WITH MEEM MEDIAL FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM
+ 0xfc27: (0x0637, 0x0645,), #  ARABIC LIGATURE TAH WITH MEEM ISOLATED FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM
+ 0xfd72: (0x0637, 0x0645, 0x062d,), #  ARABIC LIGATURE TAH WITH MEEM WITH HAH INITIAL FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd71: (0x0637, 0x0645, 0x062d,), #  ARABIC LIGATURE TAH WITH MEEM WITH HAH FINAL FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd73: (0x0637, 0x0645, 0x0645,), #  ARABIC LIGATURE TAH WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd74: (0x0637, 0x0645, 0x0649,), #  ARABIC LIGATURE TAH WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER TAH, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎طمي‎→
+ 0xfd11: (0x0637, 0x0649,), #  ARABIC LIGATURE TAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER TAH, ARABIC LETTER ALEF MAKSURA
+ 0xfcf5: (0x0637, 0x0649,), #  ARABIC LIGATURE TAH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER TAH, ARABIC LETTER ALEF MAKSURA
+ 0xfd12: (0x0637, 0x0649,), #  ARABIC LIGATURE TAH WITH YEH FINAL FORM → ARABIC LETTER TAH, ARABIC LETTER ALEF MAKSURA	# →‎طي‎→
+ 0xfcf6: (0x0637, 0x0649,), #  ARABIC LIGATURE TAH WITH YEH ISOLATED FORM → ARABIC LETTER TAH, ARABIC LETTER ALEF MAKSURA	# →‎طي‎→
+ 0x1ee1a: (0x0638,), #  ARABIC MATHEMATICAL ZAH → ARABIC LETTER ZAH
+ 0x1ee7a: (0x0638,), #  ARABIC MATHEMATICAL STRETCHED ZAH → ARABIC LETTER ZAH
+ 0x1ee9a: (0x0638,), #  ARABIC MATHEMATICAL LOOPED ZAH → ARABIC LETTER ZAH
+ 0x1eeba: (0x0638,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK ZAH → ARABIC LETTER ZAH
+ 0xfec7: (0x0638,), #  ARABIC LETTER ZAH INITIAL FORM → ARABIC LETTER ZAH
+ 0xfec8: (0x0638,), #  ARABIC LETTER ZAH MEDIAL FORM → ARABIC LETTER ZAH
+ 0xfec6: (0x0638,), #  ARABIC LETTER ZAH FINAL FORM → ARABIC LETTER ZAH
+ 0xfec5: (0x0638,), #  ARABIC LETTER ZAH ISOLATED FORM → ARABIC LETTER ZAH
+ 0xfcb9: (0x0638, 0x0645,), #  ARABIC LIGATURE ZAH WITH MEEM INITIAL FORM → ARABIC LETTER ZAH, ARABIC LETTER MEEM
+ 0xfd3b: (0x0638, 0x0645,), #  ARABIC LIGATURE ZAH WITH MEEM MEDIAL FORM → ARABIC LETTER ZAH, ARABIC LETTER MEEM
+ 0xfc28: (0x0638, 0x0645,), #  ARABIC LIGATURE ZAH WITH MEEM ISOLATED FORM → ARABIC LETTER ZAH, ARABIC LETTER MEEM
+ 0x060f: (0x0639,), #  ARABIC SIGN MISRA → ARABIC LETTER AIN
+ 0x1ee0f: (0x0639,), #  ARABIC MATHEMATICAL AIN → ARABIC LETTER AIN
+ 0x1ee2f: (0x0639,), #  ARABIC MATHEMATICAL INITIAL AIN → ARABIC LETTER AIN
+ 0x1ee4f: (0x0639,), #  ARABIC MATHEMATICAL TAILED AIN → ARABIC LETTER AIN
+ 0x1ee6f: (0x0639,), #  ARABIC MATHEMATICAL STRETCHED AIN → ARABIC LETTER AIN
+ 0x1ee8f: (0x0639,), #  ARABIC MATHEMATICAL LOOPED AIN → ARABIC LETTER AIN
+ 0x1eeaf: (0x0639,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK AIN → ARABIC LETTER AIN
+ 0xfecb: (0x0639,), #  ARABIC LETTER AIN INITIAL FORM → ARABIC LETTER AIN
+ 0xfecc: (0x0639,), #  ARABIC LETTER AIN MEDIAL FORM → ARABIC LETTER AIN
+ 0xfeca: (0x0639,), #  ARABIC LETTER AIN FINAL FORM → ARABIC LETTER AIN
+ 0xfec9: (0x0639,), #  ARABIC LETTER AIN ISOLATED FORM → ARABIC LETTER AIN
+ 0xfcba: (0x0639, 0x062c,), #  ARABIC LIGATURE AIN WITH JEEM INITIAL FORM → ARABIC LETTER AIN, ARABIC LETTER JEEM
+ 0xfc29: (0x0639, 0x062c,), #  ARABIC LIGATURE AIN WITH JEEM ISOLATED FORM → ARABIC LETTER AIN, ARABIC LETTER JEEM
+ 0xfdc4: (0x0639, 0x062c, 0x0645,), #  ARABIC LIGATURE AIN WITH JEEM WITH MEEM INITIAL FORM → ARABIC LETTER AIN, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfd75: (0x0639, 0x062c, 0x0645,), #  ARABIC LIGATURE AIN WITH JEEM WITH MEEM FINAL FORM → ARABIC LETTER AIN, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfdf7: (0x0639, 0x0644, 0x0649, 0x006f,), #  ARABIC LIGATURE ALAYHE ISOLATED FORM → ARABIC LETTER AIN, ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA, LATIN SMALL LETTER O	# →‎عليه‎→
+ 0xfcbb: (0x0639, 0x0645,), #  ARABIC LIGATURE AIN WITH MEEM INITIAL FORM → ARABIC LETTER AIN, ARABIC LETTER MEEM
+ 0xfc2a: (0x0639, 0x0645,), #  ARABIC LIGATURE AIN WITH MEEM ISOLATED FORM → ARABIC LETTER AIN, ARABIC LETTER MEEM
+ 0xfd77: (0x0639, 0x0645, 0x0645,), #  ARABIC LIGATURE AIN WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER AIN, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd76: (0x0639, 0x0645, 0x0645,), #  ARABIC LIGATURE AIN WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER AIN, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd78: (0x0639, 0x0645, 0x0649,), #  ARABIC LIGATURE AIN WITH MEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER AIN, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfdb6: (0x0639, 0x0645, 0x0649,), #  ARABIC LIGATURE AIN WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER AIN, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎عمي‎→
+ 0xfd13: (0x0639, 0x0649,), #  ARABIC LIGATURE AIN WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER AIN, ARABIC LETTER ALEF MAKSURA
+ 0xfcf7: (0x0639, 0x0649,), #  ARABIC LIGATURE AIN WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER AIN, ARABIC LETTER ALEF MAKSURA
+ 0xfd14: (0x0639, 0x0649,), #  ARABIC LIGATURE AIN WITH YEH FINAL FORM → ARABIC LETTER AIN, ARABIC LETTER ALEF MAKSURA	# →‎عي‎→
+ 0xfcf8: (0x0639, 0x0649,), #  ARABIC LIGATURE AIN WITH YEH ISOLATED FORM → ARABIC LETTER AIN, ARABIC LETTER ALEF MAKSURA	# →‎عي‎→
+ 0x1ee1b: (0x063a,), #  ARABIC MATHEMATICAL GHAIN → ARABIC LETTER GHAIN
+ 0x1ee3b: (0x063a,), #  ARABIC MATHEMATICAL INITIAL GHAIN → ARABIC LETTER GHAIN
+ 0x1ee5b: (0x063a,), #  ARABIC MATHEMATICAL TAILED GHAIN → ARABIC LETTER GHAIN
+ 0x1ee7b: (0x063a,), #  ARABIC MATHEMATICAL STRETCHED GHAIN → ARABIC LETTER GHAIN
+ 0x1ee9b: (0x063a,), #  ARABIC MATHEMATICAL LOOPED GHAIN → ARABIC LETTER GHAIN
+ 0x1eebb: (0x063a,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK GHAIN → ARABIC LETTER GHAIN
+ 0xfecf: (0x063a,), #  ARABIC LETTER GHAIN INITIAL FORM → ARABIC LETTER GHAIN
+ 0xfed0: (0x063a,), #  ARABIC LETTER GHAIN MEDIAL FORM → ARABIC LETTER GHAIN
+ 0xfece: (0x063a,), #  ARABIC LETTER GHAIN FINAL FORM → ARABIC LETTER GHAIN
+ 0xfecd: (0x063a,), #  ARABIC LETTER GHAIN ISOLATED FORM → ARABIC LETTER GHAIN
+ 0xfcbc: (0x063a, 0x062c,), #  ARABIC LIGATURE GHAIN WITH JEEM INITIAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER JEEM
+ 0xfc2b: (0x063a, 0x062c,), #  ARABIC LIGATURE GHAIN WITH JEEM ISOLATED FORM → ARABIC LETTER GHAIN, ARABIC LETTER JEEM
+ 0xfcbd: (0x063a, 0x0645,), #  ARABIC LIGATURE GHAIN WITH MEEM INITIAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER MEEM
+ 0xfc2c: (0x063a, 0x0645,), #  ARABIC LIGATURE GHAIN WITH MEEM ISOLATED FORM → ARABIC LETTER GHAIN, ARABIC LETTER MEEM
+ 0xfd79: (0x063a, 0x0645, 0x0645,), #  ARABIC LIGATURE GHAIN WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfd7b: (0x063a, 0x0645, 0x0649,), #  ARABIC LIGATURE GHAIN WITH MEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd7a: (0x063a, 0x0645, 0x0649,), #  ARABIC LIGATURE GHAIN WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎غمي‎→
+ 0xfd15: (0x063a, 0x0649,), #  ARABIC LIGATURE GHAIN WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER ALEF MAKSURA
+ 0xfcf9: (0x063a, 0x0649,), #  ARABIC LIGATURE GHAIN WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER GHAIN, ARABIC LETTER ALEF MAKSURA
+ 0xfd16: (0x063a, 0x0649,), #  ARABIC LIGATURE GHAIN WITH YEH FINAL FORM → ARABIC LETTER GHAIN, ARABIC LETTER ALEF MAKSURA	# →‎غي‎→
+ 0xfcfa: (0x063a, 0x0649,), #  ARABIC LIGATURE GHAIN WITH YEH ISOLATED FORM → ARABIC LETTER GHAIN, ARABIC LETTER ALEF MAKSURA	# →‎غي‎→
+ 0x1ee10: (0x0641,), #  ARABIC MATHEMATICAL FEH → ARABIC LETTER FEH
+ 0x1ee30: (0x0641,), #  ARABIC MATHEMATICAL INITIAL FEH → ARABIC LETTER FEH
+ 0x1ee70: (0x0641,), #  ARABIC MATHEMATICAL STRETCHED FEH → ARABIC LETTER FEH
+ 0x1ee90: (0x0641,), #  ARABIC MATHEMATICAL LOOPED FEH → ARABIC LETTER FEH
+ 0x1eeb0: (0x0641,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK FEH → ARABIC LETTER FEH
+ 0xfed3: (0x0641,), #  ARABIC LETTER FEH INITIAL FORM → ARABIC LETTER FEH
+ 0xfed4: (0x0641,), #  ARABIC LETTER FEH MEDIAL FORM → ARABIC LETTER FEH
+ 0xfed2: (0x0641,), #  ARABIC LETTER FEH FINAL FORM → ARABIC LETTER FEH
+ 0xfed1: (0x0641,), #  ARABIC LETTER FEH ISOLATED FORM → ARABIC LETTER FEH
+ 0x06a7: (0x0641,), #  ARABIC LETTER QAF WITH DOT ABOVE → ARABIC LETTER FEH
+ 0xfcbe: (0x0641, 0x062c,), #  ARABIC LIGATURE FEH WITH JEEM INITIAL FORM → ARABIC LETTER FEH, ARABIC LETTER JEEM
+ 0xfc2d: (0x0641, 0x062c,), #  ARABIC LIGATURE FEH WITH JEEM ISOLATED FORM → ARABIC LETTER FEH, ARABIC LETTER JEEM
+ 0xfcbf: (0x0641, 0x062d,), #  ARABIC LIGATURE FEH WITH HAH INITIAL FORM → ARABIC LETTER FEH, ARABIC LETTER HAH
+ 0xfc2e: (0x0641, 0x062d,), #  ARABIC LIGATURE FEH WITH HAH ISOLATED FORM → ARABIC LETTER FEH, ARABIC LETTER HAH
+ 0xfcc0: (0x0641, 0x062e,), #  ARABIC LIGATURE FEH WITH KHAH INITIAL FORM → ARABIC LETTER FEH, ARABIC LETTER KHAH
+ 0xfc2f: (0x0641, 0x062e,), #  ARABIC LIGATURE FEH WITH KHAH ISOLATED FORM → ARABIC LETTER FEH, ARABIC LETTER KHAH
+ 0xfd7d: (0x0641, 0x062e, 0x0645,), #  ARABIC LIGATURE FEH WITH KHAH WITH MEEM INITIAL FORM → ARABIC LETTER FEH, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfd7c: (0x0641, 0x062e, 0x0645,), #  ARABIC LIGATURE FEH WITH KHAH WITH MEEM FINAL FORM → ARABIC LETTER FEH, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfcc1: (0x0641, 0x0645,), #  ARABIC LIGATURE FEH WITH MEEM INITIAL FORM → ARABIC LETTER FEH, ARABIC LETTER MEEM
+ 0xfc30: (0x0641, 0x0645,), #  ARABIC LIGATURE FEH WITH MEEM ISOLATED FORM → ARABIC LETTER FEH, ARABIC LETTER MEEM
+ 0xfdc1: (0x0641, 0x0645, 0x0649,), #  ARABIC LIGATURE FEH WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER FEH, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎فمي‎→
+ 0xfc7c: (0x0641, 0x0649,), #  ARABIC LIGATURE FEH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER FEH, ARABIC LETTER ALEF MAKSURA
+ 0xfc31: (0x0641, 0x0649,), #  ARABIC LIGATURE FEH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER FEH, ARABIC LETTER ALEF MAKSURA
+ 0xfc7d: (0x0641, 0x0649,), #  ARABIC LIGATURE FEH WITH YEH FINAL FORM → ARABIC LETTER FEH, ARABIC LETTER ALEF MAKSURA	# →‎في‎→
+ 0xfc32: (0x0641, 0x0649,), #  ARABIC LIGATURE FEH WITH YEH ISOLATED FORM → ARABIC LETTER FEH, ARABIC LETTER ALEF MAKSURA	# →‎في‎→
+ 0x1ee1e: (0x06a1,), #  ARABIC MATHEMATICAL DOTLESS FEH → ARABIC LETTER DOTLESS FEH
+ 0x1ee7e: (0x06a1,), #  ARABIC MATHEMATICAL STRETCHED DOTLESS FEH → ARABIC LETTER DOTLESS FEH
+ 0x08bb: (0x06a1,), #  ARABIC LETTER AFRICAN FEH → ARABIC LETTER DOTLESS FEH
+ 0x066f: (0x06a1,), #  ARABIC LETTER DOTLESS QAF → ARABIC LETTER DOTLESS FEH
+ 0x1ee1f: (0x06a1,), #  ARABIC MATHEMATICAL DOTLESS QAF → ARABIC LETTER DOTLESS FEH	# →‎ٯ‎→
+ 0x1ee5f: (0x06a1,), #  ARABIC MATHEMATICAL TAILED DOTLESS QAF → ARABIC LETTER DOTLESS FEH	# →‎ٯ‎→
+ 0x08bc: (0x06a1,), #  ARABIC LETTER AFRICAN QAF → ARABIC LETTER DOTLESS FEH	# →‎ٯ‎→
+ 0x06a4: (0x06a1, 0x06db,), #  ARABIC LETTER VEH → ARABIC LETTER DOTLESS FEH, ARABIC SMALL HIGH THREE DOTS
+ 0xfb6c: (0x06a1, 0x06db,), #  ARABIC LETTER VEH INITIAL FORM → ARABIC LETTER DOTLESS FEH, ARABIC SMALL HIGH THREE DOTS	# →‎ڤ‎→
+ 0xfb6d: (0x06a1, 0x06db,), #  ARABIC LETTER VEH MEDIAL FORM → ARABIC LETTER DOTLESS FEH, ARABIC SMALL HIGH THREE DOTS	# →‎ڤ‎→
+ 0xfb6b: (0x06a1, 0x06db,), #  ARABIC LETTER VEH FINAL FORM → ARABIC LETTER DOTLESS FEH, ARABIC SMALL HIGH THREE DOTS	# →‎ڤ‎→
+ 0xfb6a: (0x06a1, 0x06db,), #  ARABIC LETTER VEH ISOLATED FORM → ARABIC LETTER DOTLESS FEH, ARABIC SMALL HIGH THREE DOTS	# →‎ڤ‎→
+ 0x06a8: (0x06a1, 0x06db,), #  ARABIC LETTER QAF WITH THREE DOTS ABOVE → ARABIC LETTER DOTLESS FEH, ARABIC SMALL HIGH THREE DOTS	# →‎ڤ‎→
+ 0x08a4: (0x06a2, 0x06db,), #  ARABIC LETTER FEH WITH DOT BELOW AND THREE DOTS ABOVE → ARABIC LETTER FEH WITH DOT MOVED BELOW, ARABIC SMALL HIGH THREE DOTS
+ 0xfb70: (0x06a6,), #  ARABIC LETTER PEHEH INITIAL FORM → ARABIC LETTER PEHEH
+ 0xfb71: (0x06a6,), #  ARABIC LETTER PEHEH MEDIAL FORM → ARABIC LETTER PEHEH
+ 0xfb6f: (0x06a6,), #  ARABIC LETTER PEHEH FINAL FORM → ARABIC LETTER PEHEH
+ 0xfb6e: (0x06a6,), #  ARABIC LETTER PEHEH ISOLATED FORM → ARABIC LETTER PEHEH
+ 0x1ee12: (0x0642,), #  ARABIC MATHEMATICAL QAF → ARABIC LETTER QAF
+ 0x1ee32: (0x0642,), #  ARABIC MATHEMATICAL INITIAL QAF → ARABIC LETTER QAF
+ 0x1ee52: (0x0642,), #  ARABIC MATHEMATICAL TAILED QAF → ARABIC LETTER QAF
+ 0x1ee72: (0x0642,), #  ARABIC MATHEMATICAL STRETCHED QAF → ARABIC LETTER QAF
+ 0x1ee92: (0x0642,), #  ARABIC MATHEMATICAL LOOPED QAF → ARABIC LETTER QAF
+ 0x1eeb2: (0x0642,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK QAF → ARABIC LETTER QAF
+ 0xfed7: (0x0642,), #  ARABIC LETTER QAF INITIAL FORM → ARABIC LETTER QAF
+ 0xfed8: (0x0642,), #  ARABIC LETTER QAF MEDIAL FORM → ARABIC LETTER QAF
+ 0xfed6: (0x0642,), #  ARABIC LETTER QAF FINAL FORM → ARABIC LETTER QAF
+ 0xfed5: (0x0642,), #  ARABIC LETTER QAF ISOLATED FORM → ARABIC LETTER QAF
+ 0xfcc2: (0x0642, 0x062d,), #  ARABIC LIGATURE QAF WITH HAH INITIAL FORM → ARABIC LETTER QAF, ARABIC LETTER HAH
+ 0xfc33: (0x0642, 0x062d,), #  ARABIC LIGATURE QAF WITH HAH ISOLATED FORM → ARABIC LETTER QAF, ARABIC LETTER HAH
+ 0xfdf1: (0x0642, 0x0644, 0x0649,), #  ARABIC LIGATURE QALA USED AS KORANIC STOP SIGN ISOLATED FORM → ARABIC LETTER QAF, ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA	# →‎قلے‎→
+ 0xfcc3: (0x0642, 0x0645,), #  ARABIC LIGATURE QAF WITH MEEM INITIAL FORM → ARABIC LETTER QAF, ARABIC LETTER MEEM
+ 0xfc34: (0x0642, 0x0645,), #  ARABIC LIGATURE QAF WITH MEEM ISOLATED FORM → ARABIC LETTER QAF, ARABIC LETTER MEEM
+ 0xfdb4: (0x0642, 0x0645, 0x062d,), #  ARABIC LIGATURE QAF WITH MEEM WITH HAH INITIAL FORM → ARABIC LETTER QAF, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd7e: (0x0642, 0x0645, 0x062d,), #  ARABIC LIGATURE QAF WITH MEEM WITH HAH FINAL FORM → ARABIC LETTER QAF, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd7f: (0x0642, 0x0645, 0x0645,), #  ARABIC LIGATURE QAF WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER QAF, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfdb2: (0x0642, 0x0645, 0x0649,), #  ARABIC LIGATURE QAF WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER QAF, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎قمي‎→
+ 0xfc7e: (0x0642, 0x0649,), #  ARABIC LIGATURE QAF WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER QAF, ARABIC LETTER ALEF MAKSURA
+ 0xfc35: (0x0642, 0x0649,), #  ARABIC LIGATURE QAF WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER QAF, ARABIC LETTER ALEF MAKSURA
+ 0xfc7f: (0x0642, 0x0649,), #  ARABIC LIGATURE QAF WITH YEH FINAL FORM → ARABIC LETTER QAF, ARABIC LETTER ALEF MAKSURA	# →‎قي‎→
+ 0xfc36: (0x0642, 0x0649,), #  ARABIC LIGATURE QAF WITH YEH ISOLATED FORM → ARABIC LETTER QAF, ARABIC LETTER ALEF MAKSURA	# →‎قي‎→
+ 0x1ee0a: (0x0643,), #  ARABIC MATHEMATICAL KAF → ARABIC LETTER KAF
+ 0x1ee2a: (0x0643,), #  ARABIC MATHEMATICAL INITIAL KAF → ARABIC LETTER KAF
+ 0x1ee6a: (0x0643,), #  ARABIC MATHEMATICAL STRETCHED KAF → ARABIC LETTER KAF
+ 0xfedb: (0x0643,), #  ARABIC LETTER KAF INITIAL FORM → ARABIC LETTER KAF
+ 0xfedc: (0x0643,), #  ARABIC LETTER KAF MEDIAL FORM → ARABIC LETTER KAF
+ 0xfeda: (0x0643,), #  ARABIC LETTER KAF FINAL FORM → ARABIC LETTER KAF
+ 0xfed9: (0x0643,), #  ARABIC LETTER KAF ISOLATED FORM → ARABIC LETTER KAF
+ 0x06a9: (0x0643,), #  ARABIC LETTER KEHEH → ARABIC LETTER KAF
+ 0xfb90: (0x0643,), #  ARABIC LETTER KEHEH INITIAL FORM → ARABIC LETTER KAF	# →‎ک‎→
+ 0xfb91: (0x0643,), #  ARABIC LETTER KEHEH MEDIAL FORM → ARABIC LETTER KAF	# →‎ک‎→
+ 0xfb8f: (0x0643,), #  ARABIC LETTER KEHEH FINAL FORM → ARABIC LETTER KAF	# →‎ک‎→
+ 0xfb8e: (0x0643,), #  ARABIC LETTER KEHEH ISOLATED FORM → ARABIC LETTER KAF	# →‎ک‎→
+ 0x06aa: (0x0643,), #  ARABIC LETTER SWASH KAF → ARABIC LETTER KAF
+ 0x06ad: (0x0643, 0x06db,), #  ARABIC LETTER NG → ARABIC LETTER KAF, ARABIC SMALL HIGH THREE DOTS
+ 0xfbd5: (0x0643, 0x06db,), #  ARABIC LETTER NG INITIAL FORM → ARABIC LETTER KAF, ARABIC SMALL HIGH THREE DOTS	# →‎ڭ‎→
+ 0xfbd6: (0x0643, 0x06db,), #  ARABIC LETTER NG MEDIAL FORM → ARABIC LETTER KAF, ARABIC SMALL HIGH THREE DOTS	# →‎ڭ‎→
+ 0xfbd4: (0x0643, 0x06db,), #  ARABIC LETTER NG FINAL FORM → ARABIC LETTER KAF, ARABIC SMALL HIGH THREE DOTS	# →‎ڭ‎→
+ 0xfbd3: (0x0643, 0x06db,), #  ARABIC LETTER NG ISOLATED FORM → ARABIC LETTER KAF, ARABIC SMALL HIGH THREE DOTS	# →‎ڭ‎→
+ 0x0763: (0x0643, 0x06db,), #  ARABIC LETTER KEHEH WITH THREE DOTS ABOVE → ARABIC LETTER KAF, ARABIC SMALL HIGH THREE DOTS	# →‎ڭ‎→
+ 0xfc80: (0x0643, 0x006c,), #  ARABIC LIGATURE KAF WITH ALEF FINAL FORM → ARABIC LETTER KAF, LATIN SMALL LETTER L	# →‎كا‎→
+ 0xfc37: (0x0643, 0x006c,), #  ARABIC LIGATURE KAF WITH ALEF ISOLATED FORM → ARABIC LETTER KAF, LATIN SMALL LETTER L	# →‎كا‎→
+ 0xfcc4: (0x0643, 0x062c,), #  ARABIC LIGATURE KAF WITH JEEM INITIAL FORM → ARABIC LETTER KAF, ARABIC LETTER JEEM
+ 0xfc38: (0x0643, 0x062c,), #  ARABIC LIGATURE KAF WITH JEEM ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER JEEM
+ 0xfcc5: (0x0643, 0x062d,), #  ARABIC LIGATURE KAF WITH HAH INITIAL FORM → ARABIC LETTER KAF, ARABIC LETTER HAH
+ 0xfc39: (0x0643, 0x062d,), #  ARABIC LIGATURE KAF WITH HAH ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER HAH
+ 0xfcc6: (0x0643, 0x062e,), #  ARABIC LIGATURE KAF WITH KHAH INITIAL FORM → ARABIC LETTER KAF, ARABIC LETTER KHAH
+ 0xfc3a: (0x0643, 0x062e,), #  ARABIC LIGATURE KAF WITH KHAH ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER KHAH
+ 0xfcc7: (0x0643, 0x0644,), #  ARABIC LIGATURE KAF WITH LAM INITIAL FORM → ARABIC LETTER KAF, ARABIC LETTER LAM
+ 0xfceb: (0x0643, 0x0644,), #  ARABIC LIGATURE KAF WITH LAM MEDIAL FORM → ARABIC LETTER KAF, ARABIC LETTER LAM
+ 0xfc81: (0x0643, 0x0644,), #  ARABIC LIGATURE KAF WITH LAM FINAL FORM → ARABIC LETTER KAF, ARABIC LETTER LAM
+ 0xfc3b: (0x0643, 0x0644,), #  ARABIC LIGATURE KAF WITH LAM ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER LAM
+ 0xfcc8: (0x0643, 0x0645,), #  ARABIC LIGATURE KAF WITH MEEM INITIAL FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM
+ 0xfcec: (0x0643, 0x0645,), #  ARABIC LIGATURE KAF WITH MEEM MEDIAL FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM
+ 0xfc82: (0x0643, 0x0645,), #  ARABIC LIGATURE KAF WITH MEEM FINAL FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM
+ 0xfc3c: (0x0643, 0x0645,), #  ARABIC LIGATURE KAF WITH MEEM ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM
+ 0xfdc3: (0x0643, 0x0645, 0x0645,), #  ARABIC LIGATURE KAF WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfdbb: (0x0643, 0x0645, 0x0645,), #  ARABIC LIGATURE KAF WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfdb7: (0x0643, 0x0645, 0x0649,), #  ARABIC LIGATURE KAF WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER KAF, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎كمي‎→
+ 0xfc83: (0x0643, 0x0649,), #  ARABIC LIGATURE KAF WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER KAF, ARABIC LETTER ALEF MAKSURA
+ 0xfc3d: (0x0643, 0x0649,), #  ARABIC LIGATURE KAF WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER ALEF MAKSURA
+ 0xfc84: (0x0643, 0x0649,), #  ARABIC LIGATURE KAF WITH YEH FINAL FORM → ARABIC LETTER KAF, ARABIC LETTER ALEF MAKSURA	# →‎كي‎→
+ 0xfc3e: (0x0643, 0x0649,), #  ARABIC LIGATURE KAF WITH YEH ISOLATED FORM → ARABIC LETTER KAF, ARABIC LETTER ALEF MAKSURA	# →‎كي‎→
+ 0x0762: (0x06ac,), #  ARABIC LETTER KEHEH WITH DOT ABOVE → ARABIC LETTER KAF WITH DOT ABOVE
+ 0xfb94: (0x06af,), #  ARABIC LETTER GAF INITIAL FORM → ARABIC LETTER GAF
+ 0xfb95: (0x06af,), #  ARABIC LETTER GAF MEDIAL FORM → ARABIC LETTER GAF
+ 0xfb93: (0x06af,), #  ARABIC LETTER GAF FINAL FORM → ARABIC LETTER GAF
+ 0xfb92: (0x06af,), #  ARABIC LETTER GAF ISOLATED FORM → ARABIC LETTER GAF
+ 0x08b0: (0x06af,), #  ARABIC LETTER GAF WITH INVERTED STROKE → ARABIC LETTER GAF
+ 0x06b4: (0x06af, 0x06db,), #  ARABIC LETTER GAF WITH THREE DOTS ABOVE → ARABIC LETTER GAF, ARABIC SMALL HIGH THREE DOTS
+ 0xfb9c: (0x06b1,), #  ARABIC LETTER NGOEH INITIAL FORM → ARABIC LETTER NGOEH
+ 0xfb9d: (0x06b1,), #  ARABIC LETTER NGOEH MEDIAL FORM → ARABIC LETTER NGOEH
+ 0xfb9b: (0x06b1,), #  ARABIC LETTER NGOEH FINAL FORM → ARABIC LETTER NGOEH
+ 0xfb9a: (0x06b1,), #  ARABIC LETTER NGOEH ISOLATED FORM → ARABIC LETTER NGOEH
+ 0xfb98: (0x06b3,), #  ARABIC LETTER GUEH INITIAL FORM → ARABIC LETTER GUEH
+ 0xfb99: (0x06b3,), #  ARABIC LETTER GUEH MEDIAL FORM → ARABIC LETTER GUEH
+ 0xfb97: (0x06b3,), #  ARABIC LETTER GUEH FINAL FORM → ARABIC LETTER GUEH
+ 0xfb96: (0x06b3,), #  ARABIC LETTER GUEH ISOLATED FORM → ARABIC LETTER GUEH
+ 0x1ee0b: (0x0644,), #  ARABIC MATHEMATICAL LAM → ARABIC LETTER LAM
+ 0x1ee2b: (0x0644,), #  ARABIC MATHEMATICAL INITIAL LAM → ARABIC LETTER LAM
+ 0x1ee4b: (0x0644,), #  ARABIC MATHEMATICAL TAILED LAM → ARABIC LETTER LAM
+ 0x1ee8b: (0x0644,), #  ARABIC MATHEMATICAL LOOPED LAM → ARABIC LETTER LAM
+ 0x1eeab: (0x0644,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK LAM → ARABIC LETTER LAM
+ 0xfedf: (0x0644,), #  ARABIC LETTER LAM INITIAL FORM → ARABIC LETTER LAM
+ 0xfee0: (0x0644,), #  ARABIC LETTER LAM MEDIAL FORM → ARABIC LETTER LAM
+ 0xfede: (0x0644,), #  ARABIC LETTER LAM FINAL FORM → ARABIC LETTER LAM
+ 0xfedd: (0x0644,), #  ARABIC LETTER LAM ISOLATED FORM → ARABIC LETTER LAM
+ 0x06b7: (0x0644, 0x06db,), #  ARABIC LETTER LAM WITH THREE DOTS ABOVE → ARABIC LETTER LAM, ARABIC SMALL HIGH THREE DOTS
+ 0x06b5: (0x0644, 0x0306,), #  ARABIC LETTER LAM WITH SMALL V → ARABIC LETTER LAM, COMBINING BREVE	# →‎لٚ‎→
+ 0xfefc: (0x0644, 0x006c,), #  ARABIC LIGATURE LAM WITH ALEF FINAL FORM → ARABIC LETTER LAM, LATIN SMALL LETTER L	# →‎لا‎→
+ 0xfefb: (0x0644, 0x006c,), #  ARABIC LIGATURE LAM WITH ALEF ISOLATED FORM → ARABIC LETTER LAM, LATIN SMALL LETTER L	# →‎لا‎→
+ 0xfefa: (0x0644, 0x006c, 0x0655,), #  ARABIC LIGATURE LAM WITH ALEF WITH HAMZA BELOW FINAL FORM → ARABIC LETTER LAM, LATIN SMALL LETTER L, ARABIC HAMZA BELOW	# →‎لإ‎→
+ 0xfef9: (0x0644, 0x006c, 0x0655,), #  ARABIC LIGATURE LAM WITH ALEF WITH HAMZA BELOW ISOLATED FORM → ARABIC LETTER LAM, LATIN SMALL LETTER L, ARABIC HAMZA BELOW	# →‎لإ‎→
+ 0xfef8: (0x0644, 0x006c, 0x0674,), #  ARABIC LIGATURE LAM WITH ALEF WITH HAMZA ABOVE FINAL FORM → ARABIC LETTER LAM, LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎لأ‎→
+ 0xfef7: (0x0644, 0x006c, 0x0674,), #  ARABIC LIGATURE LAM WITH ALEF WITH HAMZA ABOVE ISOLATED FORM → ARABIC LETTER LAM, LATIN SMALL LETTER L, ARABIC LETTER HIGH HAMZA	# →‎لأ‎→
+ 0xfccd: (0x0644, 0x006f,), #  ARABIC LIGATURE LAM WITH HEH INITIAL FORM → ARABIC LETTER LAM, LATIN SMALL LETTER O	# →‎له‎→
+ 0xfef6: (0x0644, 0x0622,), #  ARABIC LIGATURE LAM WITH ALEF WITH MADDA ABOVE FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER ALEF WITH MADDA ABOVE
+ 0xfef5: (0x0644, 0x0622,), #  ARABIC LIGATURE LAM WITH ALEF WITH MADDA ABOVE ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER ALEF WITH MADDA ABOVE
+ 0xfcc9: (0x0644, 0x062c,), #  ARABIC LIGATURE LAM WITH JEEM INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM
+ 0xfc3f: (0x0644, 0x062c,), #  ARABIC LIGATURE LAM WITH JEEM ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM
+ 0xfd83: (0x0644, 0x062c, 0x062c,), #  ARABIC LIGATURE LAM WITH JEEM WITH JEEM INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM, ARABIC LETTER JEEM
+ 0xfd84: (0x0644, 0x062c, 0x062c,), #  ARABIC LIGATURE LAM WITH JEEM WITH JEEM FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM, ARABIC LETTER JEEM
+ 0xfdba: (0x0644, 0x062c, 0x0645,), #  ARABIC LIGATURE LAM WITH JEEM WITH MEEM INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfdbc: (0x0644, 0x062c, 0x0645,), #  ARABIC LIGATURE LAM WITH JEEM WITH MEEM FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfdac: (0x0644, 0x062c, 0x0649,), #  ARABIC LIGATURE LAM WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎لجي‎→
+ 0xfcca: (0x0644, 0x062d,), #  ARABIC LIGATURE LAM WITH HAH INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER HAH
+ 0xfc40: (0x0644, 0x062d,), #  ARABIC LIGATURE LAM WITH HAH ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER HAH
+ 0xfdb5: (0x0644, 0x062d, 0x0645,), #  ARABIC LIGATURE LAM WITH HAH WITH MEEM INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfd80: (0x0644, 0x062d, 0x0645,), #  ARABIC LIGATURE LAM WITH HAH WITH MEEM FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfd82: (0x0644, 0x062d, 0x0649,), #  ARABIC LIGATURE LAM WITH HAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA
+ 0xfd81: (0x0644, 0x062d, 0x0649,), #  ARABIC LIGATURE LAM WITH HAH WITH YEH FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎لحي‎→
+ 0xfccb: (0x0644, 0x062e,), #  ARABIC LIGATURE LAM WITH KHAH INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER KHAH
+ 0xfc41: (0x0644, 0x062e,), #  ARABIC LIGATURE LAM WITH KHAH ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER KHAH
+ 0xfd86: (0x0644, 0x062e, 0x0645,), #  ARABIC LIGATURE LAM WITH KHAH WITH MEEM INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfd85: (0x0644, 0x062e, 0x0645,), #  ARABIC LIGATURE LAM WITH KHAH WITH MEEM FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfccc: (0x0644, 0x0645,), #  ARABIC LIGATURE LAM WITH MEEM INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM
+ 0xfced: (0x0644, 0x0645,), #  ARABIC LIGATURE LAM WITH MEEM MEDIAL FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM
+ 0xfc85: (0x0644, 0x0645,), #  ARABIC LIGATURE LAM WITH MEEM FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM
+ 0xfc42: (0x0644, 0x0645,), #  ARABIC LIGATURE LAM WITH MEEM ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM
+ 0xfd88: (0x0644, 0x0645, 0x062d,), #  ARABIC LIGATURE LAM WITH MEEM WITH HAH INITIAL FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd87: (0x0644, 0x0645, 0x062d,), #  ARABIC LIGATURE LAM WITH MEEM WITH HAH FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfdad: (0x0644, 0x0645, 0x0649,), #  ARABIC LIGATURE LAM WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎لمي‎→
+ 0xfc86: (0x0644, 0x0649,), #  ARABIC LIGATURE LAM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA
+ 0xfc43: (0x0644, 0x0649,), #  ARABIC LIGATURE LAM WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA
+ 0xfc87: (0x0644, 0x0649,), #  ARABIC LIGATURE LAM WITH YEH FINAL FORM → ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA	# →‎لي‎→
+ 0xfc44: (0x0644, 0x0649,), #  ARABIC LIGATURE LAM WITH YEH ISOLATED FORM → ARABIC LETTER LAM, ARABIC LETTER ALEF MAKSURA	# →‎لي‎→
+ 0x1ee0c: (0x0645,), #  ARABIC MATHEMATICAL MEEM → ARABIC LETTER MEEM
+ 0x1ee2c: (0x0645,), #  ARABIC MATHEMATICAL INITIAL MEEM → ARABIC LETTER MEEM
+ 0x1ee6c: (0x0645,), #  ARABIC MATHEMATICAL STRETCHED MEEM → ARABIC LETTER MEEM
+ 0x1ee8c: (0x0645,), #  ARABIC MATHEMATICAL LOOPED MEEM → ARABIC LETTER MEEM
+ 0x1eeac: (0x0645,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK MEEM → ARABIC LETTER MEEM
+ 0xfee3: (0x0645,), #  ARABIC LETTER MEEM INITIAL FORM → ARABIC LETTER MEEM
+ 0xfee4: (0x0645,), #  ARABIC LETTER MEEM MEDIAL FORM → ARABIC LETTER MEEM
+ 0xfee2: (0x0645,), #  ARABIC LETTER MEEM FINAL FORM → ARABIC LETTER MEEM
+ 0xfee1: (0x0645,), #  ARABIC LETTER MEEM ISOLATED FORM → ARABIC LETTER MEEM
+ 0x08a7: (0x0645, 0x06db,), #  ARABIC LETTER MEEM WITH THREE DOTS ABOVE → ARABIC LETTER MEEM, ARABIC SMALL HIGH THREE DOTS
+ 0x06fe: (0x0645, 0x0348,), #  ARABIC SIGN SINDHI POSTPOSITION MEN → ARABIC LETTER MEEM, COMBINING DOUBLE VERTICAL LINE BELOW
+ 0xfc88: (0x0645, 0x006c,), #  ARABIC LIGATURE MEEM WITH ALEF FINAL FORM → ARABIC LETTER MEEM, LATIN SMALL LETTER L	# →‎ما‎→
+ 0xfcce: (0x0645, 0x062c,), #  ARABIC LIGATURE MEEM WITH JEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER JEEM
+ 0xfc45: (0x0645, 0x062c,), #  ARABIC LIGATURE MEEM WITH JEEM ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER JEEM
+ 0xfd8c: (0x0645, 0x062c, 0x062d,), #  ARABIC LIGATURE MEEM WITH JEEM WITH HAH INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER JEEM, ARABIC LETTER HAH
+ 0xfd92: (0x0645, 0x062c, 0x062e,), #  ARABIC LIGATURE MEEM WITH JEEM WITH KHAH INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER JEEM, ARABIC LETTER KHAH
+ 0xfd8d: (0x0645, 0x062c, 0x0645,), #  ARABIC LIGATURE MEEM WITH JEEM WITH MEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfdc0: (0x0645, 0x062c, 0x0649,), #  ARABIC LIGATURE MEEM WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER MEEM, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎مجي‎→
+ 0xfccf: (0x0645, 0x062d,), #  ARABIC LIGATURE MEEM WITH HAH INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfc46: (0x0645, 0x062d,), #  ARABIC LIGATURE MEEM WITH HAH ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER HAH
+ 0xfd89: (0x0645, 0x062d, 0x062c,), #  ARABIC LIGATURE MEEM WITH HAH WITH JEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER HAH, ARABIC LETTER JEEM
+ 0xfd8a: (0x0645, 0x062d, 0x0645,), #  ARABIC LIGATURE MEEM WITH HAH WITH MEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfdf4: (0x0645, 0x062d, 0x0645, 0x062f,), #  ARABIC LIGATURE MOHAMMAD ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER HAH, ARABIC LETTER MEEM, ARABIC LETTER DAL
+ 0xfd8b: (0x0645, 0x062d, 0x0649,), #  ARABIC LIGATURE MEEM WITH HAH WITH YEH FINAL FORM → ARABIC LETTER MEEM, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎محي‎→
+ 0xfcd0: (0x0645, 0x062e,), #  ARABIC LIGATURE MEEM WITH KHAH INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER KHAH
+ 0xfc47: (0x0645, 0x062e,), #  ARABIC LIGATURE MEEM WITH KHAH ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER KHAH
+ 0xfd8e: (0x0645, 0x062e, 0x062c,), #  ARABIC LIGATURE MEEM WITH KHAH WITH JEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER KHAH, ARABIC LETTER JEEM
+ 0xfd8f: (0x0645, 0x062e, 0x0645,), #  ARABIC LIGATURE MEEM WITH KHAH WITH MEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER KHAH, ARABIC LETTER MEEM
+ 0xfdb9: (0x0645, 0x062e, 0x0649,), #  ARABIC LIGATURE MEEM WITH KHAH WITH YEH FINAL FORM → ARABIC LETTER MEEM, ARABIC LETTER KHAH, ARABIC LETTER ALEF MAKSURA	# →‎مخي‎→
+ 0xfcd1: (0x0645, 0x0645,), #  ARABIC LIGATURE MEEM WITH MEEM INITIAL FORM → ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfc89: (0x0645, 0x0645,), #  ARABIC LIGATURE MEEM WITH MEEM FINAL FORM → ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfc48: (0x0645, 0x0645,), #  ARABIC LIGATURE MEEM WITH MEEM ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER MEEM
+ 0xfdb1: (0x0645, 0x0645, 0x0649,), #  ARABIC LIGATURE MEEM WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER MEEM, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎ممي‎→
+ 0xfc49: (0x0645, 0x0649,), #  ARABIC LIGATURE MEEM WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfc4a: (0x0645, 0x0649,), #  ARABIC LIGATURE MEEM WITH YEH ISOLATED FORM → ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎مي‎→
+ 0x1ee0d: (0x0646,), #  ARABIC MATHEMATICAL NOON → ARABIC LETTER NOON
+ 0x1ee2d: (0x0646,), #  ARABIC MATHEMATICAL INITIAL NOON → ARABIC LETTER NOON
+ 0x1ee4d: (0x0646,), #  ARABIC MATHEMATICAL TAILED NOON → ARABIC LETTER NOON
+ 0x1ee6d: (0x0646,), #  ARABIC MATHEMATICAL STRETCHED NOON → ARABIC LETTER NOON
+ 0x1ee8d: (0x0646,), #  ARABIC MATHEMATICAL LOOPED NOON → ARABIC LETTER NOON
+ 0x1eead: (0x0646,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK NOON → ARABIC LETTER NOON
+ 0xfee7: (0x0646,), #  ARABIC LETTER NOON INITIAL FORM → ARABIC LETTER NOON
+ 0xfee8: (0x0646,), #  ARABIC LETTER NOON MEDIAL FORM → ARABIC LETTER NOON
+ 0xfee6: (0x0646,), #  ARABIC LETTER NOON FINAL FORM → ARABIC LETTER NOON
+ 0xfee5: (0x0646,), #  ARABIC LETTER NOON ISOLATED FORM → ARABIC LETTER NOON
+ 0x0768: (0x0646, 0x0615,), #  ARABIC LETTER NOON WITH SMALL TAH → ARABIC LETTER NOON, ARABIC SMALL HIGH TAH
+ 0x0769: (0x0646, 0x0306,), #  ARABIC LETTER NOON WITH SMALL V → ARABIC LETTER NOON, COMBINING BREVE	# →‎نٚ‎→
+ 0xfcd6: (0x0646, 0x006f,), #  ARABIC LIGATURE NOON WITH HEH INITIAL FORM → ARABIC LETTER NOON, LATIN SMALL LETTER O	# →‎نه‎→
+ 0xfcef: (0x0646, 0x006f,), #  ARABIC LIGATURE NOON WITH HEH MEDIAL FORM → ARABIC LETTER NOON, LATIN SMALL LETTER O	# →‎نه‎→
+ 0xfdb8: (0x0646, 0x062c, 0x062d,), #  ARABIC LIGATURE NOON WITH JEEM WITH HAH INITIAL FORM → ARABIC LETTER NOON, ARABIC LETTER JEEM, ARABIC LETTER HAH
+ 0xfdbd: (0x0646, 0x062c, 0x062d,), #  ARABIC LIGATURE NOON WITH JEEM WITH HAH FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER JEEM, ARABIC LETTER HAH
+ 0xfd98: (0x0646, 0x062c, 0x0645,), #  ARABIC LIGATURE NOON WITH JEEM WITH MEEM INITIAL FORM → ARABIC LETTER NOON, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfd97: (0x0646, 0x062c, 0x0645,), #  ARABIC LIGATURE NOON WITH JEEM WITH MEEM FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER JEEM, ARABIC LETTER MEEM
+ 0xfd99: (0x0646, 0x062c, 0x0649,), #  ARABIC LIGATURE NOON WITH JEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfdc7: (0x0646, 0x062c, 0x0649,), #  ARABIC LIGATURE NOON WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎نجي‎→
+ 0xfcd3: (0x0646, 0x062d,), #  ARABIC LIGATURE NOON WITH HAH INITIAL FORM → ARABIC LETTER NOON, ARABIC LETTER HAH
+ 0xfc4c: (0x0646, 0x062d,), #  ARABIC LIGATURE NOON WITH HAH ISOLATED FORM → ARABIC LETTER NOON, ARABIC LETTER HAH
+ 0xfd95: (0x0646, 0x062d, 0x0645,), #  ARABIC LIGATURE NOON WITH HAH WITH MEEM INITIAL FORM → ARABIC LETTER NOON, ARABIC LETTER HAH, ARABIC LETTER MEEM
+ 0xfd96: (0x0646, 0x062d, 0x0649,), #  ARABIC LIGATURE NOON WITH HAH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA
+ 0xfdb3: (0x0646, 0x062d, 0x0649,), #  ARABIC LIGATURE NOON WITH HAH WITH YEH FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎نحي‎→
+ 0xfcd4: (0x0646, 0x062e,), #  ARABIC LIGATURE NOON WITH KHAH INITIAL FORM → ARABIC LETTER NOON, ARABIC LETTER KHAH
+ 0xfc4d: (0x0646, 0x062e,), #  ARABIC LIGATURE NOON WITH KHAH ISOLATED FORM → ARABIC LETTER NOON, ARABIC LETTER KHAH
+ 0xfc8a: (0x0646, 0x0631,), #  ARABIC LIGATURE NOON WITH REH FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER REH
+ 0xfc8b: (0x0646, 0x0632,), #  ARABIC LIGATURE NOON WITH ZAIN FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER ZAIN
+ 0xfcd5: (0x0646, 0x0645,), #  ARABIC LIGATURE NOON WITH MEEM INITIAL FORM → ARABIC LETTER NOON, ARABIC LETTER MEEM
+ 0xfcee: (0x0646, 0x0645,), #  ARABIC LIGATURE NOON WITH MEEM MEDIAL FORM → ARABIC LETTER NOON, ARABIC LETTER MEEM
+ 0xfc8c: (0x0646, 0x0645,), #  ARABIC LIGATURE NOON WITH MEEM FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER MEEM
+ 0xfc4e: (0x0646, 0x0645,), #  ARABIC LIGATURE NOON WITH MEEM ISOLATED FORM → ARABIC LETTER NOON, ARABIC LETTER MEEM
+ 0xfd9b: (0x0646, 0x0645, 0x0649,), #  ARABIC LIGATURE NOON WITH MEEM WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA
+ 0xfd9a: (0x0646, 0x0645, 0x0649,), #  ARABIC LIGATURE NOON WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎نمي‎→
+ 0xfc8d: (0x0646, 0x0646,), #  ARABIC LIGATURE NOON WITH NOON FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER NOON
+ 0xfc8e: (0x0646, 0x0649,), #  ARABIC LIGATURE NOON WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER ALEF MAKSURA
+ 0xfc4f: (0x0646, 0x0649,), #  ARABIC LIGATURE NOON WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER NOON, ARABIC LETTER ALEF MAKSURA
+ 0xfc8f: (0x0646, 0x0649,), #  ARABIC LIGATURE NOON WITH YEH FINAL FORM → ARABIC LETTER NOON, ARABIC LETTER ALEF MAKSURA	# →‎ني‎→
+ 0xfc50: (0x0646, 0x0649,), #  ARABIC LIGATURE NOON WITH YEH ISOLATED FORM → ARABIC LETTER NOON, ARABIC LETTER ALEF MAKSURA	# →‎ني‎→
+ 0x06c2: (0x06c0,), #  ARABIC LETTER HEH GOAL WITH HAMZA ABOVE → ARABIC LETTER HEH WITH YEH ABOVE	# →‎ﮤ‎→
+ 0xfba5: (0x06c0,), #  ARABIC LETTER HEH WITH YEH ABOVE FINAL FORM → ARABIC LETTER HEH WITH YEH ABOVE
+ 0xfba4: (0x06c0,), #  ARABIC LETTER HEH WITH YEH ABOVE ISOLATED FORM → ARABIC LETTER HEH WITH YEH ABOVE
+ 0x102e4: (0x0648,), #  COPTIC EPACT DIGIT FOUR → ARABIC LETTER WAW
+ 0x1ee05: (0x0648,), #  ARABIC MATHEMATICAL WAW → ARABIC LETTER WAW
+ 0x1ee85: (0x0648,), #  ARABIC MATHEMATICAL LOOPED WAW → ARABIC LETTER WAW
+ 0x1eea5: (0x0648,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK WAW → ARABIC LETTER WAW
+ 0xfeee: (0x0648,), #  ARABIC LETTER WAW FINAL FORM → ARABIC LETTER WAW
+ 0xfeed: (0x0648,), #  ARABIC LETTER WAW ISOLATED FORM → ARABIC LETTER WAW
+ 0x08b1: (0x0648,), #  ARABIC LETTER STRAIGHT WAW → ARABIC LETTER WAW
+ 0x06cb: (0x0648, 0x06db,), #  ARABIC LETTER VE → ARABIC LETTER WAW, ARABIC SMALL HIGH THREE DOTS
+ 0xfbdf: (0x0648, 0x06db,), #  ARABIC LETTER VE FINAL FORM → ARABIC LETTER WAW, ARABIC SMALL HIGH THREE DOTS	# →‎ۋ‎→
+ 0xfbde: (0x0648, 0x06db,), #  ARABIC LETTER VE ISOLATED FORM → ARABIC LETTER WAW, ARABIC SMALL HIGH THREE DOTS	# →‎ۋ‎→
+ 0x06c7: (0x0648, 0x0313,), #  ARABIC LETTER U → ARABIC LETTER WAW, COMBINING COMMA ABOVE	# →‎وُ‎→
+ 0xfbd8: (0x0648, 0x0313,), #  ARABIC LETTER U FINAL FORM → ARABIC LETTER WAW, COMBINING COMMA ABOVE	# →‎ۇ‎→→‎وُ‎→
+ 0xfbd7: (0x0648, 0x0313,), #  ARABIC LETTER U ISOLATED FORM → ARABIC LETTER WAW, COMBINING COMMA ABOVE	# →‎ۇ‎→→‎وُ‎→
+ 0x06c6: (0x0648, 0x0306,), #  ARABIC LETTER OE → ARABIC LETTER WAW, COMBINING BREVE	# →‎وٚ‎→
+ 0xfbda: (0x0648, 0x0306,), #  ARABIC LETTER OE FINAL FORM → ARABIC LETTER WAW, COMBINING BREVE	# →‎ۆ‎→→‎وٚ‎→
+ 0xfbd9: (0x0648, 0x0306,), #  ARABIC LETTER OE ISOLATED FORM → ARABIC LETTER WAW, COMBINING BREVE	# →‎ۆ‎→→‎وٚ‎→
+ 0x06c9: (0x0648, 0x0302,), #  ARABIC LETTER KIRGHIZ YU → ARABIC LETTER WAW, COMBINING CIRCUMFLEX ACCENT	# →‎وٛ‎→
+ 0xfbe3: (0x0648, 0x0302,), #  ARABIC LETTER KIRGHIZ YU FINAL FORM → ARABIC LETTER WAW, COMBINING CIRCUMFLEX ACCENT	# →‎ۉ‎→→‎وٛ‎→
+ 0xfbe2: (0x0648, 0x0302,), #  ARABIC LETTER KIRGHIZ YU ISOLATED FORM → ARABIC LETTER WAW, COMBINING CIRCUMFLEX ACCENT	# →‎ۉ‎→→‎وٛ‎→
+ 0x06c8: (0x0648, 0x0670,), #  ARABIC LETTER YU → ARABIC LETTER WAW, ARABIC LETTER SUPERSCRIPT ALEF
+ 0xfbdc: (0x0648, 0x0670,), #  ARABIC LETTER YU FINAL FORM → ARABIC LETTER WAW, ARABIC LETTER SUPERSCRIPT ALEF	# →‎ۈ‎→
+ 0xfbdb: (0x0648, 0x0670,), #  ARABIC LETTER YU ISOLATED FORM → ARABIC LETTER WAW, ARABIC LETTER SUPERSCRIPT ALEF	# →‎ۈ‎→
+ 0x0624: (0x0648, 0x0674,), #  ARABIC LETTER WAW WITH HAMZA ABOVE → ARABIC LETTER WAW, ARABIC LETTER HIGH HAMZA	# →‎ٶ‎→
+ 0xfe86: (0x0648, 0x0674,), #  ARABIC LETTER WAW WITH HAMZA ABOVE FINAL FORM → ARABIC LETTER WAW, ARABIC LETTER HIGH HAMZA	# →‎ٶ‎→
+ 0xfe85: (0x0648, 0x0674,), #  ARABIC LETTER WAW WITH HAMZA ABOVE ISOLATED FORM → ARABIC LETTER WAW, ARABIC LETTER HIGH HAMZA	# →‎ٶ‎→
+ 0x0676: (0x0648, 0x0674,), #  ARABIC LETTER HIGH HAMZA WAW → ARABIC LETTER WAW, ARABIC LETTER HIGH HAMZA
+ 0x0677: (0x0648, 0x0313, 0x0674,), #  ARABIC LETTER U WITH HAMZA ABOVE → ARABIC LETTER WAW, COMBINING COMMA ABOVE, ARABIC LETTER HIGH HAMZA	# →‎ۇٴ‎→
+ 0xfbdd: (0x0648, 0x0313, 0x0674,), #  ARABIC LETTER U WITH HAMZA ABOVE ISOLATED FORM → ARABIC LETTER WAW, COMBINING COMMA ABOVE, ARABIC LETTER HIGH HAMZA	# →‎ۇٴ‎→
+ 0xfdf8: (0x0648, 0x0633, 0x0644, 0x0645,), #  ARABIC LIGATURE WASALLAM ISOLATED FORM → ARABIC LETTER WAW, ARABIC LETTER SEEN, ARABIC LETTER LAM, ARABIC LETTER MEEM
+ 0xfbe1: (0x06c5,), #  ARABIC LETTER KIRGHIZ OE FINAL FORM → ARABIC LETTER KIRGHIZ OE
+ 0xfbe0: (0x06c5,), #  ARABIC LETTER KIRGHIZ OE ISOLATED FORM → ARABIC LETTER KIRGHIZ OE
+ 0x066e: (0x0649,), #  ARABIC LETTER DOTLESS BEH → ARABIC LETTER ALEF MAKSURA
+ 0x1ee1c: (0x0649,), #  ARABIC MATHEMATICAL DOTLESS BEH → ARABIC LETTER ALEF MAKSURA	# →‎ٮ‎→
+ 0x1ee7c: (0x0649,), #  ARABIC MATHEMATICAL STRETCHED DOTLESS BEH → ARABIC LETTER ALEF MAKSURA	# →‎ٮ‎→
+ 0x06ba: (0x0649,), #  ARABIC LETTER NOON GHUNNA → ARABIC LETTER ALEF MAKSURA
+ 0x1ee1d: (0x0649,), #  ARABIC MATHEMATICAL DOTLESS NOON → ARABIC LETTER ALEF MAKSURA	# →‎ں‎→
+ 0x1ee5d: (0x0649,), #  ARABIC MATHEMATICAL TAILED DOTLESS NOON → ARABIC LETTER ALEF MAKSURA	# →‎ں‎→
+ 0xfb9f: (0x0649,), #  ARABIC LETTER NOON GHUNNA FINAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ں‎→
+ 0xfb9e: (0x0649,), #  ARABIC LETTER NOON GHUNNA ISOLATED FORM → ARABIC LETTER ALEF MAKSURA	# →‎ں‎→
+ 0x08bd: (0x0649,), #  ARABIC LETTER AFRICAN NOON → ARABIC LETTER ALEF MAKSURA	# →‎ں‎→
+ 0xfbe8: (0x0649,), #  ARABIC LETTER UIGHUR KAZAKH KIRGHIZ ALEF MAKSURA INITIAL FORM → ARABIC LETTER ALEF MAKSURA
+ 0xfbe9: (0x0649,), #  ARABIC LETTER UIGHUR KAZAKH KIRGHIZ ALEF MAKSURA MEDIAL FORM → ARABIC LETTER ALEF MAKSURA
+ 0xfef0: (0x0649,), #  ARABIC LETTER ALEF MAKSURA FINAL FORM → ARABIC LETTER ALEF MAKSURA
+ 0xfeef: (0x0649,), #  ARABIC LETTER ALEF MAKSURA ISOLATED FORM → ARABIC LETTER ALEF MAKSURA
+ 0x064a: (0x0649,), #  ARABIC LETTER YEH → ARABIC LETTER ALEF MAKSURA
+ 0x1ee09: (0x0649,), #  ARABIC MATHEMATICAL YEH → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0x1ee29: (0x0649,), #  ARABIC MATHEMATICAL INITIAL YEH → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0x1ee49: (0x0649,), #  ARABIC MATHEMATICAL TAILED YEH → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0x1ee69: (0x0649,), #  ARABIC MATHEMATICAL STRETCHED YEH → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0x1ee89: (0x0649,), #  ARABIC MATHEMATICAL LOOPED YEH → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0x1eea9: (0x0649,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK YEH → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0xfef3: (0x0649,), #  ARABIC LETTER YEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0xfef4: (0x0649,), #  ARABIC LETTER YEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0xfef2: (0x0649,), #  ARABIC LETTER YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0xfef1: (0x0649,), #  ARABIC LETTER YEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0x06cc: (0x0649,), #  ARABIC LETTER FARSI YEH → ARABIC LETTER ALEF MAKSURA
+ 0xfbfe: (0x0649,), #  ARABIC LETTER FARSI YEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ی‎→
+ 0xfbff: (0x0649,), #  ARABIC LETTER FARSI YEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ی‎→
+ 0xfbfd: (0x0649,), #  ARABIC LETTER FARSI YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ﻰ‎→
+ 0xfbfc: (0x0649,), #  ARABIC LETTER FARSI YEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA
+ 0x06d2: (0x0649,), #  ARABIC LETTER YEH BARREE → ARABIC LETTER ALEF MAKSURA	# →‎ي‎→
+ 0xfbaf: (0x0649,), #  ARABIC LETTER YEH BARREE FINAL FORM → ARABIC LETTER ALEF MAKSURA	# →‎ے‎→→‎ي‎→
+ 0xfbae: (0x0649,), #  ARABIC LETTER YEH BARREE ISOLATED FORM → ARABIC LETTER ALEF MAKSURA	# →‎ے‎→→‎ي‎→
+ 0x0679: (0x0649, 0x0615,), #  ARABIC LETTER TTEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ٮؕ‎→
+ 0xfb68: (0x0649, 0x0615,), #  ARABIC LETTER TTEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ٹ‎→→‎ٮؕ‎→
+ 0xfb69: (0x0649, 0x0615,), #  ARABIC LETTER TTEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ٹ‎→→‎ٮؕ‎→
+ 0xfb67: (0x0649, 0x0615,), #  ARABIC LETTER TTEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ٹ‎→→‎ٮؕ‎→
+ 0xfb66: (0x0649, 0x0615,), #  ARABIC LETTER TTEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ٹ‎→→‎ٮؕ‎→
+ 0x06bb: (0x0649, 0x0615,), #  ARABIC LETTER RNOON → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ںؕ‎→
+ 0xfba2: (0x0649, 0x0615,), #  ARABIC LETTER RNOON INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ڻ‎→→‎ںؕ‎→
+ 0xfba3: (0x0649, 0x0615,), #  ARABIC LETTER RNOON MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ڻ‎→→‎ںؕ‎→
+ 0xfba1: (0x0649, 0x0615,), #  ARABIC LETTER RNOON FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ڻ‎→→‎ںؕ‎→
+ 0xfba0: (0x0649, 0x0615,), #  ARABIC LETTER RNOON ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH TAH	# →‎ڻ‎→→‎ںؕ‎→
+ 0x067e: (0x0649, 0x06db,), #  ARABIC LETTER PEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ڽ‎→→‎ںۛ‎→
+ 0xfb58: (0x0649, 0x06db,), #  ARABIC LETTER PEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎پ‎→→‎ڽ‎→→‎ںۛ‎→
+ 0xfb59: (0x0649, 0x06db,), #  ARABIC LETTER PEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎پ‎→→‎ڽ‎→→‎ںۛ‎→
+ 0xfb57: (0x0649, 0x06db,), #  ARABIC LETTER PEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎پ‎→→‎ڽ‎→→‎ںۛ‎→
+ 0xfb56: (0x0649, 0x06db,), #  ARABIC LETTER PEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎پ‎→→‎ڽ‎→→‎ںۛ‎→
+ 0x062b: (0x0649, 0x06db,), #  ARABIC LETTER THEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ٮۛ‎→
+ 0x1ee16: (0x0649, 0x06db,), #  ARABIC MATHEMATICAL THEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0x1ee36: (0x0649, 0x06db,), #  ARABIC MATHEMATICAL INITIAL THEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0x1ee76: (0x0649, 0x06db,), #  ARABIC MATHEMATICAL STRETCHED THEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0x1ee96: (0x0649, 0x06db,), #  ARABIC MATHEMATICAL LOOPED THEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0x1eeb6: (0x0649, 0x06db,), #  ARABIC MATHEMATICAL DOUBLE-STRUCK THEH → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0xfe9b: (0x0649, 0x06db,), #  ARABIC LETTER THEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0xfe9c: (0x0649, 0x06db,), #  ARABIC LETTER THEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0xfe9a: (0x0649, 0x06db,), #  ARABIC LETTER THEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0xfe99: (0x0649, 0x06db,), #  ARABIC LETTER THEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ث‎→→‎ٮۛ‎→
+ 0x06bd: (0x0649, 0x06db,), #  ARABIC LETTER NOON WITH THREE DOTS ABOVE → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎ںۛ‎→
+ 0x06d1: (0x0649, 0x06db,), #  ARABIC LETTER YEH WITH THREE DOTS BELOW → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎پ‎→→‎ڽ‎→→‎ںۛ‎→
+ 0x063f: (0x0649, 0x06db,), #  ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS	# →‎یۛ‎→
+ 0x08b7: (0x0649, 0x06db, 0x06e2,), #  ARABIC LETTER PEH WITH SMALL MEEM ABOVE → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC SMALL HIGH MEEM ISOLATED FORM	# →‎پۢ‎→
+ 0x0756: (0x0649, 0x0306,), #  ARABIC LETTER BEH WITH SMALL V → ARABIC LETTER ALEF MAKSURA, COMBINING BREVE	# →‎ٮٚ‎→
+ 0x06ce: (0x0649, 0x0306,), #  ARABIC LETTER YEH WITH SMALL V → ARABIC LETTER ALEF MAKSURA, COMBINING BREVE	# →‎یٚ‎→
+ 0x08ba: (0x0649, 0x0306, 0x0307,), #  ARABIC LETTER YEH WITH TWO DOTS BELOW AND SMALL NOON ABOVE → ARABIC LETTER ALEF MAKSURA, COMBINING BREVE, COMBINING DOT ABOVE	# →‎يۨ‎→
+ 0x063d: (0x0649, 0x0302,), #  ARABIC LETTER FARSI YEH WITH INVERTED V → ARABIC LETTER ALEF MAKSURA, COMBINING CIRCUMFLEX ACCENT	# →‎یٛ‎→
+ 0x08a8: (0x0649, 0x0654,), #  ARABIC LETTER YEH WITH TWO DOTS BELOW AND HAMZA ABOVE → ARABIC LETTER ALEF MAKSURA, ARABIC HAMZA ABOVE	# →‎ئ‎→
+ 0xfc90: (0x0649, 0x0670,), #  ARABIC LIGATURE ALEF MAKSURA WITH SUPERSCRIPT ALEF FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER SUPERSCRIPT ALEF
+ 0xfc5d: (0x0649, 0x0670,), #  ARABIC LIGATURE ALEF MAKSURA WITH SUPERSCRIPT ALEF ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER SUPERSCRIPT ALEF
+ 0xfcde: (0x0649, 0x006f,), #  ARABIC LIGATURE YEH WITH HEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, LATIN SMALL LETTER O	# →‎يه‎→
+ 0xfcf1: (0x0649, 0x006f,), #  ARABIC LIGATURE YEH WITH HEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, LATIN SMALL LETTER O	# →‎يه‎→
+ 0xfce6: (0x0649, 0x06db, 0x006f,), #  ARABIC LIGATURE THEH WITH HEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, LATIN SMALL LETTER O	# →‎ثه‎→
+ 0x0626: (0x0649, 0x0674,), #  ARABIC LETTER YEH WITH HAMZA ABOVE → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA	# →‎ٸ‎→→‎يٴ‎→
+ 0xfe8b: (0x0649, 0x0674,), #  ARABIC LETTER YEH WITH HAMZA ABOVE INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA	# →‎ئ‎→→‎ٸ‎→→‎يٴ‎→
+ 0xfe8c: (0x0649, 0x0674,), #  ARABIC LETTER YEH WITH HAMZA ABOVE MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA	# →‎ئ‎→→‎ٸ‎→→‎يٴ‎→
+ 0xfe8a: (0x0649, 0x0674,), #  ARABIC LETTER YEH WITH HAMZA ABOVE FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA	# →‎ئ‎→→‎ٸ‎→→‎يٴ‎→
+ 0xfe89: (0x0649, 0x0674,), #  ARABIC LETTER YEH WITH HAMZA ABOVE ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA	# →‎ٸ‎→→‎يٴ‎→
+ 0x0678: (0x0649, 0x0674,), #  ARABIC LETTER HIGH HAMZA YEH → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA	# →‎يٴ‎→
+ 0xfbeb: (0x0649, 0x0674, 0x006c,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH ALEF FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, LATIN SMALL LETTER L	# →‎ئا‎→
+ 0xfbea: (0x0649, 0x0674, 0x006c,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH ALEF ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, LATIN SMALL LETTER L	# →‎ئا‎→
+ 0xfc9b: (0x0649, 0x0674, 0x006f,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH HEH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, LATIN SMALL LETTER O	# →‎ئه‎→
+ 0xfce0: (0x0649, 0x0674, 0x006f,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH HEH MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, LATIN SMALL LETTER O	# →‎ئه‎→
+ 0xfbed: (0x0649, 0x0674, 0x006f,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH AE FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, LATIN SMALL LETTER O	# →‎ئە‎→→‎ٴىo‎→→‎ئه‎→
+ 0xfbec: (0x0649, 0x0674, 0x006f,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH AE ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, LATIN SMALL LETTER O	# →‎ئە‎→→‎ٴىo‎→→‎ئه‎→
+ 0xfbf8: (0x0649, 0x0674, 0x067b,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH E INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER BEEH	# →‎ئې‎→
+ 0xfbf7: (0x0649, 0x0674, 0x067b,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH E FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER BEEH	# →‎ئې‎→
+ 0xfbf6: (0x0649, 0x0674, 0x067b,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH E ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER BEEH	# →‎ئې‎→
+ 0xfc97: (0x0649, 0x0674, 0x062c,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH JEEM INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER JEEM	# →‎ئج‎→
+ 0xfc00: (0x0649, 0x0674, 0x062c,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH JEEM ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER JEEM	# →‎ئج‎→
+ 0xfc98: (0x0649, 0x0674, 0x062d,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH HAH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER HAH	# →‎ئح‎→
+ 0xfc01: (0x0649, 0x0674, 0x062d,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH HAH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER HAH	# →‎ئح‎→
+ 0xfc99: (0x0649, 0x0674, 0x062e,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH KHAH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER KHAH	# →‎ئخ‎→
+ 0xfc64: (0x0649, 0x0674, 0x0631,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH REH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER REH	# →‎ئر‎→
+ 0xfc65: (0x0649, 0x0674, 0x0632,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH ZAIN FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ZAIN	# →‎ئز‎→
+ 0xfc9a: (0x0649, 0x0674, 0x0645,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH MEEM INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER MEEM	# →‎ئم‎→
+ 0xfcdf: (0x0649, 0x0674, 0x0645,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH MEEM MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER MEEM	# →‎ئم‎→
+ 0xfc66: (0x0649, 0x0674, 0x0645,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH MEEM FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER MEEM	# →‎ئم‎→
+ 0xfc02: (0x0649, 0x0674, 0x0645,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH MEEM ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER MEEM	# →‎ئم‎→
+ 0xfc67: (0x0649, 0x0674, 0x0646,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH NOON FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER NOON	# →‎ئن‎→
+ 0xfbef: (0x0649, 0x0674, 0x0648,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH WAW FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW	# →‎ئو‎→
+ 0xfbee: (0x0649, 0x0674, 0x0648,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH WAW ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW	# →‎ئو‎→
+ 0xfbf1: (0x0649, 0x0674, 0x0648, 0x0313,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH U FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW, COMBINING COMMA ABOVE	# →‎ئۇ‎→
+ 0xfbf0: (0x0649, 0x0674, 0x0648, 0x0313,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH U ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW, COMBINING COMMA ABOVE	# →‎ئۇ‎→
+ 0xfbf3: (0x0649, 0x0674, 0x0648, 0x0306,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH OE FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW, COMBINING BREVE	# →‎ئۆ‎→
+ 0xfbf2: (0x0649, 0x0674, 0x0648, 0x0306,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH OE ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW, COMBINING BREVE	# →‎ئۆ‎→
+ 0xfbf5: (0x0649, 0x0674, 0x0648, 0x0670,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH YU FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW, ARABIC LETTER SUPERSCRIPT ALEF	# →‎ئۈ‎→
+ 0xfbf4: (0x0649, 0x0674, 0x0648, 0x0670,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH YU ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER WAW, ARABIC LETTER SUPERSCRIPT ALEF	# →‎ئۈ‎→
+ 0xfbfb: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE UIGHUR KIRGHIZ YEH WITH HAMZA ABOVE WITH ALEF MAKSURA INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئى‎→
+ 0xfbfa: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE UIGHUR KIRGHIZ YEH WITH HAMZA ABOVE WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئى‎→
+ 0xfc68: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئى‎→
+ 0xfbf9: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE UIGHUR KIRGHIZ YEH WITH HAMZA ABOVE WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئى‎→
+ 0xfc03: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئى‎→
+ 0xfc69: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئي‎→→‎ٴىى‎→→‎ئى‎→
+ 0xfc04: (0x0649, 0x0674, 0x0649,), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH YEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HIGH HAMZA, ARABIC LETTER ALEF MAKSURA	# →‎ئي‎→→‎ٴىى‎→→‎ئى‎→
+ 0xfcda: (0x0649, 0x062c,), #  ARABIC LIGATURE YEH WITH JEEM INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER JEEM	# →‎يج‎→
+ 0xfc55: (0x0649, 0x062c,), #  ARABIC LIGATURE YEH WITH JEEM ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER JEEM	# →‎يج‎→
+ 0xfc11: (0x0649, 0x06db, 0x062c,), #  ARABIC LIGATURE THEH WITH JEEM ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER JEEM	# →‎ثج‎→
+ 0xfdaf: (0x0649, 0x062c, 0x0649,), #  ARABIC LIGATURE YEH WITH JEEM WITH YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER JEEM, ARABIC LETTER ALEF MAKSURA	# →‎يجي‎→
+ 0xfcdb: (0x0649, 0x062d,), #  ARABIC LIGATURE YEH WITH HAH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HAH	# →‎يح‎→
+ 0xfc56: (0x0649, 0x062d,), #  ARABIC LIGATURE YEH WITH HAH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HAH	# →‎يح‎→
+ 0xfdae: (0x0649, 0x062d, 0x0649,), #  ARABIC LIGATURE YEH WITH HAH WITH YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER HAH, ARABIC LETTER ALEF MAKSURA	# →‎يحي‎→
+ 0xfcdc: (0x0649, 0x062e,), #  ARABIC LIGATURE YEH WITH KHAH INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER KHAH	# →‎يخ‎→
+ 0xfc57: (0x0649, 0x062e,), #  ARABIC LIGATURE YEH WITH KHAH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER KHAH	# →‎يخ‎→
+ 0xfc91: (0x0649, 0x0631,), #  ARABIC LIGATURE YEH WITH REH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER REH	# →‎ير‎→
+ 0xfc76: (0x0649, 0x06db, 0x0631,), #  ARABIC LIGATURE THEH WITH REH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER REH	# →‎ثر‎→
+ 0xfc92: (0x0649, 0x0632,), #  ARABIC LIGATURE YEH WITH ZAIN FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER ZAIN	# →‎يز‎→
+ 0xfc77: (0x0649, 0x06db, 0x0632,), #  ARABIC LIGATURE THEH WITH ZAIN FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ZAIN	# →‎ثز‎→
+ 0xfcdd: (0x0649, 0x0645,), #  ARABIC LIGATURE YEH WITH MEEM INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM	# →‎يم‎→
+ 0xfcf0: (0x0649, 0x0645,), #  ARABIC LIGATURE YEH WITH MEEM MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM	# →‎يم‎→
+ 0xfc93: (0x0649, 0x0645,), #  ARABIC LIGATURE YEH WITH MEEM FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM	# →‎يم‎→
+ 0xfc58: (0x0649, 0x0645,), #  ARABIC LIGATURE YEH WITH MEEM ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM	# →‎يم‎→
+ 0xfca6: (0x0649, 0x06db, 0x0645,), #  ARABIC LIGATURE THEH WITH MEEM INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎ثم‎→
+ 0xfce5: (0x0649, 0x06db, 0x0645,), #  ARABIC LIGATURE THEH WITH MEEM MEDIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎ثم‎→
+ 0xfc78: (0x0649, 0x06db, 0x0645,), #  ARABIC LIGATURE THEH WITH MEEM FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎ثم‎→
+ 0xfc12: (0x0649, 0x06db, 0x0645,), #  ARABIC LIGATURE THEH WITH MEEM ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER MEEM	# →‎ثم‎→
+ 0xfd9d: (0x0649, 0x0645, 0x0645,), #  ARABIC LIGATURE YEH WITH MEEM WITH MEEM INITIAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM, ARABIC LETTER MEEM	# →‎يمم‎→
+ 0xfd9c: (0x0649, 0x0645, 0x0645,), #  ARABIC LIGATURE YEH WITH MEEM WITH MEEM FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM, ARABIC LETTER MEEM	# →‎يمم‎→
+ 0xfdb0: (0x0649, 0x0645, 0x0649,), #  ARABIC LIGATURE YEH WITH MEEM WITH YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER MEEM, ARABIC LETTER ALEF MAKSURA	# →‎يمي‎→
+ 0xfc94: (0x0649, 0x0646,), #  ARABIC LIGATURE YEH WITH NOON FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER NOON	# →‎ين‎→
+ 0xfc79: (0x0649, 0x06db, 0x0646,), #  ARABIC LIGATURE THEH WITH NOON FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER NOON	# →‎ثن‎→
+ 0xfc95: (0x0649, 0x0649,), #  ARABIC LIGATURE YEH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER ALEF MAKSURA	# →‎يى‎→
+ 0xfc59: (0x0649, 0x0649,), #  ARABIC LIGATURE YEH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER ALEF MAKSURA	# →‎يى‎→
+ 0xfc96: (0x0649, 0x0649,), #  ARABIC LIGATURE YEH WITH YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER ALEF MAKSURA	# →‎يي‎→
+ 0xfc5a: (0x0649, 0x0649,), #  ARABIC LIGATURE YEH WITH YEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC LETTER ALEF MAKSURA	# →‎يي‎→
+ 0xfc7a: (0x0649, 0x06db, 0x0649,), #  ARABIC LIGATURE THEH WITH ALEF MAKSURA FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎ثى‎→
+ 0xfc13: (0x0649, 0x06db, 0x0649,), #  ARABIC LIGATURE THEH WITH ALEF MAKSURA ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎ثى‎→
+ 0xfc7b: (0x0649, 0x06db, 0x0649,), #  ARABIC LIGATURE THEH WITH YEH FINAL FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎ثي‎→
+ 0xfc14: (0x0649, 0x06db, 0x0649,), #  ARABIC LIGATURE THEH WITH YEH ISOLATED FORM → ARABIC LETTER ALEF MAKSURA, ARABIC SMALL HIGH THREE DOTS, ARABIC LETTER ALEF MAKSURA	# →‎ثي‎→
+ 0xfbb1: (0x06d3,), #  ARABIC LETTER YEH BARREE WITH HAMZA ABOVE FINAL FORM → ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
+ 0xfbb0: (0x06d3,), #  ARABIC LETTER YEH BARREE WITH HAMZA ABOVE ISOLATED FORM → ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
+ 0x102b8: (0x2d40,), #  CARIAN LETTER SS → TIFINAGH LETTER YAH
+ 0x205e: (0x2d42,), #  VERTICAL FOUR DOTS → TIFINAGH LETTER TUAREG YAH
+ 0x2e3d: (0x2d42,), #  VERTICAL SIX DOTS → TIFINAGH LETTER TUAREG YAH	# →⁞→
+ 0x2999: (0x2d42,), #  DOTTED FENCE → TIFINAGH LETTER TUAREG YAH	# →⁞→
+ 0xfe19: (0x2d57,), #  PRESENTATION FORM FOR VERTICAL HORIZONTAL ELLIPSIS → TIFINAGH LETTER TUAREG YAGH	# →⁝→
+ 0x205d: (0x2d57,), #  TRICOLON → TIFINAGH LETTER TUAREG YAGH
+ 0x22ee: (0x2d57,), #  VERTICAL ELLIPSIS → TIFINAGH LETTER TUAREG YAGH	# →︙→→⁝→
+ 0x0544: (0x1206,), #  ARMENIAN CAPITAL LETTER MEN → ETHIOPIC SYLLABLE HO
+ 0x054c: (0x1261,), #  ARMENIAN CAPITAL LETTER RA → ETHIOPIC SYLLABLE BU
+ 0x053b: (0x12ae,), #  ARMENIAN CAPITAL LETTER INI → ETHIOPIC SYLLABLE KO
+ 0x054a: (0x1323,), #  ARMENIAN CAPITAL LETTER PEH → ETHIOPIC SYLLABLE THAA
+ 0x0906: (0x0905, 0x093e,), #  DEVANAGARI LETTER AA → DEVANAGARI LETTER A, DEVANAGARI VOWEL SIGN AA
+ 0x0912: (0x0905, 0x093e, 0x0946,), #  DEVANAGARI LETTER SHORT O → DEVANAGARI LETTER A, DEVANAGARI VOWEL SIGN AA, DEVANAGARI VOWEL SIGN SHORT E	# →अॊ→→आॆ→
+ 0x0913: (0x0905, 0x093e, 0x0947,), #  DEVANAGARI LETTER O → DEVANAGARI LETTER A, DEVANAGARI VOWEL SIGN AA, DEVANAGARI VOWEL SIGN E	# →अो→→आे→
+ 0x0914: (0x0905, 0x093e, 0x0948,), #  DEVANAGARI LETTER AU → DEVANAGARI LETTER A, DEVANAGARI VOWEL SIGN AA, DEVANAGARI VOWEL SIGN AI	# →अौ→→आै→
+ 0x0904: (0x0905, 0x0946,), #  DEVANAGARI LETTER SHORT A → DEVANAGARI LETTER A, DEVANAGARI VOWEL SIGN SHORT E
+ 0x0911: (0x0905, 0x0949,), #  DEVANAGARI LETTER CANDRA O → DEVANAGARI LETTER A, DEVANAGARI VOWEL SIGN CANDRA O
+ 0x090d: (0x090f, 0x0945,), #  DEVANAGARI LETTER CANDRA E → DEVANAGARI LETTER E, DEVANAGARI VOWEL SIGN CANDRA E
+ 0x090e: (0x090f, 0x0946,), #  DEVANAGARI LETTER SHORT E → DEVANAGARI LETTER E, DEVANAGARI VOWEL SIGN SHORT E
+ 0x0910: (0x090f, 0x0947,), #  DEVANAGARI LETTER AI → DEVANAGARI LETTER E, DEVANAGARI VOWEL SIGN E
+ 0x0908: (0x0930, 0x094d, 0x0907,), #  DEVANAGARI LETTER II → DEVANAGARI LETTER RA, DEVANAGARI SIGN VIRAMA, DEVANAGARI LETTER I
+ 0x0abd: (0x093d,), #  GUJARATI SIGN AVAGRAHA → DEVANAGARI SIGN AVAGRAHA
+ 0x111dc: (0xa8fb,), #  SHARADA HEADSTROKE → DEVANAGARI HEADSTROKE
+ 0x111cb: (0x093a,), #  SHARADA VOWEL MODIFIER MARK → DEVANAGARI VOWEL SIGN OE
+ 0x0ac1: (0x0941,), #  GUJARATI VOWEL SIGN U → DEVANAGARI VOWEL SIGN U
+ 0x0ac2: (0x0942,), #  GUJARATI VOWEL SIGN UU → DEVANAGARI VOWEL SIGN UU
+ 0x0a4b: (0x0946,), #  GURMUKHI VOWEL SIGN OO → DEVANAGARI VOWEL SIGN SHORT E
+ 0x0a4d: (0x094d,), #  GURMUKHI SIGN VIRAMA → DEVANAGARI SIGN VIRAMA
+ 0x0acd: (0x094d,), #  GUJARATI SIGN VIRAMA → DEVANAGARI SIGN VIRAMA
+ 0x0986: (0x0985, 0x09be,), #  BENGALI LETTER AA → BENGALI LETTER A, BENGALI VOWEL SIGN AA
+ 0x09e0: (0x098b, 0x09c3,), #  BENGALI LETTER VOCALIC RR → BENGALI LETTER VOCALIC R, BENGALI VOWEL SIGN VOCALIC R
+ 0x09e1: (0x098b, 0x09c3,), #  BENGALI LETTER VOCALIC LL → BENGALI LETTER VOCALIC R, BENGALI VOWEL SIGN VOCALIC R	# →ঌৢ→→ৠ→
+ 0x11492: (0x0998,), #  TIRHUTA LETTER GHA → BENGALI LETTER GHA
+ 0x11494: (0x099a,), #  TIRHUTA LETTER CA → BENGALI LETTER CA
+ 0x11496: (0x099c,), #  TIRHUTA LETTER JA → BENGALI LETTER JA
+ 0x11498: (0x099e,), #  TIRHUTA LETTER NYA → BENGALI LETTER NYA
+ 0x11499: (0x099f,), #  TIRHUTA LETTER TTA → BENGALI LETTER TTA
+ 0x1149b: (0x09a1,), #  TIRHUTA LETTER DDA → BENGALI LETTER DDA
+ 0x114aa: (0x09a3,), #  TIRHUTA LETTER LA → BENGALI LETTER NNA
+ 0x1149e: (0x09a4,), #  TIRHUTA LETTER TA → BENGALI LETTER TA
+ 0x1149f: (0x09a5,), #  TIRHUTA LETTER THA → BENGALI LETTER THA
+ 0x114a0: (0x09a6,), #  TIRHUTA LETTER DA → BENGALI LETTER DA
+ 0x114a1: (0x09a7,), #  TIRHUTA LETTER DHA → BENGALI LETTER DHA
+ 0x114a2: (0x09a8,), #  TIRHUTA LETTER NA → BENGALI LETTER NA
+ 0x114a3: (0x09aa,), #  TIRHUTA LETTER PA → BENGALI LETTER PA
+ 0x114a9: (0x09ac,), #  TIRHUTA LETTER RA → BENGALI LETTER BA
+ 0x114a7: (0x09ae,), #  TIRHUTA LETTER MA → BENGALI LETTER MA
+ 0x114a8: (0x09af,), #  TIRHUTA LETTER YA → BENGALI LETTER YA
+ 0x114ab: (0x09b0,), #  TIRHUTA LETTER VA → BENGALI LETTER RA
+ 0x1149d: (0x09b2,), #  TIRHUTA LETTER NNA → BENGALI LETTER LA
+ 0x114ad: (0x09b7,), #  TIRHUTA LETTER SSA → BENGALI LETTER SSA
+ 0x114ae: (0x09b8,), #  TIRHUTA LETTER SA → BENGALI LETTER SA
+ 0x114c4: (0x09bd,), #  TIRHUTA SIGN AVAGRAHA → BENGALI SIGN AVAGRAHA
+ 0x114b0: (0x09be,), #  TIRHUTA VOWEL SIGN AA → BENGALI VOWEL SIGN AA
+ 0x114b1: (0x09bf,), #  TIRHUTA VOWEL SIGN I → BENGALI VOWEL SIGN I
+ 0x114b9: (0x09c7,), #  TIRHUTA VOWEL SIGN E → BENGALI VOWEL SIGN E
+ 0x114bc: (0x09cb,), #  TIRHUTA VOWEL SIGN O → BENGALI VOWEL SIGN O
+ 0x114be: (0x09cc,), #  TIRHUTA VOWEL SIGN AU → BENGALI VOWEL SIGN AU
+ 0x114c2: (0x09cd,), #  TIRHUTA SIGN VIRAMA → BENGALI SIGN VIRAMA
+ 0x114bd: (0x09d7,), #  TIRHUTA VOWEL SIGN SHORT O → BENGALI AU LENGTH MARK
+ 0x0a09: (0x0a73, 0x0a41,), #  GURMUKHI LETTER U → GURMUKHI URA, GURMUKHI VOWEL SIGN U
+ 0x0a0a: (0x0a73, 0x0a42,), #  GURMUKHI LETTER UU → GURMUKHI URA, GURMUKHI VOWEL SIGN UU
+ 0x0a06: (0x0a05, 0x0a3e,), #  GURMUKHI LETTER AA → GURMUKHI LETTER A, GURMUKHI VOWEL SIGN AA
+ 0x0a10: (0x0a05, 0x0a48,), #  GURMUKHI LETTER AI → GURMUKHI LETTER A, GURMUKHI VOWEL SIGN AI
+ 0x0a14: (0x0a05, 0x0a4c,), #  GURMUKHI LETTER AU → GURMUKHI LETTER A, GURMUKHI VOWEL SIGN AU
+ 0x0a07: (0x0a72, 0x0a3f,), #  GURMUKHI LETTER I → GURMUKHI IRI, GURMUKHI VOWEL SIGN I
+ 0x0a08: (0x0a72, 0x0a40,), #  GURMUKHI LETTER II → GURMUKHI IRI, GURMUKHI VOWEL SIGN II
+ 0x0a0f: (0x0a72, 0x0a47,), #  GURMUKHI LETTER EE → GURMUKHI IRI, GURMUKHI VOWEL SIGN EE
+ 0x0a86: (0x0a85, 0x0abe,), #  GUJARATI LETTER AA → GUJARATI LETTER A, GUJARATI VOWEL SIGN AA
+ 0x0a91: (0x0a85, 0x0abe, 0x0ac5,), #  GUJARATI VOWEL CANDRA O → GUJARATI LETTER A, GUJARATI VOWEL SIGN AA, GUJARATI VOWEL SIGN CANDRA E	# →અૉ→→આૅ→
+ 0x0a93: (0x0a85, 0x0abe, 0x0ac7,), #  GUJARATI LETTER O → GUJARATI LETTER A, GUJARATI VOWEL SIGN AA, GUJARATI VOWEL SIGN E	# →અો→→આે→
+ 0x0a94: (0x0a85, 0x0abe, 0x0ac8,), #  GUJARATI LETTER AU → GUJARATI LETTER A, GUJARATI VOWEL SIGN AA, GUJARATI VOWEL SIGN AI	# →અૌ→→આૈ→
+ 0x0a8d: (0x0a85, 0x0ac5,), #  GUJARATI VOWEL CANDRA E → GUJARATI LETTER A, GUJARATI VOWEL SIGN CANDRA E
+ 0x0a8f: (0x0a85, 0x0ac7,), #  GUJARATI LETTER E → GUJARATI LETTER A, GUJARATI VOWEL SIGN E
+ 0x0a90: (0x0a85, 0x0ac8,), #  GUJARATI LETTER AI → GUJARATI LETTER A, GUJARATI VOWEL SIGN AI
+ 0x0b06: (0x0b05, 0x0b3e,), #  ORIYA LETTER AA → ORIYA LETTER A, ORIYA VOWEL SIGN AA
+ 0x0bee: (0x0b85,), #  TAMIL DIGIT EIGHT → TAMIL LETTER A
+ 0x0bb0: (0x0b88,), #  TAMIL LETTER RA → TAMIL LETTER II	# →ா→
+ 0x0bbe: (0x0b88,), #  TAMIL VOWEL SIGN AA → TAMIL LETTER II
+ 0x0beb: (0x0b88, 0x0bc1,), #  TAMIL DIGIT FIVE → TAMIL LETTER II, TAMIL VOWEL SIGN U	# →ரு→
+ 0x0be8: (0x0b89,), #  TAMIL DIGIT TWO → TAMIL LETTER U
+ 0x0d09: (0x0b89,), #  MALAYALAM LETTER U → TAMIL LETTER U
+ 0x0b8a: (0x0b89, 0x0bb3,), #  TAMIL LETTER UU → TAMIL LETTER U, TAMIL LETTER LLA
+ 0x0d0a: (0x0b89, 0x0d57,), #  MALAYALAM LETTER UU → TAMIL LETTER U, MALAYALAM AU LENGTH MARK	# →ഉൗ→
+ 0x0bed: (0x0b8e,), #  TAMIL DIGIT SEVEN → TAMIL LETTER E
+ 0x0bf7: (0x0b8e, 0x0bb5,), #  TAMIL CREDIT SIGN → TAMIL LETTER E, TAMIL LETTER VA
+ 0x0b9c: (0x0b90,), #  TAMIL LETTER JA → TAMIL LETTER AI
+ 0x0d1c: (0x0b90,), #  MALAYALAM LETTER JA → TAMIL LETTER AI	# →ஜ→
+ 0x0be7: (0x0b95,), #  TAMIL DIGIT ONE → TAMIL LETTER KA
+ 0x0bea: (0x0b9a,), #  TAMIL DIGIT FOUR → TAMIL LETTER CA
+ 0x0bec: (0x0b9a, 0x0bc1,), #  TAMIL DIGIT SIX → TAMIL LETTER CA, TAMIL VOWEL SIGN U
+ 0x0bf2: (0x0b9a, 0x0bc2,), #  TAMIL NUMBER ONE THOUSAND → TAMIL LETTER CA, TAMIL VOWEL SIGN UU
+ 0x0d3a: (0x0b9f, 0x0bbf,), #  MALAYALAM LETTER TTTA → TAMIL LETTER TTA, TAMIL VOWEL SIGN I
+ 0x0d23: (0x0ba3,), #  MALAYALAM LETTER NNA → TAMIL LETTER NNA
+ 0x0bfa: (0x0ba8, 0x0bc0,), #  TAMIL NUMBER SIGN → TAMIL LETTER NA, TAMIL VOWEL SIGN II
+ 0x0bf4: (0x0bae, 0x0bc0,), #  TAMIL MONTH SIGN → TAMIL LETTER MA, TAMIL VOWEL SIGN II
+ 0x0bf0: (0x0baf,), #  TAMIL NUMBER TEN → TAMIL LETTER YA
+ 0x0d34: (0x0bb4,), #  MALAYALAM LETTER LLLA → TAMIL LETTER LLLA
+ 0x0bd7: (0x0bb3,), #  TAMIL AU LENGTH MARK → TAMIL LETTER LLA
+ 0x0bc8: (0x0ba9,), #  TAMIL VOWEL SIGN AI → TAMIL LETTER NNNA
+ 0x0d36: (0x0bb6,), #  MALAYALAM LETTER SHA → TAMIL LETTER SHA
+ 0x0bf8: (0x0bb7,), #  TAMIL AS ABOVE SIGN → TAMIL LETTER SSA
+ 0x0d3f: (0x0bbf,), #  MALAYALAM VOWEL SIGN I → TAMIL VOWEL SIGN I
+ 0x0d40: (0x0bbf,), #  MALAYALAM VOWEL SIGN II → TAMIL VOWEL SIGN I
+ 0x0bca: (0x0bc6, 0x0b88,), #  TAMIL VOWEL SIGN O → TAMIL VOWEL SIGN E, TAMIL LETTER II	# →ெர→
+ 0x0bcc: (0x0bc6, 0x0bb3,), #  TAMIL VOWEL SIGN AU → TAMIL VOWEL SIGN E, TAMIL LETTER LLA
+ 0x0bcb: (0x0bc7, 0x0b88,), #  TAMIL VOWEL SIGN OO → TAMIL VOWEL SIGN EE, TAMIL LETTER II	# →ேர→
+ 0x0c85: (0x0c05,), #  KANNADA LETTER A → TELUGU LETTER A
+ 0x0c86: (0x0c06,), #  KANNADA LETTER AA → TELUGU LETTER AA
+ 0x0c87: (0x0c07,), #  KANNADA LETTER I → TELUGU LETTER I
+ 0x0c60: (0x0c0b, 0x0c3e,), #  TELUGU LETTER VOCALIC RR → TELUGU LETTER VOCALIC R, TELUGU VOWEL SIGN AA
+ 0x0c61: (0x0c0c, 0x0c3e,), #  TELUGU LETTER VOCALIC LL → TELUGU LETTER VOCALIC L, TELUGU VOWEL SIGN AA
+ 0x0c92: (0x0c12,), #  KANNADA LETTER O → TELUGU LETTER O
+ 0x0c14: (0x0c12, 0x0c4c,), #  TELUGU LETTER AU → TELUGU LETTER O, TELUGU VOWEL SIGN AU
+ 0x0c94: (0x0c12, 0x0c4c,), #  KANNADA LETTER AU → TELUGU LETTER O, TELUGU VOWEL SIGN AU	# →ఔ→
+ 0x0c13: (0x0c12, 0x0c55,), #  TELUGU LETTER OO → TELUGU LETTER O, TELUGU LENGTH MARK
+ 0x0c93: (0x0c12, 0x0c55,), #  KANNADA LETTER OO → TELUGU LETTER O, TELUGU LENGTH MARK	# →ఓ→
+ 0x0c9c: (0x0c1c,), #  KANNADA LETTER JA → TELUGU LETTER JA
+ 0x0c9e: (0x0c1e,), #  KANNADA LETTER NYA → TELUGU LETTER NYA
+ 0x0c22: (0x0c21, 0x0323,), #  TELUGU LETTER DDHA → TELUGU LETTER DDA, COMBINING DOT BELOW
+ 0x0ca3: (0x0c23,), #  KANNADA LETTER NNA → TELUGU LETTER NNA
+ 0x0c25: (0x0c27, 0x05bc,), #  TELUGU LETTER THA → TELUGU LETTER DHA, HEBREW POINT DAGESH OR MAPIQ
+ 0x0c2d: (0x0c2c, 0x0323,), #  TELUGU LETTER BHA → TELUGU LETTER BA, COMBINING DOT BELOW
+ 0x0caf: (0x0c2f,), #  KANNADA LETTER YA → TELUGU LETTER YA
+ 0x0c20: (0x0c30, 0x05bc,), #  TELUGU LETTER TTHA → TELUGU LETTER RA, HEBREW POINT DAGESH OR MAPIQ
+ 0x0cb1: (0x0c31,), #  KANNADA LETTER RRA → TELUGU LETTER RRA
+ 0x0cb2: (0x0c32,), #  KANNADA LETTER LA → TELUGU LETTER LA
+ 0x0c37: (0x0c35, 0x0323,), #  TELUGU LETTER SSA → TELUGU LETTER VA, COMBINING DOT BELOW
+ 0x0c39: (0x0c35, 0x0c3e,), #  TELUGU LETTER HA → TELUGU LETTER VA, TELUGU VOWEL SIGN AA
+ 0x0c2e: (0x0c35, 0x0c41,), #  TELUGU LETTER MA → TELUGU LETTER VA, TELUGU VOWEL SIGN U
+ 0x0c42: (0x0c41, 0x0c3e,), #  TELUGU VOWEL SIGN UU → TELUGU VOWEL SIGN U, TELUGU VOWEL SIGN AA
+ 0x0c44: (0x0c43, 0x0c3e,), #  TELUGU VOWEL SIGN VOCALIC RR → TELUGU VOWEL SIGN VOCALIC R, TELUGU VOWEL SIGN AA
+ 0x0ce1: (0x0c8c, 0x0cbe,), #  KANNADA LETTER VOCALIC LL → KANNADA LETTER VOCALIC L, KANNADA VOWEL SIGN AA
+ 0x0d08: (0x0d07, 0x0d57,), #  MALAYALAM LETTER II → MALAYALAM LETTER I, MALAYALAM AU LENGTH MARK
+ 0x0d10: (0x0d0e, 0x0d46,), #  MALAYALAM LETTER AI → MALAYALAM LETTER E, MALAYALAM VOWEL SIGN E
+ 0x0d13: (0x0d12, 0x0d3e,), #  MALAYALAM LETTER OO → MALAYALAM LETTER O, MALAYALAM VOWEL SIGN AA
+ 0x0d14: (0x0d12, 0x0d57,), #  MALAYALAM LETTER AU → MALAYALAM LETTER O, MALAYALAM AU LENGTH MARK
+ 0x0d61: (0x0d1e,), #  MALAYALAM LETTER VOCALIC LL → MALAYALAM LETTER NYA
+ 0x0d6b: (0x0d26, 0x0d4d, 0x0d30,), #  MALAYALAM DIGIT FIVE → MALAYALAM LETTER DA, MALAYALAM SIGN VIRAMA, MALAYALAM LETTER RA
+ 0x0d79: (0x0d28, 0x0d41,), #  MALAYALAM DATE MARK → MALAYALAM LETTER NA, MALAYALAM VOWEL SIGN U
+ 0x0d0c: (0x0d28, 0x0d41,), #  MALAYALAM LETTER VOCALIC L → MALAYALAM LETTER NA, MALAYALAM VOWEL SIGN U
+ 0x0d19: (0x0d28, 0x0d41,), #  MALAYALAM LETTER NGA → MALAYALAM LETTER NA, MALAYALAM VOWEL SIGN U	# →ഌ→
+ 0x0d6f: (0x0d28, 0x0d4d,), #  MALAYALAM DIGIT NINE → MALAYALAM LETTER NA, MALAYALAM SIGN VIRAMA
+ 0x0d7b: (0x0d28, 0x0d4d,), #  MALAYALAM LETTER CHILLU N → MALAYALAM LETTER NA, MALAYALAM SIGN VIRAMA	# →൯→
+ 0x0d6c: (0x0d28, 0x0d4d, 0x0d28,), #  MALAYALAM DIGIT SIX → MALAYALAM LETTER NA, MALAYALAM SIGN VIRAMA, MALAYALAM LETTER NA
+ 0x0d5a: (0x0d28, 0x0d4d, 0x0d2e,), #  MALAYALAM FRACTION THREE EIGHTIETHS → MALAYALAM LETTER NA, MALAYALAM SIGN VIRAMA, MALAYALAM LETTER MA
+ 0x0d31: (0x0d30,), #  MALAYALAM LETTER RRA → MALAYALAM LETTER RA
+ 0x0d6a: (0x0d30, 0x0d4d,), #  MALAYALAM DIGIT FOUR → MALAYALAM LETTER RA, MALAYALAM SIGN VIRAMA
+ 0x0d7c: (0x0d30, 0x0d4d,), #  MALAYALAM LETTER CHILLU RR → MALAYALAM LETTER RA, MALAYALAM SIGN VIRAMA	# →൪→
+ 0x0d6e: (0x0d35, 0x0d4d, 0x0d30,), #  MALAYALAM DIGIT EIGHT → MALAYALAM LETTER VA, MALAYALAM SIGN VIRAMA, MALAYALAM LETTER RA
+ 0x0d76: (0x0d39, 0x0d4d, 0x0d2e,), #  MALAYALAM FRACTION ONE SIXTEENTH → MALAYALAM LETTER HA, MALAYALAM SIGN VIRAMA, MALAYALAM LETTER MA
+ 0x0d42: (0x0d41,), #  MALAYALAM VOWEL SIGN UU → MALAYALAM VOWEL SIGN U
+ 0x0d43: (0x0d41,), #  MALAYALAM VOWEL SIGN VOCALIC R → MALAYALAM VOWEL SIGN U	# →ൂ→
+ 0x0d48: (0x0d46, 0x0d46,), #  MALAYALAM VOWEL SIGN AI → MALAYALAM VOWEL SIGN E, MALAYALAM VOWEL SIGN E
+ 0x0dea: (0x0da2,), #  SINHALA LITH DIGIT FOUR → SINHALA LETTER ALPAPRAANA JAYANNA
+ 0x0deb: (0x0daf,), #  SINHALA LITH DIGIT FIVE → SINHALA LETTER ALPAPRAANA DAYANNA
+ 0x11413: (0x11434, 0x11442, 0x11412,), #  NEWA LETTER NGHA → NEWA LETTER HA, NEWA SIGN VIRAMA, NEWA LETTER NGA
+ 0x11419: (0x11434, 0x11442, 0x11418,), #  NEWA LETTER NYHA → NEWA LETTER HA, NEWA SIGN VIRAMA, NEWA LETTER NYA
+ 0x11424: (0x11434, 0x11442, 0x11423,), #  NEWA LETTER NHA → NEWA LETTER HA, NEWA SIGN VIRAMA, NEWA LETTER NA
+ 0x1142a: (0x11434, 0x11442, 0x11429,), #  NEWA LETTER MHA → NEWA LETTER HA, NEWA SIGN VIRAMA, NEWA LETTER MA
+ 0x1142d: (0x11434, 0x11442, 0x1142c,), #  NEWA LETTER RHA → NEWA LETTER HA, NEWA SIGN VIRAMA, NEWA LETTER RA
+ 0x1142f: (0x11434, 0x11442, 0x1142e,), #  NEWA LETTER LHA → NEWA LETTER HA, NEWA SIGN VIRAMA, NEWA LETTER LA
+ 0x115d8: (0x11582,), #  SIDDHAM LETTER THREE-CIRCLE ALTERNATE I → SIDDHAM LETTER I
+ 0x115d9: (0x11582,), #  SIDDHAM LETTER TWO-CIRCLE ALTERNATE I → SIDDHAM LETTER I
+ 0x115da: (0x11583,), #  SIDDHAM LETTER TWO-CIRCLE ALTERNATE II → SIDDHAM LETTER II
+ 0x115db: (0x11584,), #  SIDDHAM LETTER ALTERNATE U → SIDDHAM LETTER U
+ 0x115dc: (0x115b2,), #  SIDDHAM VOWEL SIGN ALTERNATE U → SIDDHAM VOWEL SIGN U
+ 0x115dd: (0x115b3,), #  SIDDHAM VOWEL SIGN ALTERNATE UU → SIDDHAM VOWEL SIGN UU
+ 0x0e03: (0x0e02,), #  THAI CHARACTER KHO KHUAT → THAI CHARACTER KHO KHAI
+ 0x0e14: (0x0e04,), #  THAI CHARACTER DO DEK → THAI CHARACTER KHO KHWAI
+ 0x0e15: (0x0e04,), #  THAI CHARACTER TO TAO → THAI CHARACTER KHO KHWAI	# →ด→
+ 0x0e21: (0x0e06,), #  THAI CHARACTER MO MA → THAI CHARACTER KHO RAKHANG
+ 0x0e88: (0x0e08,), #  LAO LETTER CO → THAI CHARACTER CHO CHAN
+ 0x0e0b: (0x0e0a,), #  THAI CHARACTER SO SO → THAI CHARACTER CHO CHANG
+ 0x0e0f: (0x0e0e,), #  THAI CHARACTER TO PATAK → THAI CHARACTER DO CHADA
+ 0x0e17: (0x0e11,), #  THAI CHARACTER THO THAHAN → THAI CHARACTER THO NANGMONTHO
+ 0x0e9a: (0x0e1a,), #  LAO LETTER BO → THAI CHARACTER BO BAIMAI
+ 0x0e9b: (0x0e1b,), #  LAO LETTER PO → THAI CHARACTER PO PLA
+ 0x0e9d: (0x0e1d,), #  LAO LETTER FO TAM → THAI CHARACTER FO FA
+ 0x0e9e: (0x0e1e,), #  LAO LETTER PHO TAM → THAI CHARACTER PHO PHAN
+ 0x0e9f: (0x0e1f,), #  LAO LETTER FO SUNG → THAI CHARACTER FO FAN
+ 0x0e26: (0x0e20,), #  THAI CHARACTER LU → THAI CHARACTER PHO SAMPHAO
+ 0x0e8d: (0x0e22,), #  LAO LETTER NYO → THAI CHARACTER YO YAK
+ 0x17d4: (0x0e2f,), #  KHMER SIGN KHAN → THAI CHARACTER PAIYANNOI
+ 0x0e45: (0x0e32,), #  THAI CHARACTER LAKKHANGYAO → THAI CHARACTER SARA AA
+ 0x0e33: (0x030a, 0x0e32,), #  THAI CHARACTER SARA AM → COMBINING RING ABOVE, THAI CHARACTER SARA AA	# →ํา→
+ 0x17b7: (0x0e34,), #  KHMER VOWEL SIGN I → THAI CHARACTER SARA I
+ 0x17b8: (0x0e35,), #  KHMER VOWEL SIGN II → THAI CHARACTER SARA II
+ 0x17b9: (0x0e36,), #  KHMER VOWEL SIGN Y → THAI CHARACTER SARA UE
+ 0x17ba: (0x0e37,), #  KHMER VOWEL SIGN YY → THAI CHARACTER SARA UEE
+ 0x0eb8: (0x0e38,), #  LAO VOWEL SIGN U → THAI CHARACTER SARA U
+ 0x0eb9: (0x0e39,), #  LAO VOWEL SIGN UU → THAI CHARACTER SARA UU
+ 0x0e41: (0x0e40, 0x0e40,), #  THAI CHARACTER SARA AE → THAI CHARACTER SARA E, THAI CHARACTER SARA E
+ 0x0edc: (0x0eab, 0x0e99,), #  LAO HO NO → LAO LETTER HO SUNG, LAO LETTER NO
+ 0x0edd: (0x0eab, 0x0ea1,), #  LAO HO MO → LAO LETTER HO SUNG, LAO LETTER MO
+ 0x0eb3: (0x030a, 0x0eb2,), #  LAO VOWEL SIGN AM → COMBINING RING ABOVE, LAO VOWEL SIGN AA	# →ໍາ→
+ 0x0f02: (0x0f60, 0x0f74, 0x0f82, 0x0f7f,), #  TIBETAN MARK GTER YIG MGO -UM RNAM BCAD MA → TIBETAN LETTER -A, TIBETAN VOWEL SIGN U, TIBETAN SIGN NYI ZLA NAA DA, TIBETAN SIGN RNAM BCAD
+ 0x0f03: (0x0f60, 0x0f74, 0x0f82, 0x0f14,), #  TIBETAN MARK GTER YIG MGO -UM GTER TSHEG MA → TIBETAN LETTER -A, TIBETAN VOWEL SIGN U, TIBETAN SIGN NYI ZLA NAA DA, TIBETAN MARK GTER TSHEG
+ 0x0f6a: (0x0f62,), #  TIBETAN LETTER FIXED-FORM RA → TIBETAN LETTER RA
+ 0x0f00: (0x0f68, 0x0f7c, 0x0f7e,), #  TIBETAN SYLLABLE OM → TIBETAN LETTER A, TIBETAN VOWEL SIGN O, TIBETAN SIGN RJES SU NGA RO
+ 0x0f77: (0x0fb2, 0x0f71, 0x0f80,), #  TIBETAN VOWEL SIGN VOCALIC RR → TIBETAN SUBJOINED LETTER RA, TIBETAN VOWEL SIGN AA, TIBETAN VOWEL SIGN REVERSED I
+ 0x0f79: (0x0fb3, 0x0f71, 0x0f80,), #  TIBETAN VOWEL SIGN VOCALIC LL → TIBETAN SUBJOINED LETTER LA, TIBETAN VOWEL SIGN AA, TIBETAN VOWEL SIGN REVERSED I
+ 0x11cb2: (0x11caa,), #  MARCHEN VOWEL SIGN U → MARCHEN SUBJOINED LETTER RA
+ 0x1081: (0x1002, 0x103e,), #  MYANMAR LETTER SHAN HA → MYANMAR LETTER GA, MYANMAR CONSONANT SIGN MEDIAL HA
+ 0x1000: (0x1002, 0x102c,), #  MYANMAR LETTER KA → MYANMAR LETTER GA, MYANMAR VOWEL SIGN AA
+ 0x1070: (0x1003, 0x103e,), #  MYANMAR LETTER EASTERN PWO KAREN GHWA → MYANMAR LETTER GHA, MYANMAR CONSONANT SIGN MEDIAL HA
+ 0x1066: (0x1015, 0x103e,), #  MYANMAR LETTER WESTERN PWO KAREN PWA → MYANMAR LETTER PA, MYANMAR CONSONANT SIGN MEDIAL HA
+ 0x101f: (0x1015, 0x102c,), #  MYANMAR LETTER HA → MYANMAR LETTER PA, MYANMAR VOWEL SIGN AA
+ 0x106f: (0x1015, 0x102c, 0x103e,), #  MYANMAR LETTER EASTERN PWO KAREN YWA → MYANMAR LETTER PA, MYANMAR VOWEL SIGN AA, MYANMAR CONSONANT SIGN MEDIAL HA	# →ဟှ→
+ 0x107e: (0x107d, 0x103e,), #  MYANMAR LETTER SHAN FA → MYANMAR LETTER SHAN PHA, MYANMAR CONSONANT SIGN MEDIAL HA
+ 0x1029: (0x101e, 0x103c,), #  MYANMAR LETTER O → MYANMAR LETTER SA, MYANMAR CONSONANT SIGN MEDIAL RA
+ 0x102a: (0x101e, 0x103c, 0x1031, 0x102c, 0x103a,), #  MYANMAR LETTER AU → MYANMAR LETTER SA, MYANMAR CONSONANT SIGN MEDIAL RA, MYANMAR VOWEL SIGN E, MYANMAR VOWEL SIGN AA, MYANMAR SIGN ASAT	# →ဩော်→
+ 0x109e: (0x1083, 0x030a,), #  MYANMAR SYMBOL SHAN ONE → MYANMAR VOWEL SIGN SHAN AA, COMBINING RING ABOVE	# →ႃံ→
+ 0x17a3: (0x17a2,), #  KHMER INDEPENDENT VOWEL QAQ → KHMER LETTER QA
+ 0x19d0: (0x199e,), #  NEW TAI LUE DIGIT ZERO → NEW TAI LUE LETTER LOW VA
+ 0x19d1: (0x19b1,), #  NEW TAI LUE DIGIT ONE → NEW TAI LUE VOWEL SIGN AA
+ 0x1a80: (0x1a45,), #  TAI THAM HORA DIGIT ZERO → TAI THAM LETTER WA
+ 0x1a90: (0x1a45,), #  TAI THAM THAM DIGIT ZERO → TAI THAM LETTER WA
+ 0xaa53: (0xaa01,), #  CHAM DIGIT THREE → CHAM LETTER I
+ 0xaa56: (0xaa23,), #  CHAM DIGIT SIX → CHAM LETTER RA
+ 0x1b52: (0x1b0d,), #  BALINESE DIGIT TWO → BALINESE LETTER LA LENGA
+ 0x1b53: (0x1b11,), #  BALINESE DIGIT THREE → BALINESE LETTER OKARA
+ 0x1b58: (0x1b28,), #  BALINESE DIGIT EIGHT → BALINESE LETTER PA KAPAL
+ 0xa9a3: (0xa99d,), #  JAVANESE LETTER DA MAHAPRANA → JAVANESE LETTER DDA
+ 0x1896: (0x185c,), #  MONGOLIAN LETTER ALI GALI ZA → MONGOLIAN LETTER TODO DZA
+ 0x1855: (0x1835,), #  MONGOLIAN LETTER TODO YA → MONGOLIAN LETTER JA
+ 0x1ff6: (0x13ef,), #  GREEK SMALL LETTER OMEGA WITH PERISPOMENI → CHEROKEE LETTER YA
+ 0x140d: (0x1401, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WE → CANADIAN SYLLABICS E, MIDDLE DOT	# →ᐁᐧ→
+ 0x142b: (0x1401, 0x1420,), #  CANADIAN SYLLABICS EN → CANADIAN SYLLABICS E, CANADIAN SYLLABICS FINAL GRAVE
+ 0x1411: (0x1404, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WII → CANADIAN SYLLABICS II, MIDDLE DOT	# →ᐄᐧ→
+ 0x1413: (0x1405, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WO → CANADIAN SYLLABICS O, MIDDLE DOT	# →ᐅᐧ→
+ 0x142d: (0x1405, 0x1420,), #  CANADIAN SYLLABICS ON → CANADIAN SYLLABICS O, CANADIAN SYLLABICS FINAL GRAVE
+ 0x1415: (0x1406, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WOO → CANADIAN SYLLABICS OO, MIDDLE DOT	# →ᐆᐧ→
+ 0x1418: (0x140a, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WA → CANADIAN SYLLABICS A, MIDDLE DOT	# →ᐊᐧ→
+ 0x142e: (0x140a, 0x1420,), #  CANADIAN SYLLABICS AN → CANADIAN SYLLABICS A, CANADIAN SYLLABICS FINAL GRAVE
+ 0x141a: (0x140b, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE WAA → CANADIAN SYLLABICS AA, MIDDLE DOT	# →ᐋᐧ→
+ 0x18dd: (0x141e, 0x18df,), #  CANADIAN SYLLABICS WESTERN W → CANADIAN SYLLABICS GLOTTAL STOP, CANADIAN SYLLABICS FINAL RAISED DOT
+ 0x14d1: (0x1421,), #  CANADIAN SYLLABICS CARRIER NG → CANADIAN SYLLABICS FINAL BOTTOM HALF RING
+ 0x1540: (0x1429,), #  CANADIAN SYLLABICS WEST-CREE Y → CANADIAN SYLLABICS FINAL PLUS
+ 0x143f: (0x1432, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWII → CANADIAN SYLLABICS PII, MIDDLE DOT	# →ᐲᐧ→
+ 0x1443: (0x1434, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWOO → CANADIAN SYLLABICS POO, MIDDLE DOT	# →ᐴᐧ→
+ 0x2369: (0x1435,), #  APL FUNCTIONAL SYMBOL GREATER-THAN DIAERESIS → CANADIAN SYLLABICS Y-CREE POO
+ 0x1447: (0x1439, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE PWAA → CANADIAN SYLLABICS PAA, MIDDLE DOT	# →ᐹᐧ→
+ 0x145c: (0x144f, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWII → CANADIAN SYLLABICS TII, MIDDLE DOT	# →ᑏᐧ→
+ 0x2e27: (0x1450,), #  RIGHT SIDEWAYS U BRACKET → CANADIAN SYLLABICS TO	# →⊃→
+ 0x2283: (0x1450,), #  SUPERSET OF → CANADIAN SYLLABICS TO
+ 0x145e: (0x1450, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWO → CANADIAN SYLLABICS TO, MIDDLE DOT	# →ᑐᐧ→
+ 0x1469: (0x1450, 0x0027,), #  CANADIAN SYLLABICS TTO → CANADIAN SYLLABICS TO, APOSTROPHE	# →ᑐᑊ→
+ 0x27c9: (0x1450, 0x002f,), #  SUPERSET PRECEDING SOLIDUS → CANADIAN SYLLABICS TO, SOLIDUS	# →⊃/→
+ 0x2ad7: (0x1450, 0x1455,), #  SUPERSET BESIDE SUBSET → CANADIAN SYLLABICS TO, CANADIAN SYLLABICS TA	# →⊃⊂→
+ 0x1460: (0x1451, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWOO → CANADIAN SYLLABICS TOO, MIDDLE DOT	# →ᑑᐧ→
+ 0x2e26: (0x1455,), #  LEFT SIDEWAYS U BRACKET → CANADIAN SYLLABICS TA	# →⊂→
+ 0x2282: (0x1455,), #  SUBSET OF → CANADIAN SYLLABICS TA
+ 0x1462: (0x1455, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWA → CANADIAN SYLLABICS TA, MIDDLE DOT	# →ᑕᐧ→
+ 0x146a: (0x1455, 0x0027,), #  CANADIAN SYLLABICS TTA → CANADIAN SYLLABICS TA, APOSTROPHE	# →ᑕᑊ→
+ 0x1464: (0x1456, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE TWAA → CANADIAN SYLLABICS TAA, MIDDLE DOT	# →ᑖᐧ→
+ 0x1475: (0x146b, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWE → CANADIAN SYLLABICS KE, MIDDLE DOT	# →ᑫᐧ→
+ 0x1485: (0x146b, 0x0027,), #  CANADIAN SYLLABICS SOUTH-SLAVEY KEH → CANADIAN SYLLABICS KE, APOSTROPHE	# →ᑫᑊ→
+ 0x1479: (0x146e, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWII → CANADIAN SYLLABICS KII, MIDDLE DOT	# →ᑮᐧ→
+ 0x147d: (0x1470, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE KWOO → CANADIAN SYLLABICS KOO, MIDDLE DOT	# →ᑰᐧ→
+ 0x1603: (0x1489,), #  CANADIAN SYLLABICS CARRIER NO → CANADIAN SYLLABICS CE
+ 0x1493: (0x1489, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWE → CANADIAN SYLLABICS CE, MIDDLE DOT	# →ᒉᐧ→
+ 0x1495: (0x148b, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWI → CANADIAN SYLLABICS CI, MIDDLE DOT	# →ᒋᐧ→
+ 0x1497: (0x148c, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWII → CANADIAN SYLLABICS CII, MIDDLE DOT	# →ᒌᐧ→
+ 0x149b: (0x148e, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWOO → CANADIAN SYLLABICS COO, MIDDLE DOT	# →ᒎᐧ→
+ 0x1602: (0x1490,), #  CANADIAN SYLLABICS CARRIER NU → CANADIAN SYLLABICS CA
+ 0x149d: (0x1490, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWA → CANADIAN SYLLABICS CA, MIDDLE DOT	# →ᒐᐧ→
+ 0x149f: (0x1491, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE CWAA → CANADIAN SYLLABICS CAA, MIDDLE DOT	# →ᒑᐧ→
+ 0x14ad: (0x14a3, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWE → CANADIAN SYLLABICS ME, MIDDLE DOT	# →ᒣᐧ→
+ 0x14b1: (0x14a6, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWII → CANADIAN SYLLABICS MII, MIDDLE DOT	# →ᒦᐧ→
+ 0x14b3: (0x14a7, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWO → CANADIAN SYLLABICS MO, MIDDLE DOT	# →ᒧᐧ→
+ 0x14b5: (0x14a8, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWOO → CANADIAN SYLLABICS MOO, MIDDLE DOT	# →ᒨᐧ→
+ 0x14b9: (0x14ab, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE MWAA → CANADIAN SYLLABICS MAA, MIDDLE DOT	# →ᒫᐧ→
+ 0x14ca: (0x14c0, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE NWE → CANADIAN SYLLABICS NE, MIDDLE DOT	# →ᓀᐧ→
+ 0x18c7: (0x14c2, 0x00b7,), #  CANADIAN SYLLABICS OJIBWAY NWI → CANADIAN SYLLABICS NI, MIDDLE DOT	# →ᓂᐧ→
+ 0x18c9: (0x14c3, 0x00b7,), #  CANADIAN SYLLABICS OJIBWAY NWII → CANADIAN SYLLABICS NII, MIDDLE DOT	# →ᓃᐧ→
+ 0x18cb: (0x14c4, 0x00b7,), #  CANADIAN SYLLABICS OJIBWAY NWO → CANADIAN SYLLABICS NO, MIDDLE DOT	# →ᓄᐧ→
+ 0x18cd: (0x14c5, 0x00b7,), #  CANADIAN SYLLABICS OJIBWAY NWOO → CANADIAN SYLLABICS NOO, MIDDLE DOT	# →ᓅᐧ→
+ 0x14cc: (0x14c7, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE NWA → CANADIAN SYLLABICS NA, MIDDLE DOT	# →ᓇᐧ→
+ 0x14ce: (0x14c8, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE NWAA → CANADIAN SYLLABICS NAA, MIDDLE DOT	# →ᓈᐧ→
+ 0x1604: (0x14d3,), #  CANADIAN SYLLABICS CARRIER NE → CANADIAN SYLLABICS LE
+ 0x14dd: (0x14d3, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWE → CANADIAN SYLLABICS LE, MIDDLE DOT	# →ᓓᐧ→
+ 0x14df: (0x14d5, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWI → CANADIAN SYLLABICS LI, MIDDLE DOT	# →ᓕᐧ→
+ 0x14e1: (0x14d6, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWII → CANADIAN SYLLABICS LII, MIDDLE DOT	# →ᓖᐧ→
+ 0x14e3: (0x14d7, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWO → CANADIAN SYLLABICS LO, MIDDLE DOT	# →ᓗᐧ→
+ 0x14e5: (0x14d8, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWOO → CANADIAN SYLLABICS LOO, MIDDLE DOT	# →ᓘᐧ→
+ 0x1607: (0x14da,), #  CANADIAN SYLLABICS CARRIER NA → CANADIAN SYLLABICS LA
+ 0x14e7: (0x14da, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWA → CANADIAN SYLLABICS LA, MIDDLE DOT	# →ᓚᐧ→
+ 0x14e9: (0x14db, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE LWAA → CANADIAN SYLLABICS LAA, MIDDLE DOT	# →ᓛᐧ→
+ 0x14f7: (0x14ed, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWE → CANADIAN SYLLABICS SE, MIDDLE DOT	# →ᓭᐧ→
+ 0x14f9: (0x14ef, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWI → CANADIAN SYLLABICS SI, MIDDLE DOT	# →ᓯᐧ→
+ 0x14fb: (0x14f0, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWII → CANADIAN SYLLABICS SII, MIDDLE DOT	# →ᓰᐧ→
+ 0x14fd: (0x14f1, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWO → CANADIAN SYLLABICS SO, MIDDLE DOT	# →ᓱᐧ→
+ 0x14ff: (0x14f2, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWOO → CANADIAN SYLLABICS SOO, MIDDLE DOT	# →ᓲᐧ→
+ 0x1501: (0x14f4, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWA → CANADIAN SYLLABICS SA, MIDDLE DOT	# →ᓴᐧ→
+ 0x1503: (0x14f5, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SWAA → CANADIAN SYLLABICS SAA, MIDDLE DOT	# →ᓵᐧ→
+ 0x150c: (0x150b, 0x003c,), #  CANADIAN SYLLABICS NASKAPI SPWA → CANADIAN SYLLABICS NASKAPI S-W, LESS-THAN SIGN	# →ᔋᐸ→
+ 0x150e: (0x150b, 0x0062,), #  CANADIAN SYLLABICS NASKAPI SKWA → CANADIAN SYLLABICS NASKAPI S-W, LATIN SMALL LETTER B	# →ᔋᑲ→
+ 0x150d: (0x150b, 0x1455,), #  CANADIAN SYLLABICS NASKAPI STWA → CANADIAN SYLLABICS NASKAPI S-W, CANADIAN SYLLABICS TA
+ 0x150f: (0x150b, 0x1490,), #  CANADIAN SYLLABICS NASKAPI SCWA → CANADIAN SYLLABICS NASKAPI S-W, CANADIAN SYLLABICS CA
+ 0x1518: (0x1510, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWE → CANADIAN SYLLABICS SHE, MIDDLE DOT	# →ᔐᐧ→
+ 0x151a: (0x1511, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWI → CANADIAN SYLLABICS SHI, MIDDLE DOT	# →ᔑᐧ→
+ 0x151c: (0x1512, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWII → CANADIAN SYLLABICS SHII, MIDDLE DOT	# →ᔒᐧ→
+ 0x151e: (0x1513, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWO → CANADIAN SYLLABICS SHO, MIDDLE DOT	# →ᔓᐧ→
+ 0x1520: (0x1514, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWOO → CANADIAN SYLLABICS SHOO, MIDDLE DOT	# →ᔔᐧ→
+ 0x1522: (0x1515, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWA → CANADIAN SYLLABICS SHA, MIDDLE DOT	# →ᔕᐧ→
+ 0x1524: (0x1516, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE SHWAA → CANADIAN SYLLABICS SHAA, MIDDLE DOT	# →ᔖᐧ→
+ 0x1532: (0x1528, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWI → CANADIAN SYLLABICS YI, MIDDLE DOT	# →ᔨᐧ→
+ 0x1534: (0x1529, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWII → CANADIAN SYLLABICS YII, MIDDLE DOT	# →ᔩᐧ→
+ 0x1536: (0x152a, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWO → CANADIAN SYLLABICS YO, MIDDLE DOT	# →ᔪᐧ→
+ 0x1538: (0x152b, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWOO → CANADIAN SYLLABICS YOO, MIDDLE DOT	# →ᔫᐧ→
+ 0x153a: (0x152d, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWA → CANADIAN SYLLABICS YA, MIDDLE DOT	# →ᔭᐧ→
+ 0x153c: (0x152e, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE YWAA → CANADIAN SYLLABICS YAA, MIDDLE DOT	# →ᔮᐧ→
+ 0x1622: (0x1543,), #  CANADIAN SYLLABICS CARRIER LU → CANADIAN SYLLABICS R-CREE RE
+ 0x18e0: (0x1543, 0x00b7,), #  CANADIAN SYLLABICS R-CREE RWE → CANADIAN SYLLABICS R-CREE RE, MIDDLE DOT	# →ᕃᐧ→
+ 0x1623: (0x1546,), #  CANADIAN SYLLABICS CARRIER LO → CANADIAN SYLLABICS RI
+ 0x1624: (0x154a,), #  CANADIAN SYLLABICS CARRIER LE → CANADIAN SYLLABICS WEST-CREE LO
+ 0x154f: (0x154c, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE RWAA → CANADIAN SYLLABICS RAA, MIDDLE DOT	# →ᕌᐧ→
+ 0x1583: (0x1550, 0x0062,), #  CANADIAN SYLLABICS QA → CANADIAN SYLLABICS R, LATIN SMALL LETTER B	# →ᕐᑲ→
+ 0x1584: (0x1550, 0x0062, 0x0307,), #  CANADIAN SYLLABICS QAA → CANADIAN SYLLABICS R, LATIN SMALL LETTER B, COMBINING DOT ABOVE	# →ᕐᑳ→
+ 0x1581: (0x1550, 0x0064,), #  CANADIAN SYLLABICS QO → CANADIAN SYLLABICS R, LATIN SMALL LETTER D	# →ᕐᑯ→
+ 0x157f: (0x1550, 0x0050,), #  CANADIAN SYLLABICS QI → CANADIAN SYLLABICS R, LATIN CAPITAL LETTER P	# →ᕐᑭ→
+ 0x166f: (0x1550, 0x146b,), #  CANADIAN SYLLABICS QAI → CANADIAN SYLLABICS R, CANADIAN SYLLABICS KE
+ 0x157e: (0x1550, 0x146c,), #  CANADIAN SYLLABICS QAAI → CANADIAN SYLLABICS R, CANADIAN SYLLABICS KAAI
+ 0x1580: (0x1550, 0x146e,), #  CANADIAN SYLLABICS QII → CANADIAN SYLLABICS R, CANADIAN SYLLABICS KII
+ 0x1582: (0x1550, 0x1470,), #  CANADIAN SYLLABICS QOO → CANADIAN SYLLABICS R, CANADIAN SYLLABICS KOO
+ 0x1585: (0x1550, 0x1483,), #  CANADIAN SYLLABICS Q → CANADIAN SYLLABICS R, CANADIAN SYLLABICS K
+ 0x155c: (0x155a, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE FWAA → CANADIAN SYLLABICS FAA, MIDDLE DOT	# →ᕚᐧ→
+ 0x18e3: (0x155e, 0x00b7,), #  CANADIAN SYLLABICS THWE → CANADIAN SYLLABICS THE, MIDDLE DOT	# →ᕞᐧ→
+ 0x18e4: (0x1566, 0x00b7,), #  CANADIAN SYLLABICS THWA → CANADIAN SYLLABICS THA, MIDDLE DOT	# →ᕦᐧ→
+ 0x1569: (0x1567, 0x00b7,), #  CANADIAN SYLLABICS WEST-CREE THWAA → CANADIAN SYLLABICS THAA, MIDDLE DOT	# →ᕧᐧ→
+ 0x18e5: (0x156b, 0x00b7,), #  CANADIAN SYLLABICS TTHWE → CANADIAN SYLLABICS TTHE, MIDDLE DOT	# →ᕫᐧ→
+ 0x18e8: (0x1586, 0x00b7,), #  CANADIAN SYLLABICS TLHWE → CANADIAN SYLLABICS TLHE, MIDDLE DOT	# →ᖆᐧ→
+ 0x1591: (0x1595, 0x004a,), #  CANADIAN SYLLABICS NGO → CANADIAN SYLLABICS NG, LATIN CAPITAL LETTER J	# →ᖕᒍ→
+ 0x1670: (0x1595, 0x1489,), #  CANADIAN SYLLABICS NGAI → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS CE
+ 0x158e: (0x1595, 0x148a,), #  CANADIAN SYLLABICS NGAAI → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS CAAI
+ 0x158f: (0x1595, 0x148b,), #  CANADIAN SYLLABICS NGI → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS CI
+ 0x1590: (0x1595, 0x148c,), #  CANADIAN SYLLABICS NGII → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS CII
+ 0x1592: (0x1595, 0x148e,), #  CANADIAN SYLLABICS NGOO → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS COO
+ 0x1593: (0x1595, 0x1490,), #  CANADIAN SYLLABICS NGA → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS CA
+ 0x1594: (0x1595, 0x1491,), #  CANADIAN SYLLABICS NGAA → CANADIAN SYLLABICS NG, CANADIAN SYLLABICS CAA
+ 0x1673: (0x1596, 0x004a,), #  CANADIAN SYLLABICS NNGO → CANADIAN SYLLABICS NNG, LATIN CAPITAL LETTER J	# →ᖖᒍ→
+ 0x1671: (0x1596, 0x148b,), #  CANADIAN SYLLABICS NNGI → CANADIAN SYLLABICS NNG, CANADIAN SYLLABICS CI
+ 0x1672: (0x1596, 0x148c,), #  CANADIAN SYLLABICS NNGII → CANADIAN SYLLABICS NNG, CANADIAN SYLLABICS CII
+ 0x1674: (0x1596, 0x148e,), #  CANADIAN SYLLABICS NNGOO → CANADIAN SYLLABICS NNG, CANADIAN SYLLABICS COO
+ 0x1675: (0x1596, 0x1490,), #  CANADIAN SYLLABICS NNGA → CANADIAN SYLLABICS NNG, CANADIAN SYLLABICS CA
+ 0x1676: (0x1596, 0x1491,), #  CANADIAN SYLLABICS NNGAA → CANADIAN SYLLABICS NNG, CANADIAN SYLLABICS CAA
+ 0x18ea: (0x1597, 0x00b7,), #  CANADIAN SYLLABICS SAYISI SHWE → CANADIAN SYLLABICS SAYISI SHE, MIDDLE DOT	# →ᖗᐧ→
+ 0x1677: (0x15a7, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWEE → CANADIAN SYLLABICS TH-CREE THE, MIDDLE DOT	# →ᖧᐧ→
+ 0x1678: (0x15a8, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWI → CANADIAN SYLLABICS TH-CREE THI, MIDDLE DOT	# →ᖨᐧ→
+ 0x1679: (0x15a9, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWII → CANADIAN SYLLABICS TH-CREE THII, MIDDLE DOT	# →ᖩᐧ→
+ 0x167a: (0x15aa, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWO → CANADIAN SYLLABICS TH-CREE THO, MIDDLE DOT	# →ᖪᐧ→
+ 0x167b: (0x15ab, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWOO → CANADIAN SYLLABICS TH-CREE THOO, MIDDLE DOT	# →ᖫᐧ→
+ 0x167c: (0x15ac, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWA → CANADIAN SYLLABICS TH-CREE THA, MIDDLE DOT	# →ᖬᐧ→
+ 0x167d: (0x15ad, 0x00b7,), #  CANADIAN SYLLABICS WOODS-CREE THWAA → CANADIAN SYLLABICS TH-CREE THAA, MIDDLE DOT	# →ᖭᐧ→
+ 0x2aab: (0x15d2,), #  LARGER THAN → CANADIAN SYLLABICS CARRIER WE
+ 0x2aaa: (0x15d5,), #  SMALLER THAN → CANADIAN SYLLABICS CARRIER WA
+ 0xa4f7: (0x15e1,), #  LISU LETTER OE → CANADIAN SYLLABICS CARRIER THA
+ 0x18f0: (0x15f4, 0x00b7,), #  CANADIAN SYLLABICS CARRIER GWA → CANADIAN SYLLABICS CARRIER GA, MIDDLE DOT	# →ᗴᐧ→
+ 0x18f2: (0x161b, 0x00b7,), #  CANADIAN SYLLABICS CARRIER JWA → CANADIAN SYLLABICS CARRIER JA, MIDDLE DOT	# →ᘛᐧ→
+ 0x1dbb: (0x1646,), #  MODIFIER LETTER SMALL Z → CANADIAN SYLLABICS CARRIER Z
+ 0xa4ed: (0x1660,), #  LISU LETTER GHA → CANADIAN SYLLABICS CARRIER TSA
+ 0x1dba: (0x18d4,), #  MODIFIER LETTER SMALL TURNED V → CANADIAN SYLLABICS OJIBWAY P
+ 0x1d3e: (0x18d6,), #  MODIFIER LETTER CAPITAL P → CANADIAN SYLLABICS OJIBWAY K
+ 0x18dc: (0x18df, 0x141e,), #  CANADIAN SYLLABICS EASTERN W → CANADIAN SYLLABICS FINAL RAISED DOT, CANADIAN SYLLABICS GLOTTAL STOP
+ 0x02e1: (0x18f3,), #  MODIFIER LETTER SMALL L → CANADIAN SYLLABICS BEAVER DENE L
+ 0x02b3: (0x18f4,), #  MODIFIER LETTER SMALL R → CANADIAN SYLLABICS BEAVER DENE R
+ 0x02e2: (0x18f5,), #  MODIFIER LETTER SMALL S → CANADIAN SYLLABICS CARRIER DENTAL S
+ 0x18db: (0x18f5,), #  CANADIAN SYLLABICS OJIBWAY SH → CANADIAN SYLLABICS CARRIER DENTAL S	# →ˢ→
+ 0xa6b0: (0x16b9,), #  BAMUM LETTER TAA → RUNIC LETTER WUNJO WYNN W
+ 0x16e1: (0x16bc,), #  RUNIC LETTER IOR → RUNIC LETTER LONG-BRANCH-HAGALL H
+ 0x237f: (0x16bd,), #  VERTICAL LINE WITH MIDDLE DOT → RUNIC LETTER SHORT-TWIG-HAGALL H	# →ᛂ→
+ 0x16c2: (0x16bd,), #  RUNIC LETTER E → RUNIC LETTER SHORT-TWIG-HAGALL H
+ 0x1d23f: (0x16cb,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-52 → RUNIC LETTER SIGEL LONG-BRANCH-SOL S
+ 0x2191: (0x16cf,), #  UPWARDS ARROW → RUNIC LETTER TIWAZ TIR TYR T
+ 0x21bf: (0x16d0,), #  UPWARDS HARPOON WITH BARB LEFTWARDS → RUNIC LETTER SHORT-TWIG-TYR T
+ 0x296e: (0x16d0, 0x21c2,), #  UPWARDS HARPOON WITH BARB LEFT BESIDE DOWNWARDS HARPOON WITH BARB RIGHT → RUNIC LETTER SHORT-TWIG-TYR T, DOWNWARDS HARPOON WITH BARB RIGHTWARDS	# →↿⇂→
+ 0x2963: (0x16d0, 0x16da,), #  UPWARDS HARPOON WITH BARB LEFT BESIDE UPWARDS HARPOON WITH BARB RIGHT → RUNIC LETTER SHORT-TWIG-TYR T, RUNIC LETTER LAUKAZ LAGU LOGR L	# →↿↾→
+ 0x2d63: (0x16ef,), #  TIFINAGH LETTER YAZ → RUNIC TVIMADUR SYMBOL
+ 0x21be: (0x16da,), #  UPWARDS HARPOON WITH BARB RIGHTWARDS → RUNIC LETTER LAUKAZ LAGU LOGR L
+ 0x2a21: (0x16da,), #  Z NOTATION SCHEMA PROJECTION → RUNIC LETTER LAUKAZ LAGU LOGR L	# →↾→
+ 0x22c4: (0x16dc,), #  DIAMOND OPERATOR → RUNIC LETTER INGWAZ	# →◇→
+ 0x25c7: (0x16dc,), #  WHITE DIAMOND → RUNIC LETTER INGWAZ
+ 0x25ca: (0x16dc,), #  LOZENGE → RUNIC LETTER INGWAZ	# →⋄→→◇→
+ 0x2662: (0x16dc,), #  WHITE DIAMOND SUIT → RUNIC LETTER INGWAZ	# →◊→→⋄→→◇→
+ 0x1f754: (0x16dc,), #  ALCHEMICAL SYMBOL FOR SOAP → RUNIC LETTER INGWAZ	# →◇→
+ 0x118b7: (0x16dc,), #  WARANG CITI CAPITAL LETTER BU → RUNIC LETTER INGWAZ	# →◇→
+ 0x10294: (0x16dc,), #  LYCIAN LETTER KK → RUNIC LETTER INGWAZ	# →◇→
+ 0x235a: (0x16dc, 0x0332,), #  APL FUNCTIONAL SYMBOL DIAMOND UNDERBAR → RUNIC LETTER INGWAZ, COMBINING LOW LINE	# →◇̲→
+ 0x22c8: (0x16de,), #  BOWTIE → RUNIC LETTER DAGAZ DAEG D
+ 0x2a1d: (0x16de,), #  JOIN → RUNIC LETTER DAGAZ DAEG D	# →⋈→
+ 0x104d0: (0x16e6,), #  OSAGE CAPITAL LETTER KHA → RUNIC LETTER LONG-BRANCH-YR
+ 0x2195: (0x16e8,), #  UP DOWN ARROW → RUNIC LETTER ICELANDIC-YR
+ 0x10cfc: (0x10c82,), #  OLD HUNGARIAN NUMBER TEN → OLD HUNGARIAN CAPITAL LETTER EB
+ 0x10cfa: (0x10ca5,), #  OLD HUNGARIAN NUMBER ONE → OLD HUNGARIAN CAPITAL LETTER ESZ
+ 0x3131: (0x1100,), #  HANGUL LETTER KIYEOK → HANGUL CHOSEONG KIYEOK
+ 0x11a8: (0x1100,), #  HANGUL JONGSEONG KIYEOK → HANGUL CHOSEONG KIYEOK
+ 0x1101: (0x1100, 0x1100,), #  HANGUL CHOSEONG SSANGKIYEOK → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KIYEOK
+ 0x3132: (0x1100, 0x1100,), #  HANGUL LETTER SSANGKIYEOK → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KIYEOK	# →ᄁ→
+ 0x11a9: (0x1100, 0x1100,), #  HANGUL JONGSEONG SSANGKIYEOK → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KIYEOK	# →ᄁ→
+ 0x11fa: (0x1100, 0x1102,), #  HANGUL JONGSEONG KIYEOK-NIEUN → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG NIEUN	# →ᆨᆫ→
+ 0x115a: (0x1100, 0x1103,), #  HANGUL CHOSEONG KIYEOK-TIKEUT → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG TIKEUT
+ 0x11c3: (0x1100, 0x1105,), #  HANGUL JONGSEONG KIYEOK-RIEUL → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG RIEUL	# →ᆨᆯ→
+ 0x11fb: (0x1100, 0x1107,), #  HANGUL JONGSEONG KIYEOK-PIEUP → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG PIEUP	# →ᆨᆸ→
+ 0x11aa: (0x1100, 0x1109,), #  HANGUL JONGSEONG KIYEOK-SIOS → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG SIOS	# →ᆨᆺ→
+ 0x3133: (0x1100, 0x1109,), #  HANGUL LETTER KIYEOK-SIOS → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG SIOS	# →ᆪ→→ᆨᆺ→
+ 0x11c4: (0x1100, 0x1109, 0x1100,), #  HANGUL JONGSEONG KIYEOK-SIOS-KIYEOK → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK	# →ᆨᆺᆨ→
+ 0x11fc: (0x1100, 0x110e,), #  HANGUL JONGSEONG KIYEOK-CHIEUCH → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG CHIEUCH	# →ᆨᆾ→
+ 0x11fd: (0x1100, 0x110f,), #  HANGUL JONGSEONG KIYEOK-KHIEUKH → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KHIEUKH	# →ᆨᆿ→
+ 0x11fe: (0x1100, 0x1112,), #  HANGUL JONGSEONG KIYEOK-HIEUH → HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG HIEUH	# →ᆨᇂ→
+ 0x3134: (0x1102,), #  HANGUL LETTER NIEUN → HANGUL CHOSEONG NIEUN
+ 0x11ab: (0x1102,), #  HANGUL JONGSEONG NIEUN → HANGUL CHOSEONG NIEUN
+ 0x1113: (0x1102, 0x1100,), #  HANGUL CHOSEONG NIEUN-KIYEOK → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG KIYEOK
+ 0x11c5: (0x1102, 0x1100,), #  HANGUL JONGSEONG NIEUN-KIYEOK → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG KIYEOK	# →ᄓ→
+ 0x1114: (0x1102, 0x1102,), #  HANGUL CHOSEONG SSANGNIEUN → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG NIEUN
+ 0x3165: (0x1102, 0x1102,), #  HANGUL LETTER SSANGNIEUN → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG NIEUN	# →ᄔ→
+ 0x11ff: (0x1102, 0x1102,), #  HANGUL JONGSEONG SSANGNIEUN → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG NIEUN	# →ᆫᆫ→
+ 0x1115: (0x1102, 0x1103,), #  HANGUL CHOSEONG NIEUN-TIKEUT → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG TIKEUT
+ 0x3166: (0x1102, 0x1103,), #  HANGUL LETTER NIEUN-TIKEUT → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG TIKEUT	# →ᄕ→
+ 0x11c6: (0x1102, 0x1103,), #  HANGUL JONGSEONG NIEUN-TIKEUT → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG TIKEUT	# →ᄕ→
+ 0xd7cb: (0x1102, 0x1105,), #  HANGUL JONGSEONG NIEUN-RIEUL → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG RIEUL	# →ᆫᆯ→
+ 0x1116: (0x1102, 0x1107,), #  HANGUL CHOSEONG NIEUN-PIEUP → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG PIEUP
+ 0x115b: (0x1102, 0x1109,), #  HANGUL CHOSEONG NIEUN-SIOS → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG SIOS
+ 0x11c7: (0x1102, 0x1109,), #  HANGUL JONGSEONG NIEUN-SIOS → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG SIOS	# →ᆫᆺ→
+ 0x3167: (0x1102, 0x1109,), #  HANGUL LETTER NIEUN-SIOS → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG SIOS	# →ᇇ→→ᆫᆺ→
+ 0x115c: (0x1102, 0x110c,), #  HANGUL CHOSEONG NIEUN-CIEUC → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG CIEUC
+ 0x11ac: (0x1102, 0x110c,), #  HANGUL JONGSEONG NIEUN-CIEUC → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG CIEUC	# →ᆫᆽ→
+ 0x3135: (0x1102, 0x110c,), #  HANGUL LETTER NIEUN-CIEUC → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG CIEUC	# →ᆬ→→ᆫᆽ→
+ 0xd7cc: (0x1102, 0x110e,), #  HANGUL JONGSEONG NIEUN-CHIEUCH → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG CHIEUCH	# →ᆫᆾ→
+ 0x11c9: (0x1102, 0x1110,), #  HANGUL JONGSEONG NIEUN-THIEUTH → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG THIEUTH	# →ᆫᇀ→
+ 0x115d: (0x1102, 0x1112,), #  HANGUL CHOSEONG NIEUN-HIEUH → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG HIEUH
+ 0x11ad: (0x1102, 0x1112,), #  HANGUL JONGSEONG NIEUN-HIEUH → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG HIEUH	# →ᆫᇂ→
+ 0x3136: (0x1102, 0x1112,), #  HANGUL LETTER NIEUN-HIEUH → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG HIEUH	# →ᆭ→→ᆫᇂ→
+ 0x11c8: (0x1102, 0x1140,), #  HANGUL JONGSEONG NIEUN-PANSIOS → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG PANSIOS	# →ᆫᇫ→
+ 0x3168: (0x1102, 0x1140,), #  HANGUL LETTER NIEUN-PANSIOS → HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG PANSIOS	# →ᇈ→→ᆫᇫ→
+ 0x3137: (0x1103,), #  HANGUL LETTER TIKEUT → HANGUL CHOSEONG TIKEUT
+ 0x11ae: (0x1103,), #  HANGUL JONGSEONG TIKEUT → HANGUL CHOSEONG TIKEUT
+ 0x1117: (0x1103, 0x1100,), #  HANGUL CHOSEONG TIKEUT-KIYEOK → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG KIYEOK
+ 0x11ca: (0x1103, 0x1100,), #  HANGUL JONGSEONG TIKEUT-KIYEOK → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG KIYEOK	# →ᄗ→
+ 0x1104: (0x1103, 0x1103,), #  HANGUL CHOSEONG SSANGTIKEUT → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG TIKEUT
+ 0x3138: (0x1103, 0x1103,), #  HANGUL LETTER SSANGTIKEUT → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG TIKEUT	# →ᄄ→
+ 0xd7cd: (0x1103, 0x1103,), #  HANGUL JONGSEONG SSANGTIKEUT → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG TIKEUT	# →ᆮᆮ→
+ 0xd7ce: (0x1103, 0x1103, 0x1107,), #  HANGUL JONGSEONG SSANGTIKEUT-PIEUP → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG PIEUP	# →ᆮᆮᆸ→
+ 0x115e: (0x1103, 0x1105,), #  HANGUL CHOSEONG TIKEUT-RIEUL → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG RIEUL
+ 0x11cb: (0x1103, 0x1105,), #  HANGUL JONGSEONG TIKEUT-RIEUL → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG RIEUL	# →ᆮᆯ→
+ 0xa960: (0x1103, 0x1106,), #  HANGUL CHOSEONG TIKEUT-MIEUM → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG MIEUM
+ 0xa961: (0x1103, 0x1107,), #  HANGUL CHOSEONG TIKEUT-PIEUP → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG PIEUP
+ 0xd7cf: (0x1103, 0x1107,), #  HANGUL JONGSEONG TIKEUT-PIEUP → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG PIEUP	# →ᆮᆸ→
+ 0xa962: (0x1103, 0x1109,), #  HANGUL CHOSEONG TIKEUT-SIOS → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG SIOS
+ 0xd7d0: (0x1103, 0x1109,), #  HANGUL JONGSEONG TIKEUT-SIOS → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG SIOS	# →ᆮᆺ→
+ 0xd7d1: (0x1103, 0x1109, 0x1100,), #  HANGUL JONGSEONG TIKEUT-SIOS-KIYEOK → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK	# →ᆮᆺᆨ→
+ 0xa963: (0x1103, 0x110c,), #  HANGUL CHOSEONG TIKEUT-CIEUC → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG CIEUC
+ 0xd7d2: (0x1103, 0x110c,), #  HANGUL JONGSEONG TIKEUT-CIEUC → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG CIEUC	# →ᆮᆽ→
+ 0xd7d3: (0x1103, 0x110e,), #  HANGUL JONGSEONG TIKEUT-CHIEUCH → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG CHIEUCH	# →ᆮᆾ→
+ 0xd7d4: (0x1103, 0x1110,), #  HANGUL JONGSEONG TIKEUT-THIEUTH → HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG THIEUTH	# →ᆮᇀ→
+ 0x3139: (0x1105,), #  HANGUL LETTER RIEUL → HANGUL CHOSEONG RIEUL
+ 0x11af: (0x1105,), #  HANGUL JONGSEONG RIEUL → HANGUL CHOSEONG RIEUL
+ 0xa964: (0x1105, 0x1100,), #  HANGUL CHOSEONG RIEUL-KIYEOK → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK
+ 0x11b0: (0x1105, 0x1100,), #  HANGUL JONGSEONG RIEUL-KIYEOK → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK	# →ᆯᆨ→
+ 0x313a: (0x1105, 0x1100,), #  HANGUL LETTER RIEUL-KIYEOK → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK	# →ᆰ→→ᆯᆨ→
+ 0xa965: (0x1105, 0x1100, 0x1100,), #  HANGUL CHOSEONG RIEUL-SSANGKIYEOK → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KIYEOK
+ 0xd7d5: (0x1105, 0x1100, 0x1100,), #  HANGUL JONGSEONG RIEUL-SSANGKIYEOK → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KIYEOK	# →ᆯᆨᆨ→
+ 0x11cc: (0x1105, 0x1100, 0x1109,), #  HANGUL JONGSEONG RIEUL-KIYEOK-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG SIOS	# →ᆯᆨᆺ→
+ 0x3169: (0x1105, 0x1100, 0x1109,), #  HANGUL LETTER RIEUL-KIYEOK-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG SIOS	# →ᇌ→→ᆯᆨᆺ→
+ 0xd7d6: (0x1105, 0x1100, 0x1112,), #  HANGUL JONGSEONG RIEUL-KIYEOK-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG HIEUH	# →ᆯᆨᇂ→
+ 0x1118: (0x1105, 0x1102,), #  HANGUL CHOSEONG RIEUL-NIEUN → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG NIEUN
+ 0x11cd: (0x1105, 0x1102,), #  HANGUL JONGSEONG RIEUL-NIEUN → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG NIEUN	# →ᄘ→
+ 0xa966: (0x1105, 0x1103,), #  HANGUL CHOSEONG RIEUL-TIKEUT → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG TIKEUT
+ 0x11ce: (0x1105, 0x1103,), #  HANGUL JONGSEONG RIEUL-TIKEUT → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG TIKEUT	# →ᆯᆮ→
+ 0x316a: (0x1105, 0x1103,), #  HANGUL LETTER RIEUL-TIKEUT → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG TIKEUT	# →ᇎ→→ᆯᆮ→
+ 0xa967: (0x1105, 0x1103, 0x1103,), #  HANGUL CHOSEONG RIEUL-SSANGTIKEUT → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG TIKEUT
+ 0x11cf: (0x1105, 0x1103, 0x1112,), #  HANGUL JONGSEONG RIEUL-TIKEUT-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG TIKEUT, HANGUL CHOSEONG HIEUH	# →ᆯᆮᇂ→
+ 0x1119: (0x1105, 0x1105,), #  HANGUL CHOSEONG SSANGRIEUL → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG RIEUL
+ 0x11d0: (0x1105, 0x1105,), #  HANGUL JONGSEONG SSANGRIEUL → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG RIEUL	# →ᄙ→
+ 0xd7d7: (0x1105, 0x1105, 0x110f,), #  HANGUL JONGSEONG SSANGRIEUL-KHIEUKH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KHIEUKH	# →ᆯᆯᆿ→
+ 0xa968: (0x1105, 0x1106,), #  HANGUL CHOSEONG RIEUL-MIEUM → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG MIEUM
+ 0x11b1: (0x1105, 0x1106,), #  HANGUL JONGSEONG RIEUL-MIEUM → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG MIEUM	# →ᆯᆷ→
+ 0x313b: (0x1105, 0x1106,), #  HANGUL LETTER RIEUL-MIEUM → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG MIEUM	# →ᆱ→→ᆯᆷ→
+ 0x11d1: (0x1105, 0x1106, 0x1100,), #  HANGUL JONGSEONG RIEUL-MIEUM-KIYEOK → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG KIYEOK	# →ᆯᆷᆨ→
+ 0x11d2: (0x1105, 0x1106, 0x1109,), #  HANGUL JONGSEONG RIEUL-MIEUM-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG SIOS	# →ᆯᆷᆺ→
+ 0xd7d8: (0x1105, 0x1106, 0x1112,), #  HANGUL JONGSEONG RIEUL-MIEUM-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG HIEUH	# →ᆯᆷᇂ→
+ 0xa969: (0x1105, 0x1107,), #  HANGUL CHOSEONG RIEUL-PIEUP → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP
+ 0x11b2: (0x1105, 0x1107,), #  HANGUL JONGSEONG RIEUL-PIEUP → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP	# →ᆯᆸ→
+ 0x313c: (0x1105, 0x1107,), #  HANGUL LETTER RIEUL-PIEUP → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP	# →ᆲ→→ᆯᆸ→
+ 0xd7d9: (0x1105, 0x1107, 0x1103,), #  HANGUL JONGSEONG RIEUL-PIEUP-TIKEUT → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG TIKEUT	# →ᆯᆸᆮ→
+ 0xa96a: (0x1105, 0x1107, 0x1107,), #  HANGUL CHOSEONG RIEUL-SSANGPIEUP → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP
+ 0x11d3: (0x1105, 0x1107, 0x1109,), #  HANGUL JONGSEONG RIEUL-PIEUP-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS	# →ᆯᆸᆺ→
+ 0x316b: (0x1105, 0x1107, 0x1109,), #  HANGUL LETTER RIEUL-PIEUP-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS	# →ᇓ→→ᆯᆸᆺ→
+ 0xa96b: (0x1105, 0x1107, 0x110b,), #  HANGUL CHOSEONG RIEUL-KAPYEOUNPIEUP → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG
+ 0x11d5: (0x1105, 0x1107, 0x110b,), #  HANGUL JONGSEONG RIEUL-KAPYEOUNPIEUP → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG	# →ᆯᆸᆼ→
+ 0xd7da: (0x1105, 0x1107, 0x1111,), #  HANGUL JONGSEONG RIEUL-PIEUP-PHIEUPH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PHIEUPH	# →ᆯᆸᇁ→
+ 0x11d4: (0x1105, 0x1107, 0x1112,), #  HANGUL JONGSEONG RIEUL-PIEUP-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG HIEUH	# →ᆯᆸᇂ→
+ 0xa96c: (0x1105, 0x1109,), #  HANGUL CHOSEONG RIEUL-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG SIOS
+ 0x11b3: (0x1105, 0x1109,), #  HANGUL JONGSEONG RIEUL-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG SIOS	# →ᆯᆺ→
+ 0x313d: (0x1105, 0x1109,), #  HANGUL LETTER RIEUL-SIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG SIOS	# →ᆳ→→ᆯᆺ→
+ 0x11d6: (0x1105, 0x1109, 0x1109,), #  HANGUL JONGSEONG RIEUL-SSANGSIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS	# →ᆯᆺᆺ→
+ 0x111b: (0x1105, 0x110b,), #  HANGUL CHOSEONG KAPYEOUNRIEUL → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG IEUNG
+ 0xd7dd: (0x1105, 0x110b,), #  HANGUL JONGSEONG KAPYEOUNRIEUL → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG IEUNG	# →ᆯᆼ→
+ 0xa96d: (0x1105, 0x110c,), #  HANGUL CHOSEONG RIEUL-CIEUC → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG CIEUC
+ 0xa96e: (0x1105, 0x110f,), #  HANGUL CHOSEONG RIEUL-KHIEUKH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KHIEUKH
+ 0x11d8: (0x1105, 0x110f,), #  HANGUL JONGSEONG RIEUL-KHIEUKH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG KHIEUKH	# →ᆯᆿ→
+ 0x11b4: (0x1105, 0x1110,), #  HANGUL JONGSEONG RIEUL-THIEUTH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG THIEUTH	# →ᆯᇀ→
+ 0x313e: (0x1105, 0x1110,), #  HANGUL LETTER RIEUL-THIEUTH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG THIEUTH	# →ᆴ→→ᆯᇀ→
+ 0x11b5: (0x1105, 0x1111,), #  HANGUL JONGSEONG RIEUL-PHIEUPH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PHIEUPH	# →ᆯᇁ→
+ 0x313f: (0x1105, 0x1111,), #  HANGUL LETTER RIEUL-PHIEUPH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PHIEUPH	# →ᆵ→→ᆯᇁ→
+ 0x111a: (0x1105, 0x1112,), #  HANGUL CHOSEONG RIEUL-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG HIEUH
+ 0x3140: (0x1105, 0x1112,), #  HANGUL LETTER RIEUL-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG HIEUH	# →ᄚ→
+ 0x113b: (0x1105, 0x1112,), #  HANGUL CHOSEONG SIOS-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG HIEUH	# →ᄚ→
+ 0x11b6: (0x1105, 0x1112,), #  HANGUL JONGSEONG RIEUL-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG HIEUH	# →ᄚ→
+ 0xd7f2: (0x1105, 0x1112,), #  HANGUL JONGSEONG SIOS-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG HIEUH	# →ᆺᇂ→→ᄉᄒ→→ᄻ→→ᄚ→
+ 0x11d7: (0x1105, 0x1140,), #  HANGUL JONGSEONG RIEUL-PANSIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PANSIOS	# →ᆯᇫ→
+ 0x316c: (0x1105, 0x1140,), #  HANGUL LETTER RIEUL-PANSIOS → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PANSIOS	# →ᇗ→→ᆯᇫ→
+ 0xd7db: (0x1105, 0x114c,), #  HANGUL JONGSEONG RIEUL-YESIEUNG → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG YESIEUNG	# →ᆯᇰ→
+ 0x11d9: (0x1105, 0x1159,), #  HANGUL JONGSEONG RIEUL-YEORINHIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG YEORINHIEUH	# →ᆯᇹ→
+ 0x316d: (0x1105, 0x1159,), #  HANGUL LETTER RIEUL-YEORINHIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG YEORINHIEUH	# →ᇙ→→ᆯᇹ→
+ 0xd7dc: (0x1105, 0x1159, 0x1112,), #  HANGUL JONGSEONG RIEUL-YEORINHIEUH-HIEUH → HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG YEORINHIEUH, HANGUL CHOSEONG HIEUH	# →ᆯᇹᇂ→
+ 0x3141: (0x1106,), #  HANGUL LETTER MIEUM → HANGUL CHOSEONG MIEUM
+ 0x11b7: (0x1106,), #  HANGUL JONGSEONG MIEUM → HANGUL CHOSEONG MIEUM
+ 0xa96f: (0x1106, 0x1100,), #  HANGUL CHOSEONG MIEUM-KIYEOK → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG KIYEOK
+ 0x11da: (0x1106, 0x1100,), #  HANGUL JONGSEONG MIEUM-KIYEOK → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG KIYEOK	# →ᆷᆨ→
+ 0xd7de: (0x1106, 0x1102,), #  HANGUL JONGSEONG MIEUM-NIEUN → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG NIEUN	# →ᆷᆫ→
+ 0xd7df: (0x1106, 0x1102, 0x1102,), #  HANGUL JONGSEONG MIEUM-SSANGNIEUN → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG NIEUN, HANGUL CHOSEONG NIEUN	# →ᆷᆫᆫ→
+ 0xa970: (0x1106, 0x1103,), #  HANGUL CHOSEONG MIEUM-TIKEUT → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG TIKEUT
+ 0x11db: (0x1106, 0x1105,), #  HANGUL JONGSEONG MIEUM-RIEUL → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG RIEUL	# →ᆷᆯ→
+ 0xd7e0: (0x1106, 0x1106,), #  HANGUL JONGSEONG SSANGMIEUM → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG MIEUM	# →ᆷᆷ→
+ 0x111c: (0x1106, 0x1107,), #  HANGUL CHOSEONG MIEUM-PIEUP → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG PIEUP
+ 0x316e: (0x1106, 0x1107,), #  HANGUL LETTER MIEUM-PIEUP → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG PIEUP	# →ᄜ→
+ 0x11dc: (0x1106, 0x1107,), #  HANGUL JONGSEONG MIEUM-PIEUP → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG PIEUP	# →ᄜ→
+ 0xd7e1: (0x1106, 0x1107, 0x1109,), #  HANGUL JONGSEONG MIEUM-PIEUP-SIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS	# →ᆷᆸᆺ→
+ 0xa971: (0x1106, 0x1109,), #  HANGUL CHOSEONG MIEUM-SIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG SIOS
+ 0x11dd: (0x1106, 0x1109,), #  HANGUL JONGSEONG MIEUM-SIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG SIOS	# →ᆷᆺ→
+ 0x316f: (0x1106, 0x1109,), #  HANGUL LETTER MIEUM-SIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG SIOS	# →ᇝ→→ᆷᆺ→
+ 0x11de: (0x1106, 0x1109, 0x1109,), #  HANGUL JONGSEONG MIEUM-SSANGSIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS	# →ᆷᆺᆺ→
+ 0x111d: (0x1106, 0x110b,), #  HANGUL CHOSEONG KAPYEOUNMIEUM → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG IEUNG
+ 0x3171: (0x1106, 0x110b,), #  HANGUL LETTER KAPYEOUNMIEUM → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG IEUNG	# →ᄝ→
+ 0x11e2: (0x1106, 0x110b,), #  HANGUL JONGSEONG KAPYEOUNMIEUM → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG IEUNG	# →ᄝ→
+ 0xd7e2: (0x1106, 0x110c,), #  HANGUL JONGSEONG MIEUM-CIEUC → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG CIEUC	# →ᆷᆽ→
+ 0x11e0: (0x1106, 0x110e,), #  HANGUL JONGSEONG MIEUM-CHIEUCH → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG CHIEUCH	# →ᆷᆾ→
+ 0x11e1: (0x1106, 0x1112,), #  HANGUL JONGSEONG MIEUM-HIEUH → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG HIEUH	# →ᆷᇂ→
+ 0x11df: (0x1106, 0x1140,), #  HANGUL JONGSEONG MIEUM-PANSIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG PANSIOS	# →ᆷᇫ→
+ 0x3170: (0x1106, 0x1140,), #  HANGUL LETTER MIEUM-PANSIOS → HANGUL CHOSEONG MIEUM, HANGUL CHOSEONG PANSIOS	# →ᇟ→→ᆷᇫ→
+ 0x3142: (0x1107,), #  HANGUL LETTER PIEUP → HANGUL CHOSEONG PIEUP
+ 0x11b8: (0x1107,), #  HANGUL JONGSEONG PIEUP → HANGUL CHOSEONG PIEUP
+ 0x111e: (0x1107, 0x1100,), #  HANGUL CHOSEONG PIEUP-KIYEOK → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG KIYEOK
+ 0x3172: (0x1107, 0x1100,), #  HANGUL LETTER PIEUP-KIYEOK → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG KIYEOK	# →ᄞ→
+ 0x111f: (0x1107, 0x1102,), #  HANGUL CHOSEONG PIEUP-NIEUN → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG NIEUN
+ 0x1120: (0x1107, 0x1103,), #  HANGUL CHOSEONG PIEUP-TIKEUT → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG TIKEUT
+ 0x3173: (0x1107, 0x1103,), #  HANGUL LETTER PIEUP-TIKEUT → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG TIKEUT	# →ᄠ→
+ 0xd7e3: (0x1107, 0x1103,), #  HANGUL JONGSEONG PIEUP-TIKEUT → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG TIKEUT	# →ᆸᆮ→
+ 0x11e3: (0x1107, 0x1105,), #  HANGUL JONGSEONG PIEUP-RIEUL → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG RIEUL	# →ᆸᆯ→
+ 0xd7e4: (0x1107, 0x1105, 0x1111,), #  HANGUL JONGSEONG PIEUP-RIEUL-PHIEUPH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG RIEUL, HANGUL CHOSEONG PHIEUPH	# →ᆸᆯᇁ→
+ 0xd7e5: (0x1107, 0x1106,), #  HANGUL JONGSEONG PIEUP-MIEUM → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG MIEUM	# →ᆸᆷ→
+ 0x1108: (0x1107, 0x1107,), #  HANGUL CHOSEONG SSANGPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP
+ 0x3143: (0x1107, 0x1107,), #  HANGUL LETTER SSANGPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP	# →ᄈ→
+ 0xd7e6: (0x1107, 0x1107,), #  HANGUL JONGSEONG SSANGPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP	# →ᆸᆸ→
+ 0x112c: (0x1107, 0x1107, 0x110b,), #  HANGUL CHOSEONG KAPYEOUNSSANGPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG
+ 0x3179: (0x1107, 0x1107, 0x110b,), #  HANGUL LETTER KAPYEOUNSSANGPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG	# →ᄬ→
+ 0x1121: (0x1107, 0x1109,), #  HANGUL CHOSEONG PIEUP-SIOS → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS
+ 0x3144: (0x1107, 0x1109,), #  HANGUL LETTER PIEUP-SIOS → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS	# →ᄡ→
+ 0x11b9: (0x1107, 0x1109,), #  HANGUL JONGSEONG PIEUP-SIOS → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS	# →ᄡ→
+ 0x1122: (0x1107, 0x1109, 0x1100,), #  HANGUL CHOSEONG PIEUP-SIOS-KIYEOK → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK
+ 0x3174: (0x1107, 0x1109, 0x1100,), #  HANGUL LETTER PIEUP-SIOS-KIYEOK → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK	# →ᄢ→
+ 0x1123: (0x1107, 0x1109, 0x1103,), #  HANGUL CHOSEONG PIEUP-SIOS-TIKEUT → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT
+ 0x3175: (0x1107, 0x1109, 0x1103,), #  HANGUL LETTER PIEUP-SIOS-TIKEUT → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT	# →ᄣ→
+ 0xd7e7: (0x1107, 0x1109, 0x1103,), #  HANGUL JONGSEONG PIEUP-SIOS-TIKEUT → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT	# →ᆸᆺᆮ→
+ 0x1124: (0x1107, 0x1109, 0x1107,), #  HANGUL CHOSEONG PIEUP-SIOS-PIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP
+ 0x1125: (0x1107, 0x1109, 0x1109,), #  HANGUL CHOSEONG PIEUP-SSANGSIOS → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS
+ 0x1126: (0x1107, 0x1109, 0x110c,), #  HANGUL CHOSEONG PIEUP-SIOS-CIEUC → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG CIEUC
+ 0xa972: (0x1107, 0x1109, 0x1110,), #  HANGUL CHOSEONG PIEUP-SIOS-THIEUTH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG THIEUTH
+ 0x112b: (0x1107, 0x110b,), #  HANGUL CHOSEONG KAPYEOUNPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG
+ 0x3178: (0x1107, 0x110b,), #  HANGUL LETTER KAPYEOUNPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG	# →ᄫ→
+ 0x11e6: (0x1107, 0x110b,), #  HANGUL JONGSEONG KAPYEOUNPIEUP → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG	# →ᄫ→
+ 0x1127: (0x1107, 0x110c,), #  HANGUL CHOSEONG PIEUP-CIEUC → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG CIEUC
+ 0x3176: (0x1107, 0x110c,), #  HANGUL LETTER PIEUP-CIEUC → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG CIEUC	# →ᄧ→
+ 0xd7e8: (0x1107, 0x110c,), #  HANGUL JONGSEONG PIEUP-CIEUC → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG CIEUC	# →ᆸᆽ→
+ 0x1128: (0x1107, 0x110e,), #  HANGUL CHOSEONG PIEUP-CHIEUCH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG CHIEUCH
+ 0xd7e9: (0x1107, 0x110e,), #  HANGUL JONGSEONG PIEUP-CHIEUCH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG CHIEUCH	# →ᆸᆾ→
+ 0xa973: (0x1107, 0x110f,), #  HANGUL CHOSEONG PIEUP-KHIEUKH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG KHIEUKH
+ 0x1129: (0x1107, 0x1110,), #  HANGUL CHOSEONG PIEUP-THIEUTH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG THIEUTH
+ 0x3177: (0x1107, 0x1110,), #  HANGUL LETTER PIEUP-THIEUTH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG THIEUTH	# →ᄩ→
+ 0x112a: (0x1107, 0x1111,), #  HANGUL CHOSEONG PIEUP-PHIEUPH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PHIEUPH
+ 0x11e4: (0x1107, 0x1111,), #  HANGUL JONGSEONG PIEUP-PHIEUPH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PHIEUPH	# →ᄪ→
+ 0xa974: (0x1107, 0x1112,), #  HANGUL CHOSEONG PIEUP-HIEUH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG HIEUH
+ 0x11e5: (0x1107, 0x1112,), #  HANGUL JONGSEONG PIEUP-HIEUH → HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG HIEUH	# →ᆸᇂ→
+ 0x3145: (0x1109,), #  HANGUL LETTER SIOS → HANGUL CHOSEONG SIOS
+ 0x11ba: (0x1109,), #  HANGUL JONGSEONG SIOS → HANGUL CHOSEONG SIOS
+ 0x112d: (0x1109, 0x1100,), #  HANGUL CHOSEONG SIOS-KIYEOK → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK
+ 0x317a: (0x1109, 0x1100,), #  HANGUL LETTER SIOS-KIYEOK → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK	# →ᄭ→
+ 0x11e7: (0x1109, 0x1100,), #  HANGUL JONGSEONG SIOS-KIYEOK → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK	# →ᄭ→
+ 0x112e: (0x1109, 0x1102,), #  HANGUL CHOSEONG SIOS-NIEUN → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG NIEUN
+ 0x317b: (0x1109, 0x1102,), #  HANGUL LETTER SIOS-NIEUN → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG NIEUN	# →ᄮ→
+ 0x112f: (0x1109, 0x1103,), #  HANGUL CHOSEONG SIOS-TIKEUT → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT
+ 0x317c: (0x1109, 0x1103,), #  HANGUL LETTER SIOS-TIKEUT → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT	# →ᄯ→
+ 0x11e8: (0x1109, 0x1103,), #  HANGUL JONGSEONG SIOS-TIKEUT → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT	# →ᄯ→
+ 0x1130: (0x1109, 0x1105,), #  HANGUL CHOSEONG SIOS-RIEUL → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG RIEUL
+ 0x11e9: (0x1109, 0x1105,), #  HANGUL JONGSEONG SIOS-RIEUL → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG RIEUL	# →ᄰ→
+ 0x1131: (0x1109, 0x1106,), #  HANGUL CHOSEONG SIOS-MIEUM → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG MIEUM
+ 0xd7ea: (0x1109, 0x1106,), #  HANGUL JONGSEONG SIOS-MIEUM → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG MIEUM	# →ᆺᆷ→
+ 0x1132: (0x1109, 0x1107,), #  HANGUL CHOSEONG SIOS-PIEUP → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP
+ 0x317d: (0x1109, 0x1107,), #  HANGUL LETTER SIOS-PIEUP → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP	# →ᄲ→
+ 0x11ea: (0x1109, 0x1107,), #  HANGUL JONGSEONG SIOS-PIEUP → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP	# →ᄲ→
+ 0x1133: (0x1109, 0x1107, 0x1100,), #  HANGUL CHOSEONG SIOS-PIEUP-KIYEOK → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG KIYEOK
+ 0xd7eb: (0x1109, 0x1107, 0x110b,), #  HANGUL JONGSEONG SIOS-KAPYEOUNPIEUP → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG	# →ᆺᆸᆼ→
+ 0x110a: (0x1109, 0x1109,), #  HANGUL CHOSEONG SSANGSIOS → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS
+ 0x3146: (0x1109, 0x1109,), #  HANGUL LETTER SSANGSIOS → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS	# →ᄊ→
+ 0x11bb: (0x1109, 0x1109,), #  HANGUL JONGSEONG SSANGSIOS → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS	# →ᄊ→
+ 0xd7ec: (0x1109, 0x1109, 0x1100,), #  HANGUL JONGSEONG SSANGSIOS-KIYEOK → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KIYEOK	# →ᆺᆺᆨ→
+ 0xd7ed: (0x1109, 0x1109, 0x1103,), #  HANGUL JONGSEONG SSANGSIOS-TIKEUT → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG TIKEUT	# →ᆺᆺᆮ→
+ 0xa975: (0x1109, 0x1109, 0x1107,), #  HANGUL CHOSEONG SSANGSIOS-PIEUP → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PIEUP
+ 0x1134: (0x1109, 0x1109, 0x1109,), #  HANGUL CHOSEONG SIOS-SSANGSIOS → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS, HANGUL CHOSEONG SIOS
+ 0x1135: (0x1109, 0x110b,), #  HANGUL CHOSEONG SIOS-IEUNG → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG IEUNG
+ 0x1136: (0x1109, 0x110c,), #  HANGUL CHOSEONG SIOS-CIEUC → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG CIEUC
+ 0x317e: (0x1109, 0x110c,), #  HANGUL LETTER SIOS-CIEUC → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG CIEUC	# →ᄶ→
+ 0xd7ef: (0x1109, 0x110c,), #  HANGUL JONGSEONG SIOS-CIEUC → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG CIEUC	# →ᆺᆽ→
+ 0x1137: (0x1109, 0x110e,), #  HANGUL CHOSEONG SIOS-CHIEUCH → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG CHIEUCH
+ 0xd7f0: (0x1109, 0x110e,), #  HANGUL JONGSEONG SIOS-CHIEUCH → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG CHIEUCH	# →ᆺᆾ→
+ 0x1138: (0x1109, 0x110f,), #  HANGUL CHOSEONG SIOS-KHIEUKH → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG KHIEUKH
+ 0x1139: (0x1109, 0x1110,), #  HANGUL CHOSEONG SIOS-THIEUTH → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG THIEUTH
+ 0xd7f1: (0x1109, 0x1110,), #  HANGUL JONGSEONG SIOS-THIEUTH → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG THIEUTH	# →ᆺᇀ→
+ 0x113a: (0x1109, 0x1111,), #  HANGUL CHOSEONG SIOS-PHIEUPH → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PHIEUPH
+ 0xd7ee: (0x1109, 0x1140,), #  HANGUL JONGSEONG SIOS-PANSIOS → HANGUL CHOSEONG SIOS, HANGUL CHOSEONG PANSIOS	# →ᆺᇫ→
+ 0x3147: (0x110b,), #  HANGUL LETTER IEUNG → HANGUL CHOSEONG IEUNG
+ 0x11bc: (0x110b,), #  HANGUL JONGSEONG IEUNG → HANGUL CHOSEONG IEUNG
+ 0x1141: (0x110b, 0x1100,), #  HANGUL CHOSEONG IEUNG-KIYEOK → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG KIYEOK
+ 0x11ec: (0x110b, 0x1100,), #  HANGUL JONGSEONG IEUNG-KIYEOK → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG KIYEOK	# →ᅁ→
+ 0x11ed: (0x110b, 0x1100, 0x1100,), #  HANGUL JONGSEONG IEUNG-SSANGKIYEOK → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG KIYEOK, HANGUL CHOSEONG KIYEOK	# →ᆼᆨᆨ→
+ 0x1142: (0x110b, 0x1103,), #  HANGUL CHOSEONG IEUNG-TIKEUT → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG TIKEUT
+ 0xa976: (0x110b, 0x1105,), #  HANGUL CHOSEONG IEUNG-RIEUL → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG RIEUL
+ 0x1143: (0x110b, 0x1106,), #  HANGUL CHOSEONG IEUNG-MIEUM → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG MIEUM
+ 0x1144: (0x110b, 0x1107,), #  HANGUL CHOSEONG IEUNG-PIEUP → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG PIEUP
+ 0x1145: (0x110b, 0x1109,), #  HANGUL CHOSEONG IEUNG-SIOS → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG SIOS
+ 0x11f1: (0x110b, 0x1109,), #  HANGUL JONGSEONG YESIEUNG-SIOS → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG SIOS	# →ᅅ→
+ 0x3182: (0x110b, 0x1109,), #  HANGUL LETTER YESIEUNG-SIOS → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG SIOS	# →ᇱ→→ᅅ→
+ 0x1147: (0x110b, 0x110b,), #  HANGUL CHOSEONG SSANGIEUNG → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG IEUNG
+ 0x3180: (0x110b, 0x110b,), #  HANGUL LETTER SSANGIEUNG → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG IEUNG	# →ᅇ→
+ 0x11ee: (0x110b, 0x110b,), #  HANGUL JONGSEONG SSANGIEUNG → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG IEUNG	# →ᅇ→
+ 0x1148: (0x110b, 0x110c,), #  HANGUL CHOSEONG IEUNG-CIEUC → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG CIEUC
+ 0x1149: (0x110b, 0x110e,), #  HANGUL CHOSEONG IEUNG-CHIEUCH → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG CHIEUCH
+ 0x11ef: (0x110b, 0x110f,), #  HANGUL JONGSEONG IEUNG-KHIEUKH → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG KHIEUKH	# →ᆼᆿ→
+ 0x114a: (0x110b, 0x1110,), #  HANGUL CHOSEONG IEUNG-THIEUTH → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG THIEUTH
+ 0x114b: (0x110b, 0x1111,), #  HANGUL CHOSEONG IEUNG-PHIEUPH → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG PHIEUPH
+ 0xa977: (0x110b, 0x1112,), #  HANGUL CHOSEONG IEUNG-HIEUH → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG HIEUH
+ 0x1146: (0x110b, 0x1140,), #  HANGUL CHOSEONG IEUNG-PANSIOS → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG PANSIOS
+ 0x11f2: (0x110b, 0x1140,), #  HANGUL JONGSEONG YESIEUNG-PANSIOS → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG PANSIOS	# →ᅆ→
+ 0x3183: (0x110b, 0x1140,), #  HANGUL LETTER YESIEUNG-PANSIOS → HANGUL CHOSEONG IEUNG, HANGUL CHOSEONG PANSIOS	# →ᇲ→→ᅆ→
+ 0x3148: (0x110c,), #  HANGUL LETTER CIEUC → HANGUL CHOSEONG CIEUC
+ 0x11bd: (0x110c,), #  HANGUL JONGSEONG CIEUC → HANGUL CHOSEONG CIEUC
+ 0xd7f7: (0x110c, 0x1107,), #  HANGUL JONGSEONG CIEUC-PIEUP → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG PIEUP	# →ᆽᆸ→
+ 0xd7f8: (0x110c, 0x1107, 0x1107,), #  HANGUL JONGSEONG CIEUC-SSANGPIEUP → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG PIEUP	# →ᆽᆸᆸ→
+ 0x114d: (0x110c, 0x110b,), #  HANGUL CHOSEONG CIEUC-IEUNG → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG IEUNG
+ 0x110d: (0x110c, 0x110c,), #  HANGUL CHOSEONG SSANGCIEUC → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG CIEUC
+ 0x3149: (0x110c, 0x110c,), #  HANGUL LETTER SSANGCIEUC → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG CIEUC	# →ᄍ→
+ 0xd7f9: (0x110c, 0x110c,), #  HANGUL JONGSEONG SSANGCIEUC → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG CIEUC	# →ᆽᆽ→
+ 0xa978: (0x110c, 0x110c, 0x1112,), #  HANGUL CHOSEONG SSANGCIEUC-HIEUH → HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG CIEUC, HANGUL CHOSEONG HIEUH
+ 0x314a: (0x110e,), #  HANGUL LETTER CHIEUCH → HANGUL CHOSEONG CHIEUCH
+ 0x11be: (0x110e,), #  HANGUL JONGSEONG CHIEUCH → HANGUL CHOSEONG CHIEUCH
+ 0x1152: (0x110e, 0x110f,), #  HANGUL CHOSEONG CHIEUCH-KHIEUKH → HANGUL CHOSEONG CHIEUCH, HANGUL CHOSEONG KHIEUKH
+ 0x1153: (0x110e, 0x1112,), #  HANGUL CHOSEONG CHIEUCH-HIEUH → HANGUL CHOSEONG CHIEUCH, HANGUL CHOSEONG HIEUH
+ 0x314b: (0x110f,), #  HANGUL LETTER KHIEUKH → HANGUL CHOSEONG KHIEUKH
+ 0x11bf: (0x110f,), #  HANGUL JONGSEONG KHIEUKH → HANGUL CHOSEONG KHIEUKH
+ 0x314c: (0x1110,), #  HANGUL LETTER THIEUTH → HANGUL CHOSEONG THIEUTH
+ 0x11c0: (0x1110,), #  HANGUL JONGSEONG THIEUTH → HANGUL CHOSEONG THIEUTH
+ 0xa979: (0x1110, 0x1110,), #  HANGUL CHOSEONG SSANGTHIEUTH → HANGUL CHOSEONG THIEUTH, HANGUL CHOSEONG THIEUTH
+ 0x314d: (0x1111,), #  HANGUL LETTER PHIEUPH → HANGUL CHOSEONG PHIEUPH
+ 0x11c1: (0x1111,), #  HANGUL JONGSEONG PHIEUPH → HANGUL CHOSEONG PHIEUPH
+ 0x1156: (0x1111, 0x1107,), #  HANGUL CHOSEONG PHIEUPH-PIEUP → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG PIEUP
+ 0x11f3: (0x1111, 0x1107,), #  HANGUL JONGSEONG PHIEUPH-PIEUP → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG PIEUP	# →ᅖ→
+ 0xd7fa: (0x1111, 0x1109,), #  HANGUL JONGSEONG PHIEUPH-SIOS → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG SIOS	# →ᇁᆺ→
+ 0x1157: (0x1111, 0x110b,), #  HANGUL CHOSEONG KAPYEOUNPHIEUPH → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG IEUNG
+ 0x3184: (0x1111, 0x110b,), #  HANGUL LETTER KAPYEOUNPHIEUPH → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG IEUNG	# →ᅗ→
+ 0x11f4: (0x1111, 0x110b,), #  HANGUL JONGSEONG KAPYEOUNPHIEUPH → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG IEUNG	# →ᅗ→
+ 0xd7fb: (0x1111, 0x1110,), #  HANGUL JONGSEONG PHIEUPH-THIEUTH → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG THIEUTH	# →ᇁᇀ→
+ 0xa97a: (0x1111, 0x1112,), #  HANGUL CHOSEONG PHIEUPH-HIEUH → HANGUL CHOSEONG PHIEUPH, HANGUL CHOSEONG HIEUH
+ 0x314e: (0x1112,), #  HANGUL LETTER HIEUH → HANGUL CHOSEONG HIEUH
+ 0x11c2: (0x1112,), #  HANGUL JONGSEONG HIEUH → HANGUL CHOSEONG HIEUH
+ 0x11f5: (0x1112, 0x1102,), #  HANGUL JONGSEONG HIEUH-NIEUN → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG NIEUN	# →ᇂᆫ→
+ 0x11f6: (0x1112, 0x1105,), #  HANGUL JONGSEONG HIEUH-RIEUL → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG RIEUL	# →ᇂᆯ→
+ 0x11f7: (0x1112, 0x1106,), #  HANGUL JONGSEONG HIEUH-MIEUM → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG MIEUM	# →ᇂᆷ→
+ 0x11f8: (0x1112, 0x1107,), #  HANGUL JONGSEONG HIEUH-PIEUP → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG PIEUP	# →ᇂᆸ→
+ 0xa97b: (0x1112, 0x1109,), #  HANGUL CHOSEONG HIEUH-SIOS → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG SIOS
+ 0x1158: (0x1112, 0x1112,), #  HANGUL CHOSEONG SSANGHIEUH → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG HIEUH
+ 0x3185: (0x1112, 0x1112,), #  HANGUL LETTER SSANGHIEUH → HANGUL CHOSEONG HIEUH, HANGUL CHOSEONG HIEUH	# →ᅘ→
+ 0x113d: (0x113c, 0x113c,), #  HANGUL CHOSEONG CHITUEUMSSANGSIOS → HANGUL CHOSEONG CHITUEUMSIOS, HANGUL CHOSEONG CHITUEUMSIOS
+ 0x113f: (0x113e, 0x113e,), #  HANGUL CHOSEONG CEONGCHIEUMSSANGSIOS → HANGUL CHOSEONG CEONGCHIEUMSIOS, HANGUL CHOSEONG CEONGCHIEUMSIOS
+ 0x317f: (0x1140,), #  HANGUL LETTER PANSIOS → HANGUL CHOSEONG PANSIOS
+ 0x11eb: (0x1140,), #  HANGUL JONGSEONG PANSIOS → HANGUL CHOSEONG PANSIOS
+ 0xd7f3: (0x1140, 0x1107,), #  HANGUL JONGSEONG PANSIOS-PIEUP → HANGUL CHOSEONG PANSIOS, HANGUL CHOSEONG PIEUP	# →ᇫᆸ→
+ 0xd7f4: (0x1140, 0x1107, 0x110b,), #  HANGUL JONGSEONG PANSIOS-KAPYEOUNPIEUP → HANGUL CHOSEONG PANSIOS, HANGUL CHOSEONG PIEUP, HANGUL CHOSEONG IEUNG	# →ᇫᆸᆼ→
+ 0x3181: (0x114c,), #  HANGUL LETTER YESIEUNG → HANGUL CHOSEONG YESIEUNG
+ 0x11f0: (0x114c,), #  HANGUL JONGSEONG YESIEUNG → HANGUL CHOSEONG YESIEUNG
+ 0xd7f5: (0x114c, 0x1106,), #  HANGUL JONGSEONG YESIEUNG-MIEUM → HANGUL CHOSEONG YESIEUNG, HANGUL CHOSEONG MIEUM	# →ᇰᆷ→
+ 0xd7f6: (0x114c, 0x1112,), #  HANGUL JONGSEONG YESIEUNG-HIEUH → HANGUL CHOSEONG YESIEUNG, HANGUL CHOSEONG HIEUH	# →ᇰᇂ→
+ 0x114f: (0x114e, 0x114e,), #  HANGUL CHOSEONG CHITUEUMSSANGCIEUC → HANGUL CHOSEONG CHITUEUMCIEUC, HANGUL CHOSEONG CHITUEUMCIEUC
+ 0x1151: (0x1150, 0x1150,), #  HANGUL CHOSEONG CEONGCHIEUMSSANGCIEUC → HANGUL CHOSEONG CEONGCHIEUMCIEUC, HANGUL CHOSEONG CEONGCHIEUMCIEUC
+ 0x3186: (0x1159,), #  HANGUL LETTER YEORINHIEUH → HANGUL CHOSEONG YEORINHIEUH
+ 0x11f9: (0x1159,), #  HANGUL JONGSEONG YEORINHIEUH → HANGUL CHOSEONG YEORINHIEUH
+ 0xa97c: (0x1159, 0x1159,), #  HANGUL CHOSEONG SSANGYEORINHIEUH → HANGUL CHOSEONG YEORINHIEUH, HANGUL CHOSEONG YEORINHIEUH
+ 0x3164: (0x1160,), #  HANGUL FILLER → HANGUL JUNGSEONG FILLER
+ 0x314f: (0x1161,), #  HANGUL LETTER A → HANGUL JUNGSEONG A
+ 0x11a3: (0x1161, 0x30fc,), #  HANGUL JUNGSEONG A-EU → HANGUL JUNGSEONG A, KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →ᅡᅳ→
+ 0x1176: (0x1161, 0x1169,), #  HANGUL JUNGSEONG A-O → HANGUL JUNGSEONG A, HANGUL JUNGSEONG O
+ 0x1177: (0x1161, 0x116e,), #  HANGUL JUNGSEONG A-U → HANGUL JUNGSEONG A, HANGUL JUNGSEONG U
+ 0x1162: (0x1161, 0x4e28,), #  HANGUL JUNGSEONG AE → HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅡᅵ→
+ 0x3150: (0x1161, 0x4e28,), #  HANGUL LETTER AE → HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅢ→→ᅡᅵ→
+ 0x3151: (0x1163,), #  HANGUL LETTER YA → HANGUL JUNGSEONG YA
+ 0x1178: (0x1163, 0x1169,), #  HANGUL JUNGSEONG YA-O → HANGUL JUNGSEONG YA, HANGUL JUNGSEONG O
+ 0x1179: (0x1163, 0x116d,), #  HANGUL JUNGSEONG YA-YO → HANGUL JUNGSEONG YA, HANGUL JUNGSEONG YO
+ 0x11a4: (0x1163, 0x116e,), #  HANGUL JUNGSEONG YA-U → HANGUL JUNGSEONG YA, HANGUL JUNGSEONG U
+ 0x1164: (0x1163, 0x4e28,), #  HANGUL JUNGSEONG YAE → HANGUL JUNGSEONG YA, CJK UNIFIED IDEOGRAPH-4E28	# →ᅣᅵ→
+ 0x3152: (0x1163, 0x4e28,), #  HANGUL LETTER YAE → HANGUL JUNGSEONG YA, CJK UNIFIED IDEOGRAPH-4E28	# →ᅤ→→ᅣᅵ→
+ 0x3153: (0x1165,), #  HANGUL LETTER EO → HANGUL JUNGSEONG EO
+ 0x117c: (0x1165, 0x30fc,), #  HANGUL JUNGSEONG EO-EU → HANGUL JUNGSEONG EO, KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →ᅥᅳ→
+ 0x117a: (0x1165, 0x1169,), #  HANGUL JUNGSEONG EO-O → HANGUL JUNGSEONG EO, HANGUL JUNGSEONG O
+ 0x117b: (0x1165, 0x116e,), #  HANGUL JUNGSEONG EO-U → HANGUL JUNGSEONG EO, HANGUL JUNGSEONG U
+ 0x1166: (0x1165, 0x4e28,), #  HANGUL JUNGSEONG E → HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅥᅵ→
+ 0x3154: (0x1165, 0x4e28,), #  HANGUL LETTER E → HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅦ→→ᅥᅵ→
+ 0x3155: (0x1167,), #  HANGUL LETTER YEO → HANGUL JUNGSEONG YEO
+ 0x11a5: (0x1167, 0x1163,), #  HANGUL JUNGSEONG YEO-YA → HANGUL JUNGSEONG YEO, HANGUL JUNGSEONG YA
+ 0x117d: (0x1167, 0x1169,), #  HANGUL JUNGSEONG YEO-O → HANGUL JUNGSEONG YEO, HANGUL JUNGSEONG O
+ 0x117e: (0x1167, 0x116e,), #  HANGUL JUNGSEONG YEO-U → HANGUL JUNGSEONG YEO, HANGUL JUNGSEONG U
+ 0x1168: (0x1167, 0x4e28,), #  HANGUL JUNGSEONG YE → HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅧᅵ→
+ 0x3156: (0x1167, 0x4e28,), #  HANGUL LETTER YE → HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅨ→→ᅧᅵ→
+ 0x3157: (0x1169,), #  HANGUL LETTER O → HANGUL JUNGSEONG O
+ 0x116a: (0x1169, 0x1161,), #  HANGUL JUNGSEONG WA → HANGUL JUNGSEONG O, HANGUL JUNGSEONG A
+ 0x3158: (0x1169, 0x1161,), #  HANGUL LETTER WA → HANGUL JUNGSEONG O, HANGUL JUNGSEONG A	# →ᅪ→
+ 0x116b: (0x1169, 0x1161, 0x4e28,), #  HANGUL JUNGSEONG WAE → HANGUL JUNGSEONG O, HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅩᅡᅵ→
+ 0x3159: (0x1169, 0x1161, 0x4e28,), #  HANGUL LETTER WAE → HANGUL JUNGSEONG O, HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅫ→→ᅩᅡᅵ→
+ 0x11a6: (0x1169, 0x1163,), #  HANGUL JUNGSEONG O-YA → HANGUL JUNGSEONG O, HANGUL JUNGSEONG YA
+ 0x11a7: (0x1169, 0x1163, 0x4e28,), #  HANGUL JUNGSEONG O-YAE → HANGUL JUNGSEONG O, HANGUL JUNGSEONG YA, CJK UNIFIED IDEOGRAPH-4E28	# →ᅩᅣᅵ→
+ 0x117f: (0x1169, 0x1165,), #  HANGUL JUNGSEONG O-EO → HANGUL JUNGSEONG O, HANGUL JUNGSEONG EO
+ 0x1180: (0x1169, 0x1165, 0x4e28,), #  HANGUL JUNGSEONG O-E → HANGUL JUNGSEONG O, HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅩᅥᅵ→
+ 0xd7b0: (0x1169, 0x1167,), #  HANGUL JUNGSEONG O-YEO → HANGUL JUNGSEONG O, HANGUL JUNGSEONG YEO
+ 0x1181: (0x1169, 0x1167, 0x4e28,), #  HANGUL JUNGSEONG O-YE → HANGUL JUNGSEONG O, HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅩᅧᅵ→
+ 0x1182: (0x1169, 0x1169,), #  HANGUL JUNGSEONG O-O → HANGUL JUNGSEONG O, HANGUL JUNGSEONG O
+ 0xd7b1: (0x1169, 0x1169, 0x4e28,), #  HANGUL JUNGSEONG O-O-I → HANGUL JUNGSEONG O, HANGUL JUNGSEONG O, CJK UNIFIED IDEOGRAPH-4E28	# →ᅩᅩᅵ→
+ 0x1183: (0x1169, 0x116e,), #  HANGUL JUNGSEONG O-U → HANGUL JUNGSEONG O, HANGUL JUNGSEONG U
+ 0x116c: (0x1169, 0x4e28,), #  HANGUL JUNGSEONG OE → HANGUL JUNGSEONG O, CJK UNIFIED IDEOGRAPH-4E28	# →ᅩᅵ→
+ 0x315a: (0x1169, 0x4e28,), #  HANGUL LETTER OE → HANGUL JUNGSEONG O, CJK UNIFIED IDEOGRAPH-4E28	# →ᅬ→→ᅩᅵ→
+ 0x315b: (0x116d,), #  HANGUL LETTER YO → HANGUL JUNGSEONG YO
+ 0xd7b2: (0x116d, 0x1161,), #  HANGUL JUNGSEONG YO-A → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG A
+ 0xd7b3: (0x116d, 0x1161, 0x4e28,), #  HANGUL JUNGSEONG YO-AE → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅭᅡᅵ→
+ 0x1184: (0x116d, 0x1163,), #  HANGUL JUNGSEONG YO-YA → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG YA
+ 0x3187: (0x116d, 0x1163,), #  HANGUL LETTER YO-YA → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG YA	# →ᆄ→
+ 0x1186: (0x116d, 0x1163,), #  HANGUL JUNGSEONG YO-YEO → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG YA	# →ᆄ→
+ 0x1185: (0x116d, 0x1163, 0x4e28,), #  HANGUL JUNGSEONG YO-YAE → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG YA, CJK UNIFIED IDEOGRAPH-4E28	# →ᅭᅣᅵ→
+ 0x3188: (0x116d, 0x1163, 0x4e28,), #  HANGUL LETTER YO-YAE → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG YA, CJK UNIFIED IDEOGRAPH-4E28	# →ᆅ→→ᅭᅣᅵ→
+ 0xd7b4: (0x116d, 0x1165,), #  HANGUL JUNGSEONG YO-EO → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG EO
+ 0x1187: (0x116d, 0x1169,), #  HANGUL JUNGSEONG YO-O → HANGUL JUNGSEONG YO, HANGUL JUNGSEONG O
+ 0x1188: (0x116d, 0x4e28,), #  HANGUL JUNGSEONG YO-I → HANGUL JUNGSEONG YO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅭᅵ→
+ 0x3189: (0x116d, 0x4e28,), #  HANGUL LETTER YO-I → HANGUL JUNGSEONG YO, CJK UNIFIED IDEOGRAPH-4E28	# →ᆈ→→ᅭᅵ→
+ 0x315c: (0x116e,), #  HANGUL LETTER U → HANGUL JUNGSEONG U
+ 0x1189: (0x116e, 0x1161,), #  HANGUL JUNGSEONG U-A → HANGUL JUNGSEONG U, HANGUL JUNGSEONG A
+ 0x118a: (0x116e, 0x1161, 0x4e28,), #  HANGUL JUNGSEONG U-AE → HANGUL JUNGSEONG U, HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅮᅡᅵ→
+ 0x116f: (0x116e, 0x1165,), #  HANGUL JUNGSEONG WEO → HANGUL JUNGSEONG U, HANGUL JUNGSEONG EO
+ 0x315d: (0x116e, 0x1165,), #  HANGUL LETTER WEO → HANGUL JUNGSEONG U, HANGUL JUNGSEONG EO	# →ᅯ→
+ 0x118b: (0x116e, 0x1165, 0x30fc,), #  HANGUL JUNGSEONG U-EO-EU → HANGUL JUNGSEONG U, HANGUL JUNGSEONG EO, KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →ᅮᅥᅳ→
+ 0x1170: (0x116e, 0x1165, 0x4e28,), #  HANGUL JUNGSEONG WE → HANGUL JUNGSEONG U, HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅮᅥᅵ→
+ 0x315e: (0x116e, 0x1165, 0x4e28,), #  HANGUL LETTER WE → HANGUL JUNGSEONG U, HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅰ→→ᅮᅥᅵ→
+ 0xd7b5: (0x116e, 0x1167,), #  HANGUL JUNGSEONG U-YEO → HANGUL JUNGSEONG U, HANGUL JUNGSEONG YEO
+ 0x118c: (0x116e, 0x1167, 0x4e28,), #  HANGUL JUNGSEONG U-YE → HANGUL JUNGSEONG U, HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅮᅧᅵ→
+ 0x118d: (0x116e, 0x116e,), #  HANGUL JUNGSEONG U-U → HANGUL JUNGSEONG U, HANGUL JUNGSEONG U
+ 0x1171: (0x116e, 0x4e28,), #  HANGUL JUNGSEONG WI → HANGUL JUNGSEONG U, CJK UNIFIED IDEOGRAPH-4E28	# →ᅮᅵ→
+ 0x315f: (0x116e, 0x4e28,), #  HANGUL LETTER WI → HANGUL JUNGSEONG U, CJK UNIFIED IDEOGRAPH-4E28	# →ᅱ→→ᅮᅵ→
+ 0xd7b6: (0x116e, 0x4e28, 0x4e28,), #  HANGUL JUNGSEONG U-I-I → HANGUL JUNGSEONG U, CJK UNIFIED IDEOGRAPH-4E28, CJK UNIFIED IDEOGRAPH-4E28	# →ᅮᅵᅵ→
+ 0x3160: (0x1172,), #  HANGUL LETTER YU → HANGUL JUNGSEONG YU
+ 0x118e: (0x1172, 0x1161,), #  HANGUL JUNGSEONG YU-A → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG A
+ 0xd7b7: (0x1172, 0x1161, 0x4e28,), #  HANGUL JUNGSEONG YU-AE → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG A, CJK UNIFIED IDEOGRAPH-4E28	# →ᅲᅡᅵ→
+ 0x118f: (0x1172, 0x1165,), #  HANGUL JUNGSEONG YU-EO → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG EO
+ 0x1190: (0x1172, 0x1165, 0x4e28,), #  HANGUL JUNGSEONG YU-E → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅲᅥᅵ→
+ 0x1191: (0x1172, 0x1167,), #  HANGUL JUNGSEONG YU-YEO → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG YEO
+ 0x318a: (0x1172, 0x1167,), #  HANGUL LETTER YU-YEO → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG YEO	# →ᆑ→
+ 0x1192: (0x1172, 0x1167, 0x4e28,), #  HANGUL JUNGSEONG YU-YE → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅲᅧᅵ→
+ 0x318b: (0x1172, 0x1167, 0x4e28,), #  HANGUL LETTER YU-YE → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᆒ→→ᅲᅧᅵ→
+ 0xd7b8: (0x1172, 0x1169,), #  HANGUL JUNGSEONG YU-O → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG O
+ 0x1193: (0x1172, 0x116e,), #  HANGUL JUNGSEONG YU-U → HANGUL JUNGSEONG YU, HANGUL JUNGSEONG U
+ 0x1194: (0x1172, 0x4e28,), #  HANGUL JUNGSEONG YU-I → HANGUL JUNGSEONG YU, CJK UNIFIED IDEOGRAPH-4E28	# →ᅲᅵ→
+ 0x318c: (0x1172, 0x4e28,), #  HANGUL LETTER YU-I → HANGUL JUNGSEONG YU, CJK UNIFIED IDEOGRAPH-4E28	# →ᆔ→→ᅲᅵ→
+ 0x318d: (0x119e,), #  HANGUL LETTER ARAEA → HANGUL JUNGSEONG ARAEA
+ 0xd7c5: (0x119e, 0x1161,), #  HANGUL JUNGSEONG ARAEA-A → HANGUL JUNGSEONG ARAEA, HANGUL JUNGSEONG A
+ 0x119f: (0x119e, 0x1165,), #  HANGUL JUNGSEONG ARAEA-EO → HANGUL JUNGSEONG ARAEA, HANGUL JUNGSEONG EO
+ 0xd7c6: (0x119e, 0x1165, 0x4e28,), #  HANGUL JUNGSEONG ARAEA-E → HANGUL JUNGSEONG ARAEA, HANGUL JUNGSEONG EO, CJK UNIFIED IDEOGRAPH-4E28	# →ᆞᅥᅵ→
+ 0x11a0: (0x119e, 0x116e,), #  HANGUL JUNGSEONG ARAEA-U → HANGUL JUNGSEONG ARAEA, HANGUL JUNGSEONG U
+ 0x11a2: (0x119e, 0x119e,), #  HANGUL JUNGSEONG SSANGARAEA → HANGUL JUNGSEONG ARAEA, HANGUL JUNGSEONG ARAEA
+ 0x11a1: (0x119e, 0x4e28,), #  HANGUL JUNGSEONG ARAEA-I → HANGUL JUNGSEONG ARAEA, CJK UNIFIED IDEOGRAPH-4E28	# →ᆞᅵ→
+ 0x318e: (0x119e, 0x4e28,), #  HANGUL LETTER ARAEAE → HANGUL JUNGSEONG ARAEA, CJK UNIFIED IDEOGRAPH-4E28	# →ᆡ→→ᆞᅵ→
+ 0x30d8: (0x3078,), #  KATAKANA LETTER HE → HIRAGANA LETTER HE
+ 0x2341: (0x303c,), #  APL FUNCTIONAL SYMBOL QUAD SLASH → MASU MARK	# →⧄→
+ 0x29c4: (0x303c,), #  SQUARED RISING DIAGONAL SLASH → MASU MARK
+ 0xa49e: (0xa04a,), #  YI RADICAL PUT → YI SYLLABLE PUT
+ 0xa4ac: (0xa050,), #  YI RADICAL PYT → YI SYLLABLE PYT
+ 0xa49c: (0xa0c0,), #  YI RADICAL MOP → YI SYLLABLE MOP
+ 0xa4a8: (0xa132,), #  YI RADICAL TU → YI SYLLABLE TU
+ 0xa4bf: (0xa259,), #  YI RADICAL HXOP → YI SYLLABLE HXOP
+ 0xa4be: (0xa2b1,), #  YI RADICAL CIP → YI SYLLABLE CIP
+ 0xa494: (0xa2cd,), #  YI RADICAL CYP → YI SYLLABLE CYP
+ 0xa4c0: (0xa3ab,), #  YI RADICAL SHAT → YI SYLLABLE SHAT
+ 0xa4c2: (0xa3b5,), #  YI RADICAL SHOP → YI SYLLABLE SHOP
+ 0xa4ba: (0xa3bf,), #  YI RADICAL SHUR → YI SYLLABLE SHUR
+ 0xa4b0: (0xa3c2,), #  YI RADICAL SHY → YI SYLLABLE SHY
+ 0xa4a7: (0xa458,), #  YI RADICAL NYOP → YI SYLLABLE NYOP
+ 0x22a5: (0xa4d5,), #  UP TACK → LISU LETTER THA
+ 0x27c2: (0xa4d5,), #  PERPENDICULAR → LISU LETTER THA	# →⊥→
+ 0x1d21c: (0xa4d5,), #  GREEK VOCAL NOTATION SYMBOL-54 → LISU LETTER THA	# →Ʇ→
+ 0xa7b1: (0xa4d5,), #  LATIN CAPITAL LETTER TURNED T → LISU LETTER THA
+ 0xa79e: (0xa4e4,), #  LATIN CAPITAL LETTER VOLAPUK UE → LISU LETTER ZA
+ 0x2141: (0xa4e8,), #  TURNED SANS-SERIF CAPITAL G → LISU LETTER HHA
+ 0x2142: (0xa4f6,), #  TURNED SANS-SERIF CAPITAL L → LISU LETTER UH
+ 0x1d215: (0xa4f6,), #  GREEK VOCAL NOTATION SYMBOL-22 → LISU LETTER UH	# →⅂→
+ 0x1d22b: (0xa4f6,), #  GREEK INSTRUMENTAL NOTATION SYMBOL-24 → LISU LETTER UH	# →𝈕→→⅂→
+ 0x16f26: (0xa4f6,), #  MIAO LETTER HA → LISU LETTER UH	# →⅂→
+ 0x10411: (0xa4f6,), #  DESERET CAPITAL LETTER PEE → LISU LETTER UH	# →⅂→
+ 0x2143: (0x16f00,), #  REVERSED SANS-SERIF CAPITAL L → MIAO LETTER PA
+ 0x11ae6: (0x11ae5, 0x11aef,), #  PAU CIN HAU RISING TONE → PAU CIN HAU RISING TONE LONG, PAU CIN HAU MID-LEVEL TONE
+ 0x11ae8: (0x11ae5, 0x11ae5,), #  PAU CIN HAU RISING TONE LONG FINAL → PAU CIN HAU RISING TONE LONG, PAU CIN HAU RISING TONE LONG
+ 0x11ae9: (0x11ae5, 0x11ae5, 0x11aef,), #  PAU CIN HAU RISING TONE FINAL → PAU CIN HAU RISING TONE LONG, PAU CIN HAU RISING TONE LONG, PAU CIN HAU MID-LEVEL TONE	# →𑫥𑫦→
+ 0x11aea: (0x11ae5, 0x11ae5, 0x11af0,), #  PAU CIN HAU SANDHI GLOTTAL STOP FINAL → PAU CIN HAU RISING TONE LONG, PAU CIN HAU RISING TONE LONG, PAU CIN HAU GLOTTAL STOP VARIANT	# →𑫥𑫧→
+ 0x11ae7: (0x11ae5, 0x11af0,), #  PAU CIN HAU SANDHI GLOTTAL STOP → PAU CIN HAU RISING TONE LONG, PAU CIN HAU GLOTTAL STOP VARIANT
+ 0x11af4: (0x11af3, 0x11aef,), #  PAU CIN HAU LOW-FALLING TONE → PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU MID-LEVEL TONE
+ 0x11af6: (0x11af3, 0x11af3,), #  PAU CIN HAU LOW-FALLING TONE LONG FINAL → PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU LOW-FALLING TONE LONG
+ 0x11af7: (0x11af3, 0x11af3, 0x11aef,), #  PAU CIN HAU LOW-FALLING TONE FINAL → PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU MID-LEVEL TONE	# →𑫳𑫴→
+ 0x11af8: (0x11af3, 0x11af3, 0x11af0,), #  PAU CIN HAU GLOTTAL STOP FINAL → PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU GLOTTAL STOP VARIANT	# →𑫳𑫵→
+ 0x11af5: (0x11af3, 0x11af0,), #  PAU CIN HAU GLOTTAL STOP → PAU CIN HAU LOW-FALLING TONE LONG, PAU CIN HAU GLOTTAL STOP VARIANT
+ 0x11aec: (0x11aeb, 0x11aef,), #  PAU CIN HAU SANDHI TONE → PAU CIN HAU SANDHI TONE LONG, PAU CIN HAU MID-LEVEL TONE
+ 0x11aed: (0x11aeb, 0x11aeb,), #  PAU CIN HAU SANDHI TONE LONG FINAL → PAU CIN HAU SANDHI TONE LONG, PAU CIN HAU SANDHI TONE LONG
+ 0x11aee: (0x11aeb, 0x11aeb, 0x11aef,), #  PAU CIN HAU SANDHI TONE FINAL → PAU CIN HAU SANDHI TONE LONG, PAU CIN HAU SANDHI TONE LONG, PAU CIN HAU MID-LEVEL TONE	# →𑫫𑫬→
+ 0x2295: (0x102a8,), #  CIRCLED PLUS → CARIAN LETTER Q
+ 0x2a01: (0x102a8,), #  N-ARY CIRCLED PLUS OPERATOR → CARIAN LETTER Q	# →⊕→
+ 0x1f728: (0x102a8,), #  ALCHEMICAL SYMBOL FOR VERDIGRIS → CARIAN LETTER Q	# →⊕→
+ 0xa69a: (0x102a8,), #  CYRILLIC CAPITAL LETTER CROSSED O → CARIAN LETTER Q	# →⊕→
+ 0x25bd: (0x102bc,), #  WHITE DOWN-POINTING TRIANGLE → CARIAN LETTER K
+ 0x1d214: (0x102bc,), #  GREEK VOCAL NOTATION SYMBOL-21 → CARIAN LETTER K	# →▽→
+ 0x1f704: (0x102bc,), #  ALCHEMICAL SYMBOL FOR WATER → CARIAN LETTER K	# →▽→
+ 0x29d6: (0x102c0,), #  WHITE HOURGLASS → CARIAN LETTER G
+ 0xa79b: (0x1043a,), #  LATIN SMALL LETTER VOLAPUK AE → DESERET SMALL LETTER BEE
+ 0xa79a: (0x10412,), #  LATIN CAPITAL LETTER VOLAPUK AE → DESERET CAPITAL LETTER BEE
+ 0x104a0: (0x10486,), #  OSMANYA DIGIT ZERO → OSMANYA LETTER DEEL
+ 0x103d1: (0x10382,), #  OLD PERSIAN NUMBER ONE → UGARITIC LETTER GAMLA
+ 0x103d3: (0x10393,), #  OLD PERSIAN NUMBER TEN → UGARITIC LETTER AIN
+ 0x12038: (0x1039a,), #  CUNEIFORM SIGN ASH → UGARITIC LETTER TO
+ 0x2625: (0x1099e,), #  ANKH → MEROITIC HIEROGLYPHIC SYMBOL VIDJ
+ 0x132f9: (0x1099e,), #  EGYPTIAN HIEROGLYPH S034 → MEROITIC HIEROGLYPHIC SYMBOL VIDJ	# →☥→
+ 0x3039: (0x5344,), #  HANGZHOU NUMERAL TWENTY → CJK UNIFIED IDEOGRAPH-5344
+ 0xf967: (0x4e0d,), #  CJK COMPATIBILITY IDEOGRAPH-F967 → CJK UNIFIED IDEOGRAPH-4E0D
+ 0x2f800: (0x4e3d,), #  CJK COMPATIBILITY IDEOGRAPH-2F800 → CJK UNIFIED IDEOGRAPH-4E3D
+ 0xfa70: (0x4e26,), #  CJK COMPATIBILITY IDEOGRAPH-FA70 → CJK UNIFIED IDEOGRAPH-4E26
+ 0x239c: (0x4e28,), #  LEFT PARENTHESIS EXTENSION → CJK UNIFIED IDEOGRAPH-4E28	# →⎥→→⎮→
+ 0x239f: (0x4e28,), #  RIGHT PARENTHESIS EXTENSION → CJK UNIFIED IDEOGRAPH-4E28	# →⎥→→⎮→
+ 0x23a2: (0x4e28,), #  LEFT SQUARE BRACKET EXTENSION → CJK UNIFIED IDEOGRAPH-4E28	# →⎥→→⎮→
+ 0x23a5: (0x4e28,), #  RIGHT SQUARE BRACKET EXTENSION → CJK UNIFIED IDEOGRAPH-4E28	# →⎮→
+ 0x23aa: (0x4e28,), #  CURLY BRACKET EXTENSION → CJK UNIFIED IDEOGRAPH-4E28	# →⎥→→⎮→
+ 0x23ae: (0x4e28,), #  INTEGRAL EXTENSION → CJK UNIFIED IDEOGRAPH-4E28
+ 0x31d1: (0x4e28,), #  CJK STROKE S → CJK UNIFIED IDEOGRAPH-4E28
+ 0x1175: (0x4e28,), #  HANGUL JUNGSEONG I → CJK UNIFIED IDEOGRAPH-4E28	# →ㅣ→
+ 0x3163: (0x4e28,), #  HANGUL LETTER I → CJK UNIFIED IDEOGRAPH-4E28
+ 0x2f01: (0x4e28,), #  KANGXI RADICAL LINE → CJK UNIFIED IDEOGRAPH-4E28
+ 0x119c: (0x4e28, 0x30fc,), #  HANGUL JUNGSEONG I-EU → CJK UNIFIED IDEOGRAPH-4E28, KATAKANA-HIRAGANA PROLONGED SOUND MARK	# →ᅵᅳ→
+ 0x1198: (0x4e28, 0x1161,), #  HANGUL JUNGSEONG I-A → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG A	# →ᅵᅡ→
+ 0x1199: (0x4e28, 0x1163,), #  HANGUL JUNGSEONG I-YA → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YA	# →ᅵᅣ→
+ 0xd7bd: (0x4e28, 0x1163, 0x1169,), #  HANGUL JUNGSEONG I-YA-O → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YA, HANGUL JUNGSEONG O	# →ᅵᅣᅩ→
+ 0xd7be: (0x4e28, 0x1163, 0x4e28,), #  HANGUL JUNGSEONG I-YAE → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YA, CJK UNIFIED IDEOGRAPH-4E28	# →ᅵᅣᅵ→
+ 0xd7bf: (0x4e28, 0x1167,), #  HANGUL JUNGSEONG I-YEO → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YEO	# →ᅵᅧ→
+ 0xd7c0: (0x4e28, 0x1167, 0x4e28,), #  HANGUL JUNGSEONG I-YE → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YEO, CJK UNIFIED IDEOGRAPH-4E28	# →ᅵᅧᅵ→
+ 0x119a: (0x4e28, 0x1169,), #  HANGUL JUNGSEONG I-O → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG O	# →ᅵᅩ→
+ 0xd7c1: (0x4e28, 0x1169, 0x4e28,), #  HANGUL JUNGSEONG I-O-I → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG O, CJK UNIFIED IDEOGRAPH-4E28	# →ᅵᅩᅵ→
+ 0xd7c2: (0x4e28, 0x116d,), #  HANGUL JUNGSEONG I-YO → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YO	# →ᅵᅭ→
+ 0x119b: (0x4e28, 0x116e,), #  HANGUL JUNGSEONG I-U → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG U	# →ᅵᅮ→
+ 0xd7c3: (0x4e28, 0x1172,), #  HANGUL JUNGSEONG I-YU → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG YU	# →ᅵᅲ→
+ 0x119d: (0x4e28, 0x119e,), #  HANGUL JUNGSEONG I-ARAEA → CJK UNIFIED IDEOGRAPH-4E28, HANGUL JUNGSEONG ARAEA	# →ᅵᆞ→
+ 0xd7c4: (0x4e28, 0x4e28,), #  HANGUL JUNGSEONG I-I → CJK UNIFIED IDEOGRAPH-4E28, CJK UNIFIED IDEOGRAPH-4E28	# →ᅵᅵ→
+ 0xf905: (0x4e32,), #  CJK COMPATIBILITY IDEOGRAPH-F905 → CJK UNIFIED IDEOGRAPH-4E32
+ 0x2f801: (0x4e38,), #  CJK COMPATIBILITY IDEOGRAPH-2F801 → CJK UNIFIED IDEOGRAPH-4E38
+ 0xf95e: (0x4e39,), #  CJK COMPATIBILITY IDEOGRAPH-F95E → CJK UNIFIED IDEOGRAPH-4E39
+ 0x2f802: (0x4e41,), #  CJK COMPATIBILITY IDEOGRAPH-2F802 → CJK UNIFIED IDEOGRAPH-4E41
+ 0x31e0: (0x4e59,), #  CJK STROKE HXWG → CJK UNIFIED IDEOGRAPH-4E59
+ 0x2f04: (0x4e59,), #  KANGXI RADICAL SECOND → CJK UNIFIED IDEOGRAPH-4E59
+ 0x31df: (0x4e5a,), #  CJK STROKE SWG → CJK UNIFIED IDEOGRAPH-4E5A
+ 0x2e83: (0x4e5a,), #  CJK RADICAL SECOND TWO → CJK UNIFIED IDEOGRAPH-4E5A
+ 0x31d6: (0x4e5b,), #  CJK STROKE HG → CJK UNIFIED IDEOGRAPH-4E5B
+ 0x2e82: (0x4e5b,), #  CJK RADICAL SECOND ONE → CJK UNIFIED IDEOGRAPH-4E5B	# →㇖→
+ 0x2ef2: (0x4e80,), #  CJK RADICAL J-SIMPLIFIED TURTLE → CJK UNIFIED IDEOGRAPH-4E80
+ 0xf91b: (0x4e82,), #  CJK COMPATIBILITY IDEOGRAPH-F91B → CJK UNIFIED IDEOGRAPH-4E82
+ 0x31da: (0x4e85,), #  CJK STROKE SG → CJK UNIFIED IDEOGRAPH-4E85
+ 0x2f05: (0x4e85,), #  KANGXI RADICAL HOOK → CJK UNIFIED IDEOGRAPH-4E85
+ 0xf9ba: (0x4e86,), #  CJK COMPATIBILITY IDEOGRAPH-F9BA → CJK UNIFIED IDEOGRAPH-4E86
+ 0x30cb: (0x4e8c,), #  KATAKANA LETTER NI → CJK UNIFIED IDEOGRAPH-4E8C
+ 0x2f06: (0x4e8c,), #  KANGXI RADICAL TWO → CJK UNIFIED IDEOGRAPH-4E8C
+ 0x2f803: (0x20122,), #  CJK COMPATIBILITY IDEOGRAPH-2F803 → CJK UNIFIED IDEOGRAPH-20122
+ 0x2f07: (0x4ea0,), #  KANGXI RADICAL LID → CJK UNIFIED IDEOGRAPH-4EA0
+ 0xf977: (0x4eae,), #  CJK COMPATIBILITY IDEOGRAPH-F977 → CJK UNIFIED IDEOGRAPH-4EAE
+ 0x2f08: (0x4eba,), #  KANGXI RADICAL MAN → CJK UNIFIED IDEOGRAPH-4EBA
+ 0x30a4: (0x4ebb,), #  KATAKANA LETTER I → CJK UNIFIED IDEOGRAPH-4EBB	# →⺅→
+ 0x2e85: (0x4ebb,), #  CJK RADICAL PERSON → CJK UNIFIED IDEOGRAPH-4EBB
+ 0xf9fd: (0x4ec0,), #  CJK COMPATIBILITY IDEOGRAPH-F9FD → CJK UNIFIED IDEOGRAPH-4EC0
+ 0x2f819: (0x4ecc,), #  CJK COMPATIBILITY IDEOGRAPH-2F819 → CJK UNIFIED IDEOGRAPH-4ECC
+ 0xf9a8: (0x4ee4,), #  CJK COMPATIBILITY IDEOGRAPH-F9A8 → CJK UNIFIED IDEOGRAPH-4EE4
+ 0x2f804: (0x4f60,), #  CJK COMPATIBILITY IDEOGRAPH-2F804 → CJK UNIFIED IDEOGRAPH-4F60
+ 0x5002: (0x4f75,), #  CJK UNIFIED IDEOGRAPH-5002 → CJK UNIFIED IDEOGRAPH-4F75
+ 0x2f807: (0x4f75,), #  CJK COMPATIBILITY IDEOGRAPH-2F807 → CJK UNIFIED IDEOGRAPH-4F75	# →倂→
+ 0xfa73: (0x4f80,), #  CJK COMPATIBILITY IDEOGRAPH-FA73 → CJK UNIFIED IDEOGRAPH-4F80
+ 0xf92d: (0x4f86,), #  CJK COMPATIBILITY IDEOGRAPH-F92D → CJK UNIFIED IDEOGRAPH-4F86
+ 0xf9b5: (0x4f8b,), #  CJK COMPATIBILITY IDEOGRAPH-F9B5 → CJK UNIFIED IDEOGRAPH-4F8B
+ 0xfa30: (0x4fae,), #  CJK COMPATIBILITY IDEOGRAPH-FA30 → CJK UNIFIED IDEOGRAPH-4FAE
+ 0x2f805: (0x4fae,), #  CJK COMPATIBILITY IDEOGRAPH-2F805 → CJK UNIFIED IDEOGRAPH-4FAE
+ 0x2f806: (0x4fbb,), #  CJK COMPATIBILITY IDEOGRAPH-2F806 → CJK UNIFIED IDEOGRAPH-4FBB
+ 0xf965: (0x4fbf,), #  CJK COMPATIBILITY IDEOGRAPH-F965 → CJK UNIFIED IDEOGRAPH-4FBF
+ 0x503c: (0x5024,), #  CJK UNIFIED IDEOGRAPH-503C → CJK UNIFIED IDEOGRAPH-5024
+ 0xf9d4: (0x502b,), #  CJK COMPATIBILITY IDEOGRAPH-F9D4 → CJK UNIFIED IDEOGRAPH-502B
+ 0x2f808: (0x507a,), #  CJK COMPATIBILITY IDEOGRAPH-2F808 → CJK UNIFIED IDEOGRAPH-507A
+ 0x2f809: (0x5099,), #  CJK COMPATIBILITY IDEOGRAPH-2F809 → CJK UNIFIED IDEOGRAPH-5099
+ 0x2f80b: (0x50cf,), #  CJK COMPATIBILITY IDEOGRAPH-2F80B → CJK UNIFIED IDEOGRAPH-50CF
+ 0xf9bb: (0x50da,), #  CJK COMPATIBILITY IDEOGRAPH-F9BB → CJK UNIFIED IDEOGRAPH-50DA
+ 0xfa31: (0x50e7,), #  CJK COMPATIBILITY IDEOGRAPH-FA31 → CJK UNIFIED IDEOGRAPH-50E7
+ 0x2f80a: (0x50e7,), #  CJK COMPATIBILITY IDEOGRAPH-2F80A → CJK UNIFIED IDEOGRAPH-50E7
+ 0x2f80c: (0x349e,), #  CJK COMPATIBILITY IDEOGRAPH-2F80C → CJK UNIFIED IDEOGRAPH-349E
+ 0x2f09: (0x513f,), #  KANGXI RADICAL LEGS → CJK UNIFIED IDEOGRAPH-513F
+ 0xfa0c: (0x5140,), #  CJK COMPATIBILITY IDEOGRAPH-FA0C → CJK UNIFIED IDEOGRAPH-5140
+ 0x2e8e: (0x5140,), #  CJK RADICAL LAME ONE → CJK UNIFIED IDEOGRAPH-5140
+ 0xfa74: (0x5145,), #  CJK COMPATIBILITY IDEOGRAPH-FA74 → CJK UNIFIED IDEOGRAPH-5145
+ 0xfa32: (0x514d,), #  CJK COMPATIBILITY IDEOGRAPH-FA32 → CJK UNIFIED IDEOGRAPH-514D
+ 0x2f80e: (0x514d,), #  CJK COMPATIBILITY IDEOGRAPH-2F80E → CJK UNIFIED IDEOGRAPH-514D
+ 0x2f80f: (0x5154,), #  CJK COMPATIBILITY IDEOGRAPH-2F80F → CJK UNIFIED IDEOGRAPH-5154
+ 0x2f810: (0x5164,), #  CJK COMPATIBILITY IDEOGRAPH-2F810 → CJK UNIFIED IDEOGRAPH-5164
+ 0x2f0a: (0x5165,), #  KANGXI RADICAL ENTER → CJK UNIFIED IDEOGRAPH-5165
+ 0x2f814: (0x5167,), #  CJK COMPATIBILITY IDEOGRAPH-2F814 → CJK UNIFIED IDEOGRAPH-5167
+ 0xfa72: (0x5168,), #  CJK COMPATIBILITY IDEOGRAPH-FA72 → CJK UNIFIED IDEOGRAPH-5168
+ 0xf978: (0x5169,), #  CJK COMPATIBILITY IDEOGRAPH-F978 → CJK UNIFIED IDEOGRAPH-5169
+ 0x30cf: (0x516b,), #  KATAKANA LETTER HA → CJK UNIFIED IDEOGRAPH-516B
+ 0x2f0b: (0x516b,), #  KANGXI RADICAL EIGHT → CJK UNIFIED IDEOGRAPH-516B
+ 0xf9d1: (0x516d,), #  CJK COMPATIBILITY IDEOGRAPH-F9D1 → CJK UNIFIED IDEOGRAPH-516D
+ 0x2f811: (0x5177,), #  CJK COMPATIBILITY IDEOGRAPH-2F811 → CJK UNIFIED IDEOGRAPH-5177
+ 0x2f812: (0x2051c,), #  CJK COMPATIBILITY IDEOGRAPH-2F812 → CJK UNIFIED IDEOGRAPH-2051C
+ 0x2f91b: (0x20525,), #  CJK COMPATIBILITY IDEOGRAPH-2F91B → CJK UNIFIED IDEOGRAPH-20525
+ 0xfa75: (0x5180,), #  CJK COMPATIBILITY IDEOGRAPH-FA75 → CJK UNIFIED IDEOGRAPH-5180
+ 0x2f813: (0x34b9,), #  CJK COMPATIBILITY IDEOGRAPH-2F813 → CJK UNIFIED IDEOGRAPH-34B9
+ 0x2f0c: (0x5182,), #  KANGXI RADICAL DOWN BOX → CJK UNIFIED IDEOGRAPH-5182
+ 0x2f815: (0x518d,), #  CJK COMPATIBILITY IDEOGRAPH-2F815 → CJK UNIFIED IDEOGRAPH-518D
+ 0x2f816: (0x2054b,), #  CJK COMPATIBILITY IDEOGRAPH-2F816 → CJK UNIFIED IDEOGRAPH-2054B
+ 0x2f8d2: (0x5192,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D2 → CJK UNIFIED IDEOGRAPH-5192
+ 0x2f8d3: (0x5195,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D3 → CJK UNIFIED IDEOGRAPH-5195
+ 0x2f9ca: (0x34bb,), #  CJK COMPATIBILITY IDEOGRAPH-2F9CA → CJK UNIFIED IDEOGRAPH-34BB
+ 0x2f8d4: (0x6700,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D4 → CJK UNIFIED IDEOGRAPH-6700
+ 0x2f0d: (0x5196,), #  KANGXI RADICAL COVER → CJK UNIFIED IDEOGRAPH-5196
+ 0x2f817: (0x5197,), #  CJK COMPATIBILITY IDEOGRAPH-2F817 → CJK UNIFIED IDEOGRAPH-5197
+ 0x2f818: (0x51a4,), #  CJK COMPATIBILITY IDEOGRAPH-2F818 → CJK UNIFIED IDEOGRAPH-51A4
+ 0x2f0e: (0x51ab,), #  KANGXI RADICAL ICE → CJK UNIFIED IDEOGRAPH-51AB
+ 0x2f81a: (0x51ac,), #  CJK COMPATIBILITY IDEOGRAPH-2F81A → CJK UNIFIED IDEOGRAPH-51AC
+ 0xfa71: (0x51b5,), #  CJK COMPATIBILITY IDEOGRAPH-FA71 → CJK UNIFIED IDEOGRAPH-51B5
+ 0x2f81b: (0x51b5,), #  CJK COMPATIBILITY IDEOGRAPH-2F81B → CJK UNIFIED IDEOGRAPH-51B5
+ 0xf92e: (0x51b7,), #  CJK COMPATIBILITY IDEOGRAPH-F92E → CJK UNIFIED IDEOGRAPH-51B7
+ 0xf979: (0x51c9,), #  CJK COMPATIBILITY IDEOGRAPH-F979 → CJK UNIFIED IDEOGRAPH-51C9
+ 0xf955: (0x51cc,), #  CJK COMPATIBILITY IDEOGRAPH-F955 → CJK UNIFIED IDEOGRAPH-51CC
+ 0xf954: (0x51dc,), #  CJK COMPATIBILITY IDEOGRAPH-F954 → CJK UNIFIED IDEOGRAPH-51DC
+ 0xfa15: (0x51de,), #  CJK COMPATIBILITY IDEOGRAPH-FA15 → CJK UNIFIED IDEOGRAPH-51DE
+ 0x2f0f: (0x51e0,), #  KANGXI RADICAL TABLE → CJK UNIFIED IDEOGRAPH-51E0
+ 0x2f80d: (0x2063a,), #  CJK COMPATIBILITY IDEOGRAPH-2F80D → CJK UNIFIED IDEOGRAPH-2063A
+ 0x2f81d: (0x51f5,), #  CJK COMPATIBILITY IDEOGRAPH-2F81D → CJK UNIFIED IDEOGRAPH-51F5
+ 0x2f10: (0x51f5,), #  KANGXI RADICAL OPEN BOX → CJK UNIFIED IDEOGRAPH-51F5
+ 0x2f11: (0x5200,), #  KANGXI RADICAL KNIFE → CJK UNIFIED IDEOGRAPH-5200
+ 0x2e89: (0x5202,), #  CJK RADICAL KNIFE TWO → CJK UNIFIED IDEOGRAPH-5202
+ 0x2f81e: (0x5203,), #  CJK COMPATIBILITY IDEOGRAPH-2F81E → CJK UNIFIED IDEOGRAPH-5203
+ 0xfa00: (0x5207,), #  CJK COMPATIBILITY IDEOGRAPH-FA00 → CJK UNIFIED IDEOGRAPH-5207
+ 0x2f850: (0x5207,), #  CJK COMPATIBILITY IDEOGRAPH-2F850 → CJK UNIFIED IDEOGRAPH-5207
+ 0xf99c: (0x5217,), #  CJK COMPATIBILITY IDEOGRAPH-F99C → CJK UNIFIED IDEOGRAPH-5217
+ 0xf9dd: (0x5229,), #  CJK COMPATIBILITY IDEOGRAPH-F9DD → CJK UNIFIED IDEOGRAPH-5229
+ 0x2f81f: (0x34df,), #  CJK COMPATIBILITY IDEOGRAPH-2F81F → CJK UNIFIED IDEOGRAPH-34DF
+ 0xf9ff: (0x523a,), #  CJK COMPATIBILITY IDEOGRAPH-F9FF → CJK UNIFIED IDEOGRAPH-523A
+ 0x2f820: (0x523b,), #  CJK COMPATIBILITY IDEOGRAPH-2F820 → CJK UNIFIED IDEOGRAPH-523B
+ 0x2f821: (0x5246,), #  CJK COMPATIBILITY IDEOGRAPH-2F821 → CJK UNIFIED IDEOGRAPH-5246
+ 0x2f822: (0x5272,), #  CJK COMPATIBILITY IDEOGRAPH-2F822 → CJK UNIFIED IDEOGRAPH-5272
+ 0x2f823: (0x5277,), #  CJK COMPATIBILITY IDEOGRAPH-2F823 → CJK UNIFIED IDEOGRAPH-5277
+ 0xf9c7: (0x5289,), #  CJK COMPATIBILITY IDEOGRAPH-F9C7 → CJK UNIFIED IDEOGRAPH-5289
+ 0x2f9d9: (0x20804,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D9 → CJK UNIFIED IDEOGRAPH-20804
+ 0x30ab: (0x529b,), #  KATAKANA LETTER KA → CJK UNIFIED IDEOGRAPH-529B	# →⼒→
+ 0xf98a: (0x529b,), #  CJK COMPATIBILITY IDEOGRAPH-F98A → CJK UNIFIED IDEOGRAPH-529B
+ 0x2f12: (0x529b,), #  KANGXI RADICAL POWER → CJK UNIFIED IDEOGRAPH-529B
+ 0xf99d: (0x52a3,), #  CJK COMPATIBILITY IDEOGRAPH-F99D → CJK UNIFIED IDEOGRAPH-52A3
+ 0x2f824: (0x3515,), #  CJK COMPATIBILITY IDEOGRAPH-2F824 → CJK UNIFIED IDEOGRAPH-3515
+ 0x2f992: (0x52b3,), #  CJK COMPATIBILITY IDEOGRAPH-2F992 → CJK UNIFIED IDEOGRAPH-52B3
+ 0xfa76: (0x52c7,), #  CJK COMPATIBILITY IDEOGRAPH-FA76 → CJK UNIFIED IDEOGRAPH-52C7
+ 0x2f825: (0x52c7,), #  CJK COMPATIBILITY IDEOGRAPH-2F825 → CJK UNIFIED IDEOGRAPH-52C7
+ 0xfa33: (0x52c9,), #  CJK COMPATIBILITY IDEOGRAPH-FA33 → CJK UNIFIED IDEOGRAPH-52C9
+ 0x2f826: (0x52c9,), #  CJK COMPATIBILITY IDEOGRAPH-2F826 → CJK UNIFIED IDEOGRAPH-52C9
+ 0xf952: (0x52d2,), #  CJK COMPATIBILITY IDEOGRAPH-F952 → CJK UNIFIED IDEOGRAPH-52D2
+ 0xf92f: (0x52de,), #  CJK COMPATIBILITY IDEOGRAPH-F92F → CJK UNIFIED IDEOGRAPH-52DE
+ 0xfa34: (0x52e4,), #  CJK COMPATIBILITY IDEOGRAPH-FA34 → CJK UNIFIED IDEOGRAPH-52E4
+ 0x2f827: (0x52e4,), #  CJK COMPATIBILITY IDEOGRAPH-2F827 → CJK UNIFIED IDEOGRAPH-52E4
+ 0xf97f: (0x52f5,), #  CJK COMPATIBILITY IDEOGRAPH-F97F → CJK UNIFIED IDEOGRAPH-52F5
+ 0x2f13: (0x52f9,), #  KANGXI RADICAL WRAP → CJK UNIFIED IDEOGRAPH-52F9
+ 0xfa77: (0x52fa,), #  CJK COMPATIBILITY IDEOGRAPH-FA77 → CJK UNIFIED IDEOGRAPH-52FA
+ 0x2f828: (0x52fa,), #  CJK COMPATIBILITY IDEOGRAPH-2F828 → CJK UNIFIED IDEOGRAPH-52FA
+ 0x2f829: (0x5305,), #  CJK COMPATIBILITY IDEOGRAPH-2F829 → CJK UNIFIED IDEOGRAPH-5305
+ 0x2f82a: (0x5306,), #  CJK COMPATIBILITY IDEOGRAPH-2F82A → CJK UNIFIED IDEOGRAPH-5306
+ 0x2f9dd: (0x208de,), #  CJK COMPATIBILITY IDEOGRAPH-2F9DD → CJK UNIFIED IDEOGRAPH-208DE
+ 0x2f14: (0x5315,), #  KANGXI RADICAL SPOON → CJK UNIFIED IDEOGRAPH-5315
+ 0xf963: (0x5317,), #  CJK COMPATIBILITY IDEOGRAPH-F963 → CJK UNIFIED IDEOGRAPH-5317
+ 0x2f82b: (0x5317,), #  CJK COMPATIBILITY IDEOGRAPH-2F82B → CJK UNIFIED IDEOGRAPH-5317
+ 0x2f15: (0x531a,), #  KANGXI RADICAL RIGHT OPEN BOX → CJK UNIFIED IDEOGRAPH-531A
+ 0x2f16: (0x5338,), #  KANGXI RADICAL HIDING ENCLOSURE → CJK UNIFIED IDEOGRAPH-5338
+ 0xf9eb: (0x533f,), #  CJK COMPATIBILITY IDEOGRAPH-F9EB → CJK UNIFIED IDEOGRAPH-533F
+ 0x2f17: (0x5341,), #  KANGXI RADICAL TEN → CJK UNIFIED IDEOGRAPH-5341
+ 0x3038: (0x5341,), #  HANGZHOU NUMERAL TEN → CJK UNIFIED IDEOGRAPH-5341
+ 0x303a: (0x5345,), #  HANGZHOU NUMERAL THIRTY → CJK UNIFIED IDEOGRAPH-5345
+ 0x2f82c: (0x5349,), #  CJK COMPATIBILITY IDEOGRAPH-2F82C → CJK UNIFIED IDEOGRAPH-5349
+ 0x0fd6: (0x534d,), #  LEFT-FACING SVASTI SIGN → CJK UNIFIED IDEOGRAPH-534D
+ 0x0fd5: (0x5350,), #  RIGHT-FACING SVASTI SIGN → CJK UNIFIED IDEOGRAPH-5350
+ 0xfa35: (0x5351,), #  CJK COMPATIBILITY IDEOGRAPH-FA35 → CJK UNIFIED IDEOGRAPH-5351
+ 0x2f82d: (0x5351,), #  CJK COMPATIBILITY IDEOGRAPH-2F82D → CJK UNIFIED IDEOGRAPH-5351
+ 0x2f82e: (0x535a,), #  CJK COMPATIBILITY IDEOGRAPH-2F82E → CJK UNIFIED IDEOGRAPH-535A
+ 0x30c8: (0x535c,), #  KATAKANA LETTER TO → CJK UNIFIED IDEOGRAPH-535C	# →⼘→
+ 0x2f18: (0x535c,), #  KANGXI RADICAL DIVINATION → CJK UNIFIED IDEOGRAPH-535C
+ 0x2f19: (0x5369,), #  KANGXI RADICAL SEAL → CJK UNIFIED IDEOGRAPH-5369
+ 0x2e8b: (0x353e,), #  CJK RADICAL SEAL → CJK UNIFIED IDEOGRAPH-353E
+ 0x2f82f: (0x5373,), #  CJK COMPATIBILITY IDEOGRAPH-2F82F → CJK UNIFIED IDEOGRAPH-5373
+ 0xf91c: (0x5375,), #  CJK COMPATIBILITY IDEOGRAPH-F91C → CJK UNIFIED IDEOGRAPH-5375
+ 0x2f830: (0x537d,), #  CJK COMPATIBILITY IDEOGRAPH-2F830 → CJK UNIFIED IDEOGRAPH-537D
+ 0x2f831: (0x537f,), #  CJK COMPATIBILITY IDEOGRAPH-2F831 → CJK UNIFIED IDEOGRAPH-537F
+ 0x2f832: (0x537f,), #  CJK COMPATIBILITY IDEOGRAPH-2F832 → CJK UNIFIED IDEOGRAPH-537F
+ 0x2f833: (0x537f,), #  CJK COMPATIBILITY IDEOGRAPH-2F833 → CJK UNIFIED IDEOGRAPH-537F
+ 0x2f1a: (0x5382,), #  KANGXI RADICAL CLIFF → CJK UNIFIED IDEOGRAPH-5382
+ 0x2f834: (0x20a2c,), #  CJK COMPATIBILITY IDEOGRAPH-2F834 → CJK UNIFIED IDEOGRAPH-20A2C
+ 0x2f1b: (0x53b6,), #  KANGXI RADICAL PRIVATE → CJK UNIFIED IDEOGRAPH-53B6
+ 0xf96b: (0x53c3,), #  CJK COMPATIBILITY IDEOGRAPH-F96B → CJK UNIFIED IDEOGRAPH-53C3
+ 0x2f1c: (0x53c8,), #  KANGXI RADICAL AGAIN → CJK UNIFIED IDEOGRAPH-53C8
+ 0x2f836: (0x53ca,), #  CJK COMPATIBILITY IDEOGRAPH-2F836 → CJK UNIFIED IDEOGRAPH-53CA
+ 0x2f837: (0x53df,), #  CJK COMPATIBILITY IDEOGRAPH-2F837 → CJK UNIFIED IDEOGRAPH-53DF
+ 0x2f838: (0x20b63,), #  CJK COMPATIBILITY IDEOGRAPH-2F838 → CJK UNIFIED IDEOGRAPH-20B63
+ 0x30ed: (0x53e3,), #  KATAKANA LETTER RO → CJK UNIFIED IDEOGRAPH-53E3	# →⼞→→⼝→
+ 0x2f1d: (0x53e3,), #  KANGXI RADICAL MOUTH → CJK UNIFIED IDEOGRAPH-53E3
+ 0x56d7: (0x53e3,), #  CJK UNIFIED IDEOGRAPH-56D7 → CJK UNIFIED IDEOGRAPH-53E3	# →⼞→→⼝→
+ 0x2f1e: (0x53e3,), #  KANGXI RADICAL ENCLOSURE → CJK UNIFIED IDEOGRAPH-53E3	# →⼝→
+ 0xf906: (0x53e5,), #  CJK COMPATIBILITY IDEOGRAPH-F906 → CJK UNIFIED IDEOGRAPH-53E5
+ 0x2f839: (0x53eb,), #  CJK COMPATIBILITY IDEOGRAPH-2F839 → CJK UNIFIED IDEOGRAPH-53EB
+ 0x2f83a: (0x53f1,), #  CJK COMPATIBILITY IDEOGRAPH-2F83A → CJK UNIFIED IDEOGRAPH-53F1
+ 0x2f83b: (0x5406,), #  CJK COMPATIBILITY IDEOGRAPH-2F83B → CJK UNIFIED IDEOGRAPH-5406
+ 0xf9de: (0x540f,), #  CJK COMPATIBILITY IDEOGRAPH-F9DE → CJK UNIFIED IDEOGRAPH-540F
+ 0xf9ed: (0x541d,), #  CJK COMPATIBILITY IDEOGRAPH-F9ED → CJK UNIFIED IDEOGRAPH-541D
+ 0x2f83d: (0x5438,), #  CJK COMPATIBILITY IDEOGRAPH-2F83D → CJK UNIFIED IDEOGRAPH-5438
+ 0xf980: (0x5442,), #  CJK COMPATIBILITY IDEOGRAPH-F980 → CJK UNIFIED IDEOGRAPH-5442
+ 0x2f83e: (0x5448,), #  CJK COMPATIBILITY IDEOGRAPH-2F83E → CJK UNIFIED IDEOGRAPH-5448
+ 0x2f83f: (0x5468,), #  CJK COMPATIBILITY IDEOGRAPH-2F83F → CJK UNIFIED IDEOGRAPH-5468
+ 0x2f83c: (0x549e,), #  CJK COMPATIBILITY IDEOGRAPH-2F83C → CJK UNIFIED IDEOGRAPH-549E
+ 0x2f840: (0x54a2,), #  CJK COMPATIBILITY IDEOGRAPH-2F840 → CJK UNIFIED IDEOGRAPH-54A2
+ 0xf99e: (0x54bd,), #  CJK COMPATIBILITY IDEOGRAPH-F99E → CJK UNIFIED IDEOGRAPH-54BD
+ 0x439b: (0x3588,), #  CJK UNIFIED IDEOGRAPH-439B → CJK UNIFIED IDEOGRAPH-3588
+ 0x2f841: (0x54f6,), #  CJK COMPATIBILITY IDEOGRAPH-2F841 → CJK UNIFIED IDEOGRAPH-54F6
+ 0x2f842: (0x5510,), #  CJK COMPATIBILITY IDEOGRAPH-2F842 → CJK UNIFIED IDEOGRAPH-5510
+ 0x2f843: (0x5553,), #  CJK COMPATIBILITY IDEOGRAPH-2F843 → CJK UNIFIED IDEOGRAPH-5553
+ 0x555f: (0x5553,), #  CJK UNIFIED IDEOGRAPH-555F → CJK UNIFIED IDEOGRAPH-5553
+ 0xfa79: (0x5555,), #  CJK COMPATIBILITY IDEOGRAPH-FA79 → CJK UNIFIED IDEOGRAPH-5555
+ 0x2f844: (0x5563,), #  CJK COMPATIBILITY IDEOGRAPH-2F844 → CJK UNIFIED IDEOGRAPH-5563
+ 0x2f845: (0x5584,), #  CJK COMPATIBILITY IDEOGRAPH-2F845 → CJK UNIFIED IDEOGRAPH-5584
+ 0x2f846: (0x5584,), #  CJK COMPATIBILITY IDEOGRAPH-2F846 → CJK UNIFIED IDEOGRAPH-5584
+ 0xf90b: (0x5587,), #  CJK COMPATIBILITY IDEOGRAPH-F90B → CJK UNIFIED IDEOGRAPH-5587
+ 0xfa7a: (0x5599,), #  CJK COMPATIBILITY IDEOGRAPH-FA7A → CJK UNIFIED IDEOGRAPH-5599
+ 0x2f847: (0x5599,), #  CJK COMPATIBILITY IDEOGRAPH-2F847 → CJK UNIFIED IDEOGRAPH-5599
+ 0xfa36: (0x559d,), #  CJK COMPATIBILITY IDEOGRAPH-FA36 → CJK UNIFIED IDEOGRAPH-559D
+ 0xfa78: (0x559d,), #  CJK COMPATIBILITY IDEOGRAPH-FA78 → CJK UNIFIED IDEOGRAPH-559D
+ 0x2f848: (0x55ab,), #  CJK COMPATIBILITY IDEOGRAPH-2F848 → CJK UNIFIED IDEOGRAPH-55AB
+ 0x2f849: (0x55b3,), #  CJK COMPATIBILITY IDEOGRAPH-2F849 → CJK UNIFIED IDEOGRAPH-55B3
+ 0xfa0d: (0x55c0,), #  CJK COMPATIBILITY IDEOGRAPH-FA0D → CJK UNIFIED IDEOGRAPH-55C0
+ 0x2f84a: (0x55c2,), #  CJK COMPATIBILITY IDEOGRAPH-2F84A → CJK UNIFIED IDEOGRAPH-55C2
+ 0xfa7b: (0x55e2,), #  CJK COMPATIBILITY IDEOGRAPH-FA7B → CJK UNIFIED IDEOGRAPH-55E2
+ 0xfa37: (0x5606,), #  CJK COMPATIBILITY IDEOGRAPH-FA37 → CJK UNIFIED IDEOGRAPH-5606
+ 0x2f84c: (0x5606,), #  CJK COMPATIBILITY IDEOGRAPH-2F84C → CJK UNIFIED IDEOGRAPH-5606
+ 0x2f84e: (0x5651,), #  CJK COMPATIBILITY IDEOGRAPH-2F84E → CJK UNIFIED IDEOGRAPH-5651
+ 0x2f84f: (0x5674,), #  CJK COMPATIBILITY IDEOGRAPH-2F84F → CJK UNIFIED IDEOGRAPH-5674
+ 0xfa38: (0x5668,), #  CJK COMPATIBILITY IDEOGRAPH-FA38 → CJK UNIFIED IDEOGRAPH-5668
+ 0xf9a9: (0x56f9,), #  CJK COMPATIBILITY IDEOGRAPH-F9A9 → CJK UNIFIED IDEOGRAPH-56F9
+ 0x2f84b: (0x5716,), #  CJK COMPATIBILITY IDEOGRAPH-2F84B → CJK UNIFIED IDEOGRAPH-5716
+ 0x2f84d: (0x5717,), #  CJK COMPATIBILITY IDEOGRAPH-2F84D → CJK UNIFIED IDEOGRAPH-5717
+ 0x2f1f: (0x571f,), #  KANGXI RADICAL EARTH → CJK UNIFIED IDEOGRAPH-571F
+ 0x58eb: (0x571f,), #  CJK UNIFIED IDEOGRAPH-58EB → CJK UNIFIED IDEOGRAPH-571F	# →⼠→→⼟→
+ 0x2f20: (0x571f,), #  KANGXI RADICAL SCHOLAR → CJK UNIFIED IDEOGRAPH-571F	# →⼟→
+ 0x2f855: (0x578b,), #  CJK COMPATIBILITY IDEOGRAPH-2F855 → CJK UNIFIED IDEOGRAPH-578B
+ 0x2f852: (0x57ce,), #  CJK COMPATIBILITY IDEOGRAPH-2F852 → CJK UNIFIED IDEOGRAPH-57CE
+ 0x39b3: (0x363d,), #  CJK UNIFIED IDEOGRAPH-39B3 → CJK UNIFIED IDEOGRAPH-363D
+ 0x2f853: (0x57f4,), #  CJK COMPATIBILITY IDEOGRAPH-2F853 → CJK UNIFIED IDEOGRAPH-57F4
+ 0x2f854: (0x580d,), #  CJK COMPATIBILITY IDEOGRAPH-2F854 → CJK UNIFIED IDEOGRAPH-580D
+ 0x2f857: (0x5831,), #  CJK COMPATIBILITY IDEOGRAPH-2F857 → CJK UNIFIED IDEOGRAPH-5831
+ 0x2f856: (0x5832,), #  CJK COMPATIBILITY IDEOGRAPH-2F856 → CJK UNIFIED IDEOGRAPH-5832
+ 0xfa39: (0x5840,), #  CJK COMPATIBILITY IDEOGRAPH-FA39 → CJK UNIFIED IDEOGRAPH-5840
+ 0xfa10: (0x585a,), #  CJK COMPATIBILITY IDEOGRAPH-FA10 → CJK UNIFIED IDEOGRAPH-585A
+ 0xfa7c: (0x585a,), #  CJK COMPATIBILITY IDEOGRAPH-FA7C → CJK UNIFIED IDEOGRAPH-585A
+ 0xf96c: (0x585e,), #  CJK COMPATIBILITY IDEOGRAPH-F96C → CJK UNIFIED IDEOGRAPH-585E
+ 0x586b: (0x5861,), #  CJK UNIFIED IDEOGRAPH-586B → CJK UNIFIED IDEOGRAPH-5861
+ 0x58ff: (0x58ab,), #  CJK UNIFIED IDEOGRAPH-58FF → CJK UNIFIED IDEOGRAPH-58AB
+ 0x2f858: (0x58ac,), #  CJK COMPATIBILITY IDEOGRAPH-2F858 → CJK UNIFIED IDEOGRAPH-58AC
+ 0xfa7d: (0x58b3,), #  CJK COMPATIBILITY IDEOGRAPH-FA7D → CJK UNIFIED IDEOGRAPH-58B3
+ 0xf94a: (0x58d8,), #  CJK COMPATIBILITY IDEOGRAPH-F94A → CJK UNIFIED IDEOGRAPH-58D8
+ 0xf942: (0x58df,), #  CJK COMPATIBILITY IDEOGRAPH-F942 → CJK UNIFIED IDEOGRAPH-58DF
+ 0x2f859: (0x214e4,), #  CJK COMPATIBILITY IDEOGRAPH-2F859 → CJK UNIFIED IDEOGRAPH-214E4
+ 0x2f851: (0x58ee,), #  CJK COMPATIBILITY IDEOGRAPH-2F851 → CJK UNIFIED IDEOGRAPH-58EE
+ 0x2f85a: (0x58f2,), #  CJK COMPATIBILITY IDEOGRAPH-2F85A → CJK UNIFIED IDEOGRAPH-58F2
+ 0x2f85b: (0x58f7,), #  CJK COMPATIBILITY IDEOGRAPH-2F85B → CJK UNIFIED IDEOGRAPH-58F7
+ 0x2f21: (0x5902,), #  KANGXI RADICAL GO → CJK UNIFIED IDEOGRAPH-5902
+ 0x2f85c: (0x5906,), #  CJK COMPATIBILITY IDEOGRAPH-2F85C → CJK UNIFIED IDEOGRAPH-5906
+ 0x2f22: (0x590a,), #  KANGXI RADICAL GO SLOWLY → CJK UNIFIED IDEOGRAPH-590A
+ 0x30bf: (0x5915,), #  KATAKANA LETTER TA → CJK UNIFIED IDEOGRAPH-5915	# →⼣→
+ 0x2f23: (0x5915,), #  KANGXI RADICAL EVENING → CJK UNIFIED IDEOGRAPH-5915
+ 0x2f85d: (0x591a,), #  CJK COMPATIBILITY IDEOGRAPH-2F85D → CJK UNIFIED IDEOGRAPH-591A
+ 0x2f85e: (0x5922,), #  CJK COMPATIBILITY IDEOGRAPH-2F85E → CJK UNIFIED IDEOGRAPH-5922
+ 0x2f24: (0x5927,), #  KANGXI RADICAL BIG → CJK UNIFIED IDEOGRAPH-5927
+ 0xfa7e: (0x5944,), #  CJK COMPATIBILITY IDEOGRAPH-FA7E → CJK UNIFIED IDEOGRAPH-5944
+ 0xf90c: (0x5948,), #  CJK COMPATIBILITY IDEOGRAPH-F90C → CJK UNIFIED IDEOGRAPH-5948
+ 0xf909: (0x5951,), #  CJK COMPATIBILITY IDEOGRAPH-F909 → CJK UNIFIED IDEOGRAPH-5951
+ 0xfa7f: (0x5954,), #  CJK COMPATIBILITY IDEOGRAPH-FA7F → CJK UNIFIED IDEOGRAPH-5954
+ 0x2f85f: (0x5962,), #  CJK COMPATIBILITY IDEOGRAPH-2F85F → CJK UNIFIED IDEOGRAPH-5962
+ 0xf981: (0x5973,), #  CJK COMPATIBILITY IDEOGRAPH-F981 → CJK UNIFIED IDEOGRAPH-5973
+ 0x2f25: (0x5973,), #  KANGXI RADICAL WOMAN → CJK UNIFIED IDEOGRAPH-5973
+ 0x2f860: (0x216a8,), #  CJK COMPATIBILITY IDEOGRAPH-2F860 → CJK UNIFIED IDEOGRAPH-216A8
+ 0x2f861: (0x216ea,), #  CJK COMPATIBILITY IDEOGRAPH-2F861 → CJK UNIFIED IDEOGRAPH-216EA
+ 0x2f865: (0x59d8,), #  CJK COMPATIBILITY IDEOGRAPH-2F865 → CJK UNIFIED IDEOGRAPH-59D8
+ 0x2f862: (0x59ec,), #  CJK COMPATIBILITY IDEOGRAPH-2F862 → CJK UNIFIED IDEOGRAPH-59EC
+ 0x2f863: (0x5a1b,), #  CJK COMPATIBILITY IDEOGRAPH-2F863 → CJK UNIFIED IDEOGRAPH-5A1B
+ 0x2f864: (0x5a27,), #  CJK COMPATIBILITY IDEOGRAPH-2F864 → CJK UNIFIED IDEOGRAPH-5A27
+ 0xfa80: (0x5a62,), #  CJK COMPATIBILITY IDEOGRAPH-FA80 → CJK UNIFIED IDEOGRAPH-5A62
+ 0x2f866: (0x5a66,), #  CJK COMPATIBILITY IDEOGRAPH-2F866 → CJK UNIFIED IDEOGRAPH-5A66
+ 0x5b00: (0x5aaf,), #  CJK UNIFIED IDEOGRAPH-5B00 → CJK UNIFIED IDEOGRAPH-5AAF
+ 0x2f867: (0x36ee,), #  CJK COMPATIBILITY IDEOGRAPH-2F867 → CJK UNIFIED IDEOGRAPH-36EE
+ 0x2f868: (0x36fc,), #  CJK COMPATIBILITY IDEOGRAPH-2F868 → CJK UNIFIED IDEOGRAPH-36FC
+ 0x2f986: (0x5ab5,), #  CJK COMPATIBILITY IDEOGRAPH-2F986 → CJK UNIFIED IDEOGRAPH-5AB5
+ 0x2f869: (0x5b08,), #  CJK COMPATIBILITY IDEOGRAPH-2F869 → CJK UNIFIED IDEOGRAPH-5B08
+ 0xfa81: (0x5b28,), #  CJK COMPATIBILITY IDEOGRAPH-FA81 → CJK UNIFIED IDEOGRAPH-5B28
+ 0x2f86a: (0x5b3e,), #  CJK COMPATIBILITY IDEOGRAPH-2F86A → CJK UNIFIED IDEOGRAPH-5B3E
+ 0x2f86b: (0x5b3e,), #  CJK COMPATIBILITY IDEOGRAPH-2F86B → CJK UNIFIED IDEOGRAPH-5B3E
+ 0x2f26: (0x5b50,), #  KANGXI RADICAL CHILD → CJK UNIFIED IDEOGRAPH-5B50
+ 0x2f27: (0x5b80,), #  KANGXI RADICAL ROOF → CJK UNIFIED IDEOGRAPH-5B80
+ 0xfa04: (0x5b85,), #  CJK COMPATIBILITY IDEOGRAPH-FA04 → CJK UNIFIED IDEOGRAPH-5B85
+ 0x2f86c: (0x219c8,), #  CJK COMPATIBILITY IDEOGRAPH-2F86C → CJK UNIFIED IDEOGRAPH-219C8
+ 0x2f86d: (0x5bc3,), #  CJK COMPATIBILITY IDEOGRAPH-2F86D → CJK UNIFIED IDEOGRAPH-5BC3
+ 0x2f86e: (0x5bd8,), #  CJK COMPATIBILITY IDEOGRAPH-2F86E → CJK UNIFIED IDEOGRAPH-5BD8
+ 0xf95f: (0x5be7,), #  CJK COMPATIBILITY IDEOGRAPH-F95F → CJK UNIFIED IDEOGRAPH-5BE7
+ 0xf9aa: (0x5be7,), #  CJK COMPATIBILITY IDEOGRAPH-F9AA → CJK UNIFIED IDEOGRAPH-5BE7
+ 0x2f86f: (0x5be7,), #  CJK COMPATIBILITY IDEOGRAPH-2F86F → CJK UNIFIED IDEOGRAPH-5BE7
+ 0xf9bc: (0x5bee,), #  CJK COMPATIBILITY IDEOGRAPH-F9BC → CJK UNIFIED IDEOGRAPH-5BEE
+ 0x2f870: (0x5bf3,), #  CJK COMPATIBILITY IDEOGRAPH-2F870 → CJK UNIFIED IDEOGRAPH-5BF3
+ 0x2f871: (0x21b18,), #  CJK COMPATIBILITY IDEOGRAPH-2F871 → CJK UNIFIED IDEOGRAPH-21B18
+ 0x2f28: (0x5bf8,), #  KANGXI RADICAL INCH → CJK UNIFIED IDEOGRAPH-5BF8
+ 0x2f872: (0x5bff,), #  CJK COMPATIBILITY IDEOGRAPH-2F872 → CJK UNIFIED IDEOGRAPH-5BFF
+ 0x2f873: (0x5c06,), #  CJK COMPATIBILITY IDEOGRAPH-2F873 → CJK UNIFIED IDEOGRAPH-5C06
+ 0x2f29: (0x5c0f,), #  KANGXI RADICAL SMALL → CJK UNIFIED IDEOGRAPH-5C0F
+ 0x2f875: (0x5c22,), #  CJK COMPATIBILITY IDEOGRAPH-2F875 → CJK UNIFIED IDEOGRAPH-5C22
+ 0x2e90: (0x5c22,), #  CJK RADICAL LAME THREE → CJK UNIFIED IDEOGRAPH-5C22
+ 0x2f2a: (0x5c22,), #  KANGXI RADICAL LAME → CJK UNIFIED IDEOGRAPH-5C22
+ 0x2e8f: (0x5c23,), #  CJK RADICAL LAME TWO → CJK UNIFIED IDEOGRAPH-5C23
+ 0x2f876: (0x3781,), #  CJK COMPATIBILITY IDEOGRAPH-2F876 → CJK UNIFIED IDEOGRAPH-3781
+ 0x2f2b: (0x5c38,), #  KANGXI RADICAL CORPSE → CJK UNIFIED IDEOGRAPH-5C38
+ 0xf9bd: (0x5c3f,), #  CJK COMPATIBILITY IDEOGRAPH-F9BD → CJK UNIFIED IDEOGRAPH-5C3F
+ 0x2f877: (0x5c60,), #  CJK COMPATIBILITY IDEOGRAPH-2F877 → CJK UNIFIED IDEOGRAPH-5C60
+ 0xf94b: (0x5c62,), #  CJK COMPATIBILITY IDEOGRAPH-F94B → CJK UNIFIED IDEOGRAPH-5C62
+ 0xfa3b: (0x5c64,), #  CJK COMPATIBILITY IDEOGRAPH-FA3B → CJK UNIFIED IDEOGRAPH-5C64
+ 0xf9df: (0x5c65,), #  CJK COMPATIBILITY IDEOGRAPH-F9DF → CJK UNIFIED IDEOGRAPH-5C65
+ 0xfa3c: (0x5c6e,), #  CJK COMPATIBILITY IDEOGRAPH-FA3C → CJK UNIFIED IDEOGRAPH-5C6E
+ 0x2f878: (0x5c6e,), #  CJK COMPATIBILITY IDEOGRAPH-2F878 → CJK UNIFIED IDEOGRAPH-5C6E
+ 0x2f2c: (0x5c6e,), #  KANGXI RADICAL SPROUT → CJK UNIFIED IDEOGRAPH-5C6E
+ 0x2f8f8: (0x21d0b,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F8 → CJK UNIFIED IDEOGRAPH-21D0B
+ 0x2f2d: (0x5c71,), #  KANGXI RADICAL MOUNTAIN → CJK UNIFIED IDEOGRAPH-5C71
+ 0x2f879: (0x5cc0,), #  CJK COMPATIBILITY IDEOGRAPH-2F879 → CJK UNIFIED IDEOGRAPH-5CC0
+ 0x2f87a: (0x5c8d,), #  CJK COMPATIBILITY IDEOGRAPH-2F87A → CJK UNIFIED IDEOGRAPH-5C8D
+ 0x2f87b: (0x21de4,), #  CJK COMPATIBILITY IDEOGRAPH-2F87B → CJK UNIFIED IDEOGRAPH-21DE4
+ 0x2f87d: (0x21de6,), #  CJK COMPATIBILITY IDEOGRAPH-2F87D → CJK UNIFIED IDEOGRAPH-21DE6
+ 0xf9d5: (0x5d19,), #  CJK COMPATIBILITY IDEOGRAPH-F9D5 → CJK UNIFIED IDEOGRAPH-5D19
+ 0x2f87c: (0x5d43,), #  CJK COMPATIBILITY IDEOGRAPH-2F87C → CJK UNIFIED IDEOGRAPH-5D43
+ 0xf921: (0x5d50,), #  CJK COMPATIBILITY IDEOGRAPH-F921 → CJK UNIFIED IDEOGRAPH-5D50
+ 0x2f87f: (0x5d6b,), #  CJK COMPATIBILITY IDEOGRAPH-2F87F → CJK UNIFIED IDEOGRAPH-5D6B
+ 0x2f87e: (0x5d6e,), #  CJK COMPATIBILITY IDEOGRAPH-2F87E → CJK UNIFIED IDEOGRAPH-5D6E
+ 0x2f880: (0x5d7c,), #  CJK COMPATIBILITY IDEOGRAPH-2F880 → CJK UNIFIED IDEOGRAPH-5D7C
+ 0x2f9f4: (0x5db2,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F4 → CJK UNIFIED IDEOGRAPH-5DB2
+ 0xf9ab: (0x5dba,), #  CJK COMPATIBILITY IDEOGRAPH-F9AB → CJK UNIFIED IDEOGRAPH-5DBA
+ 0x2f2e: (0x5ddb,), #  KANGXI RADICAL RIVER → CJK UNIFIED IDEOGRAPH-5DDB
+ 0x2f882: (0x5de2,), #  CJK COMPATIBILITY IDEOGRAPH-2F882 → CJK UNIFIED IDEOGRAPH-5DE2
+ 0x30a8: (0x5de5,), #  KATAKANA LETTER E → CJK UNIFIED IDEOGRAPH-5DE5	# →⼯→
+ 0x2f2f: (0x5de5,), #  KANGXI RADICAL WORK → CJK UNIFIED IDEOGRAPH-5DE5
+ 0x2f30: (0x5df1,), #  KANGXI RADICAL ONESELF → CJK UNIFIED IDEOGRAPH-5DF1
+ 0x2e92: (0x5df3,), #  CJK RADICAL SNAKE → CJK UNIFIED IDEOGRAPH-5DF3
+ 0x2f883: (0x382f,), #  CJK COMPATIBILITY IDEOGRAPH-2F883 → CJK UNIFIED IDEOGRAPH-382F
+ 0x2f884: (0x5dfd,), #  CJK COMPATIBILITY IDEOGRAPH-2F884 → CJK UNIFIED IDEOGRAPH-5DFD
+ 0x2f31: (0x5dfe,), #  KANGXI RADICAL TURBAN → CJK UNIFIED IDEOGRAPH-5DFE
+ 0x5e32: (0x5e21,), #  CJK UNIFIED IDEOGRAPH-5E32 → CJK UNIFIED IDEOGRAPH-5E21
+ 0x2f885: (0x5e28,), #  CJK COMPATIBILITY IDEOGRAPH-2F885 → CJK UNIFIED IDEOGRAPH-5E28
+ 0x2f886: (0x5e3d,), #  CJK COMPATIBILITY IDEOGRAPH-2F886 → CJK UNIFIED IDEOGRAPH-5E3D
+ 0x2f887: (0x5e69,), #  CJK COMPATIBILITY IDEOGRAPH-2F887 → CJK UNIFIED IDEOGRAPH-5E69
+ 0x2f888: (0x3862,), #  CJK COMPATIBILITY IDEOGRAPH-2F888 → CJK UNIFIED IDEOGRAPH-3862
+ 0x2f889: (0x22183,), #  CJK COMPATIBILITY IDEOGRAPH-2F889 → CJK UNIFIED IDEOGRAPH-22183
+ 0x2f32: (0x5e72,), #  KANGXI RADICAL DRY → CJK UNIFIED IDEOGRAPH-5E72
+ 0xf98e: (0x5e74,), #  CJK COMPATIBILITY IDEOGRAPH-F98E → CJK UNIFIED IDEOGRAPH-5E74
+ 0x2f939: (0x2219f,), #  CJK COMPATIBILITY IDEOGRAPH-2F939 → CJK UNIFIED IDEOGRAPH-2219F
+ 0x2e93: (0x5e7a,), #  CJK RADICAL THREAD → CJK UNIFIED IDEOGRAPH-5E7A
+ 0x2f33: (0x5e7a,), #  KANGXI RADICAL SHORT THREAD → CJK UNIFIED IDEOGRAPH-5E7A
+ 0x2f34: (0x5e7f,), #  KANGXI RADICAL DOTTED CLIFF → CJK UNIFIED IDEOGRAPH-5E7F
+ 0xfa01: (0x5ea6,), #  CJK COMPATIBILITY IDEOGRAPH-FA01 → CJK UNIFIED IDEOGRAPH-5EA6
+ 0x2f88a: (0x387c,), #  CJK COMPATIBILITY IDEOGRAPH-2F88A → CJK UNIFIED IDEOGRAPH-387C
+ 0x2f88b: (0x5eb0,), #  CJK COMPATIBILITY IDEOGRAPH-2F88B → CJK UNIFIED IDEOGRAPH-5EB0
+ 0x2f88c: (0x5eb3,), #  CJK COMPATIBILITY IDEOGRAPH-2F88C → CJK UNIFIED IDEOGRAPH-5EB3
+ 0x2f88d: (0x5eb6,), #  CJK COMPATIBILITY IDEOGRAPH-2F88D → CJK UNIFIED IDEOGRAPH-5EB6
+ 0xf928: (0x5eca,), #  CJK COMPATIBILITY IDEOGRAPH-F928 → CJK UNIFIED IDEOGRAPH-5ECA
+ 0x2f88e: (0x5eca,), #  CJK COMPATIBILITY IDEOGRAPH-2F88E → CJK UNIFIED IDEOGRAPH-5ECA
+ 0xf9a2: (0x5ec9,), #  CJK COMPATIBILITY IDEOGRAPH-F9A2 → CJK UNIFIED IDEOGRAPH-5EC9
+ 0xfa82: (0x5ed2,), #  CJK COMPATIBILITY IDEOGRAPH-FA82 → CJK UNIFIED IDEOGRAPH-5ED2
+ 0xfa0b: (0x5ed3,), #  CJK COMPATIBILITY IDEOGRAPH-FA0B → CJK UNIFIED IDEOGRAPH-5ED3
+ 0xfa83: (0x5ed9,), #  CJK COMPATIBILITY IDEOGRAPH-FA83 → CJK UNIFIED IDEOGRAPH-5ED9
+ 0xf982: (0x5eec,), #  CJK COMPATIBILITY IDEOGRAPH-F982 → CJK UNIFIED IDEOGRAPH-5EEC
+ 0x2f35: (0x5ef4,), #  KANGXI RADICAL LONG STRIDE → CJK UNIFIED IDEOGRAPH-5EF4
+ 0x2f890: (0x5efe,), #  CJK COMPATIBILITY IDEOGRAPH-2F890 → CJK UNIFIED IDEOGRAPH-5EFE
+ 0x2f36: (0x5efe,), #  KANGXI RADICAL TWO HANDS → CJK UNIFIED IDEOGRAPH-5EFE
+ 0x2f891: (0x22331,), #  CJK COMPATIBILITY IDEOGRAPH-2F891 → CJK UNIFIED IDEOGRAPH-22331
+ 0x2f892: (0x22331,), #  CJK COMPATIBILITY IDEOGRAPH-2F892 → CJK UNIFIED IDEOGRAPH-22331
+ 0xf943: (0x5f04,), #  CJK COMPATIBILITY IDEOGRAPH-F943 → CJK UNIFIED IDEOGRAPH-5F04
+ 0x2f37: (0x5f0b,), #  KANGXI RADICAL SHOOT → CJK UNIFIED IDEOGRAPH-5F0B
+ 0x2f38: (0x5f13,), #  KANGXI RADICAL BOW → CJK UNIFIED IDEOGRAPH-5F13
+ 0x2f894: (0x5f22,), #  CJK COMPATIBILITY IDEOGRAPH-2F894 → CJK UNIFIED IDEOGRAPH-5F22
+ 0x2f895: (0x5f22,), #  CJK COMPATIBILITY IDEOGRAPH-2F895 → CJK UNIFIED IDEOGRAPH-5F22
+ 0x2f39: (0x5f50,), #  KANGXI RADICAL SNOUT → CJK UNIFIED IDEOGRAPH-5F50
+ 0x2e94: (0x5f51,), #  CJK RADICAL SNOUT ONE → CJK UNIFIED IDEOGRAPH-5F51
+ 0x2f874: (0x5f53,), #  CJK COMPATIBILITY IDEOGRAPH-2F874 → CJK UNIFIED IDEOGRAPH-5F53
+ 0x2f896: (0x38c7,), #  CJK COMPATIBILITY IDEOGRAPH-2F896 → CJK UNIFIED IDEOGRAPH-38C7
+ 0x2f3a: (0x5f61,), #  KANGXI RADICAL BRISTLE → CJK UNIFIED IDEOGRAPH-5F61
+ 0x2f899: (0x5f62,), #  CJK COMPATIBILITY IDEOGRAPH-2F899 → CJK UNIFIED IDEOGRAPH-5F62
+ 0xfa84: (0x5f69,), #  CJK COMPATIBILITY IDEOGRAPH-FA84 → CJK UNIFIED IDEOGRAPH-5F69
+ 0x2f89a: (0x5f6b,), #  CJK COMPATIBILITY IDEOGRAPH-2F89A → CJK UNIFIED IDEOGRAPH-5F6B
+ 0x2f3b: (0x5f73,), #  KANGXI RADICAL STEP → CJK UNIFIED IDEOGRAPH-5F73
+ 0xf9d8: (0x5f8b,), #  CJK COMPATIBILITY IDEOGRAPH-F9D8 → CJK UNIFIED IDEOGRAPH-5F8B
+ 0x2f89b: (0x38e3,), #  CJK COMPATIBILITY IDEOGRAPH-2F89B → CJK UNIFIED IDEOGRAPH-38E3
+ 0x2f89c: (0x5f9a,), #  CJK COMPATIBILITY IDEOGRAPH-2F89C → CJK UNIFIED IDEOGRAPH-5F9A
+ 0xf966: (0x5fa9,), #  CJK COMPATIBILITY IDEOGRAPH-F966 → CJK UNIFIED IDEOGRAPH-5FA9
+ 0xfa85: (0x5fad,), #  CJK COMPATIBILITY IDEOGRAPH-FA85 → CJK UNIFIED IDEOGRAPH-5FAD
+ 0x2f3c: (0x5fc3,), #  KANGXI RADICAL HEART → CJK UNIFIED IDEOGRAPH-5FC3
+ 0x2e96: (0x5fc4,), #  CJK RADICAL HEART ONE → CJK UNIFIED IDEOGRAPH-5FC4
+ 0x2e97: (0x38fa,), #  CJK RADICAL HEART TWO → CJK UNIFIED IDEOGRAPH-38FA
+ 0x2f89d: (0x5fcd,), #  CJK COMPATIBILITY IDEOGRAPH-2F89D → CJK UNIFIED IDEOGRAPH-5FCD
+ 0x2f89e: (0x5fd7,), #  CJK COMPATIBILITY IDEOGRAPH-2F89E → CJK UNIFIED IDEOGRAPH-5FD7
+ 0xf9a3: (0x5ff5,), #  CJK COMPATIBILITY IDEOGRAPH-F9A3 → CJK UNIFIED IDEOGRAPH-5FF5
+ 0x2f89f: (0x5ff9,), #  CJK COMPATIBILITY IDEOGRAPH-2F89F → CJK UNIFIED IDEOGRAPH-5FF9
+ 0xf960: (0x6012,), #  CJK COMPATIBILITY IDEOGRAPH-F960 → CJK UNIFIED IDEOGRAPH-6012
+ 0xf9ac: (0x601c,), #  CJK COMPATIBILITY IDEOGRAPH-F9AC → CJK UNIFIED IDEOGRAPH-601C
+ 0xfa6b: (0x6075,), #  CJK COMPATIBILITY IDEOGRAPH-FA6B → CJK UNIFIED IDEOGRAPH-6075
+ 0x2f8a2: (0x391c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A2 → CJK UNIFIED IDEOGRAPH-391C
+ 0x2f8a1: (0x393a,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A1 → CJK UNIFIED IDEOGRAPH-393A
+ 0x2f8a0: (0x6081,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A0 → CJK UNIFIED IDEOGRAPH-6081
+ 0xfa3d: (0x6094,), #  CJK COMPATIBILITY IDEOGRAPH-FA3D → CJK UNIFIED IDEOGRAPH-6094
+ 0x2f8a3: (0x6094,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A3 → CJK UNIFIED IDEOGRAPH-6094
+ 0x2f8a5: (0x60c7,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A5 → CJK UNIFIED IDEOGRAPH-60C7
+ 0xfa86: (0x60d8,), #  CJK COMPATIBILITY IDEOGRAPH-FA86 → CJK UNIFIED IDEOGRAPH-60D8
+ 0xf9b9: (0x60e1,), #  CJK COMPATIBILITY IDEOGRAPH-F9B9 → CJK UNIFIED IDEOGRAPH-60E1
+ 0x2f8a4: (0x226d4,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A4 → CJK UNIFIED IDEOGRAPH-226D4
+ 0xfa88: (0x6108,), #  CJK COMPATIBILITY IDEOGRAPH-FA88 → CJK UNIFIED IDEOGRAPH-6108
+ 0xfa3e: (0x6168,), #  CJK COMPATIBILITY IDEOGRAPH-FA3E → CJK UNIFIED IDEOGRAPH-6168
+ 0xf9d9: (0x6144,), #  CJK COMPATIBILITY IDEOGRAPH-F9D9 → CJK UNIFIED IDEOGRAPH-6144
+ 0x2f8a6: (0x6148,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A6 → CJK UNIFIED IDEOGRAPH-6148
+ 0x2f8a7: (0x614c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A7 → CJK UNIFIED IDEOGRAPH-614C
+ 0x2f8a9: (0x614c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A9 → CJK UNIFIED IDEOGRAPH-614C
+ 0xfa87: (0x614e,), #  CJK COMPATIBILITY IDEOGRAPH-FA87 → CJK UNIFIED IDEOGRAPH-614E
+ 0x2f8a8: (0x614e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8A8 → CJK UNIFIED IDEOGRAPH-614E
+ 0xfa8a: (0x6160,), #  CJK COMPATIBILITY IDEOGRAPH-FA8A → CJK UNIFIED IDEOGRAPH-6160
+ 0x2f8aa: (0x617a,), #  CJK COMPATIBILITY IDEOGRAPH-2F8AA → CJK UNIFIED IDEOGRAPH-617A
+ 0xfa3f: (0x618e,), #  CJK COMPATIBILITY IDEOGRAPH-FA3F → CJK UNIFIED IDEOGRAPH-618E
+ 0xfa89: (0x618e,), #  CJK COMPATIBILITY IDEOGRAPH-FA89 → CJK UNIFIED IDEOGRAPH-618E
+ 0x2f8ab: (0x618e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8AB → CJK UNIFIED IDEOGRAPH-618E
+ 0xf98f: (0x6190,), #  CJK COMPATIBILITY IDEOGRAPH-F98F → CJK UNIFIED IDEOGRAPH-6190
+ 0x2f8ad: (0x61a4,), #  CJK COMPATIBILITY IDEOGRAPH-2F8AD → CJK UNIFIED IDEOGRAPH-61A4
+ 0x2f8ae: (0x61af,), #  CJK COMPATIBILITY IDEOGRAPH-2F8AE → CJK UNIFIED IDEOGRAPH-61AF
+ 0x2f8ac: (0x61b2,), #  CJK COMPATIBILITY IDEOGRAPH-2F8AC → CJK UNIFIED IDEOGRAPH-61B2
+ 0xfad0: (0x22844,), #  CJK COMPATIBILITY IDEOGRAPH-FAD0 → CJK UNIFIED IDEOGRAPH-22844
+ 0xfacf: (0x2284a,), #  CJK COMPATIBILITY IDEOGRAPH-FACF → CJK UNIFIED IDEOGRAPH-2284A
+ 0x2f8af: (0x61de,), #  CJK COMPATIBILITY IDEOGRAPH-2F8AF → CJK UNIFIED IDEOGRAPH-61DE
+ 0xfa40: (0x61f2,), #  CJK COMPATIBILITY IDEOGRAPH-FA40 → CJK UNIFIED IDEOGRAPH-61F2
+ 0xfa8b: (0x61f2,), #  CJK COMPATIBILITY IDEOGRAPH-FA8B → CJK UNIFIED IDEOGRAPH-61F2
+ 0x2f8b0: (0x61f2,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B0 → CJK UNIFIED IDEOGRAPH-61F2
+ 0xf90d: (0x61f6,), #  CJK COMPATIBILITY IDEOGRAPH-F90D → CJK UNIFIED IDEOGRAPH-61F6
+ 0x2f8b1: (0x61f6,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B1 → CJK UNIFIED IDEOGRAPH-61F6
+ 0xf990: (0x6200,), #  CJK COMPATIBILITY IDEOGRAPH-F990 → CJK UNIFIED IDEOGRAPH-6200
+ 0x2f3d: (0x6208,), #  KANGXI RADICAL HALBERD → CJK UNIFIED IDEOGRAPH-6208
+ 0x2f8b2: (0x6210,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B2 → CJK UNIFIED IDEOGRAPH-6210
+ 0x2f8b3: (0x621b,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B3 → CJK UNIFIED IDEOGRAPH-621B
+ 0xf9d2: (0x622e,), #  CJK COMPATIBILITY IDEOGRAPH-F9D2 → CJK UNIFIED IDEOGRAPH-622E
+ 0xfa8c: (0x6234,), #  CJK COMPATIBILITY IDEOGRAPH-FA8C → CJK UNIFIED IDEOGRAPH-6234
+ 0x2f3e: (0x6236,), #  KANGXI RADICAL DOOR → CJK UNIFIED IDEOGRAPH-6236
+ 0x6238: (0x6236,), #  CJK UNIFIED IDEOGRAPH-6238 → CJK UNIFIED IDEOGRAPH-6236	# →⼾→
+ 0x2f3f: (0x624b,), #  KANGXI RADICAL HAND → CJK UNIFIED IDEOGRAPH-624B
+ 0x2e98: (0x624c,), #  CJK RADICAL HAND → CJK UNIFIED IDEOGRAPH-624C
+ 0x2f8b4: (0x625d,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B4 → CJK UNIFIED IDEOGRAPH-625D
+ 0x2f8b5: (0x62b1,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B5 → CJK UNIFIED IDEOGRAPH-62B1
+ 0xf925: (0x62c9,), #  CJK COMPATIBILITY IDEOGRAPH-F925 → CJK UNIFIED IDEOGRAPH-62C9
+ 0xf95b: (0x62cf,), #  CJK COMPATIBILITY IDEOGRAPH-F95B → CJK UNIFIED IDEOGRAPH-62CF
+ 0xfa02: (0x62d3,), #  CJK COMPATIBILITY IDEOGRAPH-FA02 → CJK UNIFIED IDEOGRAPH-62D3
+ 0x2f8b6: (0x62d4,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B6 → CJK UNIFIED IDEOGRAPH-62D4
+ 0x2f8ba: (0x62fc,), #  CJK COMPATIBILITY IDEOGRAPH-2F8BA → CJK UNIFIED IDEOGRAPH-62FC
+ 0xf973: (0x62fe,), #  CJK COMPATIBILITY IDEOGRAPH-F973 → CJK UNIFIED IDEOGRAPH-62FE
+ 0x2f8b8: (0x22b0c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B8 → CJK UNIFIED IDEOGRAPH-22B0C
+ 0x2f8b9: (0x633d,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B9 → CJK UNIFIED IDEOGRAPH-633D
+ 0x2f8b7: (0x6350,), #  CJK COMPATIBILITY IDEOGRAPH-2F8B7 → CJK UNIFIED IDEOGRAPH-6350
+ 0x2f8bb: (0x6368,), #  CJK COMPATIBILITY IDEOGRAPH-2F8BB → CJK UNIFIED IDEOGRAPH-6368
+ 0xf9a4: (0x637b,), #  CJK COMPATIBILITY IDEOGRAPH-F9A4 → CJK UNIFIED IDEOGRAPH-637B
+ 0x2f8bc: (0x6383,), #  CJK COMPATIBILITY IDEOGRAPH-2F8BC → CJK UNIFIED IDEOGRAPH-6383
+ 0xf975: (0x63a0,), #  CJK COMPATIBILITY IDEOGRAPH-F975 → CJK UNIFIED IDEOGRAPH-63A0
+ 0x2f8c1: (0x63a9,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C1 → CJK UNIFIED IDEOGRAPH-63A9
+ 0xfa8d: (0x63c4,), #  CJK COMPATIBILITY IDEOGRAPH-FA8D → CJK UNIFIED IDEOGRAPH-63C4
+ 0x2f8bd: (0x63e4,), #  CJK COMPATIBILITY IDEOGRAPH-2F8BD → CJK UNIFIED IDEOGRAPH-63E4
+ 0xfa8f: (0x6452,), #  CJK COMPATIBILITY IDEOGRAPH-FA8F → CJK UNIFIED IDEOGRAPH-6452
+ 0x2f8be: (0x22bf1,), #  CJK COMPATIBILITY IDEOGRAPH-2F8BE → CJK UNIFIED IDEOGRAPH-22BF1
+ 0xfa8e: (0x641c,), #  CJK COMPATIBILITY IDEOGRAPH-FA8E → CJK UNIFIED IDEOGRAPH-641C
+ 0x2f8bf: (0x6422,), #  CJK COMPATIBILITY IDEOGRAPH-2F8BF → CJK UNIFIED IDEOGRAPH-6422
+ 0x2f8c0: (0x63c5,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C0 → CJK UNIFIED IDEOGRAPH-63C5
+ 0x2f8c3: (0x6469,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C3 → CJK UNIFIED IDEOGRAPH-6469
+ 0x2f8c6: (0x6477,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C6 → CJK UNIFIED IDEOGRAPH-6477
+ 0x2f8c4: (0x647e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C4 → CJK UNIFIED IDEOGRAPH-647E
+ 0x2f8c2: (0x3a2e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C2 → CJK UNIFIED IDEOGRAPH-3A2E
+ 0x6409: (0x3a41,), #  CJK UNIFIED IDEOGRAPH-6409 → CJK UNIFIED IDEOGRAPH-3A41
+ 0xf991: (0x649a,), #  CJK COMPATIBILITY IDEOGRAPH-F991 → CJK UNIFIED IDEOGRAPH-649A
+ 0x2f8c5: (0x649d,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C5 → CJK UNIFIED IDEOGRAPH-649D
+ 0xf930: (0x64c4,), #  CJK COMPATIBILITY IDEOGRAPH-F930 → CJK UNIFIED IDEOGRAPH-64C4
+ 0x2f8c7: (0x3a6c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C7 → CJK UNIFIED IDEOGRAPH-3A6C
+ 0x2f40: (0x652f,), #  KANGXI RADICAL BRANCH → CJK UNIFIED IDEOGRAPH-652F
+ 0x2f41: (0x6534,), #  KANGXI RADICAL RAP → CJK UNIFIED IDEOGRAPH-6534
+ 0x2e99: (0x6535,), #  CJK RADICAL RAP → CJK UNIFIED IDEOGRAPH-6535
+ 0xfa41: (0x654f,), #  CJK COMPATIBILITY IDEOGRAPH-FA41 → CJK UNIFIED IDEOGRAPH-654F
+ 0x2f8c8: (0x654f,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C8 → CJK UNIFIED IDEOGRAPH-654F
+ 0xfa90: (0x6556,), #  CJK COMPATIBILITY IDEOGRAPH-FA90 → CJK UNIFIED IDEOGRAPH-6556
+ 0x2f8c9: (0x656c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8C9 → CJK UNIFIED IDEOGRAPH-656C
+ 0xf969: (0x6578,), #  CJK COMPATIBILITY IDEOGRAPH-F969 → CJK UNIFIED IDEOGRAPH-6578
+ 0x2f8ca: (0x2300a,), #  CJK COMPATIBILITY IDEOGRAPH-2F8CA → CJK UNIFIED IDEOGRAPH-2300A
+ 0x2f42: (0x6587,), #  KANGXI RADICAL SCRIPT → CJK UNIFIED IDEOGRAPH-6587
+ 0x2eeb: (0x6589,), #  CJK RADICAL J-SIMPLIFIED EVEN → CJK UNIFIED IDEOGRAPH-6589
+ 0x2f43: (0x6597,), #  KANGXI RADICAL DIPPER → CJK UNIFIED IDEOGRAPH-6597
+ 0xf9be: (0x6599,), #  CJK COMPATIBILITY IDEOGRAPH-F9BE → CJK UNIFIED IDEOGRAPH-6599
+ 0x2f44: (0x65a4,), #  KANGXI RADICAL AXE → CJK UNIFIED IDEOGRAPH-65A4
+ 0x2f45: (0x65b9,), #  KANGXI RADICAL SQUARE → CJK UNIFIED IDEOGRAPH-65B9
+ 0xf983: (0x65c5,), #  CJK COMPATIBILITY IDEOGRAPH-F983 → CJK UNIFIED IDEOGRAPH-65C5
+ 0x2f46: (0x65e0,), #  KANGXI RADICAL NOT → CJK UNIFIED IDEOGRAPH-65E0
+ 0x2e9b: (0x65e1,), #  CJK RADICAL CHOKE → CJK UNIFIED IDEOGRAPH-65E1
+ 0xfa42: (0x65e2,), #  CJK COMPATIBILITY IDEOGRAPH-FA42 → CJK UNIFIED IDEOGRAPH-65E2
+ 0x2f8cb: (0x65e3,), #  CJK COMPATIBILITY IDEOGRAPH-2F8CB → CJK UNIFIED IDEOGRAPH-65E3
+ 0x2f47: (0x65e5,), #  KANGXI RADICAL SUN → CJK UNIFIED IDEOGRAPH-65E5
+ 0xf9e0: (0x6613,), #  CJK COMPATIBILITY IDEOGRAPH-F9E0 → CJK UNIFIED IDEOGRAPH-6613
+ 0x66f6: (0x3ada,), #  CJK UNIFIED IDEOGRAPH-66F6 → CJK UNIFIED IDEOGRAPH-3ADA
+ 0x2f8d1: (0x3ae4,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D1 → CJK UNIFIED IDEOGRAPH-3AE4
+ 0x2f8cd: (0x6649,), #  CJK COMPATIBILITY IDEOGRAPH-2F8CD → CJK UNIFIED IDEOGRAPH-6649
+ 0x6669: (0x665a,), #  CJK UNIFIED IDEOGRAPH-6669 → CJK UNIFIED IDEOGRAPH-665A
+ 0xfa12: (0x6674,), #  CJK COMPATIBILITY IDEOGRAPH-FA12 → CJK UNIFIED IDEOGRAPH-6674
+ 0xfa91: (0x6674,), #  CJK COMPATIBILITY IDEOGRAPH-FA91 → CJK UNIFIED IDEOGRAPH-6674
+ 0xfa43: (0x6691,), #  CJK COMPATIBILITY IDEOGRAPH-FA43 → CJK UNIFIED IDEOGRAPH-6691
+ 0x2f8cf: (0x6691,), #  CJK COMPATIBILITY IDEOGRAPH-2F8CF → CJK UNIFIED IDEOGRAPH-6691
+ 0xf9c5: (0x6688,), #  CJK COMPATIBILITY IDEOGRAPH-F9C5 → CJK UNIFIED IDEOGRAPH-6688
+ 0x2f8d0: (0x3b08,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D0 → CJK UNIFIED IDEOGRAPH-3B08
+ 0x2f8d5: (0x669c,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D5 → CJK UNIFIED IDEOGRAPH-669C
+ 0xfa06: (0x66b4,), #  CJK COMPATIBILITY IDEOGRAPH-FA06 → CJK UNIFIED IDEOGRAPH-66B4
+ 0xf98b: (0x66c6,), #  CJK COMPATIBILITY IDEOGRAPH-F98B → CJK UNIFIED IDEOGRAPH-66C6
+ 0x2f8ce: (0x3b19,), #  CJK COMPATIBILITY IDEOGRAPH-2F8CE → CJK UNIFIED IDEOGRAPH-3B19
+ 0x2f897: (0x232b8,), #  CJK COMPATIBILITY IDEOGRAPH-2F897 → CJK UNIFIED IDEOGRAPH-232B8
+ 0x2f48: (0x66f0,), #  KANGXI RADICAL SAY → CJK UNIFIED IDEOGRAPH-66F0
+ 0xf901: (0x66f4,), #  CJK COMPATIBILITY IDEOGRAPH-F901 → CJK UNIFIED IDEOGRAPH-66F4
+ 0x2f8cc: (0x66f8,), #  CJK COMPATIBILITY IDEOGRAPH-2F8CC → CJK UNIFIED IDEOGRAPH-66F8
+ 0x2f49: (0x6708,), #  KANGXI RADICAL MOON → CJK UNIFIED IDEOGRAPH-6708
+ 0x2f980: (0x2335f,), #  CJK COMPATIBILITY IDEOGRAPH-2F980 → CJK UNIFIED IDEOGRAPH-2335F
+ 0x80a6: (0x670c,), #  CJK UNIFIED IDEOGRAPH-80A6 → CJK UNIFIED IDEOGRAPH-670C
+ 0x80d0: (0x670f,), #  CJK UNIFIED IDEOGRAPH-80D0 → CJK UNIFIED IDEOGRAPH-670F
+ 0x80ca: (0x6710,), #  CJK UNIFIED IDEOGRAPH-80CA → CJK UNIFIED IDEOGRAPH-6710
+ 0x8101: (0x6713,), #  CJK UNIFIED IDEOGRAPH-8101 → CJK UNIFIED IDEOGRAPH-6713
+ 0x80f6: (0x3b35,), #  CJK UNIFIED IDEOGRAPH-80F6 → CJK UNIFIED IDEOGRAPH-3B35
+ 0xf929: (0x6717,), #  CJK COMPATIBILITY IDEOGRAPH-F929 → CJK UNIFIED IDEOGRAPH-6717
+ 0xfa92: (0x6717,), #  CJK COMPATIBILITY IDEOGRAPH-FA92 → CJK UNIFIED IDEOGRAPH-6717
+ 0x2f8d8: (0x6717,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D8 → CJK UNIFIED IDEOGRAPH-6717
+ 0x8127: (0x6718,), #  CJK UNIFIED IDEOGRAPH-8127 → CJK UNIFIED IDEOGRAPH-6718
+ 0xfa93: (0x671b,), #  CJK COMPATIBILITY IDEOGRAPH-FA93 → CJK UNIFIED IDEOGRAPH-671B
+ 0x2f8d9: (0x671b,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D9 → CJK UNIFIED IDEOGRAPH-671B
+ 0x2f8da: (0x6721,), #  CJK COMPATIBILITY IDEOGRAPH-2F8DA → CJK UNIFIED IDEOGRAPH-6721
+ 0x5e50: (0x3b3a,), #  CJK UNIFIED IDEOGRAPH-5E50 → CJK UNIFIED IDEOGRAPH-3B3A
+ 0x4420: (0x3b3b,), #  CJK UNIFIED IDEOGRAPH-4420 → CJK UNIFIED IDEOGRAPH-3B3B
+ 0x2f989: (0x23393,), #  CJK COMPATIBILITY IDEOGRAPH-2F989 → CJK UNIFIED IDEOGRAPH-23393
+ 0x81a7: (0x6723,), #  CJK UNIFIED IDEOGRAPH-81A7 → CJK UNIFIED IDEOGRAPH-6723
+ 0x2f98a: (0x2339c,), #  CJK COMPATIBILITY IDEOGRAPH-2F98A → CJK UNIFIED IDEOGRAPH-2339C
+ 0x2f4a: (0x6728,), #  KANGXI RADICAL TREE → CJK UNIFIED IDEOGRAPH-6728
+ 0xf9e1: (0x674e,), #  CJK COMPATIBILITY IDEOGRAPH-F9E1 → CJK UNIFIED IDEOGRAPH-674E
+ 0x2f8dc: (0x6753,), #  CJK COMPATIBILITY IDEOGRAPH-2F8DC → CJK UNIFIED IDEOGRAPH-6753
+ 0xfa94: (0x6756,), #  CJK COMPATIBILITY IDEOGRAPH-FA94 → CJK UNIFIED IDEOGRAPH-6756
+ 0x2f8db: (0x675e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8DB → CJK UNIFIED IDEOGRAPH-675E
+ 0x2f8dd: (0x233c3,), #  CJK COMPATIBILITY IDEOGRAPH-2F8DD → CJK UNIFIED IDEOGRAPH-233C3
+ 0x67ff: (0x676e,), #  CJK UNIFIED IDEOGRAPH-67FF → CJK UNIFIED IDEOGRAPH-676E
+ 0xf9c8: (0x677b,), #  CJK COMPATIBILITY IDEOGRAPH-F9C8 → CJK UNIFIED IDEOGRAPH-677B
+ 0x2f8e0: (0x6785,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E0 → CJK UNIFIED IDEOGRAPH-6785
+ 0xf9f4: (0x6797,), #  CJK COMPATIBILITY IDEOGRAPH-F9F4 → CJK UNIFIED IDEOGRAPH-6797
+ 0x2f8de: (0x3b49,), #  CJK COMPATIBILITY IDEOGRAPH-2F8DE → CJK UNIFIED IDEOGRAPH-3B49
+ 0xfad1: (0x233d5,), #  CJK COMPATIBILITY IDEOGRAPH-FAD1 → CJK UNIFIED IDEOGRAPH-233D5
+ 0xf9c9: (0x67f3,), #  CJK COMPATIBILITY IDEOGRAPH-F9C9 → CJK UNIFIED IDEOGRAPH-67F3
+ 0x2f8df: (0x67fa,), #  CJK COMPATIBILITY IDEOGRAPH-2F8DF → CJK UNIFIED IDEOGRAPH-67FA
+ 0xf9da: (0x6817,), #  CJK COMPATIBILITY IDEOGRAPH-F9DA → CJK UNIFIED IDEOGRAPH-6817
+ 0x2f8e5: (0x681f,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E5 → CJK UNIFIED IDEOGRAPH-681F
+ 0x2f8e1: (0x6852,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E1 → CJK UNIFIED IDEOGRAPH-6852
+ 0x2f8e3: (0x2346d,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E3 → CJK UNIFIED IDEOGRAPH-2346D
+ 0xf97a: (0x6881,), #  CJK COMPATIBILITY IDEOGRAPH-F97A → CJK UNIFIED IDEOGRAPH-6881
+ 0xfa44: (0x6885,), #  CJK COMPATIBILITY IDEOGRAPH-FA44 → CJK UNIFIED IDEOGRAPH-6885
+ 0x2f8e2: (0x6885,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E2 → CJK UNIFIED IDEOGRAPH-6885
+ 0x2f8e4: (0x688e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E4 → CJK UNIFIED IDEOGRAPH-688E
+ 0xf9e2: (0x68a8,), #  CJK COMPATIBILITY IDEOGRAPH-F9E2 → CJK UNIFIED IDEOGRAPH-68A8
+ 0x2f8e6: (0x6914,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E6 → CJK UNIFIED IDEOGRAPH-6914
+ 0x2f8e8: (0x6942,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E8 → CJK UNIFIED IDEOGRAPH-6942
+ 0xfad2: (0x3b9d,), #  CJK COMPATIBILITY IDEOGRAPH-FAD2 → CJK UNIFIED IDEOGRAPH-3B9D
+ 0x2f8e7: (0x3b9d,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E7 → CJK UNIFIED IDEOGRAPH-3B9D
+ 0x69e9: (0x3ba3,), #  CJK UNIFIED IDEOGRAPH-69E9 → CJK UNIFIED IDEOGRAPH-3BA3
+ 0x6a27: (0x699d,), #  CJK UNIFIED IDEOGRAPH-6A27 → CJK UNIFIED IDEOGRAPH-699D
+ 0x2f8e9: (0x69a3,), #  CJK COMPATIBILITY IDEOGRAPH-2F8E9 → CJK UNIFIED IDEOGRAPH-69A3
+ 0x2f8ea: (0x69ea,), #  CJK COMPATIBILITY IDEOGRAPH-2F8EA → CJK UNIFIED IDEOGRAPH-69EA
+ 0xf914: (0x6a02,), #  CJK COMPATIBILITY IDEOGRAPH-F914 → CJK UNIFIED IDEOGRAPH-6A02
+ 0xf95c: (0x6a02,), #  CJK COMPATIBILITY IDEOGRAPH-F95C → CJK UNIFIED IDEOGRAPH-6A02
+ 0xf9bf: (0x6a02,), #  CJK COMPATIBILITY IDEOGRAPH-F9BF → CJK UNIFIED IDEOGRAPH-6A02
+ 0xf94c: (0x6a13,), #  CJK COMPATIBILITY IDEOGRAPH-F94C → CJK UNIFIED IDEOGRAPH-6A13
+ 0x2f8ec: (0x236a3,), #  CJK COMPATIBILITY IDEOGRAPH-2F8EC → CJK UNIFIED IDEOGRAPH-236A3
+ 0x2f8eb: (0x6aa8,), #  CJK COMPATIBILITY IDEOGRAPH-2F8EB → CJK UNIFIED IDEOGRAPH-6AA8
+ 0xf931: (0x6ad3,), #  CJK COMPATIBILITY IDEOGRAPH-F931 → CJK UNIFIED IDEOGRAPH-6AD3
+ 0x2f8ed: (0x6adb,), #  CJK COMPATIBILITY IDEOGRAPH-2F8ED → CJK UNIFIED IDEOGRAPH-6ADB
+ 0xf91d: (0x6b04,), #  CJK COMPATIBILITY IDEOGRAPH-F91D → CJK UNIFIED IDEOGRAPH-6B04
+ 0x2f8ee: (0x3c18,), #  CJK COMPATIBILITY IDEOGRAPH-2F8EE → CJK UNIFIED IDEOGRAPH-3C18
+ 0x2f4b: (0x6b20,), #  KANGXI RADICAL LACK → CJK UNIFIED IDEOGRAPH-6B20
+ 0x2f8ef: (0x6b21,), #  CJK COMPATIBILITY IDEOGRAPH-2F8EF → CJK UNIFIED IDEOGRAPH-6B21
+ 0x2f8f0: (0x238a7,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F0 → CJK UNIFIED IDEOGRAPH-238A7
+ 0x2f8f1: (0x6b54,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F1 → CJK UNIFIED IDEOGRAPH-6B54
+ 0x2f8f2: (0x3c4e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F2 → CJK UNIFIED IDEOGRAPH-3C4E
+ 0x2f4c: (0x6b62,), #  KANGXI RADICAL STOP → CJK UNIFIED IDEOGRAPH-6B62
+ 0x2eed: (0x6b6f,), #  CJK RADICAL J-SIMPLIFIED TOOTH → CJK UNIFIED IDEOGRAPH-6B6F
+ 0x2f8f3: (0x6b72,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F3 → CJK UNIFIED IDEOGRAPH-6B72
+ 0xf98c: (0x6b77,), #  CJK COMPATIBILITY IDEOGRAPH-F98C → CJK UNIFIED IDEOGRAPH-6B77
+ 0xfa95: (0x6b79,), #  CJK COMPATIBILITY IDEOGRAPH-FA95 → CJK UNIFIED IDEOGRAPH-6B79
+ 0x2f4d: (0x6b79,), #  KANGXI RADICAL DEATH → CJK UNIFIED IDEOGRAPH-6B79
+ 0x2e9e: (0x6b7a,), #  CJK RADICAL DEATH → CJK UNIFIED IDEOGRAPH-6B7A
+ 0x2f8f4: (0x6b9f,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F4 → CJK UNIFIED IDEOGRAPH-6B9F
+ 0xf9a5: (0x6bae,), #  CJK COMPATIBILITY IDEOGRAPH-F9A5 → CJK UNIFIED IDEOGRAPH-6BAE
+ 0x2f4e: (0x6bb3,), #  KANGXI RADICAL WEAPON → CJK UNIFIED IDEOGRAPH-6BB3
+ 0xf970: (0x6bba,), #  CJK COMPATIBILITY IDEOGRAPH-F970 → CJK UNIFIED IDEOGRAPH-6BBA
+ 0xfa96: (0x6bba,), #  CJK COMPATIBILITY IDEOGRAPH-FA96 → CJK UNIFIED IDEOGRAPH-6BBA
+ 0x2f8f5: (0x6bba,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F5 → CJK UNIFIED IDEOGRAPH-6BBA
+ 0x2f8f6: (0x6bbb,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F6 → CJK UNIFIED IDEOGRAPH-6BBB
+ 0x2f8f7: (0x23a8d,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F7 → CJK UNIFIED IDEOGRAPH-23A8D
+ 0x2f4f: (0x6bcb,), #  KANGXI RADICAL DO NOT → CJK UNIFIED IDEOGRAPH-6BCB
+ 0x2e9f: (0x6bcd,), #  CJK RADICAL MOTHER → CJK UNIFIED IDEOGRAPH-6BCD
+ 0x2f8f9: (0x23afa,), #  CJK COMPATIBILITY IDEOGRAPH-2F8F9 → CJK UNIFIED IDEOGRAPH-23AFA
+ 0x2f50: (0x6bd4,), #  KANGXI RADICAL COMPARE → CJK UNIFIED IDEOGRAPH-6BD4
+ 0x2f51: (0x6bdb,), #  KANGXI RADICAL FUR → CJK UNIFIED IDEOGRAPH-6BDB
+ 0x2f52: (0x6c0f,), #  KANGXI RADICAL CLAN → CJK UNIFIED IDEOGRAPH-6C0F
+ 0x2ea0: (0x6c11,), #  CJK RADICAL CIVILIAN → CJK UNIFIED IDEOGRAPH-6C11
+ 0x2f53: (0x6c14,), #  KANGXI RADICAL STEAM → CJK UNIFIED IDEOGRAPH-6C14
+ 0x2f54: (0x6c34,), #  KANGXI RADICAL WATER → CJK UNIFIED IDEOGRAPH-6C34
+ 0x2ea1: (0x6c35,), #  CJK RADICAL WATER ONE → CJK UNIFIED IDEOGRAPH-6C35
+ 0x2ea2: (0x6c3a,), #  CJK RADICAL WATER TWO → CJK UNIFIED IDEOGRAPH-6C3A
+ 0x2f8fa: (0x6c4e,), #  CJK COMPATIBILITY IDEOGRAPH-2F8FA → CJK UNIFIED IDEOGRAPH-6C4E
+ 0x2f8fe: (0x6c67,), #  CJK COMPATIBILITY IDEOGRAPH-2F8FE → CJK UNIFIED IDEOGRAPH-6C67
+ 0xf972: (0x6c88,), #  CJK COMPATIBILITY IDEOGRAPH-F972 → CJK UNIFIED IDEOGRAPH-6C88
+ 0x2f8fc: (0x6cbf,), #  CJK COMPATIBILITY IDEOGRAPH-2F8FC → CJK UNIFIED IDEOGRAPH-6CBF
+ 0xf968: (0x6ccc,), #  CJK COMPATIBILITY IDEOGRAPH-F968 → CJK UNIFIED IDEOGRAPH-6CCC
+ 0x2f8fd: (0x6ccd,), #  CJK COMPATIBILITY IDEOGRAPH-2F8FD → CJK UNIFIED IDEOGRAPH-6CCD
+ 0xf9e3: (0x6ce5,), #  CJK COMPATIBILITY IDEOGRAPH-F9E3 → CJK UNIFIED IDEOGRAPH-6CE5
+ 0x2f8fb: (0x23cbc,), #  CJK COMPATIBILITY IDEOGRAPH-2F8FB → CJK UNIFIED IDEOGRAPH-23CBC
+ 0xf915: (0x6d1b,), #  CJK COMPATIBILITY IDEOGRAPH-F915 → CJK UNIFIED IDEOGRAPH-6D1B
+ 0xfa05: (0x6d1e,), #  CJK COMPATIBILITY IDEOGRAPH-FA05 → CJK UNIFIED IDEOGRAPH-6D1E
+ 0x2f907: (0x6d34,), #  CJK COMPATIBILITY IDEOGRAPH-2F907 → CJK UNIFIED IDEOGRAPH-6D34
+ 0x2f900: (0x6d3e,), #  CJK COMPATIBILITY IDEOGRAPH-2F900 → CJK UNIFIED IDEOGRAPH-6D3E
+ 0xf9ca: (0x6d41,), #  CJK COMPATIBILITY IDEOGRAPH-F9CA → CJK UNIFIED IDEOGRAPH-6D41
+ 0xfa97: (0x6d41,), #  CJK COMPATIBILITY IDEOGRAPH-FA97 → CJK UNIFIED IDEOGRAPH-6D41
+ 0x2f902: (0x6d41,), #  CJK COMPATIBILITY IDEOGRAPH-2F902 → CJK UNIFIED IDEOGRAPH-6D41
+ 0x2f8ff: (0x6d16,), #  CJK COMPATIBILITY IDEOGRAPH-2F8FF → CJK UNIFIED IDEOGRAPH-6D16
+ 0x2f903: (0x6d69,), #  CJK COMPATIBILITY IDEOGRAPH-2F903 → CJK UNIFIED IDEOGRAPH-6D69
+ 0xf92a: (0x6d6a,), #  CJK COMPATIBILITY IDEOGRAPH-F92A → CJK UNIFIED IDEOGRAPH-6D6A
+ 0xfa45: (0x6d77,), #  CJK COMPATIBILITY IDEOGRAPH-FA45 → CJK UNIFIED IDEOGRAPH-6D77
+ 0x2f901: (0x6d77,), #  CJK COMPATIBILITY IDEOGRAPH-2F901 → CJK UNIFIED IDEOGRAPH-6D77
+ 0x2f904: (0x6d78,), #  CJK COMPATIBILITY IDEOGRAPH-2F904 → CJK UNIFIED IDEOGRAPH-6D78
+ 0x2f905: (0x6d85,), #  CJK COMPATIBILITY IDEOGRAPH-2F905 → CJK UNIFIED IDEOGRAPH-6D85
+ 0x2f906: (0x23d1e,), #  CJK COMPATIBILITY IDEOGRAPH-2F906 → CJK UNIFIED IDEOGRAPH-23D1E
+ 0xf9f5: (0x6dcb,), #  CJK COMPATIBILITY IDEOGRAPH-F9F5 → CJK UNIFIED IDEOGRAPH-6DCB
+ 0xf94d: (0x6dda,), #  CJK COMPATIBILITY IDEOGRAPH-F94D → CJK UNIFIED IDEOGRAPH-6DDA
+ 0xf9d6: (0x6dea,), #  CJK COMPATIBILITY IDEOGRAPH-F9D6 → CJK UNIFIED IDEOGRAPH-6DEA
+ 0x2f90e: (0x6df9,), #  CJK COMPATIBILITY IDEOGRAPH-2F90E → CJK UNIFIED IDEOGRAPH-6DF9
+ 0xfa46: (0x6e1a,), #  CJK COMPATIBILITY IDEOGRAPH-FA46 → CJK UNIFIED IDEOGRAPH-6E1A
+ 0x2f908: (0x6e2f,), #  CJK COMPATIBILITY IDEOGRAPH-2F908 → CJK UNIFIED IDEOGRAPH-6E2F
+ 0x2f909: (0x6e6e,), #  CJK COMPATIBILITY IDEOGRAPH-2F909 → CJK UNIFIED IDEOGRAPH-6E6E
+ 0x6f59: (0x6e88,), #  CJK UNIFIED IDEOGRAPH-6F59 → CJK UNIFIED IDEOGRAPH-6E88
+ 0xfa99: (0x6ecb,), #  CJK COMPATIBILITY IDEOGRAPH-FA99 → CJK UNIFIED IDEOGRAPH-6ECB
+ 0x2f90b: (0x6ecb,), #  CJK COMPATIBILITY IDEOGRAPH-2F90B → CJK UNIFIED IDEOGRAPH-6ECB
+ 0xf9cb: (0x6e9c,), #  CJK COMPATIBILITY IDEOGRAPH-F9CB → CJK UNIFIED IDEOGRAPH-6E9C
+ 0xf9ec: (0x6eba,), #  CJK COMPATIBILITY IDEOGRAPH-F9EC → CJK UNIFIED IDEOGRAPH-6EBA
+ 0x2f90c: (0x6ec7,), #  CJK COMPATIBILITY IDEOGRAPH-2F90C → CJK UNIFIED IDEOGRAPH-6EC7
+ 0xf904: (0x6ed1,), #  CJK COMPATIBILITY IDEOGRAPH-F904 → CJK UNIFIED IDEOGRAPH-6ED1
+ 0xfa98: (0x6edb,), #  CJK COMPATIBILITY IDEOGRAPH-FA98 → CJK UNIFIED IDEOGRAPH-6EDB
+ 0x2f90a: (0x3d33,), #  CJK COMPATIBILITY IDEOGRAPH-2F90A → CJK UNIFIED IDEOGRAPH-3D33
+ 0xf94e: (0x6f0f,), #  CJK COMPATIBILITY IDEOGRAPH-F94E → CJK UNIFIED IDEOGRAPH-6F0F
+ 0xfa47: (0x6f22,), #  CJK COMPATIBILITY IDEOGRAPH-FA47 → CJK UNIFIED IDEOGRAPH-6F22
+ 0xfa9a: (0x6f22,), #  CJK COMPATIBILITY IDEOGRAPH-FA9A → CJK UNIFIED IDEOGRAPH-6F22
+ 0xf992: (0x6f23,), #  CJK COMPATIBILITY IDEOGRAPH-F992 → CJK UNIFIED IDEOGRAPH-6F23
+ 0x2f90d: (0x23ed1,), #  CJK COMPATIBILITY IDEOGRAPH-2F90D → CJK UNIFIED IDEOGRAPH-23ED1
+ 0x2f90f: (0x6f6e,), #  CJK COMPATIBILITY IDEOGRAPH-2F90F → CJK UNIFIED IDEOGRAPH-6F6E
+ 0x2f910: (0x23f5e,), #  CJK COMPATIBILITY IDEOGRAPH-2F910 → CJK UNIFIED IDEOGRAPH-23F5E
+ 0x2f911: (0x23f8e,), #  CJK COMPATIBILITY IDEOGRAPH-2F911 → CJK UNIFIED IDEOGRAPH-23F8E
+ 0x2f912: (0x6fc6,), #  CJK COMPATIBILITY IDEOGRAPH-2F912 → CJK UNIFIED IDEOGRAPH-6FC6
+ 0xf922: (0x6feb,), #  CJK COMPATIBILITY IDEOGRAPH-F922 → CJK UNIFIED IDEOGRAPH-6FEB
+ 0xf984: (0x6ffe,), #  CJK COMPATIBILITY IDEOGRAPH-F984 → CJK UNIFIED IDEOGRAPH-6FFE
+ 0x2f915: (0x701b,), #  CJK COMPATIBILITY IDEOGRAPH-2F915 → CJK UNIFIED IDEOGRAPH-701B
+ 0xfa9b: (0x701e,), #  CJK COMPATIBILITY IDEOGRAPH-FA9B → CJK UNIFIED IDEOGRAPH-701E
+ 0x2f914: (0x701e,), #  CJK COMPATIBILITY IDEOGRAPH-2F914 → CJK UNIFIED IDEOGRAPH-701E
+ 0x2f913: (0x7039,), #  CJK COMPATIBILITY IDEOGRAPH-2F913 → CJK UNIFIED IDEOGRAPH-7039
+ 0x2f917: (0x704a,), #  CJK COMPATIBILITY IDEOGRAPH-2F917 → CJK UNIFIED IDEOGRAPH-704A
+ 0x2f916: (0x3d96,), #  CJK COMPATIBILITY IDEOGRAPH-2F916 → CJK UNIFIED IDEOGRAPH-3D96
+ 0x2f55: (0x706b,), #  KANGXI RADICAL FIRE → CJK UNIFIED IDEOGRAPH-706B
+ 0x2ea3: (0x706c,), #  CJK RADICAL FIRE → CJK UNIFIED IDEOGRAPH-706C
+ 0x2f835: (0x7070,), #  CJK COMPATIBILITY IDEOGRAPH-2F835 → CJK UNIFIED IDEOGRAPH-7070
+ 0x2f919: (0x7077,), #  CJK COMPATIBILITY IDEOGRAPH-2F919 → CJK UNIFIED IDEOGRAPH-7077
+ 0x2f918: (0x707d,), #  CJK COMPATIBILITY IDEOGRAPH-2F918 → CJK UNIFIED IDEOGRAPH-707D
+ 0xf9fb: (0x7099,), #  CJK COMPATIBILITY IDEOGRAPH-F9FB → CJK UNIFIED IDEOGRAPH-7099
+ 0x2f91a: (0x70ad,), #  CJK COMPATIBILITY IDEOGRAPH-2F91A → CJK UNIFIED IDEOGRAPH-70AD
+ 0xf99f: (0x70c8,), #  CJK COMPATIBILITY IDEOGRAPH-F99F → CJK UNIFIED IDEOGRAPH-70C8
+ 0xf916: (0x70d9,), #  CJK COMPATIBILITY IDEOGRAPH-F916 → CJK UNIFIED IDEOGRAPH-70D9
+ 0xfa48: (0x716e,), #  CJK COMPATIBILITY IDEOGRAPH-FA48 → CJK UNIFIED IDEOGRAPH-716E
+ 0xfa9c: (0x716e,), #  CJK COMPATIBILITY IDEOGRAPH-FA9C → CJK UNIFIED IDEOGRAPH-716E
+ 0x2f91d: (0x24263,), #  CJK COMPATIBILITY IDEOGRAPH-2F91D → CJK UNIFIED IDEOGRAPH-24263
+ 0x2f91c: (0x7145,), #  CJK COMPATIBILITY IDEOGRAPH-2F91C → CJK UNIFIED IDEOGRAPH-7145
+ 0xf993: (0x7149,), #  CJK COMPATIBILITY IDEOGRAPH-F993 → CJK UNIFIED IDEOGRAPH-7149
+ 0xfa6c: (0x242ee,), #  CJK COMPATIBILITY IDEOGRAPH-FA6C → CJK UNIFIED IDEOGRAPH-242EE
+ 0x2f91e: (0x719c,), #  CJK COMPATIBILITY IDEOGRAPH-2F91E → CJK UNIFIED IDEOGRAPH-719C
+ 0xf9c0: (0x71ce,), #  CJK COMPATIBILITY IDEOGRAPH-F9C0 → CJK UNIFIED IDEOGRAPH-71CE
+ 0xf9ee: (0x71d0,), #  CJK COMPATIBILITY IDEOGRAPH-F9EE → CJK UNIFIED IDEOGRAPH-71D0
+ 0x2f91f: (0x243ab,), #  CJK COMPATIBILITY IDEOGRAPH-2F91F → CJK UNIFIED IDEOGRAPH-243AB
+ 0xf932: (0x7210,), #  CJK COMPATIBILITY IDEOGRAPH-F932 → CJK UNIFIED IDEOGRAPH-7210
+ 0xf91e: (0x721b,), #  CJK COMPATIBILITY IDEOGRAPH-F91E → CJK UNIFIED IDEOGRAPH-721B
+ 0x2f920: (0x7228,), #  CJK COMPATIBILITY IDEOGRAPH-2F920 → CJK UNIFIED IDEOGRAPH-7228
+ 0x2f56: (0x722a,), #  KANGXI RADICAL CLAW → CJK UNIFIED IDEOGRAPH-722A
+ 0xfa49: (0x722b,), #  CJK COMPATIBILITY IDEOGRAPH-FA49 → CJK UNIFIED IDEOGRAPH-722B
+ 0x2ea4: (0x722b,), #  CJK RADICAL PAW ONE → CJK UNIFIED IDEOGRAPH-722B
+ 0xfa9e: (0x7235,), #  CJK COMPATIBILITY IDEOGRAPH-FA9E → CJK UNIFIED IDEOGRAPH-7235
+ 0x2f921: (0x7235,), #  CJK COMPATIBILITY IDEOGRAPH-2F921 → CJK UNIFIED IDEOGRAPH-7235
+ 0x2f57: (0x7236,), #  KANGXI RADICAL FATHER → CJK UNIFIED IDEOGRAPH-7236
+ 0x2f58: (0x723b,), #  KANGXI RADICAL DOUBLE X → CJK UNIFIED IDEOGRAPH-723B
+ 0x2ea6: (0x4e2c,), #  CJK RADICAL SIMPLIFIED HALF TREE TRUNK → CJK UNIFIED IDEOGRAPH-4E2C
+ 0x2f59: (0x723f,), #  KANGXI RADICAL HALF TREE TRUNK → CJK UNIFIED IDEOGRAPH-723F
+ 0x2f5a: (0x7247,), #  KANGXI RADICAL SLICE → CJK UNIFIED IDEOGRAPH-7247
+ 0x2f922: (0x7250,), #  CJK COMPATIBILITY IDEOGRAPH-2F922 → CJK UNIFIED IDEOGRAPH-7250
+ 0x2f5b: (0x7259,), #  KANGXI RADICAL FANG → CJK UNIFIED IDEOGRAPH-7259
+ 0x2f923: (0x24608,), #  CJK COMPATIBILITY IDEOGRAPH-2F923 → CJK UNIFIED IDEOGRAPH-24608
+ 0x2f5c: (0x725b,), #  KANGXI RADICAL COW → CJK UNIFIED IDEOGRAPH-725B
+ 0xf946: (0x7262,), #  CJK COMPATIBILITY IDEOGRAPH-F946 → CJK UNIFIED IDEOGRAPH-7262
+ 0x2f924: (0x7280,), #  CJK COMPATIBILITY IDEOGRAPH-2F924 → CJK UNIFIED IDEOGRAPH-7280
+ 0x2f925: (0x7295,), #  CJK COMPATIBILITY IDEOGRAPH-2F925 → CJK UNIFIED IDEOGRAPH-7295
+ 0x2f5d: (0x72ac,), #  KANGXI RADICAL DOG → CJK UNIFIED IDEOGRAPH-72AC
+ 0x2ea8: (0x72ad,), #  CJK RADICAL DOG → CJK UNIFIED IDEOGRAPH-72AD
+ 0xfa9f: (0x72af,), #  CJK COMPATIBILITY IDEOGRAPH-FA9F → CJK UNIFIED IDEOGRAPH-72AF
+ 0xf9fa: (0x72c0,), #  CJK COMPATIBILITY IDEOGRAPH-F9FA → CJK UNIFIED IDEOGRAPH-72C0
+ 0x2f926: (0x24735,), #  CJK COMPATIBILITY IDEOGRAPH-2F926 → CJK UNIFIED IDEOGRAPH-24735
+ 0xf92b: (0x72fc,), #  CJK COMPATIBILITY IDEOGRAPH-F92B → CJK UNIFIED IDEOGRAPH-72FC
+ 0xfa16: (0x732a,), #  CJK COMPATIBILITY IDEOGRAPH-FA16 → CJK UNIFIED IDEOGRAPH-732A
+ 0xfaa0: (0x732a,), #  CJK COMPATIBILITY IDEOGRAPH-FAA0 → CJK UNIFIED IDEOGRAPH-732A
+ 0x2f927: (0x24814,), #  CJK COMPATIBILITY IDEOGRAPH-2F927 → CJK UNIFIED IDEOGRAPH-24814
+ 0xf9a7: (0x7375,), #  CJK COMPATIBILITY IDEOGRAPH-F9A7 → CJK UNIFIED IDEOGRAPH-7375
+ 0x2f928: (0x737a,), #  CJK COMPATIBILITY IDEOGRAPH-2F928 → CJK UNIFIED IDEOGRAPH-737A
+ 0x2f5e: (0x7384,), #  KANGXI RADICAL PROFOUND → CJK UNIFIED IDEOGRAPH-7384
+ 0xf961: (0x7387,), #  CJK COMPATIBILITY IDEOGRAPH-F961 → CJK UNIFIED IDEOGRAPH-7387
+ 0xf9db: (0x7387,), #  CJK COMPATIBILITY IDEOGRAPH-F9DB → CJK UNIFIED IDEOGRAPH-7387
+ 0x2f5f: (0x7389,), #  KANGXI RADICAL JADE → CJK UNIFIED IDEOGRAPH-7389
+ 0x2f929: (0x738b,), #  CJK COMPATIBILITY IDEOGRAPH-2F929 → CJK UNIFIED IDEOGRAPH-738B
+ 0x2f92a: (0x3eac,), #  CJK COMPATIBILITY IDEOGRAPH-2F92A → CJK UNIFIED IDEOGRAPH-3EAC
+ 0x2f92b: (0x73a5,), #  CJK COMPATIBILITY IDEOGRAPH-2F92B → CJK UNIFIED IDEOGRAPH-73A5
+ 0xf9ad: (0x73b2,), #  CJK COMPATIBILITY IDEOGRAPH-F9AD → CJK UNIFIED IDEOGRAPH-73B2
+ 0x2f92c: (0x3eb8,), #  CJK COMPATIBILITY IDEOGRAPH-2F92C → CJK UNIFIED IDEOGRAPH-3EB8
+ 0x2f92d: (0x3eb8,), #  CJK COMPATIBILITY IDEOGRAPH-2F92D → CJK UNIFIED IDEOGRAPH-3EB8
+ 0xf917: (0x73de,), #  CJK COMPATIBILITY IDEOGRAPH-F917 → CJK UNIFIED IDEOGRAPH-73DE
+ 0xf9cc: (0x7409,), #  CJK COMPATIBILITY IDEOGRAPH-F9CC → CJK UNIFIED IDEOGRAPH-7409
+ 0xf9e4: (0x7406,), #  CJK COMPATIBILITY IDEOGRAPH-F9E4 → CJK UNIFIED IDEOGRAPH-7406
+ 0xfa4a: (0x7422,), #  CJK COMPATIBILITY IDEOGRAPH-FA4A → CJK UNIFIED IDEOGRAPH-7422
+ 0x2f92e: (0x7447,), #  CJK COMPATIBILITY IDEOGRAPH-2F92E → CJK UNIFIED IDEOGRAPH-7447
+ 0x2f92f: (0x745c,), #  CJK COMPATIBILITY IDEOGRAPH-2F92F → CJK UNIFIED IDEOGRAPH-745C
+ 0xf9ae: (0x7469,), #  CJK COMPATIBILITY IDEOGRAPH-F9AE → CJK UNIFIED IDEOGRAPH-7469
+ 0xfaa1: (0x7471,), #  CJK COMPATIBILITY IDEOGRAPH-FAA1 → CJK UNIFIED IDEOGRAPH-7471
+ 0x2f930: (0x7471,), #  CJK COMPATIBILITY IDEOGRAPH-2F930 → CJK UNIFIED IDEOGRAPH-7471
+ 0x2f931: (0x7485,), #  CJK COMPATIBILITY IDEOGRAPH-2F931 → CJK UNIFIED IDEOGRAPH-7485
+ 0xf994: (0x7489,), #  CJK COMPATIBILITY IDEOGRAPH-F994 → CJK UNIFIED IDEOGRAPH-7489
+ 0xf9ef: (0x7498,), #  CJK COMPATIBILITY IDEOGRAPH-F9EF → CJK UNIFIED IDEOGRAPH-7498
+ 0x2f932: (0x74ca,), #  CJK COMPATIBILITY IDEOGRAPH-2F932 → CJK UNIFIED IDEOGRAPH-74CA
+ 0x2f60: (0x74dc,), #  KANGXI RADICAL MELON → CJK UNIFIED IDEOGRAPH-74DC
+ 0x2f61: (0x74e6,), #  KANGXI RADICAL TILE → CJK UNIFIED IDEOGRAPH-74E6
+ 0x2f933: (0x3f1b,), #  CJK COMPATIBILITY IDEOGRAPH-2F933 → CJK UNIFIED IDEOGRAPH-3F1B
+ 0xfaa2: (0x7506,), #  CJK COMPATIBILITY IDEOGRAPH-FAA2 → CJK UNIFIED IDEOGRAPH-7506
+ 0x2f62: (0x7518,), #  KANGXI RADICAL SWEET → CJK UNIFIED IDEOGRAPH-7518
+ 0x2f63: (0x751f,), #  KANGXI RADICAL LIFE → CJK UNIFIED IDEOGRAPH-751F
+ 0x2f934: (0x7524,), #  CJK COMPATIBILITY IDEOGRAPH-2F934 → CJK UNIFIED IDEOGRAPH-7524
+ 0x2f64: (0x7528,), #  KANGXI RADICAL USE → CJK UNIFIED IDEOGRAPH-7528
+ 0x2f65: (0x7530,), #  KANGXI RADICAL FIELD → CJK UNIFIED IDEOGRAPH-7530
+ 0xfaa3: (0x753b,), #  CJK COMPATIBILITY IDEOGRAPH-FAA3 → CJK UNIFIED IDEOGRAPH-753B
+ 0x2f936: (0x753e,), #  CJK COMPATIBILITY IDEOGRAPH-2F936 → CJK UNIFIED IDEOGRAPH-753E
+ 0x2f935: (0x24c36,), #  CJK COMPATIBILITY IDEOGRAPH-2F935 → CJK UNIFIED IDEOGRAPH-24C36
+ 0xf9cd: (0x7559,), #  CJK COMPATIBILITY IDEOGRAPH-F9CD → CJK UNIFIED IDEOGRAPH-7559
+ 0xf976: (0x7565,), #  CJK COMPATIBILITY IDEOGRAPH-F976 → CJK UNIFIED IDEOGRAPH-7565
+ 0xf962: (0x7570,), #  CJK COMPATIBILITY IDEOGRAPH-F962 → CJK UNIFIED IDEOGRAPH-7570
+ 0x2f938: (0x7570,), #  CJK COMPATIBILITY IDEOGRAPH-2F938 → CJK UNIFIED IDEOGRAPH-7570
+ 0x2f937: (0x24c92,), #  CJK COMPATIBILITY IDEOGRAPH-2F937 → CJK UNIFIED IDEOGRAPH-24C92
+ 0x2f66: (0x758b,), #  KANGXI RADICAL BOLT OF CLOTH → CJK UNIFIED IDEOGRAPH-758B
+ 0x2f67: (0x7592,), #  KANGXI RADICAL SICKNESS → CJK UNIFIED IDEOGRAPH-7592
+ 0xf9e5: (0x75e2,), #  CJK COMPATIBILITY IDEOGRAPH-F9E5 → CJK UNIFIED IDEOGRAPH-75E2
+ 0x2f93a: (0x7610,), #  CJK COMPATIBILITY IDEOGRAPH-2F93A → CJK UNIFIED IDEOGRAPH-7610
+ 0xfaa5: (0x761f,), #  CJK COMPATIBILITY IDEOGRAPH-FAA5 → CJK UNIFIED IDEOGRAPH-761F
+ 0xfaa4: (0x761d,), #  CJK COMPATIBILITY IDEOGRAPH-FAA4 → CJK UNIFIED IDEOGRAPH-761D
+ 0xf9c1: (0x7642,), #  CJK COMPATIBILITY IDEOGRAPH-F9C1 → CJK UNIFIED IDEOGRAPH-7642
+ 0xf90e: (0x7669,), #  CJK COMPATIBILITY IDEOGRAPH-F90E → CJK UNIFIED IDEOGRAPH-7669
+ 0x2f68: (0x7676,), #  KANGXI RADICAL DOTTED TENT → CJK UNIFIED IDEOGRAPH-7676
+ 0x2f69: (0x767d,), #  KANGXI RADICAL WHITE → CJK UNIFIED IDEOGRAPH-767D
+ 0x2f93b: (0x24fa1,), #  CJK COMPATIBILITY IDEOGRAPH-2F93B → CJK UNIFIED IDEOGRAPH-24FA1
+ 0x2f93c: (0x24fb8,), #  CJK COMPATIBILITY IDEOGRAPH-2F93C → CJK UNIFIED IDEOGRAPH-24FB8
+ 0x2f6a: (0x76ae,), #  KANGXI RADICAL SKIN → CJK UNIFIED IDEOGRAPH-76AE
+ 0x2f6b: (0x76bf,), #  KANGXI RADICAL DISH → CJK UNIFIED IDEOGRAPH-76BF
+ 0x2f93d: (0x25044,), #  CJK COMPATIBILITY IDEOGRAPH-2F93D → CJK UNIFIED IDEOGRAPH-25044
+ 0x2f93e: (0x3ffc,), #  CJK COMPATIBILITY IDEOGRAPH-2F93E → CJK UNIFIED IDEOGRAPH-3FFC
+ 0xfa17: (0x76ca,), #  CJK COMPATIBILITY IDEOGRAPH-FA17 → CJK UNIFIED IDEOGRAPH-76CA
+ 0xfaa6: (0x76ca,), #  CJK COMPATIBILITY IDEOGRAPH-FAA6 → CJK UNIFIED IDEOGRAPH-76CA
+ 0xfaa7: (0x76db,), #  CJK COMPATIBILITY IDEOGRAPH-FAA7 → CJK UNIFIED IDEOGRAPH-76DB
+ 0xf933: (0x76e7,), #  CJK COMPATIBILITY IDEOGRAPH-F933 → CJK UNIFIED IDEOGRAPH-76E7
+ 0x2f93f: (0x4008,), #  CJK COMPATIBILITY IDEOGRAPH-2F93F → CJK UNIFIED IDEOGRAPH-4008
+ 0x2f6c: (0x76ee,), #  KANGXI RADICAL EYE → CJK UNIFIED IDEOGRAPH-76EE
+ 0xfaa8: (0x76f4,), #  CJK COMPATIBILITY IDEOGRAPH-FAA8 → CJK UNIFIED IDEOGRAPH-76F4
+ 0x2f940: (0x76f4,), #  CJK COMPATIBILITY IDEOGRAPH-2F940 → CJK UNIFIED IDEOGRAPH-76F4
+ 0x2f942: (0x250f2,), #  CJK COMPATIBILITY IDEOGRAPH-2F942 → CJK UNIFIED IDEOGRAPH-250F2
+ 0x2f941: (0x250f3,), #  CJK COMPATIBILITY IDEOGRAPH-2F941 → CJK UNIFIED IDEOGRAPH-250F3
+ 0xf96d: (0x7701,), #  CJK COMPATIBILITY IDEOGRAPH-F96D → CJK UNIFIED IDEOGRAPH-7701
+ 0xfad3: (0x4018,), #  CJK COMPATIBILITY IDEOGRAPH-FAD3 → CJK UNIFIED IDEOGRAPH-4018
+ 0x2f943: (0x25119,), #  CJK COMPATIBILITY IDEOGRAPH-2F943 → CJK UNIFIED IDEOGRAPH-25119
+ 0x2f945: (0x771e,), #  CJK COMPATIBILITY IDEOGRAPH-2F945 → CJK UNIFIED IDEOGRAPH-771E
+ 0x2f946: (0x771f,), #  CJK COMPATIBILITY IDEOGRAPH-2F946 → CJK UNIFIED IDEOGRAPH-771F
+ 0x2f947: (0x771f,), #  CJK COMPATIBILITY IDEOGRAPH-2F947 → CJK UNIFIED IDEOGRAPH-771F
+ 0x2f944: (0x25133,), #  CJK COMPATIBILITY IDEOGRAPH-2F944 → CJK UNIFIED IDEOGRAPH-25133
+ 0xfaaa: (0x7740,), #  CJK COMPATIBILITY IDEOGRAPH-FAAA → CJK UNIFIED IDEOGRAPH-7740
+ 0xfaa9: (0x774a,), #  CJK COMPATIBILITY IDEOGRAPH-FAA9 → CJK UNIFIED IDEOGRAPH-774A
+ 0x2f948: (0x774a,), #  CJK COMPATIBILITY IDEOGRAPH-2F948 → CJK UNIFIED IDEOGRAPH-774A
+ 0x9fc3: (0x4039,), #  CJK UNIFIED IDEOGRAPH-9FC3 → CJK UNIFIED IDEOGRAPH-4039	# →䀹→
+ 0xfad4: (0x4039,), #  CJK COMPATIBILITY IDEOGRAPH-FAD4 → CJK UNIFIED IDEOGRAPH-4039
+ 0x2f949: (0x4039,), #  CJK COMPATIBILITY IDEOGRAPH-2F949 → CJK UNIFIED IDEOGRAPH-4039
+ 0x6663: (0x403f,), #  CJK UNIFIED IDEOGRAPH-6663 → CJK UNIFIED IDEOGRAPH-403F
+ 0x2f94b: (0x4046,), #  CJK COMPATIBILITY IDEOGRAPH-2F94B → CJK UNIFIED IDEOGRAPH-4046
+ 0x2f94a: (0x778b,), #  CJK COMPATIBILITY IDEOGRAPH-2F94A → CJK UNIFIED IDEOGRAPH-778B
+ 0xfad5: (0x25249,), #  CJK COMPATIBILITY IDEOGRAPH-FAD5 → CJK UNIFIED IDEOGRAPH-25249
+ 0xfa9d: (0x77a7,), #  CJK COMPATIBILITY IDEOGRAPH-FA9D → CJK UNIFIED IDEOGRAPH-77A7
+ 0x2f6d: (0x77db,), #  KANGXI RADICAL SPEAR → CJK UNIFIED IDEOGRAPH-77DB
+ 0x2f6e: (0x77e2,), #  KANGXI RADICAL ARROW → CJK UNIFIED IDEOGRAPH-77E2
+ 0x2f6f: (0x77f3,), #  KANGXI RADICAL STONE → CJK UNIFIED IDEOGRAPH-77F3
+ 0x2f94c: (0x4096,), #  CJK COMPATIBILITY IDEOGRAPH-2F94C → CJK UNIFIED IDEOGRAPH-4096
+ 0x2f94d: (0x2541d,), #  CJK COMPATIBILITY IDEOGRAPH-2F94D → CJK UNIFIED IDEOGRAPH-2541D
+ 0x784f: (0x7814,), #  CJK UNIFIED IDEOGRAPH-784F → CJK UNIFIED IDEOGRAPH-7814
+ 0x2f94e: (0x784e,), #  CJK COMPATIBILITY IDEOGRAPH-2F94E → CJK UNIFIED IDEOGRAPH-784E
+ 0xf9ce: (0x786b,), #  CJK COMPATIBILITY IDEOGRAPH-F9CE → CJK UNIFIED IDEOGRAPH-786B
+ 0xf93b: (0x788c,), #  CJK COMPATIBILITY IDEOGRAPH-F93B → CJK UNIFIED IDEOGRAPH-788C
+ 0x2f94f: (0x788c,), #  CJK COMPATIBILITY IDEOGRAPH-2F94F → CJK UNIFIED IDEOGRAPH-788C
+ 0xfa4b: (0x7891,), #  CJK COMPATIBILITY IDEOGRAPH-FA4B → CJK UNIFIED IDEOGRAPH-7891
+ 0xf947: (0x78ca,), #  CJK COMPATIBILITY IDEOGRAPH-F947 → CJK UNIFIED IDEOGRAPH-78CA
+ 0xfaab: (0x78cc,), #  CJK COMPATIBILITY IDEOGRAPH-FAAB → CJK UNIFIED IDEOGRAPH-78CC
+ 0x2f950: (0x78cc,), #  CJK COMPATIBILITY IDEOGRAPH-2F950 → CJK UNIFIED IDEOGRAPH-78CC
+ 0xf964: (0x78fb,), #  CJK COMPATIBILITY IDEOGRAPH-F964 → CJK UNIFIED IDEOGRAPH-78FB
+ 0x2f951: (0x40e3,), #  CJK COMPATIBILITY IDEOGRAPH-2F951 → CJK UNIFIED IDEOGRAPH-40E3
+ 0xf985: (0x792a,), #  CJK COMPATIBILITY IDEOGRAPH-F985 → CJK UNIFIED IDEOGRAPH-792A
+ 0x2f70: (0x793a,), #  KANGXI RADICAL SPIRIT → CJK UNIFIED IDEOGRAPH-793A
+ 0x2ead: (0x793b,), #  CJK RADICAL SPIRIT TWO → CJK UNIFIED IDEOGRAPH-793B
+ 0xfa18: (0x793c,), #  CJK COMPATIBILITY IDEOGRAPH-FA18 → CJK UNIFIED IDEOGRAPH-793C
+ 0xfa4c: (0x793e,), #  CJK COMPATIBILITY IDEOGRAPH-FA4C → CJK UNIFIED IDEOGRAPH-793E
+ 0xfa4e: (0x7948,), #  CJK COMPATIBILITY IDEOGRAPH-FA4E → CJK UNIFIED IDEOGRAPH-7948
+ 0xfa4d: (0x7949,), #  CJK COMPATIBILITY IDEOGRAPH-FA4D → CJK UNIFIED IDEOGRAPH-7949
+ 0x2f952: (0x25626,), #  CJK COMPATIBILITY IDEOGRAPH-2F952 → CJK UNIFIED IDEOGRAPH-25626
+ 0xfa4f: (0x7950,), #  CJK COMPATIBILITY IDEOGRAPH-FA4F → CJK UNIFIED IDEOGRAPH-7950
+ 0xfa50: (0x7956,), #  CJK COMPATIBILITY IDEOGRAPH-FA50 → CJK UNIFIED IDEOGRAPH-7956
+ 0x2f953: (0x7956,), #  CJK COMPATIBILITY IDEOGRAPH-2F953 → CJK UNIFIED IDEOGRAPH-7956
+ 0xfa51: (0x795d,), #  CJK COMPATIBILITY IDEOGRAPH-FA51 → CJK UNIFIED IDEOGRAPH-795D
+ 0xfa19: (0x795e,), #  CJK COMPATIBILITY IDEOGRAPH-FA19 → CJK UNIFIED IDEOGRAPH-795E
+ 0xfa1a: (0x7965,), #  CJK COMPATIBILITY IDEOGRAPH-FA1A → CJK UNIFIED IDEOGRAPH-7965
+ 0xfa61: (0x8996,), #  CJK COMPATIBILITY IDEOGRAPH-FA61 → CJK UNIFIED IDEOGRAPH-8996
+ 0xfab8: (0x8996,), #  CJK COMPATIBILITY IDEOGRAPH-FAB8 → CJK UNIFIED IDEOGRAPH-8996
+ 0xf93c: (0x797f,), #  CJK COMPATIBILITY IDEOGRAPH-F93C → CJK UNIFIED IDEOGRAPH-797F
+ 0x2f954: (0x2569a,), #  CJK COMPATIBILITY IDEOGRAPH-2F954 → CJK UNIFIED IDEOGRAPH-2569A
+ 0xfa52: (0x798d,), #  CJK COMPATIBILITY IDEOGRAPH-FA52 → CJK UNIFIED IDEOGRAPH-798D
+ 0xfa53: (0x798e,), #  CJK COMPATIBILITY IDEOGRAPH-FA53 → CJK UNIFIED IDEOGRAPH-798E
+ 0xfa1b: (0x798f,), #  CJK COMPATIBILITY IDEOGRAPH-FA1B → CJK UNIFIED IDEOGRAPH-798F
+ 0x2f956: (0x798f,), #  CJK COMPATIBILITY IDEOGRAPH-2F956 → CJK UNIFIED IDEOGRAPH-798F
+ 0x2f955: (0x256c5,), #  CJK COMPATIBILITY IDEOGRAPH-2F955 → CJK UNIFIED IDEOGRAPH-256C5
+ 0xf9b6: (0x79ae,), #  CJK COMPATIBILITY IDEOGRAPH-F9B6 → CJK UNIFIED IDEOGRAPH-79AE
+ 0x2f71: (0x79b8,), #  KANGXI RADICAL TRACK → CJK UNIFIED IDEOGRAPH-79B8
+ 0x2f72: (0x79be,), #  KANGXI RADICAL GRAIN → CJK UNIFIED IDEOGRAPH-79BE
+ 0xf995: (0x79ca,), #  CJK COMPATIBILITY IDEOGRAPH-F995 → CJK UNIFIED IDEOGRAPH-79CA
+ 0x2f958: (0x412f,), #  CJK COMPATIBILITY IDEOGRAPH-2F958 → CJK UNIFIED IDEOGRAPH-412F
+ 0x2f957: (0x79eb,), #  CJK COMPATIBILITY IDEOGRAPH-2F957 → CJK UNIFIED IDEOGRAPH-79EB
+ 0xf956: (0x7a1c,), #  CJK COMPATIBILITY IDEOGRAPH-F956 → CJK UNIFIED IDEOGRAPH-7A1C
+ 0x2f95a: (0x7a4a,), #  CJK COMPATIBILITY IDEOGRAPH-2F95A → CJK UNIFIED IDEOGRAPH-7A4A
+ 0xfa54: (0x7a40,), #  CJK COMPATIBILITY IDEOGRAPH-FA54 → CJK UNIFIED IDEOGRAPH-7A40
+ 0x2f959: (0x7a40,), #  CJK COMPATIBILITY IDEOGRAPH-2F959 → CJK UNIFIED IDEOGRAPH-7A40
+ 0x2f95b: (0x7a4f,), #  CJK COMPATIBILITY IDEOGRAPH-2F95B → CJK UNIFIED IDEOGRAPH-7A4F
+ 0x2f73: (0x7a74,), #  KANGXI RADICAL CAVE → CJK UNIFIED IDEOGRAPH-7A74
+ 0xfa55: (0x7a81,), #  CJK COMPATIBILITY IDEOGRAPH-FA55 → CJK UNIFIED IDEOGRAPH-7A81
+ 0x2f95c: (0x2597c,), #  CJK COMPATIBILITY IDEOGRAPH-2F95C → CJK UNIFIED IDEOGRAPH-2597C
+ 0xfaac: (0x7ab1,), #  CJK COMPATIBILITY IDEOGRAPH-FAAC → CJK UNIFIED IDEOGRAPH-7AB1
+ 0xf9f7: (0x7acb,), #  CJK COMPATIBILITY IDEOGRAPH-F9F7 → CJK UNIFIED IDEOGRAPH-7ACB
+ 0x2f74: (0x7acb,), #  KANGXI RADICAL STAND → CJK UNIFIED IDEOGRAPH-7ACB
+ 0x2eef: (0x7adc,), #  CJK RADICAL J-SIMPLIFIED DRAGON → CJK UNIFIED IDEOGRAPH-7ADC
+ 0x2f95d: (0x25aa7,), #  CJK COMPATIBILITY IDEOGRAPH-2F95D → CJK UNIFIED IDEOGRAPH-25AA7
+ 0x2f95e: (0x25aa7,), #  CJK COMPATIBILITY IDEOGRAPH-2F95E → CJK UNIFIED IDEOGRAPH-25AA7
+ 0x2f95f: (0x7aee,), #  CJK COMPATIBILITY IDEOGRAPH-2F95F → CJK UNIFIED IDEOGRAPH-7AEE
+ 0x2f75: (0x7af9,), #  KANGXI RADICAL BAMBOO → CJK UNIFIED IDEOGRAPH-7AF9
+ 0xf9f8: (0x7b20,), #  CJK COMPATIBILITY IDEOGRAPH-F9F8 → CJK UNIFIED IDEOGRAPH-7B20
+ 0xfa56: (0x7bc0,), #  CJK COMPATIBILITY IDEOGRAPH-FA56 → CJK UNIFIED IDEOGRAPH-7BC0
+ 0xfaad: (0x7bc0,), #  CJK COMPATIBILITY IDEOGRAPH-FAAD → CJK UNIFIED IDEOGRAPH-7BC0
+ 0x2f960: (0x4202,), #  CJK COMPATIBILITY IDEOGRAPH-2F960 → CJK UNIFIED IDEOGRAPH-4202
+ 0x2f961: (0x25bab,), #  CJK COMPATIBILITY IDEOGRAPH-2F961 → CJK UNIFIED IDEOGRAPH-25BAB
+ 0x2f962: (0x7bc6,), #  CJK COMPATIBILITY IDEOGRAPH-2F962 → CJK UNIFIED IDEOGRAPH-7BC6
+ 0x2f964: (0x4227,), #  CJK COMPATIBILITY IDEOGRAPH-2F964 → CJK UNIFIED IDEOGRAPH-4227
+ 0x2f963: (0x7bc9,), #  CJK COMPATIBILITY IDEOGRAPH-2F963 → CJK UNIFIED IDEOGRAPH-7BC9
+ 0x2f965: (0x25c80,), #  CJK COMPATIBILITY IDEOGRAPH-2F965 → CJK UNIFIED IDEOGRAPH-25C80
+ 0xfad6: (0x25cd0,), #  CJK COMPATIBILITY IDEOGRAPH-FAD6 → CJK UNIFIED IDEOGRAPH-25CD0
+ 0xf9a6: (0x7c3e,), #  CJK COMPATIBILITY IDEOGRAPH-F9A6 → CJK UNIFIED IDEOGRAPH-7C3E
+ 0xf944: (0x7c60,), #  CJK COMPATIBILITY IDEOGRAPH-F944 → CJK UNIFIED IDEOGRAPH-7C60
+ 0x2f76: (0x7c73,), #  KANGXI RADICAL RICE → CJK UNIFIED IDEOGRAPH-7C73
+ 0xfaae: (0x7c7b,), #  CJK COMPATIBILITY IDEOGRAPH-FAAE → CJK UNIFIED IDEOGRAPH-7C7B
+ 0xf9f9: (0x7c92,), #  CJK COMPATIBILITY IDEOGRAPH-F9F9 → CJK UNIFIED IDEOGRAPH-7C92
+ 0xfa1d: (0x7cbe,), #  CJK COMPATIBILITY IDEOGRAPH-FA1D → CJK UNIFIED IDEOGRAPH-7CBE
+ 0x2f966: (0x7cd2,), #  CJK COMPATIBILITY IDEOGRAPH-2F966 → CJK UNIFIED IDEOGRAPH-7CD2
+ 0xfa03: (0x7cd6,), #  CJK COMPATIBILITY IDEOGRAPH-FA03 → CJK UNIFIED IDEOGRAPH-7CD6
+ 0x2f968: (0x7ce8,), #  CJK COMPATIBILITY IDEOGRAPH-2F968 → CJK UNIFIED IDEOGRAPH-7CE8
+ 0x2f967: (0x42a0,), #  CJK COMPATIBILITY IDEOGRAPH-2F967 → CJK UNIFIED IDEOGRAPH-42A0
+ 0x2f969: (0x7ce3,), #  CJK COMPATIBILITY IDEOGRAPH-2F969 → CJK UNIFIED IDEOGRAPH-7CE3
+ 0xf97b: (0x7ce7,), #  CJK COMPATIBILITY IDEOGRAPH-F97B → CJK UNIFIED IDEOGRAPH-7CE7
+ 0x2f77: (0x7cf8,), #  KANGXI RADICAL SILK → CJK UNIFIED IDEOGRAPH-7CF8
+ 0x2eaf: (0x7cf9,), #  CJK RADICAL SILK → CJK UNIFIED IDEOGRAPH-7CF9
+ 0x2f96b: (0x25f86,), #  CJK COMPATIBILITY IDEOGRAPH-2F96B → CJK UNIFIED IDEOGRAPH-25F86
+ 0x2f96a: (0x7d00,), #  CJK COMPATIBILITY IDEOGRAPH-2F96A → CJK UNIFIED IDEOGRAPH-7D00
+ 0xf9cf: (0x7d10,), #  CJK COMPATIBILITY IDEOGRAPH-F9CF → CJK UNIFIED IDEOGRAPH-7D10
+ 0xf96a: (0x7d22,), #  CJK COMPATIBILITY IDEOGRAPH-F96A → CJK UNIFIED IDEOGRAPH-7D22
+ 0xf94f: (0x7d2f,), #  CJK COMPATIBILITY IDEOGRAPH-F94F → CJK UNIFIED IDEOGRAPH-7D2F
+ 0x7d76: (0x7d55,), #  CJK UNIFIED IDEOGRAPH-7D76 → CJK UNIFIED IDEOGRAPH-7D55
+ 0x2f96c: (0x7d63,), #  CJK COMPATIBILITY IDEOGRAPH-2F96C → CJK UNIFIED IDEOGRAPH-7D63
+ 0xfaaf: (0x7d5b,), #  CJK COMPATIBILITY IDEOGRAPH-FAAF → CJK UNIFIED IDEOGRAPH-7D5B
+ 0xf93d: (0x7da0,), #  CJK COMPATIBILITY IDEOGRAPH-F93D → CJK UNIFIED IDEOGRAPH-7DA0
+ 0xf957: (0x7dbe,), #  CJK COMPATIBILITY IDEOGRAPH-F957 → CJK UNIFIED IDEOGRAPH-7DBE
+ 0x2f96e: (0x7dc7,), #  CJK COMPATIBILITY IDEOGRAPH-2F96E → CJK UNIFIED IDEOGRAPH-7DC7
+ 0xf996: (0x7df4,), #  CJK COMPATIBILITY IDEOGRAPH-F996 → CJK UNIFIED IDEOGRAPH-7DF4
+ 0xfa57: (0x7df4,), #  CJK COMPATIBILITY IDEOGRAPH-FA57 → CJK UNIFIED IDEOGRAPH-7DF4
+ 0xfab0: (0x7df4,), #  CJK COMPATIBILITY IDEOGRAPH-FAB0 → CJK UNIFIED IDEOGRAPH-7DF4
+ 0x2f96f: (0x7e02,), #  CJK COMPATIBILITY IDEOGRAPH-2F96F → CJK UNIFIED IDEOGRAPH-7E02
+ 0x2f96d: (0x4301,), #  CJK COMPATIBILITY IDEOGRAPH-2F96D → CJK UNIFIED IDEOGRAPH-4301
+ 0xfa58: (0x7e09,), #  CJK COMPATIBILITY IDEOGRAPH-FA58 → CJK UNIFIED IDEOGRAPH-7E09
+ 0xf950: (0x7e37,), #  CJK COMPATIBILITY IDEOGRAPH-F950 → CJK UNIFIED IDEOGRAPH-7E37
+ 0xfa59: (0x7e41,), #  CJK COMPATIBILITY IDEOGRAPH-FA59 → CJK UNIFIED IDEOGRAPH-7E41
+ 0x2f970: (0x7e45,), #  CJK COMPATIBILITY IDEOGRAPH-2F970 → CJK UNIFIED IDEOGRAPH-7E45
+ 0x2f898: (0x261da,), #  CJK COMPATIBILITY IDEOGRAPH-2F898 → CJK UNIFIED IDEOGRAPH-261DA
+ 0x2f971: (0x4334,), #  CJK COMPATIBILITY IDEOGRAPH-2F971 → CJK UNIFIED IDEOGRAPH-4334
+ 0x2f78: (0x7f36,), #  KANGXI RADICAL JAR → CJK UNIFIED IDEOGRAPH-7F36
+ 0x2f972: (0x26228,), #  CJK COMPATIBILITY IDEOGRAPH-2F972 → CJK UNIFIED IDEOGRAPH-26228
+ 0xfab1: (0x7f3e,), #  CJK COMPATIBILITY IDEOGRAPH-FAB1 → CJK UNIFIED IDEOGRAPH-7F3E
+ 0x2f973: (0x26247,), #  CJK COMPATIBILITY IDEOGRAPH-2F973 → CJK UNIFIED IDEOGRAPH-26247
+ 0x2f79: (0x7f51,), #  KANGXI RADICAL NET → CJK UNIFIED IDEOGRAPH-7F51
+ 0x2eab: (0x7f52,), #  CJK RADICAL EYE → CJK UNIFIED IDEOGRAPH-7F52
+ 0x2eb2: (0x7f52,), #  CJK RADICAL NET TWO → CJK UNIFIED IDEOGRAPH-7F52
+ 0x2eb1: (0x7f53,), #  CJK RADICAL NET ONE → CJK UNIFIED IDEOGRAPH-7F53
+ 0x2f974: (0x4359,), #  CJK COMPATIBILITY IDEOGRAPH-2F974 → CJK UNIFIED IDEOGRAPH-4359
+ 0xfa5a: (0x7f72,), #  CJK COMPATIBILITY IDEOGRAPH-FA5A → CJK UNIFIED IDEOGRAPH-7F72
+ 0x2f975: (0x262d9,), #  CJK COMPATIBILITY IDEOGRAPH-2F975 → CJK UNIFIED IDEOGRAPH-262D9
+ 0xf9e6: (0x7f79,), #  CJK COMPATIBILITY IDEOGRAPH-F9E6 → CJK UNIFIED IDEOGRAPH-7F79
+ 0x2f976: (0x7f7a,), #  CJK COMPATIBILITY IDEOGRAPH-2F976 → CJK UNIFIED IDEOGRAPH-7F7A
+ 0xf90f: (0x7f85,), #  CJK COMPATIBILITY IDEOGRAPH-F90F → CJK UNIFIED IDEOGRAPH-7F85
+ 0x2f977: (0x2633e,), #  CJK COMPATIBILITY IDEOGRAPH-2F977 → CJK UNIFIED IDEOGRAPH-2633E
+ 0x2f7a: (0x7f8a,), #  KANGXI RADICAL SHEEP → CJK UNIFIED IDEOGRAPH-7F8A
+ 0x2f978: (0x7f95,), #  CJK COMPATIBILITY IDEOGRAPH-2F978 → CJK UNIFIED IDEOGRAPH-7F95
+ 0xf9af: (0x7f9a,), #  CJK COMPATIBILITY IDEOGRAPH-F9AF → CJK UNIFIED IDEOGRAPH-7F9A
+ 0xfa1e: (0x7fbd,), #  CJK COMPATIBILITY IDEOGRAPH-FA1E → CJK UNIFIED IDEOGRAPH-7FBD
+ 0x2f7b: (0x7fbd,), #  KANGXI RADICAL FEATHER → CJK UNIFIED IDEOGRAPH-7FBD
+ 0x2f979: (0x7ffa,), #  CJK COMPATIBILITY IDEOGRAPH-2F979 → CJK UNIFIED IDEOGRAPH-7FFA
+ 0xf934: (0x8001,), #  CJK COMPATIBILITY IDEOGRAPH-F934 → CJK UNIFIED IDEOGRAPH-8001
+ 0x2f7c: (0x8001,), #  KANGXI RADICAL OLD → CJK UNIFIED IDEOGRAPH-8001
+ 0x2eb9: (0x8002,), #  CJK RADICAL OLD → CJK UNIFIED IDEOGRAPH-8002
+ 0xfa5b: (0x8005,), #  CJK COMPATIBILITY IDEOGRAPH-FA5B → CJK UNIFIED IDEOGRAPH-8005
+ 0xfab2: (0x8005,), #  CJK COMPATIBILITY IDEOGRAPH-FAB2 → CJK UNIFIED IDEOGRAPH-8005
+ 0x2f97a: (0x8005,), #  CJK COMPATIBILITY IDEOGRAPH-2F97A → CJK UNIFIED IDEOGRAPH-8005
+ 0x2f7d: (0x800c,), #  KANGXI RADICAL AND → CJK UNIFIED IDEOGRAPH-800C
+ 0x2f97b: (0x264da,), #  CJK COMPATIBILITY IDEOGRAPH-2F97B → CJK UNIFIED IDEOGRAPH-264DA
+ 0x2f7e: (0x8012,), #  KANGXI RADICAL PLOW → CJK UNIFIED IDEOGRAPH-8012
+ 0x2f97c: (0x26523,), #  CJK COMPATIBILITY IDEOGRAPH-2F97C → CJK UNIFIED IDEOGRAPH-26523
+ 0x2f7f: (0x8033,), #  KANGXI RADICAL EAR → CJK UNIFIED IDEOGRAPH-8033
+ 0xf9b0: (0x8046,), #  CJK COMPATIBILITY IDEOGRAPH-F9B0 → CJK UNIFIED IDEOGRAPH-8046
+ 0x2f97d: (0x8060,), #  CJK COMPATIBILITY IDEOGRAPH-2F97D → CJK UNIFIED IDEOGRAPH-8060
+ 0x2f97e: (0x265a8,), #  CJK COMPATIBILITY IDEOGRAPH-2F97E → CJK UNIFIED IDEOGRAPH-265A8
+ 0xf997: (0x806f,), #  CJK COMPATIBILITY IDEOGRAPH-F997 → CJK UNIFIED IDEOGRAPH-806F
+ 0x2f97f: (0x8070,), #  CJK COMPATIBILITY IDEOGRAPH-2F97F → CJK UNIFIED IDEOGRAPH-8070
+ 0xf945: (0x807e,), #  CJK COMPATIBILITY IDEOGRAPH-F945 → CJK UNIFIED IDEOGRAPH-807E
+ 0x2f80: (0x807f,), #  KANGXI RADICAL BRUSH → CJK UNIFIED IDEOGRAPH-807F
+ 0x2eba: (0x8080,), #  CJK RADICAL BRUSH ONE → CJK UNIFIED IDEOGRAPH-8080
+ 0x2f81: (0x8089,), #  KANGXI RADICAL MEAT → CJK UNIFIED IDEOGRAPH-8089
+ 0xf953: (0x808b,), #  CJK COMPATIBILITY IDEOGRAPH-F953 → CJK UNIFIED IDEOGRAPH-808B
+ 0x2f8d6: (0x80ad,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D6 → CJK UNIFIED IDEOGRAPH-80AD
+ 0x2f982: (0x80b2,), #  CJK COMPATIBILITY IDEOGRAPH-2F982 → CJK UNIFIED IDEOGRAPH-80B2
+ 0x2f981: (0x43d5,), #  CJK COMPATIBILITY IDEOGRAPH-2F981 → CJK UNIFIED IDEOGRAPH-43D5
+ 0x2f8d7: (0x43d9,), #  CJK COMPATIBILITY IDEOGRAPH-2F8D7 → CJK UNIFIED IDEOGRAPH-43D9
+ 0x8141: (0x80fc,), #  CJK UNIFIED IDEOGRAPH-8141 → CJK UNIFIED IDEOGRAPH-80FC
+ 0x2f983: (0x8103,), #  CJK COMPATIBILITY IDEOGRAPH-2F983 → CJK UNIFIED IDEOGRAPH-8103
+ 0x2f985: (0x813e,), #  CJK COMPATIBILITY IDEOGRAPH-2F985 → CJK UNIFIED IDEOGRAPH-813E
+ 0x2f984: (0x440b,), #  CJK COMPATIBILITY IDEOGRAPH-2F984 → CJK UNIFIED IDEOGRAPH-440B
+ 0x2f987: (0x267a7,), #  CJK COMPATIBILITY IDEOGRAPH-2F987 → CJK UNIFIED IDEOGRAPH-267A7
+ 0x2f988: (0x267b5,), #  CJK COMPATIBILITY IDEOGRAPH-2F988 → CJK UNIFIED IDEOGRAPH-267B5
+ 0x6726: (0x4443,), #  CJK UNIFIED IDEOGRAPH-6726 → CJK UNIFIED IDEOGRAPH-4443
+ 0xf926: (0x81d8,), #  CJK COMPATIBILITY IDEOGRAPH-F926 → CJK UNIFIED IDEOGRAPH-81D8
+ 0x2f82: (0x81e3,), #  KANGXI RADICAL MINISTER → CJK UNIFIED IDEOGRAPH-81E3
+ 0xf9f6: (0x81e8,), #  CJK COMPATIBILITY IDEOGRAPH-F9F6 → CJK UNIFIED IDEOGRAPH-81E8
+ 0x2f83: (0x81ea,), #  KANGXI RADICAL SELF → CJK UNIFIED IDEOGRAPH-81EA
+ 0xfa5c: (0x81ed,), #  CJK COMPATIBILITY IDEOGRAPH-FA5C → CJK UNIFIED IDEOGRAPH-81ED
+ 0x2f84: (0x81f3,), #  KANGXI RADICAL ARRIVE → CJK UNIFIED IDEOGRAPH-81F3
+ 0x2f85: (0x81fc,), #  KANGXI RADICAL MORTAR → CJK UNIFIED IDEOGRAPH-81FC
+ 0x2f893: (0x8201,), #  CJK COMPATIBILITY IDEOGRAPH-2F893 → CJK UNIFIED IDEOGRAPH-8201
+ 0x2f98b: (0x8201,), #  CJK COMPATIBILITY IDEOGRAPH-2F98B → CJK UNIFIED IDEOGRAPH-8201
+ 0x2f98c: (0x8204,), #  CJK COMPATIBILITY IDEOGRAPH-2F98C → CJK UNIFIED IDEOGRAPH-8204
+ 0x2f86: (0x820c,), #  KANGXI RADICAL TONGUE → CJK UNIFIED IDEOGRAPH-820C
+ 0xfa6d: (0x8218,), #  CJK COMPATIBILITY IDEOGRAPH-FA6D → CJK UNIFIED IDEOGRAPH-8218
+ 0x2f87: (0x821b,), #  KANGXI RADICAL OPPOSE → CJK UNIFIED IDEOGRAPH-821B
+ 0x2f88: (0x821f,), #  KANGXI RADICAL BOAT → CJK UNIFIED IDEOGRAPH-821F
+ 0x2f98e: (0x446b,), #  CJK COMPATIBILITY IDEOGRAPH-2F98E → CJK UNIFIED IDEOGRAPH-446B
+ 0x2f89: (0x826e,), #  KANGXI RADICAL STOPPING → CJK UNIFIED IDEOGRAPH-826E
+ 0xf97c: (0x826f,), #  CJK COMPATIBILITY IDEOGRAPH-F97C → CJK UNIFIED IDEOGRAPH-826F
+ 0x2f8a: (0x8272,), #  KANGXI RADICAL COLOR → CJK UNIFIED IDEOGRAPH-8272
+ 0x2f8b: (0x8278,), #  KANGXI RADICAL GRASS → CJK UNIFIED IDEOGRAPH-8278
+ 0xfa5d: (0x8279,), #  CJK COMPATIBILITY IDEOGRAPH-FA5D → CJK UNIFIED IDEOGRAPH-8279
+ 0xfa5e: (0x8279,), #  CJK COMPATIBILITY IDEOGRAPH-FA5E → CJK UNIFIED IDEOGRAPH-8279
+ 0x2ebe: (0x8279,), #  CJK RADICAL GRASS ONE → CJK UNIFIED IDEOGRAPH-8279
+ 0x2ebf: (0x8279,), #  CJK RADICAL GRASS TWO → CJK UNIFIED IDEOGRAPH-8279	# →艹→
+ 0x2ec0: (0x8279,), #  CJK RADICAL GRASS THREE → CJK UNIFIED IDEOGRAPH-8279	# →艹→
+ 0x2f990: (0x828b,), #  CJK COMPATIBILITY IDEOGRAPH-2F990 → CJK UNIFIED IDEOGRAPH-828B
+ 0x2f98f: (0x8291,), #  CJK COMPATIBILITY IDEOGRAPH-2F98F → CJK UNIFIED IDEOGRAPH-8291
+ 0x2f991: (0x829d,), #  CJK COMPATIBILITY IDEOGRAPH-2F991 → CJK UNIFIED IDEOGRAPH-829D
+ 0x2f993: (0x82b1,), #  CJK COMPATIBILITY IDEOGRAPH-2F993 → CJK UNIFIED IDEOGRAPH-82B1
+ 0x2f994: (0x82b3,), #  CJK COMPATIBILITY IDEOGRAPH-2F994 → CJK UNIFIED IDEOGRAPH-82B3
+ 0x2f995: (0x82bd,), #  CJK COMPATIBILITY IDEOGRAPH-2F995 → CJK UNIFIED IDEOGRAPH-82BD
+ 0xf974: (0x82e5,), #  CJK COMPATIBILITY IDEOGRAPH-F974 → CJK UNIFIED IDEOGRAPH-82E5
+ 0x2f998: (0x82e5,), #  CJK COMPATIBILITY IDEOGRAPH-2F998 → CJK UNIFIED IDEOGRAPH-82E5
+ 0x2f996: (0x82e6,), #  CJK COMPATIBILITY IDEOGRAPH-2F996 → CJK UNIFIED IDEOGRAPH-82E6
+ 0x2f997: (0x26b3c,), #  CJK COMPATIBILITY IDEOGRAPH-2F997 → CJK UNIFIED IDEOGRAPH-26B3C
+ 0xf9fe: (0x8336,), #  CJK COMPATIBILITY IDEOGRAPH-F9FE → CJK UNIFIED IDEOGRAPH-8336
+ 0xfab3: (0x8352,), #  CJK COMPATIBILITY IDEOGRAPH-FAB3 → CJK UNIFIED IDEOGRAPH-8352
+ 0x2f99a: (0x8363,), #  CJK COMPATIBILITY IDEOGRAPH-2F99A → CJK UNIFIED IDEOGRAPH-8363
+ 0x2f999: (0x831d,), #  CJK COMPATIBILITY IDEOGRAPH-2F999 → CJK UNIFIED IDEOGRAPH-831D
+ 0x2f99c: (0x8323,), #  CJK COMPATIBILITY IDEOGRAPH-2F99C → CJK UNIFIED IDEOGRAPH-8323
+ 0x2f99d: (0x83bd,), #  CJK COMPATIBILITY IDEOGRAPH-2F99D → CJK UNIFIED IDEOGRAPH-83BD
+ 0x2f9a0: (0x8353,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A0 → CJK UNIFIED IDEOGRAPH-8353
+ 0xf93e: (0x83c9,), #  CJK COMPATIBILITY IDEOGRAPH-F93E → CJK UNIFIED IDEOGRAPH-83C9
+ 0x2f9a1: (0x83ca,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A1 → CJK UNIFIED IDEOGRAPH-83CA
+ 0x2f9a2: (0x83cc,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A2 → CJK UNIFIED IDEOGRAPH-83CC
+ 0x2f9a3: (0x83dc,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A3 → CJK UNIFIED IDEOGRAPH-83DC
+ 0x2f99e: (0x83e7,), #  CJK COMPATIBILITY IDEOGRAPH-2F99E → CJK UNIFIED IDEOGRAPH-83E7
+ 0xfab4: (0x83ef,), #  CJK COMPATIBILITY IDEOGRAPH-FAB4 → CJK UNIFIED IDEOGRAPH-83EF
+ 0xf958: (0x83f1,), #  CJK COMPATIBILITY IDEOGRAPH-F958 → CJK UNIFIED IDEOGRAPH-83F1
+ 0xfa5f: (0x8457,), #  CJK COMPATIBILITY IDEOGRAPH-FA5F → CJK UNIFIED IDEOGRAPH-8457
+ 0x2f99f: (0x8457,), #  CJK COMPATIBILITY IDEOGRAPH-2F99F → CJK UNIFIED IDEOGRAPH-8457
+ 0x2f9a4: (0x26c36,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A4 → CJK UNIFIED IDEOGRAPH-26C36
+ 0x2f99b: (0x83ad,), #  CJK COMPATIBILITY IDEOGRAPH-2F99B → CJK UNIFIED IDEOGRAPH-83AD
+ 0xf918: (0x843d,), #  CJK COMPATIBILITY IDEOGRAPH-F918 → CJK UNIFIED IDEOGRAPH-843D
+ 0xf96e: (0x8449,), #  CJK COMPATIBILITY IDEOGRAPH-F96E → CJK UNIFIED IDEOGRAPH-8449
+ 0x853f: (0x848d,), #  CJK UNIFIED IDEOGRAPH-853F → CJK UNIFIED IDEOGRAPH-848D
+ 0x2f9a6: (0x26cd5,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A6 → CJK UNIFIED IDEOGRAPH-26CD5
+ 0x2f9a5: (0x26d6b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A5 → CJK UNIFIED IDEOGRAPH-26D6B
+ 0xf999: (0x84ee,), #  CJK COMPATIBILITY IDEOGRAPH-F999 → CJK UNIFIED IDEOGRAPH-84EE
+ 0x2f9a8: (0x84f1,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A8 → CJK UNIFIED IDEOGRAPH-84F1
+ 0x2f9a9: (0x84f3,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A9 → CJK UNIFIED IDEOGRAPH-84F3
+ 0xf9c2: (0x84fc,), #  CJK COMPATIBILITY IDEOGRAPH-F9C2 → CJK UNIFIED IDEOGRAPH-84FC
+ 0x2f9aa: (0x8516,), #  CJK COMPATIBILITY IDEOGRAPH-2F9AA → CJK UNIFIED IDEOGRAPH-8516
+ 0x2f9a7: (0x452b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9A7 → CJK UNIFIED IDEOGRAPH-452B
+ 0x2f9ac: (0x8564,), #  CJK COMPATIBILITY IDEOGRAPH-2F9AC → CJK UNIFIED IDEOGRAPH-8564
+ 0x2f9ad: (0x26f2c,), #  CJK COMPATIBILITY IDEOGRAPH-2F9AD → CJK UNIFIED IDEOGRAPH-26F2C
+ 0xf923: (0x85cd,), #  CJK COMPATIBILITY IDEOGRAPH-F923 → CJK UNIFIED IDEOGRAPH-85CD
+ 0x2f9ae: (0x455d,), #  CJK COMPATIBILITY IDEOGRAPH-2F9AE → CJK UNIFIED IDEOGRAPH-455D
+ 0x2f9b0: (0x26fb1,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B0 → CJK UNIFIED IDEOGRAPH-26FB1
+ 0x2f9af: (0x4561,), #  CJK COMPATIBILITY IDEOGRAPH-2F9AF → CJK UNIFIED IDEOGRAPH-4561
+ 0xf9f0: (0x85fa,), #  CJK COMPATIBILITY IDEOGRAPH-F9F0 → CJK UNIFIED IDEOGRAPH-85FA
+ 0xf935: (0x8606,), #  CJK COMPATIBILITY IDEOGRAPH-F935 → CJK UNIFIED IDEOGRAPH-8606
+ 0x2f9b2: (0x456b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B2 → CJK UNIFIED IDEOGRAPH-456B
+ 0xfa20: (0x8612,), #  CJK COMPATIBILITY IDEOGRAPH-FA20 → CJK UNIFIED IDEOGRAPH-8612
+ 0xf91f: (0x862d,), #  CJK COMPATIBILITY IDEOGRAPH-F91F → CJK UNIFIED IDEOGRAPH-862D
+ 0x2f9b1: (0x270d2,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B1 → CJK UNIFIED IDEOGRAPH-270D2
+ 0x8641: (0x8637,), #  CJK UNIFIED IDEOGRAPH-8641 → CJK UNIFIED IDEOGRAPH-8637
+ 0xf910: (0x863f,), #  CJK COMPATIBILITY IDEOGRAPH-F910 → CJK UNIFIED IDEOGRAPH-863F
+ 0x2f8c: (0x864d,), #  KANGXI RADICAL TIGER → CJK UNIFIED IDEOGRAPH-864D
+ 0x2ec1: (0x864e,), #  CJK RADICAL TIGER → CJK UNIFIED IDEOGRAPH-864E
+ 0x2f9b3: (0x8650,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B3 → CJK UNIFIED IDEOGRAPH-8650
+ 0xf936: (0x865c,), #  CJK COMPATIBILITY IDEOGRAPH-F936 → CJK UNIFIED IDEOGRAPH-865C
+ 0x2f9b4: (0x865c,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B4 → CJK UNIFIED IDEOGRAPH-865C
+ 0x2f9b5: (0x8667,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B5 → CJK UNIFIED IDEOGRAPH-8667
+ 0x2f9b6: (0x8669,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B6 → CJK UNIFIED IDEOGRAPH-8669
+ 0x2f8d: (0x866b,), #  KANGXI RADICAL INSECT → CJK UNIFIED IDEOGRAPH-866B
+ 0x2f9b7: (0x86a9,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B7 → CJK UNIFIED IDEOGRAPH-86A9
+ 0x2f9b8: (0x8688,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B8 → CJK UNIFIED IDEOGRAPH-8688
+ 0x2f9ba: (0x86e2,), #  CJK COMPATIBILITY IDEOGRAPH-2F9BA → CJK UNIFIED IDEOGRAPH-86E2
+ 0x2f9b9: (0x870e,), #  CJK COMPATIBILITY IDEOGRAPH-2F9B9 → CJK UNIFIED IDEOGRAPH-870E
+ 0x2f9bc: (0x8728,), #  CJK COMPATIBILITY IDEOGRAPH-2F9BC → CJK UNIFIED IDEOGRAPH-8728
+ 0x2f9bd: (0x876b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9BD → CJK UNIFIED IDEOGRAPH-876B
+ 0x2f9c0: (0x87e1,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C0 → CJK UNIFIED IDEOGRAPH-87E1
+ 0xfab5: (0x8779,), #  CJK COMPATIBILITY IDEOGRAPH-FAB5 → CJK UNIFIED IDEOGRAPH-8779
+ 0x2f9bb: (0x8779,), #  CJK COMPATIBILITY IDEOGRAPH-2F9BB → CJK UNIFIED IDEOGRAPH-8779
+ 0x2f9be: (0x8786,), #  CJK COMPATIBILITY IDEOGRAPH-2F9BE → CJK UNIFIED IDEOGRAPH-8786
+ 0x2f9bf: (0x45d7,), #  CJK COMPATIBILITY IDEOGRAPH-2F9BF → CJK UNIFIED IDEOGRAPH-45D7
+ 0x2f9ab: (0x273ca,), #  CJK COMPATIBILITY IDEOGRAPH-2F9AB → CJK UNIFIED IDEOGRAPH-273CA
+ 0xf911: (0x87ba,), #  CJK COMPATIBILITY IDEOGRAPH-F911 → CJK UNIFIED IDEOGRAPH-87BA
+ 0x2f9c1: (0x8801,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C1 → CJK UNIFIED IDEOGRAPH-8801
+ 0x2f9c2: (0x45f9,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C2 → CJK UNIFIED IDEOGRAPH-45F9
+ 0xf927: (0x881f,), #  CJK COMPATIBILITY IDEOGRAPH-F927 → CJK UNIFIED IDEOGRAPH-881F
+ 0x2f8e: (0x8840,), #  KANGXI RADICAL BLOOD → CJK UNIFIED IDEOGRAPH-8840
+ 0xfa08: (0x884c,), #  CJK COMPATIBILITY IDEOGRAPH-FA08 → CJK UNIFIED IDEOGRAPH-884C
+ 0x2f8f: (0x884c,), #  KANGXI RADICAL WALK ENCLOSURE → CJK UNIFIED IDEOGRAPH-884C
+ 0x2f9c3: (0x8860,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C3 → CJK UNIFIED IDEOGRAPH-8860
+ 0x2f9c4: (0x8863,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C4 → CJK UNIFIED IDEOGRAPH-8863
+ 0x2f90: (0x8863,), #  KANGXI RADICAL CLOTHES → CJK UNIFIED IDEOGRAPH-8863
+ 0x2ec2: (0x8864,), #  CJK RADICAL CLOTHES → CJK UNIFIED IDEOGRAPH-8864
+ 0xf9a0: (0x88c2,), #  CJK COMPATIBILITY IDEOGRAPH-F9A0 → CJK UNIFIED IDEOGRAPH-88C2
+ 0x2f9c5: (0x27667,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C5 → CJK UNIFIED IDEOGRAPH-27667
+ 0xf9e7: (0x88cf,), #  CJK COMPATIBILITY IDEOGRAPH-F9E7 → CJK UNIFIED IDEOGRAPH-88CF
+ 0x2f9c6: (0x88d7,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C6 → CJK UNIFIED IDEOGRAPH-88D7
+ 0x2f9c7: (0x88de,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C7 → CJK UNIFIED IDEOGRAPH-88DE
+ 0xf9e8: (0x88e1,), #  CJK COMPATIBILITY IDEOGRAPH-F9E8 → CJK UNIFIED IDEOGRAPH-88E1
+ 0xf912: (0x88f8,), #  CJK COMPATIBILITY IDEOGRAPH-F912 → CJK UNIFIED IDEOGRAPH-88F8
+ 0x2f9c9: (0x88fa,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C9 → CJK UNIFIED IDEOGRAPH-88FA
+ 0x2f9c8: (0x4635,), #  CJK COMPATIBILITY IDEOGRAPH-2F9C8 → CJK UNIFIED IDEOGRAPH-4635
+ 0xfa60: (0x8910,), #  CJK COMPATIBILITY IDEOGRAPH-FA60 → CJK UNIFIED IDEOGRAPH-8910
+ 0xfab6: (0x8941,), #  CJK COMPATIBILITY IDEOGRAPH-FAB6 → CJK UNIFIED IDEOGRAPH-8941
+ 0xf924: (0x8964,), #  CJK COMPATIBILITY IDEOGRAPH-F924 → CJK UNIFIED IDEOGRAPH-8964
+ 0x2f91: (0x897e,), #  KANGXI RADICAL WEST → CJK UNIFIED IDEOGRAPH-897E
+ 0x2ec4: (0x897f,), #  CJK RADICAL WEST TWO → CJK UNIFIED IDEOGRAPH-897F
+ 0x2ec3: (0x8980,), #  CJK RADICAL WEST ONE → CJK UNIFIED IDEOGRAPH-8980
+ 0xfab7: (0x8986,), #  CJK COMPATIBILITY IDEOGRAPH-FAB7 → CJK UNIFIED IDEOGRAPH-8986
+ 0xfa0a: (0x898b,), #  CJK COMPATIBILITY IDEOGRAPH-FA0A → CJK UNIFIED IDEOGRAPH-898B
+ 0x2f92: (0x898b,), #  KANGXI RADICAL SEE → CJK UNIFIED IDEOGRAPH-898B
+ 0x2f9cb: (0x278ae,), #  CJK COMPATIBILITY IDEOGRAPH-2F9CB → CJK UNIFIED IDEOGRAPH-278AE
+ 0x2ec5: (0x89c1,), #  CJK RADICAL C-SIMPLIFIED SEE → CJK UNIFIED IDEOGRAPH-89C1
+ 0x2f93: (0x89d2,), #  KANGXI RADICAL HORN → CJK UNIFIED IDEOGRAPH-89D2
+ 0x2f94: (0x8a00,), #  KANGXI RADICAL SPEECH → CJK UNIFIED IDEOGRAPH-8A00
+ 0x2f9cc: (0x27966,), #  CJK COMPATIBILITY IDEOGRAPH-2F9CC → CJK UNIFIED IDEOGRAPH-27966
+ 0x8a7d: (0x8a2e,), #  CJK UNIFIED IDEOGRAPH-8A7D → CJK UNIFIED IDEOGRAPH-8A2E
+ 0x8a1e: (0x46b6,), #  CJK UNIFIED IDEOGRAPH-8A1E → CJK UNIFIED IDEOGRAPH-46B6
+ 0x2f9cd: (0x46be,), #  CJK COMPATIBILITY IDEOGRAPH-2F9CD → CJK UNIFIED IDEOGRAPH-46BE
+ 0x2f9ce: (0x46c7,), #  CJK COMPATIBILITY IDEOGRAPH-2F9CE → CJK UNIFIED IDEOGRAPH-46C7
+ 0x2f9cf: (0x8aa0,), #  CJK COMPATIBILITY IDEOGRAPH-2F9CF → CJK UNIFIED IDEOGRAPH-8AA0
+ 0xf96f: (0x8aaa,), #  CJK COMPATIBILITY IDEOGRAPH-F96F → CJK UNIFIED IDEOGRAPH-8AAA
+ 0xf9a1: (0x8aaa,), #  CJK COMPATIBILITY IDEOGRAPH-F9A1 → CJK UNIFIED IDEOGRAPH-8AAA
+ 0xfab9: (0x8abf,), #  CJK COMPATIBILITY IDEOGRAPH-FAB9 → CJK UNIFIED IDEOGRAPH-8ABF
+ 0xfabb: (0x8acb,), #  CJK COMPATIBILITY IDEOGRAPH-FABB → CJK UNIFIED IDEOGRAPH-8ACB
+ 0xf97d: (0x8ad2,), #  CJK COMPATIBILITY IDEOGRAPH-F97D → CJK UNIFIED IDEOGRAPH-8AD2
+ 0xf941: (0x8ad6,), #  CJK COMPATIBILITY IDEOGRAPH-F941 → CJK UNIFIED IDEOGRAPH-8AD6
+ 0xfabe: (0x8aed,), #  CJK COMPATIBILITY IDEOGRAPH-FABE → CJK UNIFIED IDEOGRAPH-8AED
+ 0x2f9d0: (0x8aed,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D0 → CJK UNIFIED IDEOGRAPH-8AED
+ 0xfa22: (0x8af8,), #  CJK COMPATIBILITY IDEOGRAPH-FA22 → CJK UNIFIED IDEOGRAPH-8AF8
+ 0xfaba: (0x8af8,), #  CJK COMPATIBILITY IDEOGRAPH-FABA → CJK UNIFIED IDEOGRAPH-8AF8
+ 0xf95d: (0x8afe,), #  CJK COMPATIBILITY IDEOGRAPH-F95D → CJK UNIFIED IDEOGRAPH-8AFE
+ 0xfabd: (0x8afe,), #  CJK COMPATIBILITY IDEOGRAPH-FABD → CJK UNIFIED IDEOGRAPH-8AFE
+ 0xfa62: (0x8b01,), #  CJK COMPATIBILITY IDEOGRAPH-FA62 → CJK UNIFIED IDEOGRAPH-8B01
+ 0xfabc: (0x8b01,), #  CJK COMPATIBILITY IDEOGRAPH-FABC → CJK UNIFIED IDEOGRAPH-8B01
+ 0xfa63: (0x8b39,), #  CJK COMPATIBILITY IDEOGRAPH-FA63 → CJK UNIFIED IDEOGRAPH-8B39
+ 0xfabf: (0x8b39,), #  CJK COMPATIBILITY IDEOGRAPH-FABF → CJK UNIFIED IDEOGRAPH-8B39
+ 0xf9fc: (0x8b58,), #  CJK COMPATIBILITY IDEOGRAPH-F9FC → CJK UNIFIED IDEOGRAPH-8B58
+ 0xf95a: (0x8b80,), #  CJK COMPATIBILITY IDEOGRAPH-F95A → CJK UNIFIED IDEOGRAPH-8B80
+ 0x8b8f: (0x8b86,), #  CJK UNIFIED IDEOGRAPH-8B8F → CJK UNIFIED IDEOGRAPH-8B86
+ 0xfac0: (0x8b8a,), #  CJK COMPATIBILITY IDEOGRAPH-FAC0 → CJK UNIFIED IDEOGRAPH-8B8A
+ 0x2f9d1: (0x8b8a,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D1 → CJK UNIFIED IDEOGRAPH-8B8A
+ 0x2ec8: (0x8ba0,), #  CJK RADICAL C-SIMPLIFIED SPEECH → CJK UNIFIED IDEOGRAPH-8BA0
+ 0x2f95: (0x8c37,), #  KANGXI RADICAL VALLEY → CJK UNIFIED IDEOGRAPH-8C37
+ 0x2f96: (0x8c46,), #  KANGXI RADICAL BEAN → CJK UNIFIED IDEOGRAPH-8C46
+ 0xf900: (0x8c48,), #  CJK COMPATIBILITY IDEOGRAPH-F900 → CJK UNIFIED IDEOGRAPH-8C48
+ 0x2f9d2: (0x8c55,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D2 → CJK UNIFIED IDEOGRAPH-8C55
+ 0x2f97: (0x8c55,), #  KANGXI RADICAL PIG → CJK UNIFIED IDEOGRAPH-8C55
+ 0x8c63: (0x8c5c,), #  CJK UNIFIED IDEOGRAPH-8C63 → CJK UNIFIED IDEOGRAPH-8C5C
+ 0x2f98: (0x8c78,), #  KANGXI RADICAL BADGER → CJK UNIFIED IDEOGRAPH-8C78
+ 0x2f9d3: (0x27ca8,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D3 → CJK UNIFIED IDEOGRAPH-27CA8
+ 0x2f99: (0x8c9d,), #  KANGXI RADICAL SHELL → CJK UNIFIED IDEOGRAPH-8C9D
+ 0x2f9d4: (0x8cab,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D4 → CJK UNIFIED IDEOGRAPH-8CAB
+ 0x2f9d5: (0x8cc1,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D5 → CJK UNIFIED IDEOGRAPH-8CC1
+ 0xf948: (0x8cc2,), #  CJK COMPATIBILITY IDEOGRAPH-F948 → CJK UNIFIED IDEOGRAPH-8CC2
+ 0xf903: (0x8cc8,), #  CJK COMPATIBILITY IDEOGRAPH-F903 → CJK UNIFIED IDEOGRAPH-8CC8
+ 0xfa64: (0x8cd3,), #  CJK COMPATIBILITY IDEOGRAPH-FA64 → CJK UNIFIED IDEOGRAPH-8CD3
+ 0xfa65: (0x8d08,), #  CJK COMPATIBILITY IDEOGRAPH-FA65 → CJK UNIFIED IDEOGRAPH-8D08
+ 0xfac1: (0x8d08,), #  CJK COMPATIBILITY IDEOGRAPH-FAC1 → CJK UNIFIED IDEOGRAPH-8D08
+ 0x2f9d6: (0x8d1b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D6 → CJK UNIFIED IDEOGRAPH-8D1B
+ 0x2ec9: (0x8d1d,), #  CJK RADICAL C-SIMPLIFIED SHELL → CJK UNIFIED IDEOGRAPH-8D1D
+ 0x2f9a: (0x8d64,), #  KANGXI RADICAL RED → CJK UNIFIED IDEOGRAPH-8D64
+ 0x2f9b: (0x8d70,), #  KANGXI RADICAL RUN → CJK UNIFIED IDEOGRAPH-8D70
+ 0x2f9d7: (0x8d77,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D7 → CJK UNIFIED IDEOGRAPH-8D77
+ 0x8d86: (0x8d7f,), #  CJK UNIFIED IDEOGRAPH-8D86 → CJK UNIFIED IDEOGRAPH-8D7F
+ 0xfad7: (0x27ed3,), #  CJK COMPATIBILITY IDEOGRAPH-FAD7 → CJK UNIFIED IDEOGRAPH-27ED3
+ 0x2f9d8: (0x27f2f,), #  CJK COMPATIBILITY IDEOGRAPH-2F9D8 → CJK UNIFIED IDEOGRAPH-27F2F
+ 0x2f9c: (0x8db3,), #  KANGXI RADICAL FOOT → CJK UNIFIED IDEOGRAPH-8DB3
+ 0x2f9da: (0x8dcb,), #  CJK COMPATIBILITY IDEOGRAPH-2F9DA → CJK UNIFIED IDEOGRAPH-8DCB
+ 0x2f9db: (0x8dbc,), #  CJK COMPATIBILITY IDEOGRAPH-2F9DB → CJK UNIFIED IDEOGRAPH-8DBC
+ 0x8dfa: (0x8de5,), #  CJK UNIFIED IDEOGRAPH-8DFA → CJK UNIFIED IDEOGRAPH-8DE5
+ 0xf937: (0x8def,), #  CJK COMPATIBILITY IDEOGRAPH-F937 → CJK UNIFIED IDEOGRAPH-8DEF
+ 0x2f9dc: (0x8df0,), #  CJK COMPATIBILITY IDEOGRAPH-2F9DC → CJK UNIFIED IDEOGRAPH-8DF0
+ 0x8e9b: (0x8e97,), #  CJK UNIFIED IDEOGRAPH-8E9B → CJK UNIFIED IDEOGRAPH-8E97
+ 0x2f9d: (0x8eab,), #  KANGXI RADICAL BODY → CJK UNIFIED IDEOGRAPH-8EAB
+ 0xf902: (0x8eca,), #  CJK COMPATIBILITY IDEOGRAPH-F902 → CJK UNIFIED IDEOGRAPH-8ECA
+ 0x2f9e: (0x8eca,), #  KANGXI RADICAL CART → CJK UNIFIED IDEOGRAPH-8ECA
+ 0x2f9de: (0x8ed4,), #  CJK COMPATIBILITY IDEOGRAPH-2F9DE → CJK UNIFIED IDEOGRAPH-8ED4
+ 0x8f27: (0x8eff,), #  CJK UNIFIED IDEOGRAPH-8F27 → CJK UNIFIED IDEOGRAPH-8EFF
+ 0xf998: (0x8f26,), #  CJK COMPATIBILITY IDEOGRAPH-F998 → CJK UNIFIED IDEOGRAPH-8F26
+ 0xf9d7: (0x8f2a,), #  CJK COMPATIBILITY IDEOGRAPH-F9D7 → CJK UNIFIED IDEOGRAPH-8F2A
+ 0xfac2: (0x8f38,), #  CJK COMPATIBILITY IDEOGRAPH-FAC2 → CJK UNIFIED IDEOGRAPH-8F38
+ 0x2f9df: (0x8f38,), #  CJK COMPATIBILITY IDEOGRAPH-2F9DF → CJK UNIFIED IDEOGRAPH-8F38
+ 0xfa07: (0x8f3b,), #  CJK COMPATIBILITY IDEOGRAPH-FA07 → CJK UNIFIED IDEOGRAPH-8F3B
+ 0xf98d: (0x8f62,), #  CJK COMPATIBILITY IDEOGRAPH-F98D → CJK UNIFIED IDEOGRAPH-8F62
+ 0x2ecb: (0x8f66,), #  CJK RADICAL C-SIMPLIFIED CART → CJK UNIFIED IDEOGRAPH-8F66
+ 0x2f9f: (0x8f9b,), #  KANGXI RADICAL BITTER → CJK UNIFIED IDEOGRAPH-8F9B
+ 0x2f98d: (0x8f9e,), #  CJK COMPATIBILITY IDEOGRAPH-2F98D → CJK UNIFIED IDEOGRAPH-8F9E
+ 0xf971: (0x8fb0,), #  CJK COMPATIBILITY IDEOGRAPH-F971 → CJK UNIFIED IDEOGRAPH-8FB0
+ 0x2fa0: (0x8fb0,), #  KANGXI RADICAL MORNING → CJK UNIFIED IDEOGRAPH-8FB0
+ 0x2fa1: (0x8fb5,), #  KANGXI RADICAL WALK → CJK UNIFIED IDEOGRAPH-8FB5
+ 0xfa66: (0x8fb6,), #  CJK COMPATIBILITY IDEOGRAPH-FA66 → CJK UNIFIED IDEOGRAPH-8FB6
+ 0x2ecc: (0x8fb6,), #  CJK RADICAL SIMPLIFIED WALK → CJK UNIFIED IDEOGRAPH-8FB6
+ 0x2ecd: (0x8fb6,), #  CJK RADICAL WALK ONE → CJK UNIFIED IDEOGRAPH-8FB6
+ 0x2f881: (0x5de1,), #  CJK COMPATIBILITY IDEOGRAPH-2F881 → CJK UNIFIED IDEOGRAPH-5DE1
+ 0xf99a: (0x9023,), #  CJK COMPATIBILITY IDEOGRAPH-F99A → CJK UNIFIED IDEOGRAPH-9023
+ 0xfa25: (0x9038,), #  CJK COMPATIBILITY IDEOGRAPH-FA25 → CJK UNIFIED IDEOGRAPH-9038
+ 0xfa67: (0x9038,), #  CJK COMPATIBILITY IDEOGRAPH-FA67 → CJK UNIFIED IDEOGRAPH-9038
+ 0xfac3: (0x9072,), #  CJK COMPATIBILITY IDEOGRAPH-FAC3 → CJK UNIFIED IDEOGRAPH-9072
+ 0xf9c3: (0x907c,), #  CJK COMPATIBILITY IDEOGRAPH-F9C3 → CJK UNIFIED IDEOGRAPH-907C
+ 0x2f9e0: (0x285d2,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E0 → CJK UNIFIED IDEOGRAPH-285D2
+ 0x2f9e1: (0x285ed,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E1 → CJK UNIFIED IDEOGRAPH-285ED
+ 0xf913: (0x908f,), #  CJK COMPATIBILITY IDEOGRAPH-F913 → CJK UNIFIED IDEOGRAPH-908F
+ 0x2fa2: (0x9091,), #  KANGXI RADICAL CITY → CJK UNIFIED IDEOGRAPH-9091
+ 0x2f9e2: (0x9094,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E2 → CJK UNIFIED IDEOGRAPH-9094
+ 0xf92c: (0x90ce,), #  CJK COMPATIBILITY IDEOGRAPH-F92C → CJK UNIFIED IDEOGRAPH-90CE
+ 0x90de: (0x90ce,), #  CJK UNIFIED IDEOGRAPH-90DE → CJK UNIFIED IDEOGRAPH-90CE	# →郎→
+ 0xfa2e: (0x90ce,), #  CJK COMPATIBILITY IDEOGRAPH-FA2E → CJK UNIFIED IDEOGRAPH-90CE	# →郞→→郎→
+ 0x2f9e3: (0x90f1,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E3 → CJK UNIFIED IDEOGRAPH-90F1
+ 0xfa26: (0x90fd,), #  CJK COMPATIBILITY IDEOGRAPH-FA26 → CJK UNIFIED IDEOGRAPH-90FD
+ 0x2f9e5: (0x2872e,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E5 → CJK UNIFIED IDEOGRAPH-2872E
+ 0x2f9e4: (0x9111,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E4 → CJK UNIFIED IDEOGRAPH-9111
+ 0x2f9e6: (0x911b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E6 → CJK UNIFIED IDEOGRAPH-911B
+ 0x2fa3: (0x9149,), #  KANGXI RADICAL WINE → CJK UNIFIED IDEOGRAPH-9149
+ 0xf919: (0x916a,), #  CJK COMPATIBILITY IDEOGRAPH-F919 → CJK UNIFIED IDEOGRAPH-916A
+ 0xfac4: (0x9199,), #  CJK COMPATIBILITY IDEOGRAPH-FAC4 → CJK UNIFIED IDEOGRAPH-9199
+ 0xf9b7: (0x91b4,), #  CJK COMPATIBILITY IDEOGRAPH-F9B7 → CJK UNIFIED IDEOGRAPH-91B4
+ 0x2fa4: (0x91c6,), #  KANGXI RADICAL DISTINGUISH → CJK UNIFIED IDEOGRAPH-91C6
+ 0xf9e9: (0x91cc,), #  CJK COMPATIBILITY IDEOGRAPH-F9E9 → CJK UNIFIED IDEOGRAPH-91CC
+ 0x2fa5: (0x91cc,), #  KANGXI RADICAL VILLAGE → CJK UNIFIED IDEOGRAPH-91CC
+ 0xf97e: (0x91cf,), #  CJK COMPATIBILITY IDEOGRAPH-F97E → CJK UNIFIED IDEOGRAPH-91CF
+ 0xf90a: (0x91d1,), #  CJK COMPATIBILITY IDEOGRAPH-F90A → CJK UNIFIED IDEOGRAPH-91D1
+ 0x2fa6: (0x91d1,), #  KANGXI RADICAL GOLD → CJK UNIFIED IDEOGRAPH-91D1
+ 0xf9b1: (0x9234,), #  CJK COMPATIBILITY IDEOGRAPH-F9B1 → CJK UNIFIED IDEOGRAPH-9234
+ 0x2f9e7: (0x9238,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E7 → CJK UNIFIED IDEOGRAPH-9238
+ 0xfac5: (0x9276,), #  CJK COMPATIBILITY IDEOGRAPH-FAC5 → CJK UNIFIED IDEOGRAPH-9276
+ 0x2f9e8: (0x92d7,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E8 → CJK UNIFIED IDEOGRAPH-92D7
+ 0x2f9e9: (0x92d8,), #  CJK COMPATIBILITY IDEOGRAPH-2F9E9 → CJK UNIFIED IDEOGRAPH-92D8
+ 0x2f9ea: (0x927c,), #  CJK COMPATIBILITY IDEOGRAPH-2F9EA → CJK UNIFIED IDEOGRAPH-927C
+ 0xf93f: (0x9304,), #  CJK COMPATIBILITY IDEOGRAPH-F93F → CJK UNIFIED IDEOGRAPH-9304
+ 0xf99b: (0x934a,), #  CJK COMPATIBILITY IDEOGRAPH-F99B → CJK UNIFIED IDEOGRAPH-934A
+ 0x93ae: (0x93ad,), #  CJK UNIFIED IDEOGRAPH-93AE → CJK UNIFIED IDEOGRAPH-93AD
+ 0x2f9eb: (0x93f9,), #  CJK COMPATIBILITY IDEOGRAPH-2F9EB → CJK UNIFIED IDEOGRAPH-93F9
+ 0x2f9ec: (0x9415,), #  CJK COMPATIBILITY IDEOGRAPH-2F9EC → CJK UNIFIED IDEOGRAPH-9415
+ 0x2f9ed: (0x28bfa,), #  CJK COMPATIBILITY IDEOGRAPH-2F9ED → CJK UNIFIED IDEOGRAPH-28BFA
+ 0x2ed0: (0x9485,), #  CJK RADICAL C-SIMPLIFIED GOLD → CJK UNIFIED IDEOGRAPH-9485
+ 0x2ed1: (0x9577,), #  CJK RADICAL LONG ONE → CJK UNIFIED IDEOGRAPH-9577
+ 0x2fa7: (0x9577,), #  KANGXI RADICAL LONG → CJK UNIFIED IDEOGRAPH-9577
+ 0x2ed2: (0x9578,), #  CJK RADICAL LONG TWO → CJK UNIFIED IDEOGRAPH-9578
+ 0x2ed3: (0x957f,), #  CJK RADICAL C-SIMPLIFIED LONG → CJK UNIFIED IDEOGRAPH-957F
+ 0x2fa8: (0x9580,), #  KANGXI RADICAL GATE → CJK UNIFIED IDEOGRAPH-9580
+ 0x2f9ee: (0x958b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9EE → CJK UNIFIED IDEOGRAPH-958B
+ 0x2f9ef: (0x4995,), #  CJK COMPATIBILITY IDEOGRAPH-2F9EF → CJK UNIFIED IDEOGRAPH-4995
+ 0xf986: (0x95ad,), #  CJK COMPATIBILITY IDEOGRAPH-F986 → CJK UNIFIED IDEOGRAPH-95AD
+ 0x2f9f0: (0x95b7,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F0 → CJK UNIFIED IDEOGRAPH-95B7
+ 0x2f9f1: (0x28d77,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F1 → CJK UNIFIED IDEOGRAPH-28D77
+ 0x2ed4: (0x95e8,), #  CJK RADICAL C-SIMPLIFIED GATE → CJK UNIFIED IDEOGRAPH-95E8
+ 0x2fa9: (0x961c,), #  KANGXI RADICAL MOUND → CJK UNIFIED IDEOGRAPH-961C
+ 0x2ecf: (0x961d,), #  CJK RADICAL CITY → CJK UNIFIED IDEOGRAPH-961D
+ 0x2ed6: (0x961d,), #  CJK RADICAL MOUND TWO → CJK UNIFIED IDEOGRAPH-961D
+ 0xf9c6: (0x962e,), #  CJK COMPATIBILITY IDEOGRAPH-F9C6 → CJK UNIFIED IDEOGRAPH-962E
+ 0xf951: (0x964b,), #  CJK COMPATIBILITY IDEOGRAPH-F951 → CJK UNIFIED IDEOGRAPH-964B
+ 0xfa09: (0x964d,), #  CJK COMPATIBILITY IDEOGRAPH-FA09 → CJK UNIFIED IDEOGRAPH-964D
+ 0xf959: (0x9675,), #  CJK COMPATIBILITY IDEOGRAPH-F959 → CJK UNIFIED IDEOGRAPH-9675
+ 0xf9d3: (0x9678,), #  CJK COMPATIBILITY IDEOGRAPH-F9D3 → CJK UNIFIED IDEOGRAPH-9678
+ 0xfac6: (0x967c,), #  CJK COMPATIBILITY IDEOGRAPH-FAC6 → CJK UNIFIED IDEOGRAPH-967C
+ 0xf9dc: (0x9686,), #  CJK COMPATIBILITY IDEOGRAPH-F9DC → CJK UNIFIED IDEOGRAPH-9686
+ 0xf9f1: (0x96a3,), #  CJK COMPATIBILITY IDEOGRAPH-F9F1 → CJK UNIFIED IDEOGRAPH-96A3
+ 0x2f9f2: (0x49e6,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F2 → CJK UNIFIED IDEOGRAPH-49E6
+ 0x2faa: (0x96b6,), #  KANGXI RADICAL SLAVE → CJK UNIFIED IDEOGRAPH-96B6
+ 0xfa2f: (0x96b7,), #  CJK COMPATIBILITY IDEOGRAPH-FA2F → CJK UNIFIED IDEOGRAPH-96B7
+ 0x96b8: (0x96b7,), #  CJK UNIFIED IDEOGRAPH-96B8 → CJK UNIFIED IDEOGRAPH-96B7	# →隸→
+ 0xf9b8: (0x96b7,), #  CJK COMPATIBILITY IDEOGRAPH-F9B8 → CJK UNIFIED IDEOGRAPH-96B7
+ 0x2fab: (0x96b9,), #  KANGXI RADICAL SHORT TAILED BIRD → CJK UNIFIED IDEOGRAPH-96B9
+ 0x2f9f3: (0x96c3,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F3 → CJK UNIFIED IDEOGRAPH-96C3
+ 0xf9ea: (0x96e2,), #  CJK COMPATIBILITY IDEOGRAPH-F9EA → CJK UNIFIED IDEOGRAPH-96E2
+ 0xfa68: (0x96e3,), #  CJK COMPATIBILITY IDEOGRAPH-FA68 → CJK UNIFIED IDEOGRAPH-96E3
+ 0xfac7: (0x96e3,), #  CJK COMPATIBILITY IDEOGRAPH-FAC7 → CJK UNIFIED IDEOGRAPH-96E3
+ 0x2fac: (0x96e8,), #  KANGXI RADICAL RAIN → CJK UNIFIED IDEOGRAPH-96E8
+ 0xf9b2: (0x96f6,), #  CJK COMPATIBILITY IDEOGRAPH-F9B2 → CJK UNIFIED IDEOGRAPH-96F6
+ 0xf949: (0x96f7,), #  CJK COMPATIBILITY IDEOGRAPH-F949 → CJK UNIFIED IDEOGRAPH-96F7
+ 0x2f9f5: (0x9723,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F5 → CJK UNIFIED IDEOGRAPH-9723
+ 0x2f9f6: (0x29145,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F6 → CJK UNIFIED IDEOGRAPH-29145
+ 0xf938: (0x9732,), #  CJK COMPATIBILITY IDEOGRAPH-F938 → CJK UNIFIED IDEOGRAPH-9732
+ 0xf9b3: (0x9748,), #  CJK COMPATIBILITY IDEOGRAPH-F9B3 → CJK UNIFIED IDEOGRAPH-9748
+ 0x2fad: (0x9751,), #  KANGXI RADICAL BLUE → CJK UNIFIED IDEOGRAPH-9751
+ 0x2ed8: (0x9752,), #  CJK RADICAL BLUE → CJK UNIFIED IDEOGRAPH-9752
+ 0xfa1c: (0x9756,), #  CJK COMPATIBILITY IDEOGRAPH-FA1C → CJK UNIFIED IDEOGRAPH-9756
+ 0xfac8: (0x9756,), #  CJK COMPATIBILITY IDEOGRAPH-FAC8 → CJK UNIFIED IDEOGRAPH-9756
+ 0x2f81c: (0x291df,), #  CJK COMPATIBILITY IDEOGRAPH-2F81C → CJK UNIFIED IDEOGRAPH-291DF
+ 0x2fae: (0x975e,), #  KANGXI RADICAL WRONG → CJK UNIFIED IDEOGRAPH-975E
+ 0x2faf: (0x9762,), #  KANGXI RADICAL FACE → CJK UNIFIED IDEOGRAPH-9762
+ 0x2f9f7: (0x2921a,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F7 → CJK UNIFIED IDEOGRAPH-2921A
+ 0x2fb0: (0x9769,), #  KANGXI RADICAL LEATHER → CJK UNIFIED IDEOGRAPH-9769
+ 0x2f9f8: (0x4a6e,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F8 → CJK UNIFIED IDEOGRAPH-4A6E
+ 0x2f9f9: (0x4a76,), #  CJK COMPATIBILITY IDEOGRAPH-2F9F9 → CJK UNIFIED IDEOGRAPH-4A76
+ 0x2fb1: (0x97cb,), #  KANGXI RADICAL TANNED LEATHER → CJK UNIFIED IDEOGRAPH-97CB
+ 0xfac9: (0x97db,), #  CJK COMPATIBILITY IDEOGRAPH-FAC9 → CJK UNIFIED IDEOGRAPH-97DB
+ 0x2f9fa: (0x97e0,), #  CJK COMPATIBILITY IDEOGRAPH-2F9FA → CJK UNIFIED IDEOGRAPH-97E0
+ 0x2ed9: (0x97e6,), #  CJK RADICAL C-SIMPLIFIED TANNED LEATHER → CJK UNIFIED IDEOGRAPH-97E6
+ 0x2fb2: (0x97ed,), #  KANGXI RADICAL LEEK → CJK UNIFIED IDEOGRAPH-97ED
+ 0x2f9fb: (0x2940a,), #  CJK COMPATIBILITY IDEOGRAPH-2F9FB → CJK UNIFIED IDEOGRAPH-2940A
+ 0x2fb3: (0x97f3,), #  KANGXI RADICAL SOUND → CJK UNIFIED IDEOGRAPH-97F3
+ 0xfa69: (0x97ff,), #  CJK COMPATIBILITY IDEOGRAPH-FA69 → CJK UNIFIED IDEOGRAPH-97FF
+ 0xfaca: (0x97ff,), #  CJK COMPATIBILITY IDEOGRAPH-FACA → CJK UNIFIED IDEOGRAPH-97FF
+ 0x2fb4: (0x9801,), #  KANGXI RADICAL LEAF → CJK UNIFIED IDEOGRAPH-9801
+ 0x2f9fc: (0x4ab2,), #  CJK COMPATIBILITY IDEOGRAPH-2F9FC → CJK UNIFIED IDEOGRAPH-4AB2
+ 0xfacb: (0x980b,), #  CJK COMPATIBILITY IDEOGRAPH-FACB → CJK UNIFIED IDEOGRAPH-980B
+ 0x2f9fe: (0x980b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9FE → CJK UNIFIED IDEOGRAPH-980B
+ 0x2f9ff: (0x980b,), #  CJK COMPATIBILITY IDEOGRAPH-2F9FF → CJK UNIFIED IDEOGRAPH-980B
+ 0xf9b4: (0x9818,), #  CJK COMPATIBILITY IDEOGRAPH-F9B4 → CJK UNIFIED IDEOGRAPH-9818
+ 0x2fa00: (0x9829,), #  CJK COMPATIBILITY IDEOGRAPH-2FA00 → CJK UNIFIED IDEOGRAPH-9829
+ 0x2f9fd: (0x29496,), #  CJK COMPATIBILITY IDEOGRAPH-2F9FD → CJK UNIFIED IDEOGRAPH-29496
+ 0xfa6a: (0x983b,), #  CJK COMPATIBILITY IDEOGRAPH-FA6A → CJK UNIFIED IDEOGRAPH-983B
+ 0xfacc: (0x983b,), #  CJK COMPATIBILITY IDEOGRAPH-FACC → CJK UNIFIED IDEOGRAPH-983B
+ 0xf9d0: (0x985e,), #  CJK COMPATIBILITY IDEOGRAPH-F9D0 → CJK UNIFIED IDEOGRAPH-985E
+ 0x2eda: (0x9875,), #  CJK RADICAL C-SIMPLIFIED LEAF → CJK UNIFIED IDEOGRAPH-9875
+ 0x2fb5: (0x98a8,), #  KANGXI RADICAL WIND → CJK UNIFIED IDEOGRAPH-98A8
+ 0x2fa01: (0x295b6,), #  CJK COMPATIBILITY IDEOGRAPH-2FA01 → CJK UNIFIED IDEOGRAPH-295B6
+ 0x2edb: (0x98ce,), #  CJK RADICAL C-SIMPLIFIED WIND → CJK UNIFIED IDEOGRAPH-98CE
+ 0x2fb6: (0x98db,), #  KANGXI RADICAL FLY → CJK UNIFIED IDEOGRAPH-98DB
+ 0x2edc: (0x98de,), #  CJK RADICAL C-SIMPLIFIED FLY → CJK UNIFIED IDEOGRAPH-98DE
+ 0x2edd: (0x98df,), #  CJK RADICAL EAT ONE → CJK UNIFIED IDEOGRAPH-98DF
+ 0x2fb7: (0x98df,), #  KANGXI RADICAL EAT → CJK UNIFIED IDEOGRAPH-98DF
+ 0x2edf: (0x98e0,), #  CJK RADICAL EAT THREE → CJK UNIFIED IDEOGRAPH-98E0
+ 0x2fa02: (0x98e2,), #  CJK COMPATIBILITY IDEOGRAPH-2FA02 → CJK UNIFIED IDEOGRAPH-98E2
+ 0xfa2a: (0x98ef,), #  CJK COMPATIBILITY IDEOGRAPH-FA2A → CJK UNIFIED IDEOGRAPH-98EF
+ 0xfa2b: (0x98fc,), #  CJK COMPATIBILITY IDEOGRAPH-FA2B → CJK UNIFIED IDEOGRAPH-98FC
+ 0x2fa03: (0x4b33,), #  CJK COMPATIBILITY IDEOGRAPH-2FA03 → CJK UNIFIED IDEOGRAPH-4B33
+ 0xfa2c: (0x9928,), #  CJK COMPATIBILITY IDEOGRAPH-FA2C → CJK UNIFIED IDEOGRAPH-9928
+ 0x2fa04: (0x9929,), #  CJK COMPATIBILITY IDEOGRAPH-2FA04 → CJK UNIFIED IDEOGRAPH-9929
+ 0x2ee0: (0x9963,), #  CJK RADICAL C-SIMPLIFIED EAT → CJK UNIFIED IDEOGRAPH-9963
+ 0x2fb8: (0x9996,), #  KANGXI RADICAL HEAD → CJK UNIFIED IDEOGRAPH-9996
+ 0x2fb9: (0x9999,), #  KANGXI RADICAL FRAGRANT → CJK UNIFIED IDEOGRAPH-9999
+ 0x2fa05: (0x99a7,), #  CJK COMPATIBILITY IDEOGRAPH-2FA05 → CJK UNIFIED IDEOGRAPH-99A7
+ 0x2fba: (0x99ac,), #  KANGXI RADICAL HORSE → CJK UNIFIED IDEOGRAPH-99AC
+ 0x2fa06: (0x99c2,), #  CJK COMPATIBILITY IDEOGRAPH-2FA06 → CJK UNIFIED IDEOGRAPH-99C2
+ 0xf91a: (0x99f1,), #  CJK COMPATIBILITY IDEOGRAPH-F91A → CJK UNIFIED IDEOGRAPH-99F1
+ 0x2fa07: (0x99fe,), #  CJK COMPATIBILITY IDEOGRAPH-2FA07 → CJK UNIFIED IDEOGRAPH-99FE
+ 0xf987: (0x9a6a,), #  CJK COMPATIBILITY IDEOGRAPH-F987 → CJK UNIFIED IDEOGRAPH-9A6A
+ 0x2ee2: (0x9a6c,), #  CJK RADICAL C-SIMPLIFIED HORSE → CJK UNIFIED IDEOGRAPH-9A6C
+ 0x2fbb: (0x9aa8,), #  KANGXI RADICAL BONE → CJK UNIFIED IDEOGRAPH-9AA8
+ 0x2fa08: (0x4bce,), #  CJK COMPATIBILITY IDEOGRAPH-2FA08 → CJK UNIFIED IDEOGRAPH-4BCE
+ 0x2fbc: (0x9ad8,), #  KANGXI RADICAL TALL → CJK UNIFIED IDEOGRAPH-9AD8
+ 0x2fbd: (0x9adf,), #  KANGXI RADICAL HAIR → CJK UNIFIED IDEOGRAPH-9ADF
+ 0x2fa09: (0x29b30,), #  CJK COMPATIBILITY IDEOGRAPH-2FA09 → CJK UNIFIED IDEOGRAPH-29B30
+ 0xfacd: (0x9b12,), #  CJK COMPATIBILITY IDEOGRAPH-FACD → CJK UNIFIED IDEOGRAPH-9B12
+ 0x2fa0a: (0x9b12,), #  CJK COMPATIBILITY IDEOGRAPH-2FA0A → CJK UNIFIED IDEOGRAPH-9B12
+ 0x2fbe: (0x9b25,), #  KANGXI RADICAL FIGHT → CJK UNIFIED IDEOGRAPH-9B25
+ 0x2fbf: (0x9b2f,), #  KANGXI RADICAL SACRIFICIAL WINE → CJK UNIFIED IDEOGRAPH-9B2F
+ 0x2fc0: (0x9b32,), #  KANGXI RADICAL CAULDRON → CJK UNIFIED IDEOGRAPH-9B32
+ 0x2fc1: (0x9b3c,), #  KANGXI RADICAL GHOST → CJK UNIFIED IDEOGRAPH-9B3C
+ 0x2ee4: (0x9b3c,), #  CJK RADICAL GHOST → CJK UNIFIED IDEOGRAPH-9B3C
+ 0x2fc2: (0x9b5a,), #  KANGXI RADICAL FISH → CJK UNIFIED IDEOGRAPH-9B5A
+ 0xf939: (0x9b6f,), #  CJK COMPATIBILITY IDEOGRAPH-F939 → CJK UNIFIED IDEOGRAPH-9B6F
+ 0x2fa0b: (0x9c40,), #  CJK COMPATIBILITY IDEOGRAPH-2FA0B → CJK UNIFIED IDEOGRAPH-9C40
+ 0xf9f2: (0x9c57,), #  CJK COMPATIBILITY IDEOGRAPH-F9F2 → CJK UNIFIED IDEOGRAPH-9C57
+ 0x2ee5: (0x9c7c,), #  CJK RADICAL C-SIMPLIFIED FISH → CJK UNIFIED IDEOGRAPH-9C7C
+ 0x2fc3: (0x9ce5,), #  KANGXI RADICAL BIRD → CJK UNIFIED IDEOGRAPH-9CE5
+ 0x2fa0c: (0x9cfd,), #  CJK COMPATIBILITY IDEOGRAPH-2FA0C → CJK UNIFIED IDEOGRAPH-9CFD
+ 0x2fa0d: (0x4cce,), #  CJK COMPATIBILITY IDEOGRAPH-2FA0D → CJK UNIFIED IDEOGRAPH-4CCE
+ 0x2fa0f: (0x9d67,), #  CJK COMPATIBILITY IDEOGRAPH-2FA0F → CJK UNIFIED IDEOGRAPH-9D67
+ 0x2fa0e: (0x4ced,), #  CJK COMPATIBILITY IDEOGRAPH-2FA0E → CJK UNIFIED IDEOGRAPH-4CED
+ 0x2fa10: (0x2a0ce,), #  CJK COMPATIBILITY IDEOGRAPH-2FA10 → CJK UNIFIED IDEOGRAPH-2A0CE
+ 0xfa2d: (0x9db4,), #  CJK COMPATIBILITY IDEOGRAPH-FA2D → CJK UNIFIED IDEOGRAPH-9DB4
+ 0x2fa12: (0x2a105,), #  CJK COMPATIBILITY IDEOGRAPH-2FA12 → CJK UNIFIED IDEOGRAPH-2A105
+ 0x2fa11: (0x4cf8,), #  CJK COMPATIBILITY IDEOGRAPH-2FA11 → CJK UNIFIED IDEOGRAPH-4CF8
+ 0xf93a: (0x9dfa,), #  CJK COMPATIBILITY IDEOGRAPH-F93A → CJK UNIFIED IDEOGRAPH-9DFA
+ 0x2fa13: (0x2a20e,), #  CJK COMPATIBILITY IDEOGRAPH-2FA13 → CJK UNIFIED IDEOGRAPH-2A20E
+ 0xf920: (0x9e1e,), #  CJK COMPATIBILITY IDEOGRAPH-F920 → CJK UNIFIED IDEOGRAPH-9E1E
+ 0x9e43: (0x9e42,), #  CJK UNIFIED IDEOGRAPH-9E43 → CJK UNIFIED IDEOGRAPH-9E42
+ 0x2fc4: (0x9e75,), #  KANGXI RADICAL SALT → CJK UNIFIED IDEOGRAPH-9E75
+ 0xf940: (0x9e7f,), #  CJK COMPATIBILITY IDEOGRAPH-F940 → CJK UNIFIED IDEOGRAPH-9E7F
+ 0x2fc5: (0x9e7f,), #  KANGXI RADICAL DEER → CJK UNIFIED IDEOGRAPH-9E7F
+ 0x2fa14: (0x2a291,), #  CJK COMPATIBILITY IDEOGRAPH-2FA14 → CJK UNIFIED IDEOGRAPH-2A291
+ 0xf988: (0x9e97,), #  CJK COMPATIBILITY IDEOGRAPH-F988 → CJK UNIFIED IDEOGRAPH-9E97
+ 0xf9f3: (0x9e9f,), #  CJK COMPATIBILITY IDEOGRAPH-F9F3 → CJK UNIFIED IDEOGRAPH-9E9F
+ 0x2fc6: (0x9ea5,), #  KANGXI RADICAL WHEAT → CJK UNIFIED IDEOGRAPH-9EA5
+ 0x2ee8: (0x9ea6,), #  CJK RADICAL SIMPLIFIED WHEAT → CJK UNIFIED IDEOGRAPH-9EA6
+ 0x2fa15: (0x9ebb,), #  CJK COMPATIBILITY IDEOGRAPH-2FA15 → CJK UNIFIED IDEOGRAPH-9EBB
+ 0x2fc7: (0x9ebb,), #  KANGXI RADICAL HEMP → CJK UNIFIED IDEOGRAPH-9EBB
+ 0x2f88f: (0x2a392,), #  CJK COMPATIBILITY IDEOGRAPH-2F88F → CJK UNIFIED IDEOGRAPH-2A392
+ 0x2fc8: (0x9ec3,), #  KANGXI RADICAL YELLOW → CJK UNIFIED IDEOGRAPH-9EC3
+ 0x2ee9: (0x9ec4,), #  CJK RADICAL SIMPLIFIED YELLOW → CJK UNIFIED IDEOGRAPH-9EC4
+ 0x2fc9: (0x9ecd,), #  KANGXI RADICAL MILLET → CJK UNIFIED IDEOGRAPH-9ECD
+ 0xf989: (0x9ece,), #  CJK COMPATIBILITY IDEOGRAPH-F989 → CJK UNIFIED IDEOGRAPH-9ECE
+ 0x2fa16: (0x4d56,), #  CJK COMPATIBILITY IDEOGRAPH-2FA16 → CJK UNIFIED IDEOGRAPH-4D56
+ 0x2fca: (0x9ed1,), #  KANGXI RADICAL BLACK → CJK UNIFIED IDEOGRAPH-9ED1
+ 0x9ed2: (0x9ed1,), #  CJK UNIFIED IDEOGRAPH-9ED2 → CJK UNIFIED IDEOGRAPH-9ED1	# →⿊→
+ 0xfa3a: (0x58a8,), #  CJK COMPATIBILITY IDEOGRAPH-FA3A → CJK UNIFIED IDEOGRAPH-58A8
+ 0x2fa17: (0x9ef9,), #  CJK COMPATIBILITY IDEOGRAPH-2FA17 → CJK UNIFIED IDEOGRAPH-9EF9
+ 0x2fcb: (0x9ef9,), #  KANGXI RADICAL EMBROIDERY → CJK UNIFIED IDEOGRAPH-9EF9
+ 0x2fcc: (0x9efd,), #  KANGXI RADICAL FROG → CJK UNIFIED IDEOGRAPH-9EFD
+ 0x2fa19: (0x9f05,), #  CJK COMPATIBILITY IDEOGRAPH-2FA19 → CJK UNIFIED IDEOGRAPH-9F05
+ 0x2fa18: (0x9efe,), #  CJK COMPATIBILITY IDEOGRAPH-2FA18 → CJK UNIFIED IDEOGRAPH-9EFE
+ 0x2fcd: (0x9f0e,), #  KANGXI RADICAL TRIPOD → CJK UNIFIED IDEOGRAPH-9F0E
+ 0x2fa1a: (0x9f0f,), #  CJK COMPATIBILITY IDEOGRAPH-2FA1A → CJK UNIFIED IDEOGRAPH-9F0F
+ 0x2fce: (0x9f13,), #  KANGXI RADICAL DRUM → CJK UNIFIED IDEOGRAPH-9F13
+ 0x2fa1b: (0x9f16,), #  CJK COMPATIBILITY IDEOGRAPH-2FA1B → CJK UNIFIED IDEOGRAPH-9F16
+ 0x2fcf: (0x9f20,), #  KANGXI RADICAL RAT → CJK UNIFIED IDEOGRAPH-9F20
+ 0x2fa1c: (0x9f3b,), #  CJK COMPATIBILITY IDEOGRAPH-2FA1C → CJK UNIFIED IDEOGRAPH-9F3B
+ 0x2fd0: (0x9f3b,), #  KANGXI RADICAL NOSE → CJK UNIFIED IDEOGRAPH-9F3B
+ 0xfad8: (0x9f43,), #  CJK COMPATIBILITY IDEOGRAPH-FAD8 → CJK UNIFIED IDEOGRAPH-9F43
+ 0x2fd1: (0x9f4a,), #  KANGXI RADICAL EVEN → CJK UNIFIED IDEOGRAPH-9F4A
+ 0x2eec: (0x9f50,), #  CJK RADICAL C-SIMPLIFIED EVEN → CJK UNIFIED IDEOGRAPH-9F50
+ 0x2fd2: (0x9f52,), #  KANGXI RADICAL TOOTH → CJK UNIFIED IDEOGRAPH-9F52
+ 0x2fa1d: (0x2a600,), #  CJK COMPATIBILITY IDEOGRAPH-2FA1D → CJK UNIFIED IDEOGRAPH-2A600
+ 0x2eee: (0x9f7f,), #  CJK RADICAL C-SIMPLIFIED TOOTH → CJK UNIFIED IDEOGRAPH-9F7F
+ 0xf9c4: (0x9f8d,), #  CJK COMPATIBILITY IDEOGRAPH-F9C4 → CJK UNIFIED IDEOGRAPH-9F8D
+ 0x2fd3: (0x9f8d,), #  KANGXI RADICAL DRAGON → CJK UNIFIED IDEOGRAPH-9F8D
+ 0xfad9: (0x9f8e,), #  CJK COMPATIBILITY IDEOGRAPH-FAD9 → CJK UNIFIED IDEOGRAPH-9F8E
+ 0x2ef0: (0x9f99,), #  CJK RADICAL C-SIMPLIFIED DRAGON → CJK UNIFIED IDEOGRAPH-9F99
+ 0xf907: (0x9f9c,), #  CJK COMPATIBILITY IDEOGRAPH-F907 → CJK UNIFIED IDEOGRAPH-9F9C
+ 0xf908: (0x9f9c,), #  CJK COMPATIBILITY IDEOGRAPH-F908 → CJK UNIFIED IDEOGRAPH-9F9C
+ 0xface: (0x9f9c,), #  CJK COMPATIBILITY IDEOGRAPH-FACE → CJK UNIFIED IDEOGRAPH-9F9C
+ 0x2fd4: (0x9f9c,), #  KANGXI RADICAL TURTLE → CJK UNIFIED IDEOGRAPH-9F9C
+ 0x2ef3: (0x9f9f,), #  CJK RADICAL C-SIMPLIFIED TURTLE → CJK UNIFIED IDEOGRAPH-9F9F
+ 0x2fd5: (0x9fa0,), #  KANGXI RADICAL FLUTE → CJK UNIFIED IDEOGRAPH-9FA0
+}
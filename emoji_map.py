@@ -0,0 +1,379 @@
+
+
+# tuple of Unicode emoji property names. Bit i of a property mask is the property at index i.
+emoji_property_names = (
+ "Emoji",
+ "Emoji_Presentation",
+ "Emoji_Modifier",
+ "Emoji_Modifier_Base",
+ "Emoji_Component",
+ "Extended_Pictographic",
+)
+
+
+# dictionary of Unicode emoji properties
+# entries are: key: (f, l, p), where
+#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.
+#     p - the emoji properties of the range, as a bitmask.
+# code points not in the map have none of the emoji properties.
+emoji_map = {
+ 0x0023: (0x0023, 0x0023, 0x11),  #  Emoji, Emoji_Component
+ 0x002a: (0x002a, 0x002a, 0x11),  #  Emoji, Emoji_Component
+ 0x0030: (0x0030, 0x0039, 0x11),  #  Emoji, Emoji_Component
+ 0x00a9: (0x00a9, 0x00a9, 0x21),  #  Emoji, Extended_Pictographic
+ 0x00ae: (0x00ae, 0x00ae, 0x21),  #  Emoji, Extended_Pictographic
+ 0x200d: (0x200d, 0x200d, 0x10),  #  Emoji_Component
+ 0x203c: (0x203c, 0x203c, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2049: (0x2049, 0x2049, 0x21),  #  Emoji, Extended_Pictographic
+ 0x20e3: (0x20e3, 0x20e3, 0x10),  #  Emoji_Component
+ 0x2122: (0x2122, 0x2122, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2139: (0x2139, 0x2139, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2194: (0x2194, 0x2199, 0x21),  #  Emoji, Extended_Pictographic
+ 0x21a9: (0x21a9, 0x21aa, 0x21),  #  Emoji, Extended_Pictographic
+ 0x231a: (0x231a, 0x231b, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2328: (0x2328, 0x2328, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2388: (0x2388, 0x2388, 0x20),  #  Extended_Pictographic
+ 0x23cf: (0x23cf, 0x23cf, 0x21),  #  Emoji, Extended_Pictographic
+ 0x23e9: (0x23e9, 0x23ec, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x23ed: (0x23ed, 0x23ef, 0x21),  #  Emoji, Extended_Pictographic
+ 0x23f0: (0x23f0, 0x23f0, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x23f1: (0x23f1, 0x23f2, 0x21),  #  Emoji, Extended_Pictographic
+ 0x23f3: (0x23f3, 0x23f3, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x23f8: (0x23f8, 0x23fa, 0x21),  #  Emoji, Extended_Pictographic
+ 0x24c2: (0x24c2, 0x24c2, 0x21),  #  Emoji, Extended_Pictographic
+ 0x25aa: (0x25aa, 0x25ab, 0x21),  #  Emoji, Extended_Pictographic
+ 0x25b6: (0x25b6, 0x25b6, 0x21),  #  Emoji, Extended_Pictographic
+ 0x25c0: (0x25c0, 0x25c0, 0x21),  #  Emoji, Extended_Pictographic
+ 0x25fb: (0x25fb, 0x25fc, 0x21),  #  Emoji, Extended_Pictographic
+ 0x25fd: (0x25fd, 0x25fe, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2600: (0x2600, 0x2604, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2605: (0x2605, 0x2605, 0x20),  #  Extended_Pictographic
+ 0x2607: (0x2607, 0x260d, 0x20),  #  Extended_Pictographic
+ 0x260e: (0x260e, 0x260e, 0x21),  #  Emoji, Extended_Pictographic
+ 0x260f: (0x260f, 0x2610, 0x20),  #  Extended_Pictographic
+ 0x2611: (0x2611, 0x2611, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2612: (0x2612, 0x2612, 0x20),  #  Extended_Pictographic
+ 0x2614: (0x2614, 0x2615, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2616: (0x2616, 0x2617, 0x20),  #  Extended_Pictographic
+ 0x2618: (0x2618, 0x2618, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2619: (0x2619, 0x261c, 0x20),  #  Extended_Pictographic
+ 0x261d: (0x261d, 0x261d, 0x29),  #  Emoji, Emoji_Modifier_Base, Extended_Pictographic
+ 0x261e: (0x261e, 0x261f, 0x20),  #  Extended_Pictographic
+ 0x2620: (0x2620, 0x2620, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2621: (0x2621, 0x2621, 0x20),  #  Extended_Pictographic
+ 0x2622: (0x2622, 0x2623, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2624: (0x2624, 0x2625, 0x20),  #  Extended_Pictographic
+ 0x2626: (0x2626, 0x2626, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2627: (0x2627, 0x2629, 0x20),  #  Extended_Pictographic
+ 0x262a: (0x262a, 0x262a, 0x21),  #  Emoji, Extended_Pictographic
+ 0x262b: (0x262b, 0x262d, 0x20),  #  Extended_Pictographic
+ 0x262e: (0x262e, 0x262f, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2630: (0x2630, 0x2637, 0x20),  #  Extended_Pictographic
+ 0x2638: (0x2638, 0x263a, 0x21),  #  Emoji, Extended_Pictographic
+ 0x263b: (0x263b, 0x263f, 0x20),  #  Extended_Pictographic
+ 0x2640: (0x2640, 0x2640, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2641: (0x2641, 0x2641, 0x20),  #  Extended_Pictographic
+ 0x2642: (0x2642, 0x2642, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2643: (0x2643, 0x2647, 0x20),  #  Extended_Pictographic
+ 0x2648: (0x2648, 0x2653, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2654: (0x2654, 0x265e, 0x20),  #  Extended_Pictographic
+ 0x265f: (0x265f, 0x2660, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2661: (0x2661, 0x2662, 0x20),  #  Extended_Pictographic
+ 0x2663: (0x2663, 0x2663, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2664: (0x2664, 0x2664, 0x20),  #  Extended_Pictographic
+ 0x2665: (0x2665, 0x2666, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2667: (0x2667, 0x2667, 0x20),  #  Extended_Pictographic
+ 0x2668: (0x2668, 0x2668, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2669: (0x2669, 0x267a, 0x20),  #  Extended_Pictographic
+ 0x267b: (0x267b, 0x267b, 0x21),  #  Emoji, Extended_Pictographic
+ 0x267c: (0x267c, 0x267d, 0x20),  #  Extended_Pictographic
+ 0x267e: (0x267e, 0x267e, 0x21),  #  Emoji, Extended_Pictographic
+ 0x267f: (0x267f, 0x267f, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2680: (0x2680, 0x2685, 0x20),  #  Extended_Pictographic
+ 0x2690: (0x2690, 0x2691, 0x20),  #  Extended_Pictographic
+ 0x2692: (0x2692, 0x2692, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2693: (0x2693, 0x2693, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2694: (0x2694, 0x2697, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2698: (0x2698, 0x2698, 0x20),  #  Extended_Pictographic
+ 0x2699: (0x2699, 0x2699, 0x21),  #  Emoji, Extended_Pictographic
+ 0x269a: (0x269a, 0x269a, 0x20),  #  Extended_Pictographic
+ 0x269b: (0x269b, 0x269c, 0x21),  #  Emoji, Extended_Pictographic
+ 0x269d: (0x269d, 0x269f, 0x20),  #  Extended_Pictographic
+ 0x26a0: (0x26a0, 0x26a0, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26a1: (0x26a1, 0x26a1, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26a2: (0x26a2, 0x26a9, 0x20),  #  Extended_Pictographic
+ 0x26aa: (0x26aa, 0x26ab, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26ac: (0x26ac, 0x26af, 0x20),  #  Extended_Pictographic
+ 0x26b0: (0x26b0, 0x26b1, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26b2: (0x26b2, 0x26bc, 0x20),  #  Extended_Pictographic
+ 0x26bd: (0x26bd, 0x26be, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26bf: (0x26bf, 0x26c3, 0x20),  #  Extended_Pictographic
+ 0x26c4: (0x26c4, 0x26c5, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26c6: (0x26c6, 0x26c7, 0x20),  #  Extended_Pictographic
+ 0x26c8: (0x26c8, 0x26c8, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26c9: (0x26c9, 0x26cd, 0x20),  #  Extended_Pictographic
+ 0x26ce: (0x26ce, 0x26ce, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26cf: (0x26cf, 0x26cf, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26d0: (0x26d0, 0x26d0, 0x20),  #  Extended_Pictographic
+ 0x26d1: (0x26d1, 0x26d1, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26d2: (0x26d2, 0x26d2, 0x20),  #  Extended_Pictographic
+ 0x26d3: (0x26d3, 0x26d3, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26d4: (0x26d4, 0x26d4, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26d5: (0x26d5, 0x26e8, 0x20),  #  Extended_Pictographic
+ 0x26e9: (0x26e9, 0x26e9, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26ea: (0x26ea, 0x26ea, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26eb: (0x26eb, 0x26ef, 0x20),  #  Extended_Pictographic
+ 0x26f0: (0x26f0, 0x26f1, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26f2: (0x26f2, 0x26f3, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26f4: (0x26f4, 0x26f4, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26f5: (0x26f5, 0x26f5, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26f6: (0x26f6, 0x26f6, 0x20),  #  Extended_Pictographic
+ 0x26f7: (0x26f7, 0x26f8, 0x21),  #  Emoji, Extended_Pictographic
+ 0x26f9: (0x26f9, 0x26f9, 0x29),  #  Emoji, Emoji_Modifier_Base, Extended_Pictographic
+ 0x26fa: (0x26fa, 0x26fa, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26fb: (0x26fb, 0x26fc, 0x20),  #  Extended_Pictographic
+ 0x26fd: (0x26fd, 0x26fd, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x26fe: (0x26fe, 0x2701, 0x20),  #  Extended_Pictographic
+ 0x2702: (0x2702, 0x2702, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2703: (0x2703, 0x2704, 0x20),  #  Extended_Pictographic
+ 0x2705: (0x2705, 0x2705, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2708: (0x2708, 0x2709, 0x21),  #  Emoji, Extended_Pictographic
+ 0x270a: (0x270a, 0x270b, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x270c: (0x270c, 0x270d, 0x29),  #  Emoji, Emoji_Modifier_Base, Extended_Pictographic
+ 0x270e: (0x270e, 0x270e, 0x20),  #  Extended_Pictographic
+ 0x270f: (0x270f, 0x270f, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2710: (0x2710, 0x2711, 0x20),  #  Extended_Pictographic
+ 0x2712: (0x2712, 0x2712, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2714: (0x2714, 0x2714, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2716: (0x2716, 0x2716, 0x21),  #  Emoji, Extended_Pictographic
+ 0x271d: (0x271d, 0x271d, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2721: (0x2721, 0x2721, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2728: (0x2728, 0x2728, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2733: (0x2733, 0x2734, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2744: (0x2744, 0x2744, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2747: (0x2747, 0x2747, 0x21),  #  Emoji, Extended_Pictographic
+ 0x274c: (0x274c, 0x274c, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x274e: (0x274e, 0x274e, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2753: (0x2753, 0x2755, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2757: (0x2757, 0x2757, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2763: (0x2763, 0x2764, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2765: (0x2765, 0x2767, 0x20),  #  Extended_Pictographic
+ 0x2795: (0x2795, 0x2797, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x27a1: (0x27a1, 0x27a1, 0x21),  #  Emoji, Extended_Pictographic
+ 0x27b0: (0x27b0, 0x27b0, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x27bf: (0x27bf, 0x27bf, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2934: (0x2934, 0x2935, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2b05: (0x2b05, 0x2b07, 0x21),  #  Emoji, Extended_Pictographic
+ 0x2b1b: (0x2b1b, 0x2b1c, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2b50: (0x2b50, 0x2b50, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x2b55: (0x2b55, 0x2b55, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x3030: (0x3030, 0x3030, 0x21),  #  Emoji, Extended_Pictographic
+ 0x303d: (0x303d, 0x303d, 0x21),  #  Emoji, Extended_Pictographic
+ 0x3297: (0x3297, 0x3297, 0x21),  #  Emoji, Extended_Pictographic
+ 0x3299: (0x3299, 0x3299, 0x21),  #  Emoji, Extended_Pictographic
+ 0xfe0f: (0xfe0f, 0xfe0f, 0x10),  #  Emoji_Component
+ 0x1f000: (0x1f000, 0x1f003, 0x20),  #  Extended_Pictographic
+ 0x1f004: (0x1f004, 0x1f004, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f005: (0x1f005, 0x1f0ce, 0x20),  #  Extended_Pictographic
+ 0x1f0cf: (0x1f0cf, 0x1f0cf, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f0d0: (0x1f0d0, 0x1f0ff, 0x20),  #  Extended_Pictographic
+ 0x1f10d: (0x1f10d, 0x1f10f, 0x20),  #  Extended_Pictographic
+ 0x1f12f: (0x1f12f, 0x1f12f, 0x20),  #  Extended_Pictographic
+ 0x1f16c: (0x1f16c, 0x1f16f, 0x20),  #  Extended_Pictographic
+ 0x1f170: (0x1f170, 0x1f171, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f17e: (0x1f17e, 0x1f17f, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f18e: (0x1f18e, 0x1f18e, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f191: (0x1f191, 0x1f19a, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f1ad: (0x1f1ad, 0x1f1e5, 0x20),  #  Extended_Pictographic
+ 0x1f1e6: (0x1f1e6, 0x1f1ff, 0x13),  #  Emoji, Emoji_Presentation, Emoji_Component
+ 0x1f201: (0x1f201, 0x1f201, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f202: (0x1f202, 0x1f202, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f203: (0x1f203, 0x1f20f, 0x20),  #  Extended_Pictographic
+ 0x1f21a: (0x1f21a, 0x1f21a, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f22f: (0x1f22f, 0x1f22f, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f232: (0x1f232, 0x1f236, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f237: (0x1f237, 0x1f237, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f238: (0x1f238, 0x1f23a, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f23c: (0x1f23c, 0x1f23f, 0x20),  #  Extended_Pictographic
+ 0x1f249: (0x1f249, 0x1f24f, 0x20),  #  Extended_Pictographic
+ 0x1f250: (0x1f250, 0x1f251, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f252: (0x1f252, 0x1f2ff, 0x20),  #  Extended_Pictographic
+ 0x1f300: (0x1f300, 0x1f320, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f321: (0x1f321, 0x1f321, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f322: (0x1f322, 0x1f323, 0x20),  #  Extended_Pictographic
+ 0x1f324: (0x1f324, 0x1f32c, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f32d: (0x1f32d, 0x1f335, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f336: (0x1f336, 0x1f336, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f337: (0x1f337, 0x1f37c, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f37d: (0x1f37d, 0x1f37d, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f37e: (0x1f37e, 0x1f384, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f385: (0x1f385, 0x1f385, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f386: (0x1f386, 0x1f393, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f394: (0x1f394, 0x1f395, 0x20),  #  Extended_Pictographic
+ 0x1f396: (0x1f396, 0x1f397, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f398: (0x1f398, 0x1f398, 0x20),  #  Extended_Pictographic
+ 0x1f399: (0x1f399, 0x1f39b, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f39c: (0x1f39c, 0x1f39d, 0x20),  #  Extended_Pictographic
+ 0x1f39e: (0x1f39e, 0x1f39f, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f3a0: (0x1f3a0, 0x1f3c1, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3c2: (0x1f3c2, 0x1f3c4, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f3c5: (0x1f3c5, 0x1f3c6, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3c7: (0x1f3c7, 0x1f3c7, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f3c8: (0x1f3c8, 0x1f3c9, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3ca: (0x1f3ca, 0x1f3ca, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f3cb: (0x1f3cb, 0x1f3cc, 0x29),  #  Emoji, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f3cd: (0x1f3cd, 0x1f3ce, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f3cf: (0x1f3cf, 0x1f3d3, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3d4: (0x1f3d4, 0x1f3df, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f3e0: (0x1f3e0, 0x1f3f0, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3f1: (0x1f3f1, 0x1f3f2, 0x20),  #  Extended_Pictographic
+ 0x1f3f3: (0x1f3f3, 0x1f3f3, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f3f4: (0x1f3f4, 0x1f3f4, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3f5: (0x1f3f5, 0x1f3f5, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f3f6: (0x1f3f6, 0x1f3f6, 0x20),  #  Extended_Pictographic
+ 0x1f3f7: (0x1f3f7, 0x1f3f7, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f3f8: (0x1f3f8, 0x1f3fa, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f3fb: (0x1f3fb, 0x1f3ff, 0x17),  #  Emoji, Emoji_Presentation, Emoji_Modifier, Emoji_Component
+ 0x1f400: (0x1f400, 0x1f43e, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f43f: (0x1f43f, 0x1f43f, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f440: (0x1f440, 0x1f440, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f441: (0x1f441, 0x1f441, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f442: (0x1f442, 0x1f443, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f444: (0x1f444, 0x1f445, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f446: (0x1f446, 0x1f450, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f451: (0x1f451, 0x1f465, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f466: (0x1f466, 0x1f469, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f46a: (0x1f46a, 0x1f46d, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f46e: (0x1f46e, 0x1f46e, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f46f: (0x1f46f, 0x1f46f, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f470: (0x1f470, 0x1f478, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f479: (0x1f479, 0x1f47b, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f47c: (0x1f47c, 0x1f47c, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f47d: (0x1f47d, 0x1f480, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f481: (0x1f481, 0x1f483, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f484: (0x1f484, 0x1f484, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f485: (0x1f485, 0x1f487, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f488: (0x1f488, 0x1f4a9, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f4aa: (0x1f4aa, 0x1f4aa, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f4ab: (0x1f4ab, 0x1f4fc, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f4fd: (0x1f4fd, 0x1f4fd, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f4fe: (0x1f4fe, 0x1f4fe, 0x20),  #  Extended_Pictographic
+ 0x1f4ff: (0x1f4ff, 0x1f53d, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f546: (0x1f546, 0x1f548, 0x20),  #  Extended_Pictographic
+ 0x1f549: (0x1f549, 0x1f54a, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f54b: (0x1f54b, 0x1f54e, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f54f: (0x1f54f, 0x1f54f, 0x20),  #  Extended_Pictographic
+ 0x1f550: (0x1f550, 0x1f567, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f568: (0x1f568, 0x1f56e, 0x20),  #  Extended_Pictographic
+ 0x1f56f: (0x1f56f, 0x1f570, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f571: (0x1f571, 0x1f572, 0x20),  #  Extended_Pictographic
+ 0x1f573: (0x1f573, 0x1f573, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f574: (0x1f574, 0x1f575, 0x29),  #  Emoji, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f576: (0x1f576, 0x1f579, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f57a: (0x1f57a, 0x1f57a, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f57b: (0x1f57b, 0x1f586, 0x20),  #  Extended_Pictographic
+ 0x1f587: (0x1f587, 0x1f587, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f588: (0x1f588, 0x1f589, 0x20),  #  Extended_Pictographic
+ 0x1f58a: (0x1f58a, 0x1f58d, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f58e: (0x1f58e, 0x1f58f, 0x20),  #  Extended_Pictographic
+ 0x1f590: (0x1f590, 0x1f590, 0x29),  #  Emoji, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f591: (0x1f591, 0x1f594, 0x20),  #  Extended_Pictographic
+ 0x1f595: (0x1f595, 0x1f596, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f597: (0x1f597, 0x1f5a3, 0x20),  #  Extended_Pictographic
+ 0x1f5a4: (0x1f5a4, 0x1f5a4, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f5a5: (0x1f5a5, 0x1f5a5, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5a6: (0x1f5a6, 0x1f5a7, 0x20),  #  Extended_Pictographic
+ 0x1f5a8: (0x1f5a8, 0x1f5a8, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5a9: (0x1f5a9, 0x1f5b0, 0x20),  #  Extended_Pictographic
+ 0x1f5b1: (0x1f5b1, 0x1f5b2, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5b3: (0x1f5b3, 0x1f5bb, 0x20),  #  Extended_Pictographic
+ 0x1f5bc: (0x1f5bc, 0x1f5bc, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5bd: (0x1f5bd, 0x1f5c1, 0x20),  #  Extended_Pictographic
+ 0x1f5c2: (0x1f5c2, 0x1f5c4, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5c5: (0x1f5c5, 0x1f5d0, 0x20),  #  Extended_Pictographic
+ 0x1f5d1: (0x1f5d1, 0x1f5d3, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5d4: (0x1f5d4, 0x1f5db, 0x20),  #  Extended_Pictographic
+ 0x1f5dc: (0x1f5dc, 0x1f5de, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5df: (0x1f5df, 0x1f5e0, 0x20),  #  Extended_Pictographic
+ 0x1f5e1: (0x1f5e1, 0x1f5e1, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5e2: (0x1f5e2, 0x1f5e2, 0x20),  #  Extended_Pictographic
+ 0x1f5e3: (0x1f5e3, 0x1f5e3, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5e4: (0x1f5e4, 0x1f5e7, 0x20),  #  Extended_Pictographic
+ 0x1f5e8: (0x1f5e8, 0x1f5e8, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5e9: (0x1f5e9, 0x1f5ee, 0x20),  #  Extended_Pictographic
+ 0x1f5ef: (0x1f5ef, 0x1f5ef, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5f0: (0x1f5f0, 0x1f5f2, 0x20),  #  Extended_Pictographic
+ 0x1f5f3: (0x1f5f3, 0x1f5f3, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5f4: (0x1f5f4, 0x1f5f9, 0x20),  #  Extended_Pictographic
+ 0x1f5fa: (0x1f5fa, 0x1f5fa, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f5fb: (0x1f5fb, 0x1f644, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f645: (0x1f645, 0x1f647, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f648: (0x1f648, 0x1f64a, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f64b: (0x1f64b, 0x1f64f, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f680: (0x1f680, 0x1f6a2, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6a3: (0x1f6a3, 0x1f6a3, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f6a4: (0x1f6a4, 0x1f6b3, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6b4: (0x1f6b4, 0x1f6b6, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f6b7: (0x1f6b7, 0x1f6bf, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6c0: (0x1f6c0, 0x1f6c0, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f6c1: (0x1f6c1, 0x1f6c5, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6c6: (0x1f6c6, 0x1f6ca, 0x20),  #  Extended_Pictographic
+ 0x1f6cb: (0x1f6cb, 0x1f6cb, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f6cc: (0x1f6cc, 0x1f6cc, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f6cd: (0x1f6cd, 0x1f6cf, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f6d0: (0x1f6d0, 0x1f6d2, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6d3: (0x1f6d3, 0x1f6df, 0x20),  #  Extended_Pictographic
+ 0x1f6e0: (0x1f6e0, 0x1f6e5, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f6e6: (0x1f6e6, 0x1f6e8, 0x20),  #  Extended_Pictographic
+ 0x1f6e9: (0x1f6e9, 0x1f6e9, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f6ea: (0x1f6ea, 0x1f6ea, 0x20),  #  Extended_Pictographic
+ 0x1f6eb: (0x1f6eb, 0x1f6ec, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6ed: (0x1f6ed, 0x1f6ef, 0x20),  #  Extended_Pictographic
+ 0x1f6f0: (0x1f6f0, 0x1f6f0, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f6f1: (0x1f6f1, 0x1f6f2, 0x20),  #  Extended_Pictographic
+ 0x1f6f3: (0x1f6f3, 0x1f6f3, 0x21),  #  Emoji, Extended_Pictographic
+ 0x1f6f4: (0x1f6f4, 0x1f6f9, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f6fa: (0x1f6fa, 0x1f6ff, 0x20),  #  Extended_Pictographic
+ 0x1f774: (0x1f774, 0x1f77f, 0x20),  #  Extended_Pictographic
+ 0x1f7d5: (0x1f7d5, 0x1f7ff, 0x20),  #  Extended_Pictographic
+ 0x1f80c: (0x1f80c, 0x1f80f, 0x20),  #  Extended_Pictographic
+ 0x1f848: (0x1f848, 0x1f84f, 0x20),  #  Extended_Pictographic
+ 0x1f85a: (0x1f85a, 0x1f85f, 0x20),  #  Extended_Pictographic
+ 0x1f888: (0x1f888, 0x1f88f, 0x20),  #  Extended_Pictographic
+ 0x1f8ae: (0x1f8ae, 0x1f8ff, 0x20),  #  Extended_Pictographic
+ 0x1f90c: (0x1f90c, 0x1f90f, 0x20),  #  Extended_Pictographic
+ 0x1f910: (0x1f910, 0x1f917, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f918: (0x1f918, 0x1f91c, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f91d: (0x1f91d, 0x1f91d, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f91e: (0x1f91e, 0x1f91f, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f920: (0x1f920, 0x1f925, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f926: (0x1f926, 0x1f926, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f927: (0x1f927, 0x1f92f, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f930: (0x1f930, 0x1f939, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f93a: (0x1f93a, 0x1f93a, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f93c: (0x1f93c, 0x1f93c, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f93d: (0x1f93d, 0x1f93e, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f93f: (0x1f93f, 0x1f93f, 0x20),  #  Extended_Pictographic
+ 0x1f940: (0x1f940, 0x1f945, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f947: (0x1f947, 0x1f970, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f971: (0x1f971, 0x1f972, 0x20),  #  Extended_Pictographic
+ 0x1f973: (0x1f973, 0x1f976, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f977: (0x1f977, 0x1f979, 0x20),  #  Extended_Pictographic
+ 0x1f97a: (0x1f97a, 0x1f97a, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f97b: (0x1f97b, 0x1f97b, 0x20),  #  Extended_Pictographic
+ 0x1f97c: (0x1f97c, 0x1f9a2, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f9a3: (0x1f9a3, 0x1f9af, 0x20),  #  Extended_Pictographic
+ 0x1f9b0: (0x1f9b0, 0x1f9b3, 0x33),  #  Emoji, Emoji_Presentation, Emoji_Component, Extended_Pictographic
+ 0x1f9b4: (0x1f9b4, 0x1f9b4, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f9b5: (0x1f9b5, 0x1f9b6, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f9b7: (0x1f9b7, 0x1f9b7, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f9b8: (0x1f9b8, 0x1f9b9, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f9ba: (0x1f9ba, 0x1f9bf, 0x20),  #  Extended_Pictographic
+ 0x1f9c0: (0x1f9c0, 0x1f9c2, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f9c3: (0x1f9c3, 0x1f9cf, 0x20),  #  Extended_Pictographic
+ 0x1f9d0: (0x1f9d0, 0x1f9d0, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1f9d1: (0x1f9d1, 0x1f9dd, 0x2b),  #  Emoji, Emoji_Presentation, Emoji_Modifier_Base, Extended_Pictographic
+ 0x1f9de: (0x1f9de, 0x1f9ff, 0x23),  #  Emoji, Emoji_Presentation, Extended_Pictographic
+ 0x1fa00: (0x1fa00, 0x1fffd, 0x20),  #  Extended_Pictographic
+ 0xe0020: (0xe0020, 0xe007f, 0x10),  #  Emoji_Component
+}
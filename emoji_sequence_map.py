@@ -0,0 +1,1594 @@
+
+
+# tuple of emoji sequence types. The index of the type in the tuple is the type id.
+emoji_sequence_types = (
+ "Emoji_Keycap_Sequence",
+ "Emoji_Flag_Sequence",
+ "Emoji_Tag_Sequence",
+ "Emoji_Modifier_Sequence",
+ "Emoji_ZWJ_Sequence",
+)
+
+
+# dictionary of RGI emoji sequences (from emoji-sequences.txt and emoji-zwj-sequences.txt)
+# entries are: key: (t, name), where
+#     key - the code points of the sequence, t - the type id of the sequence, name - the name of the sequence.
+emoji_sequence_map = {
+ (0x0023, 0xfe0f, 0x20e3,): (0, 'keycap: \\x{23}'),
+ (0x002a, 0xfe0f, 0x20e3,): (0, 'keycap: *'),
+ (0x0030, 0xfe0f, 0x20e3,): (0, 'keycap: 0'),
+ (0x0031, 0xfe0f, 0x20e3,): (0, 'keycap: 1'),
+ (0x0032, 0xfe0f, 0x20e3,): (0, 'keycap: 2'),
+ (0x0033, 0xfe0f, 0x20e3,): (0, 'keycap: 3'),
+ (0x0034, 0xfe0f, 0x20e3,): (0, 'keycap: 4'),
+ (0x0035, 0xfe0f, 0x20e3,): (0, 'keycap: 5'),
+ (0x0036, 0xfe0f, 0x20e3,): (0, 'keycap: 6'),
+ (0x0037, 0xfe0f, 0x20e3,): (0, 'keycap: 7'),
+ (0x0038, 0xfe0f, 0x20e3,): (0, 'keycap: 8'),
+ (0x0039, 0xfe0f, 0x20e3,): (0, 'keycap: 9'),
+ (0x1f1e6, 0x1f1e8,): (1, 'flag: Ascension Island'),
+ (0x1f1e6, 0x1f1e9,): (1, 'flag: Andorra'),
+ (0x1f1e6, 0x1f1ea,): (1, 'flag: United Arab Emirates'),
+ (0x1f1e6, 0x1f1eb,): (1, 'flag: Afghanistan'),
+ (0x1f1e6, 0x1f1ec,): (1, 'flag: Antigua & Barbuda'),
+ (0x1f1e6, 0x1f1ee,): (1, 'flag: Anguilla'),
+ (0x1f1e6, 0x1f1f1,): (1, 'flag: Albania'),
+ (0x1f1e6, 0x1f1f2,): (1, 'flag: Armenia'),
+ (0x1f1e6, 0x1f1f4,): (1, 'flag: Angola'),
+ (0x1f1e6, 0x1f1f6,): (1, 'flag: Antarctica'),
+ (0x1f1e6, 0x1f1f7,): (1, 'flag: Argentina'),
+ (0x1f1e6, 0x1f1f8,): (1, 'flag: American Samoa'),
+ (0x1f1e6, 0x1f1f9,): (1, 'flag: Austria'),
+ (0x1f1e6, 0x1f1fa,): (1, 'flag: Australia'),
+ (0x1f1e6, 0x1f1fc,): (1, 'flag: Aruba'),
+ (0x1f1e6, 0x1f1fd,): (1, 'flag: Åland Islands'),
+ (0x1f1e6, 0x1f1ff,): (1, 'flag: Azerbaijan'),
+ (0x1f1e7, 0x1f1e6,): (1, 'flag: Bosnia & Herzegovina'),
+ (0x1f1e7, 0x1f1e7,): (1, 'flag: Barbados'),
+ (0x1f1e7, 0x1f1e9,): (1, 'flag: Bangladesh'),
+ (0x1f1e7, 0x1f1ea,): (1, 'flag: Belgium'),
+ (0x1f1e7, 0x1f1eb,): (1, 'flag: Burkina Faso'),
+ (0x1f1e7, 0x1f1ec,): (1, 'flag: Bulgaria'),
+ (0x1f1e7, 0x1f1ed,): (1, 'flag: Bahrain'),
+ (0x1f1e7, 0x1f1ee,): (1, 'flag: Burundi'),
+ (0x1f1e7, 0x1f1ef,): (1, 'flag: Benin'),
+ (0x1f1e7, 0x1f1f1,): (1, 'flag: St. Barthélemy'),
+ (0x1f1e7, 0x1f1f2,): (1, 'flag: Bermuda'),
+ (0x1f1e7, 0x1f1f3,): (1, 'flag: Brunei'),
+ (0x1f1e7, 0x1f1f4,): (1, 'flag: Bolivia'),
+ (0x1f1e7, 0x1f1f6,): (1, 'flag: Caribbean Netherlands'),
+ (0x1f1e7, 0x1f1f7,): (1, 'flag: Brazil'),
+ (0x1f1e7, 0x1f1f8,): (1, 'flag: Bahamas'),
+ (0x1f1e7, 0x1f1f9,): (1, 'flag: Bhutan'),
+ (0x1f1e7, 0x1f1fb,): (1, 'flag: Bouvet Island'),
+ (0x1f1e7, 0x1f1fc,): (1, 'flag: Botswana'),
+ (0x1f1e7, 0x1f1fe,): (1, 'flag: Belarus'),
+ (0x1f1e7, 0x1f1ff,): (1, 'flag: Belize'),
+ (0x1f1e8, 0x1f1e6,): (1, 'flag: Canada'),
+ (0x1f1e8, 0x1f1e8,): (1, 'flag: Cocos (Keeling) Islands'),
+ (0x1f1e8, 0x1f1e9,): (1, 'flag: Congo - Kinshasa'),
+ (0x1f1e8, 0x1f1eb,): (1, 'flag: Central African Republic'),
+ (0x1f1e8, 0x1f1ec,): (1, 'flag: Congo - Brazzaville'),
+ (0x1f1e8, 0x1f1ed,): (1, 'flag: Switzerland'),
+ (0x1f1e8, 0x1f1ee,): (1, 'flag: Côte d’Ivoire'),
+ (0x1f1e8, 0x1f1f0,): (1, 'flag: Cook Islands'),
+ (0x1f1e8, 0x1f1f1,): (1, 'flag: Chile'),
+ (0x1f1e8, 0x1f1f2,): (1, 'flag: Cameroon'),
+ (0x1f1e8, 0x1f1f3,): (1, 'flag: China'),
+ (0x1f1e8, 0x1f1f4,): (1, 'flag: Colombia'),
+ (0x1f1e8, 0x1f1f5,): (1, 'flag: Clipperton Island'),
+ (0x1f1e8, 0x1f1f7,): (1, 'flag: Costa Rica'),
+ (0x1f1e8, 0x1f1fa,): (1, 'flag: Cuba'),
+ (0x1f1e8, 0x1f1fb,): (1, 'flag: Cape Verde'),
+ (0x1f1e8, 0x1f1fc,): (1, 'flag: Curaçao'),
+ (0x1f1e8, 0x1f1fd,): (1, 'flag: Christmas Island'),
+ (0x1f1e8, 0x1f1fe,): (1, 'flag: Cyprus'),
+ (0x1f1e8, 0x1f1ff,): (1, 'flag: Czechia'),
+ (0x1f1e9, 0x1f1ea,): (1, 'flag: Germany'),
+ (0x1f1e9, 0x1f1ec,): (1, 'flag: Diego Garcia'),
+ (0x1f1e9, 0x1f1ef,): (1, 'flag: Djibouti'),
+ (0x1f1e9, 0x1f1f0,): (1, 'flag: Denmark'),
+ (0x1f1e9, 0x1f1f2,): (1, 'flag: Dominica'),
+ (0x1f1e9, 0x1f1f4,): (1, 'flag: Dominican Republic'),
+ (0x1f1e9, 0x1f1ff,): (1, 'flag: Algeria'),
+ (0x1f1ea, 0x1f1e6,): (1, 'flag: Ceuta & Melilla'),
+ (0x1f1ea, 0x1f1e8,): (1, 'flag: Ecuador'),
+ (0x1f1ea, 0x1f1ea,): (1, 'flag: Estonia'),
+ (0x1f1ea, 0x1f1ec,): (1, 'flag: Egypt'),
+ (0x1f1ea, 0x1f1ed,): (1, 'flag: Western Sahara'),
+ (0x1f1ea, 0x1f1f7,): (1, 'flag: Eritrea'),
+ (0x1f1ea, 0x1f1f8,): (1, 'flag: Spain'),
+ (0x1f1ea, 0x1f1f9,): (1, 'flag: Ethiopia'),
+ (0x1f1ea, 0x1f1fa,): (1, 'flag: European Union'),
+ (0x1f1eb, 0x1f1ee,): (1, 'flag: Finland'),
+ (0x1f1eb, 0x1f1ef,): (1, 'flag: Fiji'),
+ (0x1f1eb, 0x1f1f0,): (1, 'flag: Falkland Islands'),
+ (0x1f1eb, 0x1f1f2,): (1, 'flag: Micronesia'),
+ (0x1f1eb, 0x1f1f4,): (1, 'flag: Faroe Islands'),
+ (0x1f1eb, 0x1f1f7,): (1, 'flag: France'),
+ (0x1f1ec, 0x1f1e6,): (1, 'flag: Gabon'),
+ (0x1f1ec, 0x1f1e7,): (1, 'flag: United Kingdom'),
+ (0x1f1ec, 0x1f1e9,): (1, 'flag: Grenada'),
+ (0x1f1ec, 0x1f1ea,): (1, 'flag: Georgia'),
+ (0x1f1ec, 0x1f1eb,): (1, 'flag: French Guiana'),
+ (0x1f1ec, 0x1f1ec,): (1, 'flag: Guernsey'),
+ (0x1f1ec, 0x1f1ed,): (1, 'flag: Ghana'),
+ (0x1f1ec, 0x1f1ee,): (1, 'flag: Gibraltar'),
+ (0x1f1ec, 0x1f1f1,): (1, 'flag: Greenland'),
+ (0x1f1ec, 0x1f1f2,): (1, 'flag: Gambia'),
+ (0x1f1ec, 0x1f1f3,): (1, 'flag: Guinea'),
+ (0x1f1ec, 0x1f1f5,): (1, 'flag: Guadeloupe'),
+ (0x1f1ec, 0x1f1f6,): (1, 'flag: Equatorial Guinea'),
+ (0x1f1ec, 0x1f1f7,): (1, 'flag: Greece'),
+ (0x1f1ec, 0x1f1f8,): (1, 'flag: South Georgia & South Sandwich Islands'),
+ (0x1f1ec, 0x1f1f9,): (1, 'flag: Guatemala'),
+ (0x1f1ec, 0x1f1fa,): (1, 'flag: Guam'),
+ (0x1f1ec, 0x1f1fc,): (1, 'flag: Guinea-Bissau'),
+ (0x1f1ec, 0x1f1fe,): (1, 'flag: Guyana'),
+ (0x1f1ed, 0x1f1f0,): (1, 'flag: Hong Kong SAR China'),
+ (0x1f1ed, 0x1f1f2,): (1, 'flag: Heard & McDonald Islands'),
+ (0x1f1ed, 0x1f1f3,): (1, 'flag: Honduras'),
+ (0x1f1ed, 0x1f1f7,): (1, 'flag: Croatia'),
+ (0x1f1ed, 0x1f1f9,): (1, 'flag: Haiti'),
+ (0x1f1ed, 0x1f1fa,): (1, 'flag: Hungary'),
+ (0x1f1ee, 0x1f1e8,): (1, 'flag: Canary Islands'),
+ (0x1f1ee, 0x1f1e9,): (1, 'flag: Indonesia'),
+ (0x1f1ee, 0x1f1ea,): (1, 'flag: Ireland'),
+ (0x1f1ee, 0x1f1f1,): (1, 'flag: Israel'),
+ (0x1f1ee, 0x1f1f2,): (1, 'flag: Isle of Man'),
+ (0x1f1ee, 0x1f1f3,): (1, 'flag: India'),
+ (0x1f1ee, 0x1f1f4,): (1, 'flag: British Indian Ocean Territory'),
+ (0x1f1ee, 0x1f1f6,): (1, 'flag: Iraq'),
+ (0x1f1ee, 0x1f1f7,): (1, 'flag: Iran'),
+ (0x1f1ee, 0x1f1f8,): (1, 'flag: Iceland'),
+ (0x1f1ee, 0x1f1f9,): (1, 'flag: Italy'),
+ (0x1f1ef, 0x1f1ea,): (1, 'flag: Jersey'),
+ (0x1f1ef, 0x1f1f2,): (1, 'flag: Jamaica'),
+ (0x1f1ef, 0x1f1f4,): (1, 'flag: Jordan'),
+ (0x1f1ef, 0x1f1f5,): (1, 'flag: Japan'),
+ (0x1f1f0, 0x1f1ea,): (1, 'flag: Kenya'),
+ (0x1f1f0, 0x1f1ec,): (1, 'flag: Kyrgyzstan'),
+ (0x1f1f0, 0x1f1ed,): (1, 'flag: Cambodia'),
+ (0x1f1f0, 0x1f1ee,): (1, 'flag: Kiribati'),
+ (0x1f1f0, 0x1f1f2,): (1, 'flag: Comoros'),
+ (0x1f1f0, 0x1f1f3,): (1, 'flag: St. Kitts & Nevis'),
+ (0x1f1f0, 0x1f1f5,): (1, 'flag: North Korea'),
+ (0x1f1f0, 0x1f1f7,): (1, 'flag: South Korea'),
+ (0x1f1f0, 0x1f1fc,): (1, 'flag: Kuwait'),
+ (0x1f1f0, 0x1f1fe,): (1, 'flag: Cayman Islands'),
+ (0x1f1f0, 0x1f1ff,): (1, 'flag: Kazakhstan'),
+ (0x1f1f1, 0x1f1e6,): (1, 'flag: Laos'),
+ (0x1f1f1, 0x1f1e7,): (1, 'flag: Lebanon'),
+ (0x1f1f1, 0x1f1e8,): (1, 'flag: St. Lucia'),
+ (0x1f1f1, 0x1f1ee,): (1, 'flag: Liechtenstein'),
+ (0x1f1f1, 0x1f1f0,): (1, 'flag: Sri Lanka'),
+ (0x1f1f1, 0x1f1f7,): (1, 'flag: Liberia'),
+ (0x1f1f1, 0x1f1f8,): (1, 'flag: Lesotho'),
+ (0x1f1f1, 0x1f1f9,): (1, 'flag: Lithuania'),
+ (0x1f1f1, 0x1f1fa,): (1, 'flag: Luxembourg'),
+ (0x1f1f1, 0x1f1fb,): (1, 'flag: Latvia'),
+ (0x1f1f1, 0x1f1fe,): (1, 'flag: Libya'),
+ (0x1f1f2, 0x1f1e6,): (1, 'flag: Morocco'),
+ (0x1f1f2, 0x1f1e8,): (1, 'flag: Monaco'),
+ (0x1f1f2, 0x1f1e9,): (1, 'flag: Moldova'),
+ (0x1f1f2, 0x1f1ea,): (1, 'flag: Montenegro'),
+ (0x1f1f2, 0x1f1eb,): (1, 'flag: St. Martin'),
+ (0x1f1f2, 0x1f1ec,): (1, 'flag: Madagascar'),
+ (0x1f1f2, 0x1f1ed,): (1, 'flag: Marshall Islands'),
+ (0x1f1f2, 0x1f1f0,): (1, 'flag: Macedonia'),
+ (0x1f1f2, 0x1f1f1,): (1, 'flag: Mali'),
+ (0x1f1f2, 0x1f1f2,): (1, 'flag: Myanmar (Burma)'),
+ (0x1f1f2, 0x1f1f3,): (1, 'flag: Mongolia'),
+ (0x1f1f2, 0x1f1f4,): (1, 'flag: Macao SAR China'),
+ (0x1f1f2, 0x1f1f5,): (1, 'flag: Northern Mariana Islands'),
+ (0x1f1f2, 0x1f1f6,): (1, 'flag: Martinique'),
+ (0x1f1f2, 0x1f1f7,): (1, 'flag: Mauritania'),
+ (0x1f1f2, 0x1f1f8,): (1, 'flag: Montserrat'),
+ (0x1f1f2, 0x1f1f9,): (1, 'flag: Malta'),
+ (0x1f1f2, 0x1f1fa,): (1, 'flag: Mauritius'),
+ (0x1f1f2, 0x1f1fb,): (1, 'flag: Maldives'),
+ (0x1f1f2, 0x1f1fc,): (1, 'flag: Malawi'),
+ (0x1f1f2, 0x1f1fd,): (1, 'flag: Mexico'),
+ (0x1f1f2, 0x1f1fe,): (1, 'flag: Malaysia'),
+ (0x1f1f2, 0x1f1ff,): (1, 'flag: Mozambique'),
+ (0x1f1f3, 0x1f1e6,): (1, 'flag: Namibia'),
+ (0x1f1f3, 0x1f1e8,): (1, 'flag: New Caledonia'),
+ (0x1f1f3, 0x1f1ea,): (1, 'flag: Niger'),
+ (0x1f1f3, 0x1f1eb,): (1, 'flag: Norfolk Island'),
+ (0x1f1f3, 0x1f1ec,): (1, 'flag: Nigeria'),
+ (0x1f1f3, 0x1f1ee,): (1, 'flag: Nicaragua'),
+ (0x1f1f3, 0x1f1f1,): (1, 'flag: Netherlands'),
+ (0x1f1f3, 0x1f1f4,): (1, 'flag: Norway'),
+ (0x1f1f3, 0x1f1f5,): (1, 'flag: Nepal'),
+ (0x1f1f3, 0x1f1f7,): (1, 'flag: Nauru'),
+ (0x1f1f3, 0x1f1fa,): (1, 'flag: Niue'),
+ (0x1f1f3, 0x1f1ff,): (1, 'flag: New Zealand'),
+ (0x1f1f4, 0x1f1f2,): (1, 'flag: Oman'),
+ (0x1f1f5, 0x1f1e6,): (1, 'flag: Panama'),
+ (0x1f1f5, 0x1f1ea,): (1, 'flag: Peru'),
+ (0x1f1f5, 0x1f1eb,): (1, 'flag: French Polynesia'),
+ (0x1f1f5, 0x1f1ec,): (1, 'flag: Papua New Guinea'),
+ (0x1f1f5, 0x1f1ed,): (1, 'flag: Philippines'),
+ (0x1f1f5, 0x1f1f0,): (1, 'flag: Pakistan'),
+ (0x1f1f5, 0x1f1f1,): (1, 'flag: Poland'),
+ (0x1f1f5, 0x1f1f2,): (1, 'flag: St. Pierre & Miquelon'),
+ (0x1f1f5, 0x1f1f3,): (1, 'flag: Pitcairn Islands'),
+ (0x1f1f5, 0x1f1f7,): (1, 'flag: Puerto Rico'),
+ (0x1f1f5, 0x1f1f8,): (1, 'flag: Palestinian Territories'),
+ (0x1f1f5, 0x1f1f9,): (1, 'flag: Portugal'),
+ (0x1f1f5, 0x1f1fc,): (1, 'flag: Palau'),
+ (0x1f1f5, 0x1f1fe,): (1, 'flag: Paraguay'),
+ (0x1f1f6, 0x1f1e6,): (1, 'flag: Qatar'),
+ (0x1f1f7, 0x1f1ea,): (1, 'flag: Réunion'),
+ (0x1f1f7, 0x1f1f4,): (1, 'flag: Romania'),
+ (0x1f1f7, 0x1f1f8,): (1, 'flag: Serbia'),
+ (0x1f1f7, 0x1f1fa,): (1, 'flag: Russia'),
+ (0x1f1f7, 0x1f1fc,): (1, 'flag: Rwanda'),
+ (0x1f1f8, 0x1f1e6,): (1, 'flag: Saudi Arabia'),
+ (0x1f1f8, 0x1f1e7,): (1, 'flag: Solomon Islands'),
+ (0x1f1f8, 0x1f1e8,): (1, 'flag: Seychelles'),
+ (0x1f1f8, 0x1f1e9,): (1, 'flag: Sudan'),
+ (0x1f1f8, 0x1f1ea,): (1, 'flag: Sweden'),
+ (0x1f1f8, 0x1f1ec,): (1, 'flag: Singapore'),
+ (0x1f1f8, 0x1f1ed,): (1, 'flag: St. Helena'),
+ (0x1f1f8, 0x1f1ee,): (1, 'flag: Slovenia'),
+ (0x1f1f8, 0x1f1ef,): (1, 'flag: Svalbard & Jan Mayen'),
+ (0x1f1f8, 0x1f1f0,): (1, 'flag: Slovakia'),
+ (0x1f1f8, 0x1f1f1,): (1, 'flag: Sierra Leone'),
+ (0x1f1f8, 0x1f1f2,): (1, 'flag: San Marino'),
+ (0x1f1f8, 0x1f1f3,): (1, 'flag: Senegal'),
+ (0x1f1f8, 0x1f1f4,): (1, 'flag: Somalia'),
+ (0x1f1f8, 0x1f1f7,): (1, 'flag: Suriname'),
+ (0x1f1f8, 0x1f1f8,): (1, 'flag: South Sudan'),
+ (0x1f1f8, 0x1f1f9,): (1, 'flag: São Tomé & Príncipe'),
+ (0x1f1f8, 0x1f1fb,): (1, 'flag: El Salvador'),
+ (0x1f1f8, 0x1f1fd,): (1, 'flag: Sint Maarten'),
+ (0x1f1f8, 0x1f1fe,): (1, 'flag: Syria'),
+ (0x1f1f8, 0x1f1ff,): (1, 'flag: Eswatini'),
+ (0x1f1f9, 0x1f1e6,): (1, 'flag: Tristan da Cunha'),
+ (0x1f1f9, 0x1f1e8,): (1, 'flag: Turks & Caicos Islands'),
+ (0x1f1f9, 0x1f1e9,): (1, 'flag: Chad'),
+ (0x1f1f9, 0x1f1eb,): (1, 'flag: French Southern Territories'),
+ (0x1f1f9, 0x1f1ec,): (1, 'flag: Togo'),
+ (0x1f1f9, 0x1f1ed,): (1, 'flag: Thailand'),
+ (0x1f1f9, 0x1f1ef,): (1, 'flag: Tajikistan'),
+ (0x1f1f9, 0x1f1f0,): (1, 'flag: Tokelau'),
+ (0x1f1f9, 0x1f1f1,): (1, 'flag: Timor-Leste'),
+ (0x1f1f9, 0x1f1f2,): (1, 'flag: Turkmenistan'),
+ (0x1f1f9, 0x1f1f3,): (1, 'flag: Tunisia'),
+ (0x1f1f9, 0x1f1f4,): (1, 'flag: Tonga'),
+ (0x1f1f9, 0x1f1f7,): (1, 'flag: Turkey'),
+ (0x1f1f9, 0x1f1f9,): (1, 'flag: Trinidad & Tobago'),
+ (0x1f1f9, 0x1f1fb,): (1, 'flag: Tuvalu'),
+ (0x1f1f9, 0x1f1fc,): (1, 'flag: Taiwan'),
+ (0x1f1f9, 0x1f1ff,): (1, 'flag: Tanzania'),
+ (0x1f1fa, 0x1f1e6,): (1, 'flag: Ukraine'),
+ (0x1f1fa, 0x1f1ec,): (1, 'flag: Uganda'),
+ (0x1f1fa, 0x1f1f2,): (1, 'flag: U.S. Outlying Islands'),
+ (0x1f1fa, 0x1f1f3,): (1, 'flag: United Nations'),
+ (0x1f1fa, 0x1f1f8,): (1, 'flag: United States'),
+ (0x1f1fa, 0x1f1fe,): (1, 'flag: Uruguay'),
+ (0x1f1fa, 0x1f1ff,): (1, 'flag: Uzbekistan'),
+ (0x1f1fb, 0x1f1e6,): (1, 'flag: Vatican City'),
+ (0x1f1fb, 0x1f1e8,): (1, 'flag: St. Vincent & Grenadines'),
+ (0x1f1fb, 0x1f1ea,): (1, 'flag: Venezuela'),
+ (0x1f1fb, 0x1f1ec,): (1, 'flag: British Virgin Islands'),
+ (0x1f1fb, 0x1f1ee,): (1, 'flag: U.S. Virgin Islands'),
+ (0x1f1fb, 0x1f1f3,): (1, 'flag: Vietnam'),
+ (0x1f1fb, 0x1f1fa,): (1, 'flag: Vanuatu'),
+ (0x1f1fc, 0x1f1eb,): (1, 'flag: Wallis & Futuna'),
+ (0x1f1fc, 0x1f1f8,): (1, 'flag: Samoa'),
+ (0x1f1fd, 0x1f1f0,): (1, 'flag: Kosovo'),
+ (0x1f1fe, 0x1f1ea,): (1, 'flag: Yemen'),
+ (0x1f1fe, 0x1f1f9,): (1, 'flag: Mayotte'),
+ (0x1f1ff, 0x1f1e6,): (1, 'flag: South Africa'),
+ (0x1f1ff, 0x1f1f2,): (1, 'flag: Zambia'),
+ (0x1f1ff, 0x1f1fc,): (1, 'flag: Zimbabwe'),
+ (0x1f3f4, 0xe0067, 0xe0062, 0xe0065, 0xe006e, 0xe0067, 0xe007f,): (2, 'flag: England'),
+ (0x1f3f4, 0xe0067, 0xe0062, 0xe0073, 0xe0063, 0xe0074, 0xe007f,): (2, 'flag: Scotland'),
+ (0x1f3f4, 0xe0067, 0xe0062, 0xe0077, 0xe006c, 0xe0073, 0xe007f,): (2, 'flag: Wales'),
+ (0x261d, 0x1f3fb,): (3, 'index pointing up: light skin tone'),
+ (0x261d, 0x1f3fc,): (3, 'index pointing up: medium-light skin tone'),
+ (0x261d, 0x1f3fd,): (3, 'index pointing up: medium skin tone'),
+ (0x261d, 0x1f3fe,): (3, 'index pointing up: medium-dark skin tone'),
+ (0x261d, 0x1f3ff,): (3, 'index pointing up: dark skin tone'),
+ (0x26f9, 0x1f3fb,): (3, 'person bouncing ball: light skin tone'),
+ (0x26f9, 0x1f3fc,): (3, 'person bouncing ball: medium-light skin tone'),
+ (0x26f9, 0x1f3fd,): (3, 'person bouncing ball: medium skin tone'),
+ (0x26f9, 0x1f3fe,): (3, 'person bouncing ball: medium-dark skin tone'),
+ (0x26f9, 0x1f3ff,): (3, 'person bouncing ball: dark skin tone'),
+ (0x270a, 0x1f3fb,): (3, 'raised fist: light skin tone'),
+ (0x270a, 0x1f3fc,): (3, 'raised fist: medium-light skin tone'),
+ (0x270a, 0x1f3fd,): (3, 'raised fist: medium skin tone'),
+ (0x270a, 0x1f3fe,): (3, 'raised fist: medium-dark skin tone'),
+ (0x270a, 0x1f3ff,): (3, 'raised fist: dark skin tone'),
+ (0x270b, 0x1f3fb,): (3, 'raised hand: light skin tone'),
+ (0x270b, 0x1f3fc,): (3, 'raised hand: medium-light skin tone'),
+ (0x270b, 0x1f3fd,): (3, 'raised hand: medium skin tone'),
+ (0x270b, 0x1f3fe,): (3, 'raised hand: medium-dark skin tone'),
+ (0x270b, 0x1f3ff,): (3, 'raised hand: dark skin tone'),
+ (0x270c, 0x1f3fb,): (3, 'victory hand: light skin tone'),
+ (0x270c, 0x1f3fc,): (3, 'victory hand: medium-light skin tone'),
+ (0x270c, 0x1f3fd,): (3, 'victory hand: medium skin tone'),
+ (0x270c, 0x1f3fe,): (3, 'victory hand: medium-dark skin tone'),
+ (0x270c, 0x1f3ff,): (3, 'victory hand: dark skin tone'),
+ (0x270d, 0x1f3fb,): (3, 'writing hand: light skin tone'),
+ (0x270d, 0x1f3fc,): (3, 'writing hand: medium-light skin tone'),
+ (0x270d, 0x1f3fd,): (3, 'writing hand: medium skin tone'),
+ (0x270d, 0x1f3fe,): (3, 'writing hand: medium-dark skin tone'),
+ (0x270d, 0x1f3ff,): (3, 'writing hand: dark skin tone'),
+ (0x1f385, 0x1f3fb,): (3, 'Santa Claus: light skin tone'),
+ (0x1f385, 0x1f3fc,): (3, 'Santa Claus: medium-light skin tone'),
+ (0x1f385, 0x1f3fd,): (3, 'Santa Claus: medium skin tone'),
+ (0x1f385, 0x1f3fe,): (3, 'Santa Claus: medium-dark skin tone'),
+ (0x1f385, 0x1f3ff,): (3, 'Santa Claus: dark skin tone'),
+ (0x1f3c2, 0x1f3fb,): (3, 'snowboarder: light skin tone'),
+ (0x1f3c2, 0x1f3fc,): (3, 'snowboarder: medium-light skin tone'),
+ (0x1f3c2, 0x1f3fd,): (3, 'snowboarder: medium skin tone'),
+ (0x1f3c2, 0x1f3fe,): (3, 'snowboarder: medium-dark skin tone'),
+ (0x1f3c2, 0x1f3ff,): (3, 'snowboarder: dark skin tone'),
+ (0x1f3c3, 0x1f3fb,): (3, 'person running: light skin tone'),
+ (0x1f3c3, 0x1f3fc,): (3, 'person running: medium-light skin tone'),
+ (0x1f3c3, 0x1f3fd,): (3, 'person running: medium skin tone'),
+ (0x1f3c3, 0x1f3fe,): (3, 'person running: medium-dark skin tone'),
+ (0x1f3c3, 0x1f3ff,): (3, 'person running: dark skin tone'),
+ (0x1f3c4, 0x1f3fb,): (3, 'person surfing: light skin tone'),
+ (0x1f3c4, 0x1f3fc,): (3, 'person surfing: medium-light skin tone'),
+ (0x1f3c4, 0x1f3fd,): (3, 'person surfing: medium skin tone'),
+ (0x1f3c4, 0x1f3fe,): (3, 'person surfing: medium-dark skin tone'),
+ (0x1f3c4, 0x1f3ff,): (3, 'person surfing: dark skin tone'),
+ (0x1f3c7, 0x1f3fb,): (3, 'horse racing: light skin tone'),
+ (0x1f3c7, 0x1f3fc,): (3, 'horse racing: medium-light skin tone'),
+ (0x1f3c7, 0x1f3fd,): (3, 'horse racing: medium skin tone'),
+ (0x1f3c7, 0x1f3fe,): (3, 'horse racing: medium-dark skin tone'),
+ (0x1f3c7, 0x1f3ff,): (3, 'horse racing: dark skin tone'),
+ (0x1f3ca, 0x1f3fb,): (3, 'person swimming: light skin tone'),
+ (0x1f3ca, 0x1f3fc,): (3, 'person swimming: medium-light skin tone'),
+ (0x1f3ca, 0x1f3fd,): (3, 'person swimming: medium skin tone'),
+ (0x1f3ca, 0x1f3fe,): (3, 'person swimming: medium-dark skin tone'),
+ (0x1f3ca, 0x1f3ff,): (3, 'person swimming: dark skin tone'),
+ (0x1f3cb, 0x1f3fb,): (3, 'person lifting weights: light skin tone'),
+ (0x1f3cb, 0x1f3fc,): (3, 'person lifting weights: medium-light skin tone'),
+ (0x1f3cb, 0x1f3fd,): (3, 'person lifting weights: medium skin tone'),
+ (0x1f3cb, 0x1f3fe,): (3, 'person lifting weights: medium-dark skin tone'),
+ (0x1f3cb, 0x1f3ff,): (3, 'person lifting weights: dark skin tone'),
+ (0x1f3cc, 0x1f3fb,): (3, 'person golfing: light skin tone'),
+ (0x1f3cc, 0x1f3fc,): (3, 'person golfing: medium-light skin tone'),
+ (0x1f3cc, 0x1f3fd,): (3, 'person golfing: medium skin tone'),
+ (0x1f3cc, 0x1f3fe,): (3, 'person golfing: medium-dark skin tone'),
+ (0x1f3cc, 0x1f3ff,): (3, 'person golfing: dark skin tone'),
+ (0x1f442, 0x1f3fb,): (3, 'ear: light skin tone'),
+ (0x1f442, 0x1f3fc,): (3, 'ear: medium-light skin tone'),
+ (0x1f442, 0x1f3fd,): (3, 'ear: medium skin tone'),
+ (0x1f442, 0x1f3fe,): (3, 'ear: medium-dark skin tone'),
+ (0x1f442, 0x1f3ff,): (3, 'ear: dark skin tone'),
+ (0x1f443, 0x1f3fb,): (3, 'nose: light skin tone'),
+ (0x1f443, 0x1f3fc,): (3, 'nose: medium-light skin tone'),
+ (0x1f443, 0x1f3fd,): (3, 'nose: medium skin tone'),
+ (0x1f443, 0x1f3fe,): (3, 'nose: medium-dark skin tone'),
+ (0x1f443, 0x1f3ff,): (3, 'nose: dark skin tone'),
+ (0x1f446, 0x1f3fb,): (3, 'backhand index pointing up: light skin tone'),
+ (0x1f446, 0x1f3fc,): (3, 'backhand index pointing up: medium-light skin tone'),
+ (0x1f446, 0x1f3fd,): (3, 'backhand index pointing up: medium skin tone'),
+ (0x1f446, 0x1f3fe,): (3, 'backhand index pointing up: medium-dark skin tone'),
+ (0x1f446, 0x1f3ff,): (3, 'backhand index pointing up: dark skin tone'),
+ (0x1f447, 0x1f3fb,): (3, 'backhand index pointing down: light skin tone'),
+ (0x1f447, 0x1f3fc,): (3, 'backhand index pointing down: medium-light skin tone'),
+ (0x1f447, 0x1f3fd,): (3, 'backhand index pointing down: medium skin tone'),
+ (0x1f447, 0x1f3fe,): (3, 'backhand index pointing down: medium-dark skin tone'),
+ (0x1f447, 0x1f3ff,): (3, 'backhand index pointing down: dark skin tone'),
+ (0x1f448, 0x1f3fb,): (3, 'backhand index pointing left: light skin tone'),
+ (0x1f448, 0x1f3fc,): (3, 'backhand index pointing left: medium-light skin tone'),
+ (0x1f448, 0x1f3fd,): (3, 'backhand index pointing left: medium skin tone'),
+ (0x1f448, 0x1f3fe,): (3, 'backhand index pointing left: medium-dark skin tone'),
+ (0x1f448, 0x1f3ff,): (3, 'backhand index pointing left: dark skin tone'),
+ (0x1f449, 0x1f3fb,): (3, 'backhand index pointing right: light skin tone'),
+ (0x1f449, 0x1f3fc,): (3, 'backhand index pointing right: medium-light skin tone'),
+ (0x1f449, 0x1f3fd,): (3, 'backhand index pointing right: medium skin tone'),
+ (0x1f449, 0x1f3fe,): (3, 'backhand index pointing right: medium-dark skin tone'),
+ (0x1f449, 0x1f3ff,): (3, 'backhand index pointing right: dark skin tone'),
+ (0x1f44a, 0x1f3fb,): (3, 'oncoming fist: light skin tone'),
+ (0x1f44a, 0x1f3fc,): (3, 'oncoming fist: medium-light skin tone'),
+ (0x1f44a, 0x1f3fd,): (3, 'oncoming fist: medium skin tone'),
+ (0x1f44a, 0x1f3fe,): (3, 'oncoming fist: medium-dark skin tone'),
+ (0x1f44a, 0x1f3ff,): (3, 'oncoming fist: dark skin tone'),
+ (0x1f44b, 0x1f3fb,): (3, 'waving hand: light skin tone'),
+ (0x1f44b, 0x1f3fc,): (3, 'waving hand: medium-light skin tone'),
+ (0x1f44b, 0x1f3fd,): (3, 'waving hand: medium skin tone'),
+ (0x1f44b, 0x1f3fe,): (3, 'waving hand: medium-dark skin tone'),
+ (0x1f44b, 0x1f3ff,): (3, 'waving hand: dark skin tone'),
+ (0x1f44c, 0x1f3fb,): (3, 'OK hand: light skin tone'),
+ (0x1f44c, 0x1f3fc,): (3, 'OK hand: medium-light skin tone'),
+ (0x1f44c, 0x1f3fd,): (3, 'OK hand: medium skin tone'),
+ (0x1f44c, 0x1f3fe,): (3, 'OK hand: medium-dark skin tone'),
+ (0x1f44c, 0x1f3ff,): (3, 'OK hand: dark skin tone'),
+ (0x1f44d, 0x1f3fb,): (3, 'thumbs up: light skin tone'),
+ (0x1f44d, 0x1f3fc,): (3, 'thumbs up: medium-light skin tone'),
+ (0x1f44d, 0x1f3fd,): (3, 'thumbs up: medium skin tone'),
+ (0x1f44d, 0x1f3fe,): (3, 'thumbs up: medium-dark skin tone'),
+ (0x1f44d, 0x1f3ff,): (3, 'thumbs up: dark skin tone'),
+ (0x1f44e, 0x1f3fb,): (3, 'thumbs down: light skin tone'),
+ (0x1f44e, 0x1f3fc,): (3, 'thumbs down: medium-light skin tone'),
+ (0x1f44e, 0x1f3fd,): (3, 'thumbs down: medium skin tone'),
+ (0x1f44e, 0x1f3fe,): (3, 'thumbs down: medium-dark skin tone'),
+ (0x1f44e, 0x1f3ff,): (3, 'thumbs down: dark skin tone'),
+ (0x1f44f, 0x1f3fb,): (3, 'clapping hands: light skin tone'),
+ (0x1f44f, 0x1f3fc,): (3, 'clapping hands: medium-light skin tone'),
+ (0x1f44f, 0x1f3fd,): (3, 'clapping hands: medium skin tone'),
+ (0x1f44f, 0x1f3fe,): (3, 'clapping hands: medium-dark skin tone'),
+ (0x1f44f, 0x1f3ff,): (3, 'clapping hands: dark skin tone'),
+ (0x1f450, 0x1f3fb,): (3, 'open hands: light skin tone'),
+ (0x1f450, 0x1f3fc,): (3, 'open hands: medium-light skin tone'),
+ (0x1f450, 0x1f3fd,): (3, 'open hands: medium skin tone'),
+ (0x1f450, 0x1f3fe,): (3, 'open hands: medium-dark skin tone'),
+ (0x1f450, 0x1f3ff,): (3, 'open hands: dark skin tone'),
+ (0x1f466, 0x1f3fb,): (3, 'boy: light skin tone'),
+ (0x1f466, 0x1f3fc,): (3, 'boy: medium-light skin tone'),
+ (0x1f466, 0x1f3fd,): (3, 'boy: medium skin tone'),
+ (0x1f466, 0x1f3fe,): (3, 'boy: medium-dark skin tone'),
+ (0x1f466, 0x1f3ff,): (3, 'boy: dark skin tone'),
+ (0x1f467, 0x1f3fb,): (3, 'girl: light skin tone'),
+ (0x1f467, 0x1f3fc,): (3, 'girl: medium-light skin tone'),
+ (0x1f467, 0x1f3fd,): (3, 'girl: medium skin tone'),
+ (0x1f467, 0x1f3fe,): (3, 'girl: medium-dark skin tone'),
+ (0x1f467, 0x1f3ff,): (3, 'girl: dark skin tone'),
+ (0x1f468, 0x1f3fb,): (3, 'man: light skin tone'),
+ (0x1f468, 0x1f3fc,): (3, 'man: medium-light skin tone'),
+ (0x1f468, 0x1f3fd,): (3, 'man: medium skin tone'),
+ (0x1f468, 0x1f3fe,): (3, 'man: medium-dark skin tone'),
+ (0x1f468, 0x1f3ff,): (3, 'man: dark skin tone'),
+ (0x1f469, 0x1f3fb,): (3, 'woman: light skin tone'),
+ (0x1f469, 0x1f3fc,): (3, 'woman: medium-light skin tone'),
+ (0x1f469, 0x1f3fd,): (3, 'woman: medium skin tone'),
+ (0x1f469, 0x1f3fe,): (3, 'woman: medium-dark skin tone'),
+ (0x1f469, 0x1f3ff,): (3, 'woman: dark skin tone'),
+ (0x1f46e, 0x1f3fb,): (3, 'police officer: light skin tone'),
+ (0x1f46e, 0x1f3fc,): (3, 'police officer: medium-light skin tone'),
+ (0x1f46e, 0x1f3fd,): (3, 'police officer: medium skin tone'),
+ (0x1f46e, 0x1f3fe,): (3, 'police officer: medium-dark skin tone'),
+ (0x1f46e, 0x1f3ff,): (3, 'police officer: dark skin tone'),
+ (0x1f470, 0x1f3fb,): (3, 'bride with veil: light skin tone'),
+ (0x1f470, 0x1f3fc,): (3, 'bride with veil: medium-light skin tone'),
+ (0x1f470, 0x1f3fd,): (3, 'bride with veil: medium skin tone'),
+ (0x1f470, 0x1f3fe,): (3, 'bride with veil: medium-dark skin tone'),
+ (0x1f470, 0x1f3ff,): (3, 'bride with veil: dark skin tone'),
+ (0x1f471, 0x1f3fb,): (3, 'person: light skin tone, blond hair'),
+ (0x1f471, 0x1f3fc,): (3, 'person: medium-light skin tone, blond hair'),
+ (0x1f471, 0x1f3fd,): (3, 'person: medium skin tone, blond hair'),
+ (0x1f471, 0x1f3fe,): (3, 'person: medium-dark skin tone, blond hair'),
+ (0x1f471, 0x1f3ff,): (3, 'person: dark skin tone, blond hair'),
+ (0x1f472, 0x1f3fb,): (3, 'man with Chinese cap: light skin tone'),
+ (0x1f472, 0x1f3fc,): (3, 'man with Chinese cap: medium-light skin tone'),
+ (0x1f472, 0x1f3fd,): (3, 'man with Chinese cap: medium skin tone'),
+ (0x1f472, 0x1f3fe,): (3, 'man with Chinese cap: medium-dark skin tone'),
+ (0x1f472, 0x1f3ff,): (3, 'man with Chinese cap: dark skin tone'),
+ (0x1f473, 0x1f3fb,): (3, 'person wearing turban: light skin tone'),
+ (0x1f473, 0x1f3fc,): (3, 'person wearing turban: medium-light skin tone'),
+ (0x1f473, 0x1f3fd,): (3, 'person wearing turban: medium skin tone'),
+ (0x1f473, 0x1f3fe,): (3, 'person wearing turban: medium-dark skin tone'),
+ (0x1f473, 0x1f3ff,): (3, 'person wearing turban: dark skin tone'),
+ (0x1f474, 0x1f3fb,): (3, 'old man: light skin tone'),
+ (0x1f474, 0x1f3fc,): (3, 'old man: medium-light skin tone'),
+ (0x1f474, 0x1f3fd,): (3, 'old man: medium skin tone'),
+ (0x1f474, 0x1f3fe,): (3, 'old man: medium-dark skin tone'),
+ (0x1f474, 0x1f3ff,): (3, 'old man: dark skin tone'),
+ (0x1f475, 0x1f3fb,): (3, 'old woman: light skin tone'),
+ (0x1f475, 0x1f3fc,): (3, 'old woman: medium-light skin tone'),
+ (0x1f475, 0x1f3fd,): (3, 'old woman: medium skin tone'),
+ (0x1f475, 0x1f3fe,): (3, 'old woman: medium-dark skin tone'),
+ (0x1f475, 0x1f3ff,): (3, 'old woman: dark skin tone'),
+ (0x1f476, 0x1f3fb,): (3, 'baby: light skin tone'),
+ (0x1f476, 0x1f3fc,): (3, 'baby: medium-light skin tone'),
+ (0x1f476, 0x1f3fd,): (3, 'baby: medium skin tone'),
+ (0x1f476, 0x1f3fe,): (3, 'baby: medium-dark skin tone'),
+ (0x1f476, 0x1f3ff,): (3, 'baby: dark skin tone'),
+ (0x1f477, 0x1f3fb,): (3, 'construction worker: light skin tone'),
+ (0x1f477, 0x1f3fc,): (3, 'construction worker: medium-light skin tone'),
+ (0x1f477, 0x1f3fd,): (3, 'construction worker: medium skin tone'),
+ (0x1f477, 0x1f3fe,): (3, 'construction worker: medium-dark skin tone'),
+ (0x1f477, 0x1f3ff,): (3, 'construction worker: dark skin tone'),
+ (0x1f478, 0x1f3fb,): (3, 'princess: light skin tone'),
+ (0x1f478, 0x1f3fc,): (3, 'princess: medium-light skin tone'),
+ (0x1f478, 0x1f3fd,): (3, 'princess: medium skin tone'),
+ (0x1f478, 0x1f3fe,): (3, 'princess: medium-dark skin tone'),
+ (0x1f478, 0x1f3ff,): (3, 'princess: dark skin tone'),
+ (0x1f47c, 0x1f3fb,): (3, 'baby angel: light skin tone'),
+ (0x1f47c, 0x1f3fc,): (3, 'baby angel: medium-light skin tone'),
+ (0x1f47c, 0x1f3fd,): (3, 'baby angel: medium skin tone'),
+ (0x1f47c, 0x1f3fe,): (3, 'baby angel: medium-dark skin tone'),
+ (0x1f47c, 0x1f3ff,): (3, 'baby angel: dark skin tone'),
+ (0x1f481, 0x1f3fb,): (3, 'person tipping hand: light skin tone'),
+ (0x1f481, 0x1f3fc,): (3, 'person tipping hand: medium-light skin tone'),
+ (0x1f481, 0x1f3fd,): (3, 'person tipping hand: medium skin tone'),
+ (0x1f481, 0x1f3fe,): (3, 'person tipping hand: medium-dark skin tone'),
+ (0x1f481, 0x1f3ff,): (3, 'person tipping hand: dark skin tone'),
+ (0x1f482, 0x1f3fb,): (3, 'guard: light skin tone'),
+ (0x1f482, 0x1f3fc,): (3, 'guard: medium-light skin tone'),
+ (0x1f482, 0x1f3fd,): (3, 'guard: medium skin tone'),
+ (0x1f482, 0x1f3fe,): (3, 'guard: medium-dark skin tone'),
+ (0x1f482, 0x1f3ff,): (3, 'guard: dark skin tone'),
+ (0x1f483, 0x1f3fb,): (3, 'woman dancing: light skin tone'),
+ (0x1f483, 0x1f3fc,): (3, 'woman dancing: medium-light skin tone'),
+ (0x1f483, 0x1f3fd,): (3, 'woman dancing: medium skin tone'),
+ (0x1f483, 0x1f3fe,): (3, 'woman dancing: medium-dark skin tone'),
+ (0x1f483, 0x1f3ff,): (3, 'woman dancing: dark skin tone'),
+ (0x1f485, 0x1f3fb,): (3, 'nail polish: light skin tone'),
+ (0x1f485, 0x1f3fc,): (3, 'nail polish: medium-light skin tone'),
+ (0x1f485, 0x1f3fd,): (3, 'nail polish: medium skin tone'),
+ (0x1f485, 0x1f3fe,): (3, 'nail polish: medium-dark skin tone'),
+ (0x1f485, 0x1f3ff,): (3, 'nail polish: dark skin tone'),
+ (0x1f486, 0x1f3fb,): (3, 'person getting massage: light skin tone'),
+ (0x1f486, 0x1f3fc,): (3, 'person getting massage: medium-light skin tone'),
+ (0x1f486, 0x1f3fd,): (3, 'person getting massage: medium skin tone'),
+ (0x1f486, 0x1f3fe,): (3, 'person getting massage: medium-dark skin tone'),
+ (0x1f486, 0x1f3ff,): (3, 'person getting massage: dark skin tone'),
+ (0x1f487, 0x1f3fb,): (3, 'person getting haircut: light skin tone'),
+ (0x1f487, 0x1f3fc,): (3, 'person getting haircut: medium-light skin tone'),
+ (0x1f487, 0x1f3fd,): (3, 'person getting haircut: medium skin tone'),
+ (0x1f487, 0x1f3fe,): (3, 'person getting haircut: medium-dark skin tone'),
+ (0x1f487, 0x1f3ff,): (3, 'person getting haircut: dark skin tone'),
+ (0x1f4aa, 0x1f3fb,): (3, 'flexed biceps: light skin tone'),
+ (0x1f4aa, 0x1f3fc,): (3, 'flexed biceps: medium-light skin tone'),
+ (0x1f4aa, 0x1f3fd,): (3, 'flexed biceps: medium skin tone'),
+ (0x1f4aa, 0x1f3fe,): (3, 'flexed biceps: medium-dark skin tone'),
+ (0x1f4aa, 0x1f3ff,): (3, 'flexed biceps: dark skin tone'),
+ (0x1f574, 0x1f3fb,): (3, 'man in suit levitating: light skin tone'),
+ (0x1f574, 0x1f3fc,): (3, 'man in suit levitating: medium-light skin tone'),
+ (0x1f574, 0x1f3fd,): (3, 'man in suit levitating: medium skin tone'),
+ (0x1f574, 0x1f3fe,): (3, 'man in suit levitating: medium-dark skin tone'),
+ (0x1f574, 0x1f3ff,): (3, 'man in suit levitating: dark skin tone'),
+ (0x1f575, 0x1f3fb,): (3, 'detective: light skin tone'),
+ (0x1f575, 0x1f3fc,): (3, 'detective: medium-light skin tone'),
+ (0x1f575, 0x1f3fd,): (3, 'detective: medium skin tone'),
+ (0x1f575, 0x1f3fe,): (3, 'detective: medium-dark skin tone'),
+ (0x1f575, 0x1f3ff,): (3, 'detective: dark skin tone'),
+ (0x1f57a, 0x1f3fb,): (3, 'man dancing: light skin tone'),
+ (0x1f57a, 0x1f3fc,): (3, 'man dancing: medium-light skin tone'),
+ (0x1f57a, 0x1f3fd,): (3, 'man dancing: medium skin tone'),
+ (0x1f57a, 0x1f3fe,): (3, 'man dancing: medium-dark skin tone'),
+ (0x1f57a, 0x1f3ff,): (3, 'man dancing: dark skin tone'),
+ (0x1f590, 0x1f3fb,): (3, 'hand with fingers splayed: light skin tone'),
+ (0x1f590, 0x1f3fc,): (3, 'hand with fingers splayed: medium-light skin tone'),
+ (0x1f590, 0x1f3fd,): (3, 'hand with fingers splayed: medium skin tone'),
+ (0x1f590, 0x1f3fe,): (3, 'hand with fingers splayed: medium-dark skin tone'),
+ (0x1f590, 0x1f3ff,): (3, 'hand with fingers splayed: dark skin tone'),
+ (0x1f595, 0x1f3fb,): (3, 'middle finger: light skin tone'),
+ (0x1f595, 0x1f3fc,): (3, 'middle finger: medium-light skin tone'),
+ (0x1f595, 0x1f3fd,): (3, 'middle finger: medium skin tone'),
+ (0x1f595, 0x1f3fe,): (3, 'middle finger: medium-dark skin tone'),
+ (0x1f595, 0x1f3ff,): (3, 'middle finger: dark skin tone'),
+ (0x1f596, 0x1f3fb,): (3, 'vulcan salute: light skin tone'),
+ (0x1f596, 0x1f3fc,): (3, 'vulcan salute: medium-light skin tone'),
+ (0x1f596, 0x1f3fd,): (3, 'vulcan salute: medium skin tone'),
+ (0x1f596, 0x1f3fe,): (3, 'vulcan salute: medium-dark skin tone'),
+ (0x1f596, 0x1f3ff,): (3, 'vulcan salute: dark skin tone'),
+ (0x1f645, 0x1f3fb,): (3, 'person gesturing NO: light skin tone'),
+ (0x1f645, 0x1f3fc,): (3, 'person gesturing NO: medium-light skin tone'),
+ (0x1f645, 0x1f3fd,): (3, 'person gesturing NO: medium skin tone'),
+ (0x1f645, 0x1f3fe,): (3, 'person gesturing NO: medium-dark skin tone'),
+ (0x1f645, 0x1f3ff,): (3, 'person gesturing NO: dark skin tone'),
+ (0x1f646, 0x1f3fb,): (3, 'person gesturing OK: light skin tone'),
+ (0x1f646, 0x1f3fc,): (3, 'person gesturing OK: medium-light skin tone'),
+ (0x1f646, 0x1f3fd,): (3, 'person gesturing OK: medium skin tone'),
+ (0x1f646, 0x1f3fe,): (3, 'person gesturing OK: medium-dark skin tone'),
+ (0x1f646, 0x1f3ff,): (3, 'person gesturing OK: dark skin tone'),
+ (0x1f647, 0x1f3fb,): (3, 'person bowing: light skin tone'),
+ (0x1f647, 0x1f3fc,): (3, 'person bowing: medium-light skin tone'),
+ (0x1f647, 0x1f3fd,): (3, 'person bowing: medium skin tone'),
+ (0x1f647, 0x1f3fe,): (3, 'person bowing: medium-dark skin tone'),
+ (0x1f647, 0x1f3ff,): (3, 'person bowing: dark skin tone'),
+ (0x1f64b, 0x1f3fb,): (3, 'person raising hand: light skin tone'),
+ (0x1f64b, 0x1f3fc,): (3, 'person raising hand: medium-light skin tone'),
+ (0x1f64b, 0x1f3fd,): (3, 'person raising hand: medium skin tone'),
+ (0x1f64b, 0x1f3fe,): (3, 'person raising hand: medium-dark skin tone'),
+ (0x1f64b, 0x1f3ff,): (3, 'person raising hand: dark skin tone'),
+ (0x1f64c, 0x1f3fb,): (3, 'raising hands: light skin tone'),
+ (0x1f64c, 0x1f3fc,): (3, 'raising hands: medium-light skin tone'),
+ (0x1f64c, 0x1f3fd,): (3, 'raising hands: medium skin tone'),
+ (0x1f64c, 0x1f3fe,): (3, 'raising hands: medium-dark skin tone'),
+ (0x1f64c, 0x1f3ff,): (3, 'raising hands: dark skin tone'),
+ (0x1f64d, 0x1f3fb,): (3, 'person frowning: light skin tone'),
+ (0x1f64d, 0x1f3fc,): (3, 'person frowning: medium-light skin tone'),
+ (0x1f64d, 0x1f3fd,): (3, 'person frowning: medium skin tone'),
+ (0x1f64d, 0x1f3fe,): (3, 'person frowning: medium-dark skin tone'),
+ (0x1f64d, 0x1f3ff,): (3, 'person frowning: dark skin tone'),
+ (0x1f64e, 0x1f3fb,): (3, 'person pouting: light skin tone'),
+ (0x1f64e, 0x1f3fc,): (3, 'person pouting: medium-light skin tone'),
+ (0x1f64e, 0x1f3fd,): (3, 'person pouting: medium skin tone'),
+ (0x1f64e, 0x1f3fe,): (3, 'person pouting: medium-dark skin tone'),
+ (0x1f64e, 0x1f3ff,): (3, 'person pouting: dark skin tone'),
+ (0x1f64f, 0x1f3fb,): (3, 'folded hands: light skin tone'),
+ (0x1f64f, 0x1f3fc,): (3, 'folded hands: medium-light skin tone'),
+ (0x1f64f, 0x1f3fd,): (3, 'folded hands: medium skin tone'),
+ (0x1f64f, 0x1f3fe,): (3, 'folded hands: medium-dark skin tone'),
+ (0x1f64f, 0x1f3ff,): (3, 'folded hands: dark skin tone'),
+ (0x1f6a3, 0x1f3fb,): (3, 'person rowing boat: light skin tone'),
+ (0x1f6a3, 0x1f3fc,): (3, 'person rowing boat: medium-light skin tone'),
+ (0x1f6a3, 0x1f3fd,): (3, 'person rowing boat: medium skin tone'),
+ (0x1f6a3, 0x1f3fe,): (3, 'person rowing boat: medium-dark skin tone'),
+ (0x1f6a3, 0x1f3ff,): (3, 'person rowing boat: dark skin tone'),
+ (0x1f6b4, 0x1f3fb,): (3, 'person biking: light skin tone'),
+ (0x1f6b4, 0x1f3fc,): (3, 'person biking: medium-light skin tone'),
+ (0x1f6b4, 0x1f3fd,): (3, 'person biking: medium skin tone'),
+ (0x1f6b4, 0x1f3fe,): (3, 'person biking: medium-dark skin tone'),
+ (0x1f6b4, 0x1f3ff,): (3, 'person biking: dark skin tone'),
+ (0x1f6b5, 0x1f3fb,): (3, 'person mountain biking: light skin tone'),
+ (0x1f6b5, 0x1f3fc,): (3, 'person mountain biking: medium-light skin tone'),
+ (0x1f6b5, 0x1f3fd,): (3, 'person mountain biking: medium skin tone'),
+ (0x1f6b5, 0x1f3fe,): (3, 'person mountain biking: medium-dark skin tone'),
+ (0x1f6b5, 0x1f3ff,): (3, 'person mountain biking: dark skin tone'),
+ (0x1f6b6, 0x1f3fb,): (3, 'person walking: light skin tone'),
+ (0x1f6b6, 0x1f3fc,): (3, 'person walking: medium-light skin tone'),
+ (0x1f6b6, 0x1f3fd,): (3, 'person walking: medium skin tone'),
+ (0x1f6b6, 0x1f3fe,): (3, 'person walking: medium-dark skin tone'),
+ (0x1f6b6, 0x1f3ff,): (3, 'person walking: dark skin tone'),
+ (0x1f6c0, 0x1f3fb,): (3, 'person taking bath: light skin tone'),
+ (0x1f6c0, 0x1f3fc,): (3, 'person taking bath: medium-light skin tone'),
+ (0x1f6c0, 0x1f3fd,): (3, 'person taking bath: medium skin tone'),
+ (0x1f6c0, 0x1f3fe,): (3, 'person taking bath: medium-dark skin tone'),
+ (0x1f6c0, 0x1f3ff,): (3, 'person taking bath: dark skin tone'),
+ (0x1f6cc, 0x1f3fb,): (3, 'person in bed: light skin tone'),
+ (0x1f6cc, 0x1f3fc,): (3, 'person in bed: medium-light skin tone'),
+ (0x1f6cc, 0x1f3fd,): (3, 'person in bed: medium skin tone'),
+ (0x1f6cc, 0x1f3fe,): (3, 'person in bed: medium-dark skin tone'),
+ (0x1f6cc, 0x1f3ff,): (3, 'person in bed: dark skin tone'),
+ (0x1f918, 0x1f3fb,): (3, 'sign of the horns: light skin tone'),
+ (0x1f918, 0x1f3fc,): (3, 'sign of the horns: medium-light skin tone'),
+ (0x1f918, 0x1f3fd,): (3, 'sign of the horns: medium skin tone'),
+ (0x1f918, 0x1f3fe,): (3, 'sign of the horns: medium-dark skin tone'),
+ (0x1f918, 0x1f3ff,): (3, 'sign of the horns: dark skin tone'),
+ (0x1f919, 0x1f3fb,): (3, 'call me hand: light skin tone'),
+ (0x1f919, 0x1f3fc,): (3, 'call me hand: medium-light skin tone'),
+ (0x1f919, 0x1f3fd,): (3, 'call me hand: medium skin tone'),
+ (0x1f919, 0x1f3fe,): (3, 'call me hand: medium-dark skin tone'),
+ (0x1f919, 0x1f3ff,): (3, 'call me hand: dark skin tone'),
+ (0x1f91a, 0x1f3fb,): (3, 'raised back of hand: light skin tone'),
+ (0x1f91a, 0x1f3fc,): (3, 'raised back of hand: medium-light skin tone'),
+ (0x1f91a, 0x1f3fd,): (3, 'raised back of hand: medium skin tone'),
+ (0x1f91a, 0x1f3fe,): (3, 'raised back of hand: medium-dark skin tone'),
+ (0x1f91a, 0x1f3ff,): (3, 'raised back of hand: dark skin tone'),
+ (0x1f91b, 0x1f3fb,): (3, 'left-facing fist: light skin tone'),
+ (0x1f91b, 0x1f3fc,): (3, 'left-facing fist: medium-light skin tone'),
+ (0x1f91b, 0x1f3fd,): (3, 'left-facing fist: medium skin tone'),
+ (0x1f91b, 0x1f3fe,): (3, 'left-facing fist: medium-dark skin tone'),
+ (0x1f91b, 0x1f3ff,): (3, 'left-facing fist: dark skin tone'),
+ (0x1f91c, 0x1f3fb,): (3, 'right-facing fist: light skin tone'),
+ (0x1f91c, 0x1f3fc,): (3, 'right-facing fist: medium-light skin tone'),
+ (0x1f91c, 0x1f3fd,): (3, 'right-facing fist: medium skin tone'),
+ (0x1f91c, 0x1f3fe,): (3, 'right-facing fist: medium-dark skin tone'),
+ (0x1f91c, 0x1f3ff,): (3, 'right-facing fist: dark skin tone'),
+ (0x1f91e, 0x1f3fb,): (3, 'crossed fingers: light skin tone'),
+ (0x1f91e, 0x1f3fc,): (3, 'crossed fingers: medium-light skin tone'),
+ (0x1f91e, 0x1f3fd,): (3, 'crossed fingers: medium skin tone'),
+ (0x1f91e, 0x1f3fe,): (3, 'crossed fingers: medium-dark skin tone'),
+ (0x1f91e, 0x1f3ff,): (3, 'crossed fingers: dark skin tone'),
+ (0x1f91f, 0x1f3fb,): (3, 'love-you gesture: light skin tone'),
+ (0x1f91f, 0x1f3fc,): (3, 'love-you gesture: medium-light skin tone'),
+ (0x1f91f, 0x1f3fd,): (3, 'love-you gesture: medium skin tone'),
+ (0x1f91f, 0x1f3fe,): (3, 'love-you gesture: medium-dark skin tone'),
+ (0x1f91f, 0x1f3ff,): (3, 'love-you gesture: dark skin tone'),
+ (0x1f926, 0x1f3fb,): (3, 'person facepalming: light skin tone'),
+ (0x1f926, 0x1f3fc,): (3, 'person facepalming: medium-light skin tone'),
+ (0x1f926, 0x1f3fd,): (3, 'person facepalming: medium skin tone'),
+ (0x1f926, 0x1f3fe,): (3, 'person facepalming: medium-dark skin tone'),
+ (0x1f926, 0x1f3ff,): (3, 'person facepalming: dark skin tone'),
+ (0x1f930, 0x1f3fb,): (3, 'pregnant woman: light skin tone'),
+ (0x1f930, 0x1f3fc,): (3, 'pregnant woman: medium-light skin tone'),
+ (0x1f930, 0x1f3fd,): (3, 'pregnant woman: medium skin tone'),
+ (0x1f930, 0x1f3fe,): (3, 'pregnant woman: medium-dark skin tone'),
+ (0x1f930, 0x1f3ff,): (3, 'pregnant woman: dark skin tone'),
+ (0x1f931, 0x1f3fb,): (3, 'breast-feeding: light skin tone'),
+ (0x1f931, 0x1f3fc,): (3, 'breast-feeding: medium-light skin tone'),
+ (0x1f931, 0x1f3fd,): (3, 'breast-feeding: medium skin tone'),
+ (0x1f931, 0x1f3fe,): (3, 'breast-feeding: medium-dark skin tone'),
+ (0x1f931, 0x1f3ff,): (3, 'breast-feeding: dark skin tone'),
+ (0x1f932, 0x1f3fb,): (3, 'palms up together: light skin tone'),
+ (0x1f932, 0x1f3fc,): (3, 'palms up together: medium-light skin tone'),
+ (0x1f932, 0x1f3fd,): (3, 'palms up together: medium skin tone'),
+ (0x1f932, 0x1f3fe,): (3, 'palms up together: medium-dark skin tone'),
+ (0x1f932, 0x1f3ff,): (3, 'palms up together: dark skin tone'),
+ (0x1f933, 0x1f3fb,): (3, 'selfie: light skin tone'),
+ (0x1f933, 0x1f3fc,): (3, 'selfie: medium-light skin tone'),
+ (0x1f933, 0x1f3fd,): (3, 'selfie: medium skin tone'),
+ (0x1f933, 0x1f3fe,): (3, 'selfie: medium-dark skin tone'),
+ (0x1f933, 0x1f3ff,): (3, 'selfie: dark skin tone'),
+ (0x1f934, 0x1f3fb,): (3, 'prince: light skin tone'),
+ (0x1f934, 0x1f3fc,): (3, 'prince: medium-light skin tone'),
+ (0x1f934, 0x1f3fd,): (3, 'prince: medium skin tone'),
+ (0x1f934, 0x1f3fe,): (3, 'prince: medium-dark skin tone'),
+ (0x1f934, 0x1f3ff,): (3, 'prince: dark skin tone'),
+ (0x1f935, 0x1f3fb,): (3, 'man in tuxedo: light skin tone'),
+ (0x1f935, 0x1f3fc,): (3, 'man in tuxedo: medium-light skin tone'),
+ (0x1f935, 0x1f3fd,): (3, 'man in tuxedo: medium skin tone'),
+ (0x1f935, 0x1f3fe,): (3, 'man in tuxedo: medium-dark skin tone'),
+ (0x1f935, 0x1f3ff,): (3, 'man in tuxedo: dark skin tone'),
+ (0x1f936, 0x1f3fb,): (3, 'Mrs. Claus: light skin tone'),
+ (0x1f936, 0x1f3fc,): (3, 'Mrs. Claus: medium-light skin tone'),
+ (0x1f936, 0x1f3fd,): (3, 'Mrs. Claus: medium skin tone'),
+ (0x1f936, 0x1f3fe,): (3, 'Mrs. Claus: medium-dark skin tone'),
+ (0x1f936, 0x1f3ff,): (3, 'Mrs. Claus: dark skin tone'),
+ (0x1f937, 0x1f3fb,): (3, 'person shrugging: light skin tone'),
+ (0x1f937, 0x1f3fc,): (3, 'person shrugging: medium-light skin tone'),
+ (0x1f937, 0x1f3fd,): (3, 'person shrugging: medium skin tone'),
+ (0x1f937, 0x1f3fe,): (3, 'person shrugging: medium-dark skin tone'),
+ (0x1f937, 0x1f3ff,): (3, 'person shrugging: dark skin tone'),
+ (0x1f938, 0x1f3fb,): (3, 'person cartwheeling: light skin tone'),
+ (0x1f938, 0x1f3fc,): (3, 'person cartwheeling: medium-light skin tone'),
+ (0x1f938, 0x1f3fd,): (3, 'person cartwheeling: medium skin tone'),
+ (0x1f938, 0x1f3fe,): (3, 'person cartwheeling: medium-dark skin tone'),
+ (0x1f938, 0x1f3ff,): (3, 'person cartwheeling: dark skin tone'),
+ (0x1f939, 0x1f3fb,): (3, 'person juggling: light skin tone'),
+ (0x1f939, 0x1f3fc,): (3, 'person juggling: medium-light skin tone'),
+ (0x1f939, 0x1f3fd,): (3, 'person juggling: medium skin tone'),
+ (0x1f939, 0x1f3fe,): (3, 'person juggling: medium-dark skin tone'),
+ (0x1f939, 0x1f3ff,): (3, 'person juggling: dark skin tone'),
+ (0x1f93d, 0x1f3fb,): (3, 'person playing water polo: light skin tone'),
+ (0x1f93d, 0x1f3fc,): (3, 'person playing water polo: medium-light skin tone'),
+ (0x1f93d, 0x1f3fd,): (3, 'person playing water polo: medium skin tone'),
+ (0x1f93d, 0x1f3fe,): (3, 'person playing water polo: medium-dark skin tone'),
+ (0x1f93d, 0x1f3ff,): (3, 'person playing water polo: dark skin tone'),
+ (0x1f93e, 0x1f3fb,): (3, 'person playing handball: light skin tone'),
+ (0x1f93e, 0x1f3fc,): (3, 'person playing handball: medium-light skin tone'),
+ (0x1f93e, 0x1f3fd,): (3, 'person playing handball: medium skin tone'),
+ (0x1f93e, 0x1f3fe,): (3, 'person playing handball: medium-dark skin tone'),
+ (0x1f93e, 0x1f3ff,): (3, 'person playing handball: dark skin tone'),
+ (0x1f9b5, 0x1f3fb,): (3, 'leg: light skin tone'),
+ (0x1f9b5, 0x1f3fc,): (3, 'leg: medium-light skin tone'),
+ (0x1f9b5, 0x1f3fd,): (3, 'leg: medium skin tone'),
+ (0x1f9b5, 0x1f3fe,): (3, 'leg: medium-dark skin tone'),
+ (0x1f9b5, 0x1f3ff,): (3, 'leg: dark skin tone'),
+ (0x1f9b6, 0x1f3fb,): (3, 'foot: light skin tone'),
+ (0x1f9b6, 0x1f3fc,): (3, 'foot: medium-light skin tone'),
+ (0x1f9b6, 0x1f3fd,): (3, 'foot: medium skin tone'),
+ (0x1f9b6, 0x1f3fe,): (3, 'foot: medium-dark skin tone'),
+ (0x1f9b6, 0x1f3ff,): (3, 'foot: dark skin tone'),
+ (0x1f9b8, 0x1f3fb,): (3, 'superhero: light skin tone'),
+ (0x1f9b8, 0x1f3fc,): (3, 'superhero: medium-light skin tone'),
+ (0x1f9b8, 0x1f3fd,): (3, 'superhero: medium skin tone'),
+ (0x1f9b8, 0x1f3fe,): (3, 'superhero: medium-dark skin tone'),
+ (0x1f9b8, 0x1f3ff,): (3, 'superhero: dark skin tone'),
+ (0x1f9b9, 0x1f3fb,): (3, 'supervillain: light skin tone'),
+ (0x1f9b9, 0x1f3fc,): (3, 'supervillain: medium-light skin tone'),
+ (0x1f9b9, 0x1f3fd,): (3, 'supervillain: medium skin tone'),
+ (0x1f9b9, 0x1f3fe,): (3, 'supervillain: medium-dark skin tone'),
+ (0x1f9b9, 0x1f3ff,): (3, 'supervillain: dark skin tone'),
+ (0x1f9d1, 0x1f3fb,): (3, 'person: light skin tone'),
+ (0x1f9d1, 0x1f3fc,): (3, 'person: medium-light skin tone'),
+ (0x1f9d1, 0x1f3fd,): (3, 'person: medium skin tone'),
+ (0x1f9d1, 0x1f3fe,): (3, 'person: medium-dark skin tone'),
+ (0x1f9d1, 0x1f3ff,): (3, 'person: dark skin tone'),
+ (0x1f9d2, 0x1f3fb,): (3, 'child: light skin tone'),
+ (0x1f9d2, 0x1f3fc,): (3, 'child: medium-light skin tone'),
+ (0x1f9d2, 0x1f3fd,): (3, 'child: medium skin tone'),
+ (0x1f9d2, 0x1f3fe,): (3, 'child: medium-dark skin tone'),
+ (0x1f9d2, 0x1f3ff,): (3, 'child: dark skin tone'),
+ (0x1f9d3, 0x1f3fb,): (3, 'older person: light skin tone'),
+ (0x1f9d3, 0x1f3fc,): (3, 'older person: medium-light skin tone'),
+ (0x1f9d3, 0x1f3fd,): (3, 'older person: medium skin tone'),
+ (0x1f9d3, 0x1f3fe,): (3, 'older person: medium-dark skin tone'),
+ (0x1f9d3, 0x1f3ff,): (3, 'older person: dark skin tone'),
+ (0x1f9d4, 0x1f3fb,): (3, 'man: light skin tone, beard'),
+ (0x1f9d4, 0x1f3fc,): (3, 'man: medium-light skin tone, beard'),
+ (0x1f9d4, 0x1f3fd,): (3, 'man: medium skin tone, beard'),
+ (0x1f9d4, 0x1f3fe,): (3, 'man: medium-dark skin tone, beard'),
+ (0x1f9d4, 0x1f3ff,): (3, 'man: dark skin tone, beard'),
+ (0x1f9d5, 0x1f3fb,): (3, 'woman with headscarf: light skin tone'),
+ (0x1f9d5, 0x1f3fc,): (3, 'woman with headscarf: medium-light skin tone'),
+ (0x1f9d5, 0x1f3fd,): (3, 'woman with headscarf: medium skin tone'),
+ (0x1f9d5, 0x1f3fe,): (3, 'woman with headscarf: medium-dark skin tone'),
+ (0x1f9d5, 0x1f3ff,): (3, 'woman with headscarf: dark skin tone'),
+ (0x1f9d6, 0x1f3fb,): (3, 'person in steamy room: light skin tone'),
+ (0x1f9d6, 0x1f3fc,): (3, 'person in steamy room: medium-light skin tone'),
+ (0x1f9d6, 0x1f3fd,): (3, 'person in steamy room: medium skin tone'),
+ (0x1f9d6, 0x1f3fe,): (3, 'person in steamy room: medium-dark skin tone'),
+ (0x1f9d6, 0x1f3ff,): (3, 'person in steamy room: dark skin tone'),
+ (0x1f9d7, 0x1f3fb,): (3, 'person climbing: light skin tone'),
+ (0x1f9d7, 0x1f3fc,): (3, 'person climbing: medium-light skin tone'),
+ (0x1f9d7, 0x1f3fd,): (3, 'person climbing: medium skin tone'),
+ (0x1f9d7, 0x1f3fe,): (3, 'person climbing: medium-dark skin tone'),
+ (0x1f9d7, 0x1f3ff,): (3, 'person climbing: dark skin tone'),
+ (0x1f9d8, 0x1f3fb,): (3, 'person in lotus position: light skin tone'),
+ (0x1f9d8, 0x1f3fc,): (3, 'person in lotus position: medium-light skin tone'),
+ (0x1f9d8, 0x1f3fd,): (3, 'person in lotus position: medium skin tone'),
+ (0x1f9d8, 0x1f3fe,): (3, 'person in lotus position: medium-dark skin tone'),
+ (0x1f9d8, 0x1f3ff,): (3, 'person in lotus position: dark skin tone'),
+ (0x1f9d9, 0x1f3fb,): (3, 'mage: light skin tone'),
+ (0x1f9d9, 0x1f3fc,): (3, 'mage: medium-light skin tone'),
+ (0x1f9d9, 0x1f3fd,): (3, 'mage: medium skin tone'),
+ (0x1f9d9, 0x1f3fe,): (3, 'mage: medium-dark skin tone'),
+ (0x1f9d9, 0x1f3ff,): (3, 'mage: dark skin tone'),
+ (0x1f9da, 0x1f3fb,): (3, 'fairy: light skin tone'),
+ (0x1f9da, 0x1f3fc,): (3, 'fairy: medium-light skin tone'),
+ (0x1f9da, 0x1f3fd,): (3, 'fairy: medium skin tone'),
+ (0x1f9da, 0x1f3fe,): (3, 'fairy: medium-dark skin tone'),
+ (0x1f9da, 0x1f3ff,): (3, 'fairy: dark skin tone'),
+ (0x1f9db, 0x1f3fb,): (3, 'vampire: light skin tone'),
+ (0x1f9db, 0x1f3fc,): (3, 'vampire: medium-light skin tone'),
+ (0x1f9db, 0x1f3fd,): (3, 'vampire: medium skin tone'),
+ (0x1f9db, 0x1f3fe,): (3, 'vampire: medium-dark skin tone'),
+ (0x1f9db, 0x1f3ff,): (3, 'vampire: dark skin tone'),
+ (0x1f9dc, 0x1f3fb,): (3, 'merperson: light skin tone'),
+ (0x1f9dc, 0x1f3fc,): (3, 'merperson: medium-light skin tone'),
+ (0x1f9dc, 0x1f3fd,): (3, 'merperson: medium skin tone'),
+ (0x1f9dc, 0x1f3fe,): (3, 'merperson: medium-dark skin tone'),
+ (0x1f9dc, 0x1f3ff,): (3, 'merperson: dark skin tone'),
+ (0x1f9dd, 0x1f3fb,): (3, 'elf: light skin tone'),
+ (0x1f9dd, 0x1f3fc,): (3, 'elf: medium-light skin tone'),
+ (0x1f9dd, 0x1f3fd,): (3, 'elf: medium skin tone'),
+ (0x1f9dd, 0x1f3fe,): (3, 'elf: medium-dark skin tone'),
+ (0x1f9dd, 0x1f3ff,): (3, 'elf: dark skin tone'),
+ (0x1f468, 0x200d, 0x2764, 0xfe0f, 0x200d, 0x1f468,): (4, 'couple with heart: man, man'),
+ (0x1f468, 0x200d, 0x2764, 0xfe0f, 0x200d, 0x1f48b, 0x200d, 0x1f468,): (4, 'kiss: man, man'),
+ (0x1f468, 0x200d, 0x1f466,): (4, 'family: man, boy'),
+ (0x1f468, 0x200d, 0x1f466, 0x200d, 0x1f466,): (4, 'family: man, boy, boy'),
+ (0x1f468, 0x200d, 0x1f467,): (4, 'family: man, girl'),
+ (0x1f468, 0x200d, 0x1f467, 0x200d, 0x1f466,): (4, 'family: man, girl, boy'),
+ (0x1f468, 0x200d, 0x1f467, 0x200d, 0x1f467,): (4, 'family: man, girl, girl'),
+ (0x1f468, 0x200d, 0x1f468, 0x200d, 0x1f466,): (4, 'family: man, man, boy'),
+ (0x1f468, 0x200d, 0x1f468, 0x200d, 0x1f466, 0x200d, 0x1f466,): (4, 'family: man, man, boy, boy'),
+ (0x1f468, 0x200d, 0x1f468, 0x200d, 0x1f467,): (4, 'family: man, man, girl'),
+ (0x1f468, 0x200d, 0x1f468, 0x200d, 0x1f467, 0x200d, 0x1f466,): (4, 'family: man, man, girl, boy'),
+ (0x1f468, 0x200d, 0x1f468, 0x200d, 0x1f467, 0x200d, 0x1f467,): (4, 'family: man, man, girl, girl'),
+ (0x1f468, 0x200d, 0x1f469, 0x200d, 0x1f466,): (4, 'family: man, woman, boy'),
+ (0x1f468, 0x200d, 0x1f469, 0x200d, 0x1f466, 0x200d, 0x1f466,): (4, 'family: man, woman, boy, boy'),
+ (0x1f468, 0x200d, 0x1f469, 0x200d, 0x1f467,): (4, 'family: man, woman, girl'),
+ (0x1f468, 0x200d, 0x1f469, 0x200d, 0x1f467, 0x200d, 0x1f466,): (4, 'family: man, woman, girl, boy'),
+ (0x1f468, 0x200d, 0x1f469, 0x200d, 0x1f467, 0x200d, 0x1f467,): (4, 'family: man, woman, girl, girl'),
+ (0x1f469, 0x200d, 0x2764, 0xfe0f, 0x200d, 0x1f468,): (4, 'couple with heart: woman, man'),
+ (0x1f469, 0x200d, 0x2764, 0xfe0f, 0x200d, 0x1f469,): (4, 'couple with heart: woman, woman'),
+ (0x1f469, 0x200d, 0x2764, 0xfe0f, 0x200d, 0x1f48b, 0x200d, 0x1f468,): (4, 'kiss: woman, man'),
+ (0x1f469, 0x200d, 0x2764, 0xfe0f, 0x200d, 0x1f48b, 0x200d, 0x1f469,): (4, 'kiss: woman, woman'),
+ (0x1f469, 0x200d, 0x1f466,): (4, 'family: woman, boy'),
+ (0x1f469, 0x200d, 0x1f466, 0x200d, 0x1f466,): (4, 'family: woman, boy, boy'),
+ (0x1f469, 0x200d, 0x1f467,): (4, 'family: woman, girl'),
+ (0x1f469, 0x200d, 0x1f467, 0x200d, 0x1f466,): (4, 'family: woman, girl, boy'),
+ (0x1f469, 0x200d, 0x1f467, 0x200d, 0x1f467,): (4, 'family: woman, girl, girl'),
+ (0x1f469, 0x200d, 0x1f469, 0x200d, 0x1f466,): (4, 'family: woman, woman, boy'),
+ (0x1f469, 0x200d, 0x1f469, 0x200d, 0x1f466, 0x200d, 0x1f466,): (4, 'family: woman, woman, boy, boy'),
+ (0x1f469, 0x200d, 0x1f469, 0x200d, 0x1f467,): (4, 'family: woman, woman, girl'),
+ (0x1f469, 0x200d, 0x1f469, 0x200d, 0x1f467, 0x200d, 0x1f466,): (4, 'family: woman, woman, girl, boy'),
+ (0x1f469, 0x200d, 0x1f469, 0x200d, 0x1f467, 0x200d, 0x1f467,): (4, 'family: woman, woman, girl, girl'),
+ (0x1f468, 0x200d, 0x2695, 0xfe0f,): (4, 'man health worker'),
+ (0x1f468, 0x200d, 0x2696, 0xfe0f,): (4, 'man judge'),
+ (0x1f468, 0x200d, 0x2708, 0xfe0f,): (4, 'man pilot'),
+ (0x1f468, 0x200d, 0x1f33e,): (4, 'man farmer'),
+ (0x1f468, 0x200d, 0x1f373,): (4, 'man cook'),
+ (0x1f468, 0x200d, 0x1f393,): (4, 'man student'),
+ (0x1f468, 0x200d, 0x1f3a4,): (4, 'man singer'),
+ (0x1f468, 0x200d, 0x1f3a8,): (4, 'man artist'),
+ (0x1f468, 0x200d, 0x1f3eb,): (4, 'man teacher'),
+ (0x1f468, 0x200d, 0x1f3ed,): (4, 'man factory worker'),
+ (0x1f468, 0x200d, 0x1f4bb,): (4, 'man technologist'),
+ (0x1f468, 0x200d, 0x1f4bc,): (4, 'man office worker'),
+ (0x1f468, 0x200d, 0x1f527,): (4, 'man mechanic'),
+ (0x1f468, 0x200d, 0x1f52c,): (4, 'man scientist'),
+ (0x1f468, 0x200d, 0x1f680,): (4, 'man astronaut'),
+ (0x1f468, 0x200d, 0x1f692,): (4, 'man firefighter'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x2695, 0xfe0f,): (4, 'man health worker: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x2696, 0xfe0f,): (4, 'man judge: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x2708, 0xfe0f,): (4, 'man pilot: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f33e,): (4, 'man farmer: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f373,): (4, 'man cook: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f393,): (4, 'man student: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f3a4,): (4, 'man singer: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f3a8,): (4, 'man artist: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f3eb,): (4, 'man teacher: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f3ed,): (4, 'man factory worker: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f4bb,): (4, 'man technologist: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f4bc,): (4, 'man office worker: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f527,): (4, 'man mechanic: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f52c,): (4, 'man scientist: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f680,): (4, 'man astronaut: light skin tone'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f692,): (4, 'man firefighter: light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x2695, 0xfe0f,): (4, 'man health worker: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x2696, 0xfe0f,): (4, 'man judge: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x2708, 0xfe0f,): (4, 'man pilot: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f33e,): (4, 'man farmer: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f373,): (4, 'man cook: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f393,): (4, 'man student: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f3a4,): (4, 'man singer: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f3a8,): (4, 'man artist: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f3eb,): (4, 'man teacher: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f3ed,): (4, 'man factory worker: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f4bb,): (4, 'man technologist: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f4bc,): (4, 'man office worker: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f527,): (4, 'man mechanic: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f52c,): (4, 'man scientist: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f680,): (4, 'man astronaut: medium-light skin tone'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f692,): (4, 'man firefighter: medium-light skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x2695, 0xfe0f,): (4, 'man health worker: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x2696, 0xfe0f,): (4, 'man judge: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x2708, 0xfe0f,): (4, 'man pilot: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f33e,): (4, 'man farmer: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f373,): (4, 'man cook: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f393,): (4, 'man student: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f3a4,): (4, 'man singer: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f3a8,): (4, 'man artist: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f3eb,): (4, 'man teacher: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f3ed,): (4, 'man factory worker: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f4bb,): (4, 'man technologist: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f4bc,): (4, 'man office worker: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f527,): (4, 'man mechanic: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f52c,): (4, 'man scientist: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f680,): (4, 'man astronaut: medium skin tone'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f692,): (4, 'man firefighter: medium skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x2695, 0xfe0f,): (4, 'man health worker: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x2696, 0xfe0f,): (4, 'man judge: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x2708, 0xfe0f,): (4, 'man pilot: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f33e,): (4, 'man farmer: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f373,): (4, 'man cook: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f393,): (4, 'man student: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f3a4,): (4, 'man singer: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f3a8,): (4, 'man artist: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f3eb,): (4, 'man teacher: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f3ed,): (4, 'man factory worker: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f4bb,): (4, 'man technologist: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f4bc,): (4, 'man office worker: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f527,): (4, 'man mechanic: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f52c,): (4, 'man scientist: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f680,): (4, 'man astronaut: medium-dark skin tone'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f692,): (4, 'man firefighter: medium-dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x2695, 0xfe0f,): (4, 'man health worker: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x2696, 0xfe0f,): (4, 'man judge: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x2708, 0xfe0f,): (4, 'man pilot: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f33e,): (4, 'man farmer: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f373,): (4, 'man cook: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f393,): (4, 'man student: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f3a4,): (4, 'man singer: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f3a8,): (4, 'man artist: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f3eb,): (4, 'man teacher: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f3ed,): (4, 'man factory worker: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f4bb,): (4, 'man technologist: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f4bc,): (4, 'man office worker: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f527,): (4, 'man mechanic: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f52c,): (4, 'man scientist: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f680,): (4, 'man astronaut: dark skin tone'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f692,): (4, 'man firefighter: dark skin tone'),
+ (0x1f469, 0x200d, 0x2695, 0xfe0f,): (4, 'woman health worker'),
+ (0x1f469, 0x200d, 0x2696, 0xfe0f,): (4, 'woman judge'),
+ (0x1f469, 0x200d, 0x2708, 0xfe0f,): (4, 'woman pilot'),
+ (0x1f469, 0x200d, 0x1f33e,): (4, 'woman farmer'),
+ (0x1f469, 0x200d, 0x1f373,): (4, 'woman cook'),
+ (0x1f469, 0x200d, 0x1f393,): (4, 'woman student'),
+ (0x1f469, 0x200d, 0x1f3a4,): (4, 'woman singer'),
+ (0x1f469, 0x200d, 0x1f3a8,): (4, 'woman artist'),
+ (0x1f469, 0x200d, 0x1f3eb,): (4, 'woman teacher'),
+ (0x1f469, 0x200d, 0x1f3ed,): (4, 'woman factory worker'),
+ (0x1f469, 0x200d, 0x1f4bb,): (4, 'woman technologist'),
+ (0x1f469, 0x200d, 0x1f4bc,): (4, 'woman office worker'),
+ (0x1f469, 0x200d, 0x1f527,): (4, 'woman mechanic'),
+ (0x1f469, 0x200d, 0x1f52c,): (4, 'woman scientist'),
+ (0x1f469, 0x200d, 0x1f680,): (4, 'woman astronaut'),
+ (0x1f469, 0x200d, 0x1f692,): (4, 'woman firefighter'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x2695, 0xfe0f,): (4, 'woman health worker: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x2696, 0xfe0f,): (4, 'woman judge: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x2708, 0xfe0f,): (4, 'woman pilot: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f33e,): (4, 'woman farmer: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f373,): (4, 'woman cook: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f393,): (4, 'woman student: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f3a4,): (4, 'woman singer: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f3a8,): (4, 'woman artist: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f3eb,): (4, 'woman teacher: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f3ed,): (4, 'woman factory worker: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f4bb,): (4, 'woman technologist: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f4bc,): (4, 'woman office worker: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f527,): (4, 'woman mechanic: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f52c,): (4, 'woman scientist: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f680,): (4, 'woman astronaut: light skin tone'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f692,): (4, 'woman firefighter: light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x2695, 0xfe0f,): (4, 'woman health worker: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x2696, 0xfe0f,): (4, 'woman judge: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x2708, 0xfe0f,): (4, 'woman pilot: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f33e,): (4, 'woman farmer: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f373,): (4, 'woman cook: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f393,): (4, 'woman student: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f3a4,): (4, 'woman singer: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f3a8,): (4, 'woman artist: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f3eb,): (4, 'woman teacher: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f3ed,): (4, 'woman factory worker: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f4bb,): (4, 'woman technologist: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f4bc,): (4, 'woman office worker: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f527,): (4, 'woman mechanic: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f52c,): (4, 'woman scientist: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f680,): (4, 'woman astronaut: medium-light skin tone'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f692,): (4, 'woman firefighter: medium-light skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x2695, 0xfe0f,): (4, 'woman health worker: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x2696, 0xfe0f,): (4, 'woman judge: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x2708, 0xfe0f,): (4, 'woman pilot: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f33e,): (4, 'woman farmer: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f373,): (4, 'woman cook: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f393,): (4, 'woman student: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f3a4,): (4, 'woman singer: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f3a8,): (4, 'woman artist: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f3eb,): (4, 'woman teacher: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f3ed,): (4, 'woman factory worker: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f4bb,): (4, 'woman technologist: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f4bc,): (4, 'woman office worker: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f527,): (4, 'woman mechanic: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f52c,): (4, 'woman scientist: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f680,): (4, 'woman astronaut: medium skin tone'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f692,): (4, 'woman firefighter: medium skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x2695, 0xfe0f,): (4, 'woman health worker: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x2696, 0xfe0f,): (4, 'woman judge: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x2708, 0xfe0f,): (4, 'woman pilot: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f33e,): (4, 'woman farmer: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f373,): (4, 'woman cook: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f393,): (4, 'woman student: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f3a4,): (4, 'woman singer: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f3a8,): (4, 'woman artist: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f3eb,): (4, 'woman teacher: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f3ed,): (4, 'woman factory worker: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f4bb,): (4, 'woman technologist: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f4bc,): (4, 'woman office worker: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f527,): (4, 'woman mechanic: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f52c,): (4, 'woman scientist: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f680,): (4, 'woman astronaut: medium-dark skin tone'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f692,): (4, 'woman firefighter: medium-dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x2695, 0xfe0f,): (4, 'woman health worker: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x2696, 0xfe0f,): (4, 'woman judge: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x2708, 0xfe0f,): (4, 'woman pilot: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f33e,): (4, 'woman farmer: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f373,): (4, 'woman cook: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f393,): (4, 'woman student: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f3a4,): (4, 'woman singer: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f3a8,): (4, 'woman artist: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f3eb,): (4, 'woman teacher: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f3ed,): (4, 'woman factory worker: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f4bb,): (4, 'woman technologist: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f4bc,): (4, 'woman office worker: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f527,): (4, 'woman mechanic: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f52c,): (4, 'woman scientist: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f680,): (4, 'woman astronaut: dark skin tone'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f692,): (4, 'woman firefighter: dark skin tone'),
+ (0x26f9, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bouncing ball: light skin tone'),
+ (0x26f9, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man bouncing ball: light skin tone'),
+ (0x26f9, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bouncing ball: medium-light skin tone'),
+ (0x26f9, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man bouncing ball: medium-light skin tone'),
+ (0x26f9, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bouncing ball: medium skin tone'),
+ (0x26f9, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man bouncing ball: medium skin tone'),
+ (0x26f9, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bouncing ball: medium-dark skin tone'),
+ (0x26f9, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man bouncing ball: medium-dark skin tone'),
+ (0x26f9, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bouncing ball: dark skin tone'),
+ (0x26f9, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man bouncing ball: dark skin tone'),
+ (0x26f9, 0xfe0f, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bouncing ball'),
+ (0x26f9, 0xfe0f, 0x200d, 0x2642, 0xfe0f,): (4, 'man bouncing ball'),
+ (0x1f3c3, 0x200d, 0x2640, 0xfe0f,): (4, 'woman running'),
+ (0x1f3c3, 0x200d, 0x2642, 0xfe0f,): (4, 'man running'),
+ (0x1f3c3, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman running: light skin tone'),
+ (0x1f3c3, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man running: light skin tone'),
+ (0x1f3c3, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman running: medium-light skin tone'),
+ (0x1f3c3, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man running: medium-light skin tone'),
+ (0x1f3c3, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman running: medium skin tone'),
+ (0x1f3c3, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man running: medium skin tone'),
+ (0x1f3c3, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman running: medium-dark skin tone'),
+ (0x1f3c3, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man running: medium-dark skin tone'),
+ (0x1f3c3, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman running: dark skin tone'),
+ (0x1f3c3, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man running: dark skin tone'),
+ (0x1f3c4, 0x200d, 0x2640, 0xfe0f,): (4, 'woman surfing'),
+ (0x1f3c4, 0x200d, 0x2642, 0xfe0f,): (4, 'man surfing'),
+ (0x1f3c4, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman surfing: light skin tone'),
+ (0x1f3c4, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man surfing: light skin tone'),
+ (0x1f3c4, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman surfing: medium-light skin tone'),
+ (0x1f3c4, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man surfing: medium-light skin tone'),
+ (0x1f3c4, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman surfing: medium skin tone'),
+ (0x1f3c4, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man surfing: medium skin tone'),
+ (0x1f3c4, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman surfing: medium-dark skin tone'),
+ (0x1f3c4, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man surfing: medium-dark skin tone'),
+ (0x1f3c4, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman surfing: dark skin tone'),
+ (0x1f3c4, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man surfing: dark skin tone'),
+ (0x1f3ca, 0x200d, 0x2640, 0xfe0f,): (4, 'woman swimming'),
+ (0x1f3ca, 0x200d, 0x2642, 0xfe0f,): (4, 'man swimming'),
+ (0x1f3ca, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman swimming: light skin tone'),
+ (0x1f3ca, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man swimming: light skin tone'),
+ (0x1f3ca, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman swimming: medium-light skin tone'),
+ (0x1f3ca, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man swimming: medium-light skin tone'),
+ (0x1f3ca, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman swimming: medium skin tone'),
+ (0x1f3ca, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man swimming: medium skin tone'),
+ (0x1f3ca, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman swimming: medium-dark skin tone'),
+ (0x1f3ca, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man swimming: medium-dark skin tone'),
+ (0x1f3ca, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman swimming: dark skin tone'),
+ (0x1f3ca, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man swimming: dark skin tone'),
+ (0x1f3cb, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman lifting weights: light skin tone'),
+ (0x1f3cb, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man lifting weights: light skin tone'),
+ (0x1f3cb, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman lifting weights: medium-light skin tone'),
+ (0x1f3cb, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man lifting weights: medium-light skin tone'),
+ (0x1f3cb, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman lifting weights: medium skin tone'),
+ (0x1f3cb, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man lifting weights: medium skin tone'),
+ (0x1f3cb, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman lifting weights: medium-dark skin tone'),
+ (0x1f3cb, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man lifting weights: medium-dark skin tone'),
+ (0x1f3cb, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman lifting weights: dark skin tone'),
+ (0x1f3cb, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man lifting weights: dark skin tone'),
+ (0x1f3cb, 0xfe0f, 0x200d, 0x2640, 0xfe0f,): (4, 'woman lifting weights'),
+ (0x1f3cb, 0xfe0f, 0x200d, 0x2642, 0xfe0f,): (4, 'man lifting weights'),
+ (0x1f3cc, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman golfing: light skin tone'),
+ (0x1f3cc, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man golfing: light skin tone'),
+ (0x1f3cc, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman golfing: medium-light skin tone'),
+ (0x1f3cc, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man golfing: medium-light skin tone'),
+ (0x1f3cc, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman golfing: medium skin tone'),
+ (0x1f3cc, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man golfing: medium skin tone'),
+ (0x1f3cc, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman golfing: medium-dark skin tone'),
+ (0x1f3cc, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man golfing: medium-dark skin tone'),
+ (0x1f3cc, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman golfing: dark skin tone'),
+ (0x1f3cc, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man golfing: dark skin tone'),
+ (0x1f3cc, 0xfe0f, 0x200d, 0x2640, 0xfe0f,): (4, 'woman golfing'),
+ (0x1f3cc, 0xfe0f, 0x200d, 0x2642, 0xfe0f,): (4, 'man golfing'),
+ (0x1f46e, 0x200d, 0x2640, 0xfe0f,): (4, 'woman police officer'),
+ (0x1f46e, 0x200d, 0x2642, 0xfe0f,): (4, 'man police officer'),
+ (0x1f46e, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman police officer: light skin tone'),
+ (0x1f46e, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man police officer: light skin tone'),
+ (0x1f46e, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman police officer: medium-light skin tone'),
+ (0x1f46e, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man police officer: medium-light skin tone'),
+ (0x1f46e, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman police officer: medium skin tone'),
+ (0x1f46e, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man police officer: medium skin tone'),
+ (0x1f46e, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman police officer: medium-dark skin tone'),
+ (0x1f46e, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man police officer: medium-dark skin tone'),
+ (0x1f46e, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman police officer: dark skin tone'),
+ (0x1f46e, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man police officer: dark skin tone'),
+ (0x1f46f, 0x200d, 0x2640, 0xfe0f,): (4, 'women with bunny ears'),
+ (0x1f46f, 0x200d, 0x2642, 0xfe0f,): (4, 'men with bunny ears'),
+ (0x1f471, 0x200d, 0x2640, 0xfe0f,): (4, 'woman: blond hair'),
+ (0x1f471, 0x200d, 0x2642, 0xfe0f,): (4, 'man: blond hair'),
+ (0x1f471, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman: light skin tone, blond hair'),
+ (0x1f471, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man: light skin tone, blond hair'),
+ (0x1f471, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman: medium-light skin tone, blond hair'),
+ (0x1f471, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man: medium-light skin tone, blond hair'),
+ (0x1f471, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman: medium skin tone, blond hair'),
+ (0x1f471, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man: medium skin tone, blond hair'),
+ (0x1f471, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman: medium-dark skin tone, blond hair'),
+ (0x1f471, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man: medium-dark skin tone, blond hair'),
+ (0x1f471, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman: dark skin tone, blond hair'),
+ (0x1f471, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man: dark skin tone, blond hair'),
+ (0x1f473, 0x200d, 0x2640, 0xfe0f,): (4, 'woman wearing turban'),
+ (0x1f473, 0x200d, 0x2642, 0xfe0f,): (4, 'man wearing turban'),
+ (0x1f473, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman wearing turban: light skin tone'),
+ (0x1f473, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man wearing turban: light skin tone'),
+ (0x1f473, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman wearing turban: medium-light skin tone'),
+ (0x1f473, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man wearing turban: medium-light skin tone'),
+ (0x1f473, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman wearing turban: medium skin tone'),
+ (0x1f473, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man wearing turban: medium skin tone'),
+ (0x1f473, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman wearing turban: medium-dark skin tone'),
+ (0x1f473, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man wearing turban: medium-dark skin tone'),
+ (0x1f473, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman wearing turban: dark skin tone'),
+ (0x1f473, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man wearing turban: dark skin tone'),
+ (0x1f477, 0x200d, 0x2640, 0xfe0f,): (4, 'woman construction worker'),
+ (0x1f477, 0x200d, 0x2642, 0xfe0f,): (4, 'man construction worker'),
+ (0x1f477, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman construction worker: light skin tone'),
+ (0x1f477, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man construction worker: light skin tone'),
+ (0x1f477, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman construction worker: medium-light skin tone'),
+ (0x1f477, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man construction worker: medium-light skin tone'),
+ (0x1f477, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman construction worker: medium skin tone'),
+ (0x1f477, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man construction worker: medium skin tone'),
+ (0x1f477, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman construction worker: medium-dark skin tone'),
+ (0x1f477, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man construction worker: medium-dark skin tone'),
+ (0x1f477, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman construction worker: dark skin tone'),
+ (0x1f477, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man construction worker: dark skin tone'),
+ (0x1f481, 0x200d, 0x2640, 0xfe0f,): (4, 'woman tipping hand'),
+ (0x1f481, 0x200d, 0x2642, 0xfe0f,): (4, 'man tipping hand'),
+ (0x1f481, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman tipping hand: light skin tone'),
+ (0x1f481, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man tipping hand: light skin tone'),
+ (0x1f481, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman tipping hand: medium-light skin tone'),
+ (0x1f481, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man tipping hand: medium-light skin tone'),
+ (0x1f481, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman tipping hand: medium skin tone'),
+ (0x1f481, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man tipping hand: medium skin tone'),
+ (0x1f481, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman tipping hand: medium-dark skin tone'),
+ (0x1f481, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man tipping hand: medium-dark skin tone'),
+ (0x1f481, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman tipping hand: dark skin tone'),
+ (0x1f481, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man tipping hand: dark skin tone'),
+ (0x1f482, 0x200d, 0x2640, 0xfe0f,): (4, 'woman guard'),
+ (0x1f482, 0x200d, 0x2642, 0xfe0f,): (4, 'man guard'),
+ (0x1f482, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman guard: light skin tone'),
+ (0x1f482, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man guard: light skin tone'),
+ (0x1f482, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman guard: medium-light skin tone'),
+ (0x1f482, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man guard: medium-light skin tone'),
+ (0x1f482, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman guard: medium skin tone'),
+ (0x1f482, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man guard: medium skin tone'),
+ (0x1f482, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman guard: medium-dark skin tone'),
+ (0x1f482, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man guard: medium-dark skin tone'),
+ (0x1f482, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman guard: dark skin tone'),
+ (0x1f482, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man guard: dark skin tone'),
+ (0x1f486, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting massage'),
+ (0x1f486, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting massage'),
+ (0x1f486, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting massage: light skin tone'),
+ (0x1f486, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting massage: light skin tone'),
+ (0x1f486, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting massage: medium-light skin tone'),
+ (0x1f486, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting massage: medium-light skin tone'),
+ (0x1f486, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting massage: medium skin tone'),
+ (0x1f486, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting massage: medium skin tone'),
+ (0x1f486, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting massage: medium-dark skin tone'),
+ (0x1f486, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting massage: medium-dark skin tone'),
+ (0x1f486, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting massage: dark skin tone'),
+ (0x1f486, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting massage: dark skin tone'),
+ (0x1f487, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting haircut'),
+ (0x1f487, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting haircut'),
+ (0x1f487, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting haircut: light skin tone'),
+ (0x1f487, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting haircut: light skin tone'),
+ (0x1f487, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting haircut: medium-light skin tone'),
+ (0x1f487, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting haircut: medium-light skin tone'),
+ (0x1f487, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting haircut: medium skin tone'),
+ (0x1f487, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting haircut: medium skin tone'),
+ (0x1f487, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting haircut: medium-dark skin tone'),
+ (0x1f487, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting haircut: medium-dark skin tone'),
+ (0x1f487, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman getting haircut: dark skin tone'),
+ (0x1f487, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man getting haircut: dark skin tone'),
+ (0x1f575, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman detective: light skin tone'),
+ (0x1f575, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man detective: light skin tone'),
+ (0x1f575, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman detective: medium-light skin tone'),
+ (0x1f575, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man detective: medium-light skin tone'),
+ (0x1f575, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman detective: medium skin tone'),
+ (0x1f575, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man detective: medium skin tone'),
+ (0x1f575, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman detective: medium-dark skin tone'),
+ (0x1f575, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man detective: medium-dark skin tone'),
+ (0x1f575, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman detective: dark skin tone'),
+ (0x1f575, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man detective: dark skin tone'),
+ (0x1f575, 0xfe0f, 0x200d, 0x2640, 0xfe0f,): (4, 'woman detective'),
+ (0x1f575, 0xfe0f, 0x200d, 0x2642, 0xfe0f,): (4, 'man detective'),
+ (0x1f645, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing NO'),
+ (0x1f645, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing NO'),
+ (0x1f645, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing NO: light skin tone'),
+ (0x1f645, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing NO: light skin tone'),
+ (0x1f645, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing NO: medium-light skin tone'),
+ (0x1f645, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing NO: medium-light skin tone'),
+ (0x1f645, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing NO: medium skin tone'),
+ (0x1f645, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing NO: medium skin tone'),
+ (0x1f645, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing NO: medium-dark skin tone'),
+ (0x1f645, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing NO: medium-dark skin tone'),
+ (0x1f645, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing NO: dark skin tone'),
+ (0x1f645, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing NO: dark skin tone'),
+ (0x1f646, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing OK'),
+ (0x1f646, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing OK'),
+ (0x1f646, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing OK: light skin tone'),
+ (0x1f646, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing OK: light skin tone'),
+ (0x1f646, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing OK: medium-light skin tone'),
+ (0x1f646, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing OK: medium-light skin tone'),
+ (0x1f646, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing OK: medium skin tone'),
+ (0x1f646, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing OK: medium skin tone'),
+ (0x1f646, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing OK: medium-dark skin tone'),
+ (0x1f646, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing OK: medium-dark skin tone'),
+ (0x1f646, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman gesturing OK: dark skin tone'),
+ (0x1f646, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man gesturing OK: dark skin tone'),
+ (0x1f647, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bowing'),
+ (0x1f647, 0x200d, 0x2642, 0xfe0f,): (4, 'man bowing'),
+ (0x1f647, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bowing: light skin tone'),
+ (0x1f647, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man bowing: light skin tone'),
+ (0x1f647, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bowing: medium-light skin tone'),
+ (0x1f647, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man bowing: medium-light skin tone'),
+ (0x1f647, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bowing: medium skin tone'),
+ (0x1f647, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man bowing: medium skin tone'),
+ (0x1f647, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bowing: medium-dark skin tone'),
+ (0x1f647, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man bowing: medium-dark skin tone'),
+ (0x1f647, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman bowing: dark skin tone'),
+ (0x1f647, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man bowing: dark skin tone'),
+ (0x1f64b, 0x200d, 0x2640, 0xfe0f,): (4, 'woman raising hand'),
+ (0x1f64b, 0x200d, 0x2642, 0xfe0f,): (4, 'man raising hand'),
+ (0x1f64b, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman raising hand: light skin tone'),
+ (0x1f64b, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man raising hand: light skin tone'),
+ (0x1f64b, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman raising hand: medium-light skin tone'),
+ (0x1f64b, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man raising hand: medium-light skin tone'),
+ (0x1f64b, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman raising hand: medium skin tone'),
+ (0x1f64b, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man raising hand: medium skin tone'),
+ (0x1f64b, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman raising hand: medium-dark skin tone'),
+ (0x1f64b, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man raising hand: medium-dark skin tone'),
+ (0x1f64b, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman raising hand: dark skin tone'),
+ (0x1f64b, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man raising hand: dark skin tone'),
+ (0x1f64d, 0x200d, 0x2640, 0xfe0f,): (4, 'woman frowning'),
+ (0x1f64d, 0x200d, 0x2642, 0xfe0f,): (4, 'man frowning'),
+ (0x1f64d, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman frowning: light skin tone'),
+ (0x1f64d, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man frowning: light skin tone'),
+ (0x1f64d, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman frowning: medium-light skin tone'),
+ (0x1f64d, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man frowning: medium-light skin tone'),
+ (0x1f64d, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman frowning: medium skin tone'),
+ (0x1f64d, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man frowning: medium skin tone'),
+ (0x1f64d, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman frowning: medium-dark skin tone'),
+ (0x1f64d, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man frowning: medium-dark skin tone'),
+ (0x1f64d, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman frowning: dark skin tone'),
+ (0x1f64d, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man frowning: dark skin tone'),
+ (0x1f64e, 0x200d, 0x2640, 0xfe0f,): (4, 'woman pouting'),
+ (0x1f64e, 0x200d, 0x2642, 0xfe0f,): (4, 'man pouting'),
+ (0x1f64e, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman pouting: light skin tone'),
+ (0x1f64e, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man pouting: light skin tone'),
+ (0x1f64e, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman pouting: medium-light skin tone'),
+ (0x1f64e, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man pouting: medium-light skin tone'),
+ (0x1f64e, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman pouting: medium skin tone'),
+ (0x1f64e, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man pouting: medium skin tone'),
+ (0x1f64e, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman pouting: medium-dark skin tone'),
+ (0x1f64e, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man pouting: medium-dark skin tone'),
+ (0x1f64e, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman pouting: dark skin tone'),
+ (0x1f64e, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man pouting: dark skin tone'),
+ (0x1f6a3, 0x200d, 0x2640, 0xfe0f,): (4, 'woman rowing boat'),
+ (0x1f6a3, 0x200d, 0x2642, 0xfe0f,): (4, 'man rowing boat'),
+ (0x1f6a3, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman rowing boat: light skin tone'),
+ (0x1f6a3, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man rowing boat: light skin tone'),
+ (0x1f6a3, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman rowing boat: medium-light skin tone'),
+ (0x1f6a3, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man rowing boat: medium-light skin tone'),
+ (0x1f6a3, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman rowing boat: medium skin tone'),
+ (0x1f6a3, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man rowing boat: medium skin tone'),
+ (0x1f6a3, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman rowing boat: medium-dark skin tone'),
+ (0x1f6a3, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man rowing boat: medium-dark skin tone'),
+ (0x1f6a3, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman rowing boat: dark skin tone'),
+ (0x1f6a3, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man rowing boat: dark skin tone'),
+ (0x1f6b4, 0x200d, 0x2640, 0xfe0f,): (4, 'woman biking'),
+ (0x1f6b4, 0x200d, 0x2642, 0xfe0f,): (4, 'man biking'),
+ (0x1f6b4, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman biking: light skin tone'),
+ (0x1f6b4, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man biking: light skin tone'),
+ (0x1f6b4, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman biking: medium-light skin tone'),
+ (0x1f6b4, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man biking: medium-light skin tone'),
+ (0x1f6b4, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman biking: medium skin tone'),
+ (0x1f6b4, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man biking: medium skin tone'),
+ (0x1f6b4, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman biking: medium-dark skin tone'),
+ (0x1f6b4, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man biking: medium-dark skin tone'),
+ (0x1f6b4, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman biking: dark skin tone'),
+ (0x1f6b4, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man biking: dark skin tone'),
+ (0x1f6b5, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mountain biking'),
+ (0x1f6b5, 0x200d, 0x2642, 0xfe0f,): (4, 'man mountain biking'),
+ (0x1f6b5, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mountain biking: light skin tone'),
+ (0x1f6b5, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man mountain biking: light skin tone'),
+ (0x1f6b5, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mountain biking: medium-light skin tone'),
+ (0x1f6b5, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man mountain biking: medium-light skin tone'),
+ (0x1f6b5, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mountain biking: medium skin tone'),
+ (0x1f6b5, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man mountain biking: medium skin tone'),
+ (0x1f6b5, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mountain biking: medium-dark skin tone'),
+ (0x1f6b5, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man mountain biking: medium-dark skin tone'),
+ (0x1f6b5, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mountain biking: dark skin tone'),
+ (0x1f6b5, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man mountain biking: dark skin tone'),
+ (0x1f6b6, 0x200d, 0x2640, 0xfe0f,): (4, 'woman walking'),
+ (0x1f6b6, 0x200d, 0x2642, 0xfe0f,): (4, 'man walking'),
+ (0x1f6b6, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman walking: light skin tone'),
+ (0x1f6b6, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man walking: light skin tone'),
+ (0x1f6b6, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman walking: medium-light skin tone'),
+ (0x1f6b6, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man walking: medium-light skin tone'),
+ (0x1f6b6, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman walking: medium skin tone'),
+ (0x1f6b6, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man walking: medium skin tone'),
+ (0x1f6b6, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman walking: medium-dark skin tone'),
+ (0x1f6b6, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man walking: medium-dark skin tone'),
+ (0x1f6b6, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman walking: dark skin tone'),
+ (0x1f6b6, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man walking: dark skin tone'),
+ (0x1f926, 0x200d, 0x2640, 0xfe0f,): (4, 'woman facepalming'),
+ (0x1f926, 0x200d, 0x2642, 0xfe0f,): (4, 'man facepalming'),
+ (0x1f926, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman facepalming: light skin tone'),
+ (0x1f926, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man facepalming: light skin tone'),
+ (0x1f926, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman facepalming: medium-light skin tone'),
+ (0x1f926, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man facepalming: medium-light skin tone'),
+ (0x1f926, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman facepalming: medium skin tone'),
+ (0x1f926, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man facepalming: medium skin tone'),
+ (0x1f926, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman facepalming: medium-dark skin tone'),
+ (0x1f926, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man facepalming: medium-dark skin tone'),
+ (0x1f926, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman facepalming: dark skin tone'),
+ (0x1f926, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man facepalming: dark skin tone'),
+ (0x1f937, 0x200d, 0x2640, 0xfe0f,): (4, 'woman shrugging'),
+ (0x1f937, 0x200d, 0x2642, 0xfe0f,): (4, 'man shrugging'),
+ (0x1f937, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman shrugging: light skin tone'),
+ (0x1f937, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man shrugging: light skin tone'),
+ (0x1f937, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman shrugging: medium-light skin tone'),
+ (0x1f937, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man shrugging: medium-light skin tone'),
+ (0x1f937, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman shrugging: medium skin tone'),
+ (0x1f937, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man shrugging: medium skin tone'),
+ (0x1f937, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman shrugging: medium-dark skin tone'),
+ (0x1f937, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man shrugging: medium-dark skin tone'),
+ (0x1f937, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman shrugging: dark skin tone'),
+ (0x1f937, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man shrugging: dark skin tone'),
+ (0x1f938, 0x200d, 0x2640, 0xfe0f,): (4, 'woman cartwheeling'),
+ (0x1f938, 0x200d, 0x2642, 0xfe0f,): (4, 'man cartwheeling'),
+ (0x1f938, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman cartwheeling: light skin tone'),
+ (0x1f938, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man cartwheeling: light skin tone'),
+ (0x1f938, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman cartwheeling: medium-light skin tone'),
+ (0x1f938, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man cartwheeling: medium-light skin tone'),
+ (0x1f938, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman cartwheeling: medium skin tone'),
+ (0x1f938, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man cartwheeling: medium skin tone'),
+ (0x1f938, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman cartwheeling: medium-dark skin tone'),
+ (0x1f938, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man cartwheeling: medium-dark skin tone'),
+ (0x1f938, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman cartwheeling: dark skin tone'),
+ (0x1f938, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man cartwheeling: dark skin tone'),
+ (0x1f939, 0x200d, 0x2640, 0xfe0f,): (4, 'woman juggling'),
+ (0x1f939, 0x200d, 0x2642, 0xfe0f,): (4, 'man juggling'),
+ (0x1f939, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman juggling: light skin tone'),
+ (0x1f939, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man juggling: light skin tone'),
+ (0x1f939, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman juggling: medium-light skin tone'),
+ (0x1f939, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man juggling: medium-light skin tone'),
+ (0x1f939, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman juggling: medium skin tone'),
+ (0x1f939, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man juggling: medium skin tone'),
+ (0x1f939, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman juggling: medium-dark skin tone'),
+ (0x1f939, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man juggling: medium-dark skin tone'),
+ (0x1f939, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman juggling: dark skin tone'),
+ (0x1f939, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man juggling: dark skin tone'),
+ (0x1f93c, 0x200d, 0x2640, 0xfe0f,): (4, 'women wrestling'),
+ (0x1f93c, 0x200d, 0x2642, 0xfe0f,): (4, 'men wrestling'),
+ (0x1f93d, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing water polo'),
+ (0x1f93d, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing water polo'),
+ (0x1f93d, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing water polo: light skin tone'),
+ (0x1f93d, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing water polo: light skin tone'),
+ (0x1f93d, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing water polo: medium-light skin tone'),
+ (0x1f93d, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing water polo: medium-light skin tone'),
+ (0x1f93d, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing water polo: medium skin tone'),
+ (0x1f93d, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing water polo: medium skin tone'),
+ (0x1f93d, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing water polo: medium-dark skin tone'),
+ (0x1f93d, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing water polo: medium-dark skin tone'),
+ (0x1f93d, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing water polo: dark skin tone'),
+ (0x1f93d, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing water polo: dark skin tone'),
+ (0x1f93e, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing handball'),
+ (0x1f93e, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing handball'),
+ (0x1f93e, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing handball: light skin tone'),
+ (0x1f93e, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing handball: light skin tone'),
+ (0x1f93e, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing handball: medium-light skin tone'),
+ (0x1f93e, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing handball: medium-light skin tone'),
+ (0x1f93e, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing handball: medium skin tone'),
+ (0x1f93e, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing handball: medium skin tone'),
+ (0x1f93e, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing handball: medium-dark skin tone'),
+ (0x1f93e, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing handball: medium-dark skin tone'),
+ (0x1f93e, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman playing handball: dark skin tone'),
+ (0x1f93e, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man playing handball: dark skin tone'),
+ (0x1f9b8, 0x200d, 0x2640, 0xfe0f,): (4, 'woman superhero'),
+ (0x1f9b8, 0x200d, 0x2642, 0xfe0f,): (4, 'man superhero'),
+ (0x1f9b8, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman superhero: light skin tone'),
+ (0x1f9b8, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man superhero: light skin tone'),
+ (0x1f9b8, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman superhero: medium-light skin tone'),
+ (0x1f9b8, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man superhero: medium-light skin tone'),
+ (0x1f9b8, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman superhero: medium skin tone'),
+ (0x1f9b8, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man superhero: medium skin tone'),
+ (0x1f9b8, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman superhero: medium-dark skin tone'),
+ (0x1f9b8, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man superhero: medium-dark skin tone'),
+ (0x1f9b8, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman superhero: dark skin tone'),
+ (0x1f9b8, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man superhero: dark skin tone'),
+ (0x1f9b9, 0x200d, 0x2640, 0xfe0f,): (4, 'woman supervillain'),
+ (0x1f9b9, 0x200d, 0x2642, 0xfe0f,): (4, 'man supervillain'),
+ (0x1f9b9, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman supervillain: light skin tone'),
+ (0x1f9b9, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man supervillain: light skin tone'),
+ (0x1f9b9, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman supervillain: medium-light skin tone'),
+ (0x1f9b9, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man supervillain: medium-light skin tone'),
+ (0x1f9b9, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman supervillain: medium skin tone'),
+ (0x1f9b9, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man supervillain: medium skin tone'),
+ (0x1f9b9, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman supervillain: medium-dark skin tone'),
+ (0x1f9b9, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man supervillain: medium-dark skin tone'),
+ (0x1f9b9, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman supervillain: dark skin tone'),
+ (0x1f9b9, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man supervillain: dark skin tone'),
+ (0x1f9d6, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in steamy room'),
+ (0x1f9d6, 0x200d, 0x2642, 0xfe0f,): (4, 'man in steamy room'),
+ (0x1f9d6, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in steamy room: light skin tone'),
+ (0x1f9d6, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man in steamy room: light skin tone'),
+ (0x1f9d6, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in steamy room: medium-light skin tone'),
+ (0x1f9d6, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man in steamy room: medium-light skin tone'),
+ (0x1f9d6, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in steamy room: medium skin tone'),
+ (0x1f9d6, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man in steamy room: medium skin tone'),
+ (0x1f9d6, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in steamy room: medium-dark skin tone'),
+ (0x1f9d6, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man in steamy room: medium-dark skin tone'),
+ (0x1f9d6, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in steamy room: dark skin tone'),
+ (0x1f9d6, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man in steamy room: dark skin tone'),
+ (0x1f9d7, 0x200d, 0x2640, 0xfe0f,): (4, 'woman climbing'),
+ (0x1f9d7, 0x200d, 0x2642, 0xfe0f,): (4, 'man climbing'),
+ (0x1f9d7, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman climbing: light skin tone'),
+ (0x1f9d7, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man climbing: light skin tone'),
+ (0x1f9d7, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman climbing: medium-light skin tone'),
+ (0x1f9d7, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man climbing: medium-light skin tone'),
+ (0x1f9d7, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman climbing: medium skin tone'),
+ (0x1f9d7, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man climbing: medium skin tone'),
+ (0x1f9d7, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman climbing: medium-dark skin tone'),
+ (0x1f9d7, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man climbing: medium-dark skin tone'),
+ (0x1f9d7, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman climbing: dark skin tone'),
+ (0x1f9d7, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man climbing: dark skin tone'),
+ (0x1f9d8, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in lotus position'),
+ (0x1f9d8, 0x200d, 0x2642, 0xfe0f,): (4, 'man in lotus position'),
+ (0x1f9d8, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in lotus position: light skin tone'),
+ (0x1f9d8, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man in lotus position: light skin tone'),
+ (0x1f9d8, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in lotus position: medium-light skin tone'),
+ (0x1f9d8, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man in lotus position: medium-light skin tone'),
+ (0x1f9d8, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in lotus position: medium skin tone'),
+ (0x1f9d8, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man in lotus position: medium skin tone'),
+ (0x1f9d8, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in lotus position: medium-dark skin tone'),
+ (0x1f9d8, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man in lotus position: medium-dark skin tone'),
+ (0x1f9d8, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman in lotus position: dark skin tone'),
+ (0x1f9d8, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man in lotus position: dark skin tone'),
+ (0x1f9d9, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mage'),
+ (0x1f9d9, 0x200d, 0x2642, 0xfe0f,): (4, 'man mage'),
+ (0x1f9d9, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mage: light skin tone'),
+ (0x1f9d9, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man mage: light skin tone'),
+ (0x1f9d9, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mage: medium-light skin tone'),
+ (0x1f9d9, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man mage: medium-light skin tone'),
+ (0x1f9d9, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mage: medium skin tone'),
+ (0x1f9d9, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man mage: medium skin tone'),
+ (0x1f9d9, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mage: medium-dark skin tone'),
+ (0x1f9d9, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man mage: medium-dark skin tone'),
+ (0x1f9d9, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman mage: dark skin tone'),
+ (0x1f9d9, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man mage: dark skin tone'),
+ (0x1f9da, 0x200d, 0x2640, 0xfe0f,): (4, 'woman fairy'),
+ (0x1f9da, 0x200d, 0x2642, 0xfe0f,): (4, 'man fairy'),
+ (0x1f9da, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman fairy: light skin tone'),
+ (0x1f9da, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man fairy: light skin tone'),
+ (0x1f9da, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman fairy: medium-light skin tone'),
+ (0x1f9da, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man fairy: medium-light skin tone'),
+ (0x1f9da, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman fairy: medium skin tone'),
+ (0x1f9da, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man fairy: medium skin tone'),
+ (0x1f9da, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman fairy: medium-dark skin tone'),
+ (0x1f9da, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man fairy: medium-dark skin tone'),
+ (0x1f9da, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman fairy: dark skin tone'),
+ (0x1f9da, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man fairy: dark skin tone'),
+ (0x1f9db, 0x200d, 0x2640, 0xfe0f,): (4, 'woman vampire'),
+ (0x1f9db, 0x200d, 0x2642, 0xfe0f,): (4, 'man vampire'),
+ (0x1f9db, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman vampire: light skin tone'),
+ (0x1f9db, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man vampire: light skin tone'),
+ (0x1f9db, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman vampire: medium-light skin tone'),
+ (0x1f9db, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man vampire: medium-light skin tone'),
+ (0x1f9db, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman vampire: medium skin tone'),
+ (0x1f9db, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man vampire: medium skin tone'),
+ (0x1f9db, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman vampire: medium-dark skin tone'),
+ (0x1f9db, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man vampire: medium-dark skin tone'),
+ (0x1f9db, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman vampire: dark skin tone'),
+ (0x1f9db, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man vampire: dark skin tone'),
+ (0x1f9dc, 0x200d, 0x2640, 0xfe0f,): (4, 'mermaid'),
+ (0x1f9dc, 0x200d, 0x2642, 0xfe0f,): (4, 'merman'),
+ (0x1f9dc, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'mermaid: light skin tone'),
+ (0x1f9dc, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'merman: light skin tone'),
+ (0x1f9dc, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'mermaid: medium-light skin tone'),
+ (0x1f9dc, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'merman: medium-light skin tone'),
+ (0x1f9dc, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'mermaid: medium skin tone'),
+ (0x1f9dc, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'merman: medium skin tone'),
+ (0x1f9dc, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'mermaid: medium-dark skin tone'),
+ (0x1f9dc, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'merman: medium-dark skin tone'),
+ (0x1f9dc, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'mermaid: dark skin tone'),
+ (0x1f9dc, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'merman: dark skin tone'),
+ (0x1f9dd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman elf'),
+ (0x1f9dd, 0x200d, 0x2642, 0xfe0f,): (4, 'man elf'),
+ (0x1f9dd, 0x1f3fb, 0x200d, 0x2640, 0xfe0f,): (4, 'woman elf: light skin tone'),
+ (0x1f9dd, 0x1f3fb, 0x200d, 0x2642, 0xfe0f,): (4, 'man elf: light skin tone'),
+ (0x1f9dd, 0x1f3fc, 0x200d, 0x2640, 0xfe0f,): (4, 'woman elf: medium-light skin tone'),
+ (0x1f9dd, 0x1f3fc, 0x200d, 0x2642, 0xfe0f,): (4, 'man elf: medium-light skin tone'),
+ (0x1f9dd, 0x1f3fd, 0x200d, 0x2640, 0xfe0f,): (4, 'woman elf: medium skin tone'),
+ (0x1f9dd, 0x1f3fd, 0x200d, 0x2642, 0xfe0f,): (4, 'man elf: medium skin tone'),
+ (0x1f9dd, 0x1f3fe, 0x200d, 0x2640, 0xfe0f,): (4, 'woman elf: medium-dark skin tone'),
+ (0x1f9dd, 0x1f3fe, 0x200d, 0x2642, 0xfe0f,): (4, 'man elf: medium-dark skin tone'),
+ (0x1f9dd, 0x1f3ff, 0x200d, 0x2640, 0xfe0f,): (4, 'woman elf: dark skin tone'),
+ (0x1f9dd, 0x1f3ff, 0x200d, 0x2642, 0xfe0f,): (4, 'man elf: dark skin tone'),
+ (0x1f9de, 0x200d, 0x2640, 0xfe0f,): (4, 'woman genie'),
+ (0x1f9de, 0x200d, 0x2642, 0xfe0f,): (4, 'man genie'),
+ (0x1f9df, 0x200d, 0x2640, 0xfe0f,): (4, 'woman zombie'),
+ (0x1f9df, 0x200d, 0x2642, 0xfe0f,): (4, 'man zombie'),
+ (0x1f468, 0x200d, 0x1f9b0,): (4, 'man: red hair'),
+ (0x1f468, 0x200d, 0x1f9b1,): (4, 'man: curly hair'),
+ (0x1f468, 0x200d, 0x1f9b2,): (4, 'man: bald'),
+ (0x1f468, 0x200d, 0x1f9b3,): (4, 'man: white hair'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f9b0,): (4, 'man: light skin tone, red hair'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f9b1,): (4, 'man: light skin tone, curly hair'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f9b2,): (4, 'man: light skin tone, bald'),
+ (0x1f468, 0x1f3fb, 0x200d, 0x1f9b3,): (4, 'man: light skin tone, white hair'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f9b0,): (4, 'man: medium-light skin tone, red hair'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f9b1,): (4, 'man: medium-light skin tone, curly hair'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f9b2,): (4, 'man: medium-light skin tone, bald'),
+ (0x1f468, 0x1f3fc, 0x200d, 0x1f9b3,): (4, 'man: medium-light skin tone, white hair'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f9b0,): (4, 'man: medium skin tone, red hair'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f9b1,): (4, 'man: medium skin tone, curly hair'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f9b2,): (4, 'man: medium skin tone, bald'),
+ (0x1f468, 0x1f3fd, 0x200d, 0x1f9b3,): (4, 'man: medium skin tone, white hair'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f9b0,): (4, 'man: medium-dark skin tone, red hair'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f9b1,): (4, 'man: medium-dark skin tone, curly hair'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f9b2,): (4, 'man: medium-dark skin tone, bald'),
+ (0x1f468, 0x1f3fe, 0x200d, 0x1f9b3,): (4, 'man: medium-dark skin tone, white hair'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f9b0,): (4, 'man: dark skin tone, red hair'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f9b1,): (4, 'man: dark skin tone, curly hair'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f9b2,): (4, 'man: dark skin tone, bald'),
+ (0x1f468, 0x1f3ff, 0x200d, 0x1f9b3,): (4, 'man: dark skin tone, white hair'),
+ (0x1f469, 0x200d, 0x1f9b0,): (4, 'woman: red hair'),
+ (0x1f469, 0x200d, 0x1f9b1,): (4, 'woman: curly hair'),
+ (0x1f469, 0x200d, 0x1f9b2,): (4, 'woman: bald'),
+ (0x1f469, 0x200d, 0x1f9b3,): (4, 'woman: white hair'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f9b0,): (4, 'woman: light skin tone, red hair'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f9b1,): (4, 'woman: light skin tone, curly hair'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f9b2,): (4, 'woman: light skin tone, bald'),
+ (0x1f469, 0x1f3fb, 0x200d, 0x1f9b3,): (4, 'woman: light skin tone, white hair'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f9b0,): (4, 'woman: medium-light skin tone, red hair'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f9b1,): (4, 'woman: medium-light skin tone, curly hair'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f9b2,): (4, 'woman: medium-light skin tone, bald'),
+ (0x1f469, 0x1f3fc, 0x200d, 0x1f9b3,): (4, 'woman: medium-light skin tone, white hair'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f9b0,): (4, 'woman: medium skin tone, red hair'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f9b1,): (4, 'woman: medium skin tone, curly hair'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f9b2,): (4, 'woman: medium skin tone, bald'),
+ (0x1f469, 0x1f3fd, 0x200d, 0x1f9b3,): (4, 'woman: medium skin tone, white hair'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f9b0,): (4, 'woman: medium-dark skin tone, red hair'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f9b1,): (4, 'woman: medium-dark skin tone, curly hair'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f9b2,): (4, 'woman: medium-dark skin tone, bald'),
+ (0x1f469, 0x1f3fe, 0x200d, 0x1f9b3,): (4, 'woman: medium-dark skin tone, white hair'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f9b0,): (4, 'woman: dark skin tone, red hair'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f9b1,): (4, 'woman: dark skin tone, curly hair'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f9b2,): (4, 'woman: dark skin tone, bald'),
+ (0x1f469, 0x1f3ff, 0x200d, 0x1f9b3,): (4, 'woman: dark skin tone, white hair'),
+ (0x1f3f3, 0xfe0f, 0x200d, 0x1f308,): (4, 'rainbow flag'),
+ (0x1f3f4, 0x200d, 0x2620, 0xfe0f,): (4, 'pirate flag'),
+ (0x1f441, 0xfe0f, 0x200d, 0x1f5e8, 0xfe0f,): (4, 'eye in speech bubble'),
+}
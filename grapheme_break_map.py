@@ -0,0 +1,1428 @@
+
+
+# tuple of Unicode Grapheme_Cluster_Break (short) names, plus ExtPict for the Extended_Pictographic
+# characters. The index of the name in the tuple is the grapheme break id.
+grapheme_break_names = (
+ "XX",
+ "CR",
+ "LF",
+ "CN",
+ "EX",
+ "ZWJ",
+ "RI",
+ "PP",
+ "SM",
+ "L",
+ "V",
+ "T",
+ "LV",
+ "LVT",
+ "ExtPict",
+)
+
+
+# dictionary of Unicode grapheme breaks
+# entries are: key: (f, l, gcb), where
+#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.
+#     gcb - the grapheme break id.
+# code points not in the map are XX (Other.)
+grapheme_break_map = {
+ 0x0000: (0x0000, 0x0009, 3),  #  CN
+ 0x000a: (0x000a, 0x000a, 2),  #  LF
+ 0x000b: (0x000b, 0x000c, 3),  #  CN
+ 0x000d: (0x000d, 0x000d, 1),  #  CR
+ 0x000e: (0x000e, 0x001f, 3),  #  CN
+ 0x007f: (0x007f, 0x009f, 3),  #  CN
+ 0x00a9: (0x00a9, 0x00a9, 14),  #  ExtPict
+ 0x00ad: (0x00ad, 0x00ad, 3),  #  CN
+ 0x00ae: (0x00ae, 0x00ae, 14),  #  ExtPict
+ 0x0300: (0x0300, 0x036f, 4),  #  EX
+ 0x0483: (0x0483, 0x0489, 4),  #  EX
+ 0x0591: (0x0591, 0x05bd, 4),  #  EX
+ 0x05bf: (0x05bf, 0x05bf, 4),  #  EX
+ 0x05c1: (0x05c1, 0x05c2, 4),  #  EX
+ 0x05c4: (0x05c4, 0x05c5, 4),  #  EX
+ 0x05c7: (0x05c7, 0x05c7, 4),  #  EX
+ 0x0600: (0x0600, 0x0605, 7),  #  PP
+ 0x0610: (0x0610, 0x061a, 4),  #  EX
+ 0x061c: (0x061c, 0x061c, 3),  #  CN
+ 0x064b: (0x064b, 0x065f, 4),  #  EX
+ 0x0670: (0x0670, 0x0670, 4),  #  EX
+ 0x06d6: (0x06d6, 0x06dc, 4),  #  EX
+ 0x06dd: (0x06dd, 0x06dd, 7),  #  PP
+ 0x06df: (0x06df, 0x06e4, 4),  #  EX
+ 0x06e7: (0x06e7, 0x06e8, 4),  #  EX
+ 0x06ea: (0x06ea, 0x06ed, 4),  #  EX
+ 0x070f: (0x070f, 0x070f, 7),  #  PP
+ 0x0711: (0x0711, 0x0711, 4),  #  EX
+ 0x0730: (0x0730, 0x074a, 4),  #  EX
+ 0x07a6: (0x07a6, 0x07b0, 4),  #  EX
+ 0x07eb: (0x07eb, 0x07f3, 4),  #  EX
+ 0x07fd: (0x07fd, 0x07fd, 4),  #  EX
+ 0x0816: (0x0816, 0x0819, 4),  #  EX
+ 0x081b: (0x081b, 0x0823, 4),  #  EX
+ 0x0825: (0x0825, 0x0827, 4),  #  EX
+ 0x0829: (0x0829, 0x082d, 4),  #  EX
+ 0x0859: (0x0859, 0x085b, 4),  #  EX
+ 0x08d3: (0x08d3, 0x08e1, 4),  #  EX
+ 0x08e2: (0x08e2, 0x08e2, 7),  #  PP
+ 0x08e3: (0x08e3, 0x0902, 4),  #  EX
+ 0x0903: (0x0903, 0x0903, 8),  #  SM
+ 0x093a: (0x093a, 0x093a, 4),  #  EX
+ 0x093b: (0x093b, 0x093b, 8),  #  SM
+ 0x093c: (0x093c, 0x093c, 4),  #  EX
+ 0x093e: (0x093e, 0x0940, 8),  #  SM
+ 0x0941: (0x0941, 0x0948, 4),  #  EX
+ 0x0949: (0x0949, 0x094c, 8),  #  SM
+ 0x094d: (0x094d, 0x094d, 4),  #  EX
+ 0x094e: (0x094e, 0x094f, 8),  #  SM
+ 0x0951: (0x0951, 0x0957, 4),  #  EX
+ 0x0962: (0x0962, 0x0963, 4),  #  EX
+ 0x0981: (0x0981, 0x0981, 4),  #  EX
+ 0x0982: (0x0982, 0x0983, 8),  #  SM
+ 0x09bc: (0x09bc, 0x09bc, 4),  #  EX
+ 0x09be: (0x09be, 0x09be, 4),  #  EX
+ 0x09bf: (0x09bf, 0x09c0, 8),  #  SM
+ 0x09c1: (0x09c1, 0x09c4, 4),  #  EX
+ 0x09c7: (0x09c7, 0x09c8, 8),  #  SM
+ 0x09cb: (0x09cb, 0x09cc, 8),  #  SM
+ 0x09cd: (0x09cd, 0x09cd, 4),  #  EX
+ 0x09d7: (0x09d7, 0x09d7, 4),  #  EX
+ 0x09e2: (0x09e2, 0x09e3, 4),  #  EX
+ 0x09fe: (0x09fe, 0x09fe, 4),  #  EX
+ 0x0a01: (0x0a01, 0x0a02, 4),  #  EX
+ 0x0a03: (0x0a03, 0x0a03, 8),  #  SM
+ 0x0a3c: (0x0a3c, 0x0a3c, 4),  #  EX
+ 0x0a3e: (0x0a3e, 0x0a40, 8),  #  SM
+ 0x0a41: (0x0a41, 0x0a42, 4),  #  EX
+ 0x0a47: (0x0a47, 0x0a48, 4),  #  EX
+ 0x0a4b: (0x0a4b, 0x0a4d, 4),  #  EX
+ 0x0a51: (0x0a51, 0x0a51, 4),  #  EX
+ 0x0a70: (0x0a70, 0x0a71, 4),  #  EX
+ 0x0a75: (0x0a75, 0x0a75, 4),  #  EX
+ 0x0a81: (0x0a81, 0x0a82, 4),  #  EX
+ 0x0a83: (0x0a83, 0x0a83, 8),  #  SM
+ 0x0abc: (0x0abc, 0x0abc, 4),  #  EX
+ 0x0abe: (0x0abe, 0x0ac0, 8),  #  SM
+ 0x0ac1: (0x0ac1, 0x0ac5, 4),  #  EX
+ 0x0ac7: (0x0ac7, 0x0ac8, 4),  #  EX
+ 0x0ac9: (0x0ac9, 0x0ac9, 8),  #  SM
+ 0x0acb: (0x0acb, 0x0acc, 8),  #  SM
+ 0x0acd: (0x0acd, 0x0acd, 4),  #  EX
+ 0x0ae2: (0x0ae2, 0x0ae3, 4),  #  EX
+ 0x0afa: (0x0afa, 0x0aff, 4),  #  EX
+ 0x0b01: (0x0b01, 0x0b01, 4),  #  EX
+ 0x0b02: (0x0b02, 0x0b03, 8),  #  SM
+ 0x0b3c: (0x0b3c, 0x0b3c, 4),  #  EX
+ 0x0b3e: (0x0b3e, 0x0b3f, 4),  #  EX
+ 0x0b40: (0x0b40, 0x0b40, 8),  #  SM
+ 0x0b41: (0x0b41, 0x0b44, 4),  #  EX
+ 0x0b47: (0x0b47, 0x0b48, 8),  #  SM
+ 0x0b4b: (0x0b4b, 0x0b4c, 8),  #  SM
+ 0x0b4d: (0x0b4d, 0x0b4d, 4),  #  EX
+ 0x0b56: (0x0b56, 0x0b57, 4),  #  EX
+ 0x0b62: (0x0b62, 0x0b63, 4),  #  EX
+ 0x0b82: (0x0b82, 0x0b82, 4),  #  EX
+ 0x0bbe: (0x0bbe, 0x0bbe, 4),  #  EX
+ 0x0bbf: (0x0bbf, 0x0bbf, 8),  #  SM
+ 0x0bc0: (0x0bc0, 0x0bc0, 4),  #  EX
+ 0x0bc1: (0x0bc1, 0x0bc2, 8),  #  SM
+ 0x0bc6: (0x0bc6, 0x0bc8, 8),  #  SM
+ 0x0bca: (0x0bca, 0x0bcc, 8),  #  SM
+ 0x0bcd: (0x0bcd, 0x0bcd, 4),  #  EX
+ 0x0bd7: (0x0bd7, 0x0bd7, 4),  #  EX
+ 0x0c00: (0x0c00, 0x0c00, 4),  #  EX
+ 0x0c01: (0x0c01, 0x0c03, 8),  #  SM
+ 0x0c04: (0x0c04, 0x0c04, 4),  #  EX
+ 0x0c3e: (0x0c3e, 0x0c40, 4),  #  EX
+ 0x0c41: (0x0c41, 0x0c44, 8),  #  SM
+ 0x0c46: (0x0c46, 0x0c48, 4),  #  EX
+ 0x0c4a: (0x0c4a, 0x0c4d, 4),  #  EX
+ 0x0c55: (0x0c55, 0x0c56, 4),  #  EX
+ 0x0c62: (0x0c62, 0x0c63, 4),  #  EX
+ 0x0c81: (0x0c81, 0x0c81, 4),  #  EX
+ 0x0c82: (0x0c82, 0x0c83, 8),  #  SM
+ 0x0cbc: (0x0cbc, 0x0cbc, 4),  #  EX
+ 0x0cbe: (0x0cbe, 0x0cbe, 8),  #  SM
+ 0x0cbf: (0x0cbf, 0x0cbf, 4),  #  EX
+ 0x0cc0: (0x0cc0, 0x0cc1, 8),  #  SM
+ 0x0cc2: (0x0cc2, 0x0cc2, 4),  #  EX
+ 0x0cc3: (0x0cc3, 0x0cc4, 8),  #  SM
+ 0x0cc6: (0x0cc6, 0x0cc6, 4),  #  EX
+ 0x0cc7: (0x0cc7, 0x0cc8, 8),  #  SM
+ 0x0cca: (0x0cca, 0x0ccb, 8),  #  SM
+ 0x0ccc: (0x0ccc, 0x0ccd, 4),  #  EX
+ 0x0cd5: (0x0cd5, 0x0cd6, 4),  #  EX
+ 0x0ce2: (0x0ce2, 0x0ce3, 4),  #  EX
+ 0x0d00: (0x0d00, 0x0d01, 4),  #  EX
+ 0x0d02: (0x0d02, 0x0d03, 8),  #  SM
+ 0x0d3b: (0x0d3b, 0x0d3c, 4),  #  EX
+ 0x0d3e: (0x0d3e, 0x0d3e, 4),  #  EX
+ 0x0d3f: (0x0d3f, 0x0d40, 8),  #  SM
+ 0x0d41: (0x0d41, 0x0d44, 4),  #  EX
+ 0x0d46: (0x0d46, 0x0d48, 8),  #  SM
+ 0x0d4a: (0x0d4a, 0x0d4c, 8),  #  SM
+ 0x0d4d: (0x0d4d, 0x0d4d, 4),  #  EX
+ 0x0d4e: (0x0d4e, 0x0d4e, 7),  #  PP
+ 0x0d57: (0x0d57, 0x0d57, 4),  #  EX
+ 0x0d62: (0x0d62, 0x0d63, 4),  #  EX
+ 0x0d82: (0x0d82, 0x0d83, 8),  #  SM
+ 0x0dca: (0x0dca, 0x0dca, 4),  #  EX
+ 0x0dcf: (0x0dcf, 0x0dcf, 4),  #  EX
+ 0x0dd0: (0x0dd0, 0x0dd1, 8),  #  SM
+ 0x0dd2: (0x0dd2, 0x0dd4, 4),  #  EX
+ 0x0dd6: (0x0dd6, 0x0dd6, 4),  #  EX
+ 0x0dd8: (0x0dd8, 0x0dde, 8),  #  SM
+ 0x0ddf: (0x0ddf, 0x0ddf, 4),  #  EX
+ 0x0df2: (0x0df2, 0x0df3, 8),  #  SM
+ 0x0e31: (0x0e31, 0x0e31, 4),  #  EX
+ 0x0e33: (0x0e33, 0x0e33, 8),  #  SM
+ 0x0e34: (0x0e34, 0x0e3a, 4),  #  EX
+ 0x0e47: (0x0e47, 0x0e4e, 4),  #  EX
+ 0x0eb1: (0x0eb1, 0x0eb1, 4),  #  EX
+ 0x0eb3: (0x0eb3, 0x0eb3, 8),  #  SM
+ 0x0eb4: (0x0eb4, 0x0eb9, 4),  #  EX
+ 0x0ebb: (0x0ebb, 0x0ebc, 4),  #  EX
+ 0x0ec8: (0x0ec8, 0x0ecd, 4),  #  EX
+ 0x0f18: (0x0f18, 0x0f19, 4),  #  EX
+ 0x0f35: (0x0f35, 0x0f35, 4),  #  EX
+ 0x0f37: (0x0f37, 0x0f37, 4),  #  EX
+ 0x0f39: (0x0f39, 0x0f39, 4),  #  EX
+ 0x0f3e: (0x0f3e, 0x0f3f, 8),  #  SM
+ 0x0f71: (0x0f71, 0x0f7e, 4),  #  EX
+ 0x0f7f: (0x0f7f, 0x0f7f, 8),  #  SM
+ 0x0f80: (0x0f80, 0x0f84, 4),  #  EX
+ 0x0f86: (0x0f86, 0x0f87, 4),  #  EX
+ 0x0f8d: (0x0f8d, 0x0f97, 4),  #  EX
+ 0x0f99: (0x0f99, 0x0fbc, 4),  #  EX
+ 0x0fc6: (0x0fc6, 0x0fc6, 4),  #  EX
+ 0x102d: (0x102d, 0x1030, 4),  #  EX
+ 0x1031: (0x1031, 0x1031, 8),  #  SM
+ 0x1032: (0x1032, 0x1037, 4),  #  EX
+ 0x1039: (0x1039, 0x103a, 4),  #  EX
+ 0x103b: (0x103b, 0x103c, 8),  #  SM
+ 0x103d: (0x103d, 0x103e, 4),  #  EX
+ 0x1056: (0x1056, 0x1057, 8),  #  SM
+ 0x1058: (0x1058, 0x1059, 4),  #  EX
+ 0x105e: (0x105e, 0x1060, 4),  #  EX
+ 0x1071: (0x1071, 0x1074, 4),  #  EX
+ 0x1082: (0x1082, 0x1082, 4),  #  EX
+ 0x1084: (0x1084, 0x1084, 8),  #  SM
+ 0x1085: (0x1085, 0x1086, 4),  #  EX
+ 0x108d: (0x108d, 0x108d, 4),  #  EX
+ 0x109d: (0x109d, 0x109d, 4),  #  EX
+ 0x1100: (0x1100, 0x115f, 9),  #  L
+ 0x1160: (0x1160, 0x11a7, 10),  #  V
+ 0x11a8: (0x11a8, 0x11ff, 11),  #  T
+ 0x135d: (0x135d, 0x135f, 4),  #  EX
+ 0x1712: (0x1712, 0x1714, 4),  #  EX
+ 0x1732: (0x1732, 0x1734, 4),  #  EX
+ 0x1752: (0x1752, 0x1753, 4),  #  EX
+ 0x1772: (0x1772, 0x1773, 4),  #  EX
+ 0x17b4: (0x17b4, 0x17b5, 4),  #  EX
+ 0x17b6: (0x17b6, 0x17b6, 8),  #  SM
+ 0x17b7: (0x17b7, 0x17bd, 4),  #  EX
+ 0x17be: (0x17be, 0x17c5, 8),  #  SM
+ 0x17c6: (0x17c6, 0x17c6, 4),  #  EX
+ 0x17c7: (0x17c7, 0x17c8, 8),  #  SM
+ 0x17c9: (0x17c9, 0x17d3, 4),  #  EX
+ 0x17dd: (0x17dd, 0x17dd, 4),  #  EX
+ 0x180b: (0x180b, 0x180d, 4),  #  EX
+ 0x180e: (0x180e, 0x180e, 3),  #  CN
+ 0x1885: (0x1885, 0x1886, 4),  #  EX
+ 0x18a9: (0x18a9, 0x18a9, 4),  #  EX
+ 0x1920: (0x1920, 0x1922, 4),  #  EX
+ 0x1923: (0x1923, 0x1926, 8),  #  SM
+ 0x1927: (0x1927, 0x1928, 4),  #  EX
+ 0x1929: (0x1929, 0x192b, 8),  #  SM
+ 0x1930: (0x1930, 0x1931, 8),  #  SM
+ 0x1932: (0x1932, 0x1932, 4),  #  EX
+ 0x1933: (0x1933, 0x1938, 8),  #  SM
+ 0x1939: (0x1939, 0x193b, 4),  #  EX
+ 0x1a17: (0x1a17, 0x1a18, 4),  #  EX
+ 0x1a19: (0x1a19, 0x1a1a, 8),  #  SM
+ 0x1a1b: (0x1a1b, 0x1a1b, 4),  #  EX
+ 0x1a55: (0x1a55, 0x1a55, 8),  #  SM
+ 0x1a56: (0x1a56, 0x1a56, 4),  #  EX
+ 0x1a57: (0x1a57, 0x1a57, 8),  #  SM
+ 0x1a58: (0x1a58, 0x1a5e, 4),  #  EX
+ 0x1a60: (0x1a60, 0x1a60, 4),  #  EX
+ 0x1a62: (0x1a62, 0x1a62, 4),  #  EX
+ 0x1a65: (0x1a65, 0x1a6c, 4),  #  EX
+ 0x1a6d: (0x1a6d, 0x1a72, 8),  #  SM
+ 0x1a73: (0x1a73, 0x1a7c, 4),  #  EX
+ 0x1a7f: (0x1a7f, 0x1a7f, 4),  #  EX
+ 0x1ab0: (0x1ab0, 0x1abe, 4),  #  EX
+ 0x1b00: (0x1b00, 0x1b03, 4),  #  EX
+ 0x1b04: (0x1b04, 0x1b04, 8),  #  SM
+ 0x1b34: (0x1b34, 0x1b34, 4),  #  EX
+ 0x1b35: (0x1b35, 0x1b35, 8),  #  SM
+ 0x1b36: (0x1b36, 0x1b3a, 4),  #  EX
+ 0x1b3b: (0x1b3b, 0x1b3b, 8),  #  SM
+ 0x1b3c: (0x1b3c, 0x1b3c, 4),  #  EX
+ 0x1b3d: (0x1b3d, 0x1b41, 8),  #  SM
+ 0x1b42: (0x1b42, 0x1b42, 4),  #  EX
+ 0x1b43: (0x1b43, 0x1b44, 8),  #  SM
+ 0x1b6b: (0x1b6b, 0x1b73, 4),  #  EX
+ 0x1b80: (0x1b80, 0x1b81, 4),  #  EX
+ 0x1b82: (0x1b82, 0x1b82, 8),  #  SM
+ 0x1ba1: (0x1ba1, 0x1ba1, 8),  #  SM
+ 0x1ba2: (0x1ba2, 0x1ba5, 4),  #  EX
+ 0x1ba6: (0x1ba6, 0x1ba7, 8),  #  SM
+ 0x1ba8: (0x1ba8, 0x1ba9, 4),  #  EX
+ 0x1baa: (0x1baa, 0x1baa, 8),  #  SM
+ 0x1bab: (0x1bab, 0x1bad, 4),  #  EX
+ 0x1be6: (0x1be6, 0x1be6, 4),  #  EX
+ 0x1be7: (0x1be7, 0x1be7, 8),  #  SM
+ 0x1be8: (0x1be8, 0x1be9, 4),  #  EX
+ 0x1bea: (0x1bea, 0x1bec, 8),  #  SM
+ 0x1bed: (0x1bed, 0x1bed, 4),  #  EX
+ 0x1bee: (0x1bee, 0x1bee, 8),  #  SM
+ 0x1bef: (0x1bef, 0x1bf1, 4),  #  EX
+ 0x1bf2: (0x1bf2, 0x1bf3, 8),  #  SM
+ 0x1c24: (0x1c24, 0x1c2b, 8),  #  SM
+ 0x1c2c: (0x1c2c, 0x1c33, 4),  #  EX
+ 0x1c34: (0x1c34, 0x1c35, 8),  #  SM
+ 0x1c36: (0x1c36, 0x1c37, 4),  #  EX
+ 0x1cd0: (0x1cd0, 0x1cd2, 4),  #  EX
+ 0x1cd4: (0x1cd4, 0x1ce0, 4),  #  EX
+ 0x1ce1: (0x1ce1, 0x1ce1, 8),  #  SM
+ 0x1ce2: (0x1ce2, 0x1ce8, 4),  #  EX
+ 0x1ced: (0x1ced, 0x1ced, 4),  #  EX
+ 0x1cf2: (0x1cf2, 0x1cf3, 8),  #  SM
+ 0x1cf4: (0x1cf4, 0x1cf4, 4),  #  EX
+ 0x1cf7: (0x1cf7, 0x1cf7, 8),  #  SM
+ 0x1cf8: (0x1cf8, 0x1cf9, 4),  #  EX
+ 0x1dc0: (0x1dc0, 0x1df9, 4),  #  EX
+ 0x1dfb: (0x1dfb, 0x1dff, 4),  #  EX
+ 0x200b: (0x200b, 0x200b, 3),  #  CN
+ 0x200c: (0x200c, 0x200c, 4),  #  EX
+ 0x200d: (0x200d, 0x200d, 5),  #  ZWJ
+ 0x200e: (0x200e, 0x200f, 3),  #  CN
+ 0x2028: (0x2028, 0x202e, 3),  #  CN
+ 0x203c: (0x203c, 0x203c, 14),  #  ExtPict
+ 0x2049: (0x2049, 0x2049, 14),  #  ExtPict
+ 0x2060: (0x2060, 0x206f, 3),  #  CN
+ 0x20d0: (0x20d0, 0x20f0, 4),  #  EX
+ 0x2122: (0x2122, 0x2122, 14),  #  ExtPict
+ 0x2139: (0x2139, 0x2139, 14),  #  ExtPict
+ 0x2194: (0x2194, 0x2199, 14),  #  ExtPict
+ 0x21a9: (0x21a9, 0x21aa, 14),  #  ExtPict
+ 0x231a: (0x231a, 0x231b, 14),  #  ExtPict
+ 0x2328: (0x2328, 0x2328, 14),  #  ExtPict
+ 0x2388: (0x2388, 0x2388, 14),  #  ExtPict
+ 0x23cf: (0x23cf, 0x23cf, 14),  #  ExtPict
+ 0x23e9: (0x23e9, 0x23f3, 14),  #  ExtPict
+ 0x23f8: (0x23f8, 0x23fa, 14),  #  ExtPict
+ 0x24c2: (0x24c2, 0x24c2, 14),  #  ExtPict
+ 0x25aa: (0x25aa, 0x25ab, 14),  #  ExtPict
+ 0x25b6: (0x25b6, 0x25b6, 14),  #  ExtPict
+ 0x25c0: (0x25c0, 0x25c0, 14),  #  ExtPict
+ 0x25fb: (0x25fb, 0x25fe, 14),  #  ExtPict
+ 0x2600: (0x2600, 0x2605, 14),  #  ExtPict
+ 0x2607: (0x2607, 0x2612, 14),  #  ExtPict
+ 0x2614: (0x2614, 0x2685, 14),  #  ExtPict
+ 0x2690: (0x2690, 0x2705, 14),  #  ExtPict
+ 0x2708: (0x2708, 0x2712, 14),  #  ExtPict
+ 0x2714: (0x2714, 0x2714, 14),  #  ExtPict
+ 0x2716: (0x2716, 0x2716, 14),  #  ExtPict
+ 0x271d: (0x271d, 0x271d, 14),  #  ExtPict
+ 0x2721: (0x2721, 0x2721, 14),  #  ExtPict
+ 0x2728: (0x2728, 0x2728, 14),  #  ExtPict
+ 0x2733: (0x2733, 0x2734, 14),  #  ExtPict
+ 0x2744: (0x2744, 0x2744, 14),  #  ExtPict
+ 0x2747: (0x2747, 0x2747, 14),  #  ExtPict
+ 0x274c: (0x274c, 0x274c, 14),  #  ExtPict
+ 0x274e: (0x274e, 0x274e, 14),  #  ExtPict
+ 0x2753: (0x2753, 0x2755, 14),  #  ExtPict
+ 0x2757: (0x2757, 0x2757, 14),  #  ExtPict
+ 0x2763: (0x2763, 0x2767, 14),  #  ExtPict
+ 0x2795: (0x2795, 0x2797, 14),  #  ExtPict
+ 0x27a1: (0x27a1, 0x27a1, 14),  #  ExtPict
+ 0x27b0: (0x27b0, 0x27b0, 14),  #  ExtPict
+ 0x27bf: (0x27bf, 0x27bf, 14),  #  ExtPict
+ 0x2934: (0x2934, 0x2935, 14),  #  ExtPict
+ 0x2b05: (0x2b05, 0x2b07, 14),  #  ExtPict
+ 0x2b1b: (0x2b1b, 0x2b1c, 14),  #  ExtPict
+ 0x2b50: (0x2b50, 0x2b50, 14),  #  ExtPict
+ 0x2b55: (0x2b55, 0x2b55, 14),  #  ExtPict
+ 0x2cef: (0x2cef, 0x2cf1, 4),  #  EX
+ 0x2d7f: (0x2d7f, 0x2d7f, 4),  #  EX
+ 0x2de0: (0x2de0, 0x2dff, 4),  #  EX
+ 0x302a: (0x302a, 0x302f, 4),  #  EX
+ 0x3030: (0x3030, 0x3030, 14),  #  ExtPict
+ 0x303d: (0x303d, 0x303d, 14),  #  ExtPict
+ 0x3099: (0x3099, 0x309a, 4),  #  EX
+ 0x3297: (0x3297, 0x3297, 14),  #  ExtPict
+ 0x3299: (0x3299, 0x3299, 14),  #  ExtPict
+ 0xa66f: (0xa66f, 0xa672, 4),  #  EX
+ 0xa674: (0xa674, 0xa67d, 4),  #  EX
+ 0xa69e: (0xa69e, 0xa69f, 4),  #  EX
+ 0xa6f0: (0xa6f0, 0xa6f1, 4),  #  EX
+ 0xa802: (0xa802, 0xa802, 4),  #  EX
+ 0xa806: (0xa806, 0xa806, 4),  #  EX
+ 0xa80b: (0xa80b, 0xa80b, 4),  #  EX
+ 0xa823: (0xa823, 0xa824, 8),  #  SM
+ 0xa825: (0xa825, 0xa826, 4),  #  EX
+ 0xa827: (0xa827, 0xa827, 8),  #  SM
+ 0xa880: (0xa880, 0xa881, 8),  #  SM
+ 0xa8b4: (0xa8b4, 0xa8c3, 8),  #  SM
+ 0xa8c4: (0xa8c4, 0xa8c5, 4),  #  EX
+ 0xa8e0: (0xa8e0, 0xa8f1, 4),  #  EX
+ 0xa8ff: (0xa8ff, 0xa8ff, 4),  #  EX
+ 0xa926: (0xa926, 0xa92d, 4),  #  EX
+ 0xa947: (0xa947, 0xa951, 4),  #  EX
+ 0xa952: (0xa952, 0xa953, 8),  #  SM
+ 0xa960: (0xa960, 0xa97c, 9),  #  L
+ 0xa980: (0xa980, 0xa982, 4),  #  EX
+ 0xa983: (0xa983, 0xa983, 8),  #  SM
+ 0xa9b3: (0xa9b3, 0xa9b3, 4),  #  EX
+ 0xa9b4: (0xa9b4, 0xa9b5, 8),  #  SM
+ 0xa9b6: (0xa9b6, 0xa9b9, 4),  #  EX
+ 0xa9ba: (0xa9ba, 0xa9bb, 8),  #  SM
+ 0xa9bc: (0xa9bc, 0xa9bc, 4),  #  EX
+ 0xa9bd: (0xa9bd, 0xa9c0, 8),  #  SM
+ 0xa9e5: (0xa9e5, 0xa9e5, 4),  #  EX
+ 0xaa29: (0xaa29, 0xaa2e, 4),  #  EX
+ 0xaa2f: (0xaa2f, 0xaa30, 8),  #  SM
+ 0xaa31: (0xaa31, 0xaa32, 4),  #  EX
+ 0xaa33: (0xaa33, 0xaa34, 8),  #  SM
+ 0xaa35: (0xaa35, 0xaa36, 4),  #  EX
+ 0xaa43: (0xaa43, 0xaa43, 4),  #  EX
+ 0xaa4c: (0xaa4c, 0xaa4c, 4),  #  EX
+ 0xaa4d: (0xaa4d, 0xaa4d, 8),  #  SM
+ 0xaa7c: (0xaa7c, 0xaa7c, 4),  #  EX
+ 0xaab0: (0xaab0, 0xaab0, 4),  #  EX
+ 0xaab2: (0xaab2, 0xaab4, 4),  #  EX
+ 0xaab7: (0xaab7, 0xaab8, 4),  #  EX
+ 0xaabe: (0xaabe, 0xaabf, 4),  #  EX
+ 0xaac1: (0xaac1, 0xaac1, 4),  #  EX
+ 0xaaeb: (0xaaeb, 0xaaeb, 8),  #  SM
+ 0xaaec: (0xaaec, 0xaaed, 4),  #  EX
+ 0xaaee: (0xaaee, 0xaaef, 8),  #  SM
+ 0xaaf5: (0xaaf5, 0xaaf5, 8),  #  SM
+ 0xaaf6: (0xaaf6, 0xaaf6, 4),  #  EX
+ 0xabe3: (0xabe3, 0xabe4, 8),  #  SM
+ 0xabe5: (0xabe5, 0xabe5, 4),  #  EX
+ 0xabe6: (0xabe6, 0xabe7, 8),  #  SM
+ 0xabe8: (0xabe8, 0xabe8, 4),  #  EX
+ 0xabe9: (0xabe9, 0xabea, 8),  #  SM
+ 0xabec: (0xabec, 0xabec, 8),  #  SM
+ 0xabed: (0xabed, 0xabed, 4),  #  EX
+ 0xac00: (0xac00, 0xac00, 12),  #  LV
+ 0xac01: (0xac01, 0xac1b, 13),  #  LVT
+ 0xac1c: (0xac1c, 0xac1c, 12),  #  LV
+ 0xac1d: (0xac1d, 0xac37, 13),  #  LVT
+ 0xac38: (0xac38, 0xac38, 12),  #  LV
+ 0xac39: (0xac39, 0xac53, 13),  #  LVT
+ 0xac54: (0xac54, 0xac54, 12),  #  LV
+ 0xac55: (0xac55, 0xac6f, 13),  #  LVT
+ 0xac70: (0xac70, 0xac70, 12),  #  LV
+ 0xac71: (0xac71, 0xac8b, 13),  #  LVT
+ 0xac8c: (0xac8c, 0xac8c, 12),  #  LV
+ 0xac8d: (0xac8d, 0xaca7, 13),  #  LVT
+ 0xaca8: (0xaca8, 0xaca8, 12),  #  LV
+ 0xaca9: (0xaca9, 0xacc3, 13),  #  LVT
+ 0xacc4: (0xacc4, 0xacc4, 12),  #  LV
+ 0xacc5: (0xacc5, 0xacdf, 13),  #  LVT
+ 0xace0: (0xace0, 0xace0, 12),  #  LV
+ 0xace1: (0xace1, 0xacfb, 13),  #  LVT
+ 0xacfc: (0xacfc, 0xacfc, 12),  #  LV
+ 0xacfd: (0xacfd, 0xad17, 13),  #  LVT
+ 0xad18: (0xad18, 0xad18, 12),  #  LV
+ 0xad19: (0xad19, 0xad33, 13),  #  LVT
+ 0xad34: (0xad34, 0xad34, 12),  #  LV
+ 0xad35: (0xad35, 0xad4f, 13),  #  LVT
+ 0xad50: (0xad50, 0xad50, 12),  #  LV
+ 0xad51: (0xad51, 0xad6b, 13),  #  LVT
+ 0xad6c: (0xad6c, 0xad6c, 12),  #  LV
+ 0xad6d: (0xad6d, 0xad87, 13),  #  LVT
+ 0xad88: (0xad88, 0xad88, 12),  #  LV
+ 0xad89: (0xad89, 0xada3, 13),  #  LVT
+ 0xada4: (0xada4, 0xada4, 12),  #  LV
+ 0xada5: (0xada5, 0xadbf, 13),  #  LVT
+ 0xadc0: (0xadc0, 0xadc0, 12),  #  LV
+ 0xadc1: (0xadc1, 0xaddb, 13),  #  LVT
+ 0xaddc: (0xaddc, 0xaddc, 12),  #  LV
+ 0xaddd: (0xaddd, 0xadf7, 13),  #  LVT
+ 0xadf8: (0xadf8, 0xadf8, 12),  #  LV
+ 0xadf9: (0xadf9, 0xae13, 13),  #  LVT
+ 0xae14: (0xae14, 0xae14, 12),  #  LV
+ 0xae15: (0xae15, 0xae2f, 13),  #  LVT
+ 0xae30: (0xae30, 0xae30, 12),  #  LV
+ 0xae31: (0xae31, 0xae4b, 13),  #  LVT
+ 0xae4c: (0xae4c, 0xae4c, 12),  #  LV
+ 0xae4d: (0xae4d, 0xae67, 13),  #  LVT
+ 0xae68: (0xae68, 0xae68, 12),  #  LV
+ 0xae69: (0xae69, 0xae83, 13),  #  LVT
+ 0xae84: (0xae84, 0xae84, 12),  #  LV
+ 0xae85: (0xae85, 0xae9f, 13),  #  LVT
+ 0xaea0: (0xaea0, 0xaea0, 12),  #  LV
+ 0xaea1: (0xaea1, 0xaebb, 13),  #  LVT
+ 0xaebc: (0xaebc, 0xaebc, 12),  #  LV
+ 0xaebd: (0xaebd, 0xaed7, 13),  #  LVT
+ 0xaed8: (0xaed8, 0xaed8, 12),  #  LV
+ 0xaed9: (0xaed9, 0xaef3, 13),  #  LVT
+ 0xaef4: (0xaef4, 0xaef4, 12),  #  LV
+ 0xaef5: (0xaef5, 0xaf0f, 13),  #  LVT
+ 0xaf10: (0xaf10, 0xaf10, 12),  #  LV
+ 0xaf11: (0xaf11, 0xaf2b, 13),  #  LVT
+ 0xaf2c: (0xaf2c, 0xaf2c, 12),  #  LV
+ 0xaf2d: (0xaf2d, 0xaf47, 13),  #  LVT
+ 0xaf48: (0xaf48, 0xaf48, 12),  #  LV
+ 0xaf49: (0xaf49, 0xaf63, 13),  #  LVT
+ 0xaf64: (0xaf64, 0xaf64, 12),  #  LV
+ 0xaf65: (0xaf65, 0xaf7f, 13),  #  LVT
+ 0xaf80: (0xaf80, 0xaf80, 12),  #  LV
+ 0xaf81: (0xaf81, 0xaf9b, 13),  #  LVT
+ 0xaf9c: (0xaf9c, 0xaf9c, 12),  #  LV
+ 0xaf9d: (0xaf9d, 0xafb7, 13),  #  LVT
+ 0xafb8: (0xafb8, 0xafb8, 12),  #  LV
+ 0xafb9: (0xafb9, 0xafd3, 13),  #  LVT
+ 0xafd4: (0xafd4, 0xafd4, 12),  #  LV
+ 0xafd5: (0xafd5, 0xafef, 13),  #  LVT
+ 0xaff0: (0xaff0, 0xaff0, 12),  #  LV
+ 0xaff1: (0xaff1, 0xb00b, 13),  #  LVT
+ 0xb00c: (0xb00c, 0xb00c, 12),  #  LV
+ 0xb00d: (0xb00d, 0xb027, 13),  #  LVT
+ 0xb028: (0xb028, 0xb028, 12),  #  LV
+ 0xb029: (0xb029, 0xb043, 13),  #  LVT
+ 0xb044: (0xb044, 0xb044, 12),  #  LV
+ 0xb045: (0xb045, 0xb05f, 13),  #  LVT
+ 0xb060: (0xb060, 0xb060, 12),  #  LV
+ 0xb061: (0xb061, 0xb07b, 13),  #  LVT
+ 0xb07c: (0xb07c, 0xb07c, 12),  #  LV
+ 0xb07d: (0xb07d, 0xb097, 13),  #  LVT
+ 0xb098: (0xb098, 0xb098, 12),  #  LV
+ 0xb099: (0xb099, 0xb0b3, 13),  #  LVT
+ 0xb0b4: (0xb0b4, 0xb0b4, 12),  #  LV
+ 0xb0b5: (0xb0b5, 0xb0cf, 13),  #  LVT
+ 0xb0d0: (0xb0d0, 0xb0d0, 12),  #  LV
+ 0xb0d1: (0xb0d1, 0xb0eb, 13),  #  LVT
+ 0xb0ec: (0xb0ec, 0xb0ec, 12),  #  LV
+ 0xb0ed: (0xb0ed, 0xb107, 13),  #  LVT
+ 0xb108: (0xb108, 0xb108, 12),  #  LV
+ 0xb109: (0xb109, 0xb123, 13),  #  LVT
+ 0xb124: (0xb124, 0xb124, 12),  #  LV
+ 0xb125: (0xb125, 0xb13f, 13),  #  LVT
+ 0xb140: (0xb140, 0xb140, 12),  #  LV
+ 0xb141: (0xb141, 0xb15b, 13),  #  LVT
+ 0xb15c: (0xb15c, 0xb15c, 12),  #  LV
+ 0xb15d: (0xb15d, 0xb177, 13),  #  LVT
+ 0xb178: (0xb178, 0xb178, 12),  #  LV
+ 0xb179: (0xb179, 0xb193, 13),  #  LVT
+ 0xb194: (0xb194, 0xb194, 12),  #  LV
+ 0xb195: (0xb195, 0xb1af, 13),  #  LVT
+ 0xb1b0: (0xb1b0, 0xb1b0, 12),  #  LV
+ 0xb1b1: (0xb1b1, 0xb1cb, 13),  #  LVT
+ 0xb1cc: (0xb1cc, 0xb1cc, 12),  #  LV
+ 0xb1cd: (0xb1cd, 0xb1e7, 13),  #  LVT
+ 0xb1e8: (0xb1e8, 0xb1e8, 12),  #  LV
+ 0xb1e9: (0xb1e9, 0xb203, 13),  #  LVT
+ 0xb204: (0xb204, 0xb204, 12),  #  LV
+ 0xb205: (0xb205, 0xb21f, 13),  #  LVT
+ 0xb220: (0xb220, 0xb220, 12),  #  LV
+ 0xb221: (0xb221, 0xb23b, 13),  #  LVT
+ 0xb23c: (0xb23c, 0xb23c, 12),  #  LV
+ 0xb23d: (0xb23d, 0xb257, 13),  #  LVT
+ 0xb258: (0xb258, 0xb258, 12),  #  LV
+ 0xb259: (0xb259, 0xb273, 13),  #  LVT
+ 0xb274: (0xb274, 0xb274, 12),  #  LV
+ 0xb275: (0xb275, 0xb28f, 13),  #  LVT
+ 0xb290: (0xb290, 0xb290, 12),  #  LV
+ 0xb291: (0xb291, 0xb2ab, 13),  #  LVT
+ 0xb2ac: (0xb2ac, 0xb2ac, 12),  #  LV
+ 0xb2ad: (0xb2ad, 0xb2c7, 13),  #  LVT
+ 0xb2c8: (0xb2c8, 0xb2c8, 12),  #  LV
+ 0xb2c9: (0xb2c9, 0xb2e3, 13),  #  LVT
+ 0xb2e4: (0xb2e4, 0xb2e4, 12),  #  LV
+ 0xb2e5: (0xb2e5, 0xb2ff, 13),  #  LVT
+ 0xb300: (0xb300, 0xb300, 12),  #  LV
+ 0xb301: (0xb301, 0xb31b, 13),  #  LVT
+ 0xb31c: (0xb31c, 0xb31c, 12),  #  LV
+ 0xb31d: (0xb31d, 0xb337, 13),  #  LVT
+ 0xb338: (0xb338, 0xb338, 12),  #  LV
+ 0xb339: (0xb339, 0xb353, 13),  #  LVT
+ 0xb354: (0xb354, 0xb354, 12),  #  LV
+ 0xb355: (0xb355, 0xb36f, 13),  #  LVT
+ 0xb370: (0xb370, 0xb370, 12),  #  LV
+ 0xb371: (0xb371, 0xb38b, 13),  #  LVT
+ 0xb38c: (0xb38c, 0xb38c, 12),  #  LV
+ 0xb38d: (0xb38d, 0xb3a7, 13),  #  LVT
+ 0xb3a8: (0xb3a8, 0xb3a8, 12),  #  LV
+ 0xb3a9: (0xb3a9, 0xb3c3, 13),  #  LVT
+ 0xb3c4: (0xb3c4, 0xb3c4, 12),  #  LV
+ 0xb3c5: (0xb3c5, 0xb3df, 13),  #  LVT
+ 0xb3e0: (0xb3e0, 0xb3e0, 12),  #  LV
+ 0xb3e1: (0xb3e1, 0xb3fb, 13),  #  LVT
+ 0xb3fc: (0xb3fc, 0xb3fc, 12),  #  LV
+ 0xb3fd: (0xb3fd, 0xb417, 13),  #  LVT
+ 0xb418: (0xb418, 0xb418, 12),  #  LV
+ 0xb419: (0xb419, 0xb433, 13),  #  LVT
+ 0xb434: (0xb434, 0xb434, 12),  #  LV
+ 0xb435: (0xb435, 0xb44f, 13),  #  LVT
+ 0xb450: (0xb450, 0xb450, 12),  #  LV
+ 0xb451: (0xb451, 0xb46b, 13),  #  LVT
+ 0xb46c: (0xb46c, 0xb46c, 12),  #  LV
+ 0xb46d: (0xb46d, 0xb487, 13),  #  LVT
+ 0xb488: (0xb488, 0xb488, 12),  #  LV
+ 0xb489: (0xb489, 0xb4a3, 13),  #  LVT
+ 0xb4a4: (0xb4a4, 0xb4a4, 12),  #  LV
+ 0xb4a5: (0xb4a5, 0xb4bf, 13),  #  LVT
+ 0xb4c0: (0xb4c0, 0xb4c0, 12),  #  LV
+ 0xb4c1: (0xb4c1, 0xb4db, 13),  #  LVT
+ 0xb4dc: (0xb4dc, 0xb4dc, 12),  #  LV
+ 0xb4dd: (0xb4dd, 0xb4f7, 13),  #  LVT
+ 0xb4f8: (0xb4f8, 0xb4f8, 12),  #  LV
+ 0xb4f9: (0xb4f9, 0xb513, 13),  #  LVT
+ 0xb514: (0xb514, 0xb514, 12),  #  LV
+ 0xb515: (0xb515, 0xb52f, 13),  #  LVT
+ 0xb530: (0xb530, 0xb530, 12),  #  LV
+ 0xb531: (0xb531, 0xb54b, 13),  #  LVT
+ 0xb54c: (0xb54c, 0xb54c, 12),  #  LV
+ 0xb54d: (0xb54d, 0xb567, 13),  #  LVT
+ 0xb568: (0xb568, 0xb568, 12),  #  LV
+ 0xb569: (0xb569, 0xb583, 13),  #  LVT
+ 0xb584: (0xb584, 0xb584, 12),  #  LV
+ 0xb585: (0xb585, 0xb59f, 13),  #  LVT
+ 0xb5a0: (0xb5a0, 0xb5a0, 12),  #  LV
+ 0xb5a1: (0xb5a1, 0xb5bb, 13),  #  LVT
+ 0xb5bc: (0xb5bc, 0xb5bc, 12),  #  LV
+ 0xb5bd: (0xb5bd, 0xb5d7, 13),  #  LVT
+ 0xb5d8: (0xb5d8, 0xb5d8, 12),  #  LV
+ 0xb5d9: (0xb5d9, 0xb5f3, 13),  #  LVT
+ 0xb5f4: (0xb5f4, 0xb5f4, 12),  #  LV
+ 0xb5f5: (0xb5f5, 0xb60f, 13),  #  LVT
+ 0xb610: (0xb610, 0xb610, 12),  #  LV
+ 0xb611: (0xb611, 0xb62b, 13),  #  LVT
+ 0xb62c: (0xb62c, 0xb62c, 12),  #  LV
+ 0xb62d: (0xb62d, 0xb647, 13),  #  LVT
+ 0xb648: (0xb648, 0xb648, 12),  #  LV
+ 0xb649: (0xb649, 0xb663, 13),  #  LVT
+ 0xb664: (0xb664, 0xb664, 12),  #  LV
+ 0xb665: (0xb665, 0xb67f, 13),  #  LVT
+ 0xb680: (0xb680, 0xb680, 12),  #  LV
+ 0xb681: (0xb681, 0xb69b, 13),  #  LVT
+ 0xb69c: (0xb69c, 0xb69c, 12),  #  LV
+ 0xb69d: (0xb69d, 0xb6b7, 13),  #  LVT
+ 0xb6b8: (0xb6b8, 0xb6b8, 12),  #  LV
+ 0xb6b9: (0xb6b9, 0xb6d3, 13),  #  LVT
+ 0xb6d4: (0xb6d4, 0xb6d4, 12),  #  LV
+ 0xb6d5: (0xb6d5, 0xb6ef, 13),  #  LVT
+ 0xb6f0: (0xb6f0, 0xb6f0, 12),  #  LV
+ 0xb6f1: (0xb6f1, 0xb70b, 13),  #  LVT
+ 0xb70c: (0xb70c, 0xb70c, 12),  #  LV
+ 0xb70d: (0xb70d, 0xb727, 13),  #  LVT
+ 0xb728: (0xb728, 0xb728, 12),  #  LV
+ 0xb729: (0xb729, 0xb743, 13),  #  LVT
+ 0xb744: (0xb744, 0xb744, 12),  #  LV
+ 0xb745: (0xb745, 0xb75f, 13),  #  LVT
+ 0xb760: (0xb760, 0xb760, 12),  #  LV
+ 0xb761: (0xb761, 0xb77b, 13),  #  LVT
+ 0xb77c: (0xb77c, 0xb77c, 12),  #  LV
+ 0xb77d: (0xb77d, 0xb797, 13),  #  LVT
+ 0xb798: (0xb798, 0xb798, 12),  #  LV
+ 0xb799: (0xb799, 0xb7b3, 13),  #  LVT
+ 0xb7b4: (0xb7b4, 0xb7b4, 12),  #  LV
+ 0xb7b5: (0xb7b5, 0xb7cf, 13),  #  LVT
+ 0xb7d0: (0xb7d0, 0xb7d0, 12),  #  LV
+ 0xb7d1: (0xb7d1, 0xb7eb, 13),  #  LVT
+ 0xb7ec: (0xb7ec, 0xb7ec, 12),  #  LV
+ 0xb7ed: (0xb7ed, 0xb807, 13),  #  LVT
+ 0xb808: (0xb808, 0xb808, 12),  #  LV
+ 0xb809: (0xb809, 0xb823, 13),  #  LVT
+ 0xb824: (0xb824, 0xb824, 12),  #  LV
+ 0xb825: (0xb825, 0xb83f, 13),  #  LVT
+ 0xb840: (0xb840, 0xb840, 12),  #  LV
+ 0xb841: (0xb841, 0xb85b, 13),  #  LVT
+ 0xb85c: (0xb85c, 0xb85c, 12),  #  LV
+ 0xb85d: (0xb85d, 0xb877, 13),  #  LVT
+ 0xb878: (0xb878, 0xb878, 12),  #  LV
+ 0xb879: (0xb879, 0xb893, 13),  #  LVT
+ 0xb894: (0xb894, 0xb894, 12),  #  LV
+ 0xb895: (0xb895, 0xb8af, 13),  #  LVT
+ 0xb8b0: (0xb8b0, 0xb8b0, 12),  #  LV
+ 0xb8b1: (0xb8b1, 0xb8cb, 13),  #  LVT
+ 0xb8cc: (0xb8cc, 0xb8cc, 12),  #  LV
+ 0xb8cd: (0xb8cd, 0xb8e7, 13),  #  LVT
+ 0xb8e8: (0xb8e8, 0xb8e8, 12),  #  LV
+ 0xb8e9: (0xb8e9, 0xb903, 13),  #  LVT
+ 0xb904: (0xb904, 0xb904, 12),  #  LV
+ 0xb905: (0xb905, 0xb91f, 13),  #  LVT
+ 0xb920: (0xb920, 0xb920, 12),  #  LV
+ 0xb921: (0xb921, 0xb93b, 13),  #  LVT
+ 0xb93c: (0xb93c, 0xb93c, 12),  #  LV
+ 0xb93d: (0xb93d, 0xb957, 13),  #  LVT
+ 0xb958: (0xb958, 0xb958, 12),  #  LV
+ 0xb959: (0xb959, 0xb973, 13),  #  LVT
+ 0xb974: (0xb974, 0xb974, 12),  #  LV
+ 0xb975: (0xb975, 0xb98f, 13),  #  LVT
+ 0xb990: (0xb990, 0xb990, 12),  #  LV
+ 0xb991: (0xb991, 0xb9ab, 13),  #  LVT
+ 0xb9ac: (0xb9ac, 0xb9ac, 12),  #  LV
+ 0xb9ad: (0xb9ad, 0xb9c7, 13),  #  LVT
+ 0xb9c8: (0xb9c8, 0xb9c8, 12),  #  LV
+ 0xb9c9: (0xb9c9, 0xb9e3, 13),  #  LVT
+ 0xb9e4: (0xb9e4, 0xb9e4, 12),  #  LV
+ 0xb9e5: (0xb9e5, 0xb9ff, 13),  #  LVT
+ 0xba00: (0xba00, 0xba00, 12),  #  LV
+ 0xba01: (0xba01, 0xba1b, 13),  #  LVT
+ 0xba1c: (0xba1c, 0xba1c, 12),  #  LV
+ 0xba1d: (0xba1d, 0xba37, 13),  #  LVT
+ 0xba38: (0xba38, 0xba38, 12),  #  LV
+ 0xba39: (0xba39, 0xba53, 13),  #  LVT
+ 0xba54: (0xba54, 0xba54, 12),  #  LV
+ 0xba55: (0xba55, 0xba6f, 13),  #  LVT
+ 0xba70: (0xba70, 0xba70, 12),  #  LV
+ 0xba71: (0xba71, 0xba8b, 13),  #  LVT
+ 0xba8c: (0xba8c, 0xba8c, 12),  #  LV
+ 0xba8d: (0xba8d, 0xbaa7, 13),  #  LVT
+ 0xbaa8: (0xbaa8, 0xbaa8, 12),  #  LV
+ 0xbaa9: (0xbaa9, 0xbac3, 13),  #  LVT
+ 0xbac4: (0xbac4, 0xbac4, 12),  #  LV
+ 0xbac5: (0xbac5, 0xbadf, 13),  #  LVT
+ 0xbae0: (0xbae0, 0xbae0, 12),  #  LV
+ 0xbae1: (0xbae1, 0xbafb, 13),  #  LVT
+ 0xbafc: (0xbafc, 0xbafc, 12),  #  LV
+ 0xbafd: (0xbafd, 0xbb17, 13),  #  LVT
+ 0xbb18: (0xbb18, 0xbb18, 12),  #  LV
+ 0xbb19: (0xbb19, 0xbb33, 13),  #  LVT
+ 0xbb34: (0xbb34, 0xbb34, 12),  #  LV
+ 0xbb35: (0xbb35, 0xbb4f, 13),  #  LVT
+ 0xbb50: (0xbb50, 0xbb50, 12),  #  LV
+ 0xbb51: (0xbb51, 0xbb6b, 13),  #  LVT
+ 0xbb6c: (0xbb6c, 0xbb6c, 12),  #  LV
+ 0xbb6d: (0xbb6d, 0xbb87, 13),  #  LVT
+ 0xbb88: (0xbb88, 0xbb88, 12),  #  LV
+ 0xbb89: (0xbb89, 0xbba3, 13),  #  LVT
+ 0xbba4: (0xbba4, 0xbba4, 12),  #  LV
+ 0xbba5: (0xbba5, 0xbbbf, 13),  #  LVT
+ 0xbbc0: (0xbbc0, 0xbbc0, 12),  #  LV
+ 0xbbc1: (0xbbc1, 0xbbdb, 13),  #  LVT
+ 0xbbdc: (0xbbdc, 0xbbdc, 12),  #  LV
+ 0xbbdd: (0xbbdd, 0xbbf7, 13),  #  LVT
+ 0xbbf8: (0xbbf8, 0xbbf8, 12),  #  LV
+ 0xbbf9: (0xbbf9, 0xbc13, 13),  #  LVT
+ 0xbc14: (0xbc14, 0xbc14, 12),  #  LV
+ 0xbc15: (0xbc15, 0xbc2f, 13),  #  LVT
+ 0xbc30: (0xbc30, 0xbc30, 12),  #  LV
+ 0xbc31: (0xbc31, 0xbc4b, 13),  #  LVT
+ 0xbc4c: (0xbc4c, 0xbc4c, 12),  #  LV
+ 0xbc4d: (0xbc4d, 0xbc67, 13),  #  LVT
+ 0xbc68: (0xbc68, 0xbc68, 12),  #  LV
+ 0xbc69: (0xbc69, 0xbc83, 13),  #  LVT
+ 0xbc84: (0xbc84, 0xbc84, 12),  #  LV
+ 0xbc85: (0xbc85, 0xbc9f, 13),  #  LVT
+ 0xbca0: (0xbca0, 0xbca0, 12),  #  LV
+ 0xbca1: (0xbca1, 0xbcbb, 13),  #  LVT
+ 0xbcbc: (0xbcbc, 0xbcbc, 12),  #  LV
+ 0xbcbd: (0xbcbd, 0xbcd7, 13),  #  LVT
+ 0xbcd8: (0xbcd8, 0xbcd8, 12),  #  LV
+ 0xbcd9: (0xbcd9, 0xbcf3, 13),  #  LVT
+ 0xbcf4: (0xbcf4, 0xbcf4, 12),  #  LV
+ 0xbcf5: (0xbcf5, 0xbd0f, 13),  #  LVT
+ 0xbd10: (0xbd10, 0xbd10, 12),  #  LV
+ 0xbd11: (0xbd11, 0xbd2b, 13),  #  LVT
+ 0xbd2c: (0xbd2c, 0xbd2c, 12),  #  LV
+ 0xbd2d: (0xbd2d, 0xbd47, 13),  #  LVT
+ 0xbd48: (0xbd48, 0xbd48, 12),  #  LV
+ 0xbd49: (0xbd49, 0xbd63, 13),  #  LVT
+ 0xbd64: (0xbd64, 0xbd64, 12),  #  LV
+ 0xbd65: (0xbd65, 0xbd7f, 13),  #  LVT
+ 0xbd80: (0xbd80, 0xbd80, 12),  #  LV
+ 0xbd81: (0xbd81, 0xbd9b, 13),  #  LVT
+ 0xbd9c: (0xbd9c, 0xbd9c, 12),  #  LV
+ 0xbd9d: (0xbd9d, 0xbdb7, 13),  #  LVT
+ 0xbdb8: (0xbdb8, 0xbdb8, 12),  #  LV
+ 0xbdb9: (0xbdb9, 0xbdd3, 13),  #  LVT
+ 0xbdd4: (0xbdd4, 0xbdd4, 12),  #  LV
+ 0xbdd5: (0xbdd5, 0xbdef, 13),  #  LVT
+ 0xbdf0: (0xbdf0, 0xbdf0, 12),  #  LV
+ 0xbdf1: (0xbdf1, 0xbe0b, 13),  #  LVT
+ 0xbe0c: (0xbe0c, 0xbe0c, 12),  #  LV
+ 0xbe0d: (0xbe0d, 0xbe27, 13),  #  LVT
+ 0xbe28: (0xbe28, 0xbe28, 12),  #  LV
+ 0xbe29: (0xbe29, 0xbe43, 13),  #  LVT
+ 0xbe44: (0xbe44, 0xbe44, 12),  #  LV
+ 0xbe45: (0xbe45, 0xbe5f, 13),  #  LVT
+ 0xbe60: (0xbe60, 0xbe60, 12),  #  LV
+ 0xbe61: (0xbe61, 0xbe7b, 13),  #  LVT
+ 0xbe7c: (0xbe7c, 0xbe7c, 12),  #  LV
+ 0xbe7d: (0xbe7d, 0xbe97, 13),  #  LVT
+ 0xbe98: (0xbe98, 0xbe98, 12),  #  LV
+ 0xbe99: (0xbe99, 0xbeb3, 13),  #  LVT
+ 0xbeb4: (0xbeb4, 0xbeb4, 12),  #  LV
+ 0xbeb5: (0xbeb5, 0xbecf, 13),  #  LVT
+ 0xbed0: (0xbed0, 0xbed0, 12),  #  LV
+ 0xbed1: (0xbed1, 0xbeeb, 13),  #  LVT
+ 0xbeec: (0xbeec, 0xbeec, 12),  #  LV
+ 0xbeed: (0xbeed, 0xbf07, 13),  #  LVT
+ 0xbf08: (0xbf08, 0xbf08, 12),  #  LV
+ 0xbf09: (0xbf09, 0xbf23, 13),  #  LVT
+ 0xbf24: (0xbf24, 0xbf24, 12),  #  LV
+ 0xbf25: (0xbf25, 0xbf3f, 13),  #  LVT
+ 0xbf40: (0xbf40, 0xbf40, 12),  #  LV
+ 0xbf41: (0xbf41, 0xbf5b, 13),  #  LVT
+ 0xbf5c: (0xbf5c, 0xbf5c, 12),  #  LV
+ 0xbf5d: (0xbf5d, 0xbf77, 13),  #  LVT
+ 0xbf78: (0xbf78, 0xbf78, 12),  #  LV
+ 0xbf79: (0xbf79, 0xbf93, 13),  #  LVT
+ 0xbf94: (0xbf94, 0xbf94, 12),  #  LV
+ 0xbf95: (0xbf95, 0xbfaf, 13),  #  LVT
+ 0xbfb0: (0xbfb0, 0xbfb0, 12),  #  LV
+ 0xbfb1: (0xbfb1, 0xbfcb, 13),  #  LVT
+ 0xbfcc: (0xbfcc, 0xbfcc, 12),  #  LV
+ 0xbfcd: (0xbfcd, 0xbfe7, 13),  #  LVT
+ 0xbfe8: (0xbfe8, 0xbfe8, 12),  #  LV
+ 0xbfe9: (0xbfe9, 0xc003, 13),  #  LVT
+ 0xc004: (0xc004, 0xc004, 12),  #  LV
+ 0xc005: (0xc005, 0xc01f, 13),  #  LVT
+ 0xc020: (0xc020, 0xc020, 12),  #  LV
+ 0xc021: (0xc021, 0xc03b, 13),  #  LVT
+ 0xc03c: (0xc03c, 0xc03c, 12),  #  LV
+ 0xc03d: (0xc03d, 0xc057, 13),  #  LVT
+ 0xc058: (0xc058, 0xc058, 12),  #  LV
+ 0xc059: (0xc059, 0xc073, 13),  #  LVT
+ 0xc074: (0xc074, 0xc074, 12),  #  LV
+ 0xc075: (0xc075, 0xc08f, 13),  #  LVT
+ 0xc090: (0xc090, 0xc090, 12),  #  LV
+ 0xc091: (0xc091, 0xc0ab, 13),  #  LVT
+ 0xc0ac: (0xc0ac, 0xc0ac, 12),  #  LV
+ 0xc0ad: (0xc0ad, 0xc0c7, 13),  #  LVT
+ 0xc0c8: (0xc0c8, 0xc0c8, 12),  #  LV
+ 0xc0c9: (0xc0c9, 0xc0e3, 13),  #  LVT
+ 0xc0e4: (0xc0e4, 0xc0e4, 12),  #  LV
+ 0xc0e5: (0xc0e5, 0xc0ff, 13),  #  LVT
+ 0xc100: (0xc100, 0xc100, 12),  #  LV
+ 0xc101: (0xc101, 0xc11b, 13),  #  LVT
+ 0xc11c: (0xc11c, 0xc11c, 12),  #  LV
+ 0xc11d: (0xc11d, 0xc137, 13),  #  LVT
+ 0xc138: (0xc138, 0xc138, 12),  #  LV
+ 0xc139: (0xc139, 0xc153, 13),  #  LVT
+ 0xc154: (0xc154, 0xc154, 12),  #  LV
+ 0xc155: (0xc155, 0xc16f, 13),  #  LVT
+ 0xc170: (0xc170, 0xc170, 12),  #  LV
+ 0xc171: (0xc171, 0xc18b, 13),  #  LVT
+ 0xc18c: (0xc18c, 0xc18c, 12),  #  LV
+ 0xc18d: (0xc18d, 0xc1a7, 13),  #  LVT
+ 0xc1a8: (0xc1a8, 0xc1a8, 12),  #  LV
+ 0xc1a9: (0xc1a9, 0xc1c3, 13),  #  LVT
+ 0xc1c4: (0xc1c4, 0xc1c4, 12),  #  LV
+ 0xc1c5: (0xc1c5, 0xc1df, 13),  #  LVT
+ 0xc1e0: (0xc1e0, 0xc1e0, 12),  #  LV
+ 0xc1e1: (0xc1e1, 0xc1fb, 13),  #  LVT
+ 0xc1fc: (0xc1fc, 0xc1fc, 12),  #  LV
+ 0xc1fd: (0xc1fd, 0xc217, 13),  #  LVT
+ 0xc218: (0xc218, 0xc218, 12),  #  LV
+ 0xc219: (0xc219, 0xc233, 13),  #  LVT
+ 0xc234: (0xc234, 0xc234, 12),  #  LV
+ 0xc235: (0xc235, 0xc24f, 13),  #  LVT
+ 0xc250: (0xc250, 0xc250, 12),  #  LV
+ 0xc251: (0xc251, 0xc26b, 13),  #  LVT
+ 0xc26c: (0xc26c, 0xc26c, 12),  #  LV
+ 0xc26d: (0xc26d, 0xc287, 13),  #  LVT
+ 0xc288: (0xc288, 0xc288, 12),  #  LV
+ 0xc289: (0xc289, 0xc2a3, 13),  #  LVT
+ 0xc2a4: (0xc2a4, 0xc2a4, 12),  #  LV
+ 0xc2a5: (0xc2a5, 0xc2bf, 13),  #  LVT
+ 0xc2c0: (0xc2c0, 0xc2c0, 12),  #  LV
+ 0xc2c1: (0xc2c1, 0xc2db, 13),  #  LVT
+ 0xc2dc: (0xc2dc, 0xc2dc, 12),  #  LV
+ 0xc2dd: (0xc2dd, 0xc2f7, 13),  #  LVT
+ 0xc2f8: (0xc2f8, 0xc2f8, 12),  #  LV
+ 0xc2f9: (0xc2f9, 0xc313, 13),  #  LVT
+ 0xc314: (0xc314, 0xc314, 12),  #  LV
+ 0xc315: (0xc315, 0xc32f, 13),  #  LVT
+ 0xc330: (0xc330, 0xc330, 12),  #  LV
+ 0xc331: (0xc331, 0xc34b, 13),  #  LVT
+ 0xc34c: (0xc34c, 0xc34c, 12),  #  LV
+ 0xc34d: (0xc34d, 0xc367, 13),  #  LVT
+ 0xc368: (0xc368, 0xc368, 12),  #  LV
+ 0xc369: (0xc369, 0xc383, 13),  #  LVT
+ 0xc384: (0xc384, 0xc384, 12),  #  LV
+ 0xc385: (0xc385, 0xc39f, 13),  #  LVT
+ 0xc3a0: (0xc3a0, 0xc3a0, 12),  #  LV
+ 0xc3a1: (0xc3a1, 0xc3bb, 13),  #  LVT
+ 0xc3bc: (0xc3bc, 0xc3bc, 12),  #  LV
+ 0xc3bd: (0xc3bd, 0xc3d7, 13),  #  LVT
+ 0xc3d8: (0xc3d8, 0xc3d8, 12),  #  LV
+ 0xc3d9: (0xc3d9, 0xc3f3, 13),  #  LVT
+ 0xc3f4: (0xc3f4, 0xc3f4, 12),  #  LV
+ 0xc3f5: (0xc3f5, 0xc40f, 13),  #  LVT
+ 0xc410: (0xc410, 0xc410, 12),  #  LV
+ 0xc411: (0xc411, 0xc42b, 13),  #  LVT
+ 0xc42c: (0xc42c, 0xc42c, 12),  #  LV
+ 0xc42d: (0xc42d, 0xc447, 13),  #  LVT
+ 0xc448: (0xc448, 0xc448, 12),  #  LV
+ 0xc449: (0xc449, 0xc463, 13),  #  LVT
+ 0xc464: (0xc464, 0xc464, 12),  #  LV
+ 0xc465: (0xc465, 0xc47f, 13),  #  LVT
+ 0xc480: (0xc480, 0xc480, 12),  #  LV
+ 0xc481: (0xc481, 0xc49b, 13),  #  LVT
+ 0xc49c: (0xc49c, 0xc49c, 12),  #  LV
+ 0xc49d: (0xc49d, 0xc4b7, 13),  #  LVT
+ 0xc4b8: (0xc4b8, 0xc4b8, 12),  #  LV
+ 0xc4b9: (0xc4b9, 0xc4d3, 13),  #  LVT
+ 0xc4d4: (0xc4d4, 0xc4d4, 12),  #  LV
+ 0xc4d5: (0xc4d5, 0xc4ef, 13),  #  LVT
+ 0xc4f0: (0xc4f0, 0xc4f0, 12),  #  LV
+ 0xc4f1: (0xc4f1, 0xc50b, 13),  #  LVT
+ 0xc50c: (0xc50c, 0xc50c, 12),  #  LV
+ 0xc50d: (0xc50d, 0xc527, 13),  #  LVT
+ 0xc528: (0xc528, 0xc528, 12),  #  LV
+ 0xc529: (0xc529, 0xc543, 13),  #  LVT
+ 0xc544: (0xc544, 0xc544, 12),  #  LV
+ 0xc545: (0xc545, 0xc55f, 13),  #  LVT
+ 0xc560: (0xc560, 0xc560, 12),  #  LV
+ 0xc561: (0xc561, 0xc57b, 13),  #  LVT
+ 0xc57c: (0xc57c, 0xc57c, 12),  #  LV
+ 0xc57d: (0xc57d, 0xc597, 13),  #  LVT
+ 0xc598: (0xc598, 0xc598, 12),  #  LV
+ 0xc599: (0xc599, 0xc5b3, 13),  #  LVT
+ 0xc5b4: (0xc5b4, 0xc5b4, 12),  #  LV
+ 0xc5b5: (0xc5b5, 0xc5cf, 13),  #  LVT
+ 0xc5d0: (0xc5d0, 0xc5d0, 12),  #  LV
+ 0xc5d1: (0xc5d1, 0xc5eb, 13),  #  LVT
+ 0xc5ec: (0xc5ec, 0xc5ec, 12),  #  LV
+ 0xc5ed: (0xc5ed, 0xc607, 13),  #  LVT
+ 0xc608: (0xc608, 0xc608, 12),  #  LV
+ 0xc609: (0xc609, 0xc623, 13),  #  LVT
+ 0xc624: (0xc624, 0xc624, 12),  #  LV
+ 0xc625: (0xc625, 0xc63f, 13),  #  LVT
+ 0xc640: (0xc640, 0xc640, 12),  #  LV
+ 0xc641: (0xc641, 0xc65b, 13),  #  LVT
+ 0xc65c: (0xc65c, 0xc65c, 12),  #  LV
+ 0xc65d: (0xc65d, 0xc677, 13),  #  LVT
+ 0xc678: (0xc678, 0xc678, 12),  #  LV
+ 0xc679: (0xc679, 0xc693, 13),  #  LVT
+ 0xc694: (0xc694, 0xc694, 12),  #  LV
+ 0xc695: (0xc695, 0xc6af, 13),  #  LVT
+ 0xc6b0: (0xc6b0, 0xc6b0, 12),  #  LV
+ 0xc6b1: (0xc6b1, 0xc6cb, 13),  #  LVT
+ 0xc6cc: (0xc6cc, 0xc6cc, 12),  #  LV
+ 0xc6cd: (0xc6cd, 0xc6e7, 13),  #  LVT
+ 0xc6e8: (0xc6e8, 0xc6e8, 12),  #  LV
+ 0xc6e9: (0xc6e9, 0xc703, 13),  #  LVT
+ 0xc704: (0xc704, 0xc704, 12),  #  LV
+ 0xc705: (0xc705, 0xc71f, 13),  #  LVT
+ 0xc720: (0xc720, 0xc720, 12),  #  LV
+ 0xc721: (0xc721, 0xc73b, 13),  #  LVT
+ 0xc73c: (0xc73c, 0xc73c, 12),  #  LV
+ 0xc73d: (0xc73d, 0xc757, 13),  #  LVT
+ 0xc758: (0xc758, 0xc758, 12),  #  LV
+ 0xc759: (0xc759, 0xc773, 13),  #  LVT
+ 0xc774: (0xc774, 0xc774, 12),  #  LV
+ 0xc775: (0xc775, 0xc78f, 13),  #  LVT
+ 0xc790: (0xc790, 0xc790, 12),  #  LV
+ 0xc791: (0xc791, 0xc7ab, 13),  #  LVT
+ 0xc7ac: (0xc7ac, 0xc7ac, 12),  #  LV
+ 0xc7ad: (0xc7ad, 0xc7c7, 13),  #  LVT
+ 0xc7c8: (0xc7c8, 0xc7c8, 12),  #  LV
+ 0xc7c9: (0xc7c9, 0xc7e3, 13),  #  LVT
+ 0xc7e4: (0xc7e4, 0xc7e4, 12),  #  LV
+ 0xc7e5: (0xc7e5, 0xc7ff, 13),  #  LVT
+ 0xc800: (0xc800, 0xc800, 12),  #  LV
+ 0xc801: (0xc801, 0xc81b, 13),  #  LVT
+ 0xc81c: (0xc81c, 0xc81c, 12),  #  LV
+ 0xc81d: (0xc81d, 0xc837, 13),  #  LVT
+ 0xc838: (0xc838, 0xc838, 12),  #  LV
+ 0xc839: (0xc839, 0xc853, 13),  #  LVT
+ 0xc854: (0xc854, 0xc854, 12),  #  LV
+ 0xc855: (0xc855, 0xc86f, 13),  #  LVT
+ 0xc870: (0xc870, 0xc870, 12),  #  LV
+ 0xc871: (0xc871, 0xc88b, 13),  #  LVT
+ 0xc88c: (0xc88c, 0xc88c, 12),  #  LV
+ 0xc88d: (0xc88d, 0xc8a7, 13),  #  LVT
+ 0xc8a8: (0xc8a8, 0xc8a8, 12),  #  LV
+ 0xc8a9: (0xc8a9, 0xc8c3, 13),  #  LVT
+ 0xc8c4: (0xc8c4, 0xc8c4, 12),  #  LV
+ 0xc8c5: (0xc8c5, 0xc8df, 13),  #  LVT
+ 0xc8e0: (0xc8e0, 0xc8e0, 12),  #  LV
+ 0xc8e1: (0xc8e1, 0xc8fb, 13),  #  LVT
+ 0xc8fc: (0xc8fc, 0xc8fc, 12),  #  LV
+ 0xc8fd: (0xc8fd, 0xc917, 13),  #  LVT
+ 0xc918: (0xc918, 0xc918, 12),  #  LV
+ 0xc919: (0xc919, 0xc933, 13),  #  LVT
+ 0xc934: (0xc934, 0xc934, 12),  #  LV
+ 0xc935: (0xc935, 0xc94f, 13),  #  LVT
+ 0xc950: (0xc950, 0xc950, 12),  #  LV
+ 0xc951: (0xc951, 0xc96b, 13),  #  LVT
+ 0xc96c: (0xc96c, 0xc96c, 12),  #  LV
+ 0xc96d: (0xc96d, 0xc987, 13),  #  LVT
+ 0xc988: (0xc988, 0xc988, 12),  #  LV
+ 0xc989: (0xc989, 0xc9a3, 13),  #  LVT
+ 0xc9a4: (0xc9a4, 0xc9a4, 12),  #  LV
+ 0xc9a5: (0xc9a5, 0xc9bf, 13),  #  LVT
+ 0xc9c0: (0xc9c0, 0xc9c0, 12),  #  LV
+ 0xc9c1: (0xc9c1, 0xc9db, 13),  #  LVT
+ 0xc9dc: (0xc9dc, 0xc9dc, 12),  #  LV
+ 0xc9dd: (0xc9dd, 0xc9f7, 13),  #  LVT
+ 0xc9f8: (0xc9f8, 0xc9f8, 12),  #  LV
+ 0xc9f9: (0xc9f9, 0xca13, 13),  #  LVT
+ 0xca14: (0xca14, 0xca14, 12),  #  LV
+ 0xca15: (0xca15, 0xca2f, 13),  #  LVT
+ 0xca30: (0xca30, 0xca30, 12),  #  LV
+ 0xca31: (0xca31, 0xca4b, 13),  #  LVT
+ 0xca4c: (0xca4c, 0xca4c, 12),  #  LV
+ 0xca4d: (0xca4d, 0xca67, 13),  #  LVT
+ 0xca68: (0xca68, 0xca68, 12),  #  LV
+ 0xca69: (0xca69, 0xca83, 13),  #  LVT
+ 0xca84: (0xca84, 0xca84, 12),  #  LV
+ 0xca85: (0xca85, 0xca9f, 13),  #  LVT
+ 0xcaa0: (0xcaa0, 0xcaa0, 12),  #  LV
+ 0xcaa1: (0xcaa1, 0xcabb, 13),  #  LVT
+ 0xcabc: (0xcabc, 0xcabc, 12),  #  LV
+ 0xcabd: (0xcabd, 0xcad7, 13),  #  LVT
+ 0xcad8: (0xcad8, 0xcad8, 12),  #  LV
+ 0xcad9: (0xcad9, 0xcaf3, 13),  #  LVT
+ 0xcaf4: (0xcaf4, 0xcaf4, 12),  #  LV
+ 0xcaf5: (0xcaf5, 0xcb0f, 13),  #  LVT
+ 0xcb10: (0xcb10, 0xcb10, 12),  #  LV
+ 0xcb11: (0xcb11, 0xcb2b, 13),  #  LVT
+ 0xcb2c: (0xcb2c, 0xcb2c, 12),  #  LV
+ 0xcb2d: (0xcb2d, 0xcb47, 13),  #  LVT
+ 0xcb48: (0xcb48, 0xcb48, 12),  #  LV
+ 0xcb49: (0xcb49, 0xcb63, 13),  #  LVT
+ 0xcb64: (0xcb64, 0xcb64, 12),  #  LV
+ 0xcb65: (0xcb65, 0xcb7f, 13),  #  LVT
+ 0xcb80: (0xcb80, 0xcb80, 12),  #  LV
+ 0xcb81: (0xcb81, 0xcb9b, 13),  #  LVT
+ 0xcb9c: (0xcb9c, 0xcb9c, 12),  #  LV
+ 0xcb9d: (0xcb9d, 0xcbb7, 13),  #  LVT
+ 0xcbb8: (0xcbb8, 0xcbb8, 12),  #  LV
+ 0xcbb9: (0xcbb9, 0xcbd3, 13),  #  LVT
+ 0xcbd4: (0xcbd4, 0xcbd4, 12),  #  LV
+ 0xcbd5: (0xcbd5, 0xcbef, 13),  #  LVT
+ 0xcbf0: (0xcbf0, 0xcbf0, 12),  #  LV
+ 0xcbf1: (0xcbf1, 0xcc0b, 13),  #  LVT
+ 0xcc0c: (0xcc0c, 0xcc0c, 12),  #  LV
+ 0xcc0d: (0xcc0d, 0xcc27, 13),  #  LVT
+ 0xcc28: (0xcc28, 0xcc28, 12),  #  LV
+ 0xcc29: (0xcc29, 0xcc43, 13),  #  LVT
+ 0xcc44: (0xcc44, 0xcc44, 12),  #  LV
+ 0xcc45: (0xcc45, 0xcc5f, 13),  #  LVT
+ 0xcc60: (0xcc60, 0xcc60, 12),  #  LV
+ 0xcc61: (0xcc61, 0xcc7b, 13),  #  LVT
+ 0xcc7c: (0xcc7c, 0xcc7c, 12),  #  LV
+ 0xcc7d: (0xcc7d, 0xcc97, 13),  #  LVT
+ 0xcc98: (0xcc98, 0xcc98, 12),  #  LV
+ 0xcc99: (0xcc99, 0xccb3, 13),  #  LVT
+ 0xccb4: (0xccb4, 0xccb4, 12),  #  LV
+ 0xccb5: (0xccb5, 0xcccf, 13),  #  LVT
+ 0xccd0: (0xccd0, 0xccd0, 12),  #  LV
+ 0xccd1: (0xccd1, 0xcceb, 13),  #  LVT
+ 0xccec: (0xccec, 0xccec, 12),  #  LV
+ 0xcced: (0xcced, 0xcd07, 13),  #  LVT
+ 0xcd08: (0xcd08, 0xcd08, 12),  #  LV
+ 0xcd09: (0xcd09, 0xcd23, 13),  #  LVT
+ 0xcd24: (0xcd24, 0xcd24, 12),  #  LV
+ 0xcd25: (0xcd25, 0xcd3f, 13),  #  LVT
+ 0xcd40: (0xcd40, 0xcd40, 12),  #  LV
+ 0xcd41: (0xcd41, 0xcd5b, 13),  #  LVT
+ 0xcd5c: (0xcd5c, 0xcd5c, 12),  #  LV
+ 0xcd5d: (0xcd5d, 0xcd77, 13),  #  LVT
+ 0xcd78: (0xcd78, 0xcd78, 12),  #  LV
+ 0xcd79: (0xcd79, 0xcd93, 13),  #  LVT
+ 0xcd94: (0xcd94, 0xcd94, 12),  #  LV
+ 0xcd95: (0xcd95, 0xcdaf, 13),  #  LVT
+ 0xcdb0: (0xcdb0, 0xcdb0, 12),  #  LV
+ 0xcdb1: (0xcdb1, 0xcdcb, 13),  #  LVT
+ 0xcdcc: (0xcdcc, 0xcdcc, 12),  #  LV
+ 0xcdcd: (0xcdcd, 0xcde7, 13),  #  LVT
+ 0xcde8: (0xcde8, 0xcde8, 12),  #  LV
+ 0xcde9: (0xcde9, 0xce03, 13),  #  LVT
+ 0xce04: (0xce04, 0xce04, 12),  #  LV
+ 0xce05: (0xce05, 0xce1f, 13),  #  LVT
+ 0xce20: (0xce20, 0xce20, 12),  #  LV
+ 0xce21: (0xce21, 0xce3b, 13),  #  LVT
+ 0xce3c: (0xce3c, 0xce3c, 12),  #  LV
+ 0xce3d: (0xce3d, 0xce57, 13),  #  LVT
+ 0xce58: (0xce58, 0xce58, 12),  #  LV
+ 0xce59: (0xce59, 0xce73, 13),  #  LVT
+ 0xce74: (0xce74, 0xce74, 12),  #  LV
+ 0xce75: (0xce75, 0xce8f, 13),  #  LVT
+ 0xce90: (0xce90, 0xce90, 12),  #  LV
+ 0xce91: (0xce91, 0xceab, 13),  #  LVT
+ 0xceac: (0xceac, 0xceac, 12),  #  LV
+ 0xcead: (0xcead, 0xcec7, 13),  #  LVT
+ 0xcec8: (0xcec8, 0xcec8, 12),  #  LV
+ 0xcec9: (0xcec9, 0xcee3, 13),  #  LVT
+ 0xcee4: (0xcee4, 0xcee4, 12),  #  LV
+ 0xcee5: (0xcee5, 0xceff, 13),  #  LVT
+ 0xcf00: (0xcf00, 0xcf00, 12),  #  LV
+ 0xcf01: (0xcf01, 0xcf1b, 13),  #  LVT
+ 0xcf1c: (0xcf1c, 0xcf1c, 12),  #  LV
+ 0xcf1d: (0xcf1d, 0xcf37, 13),  #  LVT
+ 0xcf38: (0xcf38, 0xcf38, 12),  #  LV
+ 0xcf39: (0xcf39, 0xcf53, 13),  #  LVT
+ 0xcf54: (0xcf54, 0xcf54, 12),  #  LV
+ 0xcf55: (0xcf55, 0xcf6f, 13),  #  LVT
+ 0xcf70: (0xcf70, 0xcf70, 12),  #  LV
+ 0xcf71: (0xcf71, 0xcf8b, 13),  #  LVT
+ 0xcf8c: (0xcf8c, 0xcf8c, 12),  #  LV
+ 0xcf8d: (0xcf8d, 0xcfa7, 13),  #  LVT
+ 0xcfa8: (0xcfa8, 0xcfa8, 12),  #  LV
+ 0xcfa9: (0xcfa9, 0xcfc3, 13),  #  LVT
+ 0xcfc4: (0xcfc4, 0xcfc4, 12),  #  LV
+ 0xcfc5: (0xcfc5, 0xcfdf, 13),  #  LVT
+ 0xcfe0: (0xcfe0, 0xcfe0, 12),  #  LV
+ 0xcfe1: (0xcfe1, 0xcffb, 13),  #  LVT
+ 0xcffc: (0xcffc, 0xcffc, 12),  #  LV
+ 0xcffd: (0xcffd, 0xd017, 13),  #  LVT
+ 0xd018: (0xd018, 0xd018, 12),  #  LV
+ 0xd019: (0xd019, 0xd033, 13),  #  LVT
+ 0xd034: (0xd034, 0xd034, 12),  #  LV
+ 0xd035: (0xd035, 0xd04f, 13),  #  LVT
+ 0xd050: (0xd050, 0xd050, 12),  #  LV
+ 0xd051: (0xd051, 0xd06b, 13),  #  LVT
+ 0xd06c: (0xd06c, 0xd06c, 12),  #  LV
+ 0xd06d: (0xd06d, 0xd087, 13),  #  LVT
+ 0xd088: (0xd088, 0xd088, 12),  #  LV
+ 0xd089: (0xd089, 0xd0a3, 13),  #  LVT
+ 0xd0a4: (0xd0a4, 0xd0a4, 12),  #  LV
+ 0xd0a5: (0xd0a5, 0xd0bf, 13),  #  LVT
+ 0xd0c0: (0xd0c0, 0xd0c0, 12),  #  LV
+ 0xd0c1: (0xd0c1, 0xd0db, 13),  #  LVT
+ 0xd0dc: (0xd0dc, 0xd0dc, 12),  #  LV
+ 0xd0dd: (0xd0dd, 0xd0f7, 13),  #  LVT
+ 0xd0f8: (0xd0f8, 0xd0f8, 12),  #  LV
+ 0xd0f9: (0xd0f9, 0xd113, 13),  #  LVT
+ 0xd114: (0xd114, 0xd114, 12),  #  LV
+ 0xd115: (0xd115, 0xd12f, 13),  #  LVT
+ 0xd130: (0xd130, 0xd130, 12),  #  LV
+ 0xd131: (0xd131, 0xd14b, 13),  #  LVT
+ 0xd14c: (0xd14c, 0xd14c, 12),  #  LV
+ 0xd14d: (0xd14d, 0xd167, 13),  #  LVT
+ 0xd168: (0xd168, 0xd168, 12),  #  LV
+ 0xd169: (0xd169, 0xd183, 13),  #  LVT
+ 0xd184: (0xd184, 0xd184, 12),  #  LV
+ 0xd185: (0xd185, 0xd19f, 13),  #  LVT
+ 0xd1a0: (0xd1a0, 0xd1a0, 12),  #  LV
+ 0xd1a1: (0xd1a1, 0xd1bb, 13),  #  LVT
+ 0xd1bc: (0xd1bc, 0xd1bc, 12),  #  LV
+ 0xd1bd: (0xd1bd, 0xd1d7, 13),  #  LVT
+ 0xd1d8: (0xd1d8, 0xd1d8, 12),  #  LV
+ 0xd1d9: (0xd1d9, 0xd1f3, 13),  #  LVT
+ 0xd1f4: (0xd1f4, 0xd1f4, 12),  #  LV
+ 0xd1f5: (0xd1f5, 0xd20f, 13),  #  LVT
+ 0xd210: (0xd210, 0xd210, 12),  #  LV
+ 0xd211: (0xd211, 0xd22b, 13),  #  LVT
+ 0xd22c: (0xd22c, 0xd22c, 12),  #  LV
+ 0xd22d: (0xd22d, 0xd247, 13),  #  LVT
+ 0xd248: (0xd248, 0xd248, 12),  #  LV
+ 0xd249: (0xd249, 0xd263, 13),  #  LVT
+ 0xd264: (0xd264, 0xd264, 12),  #  LV
+ 0xd265: (0xd265, 0xd27f, 13),  #  LVT
+ 0xd280: (0xd280, 0xd280, 12),  #  LV
+ 0xd281: (0xd281, 0xd29b, 13),  #  LVT
+ 0xd29c: (0xd29c, 0xd29c, 12),  #  LV
+ 0xd29d: (0xd29d, 0xd2b7, 13),  #  LVT
+ 0xd2b8: (0xd2b8, 0xd2b8, 12),  #  LV
+ 0xd2b9: (0xd2b9, 0xd2d3, 13),  #  LVT
+ 0xd2d4: (0xd2d4, 0xd2d4, 12),  #  LV
+ 0xd2d5: (0xd2d5, 0xd2ef, 13),  #  LVT
+ 0xd2f0: (0xd2f0, 0xd2f0, 12),  #  LV
+ 0xd2f1: (0xd2f1, 0xd30b, 13),  #  LVT
+ 0xd30c: (0xd30c, 0xd30c, 12),  #  LV
+ 0xd30d: (0xd30d, 0xd327, 13),  #  LVT
+ 0xd328: (0xd328, 0xd328, 12),  #  LV
+ 0xd329: (0xd329, 0xd343, 13),  #  LVT
+ 0xd344: (0xd344, 0xd344, 12),  #  LV
+ 0xd345: (0xd345, 0xd35f, 13),  #  LVT
+ 0xd360: (0xd360, 0xd360, 12),  #  LV
+ 0xd361: (0xd361, 0xd37b, 13),  #  LVT
+ 0xd37c: (0xd37c, 0xd37c, 12),  #  LV
+ 0xd37d: (0xd37d, 0xd397, 13),  #  LVT
+ 0xd398: (0xd398, 0xd398, 12),  #  LV
+ 0xd399: (0xd399, 0xd3b3, 13),  #  LVT
+ 0xd3b4: (0xd3b4, 0xd3b4, 12),  #  LV
+ 0xd3b5: (0xd3b5, 0xd3cf, 13),  #  LVT
+ 0xd3d0: (0xd3d0, 0xd3d0, 12),  #  LV
+ 0xd3d1: (0xd3d1, 0xd3eb, 13),  #  LVT
+ 0xd3ec: (0xd3ec, 0xd3ec, 12),  #  LV
+ 0xd3ed: (0xd3ed, 0xd407, 13),  #  LVT
+ 0xd408: (0xd408, 0xd408, 12),  #  LV
+ 0xd409: (0xd409, 0xd423, 13),  #  LVT
+ 0xd424: (0xd424, 0xd424, 12),  #  LV
+ 0xd425: (0xd425, 0xd43f, 13),  #  LVT
+ 0xd440: (0xd440, 0xd440, 12),  #  LV
+ 0xd441: (0xd441, 0xd45b, 13),  #  LVT
+ 0xd45c: (0xd45c, 0xd45c, 12),  #  LV
+ 0xd45d: (0xd45d, 0xd477, 13),  #  LVT
+ 0xd478: (0xd478, 0xd478, 12),  #  LV
+ 0xd479: (0xd479, 0xd493, 13),  #  LVT
+ 0xd494: (0xd494, 0xd494, 12),  #  LV
+ 0xd495: (0xd495, 0xd4af, 13),  #  LVT
+ 0xd4b0: (0xd4b0, 0xd4b0, 12),  #  LV
+ 0xd4b1: (0xd4b1, 0xd4cb, 13),  #  LVT
+ 0xd4cc: (0xd4cc, 0xd4cc, 12),  #  LV
+ 0xd4cd: (0xd4cd, 0xd4e7, 13),  #  LVT
+ 0xd4e8: (0xd4e8, 0xd4e8, 12),  #  LV
+ 0xd4e9: (0xd4e9, 0xd503, 13),  #  LVT
+ 0xd504: (0xd504, 0xd504, 12),  #  LV
+ 0xd505: (0xd505, 0xd51f, 13),  #  LVT
+ 0xd520: (0xd520, 0xd520, 12),  #  LV
+ 0xd521: (0xd521, 0xd53b, 13),  #  LVT
+ 0xd53c: (0xd53c, 0xd53c, 12),  #  LV
+ 0xd53d: (0xd53d, 0xd557, 13),  #  LVT
+ 0xd558: (0xd558, 0xd558, 12),  #  LV
+ 0xd559: (0xd559, 0xd573, 13),  #  LVT
+ 0xd574: (0xd574, 0xd574, 12),  #  LV
+ 0xd575: (0xd575, 0xd58f, 13),  #  LVT
+ 0xd590: (0xd590, 0xd590, 12),  #  LV
+ 0xd591: (0xd591, 0xd5ab, 13),  #  LVT
+ 0xd5ac: (0xd5ac, 0xd5ac, 12),  #  LV
+ 0xd5ad: (0xd5ad, 0xd5c7, 13),  #  LVT
+ 0xd5c8: (0xd5c8, 0xd5c8, 12),  #  LV
+ 0xd5c9: (0xd5c9, 0xd5e3, 13),  #  LVT
+ 0xd5e4: (0xd5e4, 0xd5e4, 12),  #  LV
+ 0xd5e5: (0xd5e5, 0xd5ff, 13),  #  LVT
+ 0xd600: (0xd600, 0xd600, 12),  #  LV
+ 0xd601: (0xd601, 0xd61b, 13),  #  LVT
+ 0xd61c: (0xd61c, 0xd61c, 12),  #  LV
+ 0xd61d: (0xd61d, 0xd637, 13),  #  LVT
+ 0xd638: (0xd638, 0xd638, 12),  #  LV
+ 0xd639: (0xd639, 0xd653, 13),  #  LVT
+ 0xd654: (0xd654, 0xd654, 12),  #  LV
+ 0xd655: (0xd655, 0xd66f, 13),  #  LVT
+ 0xd670: (0xd670, 0xd670, 12),  #  LV
+ 0xd671: (0xd671, 0xd68b, 13),  #  LVT
+ 0xd68c: (0xd68c, 0xd68c, 12),  #  LV
+ 0xd68d: (0xd68d, 0xd6a7, 13),  #  LVT
+ 0xd6a8: (0xd6a8, 0xd6a8, 12),  #  LV
+ 0xd6a9: (0xd6a9, 0xd6c3, 13),  #  LVT
+ 0xd6c4: (0xd6c4, 0xd6c4, 12),  #  LV
+ 0xd6c5: (0xd6c5, 0xd6df, 13),  #  LVT
+ 0xd6e0: (0xd6e0, 0xd6e0, 12),  #  LV
+ 0xd6e1: (0xd6e1, 0xd6fb, 13),  #  LVT
+ 0xd6fc: (0xd6fc, 0xd6fc, 12),  #  LV
+ 0xd6fd: (0xd6fd, 0xd717, 13),  #  LVT
+ 0xd718: (0xd718, 0xd718, 12),  #  LV
+ 0xd719: (0xd719, 0xd733, 13),  #  LVT
+ 0xd734: (0xd734, 0xd734, 12),  #  LV
+ 0xd735: (0xd735, 0xd74f, 13),  #  LVT
+ 0xd750: (0xd750, 0xd750, 12),  #  LV
+ 0xd751: (0xd751, 0xd76b, 13),  #  LVT
+ 0xd76c: (0xd76c, 0xd76c, 12),  #  LV
+ 0xd76d: (0xd76d, 0xd787, 13),  #  LVT
+ 0xd788: (0xd788, 0xd788, 12),  #  LV
+ 0xd789: (0xd789, 0xd7a3, 13),  #  LVT
+ 0xd7b0: (0xd7b0, 0xd7c6, 10),  #  V
+ 0xd7cb: (0xd7cb, 0xd7fb, 11),  #  T
+ 0xd800: (0xd800, 0xdfff, 3),  #  CN
+ 0xfb1e: (0xfb1e, 0xfb1e, 4),  #  EX
+ 0xfe00: (0xfe00, 0xfe0f, 4),  #  EX
+ 0xfe20: (0xfe20, 0xfe2f, 4),  #  EX
+ 0xfeff: (0xfeff, 0xfeff, 3),  #  CN
+ 0xff9e: (0xff9e, 0xff9f, 4),  #  EX
+ 0xfff0: (0xfff0, 0xfffb, 3),  #  CN
+ 0x101fd: (0x101fd, 0x101fd, 4),  #  EX
+ 0x102e0: (0x102e0, 0x102e0, 4),  #  EX
+ 0x10376: (0x10376, 0x1037a, 4),  #  EX
+ 0x10a01: (0x10a01, 0x10a03, 4),  #  EX
+ 0x10a05: (0x10a05, 0x10a06, 4),  #  EX
+ 0x10a0c: (0x10a0c, 0x10a0f, 4),  #  EX
+ 0x10a38: (0x10a38, 0x10a3a, 4),  #  EX
+ 0x10a3f: (0x10a3f, 0x10a3f, 4),  #  EX
+ 0x10ae5: (0x10ae5, 0x10ae6, 4),  #  EX
+ 0x10d24: (0x10d24, 0x10d27, 4),  #  EX
+ 0x10f46: (0x10f46, 0x10f50, 4),  #  EX
+ 0x11000: (0x11000, 0x11000, 8),  #  SM
+ 0x11001: (0x11001, 0x11001, 4),  #  EX
+ 0x11002: (0x11002, 0x11002, 8),  #  SM
+ 0x11038: (0x11038, 0x11046, 4),  #  EX
+ 0x1107f: (0x1107f, 0x11081, 4),  #  EX
+ 0x11082: (0x11082, 0x11082, 8),  #  SM
+ 0x110b0: (0x110b0, 0x110b2, 8),  #  SM
+ 0x110b3: (0x110b3, 0x110b6, 4),  #  EX
+ 0x110b7: (0x110b7, 0x110b8, 8),  #  SM
+ 0x110b9: (0x110b9, 0x110ba, 4),  #  EX
+ 0x110bd: (0x110bd, 0x110bd, 7),  #  PP
+ 0x110cd: (0x110cd, 0x110cd, 7),  #  PP
+ 0x11100: (0x11100, 0x11102, 4),  #  EX
+ 0x11127: (0x11127, 0x1112b, 4),  #  EX
+ 0x1112c: (0x1112c, 0x1112c, 8),  #  SM
+ 0x1112d: (0x1112d, 0x11134, 4),  #  EX
+ 0x11145: (0x11145, 0x11146, 8),  #  SM
+ 0x11173: (0x11173, 0x11173, 4),  #  EX
+ 0x11180: (0x11180, 0x11181, 4),  #  EX
+ 0x11182: (0x11182, 0x11182, 8),  #  SM
+ 0x111b3: (0x111b3, 0x111b5, 8),  #  SM
+ 0x111b6: (0x111b6, 0x111be, 4),  #  EX
+ 0x111bf: (0x111bf, 0x111c0, 8),  #  SM
+ 0x111c2: (0x111c2, 0x111c3, 7),  #  PP
+ 0x111c9: (0x111c9, 0x111cc, 4),  #  EX
+ 0x1122c: (0x1122c, 0x1122e, 8),  #  SM
+ 0x1122f: (0x1122f, 0x11231, 4),  #  EX
+ 0x11232: (0x11232, 0x11233, 8),  #  SM
+ 0x11234: (0x11234, 0x11234, 4),  #  EX
+ 0x11235: (0x11235, 0x11235, 8),  #  SM
+ 0x11236: (0x11236, 0x11237, 4),  #  EX
+ 0x1123e: (0x1123e, 0x1123e, 4),  #  EX
+ 0x112df: (0x112df, 0x112df, 4),  #  EX
+ 0x112e0: (0x112e0, 0x112e2, 8),  #  SM
+ 0x112e3: (0x112e3, 0x112ea, 4),  #  EX
+ 0x11300: (0x11300, 0x11301, 4),  #  EX
+ 0x11302: (0x11302, 0x11303, 8),  #  SM
+ 0x1133b: (0x1133b, 0x1133c, 4),  #  EX
+ 0x1133e: (0x1133e, 0x1133e, 4),  #  EX
+ 0x1133f: (0x1133f, 0x1133f, 8),  #  SM
+ 0x11340: (0x11340, 0x11340, 4),  #  EX
+ 0x11341: (0x11341, 0x11344, 8),  #  SM
+ 0x11347: (0x11347, 0x11348, 8),  #  SM
+ 0x1134b: (0x1134b, 0x1134d, 8),  #  SM
+ 0x11357: (0x11357, 0x11357, 4),  #  EX
+ 0x11362: (0x11362, 0x11363, 8),  #  SM
+ 0x11366: (0x11366, 0x1136c, 4),  #  EX
+ 0x11370: (0x11370, 0x11374, 4),  #  EX
+ 0x11435: (0x11435, 0x11437, 8),  #  SM
+ 0x11438: (0x11438, 0x1143f, 4),  #  EX
+ 0x11440: (0x11440, 0x11441, 8),  #  SM
+ 0x11442: (0x11442, 0x11444, 4),  #  EX
+ 0x11445: (0x11445, 0x11445, 8),  #  SM
+ 0x11446: (0x11446, 0x11446, 4),  #  EX
+ 0x1145e: (0x1145e, 0x1145e, 4),  #  EX
+ 0x114b0: (0x114b0, 0x114b0, 4),  #  EX
+ 0x114b1: (0x114b1, 0x114b2, 8),  #  SM
+ 0x114b3: (0x114b3, 0x114b8, 4),  #  EX
+ 0x114b9: (0x114b9, 0x114b9, 8),  #  SM
+ 0x114ba: (0x114ba, 0x114ba, 4),  #  EX
+ 0x114bb: (0x114bb, 0x114bc, 8),  #  SM
+ 0x114bd: (0x114bd, 0x114bd, 4),  #  EX
+ 0x114be: (0x114be, 0x114be, 8),  #  SM
+ 0x114bf: (0x114bf, 0x114c0, 4),  #  EX
+ 0x114c1: (0x114c1, 0x114c1, 8),  #  SM
+ 0x114c2: (0x114c2, 0x114c3, 4),  #  EX
+ 0x115af: (0x115af, 0x115af, 4),  #  EX
+ 0x115b0: (0x115b0, 0x115b1, 8),  #  SM
+ 0x115b2: (0x115b2, 0x115b5, 4),  #  EX
+ 0x115b8: (0x115b8, 0x115bb, 8),  #  SM
+ 0x115bc: (0x115bc, 0x115bd, 4),  #  EX
+ 0x115be: (0x115be, 0x115be, 8),  #  SM
+ 0x115bf: (0x115bf, 0x115c0, 4),  #  EX
+ 0x115dc: (0x115dc, 0x115dd, 4),  #  EX
+ 0x11630: (0x11630, 0x11632, 8),  #  SM
+ 0x11633: (0x11633, 0x1163a, 4),  #  EX
+ 0x1163b: (0x1163b, 0x1163c, 8),  #  SM
+ 0x1163d: (0x1163d, 0x1163d, 4),  #  EX
+ 0x1163e: (0x1163e, 0x1163e, 8),  #  SM
+ 0x1163f: (0x1163f, 0x11640, 4),  #  EX
+ 0x116ab: (0x116ab, 0x116ab, 4),  #  EX
+ 0x116ac: (0x116ac, 0x116ac, 8),  #  SM
+ 0x116ad: (0x116ad, 0x116ad, 4),  #  EX
+ 0x116ae: (0x116ae, 0x116af, 8),  #  SM
+ 0x116b0: (0x116b0, 0x116b5, 4),  #  EX
+ 0x116b6: (0x116b6, 0x116b6, 8),  #  SM
+ 0x116b7: (0x116b7, 0x116b7, 4),  #  EX
+ 0x1171d: (0x1171d, 0x1171f, 4),  #  EX
+ 0x11720: (0x11720, 0x11721, 8),  #  SM
+ 0x11722: (0x11722, 0x11725, 4),  #  EX
+ 0x11726: (0x11726, 0x11726, 8),  #  SM
+ 0x11727: (0x11727, 0x1172b, 4),  #  EX
+ 0x1182c: (0x1182c, 0x1182e, 8),  #  SM
+ 0x1182f: (0x1182f, 0x11837, 4),  #  EX
+ 0x11838: (0x11838, 0x11838, 8),  #  SM
+ 0x11839: (0x11839, 0x1183a, 4),  #  EX
+ 0x11a01: (0x11a01, 0x11a0a, 4),  #  EX
+ 0x11a33: (0x11a33, 0x11a38, 4),  #  EX
+ 0x11a39: (0x11a39, 0x11a39, 8),  #  SM
+ 0x11a3a: (0x11a3a, 0x11a3a, 7),  #  PP
+ 0x11a3b: (0x11a3b, 0x11a3e, 4),  #  EX
+ 0x11a47: (0x11a47, 0x11a47, 4),  #  EX
+ 0x11a51: (0x11a51, 0x11a56, 4),  #  EX
+ 0x11a57: (0x11a57, 0x11a58, 8),  #  SM
+ 0x11a59: (0x11a59, 0x11a5b, 4),  #  EX
+ 0x11a86: (0x11a86, 0x11a89, 7),  #  PP
+ 0x11a8a: (0x11a8a, 0x11a96, 4),  #  EX
+ 0x11a97: (0x11a97, 0x11a97, 8),  #  SM
+ 0x11a98: (0x11a98, 0x11a99, 4),  #  EX
+ 0x11c2f: (0x11c2f, 0x11c2f, 8),  #  SM
+ 0x11c30: (0x11c30, 0x11c36, 4),  #  EX
+ 0x11c38: (0x11c38, 0x11c3d, 4),  #  EX
+ 0x11c3e: (0x11c3e, 0x11c3e, 8),  #  SM
+ 0x11c3f: (0x11c3f, 0x11c3f, 4),  #  EX
+ 0x11c92: (0x11c92, 0x11ca7, 4),  #  EX
+ 0x11ca9: (0x11ca9, 0x11ca9, 8),  #  SM
+ 0x11caa: (0x11caa, 0x11cb0, 4),  #  EX
+ 0x11cb1: (0x11cb1, 0x11cb1, 8),  #  SM
+ 0x11cb2: (0x11cb2, 0x11cb3, 4),  #  EX
+ 0x11cb4: (0x11cb4, 0x11cb4, 8),  #  SM
+ 0x11cb5: (0x11cb5, 0x11cb6, 4),  #  EX
+ 0x11d31: (0x11d31, 0x11d36, 4),  #  EX
+ 0x11d3a: (0x11d3a, 0x11d3a, 4),  #  EX
+ 0x11d3c: (0x11d3c, 0x11d3d, 4),  #  EX
+ 0x11d3f: (0x11d3f, 0x11d45, 4),  #  EX
+ 0x11d46: (0x11d46, 0x11d46, 7),  #  PP
+ 0x11d47: (0x11d47, 0x11d47, 4),  #  EX
+ 0x11d8a: (0x11d8a, 0x11d8e, 8),  #  SM
+ 0x11d90: (0x11d90, 0x11d91, 4),  #  EX
+ 0x11d93: (0x11d93, 0x11d94, 8),  #  SM
+ 0x11d95: (0x11d95, 0x11d95, 4),  #  EX
+ 0x11d96: (0x11d96, 0x11d96, 8),  #  SM
+ 0x11d97: (0x11d97, 0x11d97, 4),  #  EX
+ 0x11ef3: (0x11ef3, 0x11ef4, 4),  #  EX
+ 0x11ef5: (0x11ef5, 0x11ef6, 8),  #  SM
+ 0x16af0: (0x16af0, 0x16af4, 4),  #  EX
+ 0x16b30: (0x16b30, 0x16b36, 4),  #  EX
+ 0x16f51: (0x16f51, 0x16f7e, 8),  #  SM
+ 0x16f8f: (0x16f8f, 0x16f92, 4),  #  EX
+ 0x1bc9d: (0x1bc9d, 0x1bc9e, 4),  #  EX
+ 0x1bca0: (0x1bca0, 0x1bca3, 3),  #  CN
+ 0x1d165: (0x1d165, 0x1d165, 4),  #  EX
+ 0x1d166: (0x1d166, 0x1d166, 8),  #  SM
+ 0x1d167: (0x1d167, 0x1d169, 4),  #  EX
+ 0x1d16d: (0x1d16d, 0x1d16d, 8),  #  SM
+ 0x1d16e: (0x1d16e, 0x1d172, 4),  #  EX
+ 0x1d173: (0x1d173, 0x1d17a, 3),  #  CN
+ 0x1d17b: (0x1d17b, 0x1d182, 4),  #  EX
+ 0x1d185: (0x1d185, 0x1d18b, 4),  #  EX
+ 0x1d1aa: (0x1d1aa, 0x1d1ad, 4),  #  EX
+ 0x1d242: (0x1d242, 0x1d244, 4),  #  EX
+ 0x1da00: (0x1da00, 0x1da36, 4),  #  EX
+ 0x1da3b: (0x1da3b, 0x1da6c, 4),  #  EX
+ 0x1da75: (0x1da75, 0x1da75, 4),  #  EX
+ 0x1da84: (0x1da84, 0x1da84, 4),  #  EX
+ 0x1da9b: (0x1da9b, 0x1da9f, 4),  #  EX
+ 0x1daa1: (0x1daa1, 0x1daaf, 4),  #  EX
+ 0x1e000: (0x1e000, 0x1e006, 4),  #  EX
+ 0x1e008: (0x1e008, 0x1e018, 4),  #  EX
+ 0x1e01b: (0x1e01b, 0x1e021, 4),  #  EX
+ 0x1e023: (0x1e023, 0x1e024, 4),  #  EX
+ 0x1e026: (0x1e026, 0x1e02a, 4),  #  EX
+ 0x1e8d0: (0x1e8d0, 0x1e8d6, 4),  #  EX
+ 0x1e944: (0x1e944, 0x1e94a, 4),  #  EX
+ 0x1f000: (0x1f000, 0x1f0ff, 14),  #  ExtPict
+ 0x1f10d: (0x1f10d, 0x1f10f, 14),  #  ExtPict
+ 0x1f12f: (0x1f12f, 0x1f12f, 14),  #  ExtPict
+ 0x1f16c: (0x1f16c, 0x1f171, 14),  #  ExtPict
+ 0x1f17e: (0x1f17e, 0x1f17f, 14),  #  ExtPict
+ 0x1f18e: (0x1f18e, 0x1f18e, 14),  #  ExtPict
+ 0x1f191: (0x1f191, 0x1f19a, 14),  #  ExtPict
+ 0x1f1ad: (0x1f1ad, 0x1f1e5, 14),  #  ExtPict
+ 0x1f1e6: (0x1f1e6, 0x1f1ff, 6),  #  RI
+ 0x1f201: (0x1f201, 0x1f20f, 14),  #  ExtPict
+ 0x1f21a: (0x1f21a, 0x1f21a, 14),  #  ExtPict
+ 0x1f22f: (0x1f22f, 0x1f22f, 14),  #  ExtPict
+ 0x1f232: (0x1f232, 0x1f23a, 14),  #  ExtPict
+ 0x1f23c: (0x1f23c, 0x1f23f, 14),  #  ExtPict
+ 0x1f249: (0x1f249, 0x1f3fa, 14),  #  ExtPict
+ 0x1f3fb: (0x1f3fb, 0x1f3ff, 4),  #  EX
+ 0x1f400: (0x1f400, 0x1f53d, 14),  #  ExtPict
+ 0x1f546: (0x1f546, 0x1f64f, 14),  #  ExtPict
+ 0x1f680: (0x1f680, 0x1f6ff, 14),  #  ExtPict
+ 0x1f774: (0x1f774, 0x1f77f, 14),  #  ExtPict
+ 0x1f7d5: (0x1f7d5, 0x1f7ff, 14),  #  ExtPict
+ 0x1f80c: (0x1f80c, 0x1f80f, 14),  #  ExtPict
+ 0x1f848: (0x1f848, 0x1f84f, 14),  #  ExtPict
+ 0x1f85a: (0x1f85a, 0x1f85f, 14),  #  ExtPict
+ 0x1f888: (0x1f888, 0x1f88f, 14),  #  ExtPict
+ 0x1f8ae: (0x1f8ae, 0x1f8ff, 14),  #  ExtPict
+ 0x1f90c: (0x1f90c, 0x1f93a, 14),  #  ExtPict
+ 0x1f93c: (0x1f93c, 0x1f945, 14),  #  ExtPict
+ 0x1f947: (0x1f947, 0x1fffd, 14),  #  ExtPict
+ 0xe0000: (0xe0000, 0xe001f, 3),  #  CN
+ 0xe0020: (0xe0020, 0xe007f, 4),  #  EX
+ 0xe0080: (0xe0080, 0xe00ff, 3),  #  CN
+ 0xe0100: (0xe0100, 0xe01ef, 4),  #  EX
+ 0xe01f0: (0xe01f0, 0xe0fff, 3),  #  CN
+}
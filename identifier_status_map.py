@@ -1,526 +1,526 @@
-
-
-# dictionary of Unicode identifier statuses
-# entries are: key: (f, l, s), where
-#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.
-#     status - the identifier status for the block.
-identifier_status_map = {
- 0x0027: (0x0027, None, "Allowed"), #  APOSTROPHE
- 0x002d: (0x002d, 0x002e, "Allowed"), #  HYPHEN-MINUS..FULL STOP
- 0x0030: (0x0030, 0x003a, "Allowed"), #  DIGIT ZERO..COLON
- 0x0041: (0x0041, 0x005a, "Allowed"), #  LATIN CAPITAL LETTER A..LATIN CAPITAL LETTER Z
- 0x005f: (0x005f, None, "Allowed"), #  LOW LINE
- 0x0061: (0x0061, 0x007a, "Allowed"), #  LATIN SMALL LETTER A..LATIN SMALL LETTER Z
- 0x00b7: (0x00b7, None, "Allowed"), #  MIDDLE DOT
- 0x00c0: (0x00c0, 0x00d6, "Allowed"), #  LATIN CAPITAL LETTER A WITH GRAVE..LATIN CAPITAL LETTER O WITH DIAERESIS
- 0x00d8: (0x00d8, 0x00f6, "Allowed"), #  LATIN CAPITAL LETTER O WITH STROKE..LATIN SMALL LETTER O WITH DIAERESIS
- 0x00f8: (0x00f8, 0x0131, "Allowed"), #  LATIN SMALL LETTER O WITH STROKE..LATIN SMALL LETTER DOTLESS I
- 0x0134: (0x0134, 0x013e, "Allowed"), #  LATIN CAPITAL LETTER J WITH CIRCUMFLEX..LATIN SMALL LETTER L WITH CARON
- 0x0141: (0x0141, 0x0148, "Allowed"), #  LATIN CAPITAL LETTER L WITH STROKE..LATIN SMALL LETTER N WITH CARON
- 0x014a: (0x014a, 0x017e, "Allowed"), #  LATIN CAPITAL LETTER ENG..LATIN SMALL LETTER Z WITH CARON
- 0x018f: (0x018f, None, "Allowed"), #  LATIN CAPITAL LETTER SCHWA
- 0x01a0: (0x01a0, 0x01a1, "Allowed"), #  LATIN CAPITAL LETTER O WITH HORN..LATIN SMALL LETTER O WITH HORN
- 0x01af: (0x01af, 0x01b0, "Allowed"), #  LATIN CAPITAL LETTER U WITH HORN..LATIN SMALL LETTER U WITH HORN
- 0x01cd: (0x01cd, 0x01dc, "Allowed"), #  LATIN CAPITAL LETTER A WITH CARON..LATIN SMALL LETTER U WITH DIAERESIS AND GRAVE
- 0x01de: (0x01de, 0x01e3, "Allowed"), #  LATIN CAPITAL LETTER A WITH DIAERESIS AND MACRON..LATIN SMALL LETTER AE WITH MACRON
- 0x01e6: (0x01e6, 0x01f0, "Allowed"), #  LATIN CAPITAL LETTER G WITH CARON..LATIN SMALL LETTER J WITH CARON
- 0x01f4: (0x01f4, 0x01f5, "Allowed"), #  LATIN CAPITAL LETTER G WITH ACUTE..LATIN SMALL LETTER G WITH ACUTE
- 0x01f8: (0x01f8, 0x01f9, "Allowed"), #  LATIN CAPITAL LETTER N WITH GRAVE..LATIN SMALL LETTER N WITH GRAVE
- 0x01fa: (0x01fa, 0x0217, "Allowed"), #  LATIN CAPITAL LETTER A WITH RING ABOVE AND ACUTE..LATIN SMALL LETTER U WITH INVERTED BREVE
- 0x0218: (0x0218, 0x021b, "Allowed"), #  LATIN CAPITAL LETTER S WITH COMMA BELOW..LATIN SMALL LETTER T WITH COMMA BELOW
- 0x021e: (0x021e, 0x021f, "Allowed"), #  LATIN CAPITAL LETTER H WITH CARON..LATIN SMALL LETTER H WITH CARON
- 0x0226: (0x0226, 0x0233, "Allowed"), #  LATIN CAPITAL LETTER A WITH DOT ABOVE..LATIN SMALL LETTER Y WITH MACRON
- 0x0259: (0x0259, None, "Allowed"), #  LATIN SMALL LETTER SCHWA
- 0x02bb: (0x02bb, 0x02bc, "Allowed"), #  MODIFIER LETTER TURNED COMMA..MODIFIER LETTER APOSTROPHE
- 0x02ec: (0x02ec, None, "Allowed"), #  MODIFIER LETTER VOICING
- 0x0300: (0x0300, 0x0304, "Allowed"), #  COMBINING GRAVE ACCENT..COMBINING MACRON
- 0x0306: (0x0306, 0x030c, "Allowed"), #  COMBINING BREVE..COMBINING CARON
- 0x030f: (0x030f, 0x0311, "Allowed"), #  COMBINING DOUBLE GRAVE ACCENT..COMBINING INVERTED BREVE
- 0x0313: (0x0313, 0x0314, "Allowed"), #  COMBINING COMMA ABOVE..COMBINING REVERSED COMMA ABOVE
- 0x031b: (0x031b, None, "Allowed"), #  COMBINING HORN
- 0x0323: (0x0323, 0x0328, "Allowed"), #  COMBINING DOT BELOW..COMBINING OGONEK
- 0x032d: (0x032d, 0x032e, "Allowed"), #  COMBINING CIRCUMFLEX ACCENT BELOW..COMBINING BREVE BELOW
- 0x0330: (0x0330, 0x0331, "Allowed"), #  COMBINING TILDE BELOW..COMBINING MACRON BELOW
- 0x0335: (0x0335, None, "Allowed"), #  COMBINING SHORT STROKE OVERLAY
- 0x0338: (0x0338, 0x0339, "Allowed"), #  COMBINING LONG SOLIDUS OVERLAY..COMBINING RIGHT HALF RING BELOW
- 0x0342: (0x0342, None, "Allowed"), #  COMBINING GREEK PERISPOMENI
- 0x0345: (0x0345, None, "Allowed"), #  COMBINING GREEK YPOGEGRAMMENI
- 0x0375: (0x0375, None, "Allowed"), #  GREEK LOWER NUMERAL SIGN
- 0x037b: (0x037b, 0x037d, "Allowed"), #  GREEK SMALL REVERSED LUNATE SIGMA SYMBOL..GREEK SMALL REVERSED DOTTED LUNATE SIGMA SYMBOL
- 0x0386: (0x0386, None, "Allowed"), #  GREEK CAPITAL LETTER ALPHA WITH TONOS
- 0x0388: (0x0388, 0x038a, "Allowed"), #  GREEK CAPITAL LETTER EPSILON WITH TONOS..GREEK CAPITAL LETTER IOTA WITH TONOS
- 0x038c: (0x038c, None, "Allowed"), #  GREEK CAPITAL LETTER OMICRON WITH TONOS
- 0x038e: (0x038e, 0x03a1, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH TONOS..GREEK CAPITAL LETTER RHO
- 0x03a3: (0x03a3, 0x03ce, "Allowed"), #  GREEK CAPITAL LETTER SIGMA..GREEK SMALL LETTER OMEGA WITH TONOS
- 0x03fc: (0x03fc, 0x03ff, "Allowed"), #  GREEK RHO WITH STROKE SYMBOL..GREEK CAPITAL REVERSED DOTTED LUNATE SIGMA SYMBOL
- 0x0400: (0x0400, None, "Allowed"), #  CYRILLIC CAPITAL LETTER IE WITH GRAVE
- 0x0401: (0x0401, 0x040c, "Allowed"), #  CYRILLIC CAPITAL LETTER IO..CYRILLIC CAPITAL LETTER KJE
- 0x040d: (0x040d, None, "Allowed"), #  CYRILLIC CAPITAL LETTER I WITH GRAVE
- 0x040e: (0x040e, 0x044f, "Allowed"), #  CYRILLIC CAPITAL LETTER SHORT U..CYRILLIC SMALL LETTER YA
- 0x0450: (0x0450, None, "Allowed"), #  CYRILLIC SMALL LETTER IE WITH GRAVE
- 0x0451: (0x0451, 0x045c, "Allowed"), #  CYRILLIC SMALL LETTER IO..CYRILLIC SMALL LETTER KJE
- 0x045d: (0x045d, None, "Allowed"), #  CYRILLIC SMALL LETTER I WITH GRAVE
- 0x045e: (0x045e, 0x045f, "Allowed"), #  CYRILLIC SMALL LETTER SHORT U..CYRILLIC SMALL LETTER DZHE
- 0x048a: (0x048a, 0x048b, "Allowed"), #  CYRILLIC CAPITAL LETTER SHORT I WITH TAIL..CYRILLIC SMALL LETTER SHORT I WITH TAIL
- 0x048c: (0x048c, 0x048f, "Allowed"), #  CYRILLIC CAPITAL LETTER SEMISOFT SIGN..CYRILLIC SMALL LETTER ER WITH TICK
- 0x0490: (0x0490, 0x04c4, "Allowed"), #  CYRILLIC CAPITAL LETTER GHE WITH UPTURN..CYRILLIC SMALL LETTER KA WITH HOOK
- 0x04c5: (0x04c5, 0x04c6, "Allowed"), #  CYRILLIC CAPITAL LETTER EL WITH TAIL..CYRILLIC SMALL LETTER EL WITH TAIL
- 0x04c7: (0x04c7, 0x04c8, "Allowed"), #  CYRILLIC CAPITAL LETTER EN WITH HOOK..CYRILLIC SMALL LETTER EN WITH HOOK
- 0x04c9: (0x04c9, 0x04ca, "Allowed"), #  CYRILLIC CAPITAL LETTER EN WITH TAIL..CYRILLIC SMALL LETTER EN WITH TAIL
- 0x04cb: (0x04cb, 0x04cc, "Allowed"), #  CYRILLIC CAPITAL LETTER KHAKASSIAN CHE..CYRILLIC SMALL LETTER KHAKASSIAN CHE
- 0x04cd: (0x04cd, 0x04ce, "Allowed"), #  CYRILLIC CAPITAL LETTER EM WITH TAIL..CYRILLIC SMALL LETTER EM WITH TAIL
- 0x04cf: (0x04cf, None, "Allowed"), #  CYRILLIC SMALL LETTER PALOCHKA
- 0x04d0: (0x04d0, 0x04eb, "Allowed"), #  CYRILLIC CAPITAL LETTER A WITH BREVE..CYRILLIC SMALL LETTER BARRED O WITH DIAERESIS
- 0x04ec: (0x04ec, 0x04ed, "Allowed"), #  CYRILLIC CAPITAL LETTER E WITH DIAERESIS..CYRILLIC SMALL LETTER E WITH DIAERESIS
- 0x04ee: (0x04ee, 0x04f5, "Allowed"), #  CYRILLIC CAPITAL LETTER U WITH MACRON..CYRILLIC SMALL LETTER CHE WITH DIAERESIS
- 0x04f6: (0x04f6, 0x04f7, "Allowed"), #  CYRILLIC CAPITAL LETTER GHE WITH DESCENDER..CYRILLIC SMALL LETTER GHE WITH DESCENDER
- 0x04f8: (0x04f8, 0x04f9, "Allowed"), #  CYRILLIC CAPITAL LETTER YERU WITH DIAERESIS..CYRILLIC SMALL LETTER YERU WITH DIAERESIS
- 0x04fa: (0x04fa, 0x04ff, "Allowed"), #  CYRILLIC CAPITAL LETTER GHE WITH STROKE AND HOOK..CYRILLIC SMALL LETTER HA WITH STROKE
- 0x0500: (0x0500, 0x050f, "Allowed"), #  CYRILLIC CAPITAL LETTER KOMI DE..CYRILLIC SMALL LETTER KOMI TJE
- 0x0510: (0x0510, 0x0513, "Allowed"), #  CYRILLIC CAPITAL LETTER REVERSED ZE..CYRILLIC SMALL LETTER EL WITH HOOK
- 0x0514: (0x0514, 0x0523, "Allowed"), #  CYRILLIC CAPITAL LETTER LHA..CYRILLIC SMALL LETTER EN WITH MIDDLE HOOK
- 0x0524: (0x0524, 0x0525, "Allowed"), #  CYRILLIC CAPITAL LETTER PE WITH DESCENDER..CYRILLIC SMALL LETTER PE WITH DESCENDER
- 0x0526: (0x0526, 0x0527, "Allowed"), #  CYRILLIC CAPITAL LETTER SHHA WITH DESCENDER..CYRILLIC SMALL LETTER SHHA WITH DESCENDER
- 0x0528: (0x0528, 0x0529, "Allowed"), #  CYRILLIC CAPITAL LETTER EN WITH LEFT HOOK..CYRILLIC SMALL LETTER EN WITH LEFT HOOK
- 0x052e: (0x052e, 0x052f, "Allowed"), #  CYRILLIC CAPITAL LETTER EL WITH DESCENDER..CYRILLIC SMALL LETTER EL WITH DESCENDER
- 0x0531: (0x0531, 0x0556, "Allowed"), #  ARMENIAN CAPITAL LETTER AYB..ARMENIAN CAPITAL LETTER FEH
- 0x0559: (0x0559, None, "Allowed"), #  ARMENIAN MODIFIER LETTER LEFT HALF RING
- 0x0560: (0x0560, None, "Allowed"), #  ARMENIAN SMALL LETTER TURNED AYB
- 0x0561: (0x0561, 0x0586, "Allowed"), #  ARMENIAN SMALL LETTER AYB..ARMENIAN SMALL LETTER FEH
- 0x0588: (0x0588, None, "Allowed"), #  ARMENIAN SMALL LETTER YI WITH STROKE
- 0x058a: (0x058a, None, "Allowed"), #  ARMENIAN HYPHEN
- 0x05b4: (0x05b4, None, "Allowed"), #  HEBREW POINT HIRIQ
- 0x05d0: (0x05d0, 0x05ea, "Allowed"), #  HEBREW LETTER ALEF..HEBREW LETTER TAV
- 0x05ef: (0x05ef, None, "Allowed"), #  HEBREW YOD TRIANGLE
- 0x05f0: (0x05f0, 0x05f4, "Allowed"), #  HEBREW LIGATURE YIDDISH DOUBLE VAV..HEBREW PUNCTUATION GERSHAYIM
- 0x0620: (0x0620, None, "Allowed"), #  ARABIC LETTER KASHMIRI YEH
- 0x0621: (0x0621, 0x063a, "Allowed"), #  ARABIC LETTER HAMZA..ARABIC LETTER GHAIN
- 0x063b: (0x063b, 0x063f, "Allowed"), #  ARABIC LETTER KEHEH WITH TWO DOTS ABOVE..ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE
- 0x0641: (0x0641, 0x0652, "Allowed"), #  ARABIC LETTER FEH..ARABIC SUKUN
- 0x0653: (0x0653, 0x0655, "Allowed"), #  ARABIC MADDAH ABOVE..ARABIC HAMZA BELOW
- 0x0660: (0x0660, 0x0669, "Allowed"), #  ARABIC-INDIC DIGIT ZERO..ARABIC-INDIC DIGIT NINE
- 0x0670: (0x0670, 0x0672, "Allowed"), #  ARABIC LETTER SUPERSCRIPT ALEF..ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE
- 0x0674: (0x0674, None, "Allowed"), #  ARABIC LETTER HIGH HAMZA
- 0x0679: (0x0679, 0x068d, "Allowed"), #  ARABIC LETTER TTEH..ARABIC LETTER DDAHAL
- 0x068f: (0x068f, 0x06b7, "Allowed"), #  ARABIC LETTER DAL WITH THREE DOTS ABOVE DOWNWARDS..ARABIC LETTER LAM WITH THREE DOTS ABOVE
- 0x06b8: (0x06b8, 0x06b9, "Allowed"), #  ARABIC LETTER LAM WITH THREE DOTS BELOW..ARABIC LETTER NOON WITH DOT BELOW
- 0x06ba: (0x06ba, 0x06be, "Allowed"), #  ARABIC LETTER NOON GHUNNA..ARABIC LETTER HEH DOACHASHMEE
- 0x06bf: (0x06bf, None, "Allowed"), #  ARABIC LETTER TCHEH WITH DOT ABOVE
- 0x06c0: (0x06c0, 0x06ce, "Allowed"), #  ARABIC LETTER HEH WITH YEH ABOVE..ARABIC LETTER YEH WITH SMALL V
- 0x06cf: (0x06cf, None, "Allowed"), #  ARABIC LETTER WAW WITH DOT ABOVE
- 0x06d0: (0x06d0, 0x06d3, "Allowed"), #  ARABIC LETTER E..ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
- 0x06d5: (0x06d5, None, "Allowed"), #  ARABIC LETTER AE
- 0x06e5: (0x06e5, 0x06e6, "Allowed"), #  ARABIC SMALL WAW..ARABIC SMALL YEH
- 0x06ee: (0x06ee, 0x06ef, "Allowed"), #  ARABIC LETTER DAL WITH INVERTED V..ARABIC LETTER REH WITH INVERTED V
- 0x06f0: (0x06f0, 0x06f9, "Allowed"), #  EXTENDED ARABIC-INDIC DIGIT ZERO..EXTENDED ARABIC-INDIC DIGIT NINE
- 0x06fa: (0x06fa, 0x06fe, "Allowed"), #  ARABIC LETTER SHEEN WITH DOT BELOW..ARABIC SIGN SINDHI POSTPOSITION MEN
- 0x06ff: (0x06ff, None, "Allowed"), #  ARABIC LETTER HEH WITH INVERTED V
- 0x0750: (0x0750, 0x076d, "Allowed"), #  ARABIC LETTER BEH WITH THREE DOTS HORIZONTALLY BELOW..ARABIC LETTER SEEN WITH TWO DOTS VERTICALLY ABOVE
- 0x076e: (0x076e, 0x077f, "Allowed"), #  ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH BELOW..ARABIC LETTER KAF WITH TWO DOTS ABOVE
- 0x0780: (0x0780, 0x07b0, "Allowed"), #  THAANA LETTER HAA..THAANA SUKUN
- 0x07b1: (0x07b1, None, "Allowed"), #  THAANA LETTER NAA
- 0x08a0: (0x08a0, None, "Allowed"), #  ARABIC LETTER BEH WITH SMALL V BELOW
- 0x08a1: (0x08a1, None, "Allowed"), #  ARABIC LETTER BEH WITH HAMZA ABOVE
- 0x08a2: (0x08a2, 0x08ac, "Allowed"), #  ARABIC LETTER JEEM WITH TWO DOTS ABOVE..ARABIC LETTER ROHINGYA YEH
- 0x08b2: (0x08b2, None, "Allowed"), #  ARABIC LETTER ZAIN WITH INVERTED V ABOVE
- 0x08b6: (0x08b6, 0x08bd, "Allowed"), #  ARABIC LETTER BEH WITH SMALL MEEM ABOVE..ARABIC LETTER AFRICAN NOON
- 0x0901: (0x0901, 0x0903, "Allowed"), #  DEVANAGARI SIGN CANDRABINDU..DEVANAGARI SIGN VISARGA
- 0x0904: (0x0904, None, "Allowed"), #  DEVANAGARI LETTER SHORT A
- 0x0905: (0x0905, 0x0939, "Allowed"), #  DEVANAGARI LETTER A..DEVANAGARI LETTER HA
- 0x093a: (0x093a, 0x093b, "Allowed"), #  DEVANAGARI VOWEL SIGN OE..DEVANAGARI VOWEL SIGN OOE
- 0x093c: (0x093c, 0x094d, "Allowed"), #  DEVANAGARI SIGN NUKTA..DEVANAGARI SIGN VIRAMA
- 0x094f: (0x094f, None, "Allowed"), #  DEVANAGARI VOWEL SIGN AW
- 0x0950: (0x0950, None, "Allowed"), #  DEVANAGARI OM
- 0x0956: (0x0956, 0x0957, "Allowed"), #  DEVANAGARI VOWEL SIGN UE..DEVANAGARI VOWEL SIGN UUE
- 0x0960: (0x0960, 0x0963, "Allowed"), #  DEVANAGARI LETTER VOCALIC RR..DEVANAGARI VOWEL SIGN VOCALIC LL
- 0x0966: (0x0966, 0x096f, "Allowed"), #  DEVANAGARI DIGIT ZERO..DEVANAGARI DIGIT NINE
- 0x0971: (0x0971, 0x0972, "Allowed"), #  DEVANAGARI SIGN HIGH SPACING DOT..DEVANAGARI LETTER CANDRA A
- 0x0973: (0x0973, 0x0977, "Allowed"), #  DEVANAGARI LETTER OE..DEVANAGARI LETTER UUE
- 0x0979: (0x0979, 0x097a, "Allowed"), #  DEVANAGARI LETTER ZHA..DEVANAGARI LETTER HEAVY YA
- 0x097b: (0x097b, 0x097c, "Allowed"), #  DEVANAGARI LETTER GGA..DEVANAGARI LETTER JJA
- 0x097d: (0x097d, None, "Allowed"), #  DEVANAGARI LETTER GLOTTAL STOP
- 0x097e: (0x097e, 0x097f, "Allowed"), #  DEVANAGARI LETTER DDDA..DEVANAGARI LETTER BBA
- 0x0981: (0x0981, 0x0983, "Allowed"), #  BENGALI SIGN CANDRABINDU..BENGALI SIGN VISARGA
- 0x0985: (0x0985, 0x098c, "Allowed"), #  BENGALI LETTER A..BENGALI LETTER VOCALIC L
- 0x098f: (0x098f, 0x0990, "Allowed"), #  BENGALI LETTER E..BENGALI LETTER AI
- 0x0993: (0x0993, 0x09a8, "Allowed"), #  BENGALI LETTER O..BENGALI LETTER NA
- 0x09aa: (0x09aa, 0x09b0, "Allowed"), #  BENGALI LETTER PA..BENGALI LETTER RA
- 0x09b2: (0x09b2, None, "Allowed"), #  BENGALI LETTER LA
- 0x09b6: (0x09b6, 0x09b9, "Allowed"), #  BENGALI LETTER SHA..BENGALI LETTER HA
- 0x09bc: (0x09bc, None, "Allowed"), #  BENGALI SIGN NUKTA
- 0x09bd: (0x09bd, None, "Allowed"), #  BENGALI SIGN AVAGRAHA
- 0x09be: (0x09be, 0x09c4, "Allowed"), #  BENGALI VOWEL SIGN AA..BENGALI VOWEL SIGN VOCALIC RR
- 0x09c7: (0x09c7, 0x09c8, "Allowed"), #  BENGALI VOWEL SIGN E..BENGALI VOWEL SIGN AI
- 0x09cb: (0x09cb, 0x09cd, "Allowed"), #  BENGALI VOWEL SIGN O..BENGALI SIGN VIRAMA
- 0x09ce: (0x09ce, None, "Allowed"), #  BENGALI LETTER KHANDA TA
- 0x09d7: (0x09d7, None, "Allowed"), #  BENGALI AU LENGTH MARK
- 0x09e0: (0x09e0, 0x09e3, "Allowed"), #  BENGALI LETTER VOCALIC RR..BENGALI VOWEL SIGN VOCALIC LL
- 0x09e6: (0x09e6, 0x09f1, "Allowed"), #  BENGALI DIGIT ZERO..BENGALI LETTER RA WITH LOWER DIAGONAL
- 0x09fc: (0x09fc, None, "Allowed"), #  BENGALI LETTER VEDIC ANUSVARA
- 0x09fe: (0x09fe, None, "Allowed"), #  BENGALI SANDHI MARK
- 0x0a01: (0x0a01, None, "Allowed"), #  GURMUKHI SIGN ADAK BINDI
- 0x0a02: (0x0a02, None, "Allowed"), #  GURMUKHI SIGN BINDI
- 0x0a03: (0x0a03, None, "Allowed"), #  GURMUKHI SIGN VISARGA
- 0x0a05: (0x0a05, 0x0a0a, "Allowed"), #  GURMUKHI LETTER A..GURMUKHI LETTER UU
- 0x0a0f: (0x0a0f, 0x0a10, "Allowed"), #  GURMUKHI LETTER EE..GURMUKHI LETTER AI
- 0x0a13: (0x0a13, 0x0a28, "Allowed"), #  GURMUKHI LETTER OO..GURMUKHI LETTER NA
- 0x0a2a: (0x0a2a, 0x0a30, "Allowed"), #  GURMUKHI LETTER PA..GURMUKHI LETTER RA
- 0x0a32: (0x0a32, None, "Allowed"), #  GURMUKHI LETTER LA
- 0x0a35: (0x0a35, None, "Allowed"), #  GURMUKHI LETTER VA
- 0x0a38: (0x0a38, 0x0a39, "Allowed"), #  GURMUKHI LETTER SA..GURMUKHI LETTER HA
- 0x0a3c: (0x0a3c, None, "Allowed"), #  GURMUKHI SIGN NUKTA
- 0x0a3e: (0x0a3e, 0x0a42, "Allowed"), #  GURMUKHI VOWEL SIGN AA..GURMUKHI VOWEL SIGN UU
- 0x0a47: (0x0a47, 0x0a48, "Allowed"), #  GURMUKHI VOWEL SIGN EE..GURMUKHI VOWEL SIGN AI
- 0x0a4b: (0x0a4b, 0x0a4d, "Allowed"), #  GURMUKHI VOWEL SIGN OO..GURMUKHI SIGN VIRAMA
- 0x0a5c: (0x0a5c, None, "Allowed"), #  GURMUKHI LETTER RRA
- 0x0a66: (0x0a66, 0x0a74, "Allowed"), #  GURMUKHI DIGIT ZERO..GURMUKHI EK ONKAR
- 0x0a81: (0x0a81, 0x0a83, "Allowed"), #  GUJARATI SIGN CANDRABINDU..GUJARATI SIGN VISARGA
- 0x0a85: (0x0a85, 0x0a8b, "Allowed"), #  GUJARATI LETTER A..GUJARATI LETTER VOCALIC R
- 0x0a8c: (0x0a8c, None, "Allowed"), #  GUJARATI LETTER VOCALIC L
- 0x0a8d: (0x0a8d, None, "Allowed"), #  GUJARATI VOWEL CANDRA E
- 0x0a8f: (0x0a8f, 0x0a91, "Allowed"), #  GUJARATI LETTER E..GUJARATI VOWEL CANDRA O
- 0x0a93: (0x0a93, 0x0aa8, "Allowed"), #  GUJARATI LETTER O..GUJARATI LETTER NA
- 0x0aaa: (0x0aaa, 0x0ab0, "Allowed"), #  GUJARATI LETTER PA..GUJARATI LETTER RA
- 0x0ab2: (0x0ab2, 0x0ab3, "Allowed"), #  GUJARATI LETTER LA..GUJARATI LETTER LLA
- 0x0ab5: (0x0ab5, 0x0ab9, "Allowed"), #  GUJARATI LETTER VA..GUJARATI LETTER HA
- 0x0abc: (0x0abc, 0x0ac5, "Allowed"), #  GUJARATI SIGN NUKTA..GUJARATI VOWEL SIGN CANDRA E
- 0x0ac7: (0x0ac7, 0x0ac9, "Allowed"), #  GUJARATI VOWEL SIGN E..GUJARATI VOWEL SIGN CANDRA O
- 0x0acb: (0x0acb, 0x0acd, "Allowed"), #  GUJARATI VOWEL SIGN O..GUJARATI SIGN VIRAMA
- 0x0ad0: (0x0ad0, None, "Allowed"), #  GUJARATI OM
- 0x0ae0: (0x0ae0, None, "Allowed"), #  GUJARATI LETTER VOCALIC RR
- 0x0ae1: (0x0ae1, 0x0ae3, "Allowed"), #  GUJARATI LETTER VOCALIC LL..GUJARATI VOWEL SIGN VOCALIC LL
- 0x0ae6: (0x0ae6, 0x0aef, "Allowed"), #  GUJARATI DIGIT ZERO..GUJARATI DIGIT NINE
- 0x0afa: (0x0afa, 0x0aff, "Allowed"), #  GUJARATI SIGN SUKUN..GUJARATI SIGN TWO-CIRCLE NUKTA ABOVE
- 0x0b01: (0x0b01, 0x0b03, "Allowed"), #  ORIYA SIGN CANDRABINDU..ORIYA SIGN VISARGA
- 0x0b05: (0x0b05, 0x0b0c, "Allowed"), #  ORIYA LETTER A..ORIYA LETTER VOCALIC L
- 0x0b0f: (0x0b0f, 0x0b10, "Allowed"), #  ORIYA LETTER E..ORIYA LETTER AI
- 0x0b13: (0x0b13, 0x0b28, "Allowed"), #  ORIYA LETTER O..ORIYA LETTER NA
- 0x0b2a: (0x0b2a, 0x0b30, "Allowed"), #  ORIYA LETTER PA..ORIYA LETTER RA
- 0x0b32: (0x0b32, 0x0b33, "Allowed"), #  ORIYA LETTER LA..ORIYA LETTER LLA
- 0x0b35: (0x0b35, None, "Allowed"), #  ORIYA LETTER VA
- 0x0b36: (0x0b36, 0x0b39, "Allowed"), #  ORIYA LETTER SHA..ORIYA LETTER HA
- 0x0b3c: (0x0b3c, 0x0b43, "Allowed"), #  ORIYA SIGN NUKTA..ORIYA VOWEL SIGN VOCALIC R
- 0x0b47: (0x0b47, 0x0b48, "Allowed"), #  ORIYA VOWEL SIGN E..ORIYA VOWEL SIGN AI
- 0x0b4b: (0x0b4b, 0x0b4d, "Allowed"), #  ORIYA VOWEL SIGN O..ORIYA SIGN VIRAMA
- 0x0b56: (0x0b56, 0x0b57, "Allowed"), #  ORIYA AI LENGTH MARK..ORIYA AU LENGTH MARK
- 0x0b5f: (0x0b5f, 0x0b61, "Allowed"), #  ORIYA LETTER YYA..ORIYA LETTER VOCALIC LL
- 0x0b66: (0x0b66, 0x0b6f, "Allowed"), #  ORIYA DIGIT ZERO..ORIYA DIGIT NINE
- 0x0b71: (0x0b71, None, "Allowed"), #  ORIYA LETTER WA
- 0x0b82: (0x0b82, 0x0b83, "Allowed"), #  TAMIL SIGN ANUSVARA..TAMIL SIGN VISARGA
- 0x0b85: (0x0b85, 0x0b8a, "Allowed"), #  TAMIL LETTER A..TAMIL LETTER UU
- 0x0b8e: (0x0b8e, 0x0b90, "Allowed"), #  TAMIL LETTER E..TAMIL LETTER AI
- 0x0b92: (0x0b92, 0x0b95, "Allowed"), #  TAMIL LETTER O..TAMIL LETTER KA
- 0x0b99: (0x0b99, 0x0b9a, "Allowed"), #  TAMIL LETTER NGA..TAMIL LETTER CA
- 0x0b9c: (0x0b9c, None, "Allowed"), #  TAMIL LETTER JA
- 0x0b9e: (0x0b9e, 0x0b9f, "Allowed"), #  TAMIL LETTER NYA..TAMIL LETTER TTA
- 0x0ba3: (0x0ba3, 0x0ba4, "Allowed"), #  TAMIL LETTER NNA..TAMIL LETTER TA
- 0x0ba8: (0x0ba8, 0x0baa, "Allowed"), #  TAMIL LETTER NA..TAMIL LETTER PA
- 0x0bae: (0x0bae, 0x0bb5, "Allowed"), #  TAMIL LETTER MA..TAMIL LETTER VA
- 0x0bb6: (0x0bb6, None, "Allowed"), #  TAMIL LETTER SHA
- 0x0bb7: (0x0bb7, 0x0bb9, "Allowed"), #  TAMIL LETTER SSA..TAMIL LETTER HA
- 0x0bbe: (0x0bbe, 0x0bc2, "Allowed"), #  TAMIL VOWEL SIGN AA..TAMIL VOWEL SIGN UU
- 0x0bc6: (0x0bc6, 0x0bc8, "Allowed"), #  TAMIL VOWEL SIGN E..TAMIL VOWEL SIGN AI
- 0x0bca: (0x0bca, 0x0bcd, "Allowed"), #  TAMIL VOWEL SIGN O..TAMIL SIGN VIRAMA
- 0x0bd0: (0x0bd0, None, "Allowed"), #  TAMIL OM
- 0x0bd7: (0x0bd7, None, "Allowed"), #  TAMIL AU LENGTH MARK
- 0x0be6: (0x0be6, None, "Allowed"), #  TAMIL DIGIT ZERO
- 0x0be7: (0x0be7, 0x0bef, "Allowed"), #  TAMIL DIGIT ONE..TAMIL DIGIT NINE
- 0x0c01: (0x0c01, 0x0c03, "Allowed"), #  TELUGU SIGN CANDRABINDU..TELUGU SIGN VISARGA
- 0x0c04: (0x0c04, None, "Allowed"), #  TELUGU SIGN COMBINING ANUSVARA ABOVE
- 0x0c05: (0x0c05, 0x0c0c, "Allowed"), #  TELUGU LETTER A..TELUGU LETTER VOCALIC L
- 0x0c0e: (0x0c0e, 0x0c10, "Allowed"), #  TELUGU LETTER E..TELUGU LETTER AI
- 0x0c12: (0x0c12, 0x0c28, "Allowed"), #  TELUGU LETTER O..TELUGU LETTER NA
- 0x0c2a: (0x0c2a, 0x0c33, "Allowed"), #  TELUGU LETTER PA..TELUGU LETTER LLA
- 0x0c35: (0x0c35, 0x0c39, "Allowed"), #  TELUGU LETTER VA..TELUGU LETTER HA
- 0x0c3d: (0x0c3d, None, "Allowed"), #  TELUGU SIGN AVAGRAHA
- 0x0c3e: (0x0c3e, 0x0c44, "Allowed"), #  TELUGU VOWEL SIGN AA..TELUGU VOWEL SIGN VOCALIC RR
- 0x0c46: (0x0c46, 0x0c48, "Allowed"), #  TELUGU VOWEL SIGN E..TELUGU VOWEL SIGN AI
- 0x0c4a: (0x0c4a, 0x0c4d, "Allowed"), #  TELUGU VOWEL SIGN O..TELUGU SIGN VIRAMA
- 0x0c55: (0x0c55, 0x0c56, "Allowed"), #  TELUGU LENGTH MARK..TELUGU AI LENGTH MARK
- 0x0c60: (0x0c60, 0x0c61, "Allowed"), #  TELUGU LETTER VOCALIC RR..TELUGU LETTER VOCALIC LL
- 0x0c66: (0x0c66, 0x0c6f, "Allowed"), #  TELUGU DIGIT ZERO..TELUGU DIGIT NINE
- 0x0c80: (0x0c80, None, "Allowed"), #  KANNADA SIGN SPACING CANDRABINDU
- 0x0c82: (0x0c82, 0x0c83, "Allowed"), #  KANNADA SIGN ANUSVARA..KANNADA SIGN VISARGA
- 0x0c85: (0x0c85, 0x0c8c, "Allowed"), #  KANNADA LETTER A..KANNADA LETTER VOCALIC L
- 0x0c8e: (0x0c8e, 0x0c90, "Allowed"), #  KANNADA LETTER E..KANNADA LETTER AI
- 0x0c92: (0x0c92, 0x0ca8, "Allowed"), #  KANNADA LETTER O..KANNADA LETTER NA
- 0x0caa: (0x0caa, 0x0cb3, "Allowed"), #  KANNADA LETTER PA..KANNADA LETTER LLA
- 0x0cb5: (0x0cb5, 0x0cb9, "Allowed"), #  KANNADA LETTER VA..KANNADA LETTER HA
- 0x0cbc: (0x0cbc, 0x0cbd, "Allowed"), #  KANNADA SIGN NUKTA..KANNADA SIGN AVAGRAHA
- 0x0cbe: (0x0cbe, 0x0cc4, "Allowed"), #  KANNADA VOWEL SIGN AA..KANNADA VOWEL SIGN VOCALIC RR
- 0x0cc6: (0x0cc6, 0x0cc8, "Allowed"), #  KANNADA VOWEL SIGN E..KANNADA VOWEL SIGN AI
- 0x0cca: (0x0cca, 0x0ccd, "Allowed"), #  KANNADA VOWEL SIGN O..KANNADA SIGN VIRAMA
- 0x0cd5: (0x0cd5, 0x0cd6, "Allowed"), #  KANNADA LENGTH MARK..KANNADA AI LENGTH MARK
- 0x0ce0: (0x0ce0, 0x0ce1, "Allowed"), #  KANNADA LETTER VOCALIC RR..KANNADA LETTER VOCALIC LL
- 0x0ce2: (0x0ce2, 0x0ce3, "Allowed"), #  KANNADA VOWEL SIGN VOCALIC L..KANNADA VOWEL SIGN VOCALIC LL
- 0x0ce6: (0x0ce6, 0x0cef, "Allowed"), #  KANNADA DIGIT ZERO..KANNADA DIGIT NINE
- 0x0cf1: (0x0cf1, 0x0cf2, "Allowed"), #  KANNADA SIGN JIHVAMULIYA..KANNADA SIGN UPADHMANIYA
- 0x0d00: (0x0d00, None, "Allowed"), #  MALAYALAM SIGN COMBINING ANUSVARA ABOVE
- 0x0d02: (0x0d02, 0x0d03, "Allowed"), #  MALAYALAM SIGN ANUSVARA..MALAYALAM SIGN VISARGA
- 0x0d05: (0x0d05, 0x0d0c, "Allowed"), #  MALAYALAM LETTER A..MALAYALAM LETTER VOCALIC L
- 0x0d0e: (0x0d0e, 0x0d10, "Allowed"), #  MALAYALAM LETTER E..MALAYALAM LETTER AI
- 0x0d12: (0x0d12, 0x0d28, "Allowed"), #  MALAYALAM LETTER O..MALAYALAM LETTER NA
- 0x0d29: (0x0d29, None, "Allowed"), #  MALAYALAM LETTER NNNA
- 0x0d2a: (0x0d2a, 0x0d39, "Allowed"), #  MALAYALAM LETTER PA..MALAYALAM LETTER HA
- 0x0d3a: (0x0d3a, None, "Allowed"), #  MALAYALAM LETTER TTTA
- 0x0d3b: (0x0d3b, 0x0d3c, "Allowed"), #  MALAYALAM SIGN VERTICAL BAR VIRAMA..MALAYALAM SIGN CIRCULAR VIRAMA
- 0x0d3d: (0x0d3d, None, "Allowed"), #  MALAYALAM SIGN AVAGRAHA
- 0x0d3e: (0x0d3e, 0x0d43, "Allowed"), #  MALAYALAM VOWEL SIGN AA..MALAYALAM VOWEL SIGN VOCALIC R
- 0x0d46: (0x0d46, 0x0d48, "Allowed"), #  MALAYALAM VOWEL SIGN E..MALAYALAM VOWEL SIGN AI
- 0x0d4a: (0x0d4a, 0x0d4d, "Allowed"), #  MALAYALAM VOWEL SIGN O..MALAYALAM SIGN VIRAMA
- 0x0d4e: (0x0d4e, None, "Allowed"), #  MALAYALAM LETTER DOT REPH
- 0x0d54: (0x0d54, 0x0d56, "Allowed"), #  MALAYALAM LETTER CHILLU M..MALAYALAM LETTER CHILLU LLL
- 0x0d57: (0x0d57, None, "Allowed"), #  MALAYALAM AU LENGTH MARK
- 0x0d60: (0x0d60, 0x0d61, "Allowed"), #  MALAYALAM LETTER VOCALIC RR..MALAYALAM LETTER VOCALIC LL
- 0x0d66: (0x0d66, 0x0d6f, "Allowed"), #  MALAYALAM DIGIT ZERO..MALAYALAM DIGIT NINE
- 0x0d7a: (0x0d7a, 0x0d7f, "Allowed"), #  MALAYALAM LETTER CHILLU NN..MALAYALAM LETTER CHILLU K
- 0x0d82: (0x0d82, 0x0d83, "Allowed"), #  SINHALA SIGN ANUSVARAYA..SINHALA SIGN VISARGAYA
- 0x0d85: (0x0d85, 0x0d8e, "Allowed"), #  SINHALA LETTER AYANNA..SINHALA LETTER IRUUYANNA
- 0x0d91: (0x0d91, 0x0d96, "Allowed"), #  SINHALA LETTER EYANNA..SINHALA LETTER AUYANNA
- 0x0d9a: (0x0d9a, 0x0da5, "Allowed"), #  SINHALA LETTER ALPAPRAANA KAYANNA..SINHALA LETTER TAALUJA SANYOOGA NAAKSIKYAYA
- 0x0da7: (0x0da7, 0x0db1, "Allowed"), #  SINHALA LETTER ALPAPRAANA TTAYANNA..SINHALA LETTER DANTAJA NAYANNA
- 0x0db3: (0x0db3, 0x0dbb, "Allowed"), #  SINHALA LETTER SANYAKA DAYANNA..SINHALA LETTER RAYANNA
- 0x0dbd: (0x0dbd, None, "Allowed"), #  SINHALA LETTER DANTAJA LAYANNA
- 0x0dc0: (0x0dc0, 0x0dc6, "Allowed"), #  SINHALA LETTER VAYANNA..SINHALA LETTER FAYANNA
- 0x0dca: (0x0dca, None, "Allowed"), #  SINHALA SIGN AL-LAKUNA
- 0x0dcf: (0x0dcf, 0x0dd4, "Allowed"), #  SINHALA VOWEL SIGN AELA-PILLA..SINHALA VOWEL SIGN KETTI PAA-PILLA
- 0x0dd6: (0x0dd6, None, "Allowed"), #  SINHALA VOWEL SIGN DIGA PAA-PILLA
- 0x0dd8: (0x0dd8, 0x0dde, "Allowed"), #  SINHALA VOWEL SIGN GAETTA-PILLA..SINHALA VOWEL SIGN KOMBUVA HAA GAYANUKITTA
- 0x0df2: (0x0df2, None, "Allowed"), #  SINHALA VOWEL SIGN DIGA GAETTA-PILLA
- 0x0e01: (0x0e01, 0x0e32, "Allowed"), #  THAI CHARACTER KO KAI..THAI CHARACTER SARA AA
- 0x0e34: (0x0e34, 0x0e3a, "Allowed"), #  THAI CHARACTER SARA I..THAI CHARACTER PHINTHU
- 0x0e40: (0x0e40, 0x0e4e, "Allowed"), #  THAI CHARACTER SARA E..THAI CHARACTER YAMAKKAN
- 0x0e50: (0x0e50, 0x0e59, "Allowed"), #  THAI DIGIT ZERO..THAI DIGIT NINE
- 0x0e81: (0x0e81, 0x0e82, "Allowed"), #  LAO LETTER KO..LAO LETTER KHO SUNG
- 0x0e84: (0x0e84, None, "Allowed"), #  LAO LETTER KHO TAM
- 0x0e87: (0x0e87, 0x0e88, "Allowed"), #  LAO LETTER NGO..LAO LETTER CO
- 0x0e8a: (0x0e8a, None, "Allowed"), #  LAO LETTER SO TAM
- 0x0e8d: (0x0e8d, None, "Allowed"), #  LAO LETTER NYO
- 0x0e94: (0x0e94, 0x0e97, "Allowed"), #  LAO LETTER DO..LAO LETTER THO TAM
- 0x0e99: (0x0e99, 0x0e9f, "Allowed"), #  LAO LETTER NO..LAO LETTER FO SUNG
- 0x0ea1: (0x0ea1, 0x0ea3, "Allowed"), #  LAO LETTER MO..LAO LETTER LO LING
- 0x0ea5: (0x0ea5, None, "Allowed"), #  LAO LETTER LO LOOT
- 0x0ea7: (0x0ea7, None, "Allowed"), #  LAO LETTER WO
- 0x0eaa: (0x0eaa, 0x0eab, "Allowed"), #  LAO LETTER SO SUNG..LAO LETTER HO SUNG
- 0x0ead: (0x0ead, 0x0eb2, "Allowed"), #  LAO LETTER O..LAO VOWEL SIGN AA
- 0x0eb4: (0x0eb4, 0x0eb9, "Allowed"), #  LAO VOWEL SIGN I..LAO VOWEL SIGN UU
- 0x0ebb: (0x0ebb, 0x0ebd, "Allowed"), #  LAO VOWEL SIGN MAI KON..LAO SEMIVOWEL SIGN NYO
- 0x0ec0: (0x0ec0, 0x0ec4, "Allowed"), #  LAO VOWEL SIGN E..LAO VOWEL SIGN AI
- 0x0ec6: (0x0ec6, None, "Allowed"), #  LAO KO LA
- 0x0ec8: (0x0ec8, 0x0ecd, "Allowed"), #  LAO TONE MAI EK..LAO NIGGAHITA
- 0x0ed0: (0x0ed0, 0x0ed9, "Allowed"), #  LAO DIGIT ZERO..LAO DIGIT NINE
- 0x0ede: (0x0ede, 0x0edf, "Allowed"), #  LAO LETTER KHMU GO..LAO LETTER KHMU NYO
- 0x0f00: (0x0f00, None, "Allowed"), #  TIBETAN SYLLABLE OM
- 0x0f0b: (0x0f0b, None, "Allowed"), #  TIBETAN MARK INTERSYLLABIC TSHEG
- 0x0f20: (0x0f20, 0x0f29, "Allowed"), #  TIBETAN DIGIT ZERO..TIBETAN DIGIT NINE
- 0x0f35: (0x0f35, None, "Allowed"), #  TIBETAN MARK NGAS BZUNG NYI ZLA
- 0x0f37: (0x0f37, None, "Allowed"), #  TIBETAN MARK NGAS BZUNG SGOR RTAGS
- 0x0f3e: (0x0f3e, 0x0f42, "Allowed"), #  TIBETAN SIGN YAR TSHES..TIBETAN LETTER GA
- 0x0f44: (0x0f44, 0x0f47, "Allowed"), #  TIBETAN LETTER NGA..TIBETAN LETTER JA
- 0x0f49: (0x0f49, 0x0f4c, "Allowed"), #  TIBETAN LETTER NYA..TIBETAN LETTER DDA
- 0x0f4e: (0x0f4e, 0x0f51, "Allowed"), #  TIBETAN LETTER NNA..TIBETAN LETTER DA
- 0x0f53: (0x0f53, 0x0f56, "Allowed"), #  TIBETAN LETTER NA..TIBETAN LETTER BA
- 0x0f58: (0x0f58, 0x0f5b, "Allowed"), #  TIBETAN LETTER MA..TIBETAN LETTER DZA
- 0x0f5d: (0x0f5d, 0x0f68, "Allowed"), #  TIBETAN LETTER WA..TIBETAN LETTER A
- 0x0f6a: (0x0f6a, None, "Allowed"), #  TIBETAN LETTER FIXED-FORM RA
- 0x0f6b: (0x0f6b, 0x0f6c, "Allowed"), #  TIBETAN LETTER KKA..TIBETAN LETTER RRA
- 0x0f71: (0x0f71, 0x0f72, "Allowed"), #  TIBETAN VOWEL SIGN AA..TIBETAN VOWEL SIGN I
- 0x0f74: (0x0f74, None, "Allowed"), #  TIBETAN VOWEL SIGN U
- 0x0f7a: (0x0f7a, 0x0f80, "Allowed"), #  TIBETAN VOWEL SIGN E..TIBETAN VOWEL SIGN REVERSED I
- 0x0f82: (0x0f82, 0x0f84, "Allowed"), #  TIBETAN SIGN NYI ZLA NAA DA..TIBETAN MARK HALANTA
- 0x0f86: (0x0f86, 0x0f8b, "Allowed"), #  TIBETAN SIGN LCI RTAGS..TIBETAN SIGN GRU MED RGYINGS
- 0x0f8c: (0x0f8c, 0x0f8f, "Allowed"), #  TIBETAN SIGN INVERTED MCHU CAN..TIBETAN SUBJOINED SIGN INVERTED MCHU CAN
- 0x0f90: (0x0f90, 0x0f92, "Allowed"), #  TIBETAN SUBJOINED LETTER KA..TIBETAN SUBJOINED LETTER GA
- 0x0f94: (0x0f94, 0x0f95, "Allowed"), #  TIBETAN SUBJOINED LETTER NGA..TIBETAN SUBJOINED LETTER CA
- 0x0f96: (0x0f96, None, "Allowed"), #  TIBETAN SUBJOINED LETTER CHA
- 0x0f97: (0x0f97, None, "Allowed"), #  TIBETAN SUBJOINED LETTER JA
- 0x0f99: (0x0f99, 0x0f9c, "Allowed"), #  TIBETAN SUBJOINED LETTER NYA..TIBETAN SUBJOINED LETTER DDA
- 0x0f9e: (0x0f9e, 0x0fa1, "Allowed"), #  TIBETAN SUBJOINED LETTER NNA..TIBETAN SUBJOINED LETTER DA
- 0x0fa3: (0x0fa3, 0x0fa6, "Allowed"), #  TIBETAN SUBJOINED LETTER NA..TIBETAN SUBJOINED LETTER BA
- 0x0fa8: (0x0fa8, 0x0fab, "Allowed"), #  TIBETAN SUBJOINED LETTER MA..TIBETAN SUBJOINED LETTER DZA
- 0x0fad: (0x0fad, None, "Allowed"), #  TIBETAN SUBJOINED LETTER WA
- 0x0fae: (0x0fae, 0x0fb0, "Allowed"), #  TIBETAN SUBJOINED LETTER ZHA..TIBETAN SUBJOINED LETTER -A
- 0x0fb1: (0x0fb1, 0x0fb7, "Allowed"), #  TIBETAN SUBJOINED LETTER YA..TIBETAN SUBJOINED LETTER HA
- 0x0fb8: (0x0fb8, None, "Allowed"), #  TIBETAN SUBJOINED LETTER A
- 0x0fba: (0x0fba, 0x0fbc, "Allowed"), #  TIBETAN SUBJOINED LETTER FIXED-FORM WA..TIBETAN SUBJOINED LETTER FIXED-FORM RA
- 0x0fc6: (0x0fc6, None, "Allowed"), #  TIBETAN SYMBOL PADMA GDAN
- 0x1000: (0x1000, 0x1021, "Allowed"), #  MYANMAR LETTER KA..MYANMAR LETTER A
- 0x1022: (0x1022, None, "Allowed"), #  MYANMAR LETTER SHAN A
- 0x1023: (0x1023, 0x1027, "Allowed"), #  MYANMAR LETTER I..MYANMAR LETTER E
- 0x1028: (0x1028, None, "Allowed"), #  MYANMAR LETTER MON E
- 0x1029: (0x1029, 0x102a, "Allowed"), #  MYANMAR LETTER O..MYANMAR LETTER AU
- 0x102b: (0x102b, None, "Allowed"), #  MYANMAR VOWEL SIGN TALL AA
- 0x102c: (0x102c, 0x1032, "Allowed"), #  MYANMAR VOWEL SIGN AA..MYANMAR VOWEL SIGN AI
- 0x1033: (0x1033, 0x1035, "Allowed"), #  MYANMAR VOWEL SIGN MON II..MYANMAR VOWEL SIGN E ABOVE
- 0x1036: (0x1036, 0x1039, "Allowed"), #  MYANMAR SIGN ANUSVARA..MYANMAR SIGN VIRAMA
- 0x103a: (0x103a, 0x103f, "Allowed"), #  MYANMAR SIGN ASAT..MYANMAR LETTER GREAT SA
- 0x1040: (0x1040, 0x1049, "Allowed"), #  MYANMAR DIGIT ZERO..MYANMAR DIGIT NINE
- 0x1050: (0x1050, 0x1059, "Allowed"), #  MYANMAR LETTER SHA..MYANMAR VOWEL SIGN VOCALIC LL
- 0x105a: (0x105a, 0x1099, "Allowed"), #  MYANMAR LETTER MON NGA..MYANMAR SHAN DIGIT NINE
- 0x109a: (0x109a, 0x109d, "Allowed"), #  MYANMAR SIGN KHAMTI TONE-1..MYANMAR VOWEL SIGN AITON AI
- 0x10c7: (0x10c7, None, "Allowed"), #  GEORGIAN CAPITAL LETTER YN
- 0x10cd: (0x10cd, None, "Allowed"), #  GEORGIAN CAPITAL LETTER AEN
- 0x10d0: (0x10d0, 0x10f0, "Allowed"), #  GEORGIAN LETTER AN..GEORGIAN LETTER HAE
- 0x10f7: (0x10f7, 0x10f8, "Allowed"), #  GEORGIAN LETTER YN..GEORGIAN LETTER ELIFI
- 0x10f9: (0x10f9, 0x10fa, "Allowed"), #  GEORGIAN LETTER TURNED GAN..GEORGIAN LETTER AIN
- 0x10fd: (0x10fd, 0x10ff, "Allowed"), #  GEORGIAN LETTER AEN..GEORGIAN LETTER LABIAL SIGN
- 0x1200: (0x1200, 0x1206, "Allowed"), #  ETHIOPIC SYLLABLE HA..ETHIOPIC SYLLABLE HO
- 0x1207: (0x1207, None, "Allowed"), #  ETHIOPIC SYLLABLE HOA
- 0x1208: (0x1208, 0x1246, "Allowed"), #  ETHIOPIC SYLLABLE LA..ETHIOPIC SYLLABLE QO
- 0x1247: (0x1247, None, "Allowed"), #  ETHIOPIC SYLLABLE QOA
- 0x1248: (0x1248, None, "Allowed"), #  ETHIOPIC SYLLABLE QWA
- 0x124a: (0x124a, 0x124d, "Allowed"), #  ETHIOPIC SYLLABLE QWI..ETHIOPIC SYLLABLE QWE
- 0x1250: (0x1250, 0x1256, "Allowed"), #  ETHIOPIC SYLLABLE QHA..ETHIOPIC SYLLABLE QHO
- 0x1258: (0x1258, None, "Allowed"), #  ETHIOPIC SYLLABLE QHWA
- 0x125a: (0x125a, 0x125d, "Allowed"), #  ETHIOPIC SYLLABLE QHWI..ETHIOPIC SYLLABLE QHWE
- 0x1260: (0x1260, 0x1286, "Allowed"), #  ETHIOPIC SYLLABLE BA..ETHIOPIC SYLLABLE XO
- 0x1287: (0x1287, None, "Allowed"), #  ETHIOPIC SYLLABLE XOA
- 0x1288: (0x1288, None, "Allowed"), #  ETHIOPIC SYLLABLE XWA
- 0x128a: (0x128a, 0x128d, "Allowed"), #  ETHIOPIC SYLLABLE XWI..ETHIOPIC SYLLABLE XWE
- 0x1290: (0x1290, 0x12ae, "Allowed"), #  ETHIOPIC SYLLABLE NA..ETHIOPIC SYLLABLE KO
- 0x12af: (0x12af, None, "Allowed"), #  ETHIOPIC SYLLABLE KOA
- 0x12b0: (0x12b0, None, "Allowed"), #  ETHIOPIC SYLLABLE KWA
- 0x12b2: (0x12b2, 0x12b5, "Allowed"), #  ETHIOPIC SYLLABLE KWI..ETHIOPIC SYLLABLE KWE
- 0x12b8: (0x12b8, 0x12be, "Allowed"), #  ETHIOPIC SYLLABLE KXA..ETHIOPIC SYLLABLE KXO
- 0x12c0: (0x12c0, None, "Allowed"), #  ETHIOPIC SYLLABLE KXWA
- 0x12c2: (0x12c2, 0x12c5, "Allowed"), #  ETHIOPIC SYLLABLE KXWI..ETHIOPIC SYLLABLE KXWE
- 0x12c8: (0x12c8, 0x12ce, "Allowed"), #  ETHIOPIC SYLLABLE WA..ETHIOPIC SYLLABLE WO
- 0x12cf: (0x12cf, None, "Allowed"), #  ETHIOPIC SYLLABLE WOA
- 0x12d0: (0x12d0, 0x12d6, "Allowed"), #  ETHIOPIC SYLLABLE PHARYNGEAL A..ETHIOPIC SYLLABLE PHARYNGEAL O
- 0x12d8: (0x12d8, 0x12ee, "Allowed"), #  ETHIOPIC SYLLABLE ZA..ETHIOPIC SYLLABLE YO
- 0x12ef: (0x12ef, None, "Allowed"), #  ETHIOPIC SYLLABLE YOA
- 0x12f0: (0x12f0, 0x130e, "Allowed"), #  ETHIOPIC SYLLABLE DA..ETHIOPIC SYLLABLE GO
- 0x130f: (0x130f, None, "Allowed"), #  ETHIOPIC SYLLABLE GOA
- 0x1310: (0x1310, None, "Allowed"), #  ETHIOPIC SYLLABLE GWA
- 0x1312: (0x1312, 0x1315, "Allowed"), #  ETHIOPIC SYLLABLE GWI..ETHIOPIC SYLLABLE GWE
- 0x1318: (0x1318, 0x131e, "Allowed"), #  ETHIOPIC SYLLABLE GGA..ETHIOPIC SYLLABLE GGO
- 0x131f: (0x131f, None, "Allowed"), #  ETHIOPIC SYLLABLE GGWAA
- 0x1320: (0x1320, 0x1346, "Allowed"), #  ETHIOPIC SYLLABLE THA..ETHIOPIC SYLLABLE TZO
- 0x1347: (0x1347, None, "Allowed"), #  ETHIOPIC SYLLABLE TZOA
- 0x1348: (0x1348, 0x135a, "Allowed"), #  ETHIOPIC SYLLABLE FA..ETHIOPIC SYLLABLE FYA
- 0x135d: (0x135d, 0x135e, "Allowed"), #  ETHIOPIC COMBINING GEMINATION AND VOWEL LENGTH MARK..ETHIOPIC COMBINING VOWEL LENGTH MARK
- 0x135f: (0x135f, None, "Allowed"), #  ETHIOPIC COMBINING GEMINATION MARK
- 0x1380: (0x1380, 0x138f, "Allowed"), #  ETHIOPIC SYLLABLE SEBATBEIT MWA..ETHIOPIC SYLLABLE PWE
- 0x1780: (0x1780, 0x17a2, "Allowed"), #  KHMER LETTER KA..KHMER LETTER QA
- 0x17a5: (0x17a5, 0x17a7, "Allowed"), #  KHMER INDEPENDENT VOWEL QI..KHMER INDEPENDENT VOWEL QU
- 0x17a9: (0x17a9, 0x17b3, "Allowed"), #  KHMER INDEPENDENT VOWEL QUU..KHMER INDEPENDENT VOWEL QAU
- 0x17b6: (0x17b6, 0x17ca, "Allowed"), #  KHMER VOWEL SIGN AA..KHMER SIGN TRIISAP
- 0x17d2: (0x17d2, None, "Allowed"), #  KHMER SIGN COENG
- 0x17d7: (0x17d7, None, "Allowed"), #  KHMER SIGN LEK TOO
- 0x17dc: (0x17dc, None, "Allowed"), #  KHMER SIGN AVAKRAHASANYA
- 0x17e0: (0x17e0, 0x17e9, "Allowed"), #  KHMER DIGIT ZERO..KHMER DIGIT NINE
- 0x1c80: (0x1c80, 0x1c88, "Allowed"), #  CYRILLIC SMALL LETTER ROUNDED VE..CYRILLIC SMALL LETTER UNBLENDED UK
- 0x1c90: (0x1c90, 0x1cba, "Allowed"), #  GEORGIAN MTAVRULI CAPITAL LETTER AN..GEORGIAN MTAVRULI CAPITAL LETTER AIN
- 0x1cbd: (0x1cbd, 0x1cbf, "Allowed"), #  GEORGIAN MTAVRULI CAPITAL LETTER AEN..GEORGIAN MTAVRULI CAPITAL LETTER LABIAL SIGN
- 0x1e00: (0x1e00, 0x1e99, "Allowed"), #  LATIN CAPITAL LETTER A WITH RING BELOW..LATIN SMALL LETTER Y WITH RING ABOVE
- 0x1e9e: (0x1e9e, None, "Allowed"), #  LATIN CAPITAL LETTER SHARP S
- 0x1ea0: (0x1ea0, 0x1ef9, "Allowed"), #  LATIN CAPITAL LETTER A WITH DOT BELOW..LATIN SMALL LETTER Y WITH TILDE
- 0x1f00: (0x1f00, 0x1f15, "Allowed"), #  GREEK SMALL LETTER ALPHA WITH PSILI..GREEK SMALL LETTER EPSILON WITH DASIA AND OXIA
- 0x1f18: (0x1f18, 0x1f1d, "Allowed"), #  GREEK CAPITAL LETTER EPSILON WITH PSILI..GREEK CAPITAL LETTER EPSILON WITH DASIA AND OXIA
- 0x1f20: (0x1f20, 0x1f45, "Allowed"), #  GREEK SMALL LETTER ETA WITH PSILI..GREEK SMALL LETTER OMICRON WITH DASIA AND OXIA
- 0x1f48: (0x1f48, 0x1f4d, "Allowed"), #  GREEK CAPITAL LETTER OMICRON WITH PSILI..GREEK CAPITAL LETTER OMICRON WITH DASIA AND OXIA
- 0x1f50: (0x1f50, 0x1f57, "Allowed"), #  GREEK SMALL LETTER UPSILON WITH PSILI..GREEK SMALL LETTER UPSILON WITH DASIA AND PERISPOMENI
- 0x1f59: (0x1f59, None, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA
- 0x1f5b: (0x1f5b, None, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND VARIA
- 0x1f5d: (0x1f5d, None, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND OXIA
- 0x1f5f: (0x1f5f, 0x1f70, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND PERISPOMENI..GREEK SMALL LETTER ALPHA WITH VARIA
- 0x1f72: (0x1f72, None, "Allowed"), #  GREEK SMALL LETTER EPSILON WITH VARIA
- 0x1f74: (0x1f74, None, "Allowed"), #  GREEK SMALL LETTER ETA WITH VARIA
- 0x1f76: (0x1f76, None, "Allowed"), #  GREEK SMALL LETTER IOTA WITH VARIA
- 0x1f78: (0x1f78, None, "Allowed"), #  GREEK SMALL LETTER OMICRON WITH VARIA
- 0x1f7a: (0x1f7a, None, "Allowed"), #  GREEK SMALL LETTER UPSILON WITH VARIA
- 0x1f7c: (0x1f7c, None, "Allowed"), #  GREEK SMALL LETTER OMEGA WITH VARIA
- 0x1f80: (0x1f80, 0x1fb4, "Allowed"), #  GREEK SMALL LETTER ALPHA WITH PSILI AND YPOGEGRAMMENI..GREEK SMALL LETTER ALPHA WITH OXIA AND YPOGEGRAMMENI
- 0x1fb6: (0x1fb6, 0x1fba, "Allowed"), #  GREEK SMALL LETTER ALPHA WITH PERISPOMENI..GREEK CAPITAL LETTER ALPHA WITH VARIA
- 0x1fbc: (0x1fbc, None, "Allowed"), #  GREEK CAPITAL LETTER ALPHA WITH PROSGEGRAMMENI
- 0x1fc2: (0x1fc2, 0x1fc4, "Allowed"), #  GREEK SMALL LETTER ETA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER ETA WITH OXIA AND YPOGEGRAMMENI
- 0x1fc6: (0x1fc6, 0x1fc8, "Allowed"), #  GREEK SMALL LETTER ETA WITH PERISPOMENI..GREEK CAPITAL LETTER EPSILON WITH VARIA
- 0x1fca: (0x1fca, None, "Allowed"), #  GREEK CAPITAL LETTER ETA WITH VARIA
- 0x1fcc: (0x1fcc, None, "Allowed"), #  GREEK CAPITAL LETTER ETA WITH PROSGEGRAMMENI
- 0x1fd0: (0x1fd0, 0x1fd2, "Allowed"), #  GREEK SMALL LETTER IOTA WITH VRACHY..GREEK SMALL LETTER IOTA WITH DIALYTIKA AND VARIA
- 0x1fd6: (0x1fd6, 0x1fda, "Allowed"), #  GREEK SMALL LETTER IOTA WITH PERISPOMENI..GREEK CAPITAL LETTER IOTA WITH VARIA
- 0x1fe0: (0x1fe0, 0x1fe2, "Allowed"), #  GREEK SMALL LETTER UPSILON WITH VRACHY..GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND VARIA
- 0x1fe4: (0x1fe4, 0x1fea, "Allowed"), #  GREEK SMALL LETTER RHO WITH PSILI..GREEK CAPITAL LETTER UPSILON WITH VARIA
- 0x1fec: (0x1fec, None, "Allowed"), #  GREEK CAPITAL LETTER RHO WITH DASIA
- 0x1ff2: (0x1ff2, 0x1ff4, "Allowed"), #  GREEK SMALL LETTER OMEGA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER OMEGA WITH OXIA AND YPOGEGRAMMENI
- 0x1ff6: (0x1ff6, 0x1ff8, "Allowed"), #  GREEK SMALL LETTER OMEGA WITH PERISPOMENI..GREEK CAPITAL LETTER OMICRON WITH VARIA
- 0x1ffa: (0x1ffa, None, "Allowed"), #  GREEK CAPITAL LETTER OMEGA WITH VARIA
- 0x1ffc: (0x1ffc, None, "Allowed"), #  GREEK CAPITAL LETTER OMEGA WITH PROSGEGRAMMENI
- 0x200c: (0x200c, 0x200d, "Allowed"), #  ZERO WIDTH NON-JOINER..ZERO WIDTH JOINER
- 0x2010: (0x2010, None, "Allowed"), #  HYPHEN
- 0x2019: (0x2019, None, "Allowed"), #  RIGHT SINGLE QUOTATION MARK
- 0x2027: (0x2027, None, "Allowed"), #  HYPHENATION POINT
- 0x2d27: (0x2d27, None, "Allowed"), #  GEORGIAN SMALL LETTER YN
- 0x2d2d: (0x2d2d, None, "Allowed"), #  GEORGIAN SMALL LETTER AEN
- 0x2d80: (0x2d80, 0x2d96, "Allowed"), #  ETHIOPIC SYLLABLE LOA..ETHIOPIC SYLLABLE GGWE
- 0x2da0: (0x2da0, 0x2da6, "Allowed"), #  ETHIOPIC SYLLABLE SSA..ETHIOPIC SYLLABLE SSO
- 0x2da8: (0x2da8, 0x2dae, "Allowed"), #  ETHIOPIC SYLLABLE CCA..ETHIOPIC SYLLABLE CCO
- 0x2db0: (0x2db0, 0x2db6, "Allowed"), #  ETHIOPIC SYLLABLE ZZA..ETHIOPIC SYLLABLE ZZO
- 0x2db8: (0x2db8, 0x2dbe, "Allowed"), #  ETHIOPIC SYLLABLE CCHA..ETHIOPIC SYLLABLE CCHO
- 0x2dc0: (0x2dc0, 0x2dc6, "Allowed"), #  ETHIOPIC SYLLABLE QYA..ETHIOPIC SYLLABLE QYO
- 0x2dc8: (0x2dc8, 0x2dce, "Allowed"), #  ETHIOPIC SYLLABLE KYA..ETHIOPIC SYLLABLE KYO
- 0x2dd0: (0x2dd0, 0x2dd6, "Allowed"), #  ETHIOPIC SYLLABLE XYA..ETHIOPIC SYLLABLE XYO
- 0x2dd8: (0x2dd8, 0x2dde, "Allowed"), #  ETHIOPIC SYLLABLE GYA..ETHIOPIC SYLLABLE GYO
- 0x3005: (0x3005, 0x3007, "Allowed"), #  IDEOGRAPHIC ITERATION MARK..IDEOGRAPHIC NUMBER ZERO
- 0x3041: (0x3041, 0x3094, "Allowed"), #  HIRAGANA LETTER SMALL A..HIRAGANA LETTER VU
- 0x3095: (0x3095, 0x3096, "Allowed"), #  HIRAGANA LETTER SMALL KA..HIRAGANA LETTER SMALL KE
- 0x3099: (0x3099, 0x309a, "Allowed"), #  COMBINING KATAKANA-HIRAGANA VOICED SOUND MARK..COMBINING KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK
- 0x309d: (0x309d, 0x309e, "Allowed"), #  HIRAGANA ITERATION MARK..HIRAGANA VOICED ITERATION MARK
- 0x30a0: (0x30a0, None, "Allowed"), #  KATAKANA-HIRAGANA DOUBLE HYPHEN
- 0x30a1: (0x30a1, 0x30fe, "Allowed"), #  KATAKANA LETTER SMALL A..KATAKANA VOICED ITERATION MARK
- 0x3105: (0x3105, 0x312c, "Allowed"), #  BOPOMOFO LETTER B..BOPOMOFO LETTER GN
- 0x312d: (0x312d, None, "Allowed"), #  BOPOMOFO LETTER IH
- 0x312e: (0x312e, None, "Allowed"), #  BOPOMOFO LETTER O WITH DOT ABOVE
- 0x312f: (0x312f, None, "Allowed"), #  BOPOMOFO LETTER NN
- 0x31a0: (0x31a0, 0x31b7, "Allowed"), #  BOPOMOFO LETTER BU..BOPOMOFO FINAL LETTER H
- 0x31b8: (0x31b8, 0x31ba, "Allowed"), #  BOPOMOFO LETTER GH..BOPOMOFO LETTER ZY
- 0x3400: (0x3400, 0x4db5, "Allowed"), #  CJK UNIFIED IDEOGRAPH-3400..CJK UNIFIED IDEOGRAPH-4DB5
- 0x4e00: (0x4e00, 0x9fa5, "Allowed"), #  CJK UNIFIED IDEOGRAPH-4E00..CJK UNIFIED IDEOGRAPH-9FA5
- 0x9fa6: (0x9fa6, 0x9fbb, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FA6..CJK UNIFIED IDEOGRAPH-9FBB
- 0x9fbc: (0x9fbc, 0x9fc3, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FBC..CJK UNIFIED IDEOGRAPH-9FC3
- 0x9fc4: (0x9fc4, 0x9fcb, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FC4..CJK UNIFIED IDEOGRAPH-9FCB
- 0x9fcc: (0x9fcc, None, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FCC
- 0x9fcd: (0x9fcd, 0x9fd5, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FCD..CJK UNIFIED IDEOGRAPH-9FD5
- 0x9fd6: (0x9fd6, 0x9fea, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FD6..CJK UNIFIED IDEOGRAPH-9FEA
- 0x9feb: (0x9feb, 0x9fef, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FEB..CJK UNIFIED IDEOGRAPH-9FEF
- 0xa660: (0xa660, 0xa661, "Allowed"), #  CYRILLIC CAPITAL LETTER REVERSED TSE..CYRILLIC SMALL LETTER REVERSED TSE
- 0xa674: (0xa674, 0xa67b, "Allowed"), #  COMBINING CYRILLIC LETTER UKRAINIAN IE..COMBINING CYRILLIC LETTER OMEGA
- 0xa67f: (0xa67f, None, "Allowed"), #  CYRILLIC PAYEROK
- 0xa69f: (0xa69f, None, "Allowed"), #  COMBINING CYRILLIC LETTER IOTIFIED E
- 0xa717: (0xa717, 0xa71a, "Allowed"), #  MODIFIER LETTER DOT VERTICAL BAR..MODIFIER LETTER LOWER RIGHT CORNER ANGLE
- 0xa71b: (0xa71b, 0xa71f, "Allowed"), #  MODIFIER LETTER RAISED UP ARROW..MODIFIER LETTER LOW INVERTED EXCLAMATION MARK
- 0xa788: (0xa788, None, "Allowed"), #  MODIFIER LETTER LOW CIRCUMFLEX ACCENT
- 0xa78d: (0xa78d, 0xa78e, "Allowed"), #  LATIN CAPITAL LETTER TURNED H..LATIN SMALL LETTER L WITH RETROFLEX HOOK AND BELT
- 0xa790: (0xa790, 0xa791, "Allowed"), #  LATIN CAPITAL LETTER N WITH DESCENDER..LATIN SMALL LETTER N WITH DESCENDER
- 0xa792: (0xa792, 0xa793, "Allowed"), #  LATIN CAPITAL LETTER C WITH BAR..LATIN SMALL LETTER C WITH BAR
- 0xa7a0: (0xa7a0, 0xa7a9, "Allowed"), #  LATIN CAPITAL LETTER G WITH OBLIQUE STROKE..LATIN SMALL LETTER S WITH OBLIQUE STROKE
- 0xa7aa: (0xa7aa, None, "Allowed"), #  LATIN CAPITAL LETTER H WITH HOOK
- 0xa7ae: (0xa7ae, None, "Allowed"), #  LATIN CAPITAL LETTER SMALL CAPITAL I
- 0xa7af: (0xa7af, None, "Allowed"), #  LATIN LETTER SMALL CAPITAL Q
- 0xa7b8: (0xa7b8, 0xa7b9, "Allowed"), #  LATIN CAPITAL LETTER U WITH STROKE..LATIN SMALL LETTER U WITH STROKE
- 0xa7fa: (0xa7fa, None, "Allowed"), #  LATIN LETTER SMALL CAPITAL TURNED M
- 0xa9e7: (0xa9e7, 0xa9fe, "Allowed"), #  MYANMAR LETTER TAI LAING NYA..MYANMAR LETTER TAI LAING BHA
- 0xaa60: (0xaa60, 0xaa76, "Allowed"), #  MYANMAR LETTER KHAMTI GA..MYANMAR LOGOGRAM KHAMTI HM
- 0xaa7a: (0xaa7a, 0xaa7b, "Allowed"), #  MYANMAR LETTER AITON RA..MYANMAR SIGN PAO KAREN TONE
- 0xaa7c: (0xaa7c, 0xaa7f, "Allowed"), #  MYANMAR SIGN TAI LAING TONE-2..MYANMAR LETTER SHWE PALAUNG SHA
- 0xab01: (0xab01, 0xab06, "Allowed"), #  ETHIOPIC SYLLABLE TTHU..ETHIOPIC SYLLABLE TTHO
- 0xab09: (0xab09, 0xab0e, "Allowed"), #  ETHIOPIC SYLLABLE DDHU..ETHIOPIC SYLLABLE DDHO
- 0xab11: (0xab11, 0xab16, "Allowed"), #  ETHIOPIC SYLLABLE DZU..ETHIOPIC SYLLABLE DZO
- 0xab20: (0xab20, 0xab26, "Allowed"), #  ETHIOPIC SYLLABLE CCHHA..ETHIOPIC SYLLABLE CCHHO
- 0xab28: (0xab28, 0xab2e, "Allowed"), #  ETHIOPIC SYLLABLE BBA..ETHIOPIC SYLLABLE BBO
- 0xac00: (0xac00, 0xd7a3, "Allowed"), #  HANGUL SYLLABLE GA..HANGUL SYLLABLE HIH
- 0xfa0e: (0xfa0e, 0xfa0f, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA0E..CJK COMPATIBILITY IDEOGRAPH-FA0F
- 0xfa11: (0xfa11, None, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA11
- 0xfa13: (0xfa13, 0xfa14, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA13..CJK COMPATIBILITY IDEOGRAPH-FA14
- 0xfa1f: (0xfa1f, None, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA1F
- 0xfa21: (0xfa21, None, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA21
- 0xfa23: (0xfa23, 0xfa24, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA23..CJK COMPATIBILITY IDEOGRAPH-FA24
- 0xfa27: (0xfa27, 0xfa29, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA27..CJK COMPATIBILITY IDEOGRAPH-FA29
- 0x1133b: (0x1133b, None, "Allowed"), #  COMBINING BINDU BELOW
- 0x1b002: (0x1b002, 0x1b11e, "Allowed"), #  HENTAIGANA LETTER A-1..HENTAIGANA LETTER N-MU-MO-2
- 0x20000: (0x20000, 0x2a6d6, "Allowed"), #  CJK UNIFIED IDEOGRAPH-20000..CJK UNIFIED IDEOGRAPH-2A6D6
- 0x2a700: (0x2a700, 0x2b734, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2A700..CJK UNIFIED IDEOGRAPH-2B734
- 0x2b740: (0x2b740, 0x2b81d, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2B740..CJK UNIFIED IDEOGRAPH-2B81D
- 0x2b820: (0x2b820, 0x2cea1, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2B820..CJK UNIFIED IDEOGRAPH-2CEA1
- 0x2ceb0: (0x2ceb0, 0x2ebe0, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2CEB0..CJK UNIFIED IDEOGRAPH-2EBE0
-}
+
+
+# dictionary of Unicode identifier statuses
+# entries are: key: (f, l, s), where
+#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.
+#     status - the identifier status for the block.
+identifier_status_map = {
+ 0x0027: (0x0027, None, "Allowed"), #  APOSTROPHE
+ 0x002d: (0x002d, 0x002e, "Allowed"), #  HYPHEN-MINUS..FULL STOP
+ 0x0030: (0x0030, 0x003a, "Allowed"), #  DIGIT ZERO..COLON
+ 0x0041: (0x0041, 0x005a, "Allowed"), #  LATIN CAPITAL LETTER A..LATIN CAPITAL LETTER Z
+ 0x005f: (0x005f, None, "Allowed"), #  LOW LINE
+ 0x0061: (0x0061, 0x007a, "Allowed"), #  LATIN SMALL LETTER A..LATIN SMALL LETTER Z
+ 0x00b7: (0x00b7, None, "Allowed"), #  MIDDLE DOT
+ 0x00c0: (0x00c0, 0x00d6, "Allowed"), #  LATIN CAPITAL LETTER A WITH GRAVE..LATIN CAPITAL LETTER O WITH DIAERESIS
+ 0x00d8: (0x00d8, 0x00f6, "Allowed"), #  LATIN CAPITAL LETTER O WITH STROKE..LATIN SMALL LETTER O WITH DIAERESIS
+ 0x00f8: (0x00f8, 0x0131, "Allowed"), #  LATIN SMALL LETTER O WITH STROKE..LATIN SMALL LETTER DOTLESS I
+ 0x0134: (0x0134, 0x013e, "Allowed"), #  LATIN CAPITAL LETTER J WITH CIRCUMFLEX..LATIN SMALL LETTER L WITH CARON
+ 0x0141: (0x0141, 0x0148, "Allowed"), #  LATIN CAPITAL LETTER L WITH STROKE..LATIN SMALL LETTER N WITH CARON
+ 0x014a: (0x014a, 0x017e, "Allowed"), #  LATIN CAPITAL LETTER ENG..LATIN SMALL LETTER Z WITH CARON
+ 0x018f: (0x018f, None, "Allowed"), #  LATIN CAPITAL LETTER SCHWA
+ 0x01a0: (0x01a0, 0x01a1, "Allowed"), #  LATIN CAPITAL LETTER O WITH HORN..LATIN SMALL LETTER O WITH HORN
+ 0x01af: (0x01af, 0x01b0, "Allowed"), #  LATIN CAPITAL LETTER U WITH HORN..LATIN SMALL LETTER U WITH HORN
+ 0x01cd: (0x01cd, 0x01dc, "Allowed"), #  LATIN CAPITAL LETTER A WITH CARON..LATIN SMALL LETTER U WITH DIAERESIS AND GRAVE
+ 0x01de: (0x01de, 0x01e3, "Allowed"), #  LATIN CAPITAL LETTER A WITH DIAERESIS AND MACRON..LATIN SMALL LETTER AE WITH MACRON
+ 0x01e6: (0x01e6, 0x01f0, "Allowed"), #  LATIN CAPITAL LETTER G WITH CARON..LATIN SMALL LETTER J WITH CARON
+ 0x01f4: (0x01f4, 0x01f5, "Allowed"), #  LATIN CAPITAL LETTER G WITH ACUTE..LATIN SMALL LETTER G WITH ACUTE
+ 0x01f8: (0x01f8, 0x01f9, "Allowed"), #  LATIN CAPITAL LETTER N WITH GRAVE..LATIN SMALL LETTER N WITH GRAVE
+ 0x01fa: (0x01fa, 0x0217, "Allowed"), #  LATIN CAPITAL LETTER A WITH RING ABOVE AND ACUTE..LATIN SMALL LETTER U WITH INVERTED BREVE
+ 0x0218: (0x0218, 0x021b, "Allowed"), #  LATIN CAPITAL LETTER S WITH COMMA BELOW..LATIN SMALL LETTER T WITH COMMA BELOW
+ 0x021e: (0x021e, 0x021f, "Allowed"), #  LATIN CAPITAL LETTER H WITH CARON..LATIN SMALL LETTER H WITH CARON
+ 0x0226: (0x0226, 0x0233, "Allowed"), #  LATIN CAPITAL LETTER A WITH DOT ABOVE..LATIN SMALL LETTER Y WITH MACRON
+ 0x0259: (0x0259, None, "Allowed"), #  LATIN SMALL LETTER SCHWA
+ 0x02bb: (0x02bb, 0x02bc, "Allowed"), #  MODIFIER LETTER TURNED COMMA..MODIFIER LETTER APOSTROPHE
+ 0x02ec: (0x02ec, None, "Allowed"), #  MODIFIER LETTER VOICING
+ 0x0300: (0x0300, 0x0304, "Allowed"), #  COMBINING GRAVE ACCENT..COMBINING MACRON
+ 0x0306: (0x0306, 0x030c, "Allowed"), #  COMBINING BREVE..COMBINING CARON
+ 0x030f: (0x030f, 0x0311, "Allowed"), #  COMBINING DOUBLE GRAVE ACCENT..COMBINING INVERTED BREVE
+ 0x0313: (0x0313, 0x0314, "Allowed"), #  COMBINING COMMA ABOVE..COMBINING REVERSED COMMA ABOVE
+ 0x031b: (0x031b, None, "Allowed"), #  COMBINING HORN
+ 0x0323: (0x0323, 0x0328, "Allowed"), #  COMBINING DOT BELOW..COMBINING OGONEK
+ 0x032d: (0x032d, 0x032e, "Allowed"), #  COMBINING CIRCUMFLEX ACCENT BELOW..COMBINING BREVE BELOW
+ 0x0330: (0x0330, 0x0331, "Allowed"), #  COMBINING TILDE BELOW..COMBINING MACRON BELOW
+ 0x0335: (0x0335, None, "Allowed"), #  COMBINING SHORT STROKE OVERLAY
+ 0x0338: (0x0338, 0x0339, "Allowed"), #  COMBINING LONG SOLIDUS OVERLAY..COMBINING RIGHT HALF RING BELOW
+ 0x0342: (0x0342, None, "Allowed"), #  COMBINING GREEK PERISPOMENI
+ 0x0345: (0x0345, None, "Allowed"), #  COMBINING GREEK YPOGEGRAMMENI
+ 0x0375: (0x0375, None, "Allowed"), #  GREEK LOWER NUMERAL SIGN
+ 0x037b: (0x037b, 0x037d, "Allowed"), #  GREEK SMALL REVERSED LUNATE SIGMA SYMBOL..GREEK SMALL REVERSED DOTTED LUNATE SIGMA SYMBOL
+ 0x0386: (0x0386, None, "Allowed"), #  GREEK CAPITAL LETTER ALPHA WITH TONOS
+ 0x0388: (0x0388, 0x038a, "Allowed"), #  GREEK CAPITAL LETTER EPSILON WITH TONOS..GREEK CAPITAL LETTER IOTA WITH TONOS
+ 0x038c: (0x038c, None, "Allowed"), #  GREEK CAPITAL LETTER OMICRON WITH TONOS
+ 0x038e: (0x038e, 0x03a1, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH TONOS..GREEK CAPITAL LETTER RHO
+ 0x03a3: (0x03a3, 0x03ce, "Allowed"), #  GREEK CAPITAL LETTER SIGMA..GREEK SMALL LETTER OMEGA WITH TONOS
+ 0x03fc: (0x03fc, 0x03ff, "Allowed"), #  GREEK RHO WITH STROKE SYMBOL..GREEK CAPITAL REVERSED DOTTED LUNATE SIGMA SYMBOL
+ 0x0400: (0x0400, None, "Allowed"), #  CYRILLIC CAPITAL LETTER IE WITH GRAVE
+ 0x0401: (0x0401, 0x040c, "Allowed"), #  CYRILLIC CAPITAL LETTER IO..CYRILLIC CAPITAL LETTER KJE
+ 0x040d: (0x040d, None, "Allowed"), #  CYRILLIC CAPITAL LETTER I WITH GRAVE
+ 0x040e: (0x040e, 0x044f, "Allowed"), #  CYRILLIC CAPITAL LETTER SHORT U..CYRILLIC SMALL LETTER YA
+ 0x0450: (0x0450, None, "Allowed"), #  CYRILLIC SMALL LETTER IE WITH GRAVE
+ 0x0451: (0x0451, 0x045c, "Allowed"), #  CYRILLIC SMALL LETTER IO..CYRILLIC SMALL LETTER KJE
+ 0x045d: (0x045d, None, "Allowed"), #  CYRILLIC SMALL LETTER I WITH GRAVE
+ 0x045e: (0x045e, 0x045f, "Allowed"), #  CYRILLIC SMALL LETTER SHORT U..CYRILLIC SMALL LETTER DZHE
+ 0x048a: (0x048a, 0x048b, "Allowed"), #  CYRILLIC CAPITAL LETTER SHORT I WITH TAIL..CYRILLIC SMALL LETTER SHORT I WITH TAIL
+ 0x048c: (0x048c, 0x048f, "Allowed"), #  CYRILLIC CAPITAL LETTER SEMISOFT SIGN..CYRILLIC SMALL LETTER ER WITH TICK
+ 0x0490: (0x0490, 0x04c4, "Allowed"), #  CYRILLIC CAPITAL LETTER GHE WITH UPTURN..CYRILLIC SMALL LETTER KA WITH HOOK
+ 0x04c5: (0x04c5, 0x04c6, "Allowed"), #  CYRILLIC CAPITAL LETTER EL WITH TAIL..CYRILLIC SMALL LETTER EL WITH TAIL
+ 0x04c7: (0x04c7, 0x04c8, "Allowed"), #  CYRILLIC CAPITAL LETTER EN WITH HOOK..CYRILLIC SMALL LETTER EN WITH HOOK
+ 0x04c9: (0x04c9, 0x04ca, "Allowed"), #  CYRILLIC CAPITAL LETTER EN WITH TAIL..CYRILLIC SMALL LETTER EN WITH TAIL
+ 0x04cb: (0x04cb, 0x04cc, "Allowed"), #  CYRILLIC CAPITAL LETTER KHAKASSIAN CHE..CYRILLIC SMALL LETTER KHAKASSIAN CHE
+ 0x04cd: (0x04cd, 0x04ce, "Allowed"), #  CYRILLIC CAPITAL LETTER EM WITH TAIL..CYRILLIC SMALL LETTER EM WITH TAIL
+ 0x04cf: (0x04cf, None, "Allowed"), #  CYRILLIC SMALL LETTER PALOCHKA
+ 0x04d0: (0x04d0, 0x04eb, "Allowed"), #  CYRILLIC CAPITAL LETTER A WITH BREVE..CYRILLIC SMALL LETTER BARRED O WITH DIAERESIS
+ 0x04ec: (0x04ec, 0x04ed, "Allowed"), #  CYRILLIC CAPITAL LETTER E WITH DIAERESIS..CYRILLIC SMALL LETTER E WITH DIAERESIS
+ 0x04ee: (0x04ee, 0x04f5, "Allowed"), #  CYRILLIC CAPITAL LETTER U WITH MACRON..CYRILLIC SMALL LETTER CHE WITH DIAERESIS
+ 0x04f6: (0x04f6, 0x04f7, "Allowed"), #  CYRILLIC CAPITAL LETTER GHE WITH DESCENDER..CYRILLIC SMALL LETTER GHE WITH DESCENDER
+ 0x04f8: (0x04f8, 0x04f9, "Allowed"), #  CYRILLIC CAPITAL LETTER YERU WITH DIAERESIS..CYRILLIC SMALL LETTER YERU WITH DIAERESIS
+ 0x04fa: (0x04fa, 0x04ff, "Allowed"), #  CYRILLIC CAPITAL LETTER GHE WITH STROKE AND HOOK..CYRILLIC SMALL LETTER HA WITH STROKE
+ 0x0500: (0x0500, 0x050f, "Allowed"), #  CYRILLIC CAPITAL LETTER KOMI DE..CYRILLIC SMALL LETTER KOMI TJE
+ 0x0510: (0x0510, 0x0513, "Allowed"), #  CYRILLIC CAPITAL LETTER REVERSED ZE..CYRILLIC SMALL LETTER EL WITH HOOK
+ 0x0514: (0x0514, 0x0523, "Allowed"), #  CYRILLIC CAPITAL LETTER LHA..CYRILLIC SMALL LETTER EN WITH MIDDLE HOOK
+ 0x0524: (0x0524, 0x0525, "Allowed"), #  CYRILLIC CAPITAL LETTER PE WITH DESCENDER..CYRILLIC SMALL LETTER PE WITH DESCENDER
+ 0x0526: (0x0526, 0x0527, "Allowed"), #  CYRILLIC CAPITAL LETTER SHHA WITH DESCENDER..CYRILLIC SMALL LETTER SHHA WITH DESCENDER
+ 0x0528: (0x0528, 0x0529, "Allowed"), #  CYRILLIC CAPITAL LETTER EN WITH LEFT HOOK..CYRILLIC SMALL LETTER EN WITH LEFT HOOK
+ 0x052e: (0x052e, 0x052f, "Allowed"), #  CYRILLIC CAPITAL LETTER EL WITH DESCENDER..CYRILLIC SMALL LETTER EL WITH DESCENDER
+ 0x0531: (0x0531, 0x0556, "Allowed"), #  ARMENIAN CAPITAL LETTER AYB..ARMENIAN CAPITAL LETTER FEH
+ 0x0559: (0x0559, None, "Allowed"), #  ARMENIAN MODIFIER LETTER LEFT HALF RING
+ 0x0560: (0x0560, None, "Allowed"), #  ARMENIAN SMALL LETTER TURNED AYB
+ 0x0561: (0x0561, 0x0586, "Allowed"), #  ARMENIAN SMALL LETTER AYB..ARMENIAN SMALL LETTER FEH
+ 0x0588: (0x0588, None, "Allowed"), #  ARMENIAN SMALL LETTER YI WITH STROKE
+ 0x058a: (0x058a, None, "Allowed"), #  ARMENIAN HYPHEN
+ 0x05b4: (0x05b4, None, "Allowed"), #  HEBREW POINT HIRIQ
+ 0x05d0: (0x05d0, 0x05ea, "Allowed"), #  HEBREW LETTER ALEF..HEBREW LETTER TAV
+ 0x05ef: (0x05ef, None, "Allowed"), #  HEBREW YOD TRIANGLE
+ 0x05f0: (0x05f0, 0x05f4, "Allowed"), #  HEBREW LIGATURE YIDDISH DOUBLE VAV..HEBREW PUNCTUATION GERSHAYIM
+ 0x0620: (0x0620, None, "Allowed"), #  ARABIC LETTER KASHMIRI YEH
+ 0x0621: (0x0621, 0x063a, "Allowed"), #  ARABIC LETTER HAMZA..ARABIC LETTER GHAIN
+ 0x063b: (0x063b, 0x063f, "Allowed"), #  ARABIC LETTER KEHEH WITH TWO DOTS ABOVE..ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE
+ 0x0641: (0x0641, 0x0652, "Allowed"), #  ARABIC LETTER FEH..ARABIC SUKUN
+ 0x0653: (0x0653, 0x0655, "Allowed"), #  ARABIC MADDAH ABOVE..ARABIC HAMZA BELOW
+ 0x0660: (0x0660, 0x0669, "Allowed"), #  ARABIC-INDIC DIGIT ZERO..ARABIC-INDIC DIGIT NINE
+ 0x0670: (0x0670, 0x0672, "Allowed"), #  ARABIC LETTER SUPERSCRIPT ALEF..ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE
+ 0x0674: (0x0674, None, "Allowed"), #  ARABIC LETTER HIGH HAMZA
+ 0x0679: (0x0679, 0x068d, "Allowed"), #  ARABIC LETTER TTEH..ARABIC LETTER DDAHAL
+ 0x068f: (0x068f, 0x06b7, "Allowed"), #  ARABIC LETTER DAL WITH THREE DOTS ABOVE DOWNWARDS..ARABIC LETTER LAM WITH THREE DOTS ABOVE
+ 0x06b8: (0x06b8, 0x06b9, "Allowed"), #  ARABIC LETTER LAM WITH THREE DOTS BELOW..ARABIC LETTER NOON WITH DOT BELOW
+ 0x06ba: (0x06ba, 0x06be, "Allowed"), #  ARABIC LETTER NOON GHUNNA..ARABIC LETTER HEH DOACHASHMEE
+ 0x06bf: (0x06bf, None, "Allowed"), #  ARABIC LETTER TCHEH WITH DOT ABOVE
+ 0x06c0: (0x06c0, 0x06ce, "Allowed"), #  ARABIC LETTER HEH WITH YEH ABOVE..ARABIC LETTER YEH WITH SMALL V
+ 0x06cf: (0x06cf, None, "Allowed"), #  ARABIC LETTER WAW WITH DOT ABOVE
+ 0x06d0: (0x06d0, 0x06d3, "Allowed"), #  ARABIC LETTER E..ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
+ 0x06d5: (0x06d5, None, "Allowed"), #  ARABIC LETTER AE
+ 0x06e5: (0x06e5, 0x06e6, "Allowed"), #  ARABIC SMALL WAW..ARABIC SMALL YEH
+ 0x06ee: (0x06ee, 0x06ef, "Allowed"), #  ARABIC LETTER DAL WITH INVERTED V..ARABIC LETTER REH WITH INVERTED V
+ 0x06f0: (0x06f0, 0x06f9, "Allowed"), #  EXTENDED ARABIC-INDIC DIGIT ZERO..EXTENDED ARABIC-INDIC DIGIT NINE
+ 0x06fa: (0x06fa, 0x06fe, "Allowed"), #  ARABIC LETTER SHEEN WITH DOT BELOW..ARABIC SIGN SINDHI POSTPOSITION MEN
+ 0x06ff: (0x06ff, None, "Allowed"), #  ARABIC LETTER HEH WITH INVERTED V
+ 0x0750: (0x0750, 0x076d, "Allowed"), #  ARABIC LETTER BEH WITH THREE DOTS HORIZONTALLY BELOW..ARABIC LETTER SEEN WITH TWO DOTS VERTICALLY ABOVE
+ 0x076e: (0x076e, 0x077f, "Allowed"), #  ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH BELOW..ARABIC LETTER KAF WITH TWO DOTS ABOVE
+ 0x0780: (0x0780, 0x07b0, "Allowed"), #  THAANA LETTER HAA..THAANA SUKUN
+ 0x07b1: (0x07b1, None, "Allowed"), #  THAANA LETTER NAA
+ 0x08a0: (0x08a0, None, "Allowed"), #  ARABIC LETTER BEH WITH SMALL V BELOW
+ 0x08a1: (0x08a1, None, "Allowed"), #  ARABIC LETTER BEH WITH HAMZA ABOVE
+ 0x08a2: (0x08a2, 0x08ac, "Allowed"), #  ARABIC LETTER JEEM WITH TWO DOTS ABOVE..ARABIC LETTER ROHINGYA YEH
+ 0x08b2: (0x08b2, None, "Allowed"), #  ARABIC LETTER ZAIN WITH INVERTED V ABOVE
+ 0x08b6: (0x08b6, 0x08bd, "Allowed"), #  ARABIC LETTER BEH WITH SMALL MEEM ABOVE..ARABIC LETTER AFRICAN NOON
+ 0x0901: (0x0901, 0x0903, "Allowed"), #  DEVANAGARI SIGN CANDRABINDU..DEVANAGARI SIGN VISARGA
+ 0x0904: (0x0904, None, "Allowed"), #  DEVANAGARI LETTER SHORT A
+ 0x0905: (0x0905, 0x0939, "Allowed"), #  DEVANAGARI LETTER A..DEVANAGARI LETTER HA
+ 0x093a: (0x093a, 0x093b, "Allowed"), #  DEVANAGARI VOWEL SIGN OE..DEVANAGARI VOWEL SIGN OOE
+ 0x093c: (0x093c, 0x094d, "Allowed"), #  DEVANAGARI SIGN NUKTA..DEVANAGARI SIGN VIRAMA
+ 0x094f: (0x094f, None, "Allowed"), #  DEVANAGARI VOWEL SIGN AW
+ 0x0950: (0x0950, None, "Allowed"), #  DEVANAGARI OM
+ 0x0956: (0x0956, 0x0957, "Allowed"), #  DEVANAGARI VOWEL SIGN UE..DEVANAGARI VOWEL SIGN UUE
+ 0x0960: (0x0960, 0x0963, "Allowed"), #  DEVANAGARI LETTER VOCALIC RR..DEVANAGARI VOWEL SIGN VOCALIC LL
+ 0x0966: (0x0966, 0x096f, "Allowed"), #  DEVANAGARI DIGIT ZERO..DEVANAGARI DIGIT NINE
+ 0x0971: (0x0971, 0x0972, "Allowed"), #  DEVANAGARI SIGN HIGH SPACING DOT..DEVANAGARI LETTER CANDRA A
+ 0x0973: (0x0973, 0x0977, "Allowed"), #  DEVANAGARI LETTER OE..DEVANAGARI LETTER UUE
+ 0x0979: (0x0979, 0x097a, "Allowed"), #  DEVANAGARI LETTER ZHA..DEVANAGARI LETTER HEAVY YA
+ 0x097b: (0x097b, 0x097c, "Allowed"), #  DEVANAGARI LETTER GGA..DEVANAGARI LETTER JJA
+ 0x097d: (0x097d, None, "Allowed"), #  DEVANAGARI LETTER GLOTTAL STOP
+ 0x097e: (0x097e, 0x097f, "Allowed"), #  DEVANAGARI LETTER DDDA..DEVANAGARI LETTER BBA
+ 0x0981: (0x0981, 0x0983, "Allowed"), #  BENGALI SIGN CANDRABINDU..BENGALI SIGN VISARGA
+ 0x0985: (0x0985, 0x098c, "Allowed"), #  BENGALI LETTER A..BENGALI LETTER VOCALIC L
+ 0x098f: (0x098f, 0x0990, "Allowed"), #  BENGALI LETTER E..BENGALI LETTER AI
+ 0x0993: (0x0993, 0x09a8, "Allowed"), #  BENGALI LETTER O..BENGALI LETTER NA
+ 0x09aa: (0x09aa, 0x09b0, "Allowed"), #  BENGALI LETTER PA..BENGALI LETTER RA
+ 0x09b2: (0x09b2, None, "Allowed"), #  BENGALI LETTER LA
+ 0x09b6: (0x09b6, 0x09b9, "Allowed"), #  BENGALI LETTER SHA..BENGALI LETTER HA
+ 0x09bc: (0x09bc, None, "Allowed"), #  BENGALI SIGN NUKTA
+ 0x09bd: (0x09bd, None, "Allowed"), #  BENGALI SIGN AVAGRAHA
+ 0x09be: (0x09be, 0x09c4, "Allowed"), #  BENGALI VOWEL SIGN AA..BENGALI VOWEL SIGN VOCALIC RR
+ 0x09c7: (0x09c7, 0x09c8, "Allowed"), #  BENGALI VOWEL SIGN E..BENGALI VOWEL SIGN AI
+ 0x09cb: (0x09cb, 0x09cd, "Allowed"), #  BENGALI VOWEL SIGN O..BENGALI SIGN VIRAMA
+ 0x09ce: (0x09ce, None, "Allowed"), #  BENGALI LETTER KHANDA TA
+ 0x09d7: (0x09d7, None, "Allowed"), #  BENGALI AU LENGTH MARK
+ 0x09e0: (0x09e0, 0x09e3, "Allowed"), #  BENGALI LETTER VOCALIC RR..BENGALI VOWEL SIGN VOCALIC LL
+ 0x09e6: (0x09e6, 0x09f1, "Allowed"), #  BENGALI DIGIT ZERO..BENGALI LETTER RA WITH LOWER DIAGONAL
+ 0x09fc: (0x09fc, None, "Allowed"), #  BENGALI LETTER VEDIC ANUSVARA
+ 0x09fe: (0x09fe, None, "Allowed"), #  BENGALI SANDHI MARK
+ 0x0a01: (0x0a01, None, "Allowed"), #  GURMUKHI SIGN ADAK BINDI
+ 0x0a02: (0x0a02, None, "Allowed"), #  GURMUKHI SIGN BINDI
+ 0x0a03: (0x0a03, None, "Allowed"), #  GURMUKHI SIGN VISARGA
+ 0x0a05: (0x0a05, 0x0a0a, "Allowed"), #  GURMUKHI LETTER A..GURMUKHI LETTER UU
+ 0x0a0f: (0x0a0f, 0x0a10, "Allowed"), #  GURMUKHI LETTER EE..GURMUKHI LETTER AI
+ 0x0a13: (0x0a13, 0x0a28, "Allowed"), #  GURMUKHI LETTER OO..GURMUKHI LETTER NA
+ 0x0a2a: (0x0a2a, 0x0a30, "Allowed"), #  GURMUKHI LETTER PA..GURMUKHI LETTER RA
+ 0x0a32: (0x0a32, None, "Allowed"), #  GURMUKHI LETTER LA
+ 0x0a35: (0x0a35, None, "Allowed"), #  GURMUKHI LETTER VA
+ 0x0a38: (0x0a38, 0x0a39, "Allowed"), #  GURMUKHI LETTER SA..GURMUKHI LETTER HA
+ 0x0a3c: (0x0a3c, None, "Allowed"), #  GURMUKHI SIGN NUKTA
+ 0x0a3e: (0x0a3e, 0x0a42, "Allowed"), #  GURMUKHI VOWEL SIGN AA..GURMUKHI VOWEL SIGN UU
+ 0x0a47: (0x0a47, 0x0a48, "Allowed"), #  GURMUKHI VOWEL SIGN EE..GURMUKHI VOWEL SIGN AI
+ 0x0a4b: (0x0a4b, 0x0a4d, "Allowed"), #  GURMUKHI VOWEL SIGN OO..GURMUKHI SIGN VIRAMA
+ 0x0a5c: (0x0a5c, None, "Allowed"), #  GURMUKHI LETTER RRA
+ 0x0a66: (0x0a66, 0x0a74, "Allowed"), #  GURMUKHI DIGIT ZERO..GURMUKHI EK ONKAR
+ 0x0a81: (0x0a81, 0x0a83, "Allowed"), #  GUJARATI SIGN CANDRABINDU..GUJARATI SIGN VISARGA
+ 0x0a85: (0x0a85, 0x0a8b, "Allowed"), #  GUJARATI LETTER A..GUJARATI LETTER VOCALIC R
+ 0x0a8c: (0x0a8c, None, "Allowed"), #  GUJARATI LETTER VOCALIC L
+ 0x0a8d: (0x0a8d, None, "Allowed"), #  GUJARATI VOWEL CANDRA E
+ 0x0a8f: (0x0a8f, 0x0a91, "Allowed"), #  GUJARATI LETTER E..GUJARATI VOWEL CANDRA O
+ 0x0a93: (0x0a93, 0x0aa8, "Allowed"), #  GUJARATI LETTER O..GUJARATI LETTER NA
+ 0x0aaa: (0x0aaa, 0x0ab0, "Allowed"), #  GUJARATI LETTER PA..GUJARATI LETTER RA
+ 0x0ab2: (0x0ab2, 0x0ab3, "Allowed"), #  GUJARATI LETTER LA..GUJARATI LETTER LLA
+ 0x0ab5: (0x0ab5, 0x0ab9, "Allowed"), #  GUJARATI LETTER VA..GUJARATI LETTER HA
+ 0x0abc: (0x0abc, 0x0ac5, "Allowed"), #  GUJARATI SIGN NUKTA..GUJARATI VOWEL SIGN CANDRA E
+ 0x0ac7: (0x0ac7, 0x0ac9, "Allowed"), #  GUJARATI VOWEL SIGN E..GUJARATI VOWEL SIGN CANDRA O
+ 0x0acb: (0x0acb, 0x0acd, "Allowed"), #  GUJARATI VOWEL SIGN O..GUJARATI SIGN VIRAMA
+ 0x0ad0: (0x0ad0, None, "Allowed"), #  GUJARATI OM
+ 0x0ae0: (0x0ae0, None, "Allowed"), #  GUJARATI LETTER VOCALIC RR
+ 0x0ae1: (0x0ae1, 0x0ae3, "Allowed"), #  GUJARATI LETTER VOCALIC LL..GUJARATI VOWEL SIGN VOCALIC LL
+ 0x0ae6: (0x0ae6, 0x0aef, "Allowed"), #  GUJARATI DIGIT ZERO..GUJARATI DIGIT NINE
+ 0x0afa: (0x0afa, 0x0aff, "Allowed"), #  GUJARATI SIGN SUKUN..GUJARATI SIGN TWO-CIRCLE NUKTA ABOVE
+ 0x0b01: (0x0b01, 0x0b03, "Allowed"), #  ORIYA SIGN CANDRABINDU..ORIYA SIGN VISARGA
+ 0x0b05: (0x0b05, 0x0b0c, "Allowed"), #  ORIYA LETTER A..ORIYA LETTER VOCALIC L
+ 0x0b0f: (0x0b0f, 0x0b10, "Allowed"), #  ORIYA LETTER E..ORIYA LETTER AI
+ 0x0b13: (0x0b13, 0x0b28, "Allowed"), #  ORIYA LETTER O..ORIYA LETTER NA
+ 0x0b2a: (0x0b2a, 0x0b30, "Allowed"), #  ORIYA LETTER PA..ORIYA LETTER RA
+ 0x0b32: (0x0b32, 0x0b33, "Allowed"), #  ORIYA LETTER LA..ORIYA LETTER LLA
+ 0x0b35: (0x0b35, None, "Allowed"), #  ORIYA LETTER VA
+ 0x0b36: (0x0b36, 0x0b39, "Allowed"), #  ORIYA LETTER SHA..ORIYA LETTER HA
+ 0x0b3c: (0x0b3c, 0x0b43, "Allowed"), #  ORIYA SIGN NUKTA..ORIYA VOWEL SIGN VOCALIC R
+ 0x0b47: (0x0b47, 0x0b48, "Allowed"), #  ORIYA VOWEL SIGN E..ORIYA VOWEL SIGN AI
+ 0x0b4b: (0x0b4b, 0x0b4d, "Allowed"), #  ORIYA VOWEL SIGN O..ORIYA SIGN VIRAMA
+ 0x0b56: (0x0b56, 0x0b57, "Allowed"), #  ORIYA AI LENGTH MARK..ORIYA AU LENGTH MARK
+ 0x0b5f: (0x0b5f, 0x0b61, "Allowed"), #  ORIYA LETTER YYA..ORIYA LETTER VOCALIC LL
+ 0x0b66: (0x0b66, 0x0b6f, "Allowed"), #  ORIYA DIGIT ZERO..ORIYA DIGIT NINE
+ 0x0b71: (0x0b71, None, "Allowed"), #  ORIYA LETTER WA
+ 0x0b82: (0x0b82, 0x0b83, "Allowed"), #  TAMIL SIGN ANUSVARA..TAMIL SIGN VISARGA
+ 0x0b85: (0x0b85, 0x0b8a, "Allowed"), #  TAMIL LETTER A..TAMIL LETTER UU
+ 0x0b8e: (0x0b8e, 0x0b90, "Allowed"), #  TAMIL LETTER E..TAMIL LETTER AI
+ 0x0b92: (0x0b92, 0x0b95, "Allowed"), #  TAMIL LETTER O..TAMIL LETTER KA
+ 0x0b99: (0x0b99, 0x0b9a, "Allowed"), #  TAMIL LETTER NGA..TAMIL LETTER CA
+ 0x0b9c: (0x0b9c, None, "Allowed"), #  TAMIL LETTER JA
+ 0x0b9e: (0x0b9e, 0x0b9f, "Allowed"), #  TAMIL LETTER NYA..TAMIL LETTER TTA
+ 0x0ba3: (0x0ba3, 0x0ba4, "Allowed"), #  TAMIL LETTER NNA..TAMIL LETTER TA
+ 0x0ba8: (0x0ba8, 0x0baa, "Allowed"), #  TAMIL LETTER NA..TAMIL LETTER PA
+ 0x0bae: (0x0bae, 0x0bb5, "Allowed"), #  TAMIL LETTER MA..TAMIL LETTER VA
+ 0x0bb6: (0x0bb6, None, "Allowed"), #  TAMIL LETTER SHA
+ 0x0bb7: (0x0bb7, 0x0bb9, "Allowed"), #  TAMIL LETTER SSA..TAMIL LETTER HA
+ 0x0bbe: (0x0bbe, 0x0bc2, "Allowed"), #  TAMIL VOWEL SIGN AA..TAMIL VOWEL SIGN UU
+ 0x0bc6: (0x0bc6, 0x0bc8, "Allowed"), #  TAMIL VOWEL SIGN E..TAMIL VOWEL SIGN AI
+ 0x0bca: (0x0bca, 0x0bcd, "Allowed"), #  TAMIL VOWEL SIGN O..TAMIL SIGN VIRAMA
+ 0x0bd0: (0x0bd0, None, "Allowed"), #  TAMIL OM
+ 0x0bd7: (0x0bd7, None, "Allowed"), #  TAMIL AU LENGTH MARK
+ 0x0be6: (0x0be6, None, "Allowed"), #  TAMIL DIGIT ZERO
+ 0x0be7: (0x0be7, 0x0bef, "Allowed"), #  TAMIL DIGIT ONE..TAMIL DIGIT NINE
+ 0x0c01: (0x0c01, 0x0c03, "Allowed"), #  TELUGU SIGN CANDRABINDU..TELUGU SIGN VISARGA
+ 0x0c04: (0x0c04, None, "Allowed"), #  TELUGU SIGN COMBINING ANUSVARA ABOVE
+ 0x0c05: (0x0c05, 0x0c0c, "Allowed"), #  TELUGU LETTER A..TELUGU LETTER VOCALIC L
+ 0x0c0e: (0x0c0e, 0x0c10, "Allowed"), #  TELUGU LETTER E..TELUGU LETTER AI
+ 0x0c12: (0x0c12, 0x0c28, "Allowed"), #  TELUGU LETTER O..TELUGU LETTER NA
+ 0x0c2a: (0x0c2a, 0x0c33, "Allowed"), #  TELUGU LETTER PA..TELUGU LETTER LLA
+ 0x0c35: (0x0c35, 0x0c39, "Allowed"), #  TELUGU LETTER VA..TELUGU LETTER HA
+ 0x0c3d: (0x0c3d, None, "Allowed"), #  TELUGU SIGN AVAGRAHA
+ 0x0c3e: (0x0c3e, 0x0c44, "Allowed"), #  TELUGU VOWEL SIGN AA..TELUGU VOWEL SIGN VOCALIC RR
+ 0x0c46: (0x0c46, 0x0c48, "Allowed"), #  TELUGU VOWEL SIGN E..TELUGU VOWEL SIGN AI
+ 0x0c4a: (0x0c4a, 0x0c4d, "Allowed"), #  TELUGU VOWEL SIGN O..TELUGU SIGN VIRAMA
+ 0x0c55: (0x0c55, 0x0c56, "Allowed"), #  TELUGU LENGTH MARK..TELUGU AI LENGTH MARK
+ 0x0c60: (0x0c60, 0x0c61, "Allowed"), #  TELUGU LETTER VOCALIC RR..TELUGU LETTER VOCALIC LL
+ 0x0c66: (0x0c66, 0x0c6f, "Allowed"), #  TELUGU DIGIT ZERO..TELUGU DIGIT NINE
+ 0x0c80: (0x0c80, None, "Allowed"), #  KANNADA SIGN SPACING CANDRABINDU
+ 0x0c82: (0x0c82, 0x0c83, "Allowed"), #  KANNADA SIGN ANUSVARA..KANNADA SIGN VISARGA
+ 0x0c85: (0x0c85, 0x0c8c, "Allowed"), #  KANNADA LETTER A..KANNADA LETTER VOCALIC L
+ 0x0c8e: (0x0c8e, 0x0c90, "Allowed"), #  KANNADA LETTER E..KANNADA LETTER AI
+ 0x0c92: (0x0c92, 0x0ca8, "Allowed"), #  KANNADA LETTER O..KANNADA LETTER NA
+ 0x0caa: (0x0caa, 0x0cb3, "Allowed"), #  KANNADA LETTER PA..KANNADA LETTER LLA
+ 0x0cb5: (0x0cb5, 0x0cb9, "Allowed"), #  KANNADA LETTER VA..KANNADA LETTER HA
+ 0x0cbc: (0x0cbc, 0x0cbd, "Allowed"), #  KANNADA SIGN NUKTA..KANNADA SIGN AVAGRAHA
+ 0x0cbe: (0x0cbe, 0x0cc4, "Allowed"), #  KANNADA VOWEL SIGN AA..KANNADA VOWEL SIGN VOCALIC RR
+ 0x0cc6: (0x0cc6, 0x0cc8, "Allowed"), #  KANNADA VOWEL SIGN E..KANNADA VOWEL SIGN AI
+ 0x0cca: (0x0cca, 0x0ccd, "Allowed"), #  KANNADA VOWEL SIGN O..KANNADA SIGN VIRAMA
+ 0x0cd5: (0x0cd5, 0x0cd6, "Allowed"), #  KANNADA LENGTH MARK..KANNADA AI LENGTH MARK
+ 0x0ce0: (0x0ce0, 0x0ce1, "Allowed"), #  KANNADA LETTER VOCALIC RR..KANNADA LETTER VOCALIC LL
+ 0x0ce2: (0x0ce2, 0x0ce3, "Allowed"), #  KANNADA VOWEL SIGN VOCALIC L..KANNADA VOWEL SIGN VOCALIC LL
+ 0x0ce6: (0x0ce6, 0x0cef, "Allowed"), #  KANNADA DIGIT ZERO..KANNADA DIGIT NINE
+ 0x0cf1: (0x0cf1, 0x0cf2, "Allowed"), #  KANNADA SIGN JIHVAMULIYA..KANNADA SIGN UPADHMANIYA
+ 0x0d00: (0x0d00, None, "Allowed"), #  MALAYALAM SIGN COMBINING ANUSVARA ABOVE
+ 0x0d02: (0x0d02, 0x0d03, "Allowed"), #  MALAYALAM SIGN ANUSVARA..MALAYALAM SIGN VISARGA
+ 0x0d05: (0x0d05, 0x0d0c, "Allowed"), #  MALAYALAM LETTER A..MALAYALAM LETTER VOCALIC L
+ 0x0d0e: (0x0d0e, 0x0d10, "Allowed"), #  MALAYALAM LETTER E..MALAYALAM LETTER AI
+ 0x0d12: (0x0d12, 0x0d28, "Allowed"), #  MALAYALAM LETTER O..MALAYALAM LETTER NA
+ 0x0d29: (0x0d29, None, "Allowed"), #  MALAYALAM LETTER NNNA
+ 0x0d2a: (0x0d2a, 0x0d39, "Allowed"), #  MALAYALAM LETTER PA..MALAYALAM LETTER HA
+ 0x0d3a: (0x0d3a, None, "Allowed"), #  MALAYALAM LETTER TTTA
+ 0x0d3b: (0x0d3b, 0x0d3c, "Allowed"), #  MALAYALAM SIGN VERTICAL BAR VIRAMA..MALAYALAM SIGN CIRCULAR VIRAMA
+ 0x0d3d: (0x0d3d, None, "Allowed"), #  MALAYALAM SIGN AVAGRAHA
+ 0x0d3e: (0x0d3e, 0x0d43, "Allowed"), #  MALAYALAM VOWEL SIGN AA..MALAYALAM VOWEL SIGN VOCALIC R
+ 0x0d46: (0x0d46, 0x0d48, "Allowed"), #  MALAYALAM VOWEL SIGN E..MALAYALAM VOWEL SIGN AI
+ 0x0d4a: (0x0d4a, 0x0d4d, "Allowed"), #  MALAYALAM VOWEL SIGN O..MALAYALAM SIGN VIRAMA
+ 0x0d4e: (0x0d4e, None, "Allowed"), #  MALAYALAM LETTER DOT REPH
+ 0x0d54: (0x0d54, 0x0d56, "Allowed"), #  MALAYALAM LETTER CHILLU M..MALAYALAM LETTER CHILLU LLL
+ 0x0d57: (0x0d57, None, "Allowed"), #  MALAYALAM AU LENGTH MARK
+ 0x0d60: (0x0d60, 0x0d61, "Allowed"), #  MALAYALAM LETTER VOCALIC RR..MALAYALAM LETTER VOCALIC LL
+ 0x0d66: (0x0d66, 0x0d6f, "Allowed"), #  MALAYALAM DIGIT ZERO..MALAYALAM DIGIT NINE
+ 0x0d7a: (0x0d7a, 0x0d7f, "Allowed"), #  MALAYALAM LETTER CHILLU NN..MALAYALAM LETTER CHILLU K
+ 0x0d82: (0x0d82, 0x0d83, "Allowed"), #  SINHALA SIGN ANUSVARAYA..SINHALA SIGN VISARGAYA
+ 0x0d85: (0x0d85, 0x0d8e, "Allowed"), #  SINHALA LETTER AYANNA..SINHALA LETTER IRUUYANNA
+ 0x0d91: (0x0d91, 0x0d96, "Allowed"), #  SINHALA LETTER EYANNA..SINHALA LETTER AUYANNA
+ 0x0d9a: (0x0d9a, 0x0da5, "Allowed"), #  SINHALA LETTER ALPAPRAANA KAYANNA..SINHALA LETTER TAALUJA SANYOOGA NAAKSIKYAYA
+ 0x0da7: (0x0da7, 0x0db1, "Allowed"), #  SINHALA LETTER ALPAPRAANA TTAYANNA..SINHALA LETTER DANTAJA NAYANNA
+ 0x0db3: (0x0db3, 0x0dbb, "Allowed"), #  SINHALA LETTER SANYAKA DAYANNA..SINHALA LETTER RAYANNA
+ 0x0dbd: (0x0dbd, None, "Allowed"), #  SINHALA LETTER DANTAJA LAYANNA
+ 0x0dc0: (0x0dc0, 0x0dc6, "Allowed"), #  SINHALA LETTER VAYANNA..SINHALA LETTER FAYANNA
+ 0x0dca: (0x0dca, None, "Allowed"), #  SINHALA SIGN AL-LAKUNA
+ 0x0dcf: (0x0dcf, 0x0dd4, "Allowed"), #  SINHALA VOWEL SIGN AELA-PILLA..SINHALA VOWEL SIGN KETTI PAA-PILLA
+ 0x0dd6: (0x0dd6, None, "Allowed"), #  SINHALA VOWEL SIGN DIGA PAA-PILLA
+ 0x0dd8: (0x0dd8, 0x0dde, "Allowed"), #  SINHALA VOWEL SIGN GAETTA-PILLA..SINHALA VOWEL SIGN KOMBUVA HAA GAYANUKITTA
+ 0x0df2: (0x0df2, None, "Allowed"), #  SINHALA VOWEL SIGN DIGA GAETTA-PILLA
+ 0x0e01: (0x0e01, 0x0e32, "Allowed"), #  THAI CHARACTER KO KAI..THAI CHARACTER SARA AA
+ 0x0e34: (0x0e34, 0x0e3a, "Allowed"), #  THAI CHARACTER SARA I..THAI CHARACTER PHINTHU
+ 0x0e40: (0x0e40, 0x0e4e, "Allowed"), #  THAI CHARACTER SARA E..THAI CHARACTER YAMAKKAN
+ 0x0e50: (0x0e50, 0x0e59, "Allowed"), #  THAI DIGIT ZERO..THAI DIGIT NINE
+ 0x0e81: (0x0e81, 0x0e82, "Allowed"), #  LAO LETTER KO..LAO LETTER KHO SUNG
+ 0x0e84: (0x0e84, None, "Allowed"), #  LAO LETTER KHO TAM
+ 0x0e87: (0x0e87, 0x0e88, "Allowed"), #  LAO LETTER NGO..LAO LETTER CO
+ 0x0e8a: (0x0e8a, None, "Allowed"), #  LAO LETTER SO TAM
+ 0x0e8d: (0x0e8d, None, "Allowed"), #  LAO LETTER NYO
+ 0x0e94: (0x0e94, 0x0e97, "Allowed"), #  LAO LETTER DO..LAO LETTER THO TAM
+ 0x0e99: (0x0e99, 0x0e9f, "Allowed"), #  LAO LETTER NO..LAO LETTER FO SUNG
+ 0x0ea1: (0x0ea1, 0x0ea3, "Allowed"), #  LAO LETTER MO..LAO LETTER LO LING
+ 0x0ea5: (0x0ea5, None, "Allowed"), #  LAO LETTER LO LOOT
+ 0x0ea7: (0x0ea7, None, "Allowed"), #  LAO LETTER WO
+ 0x0eaa: (0x0eaa, 0x0eab, "Allowed"), #  LAO LETTER SO SUNG..LAO LETTER HO SUNG
+ 0x0ead: (0x0ead, 0x0eb2, "Allowed"), #  LAO LETTER O..LAO VOWEL SIGN AA
+ 0x0eb4: (0x0eb4, 0x0eb9, "Allowed"), #  LAO VOWEL SIGN I..LAO VOWEL SIGN UU
+ 0x0ebb: (0x0ebb, 0x0ebd, "Allowed"), #  LAO VOWEL SIGN MAI KON..LAO SEMIVOWEL SIGN NYO
+ 0x0ec0: (0x0ec0, 0x0ec4, "Allowed"), #  LAO VOWEL SIGN E..LAO VOWEL SIGN AI
+ 0x0ec6: (0x0ec6, None, "Allowed"), #  LAO KO LA
+ 0x0ec8: (0x0ec8, 0x0ecd, "Allowed"), #  LAO TONE MAI EK..LAO NIGGAHITA
+ 0x0ed0: (0x0ed0, 0x0ed9, "Allowed"), #  LAO DIGIT ZERO..LAO DIGIT NINE
+ 0x0ede: (0x0ede, 0x0edf, "Allowed"), #  LAO LETTER KHMU GO..LAO LETTER KHMU NYO
+ 0x0f00: (0x0f00, None, "Allowed"), #  TIBETAN SYLLABLE OM
+ 0x0f0b: (0x0f0b, None, "Allowed"), #  TIBETAN MARK INTERSYLLABIC TSHEG
+ 0x0f20: (0x0f20, 0x0f29, "Allowed"), #  TIBETAN DIGIT ZERO..TIBETAN DIGIT NINE
+ 0x0f35: (0x0f35, None, "Allowed"), #  TIBETAN MARK NGAS BZUNG NYI ZLA
+ 0x0f37: (0x0f37, None, "Allowed"), #  TIBETAN MARK NGAS BZUNG SGOR RTAGS
+ 0x0f3e: (0x0f3e, 0x0f42, "Allowed"), #  TIBETAN SIGN YAR TSHES..TIBETAN LETTER GA
+ 0x0f44: (0x0f44, 0x0f47, "Allowed"), #  TIBETAN LETTER NGA..TIBETAN LETTER JA
+ 0x0f49: (0x0f49, 0x0f4c, "Allowed"), #  TIBETAN LETTER NYA..TIBETAN LETTER DDA
+ 0x0f4e: (0x0f4e, 0x0f51, "Allowed"), #  TIBETAN LETTER NNA..TIBETAN LETTER DA
+ 0x0f53: (0x0f53, 0x0f56, "Allowed"), #  TIBETAN LETTER NA..TIBETAN LETTER BA
+ 0x0f58: (0x0f58, 0x0f5b, "Allowed"), #  TIBETAN LETTER MA..TIBETAN LETTER DZA
+ 0x0f5d: (0x0f5d, 0x0f68, "Allowed"), #  TIBETAN LETTER WA..TIBETAN LETTER A
+ 0x0f6a: (0x0f6a, None, "Allowed"), #  TIBETAN LETTER FIXED-FORM RA
+ 0x0f6b: (0x0f6b, 0x0f6c, "Allowed"), #  TIBETAN LETTER KKA..TIBETAN LETTER RRA
+ 0x0f71: (0x0f71, 0x0f72, "Allowed"), #  TIBETAN VOWEL SIGN AA..TIBETAN VOWEL SIGN I
+ 0x0f74: (0x0f74, None, "Allowed"), #  TIBETAN VOWEL SIGN U
+ 0x0f7a: (0x0f7a, 0x0f80, "Allowed"), #  TIBETAN VOWEL SIGN E..TIBETAN VOWEL SIGN REVERSED I
+ 0x0f82: (0x0f82, 0x0f84, "Allowed"), #  TIBETAN SIGN NYI ZLA NAA DA..TIBETAN MARK HALANTA
+ 0x0f86: (0x0f86, 0x0f8b, "Allowed"), #  TIBETAN SIGN LCI RTAGS..TIBETAN SIGN GRU MED RGYINGS
+ 0x0f8c: (0x0f8c, 0x0f8f, "Allowed"), #  TIBETAN SIGN INVERTED MCHU CAN..TIBETAN SUBJOINED SIGN INVERTED MCHU CAN
+ 0x0f90: (0x0f90, 0x0f92, "Allowed"), #  TIBETAN SUBJOINED LETTER KA..TIBETAN SUBJOINED LETTER GA
+ 0x0f94: (0x0f94, 0x0f95, "Allowed"), #  TIBETAN SUBJOINED LETTER NGA..TIBETAN SUBJOINED LETTER CA
+ 0x0f96: (0x0f96, None, "Allowed"), #  TIBETAN SUBJOINED LETTER CHA
+ 0x0f97: (0x0f97, None, "Allowed"), #  TIBETAN SUBJOINED LETTER JA
+ 0x0f99: (0x0f99, 0x0f9c, "Allowed"), #  TIBETAN SUBJOINED LETTER NYA..TIBETAN SUBJOINED LETTER DDA
+ 0x0f9e: (0x0f9e, 0x0fa1, "Allowed"), #  TIBETAN SUBJOINED LETTER NNA..TIBETAN SUBJOINED LETTER DA
+ 0x0fa3: (0x0fa3, 0x0fa6, "Allowed"), #  TIBETAN SUBJOINED LETTER NA..TIBETAN SUBJOINED LETTER BA
+ 0x0fa8: (0x0fa8, 0x0fab, "Allowed"), #  TIBETAN SUBJOINED LETTER MA..TIBETAN SUBJOINED LETTER DZA
+ 0x0fad: (0x0fad, None, "Allowed"), #  TIBETAN SUBJOINED LETTER WA
+ 0x0fae: (0x0fae, 0x0fb0, "Allowed"), #  TIBETAN SUBJOINED LETTER ZHA..TIBETAN SUBJOINED LETTER -A
+ 0x0fb1: (0x0fb1, 0x0fb7, "Allowed"), #  TIBETAN SUBJOINED LETTER YA..TIBETAN SUBJOINED LETTER HA
+ 0x0fb8: (0x0fb8, None, "Allowed"), #  TIBETAN SUBJOINED LETTER A
+ 0x0fba: (0x0fba, 0x0fbc, "Allowed"), #  TIBETAN SUBJOINED LETTER FIXED-FORM WA..TIBETAN SUBJOINED LETTER FIXED-FORM RA
+ 0x0fc6: (0x0fc6, None, "Allowed"), #  TIBETAN SYMBOL PADMA GDAN
+ 0x1000: (0x1000, 0x1021, "Allowed"), #  MYANMAR LETTER KA..MYANMAR LETTER A
+ 0x1022: (0x1022, None, "Allowed"), #  MYANMAR LETTER SHAN A
+ 0x1023: (0x1023, 0x1027, "Allowed"), #  MYANMAR LETTER I..MYANMAR LETTER E
+ 0x1028: (0x1028, None, "Allowed"), #  MYANMAR LETTER MON E
+ 0x1029: (0x1029, 0x102a, "Allowed"), #  MYANMAR LETTER O..MYANMAR LETTER AU
+ 0x102b: (0x102b, None, "Allowed"), #  MYANMAR VOWEL SIGN TALL AA
+ 0x102c: (0x102c, 0x1032, "Allowed"), #  MYANMAR VOWEL SIGN AA..MYANMAR VOWEL SIGN AI
+ 0x1033: (0x1033, 0x1035, "Allowed"), #  MYANMAR VOWEL SIGN MON II..MYANMAR VOWEL SIGN E ABOVE
+ 0x1036: (0x1036, 0x1039, "Allowed"), #  MYANMAR SIGN ANUSVARA..MYANMAR SIGN VIRAMA
+ 0x103a: (0x103a, 0x103f, "Allowed"), #  MYANMAR SIGN ASAT..MYANMAR LETTER GREAT SA
+ 0x1040: (0x1040, 0x1049, "Allowed"), #  MYANMAR DIGIT ZERO..MYANMAR DIGIT NINE
+ 0x1050: (0x1050, 0x1059, "Allowed"), #  MYANMAR LETTER SHA..MYANMAR VOWEL SIGN VOCALIC LL
+ 0x105a: (0x105a, 0x1099, "Allowed"), #  MYANMAR LETTER MON NGA..MYANMAR SHAN DIGIT NINE
+ 0x109a: (0x109a, 0x109d, "Allowed"), #  MYANMAR SIGN KHAMTI TONE-1..MYANMAR VOWEL SIGN AITON AI
+ 0x10c7: (0x10c7, None, "Allowed"), #  GEORGIAN CAPITAL LETTER YN
+ 0x10cd: (0x10cd, None, "Allowed"), #  GEORGIAN CAPITAL LETTER AEN
+ 0x10d0: (0x10d0, 0x10f0, "Allowed"), #  GEORGIAN LETTER AN..GEORGIAN LETTER HAE
+ 0x10f7: (0x10f7, 0x10f8, "Allowed"), #  GEORGIAN LETTER YN..GEORGIAN LETTER ELIFI
+ 0x10f9: (0x10f9, 0x10fa, "Allowed"), #  GEORGIAN LETTER TURNED GAN..GEORGIAN LETTER AIN
+ 0x10fd: (0x10fd, 0x10ff, "Allowed"), #  GEORGIAN LETTER AEN..GEORGIAN LETTER LABIAL SIGN
+ 0x1200: (0x1200, 0x1206, "Allowed"), #  ETHIOPIC SYLLABLE HA..ETHIOPIC SYLLABLE HO
+ 0x1207: (0x1207, None, "Allowed"), #  ETHIOPIC SYLLABLE HOA
+ 0x1208: (0x1208, 0x1246, "Allowed"), #  ETHIOPIC SYLLABLE LA..ETHIOPIC SYLLABLE QO
+ 0x1247: (0x1247, None, "Allowed"), #  ETHIOPIC SYLLABLE QOA
+ 0x1248: (0x1248, None, "Allowed"), #  ETHIOPIC SYLLABLE QWA
+ 0x124a: (0x124a, 0x124d, "Allowed"), #  ETHIOPIC SYLLABLE QWI..ETHIOPIC SYLLABLE QWE
+ 0x1250: (0x1250, 0x1256, "Allowed"), #  ETHIOPIC SYLLABLE QHA..ETHIOPIC SYLLABLE QHO
+ 0x1258: (0x1258, None, "Allowed"), #  ETHIOPIC SYLLABLE QHWA
+ 0x125a: (0x125a, 0x125d, "Allowed"), #  ETHIOPIC SYLLABLE QHWI..ETHIOPIC SYLLABLE QHWE
+ 0x1260: (0x1260, 0x1286, "Allowed"), #  ETHIOPIC SYLLABLE BA..ETHIOPIC SYLLABLE XO
+ 0x1287: (0x1287, None, "Allowed"), #  ETHIOPIC SYLLABLE XOA
+ 0x1288: (0x1288, None, "Allowed"), #  ETHIOPIC SYLLABLE XWA
+ 0x128a: (0x128a, 0x128d, "Allowed"), #  ETHIOPIC SYLLABLE XWI..ETHIOPIC SYLLABLE XWE
+ 0x1290: (0x1290, 0x12ae, "Allowed"), #  ETHIOPIC SYLLABLE NA..ETHIOPIC SYLLABLE KO
+ 0x12af: (0x12af, None, "Allowed"), #  ETHIOPIC SYLLABLE KOA
+ 0x12b0: (0x12b0, None, "Allowed"), #  ETHIOPIC SYLLABLE KWA
+ 0x12b2: (0x12b2, 0x12b5, "Allowed"), #  ETHIOPIC SYLLABLE KWI..ETHIOPIC SYLLABLE KWE
+ 0x12b8: (0x12b8, 0x12be, "Allowed"), #  ETHIOPIC SYLLABLE KXA..ETHIOPIC SYLLABLE KXO
+ 0x12c0: (0x12c0, None, "Allowed"), #  ETHIOPIC SYLLABLE KXWA
+ 0x12c2: (0x12c2, 0x12c5, "Allowed"), #  ETHIOPIC SYLLABLE KXWI..ETHIOPIC SYLLABLE KXWE
+ 0x12c8: (0x12c8, 0x12ce, "Allowed"), #  ETHIOPIC SYLLABLE WA..ETHIOPIC SYLLABLE WO
+ 0x12cf: (0x12cf, None, "Allowed"), #  ETHIOPIC SYLLABLE WOA
+ 0x12d0: (0x12d0, 0x12d6, "Allowed"), #  ETHIOPIC SYLLABLE PHARYNGEAL A..ETHIOPIC SYLLABLE PHARYNGEAL O
+ 0x12d8: (0x12d8, 0x12ee, "Allowed"), #  ETHIOPIC SYLLABLE ZA..ETHIOPIC SYLLABLE YO
+ 0x12ef: (0x12ef, None, "Allowed"), #  ETHIOPIC SYLLABLE YOA
+ 0x12f0: (0x12f0, 0x130e, "Allowed"), #  ETHIOPIC SYLLABLE DA..ETHIOPIC SYLLABLE GO
+ 0x130f: (0x130f, None, "Allowed"), #  ETHIOPIC SYLLABLE GOA
+ 0x1310: (0x1310, None, "Allowed"), #  ETHIOPIC SYLLABLE GWA
+ 0x1312: (0x1312, 0x1315, "Allowed"), #  ETHIOPIC SYLLABLE GWI..ETHIOPIC SYLLABLE GWE
+ 0x1318: (0x1318, 0x131e, "Allowed"), #  ETHIOPIC SYLLABLE GGA..ETHIOPIC SYLLABLE GGO
+ 0x131f: (0x131f, None, "Allowed"), #  ETHIOPIC SYLLABLE GGWAA
+ 0x1320: (0x1320, 0x1346, "Allowed"), #  ETHIOPIC SYLLABLE THA..ETHIOPIC SYLLABLE TZO
+ 0x1347: (0x1347, None, "Allowed"), #  ETHIOPIC SYLLABLE TZOA
+ 0x1348: (0x1348, 0x135a, "Allowed"), #  ETHIOPIC SYLLABLE FA..ETHIOPIC SYLLABLE FYA
+ 0x135d: (0x135d, 0x135e, "Allowed"), #  ETHIOPIC COMBINING GEMINATION AND VOWEL LENGTH MARK..ETHIOPIC COMBINING VOWEL LENGTH MARK
+ 0x135f: (0x135f, None, "Allowed"), #  ETHIOPIC COMBINING GEMINATION MARK
+ 0x1380: (0x1380, 0x138f, "Allowed"), #  ETHIOPIC SYLLABLE SEBATBEIT MWA..ETHIOPIC SYLLABLE PWE
+ 0x1780: (0x1780, 0x17a2, "Allowed"), #  KHMER LETTER KA..KHMER LETTER QA
+ 0x17a5: (0x17a5, 0x17a7, "Allowed"), #  KHMER INDEPENDENT VOWEL QI..KHMER INDEPENDENT VOWEL QU
+ 0x17a9: (0x17a9, 0x17b3, "Allowed"), #  KHMER INDEPENDENT VOWEL QUU..KHMER INDEPENDENT VOWEL QAU
+ 0x17b6: (0x17b6, 0x17ca, "Allowed"), #  KHMER VOWEL SIGN AA..KHMER SIGN TRIISAP
+ 0x17d2: (0x17d2, None, "Allowed"), #  KHMER SIGN COENG
+ 0x17d7: (0x17d7, None, "Allowed"), #  KHMER SIGN LEK TOO
+ 0x17dc: (0x17dc, None, "Allowed"), #  KHMER SIGN AVAKRAHASANYA
+ 0x17e0: (0x17e0, 0x17e9, "Allowed"), #  KHMER DIGIT ZERO..KHMER DIGIT NINE
+ 0x1c80: (0x1c80, 0x1c88, "Allowed"), #  CYRILLIC SMALL LETTER ROUNDED VE..CYRILLIC SMALL LETTER UNBLENDED UK
+ 0x1c90: (0x1c90, 0x1cba, "Allowed"), #  GEORGIAN MTAVRULI CAPITAL LETTER AN..GEORGIAN MTAVRULI CAPITAL LETTER AIN
+ 0x1cbd: (0x1cbd, 0x1cbf, "Allowed"), #  GEORGIAN MTAVRULI CAPITAL LETTER AEN..GEORGIAN MTAVRULI CAPITAL LETTER LABIAL SIGN
+ 0x1e00: (0x1e00, 0x1e99, "Allowed"), #  LATIN CAPITAL LETTER A WITH RING BELOW..LATIN SMALL LETTER Y WITH RING ABOVE
+ 0x1e9e: (0x1e9e, None, "Allowed"), #  LATIN CAPITAL LETTER SHARP S
+ 0x1ea0: (0x1ea0, 0x1ef9, "Allowed"), #  LATIN CAPITAL LETTER A WITH DOT BELOW..LATIN SMALL LETTER Y WITH TILDE
+ 0x1f00: (0x1f00, 0x1f15, "Allowed"), #  GREEK SMALL LETTER ALPHA WITH PSILI..GREEK SMALL LETTER EPSILON WITH DASIA AND OXIA
+ 0x1f18: (0x1f18, 0x1f1d, "Allowed"), #  GREEK CAPITAL LETTER EPSILON WITH PSILI..GREEK CAPITAL LETTER EPSILON WITH DASIA AND OXIA
+ 0x1f20: (0x1f20, 0x1f45, "Allowed"), #  GREEK SMALL LETTER ETA WITH PSILI..GREEK SMALL LETTER OMICRON WITH DASIA AND OXIA
+ 0x1f48: (0x1f48, 0x1f4d, "Allowed"), #  GREEK CAPITAL LETTER OMICRON WITH PSILI..GREEK CAPITAL LETTER OMICRON WITH DASIA AND OXIA
+ 0x1f50: (0x1f50, 0x1f57, "Allowed"), #  GREEK SMALL LETTER UPSILON WITH PSILI..GREEK SMALL LETTER UPSILON WITH DASIA AND PERISPOMENI
+ 0x1f59: (0x1f59, None, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA
+ 0x1f5b: (0x1f5b, None, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND VARIA
+ 0x1f5d: (0x1f5d, None, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND OXIA
+ 0x1f5f: (0x1f5f, 0x1f70, "Allowed"), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND PERISPOMENI..GREEK SMALL LETTER ALPHA WITH VARIA
+ 0x1f72: (0x1f72, None, "Allowed"), #  GREEK SMALL LETTER EPSILON WITH VARIA
+ 0x1f74: (0x1f74, None, "Allowed"), #  GREEK SMALL LETTER ETA WITH VARIA
+ 0x1f76: (0x1f76, None, "Allowed"), #  GREEK SMALL LETTER IOTA WITH VARIA
+ 0x1f78: (0x1f78, None, "Allowed"), #  GREEK SMALL LETTER OMICRON WITH VARIA
+ 0x1f7a: (0x1f7a, None, "Allowed"), #  GREEK SMALL LETTER UPSILON WITH VARIA
+ 0x1f7c: (0x1f7c, None, "Allowed"), #  GREEK SMALL LETTER OMEGA WITH VARIA
+ 0x1f80: (0x1f80, 0x1fb4, "Allowed"), #  GREEK SMALL LETTER ALPHA WITH PSILI AND YPOGEGRAMMENI..GREEK SMALL LETTER ALPHA WITH OXIA AND YPOGEGRAMMENI
+ 0x1fb6: (0x1fb6, 0x1fba, "Allowed"), #  GREEK SMALL LETTER ALPHA WITH PERISPOMENI..GREEK CAPITAL LETTER ALPHA WITH VARIA
+ 0x1fbc: (0x1fbc, None, "Allowed"), #  GREEK CAPITAL LETTER ALPHA WITH PROSGEGRAMMENI
+ 0x1fc2: (0x1fc2, 0x1fc4, "Allowed"), #  GREEK SMALL LETTER ETA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER ETA WITH OXIA AND YPOGEGRAMMENI
+ 0x1fc6: (0x1fc6, 0x1fc8, "Allowed"), #  GREEK SMALL LETTER ETA WITH PERISPOMENI..GREEK CAPITAL LETTER EPSILON WITH VARIA
+ 0x1fca: (0x1fca, None, "Allowed"), #  GREEK CAPITAL LETTER ETA WITH VARIA
+ 0x1fcc: (0x1fcc, None, "Allowed"), #  GREEK CAPITAL LETTER ETA WITH PROSGEGRAMMENI
+ 0x1fd0: (0x1fd0, 0x1fd2, "Allowed"), #  GREEK SMALL LETTER IOTA WITH VRACHY..GREEK SMALL LETTER IOTA WITH DIALYTIKA AND VARIA
+ 0x1fd6: (0x1fd6, 0x1fda, "Allowed"), #  GREEK SMALL LETTER IOTA WITH PERISPOMENI..GREEK CAPITAL LETTER IOTA WITH VARIA
+ 0x1fe0: (0x1fe0, 0x1fe2, "Allowed"), #  GREEK SMALL LETTER UPSILON WITH VRACHY..GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND VARIA
+ 0x1fe4: (0x1fe4, 0x1fea, "Allowed"), #  GREEK SMALL LETTER RHO WITH PSILI..GREEK CAPITAL LETTER UPSILON WITH VARIA
+ 0x1fec: (0x1fec, None, "Allowed"), #  GREEK CAPITAL LETTER RHO WITH DASIA
+ 0x1ff2: (0x1ff2, 0x1ff4, "Allowed"), #  GREEK SMALL LETTER OMEGA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER OMEGA WITH OXIA AND YPOGEGRAMMENI
+ 0x1ff6: (0x1ff6, 0x1ff8, "Allowed"), #  GREEK SMALL LETTER OMEGA WITH PERISPOMENI..GREEK CAPITAL LETTER OMICRON WITH VARIA
+ 0x1ffa: (0x1ffa, None, "Allowed"), #  GREEK CAPITAL LETTER OMEGA WITH VARIA
+ 0x1ffc: (0x1ffc, None, "Allowed"), #  GREEK CAPITAL LETTER OMEGA WITH PROSGEGRAMMENI
+ 0x200c: (0x200c, 0x200d, "Allowed"), #  ZERO WIDTH NON-JOINER..ZERO WIDTH JOINER
+ 0x2010: (0x2010, None, "Allowed"), #  HYPHEN
+ 0x2019: (0x2019, None, "Allowed"), #  RIGHT SINGLE QUOTATION MARK
+ 0x2027: (0x2027, None, "Allowed"), #  HYPHENATION POINT
+ 0x2d27: (0x2d27, None, "Allowed"), #  GEORGIAN SMALL LETTER YN
+ 0x2d2d: (0x2d2d, None, "Allowed"), #  GEORGIAN SMALL LETTER AEN
+ 0x2d80: (0x2d80, 0x2d96, "Allowed"), #  ETHIOPIC SYLLABLE LOA..ETHIOPIC SYLLABLE GGWE
+ 0x2da0: (0x2da0, 0x2da6, "Allowed"), #  ETHIOPIC SYLLABLE SSA..ETHIOPIC SYLLABLE SSO
+ 0x2da8: (0x2da8, 0x2dae, "Allowed"), #  ETHIOPIC SYLLABLE CCA..ETHIOPIC SYLLABLE CCO
+ 0x2db0: (0x2db0, 0x2db6, "Allowed"), #  ETHIOPIC SYLLABLE ZZA..ETHIOPIC SYLLABLE ZZO
+ 0x2db8: (0x2db8, 0x2dbe, "Allowed"), #  ETHIOPIC SYLLABLE CCHA..ETHIOPIC SYLLABLE CCHO
+ 0x2dc0: (0x2dc0, 0x2dc6, "Allowed"), #  ETHIOPIC SYLLABLE QYA..ETHIOPIC SYLLABLE QYO
+ 0x2dc8: (0x2dc8, 0x2dce, "Allowed"), #  ETHIOPIC SYLLABLE KYA..ETHIOPIC SYLLABLE KYO
+ 0x2dd0: (0x2dd0, 0x2dd6, "Allowed"), #  ETHIOPIC SYLLABLE XYA..ETHIOPIC SYLLABLE XYO
+ 0x2dd8: (0x2dd8, 0x2dde, "Allowed"), #  ETHIOPIC SYLLABLE GYA..ETHIOPIC SYLLABLE GYO
+ 0x3005: (0x3005, 0x3007, "Allowed"), #  IDEOGRAPHIC ITERATION MARK..IDEOGRAPHIC NUMBER ZERO
+ 0x3041: (0x3041, 0x3094, "Allowed"), #  HIRAGANA LETTER SMALL A..HIRAGANA LETTER VU
+ 0x3095: (0x3095, 0x3096, "Allowed"), #  HIRAGANA LETTER SMALL KA..HIRAGANA LETTER SMALL KE
+ 0x3099: (0x3099, 0x309a, "Allowed"), #  COMBINING KATAKANA-HIRAGANA VOICED SOUND MARK..COMBINING KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK
+ 0x309d: (0x309d, 0x309e, "Allowed"), #  HIRAGANA ITERATION MARK..HIRAGANA VOICED ITERATION MARK
+ 0x30a0: (0x30a0, None, "Allowed"), #  KATAKANA-HIRAGANA DOUBLE HYPHEN
+ 0x30a1: (0x30a1, 0x30fe, "Allowed"), #  KATAKANA LETTER SMALL A..KATAKANA VOICED ITERATION MARK
+ 0x3105: (0x3105, 0x312c, "Allowed"), #  BOPOMOFO LETTER B..BOPOMOFO LETTER GN
+ 0x312d: (0x312d, None, "Allowed"), #  BOPOMOFO LETTER IH
+ 0x312e: (0x312e, None, "Allowed"), #  BOPOMOFO LETTER O WITH DOT ABOVE
+ 0x312f: (0x312f, None, "Allowed"), #  BOPOMOFO LETTER NN
+ 0x31a0: (0x31a0, 0x31b7, "Allowed"), #  BOPOMOFO LETTER BU..BOPOMOFO FINAL LETTER H
+ 0x31b8: (0x31b8, 0x31ba, "Allowed"), #  BOPOMOFO LETTER GH..BOPOMOFO LETTER ZY
+ 0x3400: (0x3400, 0x4db5, "Allowed"), #  CJK UNIFIED IDEOGRAPH-3400..CJK UNIFIED IDEOGRAPH-4DB5
+ 0x4e00: (0x4e00, 0x9fa5, "Allowed"), #  CJK UNIFIED IDEOGRAPH-4E00..CJK UNIFIED IDEOGRAPH-9FA5
+ 0x9fa6: (0x9fa6, 0x9fbb, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FA6..CJK UNIFIED IDEOGRAPH-9FBB
+ 0x9fbc: (0x9fbc, 0x9fc3, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FBC..CJK UNIFIED IDEOGRAPH-9FC3
+ 0x9fc4: (0x9fc4, 0x9fcb, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FC4..CJK UNIFIED IDEOGRAPH-9FCB
+ 0x9fcc: (0x9fcc, None, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FCC
+ 0x9fcd: (0x9fcd, 0x9fd5, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FCD..CJK UNIFIED IDEOGRAPH-9FD5
+ 0x9fd6: (0x9fd6, 0x9fea, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FD6..CJK UNIFIED IDEOGRAPH-9FEA
+ 0x9feb: (0x9feb, 0x9fef, "Allowed"), #  CJK UNIFIED IDEOGRAPH-9FEB..CJK UNIFIED IDEOGRAPH-9FEF
+ 0xa660: (0xa660, 0xa661, "Allowed"), #  CYRILLIC CAPITAL LETTER REVERSED TSE..CYRILLIC SMALL LETTER REVERSED TSE
+ 0xa674: (0xa674, 0xa67b, "Allowed"), #  COMBINING CYRILLIC LETTER UKRAINIAN IE..COMBINING CYRILLIC LETTER OMEGA
+ 0xa67f: (0xa67f, None, "Allowed"), #  CYRILLIC PAYEROK
+ 0xa69f: (0xa69f, None, "Allowed"), #  COMBINING CYRILLIC LETTER IOTIFIED E
+ 0xa717: (0xa717, 0xa71a, "Allowed"), #  MODIFIER LETTER DOT VERTICAL BAR..MODIFIER LETTER LOWER RIGHT CORNER ANGLE
+ 0xa71b: (0xa71b, 0xa71f, "Allowed"), #  MODIFIER LETTER RAISED UP ARROW..MODIFIER LETTER LOW INVERTED EXCLAMATION MARK
+ 0xa788: (0xa788, None, "Allowed"), #  MODIFIER LETTER LOW CIRCUMFLEX ACCENT
+ 0xa78d: (0xa78d, 0xa78e, "Allowed"), #  LATIN CAPITAL LETTER TURNED H..LATIN SMALL LETTER L WITH RETROFLEX HOOK AND BELT
+ 0xa790: (0xa790, 0xa791, "Allowed"), #  LATIN CAPITAL LETTER N WITH DESCENDER..LATIN SMALL LETTER N WITH DESCENDER
+ 0xa792: (0xa792, 0xa793, "Allowed"), #  LATIN CAPITAL LETTER C WITH BAR..LATIN SMALL LETTER C WITH BAR
+ 0xa7a0: (0xa7a0, 0xa7a9, "Allowed"), #  LATIN CAPITAL LETTER G WITH OBLIQUE STROKE..LATIN SMALL LETTER S WITH OBLIQUE STROKE
+ 0xa7aa: (0xa7aa, None, "Allowed"), #  LATIN CAPITAL LETTER H WITH HOOK
+ 0xa7ae: (0xa7ae, None, "Allowed"), #  LATIN CAPITAL LETTER SMALL CAPITAL I
+ 0xa7af: (0xa7af, None, "Allowed"), #  LATIN LETTER SMALL CAPITAL Q
+ 0xa7b8: (0xa7b8, 0xa7b9, "Allowed"), #  LATIN CAPITAL LETTER U WITH STROKE..LATIN SMALL LETTER U WITH STROKE
+ 0xa7fa: (0xa7fa, None, "Allowed"), #  LATIN LETTER SMALL CAPITAL TURNED M
+ 0xa9e7: (0xa9e7, 0xa9fe, "Allowed"), #  MYANMAR LETTER TAI LAING NYA..MYANMAR LETTER TAI LAING BHA
+ 0xaa60: (0xaa60, 0xaa76, "Allowed"), #  MYANMAR LETTER KHAMTI GA..MYANMAR LOGOGRAM KHAMTI HM
+ 0xaa7a: (0xaa7a, 0xaa7b, "Allowed"), #  MYANMAR LETTER AITON RA..MYANMAR SIGN PAO KAREN TONE
+ 0xaa7c: (0xaa7c, 0xaa7f, "Allowed"), #  MYANMAR SIGN TAI LAING TONE-2..MYANMAR LETTER SHWE PALAUNG SHA
+ 0xab01: (0xab01, 0xab06, "Allowed"), #  ETHIOPIC SYLLABLE TTHU..ETHIOPIC SYLLABLE TTHO
+ 0xab09: (0xab09, 0xab0e, "Allowed"), #  ETHIOPIC SYLLABLE DDHU..ETHIOPIC SYLLABLE DDHO
+ 0xab11: (0xab11, 0xab16, "Allowed"), #  ETHIOPIC SYLLABLE DZU..ETHIOPIC SYLLABLE DZO
+ 0xab20: (0xab20, 0xab26, "Allowed"), #  ETHIOPIC SYLLABLE CCHHA..ETHIOPIC SYLLABLE CCHHO
+ 0xab28: (0xab28, 0xab2e, "Allowed"), #  ETHIOPIC SYLLABLE BBA..ETHIOPIC SYLLABLE BBO
+ 0xac00: (0xac00, 0xd7a3, "Allowed"), #  HANGUL SYLLABLE GA..HANGUL SYLLABLE HIH
+ 0xfa0e: (0xfa0e, 0xfa0f, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA0E..CJK COMPATIBILITY IDEOGRAPH-FA0F
+ 0xfa11: (0xfa11, None, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA11
+ 0xfa13: (0xfa13, 0xfa14, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA13..CJK COMPATIBILITY IDEOGRAPH-FA14
+ 0xfa1f: (0xfa1f, None, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA1F
+ 0xfa21: (0xfa21, None, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA21
+ 0xfa23: (0xfa23, 0xfa24, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA23..CJK COMPATIBILITY IDEOGRAPH-FA24
+ 0xfa27: (0xfa27, 0xfa29, "Allowed"), #  CJK COMPATIBILITY IDEOGRAPH-FA27..CJK COMPATIBILITY IDEOGRAPH-FA29
+ 0x1133b: (0x1133b, None, "Allowed"), #  COMBINING BINDU BELOW
+ 0x1b002: (0x1b002, 0x1b11e, "Allowed"), #  HENTAIGANA LETTER A-1..HENTAIGANA LETTER N-MU-MO-2
+ 0x20000: (0x20000, 0x2a6d6, "Allowed"), #  CJK UNIFIED IDEOGRAPH-20000..CJK UNIFIED IDEOGRAPH-2A6D6
+ 0x2a700: (0x2a700, 0x2b734, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2A700..CJK UNIFIED IDEOGRAPH-2B734
+ 0x2b740: (0x2b740, 0x2b81d, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2B740..CJK UNIFIED IDEOGRAPH-2B81D
+ 0x2b820: (0x2b820, 0x2cea1, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2B820..CJK UNIFIED IDEOGRAPH-2CEA1
+ 0x2ceb0: (0x2ceb0, 0x2ebe0, "Allowed"), #  CJK UNIFIED IDEOGRAPH-2CEB0..CJK UNIFIED IDEOGRAPH-2EBE0
+}
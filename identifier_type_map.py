@@ -1,2171 +1,2171 @@
-
-
-# dictionary of Unicode identifier types
-# entries are: key: (f, l, types), where
-#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.
-#     types - types is a list of ints, with 0 for False and 1 for True for the following types for the identifier.
-#        allowed, deprecated, technical, obsolete, inclusion, exclusion, limited_use, uncommon_use, not_NFKC, not_XID, recommended, default_Ignorable
-identifier_type_map = {
- 0x0030: (0x0030, 0x0039, 1,0,0,0,0,0,0,0,0,0,1,0), #  DIGIT ZERO..DIGIT NINE
- 0x0041: (0x0041, 0x005a, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A..LATIN CAPITAL LETTER Z
- 0x005f: (0x005f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LOW LINE
- 0x0061: (0x0061, 0x007a, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN SMALL LETTER A..LATIN SMALL LETTER Z
- 0x00c0: (0x00c0, 0x00d6, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH GRAVE..LATIN CAPITAL LETTER O WITH DIAERESIS
- 0x00d8: (0x00d8, 0x00f6, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER O WITH STROKE..LATIN SMALL LETTER O WITH DIAERESIS
- 0x00f8: (0x00f8, 0x0131, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN SMALL LETTER O WITH STROKE..LATIN SMALL LETTER DOTLESS I
- 0x0134: (0x0134, 0x013e, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER J WITH CIRCUMFLEX..LATIN SMALL LETTER L WITH CARON
- 0x0141: (0x0141, 0x0148, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER L WITH STROKE..LATIN SMALL LETTER N WITH CARON
- 0x014a: (0x014a, 0x017e, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER ENG..LATIN SMALL LETTER Z WITH CARON
- 0x018f: (0x018f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER SCHWA
- 0x01a0: (0x01a0, 0x01a1, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER O WITH HORN..LATIN SMALL LETTER O WITH HORN
- 0x01af: (0x01af, 0x01b0, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER U WITH HORN..LATIN SMALL LETTER U WITH HORN
- 0x01cd: (0x01cd, 0x01dc, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH CARON..LATIN SMALL LETTER U WITH DIAERESIS AND GRAVE
- 0x01de: (0x01de, 0x01e3, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH DIAERESIS AND MACRON..LATIN SMALL LETTER AE WITH MACRON
- 0x01e6: (0x01e6, 0x01f0, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER G WITH CARON..LATIN SMALL LETTER J WITH CARON
- 0x01f4: (0x01f4, 0x01f5, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER G WITH ACUTE..LATIN SMALL LETTER G WITH ACUTE
- 0x01f8: (0x01f8, 0x01f9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER N WITH GRAVE..LATIN SMALL LETTER N WITH GRAVE
- 0x01fa: (0x01fa, 0x0217, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH RING ABOVE AND ACUTE..LATIN SMALL LETTER U WITH INVERTED BREVE
- 0x0218: (0x0218, 0x021b, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER S WITH COMMA BELOW..LATIN SMALL LETTER T WITH COMMA BELOW
- 0x021e: (0x021e, 0x021f, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER H WITH CARON..LATIN SMALL LETTER H WITH CARON
- 0x0226: (0x0226, 0x0233, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH DOT ABOVE..LATIN SMALL LETTER Y WITH MACRON
- 0x0259: (0x0259, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN SMALL LETTER SCHWA
- 0x02bb: (0x02bb, 0x02bc, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER TURNED COMMA..MODIFIER LETTER APOSTROPHE
- 0x02ec: (0x02ec, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER VOICING
- 0x0300: (0x0300, 0x0304, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING GRAVE ACCENT..COMBINING MACRON
- 0x0306: (0x0306, 0x030c, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING BREVE..COMBINING CARON
- 0x030f: (0x030f, 0x0311, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING DOUBLE GRAVE ACCENT..COMBINING INVERTED BREVE
- 0x0313: (0x0313, 0x0314, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING COMMA ABOVE..COMBINING REVERSED COMMA ABOVE
- 0x031b: (0x031b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING HORN
- 0x0323: (0x0323, 0x0328, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING DOT BELOW..COMBINING OGONEK
- 0x032d: (0x032d, 0x032e, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING CIRCUMFLEX ACCENT BELOW..COMBINING BREVE BELOW
- 0x0330: (0x0330, 0x0331, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING TILDE BELOW..COMBINING MACRON BELOW
- 0x0335: (0x0335, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING SHORT STROKE OVERLAY
- 0x0338: (0x0338, 0x0339, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING LONG SOLIDUS OVERLAY..COMBINING RIGHT HALF RING BELOW
- 0x0342: (0x0342, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING GREEK PERISPOMENI
- 0x0345: (0x0345, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING GREEK YPOGEGRAMMENI
- 0x037b: (0x037b, 0x037d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL REVERSED LUNATE SIGMA SYMBOL..GREEK SMALL REVERSED DOTTED LUNATE SIGMA SYMBOL
- 0x0386: (0x0386, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ALPHA WITH TONOS
- 0x0388: (0x0388, 0x038a, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER EPSILON WITH TONOS..GREEK CAPITAL LETTER IOTA WITH TONOS
- 0x038c: (0x038c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMICRON WITH TONOS
- 0x038e: (0x038e, 0x03a1, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH TONOS..GREEK CAPITAL LETTER RHO
- 0x03a3: (0x03a3, 0x03ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER SIGMA..GREEK SMALL LETTER OMEGA WITH TONOS
- 0x03fc: (0x03fc, 0x03ff, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK RHO WITH STROKE SYMBOL..GREEK CAPITAL REVERSED DOTTED LUNATE SIGMA SYMBOL
- 0x0400: (0x0400, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER IE WITH GRAVE
- 0x0401: (0x0401, 0x040c, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER IO..CYRILLIC CAPITAL LETTER KJE
- 0x040d: (0x040d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER I WITH GRAVE
- 0x040e: (0x040e, 0x044f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SHORT U..CYRILLIC SMALL LETTER YA
- 0x0450: (0x0450, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER IE WITH GRAVE
- 0x0451: (0x0451, 0x045c, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER IO..CYRILLIC SMALL LETTER KJE
- 0x045d: (0x045d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER I WITH GRAVE
- 0x045e: (0x045e, 0x045f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER SHORT U..CYRILLIC SMALL LETTER DZHE
- 0x048a: (0x048a, 0x048b, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SHORT I WITH TAIL..CYRILLIC SMALL LETTER SHORT I WITH TAIL
- 0x048c: (0x048c, 0x048f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SEMISOFT SIGN..CYRILLIC SMALL LETTER ER WITH TICK
- 0x0490: (0x0490, 0x04c4, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER GHE WITH UPTURN..CYRILLIC SMALL LETTER KA WITH HOOK
- 0x04c5: (0x04c5, 0x04c6, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EL WITH TAIL..CYRILLIC SMALL LETTER EL WITH TAIL
- 0x04c7: (0x04c7, 0x04c8, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EN WITH HOOK..CYRILLIC SMALL LETTER EN WITH HOOK
- 0x04c9: (0x04c9, 0x04ca, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EN WITH TAIL..CYRILLIC SMALL LETTER EN WITH TAIL
- 0x04cb: (0x04cb, 0x04cc, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER KHAKASSIAN CHE..CYRILLIC SMALL LETTER KHAKASSIAN CHE
- 0x04cd: (0x04cd, 0x04ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EM WITH TAIL..CYRILLIC SMALL LETTER EM WITH TAIL
- 0x04cf: (0x04cf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER PALOCHKA
- 0x04d0: (0x04d0, 0x04eb, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER A WITH BREVE..CYRILLIC SMALL LETTER BARRED O WITH DIAERESIS
- 0x04ec: (0x04ec, 0x04ed, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER E WITH DIAERESIS..CYRILLIC SMALL LETTER E WITH DIAERESIS
- 0x04ee: (0x04ee, 0x04f5, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER U WITH MACRON..CYRILLIC SMALL LETTER CHE WITH DIAERESIS
- 0x04f6: (0x04f6, 0x04f7, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER GHE WITH DESCENDER..CYRILLIC SMALL LETTER GHE WITH DESCENDER
- 0x04f8: (0x04f8, 0x04f9, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER YERU WITH DIAERESIS..CYRILLIC SMALL LETTER YERU WITH DIAERESIS
- 0x04fa: (0x04fa, 0x04ff, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER GHE WITH STROKE AND HOOK..CYRILLIC SMALL LETTER HA WITH STROKE
- 0x0500: (0x0500, 0x050f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER KOMI DE..CYRILLIC SMALL LETTER KOMI TJE
- 0x0510: (0x0510, 0x0513, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER REVERSED ZE..CYRILLIC SMALL LETTER EL WITH HOOK
- 0x0514: (0x0514, 0x0523, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER LHA..CYRILLIC SMALL LETTER EN WITH MIDDLE HOOK
- 0x0524: (0x0524, 0x0525, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER PE WITH DESCENDER..CYRILLIC SMALL LETTER PE WITH DESCENDER
- 0x0526: (0x0526, 0x0527, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SHHA WITH DESCENDER..CYRILLIC SMALL LETTER SHHA WITH DESCENDER
- 0x0528: (0x0528, 0x0529, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EN WITH LEFT HOOK..CYRILLIC SMALL LETTER EN WITH LEFT HOOK
- 0x052e: (0x052e, 0x052f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EL WITH DESCENDER..CYRILLIC SMALL LETTER EL WITH DESCENDER
- 0x0531: (0x0531, 0x0556, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN CAPITAL LETTER AYB..ARMENIAN CAPITAL LETTER FEH
- 0x0559: (0x0559, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN MODIFIER LETTER LEFT HALF RING
- 0x0560: (0x0560, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN SMALL LETTER TURNED AYB
- 0x0561: (0x0561, 0x0586, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN SMALL LETTER AYB..ARMENIAN SMALL LETTER FEH
- 0x0588: (0x0588, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN SMALL LETTER YI WITH STROKE
- 0x05b4: (0x05b4, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW POINT HIRIQ
- 0x05d0: (0x05d0, 0x05ea, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW LETTER ALEF..HEBREW LETTER TAV
- 0x05ef: (0x05ef, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW YOD TRIANGLE
- 0x05f0: (0x05f0, 0x05f2, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW LIGATURE YIDDISH DOUBLE VAV..HEBREW LIGATURE YIDDISH DOUBLE YOD
- 0x0620: (0x0620, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER KASHMIRI YEH
- 0x0621: (0x0621, 0x063a, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HAMZA..ARABIC LETTER GHAIN
- 0x063b: (0x063b, 0x063f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER KEHEH WITH TWO DOTS ABOVE..ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE
- 0x0641: (0x0641, 0x0652, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER FEH..ARABIC SUKUN
- 0x0653: (0x0653, 0x0655, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC MADDAH ABOVE..ARABIC HAMZA BELOW
- 0x0660: (0x0660, 0x0669, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC-INDIC DIGIT ZERO..ARABIC-INDIC DIGIT NINE
- 0x0670: (0x0670, 0x0672, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER SUPERSCRIPT ALEF..ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE
- 0x0674: (0x0674, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HIGH HAMZA
- 0x0679: (0x0679, 0x068d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER TTEH..ARABIC LETTER DDAHAL
- 0x068f: (0x068f, 0x06b7, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER DAL WITH THREE DOTS ABOVE DOWNWARDS..ARABIC LETTER LAM WITH THREE DOTS ABOVE
- 0x06b8: (0x06b8, 0x06b9, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER LAM WITH THREE DOTS BELOW..ARABIC LETTER NOON WITH DOT BELOW
- 0x06ba: (0x06ba, 0x06be, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER NOON GHUNNA..ARABIC LETTER HEH DOACHASHMEE
- 0x06bf: (0x06bf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER TCHEH WITH DOT ABOVE
- 0x06c0: (0x06c0, 0x06ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HEH WITH YEH ABOVE..ARABIC LETTER YEH WITH SMALL V
- 0x06cf: (0x06cf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER WAW WITH DOT ABOVE
- 0x06d0: (0x06d0, 0x06d3, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER E..ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
- 0x06d5: (0x06d5, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER AE
- 0x06e5: (0x06e5, 0x06e6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC SMALL WAW..ARABIC SMALL YEH
- 0x06ee: (0x06ee, 0x06ef, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER DAL WITH INVERTED V..ARABIC LETTER REH WITH INVERTED V
- 0x06f0: (0x06f0, 0x06f9, 1,0,0,0,0,0,0,0,0,0,1,0), #  EXTENDED ARABIC-INDIC DIGIT ZERO..EXTENDED ARABIC-INDIC DIGIT NINE
- 0x06fa: (0x06fa, 0x06fc, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER SHEEN WITH DOT BELOW..ARABIC LETTER GHAIN WITH DOT BELOW
- 0x06ff: (0x06ff, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HEH WITH INVERTED V
- 0x0750: (0x0750, 0x076d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH THREE DOTS HORIZONTALLY BELOW..ARABIC LETTER SEEN WITH TWO DOTS VERTICALLY ABOVE
- 0x076e: (0x076e, 0x077f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH BELOW..ARABIC LETTER KAF WITH TWO DOTS ABOVE
- 0x0780: (0x0780, 0x07b0, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAANA LETTER HAA..THAANA SUKUN
- 0x07b1: (0x07b1, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAANA LETTER NAA
- 0x08a0: (0x08a0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH SMALL V BELOW
- 0x08a1: (0x08a1, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH HAMZA ABOVE
- 0x08a2: (0x08a2, 0x08ac, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER JEEM WITH TWO DOTS ABOVE..ARABIC LETTER ROHINGYA YEH
- 0x08b2: (0x08b2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER ZAIN WITH INVERTED V ABOVE
- 0x08b6: (0x08b6, 0x08bd, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH SMALL MEEM ABOVE..ARABIC LETTER AFRICAN NOON
- 0x0901: (0x0901, 0x0903, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI SIGN CANDRABINDU..DEVANAGARI SIGN VISARGA
- 0x0904: (0x0904, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER SHORT A
- 0x0905: (0x0905, 0x0939, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER A..DEVANAGARI LETTER HA
- 0x093a: (0x093a, 0x093b, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI VOWEL SIGN OE..DEVANAGARI VOWEL SIGN OOE
- 0x093c: (0x093c, 0x094d, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI SIGN NUKTA..DEVANAGARI SIGN VIRAMA
- 0x094f: (0x094f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI VOWEL SIGN AW
- 0x0950: (0x0950, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI OM
- 0x0956: (0x0956, 0x0957, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI VOWEL SIGN UE..DEVANAGARI VOWEL SIGN UUE
- 0x0960: (0x0960, 0x0963, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER VOCALIC RR..DEVANAGARI VOWEL SIGN VOCALIC LL
- 0x0966: (0x0966, 0x096f, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI DIGIT ZERO..DEVANAGARI DIGIT NINE
- 0x0971: (0x0971, 0x0972, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI SIGN HIGH SPACING DOT..DEVANAGARI LETTER CANDRA A
- 0x0973: (0x0973, 0x0977, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER OE..DEVANAGARI LETTER UUE
- 0x0979: (0x0979, 0x097a, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER ZHA..DEVANAGARI LETTER HEAVY YA
- 0x097b: (0x097b, 0x097c, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER GGA..DEVANAGARI LETTER JJA
- 0x097d: (0x097d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER GLOTTAL STOP
- 0x097e: (0x097e, 0x097f, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER DDDA..DEVANAGARI LETTER BBA
- 0x0981: (0x0981, 0x0983, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SIGN CANDRABINDU..BENGALI SIGN VISARGA
- 0x0985: (0x0985, 0x098c, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER A..BENGALI LETTER VOCALIC L
- 0x098f: (0x098f, 0x0990, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER E..BENGALI LETTER AI
- 0x0993: (0x0993, 0x09a8, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER O..BENGALI LETTER NA
- 0x09aa: (0x09aa, 0x09b0, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER PA..BENGALI LETTER RA
- 0x09b2: (0x09b2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER LA
- 0x09b6: (0x09b6, 0x09b9, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER SHA..BENGALI LETTER HA
- 0x09bc: (0x09bc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SIGN NUKTA
- 0x09bd: (0x09bd, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SIGN AVAGRAHA
- 0x09be: (0x09be, 0x09c4, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI VOWEL SIGN AA..BENGALI VOWEL SIGN VOCALIC RR
- 0x09c7: (0x09c7, 0x09c8, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI VOWEL SIGN E..BENGALI VOWEL SIGN AI
- 0x09cb: (0x09cb, 0x09cd, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI VOWEL SIGN O..BENGALI SIGN VIRAMA
- 0x09ce: (0x09ce, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER KHANDA TA
- 0x09d7: (0x09d7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI AU LENGTH MARK
- 0x09e0: (0x09e0, 0x09e3, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER VOCALIC RR..BENGALI VOWEL SIGN VOCALIC LL
- 0x09e6: (0x09e6, 0x09f1, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI DIGIT ZERO..BENGALI LETTER RA WITH LOWER DIAGONAL
- 0x09fc: (0x09fc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER VEDIC ANUSVARA
- 0x09fe: (0x09fe, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SANDHI MARK
- 0x0a01: (0x0a01, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN ADAK BINDI
- 0x0a02: (0x0a02, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN BINDI
- 0x0a03: (0x0a03, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN VISARGA
- 0x0a05: (0x0a05, 0x0a0a, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER A..GURMUKHI LETTER UU
- 0x0a0f: (0x0a0f, 0x0a10, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER EE..GURMUKHI LETTER AI
- 0x0a13: (0x0a13, 0x0a28, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER OO..GURMUKHI LETTER NA
- 0x0a2a: (0x0a2a, 0x0a30, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER PA..GURMUKHI LETTER RA
- 0x0a32: (0x0a32, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER LA
- 0x0a35: (0x0a35, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER VA
- 0x0a38: (0x0a38, 0x0a39, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER SA..GURMUKHI LETTER HA
- 0x0a3c: (0x0a3c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN NUKTA
- 0x0a3e: (0x0a3e, 0x0a42, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI VOWEL SIGN AA..GURMUKHI VOWEL SIGN UU
- 0x0a47: (0x0a47, 0x0a48, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI VOWEL SIGN EE..GURMUKHI VOWEL SIGN AI
- 0x0a4b: (0x0a4b, 0x0a4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI VOWEL SIGN OO..GURMUKHI SIGN VIRAMA
- 0x0a5c: (0x0a5c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER RRA
- 0x0a66: (0x0a66, 0x0a74, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI DIGIT ZERO..GURMUKHI EK ONKAR
- 0x0a81: (0x0a81, 0x0a83, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI SIGN CANDRABINDU..GUJARATI SIGN VISARGA
- 0x0a85: (0x0a85, 0x0a8b, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER A..GUJARATI LETTER VOCALIC R
- 0x0a8c: (0x0a8c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VOCALIC L
- 0x0a8d: (0x0a8d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI VOWEL CANDRA E
- 0x0a8f: (0x0a8f, 0x0a91, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER E..GUJARATI VOWEL CANDRA O
- 0x0a93: (0x0a93, 0x0aa8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER O..GUJARATI LETTER NA
- 0x0aaa: (0x0aaa, 0x0ab0, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER PA..GUJARATI LETTER RA
- 0x0ab2: (0x0ab2, 0x0ab3, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER LA..GUJARATI LETTER LLA
- 0x0ab5: (0x0ab5, 0x0ab9, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VA..GUJARATI LETTER HA
- 0x0abc: (0x0abc, 0x0ac5, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI SIGN NUKTA..GUJARATI VOWEL SIGN CANDRA E
- 0x0ac7: (0x0ac7, 0x0ac9, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI VOWEL SIGN E..GUJARATI VOWEL SIGN CANDRA O
- 0x0acb: (0x0acb, 0x0acd, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI VOWEL SIGN O..GUJARATI SIGN VIRAMA
- 0x0ad0: (0x0ad0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI OM
- 0x0ae0: (0x0ae0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VOCALIC RR
- 0x0ae1: (0x0ae1, 0x0ae3, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VOCALIC LL..GUJARATI VOWEL SIGN VOCALIC LL
- 0x0ae6: (0x0ae6, 0x0aef, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI DIGIT ZERO..GUJARATI DIGIT NINE
- 0x0afa: (0x0afa, 0x0aff, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI SIGN SUKUN..GUJARATI SIGN TWO-CIRCLE NUKTA ABOVE
- 0x0b01: (0x0b01, 0x0b03, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA SIGN CANDRABINDU..ORIYA SIGN VISARGA
- 0x0b05: (0x0b05, 0x0b0c, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER A..ORIYA LETTER VOCALIC L
- 0x0b0f: (0x0b0f, 0x0b10, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER E..ORIYA LETTER AI
- 0x0b13: (0x0b13, 0x0b28, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER O..ORIYA LETTER NA
- 0x0b2a: (0x0b2a, 0x0b30, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER PA..ORIYA LETTER RA
- 0x0b32: (0x0b32, 0x0b33, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER LA..ORIYA LETTER LLA
- 0x0b35: (0x0b35, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER VA
- 0x0b36: (0x0b36, 0x0b39, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER SHA..ORIYA LETTER HA
- 0x0b3c: (0x0b3c, 0x0b43, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA SIGN NUKTA..ORIYA VOWEL SIGN VOCALIC R
- 0x0b47: (0x0b47, 0x0b48, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA VOWEL SIGN E..ORIYA VOWEL SIGN AI
- 0x0b4b: (0x0b4b, 0x0b4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA VOWEL SIGN O..ORIYA SIGN VIRAMA
- 0x0b56: (0x0b56, 0x0b57, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA AI LENGTH MARK..ORIYA AU LENGTH MARK
- 0x0b5f: (0x0b5f, 0x0b61, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER YYA..ORIYA LETTER VOCALIC LL
- 0x0b66: (0x0b66, 0x0b6f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA DIGIT ZERO..ORIYA DIGIT NINE
- 0x0b71: (0x0b71, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER WA
- 0x0b82: (0x0b82, 0x0b83, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL SIGN ANUSVARA..TAMIL SIGN VISARGA
- 0x0b85: (0x0b85, 0x0b8a, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER A..TAMIL LETTER UU
- 0x0b8e: (0x0b8e, 0x0b90, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER E..TAMIL LETTER AI
- 0x0b92: (0x0b92, 0x0b95, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER O..TAMIL LETTER KA
- 0x0b99: (0x0b99, 0x0b9a, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NGA..TAMIL LETTER CA
- 0x0b9c: (0x0b9c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER JA
- 0x0b9e: (0x0b9e, 0x0b9f, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NYA..TAMIL LETTER TTA
- 0x0ba3: (0x0ba3, 0x0ba4, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NNA..TAMIL LETTER TA
- 0x0ba8: (0x0ba8, 0x0baa, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NA..TAMIL LETTER PA
- 0x0bae: (0x0bae, 0x0bb5, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER MA..TAMIL LETTER VA
- 0x0bb6: (0x0bb6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER SHA
- 0x0bb7: (0x0bb7, 0x0bb9, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER SSA..TAMIL LETTER HA
- 0x0bbe: (0x0bbe, 0x0bc2, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL VOWEL SIGN AA..TAMIL VOWEL SIGN UU
- 0x0bc6: (0x0bc6, 0x0bc8, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL VOWEL SIGN E..TAMIL VOWEL SIGN AI
- 0x0bca: (0x0bca, 0x0bcd, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL VOWEL SIGN O..TAMIL SIGN VIRAMA
- 0x0bd0: (0x0bd0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL OM
- 0x0bd7: (0x0bd7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL AU LENGTH MARK
- 0x0be6: (0x0be6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL DIGIT ZERO
- 0x0be7: (0x0be7, 0x0bef, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL DIGIT ONE..TAMIL DIGIT NINE
- 0x0c01: (0x0c01, 0x0c03, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU SIGN CANDRABINDU..TELUGU SIGN VISARGA
- 0x0c04: (0x0c04, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU SIGN COMBINING ANUSVARA ABOVE
- 0x0c05: (0x0c05, 0x0c0c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER A..TELUGU LETTER VOCALIC L
- 0x0c0e: (0x0c0e, 0x0c10, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER E..TELUGU LETTER AI
- 0x0c12: (0x0c12, 0x0c28, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER O..TELUGU LETTER NA
- 0x0c2a: (0x0c2a, 0x0c33, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER PA..TELUGU LETTER LLA
- 0x0c35: (0x0c35, 0x0c39, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER VA..TELUGU LETTER HA
- 0x0c3d: (0x0c3d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU SIGN AVAGRAHA
- 0x0c3e: (0x0c3e, 0x0c44, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU VOWEL SIGN AA..TELUGU VOWEL SIGN VOCALIC RR
- 0x0c46: (0x0c46, 0x0c48, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU VOWEL SIGN E..TELUGU VOWEL SIGN AI
- 0x0c4a: (0x0c4a, 0x0c4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU VOWEL SIGN O..TELUGU SIGN VIRAMA
- 0x0c55: (0x0c55, 0x0c56, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LENGTH MARK..TELUGU AI LENGTH MARK
- 0x0c60: (0x0c60, 0x0c61, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER VOCALIC RR..TELUGU LETTER VOCALIC LL
- 0x0c66: (0x0c66, 0x0c6f, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU DIGIT ZERO..TELUGU DIGIT NINE
- 0x0c80: (0x0c80, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN SPACING CANDRABINDU
- 0x0c82: (0x0c82, 0x0c83, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN ANUSVARA..KANNADA SIGN VISARGA
- 0x0c85: (0x0c85, 0x0c8c, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER A..KANNADA LETTER VOCALIC L
- 0x0c8e: (0x0c8e, 0x0c90, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER E..KANNADA LETTER AI
- 0x0c92: (0x0c92, 0x0ca8, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER O..KANNADA LETTER NA
- 0x0caa: (0x0caa, 0x0cb3, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER PA..KANNADA LETTER LLA
- 0x0cb5: (0x0cb5, 0x0cb9, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER VA..KANNADA LETTER HA
- 0x0cbc: (0x0cbc, 0x0cbd, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN NUKTA..KANNADA SIGN AVAGRAHA
- 0x0cbe: (0x0cbe, 0x0cc4, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN AA..KANNADA VOWEL SIGN VOCALIC RR
- 0x0cc6: (0x0cc6, 0x0cc8, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN E..KANNADA VOWEL SIGN AI
- 0x0cca: (0x0cca, 0x0ccd, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN O..KANNADA SIGN VIRAMA
- 0x0cd5: (0x0cd5, 0x0cd6, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LENGTH MARK..KANNADA AI LENGTH MARK
- 0x0ce0: (0x0ce0, 0x0ce1, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER VOCALIC RR..KANNADA LETTER VOCALIC LL
- 0x0ce2: (0x0ce2, 0x0ce3, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN VOCALIC L..KANNADA VOWEL SIGN VOCALIC LL
- 0x0ce6: (0x0ce6, 0x0cef, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA DIGIT ZERO..KANNADA DIGIT NINE
- 0x0cf1: (0x0cf1, 0x0cf2, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN JIHVAMULIYA..KANNADA SIGN UPADHMANIYA
- 0x0d00: (0x0d00, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN COMBINING ANUSVARA ABOVE
- 0x0d02: (0x0d02, 0x0d03, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN ANUSVARA..MALAYALAM SIGN VISARGA
- 0x0d05: (0x0d05, 0x0d0c, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER A..MALAYALAM LETTER VOCALIC L
- 0x0d0e: (0x0d0e, 0x0d10, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER E..MALAYALAM LETTER AI
- 0x0d12: (0x0d12, 0x0d28, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER O..MALAYALAM LETTER NA
- 0x0d29: (0x0d29, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER NNNA
- 0x0d2a: (0x0d2a, 0x0d39, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER PA..MALAYALAM LETTER HA
- 0x0d3a: (0x0d3a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER TTTA
- 0x0d3b: (0x0d3b, 0x0d3c, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN VERTICAL BAR VIRAMA..MALAYALAM SIGN CIRCULAR VIRAMA
- 0x0d3d: (0x0d3d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN AVAGRAHA
- 0x0d3e: (0x0d3e, 0x0d43, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM VOWEL SIGN AA..MALAYALAM VOWEL SIGN VOCALIC R
- 0x0d46: (0x0d46, 0x0d48, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM VOWEL SIGN E..MALAYALAM VOWEL SIGN AI
- 0x0d4a: (0x0d4a, 0x0d4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM VOWEL SIGN O..MALAYALAM SIGN VIRAMA
- 0x0d4e: (0x0d4e, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER DOT REPH
- 0x0d54: (0x0d54, 0x0d56, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER CHILLU M..MALAYALAM LETTER CHILLU LLL
- 0x0d57: (0x0d57, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM AU LENGTH MARK
- 0x0d60: (0x0d60, 0x0d61, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER VOCALIC RR..MALAYALAM LETTER VOCALIC LL
- 0x0d66: (0x0d66, 0x0d6f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM DIGIT ZERO..MALAYALAM DIGIT NINE
- 0x0d7a: (0x0d7a, 0x0d7f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER CHILLU NN..MALAYALAM LETTER CHILLU K
- 0x0d82: (0x0d82, 0x0d83, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA SIGN ANUSVARAYA..SINHALA SIGN VISARGAYA
- 0x0d85: (0x0d85, 0x0d8e, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER AYANNA..SINHALA LETTER IRUUYANNA
- 0x0d91: (0x0d91, 0x0d96, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER EYANNA..SINHALA LETTER AUYANNA
- 0x0d9a: (0x0d9a, 0x0da5, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER ALPAPRAANA KAYANNA..SINHALA LETTER TAALUJA SANYOOGA NAAKSIKYAYA
- 0x0da7: (0x0da7, 0x0db1, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER ALPAPRAANA TTAYANNA..SINHALA LETTER DANTAJA NAYANNA
- 0x0db3: (0x0db3, 0x0dbb, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER SANYAKA DAYANNA..SINHALA LETTER RAYANNA
- 0x0dbd: (0x0dbd, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER DANTAJA LAYANNA
- 0x0dc0: (0x0dc0, 0x0dc6, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER VAYANNA..SINHALA LETTER FAYANNA
- 0x0dca: (0x0dca, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA SIGN AL-LAKUNA
- 0x0dcf: (0x0dcf, 0x0dd4, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN AELA-PILLA..SINHALA VOWEL SIGN KETTI PAA-PILLA
- 0x0dd6: (0x0dd6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN DIGA PAA-PILLA
- 0x0dd8: (0x0dd8, 0x0dde, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN GAETTA-PILLA..SINHALA VOWEL SIGN KOMBUVA HAA GAYANUKITTA
- 0x0df2: (0x0df2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN DIGA GAETTA-PILLA
- 0x0e01: (0x0e01, 0x0e32, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI CHARACTER KO KAI..THAI CHARACTER SARA AA
- 0x0e34: (0x0e34, 0x0e3a, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI CHARACTER SARA I..THAI CHARACTER PHINTHU
- 0x0e40: (0x0e40, 0x0e4e, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI CHARACTER SARA E..THAI CHARACTER YAMAKKAN
- 0x0e50: (0x0e50, 0x0e59, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI DIGIT ZERO..THAI DIGIT NINE
- 0x0e81: (0x0e81, 0x0e82, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER KO..LAO LETTER KHO SUNG
- 0x0e84: (0x0e84, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER KHO TAM
- 0x0e87: (0x0e87, 0x0e88, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER NGO..LAO LETTER CO
- 0x0e8a: (0x0e8a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER SO TAM
- 0x0e8d: (0x0e8d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER NYO
- 0x0e94: (0x0e94, 0x0e97, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER DO..LAO LETTER THO TAM
- 0x0e99: (0x0e99, 0x0e9f, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER NO..LAO LETTER FO SUNG
- 0x0ea1: (0x0ea1, 0x0ea3, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER MO..LAO LETTER LO LING
- 0x0ea5: (0x0ea5, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER LO LOOT
- 0x0ea7: (0x0ea7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER WO
- 0x0eaa: (0x0eaa, 0x0eab, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER SO SUNG..LAO LETTER HO SUNG
- 0x0ead: (0x0ead, 0x0eb2, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER O..LAO VOWEL SIGN AA
- 0x0eb4: (0x0eb4, 0x0eb9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO VOWEL SIGN I..LAO VOWEL SIGN UU
- 0x0ebb: (0x0ebb, 0x0ebd, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO VOWEL SIGN MAI KON..LAO SEMIVOWEL SIGN NYO
- 0x0ec0: (0x0ec0, 0x0ec4, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO VOWEL SIGN E..LAO VOWEL SIGN AI
- 0x0ec6: (0x0ec6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO KO LA
- 0x0ec8: (0x0ec8, 0x0ecd, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO TONE MAI EK..LAO NIGGAHITA
- 0x0ed0: (0x0ed0, 0x0ed9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO DIGIT ZERO..LAO DIGIT NINE
- 0x0ede: (0x0ede, 0x0edf, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER KHMU GO..LAO LETTER KHMU NYO
- 0x0f00: (0x0f00, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SYLLABLE OM
- 0x0f20: (0x0f20, 0x0f29, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN DIGIT ZERO..TIBETAN DIGIT NINE
- 0x0f35: (0x0f35, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN MARK NGAS BZUNG NYI ZLA
- 0x0f37: (0x0f37, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN MARK NGAS BZUNG SGOR RTAGS
- 0x0f3e: (0x0f3e, 0x0f42, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN YAR TSHES..TIBETAN LETTER GA
- 0x0f44: (0x0f44, 0x0f47, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NGA..TIBETAN LETTER JA
- 0x0f49: (0x0f49, 0x0f4c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NYA..TIBETAN LETTER DDA
- 0x0f4e: (0x0f4e, 0x0f51, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NNA..TIBETAN LETTER DA
- 0x0f53: (0x0f53, 0x0f56, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NA..TIBETAN LETTER BA
- 0x0f58: (0x0f58, 0x0f5b, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER MA..TIBETAN LETTER DZA
- 0x0f5d: (0x0f5d, 0x0f68, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER WA..TIBETAN LETTER A
- 0x0f6a: (0x0f6a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER FIXED-FORM RA
- 0x0f6b: (0x0f6b, 0x0f6c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER KKA..TIBETAN LETTER RRA
- 0x0f71: (0x0f71, 0x0f72, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN VOWEL SIGN AA..TIBETAN VOWEL SIGN I
- 0x0f74: (0x0f74, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN VOWEL SIGN U
- 0x0f7a: (0x0f7a, 0x0f80, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN VOWEL SIGN E..TIBETAN VOWEL SIGN REVERSED I
- 0x0f82: (0x0f82, 0x0f84, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN NYI ZLA NAA DA..TIBETAN MARK HALANTA
- 0x0f86: (0x0f86, 0x0f8b, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN LCI RTAGS..TIBETAN SIGN GRU MED RGYINGS
- 0x0f8c: (0x0f8c, 0x0f8f, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN INVERTED MCHU CAN..TIBETAN SUBJOINED SIGN INVERTED MCHU CAN
- 0x0f90: (0x0f90, 0x0f92, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER KA..TIBETAN SUBJOINED LETTER GA
- 0x0f94: (0x0f94, 0x0f95, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NGA..TIBETAN SUBJOINED LETTER CA
- 0x0f96: (0x0f96, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER CHA
- 0x0f97: (0x0f97, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER JA
- 0x0f99: (0x0f99, 0x0f9c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NYA..TIBETAN SUBJOINED LETTER DDA
- 0x0f9e: (0x0f9e, 0x0fa1, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NNA..TIBETAN SUBJOINED LETTER DA
- 0x0fa3: (0x0fa3, 0x0fa6, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NA..TIBETAN SUBJOINED LETTER BA
- 0x0fa8: (0x0fa8, 0x0fab, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER MA..TIBETAN SUBJOINED LETTER DZA
- 0x0fad: (0x0fad, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER WA
- 0x0fae: (0x0fae, 0x0fb0, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER ZHA..TIBETAN SUBJOINED LETTER -A
- 0x0fb1: (0x0fb1, 0x0fb7, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER YA..TIBETAN SUBJOINED LETTER HA
- 0x0fb8: (0x0fb8, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER A
- 0x0fba: (0x0fba, 0x0fbc, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER FIXED-FORM WA..TIBETAN SUBJOINED LETTER FIXED-FORM RA
- 0x0fc6: (0x0fc6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SYMBOL PADMA GDAN
- 0x1000: (0x1000, 0x1021, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER KA..MYANMAR LETTER A
- 0x1022: (0x1022, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER SHAN A
- 0x1023: (0x1023, 0x1027, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER I..MYANMAR LETTER E
- 0x1028: (0x1028, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER MON E
- 0x1029: (0x1029, 0x102a, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER O..MYANMAR LETTER AU
- 0x102b: (0x102b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR VOWEL SIGN TALL AA
- 0x102c: (0x102c, 0x1032, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR VOWEL SIGN AA..MYANMAR VOWEL SIGN AI
- 0x1033: (0x1033, 0x1035, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR VOWEL SIGN MON II..MYANMAR VOWEL SIGN E ABOVE
- 0x1036: (0x1036, 0x1039, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN ANUSVARA..MYANMAR SIGN VIRAMA
- 0x103a: (0x103a, 0x103f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN ASAT..MYANMAR LETTER GREAT SA
- 0x1040: (0x1040, 0x1049, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR DIGIT ZERO..MYANMAR DIGIT NINE
- 0x1050: (0x1050, 0x1059, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER SHA..MYANMAR VOWEL SIGN VOCALIC LL
- 0x105a: (0x105a, 0x1099, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER MON NGA..MYANMAR SHAN DIGIT NINE
- 0x109a: (0x109a, 0x109d, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN KHAMTI TONE-1..MYANMAR VOWEL SIGN AITON AI
- 0x10c7: (0x10c7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN CAPITAL LETTER YN
- 0x10cd: (0x10cd, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN CAPITAL LETTER AEN
- 0x10d0: (0x10d0, 0x10f0, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER AN..GEORGIAN LETTER HAE
- 0x10f7: (0x10f7, 0x10f8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER YN..GEORGIAN LETTER ELIFI
- 0x10f9: (0x10f9, 0x10fa, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER TURNED GAN..GEORGIAN LETTER AIN
- 0x10fd: (0x10fd, 0x10ff, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER AEN..GEORGIAN LETTER LABIAL SIGN
- 0x1200: (0x1200, 0x1206, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE HA..ETHIOPIC SYLLABLE HO
- 0x1207: (0x1207, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE HOA
- 0x1208: (0x1208, 0x1246, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE LA..ETHIOPIC SYLLABLE QO
- 0x1247: (0x1247, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QOA
- 0x1248: (0x1248, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QWA
- 0x124a: (0x124a, 0x124d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QWI..ETHIOPIC SYLLABLE QWE
- 0x1250: (0x1250, 0x1256, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QHA..ETHIOPIC SYLLABLE QHO
- 0x1258: (0x1258, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QHWA
- 0x125a: (0x125a, 0x125d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QHWI..ETHIOPIC SYLLABLE QHWE
- 0x1260: (0x1260, 0x1286, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE BA..ETHIOPIC SYLLABLE XO
- 0x1287: (0x1287, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XOA
- 0x1288: (0x1288, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XWA
- 0x128a: (0x128a, 0x128d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XWI..ETHIOPIC SYLLABLE XWE
- 0x1290: (0x1290, 0x12ae, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE NA..ETHIOPIC SYLLABLE KO
- 0x12af: (0x12af, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KOA
- 0x12b0: (0x12b0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KWA
- 0x12b2: (0x12b2, 0x12b5, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KWI..ETHIOPIC SYLLABLE KWE
- 0x12b8: (0x12b8, 0x12be, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KXA..ETHIOPIC SYLLABLE KXO
- 0x12c0: (0x12c0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KXWA
- 0x12c2: (0x12c2, 0x12c5, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KXWI..ETHIOPIC SYLLABLE KXWE
- 0x12c8: (0x12c8, 0x12ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE WA..ETHIOPIC SYLLABLE WO
- 0x12cf: (0x12cf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE WOA
- 0x12d0: (0x12d0, 0x12d6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE PHARYNGEAL A..ETHIOPIC SYLLABLE PHARYNGEAL O
- 0x12d8: (0x12d8, 0x12ee, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE ZA..ETHIOPIC SYLLABLE YO
- 0x12ef: (0x12ef, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE YOA
- 0x12f0: (0x12f0, 0x130e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE DA..ETHIOPIC SYLLABLE GO
- 0x130f: (0x130f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GOA
- 0x1310: (0x1310, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GWA
- 0x1312: (0x1312, 0x1315, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GWI..ETHIOPIC SYLLABLE GWE
- 0x1318: (0x1318, 0x131e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GGA..ETHIOPIC SYLLABLE GGO
- 0x131f: (0x131f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GGWAA
- 0x1320: (0x1320, 0x1346, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE THA..ETHIOPIC SYLLABLE TZO
- 0x1347: (0x1347, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE TZOA
- 0x1348: (0x1348, 0x135a, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE FA..ETHIOPIC SYLLABLE FYA
- 0x135d: (0x135d, 0x135e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC COMBINING GEMINATION AND VOWEL LENGTH MARK..ETHIOPIC COMBINING VOWEL LENGTH MARK
- 0x135f: (0x135f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC COMBINING GEMINATION MARK
- 0x1380: (0x1380, 0x138f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE SEBATBEIT MWA..ETHIOPIC SYLLABLE PWE
- 0x1780: (0x1780, 0x17a2, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER LETTER KA..KHMER LETTER QA
- 0x17a5: (0x17a5, 0x17a7, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER INDEPENDENT VOWEL QI..KHMER INDEPENDENT VOWEL QU
- 0x17a9: (0x17a9, 0x17b3, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER INDEPENDENT VOWEL QUU..KHMER INDEPENDENT VOWEL QAU
- 0x17b6: (0x17b6, 0x17ca, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER VOWEL SIGN AA..KHMER SIGN TRIISAP
- 0x17d2: (0x17d2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER SIGN COENG
- 0x17d7: (0x17d7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER SIGN LEK TOO
- 0x17dc: (0x17dc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER SIGN AVAKRAHASANYA
- 0x17e0: (0x17e0, 0x17e9, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER DIGIT ZERO..KHMER DIGIT NINE
- 0x1c80: (0x1c80, 0x1c88, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER ROUNDED VE..CYRILLIC SMALL LETTER UNBLENDED UK
- 0x1c90: (0x1c90, 0x1cba, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN MTAVRULI CAPITAL LETTER AN..GEORGIAN MTAVRULI CAPITAL LETTER AIN
- 0x1cbd: (0x1cbd, 0x1cbf, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN MTAVRULI CAPITAL LETTER AEN..GEORGIAN MTAVRULI CAPITAL LETTER LABIAL SIGN
- 0x1e00: (0x1e00, 0x1e99, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH RING BELOW..LATIN SMALL LETTER Y WITH RING ABOVE
- 0x1e9e: (0x1e9e, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER SHARP S
- 0x1ea0: (0x1ea0, 0x1ef9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH DOT BELOW..LATIN SMALL LETTER Y WITH TILDE
- 0x1f00: (0x1f00, 0x1f15, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ALPHA WITH PSILI..GREEK SMALL LETTER EPSILON WITH DASIA AND OXIA
- 0x1f18: (0x1f18, 0x1f1d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER EPSILON WITH PSILI..GREEK CAPITAL LETTER EPSILON WITH DASIA AND OXIA
- 0x1f20: (0x1f20, 0x1f45, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH PSILI..GREEK SMALL LETTER OMICRON WITH DASIA AND OXIA
- 0x1f48: (0x1f48, 0x1f4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMICRON WITH PSILI..GREEK CAPITAL LETTER OMICRON WITH DASIA AND OXIA
- 0x1f50: (0x1f50, 0x1f57, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER UPSILON WITH PSILI..GREEK SMALL LETTER UPSILON WITH DASIA AND PERISPOMENI
- 0x1f59: (0x1f59, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA
- 0x1f5b: (0x1f5b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND VARIA
- 0x1f5d: (0x1f5d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND OXIA
- 0x1f5f: (0x1f5f, 0x1f70, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND PERISPOMENI..GREEK SMALL LETTER ALPHA WITH VARIA
- 0x1f72: (0x1f72, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER EPSILON WITH VARIA
- 0x1f74: (0x1f74, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH VARIA
- 0x1f76: (0x1f76, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER IOTA WITH VARIA
- 0x1f78: (0x1f78, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMICRON WITH VARIA
- 0x1f7a: (0x1f7a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER UPSILON WITH VARIA
- 0x1f7c: (0x1f7c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMEGA WITH VARIA
- 0x1f80: (0x1f80, 0x1fb4, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ALPHA WITH PSILI AND YPOGEGRAMMENI..GREEK SMALL LETTER ALPHA WITH OXIA AND YPOGEGRAMMENI
- 0x1fb6: (0x1fb6, 0x1fba, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ALPHA WITH PERISPOMENI..GREEK CAPITAL LETTER ALPHA WITH VARIA
- 0x1fbc: (0x1fbc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ALPHA WITH PROSGEGRAMMENI
- 0x1fc2: (0x1fc2, 0x1fc4, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER ETA WITH OXIA AND YPOGEGRAMMENI
- 0x1fc6: (0x1fc6, 0x1fc8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH PERISPOMENI..GREEK CAPITAL LETTER EPSILON WITH VARIA
- 0x1fca: (0x1fca, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ETA WITH VARIA
- 0x1fcc: (0x1fcc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ETA WITH PROSGEGRAMMENI
- 0x1fd0: (0x1fd0, 0x1fd2, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER IOTA WITH VRACHY..GREEK SMALL LETTER IOTA WITH DIALYTIKA AND VARIA
- 0x1fd6: (0x1fd6, 0x1fda, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER IOTA WITH PERISPOMENI..GREEK CAPITAL LETTER IOTA WITH VARIA
- 0x1fe0: (0x1fe0, 0x1fe2, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER UPSILON WITH VRACHY..GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND VARIA
- 0x1fe4: (0x1fe4, 0x1fea, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER RHO WITH PSILI..GREEK CAPITAL LETTER UPSILON WITH VARIA
- 0x1fec: (0x1fec, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER RHO WITH DASIA
- 0x1ff2: (0x1ff2, 0x1ff4, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMEGA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER OMEGA WITH OXIA AND YPOGEGRAMMENI
- 0x1ff6: (0x1ff6, 0x1ff8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMEGA WITH PERISPOMENI..GREEK CAPITAL LETTER OMICRON WITH VARIA
- 0x1ffa: (0x1ffa, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMEGA WITH VARIA
- 0x1ffc: (0x1ffc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMEGA WITH PROSGEGRAMMENI
- 0x2d27: (0x2d27, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN SMALL LETTER YN
- 0x2d2d: (0x2d2d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN SMALL LETTER AEN
- 0x2d80: (0x2d80, 0x2d96, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE LOA..ETHIOPIC SYLLABLE GGWE
- 0x2da0: (0x2da0, 0x2da6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE SSA..ETHIOPIC SYLLABLE SSO
- 0x2da8: (0x2da8, 0x2dae, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE CCA..ETHIOPIC SYLLABLE CCO
- 0x2db0: (0x2db0, 0x2db6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE ZZA..ETHIOPIC SYLLABLE ZZO
- 0x2db8: (0x2db8, 0x2dbe, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE CCHA..ETHIOPIC SYLLABLE CCHO
- 0x2dc0: (0x2dc0, 0x2dc6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QYA..ETHIOPIC SYLLABLE QYO
- 0x2dc8: (0x2dc8, 0x2dce, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KYA..ETHIOPIC SYLLABLE KYO
- 0x2dd0: (0x2dd0, 0x2dd6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XYA..ETHIOPIC SYLLABLE XYO
- 0x2dd8: (0x2dd8, 0x2dde, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GYA..ETHIOPIC SYLLABLE GYO
- 0x3005: (0x3005, 0x3007, 1,0,0,0,0,0,0,0,0,0,1,0), #  IDEOGRAPHIC ITERATION MARK..IDEOGRAPHIC NUMBER ZERO
- 0x3041: (0x3041, 0x3094, 1,0,0,0,0,0,0,0,0,0,1,0), #  HIRAGANA LETTER SMALL A..HIRAGANA LETTER VU
- 0x3095: (0x3095, 0x3096, 1,0,0,0,0,0,0,0,0,0,1,0), #  HIRAGANA LETTER SMALL KA..HIRAGANA LETTER SMALL KE
- 0x3099: (0x3099, 0x309a, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING KATAKANA-HIRAGANA VOICED SOUND MARK..COMBINING KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK
- 0x309d: (0x309d, 0x309e, 1,0,0,0,0,0,0,0,0,0,1,0), #  HIRAGANA ITERATION MARK..HIRAGANA VOICED ITERATION MARK
- 0x30a1: (0x30a1, 0x30fa, 1,0,0,0,0,0,0,0,0,0,1,0), #  KATAKANA LETTER SMALL A..KATAKANA LETTER VO
- 0x30fc: (0x30fc, 0x30fe, 1,0,0,0,0,0,0,0,0,0,1,0), #  KATAKANA-HIRAGANA PROLONGED SOUND MARK..KATAKANA VOICED ITERATION MARK
- 0x3105: (0x3105, 0x312c, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER B..BOPOMOFO LETTER GN
- 0x312d: (0x312d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER IH
- 0x312e: (0x312e, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER O WITH DOT ABOVE
- 0x312f: (0x312f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER NN
- 0x31a0: (0x31a0, 0x31b7, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER BU..BOPOMOFO FINAL LETTER H
- 0x31b8: (0x31b8, 0x31ba, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER GH..BOPOMOFO LETTER ZY
- 0x3400: (0x3400, 0x4db5, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-3400..CJK UNIFIED IDEOGRAPH-4DB5
- 0x4e00: (0x4e00, 0x9fa5, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] CJK UNIFIED IDEOGRAPH-4E00..CJK UNIFIED IDEOGRAPH-9FA5
- 0x9fa6: (0x9fa6, 0x9fbb, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FA6..CJK UNIFIED IDEOGRAPH-9FBB
- 0x9fbc: (0x9fbc, 0x9fc3, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FBC..CJK UNIFIED IDEOGRAPH-9FC3
- 0x9fc4: (0x9fc4, 0x9fcb, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FC4..CJK UNIFIED IDEOGRAPH-9FCB
- 0x9fcc: (0x9fcc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FCC
- 0x9fcd: (0x9fcd, 0x9fd5, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FCD..CJK UNIFIED IDEOGRAPH-9FD5
- 0x9fd6: (0x9fd6, 0x9fea, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FD6..CJK UNIFIED IDEOGRAPH-9FEA
- 0x9feb: (0x9feb, 0x9fef, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FEB..CJK UNIFIED IDEOGRAPH-9FEF
- 0xa660: (0xa660, 0xa661, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER REVERSED TSE..CYRILLIC SMALL LETTER REVERSED TSE
- 0xa674: (0xa674, 0xa67b, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING CYRILLIC LETTER UKRAINIAN IE..COMBINING CYRILLIC LETTER OMEGA
- 0xa67f: (0xa67f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC PAYEROK
- 0xa69f: (0xa69f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING CYRILLIC LETTER IOTIFIED E
- 0xa717: (0xa717, 0xa71a, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER DOT VERTICAL BAR..MODIFIER LETTER LOWER RIGHT CORNER ANGLE
- 0xa71b: (0xa71b, 0xa71f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER RAISED UP ARROW..MODIFIER LETTER LOW INVERTED EXCLAMATION MARK
- 0xa788: (0xa788, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER LOW CIRCUMFLEX ACCENT
- 0xa78d: (0xa78d, 0xa78e, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER TURNED H..LATIN SMALL LETTER L WITH RETROFLEX HOOK AND BELT
- 0xa790: (0xa790, 0xa791, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER N WITH DESCENDER..LATIN SMALL LETTER N WITH DESCENDER
- 0xa792: (0xa792, 0xa793, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER C WITH BAR..LATIN SMALL LETTER C WITH BAR
- 0xa7a0: (0xa7a0, 0xa7a9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER G WITH OBLIQUE STROKE..LATIN SMALL LETTER S WITH OBLIQUE STROKE
- 0xa7aa: (0xa7aa, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER H WITH HOOK
- 0xa7ae: (0xa7ae, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER SMALL CAPITAL I
- 0xa7af: (0xa7af, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN LETTER SMALL CAPITAL Q
- 0xa7b8: (0xa7b8, 0xa7b9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER U WITH STROKE..LATIN SMALL LETTER U WITH STROKE
- 0xa7fa: (0xa7fa, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN LETTER SMALL CAPITAL TURNED M
- 0xa9e7: (0xa9e7, 0xa9fe, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER TAI LAING NYA..MYANMAR LETTER TAI LAING BHA
- 0xaa60: (0xaa60, 0xaa76, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER KHAMTI GA..MYANMAR LOGOGRAM KHAMTI HM
- 0xaa7a: (0xaa7a, 0xaa7b, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER AITON RA..MYANMAR SIGN PAO KAREN TONE
- 0xaa7c: (0xaa7c, 0xaa7f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN TAI LAING TONE-2..MYANMAR LETTER SHWE PALAUNG SHA
- 0xab01: (0xab01, 0xab06, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE TTHU..ETHIOPIC SYLLABLE TTHO
- 0xab09: (0xab09, 0xab0e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE DDHU..ETHIOPIC SYLLABLE DDHO
- 0xab11: (0xab11, 0xab16, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE DZU..ETHIOPIC SYLLABLE DZO
- 0xab20: (0xab20, 0xab26, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE CCHHA..ETHIOPIC SYLLABLE CCHHO
- 0xab28: (0xab28, 0xab2e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE BBA..ETHIOPIC SYLLABLE BBO
- 0xac00: (0xac00, 0xd7a3, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] HANGUL SYLLABLE GA..HANGUL SYLLABLE HIH
- 0xfa0e: (0xfa0e, 0xfa0f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA0E..CJK COMPATIBILITY IDEOGRAPH-FA0F
- 0xfa11: (0xfa11, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA11
- 0xfa13: (0xfa13, 0xfa14, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA13..CJK COMPATIBILITY IDEOGRAPH-FA14
- 0xfa1f: (0xfa1f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA1F
- 0xfa21: (0xfa21, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA21
- 0xfa23: (0xfa23, 0xfa24, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA23..CJK COMPATIBILITY IDEOGRAPH-FA24
- 0xfa27: (0xfa27, 0xfa29, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA27..CJK COMPATIBILITY IDEOGRAPH-FA29
- 0x1133b: (0x1133b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING BINDU BELOW
- 0x1b002: (0x1b002, 0x1b11e, 1,0,0,0,0,0,0,0,0,0,1,0), #  HENTAIGANA LETTER A-1..HENTAIGANA LETTER N-MU-MO-2
- 0x20000: (0x20000, 0x2a6d6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] CJK UNIFIED IDEOGRAPH-20000..CJK UNIFIED IDEOGRAPH-2A6D6
- 0x2a700: (0x2a700, 0x2b734, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-2A700..CJK UNIFIED IDEOGRAPH-2B734
- 0x2b740: (0x2b740, 0x2b81d, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-2B740..CJK UNIFIED IDEOGRAPH-2B81D
- 0x2b820: (0x2b820, 0x2cea1, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-2B820..CJK UNIFIED IDEOGRAPH-2CEA1
- 0x2ceb0: (0x2ceb0, 0x2ebe0, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] CJK UNIFIED IDEOGRAPH-2CEB0..CJK UNIFIED IDEOGRAPH-2EBE0
- 0x0027: (0x0027, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  APOSTROPHE
- 0x002d: (0x002d, 0x002e, 1,0,0,0,1,0,0,0,0,0,0,0), #  HYPHEN-MINUS..FULL STOP
- 0x003a: (0x003a, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  COLON
- 0x00b7: (0x00b7, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  MIDDLE DOT
- 0x0375: (0x0375, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  GREEK LOWER NUMERAL SIGN
- 0x058a: (0x058a, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  ARMENIAN HYPHEN
- 0x05f3: (0x05f3, 0x05f4, 1,0,0,0,1,0,0,0,0,0,0,0), #  HEBREW PUNCTUATION GERESH..HEBREW PUNCTUATION GERSHAYIM
- 0x06fd: (0x06fd, 0x06fe, 1,0,0,0,1,0,0,0,0,0,0,0), #  ARABIC SIGN SINDHI AMPERSAND..ARABIC SIGN SINDHI POSTPOSITION MEN
- 0x0f0b: (0x0f0b, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  TIBETAN MARK INTERSYLLABIC TSHEG
- 0x200c: (0x200c, 0x200d, 1,0,0,0,1,0,0,0,0,0,0,0), #  ZERO WIDTH NON-JOINER..ZERO WIDTH JOINER
- 0x2010: (0x2010, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  HYPHEN
- 0x2019: (0x2019, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  RIGHT SINGLE QUOTATION MARK
- 0x2027: (0x2027, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  HYPHENATION POINT
- 0x30a0: (0x30a0, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  KATAKANA-HIRAGANA DOUBLE HYPHEN
- 0x30fb: (0x30fb, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  KATAKANA MIDDLE DOT
- 0x0710: (0x0710, 0x072c, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER ALAPH..SYRIAC LETTER TAW
- 0x072d: (0x072d, 0x072f, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER PERSIAN BHETH..SYRIAC LETTER PERSIAN DHALATH
- 0x0730: (0x0730, 0x073f, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC PTHAHA ABOVE..SYRIAC RWAHA
- 0x074d: (0x074d, 0x074f, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER SOGDIAN ZHAIN..SYRIAC LETTER SOGDIAN FE
- 0x07c0: (0x07c0, 0x07e7, 0,0,0,0,0,0,1,0,0,0,0,0), #  NKO DIGIT ZERO..NKO LETTER NYA WOLOSO
- 0x07eb: (0x07eb, 0x07f5, 0,0,0,0,0,0,1,0,0,0,0,0), #  NKO COMBINING SHORT HIGH TONE..NKO LOW TONE APOSTROPHE
- 0x07fd: (0x07fd, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  NKO DANTAYALAN
- 0x0840: (0x0840, 0x085b, 0,0,0,0,0,0,1,0,0,0,0,0), #  MANDAIC LETTER HALQA..MANDAIC GEMINATION MARK
- 0x0860: (0x0860, 0x086a, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER MALAYALAM NGA..SYRIAC LETTER MALAYALAM SSA
- 0x13a0: (0x13a0, 0x13f4, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE LETTER A..CHEROKEE LETTER YV
- 0x13f5: (0x13f5, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE LETTER MV
- 0x13f8: (0x13f8, 0x13fd, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE SMALL LETTER YE..CHEROKEE SMALL LETTER MV
- 0x1401: (0x1401, 0x166c, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS E..CANADIAN SYLLABICS CARRIER TTSA
- 0x166f: (0x166f, 0x1676, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS QAI..CANADIAN SYLLABICS NNGAA
- 0x1677: (0x1677, 0x167f, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS WOODS-CREE THWEE..CANADIAN SYLLABICS BLACKFOOT W
- 0x18b0: (0x18b0, 0x18f5, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS OY..CANADIAN SYLLABICS CARRIER DENTAL S
- 0x1900: (0x1900, 0x191c, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU VOWEL-CARRIER LETTER..LIMBU LETTER HA
- 0x191d: (0x191d, 0x191e, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU LETTER GYAN..LIMBU LETTER TRA
- 0x1920: (0x1920, 0x192b, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU VOWEL SIGN A..LIMBU SUBJOINED LETTER WA
- 0x1930: (0x1930, 0x193b, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU SMALL LETTER KA..LIMBU SIGN SA-I
- 0x1946: (0x1946, 0x196d, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU DIGIT ZERO..TAI LE LETTER AI
- 0x1970: (0x1970, 0x1974, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI LE LETTER TONE-2..TAI LE LETTER TONE-6
- 0x1980: (0x1980, 0x19a9, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE LETTER HIGH QA..NEW TAI LUE LETTER LOW XVA
- 0x19aa: (0x19aa, 0x19ab, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE LETTER HIGH SUA..NEW TAI LUE LETTER LOW SUA
- 0x19b0: (0x19b0, 0x19c9, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE VOWEL SIGN VOWEL SHORTENER..NEW TAI LUE TONE MARK-2
- 0x19d0: (0x19d0, 0x19d9, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE DIGIT ZERO..NEW TAI LUE DIGIT NINE
- 0x19da: (0x19da, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE THAM DIGIT ONE
- 0x1a20: (0x1a20, 0x1a5e, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM LETTER HIGH KA..TAI THAM CONSONANT SIGN SA
- 0x1a60: (0x1a60, 0x1a7c, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM SIGN SAKOT..TAI THAM SIGN KHUEN-LUE KARAN
- 0x1a7f: (0x1a7f, 0x1a89, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM COMBINING CRYPTOGRAMMIC DOT..TAI THAM HORA DIGIT NINE
- 0x1a90: (0x1a90, 0x1a99, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM THAM DIGIT ZERO..TAI THAM THAM DIGIT NINE
- 0x1aa7: (0x1aa7, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM SIGN MAI YAMOK
- 0x1b00: (0x1b00, 0x1b4b, 0,0,0,0,0,0,1,0,0,0,0,0), #  BALINESE SIGN ULU RICEM..BALINESE LETTER ASYURA SASAK
- 0x1b50: (0x1b50, 0x1b59, 0,0,0,0,0,0,1,0,0,0,0,0), #  BALINESE DIGIT ZERO..BALINESE DIGIT NINE
- 0x1b6b: (0x1b6b, 0x1b73, 0,0,0,0,0,0,1,0,0,0,0,0), #  BALINESE MUSICAL SYMBOL COMBINING TEGEH..BALINESE MUSICAL SYMBOL COMBINING GONG
- 0x1b80: (0x1b80, 0x1baa, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE SIGN PANYECEK..SUNDANESE SIGN PAMAAEH
- 0x1bab: (0x1bab, 0x1bad, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE SIGN VIRAMA..SUNDANESE CONSONANT SIGN PASANGAN WA
- 0x1bae: (0x1bae, 0x1bb9, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE LETTER KHA..SUNDANESE DIGIT NINE
- 0x1bba: (0x1bba, 0x1bbf, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE AVAGRAHA..SUNDANESE LETTER FINAL M
- 0x1bc0: (0x1bc0, 0x1bf3, 0,0,0,0,0,0,1,0,0,0,0,0), #  BATAK LETTER A..BATAK PANONGONAN
- 0x1c00: (0x1c00, 0x1c37, 0,0,0,0,0,0,1,0,0,0,0,0), #  LEPCHA LETTER KA..LEPCHA SIGN NUKTA
- 0x1c40: (0x1c40, 0x1c49, 0,0,0,0,0,0,1,0,0,0,0,0), #  LEPCHA DIGIT ZERO..LEPCHA DIGIT NINE
- 0x1c4d: (0x1c4d, 0x1c7d, 0,0,0,0,0,0,1,0,0,0,0,0), #  LEPCHA LETTER TTA..OL CHIKI AHAD
- 0x2d30: (0x2d30, 0x2d65, 0,0,0,0,0,0,1,0,0,0,0,0), #  TIFINAGH LETTER YA..TIFINAGH LETTER YAZZ
- 0x2d66: (0x2d66, 0x2d67, 0,0,0,0,0,0,1,0,0,0,0,0), #  TIFINAGH LETTER YE..TIFINAGH LETTER YO
- 0x2d7f: (0x2d7f, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  TIFINAGH CONSONANT JOINER
- 0xa000: (0xa000, 0xa48c, 0,0,0,0,0,0,1,0,0,0,0,0), #  YI SYLLABLE IT..YI SYLLABLE YYR
- 0xa4d0: (0xa4d0, 0xa4fd, 0,0,0,0,0,0,1,0,0,0,0,0), #  LISU LETTER BA..LISU LETTER TONE MYA JEU
- 0xa500: (0xa500, 0xa60c, 0,0,0,0,0,0,1,0,0,0,0,0), #  VAI SYLLABLE EE..VAI SYLLABLE LENGTHENER
- 0xa613: (0xa613, 0xa629, 0,0,0,0,0,0,1,0,0,0,0,0), #  VAI SYMBOL FEENG..VAI DIGIT NINE
- 0xa6a0: (0xa6a0, 0xa6f1, 0,0,0,0,0,0,1,0,0,0,0,0), #  BAMUM LETTER A..BAMUM COMBINING MARK TUKWENTIS
- 0xa800: (0xa800, 0xa827, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYLOTI NAGRI LETTER A..SYLOTI NAGRI VOWEL SIGN OO
- 0xa880: (0xa880, 0xa8c4, 0,0,0,0,0,0,1,0,0,0,0,0), #  SAURASHTRA SIGN ANUSVARA..SAURASHTRA SIGN VIRAMA
- 0xa8c5: (0xa8c5, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  SAURASHTRA SIGN CANDRABINDU
- 0xa8d0: (0xa8d0, 0xa8d9, 0,0,0,0,0,0,1,0,0,0,0,0), #  SAURASHTRA DIGIT ZERO..SAURASHTRA DIGIT NINE
- 0xa900: (0xa900, 0xa92d, 0,0,0,0,0,0,1,0,0,0,0,0), #  KAYAH LI DIGIT ZERO..KAYAH LI TONE CALYA PLOPHU
- 0xa980: (0xa980, 0xa9c0, 0,0,0,0,0,0,1,0,0,0,0,0), #  JAVANESE SIGN PANYANGGA..JAVANESE PANGKON
- 0xa9d0: (0xa9d0, 0xa9d9, 0,0,0,0,0,0,1,0,0,0,0,0), #  JAVANESE DIGIT ZERO..JAVANESE DIGIT NINE
- 0xaa00: (0xaa00, 0xaa36, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAM LETTER A..CHAM CONSONANT SIGN WA
- 0xaa40: (0xaa40, 0xaa4d, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAM LETTER FINAL K..CHAM CONSONANT SIGN FINAL H
- 0xaa50: (0xaa50, 0xaa59, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAM DIGIT ZERO..CHAM DIGIT NINE
- 0xaa80: (0xaa80, 0xaac2, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI VIET LETTER LOW KO..TAI VIET TONE MAI SONG
- 0xaadb: (0xaadb, 0xaadd, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI VIET SYMBOL KON..TAI VIET SYMBOL SAM
- 0xaae0: (0xaae0, 0xaaef, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK LETTER E..MEETEI MAYEK VOWEL SIGN AAU
- 0xaaf2: (0xaaf2, 0xaaf6, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK ANJI..MEETEI MAYEK VIRAMA
- 0xab70: (0xab70, 0xabbf, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE SMALL LETTER A..CHEROKEE SMALL LETTER YA
- 0xabc0: (0xabc0, 0xabea, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK LETTER KOK..MEETEI MAYEK VOWEL SIGN NUNG
- 0xabec: (0xabec, 0xabed, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK LUM IYEK..MEETEI MAYEK APUN IYEK
- 0xabf0: (0xabf0, 0xabf9, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK DIGIT ZERO..MEETEI MAYEK DIGIT NINE
- 0x104b0: (0x104b0, 0x104d3, 0,0,0,0,0,0,1,0,0,0,0,0), #  OSAGE CAPITAL LETTER A..OSAGE CAPITAL LETTER ZHA
- 0x104d8: (0x104d8, 0x104fb, 0,0,0,0,0,0,1,0,0,0,0,0), #  OSAGE SMALL LETTER A..OSAGE SMALL LETTER ZHA
- 0x10d00: (0x10d00, 0x10d27, 0,0,0,0,0,0,1,0,0,0,0,0), #  HANIFI ROHINGYA LETTER A..HANIFI ROHINGYA SIGN TASSI
- 0x10d30: (0x10d30, 0x10d39, 0,0,0,0,0,0,1,0,0,0,0,0), #  HANIFI ROHINGYA DIGIT ZERO..HANIFI ROHINGYA DIGIT NINE
- 0x11100: (0x11100, 0x11134, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAKMA SIGN CANDRABINDU..CHAKMA MAAYYAA
- 0x11136: (0x11136, 0x1113f, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAKMA DIGIT ZERO..CHAKMA DIGIT NINE
- 0x11144: (0x11144, 0x11146, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAKMA LETTER LHAA..CHAKMA VOWEL SIGN EI
- 0x11400: (0x11400, 0x1144a, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEWA LETTER A..NEWA SIDDHI
- 0x11450: (0x11450, 0x11459, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEWA DIGIT ZERO..NEWA DIGIT NINE
- 0x1145e: (0x1145e, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEWA SANDHI MARK
- 0x11d60: (0x11d60, 0x11d65, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI LETTER A..GUNJALA GONDI LETTER UU
- 0x11d67: (0x11d67, 0x11d68, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI LETTER EE..GUNJALA GONDI LETTER AI
- 0x11d6a: (0x11d6a, 0x11d8e, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI LETTER OO..GUNJALA GONDI VOWEL SIGN UU
- 0x11d90: (0x11d90, 0x11d91, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI VOWEL SIGN EE..GUNJALA GONDI VOWEL SIGN AI
- 0x11d93: (0x11d93, 0x11d98, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI VOWEL SIGN OO..GUNJALA GONDI OM
- 0x11da0: (0x11da0, 0x11da9, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI DIGIT ZERO..GUNJALA GONDI DIGIT NINE
- 0x16800: (0x16800, 0x16a38, 0,0,0,0,0,0,1,0,0,0,0,0), #  BAMUM LETTER PHASE-A NGKUE MFON..BAMUM LETTER PHASE-F VUEQ
- 0x16f00: (0x16f00, 0x16f44, 0,0,0,0,0,0,1,0,0,0,0,0), #  MIAO LETTER PA..MIAO LETTER HHA
- 0x16f50: (0x16f50, 0x16f7e, 0,0,0,0,0,0,1,0,0,0,0,0), #  MIAO LETTER NASALIZATION..MIAO VOWEL SIGN NG
- 0x16f8f: (0x16f8f, 0x16f9f, 0,0,0,0,0,0,1,0,0,0,0,0), #  MIAO TONE RIGHT..MIAO LETTER REFORMED TONE-8
- 0x1e900: (0x1e900, 0x1e94a, 0,0,0,0,0,0,1,0,0,0,0,0), #  ADLAM CAPITAL LETTER ALIF..ADLAM NUKTA
- 0x1e950: (0x1e950, 0x1e959, 0,0,0,0,0,0,1,0,0,0,0,0), #  ADLAM DIGIT ZERO..ADLAM DIGIT NINE
- 0x18a9: (0x18a9, None, 0,0,0,0,0,1,1,1,0,0,0,0), #  MONGOLIAN LETTER ALI GALI DAGALGA
- 0x0740: (0x0740, 0x074a, 0,0,1,0,0,0,1,0,0,0,0,0), #  SYRIAC FEMININE DOT..SYRIAC BARREKH
- 0x07fa: (0x07fa, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  NKO LAJANYALAN
- 0x1810: (0x1810, 0x1819, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN DIGIT ZERO..MONGOLIAN DIGIT NINE
- 0x1820: (0x1820, 0x1877, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER A..MONGOLIAN LETTER MANCHU ZHA
- 0x1878: (0x1878, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER CHA WITH TWO DOTS
- 0x1880: (0x1880, 0x18a8, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER ALI GALI ANUSVARA ONE..MONGOLIAN LETTER MANCHU ALI GALI BHA
- 0x18aa: (0x18aa, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER MANCHU ALI GALI LHA
- 0xa9cf: (0xa9cf, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  JAVANESE PANGRANGKEP
- 0x1800: (0x1800, 0x1801, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN BIRGA..MONGOLIAN ELLIPSIS
- 0x1804: (0x1804, None, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN COLON
- 0x1806: (0x1806, 0x180a, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN TODO SOFT HYPHEN..MONGOLIAN NIRUGU
- 0x11660: (0x11660, 0x1166c, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN BIRGA WITH ORNAMENT..MONGOLIAN TURNED SWIRL BIRGA WITH DOUBLE ORNAMENT
- 0x180e: (0x180e, None, 0,0,0,0,0,1,1,0,0,1,0,1), #  MONGOLIAN VOWEL SEPARATOR
- 0x180b: (0x180b, 0x180d, 0,0,0,0,0,1,1,0,0,0,0,1), #  MONGOLIAN FREE VARIATION SELECTOR ONE..MONGOLIAN FREE VARIATION SELECTOR THREE
- 0x07e8: (0x07e8, 0x07ea, 0,0,0,1,0,0,1,0,0,0,0,0), #  NKO LETTER JONA JA..NKO LETTER JONA RA
- 0xa610: (0xa610, 0xa612, 0,0,0,1,0,0,1,0,0,0,0,0), #  VAI SYLLABLE NDOLE FA..VAI SYLLABLE NDOLE SOO
- 0xa62a: (0xa62a, 0xa62b, 0,0,0,1,0,0,1,0,0,0,0,0), #  VAI SYLLABLE NDOLE MA..VAI SYLLABLE NDOLE DO
- 0x0700: (0x0700, 0x070d, 0,0,0,0,0,0,1,0,0,1,0,0), #  SYRIAC END OF PARAGRAPH..SYRIAC HARKLEAN ASTERISCUS
- 0x070f: (0x070f, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  SYRIAC ABBREVIATION MARK
- 0x07f6: (0x07f6, 0x07f9, 0,0,0,0,0,0,1,0,0,1,0,0), #  NKO SYMBOL OO DENNEN..NKO EXCLAMATION MARK
- 0x07fe: (0x07fe, 0x07ff, 0,0,0,0,0,0,1,0,0,1,0,0), #  NKO DOROME SIGN..NKO TAMAN SIGN
- 0x085e: (0x085e, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  MANDAIC PUNCTUATION
- 0x1400: (0x1400, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  CANADIAN SYLLABICS HYPHEN
- 0x166d: (0x166d, 0x166e, 0,0,0,0,0,0,1,0,0,1,0,0), #  CANADIAN SYLLABICS CHI SIGN..CANADIAN SYLLABICS FULL STOP
- 0x1940: (0x1940, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  LIMBU SIGN LOO
- 0x1944: (0x1944, 0x1945, 0,0,0,0,0,0,1,0,0,1,0,0), #  LIMBU EXCLAMATION MARK..LIMBU QUESTION MARK
- 0x19de: (0x19de, 0x19df, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEW TAI LUE SIGN LAE..NEW TAI LUE SIGN LAEV
- 0x1aa0: (0x1aa0, 0x1aa6, 0,0,0,0,0,0,1,0,0,1,0,0), #  TAI THAM SIGN WIANG..TAI THAM SIGN REVERSED ROTATED RANA
- 0x1aa8: (0x1aa8, 0x1aad, 0,0,0,0,0,0,1,0,0,1,0,0), #  TAI THAM SIGN KAAN..TAI THAM SIGN CAANG
- 0x1b5a: (0x1b5a, 0x1b6a, 0,0,0,0,0,0,1,0,0,1,0,0), #  BALINESE PANTI..BALINESE MUSICAL SYMBOL DANG GEDE
- 0x1b74: (0x1b74, 0x1b7c, 0,0,0,0,0,0,1,0,0,1,0,0), #  BALINESE MUSICAL SYMBOL RIGHT-HAND OPEN DUG..BALINESE MUSICAL SYMBOL LEFT-HAND OPEN PING
- 0x1bfc: (0x1bfc, 0x1bff, 0,0,0,0,0,0,1,0,0,1,0,0), #  BATAK SYMBOL BINDU NA METEK..BATAK SYMBOL BINDU PANGOLAT
- 0x1c3b: (0x1c3b, 0x1c3f, 0,0,0,0,0,0,1,0,0,1,0,0), #  LEPCHA PUNCTUATION TA-ROL..LEPCHA PUNCTUATION TSHOOK
- 0x1c7e: (0x1c7e, 0x1c7f, 0,0,0,0,0,0,1,0,0,1,0,0), #  OL CHIKI PUNCTUATION MUCAAD..OL CHIKI PUNCTUATION DOUBLE MUCAAD
- 0x1cc0: (0x1cc0, 0x1cc7, 0,0,0,0,0,0,1,0,0,1,0,0), #  SUNDANESE PUNCTUATION BINDU SURYA..SUNDANESE PUNCTUATION BINDU BA SATANGA
- 0x2d70: (0x2d70, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  TIFINAGH SEPARATOR MARK
- 0xa490: (0xa490, 0xa4a1, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL QOT..YI RADICAL GA
- 0xa4a2: (0xa4a2, 0xa4a3, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL ZUP..YI RADICAL CYT
- 0xa4a4: (0xa4a4, 0xa4b3, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL DDUR..YI RADICAL JO
- 0xa4b4: (0xa4b4, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL NZUP
- 0xa4b5: (0xa4b5, 0xa4c0, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL JJY..YI RADICAL SHAT
- 0xa4c1: (0xa4c1, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL ZUR
- 0xa4c2: (0xa4c2, 0xa4c4, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL SHOP..YI RADICAL ZZIET
- 0xa4c5: (0xa4c5, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL NBIE
- 0xa4c6: (0xa4c6, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL KE
- 0xa4fe: (0xa4fe, 0xa4ff, 0,0,0,0,0,0,1,0,0,1,0,0), #  LISU PUNCTUATION COMMA..LISU PUNCTUATION FULL STOP
- 0xa60d: (0xa60d, 0xa60f, 0,0,0,0,0,0,1,0,0,1,0,0), #  VAI COMMA..VAI QUESTION MARK
- 0xa6f2: (0xa6f2, 0xa6f7, 0,0,0,0,0,0,1,0,0,1,0,0), #  BAMUM NJAEMLI..BAMUM QUESTION MARK
- 0xa828: (0xa828, 0xa82b, 0,0,0,0,0,0,1,0,0,1,0,0), #  SYLOTI NAGRI POETRY MARK-1..SYLOTI NAGRI POETRY MARK-4
- 0xa8ce: (0xa8ce, 0xa8cf, 0,0,0,0,0,0,1,0,0,1,0,0), #  SAURASHTRA DANDA..SAURASHTRA DOUBLE DANDA
- 0xa92f: (0xa92f, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  KAYAH LI SIGN SHYA
- 0xa9c1: (0xa9c1, 0xa9cd, 0,0,0,0,0,0,1,0,0,1,0,0), #  JAVANESE LEFT RERENGGAN..JAVANESE TURNED PADA PISELEH
- 0xa9de: (0xa9de, 0xa9df, 0,0,0,0,0,0,1,0,0,1,0,0), #  JAVANESE PADA TIRTA TUMETES..JAVANESE PADA ISEN-ISEN
- 0xaa5c: (0xaa5c, 0xaa5f, 0,0,0,0,0,0,1,0,0,1,0,0), #  CHAM PUNCTUATION SPIRAL..CHAM PUNCTUATION TRIPLE DANDA
- 0xaade: (0xaade, 0xaadf, 0,0,0,0,0,0,1,0,0,1,0,0), #  TAI VIET SYMBOL HO HOI..TAI VIET SYMBOL KOI KOI
- 0xaaf0: (0xaaf0, 0xaaf1, 0,0,0,0,0,0,1,0,0,1,0,0), #  MEETEI MAYEK CHEIKHAN..MEETEI MAYEK AHANG KHUDAM
- 0xabeb: (0xabeb, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  MEETEI MAYEK CHEIKHEI
- 0x11140: (0x11140, 0x11143, 0,0,0,0,0,0,1,0,0,1,0,0), #  CHAKMA SECTION MARK..CHAKMA QUESTION MARK
- 0x1144b: (0x1144b, 0x1144f, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEWA DANDA..NEWA ABBREVIATION SIGN
- 0x1145b: (0x1145b, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEWA PLACEHOLDER MARK
- 0x1145d: (0x1145d, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEWA INSERTION SIGN
- 0x1e95e: (0x1e95e, 0x1e95f, 0,0,0,0,0,0,1,0,0,1,0,0), #  ADLAM INITIAL EXCLAMATION MARK..ADLAM INITIAL QUESTION MARK
- 0x2d6f: (0x2d6f, None, 0,0,0,0,0,0,1,0,1,0,0,0), #  TIFINAGH MODIFIER LETTER LABIALIZATION MARK
- 0x0181: (0x0181, 0x018c, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER B WITH HOOK..LATIN SMALL LETTER D WITH TOPBAR
- 0x018e: (0x018e, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER REVERSED E
- 0x0190: (0x0190, 0x019f, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER OPEN E..LATIN CAPITAL LETTER O WITH MIDDLE TILDE
- 0x01a2: (0x01a2, 0x01a9, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER OI..LATIN CAPITAL LETTER ESH
- 0x01ac: (0x01ac, 0x01ae, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER T WITH HOOK..LATIN CAPITAL LETTER T WITH RETROFLEX HOOK
- 0x01b1: (0x01b1, 0x01b8, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER UPSILON..LATIN CAPITAL LETTER EZH REVERSED
- 0x01bc: (0x01bc, 0x01bd, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER TONE FIVE..LATIN SMALL LETTER TONE FIVE
- 0x01dd: (0x01dd, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER TURNED E
- 0x01e4: (0x01e4, 0x01e5, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER G WITH STROKE..LATIN SMALL LETTER G WITH STROKE
- 0x0220: (0x0220, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER N WITH LONG RIGHT LEG
- 0x0221: (0x0221, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER D WITH CURL
- 0x0222: (0x0222, 0x0225, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER OU..LATIN SMALL LETTER Z WITH HOOK
- 0x0237: (0x0237, 0x0241, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER DOTLESS J..LATIN CAPITAL LETTER GLOTTAL STOP
- 0x0242: (0x0242, 0x024f, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER GLOTTAL STOP..LATIN SMALL LETTER Y WITH STROKE
- 0x0253: (0x0253, 0x0254, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER B WITH HOOK..LATIN SMALL LETTER OPEN O
- 0x0256: (0x0256, 0x0257, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER D WITH TAIL..LATIN SMALL LETTER D WITH HOOK
- 0x025b: (0x025b, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER OPEN E
- 0x0260: (0x0260, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER G WITH HOOK
- 0x0263: (0x0263, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER GAMMA
- 0x0268: (0x0268, 0x0269, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER I WITH STROKE..LATIN SMALL LETTER IOTA
- 0x026f: (0x026f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER TURNED M
- 0x0272: (0x0272, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER N WITH LEFT HOOK
- 0x0275: (0x0275, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER BARRED O
- 0x0280: (0x0280, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN LETTER SMALL CAPITAL R
- 0x0283: (0x0283, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER ESH
- 0x0288: (0x0288, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER T WITH RETROFLEX HOOK
- 0x028a: (0x028a, 0x028b, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER UPSILON..LATIN SMALL LETTER V WITH HOOK
- 0x0292: (0x0292, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER EZH
- 0x0294: (0x0294, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN LETTER GLOTTAL STOP
- 0x0305: (0x0305, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING OVERLINE
- 0x030d: (0x030d, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING VERTICAL LINE ABOVE
- 0x0316: (0x0316, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING GRAVE ACCENT BELOW
- 0x0321: (0x0321, 0x0322, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING PALATALIZED HOOK BELOW..COMBINING RETROFLEX HOOK BELOW
- 0x0332: (0x0332, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING LOW LINE
- 0x0334: (0x0334, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING TILDE OVERLAY
- 0x0336: (0x0336, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING LONG STROKE OVERLAY
- 0x0358: (0x0358, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING DOT ABOVE RIGHT
- 0x0591: (0x0591, 0x05a1, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW ACCENT ETNAHTA..HEBREW ACCENT PAZER
- 0x05a3: (0x05a3, 0x05af, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW ACCENT MUNAH..HEBREW MARK MASORA CIRCLE
- 0x05b0: (0x05b0, 0x05b3, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT SHEVA..HEBREW POINT HATAF QAMATS
- 0x05b5: (0x05b5, 0x05b9, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT TSERE..HEBREW POINT HOLAM
- 0x05ba: (0x05ba, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT HOLAM HASER FOR VAV
- 0x05bb: (0x05bb, 0x05bd, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT QUBUTS..HEBREW POINT METEG
- 0x05bf: (0x05bf, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT RAFE
- 0x05c1: (0x05c1, 0x05c2, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT SHIN DOT..HEBREW POINT SIN DOT
- 0x05c4: (0x05c4, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW MARK UPPER DOT
- 0x0610: (0x0610, 0x0615, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SIGN SALLALLAHOU ALAYHE WASSALLAM..ARABIC SMALL HIGH TAH
- 0x0616: (0x0616, 0x061a, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH LIGATURE ALEF WITH LAM WITH YEH..ARABIC SMALL KASRA
- 0x0656: (0x0656, 0x0658, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SUBSCRIPT ALEF..ARABIC MARK NOON GHUNNA
- 0x0659: (0x0659, 0x065e, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC ZWARAKAY..ARABIC FATHA WITH TWO DOTS
- 0x065f: (0x065f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC WAVY HAMZA BELOW
- 0x06d6: (0x06d6, 0x06dc, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH LIGATURE SAD WITH LAM WITH ALEF MAKSURA..ARABIC SMALL HIGH SEEN
- 0x06df: (0x06df, 0x06e4, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH ROUNDED ZERO..ARABIC SMALL HIGH MADDA
- 0x06e7: (0x06e7, 0x06e8, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH YEH..ARABIC SMALL HIGH NOON
- 0x06ea: (0x06ea, 0x06ed, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC EMPTY CENTRE LOW STOP..ARABIC SMALL LOW MEEM
- 0x08b3: (0x08b3, 0x08b4, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC LETTER AIN WITH THREE DOTS BELOW..ARABIC LETTER KAF WITH DOT BELOW
- 0x08d3: (0x08d3, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL LOW WAW
- 0x08d4: (0x08d4, 0x08e1, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH WORD AR-RUB..ARABIC SMALL HIGH SIGN SAFHA
- 0x08e3: (0x08e3, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC TURNED DAMMA BELOW
- 0x08e4: (0x08e4, 0x08fe, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC CURLY FATHA..ARABIC DAMMA WITH DOT
- 0x08ff: (0x08ff, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC MARK SIDEWAYS NOON GHUNNA
- 0x0900: (0x0900, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  DEVANAGARI SIGN INVERTED CANDRABINDU
- 0x0955: (0x0955, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  DEVANAGARI VOWEL SIGN CANDRA LONG E
- 0x0a51: (0x0a51, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  GURMUKHI SIGN UDAAT
- 0x0a75: (0x0a75, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  GURMUKHI SIGN YAKASH
- 0x0af9: (0x0af9, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  GUJARATI LETTER ZHA
- 0x0b44: (0x0b44, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ORIYA VOWEL SIGN VOCALIC RR
- 0x0b62: (0x0b62, 0x0b63, 0,0,0,0,0,0,0,1,0,0,0,0), #  ORIYA VOWEL SIGN VOCALIC L..ORIYA VOWEL SIGN VOCALIC LL
- 0x0c5a: (0x0c5a, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  TELUGU LETTER RRRA
- 0x0c62: (0x0c62, 0x0c63, 0,0,0,0,0,0,0,1,0,0,0,0), #  TELUGU VOWEL SIGN VOCALIC L..TELUGU VOWEL SIGN VOCALIC LL
- 0x0d44: (0x0d44, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  MALAYALAM VOWEL SIGN VOCALIC RR
- 0x0d62: (0x0d62, 0x0d63, 0,0,0,0,0,0,0,1,0,0,0,0), #  MALAYALAM VOWEL SIGN VOCALIC L..MALAYALAM VOWEL SIGN VOCALIC LL
- 0x0f39: (0x0f39, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  TIBETAN MARK TSA -PHRU
- 0x2054: (0x2054, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  INVERTED UNDERTIE
- 0x2c67: (0x2c67, 0x2c6c, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER H WITH DESCENDER..LATIN SMALL LETTER Z WITH DESCENDER
- 0xa66f: (0xa66f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC VZMET
- 0xa67c: (0xa67c, 0xa67d, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC KAVYKA..COMBINING CYRILLIC PAYEROK
- 0xa69e: (0xa69e, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC LETTER EF
- 0xa78b: (0xa78b, 0xa78c, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER SALTILLO..LATIN SMALL LETTER SALTILLO
- 0xa78f: (0xa78f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN LETTER SINOLOGICAL DOT
- 0xa7b2: (0xa7b2, 0xa7b7, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER J WITH CROSSED-TAIL..LATIN SMALL LETTER OMEGA
- 0xab60: (0xab60, 0xab63, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER SAKHA YAT..LATIN SMALL LETTER UO
- 0x0289: (0x0289, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER U BAR
- 0x0d8f: (0x0d8f, 0x0d90, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA LETTER ILUYANNA..SINHALA LETTER ILUUYANNA
- 0x0da6: (0x0da6, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA LETTER SANYAKA JAYANNA
- 0x0ddf: (0x0ddf, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA VOWEL SIGN GAYANUKITTA
- 0x0df3: (0x0df3, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA VOWEL SIGN DIGA GAYANUKITTA
- 0xfb1e: (0xfb1e, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  HEBREW POINT JUDEO-SPANISH VARIKA
- 0xfe2e: (0xfe2e, 0xfe2f, 0,0,1,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC TITLO LEFT HALF..COMBINING CYRILLIC TITLO RIGHT HALF
- 0x16a40: (0x16a40, 0x16a5e, 0,0,0,0,0,1,0,1,0,0,0,0), #  MRO LETTER TA..MRO LETTER TEK
- 0x16a60: (0x16a60, 0x16a69, 0,0,0,0,0,1,0,1,0,0,0,0), #  MRO DIGIT ZERO..MRO DIGIT NINE
- 0x1d1de: (0x1d1de, 0x1d1e8, 0,0,0,0,0,1,0,1,0,1,0,0), #  MUSICAL SYMBOL KIEVAN C CLEF..MUSICAL SYMBOL KIEVAN FLAT SIGN
- 0x05a2: (0x05a2, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  HEBREW ACCENT ATNAH HAFUKH
- 0x05c5: (0x05c5, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  HEBREW MARK LOWER DOT
- 0x05c7: (0x05c7, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  HEBREW POINT QAMATS QATAN
- 0xa8fd: (0xa8fd, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  DEVANAGARI JAIN OM
- 0xa8fc: (0xa8fc, None, 0,0,0,1,0,0,0,1,0,1,0,0), #  DEVANAGARI SIGN SIDDHAM
- 0x218a: (0x218a, 0x218b, 0,0,0,0,0,0,0,1,0,1,0,0), #  TURNED DIGIT TWO..TURNED DIGIT THREE
- 0x2bec: (0x2bec, 0x2bef, 0,0,0,0,0,0,0,1,0,1,0,0), #  LEFTWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS..DOWNWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS
- 0x1f54f: (0x1f54f, None, 0,0,0,0,0,0,0,1,0,1,0,0), #  BOWL OF HYGIEIA
- 0x0180: (0x0180, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER B WITH STROKE
- 0x01c0: (0x01c0, 0x01c3, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER DENTAL CLICK..LATIN LETTER RETROFLEX CLICK
- 0x0234: (0x0234, 0x0236, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER L WITH CURL..LATIN SMALL LETTER T WITH CURL
- 0x0250: (0x0250, 0x0252, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED A..LATIN SMALL LETTER TURNED ALPHA
- 0x0255: (0x0255, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER C WITH CURL
- 0x0258: (0x0258, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER REVERSED E
- 0x025a: (0x025a, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER SCHWA WITH HOOK
- 0x025c: (0x025c, 0x025f, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER REVERSED OPEN E..LATIN SMALL LETTER DOTLESS J WITH STROKE
- 0x0261: (0x0261, 0x0262, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER SCRIPT G..LATIN LETTER SMALL CAPITAL G
- 0x0264: (0x0264, 0x0267, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER RAMS HORN..LATIN SMALL LETTER HENG WITH HOOK
- 0x026a: (0x026a, 0x026e, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL I..LATIN SMALL LETTER LEZH
- 0x0270: (0x0270, 0x0271, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED M WITH LONG LEG..LATIN SMALL LETTER M WITH HOOK
- 0x0273: (0x0273, 0x0274, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER N WITH RETROFLEX HOOK..LATIN LETTER SMALL CAPITAL N
- 0x0276: (0x0276, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL OE
- 0x0278: (0x0278, 0x027b, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER PHI..LATIN SMALL LETTER TURNED R WITH HOOK
- 0x027d: (0x027d, 0x027f, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER R WITH TAIL..LATIN SMALL LETTER REVERSED R WITH FISHHOOK
- 0x0281: (0x0281, 0x0282, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL INVERTED R..LATIN SMALL LETTER S WITH HOOK
- 0x0284: (0x0284, 0x0287, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER DOTLESS J WITH STROKE AND HOOK..LATIN SMALL LETTER TURNED T
- 0x028c: (0x028c, 0x0291, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED V..LATIN SMALL LETTER Z WITH CURL
- 0x0293: (0x0293, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER EZH WITH CURL
- 0x0295: (0x0295, 0x029d, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER PHARYNGEAL VOICED FRICATIVE..LATIN SMALL LETTER J WITH CROSSED-TAIL
- 0x029f: (0x029f, 0x02a8, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL L..LATIN SMALL LETTER TC DIGRAPH WITH CURL
- 0x02a9: (0x02a9, 0x02ad, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER FENG DIGRAPH..LATIN LETTER BIDENTAL PERCUSSIVE
- 0x02ae: (0x02ae, 0x02af, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED H WITH FISHHOOK..LATIN SMALL LETTER TURNED H WITH FISHHOOK AND TAIL
- 0x02b9: (0x02b9, 0x02ba, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER PRIME..MODIFIER LETTER DOUBLE PRIME
- 0x02bd: (0x02bd, 0x02c1, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER REVERSED COMMA..MODIFIER LETTER REVERSED GLOTTAL STOP
- 0x02c6: (0x02c6, 0x02d1, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER CIRCUMFLEX ACCENT..MODIFIER LETTER HALF TRIANGULAR COLON
- 0x02ee: (0x02ee, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER DOUBLE APOSTROPHE
- 0x030e: (0x030e, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE VERTICAL LINE ABOVE
- 0x0312: (0x0312, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING TURNED COMMA ABOVE
- 0x0315: (0x0315, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING COMMA ABOVE RIGHT
- 0x0317: (0x0317, 0x031a, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ACUTE ACCENT BELOW..COMBINING LEFT ANGLE ABOVE
- 0x031c: (0x031c, 0x0320, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LEFT HALF RING BELOW..COMBINING MINUS SIGN BELOW
- 0x0329: (0x0329, 0x032c, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING VERTICAL LINE BELOW..COMBINING CARON BELOW
- 0x032f: (0x032f, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING INVERTED BREVE BELOW
- 0x0333: (0x0333, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE LOW LINE
- 0x0337: (0x0337, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING SHORT SOLIDUS OVERLAY
- 0x033a: (0x033a, 0x033f, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING INVERTED BRIDGE BELOW..COMBINING DOUBLE OVERLINE
- 0x0346: (0x0346, 0x034e, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING BRIDGE ABOVE..COMBINING UPWARDS ARROW BELOW
- 0x0350: (0x0350, 0x0357, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING RIGHT ARROWHEAD ABOVE..COMBINING RIGHT HALF RING ABOVE
- 0x0359: (0x0359, 0x035c, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ASTERISK BELOW..COMBINING DOUBLE BREVE BELOW
- 0x035d: (0x035d, 0x035f, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE BREVE..COMBINING DOUBLE MACRON BELOW
- 0x0360: (0x0360, 0x0361, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE TILDE..COMBINING DOUBLE INVERTED BREVE
- 0x0362: (0x0362, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE RIGHTWARDS ARROW BELOW
- 0x03cf: (0x03cf, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  GREEK CAPITAL KAI SYMBOL
- 0x03d7: (0x03d7, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  GREEK KAI SYMBOL
- 0x0953: (0x0953, 0x0954, 0,0,1,0,0,0,0,0,0,0,0,0), #  DEVANAGARI GRAVE ACCENT..DEVANAGARI ACUTE ACCENT
- 0x0f18: (0x0f18, 0x0f19, 0,0,1,0,0,0,0,0,0,0,0,0), #  TIBETAN ASTROLOGICAL SIGN -KHYUD PA..TIBETAN ASTROLOGICAL SIGN SDONG TSHUGS
- 0x17cb: (0x17cb, 0x17d0, 0,0,1,0,0,0,0,0,0,0,0,0), #  KHMER SIGN BANTOC..KHMER SIGN SAMYOK SANNYA
- 0x1d00: (0x1d00, 0x1d2b, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL A..CYRILLIC LETTER SMALL CAPITAL EL
- 0x1d2f: (0x1d2f, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER CAPITAL BARRED B
- 0x1d3b: (0x1d3b, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER CAPITAL REVERSED N
- 0x1d4e: (0x1d4e, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER SMALL TURNED I
- 0x1d6b: (0x1d6b, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER UE
- 0x1d6c: (0x1d6c, 0x1d77, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER B WITH MIDDLE TILDE..LATIN SMALL LETTER TURNED G
- 0x1d79: (0x1d79, 0x1d9a, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER INSULAR G..LATIN SMALL LETTER EZH WITH RETROFLEX HOOK
- 0x1dc4: (0x1dc4, 0x1dca, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING MACRON-ACUTE..COMBINING LATIN SMALL LETTER R BELOW
- 0x1dcb: (0x1dcb, 0x1dcd, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING BREVE-MACRON..COMBINING DOUBLE CIRCUMFLEX ABOVE
- 0x1dcf: (0x1dcf, 0x1dd0, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ZIGZAG BELOW..COMBINING IS BELOW
- 0x1de7: (0x1de7, 0x1df5, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LATIN SMALL LETTER ALPHA..COMBINING UP TACK ABOVE
- 0x1df6: (0x1df6, 0x1df9, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING KAVYKA ABOVE RIGHT..COMBINING WIDE INVERTED BRIDGE BELOW
- 0x1dfb: (0x1dfb, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DELETION MARK
- 0x1dfc: (0x1dfc, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE INVERTED BREVE BELOW
- 0x1dfd: (0x1dfd, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ALMOST EQUAL TO BELOW
- 0x1dfe: (0x1dfe, 0x1dff, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LEFT ARROWHEAD ABOVE..COMBINING RIGHT ARROWHEAD AND DOWN ARROWHEAD BELOW
- 0x1e9c: (0x1e9c, 0x1e9d, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER LONG S WITH DIAGONAL STROKE..LATIN SMALL LETTER LONG S WITH HIGH STROKE
- 0x1e9f: (0x1e9f, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER DELTA
- 0x1efa: (0x1efa, 0x1eff, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER MIDDLE-WELSH LL..LATIN SMALL LETTER Y WITH LOOP
- 0x203f: (0x203f, 0x2040, 0,0,1,0,0,0,0,0,0,0,0,0), #  UNDERTIE..CHARACTER TIE
- 0x2118: (0x2118, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  SCRIPT CAPITAL P
- 0x212e: (0x212e, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  ESTIMATED SYMBOL
- 0x2c60: (0x2c60, 0x2c66, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER L WITH DOUBLE BAR..LATIN SMALL LETTER T WITH DIAGONAL STROKE
- 0x2c77: (0x2c77, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TAILLESS PHI
- 0x2c78: (0x2c78, 0x2c7b, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER E WITH NOTCH..LATIN LETTER SMALL CAPITAL TURNED E
- 0x3021: (0x3021, 0x302d, 0,0,1,0,0,0,0,0,0,0,0,0), #  HANGZHOU NUMERAL ONE..IDEOGRAPHIC ENTERING TONE MARK
- 0x3031: (0x3031, 0x3035, 0,0,1,0,0,0,0,0,0,0,0,0), #  VERTICAL KANA REPEAT MARK..VERTICAL KANA REPEAT MARK LOWER HALF
- 0x303b: (0x303b, 0x303c, 0,0,1,0,0,0,0,0,0,0,0,0), #  VERTICAL IDEOGRAPHIC ITERATION MARK..MASU MARK
- 0x31f0: (0x31f0, 0x31ff, 0,0,1,0,0,0,0,0,0,0,0,0), #  KATAKANA LETTER SMALL KU..KATAKANA LETTER SMALL RO
- 0xfe20: (0xfe20, 0xfe23, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LIGATURE LEFT HALF..COMBINING DOUBLE TILDE RIGHT HALF
- 0xfe24: (0xfe24, 0xfe26, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING MACRON LEFT HALF..COMBINING CONJOINING MACRON
- 0xfe27: (0xfe27, 0xfe2d, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LIGATURE LEFT HALF BELOW..COMBINING CONJOINING MACRON BELOW
- 0xfe73: (0xfe73, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  ARABIC TAIL FRAGMENT
- 0x20d0: (0x20d0, 0x20dc, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING LEFT HARPOON ABOVE..COMBINING FOUR DOTS ABOVE
- 0x20e1: (0x20e1, None, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING LEFT RIGHT ARROW ABOVE
- 0x20e5: (0x20e5, 0x20ea, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING REVERSE SOLIDUS OVERLAY..COMBINING LEFTWARDS ARROW OVERLAY
- 0x20eb: (0x20eb, None, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING LONG DOUBLE SOLIDUS OVERLAY
- 0x20ec: (0x20ec, 0x20ef, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING RIGHTWARDS HARPOON WITH BARB DOWNWARDS..COMBINING RIGHT ARROW BELOW
- 0x2cf0: (0x2cf0, 0x2cf1, 0,0,1,0,0,1,0,0,0,0,0,0), #  COPTIC COMBINING SPIRITUS ASPER..COPTIC COMBINING SPIRITUS LENIS
- 0x10a0d: (0x10a0d, None, 0,0,1,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI SIGN DOUBLE RING BELOW
- 0x1d165: (0x1d165, 0x1d169, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING STEM..MUSICAL SYMBOL COMBINING TREMOLO-3
- 0x1d16d: (0x1d16d, 0x1d172, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING AUGMENTATION DOT..MUSICAL SYMBOL COMBINING FLAG-5
- 0x1d17b: (0x1d17b, 0x1d182, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING ACCENT..MUSICAL SYMBOL COMBINING LOURE
- 0x1d185: (0x1d185, 0x1d18b, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING DOIT..MUSICAL SYMBOL COMBINING TRIPLE TONGUE
- 0x1d1aa: (0x1d1aa, 0x1d1ad, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING DOWN BOW..MUSICAL SYMBOL COMBINING SNAP PIZZICATO
- 0x1d242: (0x1d242, 0x1d244, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING GREEK MUSICAL TRISEME..COMBINING GREEK MUSICAL PENTASEME
- 0x20de: (0x20de, 0x20e0, 0,0,1,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING SQUARE..COMBINING ENCLOSING CIRCLE BACKSLASH
- 0x20e2: (0x20e2, 0x20e3, 0,0,1,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING SCREEN..COMBINING ENCLOSING KEYCAP
- 0x20e4: (0x20e4, None, 0,0,1,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING UPWARD POINTING TRIANGLE
- 0x1d100: (0x1d100, 0x1d126, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL SINGLE BARLINE..MUSICAL SYMBOL DRUM CLEF-2
- 0x1d129: (0x1d129, None, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL MULTIPLE MEASURE REST
- 0x1d12a: (0x1d12a, 0x1d15d, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL DOUBLE SHARP..MUSICAL SYMBOL WHOLE NOTE
- 0x1d16a: (0x1d16a, 0x1d16c, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL FINGERED TREMOLO-1..MUSICAL SYMBOL FINGERED TREMOLO-3
- 0x1d183: (0x1d183, 0x1d184, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL ARPEGGIATO UP..MUSICAL SYMBOL ARPEGGIATO DOWN
- 0x1d18c: (0x1d18c, 0x1d1a9, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL RINFORZANDO..MUSICAL SYMBOL DEGREE SLASH
- 0x1d1ae: (0x1d1ae, 0x1d1ba, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL PEDAL MARK..MUSICAL SYMBOL SEMIBREVIS BLACK
- 0x1d1c1: (0x1d1c1, 0x1d1dd, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL LONGA PERFECTA REST..MUSICAL SYMBOL PES SUBPUNCTIS
- 0x1d15e: (0x1d15e, 0x1d164, 0,0,1,0,0,1,0,0,1,1,0,0), #  MUSICAL SYMBOL HALF NOTE..MUSICAL SYMBOL ONE HUNDRED TWENTY-EIGHTH NOTE
- 0x1d1bb: (0x1d1bb, 0x1d1c0, 0,0,1,0,0,1,0,0,1,1,0,0), #  MUSICAL SYMBOL MINIMA..MUSICAL SYMBOL FUSA BLACK
- 0x1d173: (0x1d173, 0x1d17a, 0,0,1,0,0,1,0,0,0,1,0,1), #  MUSICAL SYMBOL BEGIN BEAM..MUSICAL SYMBOL END PHRASE
- 0xfe00: (0xfe00, 0xfe0f, 0,0,1,0,0,1,0,0,0,0,0,1), #  VARIATION SELECTOR-1..VARIATION SELECTOR-16
- 0x018d: (0x018d, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED DELTA
- 0x01aa: (0x01aa, 0x01ab, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN LETTER REVERSED ESH LOOP..LATIN SMALL LETTER T WITH PALATAL HOOK
- 0x01ba: (0x01ba, 0x01bb, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER EZH WITH TAIL..LATIN LETTER TWO WITH STROKE
- 0x01be: (0x01be, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN LETTER INVERTED GLOTTAL STOP WITH STROKE
- 0x0277: (0x0277, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER CLOSED OMEGA
- 0x027c: (0x027c, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER R WITH LONG LEG
- 0x029e: (0x029e, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED K
- 0x03f3: (0x03f3, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  GREEK LETTER YOT
- 0x0484: (0x0484, 0x0486, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC PALATALIZATION..COMBINING CYRILLIC PSILI PNEUMATA
- 0x0487: (0x0487, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC POKRYTIE
- 0x17d1: (0x17d1, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  KHMER SIGN VIRIAM
- 0x17dd: (0x17dd, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  KHMER SIGN ATTHACAN
- 0x1dc0: (0x1dc0, 0x1dc3, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING DOTTED GRAVE ACCENT..COMBINING SUSPENSION MARK
- 0x1dce: (0x1dce, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING OGONEK ABOVE
- 0x1dd1: (0x1dd1, 0x1de6, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING UR ABOVE..COMBINING LATIN SMALL LETTER Z
- 0x2180: (0x2180, 0x2182, 0,0,1,1,0,0,0,0,0,0,0,0), #  ROMAN NUMERAL ONE THOUSAND C D..ROMAN NUMERAL TEN THOUSAND
- 0x2183: (0x2183, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  ROMAN NUMERAL REVERSED ONE HUNDRED
- 0x302e: (0x302e, 0x302f, 0,0,1,1,0,0,0,0,0,0,0,0), #  HANGUL SINGLE DOT TONE MARK..HANGUL DOUBLE DOT TONE MARK
- 0xa722: (0xa722, 0xa72f, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER EGYPTOLOGICAL ALEF..LATIN SMALL LETTER CUATRILLO WITH COMMA
- 0x2e00: (0x2e00, 0x2e0d, 0,0,1,1,0,0,0,0,0,1,0,0), #  RIGHT ANGLE SUBSTITUTION MARKER..RIGHT RAISED OMISSION BRACKET
- 0x3260: (0x3260, 0x327b, 0,0,1,1,0,0,0,0,1,1,0,0), #  CIRCLED HANGUL KIYEOK..CIRCLED HANGUL HIEUH A
- 0x327c: (0x327c, 0x327d, 0,0,1,1,0,0,0,0,1,1,0,0), #  CIRCLED KOREAN CHARACTER CHAMKO..CIRCLED KOREAN CHARACTER JUEUI
- 0x327e: (0x327e, None, 0,0,1,1,0,0,0,0,1,1,0,0), #  CIRCLED HANGUL IEUNG U
- 0x0340: (0x0340, 0x0341, 0,0,1,1,0,0,0,0,1,0,0,0), #  COMBINING GRAVE TONE MARK..COMBINING ACUTE TONE MARK
- 0x0343: (0x0343, None, 0,0,1,1,0,0,0,0,1,0,0,0), #  COMBINING GREEK KORONIS
- 0x24eb: (0x24eb, 0x24fe, 0,0,1,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED NUMBER ELEVEN..DOUBLE CIRCLED NUMBER TEN
- 0x24ff: (0x24ff, None, 0,0,1,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED DIGIT ZERO
- 0x2800: (0x2800, 0x28ff, 0,0,1,0,0,0,0,0,0,1,0,0), #  BRAILLE PATTERN BLANK..BRAILLE PATTERN DOTS-12345678
- 0x327f: (0x327f, None, 0,0,1,0,0,0,0,0,0,1,0,0), #  KOREAN STANDARD SYMBOL
- 0x4dc0: (0x4dc0, 0x4dff, 0,0,1,0,0,0,0,0,0,1,0,0), #  HEXAGRAM FOR THE CREATIVE HEAVEN..HEXAGRAM FOR BEFORE COMPLETION
- 0xa708: (0xa708, 0xa716, 0,0,1,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER EXTRA-HIGH DOTTED TONE BAR..MODIFIER LETTER EXTRA-LOW LEFT-STEM TONE BAR
- 0xfbb2: (0xfbb2, 0xfbc1, 0,0,1,0,0,0,0,0,0,1,0,0), #  ARABIC SYMBOL DOT ABOVE..ARABIC SYMBOL SMALL TAH BELOW
- 0xfd3e: (0xfd3e, 0xfd3f, 0,0,1,0,0,0,0,0,0,1,0,0), #  ORNATE LEFT PARENTHESIS..ORNATE RIGHT PARENTHESIS
- 0xfdfd: (0xfdfd, None, 0,0,1,0,0,0,0,0,0,1,0,0), #  ARABIC LIGATURE BISMILLAH AR-RAHMAN AR-RAHEEM
- 0xfe45: (0xfe45, 0xfe46, 0,0,1,0,0,0,0,0,0,1,0,0), #  SESAME DOT..WHITE SESAME DOT
- 0x1d000: (0x1d000, 0x1d0f5, 0,0,1,0,0,0,0,0,0,1,0,0), #  BYZANTINE MUSICAL SYMBOL PSILI..BYZANTINE MUSICAL SYMBOL GORGON NEO KATO
- 0x1d300: (0x1d300, 0x1d356, 0,0,1,0,0,0,0,0,0,1,0,0), #  MONOGRAM FOR EARTH..TETRAGRAM FOR FOSTERING
- 0x2460: (0x2460, 0x24ea, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED DIGIT ONE..CIRCLED DIGIT ZERO
- 0x3251: (0x3251, 0x325f, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED NUMBER TWENTY ONE..CIRCLED NUMBER THIRTY FIVE
- 0x3280: (0x3280, 0x32b0, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED IDEOGRAPH ONE..CIRCLED IDEOGRAPH NIGHT
- 0x32b1: (0x32b1, 0x32bf, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED NUMBER THIRTY SIX..CIRCLED NUMBER FIFTY
- 0x32c0: (0x32c0, 0x32cb, 0,0,1,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR JANUARY..IDEOGRAPHIC TELEGRAPH SYMBOL FOR DECEMBER
- 0x32cc: (0x32cc, 0x32cf, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE HG..LIMITED LIABILITY SIGN
- 0x32d0: (0x32d0, 0x32fe, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED KATAKANA A..CIRCLED KATAKANA WO
- 0x3300: (0x3300, 0x3376, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE APAATO..SQUARE PC
- 0x3377: (0x3377, 0x337a, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE DM..SQUARE IU
- 0x337b: (0x337b, 0x33dd, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE ERA NAME HEISEI..SQUARE WB
- 0x33de: (0x33de, 0x33df, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE V OVER M..SQUARE A OVER M
- 0x33e0: (0x33e0, 0x33fe, 0,0,1,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY ONE..IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY THIRTY-ONE
- 0x33ff: (0x33ff, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE GAL
- 0xfb29: (0xfb29, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  HEBREW LETTER ALTERNATIVE PLUS SIGN
- 0xfc5e: (0xfc5e, 0xfc63, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC LIGATURE SHADDA WITH DAMMATAN ISOLATED FORM..ARABIC LIGATURE SHADDA WITH SUPERSCRIPT ALEF ISOLATED FORM
- 0xfdfa: (0xfdfa, 0xfdfb, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC LIGATURE SALLALLAHOU ALAYHE WASALLAM..ARABIC LIGATURE JALLAJALALOUHOU
- 0xfdfc: (0xfdfc, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  RIAL SIGN
- 0xfe10: (0xfe10, 0xfe19, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL COMMA..PRESENTATION FORM FOR VERTICAL HORIZONTAL ELLIPSIS
- 0xfe30: (0xfe30, 0xfe32, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL TWO DOT LEADER..PRESENTATION FORM FOR VERTICAL EN DASH
- 0xfe35: (0xfe35, 0xfe44, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL LEFT PARENTHESIS..PRESENTATION FORM FOR VERTICAL RIGHT WHITE CORNER BRACKET
- 0xfe47: (0xfe47, 0xfe48, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL LEFT SQUARE BRACKET..PRESENTATION FORM FOR VERTICAL RIGHT SQUARE BRACKET
- 0xfe49: (0xfe49, 0xfe4c, 0,0,1,0,0,0,0,0,1,1,0,0), #  DASHED OVERLINE..DOUBLE WAVY OVERLINE
- 0xfe50: (0xfe50, 0xfe52, 0,0,1,0,0,0,0,0,1,1,0,0), #  SMALL COMMA..SMALL FULL STOP
- 0xfe54: (0xfe54, 0xfe66, 0,0,1,0,0,0,0,0,1,1,0,0), #  SMALL SEMICOLON..SMALL EQUALS SIGN
- 0xfe68: (0xfe68, 0xfe6b, 0,0,1,0,0,0,0,0,1,1,0,0), #  SMALL REVERSE SOLIDUS..SMALL COMMERCIAL AT
- 0xfe70: (0xfe70, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC FATHATAN ISOLATED FORM
- 0xfe72: (0xfe72, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC DAMMATAN ISOLATED FORM
- 0xfe74: (0xfe74, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC KASRATAN ISOLATED FORM
- 0xfe76: (0xfe76, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC FATHA ISOLATED FORM
- 0xfe78: (0xfe78, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC DAMMA ISOLATED FORM
- 0xfe7a: (0xfe7a, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC KASRA ISOLATED FORM
- 0xfe7c: (0xfe7c, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC SHADDA ISOLATED FORM
- 0xfe7e: (0xfe7e, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC SUKUN ISOLATED FORM
- 0x1d6c1: (0x1d6c1, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD NABLA
- 0x1d6db: (0x1d6db, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD PARTIAL DIFFERENTIAL
- 0x1d6fb: (0x1d6fb, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL ITALIC NABLA
- 0x1d715: (0x1d715, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL ITALIC PARTIAL DIFFERENTIAL
- 0x1d735: (0x1d735, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD ITALIC NABLA
- 0x1d74f: (0x1d74f, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD ITALIC PARTIAL DIFFERENTIAL
- 0x1d76f: (0x1d76f, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD NABLA
- 0x1d789: (0x1d789, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD PARTIAL DIFFERENTIAL
- 0x1d7a9: (0x1d7a9, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC NABLA
- 0x1d7c3: (0x1d7c3, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC PARTIAL DIFFERENTIAL
- 0x1d2c: (0x1d2c, 0x1d2e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL A..MODIFIER LETTER CAPITAL B
- 0x1d30: (0x1d30, 0x1d3a, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL D..MODIFIER LETTER CAPITAL N
- 0x1d3c: (0x1d3c, 0x1d4d, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL O..MODIFIER LETTER SMALL G
- 0x1d4f: (0x1d4f, 0x1d6a, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL K..GREEK SUBSCRIPT SMALL LETTER CHI
- 0x1d78: (0x1d78, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CYRILLIC EN
- 0x1d9b: (0x1d9b, 0x1dbf, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL TURNED ALPHA..MODIFIER LETTER SMALL THETA
- 0xfb00: (0xfb00, 0xfb06, 0,0,1,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LIGATURE FF..LATIN SMALL LIGATURE ST
- 0xfb13: (0xfb13, 0xfb17, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARMENIAN SMALL LIGATURE MEN NOW..ARMENIAN SMALL LIGATURE MEN XEH
- 0xfb1d: (0xfb1d, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER YOD WITH HIRIQ
- 0xfb1f: (0xfb1f, 0xfb28, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LIGATURE YIDDISH YOD YOD PATAH..HEBREW LETTER WIDE TAV
- 0xfb2a: (0xfb2a, 0xfb36, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER SHIN WITH SHIN DOT..HEBREW LETTER ZAYIN WITH DAGESH
- 0xfb38: (0xfb38, 0xfb3c, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER TET WITH DAGESH..HEBREW LETTER LAMED WITH DAGESH
- 0xfb3e: (0xfb3e, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER MEM WITH DAGESH
- 0xfb40: (0xfb40, 0xfb41, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER NUN WITH DAGESH..HEBREW LETTER SAMEKH WITH DAGESH
- 0xfb43: (0xfb43, 0xfb44, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER FINAL PE WITH DAGESH..HEBREW LETTER PE WITH DAGESH
- 0xfb46: (0xfb46, 0xfbb1, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER TSADI WITH DAGESH..ARABIC LETTER YEH BARREE WITH HAMZA ABOVE FINAL FORM
- 0xfbd3: (0xfbd3, 0xfc5d, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LETTER NG ISOLATED FORM..ARABIC LIGATURE ALEF MAKSURA WITH SUPERSCRIPT ALEF ISOLATED FORM
- 0xfc64: (0xfc64, 0xfd3d, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH REH FINAL FORM..ARABIC LIGATURE ALEF WITH FATHATAN ISOLATED FORM
- 0xfd50: (0xfd50, 0xfd8f, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE TEH WITH JEEM WITH MEEM INITIAL FORM..ARABIC LIGATURE MEEM WITH KHAH WITH MEEM INITIAL FORM
- 0xfd92: (0xfd92, 0xfdc7, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE MEEM WITH JEEM WITH KHAH INITIAL FORM..ARABIC LIGATURE NOON WITH JEEM WITH YEH FINAL FORM
- 0xfdf0: (0xfdf0, 0xfdf9, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE SALLA USED AS KORANIC STOP SIGN ISOLATED FORM..ARABIC LIGATURE SALLA ISOLATED FORM
- 0xfe33: (0xfe33, 0xfe34, 0,0,1,0,0,0,0,0,1,0,0,0), #  PRESENTATION FORM FOR VERTICAL LOW LINE..PRESENTATION FORM FOR VERTICAL WAVY LOW LINE
- 0xfe4d: (0xfe4d, 0xfe4f, 0,0,1,0,0,0,0,0,1,0,0,0), #  DASHED LOW LINE..WAVY LOW LINE
- 0xfe71: (0xfe71, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC TATWEEL WITH FATHATAN ABOVE
- 0xfe77: (0xfe77, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC FATHA MEDIAL FORM
- 0xfe79: (0xfe79, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC DAMMA MEDIAL FORM
- 0xfe7b: (0xfe7b, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC KASRA MEDIAL FORM
- 0xfe7d: (0xfe7d, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC SHADDA MEDIAL FORM
- 0xfe7f: (0xfe7f, 0xfefc, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC SUKUN MEDIAL FORM..ARABIC LIGATURE LAM WITH ALEF FINAL FORM
- 0x1d400: (0x1d400, 0x1d454, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD CAPITAL A..MATHEMATICAL ITALIC SMALL G
- 0x1d456: (0x1d456, 0x1d49c, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC SMALL I..MATHEMATICAL SCRIPT CAPITAL A
- 0x1d49e: (0x1d49e, 0x1d49f, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL C..MATHEMATICAL SCRIPT CAPITAL D
- 0x1d4a2: (0x1d4a2, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL G
- 0x1d4a5: (0x1d4a5, 0x1d4a6, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL J..MATHEMATICAL SCRIPT CAPITAL K
- 0x1d4a9: (0x1d4a9, 0x1d4ac, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL N..MATHEMATICAL SCRIPT CAPITAL Q
- 0x1d4ae: (0x1d4ae, 0x1d4b9, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL S..MATHEMATICAL SCRIPT SMALL D
- 0x1d4bb: (0x1d4bb, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL F
- 0x1d4bd: (0x1d4bd, 0x1d4c0, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL H..MATHEMATICAL SCRIPT SMALL K
- 0x1d4c1: (0x1d4c1, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL L
- 0x1d4c2: (0x1d4c2, 0x1d4c3, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL M..MATHEMATICAL SCRIPT SMALL N
- 0x1d4c5: (0x1d4c5, 0x1d505, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL P..MATHEMATICAL FRAKTUR CAPITAL B
- 0x1d507: (0x1d507, 0x1d50a, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR CAPITAL D..MATHEMATICAL FRAKTUR CAPITAL G
- 0x1d50d: (0x1d50d, 0x1d514, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR CAPITAL J..MATHEMATICAL FRAKTUR CAPITAL Q
- 0x1d516: (0x1d516, 0x1d51c, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR CAPITAL S..MATHEMATICAL FRAKTUR CAPITAL Y
- 0x1d51e: (0x1d51e, 0x1d539, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR SMALL A..MATHEMATICAL DOUBLE-STRUCK CAPITAL B
- 0x1d53b: (0x1d53b, 0x1d53e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL D..MATHEMATICAL DOUBLE-STRUCK CAPITAL G
- 0x1d540: (0x1d540, 0x1d544, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL I..MATHEMATICAL DOUBLE-STRUCK CAPITAL M
- 0x1d546: (0x1d546, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL O
- 0x1d54a: (0x1d54a, 0x1d550, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL S..MATHEMATICAL DOUBLE-STRUCK CAPITAL Y
- 0x1d552: (0x1d552, 0x1d6a3, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK SMALL A..MATHEMATICAL MONOSPACE SMALL Z
- 0x1d6a4: (0x1d6a4, 0x1d6a5, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC SMALL DOTLESS I..MATHEMATICAL ITALIC SMALL DOTLESS J
- 0x1d6a8: (0x1d6a8, 0x1d6c0, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD CAPITAL ALPHA..MATHEMATICAL BOLD CAPITAL OMEGA
- 0x1d6c2: (0x1d6c2, 0x1d6da, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD SMALL ALPHA..MATHEMATICAL BOLD SMALL OMEGA
- 0x1d6dc: (0x1d6dc, 0x1d6fa, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD EPSILON SYMBOL..MATHEMATICAL ITALIC CAPITAL OMEGA
- 0x1d6fc: (0x1d6fc, 0x1d714, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC SMALL ALPHA..MATHEMATICAL ITALIC SMALL OMEGA
- 0x1d716: (0x1d716, 0x1d734, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC EPSILON SYMBOL..MATHEMATICAL BOLD ITALIC CAPITAL OMEGA
- 0x1d736: (0x1d736, 0x1d74e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD ITALIC SMALL ALPHA..MATHEMATICAL BOLD ITALIC SMALL OMEGA
- 0x1d750: (0x1d750, 0x1d76e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD ITALIC EPSILON SYMBOL..MATHEMATICAL SANS-SERIF BOLD CAPITAL OMEGA
- 0x1d770: (0x1d770, 0x1d788, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD SMALL ALPHA..MATHEMATICAL SANS-SERIF BOLD SMALL OMEGA
- 0x1d78a: (0x1d78a, 0x1d7a8, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD EPSILON SYMBOL..MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL OMEGA
- 0x1d7aa: (0x1d7aa, 0x1d7c2, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL ALPHA..MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL OMEGA
- 0x1d7c4: (0x1d7c4, 0x1d7c9, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC EPSILON SYMBOL..MATHEMATICAL SANS-SERIF BOLD ITALIC PI SYMBOL
- 0x1d7ca: (0x1d7ca, 0x1d7cb, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD CAPITAL DIGAMMA..MATHEMATICAL BOLD SMALL DIGAMMA
- 0x1d7ce: (0x1d7ce, 0x1d7ff, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD DIGIT ZERO..MATHEMATICAL MONOSPACE DIGIT NINE
- 0x03e2: (0x03e2, 0x03ef, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER SHEI..COPTIC SMALL LETTER DEI
- 0x0800: (0x0800, 0x082d, 0,0,0,0,0,1,0,0,0,0,0,0), #  SAMARITAN LETTER ALAF..SAMARITAN MARK NEQUDAA
- 0x16ee: (0x16ee, 0x16f0, 0,0,0,0,0,1,0,0,0,0,0,0), #  RUNIC ARLAUG SYMBOL..RUNIC BELGTHOR SYMBOL
- 0x16f1: (0x16f1, 0x16f8, 0,0,0,0,0,1,0,0,0,0,0,0), #  RUNIC LETTER K..RUNIC LETTER FRANKS CASKET AESC
- 0x1700: (0x1700, 0x170c, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGALOG LETTER A..TAGALOG LETTER YA
- 0x170e: (0x170e, 0x1714, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGALOG LETTER LA..TAGALOG SIGN VIRAMA
- 0x1720: (0x1720, 0x1734, 0,0,0,0,0,1,0,0,0,0,0,0), #  HANUNOO LETTER A..HANUNOO SIGN PAMUDPOD
- 0x1740: (0x1740, 0x1753, 0,0,0,0,0,1,0,0,0,0,0,0), #  BUHID LETTER A..BUHID VOWEL SIGN U
- 0x1760: (0x1760, 0x176c, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGBANWA LETTER A..TAGBANWA LETTER YA
- 0x176e: (0x176e, 0x1770, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGBANWA LETTER LA..TAGBANWA LETTER SA
- 0x1772: (0x1772, 0x1773, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGBANWA VOWEL SIGN I..TAGBANWA VOWEL SIGN U
- 0x1a00: (0x1a00, 0x1a1b, 0,0,0,0,0,1,0,0,0,0,0,0), #  BUGINESE LETTER KA..BUGINESE VOWEL SIGN AE
- 0x20f0: (0x20f0, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING ASTERISK ABOVE
- 0x2c00: (0x2c00, 0x2c2e, 0,0,0,0,0,1,0,0,0,0,0,0), #  GLAGOLITIC CAPITAL LETTER AZU..GLAGOLITIC CAPITAL LETTER LATINATE MYSLITE
- 0x2c30: (0x2c30, 0x2c5e, 0,0,0,0,0,1,0,0,0,0,0,0), #  GLAGOLITIC SMALL LETTER AZU..GLAGOLITIC SMALL LETTER LATINATE MYSLITE
- 0x2c80: (0x2c80, 0x2cb1, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER ALFA..COPTIC SMALL LETTER OOU
- 0x2ce4: (0x2ce4, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC SYMBOL KAI
- 0x2ceb: (0x2ceb, 0x2cef, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER CRYPTOGRAMMIC SHEI..COPTIC COMBINING NI ABOVE
- 0x2cf2: (0x2cf2, 0x2cf3, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER BOHAIRIC KHEI..COPTIC SMALL LETTER BOHAIRIC KHEI
- 0xa840: (0xa840, 0xa873, 0,0,0,0,0,1,0,0,0,0,0,0), #  PHAGS-PA LETTER KA..PHAGS-PA LETTER CANDRABINDU
- 0xa930: (0xa930, 0xa953, 0,0,0,0,0,1,0,0,0,0,0,0), #  REJANG LETTER KA..REJANG VIRAMA
- 0x10000: (0x10000, 0x1000b, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B008 A..LINEAR B SYLLABLE B046 JE
- 0x1000d: (0x1000d, 0x10026, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B036 JO..LINEAR B SYLLABLE B032 QO
- 0x10028: (0x10028, 0x1003a, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B060 RA..LINEAR B SYLLABLE B042 WO
- 0x1003c: (0x1003c, 0x1003d, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B017 ZA..LINEAR B SYLLABLE B074 ZE
- 0x1003f: (0x1003f, 0x1004d, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B020 ZO..LINEAR B SYLLABLE B091 TWO
- 0x10050: (0x10050, 0x1005d, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYMBOL B018..LINEAR B SYMBOL B089
- 0x10080: (0x10080, 0x100fa, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B IDEOGRAM B100 MAN..LINEAR B IDEOGRAM VESSEL B305
- 0x101fd: (0x101fd, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  PHAISTOS DISC SIGN COMBINING OBLIQUE STROKE
- 0x10280: (0x10280, 0x1029c, 0,0,0,0,0,1,0,0,0,0,0,0), #  LYCIAN LETTER A..LYCIAN LETTER X
- 0x102a0: (0x102a0, 0x102d0, 0,0,0,0,0,1,0,0,0,0,0,0), #  CARIAN LETTER A..CARIAN LETTER UUU3
- 0x1031f: (0x1031f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD ITALIC LETTER ESS
- 0x1032d: (0x1032d, 0x1032f, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD ITALIC LETTER YE..OLD ITALIC LETTER SOUTHERN TSE
- 0x10350: (0x10350, 0x1037a, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERMIC LETTER AN..COMBINING OLD PERMIC LETTER SII
- 0x10380: (0x10380, 0x1039d, 0,0,0,0,0,1,0,0,0,0,0,0), #  UGARITIC LETTER ALPA..UGARITIC LETTER SSU
- 0x103a0: (0x103a0, 0x103c3, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERSIAN SIGN A..OLD PERSIAN SIGN HA
- 0x103c8: (0x103c8, 0x103cf, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERSIAN SIGN AURAMAZDAA..OLD PERSIAN SIGN BUUMISH
- 0x103d1: (0x103d1, 0x103d5, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERSIAN NUMBER ONE..OLD PERSIAN NUMBER HUNDRED
- 0x10426: (0x10426, 0x10427, 0,0,0,0,0,1,0,0,0,0,0,0), #  DESERET CAPITAL LETTER OI..DESERET CAPITAL LETTER EW
- 0x1044e: (0x1044e, 0x1049d, 0,0,0,0,0,1,0,0,0,0,0,0), #  DESERET SMALL LETTER OI..OSMANYA LETTER OO
- 0x104a0: (0x104a0, 0x104a9, 0,0,0,0,0,1,0,0,0,0,0,0), #  OSMANYA DIGIT ZERO..OSMANYA DIGIT NINE
- 0x10500: (0x10500, 0x10527, 0,0,0,0,0,1,0,0,0,0,0,0), #  ELBASAN LETTER A..ELBASAN LETTER KHE
- 0x10530: (0x10530, 0x10563, 0,0,0,0,0,1,0,0,0,0,0,0), #  CAUCASIAN ALBANIAN LETTER ALT..CAUCASIAN ALBANIAN LETTER KIW
- 0x10600: (0x10600, 0x10736, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR A SIGN AB001..LINEAR A SIGN A664
- 0x10740: (0x10740, 0x10755, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR A SIGN A701 A..LINEAR A SIGN A732 JE
- 0x10760: (0x10760, 0x10767, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR A SIGN A800..LINEAR A SIGN A807
- 0x10800: (0x10800, 0x10805, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE A..CYPRIOT SYLLABLE JA
- 0x10808: (0x10808, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE JO
- 0x1080a: (0x1080a, 0x10835, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE KA..CYPRIOT SYLLABLE WO
- 0x10837: (0x10837, 0x10838, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE XA..CYPRIOT SYLLABLE XE
- 0x1083c: (0x1083c, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE ZA
- 0x1083f: (0x1083f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE ZO
- 0x10840: (0x10840, 0x10855, 0,0,0,0,0,1,0,0,0,0,0,0), #  IMPERIAL ARAMAIC LETTER ALEPH..IMPERIAL ARAMAIC LETTER TAW
- 0x10860: (0x10860, 0x10876, 0,0,0,0,0,1,0,0,0,0,0,0), #  PALMYRENE LETTER ALEPH..PALMYRENE LETTER TAW
- 0x10880: (0x10880, 0x1089e, 0,0,0,0,0,1,0,0,0,0,0,0), #  NABATAEAN LETTER FINAL ALEPH..NABATAEAN LETTER TAW
- 0x108e0: (0x108e0, 0x108f2, 0,0,0,0,0,1,0,0,0,0,0,0), #  HATRAN LETTER ALEPH..HATRAN LETTER QOPH
- 0x108f4: (0x108f4, 0x108f5, 0,0,0,0,0,1,0,0,0,0,0,0), #  HATRAN LETTER SHIN..HATRAN LETTER TAW
- 0x10900: (0x10900, 0x10915, 0,0,0,0,0,1,0,0,0,0,0,0), #  PHOENICIAN LETTER ALF..PHOENICIAN LETTER TAU
- 0x10920: (0x10920, 0x10939, 0,0,0,0,0,1,0,0,0,0,0,0), #  LYDIAN LETTER A..LYDIAN LETTER C
- 0x10980: (0x10980, 0x109b7, 0,0,0,0,0,1,0,0,0,0,0,0), #  MEROITIC HIEROGLYPHIC LETTER A..MEROITIC CURSIVE LETTER DA
- 0x109be: (0x109be, 0x109bf, 0,0,0,0,0,1,0,0,0,0,0,0), #  MEROITIC CURSIVE LOGOGRAM RMT..MEROITIC CURSIVE LOGOGRAM IMN
- 0x10a00: (0x10a00, 0x10a03, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER A..KHAROSHTHI VOWEL SIGN VOCALIC R
- 0x10a05: (0x10a05, 0x10a06, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI VOWEL SIGN E..KHAROSHTHI VOWEL SIGN O
- 0x10a0c: (0x10a0c, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI VOWEL LENGTH MARK
- 0x10a0e: (0x10a0e, 0x10a13, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI SIGN ANUSVARA..KHAROSHTHI LETTER GHA
- 0x10a15: (0x10a15, 0x10a17, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER CA..KHAROSHTHI LETTER JA
- 0x10a19: (0x10a19, 0x10a33, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER NYA..KHAROSHTHI LETTER TTTHA
- 0x10a34: (0x10a34, 0x10a35, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER TTTA..KHAROSHTHI LETTER VHA
- 0x10a38: (0x10a38, 0x10a3a, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI SIGN BAR ABOVE..KHAROSHTHI SIGN DOT BELOW
- 0x10a3f: (0x10a3f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI VIRAMA
- 0x10a60: (0x10a60, 0x10a7c, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD SOUTH ARABIAN LETTER HE..OLD SOUTH ARABIAN LETTER THETH
- 0x10a80: (0x10a80, 0x10a9c, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD NORTH ARABIAN LETTER HEH..OLD NORTH ARABIAN LETTER ZAH
- 0x10ac0: (0x10ac0, 0x10ac7, 0,0,0,0,0,1,0,0,0,0,0,0), #  MANICHAEAN LETTER ALEPH..MANICHAEAN LETTER WAW
- 0x10ac9: (0x10ac9, 0x10ae6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MANICHAEAN LETTER ZAYIN..MANICHAEAN ABBREVIATION MARK BELOW
- 0x10b00: (0x10b00, 0x10b35, 0,0,0,0,0,1,0,0,0,0,0,0), #  AVESTAN LETTER A..AVESTAN LETTER HE
- 0x10b40: (0x10b40, 0x10b55, 0,0,0,0,0,1,0,0,0,0,0,0), #  INSCRIPTIONAL PARTHIAN LETTER ALEPH..INSCRIPTIONAL PARTHIAN LETTER TAW
- 0x10b60: (0x10b60, 0x10b72, 0,0,0,0,0,1,0,0,0,0,0,0), #  INSCRIPTIONAL PAHLAVI LETTER ALEPH..INSCRIPTIONAL PAHLAVI LETTER TAW
- 0x10b80: (0x10b80, 0x10b91, 0,0,0,0,0,1,0,0,0,0,0,0), #  PSALTER PAHLAVI LETTER ALEPH..PSALTER PAHLAVI LETTER TAW
- 0x10c00: (0x10c00, 0x10c48, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD TURKIC LETTER ORKHON A..OLD TURKIC LETTER ORKHON BASH
- 0x10c80: (0x10c80, 0x10cb2, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD HUNGARIAN CAPITAL LETTER A..OLD HUNGARIAN CAPITAL LETTER US
- 0x10cc0: (0x10cc0, 0x10cf2, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD HUNGARIAN SMALL LETTER A..OLD HUNGARIAN SMALL LETTER US
- 0x10f00: (0x10f00, 0x10f1c, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD SOGDIAN LETTER ALEPH..OLD SOGDIAN LETTER FINAL TAW WITH VERTICAL TAIL
- 0x10f27: (0x10f27, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD SOGDIAN LIGATURE AYIN-DALETH
- 0x10f30: (0x10f30, 0x10f50, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOGDIAN LETTER ALEPH..SOGDIAN COMBINING STROKE BELOW
- 0x11000: (0x11000, 0x11046, 0,0,0,0,0,1,0,0,0,0,0,0), #  BRAHMI SIGN CANDRABINDU..BRAHMI VIRAMA
- 0x11066: (0x11066, 0x1106f, 0,0,0,0,0,1,0,0,0,0,0,0), #  BRAHMI DIGIT ZERO..BRAHMI DIGIT NINE
- 0x1107f: (0x1107f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  BRAHMI NUMBER JOINER
- 0x11080: (0x11080, 0x110ba, 0,0,0,0,0,1,0,0,0,0,0,0), #  KAITHI SIGN CANDRABINDU..KAITHI SIGN NUKTA
- 0x110d0: (0x110d0, 0x110e8, 0,0,0,0,0,1,0,0,0,0,0,0), #  SORA SOMPENG LETTER SAH..SORA SOMPENG LETTER MAE
- 0x110f0: (0x110f0, 0x110f9, 0,0,0,0,0,1,0,0,0,0,0,0), #  SORA SOMPENG DIGIT ZERO..SORA SOMPENG DIGIT NINE
- 0x11150: (0x11150, 0x11173, 0,0,0,0,0,1,0,0,0,0,0,0), #  MAHAJANI LETTER A..MAHAJANI SIGN NUKTA
- 0x11176: (0x11176, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MAHAJANI LIGATURE SHRI
- 0x11180: (0x11180, 0x111c4, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA SIGN CANDRABINDU..SHARADA OM
- 0x111c9: (0x111c9, 0x111cc, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA SANDHI MARK..SHARADA EXTRA SHORT VOWEL MARK
- 0x111d0: (0x111d0, 0x111d9, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA DIGIT ZERO..SHARADA DIGIT NINE
- 0x111da: (0x111da, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA EKAM
- 0x111dc: (0x111dc, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA HEADSTROKE
- 0x11200: (0x11200, 0x11211, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHOJKI LETTER A..KHOJKI LETTER JJA
- 0x11213: (0x11213, 0x11237, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHOJKI LETTER NYA..KHOJKI SIGN SHADDA
- 0x1123e: (0x1123e, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHOJKI SIGN SUKUN
- 0x11280: (0x11280, 0x11286, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER A..MULTANI LETTER GA
- 0x11288: (0x11288, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER GHA
- 0x1128a: (0x1128a, 0x1128d, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER CA..MULTANI LETTER JJA
- 0x1128f: (0x1128f, 0x1129d, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER NYA..MULTANI LETTER BA
- 0x1129f: (0x1129f, 0x112a8, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER BHA..MULTANI LETTER RHA
- 0x112b0: (0x112b0, 0x112ea, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHUDAWADI LETTER A..KHUDAWADI SIGN VIRAMA
- 0x112f0: (0x112f0, 0x112f9, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHUDAWADI DIGIT ZERO..KHUDAWADI DIGIT NINE
- 0x11300: (0x11300, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN COMBINING ANUSVARA ABOVE
- 0x11301: (0x11301, 0x11303, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN CANDRABINDU..GRANTHA SIGN VISARGA
- 0x11305: (0x11305, 0x1130c, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER A..GRANTHA LETTER VOCALIC L
- 0x1130f: (0x1130f, 0x11310, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER EE..GRANTHA LETTER AI
- 0x11313: (0x11313, 0x11328, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER OO..GRANTHA LETTER NA
- 0x1132a: (0x1132a, 0x11330, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER PA..GRANTHA LETTER RA
- 0x11332: (0x11332, 0x11333, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER LA..GRANTHA LETTER LLA
- 0x11335: (0x11335, 0x11339, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER VA..GRANTHA LETTER HA
- 0x1133c: (0x1133c, 0x11344, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN NUKTA..GRANTHA VOWEL SIGN VOCALIC RR
- 0x11347: (0x11347, 0x11348, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA VOWEL SIGN EE..GRANTHA VOWEL SIGN AI
- 0x1134b: (0x1134b, 0x1134d, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA VOWEL SIGN OO..GRANTHA SIGN VIRAMA
- 0x11350: (0x11350, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA OM
- 0x11357: (0x11357, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA AU LENGTH MARK
- 0x1135d: (0x1135d, 0x11363, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN PLUTA..GRANTHA VOWEL SIGN VOCALIC LL
- 0x11366: (0x11366, 0x1136c, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GRANTHA DIGIT ZERO..COMBINING GRANTHA DIGIT SIX
- 0x11370: (0x11370, 0x11374, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GRANTHA LETTER A..COMBINING GRANTHA LETTER PA
- 0x11480: (0x11480, 0x114c5, 0,0,0,0,0,1,0,0,0,0,0,0), #  TIRHUTA ANJI..TIRHUTA GVANG
- 0x114c7: (0x114c7, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  TIRHUTA OM
- 0x114d0: (0x114d0, 0x114d9, 0,0,0,0,0,1,0,0,0,0,0,0), #  TIRHUTA DIGIT ZERO..TIRHUTA DIGIT NINE
- 0x11580: (0x11580, 0x115b5, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIDDHAM LETTER A..SIDDHAM VOWEL SIGN VOCALIC RR
- 0x115b8: (0x115b8, 0x115c0, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIDDHAM VOWEL SIGN E..SIDDHAM SIGN NUKTA
- 0x115d8: (0x115d8, 0x115dd, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIDDHAM LETTER THREE-CIRCLE ALTERNATE I..SIDDHAM VOWEL SIGN ALTERNATE UU
- 0x11600: (0x11600, 0x11640, 0,0,0,0,0,1,0,0,0,0,0,0), #  MODI LETTER A..MODI SIGN ARDHACANDRA
- 0x11644: (0x11644, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MODI SIGN HUVA
- 0x11650: (0x11650, 0x11659, 0,0,0,0,0,1,0,0,0,0,0,0), #  MODI DIGIT ZERO..MODI DIGIT NINE
- 0x11680: (0x11680, 0x116b7, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAKRI LETTER A..TAKRI SIGN NUKTA
- 0x116c0: (0x116c0, 0x116c9, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAKRI DIGIT ZERO..TAKRI DIGIT NINE
- 0x11700: (0x11700, 0x11719, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM LETTER KA..AHOM LETTER JHA
- 0x1171a: (0x1171a, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM LETTER ALTERNATE BA
- 0x1171d: (0x1171d, 0x1172b, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM CONSONANT SIGN MEDIAL LA..AHOM SIGN KILLER
- 0x11730: (0x11730, 0x11739, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM DIGIT ZERO..AHOM DIGIT NINE
- 0x11800: (0x11800, 0x1183a, 0,0,0,0,0,1,0,0,0,0,0,0), #  DOGRA LETTER A..DOGRA SIGN NUKTA
- 0x118a0: (0x118a0, 0x118e9, 0,0,0,0,0,1,0,0,0,0,0,0), #  WARANG CITI CAPITAL LETTER NGAA..WARANG CITI DIGIT NINE
- 0x118ff: (0x118ff, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  WARANG CITI OM
- 0x11a00: (0x11a00, 0x11a3e, 0,0,0,0,0,1,0,0,0,0,0,0), #  ZANABAZAR SQUARE LETTER A..ZANABAZAR SQUARE CLUSTER-FINAL LETTER VA
- 0x11a47: (0x11a47, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  ZANABAZAR SQUARE SUBJOINER
- 0x11a50: (0x11a50, 0x11a83, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOYOMBO LETTER A..SOYOMBO LETTER KSSA
- 0x11a86: (0x11a86, 0x11a99, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOYOMBO CLUSTER-INITIAL LETTER RA..SOYOMBO SUBJOINER
- 0x11a9d: (0x11a9d, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOYOMBO MARK PLUTA
- 0x11ac0: (0x11ac0, 0x11af8, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAU CIN HAU LETTER PA..PAU CIN HAU GLOTTAL STOP FINAL
- 0x11c00: (0x11c00, 0x11c08, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI LETTER A..BHAIKSUKI LETTER VOCALIC L
- 0x11c0a: (0x11c0a, 0x11c36, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI LETTER E..BHAIKSUKI VOWEL SIGN VOCALIC L
- 0x11c38: (0x11c38, 0x11c40, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI VOWEL SIGN E..BHAIKSUKI SIGN AVAGRAHA
- 0x11c50: (0x11c50, 0x11c59, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI DIGIT ZERO..BHAIKSUKI DIGIT NINE
- 0x11c72: (0x11c72, 0x11c8f, 0,0,0,0,0,1,0,0,0,0,0,0), #  MARCHEN LETTER KA..MARCHEN LETTER A
- 0x11c92: (0x11c92, 0x11ca7, 0,0,0,0,0,1,0,0,0,0,0,0), #  MARCHEN SUBJOINED LETTER KA..MARCHEN SUBJOINED LETTER ZA
- 0x11ca9: (0x11ca9, 0x11cb6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MARCHEN SUBJOINED LETTER YA..MARCHEN SIGN CANDRABINDU
- 0x11d00: (0x11d00, 0x11d06, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI LETTER A..MASARAM GONDI LETTER E
- 0x11d08: (0x11d08, 0x11d09, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI LETTER AI..MASARAM GONDI LETTER O
- 0x11d0b: (0x11d0b, 0x11d36, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI LETTER AU..MASARAM GONDI VOWEL SIGN VOCALIC R
- 0x11d3a: (0x11d3a, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI VOWEL SIGN E
- 0x11d3c: (0x11d3c, 0x11d3d, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI VOWEL SIGN AI..MASARAM GONDI VOWEL SIGN O
- 0x11d3f: (0x11d3f, 0x11d47, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI VOWEL SIGN AU..MASARAM GONDI RA-KARA
- 0x11d50: (0x11d50, 0x11d59, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI DIGIT ZERO..MASARAM GONDI DIGIT NINE
- 0x11ee0: (0x11ee0, 0x11ef6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MAKASAR LETTER KA..MAKASAR VOWEL SIGN O
- 0x12000: (0x12000, 0x1236e, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN A..CUNEIFORM SIGN ZUM
- 0x1236f: (0x1236f, 0x12398, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN KAP ELAMITE..CUNEIFORM SIGN UM TIMES ME
- 0x12399: (0x12399, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN U U
- 0x12400: (0x12400, 0x12462, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM NUMERIC SIGN TWO ASH..CUNEIFORM NUMERIC SIGN OLD ASSYRIAN ONE QUARTER
- 0x12463: (0x12463, 0x1246e, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM NUMERIC SIGN ONE QUARTER GUR..CUNEIFORM NUMERIC SIGN NINE U VARIANT FORM
- 0x12480: (0x12480, 0x12543, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN AB TIMES NUN TENU..CUNEIFORM SIGN ZU5 TIMES THREE DISH TENU
- 0x13000: (0x13000, 0x1342e, 0,0,0,0,0,1,0,0,0,0,0,0), #  EGYPTIAN HIEROGLYPH A001..EGYPTIAN HIEROGLYPH AA032
- 0x14400: (0x14400, 0x14646, 0,0,0,0,0,1,0,0,0,0,0,0), #  ANATOLIAN HIEROGLYPH A001..ANATOLIAN HIEROGLYPH A530
- 0x16ad0: (0x16ad0, 0x16aed, 0,0,0,0,0,1,0,0,0,0,0,0), #  BASSA VAH LETTER ENNI..BASSA VAH LETTER I
- 0x16af0: (0x16af0, 0x16af4, 0,0,0,0,0,1,0,0,0,0,0,0), #  BASSA VAH COMBINING HIGH TONE..BASSA VAH COMBINING HIGH-LOW TONE
- 0x16b00: (0x16b00, 0x16b36, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG VOWEL KEEB..PAHAWH HMONG MARK CIM TAUM
- 0x16b40: (0x16b40, 0x16b43, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG SIGN VOS SEEV..PAHAWH HMONG SIGN IB YAM
- 0x16b50: (0x16b50, 0x16b59, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG DIGIT ZERO..PAHAWH HMONG DIGIT NINE
- 0x16b63: (0x16b63, 0x16b77, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG SIGN VOS LUB..PAHAWH HMONG SIGN CIM NRES TOS
- 0x16b7d: (0x16b7d, 0x16b8f, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG CLAN SIGN TSHEEJ..PAHAWH HMONG CLAN SIGN VWJ
- 0x16e40: (0x16e40, 0x16e7f, 0,0,0,0,0,1,0,0,0,0,0,0), #  MEDEFAIDRIN CAPITAL LETTER M..MEDEFAIDRIN SMALL LETTER Y
- 0x16fe0: (0x16fe0, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT ITERATION MARK
- 0x16fe1: (0x16fe1, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  NUSHU ITERATION MARK
- 0x17000: (0x17000, 0x187ec, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT IDEOGRAPH-17000..TANGUT IDEOGRAPH-187EC
- 0x187ed: (0x187ed, 0x187f1, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT IDEOGRAPH-187ED..TANGUT IDEOGRAPH-187F1
- 0x18800: (0x18800, 0x18af2, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT COMPONENT-001..TANGUT COMPONENT-755
- 0x1b170: (0x1b170, 0x1b2fb, 0,0,0,0,0,1,0,0,0,0,0,0), #  NUSHU CHARACTER-1B170..NUSHU CHARACTER-1B2FB
- 0x1bc00: (0x1bc00, 0x1bc6a, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN LETTER H..DUPLOYAN LETTER VOCALIC M
- 0x1bc70: (0x1bc70, 0x1bc7c, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN AFFIX LEFT HORIZONTAL SECANT..DUPLOYAN AFFIX ATTACHED TANGENT HOOK
- 0x1bc80: (0x1bc80, 0x1bc88, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN AFFIX HIGH ACUTE..DUPLOYAN AFFIX HIGH VERTICAL
- 0x1bc90: (0x1bc90, 0x1bc99, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN AFFIX LOW ACUTE..DUPLOYAN AFFIX LOW ARROW
- 0x1bc9d: (0x1bc9d, 0x1bc9e, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN THICK LETTER SELECTOR..DUPLOYAN DOUBLE MARK
- 0x1da00: (0x1da00, 0x1da36, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING HEAD RIM..SIGNWRITING AIR SUCKING IN
- 0x1da3b: (0x1da3b, 0x1da6c, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING MOUTH CLOSED NEUTRAL..SIGNWRITING EXCITEMENT
- 0x1da75: (0x1da75, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING UPPER BODY TILTING FROM HIP JOINTS
- 0x1da84: (0x1da84, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING LOCATION HEAD NECK
- 0x1da9b: (0x1da9b, 0x1da9f, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING FILL MODIFIER-2..SIGNWRITING FILL MODIFIER-6
- 0x1daa1: (0x1daa1, 0x1daaf, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING ROTATION MODIFIER-2..SIGNWRITING ROTATION MODIFIER-16
- 0x1e000: (0x1e000, 0x1e006, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER AZU..COMBINING GLAGOLITIC LETTER ZHIVETE
- 0x1e008: (0x1e008, 0x1e018, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER ZEMLJA..COMBINING GLAGOLITIC LETTER HERU
- 0x1e01b: (0x1e01b, 0x1e021, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER SHTA..COMBINING GLAGOLITIC LETTER YATI
- 0x1e023: (0x1e023, 0x1e024, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER YU..COMBINING GLAGOLITIC LETTER SMALL YUS
- 0x1e026: (0x1e026, 0x1e02a, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER YO..COMBINING GLAGOLITIC LETTER FITA
- 0x1e800: (0x1e800, 0x1e8c4, 0,0,0,0,0,1,0,0,0,0,0,0), #  MENDE KIKAKUI SYLLABLE M001 KI..MENDE KIKAKUI SYLLABLE M060 NYON
- 0x1e8d0: (0x1e8d0, 0x1e8d6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MENDE KIKAKUI COMBINING NUMBER TEENS..MENDE KIKAKUI COMBINING NUMBER MILLIONS
- 0x0640: (0x0640, None, 0,0,0,1,0,1,0,0,0,0,0,0), #  ARABIC TATWEEL
- 0x1681: (0x1681, 0x169a, 0,0,0,1,0,1,0,0,0,0,0,0), #  OGHAM LETTER BEITH..OGHAM LETTER PEITH
- 0x16a0: (0x16a0, 0x16ea, 0,0,0,1,0,1,0,0,0,0,0,0), #  RUNIC LETTER FEHU FEOH FE F..RUNIC LETTER X
- 0x2cb2: (0x2cb2, 0x2ce3, 0,0,0,1,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER DIALECT-P ALEF..COPTIC SMALL LETTER OLD NUBIAN WAU
- 0x10300: (0x10300, 0x1031e, 0,0,0,1,0,1,0,0,0,0,0,0), #  OLD ITALIC LETTER A..OLD ITALIC LETTER UU
- 0x10330: (0x10330, 0x1034a, 0,0,0,1,0,1,0,0,0,0,0,0), #  GOTHIC LETTER AHSA..GOTHIC LETTER NINE HUNDRED
- 0x10400: (0x10400, 0x10425, 0,0,0,1,0,1,0,0,0,0,0,0), #  DESERET CAPITAL LETTER LONG I..DESERET CAPITAL LETTER ENG
- 0x10428: (0x10428, 0x1044d, 0,0,0,1,0,1,0,0,0,0,0,0), #  DESERET SMALL LETTER LONG I..DESERET SMALL LETTER ENG
- 0x2cf9: (0x2cf9, 0x2cfc, 0,0,0,1,0,1,0,0,0,1,0,0), #  COPTIC OLD NUBIAN FULL STOP..COPTIC OLD NUBIAN VERSE DIVIDER
- 0x206a: (0x206a, 0x206f, 0,1,0,1,0,1,0,0,0,1,0,1), #  INHIBIT SYMMETRIC SWAPPING..NOMINAL DIGIT SHAPES
- 0xe0001: (0xe0001, None, 0,1,0,1,0,1,0,0,0,1,0,1), #  LANGUAGE TAG
- 0x3164: (0x3164, None, 0,0,0,1,0,1,0,0,1,0,0,1), #  HANGUL FILLER
- 0xffa0: (0xffa0, None, 0,0,0,1,0,1,0,0,1,0,0,1), #  HALFWIDTH HANGUL FILLER
- 0x115f: (0x115f, 0x1160, 0,0,0,1,0,1,0,0,0,0,0,1), #  HANGUL CHOSEONG FILLER..HANGUL JUNGSEONG FILLER
- 0x0830: (0x0830, 0x083e, 0,0,0,0,0,1,0,0,0,1,0,0), #  SAMARITAN PUNCTUATION NEQUDAA..SAMARITAN PUNCTUATION ANNAAU
- 0x1680: (0x1680, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  OGHAM SPACE MARK
- 0x169b: (0x169b, 0x169c, 0,0,0,0,0,1,0,0,0,1,0,0), #  OGHAM FEATHER MARK..OGHAM REVERSED FEATHER MARK
- 0x1735: (0x1735, 0x1736, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHILIPPINE SINGLE PUNCTUATION..PHILIPPINE DOUBLE PUNCTUATION
- 0x1802: (0x1802, 0x1803, 0,0,0,0,0,1,0,0,0,1,0,0), #  MONGOLIAN COMMA..MONGOLIAN FULL STOP
- 0x1805: (0x1805, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  MONGOLIAN FOUR DOTS
- 0x1a1e: (0x1a1e, 0x1a1f, 0,0,0,0,0,1,0,0,0,1,0,0), #  BUGINESE PALLAWA..BUGINESE END OF SECTION
- 0x20dd: (0x20dd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING CIRCLE
- 0x2ce5: (0x2ce5, 0x2cea, 0,0,0,0,0,1,0,0,0,1,0,0), #  COPTIC SYMBOL MI RO..COPTIC SYMBOL SHIMA SIMA
- 0x2cfd: (0x2cfd, 0x2cff, 0,0,0,0,0,1,0,0,0,1,0,0), #  COPTIC FRACTION ONE HALF..COPTIC MORPHOLOGICAL DIVIDER
- 0xa874: (0xa874, 0xa877, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHAGS-PA SINGLE HEAD MARK..PHAGS-PA MARK DOUBLE SHAD
- 0xa95f: (0xa95f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  REJANG SECTION MARK
- 0x10100: (0x10100, 0x10102, 0,0,0,0,0,1,0,0,0,1,0,0), #  AEGEAN WORD SEPARATOR LINE..AEGEAN CHECK MARK
- 0x10107: (0x10107, 0x10133, 0,0,0,0,0,1,0,0,0,1,0,0), #  AEGEAN NUMBER ONE..AEGEAN NUMBER NINETY THOUSAND
- 0x10137: (0x10137, 0x1013f, 0,0,0,0,0,1,0,0,0,1,0,0), #  AEGEAN WEIGHT BASE UNIT..AEGEAN MEASURE THIRD SUBUNIT
- 0x101d0: (0x101d0, 0x101fc, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHAISTOS DISC SIGN PEDESTRIAN..PHAISTOS DISC SIGN WAVY BAND
- 0x10320: (0x10320, 0x10323, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD ITALIC NUMERAL ONE..OLD ITALIC NUMERAL FIFTY
- 0x1039f: (0x1039f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  UGARITIC WORD DIVIDER
- 0x103d0: (0x103d0, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD PERSIAN WORD DIVIDER
- 0x1056f: (0x1056f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  CAUCASIAN ALBANIAN CITATION MARK
- 0x10857: (0x10857, 0x1085f, 0,0,0,0,0,1,0,0,0,1,0,0), #  IMPERIAL ARAMAIC SECTION SIGN..IMPERIAL ARAMAIC NUMBER TEN THOUSAND
- 0x10877: (0x10877, 0x1087f, 0,0,0,0,0,1,0,0,0,1,0,0), #  PALMYRENE LEFT-POINTING FLEURON..PALMYRENE NUMBER TWENTY
- 0x108a7: (0x108a7, 0x108af, 0,0,0,0,0,1,0,0,0,1,0,0), #  NABATAEAN NUMBER ONE..NABATAEAN NUMBER ONE HUNDRED
- 0x108fb: (0x108fb, 0x108ff, 0,0,0,0,0,1,0,0,0,1,0,0), #  HATRAN NUMBER ONE..HATRAN NUMBER ONE HUNDRED
- 0x10916: (0x10916, 0x10919, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHOENICIAN NUMBER ONE..PHOENICIAN NUMBER ONE HUNDRED
- 0x1091a: (0x1091a, 0x1091b, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHOENICIAN NUMBER TWO..PHOENICIAN NUMBER THREE
- 0x1091f: (0x1091f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHOENICIAN WORD SEPARATOR
- 0x1093f: (0x1093f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  LYDIAN TRIANGULAR MARK
- 0x109bc: (0x109bc, 0x109bd, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEROITIC CURSIVE FRACTION ELEVEN TWELFTHS..MEROITIC CURSIVE FRACTION ONE HALF
- 0x109c0: (0x109c0, 0x109cf, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEROITIC CURSIVE NUMBER ONE..MEROITIC CURSIVE NUMBER SEVENTY
- 0x109d2: (0x109d2, 0x109ff, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEROITIC CURSIVE NUMBER ONE HUNDRED..MEROITIC CURSIVE FRACTION TEN TWELFTHS
- 0x10a40: (0x10a40, 0x10a47, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHAROSHTHI DIGIT ONE..KHAROSHTHI NUMBER ONE THOUSAND
- 0x10a48: (0x10a48, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHAROSHTHI FRACTION ONE HALF
- 0x10a50: (0x10a50, 0x10a58, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHAROSHTHI PUNCTUATION DOT..KHAROSHTHI PUNCTUATION LINES
- 0x10a7d: (0x10a7d, 0x10a7f, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD SOUTH ARABIAN NUMBER ONE..OLD SOUTH ARABIAN NUMERIC INDICATOR
- 0x10a9d: (0x10a9d, 0x10a9f, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD NORTH ARABIAN NUMBER ONE..OLD NORTH ARABIAN NUMBER TWENTY
- 0x10ac8: (0x10ac8, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  MANICHAEAN SIGN UD
- 0x10aeb: (0x10aeb, 0x10af6, 0,0,0,0,0,1,0,0,0,1,0,0), #  MANICHAEAN NUMBER ONE..MANICHAEAN PUNCTUATION LINE FILLER
- 0x10b39: (0x10b39, 0x10b3f, 0,0,0,0,0,1,0,0,0,1,0,0), #  AVESTAN ABBREVIATION MARK..LARGE ONE RING OVER TWO RINGS PUNCTUATION
- 0x10b58: (0x10b58, 0x10b5f, 0,0,0,0,0,1,0,0,0,1,0,0), #  INSCRIPTIONAL PARTHIAN NUMBER ONE..INSCRIPTIONAL PARTHIAN NUMBER ONE THOUSAND
- 0x10b78: (0x10b78, 0x10b7f, 0,0,0,0,0,1,0,0,0,1,0,0), #  INSCRIPTIONAL PAHLAVI NUMBER ONE..INSCRIPTIONAL PAHLAVI NUMBER ONE THOUSAND
- 0x10b99: (0x10b99, 0x10b9c, 0,0,0,0,0,1,0,0,0,1,0,0), #  PSALTER PAHLAVI SECTION MARK..PSALTER PAHLAVI FOUR DOTS WITH DOT
- 0x10ba9: (0x10ba9, 0x10baf, 0,0,0,0,0,1,0,0,0,1,0,0), #  PSALTER PAHLAVI NUMBER ONE..PSALTER PAHLAVI NUMBER ONE HUNDRED
- 0x10cfa: (0x10cfa, 0x10cff, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD HUNGARIAN NUMBER ONE..OLD HUNGARIAN NUMBER ONE THOUSAND
- 0x10f1d: (0x10f1d, 0x10f26, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD SOGDIAN NUMBER ONE..OLD SOGDIAN FRACTION ONE HALF
- 0x10f51: (0x10f51, 0x10f59, 0,0,0,0,0,1,0,0,0,1,0,0), #  SOGDIAN NUMBER ONE..SOGDIAN PUNCTUATION HALF CIRCLE WITH DOT
- 0x11047: (0x11047, 0x1104d, 0,0,0,0,0,1,0,0,0,1,0,0), #  BRAHMI DANDA..BRAHMI PUNCTUATION LOTUS
- 0x11052: (0x11052, 0x11065, 0,0,0,0,0,1,0,0,0,1,0,0), #  BRAHMI NUMBER ONE..BRAHMI NUMBER ONE THOUSAND
- 0x110bb: (0x110bb, 0x110bc, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI ABBREVIATION SIGN..KAITHI ENUMERATION SIGN
- 0x110bd: (0x110bd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI NUMBER SIGN
- 0x110be: (0x110be, 0x110c1, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI SECTION MARK..KAITHI DOUBLE DANDA
- 0x110cd: (0x110cd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI NUMBER SIGN ABOVE
- 0x11174: (0x11174, 0x11175, 0,0,0,0,0,1,0,0,0,1,0,0), #  MAHAJANI ABBREVIATION SIGN..MAHAJANI SECTION MARK
- 0x111c5: (0x111c5, 0x111c8, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA DANDA..SHARADA SEPARATOR
- 0x111cd: (0x111cd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA SUTRA MARK
- 0x111db: (0x111db, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA SIGN SIDDHAM
- 0x111dd: (0x111dd, 0x111df, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA CONTINUATION SIGN..SHARADA SECTION MARK-2
- 0x11238: (0x11238, 0x1123d, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHOJKI DANDA..KHOJKI ABBREVIATION SIGN
- 0x112a9: (0x112a9, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  MULTANI SECTION MARK
- 0x114c6: (0x114c6, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  TIRHUTA ABBREVIATION SIGN
- 0x115c1: (0x115c1, 0x115c9, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIDDHAM SIGN SIDDHAM..SIDDHAM END OF TEXT MARK
- 0x115ca: (0x115ca, 0x115d7, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIDDHAM SECTION MARK WITH TRIDENT AND U-SHAPED ORNAMENTS..SIDDHAM SECTION MARK WITH CIRCLES AND FOUR ENCLOSURES
- 0x11641: (0x11641, 0x11643, 0,0,0,0,0,1,0,0,0,1,0,0), #  MODI DANDA..MODI ABBREVIATION SIGN
- 0x1173a: (0x1173a, 0x1173f, 0,0,0,0,0,1,0,0,0,1,0,0), #  AHOM NUMBER TEN..AHOM SYMBOL VI
- 0x1183b: (0x1183b, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  DOGRA ABBREVIATION SIGN
- 0x118ea: (0x118ea, 0x118f2, 0,0,0,0,0,1,0,0,0,1,0,0), #  WARANG CITI NUMBER TEN..WARANG CITI NUMBER NINETY
- 0x11a3f: (0x11a3f, 0x11a46, 0,0,0,0,0,1,0,0,0,1,0,0), #  ZANABAZAR SQUARE INITIAL HEAD MARK..ZANABAZAR SQUARE CLOSING DOUBLE-LINED HEAD MARK
- 0x11a9a: (0x11a9a, 0x11a9c, 0,0,0,0,0,1,0,0,0,1,0,0), #  SOYOMBO MARK TSHEG..SOYOMBO MARK DOUBLE SHAD
- 0x11a9e: (0x11a9e, 0x11aa2, 0,0,0,0,0,1,0,0,0,1,0,0), #  SOYOMBO HEAD MARK WITH MOON AND SUN AND TRIPLE FLAME..SOYOMBO TERMINAL MARK-2
- 0x11c41: (0x11c41, 0x11c45, 0,0,0,0,0,1,0,0,0,1,0,0), #  BHAIKSUKI DANDA..BHAIKSUKI GAP FILLER-2
- 0x11c5a: (0x11c5a, 0x11c6c, 0,0,0,0,0,1,0,0,0,1,0,0), #  BHAIKSUKI NUMBER ONE..BHAIKSUKI HUNDREDS UNIT MARK
- 0x11c70: (0x11c70, 0x11c71, 0,0,0,0,0,1,0,0,0,1,0,0), #  MARCHEN HEAD MARK..MARCHEN MARK SHAD
- 0x11ef7: (0x11ef7, 0x11ef8, 0,0,0,0,0,1,0,0,0,1,0,0), #  MAKASAR PASSIMBANG..MAKASAR END OF SECTION
- 0x12470: (0x12470, 0x12473, 0,0,0,0,0,1,0,0,0,1,0,0), #  CUNEIFORM PUNCTUATION SIGN OLD ASSYRIAN WORD DIVIDER..CUNEIFORM PUNCTUATION SIGN DIAGONAL TRICOLON
- 0x12474: (0x12474, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  CUNEIFORM PUNCTUATION SIGN DIAGONAL QUADCOLON
- 0x16a6e: (0x16a6e, 0x16a6f, 0,0,0,0,0,1,0,0,0,1,0,0), #  MRO DANDA..MRO DOUBLE DANDA
- 0x16af5: (0x16af5, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  BASSA VAH FULL STOP
- 0x16b37: (0x16b37, 0x16b3f, 0,0,0,0,0,1,0,0,0,1,0,0), #  PAHAWH HMONG SIGN VOS THOM..PAHAWH HMONG SIGN XYEEM FAIB
- 0x16b44: (0x16b44, 0x16b45, 0,0,0,0,0,1,0,0,0,1,0,0), #  PAHAWH HMONG SIGN XAUS..PAHAWH HMONG SIGN CIM TSOV ROG
- 0x16b5b: (0x16b5b, 0x16b61, 0,0,0,0,0,1,0,0,0,1,0,0), #  PAHAWH HMONG NUMBER TENS..PAHAWH HMONG NUMBER TRILLIONS
- 0x16e80: (0x16e80, 0x16e9a, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEDEFAIDRIN DIGIT ZERO..MEDEFAIDRIN EXCLAMATION OH
- 0x1bc9c: (0x1bc9c, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  DUPLOYAN SIGN O WITH CROSS
- 0x1bc9f: (0x1bc9f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  DUPLOYAN PUNCTUATION CHINOOK FULL STOP
- 0x1d200: (0x1d200, 0x1d241, 0,0,0,0,0,1,0,0,0,1,0,0), #  GREEK VOCAL NOTATION SYMBOL-1..GREEK INSTRUMENTAL NOTATION SYMBOL-54
- 0x1d245: (0x1d245, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  GREEK MUSICAL LEIMMA
- 0x1d800: (0x1d800, 0x1d9ff, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING HAND-FIST INDEX..SIGNWRITING HEAD
- 0x1da37: (0x1da37, 0x1da3a, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING AIR BLOW SMALL ROTATIONS..SIGNWRITING BREATH EXHALE
- 0x1da6d: (0x1da6d, 0x1da74, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING SHOULDER HIP SPINE..SIGNWRITING TORSO-FLOORPLANE TWISTING
- 0x1da76: (0x1da76, 0x1da83, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING LIMB COMBINATION..SIGNWRITING LOCATION DEPTH
- 0x1da85: (0x1da85, 0x1da8b, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING LOCATION TORSO..SIGNWRITING PARENTHESIS
- 0x1e8c7: (0x1e8c7, 0x1e8cf, 0,0,0,0,0,1,0,0,0,1,0,0), #  MENDE KIKAKUI DIGIT ONE..MENDE KIKAKUI DIGIT NINE
- 0x00ad: (0x00ad, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  SOFT HYPHEN
- 0x061c: (0x061c, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  ARABIC LETTER MARK
- 0x200b: (0x200b, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  ZERO WIDTH SPACE
- 0x200e: (0x200e, 0x200f, 0,0,0,0,0,1,0,0,0,1,0,1), #  LEFT-TO-RIGHT MARK..RIGHT-TO-LEFT MARK
- 0x202a: (0x202a, 0x202e, 0,0,0,0,0,1,0,0,0,1,0,1), #  LEFT-TO-RIGHT EMBEDDING..RIGHT-TO-LEFT OVERRIDE
- 0x2060: (0x2060, 0x2063, 0,0,0,0,0,1,0,0,0,1,0,1), #  WORD JOINER..INVISIBLE SEPARATOR
- 0x2064: (0x2064, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  INVISIBLE PLUS
- 0x2066: (0x2066, 0x2069, 0,0,0,0,0,1,0,0,0,1,0,1), #  LEFT-TO-RIGHT ISOLATE..POP DIRECTIONAL ISOLATE
- 0xfeff: (0xfeff, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  ZERO WIDTH NO-BREAK SPACE
- 0x1bca0: (0x1bca0, 0x1bca3, 0,0,0,0,0,1,0,0,0,1,0,1), #  SHORTHAND FORMAT LETTER OVERLAP..SHORTHAND FORMAT UP STEP
- 0xe0020: (0xe0020, 0xe007f, 0,0,0,0,0,1,0,0,0,1,0,1), #  TAG SPACE..CANCEL TAG
- 0x034f: (0x034f, None, 0,0,0,0,0,1,0,0,0,0,0,1), #  COMBINING GRAPHEME JOINER
- 0x17b4: (0x17b4, 0x17b5, 0,0,0,0,0,1,0,0,0,0,0,1), #  KHMER VOWEL INHERENT AQ..KHMER VOWEL INHERENT AA
- 0xe0100: (0xe0100, 0xe01ef, 0,0,0,0,0,1,0,0,0,0,0,1), #  VARIATION SELECTOR-17..VARIATION SELECTOR-256
- 0x01b9: (0x01b9, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER EZH REVERSED
- 0x01bf: (0x01bf, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN LETTER WYNN
- 0x01f6: (0x01f6, 0x01f7, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER HWAIR..LATIN CAPITAL LETTER WYNN
- 0x021c: (0x021c, 0x021d, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER YOGH..LATIN SMALL LETTER YOGH
- 0x0363: (0x0363, 0x036f, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING LATIN SMALL LETTER A..COMBINING LATIN SMALL LETTER X
- 0x0370: (0x0370, 0x0373, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER HETA..GREEK SMALL LETTER ARCHAIC SAMPI
- 0x0376: (0x0376, 0x0377, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER PAMPHYLIAN DIGAMMA..GREEK SMALL LETTER PAMPHYLIAN DIGAMMA
- 0x037f: (0x037f, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER YOT
- 0x03d8: (0x03d8, 0x03d9, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER ARCHAIC KOPPA..GREEK SMALL LETTER ARCHAIC KOPPA
- 0x03da: (0x03da, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER STIGMA
- 0x03db: (0x03db, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER STIGMA
- 0x03dc: (0x03dc, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER DIGAMMA
- 0x03dd: (0x03dd, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER DIGAMMA
- 0x03de: (0x03de, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER KOPPA
- 0x03df: (0x03df, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER KOPPA
- 0x03e0: (0x03e0, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER SAMPI
- 0x03e1: (0x03e1, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER SAMPI
- 0x03f7: (0x03f7, 0x03f8, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER SHO..GREEK SMALL LETTER SHO
- 0x03fa: (0x03fa, 0x03fb, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER SAN..GREEK SMALL LETTER SAN
- 0x0460: (0x0460, 0x0481, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER OMEGA..CYRILLIC SMALL LETTER KOPPA
- 0x0483: (0x0483, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC TITLO
- 0x052a: (0x052a, 0x052d, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER DZZHE..CYRILLIC SMALL LETTER DCHE
- 0x066e: (0x066e, 0x066f, 0,0,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER DOTLESS BEH..ARABIC LETTER DOTLESS QAF
- 0x068e: (0x068e, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER DUL
- 0x08ad: (0x08ad, 0x08b1, 0,0,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER LOW ALEF..ARABIC LETTER STRAIGHT WAW
- 0x094e: (0x094e, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI VOWEL SIGN PRISHTHAMATRA E
- 0x0951: (0x0951, 0x0952, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI STRESS SIGN UDATTA..DEVANAGARI STRESS SIGN ANUDATTA
- 0x0978: (0x0978, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI LETTER MARWARI DDA
- 0x0980: (0x0980, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  BENGALI ANJI
- 0x0c00: (0x0c00, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TELUGU SIGN COMBINING CANDRABINDU ABOVE
- 0x0c34: (0x0c34, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TELUGU LETTER LLLA
- 0x0c58: (0x0c58, 0x0c59, 0,0,0,1,0,0,0,0,0,0,0,0), #  TELUGU LETTER TSA..TELUGU LETTER DZA
- 0x0c81: (0x0c81, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KANNADA SIGN CANDRABINDU
- 0x0cde: (0x0cde, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KANNADA LETTER FA
- 0x0d01: (0x0d01, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  MALAYALAM SIGN CANDRABINDU
- 0x0d5f: (0x0d5f, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  MALAYALAM LETTER ARCHAIC II
- 0x0de6: (0x0de6, 0x0def, 0,0,0,1,0,0,0,0,0,0,0,0), #  SINHALA LITH DIGIT ZERO..SINHALA LITH DIGIT NINE
- 0x10a0: (0x10a0, 0x10c5, 0,0,0,1,0,0,0,0,0,0,0,0), #  GEORGIAN CAPITAL LETTER AN..GEORGIAN CAPITAL LETTER HOE
- 0x10f1: (0x10f1, 0x10f6, 0,0,0,1,0,0,0,0,0,0,0,0), #  GEORGIAN LETTER HE..GEORGIAN LETTER FI
- 0x1100: (0x1100, 0x1159, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL CHOSEONG KIYEOK..HANGUL CHOSEONG YEORINHIEUH
- 0x115a: (0x115a, 0x115e, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL CHOSEONG KIYEOK-TIKEUT..HANGUL CHOSEONG TIKEUT-RIEUL
- 0x1161: (0x1161, 0x11a2, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JUNGSEONG A..HANGUL JUNGSEONG SSANGARAEA
- 0x11a3: (0x11a3, 0x11a7, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JUNGSEONG A-EU..HANGUL JUNGSEONG O-YAE
- 0x11a8: (0x11a8, 0x11f9, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JONGSEONG KIYEOK..HANGUL JONGSEONG YEORINHIEUH
- 0x11fa: (0x11fa, 0x11ff, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JONGSEONG KIYEOK-NIEUN..HANGUL JONGSEONG SSANGNIEUN
- 0x1369: (0x1369, 0x1371, 0,0,0,1,0,0,0,0,0,0,0,0), #  ETHIOPIC DIGIT ONE..ETHIOPIC DIGIT NINE
- 0x17a8: (0x17a8, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KHMER INDEPENDENT VOWEL QUK
- 0x17d3: (0x17d3, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KHMER SIGN BATHAMASAT
- 0x1ab0: (0x1ab0, 0x1abd, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING DOUBLED CIRCUMFLEX ACCENT..COMBINING PARENTHESES BELOW
- 0x1cd0: (0x1cd0, 0x1cd2, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC TONE KARSHANA..VEDIC TONE PRENKHA
- 0x1cd4: (0x1cd4, 0x1cf2, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC SIGN YAJURVEDIC MIDLINE SVARITA..VEDIC SIGN ARDHAVISARGA
- 0x1cf3: (0x1cf3, 0x1cf6, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC SIGN ROTATED ARDHAVISARGA..VEDIC SIGN UPADHMANIYA
- 0x1cf7: (0x1cf7, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC SIGN ATIKRAMA
- 0x1cf8: (0x1cf8, 0x1cf9, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC TONE RING ABOVE..VEDIC TONE DOUBLE RING ABOVE
- 0x2132: (0x2132, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TURNED CAPITAL F
- 0x214e: (0x214e, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TURNED SMALL F
- 0x2184: (0x2184, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER REVERSED C
- 0x2185: (0x2185, 0x2188, 0,0,0,1,0,0,0,0,0,0,0,0), #  ROMAN NUMERAL SIX LATE FORM..ROMAN NUMERAL ONE HUNDRED THOUSAND
- 0x2c6d: (0x2c6d, 0x2c6f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER ALPHA..LATIN CAPITAL LETTER TURNED A
- 0x2c70: (0x2c70, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER TURNED ALPHA
- 0x2c71: (0x2c71, 0x2c73, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER V WITH RIGHT HOOK..LATIN SMALL LETTER W WITH HOOK
- 0x2c74: (0x2c74, 0x2c76, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER V WITH CURL..LATIN SMALL LETTER HALF H
- 0x2c7e: (0x2c7e, 0x2c7f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER S WITH SWASH TAIL..LATIN CAPITAL LETTER Z WITH SWASH TAIL
- 0x2d00: (0x2d00, 0x2d25, 0,0,0,1,0,0,0,0,0,0,0,0), #  GEORGIAN SMALL LETTER AN..GEORGIAN SMALL LETTER HOE
- 0x2de0: (0x2de0, 0x2dff, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC LETTER BE..COMBINING CYRILLIC LETTER IOTIFIED BIG YUS
- 0xa640: (0xa640, 0xa65f, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER ZEMLYA..CYRILLIC SMALL LETTER YN
- 0xa662: (0xa662, 0xa66e, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER SOFT DE..CYRILLIC LETTER MULTIOCULAR O
- 0xa680: (0xa680, 0xa697, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER DWE..CYRILLIC SMALL LETTER SHWE
- 0xa698: (0xa698, 0xa69b, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER DOUBLE O..CYRILLIC SMALL LETTER CROSSED O
- 0xa730: (0xa730, 0xa76f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL F..LATIN SMALL LETTER CON
- 0xa771: (0xa771, 0xa787, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER DUM..LATIN SMALL LETTER INSULAR T
- 0xa794: (0xa794, 0xa79f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER C WITH PALATAL HOOK..LATIN SMALL LETTER VOLAPUK UE
- 0xa7ab: (0xa7ab, 0xa7ad, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER REVERSED OPEN E..LATIN CAPITAL LETTER L WITH BELT
- 0xa7b0: (0xa7b0, 0xa7b1, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER TURNED K..LATIN CAPITAL LETTER TURNED T
- 0xa7f7: (0xa7f7, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN EPIGRAPHIC LETTER SIDEWAYS I
- 0xa7fb: (0xa7fb, 0xa7ff, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN EPIGRAPHIC LETTER REVERSED F..LATIN EPIGRAPHIC LETTER ARCHAIC M
- 0xa8e0: (0xa8e0, 0xa8f7, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING DEVANAGARI DIGIT ZERO..DEVANAGARI SIGN CANDRABINDU AVAGRAHA
- 0xa8fb: (0xa8fb, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI HEADSTROKE
- 0xa8fe: (0xa8fe, 0xa8ff, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI LETTER AY..DEVANAGARI VOWEL SIGN AY
- 0xa960: (0xa960, 0xa97c, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL CHOSEONG TIKEUT-MIEUM..HANGUL CHOSEONG SSANGYEORINHIEUH
- 0xa9e0: (0xa9e0, 0xa9e6, 0,0,0,1,0,0,0,0,0,0,0,0), #  MYANMAR LETTER SHAN GHA..MYANMAR MODIFIER LETTER SHAN REDUPLICATION
- 0xab30: (0xab30, 0xab5a, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER BARRED ALPHA..LATIN SMALL LETTER Y WITH SHORT RIGHT LEG
- 0xab64: (0xab64, 0xab65, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER INVERTED ALPHA..GREEK LETTER SMALL CAPITAL OMEGA
- 0xd7b0: (0xd7b0, 0xd7c6, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JUNGSEONG O-YEO..HANGUL JUNGSEONG ARAEA-E
- 0xd7cb: (0xd7cb, 0xd7fb, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JONGSEONG NIEUN-RIEUL..HANGUL JONGSEONG PHIEUPH-THIEUTH
- 0x10140: (0x10140, 0x10174, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK ACROPHONIC ATTIC ONE QUARTER..GREEK ACROPHONIC STRATIAN FIFTY MNAS
- 0x102e0: (0x102e0, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  COPTIC EPACT THOUSANDS MARK
- 0x1b000: (0x1b000, 0x1b001, 0,0,0,1,0,0,0,0,0,0,0,0), #  KATAKANA LETTER ARCHAIC E..HIRAGANA LETTER ARCHAIC YE
- 0x0482: (0x0482, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  CYRILLIC THOUSANDS SIGN
- 0x0488: (0x0488, 0x0489, 0,0,0,1,0,0,0,0,0,1,0,0), #  COMBINING CYRILLIC HUNDRED THOUSANDS SIGN..COMBINING CYRILLIC MILLIONS SIGN
- 0x05c6: (0x05c6, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION NUN HAFUKHA
- 0x17d8: (0x17d8, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  KHMER SIGN BEYYAL
- 0x1cd3: (0x1cd3, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  VEDIC SIGN NIHSHVASA
- 0x2056: (0x2056, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  THREE DOT PUNCTUATION
- 0x2058: (0x2058, 0x205e, 0,0,0,1,0,0,0,0,0,1,0,0), #  FOUR DOT PUNCTUATION..VERTICAL FOUR DOTS
- 0x2127: (0x2127, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  INVERTED OHM SIGN
- 0x214f: (0x214f, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  SYMBOL FOR SAMARITAN SOURCE
- 0x2e0e: (0x2e0e, 0x2e16, 0,0,0,1,0,0,0,0,0,1,0,0), #  EDITORIAL CORONIS..DOTTED RIGHT-POINTING ANGLE
- 0x2e2a: (0x2e2a, 0x2e30, 0,0,0,1,0,0,0,0,0,1,0,0), #  TWO DOTS OVER ONE DOT PUNCTUATION..RING POINT
- 0x2e31: (0x2e31, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  WORD SEPARATOR MIDDLE DOT
- 0x2e32: (0x2e32, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  TURNED COMMA
- 0x2e35: (0x2e35, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  TURNED SEMICOLON
- 0x2e39: (0x2e39, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  TOP HALF SECTION SIGN
- 0x301e: (0x301e, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  DOUBLE PRIME QUOTATION MARK
- 0xa670: (0xa670, 0xa673, 0,0,0,1,0,0,0,0,0,1,0,0), #  COMBINING CYRILLIC TEN MILLIONS SIGN..SLAVONIC ASTERISK
- 0xa700: (0xa700, 0xa707, 0,0,0,1,0,0,0,0,0,1,0,0), #  MODIFIER LETTER CHINESE TONE YIN PING..MODIFIER LETTER CHINESE TONE YANG RU
- 0xa8f8: (0xa8f8, 0xa8fa, 0,0,0,1,0,0,0,0,0,1,0,0), #  DEVANAGARI SIGN PUSHPIKA..DEVANAGARI CARET
- 0x3200: (0x3200, 0x321c, 0,0,0,1,0,0,0,0,1,1,0,0), #  PARENTHESIZED HANGUL KIYEOK..PARENTHESIZED HANGUL CIEUC U
- 0x321d: (0x321d, 0x321e, 0,0,0,1,0,0,0,0,1,1,0,0), #  PARENTHESIZED KOREAN CHARACTER OJEON..PARENTHESIZED KOREAN CHARACTER O HU
- 0x2329: (0x2329, 0x232a, 0,1,0,1,0,0,0,0,1,1,0,0), #  LEFT-POINTING ANGLE BRACKET..RIGHT-POINTING ANGLE BRACKET
- 0x0344: (0x0344, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  COMBINING GREEK DIALYTIKA TONOS
- 0x03d0: (0x03d0, 0x03d1, 0,0,0,1,0,0,0,0,1,0,0,0), #  GREEK BETA SYMBOL..GREEK THETA SYMBOL
- 0x03d5: (0x03d5, 0x03d6, 0,0,0,1,0,0,0,0,1,0,0,0), #  GREEK PHI SYMBOL..GREEK PI SYMBOL
- 0x03f9: (0x03f9, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LUNATE SIGMA SYMBOL
- 0x0f73: (0x0f73, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN II
- 0x0f75: (0x0f75, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN UU
- 0x0f81: (0x0f81, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN REVERSED II
- 0x3131: (0x3131, 0x3163, 0,0,0,1,0,0,0,0,1,0,0,0), #  HANGUL LETTER KIYEOK..HANGUL LETTER I
- 0x3165: (0x3165, 0x318e, 0,0,0,1,0,0,0,0,1,0,0,0), #  HANGUL LETTER SSANGNIEUN..HANGUL LETTER ARAEAE
- 0xa770: (0xa770, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  MODIFIER LETTER US
- 0xffa1: (0xffa1, 0xffbe, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER KIYEOK..HALFWIDTH HANGUL LETTER HIEUH
- 0xffc2: (0xffc2, 0xffc7, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER A..HALFWIDTH HANGUL LETTER E
- 0xffca: (0xffca, 0xffcf, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER YEO..HALFWIDTH HANGUL LETTER OE
- 0xffd2: (0xffd2, 0xffd7, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER YO..HALFWIDTH HANGUL LETTER YU
- 0xffda: (0xffda, 0xffdc, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER EU..HALFWIDTH HANGUL LETTER I
- 0x0149: (0x0149, None, 0,1,0,1,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER N PRECEDED BY APOSTROPHE
- 0x0f77: (0x0f77, None, 0,1,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC RR
- 0x0f79: (0x0f79, None, 0,1,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC LL
- 0x0673: (0x0673, None, 0,1,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER ALEF WITH WAVY HAMZA BELOW
- 0x17a3: (0x17a3, 0x17a4, 0,1,0,1,0,0,0,0,0,0,0,0), #  KHMER INDEPENDENT VOWEL QAQ..KHMER INDEPENDENT VOWEL QAA
- 0x0009: (0x0009, 0x000d, 0,0,0,0,0,0,0,0,0,1,0,0), #  <control-0009>..<control-000D>
- 0x0020: (0x0020, 0x0026, 0,0,0,0,0,0,0,0,0,1,0,0), #  SPACE..AMPERSAND
- 0x0028: (0x0028, 0x002c, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT PARENTHESIS..COMMA
- 0x002f: (0x002f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SOLIDUS
- 0x003b: (0x003b, 0x0040, 0,0,0,0,0,0,0,0,0,1,0,0), #  SEMICOLON..COMMERCIAL AT
- 0x005b: (0x005b, 0x005e, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT SQUARE BRACKET..CIRCUMFLEX ACCENT
- 0x0060: (0x0060, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRAVE ACCENT
- 0x007b: (0x007b, 0x007e, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT CURLY BRACKET..TILDE
- 0x0085: (0x0085, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  <control-0085>
- 0x00a1: (0x00a1, 0x00a7, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED EXCLAMATION MARK..SECTION SIGN
- 0x00a9: (0x00a9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  COPYRIGHT SIGN
- 0x00ab: (0x00ab, 0x00ac, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT-POINTING DOUBLE ANGLE QUOTATION MARK..NOT SIGN
- 0x00ae: (0x00ae, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REGISTERED SIGN
- 0x00b0: (0x00b0, 0x00b1, 0,0,0,0,0,0,0,0,0,1,0,0), #  DEGREE SIGN..PLUS-MINUS SIGN
- 0x00b6: (0x00b6, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PILCROW SIGN
- 0x00bb: (0x00bb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK
- 0x00bf: (0x00bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED QUESTION MARK
- 0x00d7: (0x00d7, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MULTIPLICATION SIGN
- 0x00f7: (0x00f7, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIVISION SIGN
- 0x02c2: (0x02c2, 0x02c5, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER LEFT ARROWHEAD..MODIFIER LETTER DOWN ARROWHEAD
- 0x02d2: (0x02d2, 0x02d7, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER CENTRED RIGHT HALF RING..MODIFIER LETTER MINUS SIGN
- 0x02de: (0x02de, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER RHOTIC HOOK
- 0x02df: (0x02df, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER CROSS ACCENT
- 0x02e5: (0x02e5, 0x02e9, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER EXTRA-HIGH TONE BAR..MODIFIER LETTER EXTRA-LOW TONE BAR
- 0x02ea: (0x02ea, 0x02eb, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER YIN DEPARTING TONE MARK..MODIFIER LETTER YANG DEPARTING TONE MARK
- 0x02ed: (0x02ed, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER UNASPIRATED
- 0x02ef: (0x02ef, 0x02ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER LOW DOWN ARROWHEAD..MODIFIER LETTER LOW LEFT ARROW
- 0x03f6: (0x03f6, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK REVERSED LUNATE EPSILON SYMBOL
- 0x055a: (0x055a, 0x055f, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARMENIAN APOSTROPHE..ARMENIAN ABBREVIATION MARK
- 0x0589: (0x0589, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARMENIAN FULL STOP
- 0x058d: (0x058d, 0x058e, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT-FACING ARMENIAN ETERNITY SIGN..LEFT-FACING ARMENIAN ETERNITY SIGN
- 0x058f: (0x058f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARMENIAN DRAM SIGN
- 0x05be: (0x05be, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION MAQAF
- 0x05c0: (0x05c0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION PASEQ
- 0x05c3: (0x05c3, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION SOF PASUQ
- 0x0600: (0x0600, 0x0603, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC NUMBER SIGN..ARABIC SIGN SAFHA
- 0x0604: (0x0604, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC SIGN SAMVAT
- 0x0605: (0x0605, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC NUMBER MARK ABOVE
- 0x0606: (0x0606, 0x060a, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC-INDIC CUBE ROOT..ARABIC-INDIC PER TEN THOUSAND SIGN
- 0x060b: (0x060b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  AFGHANI SIGN
- 0x060c: (0x060c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC COMMA
- 0x060d: (0x060d, 0x060f, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC DATE SEPARATOR..ARABIC SIGN MISRA
- 0x061b: (0x061b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC SEMICOLON
- 0x061e: (0x061e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC TRIPLE DOT PUNCTUATION MARK
- 0x061f: (0x061f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC QUESTION MARK
- 0x066a: (0x066a, 0x066d, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC PERCENT SIGN..ARABIC FIVE POINTED STAR
- 0x06d4: (0x06d4, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC FULL STOP
- 0x06dd: (0x06dd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC END OF AYAH
- 0x06de: (0x06de, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC START OF RUB EL HIZB
- 0x06e9: (0x06e9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC PLACE OF SAJDAH
- 0x08e2: (0x08e2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC DISPUTED END OF AYAH
- 0x0964: (0x0964, 0x0965, 0,0,0,0,0,0,0,0,0,1,0,0), #  DEVANAGARI DANDA..DEVANAGARI DOUBLE DANDA
- 0x0970: (0x0970, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DEVANAGARI ABBREVIATION SIGN
- 0x09f2: (0x09f2, 0x09fa, 0,0,0,0,0,0,0,0,0,1,0,0), #  BENGALI RUPEE MARK..BENGALI ISSHAR
- 0x09fb: (0x09fb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BENGALI GANDA MARK
- 0x09fd: (0x09fd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BENGALI ABBREVIATION SIGN
- 0x0a76: (0x0a76, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GURMUKHI ABBREVIATION SIGN
- 0x0af0: (0x0af0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GUJARATI ABBREVIATION SIGN
- 0x0af1: (0x0af1, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GUJARATI RUPEE SIGN
- 0x0b70: (0x0b70, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ORIYA ISSHAR
- 0x0b72: (0x0b72, 0x0b77, 0,0,0,0,0,0,0,0,0,1,0,0), #  ORIYA FRACTION ONE QUARTER..ORIYA FRACTION THREE SIXTEENTHS
- 0x0bf0: (0x0bf0, 0x0bf2, 0,0,0,0,0,0,0,0,0,1,0,0), #  TAMIL NUMBER TEN..TAMIL NUMBER ONE THOUSAND
- 0x0bf3: (0x0bf3, 0x0bfa, 0,0,0,0,0,0,0,0,0,1,0,0), #  TAMIL DAY SIGN..TAMIL NUMBER SIGN
- 0x0c78: (0x0c78, 0x0c7f, 0,0,0,0,0,0,0,0,0,1,0,0), #  TELUGU FRACTION DIGIT ZERO FOR ODD POWERS OF FOUR..TELUGU SIGN TUUMU
- 0x0c84: (0x0c84, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KANNADA SIGN SIDDHAM
- 0x0d4f: (0x0d4f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM SIGN PARA
- 0x0d58: (0x0d58, 0x0d5e, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM FRACTION ONE ONE-HUNDRED-AND-SIXTIETH..MALAYALAM FRACTION ONE FIFTH
- 0x0d70: (0x0d70, 0x0d75, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM NUMBER TEN..MALAYALAM FRACTION THREE QUARTERS
- 0x0d76: (0x0d76, 0x0d78, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM FRACTION ONE SIXTEENTH..MALAYALAM FRACTION THREE SIXTEENTHS
- 0x0d79: (0x0d79, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM DATE MARK
- 0x0df4: (0x0df4, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SINHALA PUNCTUATION KUNDDALIYA
- 0x0e3f: (0x0e3f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  THAI CURRENCY SYMBOL BAHT
- 0x0e4f: (0x0e4f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  THAI CHARACTER FONGMAN
- 0x0e5a: (0x0e5a, 0x0e5b, 0,0,0,0,0,0,0,0,0,1,0,0), #  THAI CHARACTER ANGKHANKHU..THAI CHARACTER KHOMUT
- 0x0f01: (0x0f01, 0x0f0a, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK GTER YIG MGO TRUNCATED A..TIBETAN MARK BKA- SHOG YIG MGO
- 0x0f0d: (0x0f0d, 0x0f17, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK SHAD..TIBETAN ASTROLOGICAL SIGN SGRA GCAN -CHAR RTAGS
- 0x0f1a: (0x0f1a, 0x0f1f, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SIGN RDEL DKAR GCIG..TIBETAN SIGN RDEL DKAR RDEL NAG
- 0x0f2a: (0x0f2a, 0x0f34, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN DIGIT HALF ONE..TIBETAN MARK BSDUS RTAGS
- 0x0f36: (0x0f36, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK CARET -DZUD RTAGS BZHI MIG CAN
- 0x0f38: (0x0f38, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK CHE MGO
- 0x0f3a: (0x0f3a, 0x0f3d, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK GUG RTAGS GYON..TIBETAN MARK ANG KHANG GYAS
- 0x0f85: (0x0f85, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK PALUTA
- 0x0fbe: (0x0fbe, 0x0fc5, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN KU RU KHA..TIBETAN SYMBOL RDO RJE
- 0x0fc7: (0x0fc7, 0x0fcc, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SYMBOL RDO RJE RGYA GRAM..TIBETAN SYMBOL NOR BU BZHI -KHYIL
- 0x0fce: (0x0fce, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SIGN RDEL NAG RDEL DKAR
- 0x0fcf: (0x0fcf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SIGN RDEL NAG GSUM
- 0x0fd0: (0x0fd0, 0x0fd1, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK BSKA- SHOG GI MGO RGYAN..TIBETAN MARK MNYAM YIG GI MGO RGYAN
- 0x0fd2: (0x0fd2, 0x0fd4, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK NYIS TSHEG..TIBETAN MARK CLOSING BRDA RNYING YIG MGO SGAB MA
- 0x0fd5: (0x0fd5, 0x0fd8, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT-FACING SVASTI SIGN..LEFT-FACING SVASTI SIGN WITH DOTS
- 0x0fd9: (0x0fd9, 0x0fda, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK LEADING MCHAN RTAGS..TIBETAN MARK TRAILING MCHAN RTAGS
- 0x104a: (0x104a, 0x104f, 0,0,0,0,0,0,0,0,0,1,0,0), #  MYANMAR SIGN LITTLE SECTION..MYANMAR SYMBOL GENITIVE
- 0x109e: (0x109e, 0x109f, 0,0,0,0,0,0,0,0,0,1,0,0), #  MYANMAR SYMBOL SHAN ONE..MYANMAR SYMBOL SHAN EXCLAMATION
- 0x10fb: (0x10fb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GEORGIAN PARAGRAPH SEPARATOR
- 0x1360: (0x1360, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC SECTION MARK
- 0x1361: (0x1361, 0x1368, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC WORDSPACE..ETHIOPIC PARAGRAPH SEPARATOR
- 0x1372: (0x1372, 0x137c, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC NUMBER TEN..ETHIOPIC NUMBER TEN THOUSAND
- 0x1390: (0x1390, 0x1399, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC TONAL MARK YIZET..ETHIOPIC TONAL MARK KURT
- 0x16eb: (0x16eb, 0x16ed, 0,0,0,0,0,0,0,0,0,1,0,0), #  RUNIC SINGLE PUNCTUATION..RUNIC CROSS PUNCTUATION
- 0x17d4: (0x17d4, 0x17d6, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SIGN KHAN..KHMER SIGN CAMNUC PII KUUH
- 0x17d9: (0x17d9, 0x17db, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SIGN PHNAEK MUAN..KHMER CURRENCY SYMBOL RIEL
- 0x17f0: (0x17f0, 0x17f9, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SYMBOL LEK ATTAK SON..KHMER SYMBOL LEK ATTAK PRAM-BUON
- 0x19e0: (0x19e0, 0x19ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SYMBOL PATHAMASAT..KHMER SYMBOL DAP-PRAM ROC
- 0x1abe: (0x1abe, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  COMBINING PARENTHESES OVERLAY
- 0x2012: (0x2012, 0x2016, 0,0,0,0,0,0,0,0,0,1,0,0), #  FIGURE DASH..DOUBLE VERTICAL LINE
- 0x2018: (0x2018, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT SINGLE QUOTATION MARK
- 0x201a: (0x201a, 0x2023, 0,0,0,0,0,0,0,0,0,1,0,0), #  SINGLE LOW-9 QUOTATION MARK..TRIANGULAR BULLET
- 0x2028: (0x2028, 0x2029, 0,0,0,0,0,0,0,0,0,1,0,0), #  LINE SEPARATOR..PARAGRAPH SEPARATOR
- 0x2030: (0x2030, 0x2032, 0,0,0,0,0,0,0,0,0,1,0,0), #  PER MILLE SIGN..PRIME
- 0x2035: (0x2035, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REVERSED PRIME
- 0x2038: (0x2038, 0x203b, 0,0,0,0,0,0,0,0,0,1,0,0), #  CARET..REFERENCE MARK
- 0x203d: (0x203d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  INTERROBANG
- 0x2041: (0x2041, 0x2046, 0,0,0,0,0,0,0,0,0,1,0,0), #  CARET INSERTION POINT..RIGHT SQUARE BRACKET WITH QUILL
- 0x204a: (0x204a, 0x204d, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIRONIAN SIGN ET..BLACK RIGHTWARDS BULLET
- 0x204e: (0x204e, 0x2052, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOW ASTERISK..COMMERCIAL MINUS SIGN
- 0x2053: (0x2053, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SWUNG DASH
- 0x2055: (0x2055, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FLOWER PUNCTUATION MARK
- 0x20a0: (0x20a0, 0x20a7, 0,0,0,0,0,0,0,0,0,1,0,0), #  EURO-CURRENCY SIGN..PESETA SIGN
- 0x20a9: (0x20a9, 0x20aa, 0,0,0,0,0,0,0,0,0,1,0,0), #  WON SIGN..NEW SHEQEL SIGN
- 0x20ab: (0x20ab, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DONG SIGN
- 0x20ac: (0x20ac, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EURO SIGN
- 0x20ad: (0x20ad, 0x20af, 0,0,0,0,0,0,0,0,0,1,0,0), #  KIP SIGN..DRACHMA SIGN
- 0x20b0: (0x20b0, 0x20b1, 0,0,0,0,0,0,0,0,0,1,0,0), #  GERMAN PENNY SIGN..PESO SIGN
- 0x20b2: (0x20b2, 0x20b5, 0,0,0,0,0,0,0,0,0,1,0,0), #  GUARANI SIGN..CEDI SIGN
- 0x20b6: (0x20b6, 0x20b8, 0,0,0,0,0,0,0,0,0,1,0,0), #  LIVRE TOURNOIS SIGN..TENGE SIGN
- 0x20b9: (0x20b9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  INDIAN RUPEE SIGN
- 0x20ba: (0x20ba, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TURKISH LIRA SIGN
- 0x20bb: (0x20bb, 0x20bd, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORDIC MARK SIGN..RUBLE SIGN
- 0x20be: (0x20be, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LARI SIGN
- 0x20bf: (0x20bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BITCOIN SIGN
- 0x2104: (0x2104, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CENTRE LINE SYMBOL
- 0x2108: (0x2108, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SCRUPLE
- 0x2114: (0x2114, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  L B BAR SYMBOL
- 0x2117: (0x2117, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SOUND RECORDING COPYRIGHT
- 0x211e: (0x211e, 0x211f, 0,0,0,0,0,0,0,0,0,1,0,0), #  PRESCRIPTION TAKE..RESPONSE
- 0x2123: (0x2123, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  VERSICLE
- 0x2125: (0x2125, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OUNCE SIGN
- 0x2129: (0x2129, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TURNED GREEK SMALL LETTER IOTA
- 0x213a: (0x213a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROTATED CAPITAL Q
- 0x2141: (0x2141, 0x2144, 0,0,0,0,0,0,0,0,0,1,0,0), #  TURNED SANS-SERIF CAPITAL G..TURNED SANS-SERIF CAPITAL Y
- 0x214a: (0x214a, 0x214b, 0,0,0,0,0,0,0,0,0,1,0,0), #  PROPERTY LINE..TURNED AMPERSAND
- 0x214c: (0x214c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PER SIGN
- 0x214d: (0x214d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  AKTIESELSKAB
- 0x2190: (0x2190, 0x21ea, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS ARROW..UPWARDS WHITE ARROW FROM BAR
- 0x21eb: (0x21eb, 0x21f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPWARDS WHITE ARROW ON PEDESTAL..UP DOWN WHITE ARROW
- 0x21f4: (0x21f4, 0x21ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT ARROW WITH SMALL CIRCLE..LEFT RIGHT OPEN-HEADED ARROW
- 0x2200: (0x2200, 0x222b, 0,0,0,0,0,0,0,0,0,1,0,0), #  FOR ALL..INTEGRAL
- 0x222e: (0x222e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CONTOUR INTEGRAL
- 0x2231: (0x2231, 0x22f1, 0,0,0,0,0,0,0,0,0,1,0,0), #  CLOCKWISE INTEGRAL..DOWN RIGHT DIAGONAL ELLIPSIS
- 0x22f2: (0x22f2, 0x22ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  ELEMENT OF WITH LONG HORIZONTAL STROKE..Z NOTATION BAG MEMBERSHIP
- 0x2300: (0x2300, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIAMETER SIGN
- 0x2301: (0x2301, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ELECTRIC ARROW
- 0x2302: (0x2302, 0x2328, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOUSE..KEYBOARD
- 0x232b: (0x232b, 0x237a, 0,0,0,0,0,0,0,0,0,1,0,0), #  ERASE TO THE LEFT..APL FUNCTIONAL SYMBOL ALPHA
- 0x237b: (0x237b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NOT CHECK MARK
- 0x237c: (0x237c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT ANGLE WITH DOWNWARDS ZIGZAG ARROW
- 0x237d: (0x237d, 0x239a, 0,0,0,0,0,0,0,0,0,1,0,0), #  SHOULDERED OPEN BOX..CLEAR SCREEN SYMBOL
- 0x239b: (0x239b, 0x23ce, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT PARENTHESIS UPPER HOOK..RETURN SYMBOL
- 0x23cf: (0x23cf, 0x23d0, 0,0,0,0,0,0,0,0,0,1,0,0), #  EJECT SYMBOL..VERTICAL LINE EXTENSION
- 0x23d1: (0x23d1, 0x23db, 0,0,0,0,0,0,0,0,0,1,0,0), #  METRICAL BREVE..FUSE
- 0x23dc: (0x23dc, 0x23e7, 0,0,0,0,0,0,0,0,0,1,0,0), #  TOP PARENTHESIS..ELECTRICAL INTERSECTION
- 0x23e8: (0x23e8, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DECIMAL EXPONENT SYMBOL
- 0x23e9: (0x23e9, 0x23f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK RIGHT-POINTING DOUBLE TRIANGLE..HOURGLASS WITH FLOWING SAND
- 0x23f4: (0x23f4, 0x23fa, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK MEDIUM LEFT-POINTING TRIANGLE..BLACK CIRCLE FOR RECORD
- 0x23fb: (0x23fb, 0x23fe, 0,0,0,0,0,0,0,0,0,1,0,0), #  POWER SYMBOL..POWER SLEEP SYMBOL
- 0x23ff: (0x23ff, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OBSERVER EYE SYMBOL
- 0x2400: (0x2400, 0x2424, 0,0,0,0,0,0,0,0,0,1,0,0), #  SYMBOL FOR NULL..SYMBOL FOR NEWLINE
- 0x2425: (0x2425, 0x2426, 0,0,0,0,0,0,0,0,0,1,0,0), #  SYMBOL FOR DELETE FORM TWO..SYMBOL FOR SUBSTITUTE FORM TWO
- 0x2440: (0x2440, 0x244a, 0,0,0,0,0,0,0,0,0,1,0,0), #  OCR HOOK..OCR DOUBLE BACKSLASH
- 0x2500: (0x2500, 0x2595, 0,0,0,0,0,0,0,0,0,1,0,0), #  BOX DRAWINGS LIGHT HORIZONTAL..RIGHT ONE EIGHTH BLOCK
- 0x2596: (0x2596, 0x259f, 0,0,0,0,0,0,0,0,0,1,0,0), #  QUADRANT LOWER LEFT..QUADRANT UPPER RIGHT AND LOWER LEFT AND LOWER RIGHT
- 0x25a0: (0x25a0, 0x25ef, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK SQUARE..LARGE CIRCLE
- 0x25f0: (0x25f0, 0x25f7, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE SQUARE WITH UPPER LEFT QUADRANT..WHITE CIRCLE WITH UPPER RIGHT QUADRANT
- 0x25f8: (0x25f8, 0x25ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPPER LEFT TRIANGLE..LOWER RIGHT TRIANGLE
- 0x2600: (0x2600, 0x2613, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK SUN WITH RAYS..SALTIRE
- 0x2614: (0x2614, 0x2615, 0,0,0,0,0,0,0,0,0,1,0,0), #  UMBRELLA WITH RAIN DROPS..HOT BEVERAGE
- 0x2616: (0x2616, 0x2617, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE SHOGI PIECE..BLACK SHOGI PIECE
- 0x2618: (0x2618, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SHAMROCK
- 0x2619: (0x2619, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REVERSED ROTATED FLORAL HEART BULLET
- 0x261a: (0x261a, 0x266f, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LEFT POINTING INDEX..MUSIC SHARP SIGN
- 0x2670: (0x2670, 0x2671, 0,0,0,0,0,0,0,0,0,1,0,0), #  WEST SYRIAC CROSS..EAST SYRIAC CROSS
- 0x2672: (0x2672, 0x267d, 0,0,0,0,0,0,0,0,0,1,0,0), #  UNIVERSAL RECYCLING SYMBOL..PARTIALLY-RECYCLED PAPER SYMBOL
- 0x267e: (0x267e, 0x267f, 0,0,0,0,0,0,0,0,0,1,0,0), #  PERMANENT PAPER SIGN..WHEELCHAIR SYMBOL
- 0x2680: (0x2680, 0x2689, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIE FACE-1..BLACK CIRCLE WITH TWO WHITE DOTS
- 0x268a: (0x268a, 0x2691, 0,0,0,0,0,0,0,0,0,1,0,0), #  MONOGRAM FOR YANG..BLACK FLAG
- 0x2692: (0x2692, 0x269c, 0,0,0,0,0,0,0,0,0,1,0,0), #  HAMMER AND PICK..FLEUR-DE-LIS
- 0x269d: (0x269d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OUTLINED WHITE STAR
- 0x269e: (0x269e, 0x269f, 0,0,0,0,0,0,0,0,0,1,0,0), #  THREE LINES CONVERGING RIGHT..THREE LINES CONVERGING LEFT
- 0x26a0: (0x26a0, 0x26a1, 0,0,0,0,0,0,0,0,0,1,0,0), #  WARNING SIGN..HIGH VOLTAGE SIGN
- 0x26a2: (0x26a2, 0x26b1, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOUBLED FEMALE SIGN..FUNERAL URN
- 0x26b2: (0x26b2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEUTER
- 0x26b3: (0x26b3, 0x26bc, 0,0,0,0,0,0,0,0,0,1,0,0), #  CERES..SESQUIQUADRATE
- 0x26bd: (0x26bd, 0x26bf, 0,0,0,0,0,0,0,0,0,1,0,0), #  SOCCER BALL..SQUARED KEY
- 0x26c0: (0x26c0, 0x26c3, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE DRAUGHTS MAN..BLACK DRAUGHTS KING
- 0x26c4: (0x26c4, 0x26cd, 0,0,0,0,0,0,0,0,0,1,0,0), #  SNOWMAN WITHOUT SNOW..DISABLED CAR
- 0x26ce: (0x26ce, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OPHIUCHUS
- 0x26cf: (0x26cf, 0x26e1, 0,0,0,0,0,0,0,0,0,1,0,0), #  PICK..RESTRICTED LEFT ENTRY-2
- 0x26e2: (0x26e2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ASTRONOMICAL SYMBOL FOR URANUS
- 0x26e3: (0x26e3, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY CIRCLE WITH STROKE AND TWO DOTS ABOVE
- 0x26e4: (0x26e4, 0x26e7, 0,0,0,0,0,0,0,0,0,1,0,0), #  PENTAGRAM..INVERTED PENTAGRAM
- 0x26e8: (0x26e8, 0x26ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK CROSS ON SHIELD..WHITE FLAG WITH HORIZONTAL MIDDLE BLACK STRIPE
- 0x2700: (0x2700, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK SAFETY SCISSORS
- 0x2701: (0x2701, 0x2704, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPPER BLADE SCISSORS..WHITE SCISSORS
- 0x2705: (0x2705, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE HEAVY CHECK MARK
- 0x2706: (0x2706, 0x2709, 0,0,0,0,0,0,0,0,0,1,0,0), #  TELEPHONE LOCATION SIGN..ENVELOPE
- 0x270a: (0x270a, 0x270b, 0,0,0,0,0,0,0,0,0,1,0,0), #  RAISED FIST..RAISED HAND
- 0x270c: (0x270c, 0x2727, 0,0,0,0,0,0,0,0,0,1,0,0), #  VICTORY HAND..WHITE FOUR POINTED STAR
- 0x2728: (0x2728, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SPARKLES
- 0x2729: (0x2729, 0x274b, 0,0,0,0,0,0,0,0,0,1,0,0), #  STRESS OUTLINED WHITE STAR..HEAVY EIGHT TEARDROP-SPOKED PROPELLER ASTERISK
- 0x274c: (0x274c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CROSS MARK
- 0x274d: (0x274d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SHADOWED WHITE CIRCLE
- 0x274e: (0x274e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED CROSS MARK
- 0x274f: (0x274f, 0x2752, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOWER RIGHT DROP-SHADOWED WHITE SQUARE..UPPER RIGHT SHADOWED WHITE SQUARE
- 0x2753: (0x2753, 0x2755, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK QUESTION MARK ORNAMENT..WHITE EXCLAMATION MARK ORNAMENT
- 0x2756: (0x2756, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK DIAMOND MINUS WHITE X
- 0x2757: (0x2757, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY EXCLAMATION MARK SYMBOL
- 0x2758: (0x2758, 0x275e, 0,0,0,0,0,0,0,0,0,1,0,0), #  LIGHT VERTICAL BAR..HEAVY DOUBLE COMMA QUOTATION MARK ORNAMENT
- 0x275f: (0x275f, 0x2760, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY LOW SINGLE COMMA QUOTATION MARK ORNAMENT..HEAVY LOW DOUBLE COMMA QUOTATION MARK ORNAMENT
- 0x2761: (0x2761, 0x2767, 0,0,0,0,0,0,0,0,0,1,0,0), #  CURVED STEM PARAGRAPH SIGN ORNAMENT..ROTATED FLORAL HEART BULLET
- 0x2768: (0x2768, 0x2775, 0,0,0,0,0,0,0,0,0,1,0,0), #  MEDIUM LEFT PARENTHESIS ORNAMENT..MEDIUM RIGHT CURLY BRACKET ORNAMENT
- 0x2776: (0x2776, 0x2794, 0,0,0,0,0,0,0,0,0,1,0,0), #  DINGBAT NEGATIVE CIRCLED DIGIT ONE..HEAVY WIDE-HEADED RIGHTWARDS ARROW
- 0x2795: (0x2795, 0x2797, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY PLUS SIGN..HEAVY DIVISION SIGN
- 0x2798: (0x2798, 0x27af, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY SOUTH EAST ARROW..NOTCHED LOWER RIGHT-SHADOWED WHITE RIGHTWARDS ARROW
- 0x27b0: (0x27b0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CURLY LOOP
- 0x27b1: (0x27b1, 0x27be, 0,0,0,0,0,0,0,0,0,1,0,0), #  NOTCHED UPPER RIGHT-SHADOWED WHITE RIGHTWARDS ARROW..OPEN-OUTLINED RIGHTWARDS ARROW
- 0x27bf: (0x27bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOUBLE CURLY LOOP
- 0x27c0: (0x27c0, 0x27c6, 0,0,0,0,0,0,0,0,0,1,0,0), #  THREE DIMENSIONAL ANGLE..RIGHT S-SHAPED BAG DELIMITER
- 0x27c7: (0x27c7, 0x27ca, 0,0,0,0,0,0,0,0,0,1,0,0), #  OR WITH DOT INSIDE..VERTICAL BAR WITH HORIZONTAL STROKE
- 0x27cb: (0x27cb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MATHEMATICAL RISING DIAGONAL
- 0x27cc: (0x27cc, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LONG DIVISION
- 0x27cd: (0x27cd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MATHEMATICAL FALLING DIAGONAL
- 0x27ce: (0x27ce, 0x27cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARED LOGICAL AND..SQUARED LOGICAL OR
- 0x27d0: (0x27d0, 0x27eb, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE DIAMOND WITH CENTRED DOT..MATHEMATICAL RIGHT DOUBLE ANGLE BRACKET
- 0x27ec: (0x27ec, 0x27ef, 0,0,0,0,0,0,0,0,0,1,0,0), #  MATHEMATICAL LEFT WHITE TORTOISE SHELL BRACKET..MATHEMATICAL RIGHT FLATTENED PARENTHESIS
- 0x27f0: (0x27f0, 0x27ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPWARDS QUADRUPLE ARROW..LONG RIGHTWARDS SQUIGGLE ARROW
- 0x2900: (0x2900, 0x2a0b, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHTWARDS TWO-HEADED ARROW WITH VERTICAL STROKE..SUMMATION WITH INTEGRAL
- 0x2a0d: (0x2a0d, 0x2a73, 0,0,0,0,0,0,0,0,0,1,0,0), #  FINITE PART INTEGRAL..EQUALS SIGN ABOVE TILDE OPERATOR
- 0x2a77: (0x2a77, 0x2adb, 0,0,0,0,0,0,0,0,0,1,0,0), #  EQUALS SIGN WITH TWO DOTS ABOVE AND TWO DOTS BELOW..TRANSVERSAL INTERSECTION
- 0x2add: (0x2add, 0x2aff, 0,0,0,0,0,0,0,0,0,1,0,0), #  NONFORKING..N-ARY WHITE VERTICAL BAR
- 0x2b00: (0x2b00, 0x2b0d, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH EAST WHITE ARROW..UP DOWN BLACK ARROW
- 0x2b0e: (0x2b0e, 0x2b13, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHTWARDS ARROW WITH TIP DOWNWARDS..SQUARE WITH BOTTOM HALF BLACK
- 0x2b14: (0x2b14, 0x2b1a, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARE WITH UPPER RIGHT DIAGONAL HALF BLACK..DOTTED SQUARE
- 0x2b1b: (0x2b1b, 0x2b1f, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LARGE SQUARE..BLACK PENTAGON
- 0x2b20: (0x2b20, 0x2b23, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE PENTAGON..HORIZONTAL BLACK HEXAGON
- 0x2b24: (0x2b24, 0x2b4c, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LARGE CIRCLE..RIGHTWARDS ARROW ABOVE REVERSE TILDE OPERATOR
- 0x2b4d: (0x2b4d, 0x2b4f, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOWNWARDS TRIANGLE-HEADED ZIGZAG ARROW..SHORT BACKSLANTED SOUTH ARROW
- 0x2b50: (0x2b50, 0x2b54, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE MEDIUM STAR..WHITE RIGHT-POINTING PENTAGON
- 0x2b55: (0x2b55, 0x2b59, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY LARGE CIRCLE..HEAVY CIRCLED SALTIRE
- 0x2b5a: (0x2b5a, 0x2b73, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLANTED NORTH ARROW WITH HOOKED HEAD..DOWNWARDS TRIANGLE-HEADED ARROW TO BAR
- 0x2b76: (0x2b76, 0x2b95, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH WEST TRIANGLE-HEADED ARROW TO BAR..RIGHTWARDS BLACK ARROW
- 0x2b98: (0x2b98, 0x2bb9, 0,0,0,0,0,0,0,0,0,1,0,0), #  THREE-D TOP-LIGHTED LEFTWARDS EQUILATERAL ARROWHEAD..UP ARROWHEAD IN A RECTANGLE BOX
- 0x2bba: (0x2bba, 0x2bbc, 0,0,0,0,0,0,0,0,0,1,0,0), #  OVERLAPPING WHITE SQUARES..OVERLAPPING BLACK SQUARES
- 0x2bbd: (0x2bbd, 0x2bc8, 0,0,0,0,0,0,0,0,0,1,0,0), #  BALLOT BOX WITH LIGHT X..BLACK MEDIUM RIGHT-POINTING TRIANGLE CENTRED
- 0x2bca: (0x2bca, 0x2bd1, 0,0,0,0,0,0,0,0,0,1,0,0), #  TOP HALF BLACK CIRCLE..UNCERTAINTY SIGN
- 0x2bd2: (0x2bd2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GROUP MARK
- 0x2bd3: (0x2bd3, 0x2beb, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLUTO FORM TWO..STAR WITH RIGHT HALF BLACK
- 0x2bf0: (0x2bf0, 0x2bfe, 0,0,0,0,0,0,0,0,0,1,0,0), #  ERIS FORM ONE..REVERSED RIGHT ANGLE
- 0x2e17: (0x2e17, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOUBLE OBLIQUE HYPHEN
- 0x2e18: (0x2e18, 0x2e1b, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED INTERROBANG..TILDE WITH RING ABOVE
- 0x2e1c: (0x2e1c, 0x2e1d, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT LOW PARAPHRASE BRACKET..RIGHT LOW PARAPHRASE BRACKET
- 0x2e1e: (0x2e1e, 0x2e29, 0,0,0,0,0,0,0,0,0,1,0,0), #  TILDE WITH DOT ABOVE..RIGHT DOUBLE PARENTHESIS
- 0x2e33: (0x2e33, 0x2e34, 0,0,0,0,0,0,0,0,0,1,0,0), #  RAISED DOT..RAISED COMMA
- 0x2e36: (0x2e36, 0x2e38, 0,0,0,0,0,0,0,0,0,1,0,0), #  DAGGER WITH LEFT GUARD..TURNED DAGGER
- 0x2e3a: (0x2e3a, 0x2e3b, 0,0,0,0,0,0,0,0,0,1,0,0), #  TWO-EM DASH..THREE-EM DASH
- 0x2e3c: (0x2e3c, 0x2e42, 0,0,0,0,0,0,0,0,0,1,0,0), #  STENOGRAPHIC FULL STOP..DOUBLE LOW-REVERSED-9 QUOTATION MARK
- 0x2e43: (0x2e43, 0x2e44, 0,0,0,0,0,0,0,0,0,1,0,0), #  DASH WITH LEFT UPTURN..DOUBLE SUSPENSION MARK
- 0x2e45: (0x2e45, 0x2e49, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED LOW KAVYKA..DOUBLE STACKED COMMA
- 0x2e4a: (0x2e4a, 0x2e4e, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOTTED SOLIDUS..PUNCTUS ELEVATUS MARK
- 0x2e80: (0x2e80, 0x2e99, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK RADICAL REPEAT..CJK RADICAL RAP
- 0x2e9b: (0x2e9b, 0x2e9e, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK RADICAL CHOKE..CJK RADICAL DEATH
- 0x2ea0: (0x2ea0, 0x2ef2, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK RADICAL CIVILIAN..CJK RADICAL J-SIMPLIFIED TURTLE
- 0x2ff0: (0x2ff0, 0x2ffb, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC DESCRIPTION CHARACTER LEFT TO RIGHT..IDEOGRAPHIC DESCRIPTION CHARACTER OVERLAID
- 0x3001: (0x3001, 0x3004, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC COMMA..JAPANESE INDUSTRIAL STANDARD SYMBOL
- 0x3008: (0x3008, 0x301d, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT ANGLE BRACKET..REVERSED DOUBLE PRIME QUOTATION MARK
- 0x301f: (0x301f, 0x3020, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOW DOUBLE PRIME QUOTATION MARK..POSTAL MARK FACE
- 0x3030: (0x3030, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  WAVY DASH
- 0x3037: (0x3037, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC TELEGRAPH LINE FEED SEPARATOR SYMBOL
- 0x303d: (0x303d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PART ALTERNATION MARK
- 0x303e: (0x303e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC VARIATION INDICATOR
- 0x303f: (0x303f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC HALF FILL SPACE
- 0x3190: (0x3190, 0x3191, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC ANNOTATION LINKING MARK..IDEOGRAPHIC ANNOTATION REVERSE MARK
- 0x31c0: (0x31c0, 0x31cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK STROKE T..CJK STROKE N
- 0x31d0: (0x31d0, 0x31e3, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK STROKE H..CJK STROKE Q
- 0x3248: (0x3248, 0x324f, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED NUMBER TEN ON BLACK SQUARE..CIRCLED NUMBER EIGHTY ON BLACK SQUARE
- 0xa67e: (0xa67e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CYRILLIC KAVYKA
- 0xa720: (0xa720, 0xa721, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER STRESS AND HIGH TONE..MODIFIER LETTER STRESS AND LOW TONE
- 0xa789: (0xa789, 0xa78a, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER COLON..MODIFIER LETTER SHORT EQUALS SIGN
- 0xa830: (0xa830, 0xa839, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH INDIC FRACTION ONE QUARTER..NORTH INDIC QUANTITY MARK
- 0xa92e: (0xa92e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KAYAH LI SIGN CWI
- 0xaa77: (0xaa77, 0xaa79, 0,0,0,0,0,0,0,0,0,1,0,0), #  MYANMAR SYMBOL AITON EXCLAMATION..MYANMAR SYMBOL AITON TWO
- 0xab5b: (0xab5b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER BREVE WITH INVERTED BREVE
- 0xfff9: (0xfff9, 0xfffb, 0,0,0,0,0,0,0,0,0,1,0,0), #  INTERLINEAR ANNOTATION ANCHOR..INTERLINEAR ANNOTATION TERMINATOR
- 0xfffc: (0xfffc, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OBJECT REPLACEMENT CHARACTER
- 0xfffd: (0xfffd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REPLACEMENT CHARACTER
- 0x10175: (0x10175, 0x1018a, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK ONE HALF SIGN..GREEK ZERO SIGN
- 0x1018b: (0x1018b, 0x1018c, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK ONE QUARTER SIGN..GREEK SINUSOID SIGN
- 0x1018d: (0x1018d, 0x1018e, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK INDICTION SIGN..NOMISMA SIGN
- 0x10190: (0x10190, 0x1019b, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROMAN SEXTANS SIGN..ROMAN CENTURIAL SIGN
- 0x101a0: (0x101a0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK SYMBOL TAU RHO
- 0x102e1: (0x102e1, 0x102fb, 0,0,0,0,0,0,0,0,0,1,0,0), #  COPTIC EPACT DIGIT ONE..COPTIC EPACT NUMBER NINE HUNDRED
- 0x10e60: (0x10e60, 0x10e7e, 0,0,0,0,0,0,0,0,0,1,0,0), #  RUMI DIGIT ONE..RUMI FRACTION TWO THIRDS
- 0x111e1: (0x111e1, 0x111f4, 0,0,0,0,0,0,0,0,0,1,0,0), #  SINHALA ARCHAIC DIGIT ONE..SINHALA ARCHAIC NUMBER ONE THOUSAND
- 0x1d2e0: (0x1d2e0, 0x1d2f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  MAYAN NUMERAL ZERO..MAYAN NUMERAL NINETEEN
- 0x1d360: (0x1d360, 0x1d371, 0,0,0,0,0,0,0,0,0,1,0,0), #  COUNTING ROD UNIT DIGIT ONE..COUNTING ROD TENS DIGIT NINE
- 0x1d372: (0x1d372, 0x1d378, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC TALLY MARK ONE..TALLY MARK FIVE
- 0x1ec71: (0x1ec71, 0x1ecb4, 0,0,0,0,0,0,0,0,0,1,0,0), #  INDIC SIYAQ NUMBER ONE..INDIC SIYAQ ALTERNATE LAKH MARK
- 0x1eef0: (0x1eef0, 0x1eef1, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC MATHEMATICAL OPERATOR MEEM WITH HAH WITH TATWEEL..ARABIC MATHEMATICAL OPERATOR HAH WITH DAL
- 0x1f000: (0x1f000, 0x1f02b, 0,0,0,0,0,0,0,0,0,1,0,0), #  MAHJONG TILE EAST WIND..MAHJONG TILE BACK
- 0x1f030: (0x1f030, 0x1f093, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOMINO TILE HORIZONTAL BACK..DOMINO TILE VERTICAL-06-06
- 0x1f0a0: (0x1f0a0, 0x1f0ae, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD BACK..PLAYING CARD KING OF SPADES
- 0x1f0b1: (0x1f0b1, 0x1f0be, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD ACE OF HEARTS..PLAYING CARD KING OF HEARTS
- 0x1f0bf: (0x1f0bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD RED JOKER
- 0x1f0c1: (0x1f0c1, 0x1f0cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD ACE OF DIAMONDS..PLAYING CARD BLACK JOKER
- 0x1f0d1: (0x1f0d1, 0x1f0df, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD ACE OF CLUBS..PLAYING CARD WHITE JOKER
- 0x1f0e0: (0x1f0e0, 0x1f0f5, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD FOOL..PLAYING CARD TRUMP-21
- 0x1f10b: (0x1f10b, 0x1f10c, 0,0,0,0,0,0,0,0,0,1,0,0), #  DINGBAT CIRCLED SANS-SERIF DIGIT ZERO..DINGBAT NEGATIVE CIRCLED SANS-SERIF DIGIT ZERO
- 0x1f12f: (0x1f12f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  COPYLEFT SYMBOL
- 0x1f150: (0x1f150, 0x1f156, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER A..NEGATIVE CIRCLED LATIN CAPITAL LETTER G
- 0x1f157: (0x1f157, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER H
- 0x1f158: (0x1f158, 0x1f15e, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER I..NEGATIVE CIRCLED LATIN CAPITAL LETTER O
- 0x1f15f: (0x1f15f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER P
- 0x1f160: (0x1f160, 0x1f169, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER Q..NEGATIVE CIRCLED LATIN CAPITAL LETTER Z
- 0x1f170: (0x1f170, 0x1f178, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER A..NEGATIVE SQUARED LATIN CAPITAL LETTER I
- 0x1f179: (0x1f179, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER J
- 0x1f17a: (0x1f17a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER K
- 0x1f17b: (0x1f17b, 0x1f17c, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER L..NEGATIVE SQUARED LATIN CAPITAL LETTER M
- 0x1f17d: (0x1f17d, 0x1f17e, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER N..NEGATIVE SQUARED LATIN CAPITAL LETTER O
- 0x1f17f: (0x1f17f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER P
- 0x1f180: (0x1f180, 0x1f189, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER Q..NEGATIVE SQUARED LATIN CAPITAL LETTER Z
- 0x1f18a: (0x1f18a, 0x1f18d, 0,0,0,0,0,0,0,0,0,1,0,0), #  CROSSED NEGATIVE SQUARED LATIN CAPITAL LETTER P..NEGATIVE SQUARED SA
- 0x1f18e: (0x1f18e, 0x1f18f, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED AB..NEGATIVE SQUARED WC
- 0x1f191: (0x1f191, 0x1f19a, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARED CL..SQUARED VS
- 0x1f19b: (0x1f19b, 0x1f1ac, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARED THREE D..SQUARED VOD
- 0x1f1e6: (0x1f1e6, 0x1f1ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  REGIONAL INDICATOR SYMBOL LETTER A..REGIONAL INDICATOR SYMBOL LETTER Z
- 0x1f260: (0x1f260, 0x1f265, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROUNDED SYMBOL FOR FU..ROUNDED SYMBOL FOR CAI
- 0x1f300: (0x1f300, 0x1f320, 0,0,0,0,0,0,0,0,0,1,0,0), #  CYCLONE..SHOOTING STAR
- 0x1f321: (0x1f321, 0x1f32c, 0,0,0,0,0,0,0,0,0,1,0,0), #  THERMOMETER..WIND BLOWING FACE
- 0x1f32d: (0x1f32d, 0x1f32f, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOT DOG..BURRITO
- 0x1f330: (0x1f330, 0x1f335, 0,0,0,0,0,0,0,0,0,1,0,0), #  CHESTNUT..CACTUS
- 0x1f336: (0x1f336, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOT PEPPER
- 0x1f337: (0x1f337, 0x1f37c, 0,0,0,0,0,0,0,0,0,1,0,0), #  TULIP..BABY BOTTLE
- 0x1f37d: (0x1f37d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FORK AND KNIFE WITH PLATE
- 0x1f37e: (0x1f37e, 0x1f37f, 0,0,0,0,0,0,0,0,0,1,0,0), #  BOTTLE WITH POPPING CORK..POPCORN
- 0x1f380: (0x1f380, 0x1f393, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIBBON..GRADUATION CAP
- 0x1f394: (0x1f394, 0x1f39f, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEART WITH TIP ON THE LEFT..ADMISSION TICKETS
- 0x1f3a0: (0x1f3a0, 0x1f3c4, 0,0,0,0,0,0,0,0,0,1,0,0), #  CAROUSEL HORSE..SURFER
- 0x1f3c5: (0x1f3c5, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SPORTS MEDAL
- 0x1f3c6: (0x1f3c6, 0x1f3ca, 0,0,0,0,0,0,0,0,0,1,0,0), #  TROPHY..SWIMMER
- 0x1f3cb: (0x1f3cb, 0x1f3ce, 0,0,0,0,0,0,0,0,0,1,0,0), #  WEIGHT LIFTER..RACING CAR
- 0x1f3cf: (0x1f3cf, 0x1f3d3, 0,0,0,0,0,0,0,0,0,1,0,0), #  CRICKET BAT AND BALL..TABLE TENNIS PADDLE AND BALL
- 0x1f3d4: (0x1f3d4, 0x1f3df, 0,0,0,0,0,0,0,0,0,1,0,0), #  SNOW CAPPED MOUNTAIN..STADIUM
- 0x1f3e0: (0x1f3e0, 0x1f3f0, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOUSE BUILDING..EUROPEAN CASTLE
- 0x1f3f1: (0x1f3f1, 0x1f3f7, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE PENNANT..LABEL
- 0x1f3f8: (0x1f3f8, 0x1f3ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  BADMINTON RACQUET AND SHUTTLECOCK..EMOJI MODIFIER FITZPATRICK TYPE-6
- 0x1f400: (0x1f400, 0x1f43e, 0,0,0,0,0,0,0,0,0,1,0,0), #  RAT..PAW PRINTS
- 0x1f43f: (0x1f43f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CHIPMUNK
- 0x1f440: (0x1f440, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EYES
- 0x1f441: (0x1f441, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EYE
- 0x1f442: (0x1f442, 0x1f4f7, 0,0,0,0,0,0,0,0,0,1,0,0), #  EAR..CAMERA
- 0x1f4f8: (0x1f4f8, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CAMERA WITH FLASH
- 0x1f4f9: (0x1f4f9, 0x1f4fc, 0,0,0,0,0,0,0,0,0,1,0,0), #  VIDEO CAMERA..VIDEOCASSETTE
- 0x1f4fd: (0x1f4fd, 0x1f4fe, 0,0,0,0,0,0,0,0,0,1,0,0), #  FILM PROJECTOR..PORTABLE STEREO
- 0x1f4ff: (0x1f4ff, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PRAYER BEADS
- 0x1f500: (0x1f500, 0x1f53d, 0,0,0,0,0,0,0,0,0,1,0,0), #  TWISTED RIGHTWARDS ARROWS..DOWN-POINTING SMALL RED TRIANGLE
- 0x1f53e: (0x1f53e, 0x1f53f, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOWER RIGHT SHADOWED WHITE CIRCLE..UPPER RIGHT SHADOWED WHITE CIRCLE
- 0x1f540: (0x1f540, 0x1f543, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED CROSS POMMEE..NOTCHED LEFT SEMICIRCLE WITH THREE DOTS
- 0x1f544: (0x1f544, 0x1f54a, 0,0,0,0,0,0,0,0,0,1,0,0), #  NOTCHED RIGHT SEMICIRCLE WITH THREE DOTS..DOVE OF PEACE
- 0x1f54b: (0x1f54b, 0x1f54e, 0,0,0,0,0,0,0,0,0,1,0,0), #  KAABA..MENORAH WITH NINE BRANCHES
- 0x1f550: (0x1f550, 0x1f567, 0,0,0,0,0,0,0,0,0,1,0,0), #  CLOCK FACE ONE OCLOCK..CLOCK FACE TWELVE-THIRTY
- 0x1f568: (0x1f568, 0x1f579, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT SPEAKER..JOYSTICK
- 0x1f57a: (0x1f57a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MAN DANCING
- 0x1f57b: (0x1f57b, 0x1f5a3, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT HAND TELEPHONE RECEIVER..BLACK DOWN POINTING BACKHAND INDEX
- 0x1f5a4: (0x1f5a4, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK HEART
- 0x1f5a5: (0x1f5a5, 0x1f5fa, 0,0,0,0,0,0,0,0,0,1,0,0), #  DESKTOP COMPUTER..WORLD MAP
- 0x1f5fb: (0x1f5fb, 0x1f5ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  MOUNT FUJI..MOYAI
- 0x1f600: (0x1f600, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRINNING FACE
- 0x1f601: (0x1f601, 0x1f610, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRINNING FACE WITH SMILING EYES..NEUTRAL FACE
- 0x1f611: (0x1f611, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EXPRESSIONLESS FACE
- 0x1f612: (0x1f612, 0x1f614, 0,0,0,0,0,0,0,0,0,1,0,0), #  UNAMUSED FACE..PENSIVE FACE
- 0x1f615: (0x1f615, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CONFUSED FACE
- 0x1f616: (0x1f616, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CONFOUNDED FACE
- 0x1f617: (0x1f617, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KISSING FACE
- 0x1f618: (0x1f618, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE THROWING A KISS
- 0x1f619: (0x1f619, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KISSING FACE WITH SMILING EYES
- 0x1f61a: (0x1f61a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KISSING FACE WITH CLOSED EYES
- 0x1f61b: (0x1f61b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH STUCK-OUT TONGUE
- 0x1f61c: (0x1f61c, 0x1f61e, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH STUCK-OUT TONGUE AND WINKING EYE..DISAPPOINTED FACE
- 0x1f61f: (0x1f61f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  WORRIED FACE
- 0x1f620: (0x1f620, 0x1f625, 0,0,0,0,0,0,0,0,0,1,0,0), #  ANGRY FACE..DISAPPOINTED BUT RELIEVED FACE
- 0x1f626: (0x1f626, 0x1f627, 0,0,0,0,0,0,0,0,0,1,0,0), #  FROWNING FACE WITH OPEN MOUTH..ANGUISHED FACE
- 0x1f628: (0x1f628, 0x1f62b, 0,0,0,0,0,0,0,0,0,1,0,0), #  FEARFUL FACE..TIRED FACE
- 0x1f62c: (0x1f62c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRIMACING FACE
- 0x1f62d: (0x1f62d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOUDLY CRYING FACE
- 0x1f62e: (0x1f62e, 0x1f62f, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH OPEN MOUTH..HUSHED FACE
- 0x1f630: (0x1f630, 0x1f633, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH OPEN MOUTH AND COLD SWEAT..FLUSHED FACE
- 0x1f634: (0x1f634, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLEEPING FACE
- 0x1f635: (0x1f635, 0x1f640, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIZZY FACE..WEARY CAT FACE
- 0x1f641: (0x1f641, 0x1f642, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLIGHTLY FROWNING FACE..SLIGHTLY SMILING FACE
- 0x1f643: (0x1f643, 0x1f644, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPSIDE-DOWN FACE..FACE WITH ROLLING EYES
- 0x1f645: (0x1f645, 0x1f64f, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH NO GOOD GESTURE..PERSON WITH FOLDED HANDS
- 0x1f650: (0x1f650, 0x1f67f, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH WEST POINTING LEAF..REVERSE CHECKER BOARD
- 0x1f680: (0x1f680, 0x1f6c5, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROCKET..LEFT LUGGAGE
- 0x1f6c6: (0x1f6c6, 0x1f6cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  TRIANGLE WITH ROUNDED CORNERS..BED
- 0x1f6d0: (0x1f6d0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLACE OF WORSHIP
- 0x1f6d1: (0x1f6d1, 0x1f6d2, 0,0,0,0,0,0,0,0,0,1,0,0), #  OCTAGONAL SIGN..SHOPPING TROLLEY
- 0x1f6d3: (0x1f6d3, 0x1f6d4, 0,0,0,0,0,0,0,0,0,1,0,0), #  STUPA..PAGODA
- 0x1f6e0: (0x1f6e0, 0x1f6ec, 0,0,0,0,0,0,0,0,0,1,0,0), #  HAMMER AND WRENCH..AIRPLANE ARRIVING
- 0x1f6f0: (0x1f6f0, 0x1f6f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  SATELLITE..PASSENGER SHIP
- 0x1f6f4: (0x1f6f4, 0x1f6f6, 0,0,0,0,0,0,0,0,0,1,0,0), #  SCOOTER..CANOE
- 0x1f6f7: (0x1f6f7, 0x1f6f8, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLED..FLYING SAUCER
- 0x1f6f9: (0x1f6f9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SKATEBOARD
- 0x1f700: (0x1f700, 0x1f773, 0,0,0,0,0,0,0,0,0,1,0,0), #  ALCHEMICAL SYMBOL FOR QUINTESSENCE..ALCHEMICAL SYMBOL FOR HALF OUNCE
- 0x1f780: (0x1f780, 0x1f7d4, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LEFT-POINTING ISOSCELES RIGHT TRIANGLE..HEAVY TWELVE POINTED PINWHEEL STAR
- 0x1f7d5: (0x1f7d5, 0x1f7d8, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED TRIANGLE..NEGATIVE CIRCLED SQUARE
- 0x1f800: (0x1f800, 0x1f80b, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS ARROW WITH SMALL TRIANGLE ARROWHEAD..DOWNWARDS ARROW WITH LARGE TRIANGLE ARROWHEAD
- 0x1f810: (0x1f810, 0x1f847, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS ARROW WITH SMALL EQUILATERAL ARROWHEAD..DOWNWARDS HEAVY ARROW
- 0x1f850: (0x1f850, 0x1f859, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS SANS-SERIF ARROW..UP DOWN SANS-SERIF ARROW
- 0x1f860: (0x1f860, 0x1f887, 0,0,0,0,0,0,0,0,0,1,0,0), #  WIDE-HEADED LEFTWARDS LIGHT BARB ARROW..WIDE-HEADED SOUTH WEST VERY HEAVY BARB ARROW
- 0x1f890: (0x1f890, 0x1f8ad, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS TRIANGLE ARROWHEAD..WHITE ARROW SHAFT WIDTH TWO THIRDS
- 0x1f900: (0x1f900, 0x1f90b, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED CROSS FORMEE WITH FOUR DOTS..DOWNWARD FACING NOTCHED HOOK WITH DOT
- 0x1f910: (0x1f910, 0x1f918, 0,0,0,0,0,0,0,0,0,1,0,0), #  ZIPPER-MOUTH FACE..SIGN OF THE HORNS
- 0x1f919: (0x1f919, 0x1f91e, 0,0,0,0,0,0,0,0,0,1,0,0), #  CALL ME HAND..HAND WITH INDEX AND MIDDLE FINGERS CROSSED
- 0x1f91f: (0x1f91f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  I LOVE YOU HAND SIGN
- 0x1f920: (0x1f920, 0x1f927, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH COWBOY HAT..SNEEZING FACE
- 0x1f928: (0x1f928, 0x1f92f, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH ONE EYEBROW RAISED..SHOCKED FACE WITH EXPLODING HEAD
- 0x1f930: (0x1f930, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PREGNANT WOMAN
- 0x1f931: (0x1f931, 0x1f932, 0,0,0,0,0,0,0,0,0,1,0,0), #  BREAST-FEEDING..PALMS UP TOGETHER
- 0x1f933: (0x1f933, 0x1f93e, 0,0,0,0,0,0,0,0,0,1,0,0), #  SELFIE..HANDBALL
- 0x1f940: (0x1f940, 0x1f94b, 0,0,0,0,0,0,0,0,0,1,0,0), #  WILTED FLOWER..MARTIAL ARTS UNIFORM
- 0x1f94c: (0x1f94c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CURLING STONE
- 0x1f94d: (0x1f94d, 0x1f94f, 0,0,0,0,0,0,0,0,0,1,0,0), #  LACROSSE STICK AND BALL..FLYING DISC
- 0x1f950: (0x1f950, 0x1f95e, 0,0,0,0,0,0,0,0,0,1,0,0), #  CROISSANT..PANCAKES
- 0x1f95f: (0x1f95f, 0x1f96b, 0,0,0,0,0,0,0,0,0,1,0,0), #  DUMPLING..CANNED FOOD
- 0x1f96c: (0x1f96c, 0x1f970, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEAFY GREEN..SMILING FACE WITH SMILING EYES AND THREE HEARTS
- 0x1f973: (0x1f973, 0x1f976, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH PARTY HORN AND PARTY HAT..FREEZING FACE
- 0x1f97a: (0x1f97a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH PLEADING EYES
- 0x1f97c: (0x1f97c, 0x1f97f, 0,0,0,0,0,0,0,0,0,1,0,0), #  LAB COAT..FLAT SHOE
- 0x1f980: (0x1f980, 0x1f984, 0,0,0,0,0,0,0,0,0,1,0,0), #  CRAB..UNICORN FACE
- 0x1f985: (0x1f985, 0x1f991, 0,0,0,0,0,0,0,0,0,1,0,0), #  EAGLE..SQUID
- 0x1f992: (0x1f992, 0x1f997, 0,0,0,0,0,0,0,0,0,1,0,0), #  GIRAFFE FACE..CRICKET
- 0x1f998: (0x1f998, 0x1f9a2, 0,0,0,0,0,0,0,0,0,1,0,0), #  KANGAROO..SWAN
- 0x1f9b0: (0x1f9b0, 0x1f9b9, 0,0,0,0,0,0,0,0,0,1,0,0), #  EMOJI COMPONENT RED HAIR..SUPERVILLAIN
- 0x1f9c0: (0x1f9c0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CHEESE WEDGE
- 0x1f9c1: (0x1f9c1, 0x1f9c2, 0,0,0,0,0,0,0,0,0,1,0,0), #  CUPCAKE..SALT SHAKER
- 0x1f9d0: (0x1f9d0, 0x1f9e6, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH MONOCLE..SOCKS
- 0x1f9e7: (0x1f9e7, 0x1f9ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  RED GIFT ENVELOPE..NAZAR AMULET
- 0x1fa60: (0x1fa60, 0x1fa6d, 0,0,0,0,0,0,0,0,0,1,0,0), #  XIANGQI RED GENERAL..XIANGQI BLACK SOLDIER
- 0x00a0: (0x00a0, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NO-BREAK SPACE
- 0x00a8: (0x00a8, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DIAERESIS
- 0x00af: (0x00af, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  MACRON
- 0x00b2: (0x00b2, 0x00b4, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUPERSCRIPT TWO..ACUTE ACCENT
- 0x00b8: (0x00b8, 0x00b9, 0,0,0,0,0,0,0,0,1,1,0,0), #  CEDILLA..SUPERSCRIPT ONE
- 0x00bc: (0x00bc, 0x00be, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ONE QUARTER..VULGAR FRACTION THREE QUARTERS
- 0x02d8: (0x02d8, 0x02dd, 0,0,0,0,0,0,0,0,1,1,0,0), #  BREVE..DOUBLE ACUTE ACCENT
- 0x037a: (0x037a, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK YPOGEGRAMMENI
- 0x037e: (0x037e, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK QUESTION MARK
- 0x0384: (0x0384, 0x0385, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK TONOS..GREEK DIALYTIKA TONOS
- 0x0f0c: (0x0f0c, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  TIBETAN MARK DELIMITER TSHEG BSTAR
- 0x1fbd: (0x1fbd, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK KORONIS
- 0x1fbf: (0x1fbf, 0x1fc1, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK PSILI..GREEK DIALYTIKA AND PERISPOMENI
- 0x1fcd: (0x1fcd, 0x1fcf, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK PSILI AND VARIA..GREEK PSILI AND PERISPOMENI
- 0x1fdd: (0x1fdd, 0x1fdf, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK DASIA AND VARIA..GREEK DASIA AND PERISPOMENI
- 0x1fed: (0x1fed, 0x1fef, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK DIALYTIKA AND VARIA..GREEK VARIA
- 0x1ffd: (0x1ffd, 0x1ffe, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK OXIA..GREEK DASIA
- 0x2000: (0x2000, 0x200a, 0,0,0,0,0,0,0,0,1,1,0,0), #  EN QUAD..HAIR SPACE
- 0x2011: (0x2011, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NON-BREAKING HYPHEN
- 0x2017: (0x2017, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE LOW LINE
- 0x2024: (0x2024, 0x2026, 0,0,0,0,0,0,0,0,1,1,0,0), #  ONE DOT LEADER..HORIZONTAL ELLIPSIS
- 0x202f: (0x202f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NARROW NO-BREAK SPACE
- 0x2033: (0x2033, 0x2034, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE PRIME..TRIPLE PRIME
- 0x2036: (0x2036, 0x2037, 0,0,0,0,0,0,0,0,1,1,0,0), #  REVERSED DOUBLE PRIME..REVERSED TRIPLE PRIME
- 0x203c: (0x203c, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE EXCLAMATION MARK
- 0x203e: (0x203e, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  OVERLINE
- 0x2047: (0x2047, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE QUESTION MARK
- 0x2048: (0x2048, 0x2049, 0,0,0,0,0,0,0,0,1,1,0,0), #  QUESTION EXCLAMATION MARK..EXCLAMATION QUESTION MARK
- 0x2057: (0x2057, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  QUADRUPLE PRIME
- 0x205f: (0x205f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  MEDIUM MATHEMATICAL SPACE
- 0x2070: (0x2070, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUPERSCRIPT ZERO
- 0x2074: (0x2074, 0x207e, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUPERSCRIPT FOUR..SUPERSCRIPT RIGHT PARENTHESIS
- 0x2080: (0x2080, 0x208e, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUBSCRIPT ZERO..SUBSCRIPT RIGHT PARENTHESIS
- 0x20a8: (0x20a8, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  RUPEE SIGN
- 0x2100: (0x2100, 0x2101, 0,0,0,0,0,0,0,0,1,1,0,0), #  ACCOUNT OF..ADDRESSED TO THE SUBJECT
- 0x2103: (0x2103, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DEGREE CELSIUS
- 0x2105: (0x2105, 0x2106, 0,0,0,0,0,0,0,0,1,1,0,0), #  CARE OF..CADA UNA
- 0x2109: (0x2109, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DEGREE FAHRENHEIT
- 0x2116: (0x2116, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NUMERO SIGN
- 0x2120: (0x2120, 0x2122, 0,0,0,0,0,0,0,0,1,1,0,0), #  SERVICE MARK..TRADE MARK SIGN
- 0x213b: (0x213b, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  FACSIMILE SIGN
- 0x2140: (0x2140, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE-STRUCK N-ARY SUMMATION
- 0x2150: (0x2150, 0x2152, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ONE SEVENTH..VULGAR FRACTION ONE TENTH
- 0x2153: (0x2153, 0x215f, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ONE THIRD..FRACTION NUMERATOR ONE
- 0x2189: (0x2189, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ZERO THIRDS
- 0x222c: (0x222c, 0x222d, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE INTEGRAL..TRIPLE INTEGRAL
- 0x222f: (0x222f, 0x2230, 0,0,0,0,0,0,0,0,1,1,0,0), #  SURFACE INTEGRAL..VOLUME INTEGRAL
- 0x2a0c: (0x2a0c, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  QUADRUPLE INTEGRAL OPERATOR
- 0x2a74: (0x2a74, 0x2a76, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE COLON EQUAL..THREE CONSECUTIVE EQUALS SIGNS
- 0x2adc: (0x2adc, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  FORKING
- 0x2e9f: (0x2e9f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  CJK RADICAL MOTHER
- 0x2ef3: (0x2ef3, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  CJK RADICAL C-SIMPLIFIED TURTLE
- 0x2f00: (0x2f00, 0x2fd5, 0,0,0,0,0,0,0,0,1,1,0,0), #  KANGXI RADICAL ONE..KANGXI RADICAL FLUTE
- 0x3000: (0x3000, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC SPACE
- 0x3036: (0x3036, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  CIRCLED POSTAL MARK
- 0x309b: (0x309b, 0x309c, 0,0,0,0,0,0,0,0,1,1,0,0), #  KATAKANA-HIRAGANA VOICED SOUND MARK..KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK
- 0x3192: (0x3192, 0x319f, 0,0,0,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC ANNOTATION ONE MARK..IDEOGRAPHIC ANNOTATION MAN MARK
- 0x3220: (0x3220, 0x3243, 0,0,0,0,0,0,0,0,1,1,0,0), #  PARENTHESIZED IDEOGRAPH ONE..PARENTHESIZED IDEOGRAPH REACH
- 0x3244: (0x3244, 0x3247, 0,0,0,0,0,0,0,0,1,1,0,0), #  CIRCLED IDEOGRAPH QUESTION..CIRCLED IDEOGRAPH KOTO
- 0x3250: (0x3250, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  PARTNERSHIP SIGN
- 0xff01: (0xff01, 0xff0f, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH EXCLAMATION MARK..FULLWIDTH SOLIDUS
- 0xff1a: (0xff1a, 0xff20, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH COLON..FULLWIDTH COMMERCIAL AT
- 0xff3b: (0xff3b, 0xff3e, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH LEFT SQUARE BRACKET..FULLWIDTH CIRCUMFLEX ACCENT
- 0xff40: (0xff40, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH GRAVE ACCENT
- 0xff5b: (0xff5b, 0xff5e, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH LEFT CURLY BRACKET..FULLWIDTH TILDE
- 0xff5f: (0xff5f, 0xff60, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH LEFT WHITE PARENTHESIS..FULLWIDTH RIGHT WHITE PARENTHESIS
- 0xff61: (0xff61, 0xff65, 0,0,0,0,0,0,0,0,1,1,0,0), #  HALFWIDTH IDEOGRAPHIC FULL STOP..HALFWIDTH KATAKANA MIDDLE DOT
- 0xffe0: (0xffe0, 0xffe6, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH CENT SIGN..FULLWIDTH WON SIGN
- 0xffe8: (0xffe8, 0xffee, 0,0,0,0,0,0,0,0,1,1,0,0), #  HALFWIDTH FORMS LIGHT VERTICAL..HALFWIDTH WHITE CIRCLE
- 0x1f100: (0x1f100, 0x1f10a, 0,0,0,0,0,0,0,0,1,1,0,0), #  DIGIT ZERO FULL STOP..DIGIT NINE COMMA
- 0x1f110: (0x1f110, 0x1f12e, 0,0,0,0,0,0,0,0,1,1,0,0), #  PARENTHESIZED LATIN CAPITAL LETTER A..CIRCLED WZ
- 0x1f130: (0x1f130, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER A
- 0x1f131: (0x1f131, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER B
- 0x1f132: (0x1f132, 0x1f13c, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER C..SQUARED LATIN CAPITAL LETTER M
- 0x1f13d: (0x1f13d, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER N
- 0x1f13e: (0x1f13e, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER O
- 0x1f13f: (0x1f13f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER P
- 0x1f140: (0x1f140, 0x1f141, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER Q..SQUARED LATIN CAPITAL LETTER R
- 0x1f142: (0x1f142, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER S
- 0x1f143: (0x1f143, 0x1f145, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER T..SQUARED LATIN CAPITAL LETTER V
- 0x1f146: (0x1f146, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER W
- 0x1f147: (0x1f147, 0x1f149, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER X..SQUARED LATIN CAPITAL LETTER Z
- 0x1f14a: (0x1f14a, 0x1f14e, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED HV..SQUARED PPV
- 0x1f14f: (0x1f14f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED WC
- 0x1f16a: (0x1f16a, 0x1f16b, 0,0,0,0,0,0,0,0,1,1,0,0), #  RAISED MC SIGN..RAISED MD SIGN
- 0x1f190: (0x1f190, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARE DJ
- 0x1f200: (0x1f200, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARE HIRAGANA HOKA
- 0x1f201: (0x1f201, 0x1f202, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED KATAKANA KOKO..SQUARED KATAKANA SA
- 0x1f210: (0x1f210, 0x1f231, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED CJK UNIFIED IDEOGRAPH-624B..SQUARED CJK UNIFIED IDEOGRAPH-6253
- 0x1f232: (0x1f232, 0x1f23a, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED CJK UNIFIED IDEOGRAPH-7981..SQUARED CJK UNIFIED IDEOGRAPH-55B6
- 0x1f23b: (0x1f23b, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED CJK UNIFIED IDEOGRAPH-914D
- 0x1f240: (0x1f240, 0x1f248, 0,0,0,0,0,0,0,0,1,1,0,0), #  TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-672C..TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-6557
- 0x1f250: (0x1f250, 0x1f251, 0,0,0,0,0,0,0,0,1,1,0,0), #  CIRCLED IDEOGRAPH ADVANTAGE..CIRCLED IDEOGRAPH ACCEPT
- 0x00aa: (0x00aa, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  FEMININE ORDINAL INDICATOR
- 0x00b5: (0x00b5, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  MICRO SIGN
- 0x00ba: (0x00ba, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  MASCULINE ORDINAL INDICATOR
- 0x0132: (0x0132, 0x0133, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LIGATURE IJ..LATIN SMALL LIGATURE IJ
- 0x013f: (0x013f, 0x0140, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LETTER L WITH MIDDLE DOT..LATIN SMALL LETTER L WITH MIDDLE DOT
- 0x017f: (0x017f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER LONG S
- 0x01c4: (0x01c4, 0x01cc, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LETTER DZ WITH CARON..LATIN SMALL LETTER NJ
- 0x01f1: (0x01f1, 0x01f3, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LETTER DZ..LATIN SMALL LETTER DZ
- 0x02b0: (0x02b0, 0x02b8, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL H..MODIFIER LETTER SMALL Y
- 0x02e0: (0x02e0, 0x02e4, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL GAMMA..MODIFIER LETTER SMALL REVERSED GLOTTAL STOP
- 0x0374: (0x0374, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK NUMERAL SIGN
- 0x0387: (0x0387, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK ANO TELEIA
- 0x03d2: (0x03d2, 0x03d4, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK UPSILON WITH HOOK SYMBOL..GREEK UPSILON WITH DIAERESIS AND HOOK SYMBOL
- 0x03f0: (0x03f0, 0x03f2, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK KAPPA SYMBOL..GREEK LUNATE SIGMA SYMBOL
- 0x03f4: (0x03f4, 0x03f5, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL THETA SYMBOL..GREEK LUNATE EPSILON SYMBOL
- 0x0587: (0x0587, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARMENIAN SMALL LIGATURE ECH YIWN
- 0x0675: (0x0675, 0x0678, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC LETTER HIGH HAMZA ALEF..ARABIC LETTER HIGH HAMZA YEH
- 0x0958: (0x0958, 0x095f, 0,0,0,0,0,0,0,0,1,0,0,0), #  DEVANAGARI LETTER QA..DEVANAGARI LETTER YYA
- 0x09dc: (0x09dc, 0x09dd, 0,0,0,0,0,0,0,0,1,0,0,0), #  BENGALI LETTER RRA..BENGALI LETTER RHA
- 0x09df: (0x09df, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  BENGALI LETTER YYA
- 0x0a33: (0x0a33, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER LLA
- 0x0a36: (0x0a36, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER SHA
- 0x0a59: (0x0a59, 0x0a5b, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER KHHA..GURMUKHI LETTER ZA
- 0x0a5e: (0x0a5e, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER FA
- 0x0b5c: (0x0b5c, 0x0b5d, 0,0,0,0,0,0,0,0,1,0,0,0), #  ORIYA LETTER RRA..ORIYA LETTER RHA
- 0x0e33: (0x0e33, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  THAI CHARACTER SARA AM
- 0x0eb3: (0x0eb3, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LAO VOWEL SIGN AM
- 0x0edc: (0x0edc, 0x0edd, 0,0,0,0,0,0,0,0,1,0,0,0), #  LAO HO NO..LAO HO MO
- 0x0f43: (0x0f43, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER GHA
- 0x0f4d: (0x0f4d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER DDHA
- 0x0f52: (0x0f52, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER DHA
- 0x0f57: (0x0f57, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER BHA
- 0x0f5c: (0x0f5c, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER DZHA
- 0x0f69: (0x0f69, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER KSSA
- 0x0f76: (0x0f76, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC R
- 0x0f78: (0x0f78, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC L
- 0x0f93: (0x0f93, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER GHA
- 0x0f9d: (0x0f9d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER DDHA
- 0x0fa2: (0x0fa2, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER DHA
- 0x0fa7: (0x0fa7, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER BHA
- 0x0fac: (0x0fac, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER DZHA
- 0x0fb9: (0x0fb9, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER KSSA
- 0x10fc: (0x10fc, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER GEORGIAN NAR
- 0x1e9a: (0x1e9a, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER A WITH RIGHT HALF RING
- 0x1e9b: (0x1e9b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER LONG S WITH DOT ABOVE
- 0x1f71: (0x1f71, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER ALPHA WITH OXIA
- 0x1f73: (0x1f73, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER EPSILON WITH OXIA
- 0x1f75: (0x1f75, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER ETA WITH OXIA
- 0x1f77: (0x1f77, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER IOTA WITH OXIA
- 0x1f79: (0x1f79, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER OMICRON WITH OXIA
- 0x1f7b: (0x1f7b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER UPSILON WITH OXIA
- 0x1f7d: (0x1f7d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER OMEGA WITH OXIA
- 0x1fbb: (0x1fbb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER ALPHA WITH OXIA
- 0x1fbe: (0x1fbe, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK PROSGEGRAMMENI
- 0x1fc9: (0x1fc9, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER EPSILON WITH OXIA
- 0x1fcb: (0x1fcb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER ETA WITH OXIA
- 0x1fd3: (0x1fd3, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER IOTA WITH DIALYTIKA AND OXIA
- 0x1fdb: (0x1fdb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER IOTA WITH OXIA
- 0x1fe3: (0x1fe3, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND OXIA
- 0x1feb: (0x1feb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER UPSILON WITH OXIA
- 0x1ff9: (0x1ff9, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER OMICRON WITH OXIA
- 0x1ffb: (0x1ffb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER OMEGA WITH OXIA
- 0x2071: (0x2071, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  SUPERSCRIPT LATIN SMALL LETTER I
- 0x207f: (0x207f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  SUPERSCRIPT LATIN SMALL LETTER N
- 0x2090: (0x2090, 0x2094, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SUBSCRIPT SMALL LETTER A..LATIN SUBSCRIPT SMALL LETTER SCHWA
- 0x2095: (0x2095, 0x209c, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SUBSCRIPT SMALL LETTER H..LATIN SUBSCRIPT SMALL LETTER T
- 0x2102: (0x2102, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL C
- 0x2107: (0x2107, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  EULER CONSTANT
- 0x210a: (0x210a, 0x2113, 0,0,0,0,0,0,0,0,1,0,0,0), #  SCRIPT SMALL G..SCRIPT SMALL L
- 0x2115: (0x2115, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL N
- 0x2119: (0x2119, 0x211d, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL P..DOUBLE-STRUCK CAPITAL R
- 0x2124: (0x2124, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL Z
- 0x2126: (0x2126, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  OHM SIGN
- 0x2128: (0x2128, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  BLACK-LETTER CAPITAL Z
- 0x212a: (0x212a, 0x212d, 0,0,0,0,0,0,0,0,1,0,0,0), #  KELVIN SIGN..BLACK-LETTER CAPITAL C
- 0x212f: (0x212f, 0x2131, 0,0,0,0,0,0,0,0,1,0,0,0), #  SCRIPT SMALL E..SCRIPT CAPITAL F
- 0x2133: (0x2133, 0x2138, 0,0,0,0,0,0,0,0,1,0,0,0), #  SCRIPT CAPITAL M..DALET SYMBOL
- 0x2139: (0x2139, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  INFORMATION SOURCE
- 0x213c: (0x213c, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK SMALL PI
- 0x213d: (0x213d, 0x213f, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK SMALL GAMMA..DOUBLE-STRUCK CAPITAL PI
- 0x2145: (0x2145, 0x2149, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK ITALIC CAPITAL D..DOUBLE-STRUCK ITALIC SMALL J
- 0x2160: (0x2160, 0x217f, 0,0,0,0,0,0,0,0,1,0,0,0), #  ROMAN NUMERAL ONE..SMALL ROMAN NUMERAL ONE THOUSAND
- 0x2c7c: (0x2c7c, 0x2c7d, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SUBSCRIPT SMALL LETTER J..MODIFIER LETTER CAPITAL V
- 0x3038: (0x3038, 0x303a, 0,0,0,0,0,0,0,0,1,0,0,0), #  HANGZHOU NUMERAL TEN..HANGZHOU NUMERAL THIRTY
- 0x309f: (0x309f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  HIRAGANA DIGRAPH YORI
- 0x30ff: (0x30ff, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  KATAKANA DIGRAPH KOTO
- 0xa69c: (0xa69c, 0xa69d, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CYRILLIC HARD SIGN..MODIFIER LETTER CYRILLIC SOFT SIGN
- 0xa7f8: (0xa7f8, 0xa7f9, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL H WITH STROKE..MODIFIER LETTER SMALL LIGATURE OE
- 0xab5c: (0xab5c, 0xab5f, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL HENG..MODIFIER LETTER SMALL U WITH LEFT HOOK
- 0xf900: (0xf900, 0xfa0d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-F900..CJK COMPATIBILITY IDEOGRAPH-FA0D
- 0xfa10: (0xfa10, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA10
- 0xfa12: (0xfa12, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA12
- 0xfa15: (0xfa15, 0xfa1e, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA15..CJK COMPATIBILITY IDEOGRAPH-FA1E
- 0xfa20: (0xfa20, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA20
- 0xfa22: (0xfa22, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA22
- 0xfa25: (0xfa25, 0xfa26, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA25..CJK COMPATIBILITY IDEOGRAPH-FA26
- 0xfa2a: (0xfa2a, 0xfa2d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA2A..CJK COMPATIBILITY IDEOGRAPH-FA2D
- 0xfa2e: (0xfa2e, 0xfa2f, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA2E..CJK COMPATIBILITY IDEOGRAPH-FA2F
- 0xfa30: (0xfa30, 0xfa6a, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA30..CJK COMPATIBILITY IDEOGRAPH-FA6A
- 0xfa6b: (0xfa6b, 0xfa6d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA6B..CJK COMPATIBILITY IDEOGRAPH-FA6D
- 0xfa70: (0xfa70, 0xfad9, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA70..CJK COMPATIBILITY IDEOGRAPH-FAD9
- 0xff10: (0xff10, 0xff19, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH DIGIT ZERO..FULLWIDTH DIGIT NINE
- 0xff21: (0xff21, 0xff3a, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH LATIN CAPITAL LETTER A..FULLWIDTH LATIN CAPITAL LETTER Z
- 0xff3f: (0xff3f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH LOW LINE
- 0xff41: (0xff41, 0xff5a, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH LATIN SMALL LETTER A..FULLWIDTH LATIN SMALL LETTER Z
- 0xff66: (0xff66, 0xff9f, 0,0,0,0,0,0,0,0,1,0,0,0), #  HALFWIDTH KATAKANA LETTER WO..HALFWIDTH KATAKANA SEMI-VOICED SOUND MARK
- 0x1ee00: (0x1ee00, 0x1ee03, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL ALEF..ARABIC MATHEMATICAL DAL
- 0x1ee05: (0x1ee05, 0x1ee1f, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL WAW..ARABIC MATHEMATICAL DOTLESS QAF
- 0x1ee21: (0x1ee21, 0x1ee22, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL BEH..ARABIC MATHEMATICAL INITIAL JEEM
- 0x1ee24: (0x1ee24, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL HEH
- 0x1ee27: (0x1ee27, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL HAH
- 0x1ee29: (0x1ee29, 0x1ee32, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL YEH..ARABIC MATHEMATICAL INITIAL QAF
- 0x1ee34: (0x1ee34, 0x1ee37, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL SHEEN..ARABIC MATHEMATICAL INITIAL KHAH
- 0x1ee39: (0x1ee39, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL DAD
- 0x1ee3b: (0x1ee3b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL GHAIN
- 0x1ee42: (0x1ee42, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED JEEM
- 0x1ee47: (0x1ee47, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED HAH
- 0x1ee49: (0x1ee49, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED YEH
- 0x1ee4b: (0x1ee4b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED LAM
- 0x1ee4d: (0x1ee4d, 0x1ee4f, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED NOON..ARABIC MATHEMATICAL TAILED AIN
- 0x1ee51: (0x1ee51, 0x1ee52, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED SAD..ARABIC MATHEMATICAL TAILED QAF
- 0x1ee54: (0x1ee54, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED SHEEN
- 0x1ee57: (0x1ee57, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED KHAH
- 0x1ee59: (0x1ee59, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED DAD
- 0x1ee5b: (0x1ee5b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED GHAIN
- 0x1ee5d: (0x1ee5d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED DOTLESS NOON
- 0x1ee5f: (0x1ee5f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED DOTLESS QAF
- 0x1ee61: (0x1ee61, 0x1ee62, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED BEH..ARABIC MATHEMATICAL STRETCHED JEEM
- 0x1ee64: (0x1ee64, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED HEH
- 0x1ee67: (0x1ee67, 0x1ee6a, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED HAH..ARABIC MATHEMATICAL STRETCHED KAF
- 0x1ee6c: (0x1ee6c, 0x1ee72, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED MEEM..ARABIC MATHEMATICAL STRETCHED QAF
- 0x1ee74: (0x1ee74, 0x1ee77, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED SHEEN..ARABIC MATHEMATICAL STRETCHED KHAH
- 0x1ee79: (0x1ee79, 0x1ee7c, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED DAD..ARABIC MATHEMATICAL STRETCHED DOTLESS BEH
- 0x1ee7e: (0x1ee7e, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED DOTLESS FEH
- 0x1ee80: (0x1ee80, 0x1ee89, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL LOOPED ALEF..ARABIC MATHEMATICAL LOOPED YEH
- 0x1ee8b: (0x1ee8b, 0x1ee9b, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL LOOPED LAM..ARABIC MATHEMATICAL LOOPED GHAIN
- 0x1eea1: (0x1eea1, 0x1eea3, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL DOUBLE-STRUCK BEH..ARABIC MATHEMATICAL DOUBLE-STRUCK DAL
- 0x1eea5: (0x1eea5, 0x1eea9, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL DOUBLE-STRUCK WAW..ARABIC MATHEMATICAL DOUBLE-STRUCK YEH
- 0x1eeab: (0x1eeab, 0x1eebb, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL DOUBLE-STRUCK LAM..ARABIC MATHEMATICAL DOUBLE-STRUCK GHAIN
- 0x2f800: (0x2f800, 0x2fa1d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-2F800..CJK COMPATIBILITY IDEOGRAPH-2FA1D
-}
+
+
+# dictionary of Unicode identifier types
+# entries are: key: (f, l, types), where
+#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.
+#     types - types is a list of ints, with 0 for False and 1 for True for the following types for the identifier.
+#        allowed, deprecated, technical, obsolete, inclusion, exclusion, limited_use, uncommon_use, not_NFKC, not_XID, recommended, default_Ignorable
+identifier_type_map = {
+ 0x0030: (0x0030, 0x0039, 1,0,0,0,0,0,0,0,0,0,1,0), #  DIGIT ZERO..DIGIT NINE
+ 0x0041: (0x0041, 0x005a, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A..LATIN CAPITAL LETTER Z
+ 0x005f: (0x005f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LOW LINE
+ 0x0061: (0x0061, 0x007a, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN SMALL LETTER A..LATIN SMALL LETTER Z
+ 0x00c0: (0x00c0, 0x00d6, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH GRAVE..LATIN CAPITAL LETTER O WITH DIAERESIS
+ 0x00d8: (0x00d8, 0x00f6, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER O WITH STROKE..LATIN SMALL LETTER O WITH DIAERESIS
+ 0x00f8: (0x00f8, 0x0131, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN SMALL LETTER O WITH STROKE..LATIN SMALL LETTER DOTLESS I
+ 0x0134: (0x0134, 0x013e, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER J WITH CIRCUMFLEX..LATIN SMALL LETTER L WITH CARON
+ 0x0141: (0x0141, 0x0148, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER L WITH STROKE..LATIN SMALL LETTER N WITH CARON
+ 0x014a: (0x014a, 0x017e, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER ENG..LATIN SMALL LETTER Z WITH CARON
+ 0x018f: (0x018f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER SCHWA
+ 0x01a0: (0x01a0, 0x01a1, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER O WITH HORN..LATIN SMALL LETTER O WITH HORN
+ 0x01af: (0x01af, 0x01b0, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER U WITH HORN..LATIN SMALL LETTER U WITH HORN
+ 0x01cd: (0x01cd, 0x01dc, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH CARON..LATIN SMALL LETTER U WITH DIAERESIS AND GRAVE
+ 0x01de: (0x01de, 0x01e3, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH DIAERESIS AND MACRON..LATIN SMALL LETTER AE WITH MACRON
+ 0x01e6: (0x01e6, 0x01f0, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER G WITH CARON..LATIN SMALL LETTER J WITH CARON
+ 0x01f4: (0x01f4, 0x01f5, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER G WITH ACUTE..LATIN SMALL LETTER G WITH ACUTE
+ 0x01f8: (0x01f8, 0x01f9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER N WITH GRAVE..LATIN SMALL LETTER N WITH GRAVE
+ 0x01fa: (0x01fa, 0x0217, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH RING ABOVE AND ACUTE..LATIN SMALL LETTER U WITH INVERTED BREVE
+ 0x0218: (0x0218, 0x021b, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER S WITH COMMA BELOW..LATIN SMALL LETTER T WITH COMMA BELOW
+ 0x021e: (0x021e, 0x021f, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER H WITH CARON..LATIN SMALL LETTER H WITH CARON
+ 0x0226: (0x0226, 0x0233, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH DOT ABOVE..LATIN SMALL LETTER Y WITH MACRON
+ 0x0259: (0x0259, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN SMALL LETTER SCHWA
+ 0x02bb: (0x02bb, 0x02bc, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER TURNED COMMA..MODIFIER LETTER APOSTROPHE
+ 0x02ec: (0x02ec, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER VOICING
+ 0x0300: (0x0300, 0x0304, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING GRAVE ACCENT..COMBINING MACRON
+ 0x0306: (0x0306, 0x030c, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING BREVE..COMBINING CARON
+ 0x030f: (0x030f, 0x0311, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING DOUBLE GRAVE ACCENT..COMBINING INVERTED BREVE
+ 0x0313: (0x0313, 0x0314, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING COMMA ABOVE..COMBINING REVERSED COMMA ABOVE
+ 0x031b: (0x031b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING HORN
+ 0x0323: (0x0323, 0x0328, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING DOT BELOW..COMBINING OGONEK
+ 0x032d: (0x032d, 0x032e, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING CIRCUMFLEX ACCENT BELOW..COMBINING BREVE BELOW
+ 0x0330: (0x0330, 0x0331, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING TILDE BELOW..COMBINING MACRON BELOW
+ 0x0335: (0x0335, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING SHORT STROKE OVERLAY
+ 0x0338: (0x0338, 0x0339, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING LONG SOLIDUS OVERLAY..COMBINING RIGHT HALF RING BELOW
+ 0x0342: (0x0342, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING GREEK PERISPOMENI
+ 0x0345: (0x0345, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING GREEK YPOGEGRAMMENI
+ 0x037b: (0x037b, 0x037d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL REVERSED LUNATE SIGMA SYMBOL..GREEK SMALL REVERSED DOTTED LUNATE SIGMA SYMBOL
+ 0x0386: (0x0386, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ALPHA WITH TONOS
+ 0x0388: (0x0388, 0x038a, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER EPSILON WITH TONOS..GREEK CAPITAL LETTER IOTA WITH TONOS
+ 0x038c: (0x038c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMICRON WITH TONOS
+ 0x038e: (0x038e, 0x03a1, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH TONOS..GREEK CAPITAL LETTER RHO
+ 0x03a3: (0x03a3, 0x03ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER SIGMA..GREEK SMALL LETTER OMEGA WITH TONOS
+ 0x03fc: (0x03fc, 0x03ff, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK RHO WITH STROKE SYMBOL..GREEK CAPITAL REVERSED DOTTED LUNATE SIGMA SYMBOL
+ 0x0400: (0x0400, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER IE WITH GRAVE
+ 0x0401: (0x0401, 0x040c, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER IO..CYRILLIC CAPITAL LETTER KJE
+ 0x040d: (0x040d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER I WITH GRAVE
+ 0x040e: (0x040e, 0x044f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SHORT U..CYRILLIC SMALL LETTER YA
+ 0x0450: (0x0450, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER IE WITH GRAVE
+ 0x0451: (0x0451, 0x045c, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER IO..CYRILLIC SMALL LETTER KJE
+ 0x045d: (0x045d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER I WITH GRAVE
+ 0x045e: (0x045e, 0x045f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER SHORT U..CYRILLIC SMALL LETTER DZHE
+ 0x048a: (0x048a, 0x048b, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SHORT I WITH TAIL..CYRILLIC SMALL LETTER SHORT I WITH TAIL
+ 0x048c: (0x048c, 0x048f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SEMISOFT SIGN..CYRILLIC SMALL LETTER ER WITH TICK
+ 0x0490: (0x0490, 0x04c4, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER GHE WITH UPTURN..CYRILLIC SMALL LETTER KA WITH HOOK
+ 0x04c5: (0x04c5, 0x04c6, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EL WITH TAIL..CYRILLIC SMALL LETTER EL WITH TAIL
+ 0x04c7: (0x04c7, 0x04c8, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EN WITH HOOK..CYRILLIC SMALL LETTER EN WITH HOOK
+ 0x04c9: (0x04c9, 0x04ca, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EN WITH TAIL..CYRILLIC SMALL LETTER EN WITH TAIL
+ 0x04cb: (0x04cb, 0x04cc, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER KHAKASSIAN CHE..CYRILLIC SMALL LETTER KHAKASSIAN CHE
+ 0x04cd: (0x04cd, 0x04ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EM WITH TAIL..CYRILLIC SMALL LETTER EM WITH TAIL
+ 0x04cf: (0x04cf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER PALOCHKA
+ 0x04d0: (0x04d0, 0x04eb, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER A WITH BREVE..CYRILLIC SMALL LETTER BARRED O WITH DIAERESIS
+ 0x04ec: (0x04ec, 0x04ed, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER E WITH DIAERESIS..CYRILLIC SMALL LETTER E WITH DIAERESIS
+ 0x04ee: (0x04ee, 0x04f5, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER U WITH MACRON..CYRILLIC SMALL LETTER CHE WITH DIAERESIS
+ 0x04f6: (0x04f6, 0x04f7, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER GHE WITH DESCENDER..CYRILLIC SMALL LETTER GHE WITH DESCENDER
+ 0x04f8: (0x04f8, 0x04f9, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER YERU WITH DIAERESIS..CYRILLIC SMALL LETTER YERU WITH DIAERESIS
+ 0x04fa: (0x04fa, 0x04ff, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER GHE WITH STROKE AND HOOK..CYRILLIC SMALL LETTER HA WITH STROKE
+ 0x0500: (0x0500, 0x050f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER KOMI DE..CYRILLIC SMALL LETTER KOMI TJE
+ 0x0510: (0x0510, 0x0513, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER REVERSED ZE..CYRILLIC SMALL LETTER EL WITH HOOK
+ 0x0514: (0x0514, 0x0523, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER LHA..CYRILLIC SMALL LETTER EN WITH MIDDLE HOOK
+ 0x0524: (0x0524, 0x0525, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER PE WITH DESCENDER..CYRILLIC SMALL LETTER PE WITH DESCENDER
+ 0x0526: (0x0526, 0x0527, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER SHHA WITH DESCENDER..CYRILLIC SMALL LETTER SHHA WITH DESCENDER
+ 0x0528: (0x0528, 0x0529, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EN WITH LEFT HOOK..CYRILLIC SMALL LETTER EN WITH LEFT HOOK
+ 0x052e: (0x052e, 0x052f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER EL WITH DESCENDER..CYRILLIC SMALL LETTER EL WITH DESCENDER
+ 0x0531: (0x0531, 0x0556, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN CAPITAL LETTER AYB..ARMENIAN CAPITAL LETTER FEH
+ 0x0559: (0x0559, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN MODIFIER LETTER LEFT HALF RING
+ 0x0560: (0x0560, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN SMALL LETTER TURNED AYB
+ 0x0561: (0x0561, 0x0586, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN SMALL LETTER AYB..ARMENIAN SMALL LETTER FEH
+ 0x0588: (0x0588, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARMENIAN SMALL LETTER YI WITH STROKE
+ 0x05b4: (0x05b4, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW POINT HIRIQ
+ 0x05d0: (0x05d0, 0x05ea, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW LETTER ALEF..HEBREW LETTER TAV
+ 0x05ef: (0x05ef, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW YOD TRIANGLE
+ 0x05f0: (0x05f0, 0x05f2, 1,0,0,0,0,0,0,0,0,0,1,0), #  HEBREW LIGATURE YIDDISH DOUBLE VAV..HEBREW LIGATURE YIDDISH DOUBLE YOD
+ 0x0620: (0x0620, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER KASHMIRI YEH
+ 0x0621: (0x0621, 0x063a, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HAMZA..ARABIC LETTER GHAIN
+ 0x063b: (0x063b, 0x063f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER KEHEH WITH TWO DOTS ABOVE..ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE
+ 0x0641: (0x0641, 0x0652, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER FEH..ARABIC SUKUN
+ 0x0653: (0x0653, 0x0655, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC MADDAH ABOVE..ARABIC HAMZA BELOW
+ 0x0660: (0x0660, 0x0669, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC-INDIC DIGIT ZERO..ARABIC-INDIC DIGIT NINE
+ 0x0670: (0x0670, 0x0672, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER SUPERSCRIPT ALEF..ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE
+ 0x0674: (0x0674, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HIGH HAMZA
+ 0x0679: (0x0679, 0x068d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER TTEH..ARABIC LETTER DDAHAL
+ 0x068f: (0x068f, 0x06b7, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER DAL WITH THREE DOTS ABOVE DOWNWARDS..ARABIC LETTER LAM WITH THREE DOTS ABOVE
+ 0x06b8: (0x06b8, 0x06b9, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER LAM WITH THREE DOTS BELOW..ARABIC LETTER NOON WITH DOT BELOW
+ 0x06ba: (0x06ba, 0x06be, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER NOON GHUNNA..ARABIC LETTER HEH DOACHASHMEE
+ 0x06bf: (0x06bf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER TCHEH WITH DOT ABOVE
+ 0x06c0: (0x06c0, 0x06ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HEH WITH YEH ABOVE..ARABIC LETTER YEH WITH SMALL V
+ 0x06cf: (0x06cf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER WAW WITH DOT ABOVE
+ 0x06d0: (0x06d0, 0x06d3, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER E..ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
+ 0x06d5: (0x06d5, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER AE
+ 0x06e5: (0x06e5, 0x06e6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC SMALL WAW..ARABIC SMALL YEH
+ 0x06ee: (0x06ee, 0x06ef, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER DAL WITH INVERTED V..ARABIC LETTER REH WITH INVERTED V
+ 0x06f0: (0x06f0, 0x06f9, 1,0,0,0,0,0,0,0,0,0,1,0), #  EXTENDED ARABIC-INDIC DIGIT ZERO..EXTENDED ARABIC-INDIC DIGIT NINE
+ 0x06fa: (0x06fa, 0x06fc, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER SHEEN WITH DOT BELOW..ARABIC LETTER GHAIN WITH DOT BELOW
+ 0x06ff: (0x06ff, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HEH WITH INVERTED V
+ 0x0750: (0x0750, 0x076d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH THREE DOTS HORIZONTALLY BELOW..ARABIC LETTER SEEN WITH TWO DOTS VERTICALLY ABOVE
+ 0x076e: (0x076e, 0x077f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH BELOW..ARABIC LETTER KAF WITH TWO DOTS ABOVE
+ 0x0780: (0x0780, 0x07b0, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAANA LETTER HAA..THAANA SUKUN
+ 0x07b1: (0x07b1, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAANA LETTER NAA
+ 0x08a0: (0x08a0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH SMALL V BELOW
+ 0x08a1: (0x08a1, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH HAMZA ABOVE
+ 0x08a2: (0x08a2, 0x08ac, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER JEEM WITH TWO DOTS ABOVE..ARABIC LETTER ROHINGYA YEH
+ 0x08b2: (0x08b2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER ZAIN WITH INVERTED V ABOVE
+ 0x08b6: (0x08b6, 0x08bd, 1,0,0,0,0,0,0,0,0,0,1,0), #  ARABIC LETTER BEH WITH SMALL MEEM ABOVE..ARABIC LETTER AFRICAN NOON
+ 0x0901: (0x0901, 0x0903, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI SIGN CANDRABINDU..DEVANAGARI SIGN VISARGA
+ 0x0904: (0x0904, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER SHORT A
+ 0x0905: (0x0905, 0x0939, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER A..DEVANAGARI LETTER HA
+ 0x093a: (0x093a, 0x093b, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI VOWEL SIGN OE..DEVANAGARI VOWEL SIGN OOE
+ 0x093c: (0x093c, 0x094d, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI SIGN NUKTA..DEVANAGARI SIGN VIRAMA
+ 0x094f: (0x094f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI VOWEL SIGN AW
+ 0x0950: (0x0950, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI OM
+ 0x0956: (0x0956, 0x0957, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI VOWEL SIGN UE..DEVANAGARI VOWEL SIGN UUE
+ 0x0960: (0x0960, 0x0963, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER VOCALIC RR..DEVANAGARI VOWEL SIGN VOCALIC LL
+ 0x0966: (0x0966, 0x096f, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI DIGIT ZERO..DEVANAGARI DIGIT NINE
+ 0x0971: (0x0971, 0x0972, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI SIGN HIGH SPACING DOT..DEVANAGARI LETTER CANDRA A
+ 0x0973: (0x0973, 0x0977, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER OE..DEVANAGARI LETTER UUE
+ 0x0979: (0x0979, 0x097a, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER ZHA..DEVANAGARI LETTER HEAVY YA
+ 0x097b: (0x097b, 0x097c, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER GGA..DEVANAGARI LETTER JJA
+ 0x097d: (0x097d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER GLOTTAL STOP
+ 0x097e: (0x097e, 0x097f, 1,0,0,0,0,0,0,0,0,0,1,0), #  DEVANAGARI LETTER DDDA..DEVANAGARI LETTER BBA
+ 0x0981: (0x0981, 0x0983, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SIGN CANDRABINDU..BENGALI SIGN VISARGA
+ 0x0985: (0x0985, 0x098c, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER A..BENGALI LETTER VOCALIC L
+ 0x098f: (0x098f, 0x0990, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER E..BENGALI LETTER AI
+ 0x0993: (0x0993, 0x09a8, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER O..BENGALI LETTER NA
+ 0x09aa: (0x09aa, 0x09b0, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER PA..BENGALI LETTER RA
+ 0x09b2: (0x09b2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER LA
+ 0x09b6: (0x09b6, 0x09b9, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER SHA..BENGALI LETTER HA
+ 0x09bc: (0x09bc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SIGN NUKTA
+ 0x09bd: (0x09bd, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SIGN AVAGRAHA
+ 0x09be: (0x09be, 0x09c4, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI VOWEL SIGN AA..BENGALI VOWEL SIGN VOCALIC RR
+ 0x09c7: (0x09c7, 0x09c8, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI VOWEL SIGN E..BENGALI VOWEL SIGN AI
+ 0x09cb: (0x09cb, 0x09cd, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI VOWEL SIGN O..BENGALI SIGN VIRAMA
+ 0x09ce: (0x09ce, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER KHANDA TA
+ 0x09d7: (0x09d7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI AU LENGTH MARK
+ 0x09e0: (0x09e0, 0x09e3, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER VOCALIC RR..BENGALI VOWEL SIGN VOCALIC LL
+ 0x09e6: (0x09e6, 0x09f1, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI DIGIT ZERO..BENGALI LETTER RA WITH LOWER DIAGONAL
+ 0x09fc: (0x09fc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI LETTER VEDIC ANUSVARA
+ 0x09fe: (0x09fe, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BENGALI SANDHI MARK
+ 0x0a01: (0x0a01, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN ADAK BINDI
+ 0x0a02: (0x0a02, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN BINDI
+ 0x0a03: (0x0a03, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN VISARGA
+ 0x0a05: (0x0a05, 0x0a0a, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER A..GURMUKHI LETTER UU
+ 0x0a0f: (0x0a0f, 0x0a10, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER EE..GURMUKHI LETTER AI
+ 0x0a13: (0x0a13, 0x0a28, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER OO..GURMUKHI LETTER NA
+ 0x0a2a: (0x0a2a, 0x0a30, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER PA..GURMUKHI LETTER RA
+ 0x0a32: (0x0a32, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER LA
+ 0x0a35: (0x0a35, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER VA
+ 0x0a38: (0x0a38, 0x0a39, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER SA..GURMUKHI LETTER HA
+ 0x0a3c: (0x0a3c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI SIGN NUKTA
+ 0x0a3e: (0x0a3e, 0x0a42, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI VOWEL SIGN AA..GURMUKHI VOWEL SIGN UU
+ 0x0a47: (0x0a47, 0x0a48, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI VOWEL SIGN EE..GURMUKHI VOWEL SIGN AI
+ 0x0a4b: (0x0a4b, 0x0a4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI VOWEL SIGN OO..GURMUKHI SIGN VIRAMA
+ 0x0a5c: (0x0a5c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI LETTER RRA
+ 0x0a66: (0x0a66, 0x0a74, 1,0,0,0,0,0,0,0,0,0,1,0), #  GURMUKHI DIGIT ZERO..GURMUKHI EK ONKAR
+ 0x0a81: (0x0a81, 0x0a83, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI SIGN CANDRABINDU..GUJARATI SIGN VISARGA
+ 0x0a85: (0x0a85, 0x0a8b, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER A..GUJARATI LETTER VOCALIC R
+ 0x0a8c: (0x0a8c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VOCALIC L
+ 0x0a8d: (0x0a8d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI VOWEL CANDRA E
+ 0x0a8f: (0x0a8f, 0x0a91, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER E..GUJARATI VOWEL CANDRA O
+ 0x0a93: (0x0a93, 0x0aa8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER O..GUJARATI LETTER NA
+ 0x0aaa: (0x0aaa, 0x0ab0, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER PA..GUJARATI LETTER RA
+ 0x0ab2: (0x0ab2, 0x0ab3, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER LA..GUJARATI LETTER LLA
+ 0x0ab5: (0x0ab5, 0x0ab9, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VA..GUJARATI LETTER HA
+ 0x0abc: (0x0abc, 0x0ac5, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI SIGN NUKTA..GUJARATI VOWEL SIGN CANDRA E
+ 0x0ac7: (0x0ac7, 0x0ac9, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI VOWEL SIGN E..GUJARATI VOWEL SIGN CANDRA O
+ 0x0acb: (0x0acb, 0x0acd, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI VOWEL SIGN O..GUJARATI SIGN VIRAMA
+ 0x0ad0: (0x0ad0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI OM
+ 0x0ae0: (0x0ae0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VOCALIC RR
+ 0x0ae1: (0x0ae1, 0x0ae3, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI LETTER VOCALIC LL..GUJARATI VOWEL SIGN VOCALIC LL
+ 0x0ae6: (0x0ae6, 0x0aef, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI DIGIT ZERO..GUJARATI DIGIT NINE
+ 0x0afa: (0x0afa, 0x0aff, 1,0,0,0,0,0,0,0,0,0,1,0), #  GUJARATI SIGN SUKUN..GUJARATI SIGN TWO-CIRCLE NUKTA ABOVE
+ 0x0b01: (0x0b01, 0x0b03, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA SIGN CANDRABINDU..ORIYA SIGN VISARGA
+ 0x0b05: (0x0b05, 0x0b0c, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER A..ORIYA LETTER VOCALIC L
+ 0x0b0f: (0x0b0f, 0x0b10, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER E..ORIYA LETTER AI
+ 0x0b13: (0x0b13, 0x0b28, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER O..ORIYA LETTER NA
+ 0x0b2a: (0x0b2a, 0x0b30, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER PA..ORIYA LETTER RA
+ 0x0b32: (0x0b32, 0x0b33, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER LA..ORIYA LETTER LLA
+ 0x0b35: (0x0b35, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER VA
+ 0x0b36: (0x0b36, 0x0b39, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER SHA..ORIYA LETTER HA
+ 0x0b3c: (0x0b3c, 0x0b43, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA SIGN NUKTA..ORIYA VOWEL SIGN VOCALIC R
+ 0x0b47: (0x0b47, 0x0b48, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA VOWEL SIGN E..ORIYA VOWEL SIGN AI
+ 0x0b4b: (0x0b4b, 0x0b4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA VOWEL SIGN O..ORIYA SIGN VIRAMA
+ 0x0b56: (0x0b56, 0x0b57, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA AI LENGTH MARK..ORIYA AU LENGTH MARK
+ 0x0b5f: (0x0b5f, 0x0b61, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER YYA..ORIYA LETTER VOCALIC LL
+ 0x0b66: (0x0b66, 0x0b6f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA DIGIT ZERO..ORIYA DIGIT NINE
+ 0x0b71: (0x0b71, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ORIYA LETTER WA
+ 0x0b82: (0x0b82, 0x0b83, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL SIGN ANUSVARA..TAMIL SIGN VISARGA
+ 0x0b85: (0x0b85, 0x0b8a, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER A..TAMIL LETTER UU
+ 0x0b8e: (0x0b8e, 0x0b90, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER E..TAMIL LETTER AI
+ 0x0b92: (0x0b92, 0x0b95, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER O..TAMIL LETTER KA
+ 0x0b99: (0x0b99, 0x0b9a, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NGA..TAMIL LETTER CA
+ 0x0b9c: (0x0b9c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER JA
+ 0x0b9e: (0x0b9e, 0x0b9f, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NYA..TAMIL LETTER TTA
+ 0x0ba3: (0x0ba3, 0x0ba4, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NNA..TAMIL LETTER TA
+ 0x0ba8: (0x0ba8, 0x0baa, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER NA..TAMIL LETTER PA
+ 0x0bae: (0x0bae, 0x0bb5, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER MA..TAMIL LETTER VA
+ 0x0bb6: (0x0bb6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER SHA
+ 0x0bb7: (0x0bb7, 0x0bb9, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL LETTER SSA..TAMIL LETTER HA
+ 0x0bbe: (0x0bbe, 0x0bc2, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL VOWEL SIGN AA..TAMIL VOWEL SIGN UU
+ 0x0bc6: (0x0bc6, 0x0bc8, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL VOWEL SIGN E..TAMIL VOWEL SIGN AI
+ 0x0bca: (0x0bca, 0x0bcd, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL VOWEL SIGN O..TAMIL SIGN VIRAMA
+ 0x0bd0: (0x0bd0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL OM
+ 0x0bd7: (0x0bd7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL AU LENGTH MARK
+ 0x0be6: (0x0be6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL DIGIT ZERO
+ 0x0be7: (0x0be7, 0x0bef, 1,0,0,0,0,0,0,0,0,0,1,0), #  TAMIL DIGIT ONE..TAMIL DIGIT NINE
+ 0x0c01: (0x0c01, 0x0c03, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU SIGN CANDRABINDU..TELUGU SIGN VISARGA
+ 0x0c04: (0x0c04, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU SIGN COMBINING ANUSVARA ABOVE
+ 0x0c05: (0x0c05, 0x0c0c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER A..TELUGU LETTER VOCALIC L
+ 0x0c0e: (0x0c0e, 0x0c10, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER E..TELUGU LETTER AI
+ 0x0c12: (0x0c12, 0x0c28, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER O..TELUGU LETTER NA
+ 0x0c2a: (0x0c2a, 0x0c33, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER PA..TELUGU LETTER LLA
+ 0x0c35: (0x0c35, 0x0c39, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER VA..TELUGU LETTER HA
+ 0x0c3d: (0x0c3d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU SIGN AVAGRAHA
+ 0x0c3e: (0x0c3e, 0x0c44, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU VOWEL SIGN AA..TELUGU VOWEL SIGN VOCALIC RR
+ 0x0c46: (0x0c46, 0x0c48, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU VOWEL SIGN E..TELUGU VOWEL SIGN AI
+ 0x0c4a: (0x0c4a, 0x0c4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU VOWEL SIGN O..TELUGU SIGN VIRAMA
+ 0x0c55: (0x0c55, 0x0c56, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LENGTH MARK..TELUGU AI LENGTH MARK
+ 0x0c60: (0x0c60, 0x0c61, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU LETTER VOCALIC RR..TELUGU LETTER VOCALIC LL
+ 0x0c66: (0x0c66, 0x0c6f, 1,0,0,0,0,0,0,0,0,0,1,0), #  TELUGU DIGIT ZERO..TELUGU DIGIT NINE
+ 0x0c80: (0x0c80, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN SPACING CANDRABINDU
+ 0x0c82: (0x0c82, 0x0c83, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN ANUSVARA..KANNADA SIGN VISARGA
+ 0x0c85: (0x0c85, 0x0c8c, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER A..KANNADA LETTER VOCALIC L
+ 0x0c8e: (0x0c8e, 0x0c90, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER E..KANNADA LETTER AI
+ 0x0c92: (0x0c92, 0x0ca8, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER O..KANNADA LETTER NA
+ 0x0caa: (0x0caa, 0x0cb3, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER PA..KANNADA LETTER LLA
+ 0x0cb5: (0x0cb5, 0x0cb9, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER VA..KANNADA LETTER HA
+ 0x0cbc: (0x0cbc, 0x0cbd, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN NUKTA..KANNADA SIGN AVAGRAHA
+ 0x0cbe: (0x0cbe, 0x0cc4, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN AA..KANNADA VOWEL SIGN VOCALIC RR
+ 0x0cc6: (0x0cc6, 0x0cc8, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN E..KANNADA VOWEL SIGN AI
+ 0x0cca: (0x0cca, 0x0ccd, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN O..KANNADA SIGN VIRAMA
+ 0x0cd5: (0x0cd5, 0x0cd6, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LENGTH MARK..KANNADA AI LENGTH MARK
+ 0x0ce0: (0x0ce0, 0x0ce1, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA LETTER VOCALIC RR..KANNADA LETTER VOCALIC LL
+ 0x0ce2: (0x0ce2, 0x0ce3, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA VOWEL SIGN VOCALIC L..KANNADA VOWEL SIGN VOCALIC LL
+ 0x0ce6: (0x0ce6, 0x0cef, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA DIGIT ZERO..KANNADA DIGIT NINE
+ 0x0cf1: (0x0cf1, 0x0cf2, 1,0,0,0,0,0,0,0,0,0,1,0), #  KANNADA SIGN JIHVAMULIYA..KANNADA SIGN UPADHMANIYA
+ 0x0d00: (0x0d00, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN COMBINING ANUSVARA ABOVE
+ 0x0d02: (0x0d02, 0x0d03, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN ANUSVARA..MALAYALAM SIGN VISARGA
+ 0x0d05: (0x0d05, 0x0d0c, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER A..MALAYALAM LETTER VOCALIC L
+ 0x0d0e: (0x0d0e, 0x0d10, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER E..MALAYALAM LETTER AI
+ 0x0d12: (0x0d12, 0x0d28, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER O..MALAYALAM LETTER NA
+ 0x0d29: (0x0d29, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER NNNA
+ 0x0d2a: (0x0d2a, 0x0d39, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER PA..MALAYALAM LETTER HA
+ 0x0d3a: (0x0d3a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER TTTA
+ 0x0d3b: (0x0d3b, 0x0d3c, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN VERTICAL BAR VIRAMA..MALAYALAM SIGN CIRCULAR VIRAMA
+ 0x0d3d: (0x0d3d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM SIGN AVAGRAHA
+ 0x0d3e: (0x0d3e, 0x0d43, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM VOWEL SIGN AA..MALAYALAM VOWEL SIGN VOCALIC R
+ 0x0d46: (0x0d46, 0x0d48, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM VOWEL SIGN E..MALAYALAM VOWEL SIGN AI
+ 0x0d4a: (0x0d4a, 0x0d4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM VOWEL SIGN O..MALAYALAM SIGN VIRAMA
+ 0x0d4e: (0x0d4e, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER DOT REPH
+ 0x0d54: (0x0d54, 0x0d56, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER CHILLU M..MALAYALAM LETTER CHILLU LLL
+ 0x0d57: (0x0d57, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM AU LENGTH MARK
+ 0x0d60: (0x0d60, 0x0d61, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER VOCALIC RR..MALAYALAM LETTER VOCALIC LL
+ 0x0d66: (0x0d66, 0x0d6f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM DIGIT ZERO..MALAYALAM DIGIT NINE
+ 0x0d7a: (0x0d7a, 0x0d7f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MALAYALAM LETTER CHILLU NN..MALAYALAM LETTER CHILLU K
+ 0x0d82: (0x0d82, 0x0d83, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA SIGN ANUSVARAYA..SINHALA SIGN VISARGAYA
+ 0x0d85: (0x0d85, 0x0d8e, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER AYANNA..SINHALA LETTER IRUUYANNA
+ 0x0d91: (0x0d91, 0x0d96, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER EYANNA..SINHALA LETTER AUYANNA
+ 0x0d9a: (0x0d9a, 0x0da5, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER ALPAPRAANA KAYANNA..SINHALA LETTER TAALUJA SANYOOGA NAAKSIKYAYA
+ 0x0da7: (0x0da7, 0x0db1, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER ALPAPRAANA TTAYANNA..SINHALA LETTER DANTAJA NAYANNA
+ 0x0db3: (0x0db3, 0x0dbb, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER SANYAKA DAYANNA..SINHALA LETTER RAYANNA
+ 0x0dbd: (0x0dbd, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER DANTAJA LAYANNA
+ 0x0dc0: (0x0dc0, 0x0dc6, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA LETTER VAYANNA..SINHALA LETTER FAYANNA
+ 0x0dca: (0x0dca, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA SIGN AL-LAKUNA
+ 0x0dcf: (0x0dcf, 0x0dd4, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN AELA-PILLA..SINHALA VOWEL SIGN KETTI PAA-PILLA
+ 0x0dd6: (0x0dd6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN DIGA PAA-PILLA
+ 0x0dd8: (0x0dd8, 0x0dde, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN GAETTA-PILLA..SINHALA VOWEL SIGN KOMBUVA HAA GAYANUKITTA
+ 0x0df2: (0x0df2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  SINHALA VOWEL SIGN DIGA GAETTA-PILLA
+ 0x0e01: (0x0e01, 0x0e32, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI CHARACTER KO KAI..THAI CHARACTER SARA AA
+ 0x0e34: (0x0e34, 0x0e3a, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI CHARACTER SARA I..THAI CHARACTER PHINTHU
+ 0x0e40: (0x0e40, 0x0e4e, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI CHARACTER SARA E..THAI CHARACTER YAMAKKAN
+ 0x0e50: (0x0e50, 0x0e59, 1,0,0,0,0,0,0,0,0,0,1,0), #  THAI DIGIT ZERO..THAI DIGIT NINE
+ 0x0e81: (0x0e81, 0x0e82, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER KO..LAO LETTER KHO SUNG
+ 0x0e84: (0x0e84, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER KHO TAM
+ 0x0e87: (0x0e87, 0x0e88, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER NGO..LAO LETTER CO
+ 0x0e8a: (0x0e8a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER SO TAM
+ 0x0e8d: (0x0e8d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER NYO
+ 0x0e94: (0x0e94, 0x0e97, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER DO..LAO LETTER THO TAM
+ 0x0e99: (0x0e99, 0x0e9f, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER NO..LAO LETTER FO SUNG
+ 0x0ea1: (0x0ea1, 0x0ea3, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER MO..LAO LETTER LO LING
+ 0x0ea5: (0x0ea5, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER LO LOOT
+ 0x0ea7: (0x0ea7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER WO
+ 0x0eaa: (0x0eaa, 0x0eab, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER SO SUNG..LAO LETTER HO SUNG
+ 0x0ead: (0x0ead, 0x0eb2, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER O..LAO VOWEL SIGN AA
+ 0x0eb4: (0x0eb4, 0x0eb9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO VOWEL SIGN I..LAO VOWEL SIGN UU
+ 0x0ebb: (0x0ebb, 0x0ebd, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO VOWEL SIGN MAI KON..LAO SEMIVOWEL SIGN NYO
+ 0x0ec0: (0x0ec0, 0x0ec4, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO VOWEL SIGN E..LAO VOWEL SIGN AI
+ 0x0ec6: (0x0ec6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO KO LA
+ 0x0ec8: (0x0ec8, 0x0ecd, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO TONE MAI EK..LAO NIGGAHITA
+ 0x0ed0: (0x0ed0, 0x0ed9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO DIGIT ZERO..LAO DIGIT NINE
+ 0x0ede: (0x0ede, 0x0edf, 1,0,0,0,0,0,0,0,0,0,1,0), #  LAO LETTER KHMU GO..LAO LETTER KHMU NYO
+ 0x0f00: (0x0f00, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SYLLABLE OM
+ 0x0f20: (0x0f20, 0x0f29, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN DIGIT ZERO..TIBETAN DIGIT NINE
+ 0x0f35: (0x0f35, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN MARK NGAS BZUNG NYI ZLA
+ 0x0f37: (0x0f37, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN MARK NGAS BZUNG SGOR RTAGS
+ 0x0f3e: (0x0f3e, 0x0f42, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN YAR TSHES..TIBETAN LETTER GA
+ 0x0f44: (0x0f44, 0x0f47, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NGA..TIBETAN LETTER JA
+ 0x0f49: (0x0f49, 0x0f4c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NYA..TIBETAN LETTER DDA
+ 0x0f4e: (0x0f4e, 0x0f51, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NNA..TIBETAN LETTER DA
+ 0x0f53: (0x0f53, 0x0f56, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER NA..TIBETAN LETTER BA
+ 0x0f58: (0x0f58, 0x0f5b, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER MA..TIBETAN LETTER DZA
+ 0x0f5d: (0x0f5d, 0x0f68, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER WA..TIBETAN LETTER A
+ 0x0f6a: (0x0f6a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER FIXED-FORM RA
+ 0x0f6b: (0x0f6b, 0x0f6c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN LETTER KKA..TIBETAN LETTER RRA
+ 0x0f71: (0x0f71, 0x0f72, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN VOWEL SIGN AA..TIBETAN VOWEL SIGN I
+ 0x0f74: (0x0f74, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN VOWEL SIGN U
+ 0x0f7a: (0x0f7a, 0x0f80, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN VOWEL SIGN E..TIBETAN VOWEL SIGN REVERSED I
+ 0x0f82: (0x0f82, 0x0f84, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN NYI ZLA NAA DA..TIBETAN MARK HALANTA
+ 0x0f86: (0x0f86, 0x0f8b, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN LCI RTAGS..TIBETAN SIGN GRU MED RGYINGS
+ 0x0f8c: (0x0f8c, 0x0f8f, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SIGN INVERTED MCHU CAN..TIBETAN SUBJOINED SIGN INVERTED MCHU CAN
+ 0x0f90: (0x0f90, 0x0f92, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER KA..TIBETAN SUBJOINED LETTER GA
+ 0x0f94: (0x0f94, 0x0f95, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NGA..TIBETAN SUBJOINED LETTER CA
+ 0x0f96: (0x0f96, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER CHA
+ 0x0f97: (0x0f97, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER JA
+ 0x0f99: (0x0f99, 0x0f9c, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NYA..TIBETAN SUBJOINED LETTER DDA
+ 0x0f9e: (0x0f9e, 0x0fa1, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NNA..TIBETAN SUBJOINED LETTER DA
+ 0x0fa3: (0x0fa3, 0x0fa6, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER NA..TIBETAN SUBJOINED LETTER BA
+ 0x0fa8: (0x0fa8, 0x0fab, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER MA..TIBETAN SUBJOINED LETTER DZA
+ 0x0fad: (0x0fad, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER WA
+ 0x0fae: (0x0fae, 0x0fb0, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER ZHA..TIBETAN SUBJOINED LETTER -A
+ 0x0fb1: (0x0fb1, 0x0fb7, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER YA..TIBETAN SUBJOINED LETTER HA
+ 0x0fb8: (0x0fb8, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER A
+ 0x0fba: (0x0fba, 0x0fbc, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SUBJOINED LETTER FIXED-FORM WA..TIBETAN SUBJOINED LETTER FIXED-FORM RA
+ 0x0fc6: (0x0fc6, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  TIBETAN SYMBOL PADMA GDAN
+ 0x1000: (0x1000, 0x1021, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER KA..MYANMAR LETTER A
+ 0x1022: (0x1022, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER SHAN A
+ 0x1023: (0x1023, 0x1027, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER I..MYANMAR LETTER E
+ 0x1028: (0x1028, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER MON E
+ 0x1029: (0x1029, 0x102a, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER O..MYANMAR LETTER AU
+ 0x102b: (0x102b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR VOWEL SIGN TALL AA
+ 0x102c: (0x102c, 0x1032, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR VOWEL SIGN AA..MYANMAR VOWEL SIGN AI
+ 0x1033: (0x1033, 0x1035, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR VOWEL SIGN MON II..MYANMAR VOWEL SIGN E ABOVE
+ 0x1036: (0x1036, 0x1039, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN ANUSVARA..MYANMAR SIGN VIRAMA
+ 0x103a: (0x103a, 0x103f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN ASAT..MYANMAR LETTER GREAT SA
+ 0x1040: (0x1040, 0x1049, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR DIGIT ZERO..MYANMAR DIGIT NINE
+ 0x1050: (0x1050, 0x1059, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER SHA..MYANMAR VOWEL SIGN VOCALIC LL
+ 0x105a: (0x105a, 0x1099, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER MON NGA..MYANMAR SHAN DIGIT NINE
+ 0x109a: (0x109a, 0x109d, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN KHAMTI TONE-1..MYANMAR VOWEL SIGN AITON AI
+ 0x10c7: (0x10c7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN CAPITAL LETTER YN
+ 0x10cd: (0x10cd, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN CAPITAL LETTER AEN
+ 0x10d0: (0x10d0, 0x10f0, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER AN..GEORGIAN LETTER HAE
+ 0x10f7: (0x10f7, 0x10f8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER YN..GEORGIAN LETTER ELIFI
+ 0x10f9: (0x10f9, 0x10fa, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER TURNED GAN..GEORGIAN LETTER AIN
+ 0x10fd: (0x10fd, 0x10ff, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN LETTER AEN..GEORGIAN LETTER LABIAL SIGN
+ 0x1200: (0x1200, 0x1206, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE HA..ETHIOPIC SYLLABLE HO
+ 0x1207: (0x1207, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE HOA
+ 0x1208: (0x1208, 0x1246, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE LA..ETHIOPIC SYLLABLE QO
+ 0x1247: (0x1247, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QOA
+ 0x1248: (0x1248, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QWA
+ 0x124a: (0x124a, 0x124d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QWI..ETHIOPIC SYLLABLE QWE
+ 0x1250: (0x1250, 0x1256, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QHA..ETHIOPIC SYLLABLE QHO
+ 0x1258: (0x1258, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QHWA
+ 0x125a: (0x125a, 0x125d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QHWI..ETHIOPIC SYLLABLE QHWE
+ 0x1260: (0x1260, 0x1286, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE BA..ETHIOPIC SYLLABLE XO
+ 0x1287: (0x1287, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XOA
+ 0x1288: (0x1288, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XWA
+ 0x128a: (0x128a, 0x128d, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XWI..ETHIOPIC SYLLABLE XWE
+ 0x1290: (0x1290, 0x12ae, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE NA..ETHIOPIC SYLLABLE KO
+ 0x12af: (0x12af, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KOA
+ 0x12b0: (0x12b0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KWA
+ 0x12b2: (0x12b2, 0x12b5, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KWI..ETHIOPIC SYLLABLE KWE
+ 0x12b8: (0x12b8, 0x12be, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KXA..ETHIOPIC SYLLABLE KXO
+ 0x12c0: (0x12c0, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KXWA
+ 0x12c2: (0x12c2, 0x12c5, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KXWI..ETHIOPIC SYLLABLE KXWE
+ 0x12c8: (0x12c8, 0x12ce, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE WA..ETHIOPIC SYLLABLE WO
+ 0x12cf: (0x12cf, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE WOA
+ 0x12d0: (0x12d0, 0x12d6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE PHARYNGEAL A..ETHIOPIC SYLLABLE PHARYNGEAL O
+ 0x12d8: (0x12d8, 0x12ee, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE ZA..ETHIOPIC SYLLABLE YO
+ 0x12ef: (0x12ef, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE YOA
+ 0x12f0: (0x12f0, 0x130e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE DA..ETHIOPIC SYLLABLE GO
+ 0x130f: (0x130f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GOA
+ 0x1310: (0x1310, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GWA
+ 0x1312: (0x1312, 0x1315, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GWI..ETHIOPIC SYLLABLE GWE
+ 0x1318: (0x1318, 0x131e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GGA..ETHIOPIC SYLLABLE GGO
+ 0x131f: (0x131f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GGWAA
+ 0x1320: (0x1320, 0x1346, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE THA..ETHIOPIC SYLLABLE TZO
+ 0x1347: (0x1347, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE TZOA
+ 0x1348: (0x1348, 0x135a, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE FA..ETHIOPIC SYLLABLE FYA
+ 0x135d: (0x135d, 0x135e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC COMBINING GEMINATION AND VOWEL LENGTH MARK..ETHIOPIC COMBINING VOWEL LENGTH MARK
+ 0x135f: (0x135f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC COMBINING GEMINATION MARK
+ 0x1380: (0x1380, 0x138f, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE SEBATBEIT MWA..ETHIOPIC SYLLABLE PWE
+ 0x1780: (0x1780, 0x17a2, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER LETTER KA..KHMER LETTER QA
+ 0x17a5: (0x17a5, 0x17a7, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER INDEPENDENT VOWEL QI..KHMER INDEPENDENT VOWEL QU
+ 0x17a9: (0x17a9, 0x17b3, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER INDEPENDENT VOWEL QUU..KHMER INDEPENDENT VOWEL QAU
+ 0x17b6: (0x17b6, 0x17ca, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER VOWEL SIGN AA..KHMER SIGN TRIISAP
+ 0x17d2: (0x17d2, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER SIGN COENG
+ 0x17d7: (0x17d7, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER SIGN LEK TOO
+ 0x17dc: (0x17dc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER SIGN AVAKRAHASANYA
+ 0x17e0: (0x17e0, 0x17e9, 1,0,0,0,0,0,0,0,0,0,1,0), #  KHMER DIGIT ZERO..KHMER DIGIT NINE
+ 0x1c80: (0x1c80, 0x1c88, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC SMALL LETTER ROUNDED VE..CYRILLIC SMALL LETTER UNBLENDED UK
+ 0x1c90: (0x1c90, 0x1cba, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN MTAVRULI CAPITAL LETTER AN..GEORGIAN MTAVRULI CAPITAL LETTER AIN
+ 0x1cbd: (0x1cbd, 0x1cbf, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN MTAVRULI CAPITAL LETTER AEN..GEORGIAN MTAVRULI CAPITAL LETTER LABIAL SIGN
+ 0x1e00: (0x1e00, 0x1e99, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH RING BELOW..LATIN SMALL LETTER Y WITH RING ABOVE
+ 0x1e9e: (0x1e9e, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER SHARP S
+ 0x1ea0: (0x1ea0, 0x1ef9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER A WITH DOT BELOW..LATIN SMALL LETTER Y WITH TILDE
+ 0x1f00: (0x1f00, 0x1f15, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ALPHA WITH PSILI..GREEK SMALL LETTER EPSILON WITH DASIA AND OXIA
+ 0x1f18: (0x1f18, 0x1f1d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER EPSILON WITH PSILI..GREEK CAPITAL LETTER EPSILON WITH DASIA AND OXIA
+ 0x1f20: (0x1f20, 0x1f45, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH PSILI..GREEK SMALL LETTER OMICRON WITH DASIA AND OXIA
+ 0x1f48: (0x1f48, 0x1f4d, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMICRON WITH PSILI..GREEK CAPITAL LETTER OMICRON WITH DASIA AND OXIA
+ 0x1f50: (0x1f50, 0x1f57, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER UPSILON WITH PSILI..GREEK SMALL LETTER UPSILON WITH DASIA AND PERISPOMENI
+ 0x1f59: (0x1f59, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA
+ 0x1f5b: (0x1f5b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND VARIA
+ 0x1f5d: (0x1f5d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND OXIA
+ 0x1f5f: (0x1f5f, 0x1f70, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER UPSILON WITH DASIA AND PERISPOMENI..GREEK SMALL LETTER ALPHA WITH VARIA
+ 0x1f72: (0x1f72, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER EPSILON WITH VARIA
+ 0x1f74: (0x1f74, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH VARIA
+ 0x1f76: (0x1f76, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER IOTA WITH VARIA
+ 0x1f78: (0x1f78, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMICRON WITH VARIA
+ 0x1f7a: (0x1f7a, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER UPSILON WITH VARIA
+ 0x1f7c: (0x1f7c, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMEGA WITH VARIA
+ 0x1f80: (0x1f80, 0x1fb4, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ALPHA WITH PSILI AND YPOGEGRAMMENI..GREEK SMALL LETTER ALPHA WITH OXIA AND YPOGEGRAMMENI
+ 0x1fb6: (0x1fb6, 0x1fba, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ALPHA WITH PERISPOMENI..GREEK CAPITAL LETTER ALPHA WITH VARIA
+ 0x1fbc: (0x1fbc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ALPHA WITH PROSGEGRAMMENI
+ 0x1fc2: (0x1fc2, 0x1fc4, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER ETA WITH OXIA AND YPOGEGRAMMENI
+ 0x1fc6: (0x1fc6, 0x1fc8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER ETA WITH PERISPOMENI..GREEK CAPITAL LETTER EPSILON WITH VARIA
+ 0x1fca: (0x1fca, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ETA WITH VARIA
+ 0x1fcc: (0x1fcc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER ETA WITH PROSGEGRAMMENI
+ 0x1fd0: (0x1fd0, 0x1fd2, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER IOTA WITH VRACHY..GREEK SMALL LETTER IOTA WITH DIALYTIKA AND VARIA
+ 0x1fd6: (0x1fd6, 0x1fda, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER IOTA WITH PERISPOMENI..GREEK CAPITAL LETTER IOTA WITH VARIA
+ 0x1fe0: (0x1fe0, 0x1fe2, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER UPSILON WITH VRACHY..GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND VARIA
+ 0x1fe4: (0x1fe4, 0x1fea, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER RHO WITH PSILI..GREEK CAPITAL LETTER UPSILON WITH VARIA
+ 0x1fec: (0x1fec, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER RHO WITH DASIA
+ 0x1ff2: (0x1ff2, 0x1ff4, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMEGA WITH VARIA AND YPOGEGRAMMENI..GREEK SMALL LETTER OMEGA WITH OXIA AND YPOGEGRAMMENI
+ 0x1ff6: (0x1ff6, 0x1ff8, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK SMALL LETTER OMEGA WITH PERISPOMENI..GREEK CAPITAL LETTER OMICRON WITH VARIA
+ 0x1ffa: (0x1ffa, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMEGA WITH VARIA
+ 0x1ffc: (0x1ffc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GREEK CAPITAL LETTER OMEGA WITH PROSGEGRAMMENI
+ 0x2d27: (0x2d27, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN SMALL LETTER YN
+ 0x2d2d: (0x2d2d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  GEORGIAN SMALL LETTER AEN
+ 0x2d80: (0x2d80, 0x2d96, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE LOA..ETHIOPIC SYLLABLE GGWE
+ 0x2da0: (0x2da0, 0x2da6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE SSA..ETHIOPIC SYLLABLE SSO
+ 0x2da8: (0x2da8, 0x2dae, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE CCA..ETHIOPIC SYLLABLE CCO
+ 0x2db0: (0x2db0, 0x2db6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE ZZA..ETHIOPIC SYLLABLE ZZO
+ 0x2db8: (0x2db8, 0x2dbe, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE CCHA..ETHIOPIC SYLLABLE CCHO
+ 0x2dc0: (0x2dc0, 0x2dc6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE QYA..ETHIOPIC SYLLABLE QYO
+ 0x2dc8: (0x2dc8, 0x2dce, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE KYA..ETHIOPIC SYLLABLE KYO
+ 0x2dd0: (0x2dd0, 0x2dd6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE XYA..ETHIOPIC SYLLABLE XYO
+ 0x2dd8: (0x2dd8, 0x2dde, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE GYA..ETHIOPIC SYLLABLE GYO
+ 0x3005: (0x3005, 0x3007, 1,0,0,0,0,0,0,0,0,0,1,0), #  IDEOGRAPHIC ITERATION MARK..IDEOGRAPHIC NUMBER ZERO
+ 0x3041: (0x3041, 0x3094, 1,0,0,0,0,0,0,0,0,0,1,0), #  HIRAGANA LETTER SMALL A..HIRAGANA LETTER VU
+ 0x3095: (0x3095, 0x3096, 1,0,0,0,0,0,0,0,0,0,1,0), #  HIRAGANA LETTER SMALL KA..HIRAGANA LETTER SMALL KE
+ 0x3099: (0x3099, 0x309a, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING KATAKANA-HIRAGANA VOICED SOUND MARK..COMBINING KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK
+ 0x309d: (0x309d, 0x309e, 1,0,0,0,0,0,0,0,0,0,1,0), #  HIRAGANA ITERATION MARK..HIRAGANA VOICED ITERATION MARK
+ 0x30a1: (0x30a1, 0x30fa, 1,0,0,0,0,0,0,0,0,0,1,0), #  KATAKANA LETTER SMALL A..KATAKANA LETTER VO
+ 0x30fc: (0x30fc, 0x30fe, 1,0,0,0,0,0,0,0,0,0,1,0), #  KATAKANA-HIRAGANA PROLONGED SOUND MARK..KATAKANA VOICED ITERATION MARK
+ 0x3105: (0x3105, 0x312c, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER B..BOPOMOFO LETTER GN
+ 0x312d: (0x312d, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER IH
+ 0x312e: (0x312e, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER O WITH DOT ABOVE
+ 0x312f: (0x312f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER NN
+ 0x31a0: (0x31a0, 0x31b7, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER BU..BOPOMOFO FINAL LETTER H
+ 0x31b8: (0x31b8, 0x31ba, 1,0,0,0,0,0,0,0,0,0,1,0), #  BOPOMOFO LETTER GH..BOPOMOFO LETTER ZY
+ 0x3400: (0x3400, 0x4db5, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-3400..CJK UNIFIED IDEOGRAPH-4DB5
+ 0x4e00: (0x4e00, 0x9fa5, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] CJK UNIFIED IDEOGRAPH-4E00..CJK UNIFIED IDEOGRAPH-9FA5
+ 0x9fa6: (0x9fa6, 0x9fbb, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FA6..CJK UNIFIED IDEOGRAPH-9FBB
+ 0x9fbc: (0x9fbc, 0x9fc3, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FBC..CJK UNIFIED IDEOGRAPH-9FC3
+ 0x9fc4: (0x9fc4, 0x9fcb, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FC4..CJK UNIFIED IDEOGRAPH-9FCB
+ 0x9fcc: (0x9fcc, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FCC
+ 0x9fcd: (0x9fcd, 0x9fd5, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FCD..CJK UNIFIED IDEOGRAPH-9FD5
+ 0x9fd6: (0x9fd6, 0x9fea, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FD6..CJK UNIFIED IDEOGRAPH-9FEA
+ 0x9feb: (0x9feb, 0x9fef, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-9FEB..CJK UNIFIED IDEOGRAPH-9FEF
+ 0xa660: (0xa660, 0xa661, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC CAPITAL LETTER REVERSED TSE..CYRILLIC SMALL LETTER REVERSED TSE
+ 0xa674: (0xa674, 0xa67b, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING CYRILLIC LETTER UKRAINIAN IE..COMBINING CYRILLIC LETTER OMEGA
+ 0xa67f: (0xa67f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CYRILLIC PAYEROK
+ 0xa69f: (0xa69f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING CYRILLIC LETTER IOTIFIED E
+ 0xa717: (0xa717, 0xa71a, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER DOT VERTICAL BAR..MODIFIER LETTER LOWER RIGHT CORNER ANGLE
+ 0xa71b: (0xa71b, 0xa71f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER RAISED UP ARROW..MODIFIER LETTER LOW INVERTED EXCLAMATION MARK
+ 0xa788: (0xa788, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  MODIFIER LETTER LOW CIRCUMFLEX ACCENT
+ 0xa78d: (0xa78d, 0xa78e, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER TURNED H..LATIN SMALL LETTER L WITH RETROFLEX HOOK AND BELT
+ 0xa790: (0xa790, 0xa791, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER N WITH DESCENDER..LATIN SMALL LETTER N WITH DESCENDER
+ 0xa792: (0xa792, 0xa793, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER C WITH BAR..LATIN SMALL LETTER C WITH BAR
+ 0xa7a0: (0xa7a0, 0xa7a9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER G WITH OBLIQUE STROKE..LATIN SMALL LETTER S WITH OBLIQUE STROKE
+ 0xa7aa: (0xa7aa, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER H WITH HOOK
+ 0xa7ae: (0xa7ae, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER SMALL CAPITAL I
+ 0xa7af: (0xa7af, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN LETTER SMALL CAPITAL Q
+ 0xa7b8: (0xa7b8, 0xa7b9, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN CAPITAL LETTER U WITH STROKE..LATIN SMALL LETTER U WITH STROKE
+ 0xa7fa: (0xa7fa, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  LATIN LETTER SMALL CAPITAL TURNED M
+ 0xa9e7: (0xa9e7, 0xa9fe, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER TAI LAING NYA..MYANMAR LETTER TAI LAING BHA
+ 0xaa60: (0xaa60, 0xaa76, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER KHAMTI GA..MYANMAR LOGOGRAM KHAMTI HM
+ 0xaa7a: (0xaa7a, 0xaa7b, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR LETTER AITON RA..MYANMAR SIGN PAO KAREN TONE
+ 0xaa7c: (0xaa7c, 0xaa7f, 1,0,0,0,0,0,0,0,0,0,1,0), #  MYANMAR SIGN TAI LAING TONE-2..MYANMAR LETTER SHWE PALAUNG SHA
+ 0xab01: (0xab01, 0xab06, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE TTHU..ETHIOPIC SYLLABLE TTHO
+ 0xab09: (0xab09, 0xab0e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE DDHU..ETHIOPIC SYLLABLE DDHO
+ 0xab11: (0xab11, 0xab16, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE DZU..ETHIOPIC SYLLABLE DZO
+ 0xab20: (0xab20, 0xab26, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE CCHHA..ETHIOPIC SYLLABLE CCHHO
+ 0xab28: (0xab28, 0xab2e, 1,0,0,0,0,0,0,0,0,0,1,0), #  ETHIOPIC SYLLABLE BBA..ETHIOPIC SYLLABLE BBO
+ 0xac00: (0xac00, 0xd7a3, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] HANGUL SYLLABLE GA..HANGUL SYLLABLE HIH
+ 0xfa0e: (0xfa0e, 0xfa0f, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA0E..CJK COMPATIBILITY IDEOGRAPH-FA0F
+ 0xfa11: (0xfa11, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA11
+ 0xfa13: (0xfa13, 0xfa14, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA13..CJK COMPATIBILITY IDEOGRAPH-FA14
+ 0xfa1f: (0xfa1f, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA1F
+ 0xfa21: (0xfa21, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA21
+ 0xfa23: (0xfa23, 0xfa24, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA23..CJK COMPATIBILITY IDEOGRAPH-FA24
+ 0xfa27: (0xfa27, 0xfa29, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK COMPATIBILITY IDEOGRAPH-FA27..CJK COMPATIBILITY IDEOGRAPH-FA29
+ 0x1133b: (0x1133b, None, 1,0,0,0,0,0,0,0,0,0,1,0), #  COMBINING BINDU BELOW
+ 0x1b002: (0x1b002, 0x1b11e, 1,0,0,0,0,0,0,0,0,0,1,0), #  HENTAIGANA LETTER A-1..HENTAIGANA LETTER N-MU-MO-2
+ 0x20000: (0x20000, 0x2a6d6, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] CJK UNIFIED IDEOGRAPH-20000..CJK UNIFIED IDEOGRAPH-2A6D6
+ 0x2a700: (0x2a700, 0x2b734, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-2A700..CJK UNIFIED IDEOGRAPH-2B734
+ 0x2b740: (0x2b740, 0x2b81d, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-2B740..CJK UNIFIED IDEOGRAPH-2B81D
+ 0x2b820: (0x2b820, 0x2cea1, 1,0,0,0,0,0,0,0,0,0,1,0), #  CJK UNIFIED IDEOGRAPH-2B820..CJK UNIFIED IDEOGRAPH-2CEA1
+ 0x2ceb0: (0x2ceb0, 0x2ebe0, 1,0,0,0,0,0,0,0,0,0,1,0), #  ] CJK UNIFIED IDEOGRAPH-2CEB0..CJK UNIFIED IDEOGRAPH-2EBE0
+ 0x0027: (0x0027, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  APOSTROPHE
+ 0x002d: (0x002d, 0x002e, 1,0,0,0,1,0,0,0,0,0,0,0), #  HYPHEN-MINUS..FULL STOP
+ 0x003a: (0x003a, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  COLON
+ 0x00b7: (0x00b7, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  MIDDLE DOT
+ 0x0375: (0x0375, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  GREEK LOWER NUMERAL SIGN
+ 0x058a: (0x058a, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  ARMENIAN HYPHEN
+ 0x05f3: (0x05f3, 0x05f4, 1,0,0,0,1,0,0,0,0,0,0,0), #  HEBREW PUNCTUATION GERESH..HEBREW PUNCTUATION GERSHAYIM
+ 0x06fd: (0x06fd, 0x06fe, 1,0,0,0,1,0,0,0,0,0,0,0), #  ARABIC SIGN SINDHI AMPERSAND..ARABIC SIGN SINDHI POSTPOSITION MEN
+ 0x0f0b: (0x0f0b, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  TIBETAN MARK INTERSYLLABIC TSHEG
+ 0x200c: (0x200c, 0x200d, 1,0,0,0,1,0,0,0,0,0,0,0), #  ZERO WIDTH NON-JOINER..ZERO WIDTH JOINER
+ 0x2010: (0x2010, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  HYPHEN
+ 0x2019: (0x2019, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  RIGHT SINGLE QUOTATION MARK
+ 0x2027: (0x2027, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  HYPHENATION POINT
+ 0x30a0: (0x30a0, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  KATAKANA-HIRAGANA DOUBLE HYPHEN
+ 0x30fb: (0x30fb, None, 1,0,0,0,1,0,0,0,0,0,0,0), #  KATAKANA MIDDLE DOT
+ 0x0710: (0x0710, 0x072c, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER ALAPH..SYRIAC LETTER TAW
+ 0x072d: (0x072d, 0x072f, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER PERSIAN BHETH..SYRIAC LETTER PERSIAN DHALATH
+ 0x0730: (0x0730, 0x073f, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC PTHAHA ABOVE..SYRIAC RWAHA
+ 0x074d: (0x074d, 0x074f, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER SOGDIAN ZHAIN..SYRIAC LETTER SOGDIAN FE
+ 0x07c0: (0x07c0, 0x07e7, 0,0,0,0,0,0,1,0,0,0,0,0), #  NKO DIGIT ZERO..NKO LETTER NYA WOLOSO
+ 0x07eb: (0x07eb, 0x07f5, 0,0,0,0,0,0,1,0,0,0,0,0), #  NKO COMBINING SHORT HIGH TONE..NKO LOW TONE APOSTROPHE
+ 0x07fd: (0x07fd, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  NKO DANTAYALAN
+ 0x0840: (0x0840, 0x085b, 0,0,0,0,0,0,1,0,0,0,0,0), #  MANDAIC LETTER HALQA..MANDAIC GEMINATION MARK
+ 0x0860: (0x0860, 0x086a, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYRIAC LETTER MALAYALAM NGA..SYRIAC LETTER MALAYALAM SSA
+ 0x13a0: (0x13a0, 0x13f4, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE LETTER A..CHEROKEE LETTER YV
+ 0x13f5: (0x13f5, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE LETTER MV
+ 0x13f8: (0x13f8, 0x13fd, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE SMALL LETTER YE..CHEROKEE SMALL LETTER MV
+ 0x1401: (0x1401, 0x166c, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS E..CANADIAN SYLLABICS CARRIER TTSA
+ 0x166f: (0x166f, 0x1676, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS QAI..CANADIAN SYLLABICS NNGAA
+ 0x1677: (0x1677, 0x167f, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS WOODS-CREE THWEE..CANADIAN SYLLABICS BLACKFOOT W
+ 0x18b0: (0x18b0, 0x18f5, 0,0,0,0,0,0,1,0,0,0,0,0), #  CANADIAN SYLLABICS OY..CANADIAN SYLLABICS CARRIER DENTAL S
+ 0x1900: (0x1900, 0x191c, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU VOWEL-CARRIER LETTER..LIMBU LETTER HA
+ 0x191d: (0x191d, 0x191e, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU LETTER GYAN..LIMBU LETTER TRA
+ 0x1920: (0x1920, 0x192b, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU VOWEL SIGN A..LIMBU SUBJOINED LETTER WA
+ 0x1930: (0x1930, 0x193b, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU SMALL LETTER KA..LIMBU SIGN SA-I
+ 0x1946: (0x1946, 0x196d, 0,0,0,0,0,0,1,0,0,0,0,0), #  LIMBU DIGIT ZERO..TAI LE LETTER AI
+ 0x1970: (0x1970, 0x1974, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI LE LETTER TONE-2..TAI LE LETTER TONE-6
+ 0x1980: (0x1980, 0x19a9, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE LETTER HIGH QA..NEW TAI LUE LETTER LOW XVA
+ 0x19aa: (0x19aa, 0x19ab, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE LETTER HIGH SUA..NEW TAI LUE LETTER LOW SUA
+ 0x19b0: (0x19b0, 0x19c9, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE VOWEL SIGN VOWEL SHORTENER..NEW TAI LUE TONE MARK-2
+ 0x19d0: (0x19d0, 0x19d9, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE DIGIT ZERO..NEW TAI LUE DIGIT NINE
+ 0x19da: (0x19da, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEW TAI LUE THAM DIGIT ONE
+ 0x1a20: (0x1a20, 0x1a5e, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM LETTER HIGH KA..TAI THAM CONSONANT SIGN SA
+ 0x1a60: (0x1a60, 0x1a7c, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM SIGN SAKOT..TAI THAM SIGN KHUEN-LUE KARAN
+ 0x1a7f: (0x1a7f, 0x1a89, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM COMBINING CRYPTOGRAMMIC DOT..TAI THAM HORA DIGIT NINE
+ 0x1a90: (0x1a90, 0x1a99, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM THAM DIGIT ZERO..TAI THAM THAM DIGIT NINE
+ 0x1aa7: (0x1aa7, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI THAM SIGN MAI YAMOK
+ 0x1b00: (0x1b00, 0x1b4b, 0,0,0,0,0,0,1,0,0,0,0,0), #  BALINESE SIGN ULU RICEM..BALINESE LETTER ASYURA SASAK
+ 0x1b50: (0x1b50, 0x1b59, 0,0,0,0,0,0,1,0,0,0,0,0), #  BALINESE DIGIT ZERO..BALINESE DIGIT NINE
+ 0x1b6b: (0x1b6b, 0x1b73, 0,0,0,0,0,0,1,0,0,0,0,0), #  BALINESE MUSICAL SYMBOL COMBINING TEGEH..BALINESE MUSICAL SYMBOL COMBINING GONG
+ 0x1b80: (0x1b80, 0x1baa, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE SIGN PANYECEK..SUNDANESE SIGN PAMAAEH
+ 0x1bab: (0x1bab, 0x1bad, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE SIGN VIRAMA..SUNDANESE CONSONANT SIGN PASANGAN WA
+ 0x1bae: (0x1bae, 0x1bb9, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE LETTER KHA..SUNDANESE DIGIT NINE
+ 0x1bba: (0x1bba, 0x1bbf, 0,0,0,0,0,0,1,0,0,0,0,0), #  SUNDANESE AVAGRAHA..SUNDANESE LETTER FINAL M
+ 0x1bc0: (0x1bc0, 0x1bf3, 0,0,0,0,0,0,1,0,0,0,0,0), #  BATAK LETTER A..BATAK PANONGONAN
+ 0x1c00: (0x1c00, 0x1c37, 0,0,0,0,0,0,1,0,0,0,0,0), #  LEPCHA LETTER KA..LEPCHA SIGN NUKTA
+ 0x1c40: (0x1c40, 0x1c49, 0,0,0,0,0,0,1,0,0,0,0,0), #  LEPCHA DIGIT ZERO..LEPCHA DIGIT NINE
+ 0x1c4d: (0x1c4d, 0x1c7d, 0,0,0,0,0,0,1,0,0,0,0,0), #  LEPCHA LETTER TTA..OL CHIKI AHAD
+ 0x2d30: (0x2d30, 0x2d65, 0,0,0,0,0,0,1,0,0,0,0,0), #  TIFINAGH LETTER YA..TIFINAGH LETTER YAZZ
+ 0x2d66: (0x2d66, 0x2d67, 0,0,0,0,0,0,1,0,0,0,0,0), #  TIFINAGH LETTER YE..TIFINAGH LETTER YO
+ 0x2d7f: (0x2d7f, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  TIFINAGH CONSONANT JOINER
+ 0xa000: (0xa000, 0xa48c, 0,0,0,0,0,0,1,0,0,0,0,0), #  YI SYLLABLE IT..YI SYLLABLE YYR
+ 0xa4d0: (0xa4d0, 0xa4fd, 0,0,0,0,0,0,1,0,0,0,0,0), #  LISU LETTER BA..LISU LETTER TONE MYA JEU
+ 0xa500: (0xa500, 0xa60c, 0,0,0,0,0,0,1,0,0,0,0,0), #  VAI SYLLABLE EE..VAI SYLLABLE LENGTHENER
+ 0xa613: (0xa613, 0xa629, 0,0,0,0,0,0,1,0,0,0,0,0), #  VAI SYMBOL FEENG..VAI DIGIT NINE
+ 0xa6a0: (0xa6a0, 0xa6f1, 0,0,0,0,0,0,1,0,0,0,0,0), #  BAMUM LETTER A..BAMUM COMBINING MARK TUKWENTIS
+ 0xa800: (0xa800, 0xa827, 0,0,0,0,0,0,1,0,0,0,0,0), #  SYLOTI NAGRI LETTER A..SYLOTI NAGRI VOWEL SIGN OO
+ 0xa880: (0xa880, 0xa8c4, 0,0,0,0,0,0,1,0,0,0,0,0), #  SAURASHTRA SIGN ANUSVARA..SAURASHTRA SIGN VIRAMA
+ 0xa8c5: (0xa8c5, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  SAURASHTRA SIGN CANDRABINDU
+ 0xa8d0: (0xa8d0, 0xa8d9, 0,0,0,0,0,0,1,0,0,0,0,0), #  SAURASHTRA DIGIT ZERO..SAURASHTRA DIGIT NINE
+ 0xa900: (0xa900, 0xa92d, 0,0,0,0,0,0,1,0,0,0,0,0), #  KAYAH LI DIGIT ZERO..KAYAH LI TONE CALYA PLOPHU
+ 0xa980: (0xa980, 0xa9c0, 0,0,0,0,0,0,1,0,0,0,0,0), #  JAVANESE SIGN PANYANGGA..JAVANESE PANGKON
+ 0xa9d0: (0xa9d0, 0xa9d9, 0,0,0,0,0,0,1,0,0,0,0,0), #  JAVANESE DIGIT ZERO..JAVANESE DIGIT NINE
+ 0xaa00: (0xaa00, 0xaa36, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAM LETTER A..CHAM CONSONANT SIGN WA
+ 0xaa40: (0xaa40, 0xaa4d, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAM LETTER FINAL K..CHAM CONSONANT SIGN FINAL H
+ 0xaa50: (0xaa50, 0xaa59, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAM DIGIT ZERO..CHAM DIGIT NINE
+ 0xaa80: (0xaa80, 0xaac2, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI VIET LETTER LOW KO..TAI VIET TONE MAI SONG
+ 0xaadb: (0xaadb, 0xaadd, 0,0,0,0,0,0,1,0,0,0,0,0), #  TAI VIET SYMBOL KON..TAI VIET SYMBOL SAM
+ 0xaae0: (0xaae0, 0xaaef, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK LETTER E..MEETEI MAYEK VOWEL SIGN AAU
+ 0xaaf2: (0xaaf2, 0xaaf6, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK ANJI..MEETEI MAYEK VIRAMA
+ 0xab70: (0xab70, 0xabbf, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHEROKEE SMALL LETTER A..CHEROKEE SMALL LETTER YA
+ 0xabc0: (0xabc0, 0xabea, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK LETTER KOK..MEETEI MAYEK VOWEL SIGN NUNG
+ 0xabec: (0xabec, 0xabed, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK LUM IYEK..MEETEI MAYEK APUN IYEK
+ 0xabf0: (0xabf0, 0xabf9, 0,0,0,0,0,0,1,0,0,0,0,0), #  MEETEI MAYEK DIGIT ZERO..MEETEI MAYEK DIGIT NINE
+ 0x104b0: (0x104b0, 0x104d3, 0,0,0,0,0,0,1,0,0,0,0,0), #  OSAGE CAPITAL LETTER A..OSAGE CAPITAL LETTER ZHA
+ 0x104d8: (0x104d8, 0x104fb, 0,0,0,0,0,0,1,0,0,0,0,0), #  OSAGE SMALL LETTER A..OSAGE SMALL LETTER ZHA
+ 0x10d00: (0x10d00, 0x10d27, 0,0,0,0,0,0,1,0,0,0,0,0), #  HANIFI ROHINGYA LETTER A..HANIFI ROHINGYA SIGN TASSI
+ 0x10d30: (0x10d30, 0x10d39, 0,0,0,0,0,0,1,0,0,0,0,0), #  HANIFI ROHINGYA DIGIT ZERO..HANIFI ROHINGYA DIGIT NINE
+ 0x11100: (0x11100, 0x11134, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAKMA SIGN CANDRABINDU..CHAKMA MAAYYAA
+ 0x11136: (0x11136, 0x1113f, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAKMA DIGIT ZERO..CHAKMA DIGIT NINE
+ 0x11144: (0x11144, 0x11146, 0,0,0,0,0,0,1,0,0,0,0,0), #  CHAKMA LETTER LHAA..CHAKMA VOWEL SIGN EI
+ 0x11400: (0x11400, 0x1144a, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEWA LETTER A..NEWA SIDDHI
+ 0x11450: (0x11450, 0x11459, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEWA DIGIT ZERO..NEWA DIGIT NINE
+ 0x1145e: (0x1145e, None, 0,0,0,0,0,0,1,0,0,0,0,0), #  NEWA SANDHI MARK
+ 0x11d60: (0x11d60, 0x11d65, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI LETTER A..GUNJALA GONDI LETTER UU
+ 0x11d67: (0x11d67, 0x11d68, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI LETTER EE..GUNJALA GONDI LETTER AI
+ 0x11d6a: (0x11d6a, 0x11d8e, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI LETTER OO..GUNJALA GONDI VOWEL SIGN UU
+ 0x11d90: (0x11d90, 0x11d91, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI VOWEL SIGN EE..GUNJALA GONDI VOWEL SIGN AI
+ 0x11d93: (0x11d93, 0x11d98, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI VOWEL SIGN OO..GUNJALA GONDI OM
+ 0x11da0: (0x11da0, 0x11da9, 0,0,0,0,0,0,1,0,0,0,0,0), #  GUNJALA GONDI DIGIT ZERO..GUNJALA GONDI DIGIT NINE
+ 0x16800: (0x16800, 0x16a38, 0,0,0,0,0,0,1,0,0,0,0,0), #  BAMUM LETTER PHASE-A NGKUE MFON..BAMUM LETTER PHASE-F VUEQ
+ 0x16f00: (0x16f00, 0x16f44, 0,0,0,0,0,0,1,0,0,0,0,0), #  MIAO LETTER PA..MIAO LETTER HHA
+ 0x16f50: (0x16f50, 0x16f7e, 0,0,0,0,0,0,1,0,0,0,0,0), #  MIAO LETTER NASALIZATION..MIAO VOWEL SIGN NG
+ 0x16f8f: (0x16f8f, 0x16f9f, 0,0,0,0,0,0,1,0,0,0,0,0), #  MIAO TONE RIGHT..MIAO LETTER REFORMED TONE-8
+ 0x1e900: (0x1e900, 0x1e94a, 0,0,0,0,0,0,1,0,0,0,0,0), #  ADLAM CAPITAL LETTER ALIF..ADLAM NUKTA
+ 0x1e950: (0x1e950, 0x1e959, 0,0,0,0,0,0,1,0,0,0,0,0), #  ADLAM DIGIT ZERO..ADLAM DIGIT NINE
+ 0x18a9: (0x18a9, None, 0,0,0,0,0,1,1,1,0,0,0,0), #  MONGOLIAN LETTER ALI GALI DAGALGA
+ 0x0740: (0x0740, 0x074a, 0,0,1,0,0,0,1,0,0,0,0,0), #  SYRIAC FEMININE DOT..SYRIAC BARREKH
+ 0x07fa: (0x07fa, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  NKO LAJANYALAN
+ 0x1810: (0x1810, 0x1819, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN DIGIT ZERO..MONGOLIAN DIGIT NINE
+ 0x1820: (0x1820, 0x1877, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER A..MONGOLIAN LETTER MANCHU ZHA
+ 0x1878: (0x1878, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER CHA WITH TWO DOTS
+ 0x1880: (0x1880, 0x18a8, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER ALI GALI ANUSVARA ONE..MONGOLIAN LETTER MANCHU ALI GALI BHA
+ 0x18aa: (0x18aa, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  MONGOLIAN LETTER MANCHU ALI GALI LHA
+ 0xa9cf: (0xa9cf, None, 0,0,0,0,0,1,1,0,0,0,0,0), #  JAVANESE PANGRANGKEP
+ 0x1800: (0x1800, 0x1801, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN BIRGA..MONGOLIAN ELLIPSIS
+ 0x1804: (0x1804, None, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN COLON
+ 0x1806: (0x1806, 0x180a, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN TODO SOFT HYPHEN..MONGOLIAN NIRUGU
+ 0x11660: (0x11660, 0x1166c, 0,0,0,0,0,1,1,0,0,1,0,0), #  MONGOLIAN BIRGA WITH ORNAMENT..MONGOLIAN TURNED SWIRL BIRGA WITH DOUBLE ORNAMENT
+ 0x180e: (0x180e, None, 0,0,0,0,0,1,1,0,0,1,0,1), #  MONGOLIAN VOWEL SEPARATOR
+ 0x180b: (0x180b, 0x180d, 0,0,0,0,0,1,1,0,0,0,0,1), #  MONGOLIAN FREE VARIATION SELECTOR ONE..MONGOLIAN FREE VARIATION SELECTOR THREE
+ 0x07e8: (0x07e8, 0x07ea, 0,0,0,1,0,0,1,0,0,0,0,0), #  NKO LETTER JONA JA..NKO LETTER JONA RA
+ 0xa610: (0xa610, 0xa612, 0,0,0,1,0,0,1,0,0,0,0,0), #  VAI SYLLABLE NDOLE FA..VAI SYLLABLE NDOLE SOO
+ 0xa62a: (0xa62a, 0xa62b, 0,0,0,1,0,0,1,0,0,0,0,0), #  VAI SYLLABLE NDOLE MA..VAI SYLLABLE NDOLE DO
+ 0x0700: (0x0700, 0x070d, 0,0,0,0,0,0,1,0,0,1,0,0), #  SYRIAC END OF PARAGRAPH..SYRIAC HARKLEAN ASTERISCUS
+ 0x070f: (0x070f, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  SYRIAC ABBREVIATION MARK
+ 0x07f6: (0x07f6, 0x07f9, 0,0,0,0,0,0,1,0,0,1,0,0), #  NKO SYMBOL OO DENNEN..NKO EXCLAMATION MARK
+ 0x07fe: (0x07fe, 0x07ff, 0,0,0,0,0,0,1,0,0,1,0,0), #  NKO DOROME SIGN..NKO TAMAN SIGN
+ 0x085e: (0x085e, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  MANDAIC PUNCTUATION
+ 0x1400: (0x1400, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  CANADIAN SYLLABICS HYPHEN
+ 0x166d: (0x166d, 0x166e, 0,0,0,0,0,0,1,0,0,1,0,0), #  CANADIAN SYLLABICS CHI SIGN..CANADIAN SYLLABICS FULL STOP
+ 0x1940: (0x1940, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  LIMBU SIGN LOO
+ 0x1944: (0x1944, 0x1945, 0,0,0,0,0,0,1,0,0,1,0,0), #  LIMBU EXCLAMATION MARK..LIMBU QUESTION MARK
+ 0x19de: (0x19de, 0x19df, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEW TAI LUE SIGN LAE..NEW TAI LUE SIGN LAEV
+ 0x1aa0: (0x1aa0, 0x1aa6, 0,0,0,0,0,0,1,0,0,1,0,0), #  TAI THAM SIGN WIANG..TAI THAM SIGN REVERSED ROTATED RANA
+ 0x1aa8: (0x1aa8, 0x1aad, 0,0,0,0,0,0,1,0,0,1,0,0), #  TAI THAM SIGN KAAN..TAI THAM SIGN CAANG
+ 0x1b5a: (0x1b5a, 0x1b6a, 0,0,0,0,0,0,1,0,0,1,0,0), #  BALINESE PANTI..BALINESE MUSICAL SYMBOL DANG GEDE
+ 0x1b74: (0x1b74, 0x1b7c, 0,0,0,0,0,0,1,0,0,1,0,0), #  BALINESE MUSICAL SYMBOL RIGHT-HAND OPEN DUG..BALINESE MUSICAL SYMBOL LEFT-HAND OPEN PING
+ 0x1bfc: (0x1bfc, 0x1bff, 0,0,0,0,0,0,1,0,0,1,0,0), #  BATAK SYMBOL BINDU NA METEK..BATAK SYMBOL BINDU PANGOLAT
+ 0x1c3b: (0x1c3b, 0x1c3f, 0,0,0,0,0,0,1,0,0,1,0,0), #  LEPCHA PUNCTUATION TA-ROL..LEPCHA PUNCTUATION TSHOOK
+ 0x1c7e: (0x1c7e, 0x1c7f, 0,0,0,0,0,0,1,0,0,1,0,0), #  OL CHIKI PUNCTUATION MUCAAD..OL CHIKI PUNCTUATION DOUBLE MUCAAD
+ 0x1cc0: (0x1cc0, 0x1cc7, 0,0,0,0,0,0,1,0,0,1,0,0), #  SUNDANESE PUNCTUATION BINDU SURYA..SUNDANESE PUNCTUATION BINDU BA SATANGA
+ 0x2d70: (0x2d70, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  TIFINAGH SEPARATOR MARK
+ 0xa490: (0xa490, 0xa4a1, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL QOT..YI RADICAL GA
+ 0xa4a2: (0xa4a2, 0xa4a3, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL ZUP..YI RADICAL CYT
+ 0xa4a4: (0xa4a4, 0xa4b3, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL DDUR..YI RADICAL JO
+ 0xa4b4: (0xa4b4, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL NZUP
+ 0xa4b5: (0xa4b5, 0xa4c0, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL JJY..YI RADICAL SHAT
+ 0xa4c1: (0xa4c1, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL ZUR
+ 0xa4c2: (0xa4c2, 0xa4c4, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL SHOP..YI RADICAL ZZIET
+ 0xa4c5: (0xa4c5, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL NBIE
+ 0xa4c6: (0xa4c6, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  YI RADICAL KE
+ 0xa4fe: (0xa4fe, 0xa4ff, 0,0,0,0,0,0,1,0,0,1,0,0), #  LISU PUNCTUATION COMMA..LISU PUNCTUATION FULL STOP
+ 0xa60d: (0xa60d, 0xa60f, 0,0,0,0,0,0,1,0,0,1,0,0), #  VAI COMMA..VAI QUESTION MARK
+ 0xa6f2: (0xa6f2, 0xa6f7, 0,0,0,0,0,0,1,0,0,1,0,0), #  BAMUM NJAEMLI..BAMUM QUESTION MARK
+ 0xa828: (0xa828, 0xa82b, 0,0,0,0,0,0,1,0,0,1,0,0), #  SYLOTI NAGRI POETRY MARK-1..SYLOTI NAGRI POETRY MARK-4
+ 0xa8ce: (0xa8ce, 0xa8cf, 0,0,0,0,0,0,1,0,0,1,0,0), #  SAURASHTRA DANDA..SAURASHTRA DOUBLE DANDA
+ 0xa92f: (0xa92f, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  KAYAH LI SIGN SHYA
+ 0xa9c1: (0xa9c1, 0xa9cd, 0,0,0,0,0,0,1,0,0,1,0,0), #  JAVANESE LEFT RERENGGAN..JAVANESE TURNED PADA PISELEH
+ 0xa9de: (0xa9de, 0xa9df, 0,0,0,0,0,0,1,0,0,1,0,0), #  JAVANESE PADA TIRTA TUMETES..JAVANESE PADA ISEN-ISEN
+ 0xaa5c: (0xaa5c, 0xaa5f, 0,0,0,0,0,0,1,0,0,1,0,0), #  CHAM PUNCTUATION SPIRAL..CHAM PUNCTUATION TRIPLE DANDA
+ 0xaade: (0xaade, 0xaadf, 0,0,0,0,0,0,1,0,0,1,0,0), #  TAI VIET SYMBOL HO HOI..TAI VIET SYMBOL KOI KOI
+ 0xaaf0: (0xaaf0, 0xaaf1, 0,0,0,0,0,0,1,0,0,1,0,0), #  MEETEI MAYEK CHEIKHAN..MEETEI MAYEK AHANG KHUDAM
+ 0xabeb: (0xabeb, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  MEETEI MAYEK CHEIKHEI
+ 0x11140: (0x11140, 0x11143, 0,0,0,0,0,0,1,0,0,1,0,0), #  CHAKMA SECTION MARK..CHAKMA QUESTION MARK
+ 0x1144b: (0x1144b, 0x1144f, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEWA DANDA..NEWA ABBREVIATION SIGN
+ 0x1145b: (0x1145b, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEWA PLACEHOLDER MARK
+ 0x1145d: (0x1145d, None, 0,0,0,0,0,0,1,0,0,1,0,0), #  NEWA INSERTION SIGN
+ 0x1e95e: (0x1e95e, 0x1e95f, 0,0,0,0,0,0,1,0,0,1,0,0), #  ADLAM INITIAL EXCLAMATION MARK..ADLAM INITIAL QUESTION MARK
+ 0x2d6f: (0x2d6f, None, 0,0,0,0,0,0,1,0,1,0,0,0), #  TIFINAGH MODIFIER LETTER LABIALIZATION MARK
+ 0x0181: (0x0181, 0x018c, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER B WITH HOOK..LATIN SMALL LETTER D WITH TOPBAR
+ 0x018e: (0x018e, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER REVERSED E
+ 0x0190: (0x0190, 0x019f, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER OPEN E..LATIN CAPITAL LETTER O WITH MIDDLE TILDE
+ 0x01a2: (0x01a2, 0x01a9, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER OI..LATIN CAPITAL LETTER ESH
+ 0x01ac: (0x01ac, 0x01ae, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER T WITH HOOK..LATIN CAPITAL LETTER T WITH RETROFLEX HOOK
+ 0x01b1: (0x01b1, 0x01b8, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER UPSILON..LATIN CAPITAL LETTER EZH REVERSED
+ 0x01bc: (0x01bc, 0x01bd, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER TONE FIVE..LATIN SMALL LETTER TONE FIVE
+ 0x01dd: (0x01dd, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER TURNED E
+ 0x01e4: (0x01e4, 0x01e5, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER G WITH STROKE..LATIN SMALL LETTER G WITH STROKE
+ 0x0220: (0x0220, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER N WITH LONG RIGHT LEG
+ 0x0221: (0x0221, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER D WITH CURL
+ 0x0222: (0x0222, 0x0225, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER OU..LATIN SMALL LETTER Z WITH HOOK
+ 0x0237: (0x0237, 0x0241, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER DOTLESS J..LATIN CAPITAL LETTER GLOTTAL STOP
+ 0x0242: (0x0242, 0x024f, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER GLOTTAL STOP..LATIN SMALL LETTER Y WITH STROKE
+ 0x0253: (0x0253, 0x0254, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER B WITH HOOK..LATIN SMALL LETTER OPEN O
+ 0x0256: (0x0256, 0x0257, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER D WITH TAIL..LATIN SMALL LETTER D WITH HOOK
+ 0x025b: (0x025b, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER OPEN E
+ 0x0260: (0x0260, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER G WITH HOOK
+ 0x0263: (0x0263, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER GAMMA
+ 0x0268: (0x0268, 0x0269, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER I WITH STROKE..LATIN SMALL LETTER IOTA
+ 0x026f: (0x026f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER TURNED M
+ 0x0272: (0x0272, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER N WITH LEFT HOOK
+ 0x0275: (0x0275, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER BARRED O
+ 0x0280: (0x0280, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN LETTER SMALL CAPITAL R
+ 0x0283: (0x0283, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER ESH
+ 0x0288: (0x0288, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER T WITH RETROFLEX HOOK
+ 0x028a: (0x028a, 0x028b, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER UPSILON..LATIN SMALL LETTER V WITH HOOK
+ 0x0292: (0x0292, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER EZH
+ 0x0294: (0x0294, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN LETTER GLOTTAL STOP
+ 0x0305: (0x0305, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING OVERLINE
+ 0x030d: (0x030d, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING VERTICAL LINE ABOVE
+ 0x0316: (0x0316, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING GRAVE ACCENT BELOW
+ 0x0321: (0x0321, 0x0322, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING PALATALIZED HOOK BELOW..COMBINING RETROFLEX HOOK BELOW
+ 0x0332: (0x0332, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING LOW LINE
+ 0x0334: (0x0334, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING TILDE OVERLAY
+ 0x0336: (0x0336, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING LONG STROKE OVERLAY
+ 0x0358: (0x0358, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING DOT ABOVE RIGHT
+ 0x0591: (0x0591, 0x05a1, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW ACCENT ETNAHTA..HEBREW ACCENT PAZER
+ 0x05a3: (0x05a3, 0x05af, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW ACCENT MUNAH..HEBREW MARK MASORA CIRCLE
+ 0x05b0: (0x05b0, 0x05b3, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT SHEVA..HEBREW POINT HATAF QAMATS
+ 0x05b5: (0x05b5, 0x05b9, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT TSERE..HEBREW POINT HOLAM
+ 0x05ba: (0x05ba, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT HOLAM HASER FOR VAV
+ 0x05bb: (0x05bb, 0x05bd, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT QUBUTS..HEBREW POINT METEG
+ 0x05bf: (0x05bf, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT RAFE
+ 0x05c1: (0x05c1, 0x05c2, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW POINT SHIN DOT..HEBREW POINT SIN DOT
+ 0x05c4: (0x05c4, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  HEBREW MARK UPPER DOT
+ 0x0610: (0x0610, 0x0615, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SIGN SALLALLAHOU ALAYHE WASSALLAM..ARABIC SMALL HIGH TAH
+ 0x0616: (0x0616, 0x061a, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH LIGATURE ALEF WITH LAM WITH YEH..ARABIC SMALL KASRA
+ 0x0656: (0x0656, 0x0658, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SUBSCRIPT ALEF..ARABIC MARK NOON GHUNNA
+ 0x0659: (0x0659, 0x065e, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC ZWARAKAY..ARABIC FATHA WITH TWO DOTS
+ 0x065f: (0x065f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC WAVY HAMZA BELOW
+ 0x06d6: (0x06d6, 0x06dc, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH LIGATURE SAD WITH LAM WITH ALEF MAKSURA..ARABIC SMALL HIGH SEEN
+ 0x06df: (0x06df, 0x06e4, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH ROUNDED ZERO..ARABIC SMALL HIGH MADDA
+ 0x06e7: (0x06e7, 0x06e8, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH YEH..ARABIC SMALL HIGH NOON
+ 0x06ea: (0x06ea, 0x06ed, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC EMPTY CENTRE LOW STOP..ARABIC SMALL LOW MEEM
+ 0x08b3: (0x08b3, 0x08b4, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC LETTER AIN WITH THREE DOTS BELOW..ARABIC LETTER KAF WITH DOT BELOW
+ 0x08d3: (0x08d3, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL LOW WAW
+ 0x08d4: (0x08d4, 0x08e1, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC SMALL HIGH WORD AR-RUB..ARABIC SMALL HIGH SIGN SAFHA
+ 0x08e3: (0x08e3, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC TURNED DAMMA BELOW
+ 0x08e4: (0x08e4, 0x08fe, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC CURLY FATHA..ARABIC DAMMA WITH DOT
+ 0x08ff: (0x08ff, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ARABIC MARK SIDEWAYS NOON GHUNNA
+ 0x0900: (0x0900, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  DEVANAGARI SIGN INVERTED CANDRABINDU
+ 0x0955: (0x0955, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  DEVANAGARI VOWEL SIGN CANDRA LONG E
+ 0x0a51: (0x0a51, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  GURMUKHI SIGN UDAAT
+ 0x0a75: (0x0a75, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  GURMUKHI SIGN YAKASH
+ 0x0af9: (0x0af9, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  GUJARATI LETTER ZHA
+ 0x0b44: (0x0b44, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  ORIYA VOWEL SIGN VOCALIC RR
+ 0x0b62: (0x0b62, 0x0b63, 0,0,0,0,0,0,0,1,0,0,0,0), #  ORIYA VOWEL SIGN VOCALIC L..ORIYA VOWEL SIGN VOCALIC LL
+ 0x0c5a: (0x0c5a, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  TELUGU LETTER RRRA
+ 0x0c62: (0x0c62, 0x0c63, 0,0,0,0,0,0,0,1,0,0,0,0), #  TELUGU VOWEL SIGN VOCALIC L..TELUGU VOWEL SIGN VOCALIC LL
+ 0x0d44: (0x0d44, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  MALAYALAM VOWEL SIGN VOCALIC RR
+ 0x0d62: (0x0d62, 0x0d63, 0,0,0,0,0,0,0,1,0,0,0,0), #  MALAYALAM VOWEL SIGN VOCALIC L..MALAYALAM VOWEL SIGN VOCALIC LL
+ 0x0f39: (0x0f39, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  TIBETAN MARK TSA -PHRU
+ 0x2054: (0x2054, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  INVERTED UNDERTIE
+ 0x2c67: (0x2c67, 0x2c6c, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER H WITH DESCENDER..LATIN SMALL LETTER Z WITH DESCENDER
+ 0xa66f: (0xa66f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC VZMET
+ 0xa67c: (0xa67c, 0xa67d, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC KAVYKA..COMBINING CYRILLIC PAYEROK
+ 0xa69e: (0xa69e, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC LETTER EF
+ 0xa78b: (0xa78b, 0xa78c, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER SALTILLO..LATIN SMALL LETTER SALTILLO
+ 0xa78f: (0xa78f, None, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN LETTER SINOLOGICAL DOT
+ 0xa7b2: (0xa7b2, 0xa7b7, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN CAPITAL LETTER J WITH CROSSED-TAIL..LATIN SMALL LETTER OMEGA
+ 0xab60: (0xab60, 0xab63, 0,0,0,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER SAKHA YAT..LATIN SMALL LETTER UO
+ 0x0289: (0x0289, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  LATIN SMALL LETTER U BAR
+ 0x0d8f: (0x0d8f, 0x0d90, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA LETTER ILUYANNA..SINHALA LETTER ILUUYANNA
+ 0x0da6: (0x0da6, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA LETTER SANYAKA JAYANNA
+ 0x0ddf: (0x0ddf, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA VOWEL SIGN GAYANUKITTA
+ 0x0df3: (0x0df3, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  SINHALA VOWEL SIGN DIGA GAYANUKITTA
+ 0xfb1e: (0xfb1e, None, 0,0,1,0,0,0,0,1,0,0,0,0), #  HEBREW POINT JUDEO-SPANISH VARIKA
+ 0xfe2e: (0xfe2e, 0xfe2f, 0,0,1,0,0,0,0,1,0,0,0,0), #  COMBINING CYRILLIC TITLO LEFT HALF..COMBINING CYRILLIC TITLO RIGHT HALF
+ 0x16a40: (0x16a40, 0x16a5e, 0,0,0,0,0,1,0,1,0,0,0,0), #  MRO LETTER TA..MRO LETTER TEK
+ 0x16a60: (0x16a60, 0x16a69, 0,0,0,0,0,1,0,1,0,0,0,0), #  MRO DIGIT ZERO..MRO DIGIT NINE
+ 0x1d1de: (0x1d1de, 0x1d1e8, 0,0,0,0,0,1,0,1,0,1,0,0), #  MUSICAL SYMBOL KIEVAN C CLEF..MUSICAL SYMBOL KIEVAN FLAT SIGN
+ 0x05a2: (0x05a2, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  HEBREW ACCENT ATNAH HAFUKH
+ 0x05c5: (0x05c5, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  HEBREW MARK LOWER DOT
+ 0x05c7: (0x05c7, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  HEBREW POINT QAMATS QATAN
+ 0xa8fd: (0xa8fd, None, 0,0,0,1,0,0,0,1,0,0,0,0), #  DEVANAGARI JAIN OM
+ 0xa8fc: (0xa8fc, None, 0,0,0,1,0,0,0,1,0,1,0,0), #  DEVANAGARI SIGN SIDDHAM
+ 0x218a: (0x218a, 0x218b, 0,0,0,0,0,0,0,1,0,1,0,0), #  TURNED DIGIT TWO..TURNED DIGIT THREE
+ 0x2bec: (0x2bec, 0x2bef, 0,0,0,0,0,0,0,1,0,1,0,0), #  LEFTWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS..DOWNWARDS TWO-HEADED ARROW WITH TRIANGLE ARROWHEADS
+ 0x1f54f: (0x1f54f, None, 0,0,0,0,0,0,0,1,0,1,0,0), #  BOWL OF HYGIEIA
+ 0x0180: (0x0180, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER B WITH STROKE
+ 0x01c0: (0x01c0, 0x01c3, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER DENTAL CLICK..LATIN LETTER RETROFLEX CLICK
+ 0x0234: (0x0234, 0x0236, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER L WITH CURL..LATIN SMALL LETTER T WITH CURL
+ 0x0250: (0x0250, 0x0252, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED A..LATIN SMALL LETTER TURNED ALPHA
+ 0x0255: (0x0255, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER C WITH CURL
+ 0x0258: (0x0258, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER REVERSED E
+ 0x025a: (0x025a, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER SCHWA WITH HOOK
+ 0x025c: (0x025c, 0x025f, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER REVERSED OPEN E..LATIN SMALL LETTER DOTLESS J WITH STROKE
+ 0x0261: (0x0261, 0x0262, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER SCRIPT G..LATIN LETTER SMALL CAPITAL G
+ 0x0264: (0x0264, 0x0267, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER RAMS HORN..LATIN SMALL LETTER HENG WITH HOOK
+ 0x026a: (0x026a, 0x026e, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL I..LATIN SMALL LETTER LEZH
+ 0x0270: (0x0270, 0x0271, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED M WITH LONG LEG..LATIN SMALL LETTER M WITH HOOK
+ 0x0273: (0x0273, 0x0274, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER N WITH RETROFLEX HOOK..LATIN LETTER SMALL CAPITAL N
+ 0x0276: (0x0276, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL OE
+ 0x0278: (0x0278, 0x027b, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER PHI..LATIN SMALL LETTER TURNED R WITH HOOK
+ 0x027d: (0x027d, 0x027f, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER R WITH TAIL..LATIN SMALL LETTER REVERSED R WITH FISHHOOK
+ 0x0281: (0x0281, 0x0282, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL INVERTED R..LATIN SMALL LETTER S WITH HOOK
+ 0x0284: (0x0284, 0x0287, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER DOTLESS J WITH STROKE AND HOOK..LATIN SMALL LETTER TURNED T
+ 0x028c: (0x028c, 0x0291, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED V..LATIN SMALL LETTER Z WITH CURL
+ 0x0293: (0x0293, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER EZH WITH CURL
+ 0x0295: (0x0295, 0x029d, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER PHARYNGEAL VOICED FRICATIVE..LATIN SMALL LETTER J WITH CROSSED-TAIL
+ 0x029f: (0x029f, 0x02a8, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL L..LATIN SMALL LETTER TC DIGRAPH WITH CURL
+ 0x02a9: (0x02a9, 0x02ad, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER FENG DIGRAPH..LATIN LETTER BIDENTAL PERCUSSIVE
+ 0x02ae: (0x02ae, 0x02af, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED H WITH FISHHOOK..LATIN SMALL LETTER TURNED H WITH FISHHOOK AND TAIL
+ 0x02b9: (0x02b9, 0x02ba, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER PRIME..MODIFIER LETTER DOUBLE PRIME
+ 0x02bd: (0x02bd, 0x02c1, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER REVERSED COMMA..MODIFIER LETTER REVERSED GLOTTAL STOP
+ 0x02c6: (0x02c6, 0x02d1, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER CIRCUMFLEX ACCENT..MODIFIER LETTER HALF TRIANGULAR COLON
+ 0x02ee: (0x02ee, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER DOUBLE APOSTROPHE
+ 0x030e: (0x030e, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE VERTICAL LINE ABOVE
+ 0x0312: (0x0312, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING TURNED COMMA ABOVE
+ 0x0315: (0x0315, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING COMMA ABOVE RIGHT
+ 0x0317: (0x0317, 0x031a, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ACUTE ACCENT BELOW..COMBINING LEFT ANGLE ABOVE
+ 0x031c: (0x031c, 0x0320, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LEFT HALF RING BELOW..COMBINING MINUS SIGN BELOW
+ 0x0329: (0x0329, 0x032c, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING VERTICAL LINE BELOW..COMBINING CARON BELOW
+ 0x032f: (0x032f, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING INVERTED BREVE BELOW
+ 0x0333: (0x0333, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE LOW LINE
+ 0x0337: (0x0337, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING SHORT SOLIDUS OVERLAY
+ 0x033a: (0x033a, 0x033f, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING INVERTED BRIDGE BELOW..COMBINING DOUBLE OVERLINE
+ 0x0346: (0x0346, 0x034e, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING BRIDGE ABOVE..COMBINING UPWARDS ARROW BELOW
+ 0x0350: (0x0350, 0x0357, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING RIGHT ARROWHEAD ABOVE..COMBINING RIGHT HALF RING ABOVE
+ 0x0359: (0x0359, 0x035c, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ASTERISK BELOW..COMBINING DOUBLE BREVE BELOW
+ 0x035d: (0x035d, 0x035f, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE BREVE..COMBINING DOUBLE MACRON BELOW
+ 0x0360: (0x0360, 0x0361, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE TILDE..COMBINING DOUBLE INVERTED BREVE
+ 0x0362: (0x0362, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE RIGHTWARDS ARROW BELOW
+ 0x03cf: (0x03cf, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  GREEK CAPITAL KAI SYMBOL
+ 0x03d7: (0x03d7, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  GREEK KAI SYMBOL
+ 0x0953: (0x0953, 0x0954, 0,0,1,0,0,0,0,0,0,0,0,0), #  DEVANAGARI GRAVE ACCENT..DEVANAGARI ACUTE ACCENT
+ 0x0f18: (0x0f18, 0x0f19, 0,0,1,0,0,0,0,0,0,0,0,0), #  TIBETAN ASTROLOGICAL SIGN -KHYUD PA..TIBETAN ASTROLOGICAL SIGN SDONG TSHUGS
+ 0x17cb: (0x17cb, 0x17d0, 0,0,1,0,0,0,0,0,0,0,0,0), #  KHMER SIGN BANTOC..KHMER SIGN SAMYOK SANNYA
+ 0x1d00: (0x1d00, 0x1d2b, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL A..CYRILLIC LETTER SMALL CAPITAL EL
+ 0x1d2f: (0x1d2f, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER CAPITAL BARRED B
+ 0x1d3b: (0x1d3b, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER CAPITAL REVERSED N
+ 0x1d4e: (0x1d4e, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  MODIFIER LETTER SMALL TURNED I
+ 0x1d6b: (0x1d6b, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER UE
+ 0x1d6c: (0x1d6c, 0x1d77, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER B WITH MIDDLE TILDE..LATIN SMALL LETTER TURNED G
+ 0x1d79: (0x1d79, 0x1d9a, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER INSULAR G..LATIN SMALL LETTER EZH WITH RETROFLEX HOOK
+ 0x1dc4: (0x1dc4, 0x1dca, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING MACRON-ACUTE..COMBINING LATIN SMALL LETTER R BELOW
+ 0x1dcb: (0x1dcb, 0x1dcd, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING BREVE-MACRON..COMBINING DOUBLE CIRCUMFLEX ABOVE
+ 0x1dcf: (0x1dcf, 0x1dd0, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ZIGZAG BELOW..COMBINING IS BELOW
+ 0x1de7: (0x1de7, 0x1df5, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LATIN SMALL LETTER ALPHA..COMBINING UP TACK ABOVE
+ 0x1df6: (0x1df6, 0x1df9, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING KAVYKA ABOVE RIGHT..COMBINING WIDE INVERTED BRIDGE BELOW
+ 0x1dfb: (0x1dfb, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DELETION MARK
+ 0x1dfc: (0x1dfc, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING DOUBLE INVERTED BREVE BELOW
+ 0x1dfd: (0x1dfd, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING ALMOST EQUAL TO BELOW
+ 0x1dfe: (0x1dfe, 0x1dff, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LEFT ARROWHEAD ABOVE..COMBINING RIGHT ARROWHEAD AND DOWN ARROWHEAD BELOW
+ 0x1e9c: (0x1e9c, 0x1e9d, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER LONG S WITH DIAGONAL STROKE..LATIN SMALL LETTER LONG S WITH HIGH STROKE
+ 0x1e9f: (0x1e9f, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER DELTA
+ 0x1efa: (0x1efa, 0x1eff, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER MIDDLE-WELSH LL..LATIN SMALL LETTER Y WITH LOOP
+ 0x203f: (0x203f, 0x2040, 0,0,1,0,0,0,0,0,0,0,0,0), #  UNDERTIE..CHARACTER TIE
+ 0x2118: (0x2118, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  SCRIPT CAPITAL P
+ 0x212e: (0x212e, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  ESTIMATED SYMBOL
+ 0x2c60: (0x2c60, 0x2c66, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER L WITH DOUBLE BAR..LATIN SMALL LETTER T WITH DIAGONAL STROKE
+ 0x2c77: (0x2c77, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TAILLESS PHI
+ 0x2c78: (0x2c78, 0x2c7b, 0,0,1,0,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER E WITH NOTCH..LATIN LETTER SMALL CAPITAL TURNED E
+ 0x3021: (0x3021, 0x302d, 0,0,1,0,0,0,0,0,0,0,0,0), #  HANGZHOU NUMERAL ONE..IDEOGRAPHIC ENTERING TONE MARK
+ 0x3031: (0x3031, 0x3035, 0,0,1,0,0,0,0,0,0,0,0,0), #  VERTICAL KANA REPEAT MARK..VERTICAL KANA REPEAT MARK LOWER HALF
+ 0x303b: (0x303b, 0x303c, 0,0,1,0,0,0,0,0,0,0,0,0), #  VERTICAL IDEOGRAPHIC ITERATION MARK..MASU MARK
+ 0x31f0: (0x31f0, 0x31ff, 0,0,1,0,0,0,0,0,0,0,0,0), #  KATAKANA LETTER SMALL KU..KATAKANA LETTER SMALL RO
+ 0xfe20: (0xfe20, 0xfe23, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LIGATURE LEFT HALF..COMBINING DOUBLE TILDE RIGHT HALF
+ 0xfe24: (0xfe24, 0xfe26, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING MACRON LEFT HALF..COMBINING CONJOINING MACRON
+ 0xfe27: (0xfe27, 0xfe2d, 0,0,1,0,0,0,0,0,0,0,0,0), #  COMBINING LIGATURE LEFT HALF BELOW..COMBINING CONJOINING MACRON BELOW
+ 0xfe73: (0xfe73, None, 0,0,1,0,0,0,0,0,0,0,0,0), #  ARABIC TAIL FRAGMENT
+ 0x20d0: (0x20d0, 0x20dc, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING LEFT HARPOON ABOVE..COMBINING FOUR DOTS ABOVE
+ 0x20e1: (0x20e1, None, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING LEFT RIGHT ARROW ABOVE
+ 0x20e5: (0x20e5, 0x20ea, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING REVERSE SOLIDUS OVERLAY..COMBINING LEFTWARDS ARROW OVERLAY
+ 0x20eb: (0x20eb, None, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING LONG DOUBLE SOLIDUS OVERLAY
+ 0x20ec: (0x20ec, 0x20ef, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING RIGHTWARDS HARPOON WITH BARB DOWNWARDS..COMBINING RIGHT ARROW BELOW
+ 0x2cf0: (0x2cf0, 0x2cf1, 0,0,1,0,0,1,0,0,0,0,0,0), #  COPTIC COMBINING SPIRITUS ASPER..COPTIC COMBINING SPIRITUS LENIS
+ 0x10a0d: (0x10a0d, None, 0,0,1,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI SIGN DOUBLE RING BELOW
+ 0x1d165: (0x1d165, 0x1d169, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING STEM..MUSICAL SYMBOL COMBINING TREMOLO-3
+ 0x1d16d: (0x1d16d, 0x1d172, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING AUGMENTATION DOT..MUSICAL SYMBOL COMBINING FLAG-5
+ 0x1d17b: (0x1d17b, 0x1d182, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING ACCENT..MUSICAL SYMBOL COMBINING LOURE
+ 0x1d185: (0x1d185, 0x1d18b, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING DOIT..MUSICAL SYMBOL COMBINING TRIPLE TONGUE
+ 0x1d1aa: (0x1d1aa, 0x1d1ad, 0,0,1,0,0,1,0,0,0,0,0,0), #  MUSICAL SYMBOL COMBINING DOWN BOW..MUSICAL SYMBOL COMBINING SNAP PIZZICATO
+ 0x1d242: (0x1d242, 0x1d244, 0,0,1,0,0,1,0,0,0,0,0,0), #  COMBINING GREEK MUSICAL TRISEME..COMBINING GREEK MUSICAL PENTASEME
+ 0x20de: (0x20de, 0x20e0, 0,0,1,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING SQUARE..COMBINING ENCLOSING CIRCLE BACKSLASH
+ 0x20e2: (0x20e2, 0x20e3, 0,0,1,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING SCREEN..COMBINING ENCLOSING KEYCAP
+ 0x20e4: (0x20e4, None, 0,0,1,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING UPWARD POINTING TRIANGLE
+ 0x1d100: (0x1d100, 0x1d126, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL SINGLE BARLINE..MUSICAL SYMBOL DRUM CLEF-2
+ 0x1d129: (0x1d129, None, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL MULTIPLE MEASURE REST
+ 0x1d12a: (0x1d12a, 0x1d15d, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL DOUBLE SHARP..MUSICAL SYMBOL WHOLE NOTE
+ 0x1d16a: (0x1d16a, 0x1d16c, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL FINGERED TREMOLO-1..MUSICAL SYMBOL FINGERED TREMOLO-3
+ 0x1d183: (0x1d183, 0x1d184, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL ARPEGGIATO UP..MUSICAL SYMBOL ARPEGGIATO DOWN
+ 0x1d18c: (0x1d18c, 0x1d1a9, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL RINFORZANDO..MUSICAL SYMBOL DEGREE SLASH
+ 0x1d1ae: (0x1d1ae, 0x1d1ba, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL PEDAL MARK..MUSICAL SYMBOL SEMIBREVIS BLACK
+ 0x1d1c1: (0x1d1c1, 0x1d1dd, 0,0,1,0,0,1,0,0,0,1,0,0), #  MUSICAL SYMBOL LONGA PERFECTA REST..MUSICAL SYMBOL PES SUBPUNCTIS
+ 0x1d15e: (0x1d15e, 0x1d164, 0,0,1,0,0,1,0,0,1,1,0,0), #  MUSICAL SYMBOL HALF NOTE..MUSICAL SYMBOL ONE HUNDRED TWENTY-EIGHTH NOTE
+ 0x1d1bb: (0x1d1bb, 0x1d1c0, 0,0,1,0,0,1,0,0,1,1,0,0), #  MUSICAL SYMBOL MINIMA..MUSICAL SYMBOL FUSA BLACK
+ 0x1d173: (0x1d173, 0x1d17a, 0,0,1,0,0,1,0,0,0,1,0,1), #  MUSICAL SYMBOL BEGIN BEAM..MUSICAL SYMBOL END PHRASE
+ 0xfe00: (0xfe00, 0xfe0f, 0,0,1,0,0,1,0,0,0,0,0,1), #  VARIATION SELECTOR-1..VARIATION SELECTOR-16
+ 0x018d: (0x018d, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED DELTA
+ 0x01aa: (0x01aa, 0x01ab, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN LETTER REVERSED ESH LOOP..LATIN SMALL LETTER T WITH PALATAL HOOK
+ 0x01ba: (0x01ba, 0x01bb, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER EZH WITH TAIL..LATIN LETTER TWO WITH STROKE
+ 0x01be: (0x01be, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN LETTER INVERTED GLOTTAL STOP WITH STROKE
+ 0x0277: (0x0277, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER CLOSED OMEGA
+ 0x027c: (0x027c, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER R WITH LONG LEG
+ 0x029e: (0x029e, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER TURNED K
+ 0x03f3: (0x03f3, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  GREEK LETTER YOT
+ 0x0484: (0x0484, 0x0486, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC PALATALIZATION..COMBINING CYRILLIC PSILI PNEUMATA
+ 0x0487: (0x0487, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC POKRYTIE
+ 0x17d1: (0x17d1, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  KHMER SIGN VIRIAM
+ 0x17dd: (0x17dd, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  KHMER SIGN ATTHACAN
+ 0x1dc0: (0x1dc0, 0x1dc3, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING DOTTED GRAVE ACCENT..COMBINING SUSPENSION MARK
+ 0x1dce: (0x1dce, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING OGONEK ABOVE
+ 0x1dd1: (0x1dd1, 0x1de6, 0,0,1,1,0,0,0,0,0,0,0,0), #  COMBINING UR ABOVE..COMBINING LATIN SMALL LETTER Z
+ 0x2180: (0x2180, 0x2182, 0,0,1,1,0,0,0,0,0,0,0,0), #  ROMAN NUMERAL ONE THOUSAND C D..ROMAN NUMERAL TEN THOUSAND
+ 0x2183: (0x2183, None, 0,0,1,1,0,0,0,0,0,0,0,0), #  ROMAN NUMERAL REVERSED ONE HUNDRED
+ 0x302e: (0x302e, 0x302f, 0,0,1,1,0,0,0,0,0,0,0,0), #  HANGUL SINGLE DOT TONE MARK..HANGUL DOUBLE DOT TONE MARK
+ 0xa722: (0xa722, 0xa72f, 0,0,1,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER EGYPTOLOGICAL ALEF..LATIN SMALL LETTER CUATRILLO WITH COMMA
+ 0x2e00: (0x2e00, 0x2e0d, 0,0,1,1,0,0,0,0,0,1,0,0), #  RIGHT ANGLE SUBSTITUTION MARKER..RIGHT RAISED OMISSION BRACKET
+ 0x3260: (0x3260, 0x327b, 0,0,1,1,0,0,0,0,1,1,0,0), #  CIRCLED HANGUL KIYEOK..CIRCLED HANGUL HIEUH A
+ 0x327c: (0x327c, 0x327d, 0,0,1,1,0,0,0,0,1,1,0,0), #  CIRCLED KOREAN CHARACTER CHAMKO..CIRCLED KOREAN CHARACTER JUEUI
+ 0x327e: (0x327e, None, 0,0,1,1,0,0,0,0,1,1,0,0), #  CIRCLED HANGUL IEUNG U
+ 0x0340: (0x0340, 0x0341, 0,0,1,1,0,0,0,0,1,0,0,0), #  COMBINING GRAVE TONE MARK..COMBINING ACUTE TONE MARK
+ 0x0343: (0x0343, None, 0,0,1,1,0,0,0,0,1,0,0,0), #  COMBINING GREEK KORONIS
+ 0x24eb: (0x24eb, 0x24fe, 0,0,1,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED NUMBER ELEVEN..DOUBLE CIRCLED NUMBER TEN
+ 0x24ff: (0x24ff, None, 0,0,1,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED DIGIT ZERO
+ 0x2800: (0x2800, 0x28ff, 0,0,1,0,0,0,0,0,0,1,0,0), #  BRAILLE PATTERN BLANK..BRAILLE PATTERN DOTS-12345678
+ 0x327f: (0x327f, None, 0,0,1,0,0,0,0,0,0,1,0,0), #  KOREAN STANDARD SYMBOL
+ 0x4dc0: (0x4dc0, 0x4dff, 0,0,1,0,0,0,0,0,0,1,0,0), #  HEXAGRAM FOR THE CREATIVE HEAVEN..HEXAGRAM FOR BEFORE COMPLETION
+ 0xa708: (0xa708, 0xa716, 0,0,1,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER EXTRA-HIGH DOTTED TONE BAR..MODIFIER LETTER EXTRA-LOW LEFT-STEM TONE BAR
+ 0xfbb2: (0xfbb2, 0xfbc1, 0,0,1,0,0,0,0,0,0,1,0,0), #  ARABIC SYMBOL DOT ABOVE..ARABIC SYMBOL SMALL TAH BELOW
+ 0xfd3e: (0xfd3e, 0xfd3f, 0,0,1,0,0,0,0,0,0,1,0,0), #  ORNATE LEFT PARENTHESIS..ORNATE RIGHT PARENTHESIS
+ 0xfdfd: (0xfdfd, None, 0,0,1,0,0,0,0,0,0,1,0,0), #  ARABIC LIGATURE BISMILLAH AR-RAHMAN AR-RAHEEM
+ 0xfe45: (0xfe45, 0xfe46, 0,0,1,0,0,0,0,0,0,1,0,0), #  SESAME DOT..WHITE SESAME DOT
+ 0x1d000: (0x1d000, 0x1d0f5, 0,0,1,0,0,0,0,0,0,1,0,0), #  BYZANTINE MUSICAL SYMBOL PSILI..BYZANTINE MUSICAL SYMBOL GORGON NEO KATO
+ 0x1d300: (0x1d300, 0x1d356, 0,0,1,0,0,0,0,0,0,1,0,0), #  MONOGRAM FOR EARTH..TETRAGRAM FOR FOSTERING
+ 0x2460: (0x2460, 0x24ea, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED DIGIT ONE..CIRCLED DIGIT ZERO
+ 0x3251: (0x3251, 0x325f, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED NUMBER TWENTY ONE..CIRCLED NUMBER THIRTY FIVE
+ 0x3280: (0x3280, 0x32b0, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED IDEOGRAPH ONE..CIRCLED IDEOGRAPH NIGHT
+ 0x32b1: (0x32b1, 0x32bf, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED NUMBER THIRTY SIX..CIRCLED NUMBER FIFTY
+ 0x32c0: (0x32c0, 0x32cb, 0,0,1,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR JANUARY..IDEOGRAPHIC TELEGRAPH SYMBOL FOR DECEMBER
+ 0x32cc: (0x32cc, 0x32cf, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE HG..LIMITED LIABILITY SIGN
+ 0x32d0: (0x32d0, 0x32fe, 0,0,1,0,0,0,0,0,1,1,0,0), #  CIRCLED KATAKANA A..CIRCLED KATAKANA WO
+ 0x3300: (0x3300, 0x3376, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE APAATO..SQUARE PC
+ 0x3377: (0x3377, 0x337a, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE DM..SQUARE IU
+ 0x337b: (0x337b, 0x33dd, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE ERA NAME HEISEI..SQUARE WB
+ 0x33de: (0x33de, 0x33df, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE V OVER M..SQUARE A OVER M
+ 0x33e0: (0x33e0, 0x33fe, 0,0,1,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY ONE..IDEOGRAPHIC TELEGRAPH SYMBOL FOR DAY THIRTY-ONE
+ 0x33ff: (0x33ff, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  SQUARE GAL
+ 0xfb29: (0xfb29, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  HEBREW LETTER ALTERNATIVE PLUS SIGN
+ 0xfc5e: (0xfc5e, 0xfc63, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC LIGATURE SHADDA WITH DAMMATAN ISOLATED FORM..ARABIC LIGATURE SHADDA WITH SUPERSCRIPT ALEF ISOLATED FORM
+ 0xfdfa: (0xfdfa, 0xfdfb, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC LIGATURE SALLALLAHOU ALAYHE WASALLAM..ARABIC LIGATURE JALLAJALALOUHOU
+ 0xfdfc: (0xfdfc, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  RIAL SIGN
+ 0xfe10: (0xfe10, 0xfe19, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL COMMA..PRESENTATION FORM FOR VERTICAL HORIZONTAL ELLIPSIS
+ 0xfe30: (0xfe30, 0xfe32, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL TWO DOT LEADER..PRESENTATION FORM FOR VERTICAL EN DASH
+ 0xfe35: (0xfe35, 0xfe44, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL LEFT PARENTHESIS..PRESENTATION FORM FOR VERTICAL RIGHT WHITE CORNER BRACKET
+ 0xfe47: (0xfe47, 0xfe48, 0,0,1,0,0,0,0,0,1,1,0,0), #  PRESENTATION FORM FOR VERTICAL LEFT SQUARE BRACKET..PRESENTATION FORM FOR VERTICAL RIGHT SQUARE BRACKET
+ 0xfe49: (0xfe49, 0xfe4c, 0,0,1,0,0,0,0,0,1,1,0,0), #  DASHED OVERLINE..DOUBLE WAVY OVERLINE
+ 0xfe50: (0xfe50, 0xfe52, 0,0,1,0,0,0,0,0,1,1,0,0), #  SMALL COMMA..SMALL FULL STOP
+ 0xfe54: (0xfe54, 0xfe66, 0,0,1,0,0,0,0,0,1,1,0,0), #  SMALL SEMICOLON..SMALL EQUALS SIGN
+ 0xfe68: (0xfe68, 0xfe6b, 0,0,1,0,0,0,0,0,1,1,0,0), #  SMALL REVERSE SOLIDUS..SMALL COMMERCIAL AT
+ 0xfe70: (0xfe70, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC FATHATAN ISOLATED FORM
+ 0xfe72: (0xfe72, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC DAMMATAN ISOLATED FORM
+ 0xfe74: (0xfe74, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC KASRATAN ISOLATED FORM
+ 0xfe76: (0xfe76, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC FATHA ISOLATED FORM
+ 0xfe78: (0xfe78, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC DAMMA ISOLATED FORM
+ 0xfe7a: (0xfe7a, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC KASRA ISOLATED FORM
+ 0xfe7c: (0xfe7c, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC SHADDA ISOLATED FORM
+ 0xfe7e: (0xfe7e, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  ARABIC SUKUN ISOLATED FORM
+ 0x1d6c1: (0x1d6c1, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD NABLA
+ 0x1d6db: (0x1d6db, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD PARTIAL DIFFERENTIAL
+ 0x1d6fb: (0x1d6fb, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL ITALIC NABLA
+ 0x1d715: (0x1d715, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL ITALIC PARTIAL DIFFERENTIAL
+ 0x1d735: (0x1d735, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD ITALIC NABLA
+ 0x1d74f: (0x1d74f, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL BOLD ITALIC PARTIAL DIFFERENTIAL
+ 0x1d76f: (0x1d76f, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD NABLA
+ 0x1d789: (0x1d789, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD PARTIAL DIFFERENTIAL
+ 0x1d7a9: (0x1d7a9, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC NABLA
+ 0x1d7c3: (0x1d7c3, None, 0,0,1,0,0,0,0,0,1,1,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC PARTIAL DIFFERENTIAL
+ 0x1d2c: (0x1d2c, 0x1d2e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL A..MODIFIER LETTER CAPITAL B
+ 0x1d30: (0x1d30, 0x1d3a, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL D..MODIFIER LETTER CAPITAL N
+ 0x1d3c: (0x1d3c, 0x1d4d, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL O..MODIFIER LETTER SMALL G
+ 0x1d4f: (0x1d4f, 0x1d6a, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL K..GREEK SUBSCRIPT SMALL LETTER CHI
+ 0x1d78: (0x1d78, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CYRILLIC EN
+ 0x1d9b: (0x1d9b, 0x1dbf, 0,0,1,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL TURNED ALPHA..MODIFIER LETTER SMALL THETA
+ 0xfb00: (0xfb00, 0xfb06, 0,0,1,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LIGATURE FF..LATIN SMALL LIGATURE ST
+ 0xfb13: (0xfb13, 0xfb17, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARMENIAN SMALL LIGATURE MEN NOW..ARMENIAN SMALL LIGATURE MEN XEH
+ 0xfb1d: (0xfb1d, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER YOD WITH HIRIQ
+ 0xfb1f: (0xfb1f, 0xfb28, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LIGATURE YIDDISH YOD YOD PATAH..HEBREW LETTER WIDE TAV
+ 0xfb2a: (0xfb2a, 0xfb36, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER SHIN WITH SHIN DOT..HEBREW LETTER ZAYIN WITH DAGESH
+ 0xfb38: (0xfb38, 0xfb3c, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER TET WITH DAGESH..HEBREW LETTER LAMED WITH DAGESH
+ 0xfb3e: (0xfb3e, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER MEM WITH DAGESH
+ 0xfb40: (0xfb40, 0xfb41, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER NUN WITH DAGESH..HEBREW LETTER SAMEKH WITH DAGESH
+ 0xfb43: (0xfb43, 0xfb44, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER FINAL PE WITH DAGESH..HEBREW LETTER PE WITH DAGESH
+ 0xfb46: (0xfb46, 0xfbb1, 0,0,1,0,0,0,0,0,1,0,0,0), #  HEBREW LETTER TSADI WITH DAGESH..ARABIC LETTER YEH BARREE WITH HAMZA ABOVE FINAL FORM
+ 0xfbd3: (0xfbd3, 0xfc5d, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LETTER NG ISOLATED FORM..ARABIC LIGATURE ALEF MAKSURA WITH SUPERSCRIPT ALEF ISOLATED FORM
+ 0xfc64: (0xfc64, 0xfd3d, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE YEH WITH HAMZA ABOVE WITH REH FINAL FORM..ARABIC LIGATURE ALEF WITH FATHATAN ISOLATED FORM
+ 0xfd50: (0xfd50, 0xfd8f, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE TEH WITH JEEM WITH MEEM INITIAL FORM..ARABIC LIGATURE MEEM WITH KHAH WITH MEEM INITIAL FORM
+ 0xfd92: (0xfd92, 0xfdc7, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE MEEM WITH JEEM WITH KHAH INITIAL FORM..ARABIC LIGATURE NOON WITH JEEM WITH YEH FINAL FORM
+ 0xfdf0: (0xfdf0, 0xfdf9, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC LIGATURE SALLA USED AS KORANIC STOP SIGN ISOLATED FORM..ARABIC LIGATURE SALLA ISOLATED FORM
+ 0xfe33: (0xfe33, 0xfe34, 0,0,1,0,0,0,0,0,1,0,0,0), #  PRESENTATION FORM FOR VERTICAL LOW LINE..PRESENTATION FORM FOR VERTICAL WAVY LOW LINE
+ 0xfe4d: (0xfe4d, 0xfe4f, 0,0,1,0,0,0,0,0,1,0,0,0), #  DASHED LOW LINE..WAVY LOW LINE
+ 0xfe71: (0xfe71, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC TATWEEL WITH FATHATAN ABOVE
+ 0xfe77: (0xfe77, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC FATHA MEDIAL FORM
+ 0xfe79: (0xfe79, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC DAMMA MEDIAL FORM
+ 0xfe7b: (0xfe7b, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC KASRA MEDIAL FORM
+ 0xfe7d: (0xfe7d, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC SHADDA MEDIAL FORM
+ 0xfe7f: (0xfe7f, 0xfefc, 0,0,1,0,0,0,0,0,1,0,0,0), #  ARABIC SUKUN MEDIAL FORM..ARABIC LIGATURE LAM WITH ALEF FINAL FORM
+ 0x1d400: (0x1d400, 0x1d454, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD CAPITAL A..MATHEMATICAL ITALIC SMALL G
+ 0x1d456: (0x1d456, 0x1d49c, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC SMALL I..MATHEMATICAL SCRIPT CAPITAL A
+ 0x1d49e: (0x1d49e, 0x1d49f, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL C..MATHEMATICAL SCRIPT CAPITAL D
+ 0x1d4a2: (0x1d4a2, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL G
+ 0x1d4a5: (0x1d4a5, 0x1d4a6, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL J..MATHEMATICAL SCRIPT CAPITAL K
+ 0x1d4a9: (0x1d4a9, 0x1d4ac, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL N..MATHEMATICAL SCRIPT CAPITAL Q
+ 0x1d4ae: (0x1d4ae, 0x1d4b9, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT CAPITAL S..MATHEMATICAL SCRIPT SMALL D
+ 0x1d4bb: (0x1d4bb, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL F
+ 0x1d4bd: (0x1d4bd, 0x1d4c0, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL H..MATHEMATICAL SCRIPT SMALL K
+ 0x1d4c1: (0x1d4c1, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL L
+ 0x1d4c2: (0x1d4c2, 0x1d4c3, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL M..MATHEMATICAL SCRIPT SMALL N
+ 0x1d4c5: (0x1d4c5, 0x1d505, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SCRIPT SMALL P..MATHEMATICAL FRAKTUR CAPITAL B
+ 0x1d507: (0x1d507, 0x1d50a, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR CAPITAL D..MATHEMATICAL FRAKTUR CAPITAL G
+ 0x1d50d: (0x1d50d, 0x1d514, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR CAPITAL J..MATHEMATICAL FRAKTUR CAPITAL Q
+ 0x1d516: (0x1d516, 0x1d51c, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR CAPITAL S..MATHEMATICAL FRAKTUR CAPITAL Y
+ 0x1d51e: (0x1d51e, 0x1d539, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL FRAKTUR SMALL A..MATHEMATICAL DOUBLE-STRUCK CAPITAL B
+ 0x1d53b: (0x1d53b, 0x1d53e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL D..MATHEMATICAL DOUBLE-STRUCK CAPITAL G
+ 0x1d540: (0x1d540, 0x1d544, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL I..MATHEMATICAL DOUBLE-STRUCK CAPITAL M
+ 0x1d546: (0x1d546, None, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL O
+ 0x1d54a: (0x1d54a, 0x1d550, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK CAPITAL S..MATHEMATICAL DOUBLE-STRUCK CAPITAL Y
+ 0x1d552: (0x1d552, 0x1d6a3, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL DOUBLE-STRUCK SMALL A..MATHEMATICAL MONOSPACE SMALL Z
+ 0x1d6a4: (0x1d6a4, 0x1d6a5, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC SMALL DOTLESS I..MATHEMATICAL ITALIC SMALL DOTLESS J
+ 0x1d6a8: (0x1d6a8, 0x1d6c0, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD CAPITAL ALPHA..MATHEMATICAL BOLD CAPITAL OMEGA
+ 0x1d6c2: (0x1d6c2, 0x1d6da, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD SMALL ALPHA..MATHEMATICAL BOLD SMALL OMEGA
+ 0x1d6dc: (0x1d6dc, 0x1d6fa, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD EPSILON SYMBOL..MATHEMATICAL ITALIC CAPITAL OMEGA
+ 0x1d6fc: (0x1d6fc, 0x1d714, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC SMALL ALPHA..MATHEMATICAL ITALIC SMALL OMEGA
+ 0x1d716: (0x1d716, 0x1d734, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL ITALIC EPSILON SYMBOL..MATHEMATICAL BOLD ITALIC CAPITAL OMEGA
+ 0x1d736: (0x1d736, 0x1d74e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD ITALIC SMALL ALPHA..MATHEMATICAL BOLD ITALIC SMALL OMEGA
+ 0x1d750: (0x1d750, 0x1d76e, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD ITALIC EPSILON SYMBOL..MATHEMATICAL SANS-SERIF BOLD CAPITAL OMEGA
+ 0x1d770: (0x1d770, 0x1d788, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD SMALL ALPHA..MATHEMATICAL SANS-SERIF BOLD SMALL OMEGA
+ 0x1d78a: (0x1d78a, 0x1d7a8, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD EPSILON SYMBOL..MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL OMEGA
+ 0x1d7aa: (0x1d7aa, 0x1d7c2, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL ALPHA..MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL OMEGA
+ 0x1d7c4: (0x1d7c4, 0x1d7c9, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL SANS-SERIF BOLD ITALIC EPSILON SYMBOL..MATHEMATICAL SANS-SERIF BOLD ITALIC PI SYMBOL
+ 0x1d7ca: (0x1d7ca, 0x1d7cb, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD CAPITAL DIGAMMA..MATHEMATICAL BOLD SMALL DIGAMMA
+ 0x1d7ce: (0x1d7ce, 0x1d7ff, 0,0,1,0,0,0,0,0,1,0,0,0), #  MATHEMATICAL BOLD DIGIT ZERO..MATHEMATICAL MONOSPACE DIGIT NINE
+ 0x03e2: (0x03e2, 0x03ef, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER SHEI..COPTIC SMALL LETTER DEI
+ 0x0800: (0x0800, 0x082d, 0,0,0,0,0,1,0,0,0,0,0,0), #  SAMARITAN LETTER ALAF..SAMARITAN MARK NEQUDAA
+ 0x16ee: (0x16ee, 0x16f0, 0,0,0,0,0,1,0,0,0,0,0,0), #  RUNIC ARLAUG SYMBOL..RUNIC BELGTHOR SYMBOL
+ 0x16f1: (0x16f1, 0x16f8, 0,0,0,0,0,1,0,0,0,0,0,0), #  RUNIC LETTER K..RUNIC LETTER FRANKS CASKET AESC
+ 0x1700: (0x1700, 0x170c, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGALOG LETTER A..TAGALOG LETTER YA
+ 0x170e: (0x170e, 0x1714, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGALOG LETTER LA..TAGALOG SIGN VIRAMA
+ 0x1720: (0x1720, 0x1734, 0,0,0,0,0,1,0,0,0,0,0,0), #  HANUNOO LETTER A..HANUNOO SIGN PAMUDPOD
+ 0x1740: (0x1740, 0x1753, 0,0,0,0,0,1,0,0,0,0,0,0), #  BUHID LETTER A..BUHID VOWEL SIGN U
+ 0x1760: (0x1760, 0x176c, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGBANWA LETTER A..TAGBANWA LETTER YA
+ 0x176e: (0x176e, 0x1770, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGBANWA LETTER LA..TAGBANWA LETTER SA
+ 0x1772: (0x1772, 0x1773, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAGBANWA VOWEL SIGN I..TAGBANWA VOWEL SIGN U
+ 0x1a00: (0x1a00, 0x1a1b, 0,0,0,0,0,1,0,0,0,0,0,0), #  BUGINESE LETTER KA..BUGINESE VOWEL SIGN AE
+ 0x20f0: (0x20f0, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING ASTERISK ABOVE
+ 0x2c00: (0x2c00, 0x2c2e, 0,0,0,0,0,1,0,0,0,0,0,0), #  GLAGOLITIC CAPITAL LETTER AZU..GLAGOLITIC CAPITAL LETTER LATINATE MYSLITE
+ 0x2c30: (0x2c30, 0x2c5e, 0,0,0,0,0,1,0,0,0,0,0,0), #  GLAGOLITIC SMALL LETTER AZU..GLAGOLITIC SMALL LETTER LATINATE MYSLITE
+ 0x2c80: (0x2c80, 0x2cb1, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER ALFA..COPTIC SMALL LETTER OOU
+ 0x2ce4: (0x2ce4, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC SYMBOL KAI
+ 0x2ceb: (0x2ceb, 0x2cef, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER CRYPTOGRAMMIC SHEI..COPTIC COMBINING NI ABOVE
+ 0x2cf2: (0x2cf2, 0x2cf3, 0,0,0,0,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER BOHAIRIC KHEI..COPTIC SMALL LETTER BOHAIRIC KHEI
+ 0xa840: (0xa840, 0xa873, 0,0,0,0,0,1,0,0,0,0,0,0), #  PHAGS-PA LETTER KA..PHAGS-PA LETTER CANDRABINDU
+ 0xa930: (0xa930, 0xa953, 0,0,0,0,0,1,0,0,0,0,0,0), #  REJANG LETTER KA..REJANG VIRAMA
+ 0x10000: (0x10000, 0x1000b, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B008 A..LINEAR B SYLLABLE B046 JE
+ 0x1000d: (0x1000d, 0x10026, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B036 JO..LINEAR B SYLLABLE B032 QO
+ 0x10028: (0x10028, 0x1003a, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B060 RA..LINEAR B SYLLABLE B042 WO
+ 0x1003c: (0x1003c, 0x1003d, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B017 ZA..LINEAR B SYLLABLE B074 ZE
+ 0x1003f: (0x1003f, 0x1004d, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYLLABLE B020 ZO..LINEAR B SYLLABLE B091 TWO
+ 0x10050: (0x10050, 0x1005d, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B SYMBOL B018..LINEAR B SYMBOL B089
+ 0x10080: (0x10080, 0x100fa, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR B IDEOGRAM B100 MAN..LINEAR B IDEOGRAM VESSEL B305
+ 0x101fd: (0x101fd, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  PHAISTOS DISC SIGN COMBINING OBLIQUE STROKE
+ 0x10280: (0x10280, 0x1029c, 0,0,0,0,0,1,0,0,0,0,0,0), #  LYCIAN LETTER A..LYCIAN LETTER X
+ 0x102a0: (0x102a0, 0x102d0, 0,0,0,0,0,1,0,0,0,0,0,0), #  CARIAN LETTER A..CARIAN LETTER UUU3
+ 0x1031f: (0x1031f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD ITALIC LETTER ESS
+ 0x1032d: (0x1032d, 0x1032f, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD ITALIC LETTER YE..OLD ITALIC LETTER SOUTHERN TSE
+ 0x10350: (0x10350, 0x1037a, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERMIC LETTER AN..COMBINING OLD PERMIC LETTER SII
+ 0x10380: (0x10380, 0x1039d, 0,0,0,0,0,1,0,0,0,0,0,0), #  UGARITIC LETTER ALPA..UGARITIC LETTER SSU
+ 0x103a0: (0x103a0, 0x103c3, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERSIAN SIGN A..OLD PERSIAN SIGN HA
+ 0x103c8: (0x103c8, 0x103cf, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERSIAN SIGN AURAMAZDAA..OLD PERSIAN SIGN BUUMISH
+ 0x103d1: (0x103d1, 0x103d5, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD PERSIAN NUMBER ONE..OLD PERSIAN NUMBER HUNDRED
+ 0x10426: (0x10426, 0x10427, 0,0,0,0,0,1,0,0,0,0,0,0), #  DESERET CAPITAL LETTER OI..DESERET CAPITAL LETTER EW
+ 0x1044e: (0x1044e, 0x1049d, 0,0,0,0,0,1,0,0,0,0,0,0), #  DESERET SMALL LETTER OI..OSMANYA LETTER OO
+ 0x104a0: (0x104a0, 0x104a9, 0,0,0,0,0,1,0,0,0,0,0,0), #  OSMANYA DIGIT ZERO..OSMANYA DIGIT NINE
+ 0x10500: (0x10500, 0x10527, 0,0,0,0,0,1,0,0,0,0,0,0), #  ELBASAN LETTER A..ELBASAN LETTER KHE
+ 0x10530: (0x10530, 0x10563, 0,0,0,0,0,1,0,0,0,0,0,0), #  CAUCASIAN ALBANIAN LETTER ALT..CAUCASIAN ALBANIAN LETTER KIW
+ 0x10600: (0x10600, 0x10736, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR A SIGN AB001..LINEAR A SIGN A664
+ 0x10740: (0x10740, 0x10755, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR A SIGN A701 A..LINEAR A SIGN A732 JE
+ 0x10760: (0x10760, 0x10767, 0,0,0,0,0,1,0,0,0,0,0,0), #  LINEAR A SIGN A800..LINEAR A SIGN A807
+ 0x10800: (0x10800, 0x10805, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE A..CYPRIOT SYLLABLE JA
+ 0x10808: (0x10808, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE JO
+ 0x1080a: (0x1080a, 0x10835, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE KA..CYPRIOT SYLLABLE WO
+ 0x10837: (0x10837, 0x10838, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE XA..CYPRIOT SYLLABLE XE
+ 0x1083c: (0x1083c, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE ZA
+ 0x1083f: (0x1083f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CYPRIOT SYLLABLE ZO
+ 0x10840: (0x10840, 0x10855, 0,0,0,0,0,1,0,0,0,0,0,0), #  IMPERIAL ARAMAIC LETTER ALEPH..IMPERIAL ARAMAIC LETTER TAW
+ 0x10860: (0x10860, 0x10876, 0,0,0,0,0,1,0,0,0,0,0,0), #  PALMYRENE LETTER ALEPH..PALMYRENE LETTER TAW
+ 0x10880: (0x10880, 0x1089e, 0,0,0,0,0,1,0,0,0,0,0,0), #  NABATAEAN LETTER FINAL ALEPH..NABATAEAN LETTER TAW
+ 0x108e0: (0x108e0, 0x108f2, 0,0,0,0,0,1,0,0,0,0,0,0), #  HATRAN LETTER ALEPH..HATRAN LETTER QOPH
+ 0x108f4: (0x108f4, 0x108f5, 0,0,0,0,0,1,0,0,0,0,0,0), #  HATRAN LETTER SHIN..HATRAN LETTER TAW
+ 0x10900: (0x10900, 0x10915, 0,0,0,0,0,1,0,0,0,0,0,0), #  PHOENICIAN LETTER ALF..PHOENICIAN LETTER TAU
+ 0x10920: (0x10920, 0x10939, 0,0,0,0,0,1,0,0,0,0,0,0), #  LYDIAN LETTER A..LYDIAN LETTER C
+ 0x10980: (0x10980, 0x109b7, 0,0,0,0,0,1,0,0,0,0,0,0), #  MEROITIC HIEROGLYPHIC LETTER A..MEROITIC CURSIVE LETTER DA
+ 0x109be: (0x109be, 0x109bf, 0,0,0,0,0,1,0,0,0,0,0,0), #  MEROITIC CURSIVE LOGOGRAM RMT..MEROITIC CURSIVE LOGOGRAM IMN
+ 0x10a00: (0x10a00, 0x10a03, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER A..KHAROSHTHI VOWEL SIGN VOCALIC R
+ 0x10a05: (0x10a05, 0x10a06, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI VOWEL SIGN E..KHAROSHTHI VOWEL SIGN O
+ 0x10a0c: (0x10a0c, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI VOWEL LENGTH MARK
+ 0x10a0e: (0x10a0e, 0x10a13, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI SIGN ANUSVARA..KHAROSHTHI LETTER GHA
+ 0x10a15: (0x10a15, 0x10a17, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER CA..KHAROSHTHI LETTER JA
+ 0x10a19: (0x10a19, 0x10a33, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER NYA..KHAROSHTHI LETTER TTTHA
+ 0x10a34: (0x10a34, 0x10a35, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI LETTER TTTA..KHAROSHTHI LETTER VHA
+ 0x10a38: (0x10a38, 0x10a3a, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI SIGN BAR ABOVE..KHAROSHTHI SIGN DOT BELOW
+ 0x10a3f: (0x10a3f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHAROSHTHI VIRAMA
+ 0x10a60: (0x10a60, 0x10a7c, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD SOUTH ARABIAN LETTER HE..OLD SOUTH ARABIAN LETTER THETH
+ 0x10a80: (0x10a80, 0x10a9c, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD NORTH ARABIAN LETTER HEH..OLD NORTH ARABIAN LETTER ZAH
+ 0x10ac0: (0x10ac0, 0x10ac7, 0,0,0,0,0,1,0,0,0,0,0,0), #  MANICHAEAN LETTER ALEPH..MANICHAEAN LETTER WAW
+ 0x10ac9: (0x10ac9, 0x10ae6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MANICHAEAN LETTER ZAYIN..MANICHAEAN ABBREVIATION MARK BELOW
+ 0x10b00: (0x10b00, 0x10b35, 0,0,0,0,0,1,0,0,0,0,0,0), #  AVESTAN LETTER A..AVESTAN LETTER HE
+ 0x10b40: (0x10b40, 0x10b55, 0,0,0,0,0,1,0,0,0,0,0,0), #  INSCRIPTIONAL PARTHIAN LETTER ALEPH..INSCRIPTIONAL PARTHIAN LETTER TAW
+ 0x10b60: (0x10b60, 0x10b72, 0,0,0,0,0,1,0,0,0,0,0,0), #  INSCRIPTIONAL PAHLAVI LETTER ALEPH..INSCRIPTIONAL PAHLAVI LETTER TAW
+ 0x10b80: (0x10b80, 0x10b91, 0,0,0,0,0,1,0,0,0,0,0,0), #  PSALTER PAHLAVI LETTER ALEPH..PSALTER PAHLAVI LETTER TAW
+ 0x10c00: (0x10c00, 0x10c48, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD TURKIC LETTER ORKHON A..OLD TURKIC LETTER ORKHON BASH
+ 0x10c80: (0x10c80, 0x10cb2, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD HUNGARIAN CAPITAL LETTER A..OLD HUNGARIAN CAPITAL LETTER US
+ 0x10cc0: (0x10cc0, 0x10cf2, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD HUNGARIAN SMALL LETTER A..OLD HUNGARIAN SMALL LETTER US
+ 0x10f00: (0x10f00, 0x10f1c, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD SOGDIAN LETTER ALEPH..OLD SOGDIAN LETTER FINAL TAW WITH VERTICAL TAIL
+ 0x10f27: (0x10f27, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  OLD SOGDIAN LIGATURE AYIN-DALETH
+ 0x10f30: (0x10f30, 0x10f50, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOGDIAN LETTER ALEPH..SOGDIAN COMBINING STROKE BELOW
+ 0x11000: (0x11000, 0x11046, 0,0,0,0,0,1,0,0,0,0,0,0), #  BRAHMI SIGN CANDRABINDU..BRAHMI VIRAMA
+ 0x11066: (0x11066, 0x1106f, 0,0,0,0,0,1,0,0,0,0,0,0), #  BRAHMI DIGIT ZERO..BRAHMI DIGIT NINE
+ 0x1107f: (0x1107f, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  BRAHMI NUMBER JOINER
+ 0x11080: (0x11080, 0x110ba, 0,0,0,0,0,1,0,0,0,0,0,0), #  KAITHI SIGN CANDRABINDU..KAITHI SIGN NUKTA
+ 0x110d0: (0x110d0, 0x110e8, 0,0,0,0,0,1,0,0,0,0,0,0), #  SORA SOMPENG LETTER SAH..SORA SOMPENG LETTER MAE
+ 0x110f0: (0x110f0, 0x110f9, 0,0,0,0,0,1,0,0,0,0,0,0), #  SORA SOMPENG DIGIT ZERO..SORA SOMPENG DIGIT NINE
+ 0x11150: (0x11150, 0x11173, 0,0,0,0,0,1,0,0,0,0,0,0), #  MAHAJANI LETTER A..MAHAJANI SIGN NUKTA
+ 0x11176: (0x11176, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MAHAJANI LIGATURE SHRI
+ 0x11180: (0x11180, 0x111c4, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA SIGN CANDRABINDU..SHARADA OM
+ 0x111c9: (0x111c9, 0x111cc, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA SANDHI MARK..SHARADA EXTRA SHORT VOWEL MARK
+ 0x111d0: (0x111d0, 0x111d9, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA DIGIT ZERO..SHARADA DIGIT NINE
+ 0x111da: (0x111da, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA EKAM
+ 0x111dc: (0x111dc, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SHARADA HEADSTROKE
+ 0x11200: (0x11200, 0x11211, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHOJKI LETTER A..KHOJKI LETTER JJA
+ 0x11213: (0x11213, 0x11237, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHOJKI LETTER NYA..KHOJKI SIGN SHADDA
+ 0x1123e: (0x1123e, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHOJKI SIGN SUKUN
+ 0x11280: (0x11280, 0x11286, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER A..MULTANI LETTER GA
+ 0x11288: (0x11288, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER GHA
+ 0x1128a: (0x1128a, 0x1128d, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER CA..MULTANI LETTER JJA
+ 0x1128f: (0x1128f, 0x1129d, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER NYA..MULTANI LETTER BA
+ 0x1129f: (0x1129f, 0x112a8, 0,0,0,0,0,1,0,0,0,0,0,0), #  MULTANI LETTER BHA..MULTANI LETTER RHA
+ 0x112b0: (0x112b0, 0x112ea, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHUDAWADI LETTER A..KHUDAWADI SIGN VIRAMA
+ 0x112f0: (0x112f0, 0x112f9, 0,0,0,0,0,1,0,0,0,0,0,0), #  KHUDAWADI DIGIT ZERO..KHUDAWADI DIGIT NINE
+ 0x11300: (0x11300, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN COMBINING ANUSVARA ABOVE
+ 0x11301: (0x11301, 0x11303, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN CANDRABINDU..GRANTHA SIGN VISARGA
+ 0x11305: (0x11305, 0x1130c, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER A..GRANTHA LETTER VOCALIC L
+ 0x1130f: (0x1130f, 0x11310, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER EE..GRANTHA LETTER AI
+ 0x11313: (0x11313, 0x11328, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER OO..GRANTHA LETTER NA
+ 0x1132a: (0x1132a, 0x11330, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER PA..GRANTHA LETTER RA
+ 0x11332: (0x11332, 0x11333, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER LA..GRANTHA LETTER LLA
+ 0x11335: (0x11335, 0x11339, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA LETTER VA..GRANTHA LETTER HA
+ 0x1133c: (0x1133c, 0x11344, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN NUKTA..GRANTHA VOWEL SIGN VOCALIC RR
+ 0x11347: (0x11347, 0x11348, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA VOWEL SIGN EE..GRANTHA VOWEL SIGN AI
+ 0x1134b: (0x1134b, 0x1134d, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA VOWEL SIGN OO..GRANTHA SIGN VIRAMA
+ 0x11350: (0x11350, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA OM
+ 0x11357: (0x11357, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA AU LENGTH MARK
+ 0x1135d: (0x1135d, 0x11363, 0,0,0,0,0,1,0,0,0,0,0,0), #  GRANTHA SIGN PLUTA..GRANTHA VOWEL SIGN VOCALIC LL
+ 0x11366: (0x11366, 0x1136c, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GRANTHA DIGIT ZERO..COMBINING GRANTHA DIGIT SIX
+ 0x11370: (0x11370, 0x11374, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GRANTHA LETTER A..COMBINING GRANTHA LETTER PA
+ 0x11480: (0x11480, 0x114c5, 0,0,0,0,0,1,0,0,0,0,0,0), #  TIRHUTA ANJI..TIRHUTA GVANG
+ 0x114c7: (0x114c7, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  TIRHUTA OM
+ 0x114d0: (0x114d0, 0x114d9, 0,0,0,0,0,1,0,0,0,0,0,0), #  TIRHUTA DIGIT ZERO..TIRHUTA DIGIT NINE
+ 0x11580: (0x11580, 0x115b5, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIDDHAM LETTER A..SIDDHAM VOWEL SIGN VOCALIC RR
+ 0x115b8: (0x115b8, 0x115c0, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIDDHAM VOWEL SIGN E..SIDDHAM SIGN NUKTA
+ 0x115d8: (0x115d8, 0x115dd, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIDDHAM LETTER THREE-CIRCLE ALTERNATE I..SIDDHAM VOWEL SIGN ALTERNATE UU
+ 0x11600: (0x11600, 0x11640, 0,0,0,0,0,1,0,0,0,0,0,0), #  MODI LETTER A..MODI SIGN ARDHACANDRA
+ 0x11644: (0x11644, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MODI SIGN HUVA
+ 0x11650: (0x11650, 0x11659, 0,0,0,0,0,1,0,0,0,0,0,0), #  MODI DIGIT ZERO..MODI DIGIT NINE
+ 0x11680: (0x11680, 0x116b7, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAKRI LETTER A..TAKRI SIGN NUKTA
+ 0x116c0: (0x116c0, 0x116c9, 0,0,0,0,0,1,0,0,0,0,0,0), #  TAKRI DIGIT ZERO..TAKRI DIGIT NINE
+ 0x11700: (0x11700, 0x11719, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM LETTER KA..AHOM LETTER JHA
+ 0x1171a: (0x1171a, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM LETTER ALTERNATE BA
+ 0x1171d: (0x1171d, 0x1172b, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM CONSONANT SIGN MEDIAL LA..AHOM SIGN KILLER
+ 0x11730: (0x11730, 0x11739, 0,0,0,0,0,1,0,0,0,0,0,0), #  AHOM DIGIT ZERO..AHOM DIGIT NINE
+ 0x11800: (0x11800, 0x1183a, 0,0,0,0,0,1,0,0,0,0,0,0), #  DOGRA LETTER A..DOGRA SIGN NUKTA
+ 0x118a0: (0x118a0, 0x118e9, 0,0,0,0,0,1,0,0,0,0,0,0), #  WARANG CITI CAPITAL LETTER NGAA..WARANG CITI DIGIT NINE
+ 0x118ff: (0x118ff, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  WARANG CITI OM
+ 0x11a00: (0x11a00, 0x11a3e, 0,0,0,0,0,1,0,0,0,0,0,0), #  ZANABAZAR SQUARE LETTER A..ZANABAZAR SQUARE CLUSTER-FINAL LETTER VA
+ 0x11a47: (0x11a47, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  ZANABAZAR SQUARE SUBJOINER
+ 0x11a50: (0x11a50, 0x11a83, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOYOMBO LETTER A..SOYOMBO LETTER KSSA
+ 0x11a86: (0x11a86, 0x11a99, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOYOMBO CLUSTER-INITIAL LETTER RA..SOYOMBO SUBJOINER
+ 0x11a9d: (0x11a9d, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SOYOMBO MARK PLUTA
+ 0x11ac0: (0x11ac0, 0x11af8, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAU CIN HAU LETTER PA..PAU CIN HAU GLOTTAL STOP FINAL
+ 0x11c00: (0x11c00, 0x11c08, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI LETTER A..BHAIKSUKI LETTER VOCALIC L
+ 0x11c0a: (0x11c0a, 0x11c36, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI LETTER E..BHAIKSUKI VOWEL SIGN VOCALIC L
+ 0x11c38: (0x11c38, 0x11c40, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI VOWEL SIGN E..BHAIKSUKI SIGN AVAGRAHA
+ 0x11c50: (0x11c50, 0x11c59, 0,0,0,0,0,1,0,0,0,0,0,0), #  BHAIKSUKI DIGIT ZERO..BHAIKSUKI DIGIT NINE
+ 0x11c72: (0x11c72, 0x11c8f, 0,0,0,0,0,1,0,0,0,0,0,0), #  MARCHEN LETTER KA..MARCHEN LETTER A
+ 0x11c92: (0x11c92, 0x11ca7, 0,0,0,0,0,1,0,0,0,0,0,0), #  MARCHEN SUBJOINED LETTER KA..MARCHEN SUBJOINED LETTER ZA
+ 0x11ca9: (0x11ca9, 0x11cb6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MARCHEN SUBJOINED LETTER YA..MARCHEN SIGN CANDRABINDU
+ 0x11d00: (0x11d00, 0x11d06, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI LETTER A..MASARAM GONDI LETTER E
+ 0x11d08: (0x11d08, 0x11d09, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI LETTER AI..MASARAM GONDI LETTER O
+ 0x11d0b: (0x11d0b, 0x11d36, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI LETTER AU..MASARAM GONDI VOWEL SIGN VOCALIC R
+ 0x11d3a: (0x11d3a, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI VOWEL SIGN E
+ 0x11d3c: (0x11d3c, 0x11d3d, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI VOWEL SIGN AI..MASARAM GONDI VOWEL SIGN O
+ 0x11d3f: (0x11d3f, 0x11d47, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI VOWEL SIGN AU..MASARAM GONDI RA-KARA
+ 0x11d50: (0x11d50, 0x11d59, 0,0,0,0,0,1,0,0,0,0,0,0), #  MASARAM GONDI DIGIT ZERO..MASARAM GONDI DIGIT NINE
+ 0x11ee0: (0x11ee0, 0x11ef6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MAKASAR LETTER KA..MAKASAR VOWEL SIGN O
+ 0x12000: (0x12000, 0x1236e, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN A..CUNEIFORM SIGN ZUM
+ 0x1236f: (0x1236f, 0x12398, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN KAP ELAMITE..CUNEIFORM SIGN UM TIMES ME
+ 0x12399: (0x12399, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN U U
+ 0x12400: (0x12400, 0x12462, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM NUMERIC SIGN TWO ASH..CUNEIFORM NUMERIC SIGN OLD ASSYRIAN ONE QUARTER
+ 0x12463: (0x12463, 0x1246e, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM NUMERIC SIGN ONE QUARTER GUR..CUNEIFORM NUMERIC SIGN NINE U VARIANT FORM
+ 0x12480: (0x12480, 0x12543, 0,0,0,0,0,1,0,0,0,0,0,0), #  CUNEIFORM SIGN AB TIMES NUN TENU..CUNEIFORM SIGN ZU5 TIMES THREE DISH TENU
+ 0x13000: (0x13000, 0x1342e, 0,0,0,0,0,1,0,0,0,0,0,0), #  EGYPTIAN HIEROGLYPH A001..EGYPTIAN HIEROGLYPH AA032
+ 0x14400: (0x14400, 0x14646, 0,0,0,0,0,1,0,0,0,0,0,0), #  ANATOLIAN HIEROGLYPH A001..ANATOLIAN HIEROGLYPH A530
+ 0x16ad0: (0x16ad0, 0x16aed, 0,0,0,0,0,1,0,0,0,0,0,0), #  BASSA VAH LETTER ENNI..BASSA VAH LETTER I
+ 0x16af0: (0x16af0, 0x16af4, 0,0,0,0,0,1,0,0,0,0,0,0), #  BASSA VAH COMBINING HIGH TONE..BASSA VAH COMBINING HIGH-LOW TONE
+ 0x16b00: (0x16b00, 0x16b36, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG VOWEL KEEB..PAHAWH HMONG MARK CIM TAUM
+ 0x16b40: (0x16b40, 0x16b43, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG SIGN VOS SEEV..PAHAWH HMONG SIGN IB YAM
+ 0x16b50: (0x16b50, 0x16b59, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG DIGIT ZERO..PAHAWH HMONG DIGIT NINE
+ 0x16b63: (0x16b63, 0x16b77, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG SIGN VOS LUB..PAHAWH HMONG SIGN CIM NRES TOS
+ 0x16b7d: (0x16b7d, 0x16b8f, 0,0,0,0,0,1,0,0,0,0,0,0), #  PAHAWH HMONG CLAN SIGN TSHEEJ..PAHAWH HMONG CLAN SIGN VWJ
+ 0x16e40: (0x16e40, 0x16e7f, 0,0,0,0,0,1,0,0,0,0,0,0), #  MEDEFAIDRIN CAPITAL LETTER M..MEDEFAIDRIN SMALL LETTER Y
+ 0x16fe0: (0x16fe0, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT ITERATION MARK
+ 0x16fe1: (0x16fe1, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  NUSHU ITERATION MARK
+ 0x17000: (0x17000, 0x187ec, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT IDEOGRAPH-17000..TANGUT IDEOGRAPH-187EC
+ 0x187ed: (0x187ed, 0x187f1, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT IDEOGRAPH-187ED..TANGUT IDEOGRAPH-187F1
+ 0x18800: (0x18800, 0x18af2, 0,0,0,0,0,1,0,0,0,0,0,0), #  TANGUT COMPONENT-001..TANGUT COMPONENT-755
+ 0x1b170: (0x1b170, 0x1b2fb, 0,0,0,0,0,1,0,0,0,0,0,0), #  NUSHU CHARACTER-1B170..NUSHU CHARACTER-1B2FB
+ 0x1bc00: (0x1bc00, 0x1bc6a, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN LETTER H..DUPLOYAN LETTER VOCALIC M
+ 0x1bc70: (0x1bc70, 0x1bc7c, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN AFFIX LEFT HORIZONTAL SECANT..DUPLOYAN AFFIX ATTACHED TANGENT HOOK
+ 0x1bc80: (0x1bc80, 0x1bc88, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN AFFIX HIGH ACUTE..DUPLOYAN AFFIX HIGH VERTICAL
+ 0x1bc90: (0x1bc90, 0x1bc99, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN AFFIX LOW ACUTE..DUPLOYAN AFFIX LOW ARROW
+ 0x1bc9d: (0x1bc9d, 0x1bc9e, 0,0,0,0,0,1,0,0,0,0,0,0), #  DUPLOYAN THICK LETTER SELECTOR..DUPLOYAN DOUBLE MARK
+ 0x1da00: (0x1da00, 0x1da36, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING HEAD RIM..SIGNWRITING AIR SUCKING IN
+ 0x1da3b: (0x1da3b, 0x1da6c, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING MOUTH CLOSED NEUTRAL..SIGNWRITING EXCITEMENT
+ 0x1da75: (0x1da75, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING UPPER BODY TILTING FROM HIP JOINTS
+ 0x1da84: (0x1da84, None, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING LOCATION HEAD NECK
+ 0x1da9b: (0x1da9b, 0x1da9f, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING FILL MODIFIER-2..SIGNWRITING FILL MODIFIER-6
+ 0x1daa1: (0x1daa1, 0x1daaf, 0,0,0,0,0,1,0,0,0,0,0,0), #  SIGNWRITING ROTATION MODIFIER-2..SIGNWRITING ROTATION MODIFIER-16
+ 0x1e000: (0x1e000, 0x1e006, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER AZU..COMBINING GLAGOLITIC LETTER ZHIVETE
+ 0x1e008: (0x1e008, 0x1e018, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER ZEMLJA..COMBINING GLAGOLITIC LETTER HERU
+ 0x1e01b: (0x1e01b, 0x1e021, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER SHTA..COMBINING GLAGOLITIC LETTER YATI
+ 0x1e023: (0x1e023, 0x1e024, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER YU..COMBINING GLAGOLITIC LETTER SMALL YUS
+ 0x1e026: (0x1e026, 0x1e02a, 0,0,0,0,0,1,0,0,0,0,0,0), #  COMBINING GLAGOLITIC LETTER YO..COMBINING GLAGOLITIC LETTER FITA
+ 0x1e800: (0x1e800, 0x1e8c4, 0,0,0,0,0,1,0,0,0,0,0,0), #  MENDE KIKAKUI SYLLABLE M001 KI..MENDE KIKAKUI SYLLABLE M060 NYON
+ 0x1e8d0: (0x1e8d0, 0x1e8d6, 0,0,0,0,0,1,0,0,0,0,0,0), #  MENDE KIKAKUI COMBINING NUMBER TEENS..MENDE KIKAKUI COMBINING NUMBER MILLIONS
+ 0x0640: (0x0640, None, 0,0,0,1,0,1,0,0,0,0,0,0), #  ARABIC TATWEEL
+ 0x1681: (0x1681, 0x169a, 0,0,0,1,0,1,0,0,0,0,0,0), #  OGHAM LETTER BEITH..OGHAM LETTER PEITH
+ 0x16a0: (0x16a0, 0x16ea, 0,0,0,1,0,1,0,0,0,0,0,0), #  RUNIC LETTER FEHU FEOH FE F..RUNIC LETTER X
+ 0x2cb2: (0x2cb2, 0x2ce3, 0,0,0,1,0,1,0,0,0,0,0,0), #  COPTIC CAPITAL LETTER DIALECT-P ALEF..COPTIC SMALL LETTER OLD NUBIAN WAU
+ 0x10300: (0x10300, 0x1031e, 0,0,0,1,0,1,0,0,0,0,0,0), #  OLD ITALIC LETTER A..OLD ITALIC LETTER UU
+ 0x10330: (0x10330, 0x1034a, 0,0,0,1,0,1,0,0,0,0,0,0), #  GOTHIC LETTER AHSA..GOTHIC LETTER NINE HUNDRED
+ 0x10400: (0x10400, 0x10425, 0,0,0,1,0,1,0,0,0,0,0,0), #  DESERET CAPITAL LETTER LONG I..DESERET CAPITAL LETTER ENG
+ 0x10428: (0x10428, 0x1044d, 0,0,0,1,0,1,0,0,0,0,0,0), #  DESERET SMALL LETTER LONG I..DESERET SMALL LETTER ENG
+ 0x2cf9: (0x2cf9, 0x2cfc, 0,0,0,1,0,1,0,0,0,1,0,0), #  COPTIC OLD NUBIAN FULL STOP..COPTIC OLD NUBIAN VERSE DIVIDER
+ 0x206a: (0x206a, 0x206f, 0,1,0,1,0,1,0,0,0,1,0,1), #  INHIBIT SYMMETRIC SWAPPING..NOMINAL DIGIT SHAPES
+ 0xe0001: (0xe0001, None, 0,1,0,1,0,1,0,0,0,1,0,1), #  LANGUAGE TAG
+ 0x3164: (0x3164, None, 0,0,0,1,0,1,0,0,1,0,0,1), #  HANGUL FILLER
+ 0xffa0: (0xffa0, None, 0,0,0,1,0,1,0,0,1,0,0,1), #  HALFWIDTH HANGUL FILLER
+ 0x115f: (0x115f, 0x1160, 0,0,0,1,0,1,0,0,0,0,0,1), #  HANGUL CHOSEONG FILLER..HANGUL JUNGSEONG FILLER
+ 0x0830: (0x0830, 0x083e, 0,0,0,0,0,1,0,0,0,1,0,0), #  SAMARITAN PUNCTUATION NEQUDAA..SAMARITAN PUNCTUATION ANNAAU
+ 0x1680: (0x1680, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  OGHAM SPACE MARK
+ 0x169b: (0x169b, 0x169c, 0,0,0,0,0,1,0,0,0,1,0,0), #  OGHAM FEATHER MARK..OGHAM REVERSED FEATHER MARK
+ 0x1735: (0x1735, 0x1736, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHILIPPINE SINGLE PUNCTUATION..PHILIPPINE DOUBLE PUNCTUATION
+ 0x1802: (0x1802, 0x1803, 0,0,0,0,0,1,0,0,0,1,0,0), #  MONGOLIAN COMMA..MONGOLIAN FULL STOP
+ 0x1805: (0x1805, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  MONGOLIAN FOUR DOTS
+ 0x1a1e: (0x1a1e, 0x1a1f, 0,0,0,0,0,1,0,0,0,1,0,0), #  BUGINESE PALLAWA..BUGINESE END OF SECTION
+ 0x20dd: (0x20dd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  COMBINING ENCLOSING CIRCLE
+ 0x2ce5: (0x2ce5, 0x2cea, 0,0,0,0,0,1,0,0,0,1,0,0), #  COPTIC SYMBOL MI RO..COPTIC SYMBOL SHIMA SIMA
+ 0x2cfd: (0x2cfd, 0x2cff, 0,0,0,0,0,1,0,0,0,1,0,0), #  COPTIC FRACTION ONE HALF..COPTIC MORPHOLOGICAL DIVIDER
+ 0xa874: (0xa874, 0xa877, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHAGS-PA SINGLE HEAD MARK..PHAGS-PA MARK DOUBLE SHAD
+ 0xa95f: (0xa95f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  REJANG SECTION MARK
+ 0x10100: (0x10100, 0x10102, 0,0,0,0,0,1,0,0,0,1,0,0), #  AEGEAN WORD SEPARATOR LINE..AEGEAN CHECK MARK
+ 0x10107: (0x10107, 0x10133, 0,0,0,0,0,1,0,0,0,1,0,0), #  AEGEAN NUMBER ONE..AEGEAN NUMBER NINETY THOUSAND
+ 0x10137: (0x10137, 0x1013f, 0,0,0,0,0,1,0,0,0,1,0,0), #  AEGEAN WEIGHT BASE UNIT..AEGEAN MEASURE THIRD SUBUNIT
+ 0x101d0: (0x101d0, 0x101fc, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHAISTOS DISC SIGN PEDESTRIAN..PHAISTOS DISC SIGN WAVY BAND
+ 0x10320: (0x10320, 0x10323, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD ITALIC NUMERAL ONE..OLD ITALIC NUMERAL FIFTY
+ 0x1039f: (0x1039f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  UGARITIC WORD DIVIDER
+ 0x103d0: (0x103d0, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD PERSIAN WORD DIVIDER
+ 0x1056f: (0x1056f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  CAUCASIAN ALBANIAN CITATION MARK
+ 0x10857: (0x10857, 0x1085f, 0,0,0,0,0,1,0,0,0,1,0,0), #  IMPERIAL ARAMAIC SECTION SIGN..IMPERIAL ARAMAIC NUMBER TEN THOUSAND
+ 0x10877: (0x10877, 0x1087f, 0,0,0,0,0,1,0,0,0,1,0,0), #  PALMYRENE LEFT-POINTING FLEURON..PALMYRENE NUMBER TWENTY
+ 0x108a7: (0x108a7, 0x108af, 0,0,0,0,0,1,0,0,0,1,0,0), #  NABATAEAN NUMBER ONE..NABATAEAN NUMBER ONE HUNDRED
+ 0x108fb: (0x108fb, 0x108ff, 0,0,0,0,0,1,0,0,0,1,0,0), #  HATRAN NUMBER ONE..HATRAN NUMBER ONE HUNDRED
+ 0x10916: (0x10916, 0x10919, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHOENICIAN NUMBER ONE..PHOENICIAN NUMBER ONE HUNDRED
+ 0x1091a: (0x1091a, 0x1091b, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHOENICIAN NUMBER TWO..PHOENICIAN NUMBER THREE
+ 0x1091f: (0x1091f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  PHOENICIAN WORD SEPARATOR
+ 0x1093f: (0x1093f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  LYDIAN TRIANGULAR MARK
+ 0x109bc: (0x109bc, 0x109bd, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEROITIC CURSIVE FRACTION ELEVEN TWELFTHS..MEROITIC CURSIVE FRACTION ONE HALF
+ 0x109c0: (0x109c0, 0x109cf, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEROITIC CURSIVE NUMBER ONE..MEROITIC CURSIVE NUMBER SEVENTY
+ 0x109d2: (0x109d2, 0x109ff, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEROITIC CURSIVE NUMBER ONE HUNDRED..MEROITIC CURSIVE FRACTION TEN TWELFTHS
+ 0x10a40: (0x10a40, 0x10a47, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHAROSHTHI DIGIT ONE..KHAROSHTHI NUMBER ONE THOUSAND
+ 0x10a48: (0x10a48, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHAROSHTHI FRACTION ONE HALF
+ 0x10a50: (0x10a50, 0x10a58, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHAROSHTHI PUNCTUATION DOT..KHAROSHTHI PUNCTUATION LINES
+ 0x10a7d: (0x10a7d, 0x10a7f, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD SOUTH ARABIAN NUMBER ONE..OLD SOUTH ARABIAN NUMERIC INDICATOR
+ 0x10a9d: (0x10a9d, 0x10a9f, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD NORTH ARABIAN NUMBER ONE..OLD NORTH ARABIAN NUMBER TWENTY
+ 0x10ac8: (0x10ac8, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  MANICHAEAN SIGN UD
+ 0x10aeb: (0x10aeb, 0x10af6, 0,0,0,0,0,1,0,0,0,1,0,0), #  MANICHAEAN NUMBER ONE..MANICHAEAN PUNCTUATION LINE FILLER
+ 0x10b39: (0x10b39, 0x10b3f, 0,0,0,0,0,1,0,0,0,1,0,0), #  AVESTAN ABBREVIATION MARK..LARGE ONE RING OVER TWO RINGS PUNCTUATION
+ 0x10b58: (0x10b58, 0x10b5f, 0,0,0,0,0,1,0,0,0,1,0,0), #  INSCRIPTIONAL PARTHIAN NUMBER ONE..INSCRIPTIONAL PARTHIAN NUMBER ONE THOUSAND
+ 0x10b78: (0x10b78, 0x10b7f, 0,0,0,0,0,1,0,0,0,1,0,0), #  INSCRIPTIONAL PAHLAVI NUMBER ONE..INSCRIPTIONAL PAHLAVI NUMBER ONE THOUSAND
+ 0x10b99: (0x10b99, 0x10b9c, 0,0,0,0,0,1,0,0,0,1,0,0), #  PSALTER PAHLAVI SECTION MARK..PSALTER PAHLAVI FOUR DOTS WITH DOT
+ 0x10ba9: (0x10ba9, 0x10baf, 0,0,0,0,0,1,0,0,0,1,0,0), #  PSALTER PAHLAVI NUMBER ONE..PSALTER PAHLAVI NUMBER ONE HUNDRED
+ 0x10cfa: (0x10cfa, 0x10cff, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD HUNGARIAN NUMBER ONE..OLD HUNGARIAN NUMBER ONE THOUSAND
+ 0x10f1d: (0x10f1d, 0x10f26, 0,0,0,0,0,1,0,0,0,1,0,0), #  OLD SOGDIAN NUMBER ONE..OLD SOGDIAN FRACTION ONE HALF
+ 0x10f51: (0x10f51, 0x10f59, 0,0,0,0,0,1,0,0,0,1,0,0), #  SOGDIAN NUMBER ONE..SOGDIAN PUNCTUATION HALF CIRCLE WITH DOT
+ 0x11047: (0x11047, 0x1104d, 0,0,0,0,0,1,0,0,0,1,0,0), #  BRAHMI DANDA..BRAHMI PUNCTUATION LOTUS
+ 0x11052: (0x11052, 0x11065, 0,0,0,0,0,1,0,0,0,1,0,0), #  BRAHMI NUMBER ONE..BRAHMI NUMBER ONE THOUSAND
+ 0x110bb: (0x110bb, 0x110bc, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI ABBREVIATION SIGN..KAITHI ENUMERATION SIGN
+ 0x110bd: (0x110bd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI NUMBER SIGN
+ 0x110be: (0x110be, 0x110c1, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI SECTION MARK..KAITHI DOUBLE DANDA
+ 0x110cd: (0x110cd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  KAITHI NUMBER SIGN ABOVE
+ 0x11174: (0x11174, 0x11175, 0,0,0,0,0,1,0,0,0,1,0,0), #  MAHAJANI ABBREVIATION SIGN..MAHAJANI SECTION MARK
+ 0x111c5: (0x111c5, 0x111c8, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA DANDA..SHARADA SEPARATOR
+ 0x111cd: (0x111cd, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA SUTRA MARK
+ 0x111db: (0x111db, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA SIGN SIDDHAM
+ 0x111dd: (0x111dd, 0x111df, 0,0,0,0,0,1,0,0,0,1,0,0), #  SHARADA CONTINUATION SIGN..SHARADA SECTION MARK-2
+ 0x11238: (0x11238, 0x1123d, 0,0,0,0,0,1,0,0,0,1,0,0), #  KHOJKI DANDA..KHOJKI ABBREVIATION SIGN
+ 0x112a9: (0x112a9, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  MULTANI SECTION MARK
+ 0x114c6: (0x114c6, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  TIRHUTA ABBREVIATION SIGN
+ 0x115c1: (0x115c1, 0x115c9, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIDDHAM SIGN SIDDHAM..SIDDHAM END OF TEXT MARK
+ 0x115ca: (0x115ca, 0x115d7, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIDDHAM SECTION MARK WITH TRIDENT AND U-SHAPED ORNAMENTS..SIDDHAM SECTION MARK WITH CIRCLES AND FOUR ENCLOSURES
+ 0x11641: (0x11641, 0x11643, 0,0,0,0,0,1,0,0,0,1,0,0), #  MODI DANDA..MODI ABBREVIATION SIGN
+ 0x1173a: (0x1173a, 0x1173f, 0,0,0,0,0,1,0,0,0,1,0,0), #  AHOM NUMBER TEN..AHOM SYMBOL VI
+ 0x1183b: (0x1183b, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  DOGRA ABBREVIATION SIGN
+ 0x118ea: (0x118ea, 0x118f2, 0,0,0,0,0,1,0,0,0,1,0,0), #  WARANG CITI NUMBER TEN..WARANG CITI NUMBER NINETY
+ 0x11a3f: (0x11a3f, 0x11a46, 0,0,0,0,0,1,0,0,0,1,0,0), #  ZANABAZAR SQUARE INITIAL HEAD MARK..ZANABAZAR SQUARE CLOSING DOUBLE-LINED HEAD MARK
+ 0x11a9a: (0x11a9a, 0x11a9c, 0,0,0,0,0,1,0,0,0,1,0,0), #  SOYOMBO MARK TSHEG..SOYOMBO MARK DOUBLE SHAD
+ 0x11a9e: (0x11a9e, 0x11aa2, 0,0,0,0,0,1,0,0,0,1,0,0), #  SOYOMBO HEAD MARK WITH MOON AND SUN AND TRIPLE FLAME..SOYOMBO TERMINAL MARK-2
+ 0x11c41: (0x11c41, 0x11c45, 0,0,0,0,0,1,0,0,0,1,0,0), #  BHAIKSUKI DANDA..BHAIKSUKI GAP FILLER-2
+ 0x11c5a: (0x11c5a, 0x11c6c, 0,0,0,0,0,1,0,0,0,1,0,0), #  BHAIKSUKI NUMBER ONE..BHAIKSUKI HUNDREDS UNIT MARK
+ 0x11c70: (0x11c70, 0x11c71, 0,0,0,0,0,1,0,0,0,1,0,0), #  MARCHEN HEAD MARK..MARCHEN MARK SHAD
+ 0x11ef7: (0x11ef7, 0x11ef8, 0,0,0,0,0,1,0,0,0,1,0,0), #  MAKASAR PASSIMBANG..MAKASAR END OF SECTION
+ 0x12470: (0x12470, 0x12473, 0,0,0,0,0,1,0,0,0,1,0,0), #  CUNEIFORM PUNCTUATION SIGN OLD ASSYRIAN WORD DIVIDER..CUNEIFORM PUNCTUATION SIGN DIAGONAL TRICOLON
+ 0x12474: (0x12474, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  CUNEIFORM PUNCTUATION SIGN DIAGONAL QUADCOLON
+ 0x16a6e: (0x16a6e, 0x16a6f, 0,0,0,0,0,1,0,0,0,1,0,0), #  MRO DANDA..MRO DOUBLE DANDA
+ 0x16af5: (0x16af5, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  BASSA VAH FULL STOP
+ 0x16b37: (0x16b37, 0x16b3f, 0,0,0,0,0,1,0,0,0,1,0,0), #  PAHAWH HMONG SIGN VOS THOM..PAHAWH HMONG SIGN XYEEM FAIB
+ 0x16b44: (0x16b44, 0x16b45, 0,0,0,0,0,1,0,0,0,1,0,0), #  PAHAWH HMONG SIGN XAUS..PAHAWH HMONG SIGN CIM TSOV ROG
+ 0x16b5b: (0x16b5b, 0x16b61, 0,0,0,0,0,1,0,0,0,1,0,0), #  PAHAWH HMONG NUMBER TENS..PAHAWH HMONG NUMBER TRILLIONS
+ 0x16e80: (0x16e80, 0x16e9a, 0,0,0,0,0,1,0,0,0,1,0,0), #  MEDEFAIDRIN DIGIT ZERO..MEDEFAIDRIN EXCLAMATION OH
+ 0x1bc9c: (0x1bc9c, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  DUPLOYAN SIGN O WITH CROSS
+ 0x1bc9f: (0x1bc9f, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  DUPLOYAN PUNCTUATION CHINOOK FULL STOP
+ 0x1d200: (0x1d200, 0x1d241, 0,0,0,0,0,1,0,0,0,1,0,0), #  GREEK VOCAL NOTATION SYMBOL-1..GREEK INSTRUMENTAL NOTATION SYMBOL-54
+ 0x1d245: (0x1d245, None, 0,0,0,0,0,1,0,0,0,1,0,0), #  GREEK MUSICAL LEIMMA
+ 0x1d800: (0x1d800, 0x1d9ff, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING HAND-FIST INDEX..SIGNWRITING HEAD
+ 0x1da37: (0x1da37, 0x1da3a, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING AIR BLOW SMALL ROTATIONS..SIGNWRITING BREATH EXHALE
+ 0x1da6d: (0x1da6d, 0x1da74, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING SHOULDER HIP SPINE..SIGNWRITING TORSO-FLOORPLANE TWISTING
+ 0x1da76: (0x1da76, 0x1da83, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING LIMB COMBINATION..SIGNWRITING LOCATION DEPTH
+ 0x1da85: (0x1da85, 0x1da8b, 0,0,0,0,0,1,0,0,0,1,0,0), #  SIGNWRITING LOCATION TORSO..SIGNWRITING PARENTHESIS
+ 0x1e8c7: (0x1e8c7, 0x1e8cf, 0,0,0,0,0,1,0,0,0,1,0,0), #  MENDE KIKAKUI DIGIT ONE..MENDE KIKAKUI DIGIT NINE
+ 0x00ad: (0x00ad, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  SOFT HYPHEN
+ 0x061c: (0x061c, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  ARABIC LETTER MARK
+ 0x200b: (0x200b, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  ZERO WIDTH SPACE
+ 0x200e: (0x200e, 0x200f, 0,0,0,0,0,1,0,0,0,1,0,1), #  LEFT-TO-RIGHT MARK..RIGHT-TO-LEFT MARK
+ 0x202a: (0x202a, 0x202e, 0,0,0,0,0,1,0,0,0,1,0,1), #  LEFT-TO-RIGHT EMBEDDING..RIGHT-TO-LEFT OVERRIDE
+ 0x2060: (0x2060, 0x2063, 0,0,0,0,0,1,0,0,0,1,0,1), #  WORD JOINER..INVISIBLE SEPARATOR
+ 0x2064: (0x2064, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  INVISIBLE PLUS
+ 0x2066: (0x2066, 0x2069, 0,0,0,0,0,1,0,0,0,1,0,1), #  LEFT-TO-RIGHT ISOLATE..POP DIRECTIONAL ISOLATE
+ 0xfeff: (0xfeff, None, 0,0,0,0,0,1,0,0,0,1,0,1), #  ZERO WIDTH NO-BREAK SPACE
+ 0x1bca0: (0x1bca0, 0x1bca3, 0,0,0,0,0,1,0,0,0,1,0,1), #  SHORTHAND FORMAT LETTER OVERLAP..SHORTHAND FORMAT UP STEP
+ 0xe0020: (0xe0020, 0xe007f, 0,0,0,0,0,1,0,0,0,1,0,1), #  TAG SPACE..CANCEL TAG
+ 0x034f: (0x034f, None, 0,0,0,0,0,1,0,0,0,0,0,1), #  COMBINING GRAPHEME JOINER
+ 0x17b4: (0x17b4, 0x17b5, 0,0,0,0,0,1,0,0,0,0,0,1), #  KHMER VOWEL INHERENT AQ..KHMER VOWEL INHERENT AA
+ 0xe0100: (0xe0100, 0xe01ef, 0,0,0,0,0,1,0,0,0,0,0,1), #  VARIATION SELECTOR-17..VARIATION SELECTOR-256
+ 0x01b9: (0x01b9, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER EZH REVERSED
+ 0x01bf: (0x01bf, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN LETTER WYNN
+ 0x01f6: (0x01f6, 0x01f7, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER HWAIR..LATIN CAPITAL LETTER WYNN
+ 0x021c: (0x021c, 0x021d, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER YOGH..LATIN SMALL LETTER YOGH
+ 0x0363: (0x0363, 0x036f, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING LATIN SMALL LETTER A..COMBINING LATIN SMALL LETTER X
+ 0x0370: (0x0370, 0x0373, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER HETA..GREEK SMALL LETTER ARCHAIC SAMPI
+ 0x0376: (0x0376, 0x0377, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER PAMPHYLIAN DIGAMMA..GREEK SMALL LETTER PAMPHYLIAN DIGAMMA
+ 0x037f: (0x037f, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER YOT
+ 0x03d8: (0x03d8, 0x03d9, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER ARCHAIC KOPPA..GREEK SMALL LETTER ARCHAIC KOPPA
+ 0x03da: (0x03da, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER STIGMA
+ 0x03db: (0x03db, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER STIGMA
+ 0x03dc: (0x03dc, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER DIGAMMA
+ 0x03dd: (0x03dd, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER DIGAMMA
+ 0x03de: (0x03de, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER KOPPA
+ 0x03df: (0x03df, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER KOPPA
+ 0x03e0: (0x03e0, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK LETTER SAMPI
+ 0x03e1: (0x03e1, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK SMALL LETTER SAMPI
+ 0x03f7: (0x03f7, 0x03f8, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER SHO..GREEK SMALL LETTER SHO
+ 0x03fa: (0x03fa, 0x03fb, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK CAPITAL LETTER SAN..GREEK SMALL LETTER SAN
+ 0x0460: (0x0460, 0x0481, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER OMEGA..CYRILLIC SMALL LETTER KOPPA
+ 0x0483: (0x0483, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC TITLO
+ 0x052a: (0x052a, 0x052d, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER DZZHE..CYRILLIC SMALL LETTER DCHE
+ 0x066e: (0x066e, 0x066f, 0,0,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER DOTLESS BEH..ARABIC LETTER DOTLESS QAF
+ 0x068e: (0x068e, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER DUL
+ 0x08ad: (0x08ad, 0x08b1, 0,0,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER LOW ALEF..ARABIC LETTER STRAIGHT WAW
+ 0x094e: (0x094e, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI VOWEL SIGN PRISHTHAMATRA E
+ 0x0951: (0x0951, 0x0952, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI STRESS SIGN UDATTA..DEVANAGARI STRESS SIGN ANUDATTA
+ 0x0978: (0x0978, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI LETTER MARWARI DDA
+ 0x0980: (0x0980, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  BENGALI ANJI
+ 0x0c00: (0x0c00, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TELUGU SIGN COMBINING CANDRABINDU ABOVE
+ 0x0c34: (0x0c34, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TELUGU LETTER LLLA
+ 0x0c58: (0x0c58, 0x0c59, 0,0,0,1,0,0,0,0,0,0,0,0), #  TELUGU LETTER TSA..TELUGU LETTER DZA
+ 0x0c81: (0x0c81, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KANNADA SIGN CANDRABINDU
+ 0x0cde: (0x0cde, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KANNADA LETTER FA
+ 0x0d01: (0x0d01, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  MALAYALAM SIGN CANDRABINDU
+ 0x0d5f: (0x0d5f, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  MALAYALAM LETTER ARCHAIC II
+ 0x0de6: (0x0de6, 0x0def, 0,0,0,1,0,0,0,0,0,0,0,0), #  SINHALA LITH DIGIT ZERO..SINHALA LITH DIGIT NINE
+ 0x10a0: (0x10a0, 0x10c5, 0,0,0,1,0,0,0,0,0,0,0,0), #  GEORGIAN CAPITAL LETTER AN..GEORGIAN CAPITAL LETTER HOE
+ 0x10f1: (0x10f1, 0x10f6, 0,0,0,1,0,0,0,0,0,0,0,0), #  GEORGIAN LETTER HE..GEORGIAN LETTER FI
+ 0x1100: (0x1100, 0x1159, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL CHOSEONG KIYEOK..HANGUL CHOSEONG YEORINHIEUH
+ 0x115a: (0x115a, 0x115e, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL CHOSEONG KIYEOK-TIKEUT..HANGUL CHOSEONG TIKEUT-RIEUL
+ 0x1161: (0x1161, 0x11a2, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JUNGSEONG A..HANGUL JUNGSEONG SSANGARAEA
+ 0x11a3: (0x11a3, 0x11a7, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JUNGSEONG A-EU..HANGUL JUNGSEONG O-YAE
+ 0x11a8: (0x11a8, 0x11f9, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JONGSEONG KIYEOK..HANGUL JONGSEONG YEORINHIEUH
+ 0x11fa: (0x11fa, 0x11ff, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JONGSEONG KIYEOK-NIEUN..HANGUL JONGSEONG SSANGNIEUN
+ 0x1369: (0x1369, 0x1371, 0,0,0,1,0,0,0,0,0,0,0,0), #  ETHIOPIC DIGIT ONE..ETHIOPIC DIGIT NINE
+ 0x17a8: (0x17a8, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KHMER INDEPENDENT VOWEL QUK
+ 0x17d3: (0x17d3, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  KHMER SIGN BATHAMASAT
+ 0x1ab0: (0x1ab0, 0x1abd, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING DOUBLED CIRCUMFLEX ACCENT..COMBINING PARENTHESES BELOW
+ 0x1cd0: (0x1cd0, 0x1cd2, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC TONE KARSHANA..VEDIC TONE PRENKHA
+ 0x1cd4: (0x1cd4, 0x1cf2, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC SIGN YAJURVEDIC MIDLINE SVARITA..VEDIC SIGN ARDHAVISARGA
+ 0x1cf3: (0x1cf3, 0x1cf6, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC SIGN ROTATED ARDHAVISARGA..VEDIC SIGN UPADHMANIYA
+ 0x1cf7: (0x1cf7, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC SIGN ATIKRAMA
+ 0x1cf8: (0x1cf8, 0x1cf9, 0,0,0,1,0,0,0,0,0,0,0,0), #  VEDIC TONE RING ABOVE..VEDIC TONE DOUBLE RING ABOVE
+ 0x2132: (0x2132, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TURNED CAPITAL F
+ 0x214e: (0x214e, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  TURNED SMALL F
+ 0x2184: (0x2184, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER REVERSED C
+ 0x2185: (0x2185, 0x2188, 0,0,0,1,0,0,0,0,0,0,0,0), #  ROMAN NUMERAL SIX LATE FORM..ROMAN NUMERAL ONE HUNDRED THOUSAND
+ 0x2c6d: (0x2c6d, 0x2c6f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER ALPHA..LATIN CAPITAL LETTER TURNED A
+ 0x2c70: (0x2c70, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER TURNED ALPHA
+ 0x2c71: (0x2c71, 0x2c73, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER V WITH RIGHT HOOK..LATIN SMALL LETTER W WITH HOOK
+ 0x2c74: (0x2c74, 0x2c76, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER V WITH CURL..LATIN SMALL LETTER HALF H
+ 0x2c7e: (0x2c7e, 0x2c7f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER S WITH SWASH TAIL..LATIN CAPITAL LETTER Z WITH SWASH TAIL
+ 0x2d00: (0x2d00, 0x2d25, 0,0,0,1,0,0,0,0,0,0,0,0), #  GEORGIAN SMALL LETTER AN..GEORGIAN SMALL LETTER HOE
+ 0x2de0: (0x2de0, 0x2dff, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING CYRILLIC LETTER BE..COMBINING CYRILLIC LETTER IOTIFIED BIG YUS
+ 0xa640: (0xa640, 0xa65f, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER ZEMLYA..CYRILLIC SMALL LETTER YN
+ 0xa662: (0xa662, 0xa66e, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER SOFT DE..CYRILLIC LETTER MULTIOCULAR O
+ 0xa680: (0xa680, 0xa697, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER DWE..CYRILLIC SMALL LETTER SHWE
+ 0xa698: (0xa698, 0xa69b, 0,0,0,1,0,0,0,0,0,0,0,0), #  CYRILLIC CAPITAL LETTER DOUBLE O..CYRILLIC SMALL LETTER CROSSED O
+ 0xa730: (0xa730, 0xa76f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN LETTER SMALL CAPITAL F..LATIN SMALL LETTER CON
+ 0xa771: (0xa771, 0xa787, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER DUM..LATIN SMALL LETTER INSULAR T
+ 0xa794: (0xa794, 0xa79f, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER C WITH PALATAL HOOK..LATIN SMALL LETTER VOLAPUK UE
+ 0xa7ab: (0xa7ab, 0xa7ad, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER REVERSED OPEN E..LATIN CAPITAL LETTER L WITH BELT
+ 0xa7b0: (0xa7b0, 0xa7b1, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN CAPITAL LETTER TURNED K..LATIN CAPITAL LETTER TURNED T
+ 0xa7f7: (0xa7f7, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN EPIGRAPHIC LETTER SIDEWAYS I
+ 0xa7fb: (0xa7fb, 0xa7ff, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN EPIGRAPHIC LETTER REVERSED F..LATIN EPIGRAPHIC LETTER ARCHAIC M
+ 0xa8e0: (0xa8e0, 0xa8f7, 0,0,0,1,0,0,0,0,0,0,0,0), #  COMBINING DEVANAGARI DIGIT ZERO..DEVANAGARI SIGN CANDRABINDU AVAGRAHA
+ 0xa8fb: (0xa8fb, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI HEADSTROKE
+ 0xa8fe: (0xa8fe, 0xa8ff, 0,0,0,1,0,0,0,0,0,0,0,0), #  DEVANAGARI LETTER AY..DEVANAGARI VOWEL SIGN AY
+ 0xa960: (0xa960, 0xa97c, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL CHOSEONG TIKEUT-MIEUM..HANGUL CHOSEONG SSANGYEORINHIEUH
+ 0xa9e0: (0xa9e0, 0xa9e6, 0,0,0,1,0,0,0,0,0,0,0,0), #  MYANMAR LETTER SHAN GHA..MYANMAR MODIFIER LETTER SHAN REDUPLICATION
+ 0xab30: (0xab30, 0xab5a, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER BARRED ALPHA..LATIN SMALL LETTER Y WITH SHORT RIGHT LEG
+ 0xab64: (0xab64, 0xab65, 0,0,0,1,0,0,0,0,0,0,0,0), #  LATIN SMALL LETTER INVERTED ALPHA..GREEK LETTER SMALL CAPITAL OMEGA
+ 0xd7b0: (0xd7b0, 0xd7c6, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JUNGSEONG O-YEO..HANGUL JUNGSEONG ARAEA-E
+ 0xd7cb: (0xd7cb, 0xd7fb, 0,0,0,1,0,0,0,0,0,0,0,0), #  HANGUL JONGSEONG NIEUN-RIEUL..HANGUL JONGSEONG PHIEUPH-THIEUTH
+ 0x10140: (0x10140, 0x10174, 0,0,0,1,0,0,0,0,0,0,0,0), #  GREEK ACROPHONIC ATTIC ONE QUARTER..GREEK ACROPHONIC STRATIAN FIFTY MNAS
+ 0x102e0: (0x102e0, None, 0,0,0,1,0,0,0,0,0,0,0,0), #  COPTIC EPACT THOUSANDS MARK
+ 0x1b000: (0x1b000, 0x1b001, 0,0,0,1,0,0,0,0,0,0,0,0), #  KATAKANA LETTER ARCHAIC E..HIRAGANA LETTER ARCHAIC YE
+ 0x0482: (0x0482, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  CYRILLIC THOUSANDS SIGN
+ 0x0488: (0x0488, 0x0489, 0,0,0,1,0,0,0,0,0,1,0,0), #  COMBINING CYRILLIC HUNDRED THOUSANDS SIGN..COMBINING CYRILLIC MILLIONS SIGN
+ 0x05c6: (0x05c6, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION NUN HAFUKHA
+ 0x17d8: (0x17d8, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  KHMER SIGN BEYYAL
+ 0x1cd3: (0x1cd3, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  VEDIC SIGN NIHSHVASA
+ 0x2056: (0x2056, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  THREE DOT PUNCTUATION
+ 0x2058: (0x2058, 0x205e, 0,0,0,1,0,0,0,0,0,1,0,0), #  FOUR DOT PUNCTUATION..VERTICAL FOUR DOTS
+ 0x2127: (0x2127, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  INVERTED OHM SIGN
+ 0x214f: (0x214f, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  SYMBOL FOR SAMARITAN SOURCE
+ 0x2e0e: (0x2e0e, 0x2e16, 0,0,0,1,0,0,0,0,0,1,0,0), #  EDITORIAL CORONIS..DOTTED RIGHT-POINTING ANGLE
+ 0x2e2a: (0x2e2a, 0x2e30, 0,0,0,1,0,0,0,0,0,1,0,0), #  TWO DOTS OVER ONE DOT PUNCTUATION..RING POINT
+ 0x2e31: (0x2e31, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  WORD SEPARATOR MIDDLE DOT
+ 0x2e32: (0x2e32, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  TURNED COMMA
+ 0x2e35: (0x2e35, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  TURNED SEMICOLON
+ 0x2e39: (0x2e39, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  TOP HALF SECTION SIGN
+ 0x301e: (0x301e, None, 0,0,0,1,0,0,0,0,0,1,0,0), #  DOUBLE PRIME QUOTATION MARK
+ 0xa670: (0xa670, 0xa673, 0,0,0,1,0,0,0,0,0,1,0,0), #  COMBINING CYRILLIC TEN MILLIONS SIGN..SLAVONIC ASTERISK
+ 0xa700: (0xa700, 0xa707, 0,0,0,1,0,0,0,0,0,1,0,0), #  MODIFIER LETTER CHINESE TONE YIN PING..MODIFIER LETTER CHINESE TONE YANG RU
+ 0xa8f8: (0xa8f8, 0xa8fa, 0,0,0,1,0,0,0,0,0,1,0,0), #  DEVANAGARI SIGN PUSHPIKA..DEVANAGARI CARET
+ 0x3200: (0x3200, 0x321c, 0,0,0,1,0,0,0,0,1,1,0,0), #  PARENTHESIZED HANGUL KIYEOK..PARENTHESIZED HANGUL CIEUC U
+ 0x321d: (0x321d, 0x321e, 0,0,0,1,0,0,0,0,1,1,0,0), #  PARENTHESIZED KOREAN CHARACTER OJEON..PARENTHESIZED KOREAN CHARACTER O HU
+ 0x2329: (0x2329, 0x232a, 0,1,0,1,0,0,0,0,1,1,0,0), #  LEFT-POINTING ANGLE BRACKET..RIGHT-POINTING ANGLE BRACKET
+ 0x0344: (0x0344, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  COMBINING GREEK DIALYTIKA TONOS
+ 0x03d0: (0x03d0, 0x03d1, 0,0,0,1,0,0,0,0,1,0,0,0), #  GREEK BETA SYMBOL..GREEK THETA SYMBOL
+ 0x03d5: (0x03d5, 0x03d6, 0,0,0,1,0,0,0,0,1,0,0,0), #  GREEK PHI SYMBOL..GREEK PI SYMBOL
+ 0x03f9: (0x03f9, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LUNATE SIGMA SYMBOL
+ 0x0f73: (0x0f73, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN II
+ 0x0f75: (0x0f75, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN UU
+ 0x0f81: (0x0f81, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN REVERSED II
+ 0x3131: (0x3131, 0x3163, 0,0,0,1,0,0,0,0,1,0,0,0), #  HANGUL LETTER KIYEOK..HANGUL LETTER I
+ 0x3165: (0x3165, 0x318e, 0,0,0,1,0,0,0,0,1,0,0,0), #  HANGUL LETTER SSANGNIEUN..HANGUL LETTER ARAEAE
+ 0xa770: (0xa770, None, 0,0,0,1,0,0,0,0,1,0,0,0), #  MODIFIER LETTER US
+ 0xffa1: (0xffa1, 0xffbe, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER KIYEOK..HALFWIDTH HANGUL LETTER HIEUH
+ 0xffc2: (0xffc2, 0xffc7, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER A..HALFWIDTH HANGUL LETTER E
+ 0xffca: (0xffca, 0xffcf, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER YEO..HALFWIDTH HANGUL LETTER OE
+ 0xffd2: (0xffd2, 0xffd7, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER YO..HALFWIDTH HANGUL LETTER YU
+ 0xffda: (0xffda, 0xffdc, 0,0,0,1,0,0,0,0,1,0,0,0), #  HALFWIDTH HANGUL LETTER EU..HALFWIDTH HANGUL LETTER I
+ 0x0149: (0x0149, None, 0,1,0,1,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER N PRECEDED BY APOSTROPHE
+ 0x0f77: (0x0f77, None, 0,1,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC RR
+ 0x0f79: (0x0f79, None, 0,1,0,1,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC LL
+ 0x0673: (0x0673, None, 0,1,0,1,0,0,0,0,0,0,0,0), #  ARABIC LETTER ALEF WITH WAVY HAMZA BELOW
+ 0x17a3: (0x17a3, 0x17a4, 0,1,0,1,0,0,0,0,0,0,0,0), #  KHMER INDEPENDENT VOWEL QAQ..KHMER INDEPENDENT VOWEL QAA
+ 0x0009: (0x0009, 0x000d, 0,0,0,0,0,0,0,0,0,1,0,0), #  <control-0009>..<control-000D>
+ 0x0020: (0x0020, 0x0026, 0,0,0,0,0,0,0,0,0,1,0,0), #  SPACE..AMPERSAND
+ 0x0028: (0x0028, 0x002c, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT PARENTHESIS..COMMA
+ 0x002f: (0x002f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SOLIDUS
+ 0x003b: (0x003b, 0x0040, 0,0,0,0,0,0,0,0,0,1,0,0), #  SEMICOLON..COMMERCIAL AT
+ 0x005b: (0x005b, 0x005e, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT SQUARE BRACKET..CIRCUMFLEX ACCENT
+ 0x0060: (0x0060, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRAVE ACCENT
+ 0x007b: (0x007b, 0x007e, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT CURLY BRACKET..TILDE
+ 0x0085: (0x0085, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  <control-0085>
+ 0x00a1: (0x00a1, 0x00a7, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED EXCLAMATION MARK..SECTION SIGN
+ 0x00a9: (0x00a9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  COPYRIGHT SIGN
+ 0x00ab: (0x00ab, 0x00ac, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT-POINTING DOUBLE ANGLE QUOTATION MARK..NOT SIGN
+ 0x00ae: (0x00ae, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REGISTERED SIGN
+ 0x00b0: (0x00b0, 0x00b1, 0,0,0,0,0,0,0,0,0,1,0,0), #  DEGREE SIGN..PLUS-MINUS SIGN
+ 0x00b6: (0x00b6, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PILCROW SIGN
+ 0x00bb: (0x00bb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK
+ 0x00bf: (0x00bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED QUESTION MARK
+ 0x00d7: (0x00d7, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MULTIPLICATION SIGN
+ 0x00f7: (0x00f7, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIVISION SIGN
+ 0x02c2: (0x02c2, 0x02c5, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER LEFT ARROWHEAD..MODIFIER LETTER DOWN ARROWHEAD
+ 0x02d2: (0x02d2, 0x02d7, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER CENTRED RIGHT HALF RING..MODIFIER LETTER MINUS SIGN
+ 0x02de: (0x02de, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER RHOTIC HOOK
+ 0x02df: (0x02df, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER CROSS ACCENT
+ 0x02e5: (0x02e5, 0x02e9, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER EXTRA-HIGH TONE BAR..MODIFIER LETTER EXTRA-LOW TONE BAR
+ 0x02ea: (0x02ea, 0x02eb, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER YIN DEPARTING TONE MARK..MODIFIER LETTER YANG DEPARTING TONE MARK
+ 0x02ed: (0x02ed, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER UNASPIRATED
+ 0x02ef: (0x02ef, 0x02ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER LOW DOWN ARROWHEAD..MODIFIER LETTER LOW LEFT ARROW
+ 0x03f6: (0x03f6, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK REVERSED LUNATE EPSILON SYMBOL
+ 0x055a: (0x055a, 0x055f, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARMENIAN APOSTROPHE..ARMENIAN ABBREVIATION MARK
+ 0x0589: (0x0589, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARMENIAN FULL STOP
+ 0x058d: (0x058d, 0x058e, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT-FACING ARMENIAN ETERNITY SIGN..LEFT-FACING ARMENIAN ETERNITY SIGN
+ 0x058f: (0x058f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARMENIAN DRAM SIGN
+ 0x05be: (0x05be, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION MAQAF
+ 0x05c0: (0x05c0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION PASEQ
+ 0x05c3: (0x05c3, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEBREW PUNCTUATION SOF PASUQ
+ 0x0600: (0x0600, 0x0603, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC NUMBER SIGN..ARABIC SIGN SAFHA
+ 0x0604: (0x0604, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC SIGN SAMVAT
+ 0x0605: (0x0605, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC NUMBER MARK ABOVE
+ 0x0606: (0x0606, 0x060a, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC-INDIC CUBE ROOT..ARABIC-INDIC PER TEN THOUSAND SIGN
+ 0x060b: (0x060b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  AFGHANI SIGN
+ 0x060c: (0x060c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC COMMA
+ 0x060d: (0x060d, 0x060f, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC DATE SEPARATOR..ARABIC SIGN MISRA
+ 0x061b: (0x061b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC SEMICOLON
+ 0x061e: (0x061e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC TRIPLE DOT PUNCTUATION MARK
+ 0x061f: (0x061f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC QUESTION MARK
+ 0x066a: (0x066a, 0x066d, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC PERCENT SIGN..ARABIC FIVE POINTED STAR
+ 0x06d4: (0x06d4, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC FULL STOP
+ 0x06dd: (0x06dd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC END OF AYAH
+ 0x06de: (0x06de, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC START OF RUB EL HIZB
+ 0x06e9: (0x06e9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC PLACE OF SAJDAH
+ 0x08e2: (0x08e2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC DISPUTED END OF AYAH
+ 0x0964: (0x0964, 0x0965, 0,0,0,0,0,0,0,0,0,1,0,0), #  DEVANAGARI DANDA..DEVANAGARI DOUBLE DANDA
+ 0x0970: (0x0970, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DEVANAGARI ABBREVIATION SIGN
+ 0x09f2: (0x09f2, 0x09fa, 0,0,0,0,0,0,0,0,0,1,0,0), #  BENGALI RUPEE MARK..BENGALI ISSHAR
+ 0x09fb: (0x09fb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BENGALI GANDA MARK
+ 0x09fd: (0x09fd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BENGALI ABBREVIATION SIGN
+ 0x0a76: (0x0a76, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GURMUKHI ABBREVIATION SIGN
+ 0x0af0: (0x0af0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GUJARATI ABBREVIATION SIGN
+ 0x0af1: (0x0af1, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GUJARATI RUPEE SIGN
+ 0x0b70: (0x0b70, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ORIYA ISSHAR
+ 0x0b72: (0x0b72, 0x0b77, 0,0,0,0,0,0,0,0,0,1,0,0), #  ORIYA FRACTION ONE QUARTER..ORIYA FRACTION THREE SIXTEENTHS
+ 0x0bf0: (0x0bf0, 0x0bf2, 0,0,0,0,0,0,0,0,0,1,0,0), #  TAMIL NUMBER TEN..TAMIL NUMBER ONE THOUSAND
+ 0x0bf3: (0x0bf3, 0x0bfa, 0,0,0,0,0,0,0,0,0,1,0,0), #  TAMIL DAY SIGN..TAMIL NUMBER SIGN
+ 0x0c78: (0x0c78, 0x0c7f, 0,0,0,0,0,0,0,0,0,1,0,0), #  TELUGU FRACTION DIGIT ZERO FOR ODD POWERS OF FOUR..TELUGU SIGN TUUMU
+ 0x0c84: (0x0c84, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KANNADA SIGN SIDDHAM
+ 0x0d4f: (0x0d4f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM SIGN PARA
+ 0x0d58: (0x0d58, 0x0d5e, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM FRACTION ONE ONE-HUNDRED-AND-SIXTIETH..MALAYALAM FRACTION ONE FIFTH
+ 0x0d70: (0x0d70, 0x0d75, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM NUMBER TEN..MALAYALAM FRACTION THREE QUARTERS
+ 0x0d76: (0x0d76, 0x0d78, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM FRACTION ONE SIXTEENTH..MALAYALAM FRACTION THREE SIXTEENTHS
+ 0x0d79: (0x0d79, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MALAYALAM DATE MARK
+ 0x0df4: (0x0df4, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SINHALA PUNCTUATION KUNDDALIYA
+ 0x0e3f: (0x0e3f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  THAI CURRENCY SYMBOL BAHT
+ 0x0e4f: (0x0e4f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  THAI CHARACTER FONGMAN
+ 0x0e5a: (0x0e5a, 0x0e5b, 0,0,0,0,0,0,0,0,0,1,0,0), #  THAI CHARACTER ANGKHANKHU..THAI CHARACTER KHOMUT
+ 0x0f01: (0x0f01, 0x0f0a, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK GTER YIG MGO TRUNCATED A..TIBETAN MARK BKA- SHOG YIG MGO
+ 0x0f0d: (0x0f0d, 0x0f17, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK SHAD..TIBETAN ASTROLOGICAL SIGN SGRA GCAN -CHAR RTAGS
+ 0x0f1a: (0x0f1a, 0x0f1f, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SIGN RDEL DKAR GCIG..TIBETAN SIGN RDEL DKAR RDEL NAG
+ 0x0f2a: (0x0f2a, 0x0f34, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN DIGIT HALF ONE..TIBETAN MARK BSDUS RTAGS
+ 0x0f36: (0x0f36, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK CARET -DZUD RTAGS BZHI MIG CAN
+ 0x0f38: (0x0f38, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK CHE MGO
+ 0x0f3a: (0x0f3a, 0x0f3d, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK GUG RTAGS GYON..TIBETAN MARK ANG KHANG GYAS
+ 0x0f85: (0x0f85, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK PALUTA
+ 0x0fbe: (0x0fbe, 0x0fc5, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN KU RU KHA..TIBETAN SYMBOL RDO RJE
+ 0x0fc7: (0x0fc7, 0x0fcc, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SYMBOL RDO RJE RGYA GRAM..TIBETAN SYMBOL NOR BU BZHI -KHYIL
+ 0x0fce: (0x0fce, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SIGN RDEL NAG RDEL DKAR
+ 0x0fcf: (0x0fcf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN SIGN RDEL NAG GSUM
+ 0x0fd0: (0x0fd0, 0x0fd1, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK BSKA- SHOG GI MGO RGYAN..TIBETAN MARK MNYAM YIG GI MGO RGYAN
+ 0x0fd2: (0x0fd2, 0x0fd4, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK NYIS TSHEG..TIBETAN MARK CLOSING BRDA RNYING YIG MGO SGAB MA
+ 0x0fd5: (0x0fd5, 0x0fd8, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT-FACING SVASTI SIGN..LEFT-FACING SVASTI SIGN WITH DOTS
+ 0x0fd9: (0x0fd9, 0x0fda, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIBETAN MARK LEADING MCHAN RTAGS..TIBETAN MARK TRAILING MCHAN RTAGS
+ 0x104a: (0x104a, 0x104f, 0,0,0,0,0,0,0,0,0,1,0,0), #  MYANMAR SIGN LITTLE SECTION..MYANMAR SYMBOL GENITIVE
+ 0x109e: (0x109e, 0x109f, 0,0,0,0,0,0,0,0,0,1,0,0), #  MYANMAR SYMBOL SHAN ONE..MYANMAR SYMBOL SHAN EXCLAMATION
+ 0x10fb: (0x10fb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GEORGIAN PARAGRAPH SEPARATOR
+ 0x1360: (0x1360, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC SECTION MARK
+ 0x1361: (0x1361, 0x1368, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC WORDSPACE..ETHIOPIC PARAGRAPH SEPARATOR
+ 0x1372: (0x1372, 0x137c, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC NUMBER TEN..ETHIOPIC NUMBER TEN THOUSAND
+ 0x1390: (0x1390, 0x1399, 0,0,0,0,0,0,0,0,0,1,0,0), #  ETHIOPIC TONAL MARK YIZET..ETHIOPIC TONAL MARK KURT
+ 0x16eb: (0x16eb, 0x16ed, 0,0,0,0,0,0,0,0,0,1,0,0), #  RUNIC SINGLE PUNCTUATION..RUNIC CROSS PUNCTUATION
+ 0x17d4: (0x17d4, 0x17d6, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SIGN KHAN..KHMER SIGN CAMNUC PII KUUH
+ 0x17d9: (0x17d9, 0x17db, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SIGN PHNAEK MUAN..KHMER CURRENCY SYMBOL RIEL
+ 0x17f0: (0x17f0, 0x17f9, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SYMBOL LEK ATTAK SON..KHMER SYMBOL LEK ATTAK PRAM-BUON
+ 0x19e0: (0x19e0, 0x19ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  KHMER SYMBOL PATHAMASAT..KHMER SYMBOL DAP-PRAM ROC
+ 0x1abe: (0x1abe, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  COMBINING PARENTHESES OVERLAY
+ 0x2012: (0x2012, 0x2016, 0,0,0,0,0,0,0,0,0,1,0,0), #  FIGURE DASH..DOUBLE VERTICAL LINE
+ 0x2018: (0x2018, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT SINGLE QUOTATION MARK
+ 0x201a: (0x201a, 0x2023, 0,0,0,0,0,0,0,0,0,1,0,0), #  SINGLE LOW-9 QUOTATION MARK..TRIANGULAR BULLET
+ 0x2028: (0x2028, 0x2029, 0,0,0,0,0,0,0,0,0,1,0,0), #  LINE SEPARATOR..PARAGRAPH SEPARATOR
+ 0x2030: (0x2030, 0x2032, 0,0,0,0,0,0,0,0,0,1,0,0), #  PER MILLE SIGN..PRIME
+ 0x2035: (0x2035, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REVERSED PRIME
+ 0x2038: (0x2038, 0x203b, 0,0,0,0,0,0,0,0,0,1,0,0), #  CARET..REFERENCE MARK
+ 0x203d: (0x203d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  INTERROBANG
+ 0x2041: (0x2041, 0x2046, 0,0,0,0,0,0,0,0,0,1,0,0), #  CARET INSERTION POINT..RIGHT SQUARE BRACKET WITH QUILL
+ 0x204a: (0x204a, 0x204d, 0,0,0,0,0,0,0,0,0,1,0,0), #  TIRONIAN SIGN ET..BLACK RIGHTWARDS BULLET
+ 0x204e: (0x204e, 0x2052, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOW ASTERISK..COMMERCIAL MINUS SIGN
+ 0x2053: (0x2053, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SWUNG DASH
+ 0x2055: (0x2055, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FLOWER PUNCTUATION MARK
+ 0x20a0: (0x20a0, 0x20a7, 0,0,0,0,0,0,0,0,0,1,0,0), #  EURO-CURRENCY SIGN..PESETA SIGN
+ 0x20a9: (0x20a9, 0x20aa, 0,0,0,0,0,0,0,0,0,1,0,0), #  WON SIGN..NEW SHEQEL SIGN
+ 0x20ab: (0x20ab, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DONG SIGN
+ 0x20ac: (0x20ac, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EURO SIGN
+ 0x20ad: (0x20ad, 0x20af, 0,0,0,0,0,0,0,0,0,1,0,0), #  KIP SIGN..DRACHMA SIGN
+ 0x20b0: (0x20b0, 0x20b1, 0,0,0,0,0,0,0,0,0,1,0,0), #  GERMAN PENNY SIGN..PESO SIGN
+ 0x20b2: (0x20b2, 0x20b5, 0,0,0,0,0,0,0,0,0,1,0,0), #  GUARANI SIGN..CEDI SIGN
+ 0x20b6: (0x20b6, 0x20b8, 0,0,0,0,0,0,0,0,0,1,0,0), #  LIVRE TOURNOIS SIGN..TENGE SIGN
+ 0x20b9: (0x20b9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  INDIAN RUPEE SIGN
+ 0x20ba: (0x20ba, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TURKISH LIRA SIGN
+ 0x20bb: (0x20bb, 0x20bd, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORDIC MARK SIGN..RUBLE SIGN
+ 0x20be: (0x20be, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LARI SIGN
+ 0x20bf: (0x20bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BITCOIN SIGN
+ 0x2104: (0x2104, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CENTRE LINE SYMBOL
+ 0x2108: (0x2108, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SCRUPLE
+ 0x2114: (0x2114, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  L B BAR SYMBOL
+ 0x2117: (0x2117, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SOUND RECORDING COPYRIGHT
+ 0x211e: (0x211e, 0x211f, 0,0,0,0,0,0,0,0,0,1,0,0), #  PRESCRIPTION TAKE..RESPONSE
+ 0x2123: (0x2123, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  VERSICLE
+ 0x2125: (0x2125, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OUNCE SIGN
+ 0x2129: (0x2129, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  TURNED GREEK SMALL LETTER IOTA
+ 0x213a: (0x213a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROTATED CAPITAL Q
+ 0x2141: (0x2141, 0x2144, 0,0,0,0,0,0,0,0,0,1,0,0), #  TURNED SANS-SERIF CAPITAL G..TURNED SANS-SERIF CAPITAL Y
+ 0x214a: (0x214a, 0x214b, 0,0,0,0,0,0,0,0,0,1,0,0), #  PROPERTY LINE..TURNED AMPERSAND
+ 0x214c: (0x214c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PER SIGN
+ 0x214d: (0x214d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  AKTIESELSKAB
+ 0x2190: (0x2190, 0x21ea, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS ARROW..UPWARDS WHITE ARROW FROM BAR
+ 0x21eb: (0x21eb, 0x21f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPWARDS WHITE ARROW ON PEDESTAL..UP DOWN WHITE ARROW
+ 0x21f4: (0x21f4, 0x21ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT ARROW WITH SMALL CIRCLE..LEFT RIGHT OPEN-HEADED ARROW
+ 0x2200: (0x2200, 0x222b, 0,0,0,0,0,0,0,0,0,1,0,0), #  FOR ALL..INTEGRAL
+ 0x222e: (0x222e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CONTOUR INTEGRAL
+ 0x2231: (0x2231, 0x22f1, 0,0,0,0,0,0,0,0,0,1,0,0), #  CLOCKWISE INTEGRAL..DOWN RIGHT DIAGONAL ELLIPSIS
+ 0x22f2: (0x22f2, 0x22ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  ELEMENT OF WITH LONG HORIZONTAL STROKE..Z NOTATION BAG MEMBERSHIP
+ 0x2300: (0x2300, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIAMETER SIGN
+ 0x2301: (0x2301, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ELECTRIC ARROW
+ 0x2302: (0x2302, 0x2328, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOUSE..KEYBOARD
+ 0x232b: (0x232b, 0x237a, 0,0,0,0,0,0,0,0,0,1,0,0), #  ERASE TO THE LEFT..APL FUNCTIONAL SYMBOL ALPHA
+ 0x237b: (0x237b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NOT CHECK MARK
+ 0x237c: (0x237c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT ANGLE WITH DOWNWARDS ZIGZAG ARROW
+ 0x237d: (0x237d, 0x239a, 0,0,0,0,0,0,0,0,0,1,0,0), #  SHOULDERED OPEN BOX..CLEAR SCREEN SYMBOL
+ 0x239b: (0x239b, 0x23ce, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT PARENTHESIS UPPER HOOK..RETURN SYMBOL
+ 0x23cf: (0x23cf, 0x23d0, 0,0,0,0,0,0,0,0,0,1,0,0), #  EJECT SYMBOL..VERTICAL LINE EXTENSION
+ 0x23d1: (0x23d1, 0x23db, 0,0,0,0,0,0,0,0,0,1,0,0), #  METRICAL BREVE..FUSE
+ 0x23dc: (0x23dc, 0x23e7, 0,0,0,0,0,0,0,0,0,1,0,0), #  TOP PARENTHESIS..ELECTRICAL INTERSECTION
+ 0x23e8: (0x23e8, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DECIMAL EXPONENT SYMBOL
+ 0x23e9: (0x23e9, 0x23f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK RIGHT-POINTING DOUBLE TRIANGLE..HOURGLASS WITH FLOWING SAND
+ 0x23f4: (0x23f4, 0x23fa, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK MEDIUM LEFT-POINTING TRIANGLE..BLACK CIRCLE FOR RECORD
+ 0x23fb: (0x23fb, 0x23fe, 0,0,0,0,0,0,0,0,0,1,0,0), #  POWER SYMBOL..POWER SLEEP SYMBOL
+ 0x23ff: (0x23ff, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OBSERVER EYE SYMBOL
+ 0x2400: (0x2400, 0x2424, 0,0,0,0,0,0,0,0,0,1,0,0), #  SYMBOL FOR NULL..SYMBOL FOR NEWLINE
+ 0x2425: (0x2425, 0x2426, 0,0,0,0,0,0,0,0,0,1,0,0), #  SYMBOL FOR DELETE FORM TWO..SYMBOL FOR SUBSTITUTE FORM TWO
+ 0x2440: (0x2440, 0x244a, 0,0,0,0,0,0,0,0,0,1,0,0), #  OCR HOOK..OCR DOUBLE BACKSLASH
+ 0x2500: (0x2500, 0x2595, 0,0,0,0,0,0,0,0,0,1,0,0), #  BOX DRAWINGS LIGHT HORIZONTAL..RIGHT ONE EIGHTH BLOCK
+ 0x2596: (0x2596, 0x259f, 0,0,0,0,0,0,0,0,0,1,0,0), #  QUADRANT LOWER LEFT..QUADRANT UPPER RIGHT AND LOWER LEFT AND LOWER RIGHT
+ 0x25a0: (0x25a0, 0x25ef, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK SQUARE..LARGE CIRCLE
+ 0x25f0: (0x25f0, 0x25f7, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE SQUARE WITH UPPER LEFT QUADRANT..WHITE CIRCLE WITH UPPER RIGHT QUADRANT
+ 0x25f8: (0x25f8, 0x25ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPPER LEFT TRIANGLE..LOWER RIGHT TRIANGLE
+ 0x2600: (0x2600, 0x2613, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK SUN WITH RAYS..SALTIRE
+ 0x2614: (0x2614, 0x2615, 0,0,0,0,0,0,0,0,0,1,0,0), #  UMBRELLA WITH RAIN DROPS..HOT BEVERAGE
+ 0x2616: (0x2616, 0x2617, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE SHOGI PIECE..BLACK SHOGI PIECE
+ 0x2618: (0x2618, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SHAMROCK
+ 0x2619: (0x2619, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REVERSED ROTATED FLORAL HEART BULLET
+ 0x261a: (0x261a, 0x266f, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LEFT POINTING INDEX..MUSIC SHARP SIGN
+ 0x2670: (0x2670, 0x2671, 0,0,0,0,0,0,0,0,0,1,0,0), #  WEST SYRIAC CROSS..EAST SYRIAC CROSS
+ 0x2672: (0x2672, 0x267d, 0,0,0,0,0,0,0,0,0,1,0,0), #  UNIVERSAL RECYCLING SYMBOL..PARTIALLY-RECYCLED PAPER SYMBOL
+ 0x267e: (0x267e, 0x267f, 0,0,0,0,0,0,0,0,0,1,0,0), #  PERMANENT PAPER SIGN..WHEELCHAIR SYMBOL
+ 0x2680: (0x2680, 0x2689, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIE FACE-1..BLACK CIRCLE WITH TWO WHITE DOTS
+ 0x268a: (0x268a, 0x2691, 0,0,0,0,0,0,0,0,0,1,0,0), #  MONOGRAM FOR YANG..BLACK FLAG
+ 0x2692: (0x2692, 0x269c, 0,0,0,0,0,0,0,0,0,1,0,0), #  HAMMER AND PICK..FLEUR-DE-LIS
+ 0x269d: (0x269d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OUTLINED WHITE STAR
+ 0x269e: (0x269e, 0x269f, 0,0,0,0,0,0,0,0,0,1,0,0), #  THREE LINES CONVERGING RIGHT..THREE LINES CONVERGING LEFT
+ 0x26a0: (0x26a0, 0x26a1, 0,0,0,0,0,0,0,0,0,1,0,0), #  WARNING SIGN..HIGH VOLTAGE SIGN
+ 0x26a2: (0x26a2, 0x26b1, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOUBLED FEMALE SIGN..FUNERAL URN
+ 0x26b2: (0x26b2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEUTER
+ 0x26b3: (0x26b3, 0x26bc, 0,0,0,0,0,0,0,0,0,1,0,0), #  CERES..SESQUIQUADRATE
+ 0x26bd: (0x26bd, 0x26bf, 0,0,0,0,0,0,0,0,0,1,0,0), #  SOCCER BALL..SQUARED KEY
+ 0x26c0: (0x26c0, 0x26c3, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE DRAUGHTS MAN..BLACK DRAUGHTS KING
+ 0x26c4: (0x26c4, 0x26cd, 0,0,0,0,0,0,0,0,0,1,0,0), #  SNOWMAN WITHOUT SNOW..DISABLED CAR
+ 0x26ce: (0x26ce, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OPHIUCHUS
+ 0x26cf: (0x26cf, 0x26e1, 0,0,0,0,0,0,0,0,0,1,0,0), #  PICK..RESTRICTED LEFT ENTRY-2
+ 0x26e2: (0x26e2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  ASTRONOMICAL SYMBOL FOR URANUS
+ 0x26e3: (0x26e3, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY CIRCLE WITH STROKE AND TWO DOTS ABOVE
+ 0x26e4: (0x26e4, 0x26e7, 0,0,0,0,0,0,0,0,0,1,0,0), #  PENTAGRAM..INVERTED PENTAGRAM
+ 0x26e8: (0x26e8, 0x26ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK CROSS ON SHIELD..WHITE FLAG WITH HORIZONTAL MIDDLE BLACK STRIPE
+ 0x2700: (0x2700, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK SAFETY SCISSORS
+ 0x2701: (0x2701, 0x2704, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPPER BLADE SCISSORS..WHITE SCISSORS
+ 0x2705: (0x2705, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE HEAVY CHECK MARK
+ 0x2706: (0x2706, 0x2709, 0,0,0,0,0,0,0,0,0,1,0,0), #  TELEPHONE LOCATION SIGN..ENVELOPE
+ 0x270a: (0x270a, 0x270b, 0,0,0,0,0,0,0,0,0,1,0,0), #  RAISED FIST..RAISED HAND
+ 0x270c: (0x270c, 0x2727, 0,0,0,0,0,0,0,0,0,1,0,0), #  VICTORY HAND..WHITE FOUR POINTED STAR
+ 0x2728: (0x2728, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SPARKLES
+ 0x2729: (0x2729, 0x274b, 0,0,0,0,0,0,0,0,0,1,0,0), #  STRESS OUTLINED WHITE STAR..HEAVY EIGHT TEARDROP-SPOKED PROPELLER ASTERISK
+ 0x274c: (0x274c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CROSS MARK
+ 0x274d: (0x274d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SHADOWED WHITE CIRCLE
+ 0x274e: (0x274e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED CROSS MARK
+ 0x274f: (0x274f, 0x2752, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOWER RIGHT DROP-SHADOWED WHITE SQUARE..UPPER RIGHT SHADOWED WHITE SQUARE
+ 0x2753: (0x2753, 0x2755, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK QUESTION MARK ORNAMENT..WHITE EXCLAMATION MARK ORNAMENT
+ 0x2756: (0x2756, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK DIAMOND MINUS WHITE X
+ 0x2757: (0x2757, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY EXCLAMATION MARK SYMBOL
+ 0x2758: (0x2758, 0x275e, 0,0,0,0,0,0,0,0,0,1,0,0), #  LIGHT VERTICAL BAR..HEAVY DOUBLE COMMA QUOTATION MARK ORNAMENT
+ 0x275f: (0x275f, 0x2760, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY LOW SINGLE COMMA QUOTATION MARK ORNAMENT..HEAVY LOW DOUBLE COMMA QUOTATION MARK ORNAMENT
+ 0x2761: (0x2761, 0x2767, 0,0,0,0,0,0,0,0,0,1,0,0), #  CURVED STEM PARAGRAPH SIGN ORNAMENT..ROTATED FLORAL HEART BULLET
+ 0x2768: (0x2768, 0x2775, 0,0,0,0,0,0,0,0,0,1,0,0), #  MEDIUM LEFT PARENTHESIS ORNAMENT..MEDIUM RIGHT CURLY BRACKET ORNAMENT
+ 0x2776: (0x2776, 0x2794, 0,0,0,0,0,0,0,0,0,1,0,0), #  DINGBAT NEGATIVE CIRCLED DIGIT ONE..HEAVY WIDE-HEADED RIGHTWARDS ARROW
+ 0x2795: (0x2795, 0x2797, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY PLUS SIGN..HEAVY DIVISION SIGN
+ 0x2798: (0x2798, 0x27af, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY SOUTH EAST ARROW..NOTCHED LOWER RIGHT-SHADOWED WHITE RIGHTWARDS ARROW
+ 0x27b0: (0x27b0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CURLY LOOP
+ 0x27b1: (0x27b1, 0x27be, 0,0,0,0,0,0,0,0,0,1,0,0), #  NOTCHED UPPER RIGHT-SHADOWED WHITE RIGHTWARDS ARROW..OPEN-OUTLINED RIGHTWARDS ARROW
+ 0x27bf: (0x27bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOUBLE CURLY LOOP
+ 0x27c0: (0x27c0, 0x27c6, 0,0,0,0,0,0,0,0,0,1,0,0), #  THREE DIMENSIONAL ANGLE..RIGHT S-SHAPED BAG DELIMITER
+ 0x27c7: (0x27c7, 0x27ca, 0,0,0,0,0,0,0,0,0,1,0,0), #  OR WITH DOT INSIDE..VERTICAL BAR WITH HORIZONTAL STROKE
+ 0x27cb: (0x27cb, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MATHEMATICAL RISING DIAGONAL
+ 0x27cc: (0x27cc, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LONG DIVISION
+ 0x27cd: (0x27cd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MATHEMATICAL FALLING DIAGONAL
+ 0x27ce: (0x27ce, 0x27cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARED LOGICAL AND..SQUARED LOGICAL OR
+ 0x27d0: (0x27d0, 0x27eb, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE DIAMOND WITH CENTRED DOT..MATHEMATICAL RIGHT DOUBLE ANGLE BRACKET
+ 0x27ec: (0x27ec, 0x27ef, 0,0,0,0,0,0,0,0,0,1,0,0), #  MATHEMATICAL LEFT WHITE TORTOISE SHELL BRACKET..MATHEMATICAL RIGHT FLATTENED PARENTHESIS
+ 0x27f0: (0x27f0, 0x27ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPWARDS QUADRUPLE ARROW..LONG RIGHTWARDS SQUIGGLE ARROW
+ 0x2900: (0x2900, 0x2a0b, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHTWARDS TWO-HEADED ARROW WITH VERTICAL STROKE..SUMMATION WITH INTEGRAL
+ 0x2a0d: (0x2a0d, 0x2a73, 0,0,0,0,0,0,0,0,0,1,0,0), #  FINITE PART INTEGRAL..EQUALS SIGN ABOVE TILDE OPERATOR
+ 0x2a77: (0x2a77, 0x2adb, 0,0,0,0,0,0,0,0,0,1,0,0), #  EQUALS SIGN WITH TWO DOTS ABOVE AND TWO DOTS BELOW..TRANSVERSAL INTERSECTION
+ 0x2add: (0x2add, 0x2aff, 0,0,0,0,0,0,0,0,0,1,0,0), #  NONFORKING..N-ARY WHITE VERTICAL BAR
+ 0x2b00: (0x2b00, 0x2b0d, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH EAST WHITE ARROW..UP DOWN BLACK ARROW
+ 0x2b0e: (0x2b0e, 0x2b13, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHTWARDS ARROW WITH TIP DOWNWARDS..SQUARE WITH BOTTOM HALF BLACK
+ 0x2b14: (0x2b14, 0x2b1a, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARE WITH UPPER RIGHT DIAGONAL HALF BLACK..DOTTED SQUARE
+ 0x2b1b: (0x2b1b, 0x2b1f, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LARGE SQUARE..BLACK PENTAGON
+ 0x2b20: (0x2b20, 0x2b23, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE PENTAGON..HORIZONTAL BLACK HEXAGON
+ 0x2b24: (0x2b24, 0x2b4c, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LARGE CIRCLE..RIGHTWARDS ARROW ABOVE REVERSE TILDE OPERATOR
+ 0x2b4d: (0x2b4d, 0x2b4f, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOWNWARDS TRIANGLE-HEADED ZIGZAG ARROW..SHORT BACKSLANTED SOUTH ARROW
+ 0x2b50: (0x2b50, 0x2b54, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE MEDIUM STAR..WHITE RIGHT-POINTING PENTAGON
+ 0x2b55: (0x2b55, 0x2b59, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEAVY LARGE CIRCLE..HEAVY CIRCLED SALTIRE
+ 0x2b5a: (0x2b5a, 0x2b73, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLANTED NORTH ARROW WITH HOOKED HEAD..DOWNWARDS TRIANGLE-HEADED ARROW TO BAR
+ 0x2b76: (0x2b76, 0x2b95, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH WEST TRIANGLE-HEADED ARROW TO BAR..RIGHTWARDS BLACK ARROW
+ 0x2b98: (0x2b98, 0x2bb9, 0,0,0,0,0,0,0,0,0,1,0,0), #  THREE-D TOP-LIGHTED LEFTWARDS EQUILATERAL ARROWHEAD..UP ARROWHEAD IN A RECTANGLE BOX
+ 0x2bba: (0x2bba, 0x2bbc, 0,0,0,0,0,0,0,0,0,1,0,0), #  OVERLAPPING WHITE SQUARES..OVERLAPPING BLACK SQUARES
+ 0x2bbd: (0x2bbd, 0x2bc8, 0,0,0,0,0,0,0,0,0,1,0,0), #  BALLOT BOX WITH LIGHT X..BLACK MEDIUM RIGHT-POINTING TRIANGLE CENTRED
+ 0x2bca: (0x2bca, 0x2bd1, 0,0,0,0,0,0,0,0,0,1,0,0), #  TOP HALF BLACK CIRCLE..UNCERTAINTY SIGN
+ 0x2bd2: (0x2bd2, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GROUP MARK
+ 0x2bd3: (0x2bd3, 0x2beb, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLUTO FORM TWO..STAR WITH RIGHT HALF BLACK
+ 0x2bf0: (0x2bf0, 0x2bfe, 0,0,0,0,0,0,0,0,0,1,0,0), #  ERIS FORM ONE..REVERSED RIGHT ANGLE
+ 0x2e17: (0x2e17, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOUBLE OBLIQUE HYPHEN
+ 0x2e18: (0x2e18, 0x2e1b, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED INTERROBANG..TILDE WITH RING ABOVE
+ 0x2e1c: (0x2e1c, 0x2e1d, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT LOW PARAPHRASE BRACKET..RIGHT LOW PARAPHRASE BRACKET
+ 0x2e1e: (0x2e1e, 0x2e29, 0,0,0,0,0,0,0,0,0,1,0,0), #  TILDE WITH DOT ABOVE..RIGHT DOUBLE PARENTHESIS
+ 0x2e33: (0x2e33, 0x2e34, 0,0,0,0,0,0,0,0,0,1,0,0), #  RAISED DOT..RAISED COMMA
+ 0x2e36: (0x2e36, 0x2e38, 0,0,0,0,0,0,0,0,0,1,0,0), #  DAGGER WITH LEFT GUARD..TURNED DAGGER
+ 0x2e3a: (0x2e3a, 0x2e3b, 0,0,0,0,0,0,0,0,0,1,0,0), #  TWO-EM DASH..THREE-EM DASH
+ 0x2e3c: (0x2e3c, 0x2e42, 0,0,0,0,0,0,0,0,0,1,0,0), #  STENOGRAPHIC FULL STOP..DOUBLE LOW-REVERSED-9 QUOTATION MARK
+ 0x2e43: (0x2e43, 0x2e44, 0,0,0,0,0,0,0,0,0,1,0,0), #  DASH WITH LEFT UPTURN..DOUBLE SUSPENSION MARK
+ 0x2e45: (0x2e45, 0x2e49, 0,0,0,0,0,0,0,0,0,1,0,0), #  INVERTED LOW KAVYKA..DOUBLE STACKED COMMA
+ 0x2e4a: (0x2e4a, 0x2e4e, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOTTED SOLIDUS..PUNCTUS ELEVATUS MARK
+ 0x2e80: (0x2e80, 0x2e99, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK RADICAL REPEAT..CJK RADICAL RAP
+ 0x2e9b: (0x2e9b, 0x2e9e, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK RADICAL CHOKE..CJK RADICAL DEATH
+ 0x2ea0: (0x2ea0, 0x2ef2, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK RADICAL CIVILIAN..CJK RADICAL J-SIMPLIFIED TURTLE
+ 0x2ff0: (0x2ff0, 0x2ffb, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC DESCRIPTION CHARACTER LEFT TO RIGHT..IDEOGRAPHIC DESCRIPTION CHARACTER OVERLAID
+ 0x3001: (0x3001, 0x3004, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC COMMA..JAPANESE INDUSTRIAL STANDARD SYMBOL
+ 0x3008: (0x3008, 0x301d, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT ANGLE BRACKET..REVERSED DOUBLE PRIME QUOTATION MARK
+ 0x301f: (0x301f, 0x3020, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOW DOUBLE PRIME QUOTATION MARK..POSTAL MARK FACE
+ 0x3030: (0x3030, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  WAVY DASH
+ 0x3037: (0x3037, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC TELEGRAPH LINE FEED SEPARATOR SYMBOL
+ 0x303d: (0x303d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PART ALTERNATION MARK
+ 0x303e: (0x303e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC VARIATION INDICATOR
+ 0x303f: (0x303f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC HALF FILL SPACE
+ 0x3190: (0x3190, 0x3191, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC ANNOTATION LINKING MARK..IDEOGRAPHIC ANNOTATION REVERSE MARK
+ 0x31c0: (0x31c0, 0x31cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK STROKE T..CJK STROKE N
+ 0x31d0: (0x31d0, 0x31e3, 0,0,0,0,0,0,0,0,0,1,0,0), #  CJK STROKE H..CJK STROKE Q
+ 0x3248: (0x3248, 0x324f, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED NUMBER TEN ON BLACK SQUARE..CIRCLED NUMBER EIGHTY ON BLACK SQUARE
+ 0xa67e: (0xa67e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CYRILLIC KAVYKA
+ 0xa720: (0xa720, 0xa721, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER STRESS AND HIGH TONE..MODIFIER LETTER STRESS AND LOW TONE
+ 0xa789: (0xa789, 0xa78a, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER LETTER COLON..MODIFIER LETTER SHORT EQUALS SIGN
+ 0xa830: (0xa830, 0xa839, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH INDIC FRACTION ONE QUARTER..NORTH INDIC QUANTITY MARK
+ 0xa92e: (0xa92e, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KAYAH LI SIGN CWI
+ 0xaa77: (0xaa77, 0xaa79, 0,0,0,0,0,0,0,0,0,1,0,0), #  MYANMAR SYMBOL AITON EXCLAMATION..MYANMAR SYMBOL AITON TWO
+ 0xab5b: (0xab5b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MODIFIER BREVE WITH INVERTED BREVE
+ 0xfff9: (0xfff9, 0xfffb, 0,0,0,0,0,0,0,0,0,1,0,0), #  INTERLINEAR ANNOTATION ANCHOR..INTERLINEAR ANNOTATION TERMINATOR
+ 0xfffc: (0xfffc, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  OBJECT REPLACEMENT CHARACTER
+ 0xfffd: (0xfffd, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  REPLACEMENT CHARACTER
+ 0x10175: (0x10175, 0x1018a, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK ONE HALF SIGN..GREEK ZERO SIGN
+ 0x1018b: (0x1018b, 0x1018c, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK ONE QUARTER SIGN..GREEK SINUSOID SIGN
+ 0x1018d: (0x1018d, 0x1018e, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK INDICTION SIGN..NOMISMA SIGN
+ 0x10190: (0x10190, 0x1019b, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROMAN SEXTANS SIGN..ROMAN CENTURIAL SIGN
+ 0x101a0: (0x101a0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GREEK SYMBOL TAU RHO
+ 0x102e1: (0x102e1, 0x102fb, 0,0,0,0,0,0,0,0,0,1,0,0), #  COPTIC EPACT DIGIT ONE..COPTIC EPACT NUMBER NINE HUNDRED
+ 0x10e60: (0x10e60, 0x10e7e, 0,0,0,0,0,0,0,0,0,1,0,0), #  RUMI DIGIT ONE..RUMI FRACTION TWO THIRDS
+ 0x111e1: (0x111e1, 0x111f4, 0,0,0,0,0,0,0,0,0,1,0,0), #  SINHALA ARCHAIC DIGIT ONE..SINHALA ARCHAIC NUMBER ONE THOUSAND
+ 0x1d2e0: (0x1d2e0, 0x1d2f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  MAYAN NUMERAL ZERO..MAYAN NUMERAL NINETEEN
+ 0x1d360: (0x1d360, 0x1d371, 0,0,0,0,0,0,0,0,0,1,0,0), #  COUNTING ROD UNIT DIGIT ONE..COUNTING ROD TENS DIGIT NINE
+ 0x1d372: (0x1d372, 0x1d378, 0,0,0,0,0,0,0,0,0,1,0,0), #  IDEOGRAPHIC TALLY MARK ONE..TALLY MARK FIVE
+ 0x1ec71: (0x1ec71, 0x1ecb4, 0,0,0,0,0,0,0,0,0,1,0,0), #  INDIC SIYAQ NUMBER ONE..INDIC SIYAQ ALTERNATE LAKH MARK
+ 0x1eef0: (0x1eef0, 0x1eef1, 0,0,0,0,0,0,0,0,0,1,0,0), #  ARABIC MATHEMATICAL OPERATOR MEEM WITH HAH WITH TATWEEL..ARABIC MATHEMATICAL OPERATOR HAH WITH DAL
+ 0x1f000: (0x1f000, 0x1f02b, 0,0,0,0,0,0,0,0,0,1,0,0), #  MAHJONG TILE EAST WIND..MAHJONG TILE BACK
+ 0x1f030: (0x1f030, 0x1f093, 0,0,0,0,0,0,0,0,0,1,0,0), #  DOMINO TILE HORIZONTAL BACK..DOMINO TILE VERTICAL-06-06
+ 0x1f0a0: (0x1f0a0, 0x1f0ae, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD BACK..PLAYING CARD KING OF SPADES
+ 0x1f0b1: (0x1f0b1, 0x1f0be, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD ACE OF HEARTS..PLAYING CARD KING OF HEARTS
+ 0x1f0bf: (0x1f0bf, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD RED JOKER
+ 0x1f0c1: (0x1f0c1, 0x1f0cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD ACE OF DIAMONDS..PLAYING CARD BLACK JOKER
+ 0x1f0d1: (0x1f0d1, 0x1f0df, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD ACE OF CLUBS..PLAYING CARD WHITE JOKER
+ 0x1f0e0: (0x1f0e0, 0x1f0f5, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLAYING CARD FOOL..PLAYING CARD TRUMP-21
+ 0x1f10b: (0x1f10b, 0x1f10c, 0,0,0,0,0,0,0,0,0,1,0,0), #  DINGBAT CIRCLED SANS-SERIF DIGIT ZERO..DINGBAT NEGATIVE CIRCLED SANS-SERIF DIGIT ZERO
+ 0x1f12f: (0x1f12f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  COPYLEFT SYMBOL
+ 0x1f150: (0x1f150, 0x1f156, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER A..NEGATIVE CIRCLED LATIN CAPITAL LETTER G
+ 0x1f157: (0x1f157, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER H
+ 0x1f158: (0x1f158, 0x1f15e, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER I..NEGATIVE CIRCLED LATIN CAPITAL LETTER O
+ 0x1f15f: (0x1f15f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER P
+ 0x1f160: (0x1f160, 0x1f169, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE CIRCLED LATIN CAPITAL LETTER Q..NEGATIVE CIRCLED LATIN CAPITAL LETTER Z
+ 0x1f170: (0x1f170, 0x1f178, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER A..NEGATIVE SQUARED LATIN CAPITAL LETTER I
+ 0x1f179: (0x1f179, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER J
+ 0x1f17a: (0x1f17a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER K
+ 0x1f17b: (0x1f17b, 0x1f17c, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER L..NEGATIVE SQUARED LATIN CAPITAL LETTER M
+ 0x1f17d: (0x1f17d, 0x1f17e, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER N..NEGATIVE SQUARED LATIN CAPITAL LETTER O
+ 0x1f17f: (0x1f17f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER P
+ 0x1f180: (0x1f180, 0x1f189, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED LATIN CAPITAL LETTER Q..NEGATIVE SQUARED LATIN CAPITAL LETTER Z
+ 0x1f18a: (0x1f18a, 0x1f18d, 0,0,0,0,0,0,0,0,0,1,0,0), #  CROSSED NEGATIVE SQUARED LATIN CAPITAL LETTER P..NEGATIVE SQUARED SA
+ 0x1f18e: (0x1f18e, 0x1f18f, 0,0,0,0,0,0,0,0,0,1,0,0), #  NEGATIVE SQUARED AB..NEGATIVE SQUARED WC
+ 0x1f191: (0x1f191, 0x1f19a, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARED CL..SQUARED VS
+ 0x1f19b: (0x1f19b, 0x1f1ac, 0,0,0,0,0,0,0,0,0,1,0,0), #  SQUARED THREE D..SQUARED VOD
+ 0x1f1e6: (0x1f1e6, 0x1f1ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  REGIONAL INDICATOR SYMBOL LETTER A..REGIONAL INDICATOR SYMBOL LETTER Z
+ 0x1f260: (0x1f260, 0x1f265, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROUNDED SYMBOL FOR FU..ROUNDED SYMBOL FOR CAI
+ 0x1f300: (0x1f300, 0x1f320, 0,0,0,0,0,0,0,0,0,1,0,0), #  CYCLONE..SHOOTING STAR
+ 0x1f321: (0x1f321, 0x1f32c, 0,0,0,0,0,0,0,0,0,1,0,0), #  THERMOMETER..WIND BLOWING FACE
+ 0x1f32d: (0x1f32d, 0x1f32f, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOT DOG..BURRITO
+ 0x1f330: (0x1f330, 0x1f335, 0,0,0,0,0,0,0,0,0,1,0,0), #  CHESTNUT..CACTUS
+ 0x1f336: (0x1f336, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOT PEPPER
+ 0x1f337: (0x1f337, 0x1f37c, 0,0,0,0,0,0,0,0,0,1,0,0), #  TULIP..BABY BOTTLE
+ 0x1f37d: (0x1f37d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FORK AND KNIFE WITH PLATE
+ 0x1f37e: (0x1f37e, 0x1f37f, 0,0,0,0,0,0,0,0,0,1,0,0), #  BOTTLE WITH POPPING CORK..POPCORN
+ 0x1f380: (0x1f380, 0x1f393, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIBBON..GRADUATION CAP
+ 0x1f394: (0x1f394, 0x1f39f, 0,0,0,0,0,0,0,0,0,1,0,0), #  HEART WITH TIP ON THE LEFT..ADMISSION TICKETS
+ 0x1f3a0: (0x1f3a0, 0x1f3c4, 0,0,0,0,0,0,0,0,0,1,0,0), #  CAROUSEL HORSE..SURFER
+ 0x1f3c5: (0x1f3c5, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SPORTS MEDAL
+ 0x1f3c6: (0x1f3c6, 0x1f3ca, 0,0,0,0,0,0,0,0,0,1,0,0), #  TROPHY..SWIMMER
+ 0x1f3cb: (0x1f3cb, 0x1f3ce, 0,0,0,0,0,0,0,0,0,1,0,0), #  WEIGHT LIFTER..RACING CAR
+ 0x1f3cf: (0x1f3cf, 0x1f3d3, 0,0,0,0,0,0,0,0,0,1,0,0), #  CRICKET BAT AND BALL..TABLE TENNIS PADDLE AND BALL
+ 0x1f3d4: (0x1f3d4, 0x1f3df, 0,0,0,0,0,0,0,0,0,1,0,0), #  SNOW CAPPED MOUNTAIN..STADIUM
+ 0x1f3e0: (0x1f3e0, 0x1f3f0, 0,0,0,0,0,0,0,0,0,1,0,0), #  HOUSE BUILDING..EUROPEAN CASTLE
+ 0x1f3f1: (0x1f3f1, 0x1f3f7, 0,0,0,0,0,0,0,0,0,1,0,0), #  WHITE PENNANT..LABEL
+ 0x1f3f8: (0x1f3f8, 0x1f3ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  BADMINTON RACQUET AND SHUTTLECOCK..EMOJI MODIFIER FITZPATRICK TYPE-6
+ 0x1f400: (0x1f400, 0x1f43e, 0,0,0,0,0,0,0,0,0,1,0,0), #  RAT..PAW PRINTS
+ 0x1f43f: (0x1f43f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CHIPMUNK
+ 0x1f440: (0x1f440, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EYES
+ 0x1f441: (0x1f441, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EYE
+ 0x1f442: (0x1f442, 0x1f4f7, 0,0,0,0,0,0,0,0,0,1,0,0), #  EAR..CAMERA
+ 0x1f4f8: (0x1f4f8, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CAMERA WITH FLASH
+ 0x1f4f9: (0x1f4f9, 0x1f4fc, 0,0,0,0,0,0,0,0,0,1,0,0), #  VIDEO CAMERA..VIDEOCASSETTE
+ 0x1f4fd: (0x1f4fd, 0x1f4fe, 0,0,0,0,0,0,0,0,0,1,0,0), #  FILM PROJECTOR..PORTABLE STEREO
+ 0x1f4ff: (0x1f4ff, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PRAYER BEADS
+ 0x1f500: (0x1f500, 0x1f53d, 0,0,0,0,0,0,0,0,0,1,0,0), #  TWISTED RIGHTWARDS ARROWS..DOWN-POINTING SMALL RED TRIANGLE
+ 0x1f53e: (0x1f53e, 0x1f53f, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOWER RIGHT SHADOWED WHITE CIRCLE..UPPER RIGHT SHADOWED WHITE CIRCLE
+ 0x1f540: (0x1f540, 0x1f543, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED CROSS POMMEE..NOTCHED LEFT SEMICIRCLE WITH THREE DOTS
+ 0x1f544: (0x1f544, 0x1f54a, 0,0,0,0,0,0,0,0,0,1,0,0), #  NOTCHED RIGHT SEMICIRCLE WITH THREE DOTS..DOVE OF PEACE
+ 0x1f54b: (0x1f54b, 0x1f54e, 0,0,0,0,0,0,0,0,0,1,0,0), #  KAABA..MENORAH WITH NINE BRANCHES
+ 0x1f550: (0x1f550, 0x1f567, 0,0,0,0,0,0,0,0,0,1,0,0), #  CLOCK FACE ONE OCLOCK..CLOCK FACE TWELVE-THIRTY
+ 0x1f568: (0x1f568, 0x1f579, 0,0,0,0,0,0,0,0,0,1,0,0), #  RIGHT SPEAKER..JOYSTICK
+ 0x1f57a: (0x1f57a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  MAN DANCING
+ 0x1f57b: (0x1f57b, 0x1f5a3, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFT HAND TELEPHONE RECEIVER..BLACK DOWN POINTING BACKHAND INDEX
+ 0x1f5a4: (0x1f5a4, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK HEART
+ 0x1f5a5: (0x1f5a5, 0x1f5fa, 0,0,0,0,0,0,0,0,0,1,0,0), #  DESKTOP COMPUTER..WORLD MAP
+ 0x1f5fb: (0x1f5fb, 0x1f5ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  MOUNT FUJI..MOYAI
+ 0x1f600: (0x1f600, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRINNING FACE
+ 0x1f601: (0x1f601, 0x1f610, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRINNING FACE WITH SMILING EYES..NEUTRAL FACE
+ 0x1f611: (0x1f611, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  EXPRESSIONLESS FACE
+ 0x1f612: (0x1f612, 0x1f614, 0,0,0,0,0,0,0,0,0,1,0,0), #  UNAMUSED FACE..PENSIVE FACE
+ 0x1f615: (0x1f615, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CONFUSED FACE
+ 0x1f616: (0x1f616, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CONFOUNDED FACE
+ 0x1f617: (0x1f617, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KISSING FACE
+ 0x1f618: (0x1f618, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE THROWING A KISS
+ 0x1f619: (0x1f619, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KISSING FACE WITH SMILING EYES
+ 0x1f61a: (0x1f61a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  KISSING FACE WITH CLOSED EYES
+ 0x1f61b: (0x1f61b, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH STUCK-OUT TONGUE
+ 0x1f61c: (0x1f61c, 0x1f61e, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH STUCK-OUT TONGUE AND WINKING EYE..DISAPPOINTED FACE
+ 0x1f61f: (0x1f61f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  WORRIED FACE
+ 0x1f620: (0x1f620, 0x1f625, 0,0,0,0,0,0,0,0,0,1,0,0), #  ANGRY FACE..DISAPPOINTED BUT RELIEVED FACE
+ 0x1f626: (0x1f626, 0x1f627, 0,0,0,0,0,0,0,0,0,1,0,0), #  FROWNING FACE WITH OPEN MOUTH..ANGUISHED FACE
+ 0x1f628: (0x1f628, 0x1f62b, 0,0,0,0,0,0,0,0,0,1,0,0), #  FEARFUL FACE..TIRED FACE
+ 0x1f62c: (0x1f62c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  GRIMACING FACE
+ 0x1f62d: (0x1f62d, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  LOUDLY CRYING FACE
+ 0x1f62e: (0x1f62e, 0x1f62f, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH OPEN MOUTH..HUSHED FACE
+ 0x1f630: (0x1f630, 0x1f633, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH OPEN MOUTH AND COLD SWEAT..FLUSHED FACE
+ 0x1f634: (0x1f634, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLEEPING FACE
+ 0x1f635: (0x1f635, 0x1f640, 0,0,0,0,0,0,0,0,0,1,0,0), #  DIZZY FACE..WEARY CAT FACE
+ 0x1f641: (0x1f641, 0x1f642, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLIGHTLY FROWNING FACE..SLIGHTLY SMILING FACE
+ 0x1f643: (0x1f643, 0x1f644, 0,0,0,0,0,0,0,0,0,1,0,0), #  UPSIDE-DOWN FACE..FACE WITH ROLLING EYES
+ 0x1f645: (0x1f645, 0x1f64f, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH NO GOOD GESTURE..PERSON WITH FOLDED HANDS
+ 0x1f650: (0x1f650, 0x1f67f, 0,0,0,0,0,0,0,0,0,1,0,0), #  NORTH WEST POINTING LEAF..REVERSE CHECKER BOARD
+ 0x1f680: (0x1f680, 0x1f6c5, 0,0,0,0,0,0,0,0,0,1,0,0), #  ROCKET..LEFT LUGGAGE
+ 0x1f6c6: (0x1f6c6, 0x1f6cf, 0,0,0,0,0,0,0,0,0,1,0,0), #  TRIANGLE WITH ROUNDED CORNERS..BED
+ 0x1f6d0: (0x1f6d0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PLACE OF WORSHIP
+ 0x1f6d1: (0x1f6d1, 0x1f6d2, 0,0,0,0,0,0,0,0,0,1,0,0), #  OCTAGONAL SIGN..SHOPPING TROLLEY
+ 0x1f6d3: (0x1f6d3, 0x1f6d4, 0,0,0,0,0,0,0,0,0,1,0,0), #  STUPA..PAGODA
+ 0x1f6e0: (0x1f6e0, 0x1f6ec, 0,0,0,0,0,0,0,0,0,1,0,0), #  HAMMER AND WRENCH..AIRPLANE ARRIVING
+ 0x1f6f0: (0x1f6f0, 0x1f6f3, 0,0,0,0,0,0,0,0,0,1,0,0), #  SATELLITE..PASSENGER SHIP
+ 0x1f6f4: (0x1f6f4, 0x1f6f6, 0,0,0,0,0,0,0,0,0,1,0,0), #  SCOOTER..CANOE
+ 0x1f6f7: (0x1f6f7, 0x1f6f8, 0,0,0,0,0,0,0,0,0,1,0,0), #  SLED..FLYING SAUCER
+ 0x1f6f9: (0x1f6f9, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  SKATEBOARD
+ 0x1f700: (0x1f700, 0x1f773, 0,0,0,0,0,0,0,0,0,1,0,0), #  ALCHEMICAL SYMBOL FOR QUINTESSENCE..ALCHEMICAL SYMBOL FOR HALF OUNCE
+ 0x1f780: (0x1f780, 0x1f7d4, 0,0,0,0,0,0,0,0,0,1,0,0), #  BLACK LEFT-POINTING ISOSCELES RIGHT TRIANGLE..HEAVY TWELVE POINTED PINWHEEL STAR
+ 0x1f7d5: (0x1f7d5, 0x1f7d8, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED TRIANGLE..NEGATIVE CIRCLED SQUARE
+ 0x1f800: (0x1f800, 0x1f80b, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS ARROW WITH SMALL TRIANGLE ARROWHEAD..DOWNWARDS ARROW WITH LARGE TRIANGLE ARROWHEAD
+ 0x1f810: (0x1f810, 0x1f847, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS ARROW WITH SMALL EQUILATERAL ARROWHEAD..DOWNWARDS HEAVY ARROW
+ 0x1f850: (0x1f850, 0x1f859, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS SANS-SERIF ARROW..UP DOWN SANS-SERIF ARROW
+ 0x1f860: (0x1f860, 0x1f887, 0,0,0,0,0,0,0,0,0,1,0,0), #  WIDE-HEADED LEFTWARDS LIGHT BARB ARROW..WIDE-HEADED SOUTH WEST VERY HEAVY BARB ARROW
+ 0x1f890: (0x1f890, 0x1f8ad, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEFTWARDS TRIANGLE ARROWHEAD..WHITE ARROW SHAFT WIDTH TWO THIRDS
+ 0x1f900: (0x1f900, 0x1f90b, 0,0,0,0,0,0,0,0,0,1,0,0), #  CIRCLED CROSS FORMEE WITH FOUR DOTS..DOWNWARD FACING NOTCHED HOOK WITH DOT
+ 0x1f910: (0x1f910, 0x1f918, 0,0,0,0,0,0,0,0,0,1,0,0), #  ZIPPER-MOUTH FACE..SIGN OF THE HORNS
+ 0x1f919: (0x1f919, 0x1f91e, 0,0,0,0,0,0,0,0,0,1,0,0), #  CALL ME HAND..HAND WITH INDEX AND MIDDLE FINGERS CROSSED
+ 0x1f91f: (0x1f91f, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  I LOVE YOU HAND SIGN
+ 0x1f920: (0x1f920, 0x1f927, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH COWBOY HAT..SNEEZING FACE
+ 0x1f928: (0x1f928, 0x1f92f, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH ONE EYEBROW RAISED..SHOCKED FACE WITH EXPLODING HEAD
+ 0x1f930: (0x1f930, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  PREGNANT WOMAN
+ 0x1f931: (0x1f931, 0x1f932, 0,0,0,0,0,0,0,0,0,1,0,0), #  BREAST-FEEDING..PALMS UP TOGETHER
+ 0x1f933: (0x1f933, 0x1f93e, 0,0,0,0,0,0,0,0,0,1,0,0), #  SELFIE..HANDBALL
+ 0x1f940: (0x1f940, 0x1f94b, 0,0,0,0,0,0,0,0,0,1,0,0), #  WILTED FLOWER..MARTIAL ARTS UNIFORM
+ 0x1f94c: (0x1f94c, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CURLING STONE
+ 0x1f94d: (0x1f94d, 0x1f94f, 0,0,0,0,0,0,0,0,0,1,0,0), #  LACROSSE STICK AND BALL..FLYING DISC
+ 0x1f950: (0x1f950, 0x1f95e, 0,0,0,0,0,0,0,0,0,1,0,0), #  CROISSANT..PANCAKES
+ 0x1f95f: (0x1f95f, 0x1f96b, 0,0,0,0,0,0,0,0,0,1,0,0), #  DUMPLING..CANNED FOOD
+ 0x1f96c: (0x1f96c, 0x1f970, 0,0,0,0,0,0,0,0,0,1,0,0), #  LEAFY GREEN..SMILING FACE WITH SMILING EYES AND THREE HEARTS
+ 0x1f973: (0x1f973, 0x1f976, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH PARTY HORN AND PARTY HAT..FREEZING FACE
+ 0x1f97a: (0x1f97a, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH PLEADING EYES
+ 0x1f97c: (0x1f97c, 0x1f97f, 0,0,0,0,0,0,0,0,0,1,0,0), #  LAB COAT..FLAT SHOE
+ 0x1f980: (0x1f980, 0x1f984, 0,0,0,0,0,0,0,0,0,1,0,0), #  CRAB..UNICORN FACE
+ 0x1f985: (0x1f985, 0x1f991, 0,0,0,0,0,0,0,0,0,1,0,0), #  EAGLE..SQUID
+ 0x1f992: (0x1f992, 0x1f997, 0,0,0,0,0,0,0,0,0,1,0,0), #  GIRAFFE FACE..CRICKET
+ 0x1f998: (0x1f998, 0x1f9a2, 0,0,0,0,0,0,0,0,0,1,0,0), #  KANGAROO..SWAN
+ 0x1f9b0: (0x1f9b0, 0x1f9b9, 0,0,0,0,0,0,0,0,0,1,0,0), #  EMOJI COMPONENT RED HAIR..SUPERVILLAIN
+ 0x1f9c0: (0x1f9c0, None, 0,0,0,0,0,0,0,0,0,1,0,0), #  CHEESE WEDGE
+ 0x1f9c1: (0x1f9c1, 0x1f9c2, 0,0,0,0,0,0,0,0,0,1,0,0), #  CUPCAKE..SALT SHAKER
+ 0x1f9d0: (0x1f9d0, 0x1f9e6, 0,0,0,0,0,0,0,0,0,1,0,0), #  FACE WITH MONOCLE..SOCKS
+ 0x1f9e7: (0x1f9e7, 0x1f9ff, 0,0,0,0,0,0,0,0,0,1,0,0), #  RED GIFT ENVELOPE..NAZAR AMULET
+ 0x1fa60: (0x1fa60, 0x1fa6d, 0,0,0,0,0,0,0,0,0,1,0,0), #  XIANGQI RED GENERAL..XIANGQI BLACK SOLDIER
+ 0x00a0: (0x00a0, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NO-BREAK SPACE
+ 0x00a8: (0x00a8, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DIAERESIS
+ 0x00af: (0x00af, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  MACRON
+ 0x00b2: (0x00b2, 0x00b4, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUPERSCRIPT TWO..ACUTE ACCENT
+ 0x00b8: (0x00b8, 0x00b9, 0,0,0,0,0,0,0,0,1,1,0,0), #  CEDILLA..SUPERSCRIPT ONE
+ 0x00bc: (0x00bc, 0x00be, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ONE QUARTER..VULGAR FRACTION THREE QUARTERS
+ 0x02d8: (0x02d8, 0x02dd, 0,0,0,0,0,0,0,0,1,1,0,0), #  BREVE..DOUBLE ACUTE ACCENT
+ 0x037a: (0x037a, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK YPOGEGRAMMENI
+ 0x037e: (0x037e, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK QUESTION MARK
+ 0x0384: (0x0384, 0x0385, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK TONOS..GREEK DIALYTIKA TONOS
+ 0x0f0c: (0x0f0c, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  TIBETAN MARK DELIMITER TSHEG BSTAR
+ 0x1fbd: (0x1fbd, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK KORONIS
+ 0x1fbf: (0x1fbf, 0x1fc1, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK PSILI..GREEK DIALYTIKA AND PERISPOMENI
+ 0x1fcd: (0x1fcd, 0x1fcf, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK PSILI AND VARIA..GREEK PSILI AND PERISPOMENI
+ 0x1fdd: (0x1fdd, 0x1fdf, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK DASIA AND VARIA..GREEK DASIA AND PERISPOMENI
+ 0x1fed: (0x1fed, 0x1fef, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK DIALYTIKA AND VARIA..GREEK VARIA
+ 0x1ffd: (0x1ffd, 0x1ffe, 0,0,0,0,0,0,0,0,1,1,0,0), #  GREEK OXIA..GREEK DASIA
+ 0x2000: (0x2000, 0x200a, 0,0,0,0,0,0,0,0,1,1,0,0), #  EN QUAD..HAIR SPACE
+ 0x2011: (0x2011, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NON-BREAKING HYPHEN
+ 0x2017: (0x2017, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE LOW LINE
+ 0x2024: (0x2024, 0x2026, 0,0,0,0,0,0,0,0,1,1,0,0), #  ONE DOT LEADER..HORIZONTAL ELLIPSIS
+ 0x202f: (0x202f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NARROW NO-BREAK SPACE
+ 0x2033: (0x2033, 0x2034, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE PRIME..TRIPLE PRIME
+ 0x2036: (0x2036, 0x2037, 0,0,0,0,0,0,0,0,1,1,0,0), #  REVERSED DOUBLE PRIME..REVERSED TRIPLE PRIME
+ 0x203c: (0x203c, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE EXCLAMATION MARK
+ 0x203e: (0x203e, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  OVERLINE
+ 0x2047: (0x2047, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE QUESTION MARK
+ 0x2048: (0x2048, 0x2049, 0,0,0,0,0,0,0,0,1,1,0,0), #  QUESTION EXCLAMATION MARK..EXCLAMATION QUESTION MARK
+ 0x2057: (0x2057, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  QUADRUPLE PRIME
+ 0x205f: (0x205f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  MEDIUM MATHEMATICAL SPACE
+ 0x2070: (0x2070, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUPERSCRIPT ZERO
+ 0x2074: (0x2074, 0x207e, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUPERSCRIPT FOUR..SUPERSCRIPT RIGHT PARENTHESIS
+ 0x2080: (0x2080, 0x208e, 0,0,0,0,0,0,0,0,1,1,0,0), #  SUBSCRIPT ZERO..SUBSCRIPT RIGHT PARENTHESIS
+ 0x20a8: (0x20a8, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  RUPEE SIGN
+ 0x2100: (0x2100, 0x2101, 0,0,0,0,0,0,0,0,1,1,0,0), #  ACCOUNT OF..ADDRESSED TO THE SUBJECT
+ 0x2103: (0x2103, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DEGREE CELSIUS
+ 0x2105: (0x2105, 0x2106, 0,0,0,0,0,0,0,0,1,1,0,0), #  CARE OF..CADA UNA
+ 0x2109: (0x2109, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DEGREE FAHRENHEIT
+ 0x2116: (0x2116, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  NUMERO SIGN
+ 0x2120: (0x2120, 0x2122, 0,0,0,0,0,0,0,0,1,1,0,0), #  SERVICE MARK..TRADE MARK SIGN
+ 0x213b: (0x213b, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  FACSIMILE SIGN
+ 0x2140: (0x2140, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE-STRUCK N-ARY SUMMATION
+ 0x2150: (0x2150, 0x2152, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ONE SEVENTH..VULGAR FRACTION ONE TENTH
+ 0x2153: (0x2153, 0x215f, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ONE THIRD..FRACTION NUMERATOR ONE
+ 0x2189: (0x2189, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  VULGAR FRACTION ZERO THIRDS
+ 0x222c: (0x222c, 0x222d, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE INTEGRAL..TRIPLE INTEGRAL
+ 0x222f: (0x222f, 0x2230, 0,0,0,0,0,0,0,0,1,1,0,0), #  SURFACE INTEGRAL..VOLUME INTEGRAL
+ 0x2a0c: (0x2a0c, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  QUADRUPLE INTEGRAL OPERATOR
+ 0x2a74: (0x2a74, 0x2a76, 0,0,0,0,0,0,0,0,1,1,0,0), #  DOUBLE COLON EQUAL..THREE CONSECUTIVE EQUALS SIGNS
+ 0x2adc: (0x2adc, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  FORKING
+ 0x2e9f: (0x2e9f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  CJK RADICAL MOTHER
+ 0x2ef3: (0x2ef3, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  CJK RADICAL C-SIMPLIFIED TURTLE
+ 0x2f00: (0x2f00, 0x2fd5, 0,0,0,0,0,0,0,0,1,1,0,0), #  KANGXI RADICAL ONE..KANGXI RADICAL FLUTE
+ 0x3000: (0x3000, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC SPACE
+ 0x3036: (0x3036, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  CIRCLED POSTAL MARK
+ 0x309b: (0x309b, 0x309c, 0,0,0,0,0,0,0,0,1,1,0,0), #  KATAKANA-HIRAGANA VOICED SOUND MARK..KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK
+ 0x3192: (0x3192, 0x319f, 0,0,0,0,0,0,0,0,1,1,0,0), #  IDEOGRAPHIC ANNOTATION ONE MARK..IDEOGRAPHIC ANNOTATION MAN MARK
+ 0x3220: (0x3220, 0x3243, 0,0,0,0,0,0,0,0,1,1,0,0), #  PARENTHESIZED IDEOGRAPH ONE..PARENTHESIZED IDEOGRAPH REACH
+ 0x3244: (0x3244, 0x3247, 0,0,0,0,0,0,0,0,1,1,0,0), #  CIRCLED IDEOGRAPH QUESTION..CIRCLED IDEOGRAPH KOTO
+ 0x3250: (0x3250, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  PARTNERSHIP SIGN
+ 0xff01: (0xff01, 0xff0f, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH EXCLAMATION MARK..FULLWIDTH SOLIDUS
+ 0xff1a: (0xff1a, 0xff20, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH COLON..FULLWIDTH COMMERCIAL AT
+ 0xff3b: (0xff3b, 0xff3e, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH LEFT SQUARE BRACKET..FULLWIDTH CIRCUMFLEX ACCENT
+ 0xff40: (0xff40, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH GRAVE ACCENT
+ 0xff5b: (0xff5b, 0xff5e, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH LEFT CURLY BRACKET..FULLWIDTH TILDE
+ 0xff5f: (0xff5f, 0xff60, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH LEFT WHITE PARENTHESIS..FULLWIDTH RIGHT WHITE PARENTHESIS
+ 0xff61: (0xff61, 0xff65, 0,0,0,0,0,0,0,0,1,1,0,0), #  HALFWIDTH IDEOGRAPHIC FULL STOP..HALFWIDTH KATAKANA MIDDLE DOT
+ 0xffe0: (0xffe0, 0xffe6, 0,0,0,0,0,0,0,0,1,1,0,0), #  FULLWIDTH CENT SIGN..FULLWIDTH WON SIGN
+ 0xffe8: (0xffe8, 0xffee, 0,0,0,0,0,0,0,0,1,1,0,0), #  HALFWIDTH FORMS LIGHT VERTICAL..HALFWIDTH WHITE CIRCLE
+ 0x1f100: (0x1f100, 0x1f10a, 0,0,0,0,0,0,0,0,1,1,0,0), #  DIGIT ZERO FULL STOP..DIGIT NINE COMMA
+ 0x1f110: (0x1f110, 0x1f12e, 0,0,0,0,0,0,0,0,1,1,0,0), #  PARENTHESIZED LATIN CAPITAL LETTER A..CIRCLED WZ
+ 0x1f130: (0x1f130, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER A
+ 0x1f131: (0x1f131, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER B
+ 0x1f132: (0x1f132, 0x1f13c, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER C..SQUARED LATIN CAPITAL LETTER M
+ 0x1f13d: (0x1f13d, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER N
+ 0x1f13e: (0x1f13e, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER O
+ 0x1f13f: (0x1f13f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER P
+ 0x1f140: (0x1f140, 0x1f141, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER Q..SQUARED LATIN CAPITAL LETTER R
+ 0x1f142: (0x1f142, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER S
+ 0x1f143: (0x1f143, 0x1f145, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER T..SQUARED LATIN CAPITAL LETTER V
+ 0x1f146: (0x1f146, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER W
+ 0x1f147: (0x1f147, 0x1f149, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED LATIN CAPITAL LETTER X..SQUARED LATIN CAPITAL LETTER Z
+ 0x1f14a: (0x1f14a, 0x1f14e, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED HV..SQUARED PPV
+ 0x1f14f: (0x1f14f, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED WC
+ 0x1f16a: (0x1f16a, 0x1f16b, 0,0,0,0,0,0,0,0,1,1,0,0), #  RAISED MC SIGN..RAISED MD SIGN
+ 0x1f190: (0x1f190, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARE DJ
+ 0x1f200: (0x1f200, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARE HIRAGANA HOKA
+ 0x1f201: (0x1f201, 0x1f202, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED KATAKANA KOKO..SQUARED KATAKANA SA
+ 0x1f210: (0x1f210, 0x1f231, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED CJK UNIFIED IDEOGRAPH-624B..SQUARED CJK UNIFIED IDEOGRAPH-6253
+ 0x1f232: (0x1f232, 0x1f23a, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED CJK UNIFIED IDEOGRAPH-7981..SQUARED CJK UNIFIED IDEOGRAPH-55B6
+ 0x1f23b: (0x1f23b, None, 0,0,0,0,0,0,0,0,1,1,0,0), #  SQUARED CJK UNIFIED IDEOGRAPH-914D
+ 0x1f240: (0x1f240, 0x1f248, 0,0,0,0,0,0,0,0,1,1,0,0), #  TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-672C..TORTOISE SHELL BRACKETED CJK UNIFIED IDEOGRAPH-6557
+ 0x1f250: (0x1f250, 0x1f251, 0,0,0,0,0,0,0,0,1,1,0,0), #  CIRCLED IDEOGRAPH ADVANTAGE..CIRCLED IDEOGRAPH ACCEPT
+ 0x00aa: (0x00aa, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  FEMININE ORDINAL INDICATOR
+ 0x00b5: (0x00b5, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  MICRO SIGN
+ 0x00ba: (0x00ba, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  MASCULINE ORDINAL INDICATOR
+ 0x0132: (0x0132, 0x0133, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LIGATURE IJ..LATIN SMALL LIGATURE IJ
+ 0x013f: (0x013f, 0x0140, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LETTER L WITH MIDDLE DOT..LATIN SMALL LETTER L WITH MIDDLE DOT
+ 0x017f: (0x017f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER LONG S
+ 0x01c4: (0x01c4, 0x01cc, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LETTER DZ WITH CARON..LATIN SMALL LETTER NJ
+ 0x01f1: (0x01f1, 0x01f3, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN CAPITAL LETTER DZ..LATIN SMALL LETTER DZ
+ 0x02b0: (0x02b0, 0x02b8, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL H..MODIFIER LETTER SMALL Y
+ 0x02e0: (0x02e0, 0x02e4, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL GAMMA..MODIFIER LETTER SMALL REVERSED GLOTTAL STOP
+ 0x0374: (0x0374, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK NUMERAL SIGN
+ 0x0387: (0x0387, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK ANO TELEIA
+ 0x03d2: (0x03d2, 0x03d4, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK UPSILON WITH HOOK SYMBOL..GREEK UPSILON WITH DIAERESIS AND HOOK SYMBOL
+ 0x03f0: (0x03f0, 0x03f2, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK KAPPA SYMBOL..GREEK LUNATE SIGMA SYMBOL
+ 0x03f4: (0x03f4, 0x03f5, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL THETA SYMBOL..GREEK LUNATE EPSILON SYMBOL
+ 0x0587: (0x0587, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARMENIAN SMALL LIGATURE ECH YIWN
+ 0x0675: (0x0675, 0x0678, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC LETTER HIGH HAMZA ALEF..ARABIC LETTER HIGH HAMZA YEH
+ 0x0958: (0x0958, 0x095f, 0,0,0,0,0,0,0,0,1,0,0,0), #  DEVANAGARI LETTER QA..DEVANAGARI LETTER YYA
+ 0x09dc: (0x09dc, 0x09dd, 0,0,0,0,0,0,0,0,1,0,0,0), #  BENGALI LETTER RRA..BENGALI LETTER RHA
+ 0x09df: (0x09df, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  BENGALI LETTER YYA
+ 0x0a33: (0x0a33, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER LLA
+ 0x0a36: (0x0a36, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER SHA
+ 0x0a59: (0x0a59, 0x0a5b, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER KHHA..GURMUKHI LETTER ZA
+ 0x0a5e: (0x0a5e, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GURMUKHI LETTER FA
+ 0x0b5c: (0x0b5c, 0x0b5d, 0,0,0,0,0,0,0,0,1,0,0,0), #  ORIYA LETTER RRA..ORIYA LETTER RHA
+ 0x0e33: (0x0e33, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  THAI CHARACTER SARA AM
+ 0x0eb3: (0x0eb3, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LAO VOWEL SIGN AM
+ 0x0edc: (0x0edc, 0x0edd, 0,0,0,0,0,0,0,0,1,0,0,0), #  LAO HO NO..LAO HO MO
+ 0x0f43: (0x0f43, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER GHA
+ 0x0f4d: (0x0f4d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER DDHA
+ 0x0f52: (0x0f52, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER DHA
+ 0x0f57: (0x0f57, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER BHA
+ 0x0f5c: (0x0f5c, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER DZHA
+ 0x0f69: (0x0f69, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN LETTER KSSA
+ 0x0f76: (0x0f76, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC R
+ 0x0f78: (0x0f78, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN VOWEL SIGN VOCALIC L
+ 0x0f93: (0x0f93, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER GHA
+ 0x0f9d: (0x0f9d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER DDHA
+ 0x0fa2: (0x0fa2, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER DHA
+ 0x0fa7: (0x0fa7, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER BHA
+ 0x0fac: (0x0fac, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER DZHA
+ 0x0fb9: (0x0fb9, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  TIBETAN SUBJOINED LETTER KSSA
+ 0x10fc: (0x10fc, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER GEORGIAN NAR
+ 0x1e9a: (0x1e9a, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER A WITH RIGHT HALF RING
+ 0x1e9b: (0x1e9b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SMALL LETTER LONG S WITH DOT ABOVE
+ 0x1f71: (0x1f71, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER ALPHA WITH OXIA
+ 0x1f73: (0x1f73, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER EPSILON WITH OXIA
+ 0x1f75: (0x1f75, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER ETA WITH OXIA
+ 0x1f77: (0x1f77, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER IOTA WITH OXIA
+ 0x1f79: (0x1f79, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER OMICRON WITH OXIA
+ 0x1f7b: (0x1f7b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER UPSILON WITH OXIA
+ 0x1f7d: (0x1f7d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER OMEGA WITH OXIA
+ 0x1fbb: (0x1fbb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER ALPHA WITH OXIA
+ 0x1fbe: (0x1fbe, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK PROSGEGRAMMENI
+ 0x1fc9: (0x1fc9, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER EPSILON WITH OXIA
+ 0x1fcb: (0x1fcb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER ETA WITH OXIA
+ 0x1fd3: (0x1fd3, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER IOTA WITH DIALYTIKA AND OXIA
+ 0x1fdb: (0x1fdb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER IOTA WITH OXIA
+ 0x1fe3: (0x1fe3, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND OXIA
+ 0x1feb: (0x1feb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER UPSILON WITH OXIA
+ 0x1ff9: (0x1ff9, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER OMICRON WITH OXIA
+ 0x1ffb: (0x1ffb, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  GREEK CAPITAL LETTER OMEGA WITH OXIA
+ 0x2071: (0x2071, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  SUPERSCRIPT LATIN SMALL LETTER I
+ 0x207f: (0x207f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  SUPERSCRIPT LATIN SMALL LETTER N
+ 0x2090: (0x2090, 0x2094, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SUBSCRIPT SMALL LETTER A..LATIN SUBSCRIPT SMALL LETTER SCHWA
+ 0x2095: (0x2095, 0x209c, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SUBSCRIPT SMALL LETTER H..LATIN SUBSCRIPT SMALL LETTER T
+ 0x2102: (0x2102, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL C
+ 0x2107: (0x2107, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  EULER CONSTANT
+ 0x210a: (0x210a, 0x2113, 0,0,0,0,0,0,0,0,1,0,0,0), #  SCRIPT SMALL G..SCRIPT SMALL L
+ 0x2115: (0x2115, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL N
+ 0x2119: (0x2119, 0x211d, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL P..DOUBLE-STRUCK CAPITAL R
+ 0x2124: (0x2124, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK CAPITAL Z
+ 0x2126: (0x2126, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  OHM SIGN
+ 0x2128: (0x2128, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  BLACK-LETTER CAPITAL Z
+ 0x212a: (0x212a, 0x212d, 0,0,0,0,0,0,0,0,1,0,0,0), #  KELVIN SIGN..BLACK-LETTER CAPITAL C
+ 0x212f: (0x212f, 0x2131, 0,0,0,0,0,0,0,0,1,0,0,0), #  SCRIPT SMALL E..SCRIPT CAPITAL F
+ 0x2133: (0x2133, 0x2138, 0,0,0,0,0,0,0,0,1,0,0,0), #  SCRIPT CAPITAL M..DALET SYMBOL
+ 0x2139: (0x2139, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  INFORMATION SOURCE
+ 0x213c: (0x213c, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK SMALL PI
+ 0x213d: (0x213d, 0x213f, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK SMALL GAMMA..DOUBLE-STRUCK CAPITAL PI
+ 0x2145: (0x2145, 0x2149, 0,0,0,0,0,0,0,0,1,0,0,0), #  DOUBLE-STRUCK ITALIC CAPITAL D..DOUBLE-STRUCK ITALIC SMALL J
+ 0x2160: (0x2160, 0x217f, 0,0,0,0,0,0,0,0,1,0,0,0), #  ROMAN NUMERAL ONE..SMALL ROMAN NUMERAL ONE THOUSAND
+ 0x2c7c: (0x2c7c, 0x2c7d, 0,0,0,0,0,0,0,0,1,0,0,0), #  LATIN SUBSCRIPT SMALL LETTER J..MODIFIER LETTER CAPITAL V
+ 0x3038: (0x3038, 0x303a, 0,0,0,0,0,0,0,0,1,0,0,0), #  HANGZHOU NUMERAL TEN..HANGZHOU NUMERAL THIRTY
+ 0x309f: (0x309f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  HIRAGANA DIGRAPH YORI
+ 0x30ff: (0x30ff, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  KATAKANA DIGRAPH KOTO
+ 0xa69c: (0xa69c, 0xa69d, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CYRILLIC HARD SIGN..MODIFIER LETTER CYRILLIC SOFT SIGN
+ 0xa7f8: (0xa7f8, 0xa7f9, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER CAPITAL H WITH STROKE..MODIFIER LETTER SMALL LIGATURE OE
+ 0xab5c: (0xab5c, 0xab5f, 0,0,0,0,0,0,0,0,1,0,0,0), #  MODIFIER LETTER SMALL HENG..MODIFIER LETTER SMALL U WITH LEFT HOOK
+ 0xf900: (0xf900, 0xfa0d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-F900..CJK COMPATIBILITY IDEOGRAPH-FA0D
+ 0xfa10: (0xfa10, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA10
+ 0xfa12: (0xfa12, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA12
+ 0xfa15: (0xfa15, 0xfa1e, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA15..CJK COMPATIBILITY IDEOGRAPH-FA1E
+ 0xfa20: (0xfa20, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA20
+ 0xfa22: (0xfa22, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA22
+ 0xfa25: (0xfa25, 0xfa26, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA25..CJK COMPATIBILITY IDEOGRAPH-FA26
+ 0xfa2a: (0xfa2a, 0xfa2d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA2A..CJK COMPATIBILITY IDEOGRAPH-FA2D
+ 0xfa2e: (0xfa2e, 0xfa2f, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA2E..CJK COMPATIBILITY IDEOGRAPH-FA2F
+ 0xfa30: (0xfa30, 0xfa6a, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA30..CJK COMPATIBILITY IDEOGRAPH-FA6A
+ 0xfa6b: (0xfa6b, 0xfa6d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA6B..CJK COMPATIBILITY IDEOGRAPH-FA6D
+ 0xfa70: (0xfa70, 0xfad9, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-FA70..CJK COMPATIBILITY IDEOGRAPH-FAD9
+ 0xff10: (0xff10, 0xff19, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH DIGIT ZERO..FULLWIDTH DIGIT NINE
+ 0xff21: (0xff21, 0xff3a, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH LATIN CAPITAL LETTER A..FULLWIDTH LATIN CAPITAL LETTER Z
+ 0xff3f: (0xff3f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH LOW LINE
+ 0xff41: (0xff41, 0xff5a, 0,0,0,0,0,0,0,0,1,0,0,0), #  FULLWIDTH LATIN SMALL LETTER A..FULLWIDTH LATIN SMALL LETTER Z
+ 0xff66: (0xff66, 0xff9f, 0,0,0,0,0,0,0,0,1,0,0,0), #  HALFWIDTH KATAKANA LETTER WO..HALFWIDTH KATAKANA SEMI-VOICED SOUND MARK
+ 0x1ee00: (0x1ee00, 0x1ee03, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL ALEF..ARABIC MATHEMATICAL DAL
+ 0x1ee05: (0x1ee05, 0x1ee1f, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL WAW..ARABIC MATHEMATICAL DOTLESS QAF
+ 0x1ee21: (0x1ee21, 0x1ee22, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL BEH..ARABIC MATHEMATICAL INITIAL JEEM
+ 0x1ee24: (0x1ee24, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL HEH
+ 0x1ee27: (0x1ee27, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL HAH
+ 0x1ee29: (0x1ee29, 0x1ee32, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL YEH..ARABIC MATHEMATICAL INITIAL QAF
+ 0x1ee34: (0x1ee34, 0x1ee37, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL SHEEN..ARABIC MATHEMATICAL INITIAL KHAH
+ 0x1ee39: (0x1ee39, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL DAD
+ 0x1ee3b: (0x1ee3b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL INITIAL GHAIN
+ 0x1ee42: (0x1ee42, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED JEEM
+ 0x1ee47: (0x1ee47, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED HAH
+ 0x1ee49: (0x1ee49, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED YEH
+ 0x1ee4b: (0x1ee4b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED LAM
+ 0x1ee4d: (0x1ee4d, 0x1ee4f, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED NOON..ARABIC MATHEMATICAL TAILED AIN
+ 0x1ee51: (0x1ee51, 0x1ee52, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED SAD..ARABIC MATHEMATICAL TAILED QAF
+ 0x1ee54: (0x1ee54, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED SHEEN
+ 0x1ee57: (0x1ee57, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED KHAH
+ 0x1ee59: (0x1ee59, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED DAD
+ 0x1ee5b: (0x1ee5b, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED GHAIN
+ 0x1ee5d: (0x1ee5d, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED DOTLESS NOON
+ 0x1ee5f: (0x1ee5f, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL TAILED DOTLESS QAF
+ 0x1ee61: (0x1ee61, 0x1ee62, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED BEH..ARABIC MATHEMATICAL STRETCHED JEEM
+ 0x1ee64: (0x1ee64, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED HEH
+ 0x1ee67: (0x1ee67, 0x1ee6a, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED HAH..ARABIC MATHEMATICAL STRETCHED KAF
+ 0x1ee6c: (0x1ee6c, 0x1ee72, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED MEEM..ARABIC MATHEMATICAL STRETCHED QAF
+ 0x1ee74: (0x1ee74, 0x1ee77, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED SHEEN..ARABIC MATHEMATICAL STRETCHED KHAH
+ 0x1ee79: (0x1ee79, 0x1ee7c, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED DAD..ARABIC MATHEMATICAL STRETCHED DOTLESS BEH
+ 0x1ee7e: (0x1ee7e, None, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL STRETCHED DOTLESS FEH
+ 0x1ee80: (0x1ee80, 0x1ee89, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL LOOPED ALEF..ARABIC MATHEMATICAL LOOPED YEH
+ 0x1ee8b: (0x1ee8b, 0x1ee9b, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL LOOPED LAM..ARABIC MATHEMATICAL LOOPED GHAIN
+ 0x1eea1: (0x1eea1, 0x1eea3, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL DOUBLE-STRUCK BEH..ARABIC MATHEMATICAL DOUBLE-STRUCK DAL
+ 0x1eea5: (0x1eea5, 0x1eea9, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL DOUBLE-STRUCK WAW..ARABIC MATHEMATICAL DOUBLE-STRUCK YEH
+ 0x1eeab: (0x1eeab, 0x1eebb, 0,0,0,0,0,0,0,0,1,0,0,0), #  ARABIC MATHEMATICAL DOUBLE-STRUCK LAM..ARABIC MATHEMATICAL DOUBLE-STRUCK GHAIN
+ 0x2f800: (0x2f800, 0x2fa1d, 0,0,0,0,0,0,0,0,1,0,0,0), #  CJK COMPATIBILITY IDEOGRAPH-2F800..CJK COMPATIBILITY IDEOGRAPH-2FA1D
+}
@@ -1,86 +1,86 @@
-# dictionary to map unicode characters to canonical characters
-# entries are tuples of -- key: code_point, name1, name2
-# where: key - code point of the confusing char, code_point - code point of the character that it confuses,
-#    name1 - the name of the confusing char, name2 - the name of the char that it confuses
-#
-# This dictionary can be used to reduce confusion by mapping to the canonical (non-confusing) letter
-intentional_map = {
-    0x01c3: ( 0x0021, "LATIN LETTER RETROFLEX CLICK", "EXCLAMATION MARK" ),
-    0x0391: ( 0x0041, "GREEK CAPITAL LETTER ALPHA", "LATIN CAPITAL LETTER A" ),
-    0x0392: ( 0x0042, "GREEK CAPITAL LETTER BETA", "LATIN CAPITAL LETTER B" ),
-    0x0421: ( 0x0043, "CYRILLIC CAPITAL LETTER ES", "LATIN CAPITAL LETTER C" ),
-    0x0395: ( 0x0045, "GREEK CAPITAL LETTER EPSILON", "LATIN CAPITAL LETTER E" ),
-    0x0397: ( 0x0048, "GREEK CAPITAL LETTER ETA", "LATIN CAPITAL LETTER H" ),
-    0x0399: ( 0x0049, "GREEK CAPITAL LETTER IOTA", "LATIN CAPITAL LETTER I" ),
-    0x0408: ( 0x004A, "CYRILLIC CAPITAL LETTER JE", "LATIN CAPITAL LETTER J" ),
-    0x039a: ( 0x004B, "GREEK CAPITAL LETTER KAPPA", "LATIN CAPITAL LETTER K" ),
-    0x039c: ( 0x004D, "GREEK CAPITAL LETTER MU", "LATIN CAPITAL LETTER M" ),
-    0x039d: ( 0x004E, "GREEK CAPITAL LETTER NU", "LATIN CAPITAL LETTER N" ),
-    0x039f: ( 0x004F, "GREEK CAPITAL LETTER OMICRON", "LATIN CAPITAL LETTER O" ),
-    0x03a1: ( 0x0050, "GREEK CAPITAL LETTER RHO", "LATIN CAPITAL LETTER P" ),
-    0x0405: ( 0x0053, "CYRILLIC CAPITAL LETTER DZE", "LATIN CAPITAL LETTER S" ),
-    0x03a4: ( 0x0054, "GREEK CAPITAL LETTER TAU", "LATIN CAPITAL LETTER T" ),
-    0x03a7: ( 0x0058, "GREEK CAPITAL LETTER CHI", "LATIN CAPITAL LETTER X" ),
-    0x03a5: ( 0x0059, "GREEK CAPITAL LETTER UPSILON", "LATIN CAPITAL LETTER Y" ),
-    0x0396: ( 0x005A, "GREEK CAPITAL LETTER ZETA", "LATIN CAPITAL LETTER Z" ),
-    0x0430: ( 0x0061, "CYRILLIC SMALL LETTER A", "LATIN SMALL LETTER A" ),
-    0x0441: ( 0x0063, "CYRILLIC SMALL LETTER ES", "LATIN SMALL LETTER C" ),
-    0x0501: ( 0x0064, "CYRILLIC SMALL LETTER KOMI DE", "LATIN SMALL LETTER D" ),
-    0x0435: ( 0x0065, "CYRILLIC SMALL LETTER IE", "LATIN SMALL LETTER E" ),
-    0x04bb: ( 0x0068, "CYRILLIC SMALL LETTER SHHA", "LATIN SMALL LETTER H" ),
-    0x0456: ( 0x0069, "CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I", "LATIN SMALL LETTER I" ),
-    0x03f3: ( 0x006A, "GREEK LETTER YOT", "LATIN SMALL LETTER J" ),
-    0x03bf: ( 0x006F, "GREEK SMALL LETTER OMICRON", "LATIN SMALL LETTER O" ),
-    0x0440: ( 0x0070, "CYRILLIC SMALL LETTER ER", "LATIN SMALL LETTER P" ),
-    0x0455: ( 0x0073, "CYRILLIC SMALL LETTER DZE", "LATIN SMALL LETTER S" ),
-    0x0445: ( 0x0078, "CYRILLIC SMALL LETTER HA", "LATIN SMALL LETTER X" ),
-    0x0443: ( 0x0079, "CYRILLIC SMALL LETTER U", "LATIN SMALL LETTER Y" ),
-    0x04d4: ( 0x00C6, "CYRILLIC CAPITAL LIGATURE A IE", "LATIN CAPITAL LETTER AE" ),
-    0x0110: ( 0x00D0, "LATIN CAPITAL LETTER D WITH STROKE", "LATIN CAPITAL LETTER ETH" ),
-    0x04d5: ( 0x00E6, "CYRILLIC SMALL LIGATURE A IE", "LATIN SMALL LETTER AE" ),
-    0x043a: ( 0x0138, "CYRILLIC SMALL LETTER KA", "LATIN SMALL LETTER KRA" ),
-    0x0411: ( 0x0182, "CYRILLIC CAPITAL LETTER BE", "LATIN CAPITAL LETTER B WITH TOPBAR" ),
-    0x04d8: ( 0x018F, "CYRILLIC CAPITAL LETTER SCHWA", "LATIN CAPITAL LETTER SCHWA" ),
-    0x04e8: ( 0x019F, "CYRILLIC CAPITAL LETTER BARRED O", "LATIN CAPITAL LETTER O WITH MIDDLE TILDE" ),
-    0x03a3: ( 0x01A9, "GREEK CAPITAL LETTER SIGMA", "LATIN CAPITAL LETTER ESH" ),
-    0x0259: ( 0x01DD, "LATIN SMALL LETTER SCHWA", "LATIN SMALL LETTER TURNED E" ),
-    0x039b: ( 0x0245, "GREEK CAPITAL LETTER LAMDA", "LATIN CAPITAL LETTER TURNED V" ),
-    0x04d9: ( 0x0259, "CYRILLIC SMALL LETTER SCHWA", "LATIN SMALL LETTER SCHWA" ),
-    0x03b5: ( 0x025B, "GREEK SMALL LETTER EPSILON", "LATIN SMALL LETTER OPEN E" ),
-    0x03b9: ( 0x0269, "GREEK SMALL LETTER IOTA", "LATIN SMALL LETTER IOTA" ),
-    0x04cf: ( 0x026A, "CYRILLIC SMALL LETTER PALOCHKA", "LATIN LETTER SMALL CAPITAL I" ),
-    0x04e9: ( 0x0275, "CYRILLIC SMALL LETTER BARRED O", "LATIN SMALL LETTER BARRED O" ),
-    0x04e1: ( 0x0292, "CYRILLIC SMALL LETTER ABKHASIAN DZE", "LATIN SMALL LETTER EZH" ),
-    0x0432: ( 0x0299, "CYRILLIC SMALL LETTER VE", "LATIN LETTER SMALL CAPITAL B" ),
-    0x043d: ( 0x029C, "CYRILLIC SMALL LETTER EN", "LATIN LETTER SMALL CAPITAL H" ),
-    0x0413: ( 0x0393, "CYRILLIC CAPITAL LETTER GHE", "GREEK CAPITAL LETTER GAMMA" ),
-    0x041f: ( 0x03A0, "CYRILLIC CAPITAL LETTER PE", "GREEK CAPITAL LETTER PI" ),
-    0x237a: ( 0x03B1, "APL FUNCTIONAL SYMBOL ALPHA", "GREEK SMALL LETTER ALPHA" ),
-    0x2373: ( 0x03B9, "APL FUNCTIONAL SYMBOL IOTA", "GREEK SMALL LETTER IOTA" ),
-    0x2374: ( 0x03C1, "APL FUNCTIONAL SYMBOL RHO", "GREEK SMALL LETTER RHO" ),
-    0x2375: ( 0x03C9, "APL FUNCTIONAL SYMBOL OMEGA", "GREEK SMALL LETTER OMEGA" ),
-    0x1d26: ( 0x0433, "GREEK LETTER SMALL CAPITAL GAMMA", "CYRILLIC SMALL LETTER GHE" ),
-    0x1d2b: ( 0x043B, "CYRILLIC LETTER SMALL CAPITAL EL", "CYRILLIC SMALL LETTER EL" ),
-    0x1d28: ( 0x043F, "GREEK LETTER SMALL CAPITAL PI", "CYRILLIC SMALL LETTER PE" ),
-    0x1040: ( 0x101D, "MYANMAR DIGIT ZERO", "MYANMAR LETTER WA" ),
-    0x17a3: ( 0x17A2, "KHMER INDEPENDENT VOWEL QAQ", "KHMER LETTER QA" ),
-    0x1855: ( 0x1835, "MONGOLIAN LETTER TODO YA", "MONGOLIAN LETTER JA" ),
-    0x19d0: ( 0x199E, "NEW TAI LUE DIGIT ZERO", "NEW TAI LUE LETTER LOW VA" ),
-    0x19d1: ( 0x19B1, "NEW TAI LUE DIGIT ONE", "NEW TAI LUE VOWEL SIGN AA" ),
-    0x1a80: ( 0x1A45, "TAI THAM HORA DIGIT ZERO", "TAI THAM LETTER WA" ),
-    0x1a90: ( 0x1A45, "TAI THAM THAM DIGIT ZERO", "TAI THAM LETTER WA" ),
-    0x1b52: ( 0x1B0D, "BALINESE DIGIT TWO", "BALINESE LETTER LA LENGA" ),
-    0x1b53: ( 0x1B11, "BALINESE DIGIT THREE", "BALINESE LETTER OKARA" ),
-    0x1b58: ( 0x1B28, "BALINESE DIGIT EIGHT", "BALINESE LETTER PA KAPAL" ),
-    0x1b5c: ( 0x1B50, "BALINESE WINDU", "BALINESE DIGIT ZERO" ),
-    0x043c: ( 0x1D0D, "CYRILLIC SMALL LETTER EM", "LATIN LETTER SMALL CAPITAL M" ),
-    0x1d29: ( 0x1D18, "GREEK LETTER SMALL CAPITAL RHO", "LATIN LETTER SMALL CAPITAL P" ),
-    0x0442: ( 0x1D1B, "CYRILLIC SMALL LETTER TE", "LATIN LETTER SMALL CAPITAL T" ),
-    0x04a2: ( 0x2C67, "CYRILLIC CAPITAL LETTER EN WITH DESCENDER", "LATIN CAPITAL LETTER H WITH DESCENDER" ),
-    0x049a: ( 0x2C69, "CYRILLIC CAPITAL LETTER KA WITH DESCENDER", "LATIN CAPITAL LETTER K WITH DESCENDER" ),
-    0xa9c6: ( 0xA9D0, "JAVANESE PADA WINDU", "JAVANESE DIGIT ZERO" ),
-    0x103d1: ( 0x10382, "OLD PERSIAN NUMBER ONE", "UGARITIC LETTER GAMLA" ),
-    0x103d3: ( 0x10393, "OLD PERSIAN NUMBER TEN", "UGARITIC LETTER AIN" ),
-    0x12038: ( 0x1039A, "CUNEIFORM SIGN ASH", "UGARITIC LETTER TO" ),
-    0x104a0: ( 0x10486, "OSMANYA DIGIT ZERO", "OSMANYA LETTER DEEL" ),
-}
+# dictionary to map unicode characters to canonical characters
+# entries are tuples of -- key: code_point, name1, name2
+# where: key - code point of the confusing char, code_point - code point of the character that it confuses,
+#    name1 - the name of the confusing char, name2 - the name of the char that it confuses
+#
+# This dictionary can be used to reduce confusion by mapping to the canonical (non-confusing) letter
+intentional_map = {
+    0x01c3: ( 0x0021, "LATIN LETTER RETROFLEX CLICK", "EXCLAMATION MARK" ),
+    0x0391: ( 0x0041, "GREEK CAPITAL LETTER ALPHA", "LATIN CAPITAL LETTER A" ),
+    0x0392: ( 0x0042, "GREEK CAPITAL LETTER BETA", "LATIN CAPITAL LETTER B" ),
+    0x0421: ( 0x0043, "CYRILLIC CAPITAL LETTER ES", "LATIN CAPITAL LETTER C" ),
+    0x0395: ( 0x0045, "GREEK CAPITAL LETTER EPSILON", "LATIN CAPITAL LETTER E" ),
+    0x0397: ( 0x0048, "GREEK CAPITAL LETTER ETA", "LATIN CAPITAL LETTER H" ),
+    0x0399: ( 0x0049, "GREEK CAPITAL LETTER IOTA", "LATIN CAPITAL LETTER I" ),
+    0x0408: ( 0x004A, "CYRILLIC CAPITAL LETTER JE", "LATIN CAPITAL LETTER J" ),
+    0x039a: ( 0x004B, "GREEK CAPITAL LETTER KAPPA", "LATIN CAPITAL LETTER K" ),
+    0x039c: ( 0x004D, "GREEK CAPITAL LETTER MU", "LATIN CAPITAL LETTER M" ),
+    0x039d: ( 0x004E, "GREEK CAPITAL LETTER NU", "LATIN CAPITAL LETTER N" ),
+    0x039f: ( 0x004F, "GREEK CAPITAL LETTER OMICRON", "LATIN CAPITAL LETTER O" ),
+    0x03a1: ( 0x0050, "GREEK CAPITAL LETTER RHO", "LATIN CAPITAL LETTER P" ),
+    0x0405: ( 0x0053, "CYRILLIC CAPITAL LETTER DZE", "LATIN CAPITAL LETTER S" ),
+    0x03a4: ( 0x0054, "GREEK CAPITAL LETTER TAU", "LATIN CAPITAL LETTER T" ),
+    0x03a7: ( 0x0058, "GREEK CAPITAL LETTER CHI", "LATIN CAPITAL LETTER X" ),
+    0x03a5: ( 0x0059, "GREEK CAPITAL LETTER UPSILON", "LATIN CAPITAL LETTER Y" ),
+    0x0396: ( 0x005A, "GREEK CAPITAL LETTER ZETA", "LATIN CAPITAL LETTER Z" ),
+    0x0430: ( 0x0061, "CYRILLIC SMALL LETTER A", "LATIN SMALL LETTER A" ),
+    0x0441: ( 0x0063, "CYRILLIC SMALL LETTER ES", "LATIN SMALL LETTER C" ),
+    0x0501: ( 0x0064, "CYRILLIC SMALL LETTER KOMI DE", "LATIN SMALL LETTER D" ),
+    0x0435: ( 0x0065, "CYRILLIC SMALL LETTER IE", "LATIN SMALL LETTER E" ),
+    0x04bb: ( 0x0068, "CYRILLIC SMALL LETTER SHHA", "LATIN SMALL LETTER H" ),
+    0x0456: ( 0x0069, "CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I", "LATIN SMALL LETTER I" ),
+    0x03f3: ( 0x006A, "GREEK LETTER YOT", "LATIN SMALL LETTER J" ),
+    0x03bf: ( 0x006F, "GREEK SMALL LETTER OMICRON", "LATIN SMALL LETTER O" ),
+    0x0440: ( 0x0070, "CYRILLIC SMALL LETTER ER", "LATIN SMALL LETTER P" ),
+    0x0455: ( 0x0073, "CYRILLIC SMALL LETTER DZE", "LATIN SMALL LETTER S" ),
+    0x0445: ( 0x0078, "CYRILLIC SMALL LETTER HA", "LATIN SMALL LETTER X" ),
+    0x0443: ( 0x0079, "CYRILLIC SMALL LETTER U", "LATIN SMALL LETTER Y" ),
+    0x04d4: ( 0x00C6, "CYRILLIC CAPITAL LIGATURE A IE", "LATIN CAPITAL LETTER AE" ),
+    0x0110: ( 0x00D0, "LATIN CAPITAL LETTER D WITH STROKE", "LATIN CAPITAL LETTER ETH" ),
+    0x04d5: ( 0x00E6, "CYRILLIC SMALL LIGATURE A IE", "LATIN SMALL LETTER AE" ),
+    0x043a: ( 0x0138, "CYRILLIC SMALL LETTER KA", "LATIN SMALL LETTER KRA" ),
+    0x0411: ( 0x0182, "CYRILLIC CAPITAL LETTER BE", "LATIN CAPITAL LETTER B WITH TOPBAR" ),
+    0x04d8: ( 0x018F, "CYRILLIC CAPITAL LETTER SCHWA", "LATIN CAPITAL LETTER SCHWA" ),
+    0x04e8: ( 0x019F, "CYRILLIC CAPITAL LETTER BARRED O", "LATIN CAPITAL LETTER O WITH MIDDLE TILDE" ),
+    0x03a3: ( 0x01A9, "GREEK CAPITAL LETTER SIGMA", "LATIN CAPITAL LETTER ESH" ),
+    0x0259: ( 0x01DD, "LATIN SMALL LETTER SCHWA", "LATIN SMALL LETTER TURNED E" ),
+    0x039b: ( 0x0245, "GREEK CAPITAL LETTER LAMDA", "LATIN CAPITAL LETTER TURNED V" ),
+    0x04d9: ( 0x0259, "CYRILLIC SMALL LETTER SCHWA", "LATIN SMALL LETTER SCHWA" ),
+    0x03b5: ( 0x025B, "GREEK SMALL LETTER EPSILON", "LATIN SMALL LETTER OPEN E" ),
+    0x03b9: ( 0x0269, "GREEK SMALL LETTER IOTA", "LATIN SMALL LETTER IOTA" ),
+    0x04cf: ( 0x026A, "CYRILLIC SMALL LETTER PALOCHKA", "LATIN LETTER SMALL CAPITAL I" ),
+    0x04e9: ( 0x0275, "CYRILLIC SMALL LETTER BARRED O", "LATIN SMALL LETTER BARRED O" ),
+    0x04e1: ( 0x0292, "CYRILLIC SMALL LETTER ABKHASIAN DZE", "LATIN SMALL LETTER EZH" ),
+    0x0432: ( 0x0299, "CYRILLIC SMALL LETTER VE", "LATIN LETTER SMALL CAPITAL B" ),
+    0x043d: ( 0x029C, "CYRILLIC SMALL LETTER EN", "LATIN LETTER SMALL CAPITAL H" ),
+    0x0413: ( 0x0393, "CYRILLIC CAPITAL LETTER GHE", "GREEK CAPITAL LETTER GAMMA" ),
+    0x041f: ( 0x03A0, "CYRILLIC CAPITAL LETTER PE", "GREEK CAPITAL LETTER PI" ),
+    0x237a: ( 0x03B1, "APL FUNCTIONAL SYMBOL ALPHA", "GREEK SMALL LETTER ALPHA" ),
+    0x2373: ( 0x03B9, "APL FUNCTIONAL SYMBOL IOTA", "GREEK SMALL LETTER IOTA" ),
+    0x2374: ( 0x03C1, "APL FUNCTIONAL SYMBOL RHO", "GREEK SMALL LETTER RHO" ),
+    0x2375: ( 0x03C9, "APL FUNCTIONAL SYMBOL OMEGA", "GREEK SMALL LETTER OMEGA" ),
+    0x1d26: ( 0x0433, "GREEK LETTER SMALL CAPITAL GAMMA", "CYRILLIC SMALL LETTER GHE" ),
+    0x1d2b: ( 0x043B, "CYRILLIC LETTER SMALL CAPITAL EL", "CYRILLIC SMALL LETTER EL" ),
+    0x1d28: ( 0x043F, "GREEK LETTER SMALL CAPITAL PI", "CYRILLIC SMALL LETTER PE" ),
+    0x1040: ( 0x101D, "MYANMAR DIGIT ZERO", "MYANMAR LETTER WA" ),
+    0x17a3: ( 0x17A2, "KHMER INDEPENDENT VOWEL QAQ", "KHMER LETTER QA" ),
+    0x1855: ( 0x1835, "MONGOLIAN LETTER TODO YA", "MONGOLIAN LETTER JA" ),
+    0x19d0: ( 0x199E, "NEW TAI LUE DIGIT ZERO", "NEW TAI LUE LETTER LOW VA" ),
+    0x19d1: ( 0x19B1, "NEW TAI LUE DIGIT ONE", "NEW TAI LUE VOWEL SIGN AA" ),
+    0x1a80: ( 0x1A45, "TAI THAM HORA DIGIT ZERO", "TAI THAM LETTER WA" ),
+    0x1a90: ( 0x1A45, "TAI THAM THAM DIGIT ZERO", "TAI THAM LETTER WA" ),
+    0x1b52: ( 0x1B0D, "BALINESE DIGIT TWO", "BALINESE LETTER LA LENGA" ),
+    0x1b53: ( 0x1B11, "BALINESE DIGIT THREE", "BALINESE LETTER OKARA" ),
+    0x1b58: ( 0x1B28, "BALINESE DIGIT EIGHT", "BALINESE LETTER PA KAPAL" ),
+    0x1b5c: ( 0x1B50, "BALINESE WINDU", "BALINESE DIGIT ZERO" ),
+    0x043c: ( 0x1D0D, "CYRILLIC SMALL LETTER EM", "LATIN LETTER SMALL CAPITAL M" ),
+    0x1d29: ( 0x1D18, "GREEK LETTER SMALL CAPITAL RHO", "LATIN LETTER SMALL CAPITAL P" ),
+    0x0442: ( 0x1D1B, "CYRILLIC SMALL LETTER TE", "LATIN LETTER SMALL CAPITAL T" ),
+    0x04a2: ( 0x2C67, "CYRILLIC CAPITAL LETTER EN WITH DESCENDER", "LATIN CAPITAL LETTER H WITH DESCENDER" ),
+    0x049a: ( 0x2C69, "CYRILLIC CAPITAL LETTER KA WITH DESCENDER", "LATIN CAPITAL LETTER K WITH DESCENDER" ),
+    0xa9c6: ( 0xA9D0, "JAVANESE PADA WINDU", "JAVANESE DIGIT ZERO" ),
+    0x103d1: ( 0x10382, "OLD PERSIAN NUMBER ONE", "UGARITIC LETTER GAMLA" ),
+    0x103d3: ( 0x10393, "OLD PERSIAN NUMBER TEN", "UGARITIC LETTER AIN" ),
+    0x12038: ( 0x1039A, "CUNEIFORM SIGN ASH", "UGARITIC LETTER TO" ),
+    0x104a0: ( 0x10486, "OSMANYA DIGIT ZERO", "OSMANYA LETTER DEEL" ),
+}
@@ -1,282 +1,1278 @@
-"""
-More unicodedata:
-
-utilities for extended unicode data. Takes off where the standard library unicodedata library leaves off
-
-Len Wanger, 2019
-
-TODO/Issues:
-    - is_safe_identifier -- should it validate punycode strings too?
-    - block names and block names of characters don't always match. e.g. block name is "Latin-1 Supplement" and
-        repertoire has "Latin_1_Sup". Just use block names? Remove block from repertoire?
-    - parser IdentifierType file. Type will give further restrictions: Recommended, Not_XID, Exclusion, Obsolete,  Not_NFKC, etc.
-"""
-
-from bisect import bisect_left
-
-from intentional_map import intentional_map
-from block_map import block_map
-from repertoire_map import repertoire_map
-from reserved_map import reserved_map
-from identifier_status_map import identifier_status_map
-from identifier_type_map import identifier_type_map
-
-from more_unicodedata_types import UnicodeChar, UnicodeReserved, UnicodeBlock, UnicodeIdentifierStatus
-
-
-# routines for intentional confusion
-def is_intentional_confusion(s):
-    """
-    Check if a string contains any characters on the intentional confusion list.
-
-    :param s: the string to check
-    :return: True if the string contains any characters in the intentional_confusion list (False otherwise)
-    """
-    return any((ord(c) in intentional_map) for c in s)
-
-
-def fix_intention_confusion(s):
-    """
-    :param s:
-    :return: string with any intentionally confusing characters changed to the non-confusing equivalent character
-    """
-    return ''.join(chr(intentional_map[ord(c)][0]) if ord(c) in intentional_map else c for c in s)
-
-
-def show_intentional_confusion(s):
-    """
-    return a list of intentionally confusing characters in the string.
-
-    :param s: the string to check
-    :return: a list of tuples, where the tuples of intentionally confusing characters. If no intentionally confusing
-        characters are found an empty list ([]) is returned.
-
-    Each tuple in the list returned has five elements.
-        idx - the index of the confusing character in the string
-        confusing character - the unicode character for the confusing character
-        mimicked character - the unicode character the confusing character is mimicking
-        confusing description - the name of the confusing character
-        mimicked description - the name of the mimicked character
-    """
-    return [(i, c, chr(intentional_map[ord(c)][0]), intentional_map[ord(c)][1], intentional_map[ord(c)][2])
-                        for i,c in enumerate(s) if ord(c) in intentional_map]
-
-
-# routines for blocks
-def in_block(s, block_name):
-    # return True if all characters in string s are in block_name
-    block = block_map[block_name]
-    return all(block[0] <= ord(c) <= block[1] for c in s)
-
-def blocks(s):
-    # return set of blocks that characters of the string are in
-    return {repertoire_map[ord(c)][10] for c in s}
-
-# routine for reserved blocks
-
-def in_reserved(s):
-    # return True if any characters in string s are in a reserved block
-    reserve_start_cps = tuple(reserved_map.keys())
-
-    for c in s:
-        if ord(c) < reserve_start_cps[0]:
-            return False
-
-        left = bisect_left(reserve_start_cps, ord(c))
-
-        if ord(c) == reserve_start_cps[left]:
-            continue
-        else:
-            reserved_left = reserve_start_cps[left-1]
-            rb = reserved_map[reserved_left]
-            if not (rb[2] <= ord(c) <= rb[3]):
-                return False
-
-    return True
-
-
-def in_identifier_range(c):
-    # return True if character c is in an identifier status block
-    is_keys = tuple(identifier_status_map.keys())
-
-    if ord(c) < is_keys[0]:
-        return False
-
-    left = bisect_left(is_keys, ord(c))
-
-    if ord(c) == is_keys[left]:
-        return True
-    else:
-        reserved_left = is_keys[left - 1]
-        rb = identifier_status_map[reserved_left]
-        if rb[1] is None:  # if equal to rb[0] would already have returned True
-            return False
-        if not (rb[0] <= ord(c) <= rb[1]):
-            return False
-
-    return True
-
-
-def get_identifier_type(c):
-    # get the identifier_type for the character. return None if not in a type block
-    id_type_cps = tuple(identifier_type_map.keys())
-
-    if ord(c) < id_type_cps[0]:
-        return None
-
-    left = bisect_left(id_type_cps, ord(c))
-
-    if ord(c) == id_type_cps[left]:
-        return identifier_type_map[id_type_cps[left]]
-    else:
-        idt_left = id_type_cps[left-1]
-        idt = identifier_type_map[idt_left]
-        if (idt[0] <= ord(c) <= idt[1]):
-            return idt
-        else:
-            return None
-
-
-def all_ascii(s, allowed_chars=None):
-    # return True if all characters in the string are in the ascii code block
-    return all((0 <= ord(c) <= 127) or (allowed_chars and (c in allowed_chars)) for c in s)
-
-
-def all_latin(s, allowed_chars=None):
-    # return True if all characters in the string are in the ascii or a Latin code block
-    try:
-        blocks = {repertoire_map[ord(c)][10] for c in s if (not allowed_chars) or (c not in allowed_chars)}
-    except KeyError:
-        return False
-
-    return all((b=='ASCII' or b.startswith('Latin')) for b in blocks)
-
-
-def all_allowed(s, allowed_chars=None):
-    # return True if all characters in the string are in the ascii or a Latin code block
-    try:
-        # get itm for each char... check each has allowed type
-        for c in s:
-            if allowed_chars and (c in allowed_chars):
-                continue
-            itm = get_identifier_type(c)
-            if itm is None or itm[2] == 0:
-                return False
-        # result = all((identifier_type_map[ord(c)][2]==1) for c in s if (not allowed_chars) or (c not in allowed_chars))
-    except KeyError:
-        return False
-    return True
-
-
-def is_safe_identifier(s, level='ascii', allowed_chars=None):
-    """
-    Return true if the string is a valid IDNA identifier as specified in: https://www.unicode.org/reports/tr46/
-
-    :param s: the string to check
-    :param level: safety level to check
-    :param allowed_chars:
-    :return: True if the string is a valid/safe identifier for the given safety level (otherwise False)
-
-    supported safety levels:
-      'ascii' - all ascii
-      'programming' - follows core XID_START and XID_CONTINUE
-      'idmod' - follows extended identifier rules (see: http://www.unicode.org/reports/tr39/tr39-17.html, section 3.1))
-    """
-    if level == 'ascii':
-        return all_ascii(s, allowed_chars=None)
-    elif level == 'programming':
-        try:
-            rmc = repertoire_map[ord(s[0])]
-        except KeyError:
-            return False
-
-        if rmc[8] == 0 and allowed_chars and s[0] not in allowed_chars: # is not XID_START
-            return False
-
-        for c in s[1:]:
-            try:
-                rmc = repertoire_map[ord(c)]
-            except KeyError:
-                return False
-            if rmc[9] == 0 and allowed_chars and c not in allowed_chars:  # is not XID_CONTINUE
-                return False
-
-        return True
-    elif level == 'idmod':  # TODO - test idmod!
-        for c in s:
-            if in_identifier_range(c):
-                continue
-            elif allowed_chars and c in  allowed_chars:  # ok if in allowed_characters
-                continue
-            else:
-                return False
-    else:
-        raise ValueError(f'Unsupported level ({level})')
-
-    return True
-
-
-def get_unicode_char(ord_c, repertoire_map):
-    # get the value for a character from the repertoire map (c is ordinal value of the character)
-    try:
-        uc = UnicodeChar(*repertoire_map[ord_c])
-    except KeyError:
-        return None
-
-    return uc
-
-
-def is_safe_string(s, level='ascii', allowed_chars=None):
-    """
-    Returns True if a string passes the specified security level.
-
-    :param s: the sring to check
-    :param level: the safety level (see below for safety levels
-    :param allowed_chars: additional allowable characters
-    :return: True is the specified string is safe, False otherwise
-
-     levels:
-        'ascii' - only allow characters in the ascii character set
-        'latin' - only allow characters in the Latin code block
-        'allowed' - only allow characters allowed in the identifier_type table
-        'unrestricted' - allow any character
-
-        This is based on recommendations in: Unicode security mechanisms (http://www.unicode.org/reports/tr39/tr39-17.html)
-
-    TODO - This still doesn't deal with a lot of safety issues. For examples (but not an exhaustive list):
-        - doesn't deal with single script spoofing
-        - doesn't deal with non-intentional confusions
-        - doesn't deal with bidirectional script spoofing
-        - doesn't deal with syntax spoofing
-        - doesn't deal with numeric spoofs
-        - doesn't deal with ill-formed sub-sequences
-        - doesn't deal with illegal input byte sequences
-
-    More TODO:
-        - allow specifying a list of allowed languages
-        - check for bidi override characters
-        - check for mixing right-to-left and left-to-rigth in single string
-        - allow specifying types (e.g. private data, technical, etc.) to specifically allow or disallow (even in unrestricted)?
-
-
-    """
-    # TODO:  check canonical equivalence (for <u, combining-diaeresis>" 1) check u is allowed and diaeresis is allowed, 2) combined (normalized) is allowed)
-    #         so check non-normalized then if normalized is different check normalized chars
-    # TODO: check for intentional confusion
-    # TODO: check characters are allowed (vs rules)
-    # TODO: check for multiple scripts (with allowd sets)
-    # TODO: check for private data chars
-    # identifier_type_map
-
-    if level == 'unrestricted':
-        return True
-    elif level == 'ascii':
-        return all_ascii(s, allowed_chars)
-    elif level == 'latin':
-        return all_latin(s, allowed_chars)
-    elif level == 'allowed':
-        return all_allowed(s, allowed_chars)
-    else:
-        raise ValueError(f'Unrecognized safety level ({level})')
-
-    return True
\ No newline at end of file
+"""
+More unicodedata:
+
+utilities for extended unicode data. Takes off where the standard library unicodedata library leaves off
+
+Len Wanger, 2019
+
+TODO/Issues:
+    - is_safe_identifier -- should it validate punycode strings too?
+    - block names and block names of characters don't always match. e.g. block name is "Latin-1 Supplement" and
+        repertoire has "Latin_1_Sup". Just use block names? Remove block from repertoire?
+    - parser IdentifierType file. Type will give further restrictions: Recommended, Not_XID, Exclusion, Obsolete,  Not_NFKC, etc.
+"""
+
+import re
+import sys
+from collections import Counter
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from unicodedata import normalize
+
+from intentional_map import intentional_map
+from confusables_map import confusables_map
+from block_map import block_map
+from repertoire_map import repertoire_map
+from reserved_map import reserved_map
+from identifier_status_map import identifier_status_map
+from identifier_type_map import identifier_type_map
+from script_map import script_names, script_map
+from bidi_class_map import bidi_class_names, bidi_class_map
+from grapheme_break_map import grapheme_break_names, grapheme_break_map
+from emoji_map import emoji_property_names, emoji_map
+from emoji_sequence_map import emoji_sequence_types, emoji_sequence_map
+
+from more_unicodedata_types import UnicodeChar, UnicodeReserved, UnicodeBlock, UnicodeIdentifierStatus
+from more_unicodedata_types import UnicodeIdentifierType, SecurityReport, Violation, DirectionProfile
+from more_unicodedata_matcher import SequenceAutomaton
+from more_unicodedata_tables import RangeIndex, CodePointTable, CharSet, _code_points
+from more_unicodedata_policy import IdentifierAutomaton, IDENTIFIER_LEVELS
+from more_unicodedata_utf8 import iter_utf8
+from more_unicodedata_bounded import ABORTED, _bounded
+
+
+# version of the Unicode data files the map files were created from
+UNICODE_DATA_VERSION = '11.0.0'
+
+
+def _allowed_code_points(allowed_chars):
+    # return allowed_chars as a container of code points (an empty set for None)
+    if not allowed_chars:
+        return frozenset()
+    if isinstance(allowed_chars, CharSet):  # already takes code points
+        return allowed_chars
+    return frozenset(ord(c) for c in allowed_chars)
+
+
+# routines for intentional confusion
+
+# str.translate table from intentionally confusing code point to the code point it mimics
+_intentional_table = {k: v[0] for k, v in intentional_map.items()}
+
+
+@_bounded()
+def is_intentional_confusion(s):
+    """
+    Check if a string contains any characters on the intentional confusion list.
+
+    :param s: the string to check
+    :return: True if the string contains any characters in the intentional_confusion list (False otherwise)
+    """
+    return not intentional_map.keys().isdisjoint(_code_points(s))
+
+
+@_bounded()
+def fix_intention_confusion(s):
+    """
+    :param s:
+    :return: string with any intentionally confusing characters changed to the non-confusing equivalent character
+    """
+    return s.translate(_intentional_table)
+
+
+@_bounded()
+def show_intentional_confusion(s):
+    """
+    return a list of intentionally confusing characters in the string.
+
+    :param s: the string to check
+    :return: a list of tuples, where the tuples of intentionally confusing characters. If no intentionally confusing
+        characters are found an empty list ([]) is returned.
+
+    Each tuple in the list returned has five elements.
+        idx - the index of the confusing character in the string
+        confusing character - the unicode character for the confusing character
+        mimicked character - the unicode character the confusing character is mimicking
+        confusing description - the name of the confusing character
+        mimicked description - the name of the mimicked character
+    """
+    return [(i, chr(cp), chr(intentional_map[cp][0]), intentional_map[cp][1], intentional_map[cp][2])
+            for i, cp in enumerate(_code_points(s)) if cp in intentional_map]
+
+
+# routines for confusables (TR39 skeletons)
+
+# str.translate table from confusable code point to its prototype string. Built once at import time so skeleton()
+# is two normalizations and a single C-level translate.
+_skeleton_table = {k: ''.join(chr(cp) for cp in v) for k, v in confusables_map.items()}
+
+
+@_bounded()
+def skeleton(s):
+    """
+    Return the TR39 skeleton of a string (see: http://www.unicode.org/reports/tr39/#Confusable_Detection)
+
+    Two strings are confusable if they have the same skeleton. The skeleton is made by converting the string to NFD,
+    mapping each code point to its prototype in confusables_map, and converting to NFD again.
+
+    :param s: the string to get the skeleton for
+    :return: the skeleton of the string. The skeleton is only meant for comparison, not for display.
+    """
+    if s.isascii():  # NFD is a no-op for ascii, so only normalize if the mapping left ascii
+        skel = s.translate(_skeleton_table)
+        return skel if skel.isascii() else normalize('NFD', skel)
+
+    return normalize('NFD', normalize('NFD', s).translate(_skeleton_table))
+
+
+@_bounded(2)
+def is_confusable(s1, s2):
+    # return True if the two strings are confusable (i.e. have the same skeleton)
+    return skeleton(s1) == skeleton(s2)
+
+
+@lru_cache(maxsize=None)
+def _confusable_replacer():
+    # automaton mapping each non-ascii confusable character, composed and decomposed (NFD), to its prototype
+    patterns = {}
+
+    for k, prototype in _skeleton_table.items():
+        if k > 127:
+            c = chr(k)
+            patterns[c] = prototype
+            patterns.setdefault(normalize('NFD', c), prototype)
+
+    return SequenceAutomaton(patterns)
+
+
+@lru_cache(maxsize=None)
+def _confusable_detector():
+    # automaton mapping each confusable character (composed and NFD) to its prototype, and each multi-code-point
+    # prototype (e.g. 'rn') to the characters it can be confused with (e.g. 'm').
+    patterns = {}
+
+    for k, prototype in _skeleton_table.items():
+        c = chr(k)
+        for pattern in (c, normalize('NFD', c)):
+            confused_with = patterns.setdefault(pattern, [])
+            if prototype not in confused_with:
+                confused_with.append(prototype)
+        if len(prototype) > 1:
+            patterns.setdefault(prototype, []).append(c)
+
+    return SequenceAutomaton((k, tuple(v)) for k, v in patterns.items())
+
+
+@_bounded()
+def fix_sequence_confusion(s):
+    """
+    Like fix_intention_confusion, but uses the full confusables data, including multi-code-point prototypes and
+    confusable characters in decomposed (combining sequence) form.
+
+    The string is scanned once, replacing the longest confusable sequence at each position. Ascii characters are
+    left as they are.
+
+    :param s: the string to fix
+    :return: string with the confusable characters and sequences changed to their prototypes
+    """
+    return _confusable_replacer().replace(s)
+
+
+@_bounded()
+def show_sequence_confusion(s):
+    """
+    Like show_intentional_confusion, but uses the full confusables data. Sequences are found as well as single
+    characters, e.g. 'rn' is reported as confusable with 'm', and 'm' as confusable with 'rn'.
+
+    :param s: the string to check
+    :return: a list of tuples for the confusable sequences found (or [] if there are none).
+
+    Each tuple in the list returned has four elements.
+        start - the index of the start of the confusable sequence in the string
+        end - the index of the end of the sequence (exclusive)
+        confusing sequence - the confusable sequence (s[start:end])
+        confused with - a tuple of the strings the sequence can be confused with
+    """
+    return [(start, end, s[start:end], confused_with)
+            for start, end, confused_with in _confusable_detector().iter_matches(s)]
+
+
+# routines for blocks
+@_bounded()
+def in_block(s, block_name):
+    # return True if all characters in string s are in block_name
+    first, last = block_map[block_name]
+    return all(first <= cp <= last for cp in _code_points(s))
+
+@_bounded()
+def blocks(s):
+    # return set of blocks that characters of the string are in
+    return {repertoire_map[cp][10] for cp in set(_code_points(s))}
+
+# routine for reserved blocks
+
+_reserved_start_cps = tuple(reserved_map.keys())
+
+@_bounded()
+def in_reserved(s):
+    # return True if any characters in string s are in a reserved block
+    reserve_start_cps = _reserved_start_cps
+
+    for cp in _code_points(s):
+        if cp < reserve_start_cps[0]:
+            return False
+
+        left = bisect_left(reserve_start_cps, cp)
+
+        if left < len(reserve_start_cps) and cp == reserve_start_cps[left]:
+            continue
+        else:
+            reserved_left = reserve_start_cps[left-1]
+            rb = reserved_map[reserved_left]
+            if not (rb[2] <= cp <= rb[3]):
+                return False
+
+    return True
+
+
+def in_identifier_range(c):
+    # return True if character c is in an identifier status block
+    is_keys = tuple(identifier_status_map.keys())
+
+    if ord(c) < is_keys[0]:
+        return False
+
+    left = bisect_left(is_keys, ord(c))
+
+    if ord(c) == is_keys[left]:
+        return True
+    else:
+        reserved_left = is_keys[left - 1]
+        rb = identifier_status_map[reserved_left]
+        if rb[1] is None:  # if equal to rb[0] would already have returned True
+            return False
+        if not (rb[0] <= ord(c) <= rb[1]):
+            return False
+
+    return True
+
+
+# identifier_type_map entries, by range. (The map isn't in code point order, so its keys can't be bisected directly.)
+_identifier_type_entries = RangeIndex.from_map(identifier_type_map)
+
+
+def get_identifier_type(c):
+    # get the identifier_type for the character. return None if not in a type block
+    return _identifier_type_entries.lookup(ord(c))
+
+
+# routines for scripts (see: http://www.unicode.org/reports/tr39/#Mixed_Script_Detection)
+
+# TR39 adds pseudo scripts to the script extensions of Han, Hiragana, Katakana, Hangul and Bopomofo characters, so
+# Japanese, Korean and Chinese with Bopomofo resolve to a single script: Hanb (Han with Bopomofo), Jpan and Kore.
+all_script_names = script_names + ('Hanb', 'Jpan', 'Kore')
+_script_ids = {name: i for i, name in enumerate(all_script_names)}
+
+
+def script_mask(*names):
+    # return the bitmask for a set of script (short) names. Unknown names are ignored.
+    mask = 0
+    for name in names:
+        if name in _script_ids:
+            mask |= 1 << _script_ids[name]
+    return mask
+
+
+def script_names_from_mask(mask):
+    # return the set of script (short) names for a bitmask of script ids
+    return frozenset(name for i, name in enumerate(all_script_names) if mask >> i & 1)
+
+
+# the 'any script' mask (the resolved script set of Common/Inherited text): every script except Unknown, Common and
+# Inherited, which aren't real scripts a string can resolve to
+ALL_SCRIPTS_MASK = ((1 << len(all_script_names)) - 1) & ~script_mask('Zzzz', 'Zyyy', 'Zinh')
+
+
+_script_augments = ((script_mask('Hani'), script_mask('Hanb', 'Jpan', 'Kore')),
+                    (script_mask('Hira', 'Kana'), script_mask('Jpan')),
+                    (script_mask('Hang'), script_mask('Kore')),
+                    (script_mask('Bopo'), script_mask('Hanb')))
+
+
+def _augmented_scx(scx):
+    # script extensions mask used for the resolved script set: Common and Inherited are in every script, and the
+    # TR39 pseudo scripts are added.
+    if scx in (script_mask('Zyyy'), script_mask('Zinh')):
+        return ALL_SCRIPTS_MASK
+
+    for has, added in _script_augments:
+        if scx & has:
+            scx |= added
+
+    return scx
+
+
+_script_index = RangeIndex((v[0], v[1], (v[2], v[3])) for v in script_map.values())
+_resolved_scx = [_augmented_scx(scx) for sc, scx in _script_index.values]
+
+
+def _resolved_scx_for(cp):
+    # augmented script extensions mask for code point cp (0 if it isn't assigned)
+    i = bisect_right(_script_index.starts, cp) - 1
+    return _resolved_scx[i] if i >= 0 and cp <= _script_index.ends[i] else 0
+
+
+_ascii_resolved_scx = [_resolved_scx_for(cp) for cp in range(128)]
+
+
+def get_script(c):
+    # get the (short) name of the script of character c ('Zzzz' - Unknown - if it isn't assigned)
+    v = _script_index.lookup(ord(c))
+    return 'Zzzz' if v is None else script_names[v[0]]
+
+
+def get_script_extensions(c):
+    # get the set of (short) names of the script extensions of character c ({'Zzzz'} if it isn't assigned)
+    v = _script_index.lookup(ord(c))
+    return frozenset({'Zzzz'}) if v is None else script_names_from_mask(v[1])
+
+
+@_bounded()
+def resolved_script_mask(s):
+    """
+    Return the resolved script set of a string as a bitmask of script ids (see resolved_script_set.)
+
+    The mask is the AND of the (augmented) script extension masks of the characters, so this is a single pass with
+    one range lookup per non-ascii character and no set operations.
+
+    :param s: the string to check
+    :return: the bitmask (0 if the string is mixed script, ALL_SCRIPTS_MASK if all characters are Common/Inherited)
+    """
+    starts, ends, resolved, ascii_resolved = _script_index.starts, _script_index.ends, _resolved_scx, _ascii_resolved_scx
+    mask = ALL_SCRIPTS_MASK
+
+    for cp in _code_points(s):
+        if cp < 128:
+            mask &= ascii_resolved[cp]
+        else:
+            i = bisect_right(starts, cp) - 1
+            if i < 0 or cp > ends[i]:  # unassigned
+                return 0
+            mask &= resolved[i]
+
+        if not mask:
+            return 0
+
+    return mask
+
+
+@_bounded()
+def resolved_script_set(s):
+    """
+    Return the resolved script set of a string as defined in TR39 (http://www.unicode.org/reports/tr39/#def-resolved-script-set)
+
+    This is the intersection of the script extensions of the characters, where Common and Inherited characters are
+    in every script and the Hanb, Jpan and Kore pseudo scripts are added for Han, Hiragana, Katakana, Hangul and
+    Bopomofo.
+
+    :param s: the string to check
+    :return: frozenset of script (short) names. An empty set means the string is mixed script.
+    """
+    return script_names_from_mask(resolved_script_mask(s))
+
+
+@_bounded()
+def is_mixed_script(s):
+    # return True if string s is mixed script (i.e. the resolved script set is empty)
+    return resolved_script_mask(s) == 0
+
+
+# routines for restriction levels (see: http://www.unicode.org/reports/tr39/#Restriction_Level_Detection)
+
+# restriction levels, from most to least restrictive
+RESTRICTION_LEVELS = ('ascii_only', 'single_script', 'highly_restrictive', 'moderately_restrictive',
+                      'minimally_restrictive', 'unrestricted')
+
+# scripts recommended for identifiers (Table 5 of UAX #31)
+RECOMMENDED_SCRIPTS = frozenset({'Zyyy', 'Zinh', 'Arab', 'Armn', 'Beng', 'Bopo', 'Cyrl', 'Deva', 'Ethi', 'Geor', 'Grek',
+                                 'Gujr', 'Guru', 'Hang', 'Hani', 'Hebr', 'Hira', 'Kana', 'Khmr', 'Knda', 'Laoo', 'Latn',
+                                 'Mlym', 'Mymr', 'Orya', 'Sinh', 'Taml', 'Telu', 'Thaa', 'Thai', 'Tibt'})
+
+_LATIN_MASK = script_mask('Latn')
+_MODERATE_OTHER_SCRIPTS_MASK = script_mask(*(RECOMMENDED_SCRIPTS - {'Zyyy', 'Zinh', 'Latn', 'Cyrl', 'Grek'}))
+
+# flag bits for the restriction level segments
+_RL_ALLOWED = 0x1       # in the identifier profile (identifier_status_map Allowed)
+_RL_COVER_JPAN = 0x2    # scripts intersect Latin + Han + Hiragana + Katakana
+_RL_COVER_HANB = 0x4    # scripts intersect Latin + Han + Bopomofo
+_RL_COVER_KORE = 0x8    # scripts intersect Latin + Han + Hangul
+_RL_LATIN = 0x10        # Latin is in the (augmented) script extensions
+_RL_COVERS = _RL_COVER_JPAN | _RL_COVER_HANB | _RL_COVER_KORE
+
+
+def _make_restriction_index():
+    # index of the segments between all of the identifier status and script range boundaries. Each segment has the
+    # resolved script mask and the flags for restriction levels, so a character costs one lookup.
+    allowed = RangeIndex((v[0], v[1], True) for v in identifier_status_map.values() if v[2] == 'Allowed')
+    bounds = sorted({b for idx in (allowed, _script_index) for first, last in zip(idx.starts, idx.ends)
+                     for b in (first, last + 1)})
+    covers = ((script_mask('Latn', 'Jpan'), _RL_COVER_JPAN), (script_mask('Latn', 'Hanb'), _RL_COVER_HANB),
+              (script_mask('Latn', 'Kore'), _RL_COVER_KORE))
+    segments = []
+
+    for first, nxt in zip(bounds, bounds[1:]):
+        mask = _resolved_scx_for(first)
+        flags = _RL_ALLOWED if first in allowed else 0
+
+        for cover_mask, flag in covers:
+            if mask & cover_mask:
+                flags |= flag
+
+        if mask & _LATIN_MASK:
+            flags |= _RL_LATIN
+
+        segments.append((first, nxt - 1, (mask, flags)))
+
+    return RangeIndex(segments)
+
+
+_restriction_index = _make_restriction_index()
+_restriction_masks = [v[0] for v in _restriction_index.values]
+_restriction_flags = [v[1] for v in _restriction_index.values]
+
+
+@_bounded()
+def restriction_level(s):
+    """
+    Return the TR39 restriction level of a string.
+
+    The string is scanned once: each character is a single lookup in a precomputed table holding the identifier
+    profile (identifier_status_map Allowed) check and the script masks, and returns as soon as a character outside
+    the identifier profile is found.
+
+    :param s: the string to check
+    :return: the most restrictive level the string meets (one of RESTRICTION_LEVELS):
+
+     levels:
+        'ascii_only' - all characters are ascii
+        'single_script' - all characters are in the identifier profile and the string is single script
+        'highly_restrictive' - all characters are in the identifier profile and the string is covered by Latin + Han +
+            Hiragana + Katakana, Latin + Han + Bopomofo, or Latin + Han + Hangul
+        'moderately_restrictive' - all characters are in the identifier profile and the string is covered by Latin +
+            one other recommended script, except Cyrillic and Greek
+        'minimally_restrictive' - all characters are in the identifier profile
+        'unrestricted' - anything else
+
+        A level can be used as a gate with RESTRICTION_LEVELS.index(level) <= RESTRICTION_LEVELS.index(max_level).
+    """
+    if s.isascii():
+        return 'ascii_only'
+
+    starts, ends = _restriction_index.starts, _restriction_index.ends
+    masks, all_flags = _restriction_masks, _restriction_flags
+    resolved = non_latin = ALL_SCRIPTS_MASK
+    covers = _RL_COVERS
+
+    for cp in _code_points(s):
+        i = bisect_right(starts, cp) - 1
+
+        if i < 0 or cp > ends[i]:
+            return 'unrestricted'
+
+        flags = all_flags[i]
+
+        if not flags & _RL_ALLOWED:
+            return 'unrestricted'
+
+        mask = masks[i]
+        resolved &= mask
+        covers &= flags
+
+        if not flags & _RL_LATIN:
+            non_latin &= mask
+
+    if resolved:
+        return 'single_script'
+    elif covers:
+        return 'highly_restrictive'
+    elif non_latin & _MODERATE_OTHER_SCRIPTS_MASK:
+        return 'moderately_restrictive'
+    else:
+        return 'minimally_restrictive'
+
+
+# routines for bidi classes (see: http://www.unicode.org/reports/tr9/)
+
+# table of bidi class ids for every code point (L, id 0, isn't in the map)
+_bidi_class_table = CodePointTable.from_ranges(bidi_class_map.values())
+
+_BIDI_L = bidi_class_names.index('L')
+_BIDI_R = bidi_class_names.index('R')
+_BIDI_AL = bidi_class_names.index('AL')
+
+
+def get_bidi_class(c):
+    # get the (short) name of the Bidi_Class of character c (e.g. 'L', 'R', 'AL', 'EN', 'NSM')
+    return bidi_class_names[_bidi_class_table[ord(c)]]
+
+
+@_bounded()
+def direction_profile(s):
+    """
+    Count the bidi classes of the characters in a string.
+
+    This is a single pass with one table lookup per character (done in C for strings with only BMP characters.)
+
+    :param s: the string to check
+    :return: DirectionProfile with:
+        length - the length of the string
+        counts - dict of bidi class (short) name to the number of characters with the class
+        ltr - the number of strong left-to-right characters (L)
+        rtl - the number of strong right-to-left characters (R and AL)
+        direction - 'ltr' or 'rtl' if all of the strong characters have the same direction, 'mixed' if there are
+            both, or 'neutral' if there aren't any (e.g. digits and punctuation only)
+    """
+    table = _bidi_class_table
+
+    if not s:
+        ids = Counter()
+    elif type(s) is str and max(s) <= '\uffff':
+        ids = Counter(map(table.bmp.__getitem__, map(ord, s)))
+    else:
+        ids = Counter(map(table.__getitem__, _code_points(s)))
+
+    ltr = ids[_BIDI_L]
+    rtl = ids[_BIDI_R] + ids[_BIDI_AL]
+    direction = ('mixed' if rtl else 'ltr') if ltr else ('rtl' if rtl else 'neutral')
+    counts = {bidi_class_names[i]: n for i, n in ids.items() if n}
+
+    return DirectionProfile(len(s), counts, ltr, rtl, direction)
+
+
+@_bounded()
+def is_mixed_direction(s):
+    # return True if string s has both strong left-to-right and strong right-to-left characters
+    return direction_profile(s).direction == 'mixed'
+
+
+# routines for grapheme clusters (see: http://www.unicode.org/reports/tr29/#Grapheme_Cluster_Boundaries)
+
+# table of grapheme break ids for every code point (XX, id 0, isn't in the map)
+_grapheme_break_table = CodePointTable.from_ranges(grapheme_break_map.values())
+
+_N_GRAPHEME_BREAKS = len(grapheme_break_names)
+_GB_EXTEND, _GB_ZWJ, _GB_RI, _GB_EXT_PICT = (grapheme_break_names.index(name) for name in ('EX', 'ZWJ', 'RI', 'ExtPict'))
+
+# actions in the pair table
+_BREAK = 0
+_NO_BREAK = 1
+_BREAK_UNLESS_EMOJI = 2     # ZWJ x ExtPict: no break if the ZWJ follows ExtPict Extend* (GB11)
+_BREAK_UNLESS_RI_PAIR = 3   # RI x RI: no break if it makes a pair (GB12, GB13)
+
+
+def _make_grapheme_pairs():
+    # the action for each (previous grapheme break id, current grapheme break id) pair, at
+    # [previous * _N_GRAPHEME_BREAKS + current]. The rules are set from the lowest priority up, so the higher priority
+    # rules overwrite them.
+    ids = {name: i for i, name in enumerate(grapheme_break_names)}
+    every = range(_N_GRAPHEME_BREAKS)
+    controls = (ids['CR'], ids['LF'], ids['CN'])
+    pairs = bytearray(_N_GRAPHEME_BREAKS * _N_GRAPHEME_BREAKS)     # GB999: break everywhere else
+
+    def set_pairs(previous, current, action):
+        for p in previous:
+            for c in current:
+                pairs[p * _N_GRAPHEME_BREAKS + c] = action
+
+    set_pairs((ids['RI'],), (ids['RI'],), _BREAK_UNLESS_RI_PAIR)                      # GB12, GB13
+    set_pairs((ids['ZWJ'],), (ids['ExtPict'],), _BREAK_UNLESS_EMOJI)                  # GB11
+    set_pairs((ids['PP'],), every, _NO_BREAK)                                         # GB9b
+    set_pairs(every, (ids['EX'], ids['ZWJ'], ids['SM']), _NO_BREAK)                   # GB9, GB9a
+    set_pairs((ids['L'],), (ids['L'], ids['V'], ids['LV'], ids['LVT']), _NO_BREAK)    # GB6
+    set_pairs((ids['LV'], ids['V']), (ids['V'], ids['T']), _NO_BREAK)                 # GB7
+    set_pairs((ids['LVT'], ids['T']), (ids['T'],), _NO_BREAK)                         # GB8
+    set_pairs(controls, every, _BREAK)                                                # GB4
+    set_pairs(every, controls, _BREAK)                                                # GB5
+    set_pairs((ids['CR'],), (ids['LF'],), _NO_BREAK)                                  # GB3
+
+    return bytes(pairs)
+
+
+_grapheme_pairs = _make_grapheme_pairs()
+
+# ascii graphemes are single characters, apart from CR LF
+_ascii_graphemes = re.compile('\r\n|.', re.DOTALL)
+
+
+@_bounded()
+def iter_grapheme_spans(s):
+    """
+    Generate the extended grapheme clusters (user-perceived characters) in a string, as spans.
+
+    Follows the grapheme cluster boundary rules of UAX #29. Each boundary is one lookup in a table of the pairs of
+    grapheme break properties, with a little state for the two rules that need more context (emoji ZWJ sequences and
+    regional indicator pairs.)
+
+    :param s: the string to split
+    :return: generator of (start, end) tuples, where s[start:end] is a grapheme cluster
+    """
+    if not s:
+        return
+
+    if s.isascii():
+        for m in _ascii_graphemes.finditer(s):
+            yield m.span()
+        return
+
+    table = _grapheme_break_table
+    bmp = table.bmp
+    pairs = _grapheme_pairs
+    start = 0
+    previous = 0
+    ext_pict = False    # the last character other than Extend was Extended_Pictographic
+    emoji_zwj = False   # the last ZWJ followed ExtPict Extend*
+    ri_odd = False      # an odd number of regional indicators end at the previous character
+
+    for i, cp in enumerate(_code_points(s)):
+        current = bmp[cp] if cp < 0x10000 else table[cp]
+
+        if i:
+            action = pairs[previous * _N_GRAPHEME_BREAKS + current]
+            if action == _BREAK_UNLESS_EMOJI:
+                action = emoji_zwj
+            elif action == _BREAK_UNLESS_RI_PAIR:
+                action = ri_odd
+
+            if not action:
+                yield start, i
+                start = i
+
+        if current == _GB_EXT_PICT:
+            ext_pict = True
+        elif current == _GB_ZWJ:
+            emoji_zwj = ext_pict
+            ext_pict = False
+        elif current != _GB_EXTEND:
+            ext_pict = False
+
+        ri_odd = not ri_odd if current == _GB_RI else False
+        previous = current
+
+    yield start, len(s)
+
+
+@_bounded()
+def iter_graphemes(s):
+    # generate the extended grapheme clusters (user-perceived characters) in string s (see iter_grapheme_spans)
+    for start, end in iter_grapheme_spans(s):
+        yield s[start:end]
+
+
+@_bounded()
+def show_grapheme_confusion(s):
+    """
+    Return the grapheme clusters of a string with intentionally confusing characters.
+
+    Like show_intentional_confusion, but by grapheme cluster, so a confusing character is shown with the combining
+    marks on it (e.g. a Cyrillic a with an acute accent, which looks like an accented Latin a.)
+
+    :param s: the string to check
+    :return: list of (index, grapheme, fixed grapheme) tuples, where index is the index of the grapheme in the
+        string and the fixed grapheme has the confusing characters replaced with the characters they mimic. An empty
+        list ([]) is returned if there aren't any intentionally confusing characters.
+    """
+    if not is_intentional_confusion(s):
+        return []
+
+    result = []
+    for start, end in iter_grapheme_spans(s):
+        grapheme = s[start:end]
+        fixed = grapheme.translate(_intentional_table)
+        if fixed != grapheme:
+            result.append((start, grapheme, fixed))
+
+    return result
+
+
+# routines for emoji properties (see: https://www.unicode.org/reports/tr51/#Emoji_Properties)
+
+_emoji_index = RangeIndex(emoji_map.values())
+_emoji_bits = {name: 1 << i for i, name in enumerate(emoji_property_names)}
+
+_EMOJI = _emoji_bits['Emoji']
+_EMOJI_PRESENTATION = _emoji_bits['Emoji_Presentation']
+_EMOJI_MODIFIER = _emoji_bits['Emoji_Modifier']
+_EMOJI_MODIFIER_BASE = _emoji_bits['Emoji_Modifier_Base']
+_EMOJI_COMPONENT = _emoji_bits['Emoji_Component']
+_EXTENDED_PICTOGRAPHIC = _emoji_bits['Extended_Pictographic']
+
+
+def emoji_properties(c):
+    # return the set of emoji property names (e.g. 'Emoji', 'Emoji_Presentation') of character c
+    mask = _emoji_index.lookup(ord(c), 0)
+    return frozenset(name for name, bit in _emoji_bits.items() if mask & bit)
+
+
+def is_emoji(c):
+    # return True if character c has the Emoji property (note: this includes the digits, # and *)
+    return bool(_emoji_index.lookup(ord(c), 0) & _EMOJI)
+
+
+def is_emoji_presentation(c):
+    # return True if character c is displayed as an emoji by default (the Emoji_Presentation property)
+    return bool(_emoji_index.lookup(ord(c), 0) & _EMOJI_PRESENTATION)
+
+
+def is_emoji_modifier(c):
+    # return True if character c is an emoji modifier (a skin tone)
+    return bool(_emoji_index.lookup(ord(c), 0) & _EMOJI_MODIFIER)
+
+
+def is_emoji_modifier_base(c):
+    # return True if character c can be followed by an emoji modifier
+    return bool(_emoji_index.lookup(ord(c), 0) & _EMOJI_MODIFIER_BASE)
+
+
+def is_emoji_component(c):
+    # return True if character c is used in emoji sequences (e.g. ZWJ, keycap, regional indicators and tags)
+    return bool(_emoji_index.lookup(ord(c), 0) & _EMOJI_COMPONENT)
+
+
+def is_extended_pictographic(c):
+    # return True if character c has the Extended_Pictographic property (emoji, and code points reserved for them)
+    return bool(_emoji_index.lookup(ord(c), 0) & _EXTENDED_PICTOGRAPHIC)
+
+
+def emoji_char_set(*properties):
+    """
+    Return the characters with emoji properties as a CharSet (e.g. to allow emoji with allowed_chars.)
+
+    :param properties: emoji property names (from emoji_property_names.) Characters with any of the properties are
+        in the set. The default is 'Emoji'.
+    :return: CharSet
+    """
+    mask = 0
+    for name in properties or ('Emoji',):
+        if name not in _emoji_bits:
+            raise ValueError(f'Unrecognized emoji property ({name})')
+        mask |= _emoji_bits[name]
+
+    return CharSet(ranges=[(first, last) for first, last, value in emoji_map.values() if value & mask])
+
+
+# routines for emoji sequences (see: https://www.unicode.org/reports/tr51/#Emoji_Sets)
+
+# RGI emoji sequence (as a string) -> sequence type name
+_emoji_sequences = {''.join(map(chr, k)): emoji_sequence_types[v[0]] for k, v in emoji_sequence_map.items()}
+
+
+@lru_cache(maxsize=None)
+def _emoji_sequence_matcher():
+    # automaton for the RGI emoji sequences (the values are the sequence types), and a regex for the characters that
+    # start them (so strings without any can be skipped)
+    starts = ''.join(sorted({re.escape(seq[0]) for seq in _emoji_sequences}))
+    return SequenceAutomaton(_emoji_sequences), re.compile(f'[{starts}]')
+
+
+def emoji_sequence_type(s):
+    # return the type (e.g. 'Emoji_ZWJ_Sequence') if string s is an RGI emoji sequence, otherwise None
+    return _emoji_sequences.get(s)
+
+
+@_bounded()
+def iter_emoji_sequences(s):
+    """
+    Generate the RGI emoji sequences (ZWJ, flag, keycap, tag and modifier sequences) in a string.
+
+    The sequences are found in a single pass with an automaton built from all of the sequences (on first use.)
+    Matches are leftmost-longest, so e.g. a family ZWJ sequence is one match rather than a match for each person.
+
+    :param s: the string to check
+    :return: generator of (start, end, type) tuples, in order, where s[start:end] is an RGI emoji sequence and type
+        is its type (from emoji_sequence_types)
+    """
+    if s.isascii():     # no sequence is all ascii
+        return
+
+    automaton, starts = _emoji_sequence_matcher()
+    if starts.search(s) is None:
+        return
+
+    yield from automaton.iter_matches(s)
+
+
+@_bounded()
+def replace_emoji_sequences(s, replacement=''):
+    """
+    Replace each RGI emoji sequence in a string (e.g. so the rest of the string can be checked without them.)
+
+    :param s: the string to change
+    :param replacement: the string to replace each sequence with
+    :return: the changed string
+    """
+    if s.isascii():
+        return s
+
+    automaton, starts = _emoji_sequence_matcher()
+    if starts.search(s) is None:
+        return s
+
+    return automaton.replace(s, lambda _: replacement)
+
+
+@_bounded()
+def all_ascii(s, allowed_chars=None):
+    # return True if all characters in the string are in the ascii code block
+    if s.isascii():  # cheap accept (a single C level pass) before checking each character
+        return True
+    allowed = _allowed_code_points(allowed_chars)
+    return all(cp <= 127 or cp in allowed for cp in _code_points(s))
+
+
+@_bounded()
+def all_latin(s, allowed_chars=None):
+    # return True if all characters in the string are in the ascii or a Latin code block
+    allowed = _allowed_code_points(allowed_chars)
+
+    try:
+        blocks = {repertoire_map[cp][10] for cp in set(_code_points(s)) if cp not in allowed}
+    except KeyError:
+        return False
+
+    return all((b=='ASCII' or b.startswith('Latin')) for b in blocks)
+
+
+@_bounded()
+def all_allowed(s, allowed_chars=None):
+    # return True if all characters in the string have the allowed identifier type (bit 0 of the identifier type
+    # mask, see identifier_type_names)
+    allowed = _allowed_code_points(allowed_chars)
+    return all(_identifier_type_index.lookup(cp, 0) & 1 for cp in set(_code_points(s)) if cp not in allowed)
+
+
+@lru_cache(maxsize=None)
+def _level_automaton(level):
+    # the IdentifierAutomaton for a level with no allowed_chars (compiled on first use)
+    return IdentifierAutomaton(level)
+
+
+def _identifier_automaton(level, allowed_chars=None):
+    # return the IdentifierAutomaton for a level and allowed_chars
+    if level not in IDENTIFIER_LEVELS:
+        raise ValueError(f'Unsupported level ({level})')
+
+    if not allowed_chars:
+        return _level_automaton(level)
+    return IdentifierAutomaton(level, allowed_chars)
+
+
+@_bounded()
+def is_safe_identifier(s, level='ascii', allowed_chars=None):
+    """
+    Return true if the string is a valid IDNA identifier as specified in: https://www.unicode.org/reports/tr46/
+
+    :param s: the string to check
+    :param level: safety level to check
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: True if the string is a valid/safe identifier for the given safety level (otherwise False)
+
+    supported safety levels:
+      'ascii' - all ascii
+      'programming' - follows core XID_START and XID_CONTINUE
+      'idmod' - follows extended identifier rules (see: http://www.unicode.org/reports/tr39/tr39-17.html, section 3.1))
+
+    Each level is checked by an IdentifierAutomaton (compiled once per level.)
+    """
+    return _identifier_automaton(level, allowed_chars).match(s)
+
+
+def get_unicode_char(ord_c, repertoire_map):
+    # get the value for a character from the repertoire map (c is ordinal value of the character)
+    try:
+        uc = UnicodeChar(*repertoire_map[ord_c])
+    except KeyError:
+        return None
+
+    return uc
+
+
+@_bounded()
+def is_safe_string(s, level='ascii', allowed_chars=None):
+    """
+    Returns True if a string passes the specified security level.
+
+    :param s: the sring to check
+    :param level: the safety level (see below for safety levels
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: True is the specified string is safe, False otherwise
+
+     levels:
+        'ascii' - only allow characters in the ascii character set
+        'latin' - only allow characters in the Latin code block
+        'allowed' - only allow characters allowed in the identifier_type table
+        'unrestricted' - allow any character
+
+        This is based on recommendations in: Unicode security mechanisms (http://www.unicode.org/reports/tr39/tr39-17.html)
+
+    TODO - This still doesn't deal with a lot of safety issues. For examples (but not an exhaustive list):
+        - doesn't deal with single script spoofing
+        - doesn't deal with non-intentional confusions
+        - doesn't deal with bidirectional script spoofing
+        - doesn't deal with syntax spoofing
+        - doesn't deal with numeric spoofs
+        - doesn't deal with ill-formed sub-sequences or illegal input byte sequences (use is_safe_bytes to check
+            UTF-8 bytes)
+
+    More TODO:
+        - allow specifying a list of allowed languages
+        - check for bidi override characters (see more_unicodedata_bidi for unterminated controls)
+        - check for mixing right-to-left and left-to-rigth in single string (see is_mixed_direction)
+        - allow specifying types (e.g. private data, technical, etc.) to specifically allow or disallow (even in unrestricted)?
+
+
+    """
+    # TODO:  check canonical equivalence (for <u, combining-diaeresis>" 1) check u is allowed and diaeresis is allowed, 2) combined (normalized) is allowed)
+    #         so check non-normalized then if normalized is different check normalized chars
+    # TODO: check for intentional confusion
+    # TODO: check characters are allowed (vs rules)
+    # TODO: check for multiple scripts (with allowd sets)
+    # TODO: check for private data chars
+    # identifier_type_map
+
+    if level == 'unrestricted':
+        return True
+    elif level == 'ascii':
+        return all_ascii(s, allowed_chars)
+    elif level == 'latin':
+        return all_latin(s, allowed_chars)
+    elif level == 'allowed':
+        return all_allowed(s, allowed_chars)
+    else:
+        raise ValueError(f'Unrecognized safety level ({level})')
+
+    return True
+
+
+# routines for reports
+
+# block names in block_map order. Bit i of a block mask is block_names[i].
+block_names = tuple(block_map)
+_block_index = RangeIndex((v[0], v[1], i) for i, v in enumerate(block_map.values()))
+
+_reserved_index = RangeIndex.from_map(reserved_map, first_idx=2, last_idx=3)
+
+# identifier types in identifier_type_map order. Bit i of an identifier type mask is identifier_type_names[i].
+identifier_type_names = UnicodeIdentifierType._fields[2:]
+_identifier_type_index = RangeIndex((v[0], v[1], sum(f << i for i, f in enumerate(v[2:])))
+                                    for v in identifier_type_map.values())
+
+_SAFETY_LEVELS = ('ascii', 'latin', 'allowed', 'unrestricted')
+
+
+def block_names_from_mask(mask):
+    # return the set of block names (block_map keys) for a block mask
+    return frozenset(name for i, name in enumerate(block_names) if mask >> i & 1)
+
+
+def identifier_types_from_mask(mask):
+    # return the set of identifier type names for an identifier type mask
+    return frozenset(name for i, name in enumerate(identifier_type_names) if mask >> i & 1)
+
+
+@lru_cache(maxsize=4096)
+def _char_info(cp):
+    # everything analyze needs to know about a code point, so repeated characters are only looked up once:
+    # (intentional confusion, repertoire block, block bit, reserved type, identifier type mask, is latin)
+    rmc = repertoire_map.get(cp)
+    block = None if rmc is None else rmc[10]
+    block_idx = _block_index.lookup(cp)
+    reserved = _reserved_index.lookup(cp)
+    return (cp in intentional_map, block, 0 if block_idx is None else 1 << block_idx,
+            None if reserved is None else reserved[1], _identifier_type_index.lookup(cp, 0),
+            block is not None and (block == 'ASCII' or block.startswith('Latin')))
+
+
+@_bounded()
+def analyze(s, allowed_chars=None):
+    """
+    Return a security report for a string, made in a single pass over the string.
+
+    This has what show_intentional_confusion, blocks, in_reserved, get_identifier_type and is_safe_string (at each
+    level) would report, without a traversal for each.
+
+    :param s: the string to check
+    :param allowed_chars: additional allowable characters for the safety level (see is_safe_string)
+    :return: SecurityReport with the fields:
+
+        length - the length of the string
+        confusable_positions - tuple of the indexes of the characters in intentional_map
+        blocks - frozenset of the (repertoire) block names of the characters (as returned by blocks)
+        block_mask - bitmask of the blocks (block_map) of the characters (see block_names_from_mask)
+        reserved_positions - tuple of the indexes of reserved (unassigned) code points
+        surrogate_positions - tuple of the indexes of surrogate code points
+        noncharacter_positions - tuple of the indexes of noncharacters
+        identifier_types_or - bitmask of the identifier types any character has (see identifier_types_from_mask)
+        identifier_types_and - bitmask of the identifier types every character has
+        safety_level - the first of 'ascii', 'latin', 'allowed' and 'unrestricted' the string passes with
+            is_safe_string
+    """
+    confusable_positions = []
+    positions = {'reserved': [], 'surrogate': [], 'noncharacter': []}
+    blocks_found = set()
+    block_mask = types_or = 0
+    types_and = (1 << len(identifier_type_names)) - 1
+    is_ascii = is_latin = is_allowed = True
+    allowed_cps = _allowed_code_points(allowed_chars)
+
+    for i, cp in enumerate(_code_points(s)):
+        confusable, block, block_bit, reserved, types, latin = _char_info(cp)
+        allowed = types & 1
+
+        if cp in allowed_cps:
+            latin = allowed = True
+        elif cp > 127:
+            is_ascii = False
+
+        if confusable:
+            confusable_positions.append(i)
+        if block is not None:
+            blocks_found.add(block)
+        if reserved is not None:
+            positions[reserved].append(i)
+
+        block_mask |= block_bit
+        types_or |= types
+        types_and &= types
+        is_latin = is_latin and latin
+        is_allowed = is_allowed and allowed
+
+    if not s:
+        types_and = 0
+
+    passed = (is_ascii, is_latin, is_allowed, True)
+    safety_level = next(level for level, ok in zip(_SAFETY_LEVELS, passed) if ok)
+
+    return SecurityReport(len(s), tuple(confusable_positions), frozenset(blocks_found), block_mask,
+                          tuple(positions['reserved']), tuple(positions['surrogate']),
+                          tuple(positions['noncharacter']), types_or, types_and, safety_level)
+
+
+# routines for violations (where a check fails, rather than just if it fails)
+
+def _string_violation(cp, level):
+    # return the reason code point cp fails is_safe_string at level (None if it passes)
+    if level == 'ascii':
+        return 'not_ascii' if cp > 127 else None
+    elif level == 'latin':
+        return None if _char_info(cp)[5] else 'not_latin'
+    elif level == 'allowed':
+        return None if _identifier_type_index.lookup(cp, 0) & 1 else 'not_allowed'
+    return None
+
+
+@_bounded()
+def iter_violations(s, level='ascii', allowed_chars=None):
+    """
+    Generate the characters of a string that fail is_safe_string at a safety level.
+
+    Characters are checked lazily, so the caller can stop at any point (see first_violation.)
+
+    :param s: the string to check
+    :param level: the safety level (see is_safe_string)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: generator of Violation (index, code point, reason) for each character that isn't allowed. Reasons are:
+        'not_ascii', 'not_latin' and 'not_allowed'.
+    """
+    if level not in _SAFETY_LEVELS:
+        raise ValueError(f'Unrecognized safety level ({level})')
+
+    if level == 'unrestricted':
+        return
+
+    allowed = _allowed_code_points(allowed_chars)
+
+    for i, cp in enumerate(_code_points(s)):
+        if cp in allowed:
+            continue
+
+        reason = _string_violation(cp, level)
+        if reason:
+            yield Violation(i, cp, reason)
+
+
+@_bounded()
+def first_violation(s, level='ascii', allowed_chars=None):
+    """
+    Return the first character of a string that fails is_safe_string at a safety level.
+
+    Stops at the first bad character, so this is as fast as is_safe_string for a failing string, and also tells
+    where and why it failed.
+
+    :param s: the string to check
+    :param level: the safety level (see is_safe_string)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: Violation (index, code point, reason) for the first character that isn't allowed, or None if the
+        string passes
+    """
+    return next(iter_violations(s, level, allowed_chars), None)
+
+
+@_bounded()
+def iter_identifier_violations(s, level='ascii', allowed_chars=None):
+    """
+    Generate the characters of a string that fail is_safe_identifier at a safety level.
+
+    :param s: the string to check
+    :param level: the safety level (see is_safe_identifier)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: generator of Violation (index, code point, reason) for each character that isn't allowed. Reasons are:
+        'not_ascii', 'not_xid_start' (first character), 'not_xid_continue' and 'not_allowed' (not in the
+        identifier_status_map for 'idmod'.) An empty string that isn't an identifier at the level ('programming')
+        gives a single Violation(0, None, 'empty').
+    """
+    automaton = _identifier_automaton(level, allowed_chars)
+
+    if not s and not automaton.accepts(automaton.START):
+        yield Violation(0, None, 'empty')
+        return
+
+    for i, cp in enumerate(_code_points(s)):
+        reason = automaton.violation_reason(cp, i == 0)
+        if reason:
+            yield Violation(i, cp, reason)
+
+
+@_bounded()
+def first_identifier_violation(s, level='ascii', allowed_chars=None):
+    """
+    Return the first character of a string that fails is_safe_identifier at a safety level.
+
+    :param s: the string to check
+    :param level: the safety level (see is_safe_identifier)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: Violation (index, code point, reason) for the first character that isn't allowed, or None if the
+        string passes
+    """
+    return next(iter_identifier_violations(s, level, allowed_chars), None)
+
+
+@_bounded()
+def iter_reserved(s):
+    """
+    Generate the reserved (unassigned), surrogate and noncharacter code points in a string.
+
+    :param s: the string to check
+    :return: generator of Violation (index, code point, reason), where reason is the type from reserved_map:
+        'reserved', 'surrogate' or 'noncharacter'
+    """
+    for i, cp in enumerate(_code_points(s)):
+        reserved = _reserved_index.lookup(cp)
+        if reserved is not None:
+            yield Violation(i, cp, reserved[1])
+
+
+@_bounded()
+def first_reserved(s):
+    # return the Violation (index, code point, reserved type) for the first reserved code point in s, or None
+    return next(iter_reserved(s), None)
+
+
+# routines for UTF-8 bytes input (checked as they're decoded, without making a str)
+
+@_bounded()
+def iter_byte_violations(data, level='ascii', allowed_chars=None):
+    """
+    Like iter_violations, but for UTF-8 encoded bytes.
+
+    The bytes are decoded and checked in a single pass, without decoding to a str. Ill-formed UTF-8 is reported too.
+
+    :param data: the UTF-8 bytes to check (bytes, bytearray or memoryview)
+    :param level: the safety level (see is_safe_string)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: generator of Violation (byte offset, code point, reason) for each code point that isn't allowed and
+        each ill-formed sequence. Reasons are those of iter_violations, and 'ill_formed', 'overlong' and 'surrogate'
+        for ill-formed sequences (the code point is None for those.)
+    """
+    if level not in _SAFETY_LEVELS:
+        raise ValueError(f'Unrecognized safety level ({level})')
+
+    allowed = _allowed_code_points(allowed_chars)
+
+    for offset, cp, error in iter_utf8(data):
+        if error:
+            yield Violation(offset, None, error)
+        elif cp in allowed:
+            continue
+        else:
+            reason = _string_violation(cp, level)
+            if reason:
+                yield Violation(offset, cp, reason)
+
+
+@_bounded()
+def first_byte_violation(data, level='ascii', allowed_chars=None):
+    # return the first Violation (byte offset, code point, reason) from iter_byte_violations, or None if there are none
+    return next(iter_byte_violations(data, level, allowed_chars), None)
+
+
+@_bounded()
+def is_safe_bytes(data, level='ascii', allowed_chars=None):
+    """
+    Like is_safe_string, but for UTF-8 encoded bytes. Ill-formed UTF-8 (including overlong forms and encoded
+    surrogates) is never safe.
+
+    :param data: the UTF-8 bytes to check (bytes, bytearray or memoryview)
+    :param level: the safety level (see is_safe_string)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: True is the bytes are well-formed UTF-8 and safe, False otherwise
+    """
+    if level in ('ascii', 'latin') and isinstance(data, (bytes, bytearray)) and data.isascii():
+        return True  # ascii is well-formed, and passes both levels
+    return first_byte_violation(data, level, allowed_chars) is None
+
+
+@_bounded()
+def iter_identifier_byte_violations(data, level='ascii', allowed_chars=None):
+    """
+    Like iter_identifier_violations, but for UTF-8 encoded bytes (see iter_byte_violations.)
+
+    :param data: the UTF-8 bytes to check (bytes, bytearray or memoryview)
+    :param level: the safety level (see is_safe_identifier)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: generator of Violation (byte offset, code point, reason) for each code point that isn't allowed and
+        each ill-formed sequence (and Violation(0, None, 'empty') for empty bytes, as iter_identifier_violations)
+    """
+    automaton = _identifier_automaton(level, allowed_chars)
+
+    if not data and not automaton.accepts(automaton.START):
+        yield Violation(0, None, 'empty')
+        return
+
+    for offset, cp, error in iter_utf8(data):
+        if error:
+            yield Violation(offset, None, error)
+        else:
+            reason = automaton.violation_reason(cp, offset == 0)
+            if reason:
+                yield Violation(offset, cp, reason)
+
+
+@_bounded()
+def is_safe_identifier_bytes(data, level='ascii', allowed_chars=None):
+    """
+    Like is_safe_identifier, but for UTF-8 encoded bytes. Ill-formed UTF-8 is never a safe identifier.
+
+    :param data: the UTF-8 bytes to check (bytes, bytearray or memoryview)
+    :param level: the safety level (see is_safe_identifier)
+    :param allowed_chars: additional allowable characters (any container of characters, a CharSet is fastest)
+    :return: True if the bytes are well-formed UTF-8 and a valid/safe identifier for the level (otherwise False)
+    """
+    return next(iter_identifier_byte_violations(data, level, allowed_chars), None) is None
+
+
+if __name__ == '__main__':
+    # python -m more_unicodedata <command> (see more_unicodedata_cli). The cli imports this module by name, so use
+    # this copy rather than loading the maps again.
+    sys.modules.setdefault('more_unicodedata', sys.modules['__main__'])
+    from more_unicodedata_cli import main
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Bidirectional control checks
+
+Finds the explicit bidi formatting characters (embeddings, overrides and isolates) that aren't properly closed, as
+used in "Trojan Source" attacks (CVE-2021-42574, https://trojansource.codes/), where an unterminated override in a
+comment or string literal makes source code display differently from how it's compiled.
+
+The controls are matched as the bidi algorithm (UAX #9, http://www.unicode.org/reports/tr9/) matches them: a PDF
+closes the last embedding or override (but not across an isolate), a PDI closes the last isolate (and anything
+opened after it), and everything is closed at the end of a paragraph (a line.) Anything that isn't closed
+explicitly, and any PDF or PDI with nothing to close, is reported.
+
+Strings and UTF-8 bytes are scanned in one pass. All of the controls encode as E2 80 xx or E2 81 xx in UTF-8, so
+bytes without either of those pairs are accepted without scanning.
+"""
+
+import re
+from types import MappingProxyType
+
+from more_unicodedata_types import Violation
+from more_unicodedata_bounded import _bounded
+
+# the explicit bidi formatting characters, by code point
+BIDI_CONTROLS = MappingProxyType({
+    0x202A: 'LRE',      # left-to-right embedding
+    0x202B: 'RLE',      # right-to-left embedding
+    0x202C: 'PDF',      # pop directional formatting
+    0x202D: 'LRO',      # left-to-right override
+    0x202E: 'RLO',      # right-to-left override
+    0x2066: 'LRI',      # left-to-right isolate
+    0x2067: 'RLI',      # right-to-left isolate
+    0x2068: 'FSI',      # first strong isolate
+    0x2069: 'PDI',      # pop directional isolate
+})
+
+# the implicit directional marks. These don't need closing, so aren't reported, but can be found with
+# has_bidi_controls(s, marks=True)
+BIDI_MARKS = MappingProxyType({
+    0x061C: 'ALM',      # arabic letter mark
+    0x200E: 'LRM',      # left-to-right mark
+    0x200F: 'RLM',      # right-to-left mark
+})
+
+# event kinds for the stack machine
+_EMBEDDING = 0
+_PDF = 1
+_ISOLATE = 2
+_PDI = 3
+_LINE_END = 4
+
+_kinds = {0x202A: _EMBEDDING, 0x202B: _EMBEDDING, 0x202C: _PDF, 0x202D: _EMBEDDING, 0x202E: _EMBEDDING,
+          0x2066: _ISOLATE, 0x2067: _ISOLATE, 0x2068: _ISOLATE, 0x2069: _PDI}
+
+# paragraph separators (bidi class B), which close everything
+_line_ends = (0x0A, 0x0D, 0x1C, 0x1D, 0x1E, 0x85, 0x2029)
+_kinds.update((cp, _LINE_END) for cp in _line_ends)
+
+# the frozen table, for both strings (by character) and UTF-8 (by encoded sequence)
+_str_kinds = MappingProxyType({chr(cp): kind for cp, kind in _kinds.items()})
+_utf8_kinds = MappingProxyType({chr(cp).encode('utf-8'): (cp, kind) for cp, kind in _kinds.items()})
+
+_str_controls = re.compile('[\u202a-\u202e\u2066-\u2069]')
+_str_events = re.compile('[\u202a-\u202e\u2066-\u2069\n\r\x1c-\x1e\x85\u2029]')
+_str_marks = re.compile('[\u202a-\u202e\u2066-\u2069\u061c\u200e\u200f]')
+_utf8_leads = re.compile(b'\xe2[\x80\x81]')
+_utf8_controls = re.compile(b'\xe2\x80[\xaa-\xae]|\xe2\x81[\xa6-\xa9]')
+_utf8_events = re.compile(b'\xe2\x80[\xaa-\xae]|\xe2\x81[\xa6-\xa9]|[\n\r\x1c-\x1e]|\xc2\x85|\xe2\x80\xa9')
+_utf8_marks = re.compile(b'\xe2\x80[\x8e\x8f\xaa-\xae]|\xe2\x81[\xa6-\xa9]|\xd8\x9c')
+
+
+def _first_control(s):
+    # return the index of the first embedding, override or isolate in s (str or UTF-8 bytes), or None if there
+    # aren't any
+    if isinstance(s, str):
+        m = _str_controls.search(s)
+        return None if m is None else m.start()
+
+    # fast path: every control starts with E2 80 or E2 81
+    m = _utf8_leads.search(s)
+    return None if m is None else m.start()
+
+
+def _iter_events(s, start):
+    # generate (index, code point, kind) for the controls and line ends in s, from index start
+    if isinstance(s, str):
+        kinds = _str_kinds
+        for m in _str_events.finditer(s, start):
+            c = m.group()
+            yield m.start(), ord(c), kinds[c]
+    else:
+        kinds = _utf8_kinds
+        for m in _utf8_events.finditer(s, start):
+            cp, kind = kinds[m.group()]
+            yield m.start(), cp, kind
+
+
+@_bounded()
+def iter_bidi_violations(s):
+    """
+    Generate the bidi embedding, override and isolate controls in a string that aren't properly closed.
+
+    :param s: the string to check: str, or UTF-8 bytes (bytes, bytearray, memoryview or mmap). Ill-formed UTF-8
+        isn't an error, the controls are found wherever they're well-formed.
+    :return: generator of Violation (index, code point, reason), in order of index (a character index for str, a
+        byte offset for bytes.) Reasons are: 'unterminated_bidi' (an embedding, override or isolate not closed by the
+        end of its line, or an embedding closed by the PDI of an isolate it's in) and 'unmatched_bidi' (a PDF or PDI
+        with nothing to close.)
+    """
+    if isinstance(s, memoryview):
+        s = s.cast('B')
+
+    start = _first_control(s)
+    if start is None:
+        return
+
+    stack = []      # (index, code point, kind) of the open embeddings and isolates on the current line
+    found = []      # violations on the current line (reported at the end of the line, in order)
+
+    for i, cp, kind in _iter_events(s, start):
+        if kind == _EMBEDDING or kind == _ISOLATE:
+            stack.append((i, cp, kind))
+        elif kind == _PDF:
+            if stack and stack[-1][2] == _EMBEDDING:
+                stack.pop()
+            else:
+                found.append(Violation(i, cp, 'unmatched_bidi'))
+        elif kind == _PDI:
+            if any(k == _ISOLATE for _, _, k in stack):
+                while True:
+                    j, open_cp, k = stack.pop()
+                    if k == _ISOLATE:
+                        break
+                    found.append(Violation(j, open_cp, 'unterminated_bidi'))
+            else:
+                found.append(Violation(i, cp, 'unmatched_bidi'))
+        else:
+            found.extend(Violation(j, open_cp, 'unterminated_bidi') for j, open_cp, _ in stack)
+            stack.clear()
+            if found:
+                found.sort()
+                yield from found
+                found.clear()
+
+    found.extend(Violation(j, open_cp, 'unterminated_bidi') for j, open_cp, _ in stack)
+    found.sort()
+    yield from found
+
+
+@_bounded()
+def first_bidi_violation(s):
+    # return the first Violation (index, code point, reason) in s (str or UTF-8 bytes), or None (see
+    # iter_bidi_violations)
+    return next(iter_bidi_violations(s), None)
+
+
+@_bounded()
+def is_safe_bidi(s):
+    # return True if every bidi embedding, override and isolate in s (str or UTF-8 bytes) is properly closed
+    return first_bidi_violation(s) is None
+
+
+@_bounded()
+def has_bidi_controls(s, marks=False):
+    """
+    Check if a string has any explicit bidi formatting characters, closed or not.
+
+    Stricter than is_safe_bidi, for text (e.g. source code) where the controls shouldn't be used at all.
+
+    :param s: the string to check (str, or UTF-8 bytes)
+    :param marks: if True, the implicit directional marks (ALM, LRM and RLM) count too
+    :return: True if s has any of the controls
+    """
+    if isinstance(s, memoryview):
+        s = s.cast('B')
+
+    if isinstance(s, str):
+        return (_str_marks if marks else _str_controls).search(s) is not None
+
+    if marks:
+        return _utf8_marks.search(s) is not None
+
+    start = _first_control(s)
+    return start is not None and _utf8_controls.search(s, start) is not None
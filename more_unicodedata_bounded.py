@@ -0,0 +1,126 @@
+"""
+Bounded validation
+
+The _bounded decorator adds optional max_len, deadline and budget keyword arguments to the string checking functions,
+so a caller can put a hard upper bound on the work done for a single (possibly hostile) input. A check that hits a
+bound returns (or, for generators, yields) ABORTED instead of a result.
+"""
+
+from functools import wraps
+from inspect import isgeneratorfunction
+from time import monotonic
+
+
+class _Abort(Exception):
+    # raised inside a bounded call when its deadline passes
+    pass
+
+
+class _Aborted:
+    # type of ABORTED. It can't be used as a bool, so an aborted check can't be mistaken for a pass (or a fail.)
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'ABORTED'
+
+    def __bool__(self):
+        raise TypeError('ABORTED has no truth value (test for it with: result is ABORTED)')
+
+    def __reduce__(self):
+        return 'ABORTED'
+
+
+# returned by the string functions when a max_len, deadline or budget is hit (see _bounded)
+ABORTED = _Aborted()
+
+# number of characters between deadline checks
+_DEADLINE_STRIDE = 1024
+
+
+class _DeadlineStr(str):
+    # a str that checks a deadline as it's iterated, so the loops in the string functions can be stopped part way
+
+    def __iter__(self):
+        deadline = self.deadline
+        for start in range(0, len(self), _DEADLINE_STRIDE):
+            if monotonic() > deadline:
+                raise _Abort
+            yield from str.__getitem__(self, slice(start, start + _DEADLINE_STRIDE))
+
+
+def _bounded(n_strings=1):
+    """
+    Decorator to add the bounded validation keyword arguments to a string function.
+
+    The decorated function takes the keyword arguments:
+
+        max_len - return ABORTED without doing anything if a string argument is longer than max_len (in bytes for
+            the UTF-8 bytes functions)
+        deadline - return ABORTED if the time.monotonic() clock passes deadline
+        budget - return ABORTED if the call takes more than budget seconds
+
+    The length check is done first, as it's the cheapest reject. The deadline is checked every _DEADLINE_STRIDE
+    characters as the function iterates over the string. Single C level passes over the string (e.g. normalizing),
+    and bytes arguments, are only bounded by max_len. Generator functions yield ABORTED as their last value if they're
+    stopped.
+
+    :param n_strings: the number of (leading positional) string arguments to bound. Arguments that aren't strings
+        are skipped, so a method counts self (e.g. _bounded(2) for a method taking one string.)
+    """
+    def decorator(func):
+        def bound_args(args, max_len, deadline, budget):
+            # return the args with the strings set to check the deadline, or None if the call is already over bounds
+            if budget is not None:
+                budget_deadline = monotonic() + budget
+                deadline = budget_deadline if deadline is None else min(deadline, budget_deadline)
+
+            if deadline is not None and monotonic() > deadline:
+                return None
+
+            args = list(args)
+            for i, arg in enumerate(args[:n_strings]):
+                if isinstance(arg, (str, bytes, bytearray, memoryview)):
+                    if max_len is not None and len(arg) > max_len:
+                        return None
+                    if deadline is not None and isinstance(arg, str):
+                        args[i] = _DeadlineStr(arg)
+                        args[i].deadline = deadline
+
+            return args
+
+        if isgeneratorfunction(func):
+            @wraps(func)
+            def wrapper(*args, max_len=None, deadline=None, budget=None, **kwargs):
+                if max_len is None and deadline is None and budget is None:
+                    yield from func(*args, **kwargs)
+                    return
+
+                args = bound_args(args, max_len, deadline, budget)
+                if args is None:
+                    yield ABORTED
+                    return
+
+                try:
+                    yield from func(*args, **kwargs)
+                except _Abort:
+                    yield ABORTED
+        else:
+            @wraps(func)
+            def wrapper(*args, max_len=None, deadline=None, budget=None, **kwargs):
+                if max_len is None and deadline is None and budget is None:
+                    return func(*args, **kwargs)
+
+                args = bound_args(args, max_len, deadline, budget)
+                if args is None:
+                    return ABORTED
+
+                try:
+                    result = func(*args, **kwargs)
+                except _Abort:
+                    return ABORTED
+
+                return str(result) if isinstance(result, _DeadlineStr) else result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,419 @@
+"""
+Command line tools for more_unicodedata
+
+Run with: python -m more_unicodedata <command> ...
+
+Commands:
+
+    lint-identifiers [--jobs N] [--cache FILE] [--json] PATH ...
+
+        Check the identifiers in Python source files (PATHs can be files or directories, which are searched for .py
+        files.) Each identifier (NAME token) has to pass is_safe_identifier at the 'idmod' level, and not contain
+        intentionally confusing characters or be confusable with another identifier in the same file. Files are
+        checked in parallel, and the results are cached by the hash of the file contents. The exit status is 1 if
+        anything was found.
+
+    scan [--jobs N] [--cache FILE] [--banned-types TYPE ...] [--text] PATH ...
+
+        Check every text file in the PATHs (files, or directories, which are walked skipping hidden directories) for
+        intentionally confusing characters, reserved (unassigned, surrogate and noncharacter) code points,
+        characters with banned identifier types (default: deprecated, obsolete and default_Ignorable) and bidi
+        controls that aren't properly closed ("Trojan Source", see more_unicodedata_bidi.) Binary files
+        (with a NUL byte near the start) are skipped, and files that aren't UTF-8 are reported as 'not_utf8'. Files
+        are checked in parallel (large files are memory mapped), and files with the same modification time and size,
+        or the same hash of their contents, as when they were cached aren't checked again. The findings are written
+        as JSON lines (or text, with --text.) The exit status is 1 if anything was found.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
+import sys
+import tokenize
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+
+from more_unicodedata import UNICODE_DATA_VERSION, first_identifier_violation, is_intentional_confusion
+from more_unicodedata import fix_intention_confusion, show_intentional_confusion, iter_reserved
+from more_unicodedata import identifier_types_from_mask, _identifier_type_index
+from more_unicodedata_bidi import BIDI_CONTROLS, iter_bidi_violations
+from more_unicodedata_policy import SafetyPolicy, IDENTIFIER_TYPES
+from more_unicodedata_types import LintFinding
+
+# cached results are only used if they were made by the same version of the checks and data
+CACHE_VERSION = f'3/{UNICODE_DATA_VERSION}'
+
+DEFAULT_CACHE_FILE = '.more_unicodedata_cache.json'
+
+DEFAULT_BANNED_TYPES = ('deprecated', 'obsolete', 'default_Ignorable')
+
+# files at least this big are memory mapped rather than read
+MMAP_THRESHOLD = 1 << 20
+
+# files with a NUL byte in this many bytes at the start are binary, and aren't scanned
+_BINARY_CHECK_SIZE = 8192
+
+_non_ascii_bytes = re.compile(rb'[\x80-\xff]')
+_non_ascii_runs = re.compile('[^\x00-\x7f]+')
+
+
+def lint_source(source, path='<source>'):
+    """
+    Check the identifiers in Python source.
+
+    Ascii identifiers always pass the 'idmod' level and have no intentionally confusing characters, so only the
+    distinct non-ascii identifiers are checked (each once, at its first occurrence.)
+
+    :param source: the source, as bytes (decoded as Python does, with the coding cookie) or str
+    :param path: the path to use in the findings
+    :return: list of LintFinding, in order of position. Reasons are: 'not_idmod' (detail is the reason from
+        first_identifier_violation), 'intentional_confusion' (detail is the identifier with the confusing
+        characters fixed), 'confusable_identifier' (detail is the other identifier) and 'tokenize_error'.
+    """
+    if isinstance(source, str):
+        tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    else:
+        tokens = tokenize.tokenize(io.BytesIO(source).readline)
+
+    ascii_names = set()
+    first_seen = {}     # non-ascii identifier -> (line, column) of its first occurrence
+
+    try:
+        for tok in tokens:
+            if tok.type == tokenize.NAME:
+                if tok.string.isascii():
+                    ascii_names.add(tok.string)
+                elif tok.string not in first_seen:
+                    first_seen[tok.string] = tok.start
+    except (tokenize.TokenError, SyntaxError, UnicodeDecodeError) as e:
+        if isinstance(e, tokenize.TokenError):  # args are (message, (line, column))
+            return [LintFinding(path, e.args[1][0], e.args[1][1], '', 'tokenize_error', e.args[0])]
+        return [LintFinding(path, getattr(e, 'lineno', None) or 0, 0, '', 'tokenize_error', str(e))]
+
+    findings = []
+    fixed_names = {}    # identifier with confusing characters fixed -> first identifier that fixes to it
+
+    for name, (line, column) in first_seen.items():
+        violation = first_identifier_violation(name, level='idmod')
+        if violation is not None:
+            findings.append(LintFinding(path, line, column, name, 'not_idmod', violation.reason))
+
+        if is_intentional_confusion(name):
+            fixed = fix_intention_confusion(name)
+            findings.append(LintFinding(path, line, column, name, 'intentional_confusion', fixed))
+
+            other = fixed if fixed in ascii_names else fixed_names.setdefault(fixed, name)
+            if other != name:
+                findings.append(LintFinding(path, line, column, name, 'confusable_identifier', other))
+
+    findings.sort(key=lambda f: (f.line, f.column))
+    return findings
+
+
+def _file_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _lint_file(task):
+    # worker: (path, cached hash) -> (path, hash, findings), where findings is None if the hash is unchanged
+    path, cached_hash = task
+
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return path, None, [LintFinding(path, 0, 0, '', 'read_error', str(e))]
+
+    file_hash = _file_hash(data)
+    if file_hash == cached_hash:
+        return path, file_hash, None
+
+    return path, file_hash, lint_source(data, path)
+
+
+@contextmanager
+def _file_data(path):
+    # the contents of a file: bytes, or an mmap for big files (which can be used like bytes, but is only valid in
+    # the with block)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+
+
+@lru_cache(maxsize=None)
+def _scan_policy(banned_types):
+    # the compiled policy for the banned types (compiled once per process)
+    return SafetyPolicy('unrestricted', banned_types=banned_types)
+
+
+def scan_text(text, path='<text>', banned_types=DEFAULT_BANNED_TYPES):
+    """
+    Scan text for intentionally confusing characters, reserved code points, banned identifier types and bidi
+    controls that aren't properly closed.
+
+    Ascii characters pass all of the checks, so only the runs of non-ascii characters are checked (apart from the
+    bidi check, which is a single pass over the text.)
+
+    :param text: the text to scan (str)
+    :param path: the path to use in the findings
+    :param banned_types: identifier types to report (names from more_unicodedata_policy.IDENTIFIER_TYPES)
+    :return: list of LintFinding, in order of position (line numbers start at 1, columns at 0.) text is the
+        character found. Reasons are: 'intentional_confusion' (detail is the character it mimics), 'reserved',
+        'surrogate' and 'noncharacter' (the type from reserved_map), and 'banned_type' (detail is the banned types
+        the character has, separated by commas), and 'unterminated_bidi' and 'unmatched_bidi' (detail is the
+        abbreviation of the control, e.g. 'RLO'.)
+    """
+    policy = _scan_policy(tuple(banned_types)) if banned_types else None
+    banned = frozenset(banned_types or ())
+    found = []      # (offset, character, reason, detail)
+
+    for m in _non_ascii_runs.finditer(text):
+        run, start = m.group(), m.start()
+
+        for i, c, mimicked, _, _ in show_intentional_confusion(run):
+            found.append((start + i, c, 'intentional_confusion', mimicked))
+
+        for i, cp, reason in iter_reserved(run):
+            found.append((start + i, chr(cp), reason, ''))
+
+        if policy is not None:
+            for i, cp, _ in policy.iter_violations(run):
+                types = banned & identifier_types_from_mask(_identifier_type_index.lookup(cp, 0))
+                found.append((start + i, chr(cp), 'banned_type', ','.join(sorted(types))))
+
+    for i, cp, reason in iter_bidi_violations(text):
+        found.append((i, chr(cp), reason, BIDI_CONTROLS[cp]))
+
+    if not found:
+        return []
+
+    line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+    findings = []
+
+    for offset, c, reason, detail in sorted(found, key=lambda f: f[0]):
+        line = bisect_right(line_starts, offset)
+        findings.append(LintFinding(path, line, offset - line_starts[line - 1], c, reason, detail))
+
+    return findings
+
+
+def _scan_file(task, banned_types=DEFAULT_BANNED_TYPES):
+    # worker: (path, cached hash) -> (path, hash, findings), where findings is None if the hash is unchanged. Use
+    # partial to set banned_types.
+    path, cached_hash = task
+
+    try:
+        with _file_data(path) as data:
+            file_hash = _file_hash(data)
+            if file_hash == cached_hash:
+                return path, file_hash, None
+
+            if b'\0' in data[:_BINARY_CHECK_SIZE] or not _non_ascii_bytes.search(data):
+                return path, file_hash, []     # binary, or ascii (which passes all of the checks)
+
+            try:
+                text = str(data, 'utf-8')
+            except UnicodeDecodeError as e:
+                head = data[:e.start]
+                line_start = head.rfind(b'\n') + 1
+                return path, file_hash, [LintFinding(path, head.count(b'\n') + 1, e.start - line_start, '',
+                                                     'not_utf8', e.reason)]
+    except OSError as e:
+        return path, None, [LintFinding(path, 0, 0, '', 'read_error', str(e))]
+
+    return path, file_hash, scan_text(text, path, banned_types)
+
+
+def iter_source_files(paths, extensions=('.py',)):
+    # generate the files with one of the extensions (or all files if extensions is None) in paths (files are
+    # generated as they are, directories are walked, skipping hidden directories)
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                for name in sorted(files):
+                    if extensions is None or name.endswith(extensions):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def _read_cache_file(filename):
+    # return the sections (dict of section -> files) in a cache file, or {} if it's missing or out of date
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+
+    return cache.get('sections', {})
+
+
+def load_cache(filename, section='lint-identifiers'):
+    """
+    Load the cached results for a command from a cache file.
+
+    A cache file has a section for each command (and set of options that change the results), so the commands can
+    share a cache file.
+
+    :param filename: the cache file
+    :param section: the section to load
+    :return: dict of path -> [hash, findings (as lists), modification time (ns), size], or {} if the file is
+        missing or out of date.
+    """
+    return _read_cache_file(filename).get(section, {})
+
+
+def save_cache(filename, files, section='lint-identifiers'):
+    # write the cached results for a command (dict of path -> [hash, findings, mtime, size]) to a section of a
+    # cache file, keeping the other sections
+    sections = _read_cache_file(filename)
+    sections[section] = files
+
+    tmp_filename = filename + '.tmp'
+    with open(tmp_filename, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'sections': sections}, f)
+    os.replace(tmp_filename, filename)
+
+
+def _stat(path):
+    # (modification time in ns, size) of a file, or None if it can't be read
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def run_cached(worker, paths, cache_file=None, jobs=None, section='lint-identifiers'):
+    """
+    Run a file checking worker over files, in parallel, skipping files that are unchanged since they were cached.
+
+    Files with the same modification time and size as when they were cached aren't read at all. The others are
+    sent to the worker with their cached hash, so the worker can skip checking files whose contents are unchanged.
+
+    :param worker: function of (path, cached hash) returning (path, hash, findings), with findings None if the hash
+        is the cached hash. It must be picklable (a module level function, or a partial of one) so it can be sent to
+        worker processes.
+    :param paths: the files to check
+    :param cache_file: the cache file (None for no cache)
+    :param jobs: the number of worker processes (None for one per CPU, 1 to check in this process)
+    :param section: the section of the cache file to use (see load_cache)
+    :return: dict of path -> list of LintFinding
+    """
+    cache = load_cache(cache_file, section) if cache_file else {}
+    stats = {}
+    results = []
+    tasks = []
+
+    for path in paths:
+        stats[path] = _stat(path)
+        cached = cache.get(path)
+        if cached is None:
+            tasks.append((path, None))
+        elif stats[path] is not None and list(stats[path]) == cached[2:]:
+            results.append((path, cached[0], None))
+        else:
+            tasks.append((path, cached[0]))
+
+    if jobs == 1 or len(tasks) < 2:
+        results.extend(map(worker, tasks))
+    else:
+        chunksize = max(1, min(64, len(tasks) // (4 * (jobs or os.cpu_count() or 1))))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results.extend(executor.map(worker, tasks, chunksize=chunksize))
+
+    findings = {}
+    new_cache = {}
+
+    for path, file_hash, file_findings in results:
+        if file_findings is None:
+            file_findings = [LintFinding(*f) for f in cache[path][1]]
+        findings[path] = file_findings
+        if file_hash is not None and stats[path] is not None:
+            new_cache[path] = [file_hash, [list(f) for f in file_findings], *stats[path]]
+
+    if cache_file:
+        save_cache(cache_file, new_cache, section)
+
+    return findings
+
+
+def format_finding(finding):
+    # return a finding as a line of text (path:line:column: reason: text (detail))
+    detail = f' ({finding.detail})' if finding.detail else ''
+    return f'{finding.path}:{finding.line}:{finding.column}: {finding.reason}: {finding.text!r}{detail}'
+
+
+def write_findings(findings, out, as_json=False):
+    # write the findings (dict of path -> findings) to out, as text or JSON lines. Return the number of findings.
+    count = 0
+
+    for path in sorted(findings):
+        for finding in findings[path]:
+            out.write((json.dumps(finding._asdict(), ensure_ascii=False) if as_json else format_finding(finding)) + '\n')
+            count += 1
+
+    return count
+
+
+def _lint_identifiers(args):
+    paths = list(iter_source_files(args.paths))
+    findings = run_cached(_lint_file, paths, cache_file=args.cache, jobs=args.jobs)
+    return 1 if write_findings(findings, sys.stdout, as_json=args.json) else 0
+
+
+def _scan(args):
+    banned_types = tuple(sorted(set(args.banned_types)))
+    paths = list(iter_source_files(args.paths, extensions=None))
+    findings = run_cached(partial(_scan_file, banned_types=banned_types), paths, cache_file=args.cache,
+                          jobs=args.jobs, section='scan/' + ','.join(banned_types))
+    return 1 if write_findings(findings, sys.stdout, as_json=not args.text) else 0
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog='python -m more_unicodedata',
+                                     description='Unicode security checks from more_unicodedata')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    lint = commands.add_parser('lint-identifiers', help='check the identifiers in Python source files')
+    lint.add_argument('paths', nargs='+', help='Python files, or directories to search for .py files')
+    lint.add_argument('--jobs', '-j', type=int, default=None, help='number of worker processes (default: one per CPU)')
+    lint.add_argument('--cache', default=DEFAULT_CACHE_FILE, help=f'cache file (default: {DEFAULT_CACHE_FILE})')
+    lint.add_argument('--no-cache', dest='cache', action='store_const', const=None, help="don't use a cache file")
+    lint.add_argument('--json', action='store_true', help='write the findings as JSON lines')
+    lint.set_defaults(func=_lint_identifiers)
+
+    scan = commands.add_parser('scan', help='check every text file in directory trees')
+    scan.add_argument('paths', nargs='+', help='files, or directories to walk')
+    scan.add_argument('--jobs', '-j', type=int, default=None, help='number of worker processes (default: one per CPU)')
+    scan.add_argument('--cache', default=DEFAULT_CACHE_FILE, help=f'cache file (default: {DEFAULT_CACHE_FILE})')
+    scan.add_argument('--no-cache', dest='cache', action='store_const', const=None, help="don't use a cache file")
+    scan.add_argument('--banned-types', nargs='*', default=list(DEFAULT_BANNED_TYPES), choices=IDENTIFIER_TYPES,
+                      metavar='TYPE', help='identifier types to report (default: %(default)s)')
+    scan.add_argument('--text', action='store_true', help='write the findings as text (default: JSON lines)')
+    scan.set_defaults(func=_scan)
+
+    return parser
+
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Incremental checks for large documents
+
+A DocumentChecker holds a document as a list of chunks, with the findings of the per-character checks
+(show_intentional_confusion and iter_reserved) cached for each chunk. An edit only re-checks the chunks it touches,
+and reports the findings it removed and added, so a caller can update its list of findings without a rescan.
+"""
+
+from bisect import bisect_right
+
+from more_unicodedata import show_intentional_confusion, iter_reserved
+from more_unicodedata_types import DocumentFinding, DocumentEdit
+
+
+def _check_chunk(chunk):
+    # return the findings for a chunk (with offsets relative to the chunk)
+    findings = [DocumentFinding(i, ord(c), 'intentional', mimicked)
+                for i, c, mimicked, _, _ in show_intentional_confusion(chunk)]
+    findings.extend(DocumentFinding(v.index, v.code_point, v.reason, None) for v in iter_reserved(chunk))
+    findings.sort()
+    return findings
+
+
+def _shifted(findings, base):
+    # return the findings with base added to the offsets
+    return [f._replace(offset=f.offset + base) for f in findings]
+
+
+class DocumentChecker:
+    """
+    Intentional confusion and reserved code point findings for a document, kept up to date as it's edited.
+
+    The document is split into chunks of about chunk_size characters. The chunk boundaries stay where they are when
+    the document is edited (a chunk is only split when it grows to twice chunk_size, or merged with the next chunk
+    when it shrinks below half of it), so an edit re-checks the one or two chunks it touches. The cost of an edit is
+    the check of those chunks, plus updating the integer chunk offsets after them.
+
+    :param text: the initial text of the document
+    :param chunk_size: the target number of characters in a chunk
+    """
+
+    def __init__(self, text='', chunk_size=4096):
+        if chunk_size < 2:
+            raise ValueError(f'chunk_size must be at least 2 ({chunk_size})')
+
+        self.chunk_size = chunk_size
+        self._chunks = self._split(text)
+        self._findings = [_check_chunk(chunk) for chunk in self._chunks]
+        self._ends = []
+
+        end = 0
+        for chunk in self._chunks:
+            end += len(chunk)
+            self._ends.append(end)
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    @property
+    def text(self):
+        # the current text of the document
+        return ''.join(self._chunks)
+
+    def _split(self, text):
+        # split text into chunks of chunk_size characters
+        size = self.chunk_size
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    def _chunk_start(self, i):
+        return self._ends[i - 1] if i else 0
+
+    def findings(self):
+        # return a list of all of the findings in the document, in order of offset
+        result = []
+        for i, findings in enumerate(self._findings):
+            result.extend(_shifted(findings, self._chunk_start(i)))
+        return result
+
+    def replace(self, start, end, text):
+        """
+        Replace the characters from start to end (exclusive) with text.
+
+        :param start: offset of the first character to replace
+        :param end: offset after the last character to replace (start for an insert)
+        :param text: the new text (empty for a delete)
+        :return: DocumentEdit with the findings removed and added by the edit. Findings at or after shift_from (in the
+            old offsets) are unchanged, but move by delta.
+        """
+        length = len(self)
+        if not 0 <= start <= end <= length:
+            raise IndexError(f'edit ({start}, {end}) is outside of the document (length {length})')
+
+        # the chunks holding the edit (an edit at a chunk boundary goes at the end of the previous chunk.) For an
+        # empty document there are none (last is -1.)
+        first = min(bisect_right(self._ends, start - 1) if start else 0, max(len(self._chunks) - 1, 0))
+        last = max(first, min(bisect_right(self._ends, end - 1), len(self._chunks) - 1)) if self._chunks else -1
+
+        region_start = self._chunk_start(first)
+        old_region = ''.join(self._chunks[first:last + 1])
+        region = old_region[:start - region_start] + text + old_region[end - region_start:]
+
+        # merge a chunk that's too small into the next one
+        if len(region) < self.chunk_size // 2 and last + 1 < len(self._chunks):
+            last += 1
+            old_region += self._chunks[last]
+            region += self._chunks[last]
+
+        removed = []
+        for i in range(first, last + 1):
+            removed.extend(_shifted(self._findings[i], self._chunk_start(i)))
+
+        if len(region) >= 2 * self.chunk_size:
+            chunks = self._split(region)
+        else:
+            chunks = [region] if region else []
+
+        findings = [_check_chunk(chunk) for chunk in chunks]
+
+        added = []
+        ends = []
+        chunk_end = region_start
+        for chunk, chunk_findings in zip(chunks, findings):
+            added.extend(_shifted(chunk_findings, chunk_end))
+            chunk_end += len(chunk)
+            ends.append(chunk_end)
+
+        shift_from = region_start + len(old_region)
+        delta = len(region) - len(old_region)
+
+        self._chunks[first:last + 1] = chunks
+        self._findings[first:last + 1] = findings
+        self._ends[first:last + 1] = ends
+        if delta:
+            after = first + len(chunks)
+            self._ends[after:] = [e + delta for e in self._ends[after:]]
+
+        return DocumentEdit(removed, added, shift_from, delta)
+
+    def insert(self, offset, text):
+        # insert text at offset (see replace)
+        return self.replace(offset, offset, text)
+
+    def delete(self, start, end):
+        # delete the characters from start to end (see replace)
+        return self.replace(start, end, '')
+
+    @staticmethod
+    def apply_edit(findings, edit):
+        """
+        Apply the DocumentEdit returned by an edit to a list of findings (e.g. from findings() before the edit.)
+
+        :param findings: list of findings, in order of offset
+        :param edit: the DocumentEdit
+        :return: the list of findings after the edit
+        """
+        removed = set(edit.removed)
+        before = [f for f in findings if f.offset < edit.shift_from and f not in removed]
+        after = [f._replace(offset=f.offset + edit.delta) for f in findings if f.offset >= edit.shift_from]
+        return before + edit.added + after
@@ -0,0 +1,464 @@
+"""
+Confusable collision indexes
+
+Indexes a set of strings (e.g. user names) on their TR39 skeleton, so a new string can be checked for confusable
+collisions with every existing string with a single skeleton computation and lookup (O(len(candidate))).
+
+Either index can have a SkeletonBloomFilter prefilter in front of it, so candidates with no collision (most of them)
+are rejected without touching the index.
+"""
+
+from array import array
+from hashlib import blake2b
+from math import ceil, log
+from pathlib import Path
+import sqlite3
+import struct
+import sys
+
+from more_unicodedata import skeleton, UNICODE_DATA_VERSION
+from more_unicodedata_bounded import _bounded
+
+
+class SkeletonBloomFilter:
+    """
+    Bloom filter over skeletons.
+
+    A skeleton that was added is always reported as present. A skeleton that wasn't added is reported as present
+    with a probability of about error_rate (while no more than capacity skeletons have been added.) Items can't be
+    removed, so a filter in front of an index should be rebuilt after many removals.
+
+    :param capacity: the expected number of skeletons
+    :param error_rate: the target false-positive rate
+    """
+    _header = struct.Struct('<4sBIQ')  # magic, number of hashes, capacity, number of bits
+    _magic = b'MUBF'
+
+    def __init__(self, capacity, error_rate=0.01):
+        if not 0 < error_rate < 1:
+            raise ValueError(f'error_rate must be between 0 and 1 ({error_rate})')
+
+        capacity = max(capacity, 1)
+        num_bits = ceil(-capacity * log(error_rate) / (log(2) ** 2))
+        self.capacity = capacity
+        self.num_bits = (num_bits + 7) // 8 * 8
+        self.num_hashes = max(1, round(self.num_bits / capacity * log(2)))
+
+        # the header stores the capacity in 32 bits and the number of hashes in 8 bits
+        if capacity > 0xFFFFFFFF:
+            raise ValueError(f'capacity must be at most {0xFFFFFFFF} ({capacity})')
+        if self.num_hashes > 0xFF:
+            raise ValueError(f'error_rate is too small, it needs more than 255 hashes ({error_rate})')
+
+        self._bits = bytearray(self.num_bits // 8)
+
+    def _positions(self, skel):
+        # double hashing: k positions from two 64 bit halves of a single digest
+        digest = blake2b(skel.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, skel):
+        # add a skeleton to the filter
+        bits = self._bits
+        for pos in self._positions(skel):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, skels):
+        # add all of the skeletons in an iterable to the filter
+        for skel in skels:
+            self.add(skel)
+
+    def __contains__(self, skel):
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(skel))
+
+    def to_bytes(self):
+        # serialize the filter (e.g. to share it between worker processes)
+        return self._header.pack(self._magic, self.num_hashes, self.capacity, self.num_bits) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        # create a filter from the output of to_bytes
+        header = cls._header
+        magic, num_hashes, capacity, num_bits = header.unpack_from(data)
+
+        if magic != cls._magic or len(data) != header.size + num_bits // 8:
+            raise ValueError('data is not a serialized SkeletonBloomFilter')
+
+        bf = cls.__new__(cls)
+        bf.capacity = capacity
+        bf.num_bits = num_bits
+        bf.num_hashes = num_hashes
+        bf._bits = bytearray(data[header.size:])
+        return bf
+
+
+class ConfusableIndex:
+    """
+    In-memory index of strings keyed on skeleton.
+
+    Each string is stored once and referred to by an integer id. Skeletons are interned and map to a single id (the
+    common case, no collision) or to an array of ids, which keeps the overhead per string small for millions of
+    entries.
+
+    :param strings: optional iterable of strings to bulk load into the index
+    """
+    __slots__ = ('_strings', '_ids', '_skeletons', 'prefilter')
+
+    def __init__(self, strings=None):
+        self._strings = []      # id -> string (None once removed)
+        self._ids = {}          # string -> id
+        self._skeletons = {}    # skeleton -> id or array of ids
+        self.prefilter = None   # optional SkeletonBloomFilter
+
+        if strings is not None:
+            self.update(strings)
+
+    @classmethod
+    def from_iterable(cls, strings):
+        # build an index from an iterable of strings
+        return cls(strings)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, s):
+        return s in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def add(self, s):
+        # add string s to the index. Returns False if it was already in the index.
+        if s in self._ids:
+            return False
+
+        id_ = len(self._strings)
+        self._strings.append(s)
+        self._ids[s] = id_
+
+        skel = sys.intern(skeleton(s))
+        entry = self._skeletons.get(skel)
+
+        if self.prefilter is not None:
+            self.prefilter.add(skel)
+
+        if entry is None:
+            self._skeletons[skel] = id_
+        elif isinstance(entry, int):
+            self._skeletons[skel] = array('L', (entry, id_))
+        else:
+            entry.append(id_)
+
+        return True
+
+    def update(self, strings):
+        # add all of the strings in an iterable to the index
+        add = self.add
+        for s in strings:
+            add(s)
+
+    def remove(self, s):
+        # remove string s from the index. Raises KeyError if it is not in the index.
+        id_ = self._ids.pop(s)
+        self._strings[id_] = None
+
+        skel = skeleton(s)
+        entry = self._skeletons[skel]
+
+        if isinstance(entry, int):
+            del self._skeletons[skel]
+        else:
+            entry.remove(id_)
+            if len(entry) == 1:
+                self._skeletons[skel] = entry[0]
+
+    def discard(self, s):
+        # remove string s from the index if it is present
+        if s in self._ids:
+            self.remove(s)
+
+    def _entry_strings(self, entry):
+        strings = self._strings
+        if isinstance(entry, int):
+            return (strings[entry],)
+        return (strings[i] for i in entry)
+
+    @_bounded(2)
+    def collisions(self, candidate):
+        """
+        Return the strings in the index that are confusable with candidate.
+
+        :param candidate: the string to check
+        :return: a set of the indexed strings with the same skeleton as candidate (candidate itself is not included.)
+            An empty set is returned if there are no collisions.
+        """
+        skel = skeleton(candidate)
+
+        if self.prefilter is not None and skel not in self.prefilter:
+            return set()
+
+        entry = self._skeletons.get(skel)
+
+        if entry is None:
+            return set()
+
+        return {s for s in self._entry_strings(entry) if s != candidate}
+
+    @_bounded(2)
+    def has_collision(self, candidate):
+        # return True if any string in the index (other than candidate itself) is confusable with candidate
+        skel = skeleton(candidate)
+
+        if self.prefilter is not None and skel not in self.prefilter:
+            return False
+
+        entry = self._skeletons.get(skel)
+
+        if entry is None:
+            return False
+
+        return any(s != candidate for s in self._entry_strings(entry))
+
+    def build_prefilter(self, error_rate=0.01, capacity=None):
+        """
+        Put a SkeletonBloomFilter in front of the index.
+
+        Skeletons of strings added later are added to the filter too.
+
+        :param error_rate: the target false-positive rate
+        :param capacity: the expected number of skeletons (defaults to twice the current number)
+        :return: the filter (also set as the prefilter attribute)
+        """
+        if capacity is None:
+            capacity = 2 * len(self._skeletons)
+
+        self.prefilter = SkeletonBloomFilter(capacity, error_rate)
+        self.prefilter.update(self._skeletons)
+        return self.prefilter
+
+    def compact(self):
+        # renumber the ids to drop the slots left by removed strings
+        strings = list(self._ids)
+        self._strings = []
+        self._ids = {}
+        self._skeletons = {}
+        self.update(strings)
+
+
+class SqliteConfusableIndex:
+    """
+    On-disk index of strings keyed on skeleton, stored in a sqlite3 database.
+
+    Used like ConfusableIndex when the set of strings doesn't comfortably fit in memory. The database records the
+    Unicode data version its skeletons were computed with; if it doesn't match UNICODE_DATA_VERSION, call rebuild()
+    to recompute them.
+
+    The database uses write-ahead logging, so any number of read_only=True connections (e.g. one per worker process)
+    can do lookups while a single writer adds strings.
+
+    :param path: filename of the sqlite3 database (created if it doesn't exist, unless read_only is True)
+    :param read_only: open the database read-only
+    :param batch_size: number of rows written per transaction by add_many and rebuild
+    """
+
+    def __init__(self, path, read_only=False, batch_size=10000):
+        self.path = path
+        self.read_only = read_only
+        self.batch_size = batch_size
+        self.prefilter = None   # optional SkeletonBloomFilter
+
+        if read_only:
+            self._con = sqlite3.connect(Path(path).resolve().as_uri() + '?mode=ro', uri=True)
+        else:
+            self._con = sqlite3.connect(path)
+            self._con.execute('PRAGMA journal_mode=WAL')
+
+            with self._con:
+                self._con.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+                self._con.execute('CREATE TABLE IF NOT EXISTS strings (string TEXT PRIMARY KEY, skeleton TEXT NOT NULL) '
+                                  'WITHOUT ROWID')
+                self._con.execute('CREATE INDEX IF NOT EXISTS strings_skeleton ON strings (skeleton)')
+                self._con.execute("INSERT OR IGNORE INTO meta VALUES ('data_version', ?)", (UNICODE_DATA_VERSION,))
+
+    def close(self):
+        self._con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_meta(self, key):
+        row = self._con.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    @property
+    def data_version(self):
+        # the Unicode data version the stored skeletons were computed with
+        return self._get_meta('data_version')
+
+    def needs_rebuild(self):
+        # return True if the stored skeletons were computed from a different Unicode data version (or a rebuild
+        # was interrupted)
+        return self.data_version != UNICODE_DATA_VERSION or self._get_meta('rebuild_from') is not None
+
+    def __len__(self):
+        return self._con.execute('SELECT COUNT(*) FROM strings').fetchone()[0]
+
+    def __contains__(self, s):
+        return self._con.execute('SELECT 1 FROM strings WHERE string = ?', (s,)).fetchone() is not None
+
+    def add(self, s):
+        # add string s to the index. Returns False if it was already in the index.
+        skel = skeleton(s)
+
+        with self._con:
+            cur = self._con.execute('INSERT OR IGNORE INTO strings VALUES (?, ?)', (s, skel))
+
+        if self.prefilter is not None:
+            self.prefilter.add(skel)
+
+        return cur.rowcount == 1
+
+    def add_many(self, strings):
+        """
+        Add the strings from an iterable to the index.
+
+        Rows are inserted with executemany, one transaction per batch_size strings.
+
+        :param strings: iterable of strings to add
+        :return: the number of strings added (strings already in the index are not counted)
+        """
+        added = 0
+        batch = []
+
+        for s in strings:
+            batch.append((s, skeleton(s)))
+            if len(batch) >= self.batch_size:
+                added += self._insert_batch(batch)
+                batch = []
+
+        if batch:
+            added += self._insert_batch(batch)
+
+        return added
+
+    def _insert_batch(self, batch):
+        before = self._con.total_changes
+        with self._con:
+            self._con.executemany('INSERT OR IGNORE INTO strings VALUES (?, ?)', batch)
+
+        if self.prefilter is not None:
+            self.prefilter.update(skel for _, skel in batch)
+
+        return self._con.total_changes - before
+
+    def remove(self, s):
+        # remove string s from the index. Raises KeyError if it is not in the index.
+        with self._con:
+            cur = self._con.execute('DELETE FROM strings WHERE string = ?', (s,))
+        if cur.rowcount == 0:
+            raise KeyError(s)
+
+    def discard(self, s):
+        # remove string s from the index if it is present
+        with self._con:
+            self._con.execute('DELETE FROM strings WHERE string = ?', (s,))
+
+    @_bounded(2)
+    def collisions(self, candidate):
+        """
+        Return the strings in the index that are confusable with candidate.
+
+        :param candidate: the string to check
+        :return: a set of the indexed strings with the same skeleton as candidate (candidate itself is not included.)
+            An empty set is returned if there are no collisions.
+        """
+        skel = skeleton(candidate)
+
+        if self.prefilter is not None and skel not in self.prefilter:
+            return set()
+
+        rows = self._con.execute('SELECT string FROM strings WHERE skeleton = ? AND string != ?', (skel, candidate))
+        return {row[0] for row in rows}
+
+    @_bounded(2)
+    def has_collision(self, candidate):
+        # return True if any string in the index (other than candidate itself) is confusable with candidate
+        skel = skeleton(candidate)
+
+        if self.prefilter is not None and skel not in self.prefilter:
+            return False
+
+        row = self._con.execute('SELECT 1 FROM strings WHERE skeleton = ? AND string != ? LIMIT 1',
+                                (skel, candidate)).fetchone()
+        return row is not None
+
+    def build_prefilter(self, error_rate=0.01, capacity=None):
+        """
+        Put a SkeletonBloomFilter in front of the index.
+
+        The filter is kept in memory and only sees strings added through this connection, so readers should rebuild
+        (or reload, see SkeletonBloomFilter.from_bytes) it after other connections add strings.
+
+        :param error_rate: the target false-positive rate
+        :param capacity: the expected number of skeletons (defaults to twice the current number of strings)
+        :return: the filter (also set as the prefilter attribute)
+        """
+        if capacity is None:
+            capacity = 2 * len(self)
+
+        self.prefilter = SkeletonBloomFilter(capacity, error_rate)
+        self.prefilter.update(row[0] for row in self._con.execute('SELECT DISTINCT skeleton FROM strings'))
+        return self.prefilter
+
+    def rebuild(self):
+        """
+        Recompute the stored skeletons with the current skeleton data.
+
+        The rebuild is incremental: strings are walked in order batch_size at a time, only rows whose skeleton
+        changed are rewritten, and each batch is committed along with the position reached. An interrupted rebuild
+        picks up where it left off the next time rebuild is called.
+
+        :return: the number of rows whose skeleton changed
+        """
+        changed = 0
+        position = self._get_meta('rebuild_from')
+
+        while True:
+            if position is None:
+                rows = self._con.execute('SELECT string, skeleton FROM strings ORDER BY string LIMIT ?',
+                                         (self.batch_size,)).fetchall()
+            else:
+                rows = self._con.execute('SELECT string, skeleton FROM strings WHERE string > ? ORDER BY string '
+                                         'LIMIT ?', (position, self.batch_size)).fetchall()
+            if not rows:
+                break
+
+            updates = []
+            for s, old_skel in rows:
+                skel = skeleton(s)
+                if skel != old_skel:
+                    updates.append((skel, s))
+
+            position = rows[-1][0]
+
+            if self.prefilter is not None:
+                self.prefilter.update(skel for skel, _ in updates)
+
+            with self._con:
+                self._con.executemany('UPDATE strings SET skeleton = ? WHERE string = ?', updates)
+                self._con.execute("INSERT OR REPLACE INTO meta VALUES ('rebuild_from', ?)", (position,))
+
+            changed += len(updates)
+
+        with self._con:
+            self._con.execute("DELETE FROM meta WHERE key = 'rebuild_from'")
+            self._con.execute("INSERT OR REPLACE INTO meta VALUES ('data_version', ?)", (UNICODE_DATA_VERSION,))
+
+        return changed
@@ -0,0 +1,147 @@
+"""
+Multi-code-point sequence matching
+
+An Aho-Corasick automaton over code point sequences, used where a per-character map (like intentional_map) can't
+express the data -- e.g. confusable combining sequences.
+"""
+
+
+class SequenceAutomaton:
+    """
+    Aho-Corasick automaton that finds a set of code point sequences (patterns) in a string.
+
+    The automaton is built once from the patterns, then each scan is a single linear pass over the input. Matches are
+    leftmost-longest and non-overlapping: at each position the longest pattern starting there wins, and scanning
+    continues after the end of the match.
+
+    :param patterns: dict (or iterable of (pattern, value) pairs), where pattern is a non-empty string and value is
+        returned with each match of the pattern.
+    """
+    __slots__ = ('_goto', '_fail', '_match', '_out', '_depth', 'max_length')
+
+    def __init__(self, patterns):
+        goto = [{}]         # state -> {char: next state}
+        match = [None]      # state -> (length, value) if a pattern ends at the state
+        depth = [0]         # state -> length of the path from the root
+
+        if isinstance(patterns, dict):
+            patterns = patterns.items()
+
+        for pattern, value in patterns:
+            if not pattern:
+                raise ValueError('patterns must be non-empty')
+
+            state = 0
+            for c in pattern:
+                nxt = goto[state].get(c)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][c] = nxt
+                    goto.append({})
+                    match.append(None)
+                    depth.append(depth[state] + 1)
+                state = nxt
+
+            match[state] = (len(pattern), value)
+
+        # breadth first to set the failure links (longest proper suffix that is also a path from the root) and the
+        # output links (next state on the failure chain where a pattern ends).
+        fail = [0] * len(goto)
+        out = [0] * len(goto)
+        queue = list(goto[0].values())
+
+        for state in queue:
+            for c, nxt in goto[state].items():
+                f = fail[state]
+                while f and c not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(c, 0)
+                fail[nxt] = f if f != nxt else 0
+                out[nxt] = fail[nxt] if match[fail[nxt]] is not None else out[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._match = match
+        self._out = out
+        self._depth = depth
+        self.max_length = max(depth)
+
+    def iter_matches(self, s):
+        """
+        Generate the leftmost-longest, non-overlapping matches in a string.
+
+        :param s: the string to scan
+        :return: generator of (start, end, value) tuples, in order, where s[start:end] is the matched pattern
+        """
+        goto, fail, match, out, depth = self._goto, self._fail, self._match, self._out, self._depth
+        state = 0
+        pos = 0             # matches must start at or after pos (the end of the last match emitted)
+        candidates = {}     # start -> (end, value) of the longest match found so far starting there
+
+        for i, c in enumerate(s):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+
+            # record every pattern ending here
+            end = i + 1
+            m_state = state if match[state] is not None else out[state]
+            while m_state:
+                length, value = match[m_state]
+                start = end - length
+                if start >= pos:  # matches are found in order of their end, so this is the longest so far
+                    candidates[start] = (end, value)
+                m_state = out[m_state]
+
+            # no match found from here on can start before the earliest start in the current state, so the earlier
+            # candidates are final
+            frontier = end - depth[state]
+            while candidates:
+                start = min(candidates)
+                if start >= frontier:
+                    break
+                m_end, value = candidates[start]
+                yield start, m_end, value
+                pos = m_end
+                candidates = {k: v for k, v in candidates.items() if k >= pos}
+
+        while candidates:
+            start = min(candidates)
+            m_end, value = candidates[start]
+            yield start, m_end, value
+            pos = m_end
+            candidates = {k: v for k, v in candidates.items() if k >= pos}
+
+    def find_all(self, s):
+        # return a list of the (start, end, value) tuples for the matches in string s
+        return list(self.iter_matches(s))
+
+    def contains_match(self, s):
+        # return True if any pattern occurs in string s
+        for _ in self.iter_matches(s):
+            return True
+        return False
+
+    def replace(self, s, replacement=None):
+        """
+        Replace each match in a string.
+
+        :param s: the string to change
+        :param replacement: function called with the value of the match to get the replacement string. By default
+            the value itself is used (so values must be strings.)
+        :return: the changed string
+        """
+        pieces = []
+        last = 0
+
+        for start, end, value in self.iter_matches(s):
+            pieces.append(s[last:start])
+            pieces.append(value if replacement is None else replacement(value))
+            last = end
+
+        if not pieces:
+            return s
+
+        pieces.append(s[last:])
+        return ''.join(pieces)
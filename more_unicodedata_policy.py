@@ -0,0 +1,447 @@
+"""
+Compiled safety policies
+
+A SafetyPolicy is an is_safe_string check (level, allowed_chars, plus identifier types to ban) compiled once into
+a verdict table for every code point, so checking a string is one table lookup per character.
+
+An IdentifierAutomaton is an is_safe_identifier level compiled into a small deterministic automaton over character
+classes, so checking an identifier is one table lookup and one transition per character. An IdentifierValidator
+runs one a character at a time, for checking identifiers as they're typed.
+"""
+
+import pickle
+from functools import lru_cache
+
+from repertoire_map import repertoire_map
+from identifier_status_map import identifier_status_map
+from identifier_type_map import identifier_type_map
+
+from more_unicodedata_tables import RangeIndex, CodePointTable, CharSet, _code_points
+from more_unicodedata_bounded import _bounded
+from more_unicodedata_types import Violation, UnicodeIdentifierType
+
+
+SAFETY_LEVELS = ('ascii', 'latin', 'allowed', 'unrestricted')
+
+# identifier types that can be banned (the type flags in identifier_type_map)
+IDENTIFIER_TYPES = UnicodeIdentifierType._fields[3:]
+
+# verdicts in the table. 0 is ok, the others are the index of the reason in _reasons.
+_reasons = (None, 'not_ascii', 'not_latin', 'not_allowed', 'banned_type')
+
+_identifier_type_index = RangeIndex.from_map(identifier_type_map)
+
+
+def _latin_verdict(cp):
+    try:
+        block = repertoire_map[cp][10]
+    except KeyError:
+        return 2
+    return 0 if (block == 'ASCII' or block.startswith('Latin')) else 2
+
+
+def _allowed_verdict(cp):
+    itm = _identifier_type_index.lookup(cp)
+    return 0 if (itm is not None and itm[2] == 1) else 3
+
+
+class SafetyPolicy:
+    """
+    A compiled safety check.
+
+    Checks the same rules as is_safe_string(s, level, allowed_chars), and also rejects characters with any of the
+    banned identifier types (even for the 'unrestricted' level.) Characters in allowed_chars are always allowed.
+
+    The policy is compiled when it is created (this takes a moment, so create policies once and reuse them.)
+    Policies can be pickled, or saved and loaded with save and load, so worker processes can load precompiled
+    policies.
+
+    :param level: the safety level: 'ascii', 'latin', 'allowed' or 'unrestricted' (see is_safe_string)
+    :param allowed_chars: additional allowable characters (any iterable of characters, or a CharSet)
+    :param banned_types: identifier types to reject (names from IDENTIFIER_TYPES, e.g. 'obsolete', 'technical')
+    """
+
+    def __init__(self, level='ascii', allowed_chars=None, banned_types=None):
+        if level not in SAFETY_LEVELS:
+            raise ValueError(f'Unrecognized safety level ({level})')
+
+        banned_types = tuple(banned_types) if banned_types else ()
+        for t in banned_types:
+            if t not in IDENTIFIER_TYPES:
+                raise ValueError(f'Unrecognized identifier type ({t})')
+
+        self.level = level
+        self.allowed_chars = allowed_chars if isinstance(allowed_chars, CharSet) else CharSet(chars=allowed_chars)
+        self.banned_types = banned_types
+        self._table = self._compile()
+
+    def _compile(self):
+        allowed_chars = self.allowed_chars
+        banned_idxs = [UnicodeIdentifierType._fields.index(t) for t in self.banned_types]
+        level = self.level
+
+        def verdict(cp):
+            if cp in allowed_chars:
+                return 0
+
+            if banned_idxs:
+                itm = _identifier_type_index.lookup(cp)
+                if itm is not None and any(itm[i] for i in banned_idxs):
+                    return 4
+
+            if level == 'ascii':
+                return 0 if cp <= 127 else 1
+            elif level == 'latin':
+                return _latin_verdict(cp)
+            elif level == 'allowed':
+                return _allowed_verdict(cp)
+            return 0
+
+        boundaries = set()
+        for first, last in zip(_identifier_type_index.starts, _identifier_type_index.ends):
+            boundaries.update((first, last + 1))
+        if level == 'latin':
+            for k, v in repertoire_map.items():
+                boundaries.update((k, (v[3] if v[3] is not None else k) + 1))
+        for first, last in allowed_chars.ranges:
+            boundaries.update((first, last + 1))
+
+        return CodePointTable.from_function(verdict, boundaries)
+
+    def __repr__(self):
+        return f'SafetyPolicy(level={self.level!r}, allowed_chars={self.allowed_chars or None!r}, ' \
+               f'banned_types={self.banned_types or None!r})'
+
+    @_bounded(2)
+    def iter_violations(self, s):
+        """
+        Generate the characters of a string that aren't allowed by the policy.
+
+        :param s: the string to check
+        :return: generator of Violation (index, code point, reason) for each character that isn't allowed. Reasons
+            are: 'not_ascii', 'not_latin', 'not_allowed' and 'banned_type'.
+        """
+        bmp = self._table.bmp
+        astral = self._table.astral
+
+        for i, cp in enumerate(_code_points(s)):
+            v = bmp[cp] if cp < 0x10000 else astral.lookup(cp, 0)
+            if v:
+                yield Violation(i, cp, _reasons[v])
+
+    @_bounded(2)
+    def first_violation(self, s):
+        """
+        Return the first character of a string that isn't allowed by the policy.
+
+        :param s: the string to check
+        :return: Violation (index, code point, reason) for the first character that isn't allowed, or None if the
+            string passes (see iter_violations)
+        """
+        return next(self.iter_violations(s), None)
+
+    @_bounded(2)
+    def check(self, s):
+        # return True if string s passes the policy
+        if not s:
+            return True
+
+        if max(s) <= '\uffff':  # only BMP characters, so the whole check can run in C
+            return not any(map(self._table.bmp.__getitem__, map(ord, s)))
+
+        return self.first_violation(s) is None
+
+    def check_many(self, strings, max_len=None, deadline=None):
+        # return a list with the result of check for each string in an iterable (ABORTED for a string longer than
+        # max_len, or checked after deadline has passed)
+        check = self.check
+        if max_len is None and deadline is None:
+            return [check(s) for s in strings]
+        return [check(s, max_len=max_len, deadline=deadline) for s in strings]
+
+    def save(self, filename):
+        # save the compiled policy to a file (see load)
+        with open(filename, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(filename):
+        # load a compiled policy saved with save
+        with open(filename, 'rb') as f:
+            policy = pickle.load(f)
+
+        if not isinstance(policy, SafetyPolicy):
+            raise ValueError(f'{filename} does not contain a SafetyPolicy')
+
+        return policy
+
+
+IDENTIFIER_LEVELS = ('ascii', 'programming', 'idmod')
+
+# character classes of the identifier automata
+_NOT_ALLOWED = 0        # not allowed anywhere in the identifier
+_START = 1              # allowed anywhere (e.g. XID_Start)
+_CONTINUE = 2           # allowed after the first character only (e.g. XID_Continue, but not XID_Start)
+
+# reasons for characters of each class that aren't allowed, by level: (first character, later characters)
+_identifier_reasons = {
+    'ascii': ('not_ascii', 'not_ascii'),
+    'programming': ('not_xid_start', 'not_xid_continue'),
+    'idmod': ('not_allowed', 'not_allowed'),
+}
+
+
+@lru_cache(maxsize=None)
+def _identifier_class_table(level):
+    # CodePointTable of the character class of every code point for an identifier level (built on first use)
+    if level == 'ascii':
+        return CodePointTable.from_function(lambda cp: _START if cp <= 127 else _NOT_ALLOWED)
+    elif level == 'programming':
+        # ranges (e.g. CJK ideographs, Hangul syllables) are one map entry, keyed by their first code point
+        repertoire_index = RangeIndex.from_map(repertoire_map, first_idx=2, last_idx=3)
+
+        def xid_class(cp):
+            rmc = repertoire_index.lookup(cp)
+            if rmc is None:
+                return _NOT_ALLOWED
+            return _START if rmc[8] else (_CONTINUE if rmc[9] else _NOT_ALLOWED)
+
+        boundaries = set()
+        for first, last in zip(repertoire_index.starts, repertoire_index.ends):
+            boundaries.update((first, last + 1))
+        return CodePointTable.from_function(xid_class, boundaries)
+    elif level == 'idmod':  # the identifier profile (identifier_status_map Allowed), with no start restriction
+        status_index = RangeIndex.from_map(identifier_status_map)
+        boundaries = set()
+        for first, last in zip(status_index.starts, status_index.ends):
+            boundaries.update((first, last + 1))
+        return CodePointTable.from_function(lambda cp: _START if cp in status_index else _NOT_ALLOWED, boundaries)
+
+    raise ValueError(f'Unsupported level ({level})')
+
+
+class IdentifierAutomaton:
+    """
+    A compiled is_safe_identifier check.
+
+    Each code point is mapped to a character class (not allowed, allowed anywhere, or allowed after the first
+    character only) by a table lookup, and the class moves the automaton between three states: START (nothing read
+    yet), CONTINUE (a valid identifier so far) and REJECT (not an identifier, whatever follows.) For the 'programming'
+    level the classes are XID_Start and XID_Continue, for 'idmod' characters in the identifier profile
+    (identifier_status_map Allowed) are allowed anywhere, and for 'ascii' ascii characters are. Characters in
+    allowed_chars are allowed anywhere.
+
+    The automaton can check whole strings (match), or be run incrementally over the pieces of a string (run, step.)
+
+    :param level: the safety level: 'ascii', 'programming' or 'idmod' (see is_safe_identifier)
+    :param allowed_chars: additional allowable characters (any iterable of characters, or a CharSet)
+    """
+    START = 0
+    CONTINUE = 1
+    REJECT = 2
+
+    # transitions[state * 3 + class] -> next state
+    _transitions = (REJECT, CONTINUE, REJECT,
+                    REJECT, CONTINUE, CONTINUE,
+                    REJECT, REJECT, REJECT)
+
+    __slots__ = ('level', 'allowed_chars', '_bmp', '_astral', '_astral_allowed', '_accept_empty', '_reasons')
+
+    def __init__(self, level='ascii', allowed_chars=None):
+        table = _identifier_class_table(level)
+
+        self.level = level
+        self.allowed_chars = allowed_chars if isinstance(allowed_chars, CharSet) else CharSet(chars=allowed_chars)
+        self._astral = table.astral
+        self._astral_allowed = None
+        self._accept_empty = level != 'programming'
+        self._reasons = _identifier_reasons[level]
+
+        if not self.allowed_chars:
+            self._bmp = table.bmp
+            return
+
+        # overlay allowed_chars on the class table: allowed characters are allowed anywhere
+        bmp = bytearray(table.bmp)
+        for first, last in self.allowed_chars.ranges:
+            if first < 0x10000:
+                last = min(last, 0xffff)
+                bmp[first:last + 1] = bytes([_START]) * (last - first + 1)
+            if last >= 0x10000:
+                self._astral_allowed = self.allowed_chars
+        self._bmp = bytes(bmp)
+
+    def __repr__(self):
+        return f'IdentifierAutomaton(level={self.level!r}, allowed_chars={self.allowed_chars or None!r})'
+
+    def char_class(self, cp):
+        # return the character class of code point cp
+        if cp < 0x10000:
+            return self._bmp[cp]
+        if self._astral_allowed is not None and cp in self._astral_allowed:
+            return _START
+        return self._astral.lookup(cp, _NOT_ALLOWED)
+
+    def step(self, state, cp):
+        # return the state after reading code point cp in state
+        return self._transitions[state * 3 + self.char_class(cp)]
+
+    def run(self, s, state=START):
+        """
+        Run the automaton over a string (or iterable of code points), starting from a state.
+
+        Use this to check a string in pieces: pass the state returned for each piece to the next.
+
+        :param s: the string (or iterable of code points) to read
+        :param state: the state to start in (START for the beginning of an identifier)
+        :return: the state after reading s
+        """
+        transitions, bmp, char_class, reject = self._transitions, self._bmp, self.char_class, self.REJECT
+
+        for cp in (_code_points(s) if isinstance(s, str) else s):
+            state = transitions[state * 3 + (bmp[cp] if cp < 0x10000 else char_class(cp))]
+            if state == reject:
+                break
+
+        return state
+
+    def accepts(self, state):
+        # return True if the characters read to get to state are a valid identifier
+        return state == self.CONTINUE or (state == self.START and self._accept_empty)
+
+    def match(self, s):
+        """
+        Return True if a string is a valid identifier for the automaton's level.
+
+        After the first character the only rejecting transition is a character that isn't allowed anywhere, so
+        strings with only BMP characters are checked with a C level lookup of the rest of the characters.
+
+        :param s: the string to check
+        :return: True if the string is valid, False otherwise
+        """
+        if not s:
+            return self._accept_empty
+
+        if self.char_class(ord(s[0])) != _START:
+            return False
+
+        if max(s) <= '\uffff':
+            return all(map(self._bmp.__getitem__, map(ord, s)))
+
+        return self.run(s, self.CONTINUE) == self.CONTINUE
+
+    def violation_reason(self, cp, first=False):
+        """
+        Return the reason a code point isn't allowed in an identifier.
+
+        :param cp: the code point
+        :param first: True if it's the first character of the identifier
+        :return: None if the code point is allowed, otherwise the reason: 'not_ascii', 'not_xid_start',
+            'not_xid_continue' or 'not_allowed'
+        """
+        cls = self.char_class(cp)
+        if cls == _START or (cls == _CONTINUE and not first):
+            return None
+        return self._reasons[0] if first else self._reasons[1]
+
+
+class IdentifierValidator:
+    """
+    Incremental is_safe_identifier check, for validating as an identifier is typed.
+
+    The validator keeps the automaton state after each character, so appending a character is a single transition,
+    and backspacing just drops the last state. Other edits (see update) only rerun the automaton from the first
+    changed character.
+
+    :param level: the safety level: 'ascii', 'programming' or 'idmod' (see is_safe_identifier)
+    :param allowed_chars: additional allowable characters (any iterable of characters, or a CharSet)
+    :param text: initial text
+    """
+    __slots__ = ('automaton', '_chars', '_states', '_first_reject')
+
+    def __init__(self, level='ascii', allowed_chars=None, text=''):
+        self.automaton = IdentifierAutomaton(level, allowed_chars)
+        self._chars = []
+        self._states = []
+        self._first_reject = None   # index of the character that moved the automaton to REJECT
+        self.append(text)
+
+    def __repr__(self):
+        return f'IdentifierValidator(level={self.automaton.level!r}, text={self.text!r}, valid={self.is_valid})'
+
+    def __len__(self):
+        return len(self._chars)
+
+    @property
+    def text(self):
+        # the current text
+        return ''.join(self._chars)
+
+    @property
+    def state(self):
+        # the automaton state after the current text
+        return self._states[-1] if self._states else IdentifierAutomaton.START
+
+    @property
+    def is_valid(self):
+        # True if the current text is a valid identifier
+        return self.automaton.accepts(self.state)
+
+    def append(self, s):
+        # append a character (or string) to the text
+        step, state = self.automaton.step, self.state
+
+        for c, cp in zip(s, _code_points(s)):
+            state = step(state, cp)
+            if state == IdentifierAutomaton.REJECT and self._first_reject is None:
+                self._first_reject = len(self._chars)
+            self._chars.append(c)
+            self._states.append(state)
+
+    def backspace(self, n=1):
+        # remove the last n characters of the text
+        n = min(n, len(self._chars))
+        if n <= 0:
+            return
+
+        del self._chars[-n:]
+        del self._states[-n:]
+
+        if self._first_reject is not None and self._first_reject >= len(self._chars):
+            self._first_reject = None
+
+    def clear(self):
+        # remove all of the text
+        self.backspace(len(self._chars))
+
+    def update(self, text):
+        """
+        Set the text, keeping the states for the prefix it shares with the current text.
+
+        Use this when an edit isn't at the end (e.g. an insert or a paste): only the characters after the first
+        change are checked.
+
+        :param text: the new text
+        """
+        common = 0
+        for old, new in zip(self._chars, text):
+            if old != new:
+                break
+            common += 1
+
+        self.backspace(len(self._chars) - common)
+        self.append(text[common:])
+
+    def first_violation(self):
+        """
+        Return the character that made the text invalid.
+
+        :return: Violation (index, code point, reason) for the first character that isn't allowed where it is, or
+            None if there isn't one (the text is valid, or is empty)
+        """
+        i = self._first_reject
+        if i is None:
+            return None
+
+        cp = ord(self._chars[i])
+        return Violation(i, cp, self.automaton.violation_reason(cp, i == 0))
@@ -0,0 +1,332 @@
+"""
+Lookup tables for more_unicodedata
+
+Compiled (read-only) forms of the map files, built once at import time so per-character lookups don't rebuild
+key tuples or walk dictionaries.
+"""
+
+import struct
+import sys
+from bisect import bisect_right
+from itertools import chain
+
+from block_map import block_map
+from identifier_type_map import identifier_type_map
+
+from more_unicodedata_types import UnicodeIdentifierType
+
+
+# routines for iterating over code points
+
+# UTF-32 in the native byte order, and the memoryview format for its (4 byte) code units
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+_UTF32_FORMAT = 'I' if struct.calcsize('I') == 4 else 'L'
+
+
+def _code_points(s):
+    """
+    Return the code points of a string as a sequence of ints, so loops over a string don't call ord for every
+    character.
+
+    Ascii strings are encoded to bytes (which iterate as ints.) Other strings are encoded to UTF-32 and viewed as 32
+    bit ints, so the encoding is the only copy (lone surrogates are kept with surrogatepass.) Strings checking a
+    deadline (see more_unicodedata_bounded._bounded) are iterated with ord, so the deadline is still checked.
+
+    :param s: the string
+    :return: sequence (or iterable, for deadline strings) of the code points in the string
+    """
+    if type(s) is not str:
+        return map(ord, s)
+    if s.isascii():
+        return s.encode('ascii')
+    return memoryview(s.encode(_UTF32, 'surrogatepass')).cast(_UTF32_FORMAT)
+
+
+class RangeIndex:
+    """
+    Bisectable index over code point ranges.
+
+    Lookups are O(log n) in the number of ranges. Ranges must not overlap.
+
+    :param ranges: iterable of (first code point, last code point, value) tuples. last may be None for a range of a
+        single code point (as in the map files.)
+    """
+    __slots__ = ('starts', 'ends', 'values')
+
+    def __init__(self, ranges):
+        ranges = sorted(ranges, key=lambda r: r[0])
+        self.starts = [r[0] for r in ranges]
+        self.ends = [r[0] if r[1] is None else r[1] for r in ranges]
+        self.values = [r[2] for r in ranges]
+
+    @classmethod
+    def from_map(cls, range_map, first_idx=0, last_idx=1):
+        """
+        Create an index over one of the range maps (e.g. identifier_status_map or script_map.)
+
+        :param range_map: the map, where each entry has the first and last code point of its range
+        :param first_idx: the index of the first code point in the map entries
+        :param last_idx: the index of the last code point in the map entries
+        :return: RangeIndex where the values are the map entries
+        """
+        return cls((v[first_idx], v[last_idx], v) for v in range_map.values())
+
+    def __len__(self):
+        return len(self.starts)
+
+    def lookup(self, cp, default=None):
+        # return the value for the range holding code point cp (default if cp isn't in a range)
+        i = bisect_right(self.starts, cp) - 1
+        if i >= 0 and cp <= self.ends[i]:
+            return self.values[i]
+        return default
+
+    def __contains__(self, cp):
+        i = bisect_right(self.starts, cp) - 1
+        return i >= 0 and cp <= self.ends[i]
+
+
+class CodePointTable:
+    """
+    Table with a small int value (0-255) for every code point.
+
+    The BMP is a 64K bytes table (one index per lookup). The other planes are sparsely used, so they are stored as
+    ranges in a RangeIndex.
+
+    :param bmp: bytes of length 0x10000 with the values for the BMP
+    :param astral: RangeIndex of the values for code points above the BMP
+    """
+    __slots__ = ('bmp', 'astral')
+
+    def __init__(self, bmp, astral):
+        if len(bmp) != 0x10000:
+            raise ValueError(f'BMP table must have 0x10000 entries ({len(bmp)})')
+
+        self.bmp = bytes(bmp)
+        self.astral = astral
+
+    @classmethod
+    def from_function(cls, func, boundaries=()):
+        """
+        Compile a table from a function of code points.
+
+        func is called for every BMP code point, but only at the boundaries above the BMP: it has to be constant
+        between consecutive boundaries there (e.g. use the first code points and last code points + 1 of the ranges
+        of the maps func uses.)
+
+        :param func: function from code point to an int in 0-255
+        :param boundaries: iterable of code points where the value of func may change
+        :return: CodePointTable
+        """
+        bmp = bytes(func(cp) for cp in range(0x10000))
+        points = sorted({b for b in boundaries if 0x10000 < b <= 0x10FFFF} | {0x10000})
+        ranges = []
+
+        for first, nxt in zip(points, points[1:] + [0x110000]):
+            value = func(first)
+            if ranges and ranges[-1][2] == value:
+                ranges[-1] = (ranges[-1][0], nxt - 1, value)
+            else:
+                ranges.append((first, nxt - 1, value))
+
+        return cls(bmp, RangeIndex(ranges))
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """
+        Compile a table from code point ranges (e.g. the entries of one of the range maps.) Code points not in a range
+        have the value 0.
+
+        :param ranges: iterable of (first code point, last code point, value) tuples
+        :return: CodePointTable
+        """
+        bmp = bytearray(0x10000)
+        astral = []
+
+        for first, last, value in ranges:
+            if first < 0x10000:
+                end = min(last, 0xffff) + 1
+                bmp[first:end] = bytes((value,)) * (end - first)
+            if last >= 0x10000:
+                astral.append((max(first, 0x10000), last, value))
+
+        return cls(bmp, RangeIndex(astral))
+
+    def __getitem__(self, cp):
+        if cp < 0x10000:
+            return self.bmp[cp]
+        return self.astral.lookup(cp, 0)
+
+
+def _merge_ranges(ranges):
+    # sort (first, last) ranges and merge the ones that overlap or touch
+    merged = []
+
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1][1] = last
+        else:
+            merged.append([first, last])
+
+    return merged
+
+
+class CharSet:
+    """
+    Immutable set of characters, stored as sorted, non-overlapping code point ranges.
+
+    Membership is O(1) for ascii and O(log n) in the number of ranges otherwise, so a CharSet can be used as the
+    allowed_chars of any of the checks in place of a list. Sets can be combined with | (union), & (intersection) and
+    - (difference), which work on the ranges directly.
+
+    Membership can be tested with a character or a code point.
+
+    :param chars: iterable of characters (e.g. a string)
+    :param ranges: iterable of inclusive (first, last) pairs of code points or characters
+    :param blocks: iterable of block names (keys of block_map, e.g. 'Latin-1 Supplement')
+    :param identifier_types: iterable of identifier types (e.g. 'recommended'). Characters with any of the types
+        in identifier_type_map are included.
+    """
+    __slots__ = ('_starts', '_ends', '_ascii')
+
+    def __init__(self, chars=None, ranges=None, blocks=None, identifier_types=None):
+        all_ranges = []
+
+        if chars:
+            all_ranges.extend((ord(c), ord(c)) for c in chars)
+
+        if ranges:
+            for first, last in ranges:
+                first = ord(first) if isinstance(first, str) else first
+                last = ord(last) if isinstance(last, str) else last
+                if first > last:
+                    raise ValueError(f'range first is after last ({first:#x}, {last:#x})')
+                all_ranges.append((first, last))
+
+        if blocks:
+            for name in blocks:
+                all_ranges.append(block_map[name])
+
+        if identifier_types:
+            idxs = []
+            for t in identifier_types:
+                if t not in UnicodeIdentifierType._fields[2:]:
+                    raise ValueError(f'Unrecognized identifier type ({t})')
+                idxs.append(UnicodeIdentifierType._fields.index(t))
+
+            for v in identifier_type_map.values():
+                if any(v[i] for i in idxs):
+                    all_ranges.append((v[0], v[0] if v[1] is None else v[1]))
+
+        self._set_ranges(_merge_ranges(all_ranges))
+
+    def _set_ranges(self, ranges):
+        self._starts = tuple(r[0] for r in ranges)
+        self._ends = tuple(r[1] for r in ranges)
+
+        ascii_mask = 0
+        for first, last in ranges:
+            if first > 127:
+                break
+            ascii_mask |= ((1 << (min(last, 127) + 1)) - 1) ^ ((1 << first) - 1)
+        self._ascii = ascii_mask
+
+    @classmethod
+    def _from_ranges(cls, ranges):
+        cs = cls.__new__(cls)
+        cs._set_ranges(ranges)
+        return cs
+
+    @property
+    def ranges(self):
+        # tuple of the (first, last) code point ranges in the set
+        return tuple(zip(self._starts, self._ends))
+
+    def __contains__(self, c):
+        if isinstance(c, str):
+            if len(c) != 1:
+                return False
+            c = ord(c)
+
+        if c < 128:
+            return bool(self._ascii >> c & 1)
+
+        i = bisect_right(self._starts, c) - 1
+        return i >= 0 and c <= self._ends[i]
+
+    def __len__(self):
+        return sum(last - first + 1 for first, last in zip(self._starts, self._ends))
+
+    def __bool__(self):
+        return bool(self._starts)
+
+    def __iter__(self):
+        return (chr(cp) for first, last in zip(self._starts, self._ends) for cp in range(first, last + 1))
+
+    def __eq__(self, other):
+        if not isinstance(other, CharSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self):
+        return hash((self._starts, self._ends))
+
+    def __repr__(self):
+        return f'CharSet(ranges={[(f"{first:#06x}", f"{last:#06x}") for first, last in self.ranges]})'
+
+    def __reduce__(self):
+        return CharSet, (None, self.ranges)
+
+    def __or__(self, other):
+        if not isinstance(other, CharSet):
+            return NotImplemented
+        return CharSet._from_ranges(_merge_ranges(chain(self.ranges, other.ranges)))
+
+    def __and__(self, other):
+        if not isinstance(other, CharSet):
+            return NotImplemented
+
+        result = []
+        a, b = self.ranges, other.ranges
+        i = j = 0
+
+        while i < len(a) and j < len(b):
+            first = max(a[i][0], b[j][0])
+            last = min(a[i][1], b[j][1])
+            if first <= last:
+                result.append((first, last))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        return CharSet._from_ranges(result)
+
+    def __sub__(self, other):
+        if not isinstance(other, CharSet):
+            return NotImplemented
+
+        result = []
+        b = other.ranges
+        j = 0
+
+        for first, last in self.ranges:
+            while j < len(b) and b[j][1] < first:
+                j += 1
+
+            k = j
+            while k < len(b) and b[k][0] <= last:
+                if b[k][0] > first:
+                    result.append((first, b[k][0] - 1))
+                first = max(first, b[k][1] + 1)
+                k += 1
+
+            if first <= last:
+                result.append((first, last))
+
+        return CharSet._from_ranges(result)
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
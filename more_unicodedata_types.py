@@ -1,25 +1,56 @@
-"""
-Type definitions for more_unicode data
-
-Len Wanger, 2019
-"""
-
-from collections import namedtuple
-
-# Used for repertoire characters
-UnicodeChar = namedtuple('UnicodeChar', 'name is_range code_point last_code_point alpha math non_char deprecated xid_start xid_continue block')
-
-# used for: reserved, surrogate, and noncharacter.
-UnicodeReserved = namedtuple('UnicodeReserved', 'name type first_code_point last_code_point alpha math non_char deprecated xid_start xid_continue block')
-
-# used for UCD blocks
-UnicodeBlock = namedtuple('UnicodeBlock', 'name first_code_point last_code_point')
-
-# used for IdentifierStatus
-UnicodeIdentifierStatus = namedtuple('IidentifierStatus', 'first_code_point last_code_point status')
-
-# used for IdentifierType
-# UnicodeIdentifierType = namedtuple('IidentifierType', 'first_code_point last_code_point types')
-it_fields = 'first_code_point last_code_point allowed deprecated technical obsolete inclusion exclusion limited_use ' \
-            'uncommon_use not_NFKC not_XID recommended default_Ignorable'
-UnicodeIdentifierType = namedtuple('IidentifierType', it_fields)
+"""
+Type definitions for more_unicode data
+
+Len Wanger, 2019
+"""
+
+from collections import namedtuple
+
+# Used for repertoire characters. The fields after block are read by the parser for the other maps (e.g. script_map),
+# and aren't written to the repertoire map.
+UnicodeChar = namedtuple('UnicodeChar', 'name is_range code_point last_code_point alpha math non_char deprecated xid_start xid_continue block '
+                                        'script script_extensions bidi_class grapheme_cluster_break',
+                          defaults=(None, None, None, None))
+
+# used for: reserved, surrogate, and noncharacter.
+UnicodeReserved = namedtuple('UnicodeReserved', 'name type first_code_point last_code_point alpha math non_char deprecated xid_start xid_continue block '
+                                                'bidi_class grapheme_cluster_break', defaults=(None, None))
+
+# used for UCD blocks
+UnicodeBlock = namedtuple('UnicodeBlock', 'name first_code_point last_code_point')
+
+# used for IdentifierStatus
+UnicodeIdentifierStatus = namedtuple('IidentifierStatus', 'first_code_point last_code_point status')
+
+# used for IdentifierType
+# UnicodeIdentifierType = namedtuple('IidentifierType', 'first_code_point last_code_point types')
+it_fields = 'first_code_point last_code_point allowed deprecated technical obsolete inclusion exclusion limited_use ' \
+            'uncommon_use not_NFKC not_XID recommended default_Ignorable'
+UnicodeIdentifierType = namedtuple('IidentifierType', it_fields)
+
+# used for violations found by the safety checks: index - index of the character in the string, code_point - the
+# code point of the character, reason - the reason the character isn't allowed (e.g. 'not_ascii')
+Violation = namedtuple('Violation', 'index code_point reason')
+
+# used for the single pass security report of a string (see analyze)
+SecurityReport = namedtuple('SecurityReport', 'length confusable_positions blocks block_mask reserved_positions '
+                                              'surrogate_positions noncharacter_positions identifier_types_or '
+                                              'identifier_types_and safety_level')
+
+# used for the findings of a DocumentChecker: offset - offset of the character in the document, code_point - the code
+# point of the character, kind - 'intentional' (intentionally confusing character), or the reserved type ('reserved',
+# 'surrogate' or 'noncharacter'), detail - the mimicked character for 'intentional' (otherwise None)
+DocumentFinding = namedtuple('DocumentFinding', 'offset code_point kind detail')
+
+# used for the changes to the findings from an edit of a DocumentChecker: removed - findings removed (old offsets),
+# added - new findings (new offsets), shift_from - old offset where the unchanged findings after the edit start,
+# delta - the change in length of the document (add to the offsets of the findings at or after shift_from)
+DocumentEdit = namedtuple('DocumentEdit', 'removed added shift_from delta')
+
+# used for the findings of the command line checks: path - the file, line and column - where the finding is (1 based
+# line, 0 based column), text - the identifier (or other text) found, reason - the problem (e.g. 'not_idmod'),
+# detail - more about the problem (e.g. the identifier it's confusable with)
+LintFinding = namedtuple('LintFinding', 'path line column text reason detail')
+
+# used for the bidi class counts of a string (see direction_profile)
+DirectionProfile = namedtuple('DirectionProfile', 'length counts ltr rtl direction')
@@ -0,0 +1,163 @@
+"""
+UTF-8 decoding
+
+A table driven UTF-8 decoder (a DFA, in the style of Bjoern Hoehrmann's decoder, see:
+http://bjoern.hoehrmann.de/utf-8/decoder/dfa/) for checking strings that arrive as bytes without decoding them to str
+first. Unlike the utf-8 codec, the decoder reports where the ill-formed sequences are and why they're ill-formed.
+"""
+
+# byte classes
+_ASCII = 0          # 00..7F
+_CONT_LOW = 1       # 80..8F
+_CONT_MID = 2       # 90..9F
+_CONT_HIGH = 3      # A0..BF
+_C0_C1 = 4          # C0..C1 (leads that can only make overlong forms)
+_LEAD2 = 5          # C2..DF
+_E0 = 6             # E0
+_LEAD3 = 7          # E1..EC, EE..EF
+_ED = 8             # ED
+_F0 = 9             # F0
+_LEAD4 = 10         # F1..F3
+_F4 = 11            # F4
+_INVALID = 12       # F5..FF
+_N_CLASSES = 13
+
+# states. The error states are the reasons reported for ill-formed sequences.
+_ACCEPT = 0
+_ILL_FORMED = 1
+_OVERLONG = 2
+_SURROGATE = 3
+_NEED1 = 4          # need one more continuation byte
+_NEED2 = 5
+_NEED3 = 6
+_AFTER_E0 = 7       # E0 must be followed by A0..BF (80..9F would be overlong)
+_AFTER_ED = 8       # ED must be followed by 80..9F (A0..BF would be a surrogate)
+_AFTER_F0 = 9       # F0 must be followed by 90..BF (80..8F would be overlong)
+_AFTER_F4 = 10      # F4 must be followed by 80..8F (90..BF would be above 10FFFF)
+_N_STATES = 11
+
+ERRORS = (None, 'ill_formed', 'overlong', 'surrogate')
+
+
+def _make_classes():
+    classes = bytearray(256)
+
+    for first, last, cls in ((0x00, 0x7f, _ASCII), (0x80, 0x8f, _CONT_LOW), (0x90, 0x9f, _CONT_MID),
+                             (0xa0, 0xbf, _CONT_HIGH), (0xc0, 0xc1, _C0_C1), (0xc2, 0xdf, _LEAD2), (0xe0, 0xe0, _E0),
+                             (0xe1, 0xef, _LEAD3), (0xed, 0xed, _ED), (0xf0, 0xf0, _F0), (0xf1, 0xf3, _LEAD4),
+                             (0xf4, 0xf4, _F4), (0xf5, 0xff, _INVALID)):
+        for b in range(first, last + 1):
+            classes[b] = cls
+
+    return bytes(classes)
+
+
+def _make_transitions():
+    # transitions[state * _N_CLASSES + class] -> next state. Anything not set is ill-formed.
+    transitions = bytearray([_ILL_FORMED] * (_N_STATES * _N_CLASSES))
+
+    def set_transitions(state, classes, next_state):
+        for cls in classes:
+            transitions[state * _N_CLASSES + cls] = next_state
+
+    cont = (_CONT_LOW, _CONT_MID, _CONT_HIGH)
+
+    set_transitions(_ACCEPT, (_ASCII,), _ACCEPT)
+    set_transitions(_ACCEPT, (_C0_C1,), _OVERLONG)
+    set_transitions(_ACCEPT, (_LEAD2,), _NEED1)
+    set_transitions(_ACCEPT, (_E0,), _AFTER_E0)
+    set_transitions(_ACCEPT, (_LEAD3,), _NEED2)
+    set_transitions(_ACCEPT, (_ED,), _AFTER_ED)
+    set_transitions(_ACCEPT, (_F0,), _AFTER_F0)
+    set_transitions(_ACCEPT, (_LEAD4,), _NEED3)
+    set_transitions(_ACCEPT, (_F4,), _AFTER_F4)
+
+    set_transitions(_NEED1, cont, _ACCEPT)
+    set_transitions(_NEED2, cont, _NEED1)
+    set_transitions(_NEED3, cont, _NEED2)
+
+    set_transitions(_AFTER_E0, (_CONT_LOW, _CONT_MID), _OVERLONG)
+    set_transitions(_AFTER_E0, (_CONT_HIGH,), _NEED1)
+    set_transitions(_AFTER_ED, (_CONT_LOW, _CONT_MID), _NEED1)
+    set_transitions(_AFTER_ED, (_CONT_HIGH,), _SURROGATE)
+    set_transitions(_AFTER_F0, (_CONT_LOW,), _OVERLONG)
+    set_transitions(_AFTER_F0, (_CONT_MID, _CONT_HIGH), _NEED2)
+    set_transitions(_AFTER_F4, (_CONT_LOW,), _NEED2)
+
+    return bytes(transitions)
+
+
+_classes = _make_classes()
+_transitions = _make_transitions()
+
+# payload bits of a lead byte, by class
+_lead_masks = bytes((0x7f, 0, 0, 0, 0x1f, 0x1f, 0x0f, 0x0f, 0x0f, 0x07, 0x07, 0x07, 0))
+
+
+def iter_utf8(data):
+    """
+    Decode UTF-8 bytes one code point at a time.
+
+    Ill-formed sequences are reported (with the offset of the byte they start at) and decoding continues with the
+    next byte that can start a character, so one bad sequence is reported once.
+
+    :param data: bytes, bytearray or memoryview to decode
+    :return: generator of (byte offset, code point, error) tuples. error is None for a code point, otherwise code
+        point is None and error is the reason the sequence is ill-formed: 'ill_formed' (including a sequence cut off
+        by the end of the data), 'overlong' or 'surrogate'.
+    """
+    if isinstance(data, memoryview):
+        data = data.cast('B')
+    elif isinstance(data, (bytes, bytearray)) and data.isascii():
+        for i, b in enumerate(data):
+            yield i, b, None
+        return
+
+    classes, transitions, lead_masks = _classes, _transitions, _lead_masks
+    n = len(data)
+    state = _ACCEPT
+    start = cp = i = 0
+
+    while i < n:
+        b = data[i]
+
+        if b < 0x80 and state == _ACCEPT:
+            yield i, b, None
+            i += 1
+            continue
+
+        cls = classes[b]
+        if state == _ACCEPT:
+            start = i
+            cp = b & lead_masks[cls]
+        else:
+            cp = (cp << 6) | (b & 0x3f)
+
+        state = transitions[state * _N_CLASSES + cls]
+
+        if state == _ACCEPT:
+            yield start, cp, None
+        elif state < _NEED1:
+            yield start, None, ERRORS[state]
+            state = _ACCEPT
+
+            if i != start and not (0x80 <= b < 0xc0):
+                continue  # b interrupted the sequence, so it may start the next one
+
+            # skip the rest of the bad sequence (continuation bytes can't start a character)
+            i += 1
+            while i < n and 0x80 <= data[i] < 0xc0:
+                i += 1
+            continue
+
+        i += 1
+
+    if state != _ACCEPT:
+        yield start, None, 'ill_formed'
+
+
+def is_valid_utf8(data):
+    # return True if data (bytes, bytearray or memoryview) is well-formed UTF-8
+    if isinstance(data, (bytes, bytearray)) and data.isascii():
+        return True
+    return all(error is None for _, _, error in iter_utf8(data))
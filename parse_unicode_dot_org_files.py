@@ -1,461 +1,872 @@
-"""
-Read Unicode.org data files and create python importable data  from them
-
-files read:
-
-    - intention.txt - intentionally confusiong characters
-
-TODO
-    - test...
-    - parse other unicode.org files...
-    - add emoji to repertoire map and emoji_map.... read @missing?
-        https://www.unicode.org/reports/tr51/index.html / https://www.unicode.org/Public/emoji/11.0/
-        - presentation_modifier? (variation sequences - emoji followed by presentation selector or text presentation selector)
-        - Emoji properties (Annex A: https://www.unicode.org/reports/tr51/index.html#Identification)emoji, emoji_presentation, enoji-modifier, emoji-modifier-base, emohi-component, extended_pictograph
-        - text-default, emoji-default
-        - CLDR - Unicode Common Locale Data Repository (http://cldr.unicode.org/). Emoji ordering chart?
-    - continue on TR39 - block restricted characters - look at IdeentifierType (NOT_XID and XID_RESTRICTED, Limited_Use, Technical, Obsolete, etc.?)
-    - identify confusables (confusable detection)
-    - rate string for spoofing level (ascii only, one script, unrestricted, etc.)
-
-    - write tests - identifiers, danger levels, etc.
-
-"""
-
-from pathlib import Path
-import sys
-from typing import Dict
-from xml.etree import ElementTree as ET
-
-from more_unicodedata_types import UnicodeChar
-from more_unicodedata_types import UnicodeReserved
-from more_unicodedata_types import UnicodeBlock
-from more_unicodedata_types import UnicodeIdentifierStatus
-from more_unicodedata_types import UnicodeIdentifierType
-
-
-def make_intentional_map() -> Dict:
-    # create the dictionary for the intention map -- reading from intentional.txt
-    filename = Path('./import/intentional.txt').resolve()
-    char_map = {}
-
-    with open(filename, 'r', encoding='utf8') as f:
-        _ = f.readline()          # burn first line
-
-        for l in f:
-            if l[0] in {'#', '\n'}: # comment or blank line
-                continue
-
-            # parse the line - for example - 0021; 01 C3  # * ( ! ~ Çƒ ) EXCLAMATION MARK ~ LATIN LETTER RETROFLEX CLICK
-            semicolon_idx = l.find(';')
-            code_point = l[0:semicolon_idx].strip()
-            fields = l[semicolon_idx+1:]
-
-            ampersand_idx = fields.find('#')
-            close_paren_idx = fields.find(')')
-            tilde_idx = fields.rfind('~')
-            key_char = fields[0:ampersand_idx].strip()
-            key_char_comment = fields[tilde_idx + 1:].strip()
-            intended_char_comment = fields[close_paren_idx + 1:tilde_idx].strip()
-
-            chr_char = chr(int('0x'+key_char, 0))
-            chr_intended_char = chr(int('0x' + code_point, 0))
-            char_map[chr_char] = (chr_intended_char, key_char_comment, intended_char_comment)
-
-    return char_map
-
-
-def write_intentional_map_file(intentional_map, f):
-    # write intentional map to a file
-    f.write('# dictionary to map unicode characters to canonical characters\n')
-    f.write('# entries are tuples of -- key: code_point, name1, name2\n')
-    f.write('# where: key - code point of the confusing char, code_point - code point of the character that it confuses,\n')
-    f.write('#    name1 - the name of the confusing char, name2 - the name of the char that it confuses\n')
-    f.write('#\n')
-    f.write('# This dictionary can be used to reduce confusion by mapping to the canonical (non-confusing) letter\n')
-    f.write('intentional_map = {\n')
-    for k,v in intentional_map.items():
-        f.write(f'    0x{ord(k):04x}: ( 0x{ord(v[0]):04X}, "{v[1]}", "{v[2]}" ),\n')
-    f.write('}\n')
-
-
-def make_unicode_char(node):
-    a = node.attrib
-    if 'first-cp' in a:
-        uc = UnicodeChar(name=a['na'], is_range=True, code_point=a['first-cp'], last_code_point=a['last-cp'], block=a['blk'], alpha=a['Alpha'],
-                         math=a['Math'], non_char=a['NChar'], deprecated=a['Dep'], xid_start=a['XIDS'], xid_continue=a['XIDC'])
-    else:
-        uc = UnicodeChar(name=a['na'], is_range=False, code_point=a['cp'], last_code_point=None, block=a['blk'],
-                         alpha=a['Alpha'], math=a['Math'], non_char=a['NChar'], deprecated=a['Dep'],
-                         xid_start=a['XIDS'],xid_continue=a['XIDC'])
-    return uc
-
-
-def make_unicode_reserved(tag_type, node):
-    a = node.attrib
-
-    if 'first-cp' in a:
-        fcp, lcp = a['first-cp'], a['last-cp']
-    else:
-        fcp, lcp = a['cp'], a['cp']
-
-    ur = UnicodeReserved(name=a['na'], type=tag_type, first_code_point=fcp, last_code_point=lcp, block=a['blk'],
-                         alpha=a['Alpha'], math=a['Math'], non_char=a['NChar'], deprecated=a['Dep'],
-                         xid_start=a['XIDS'],xid_continue=a['XIDC'])
-    return ur
-
-
-def make_unicode_block(node):
-    a = node.attrib
-    ub = UnicodeBlock(name=a['name'], first_code_point=a['first-cp'], last_code_point=a['last-cp'])
-    return ub
-
-
-def make_ucd_map():
-    """
-    read in UCD data (nonunihan version). Create repertoire and block maps.
-
-    UCD data is in XML. The childrn are as follows:
-
-        children[0].tag is 'repertoire' [chars]
-        children[1].tag is 'blocks'
-        children[2].tag is 'named-sequences'
-        children[3].tag is 'named-sequence'
-        children[4].tag is 'normalization-corrections'
-        children[5].tag is '}standardized-variants'
-        children[6].tag is 'cjk-radicals'
-        children[7].tag is 'emoji-sources'
-
-    Note: currently just the repertroire (characters with attributes) and blocks are read in.
-
-    Note: for the repertoire (chars) a subset of the attributes are kept. The full set (as of V11.0) is:
-
-    Repertoire chars: ['cp', 'age', 'na', 'JSN', 'gc', 'ccc', 'dt', 'dm', 'nt', 'nv', 'bc', 'bpt', 'bpb',
-            'Bidi_M', 'bmg', 'suc', 'slc', 'stc', 'uc', 'lc', 'tc', 'scf', 'cf', 'jt', 'jg', 'ea', 'lb', 'sc', 'scx',
-            'Dash', 'WSpace', 'Hyphen', 'QMark', 'Radical', 'Ideo', 'UIdeo', 'IDSB', 'IDST', 'hst', 'DI', 'ODI',
-            'Alpha', 'OAlpha', 'Upper', 'OUpper', 'Lower', 'OLower', 'Math', 'OMath', 'Hex', 'AHex', 'NChar', 'VS',
-            'Bidi_C', 'Join_C', 'Gr_Base', 'Gr_Ext', 'OGr_Ext', 'Gr_Link', 'STerm', 'Ext', 'Term', 'Dia', 'Dep',
-            'IDS', 'OIDS', 'XIDS', 'IDC', 'OIDC', 'XIDC', 'SD', 'LOE', 'Pat_WS', 'Pat_Syn', 'GCB', 'WB', 'SB', 'CE',
-            'Comp_Ex', 'NFC_QC', 'NFD_QC', 'NFKC_QC', 'NFKD_QC', 'XO_NFC', 'XO_NFD', 'XO_NFKC', 'XO_NFKD', 'FC_NFKC',
-            'CI', 'Cased', 'CWCF', 'CWCM', 'CWKCF', 'CWL', 'CWT', 'CWU', 'NFKC_CF', 'InSC', 'InPC', 'PCM', 'vo', 'RI',
-            'blk', 'isc', 'na1'])
-
-
-    Blocks: first-cp, last-cp, name - e.g. 0000-007F, 'Basic Latin'
-
-    Named-sequences: name, cps - e.g. 'ARABIC SEQUENCE NOON WITH KEHEH; ;0646 06A9'
-
-    Standardized variants: cps desc when - e.g. '0030 FE00' 'short diagonal stroke form' ''
-
-    Standardized variant: number radical ideograph
-
-    Emoji sources [use emoji-data.txt instead]: unicode docomo kddi softbank - e.g. '0023 20E3' 'F985' 'F489' 'F7B0'
-        emoji-test.txt has subgroups of emojis
-        emoji-sequences has categories
-
-
-    :return: repertroire, reserved ranges and block map (dicts)
-    """
-    # FILENAME = 'xml/ucd.nounihan.flat.xml'
-    filename = Path('./import/xml/ucd.nounihan.flat.xml').resolve()
-
-
-    try:
-        dom = ET.parse(open(filename, "r"))
-        root = dom.getroot()
-    except:
-        print("Unable to open and parse input definition file: " + filename)
-        sys.exit(1)
-
-    unicode_chars = {}
-    unicode_reserved = {}
-    unicode_blocks = {}
-
-    for node in root[1]:
-        tag_type = node.tag.split('}')[1]
-
-        if tag_type == 'char':
-            uc = make_unicode_char(node)
-            unicode_chars[uc.code_point] = uc
-        elif tag_type in {'reserved', 'surrogate', 'noncharacter'} :
-            ur = make_unicode_reserved(tag_type, node)
-            unicode_reserved[ur.first_code_point] = ur
-        else:
-            print(f'unknown type={tag_type}')
-
-    for node in root[2]:
-        ub = make_unicode_block(node)
-        unicode_blocks[node.attrib['name']] = ub
-
-    return unicode_chars, unicode_reserved, unicode_blocks
-
-
-def write_unicode_char(k, v, f):
-    # v is a UnicodeChar = namedtuple('UnicodeChar', 'name is_range code_point last_code_point alpha math non_char deprecated xid_start xid_continue block')
-    alpha = 1 if v.alpha == 'Y' else 0
-    math = 1 if v.math == 'Y' else 0
-    non_char = 1 if v.non_char == 'Y' else 0
-    deprecated = 1 if v.deprecated == 'Y' else 0
-    xid_start = 1 if v.xid_start == 'Y' else 0
-    xid_continue = 1 if v.xid_continue == 'Y' else 0
-    last = 'None' if v.last_code_point is None else f'0x{v.last_code_point}'
-
-    # f.write(f' 0x{k}: {{ ')
-    # f.write(f' "n": "{v.name}", "r": {v.is_range}, "c": 0x{v.code_point}, ')
-    # f.write(f'"l": {last}, "a": {alpha}, "m": {math}, "nc": {non_char}, ')
-    # f.write(f'"d":{deprecated}, "xs": {xid_start}, "xc": {xid_continue}, "b": "{v.block}"')
-    # f.write(f' }},\n')
-    f.write(f' 0x{k}: ("{v.name}", {v.is_range}, 0x{v.code_point}, {last}, {alpha}, {math}, {non_char}, ')
-    f.write(f'{deprecated}, {xid_start}, {xid_continue}, "{v.block}"),\n')
-
-
-def write_repertoire_map(repertoire_map, f):
-    f.write('\n# dictionary of nonunihan Unicode character (repertoire) data\n')
-    # f.write('# fields are: n - name, r - is_range, c - code_point, l - last_code_point (for ranges or None)\n')
-    # f.write('#     a - alpha, m - math, nc - non_char, d - deprecated, xs - XID_start, xc - XID_Continue, b - block\n')
-    f.write('# fields are: name, is_range, code_point, last_code_point (for ranges or None),\n')
-    f.write('#     alpha, math, non_char, deprecated, XID_start, XID_Continue, block\n')
-    f.write('repertoire_map = {\n')
-    for k, v in repertoire_map.items():
-        write_unicode_char(k, v, f)
-    f.write('}\n')
-
-
-def write_unicode_reserved(k, v, f):
-    # v is a UnicodeChar = namedtuple('UnicodeChar', 'name is_range code_point last_code_point alpha math non_char deprecated xid_start xid_continue block')
-    alpha = 1 if v.alpha == 'Y' else 0
-    math = 1 if v.math == 'Y' else 0
-    non_char = 1 if v.non_char == 'Y' else 0
-    deprecated = 1 if v.deprecated == 'Y' else 0
-    xid_start = 1 if v.xid_start == 'Y' else 0
-    xid_continue = 1 if v.xid_continue == 'Y' else 0
-
-    # f.write(f' 0x{k}: {{ ')
-    # f.write(f' "n": "{v.name}", "t": {v.type}, "c": {v.first_code_point}, ')
-    # f.write(f'"l": {v.last_code_point}, "a": {alpha}, "m": {math}, "nc": {non_char}')
-    # f.write(f'"d":{deprecated}, "xs": {xid_start}, "xc": {xid_continue}, "b": "{v.block}"')
-    # f.write(f' }}\n')
-    f.write(f' 0x{k}: ("{v.name}", "{v.type}", 0x{v.first_code_point}, ')
-    f.write(f'0x{v.last_code_point}, {alpha}, {math}, {non_char}')
-    f.write(f'{deprecated}, {xid_start}, {xid_continue}, "{v.block}"),\n')
-
-
-def write_reserved_map(reserved_map, f):
-    f.write('\n\n# dictionary of reserved Unicode character blocks (reserved)\n')
-    f.write('# fields are: n - name, t - type,  c - code_point, l - last_code_point (for ranges or None)\n')
-    f.write('#     a - alpha, m - math, nc - non_char, d - deprecated, xs - XID_start, xc - XID_Continue, b - block\n')
-    f.write('reserved_map = {\n')
-    for k, v in reserved_map.items():
-        write_unicode_reserved(k, v, f)
-    f.write('}\n')
-
-
-def write_block_map(block_map, f):
-    f.write('\n\n# dictionary of Unicode blocks\n')
-    f.write('# entries are: key: (f, l), where\n')
-    f.write('#     key - the name of the block, f - the first code point of the block, l - the last code point of the block.\n')
-    f.write('block_map = {\n')
-    for k, v in block_map.items():
-        f.write(f' "{k}": (0x{v.first_code_point}, 0x{v.last_code_point}),\n')
-    f.write('}\n')
-
-
-def make_identifier_status_map():
-    # make dictionary of identifier status blocks
-    # line is either:
-    # 0027          ; Allowed    # 1.1        APOSTROPHE
-    # 002D..002E    ; Allowed    # 1.1    [2] HYPHEN-MINUS..FULL STOP
-    filename = Path('./import/IdentifierStatus.txt').resolve()
-    isl = []
-
-    with open(filename, 'r', encoding='utf8') as f:
-        for l in f:
-            if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
-                continue
-
-            # parse the line - TODO - parse comment
-            semicolon_idx = l.find(';')
-            hash_idx = l.find('#')
-
-            code_points = l[0:semicolon_idx].strip()
-            status = l[semicolon_idx+1: hash_idx].strip()
-            comment = l[hash_idx+13:].strip()
-
-            dots_idx = code_points.find('..')
-            if dots_idx == -1: # only a single code point
-                first_code_point = int(code_points, 16)
-                last_code_point = None
-            else:
-                first_code_point = int(code_points[:dots_idx], 16)
-                last_code_point = int(code_points[dots_idx+2:], 16)
-
-            ub = UnicodeIdentifierStatus(first_code_point, last_code_point, status)
-            isl.append( (ub, comment))
-
-    return isl
-
-
-def write_identifier_status_map(ism, f):
-    f.write('\n\n# dictionary of Unicode identifier statuses\n')
-    f.write('# entries are: key: (f, l, s), where\n')
-    f.write('#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.\n')
-    f.write('#     status - the identifier status for the block.\n')
-    f.write('identifier_status_map = {\n')
-
-    for v in ism:
-        ub, comment = v
-        fcp_str = f'0x{ub.first_code_point:04x}'
-
-        if ub.last_code_point is None:
-            lcp_str = 'None'
-        else:
-            lcp_str = f'0x{ub.last_code_point:04x}'
-
-        f.write(f' {fcp_str}: ({fcp_str}, {lcp_str}, "{ub.status}"), #  {comment}\n')
-
-    f.write('}\n')
-
-
-def make_identifier_type_map():
-    """
-    read in IdentifierType.txt data. Create emoji map.
-
-    :return: identifier type map (list)
-    """
-    filename = Path('./import/IdentifierType.txt').resolve()
-    isl = []
-
-    with open(filename, 'r', encoding='utf8') as f:
-        for l in f:
-            if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
-                continue
-
-            # parse the line - TODO - parse comment
-            semicolon_idx = l.find(';')
-            hash_idx = l.find('#')
-
-            code_points = l[0:semicolon_idx].strip()
-            type_str = l[semicolon_idx+1: hash_idx].strip()
-            types = type_str.split()
-            comment = l[hash_idx+12:].strip()
-
-            # set tags
-            deprecated = technical = obsolete = inclusion = exclusion = limited_use = \
-                uncommon_use = not_NFKC = not_XID = recommended = default_Ignorable = 0
-
-            for t in types:
-                if t == 'Not_XID':  # 816
-                    not_XID = 1
-                elif t == 'Recommended': # 509
-                    recommended = 1
-                elif t == 'Exclusion': # 387
-                    exclusion = 1
-                elif t == 'Not_NFKC': # 384
-                    not_NFKC = 1
-                elif t == 'Technical': # 277
-                    technical = 1
-                elif t == 'Obsolete': # 196
-                    obsolete = 1
-                elif t == 'Limited_Use': # 165
-                    limited_use = 1
-                elif t == 'Uncommon_Use': # 109
-                    uncommon_use = 1
-                elif t == 'Inclusion': # 18
-                    inclusion = 1
-                elif t == 'Default_Ignorable':  # 32
-                    default_Ignorable = 1
-                elif t == 'Deprecated': # 12
-                    deprecated = 1
-
-            allowed = inclusion or recommended
-
-            dots_idx = code_points.find('..')
-            if dots_idx == -1: # only a single code point
-                first_code_point = int(code_points, 16)
-                last_code_point = None
-            else:
-                first_code_point = int(code_points[:dots_idx], 16)
-                last_code_point = int(code_points[dots_idx+2:], 16)
-
-            ub = UnicodeIdentifierType(first_code_point, last_code_point, allowed, deprecated, technical, obsolete,
-                                       inclusion, exclusion, limited_use, uncommon_use, not_NFKC, not_XID,
-                                       recommended, default_Ignorable)
-            isl.append( (ub, comment))
-
-    return isl
-
-
-def write_identifier_type_map(itm, f):
-    f.write('\n\n# dictionary of Unicode identifier types\n')
-    f.write('# entries are: key: (f, l, types), where\n')
-    f.write('#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.\n')
-    f.write('#     types - types is a list of ints, with 0 for False and 1 for True for the following types for the identifier.\n')
-    f.write('#        allowed, deprecated, technical, obsolete, inclusion, exclusion, limited_use, uncommon_use, not_NFKC, not_XID, recommended, default_Ignorable\n')
-
-    f.write('identifier_type_map = {\n')
-
-    for v in itm:
-        ub, comment = v
-        fcp_str = f'0x{ub.first_code_point:04x}'
-
-        if ub.last_code_point is None:
-            lcp_str = 'None'
-        else:
-            lcp_str = f'0x{ub.last_code_point:04x}'
-
-        tag_vector = f'{ub.allowed},{ub.deprecated},{ub.technical},{ub.obsolete},{ub.inclusion},{ub.exclusion},' \
-            f'{ub.limited_use},{ub.uncommon_use},{ub.not_NFKC},{ub.not_XID},{ub.recommended},{ub.default_Ignorable}'
-
-        f.write(f' {fcp_str}: ({fcp_str}, {lcp_str}, {tag_vector}), #  {comment}\n')
-
-    f.write('}\n')
-
-
-def make_emoji_map():
-    """
-    read in emoji-data.txt data. Create emoji map.
-
-    :return: emoji map (dict
-    """
-    #TODO
-    pass
-    # FILENAME = 'xml/ucd.nounihan.flat.xml'
-
-
-def write_emoji_map(emoji_map, f):
-    # TODO
-    pass
-
-
-if __name__ == '__main__':
-    # intentional_map = make_intentional_map()
-    # with open('intentional_map.py', 'w') as f:
-    #     write_intentional_map_file(intentional_map, f)
-    #
-    # # ucd.nonunihan.flat.xml
-    # rep_map, reserved_map, block_map = make_ucd_map()
-    #
-    # with open('repertoire_map.py', 'w') as f:
-    #     write_repertoire_map(rep_map, f)
-    #
-    # with open('reserved_map.py', 'w') as f:
-    #     write_reserved_map(reserved_map, f)
-    #
-    # with open('block_map.py', 'w') as f:
-    #     write_block_map(block_map, f)
-    #
-    # id_status_map = make_identifier_status_map()
-    #
-    # with open('identifier_status_map.py', 'w') as f:
-    #     write_identifier_status_map(id_status_map, f)
-
-    id_type_map = make_identifier_type_map()
-
-    with open('identifier_type_map.py', 'w') as f:
-        write_identifier_type_map(id_type_map, f)
-
-    # emoji_map = make_emoji_map()
-    #
-    # with open('emoji_map.py', 'w') as f:
-    #     write_emoji_map(emoji_map, f)
-
+"""
+Read Unicode.org data files and create python importable data  from them
+
+files read:
+
+    - intention.txt - intentionally confusiong characters
+    - confusables.txt - TR39 confusable mappings (used for skeletons)
+    - ucd.nounihan.flat.xml - repertoire, reserved, block, script, bidi class and grapheme break maps
+    - emoji-data.txt - emoji properties
+    - emoji-sequences.txt, emoji-zwj-sequences.txt - RGI emoji sequences
+
+TODO
+    - test...
+    - parse other unicode.org files...
+    - add emoji to repertoire map and emoji_map.... read @missing?
+        https://www.unicode.org/reports/tr51/index.html / https://www.unicode.org/Public/emoji/11.0/
+        - presentation_modifier? (variation sequences - emoji followed by presentation selector or text presentation selector)
+        - text-default, emoji-default
+        - CLDR - Unicode Common Locale Data Repository (http://cldr.unicode.org/). Emoji ordering chart?
+    - continue on TR39 - block restricted characters - look at IdeentifierType (NOT_XID and XID_RESTRICTED, Limited_Use, Technical, Obsolete, etc.?)
+
+    - write tests - identifiers, danger levels, etc.
+
+"""
+
+from pathlib import Path
+import re
+import sys
+from typing import Dict
+from xml.etree import ElementTree as ET
+
+from more_unicodedata_types import UnicodeChar
+from more_unicodedata_types import UnicodeReserved
+from more_unicodedata_types import UnicodeBlock
+from more_unicodedata_types import UnicodeIdentifierStatus
+from more_unicodedata_types import UnicodeIdentifierType
+
+
+def make_intentional_map() -> Dict:
+    # create the dictionary for the intention map -- reading from intentional.txt
+    filename = Path('./import/intentional.txt').resolve()
+    char_map = {}
+
+    with open(filename, 'r', encoding='utf8') as f:
+        _ = f.readline()          # burn first line
+
+        for l in f:
+            if l[0] in {'#', '\n'}: # comment or blank line
+                continue
+
+            # parse the line - for example - 0021; 01 C3  # * ( ! ~ Çƒ ) EXCLAMATION MARK ~ LATIN LETTER RETROFLEX CLICK
+            semicolon_idx = l.find(';')
+            code_point = l[0:semicolon_idx].strip()
+            fields = l[semicolon_idx+1:]
+
+            ampersand_idx = fields.find('#')
+            close_paren_idx = fields.find(')')
+            tilde_idx = fields.rfind('~')
+            key_char = fields[0:ampersand_idx].strip()
+            key_char_comment = fields[tilde_idx + 1:].strip()
+            intended_char_comment = fields[close_paren_idx + 1:tilde_idx].strip()
+
+            chr_char = chr(int('0x'+key_char, 0))
+            chr_intended_char = chr(int('0x' + code_point, 0))
+            char_map[chr_char] = (chr_intended_char, key_char_comment, intended_char_comment)
+
+    return char_map
+
+
+def write_intentional_map_file(intentional_map, f):
+    # write intentional map to a file
+    f.write('# dictionary to map unicode characters to canonical characters\n')
+    f.write('# entries are tuples of -- key: code_point, name1, name2\n')
+    f.write('# where: key - code point of the confusing char, code_point - code point of the character that it confuses,\n')
+    f.write('#    name1 - the name of the confusing char, name2 - the name of the char that it confuses\n')
+    f.write('#\n')
+    f.write('# This dictionary can be used to reduce confusion by mapping to the canonical (non-confusing) letter\n')
+    f.write('intentional_map = {\n')
+    for k,v in intentional_map.items():
+        f.write(f'    0x{ord(k):04x}: ( 0x{ord(v[0]):04X}, "{v[1]}", "{v[2]}" ),\n')
+    f.write('}\n')
+
+
+def make_confusables_map() -> Dict:
+    """
+    read in confusables.txt data. Create confusables map.
+
+    Each data line maps a single source code point to the (possibly multi-code-point) prototype it is confusable with:
+
+        05AD ;	0596 ;	MA	# ( ֭ → ֖ ) HEBREW ACCENT DEHI → HEBREW ACCENT TIPEHA	#
+
+    :return: confusables map (dict) - key: source code point, value: (tuple of prototype code points, comment)
+    """
+    filename = Path('./import/confusables.txt').resolve()
+    char_map = {}
+
+    with open(filename, 'r', encoding='utf8') as f:
+        for l in f:
+            if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
+                continue
+
+            fields = l.split(';')
+
+            if len(fields) < 3:
+                continue
+
+            code_point = int(fields[0].strip(), 16)
+            prototype = tuple(int(cp, 16) for cp in fields[1].split())
+            hash_idx = l.find('#')
+            close_paren_idx = l.find(')', hash_idx)
+            comment = l[close_paren_idx+1:].strip().rstrip('#').strip()
+            char_map[code_point] = (prototype, comment)
+
+    return char_map
+
+
+def write_confusables_map(confusables_map, f):
+    f.write('\n\n# dictionary of TR39 confusable mappings (from confusables.txt)\n')
+    f.write('# entries are: key: (cp, ...), where\n')
+    f.write('#     key - the code point of the confusable character, (cp, ...) - the code point(s) of its prototype.\n')
+    f.write('# The skeleton of a string is made by mapping each character to its prototype (see TR39 section 4).\n')
+    f.write('confusables_map = {\n')
+
+    for k, v in confusables_map.items():
+        prototype, comment = v
+        cps = ', '.join(f'0x{cp:04x}' for cp in prototype)
+        f.write(f' 0x{k:04x}: ({cps},), #  {comment}\n')
+
+    f.write('}\n')
+
+
+def make_unicode_char(node):
+    a = node.attrib
+    if 'first-cp' in a:
+        uc = UnicodeChar(name=a['na'], is_range=True, code_point=a['first-cp'], last_code_point=a['last-cp'], block=a['blk'], alpha=a['Alpha'],
+                         math=a['Math'], non_char=a['NChar'], deprecated=a['Dep'], xid_start=a['XIDS'], xid_continue=a['XIDC'],
+                         script=a['sc'], script_extensions=a['scx'], bidi_class=a['bc'], grapheme_cluster_break=a['GCB'])
+    else:
+        uc = UnicodeChar(name=a['na'], is_range=False, code_point=a['cp'], last_code_point=None, block=a['blk'],
+                         alpha=a['Alpha'], math=a['Math'], non_char=a['NChar'], deprecated=a['Dep'],
+                         xid_start=a['XIDS'],xid_continue=a['XIDC'], script=a['sc'], script_extensions=a['scx'],
+                         bidi_class=a['bc'], grapheme_cluster_break=a['GCB'])
+    return uc
+
+
+def make_unicode_reserved(tag_type, node):
+    a = node.attrib
+
+    if 'first-cp' in a:
+        fcp, lcp = a['first-cp'], a['last-cp']
+    else:
+        fcp, lcp = a['cp'], a['cp']
+
+    ur = UnicodeReserved(name=a['na'], type=tag_type, first_code_point=fcp, last_code_point=lcp, block=a['blk'],
+                         alpha=a['Alpha'], math=a['Math'], non_char=a['NChar'], deprecated=a['Dep'],
+                         xid_start=a['XIDS'],xid_continue=a['XIDC'], bidi_class=a['bc'], grapheme_cluster_break=a['GCB'])
+    return ur
+
+
+def make_unicode_block(node):
+    a = node.attrib
+    ub = UnicodeBlock(name=a['name'], first_code_point=a['first-cp'], last_code_point=a['last-cp'])
+    return ub
+
+
+def make_ucd_map():
+    """
+    read in UCD data (nonunihan version). Create repertoire and block maps.
+
+    UCD data is in XML. The childrn are as follows:
+
+        children[0].tag is 'repertoire' [chars]
+        children[1].tag is 'blocks'
+        children[2].tag is 'named-sequences'
+        children[3].tag is 'named-sequence'
+        children[4].tag is 'normalization-corrections'
+        children[5].tag is '}standardized-variants'
+        children[6].tag is 'cjk-radicals'
+        children[7].tag is 'emoji-sources'
+
+    Note: currently just the repertroire (characters with attributes) and blocks are read in.
+
+    Note: for the repertoire (chars) a subset of the attributes are kept. The full set (as of V11.0) is:
+
+    Repertoire chars: ['cp', 'age', 'na', 'JSN', 'gc', 'ccc', 'dt', 'dm', 'nt', 'nv', 'bc', 'bpt', 'bpb',
+            'Bidi_M', 'bmg', 'suc', 'slc', 'stc', 'uc', 'lc', 'tc', 'scf', 'cf', 'jt', 'jg', 'ea', 'lb', 'sc', 'scx',
+            'Dash', 'WSpace', 'Hyphen', 'QMark', 'Radical', 'Ideo', 'UIdeo', 'IDSB', 'IDST', 'hst', 'DI', 'ODI',
+            'Alpha', 'OAlpha', 'Upper', 'OUpper', 'Lower', 'OLower', 'Math', 'OMath', 'Hex', 'AHex', 'NChar', 'VS',
+            'Bidi_C', 'Join_C', 'Gr_Base', 'Gr_Ext', 'OGr_Ext', 'Gr_Link', 'STerm', 'Ext', 'Term', 'Dia', 'Dep',
+            'IDS', 'OIDS', 'XIDS', 'IDC', 'OIDC', 'XIDC', 'SD', 'LOE', 'Pat_WS', 'Pat_Syn', 'GCB', 'WB', 'SB', 'CE',
+            'Comp_Ex', 'NFC_QC', 'NFD_QC', 'NFKC_QC', 'NFKD_QC', 'XO_NFC', 'XO_NFD', 'XO_NFKC', 'XO_NFKD', 'FC_NFKC',
+            'CI', 'Cased', 'CWCF', 'CWCM', 'CWKCF', 'CWL', 'CWT', 'CWU', 'NFKC_CF', 'InSC', 'InPC', 'PCM', 'vo', 'RI',
+            'blk', 'isc', 'na1'])
+
+
+    Blocks: first-cp, last-cp, name - e.g. 0000-007F, 'Basic Latin'
+
+    Named-sequences: name, cps - e.g. 'ARABIC SEQUENCE NOON WITH KEHEH; ;0646 06A9'
+
+    Standardized variants: cps desc when - e.g. '0030 FE00' 'short diagonal stroke form' ''
+
+    Standardized variant: number radical ideograph
+
+    Emoji sources [use emoji-data.txt instead]: unicode docomo kddi softbank - e.g. '0023 20E3' 'F985' 'F489' 'F7B0'
+        emoji-test.txt has subgroups of emojis
+        emoji-sequences has categories
+
+
+    :return: repertroire, reserved ranges and block map (dicts)
+    """
+    # FILENAME = 'xml/ucd.nounihan.flat.xml'
+    filename = Path('./import/xml/ucd.nounihan.flat.xml').resolve()
+
+
+    try:
+        dom = ET.parse(open(filename, "r"))
+        root = dom.getroot()
+    except:
+        print("Unable to open and parse input definition file: " + filename)
+        sys.exit(1)
+
+    unicode_chars = {}
+    unicode_reserved = {}
+    unicode_blocks = {}
+
+    for node in root[1]:
+        tag_type = node.tag.split('}')[1]
+
+        if tag_type == 'char':
+            uc = make_unicode_char(node)
+            unicode_chars[uc.code_point] = uc
+        elif tag_type in {'reserved', 'surrogate', 'noncharacter'} :
+            ur = make_unicode_reserved(tag_type, node)
+            unicode_reserved[ur.first_code_point] = ur
+        else:
+            print(f'unknown type={tag_type}')
+
+    for node in root[2]:
+        ub = make_unicode_block(node)
+        unicode_blocks[node.attrib['name']] = ub
+
+    return unicode_chars, unicode_reserved, unicode_blocks
+
+
+def write_unicode_char(k, v, f):
+    # v is a UnicodeChar = namedtuple('UnicodeChar', 'name is_range code_point last_code_point alpha math non_char deprecated xid_start xid_continue block')
+    alpha = 1 if v.alpha == 'Y' else 0
+    math = 1 if v.math == 'Y' else 0
+    non_char = 1 if v.non_char == 'Y' else 0
+    deprecated = 1 if v.deprecated == 'Y' else 0
+    xid_start = 1 if v.xid_start == 'Y' else 0
+    xid_continue = 1 if v.xid_continue == 'Y' else 0
+    last = 'None' if v.last_code_point is None else f'0x{v.last_code_point}'
+
+    # f.write(f' 0x{k}: {{ ')
+    # f.write(f' "n": "{v.name}", "r": {v.is_range}, "c": 0x{v.code_point}, ')
+    # f.write(f'"l": {last}, "a": {alpha}, "m": {math}, "nc": {non_char}, ')
+    # f.write(f'"d":{deprecated}, "xs": {xid_start}, "xc": {xid_continue}, "b": "{v.block}"')
+    # f.write(f' }},\n')
+    f.write(f' 0x{k}: ("{v.name}", {v.is_range}, 0x{v.code_point}, {last}, {alpha}, {math}, {non_char}, ')
+    f.write(f'{deprecated}, {xid_start}, {xid_continue}, "{v.block}"),\n')
+
+
+def write_repertoire_map(repertoire_map, f):
+    f.write('\n# dictionary of nonunihan Unicode character (repertoire) data\n')
+    # f.write('# fields are: n - name, r - is_range, c - code_point, l - last_code_point (for ranges or None)\n')
+    # f.write('#     a - alpha, m - math, nc - non_char, d - deprecated, xs - XID_start, xc - XID_Continue, b - block\n')
+    f.write('# fields are: name, is_range, code_point, last_code_point (for ranges or None),\n')
+    f.write('#     alpha, math, non_char, deprecated, XID_start, XID_Continue, block\n')
+    f.write('repertoire_map = {\n')
+    for k, v in repertoire_map.items():
+        write_unicode_char(k, v, f)
+    f.write('}\n')
+
+
+def write_unicode_reserved(k, v, f):
+    # v is a UnicodeChar = namedtuple('UnicodeChar', 'name is_range code_point last_code_point alpha math non_char deprecated xid_start xid_continue block')
+    alpha = 1 if v.alpha == 'Y' else 0
+    math = 1 if v.math == 'Y' else 0
+    non_char = 1 if v.non_char == 'Y' else 0
+    deprecated = 1 if v.deprecated == 'Y' else 0
+    xid_start = 1 if v.xid_start == 'Y' else 0
+    xid_continue = 1 if v.xid_continue == 'Y' else 0
+
+    # f.write(f' 0x{k}: {{ ')
+    # f.write(f' "n": "{v.name}", "t": {v.type}, "c": {v.first_code_point}, ')
+    # f.write(f'"l": {v.last_code_point}, "a": {alpha}, "m": {math}, "nc": {non_char}')
+    # f.write(f'"d":{deprecated}, "xs": {xid_start}, "xc": {xid_continue}, "b": "{v.block}"')
+    # f.write(f' }}\n')
+    f.write(f' 0x{k}: ("{v.name}", "{v.type}", 0x{v.first_code_point}, ')
+    f.write(f'0x{v.last_code_point}, {alpha}, {math}, {non_char}')
+    f.write(f'{deprecated}, {xid_start}, {xid_continue}, "{v.block}"),\n')
+
+
+def write_reserved_map(reserved_map, f):
+    f.write('\n\n# dictionary of reserved Unicode character blocks (reserved)\n')
+    f.write('# fields are: n - name, t - type,  c - code_point, l - last_code_point (for ranges or None)\n')
+    f.write('#     a - alpha, m - math, nc - non_char, d - deprecated, xs - XID_start, xc - XID_Continue, b - block\n')
+    f.write('reserved_map = {\n')
+    for k, v in reserved_map.items():
+        write_unicode_reserved(k, v, f)
+    f.write('}\n')
+
+
+def write_block_map(block_map, f):
+    f.write('\n\n# dictionary of Unicode blocks\n')
+    f.write('# entries are: key: (f, l), where\n')
+    f.write('#     key - the name of the block, f - the first code point of the block, l - the last code point of the block.\n')
+    f.write('block_map = {\n')
+    for k, v in block_map.items():
+        f.write(f' "{k}": (0x{v.first_code_point}, 0x{v.last_code_point}),\n')
+    f.write('}\n')
+
+
+def make_range_list(unicode_chars, key):
+    """
+    Coalesce consecutive characters with the same property value into ranges.
+
+    :param unicode_chars: the repertoire (dict of UnicodeChar) from make_ucd_map
+    :param key: function that returns the property value for a UnicodeChar
+    :return: list of (first code point, last code point, value) tuples, sorted by code point
+    """
+    ranges = []
+
+    for uc in sorted(unicode_chars.values(), key=lambda uc: int(uc.code_point, 16)):
+        first = int(uc.code_point, 16)
+        last = int(uc.last_code_point, 16) if uc.is_range else first
+        value = key(uc)
+
+        if ranges and ranges[-1][1] == first - 1 and ranges[-1][2] == value:
+            ranges[-1] = (ranges[-1][0], last, value)
+        else:
+            ranges.append((first, last, value))
+
+    return ranges
+
+
+def make_script_map(unicode_chars):
+    """
+    Create the script map from the sc (Script) and scx (Script_Extensions) attributes of the repertoire.
+
+    Scripts are numbered by their index in script_names (Common and Inherited are always ids 0 and 1.) Script
+    extensions are stored as a bitmask of script ids.
+
+    :param unicode_chars: the repertoire (dict of UnicodeChar) from make_ucd_map
+    :return: script_names (list of short script names) and the script ranges (list of (first, last, sc, scx))
+    """
+    all_scripts = set()
+
+    for uc in unicode_chars.values():
+        all_scripts.add(uc.script)
+        all_scripts.update(uc.script_extensions.split())
+
+    script_names = ['Zyyy', 'Zinh'] + sorted(all_scripts - {'Zyyy', 'Zinh'})
+    script_ids = {name: i for i, name in enumerate(script_names)}
+
+    def script_key(uc):
+        scx_mask = 0
+        for name in uc.script_extensions.split():
+            scx_mask |= 1 << script_ids[name]
+        return script_ids[uc.script], scx_mask
+
+    ranges = [(first, last, sc, scx) for first, last, (sc, scx) in make_range_list(unicode_chars, script_key)]
+    return script_names, ranges
+
+
+def write_script_map(script_map, f):
+    script_names, ranges = script_map
+
+    f.write('\n\n# tuple of Unicode script (short) names. The index of the script in the tuple is the script id.\n')
+    f.write('script_names = (\n')
+    for name in script_names:
+        f.write(f' "{name}",\n')
+    f.write(')\n')
+
+    f.write('\n\n# dictionary of Unicode scripts\n')
+    f.write('# entries are: key: (f, l, sc, scx), where\n')
+    f.write('#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.\n')
+    f.write('#     sc - the script id of the Script property, scx - the Script_Extensions property as a bitmask of script ids.\n')
+    f.write('# code points not in the map are unassigned (script Unknown.)\n')
+    f.write('script_map = {\n')
+
+    for first, last, sc, scx in ranges:
+        f.write(f' 0x{first:04x}: (0x{first:04x}, 0x{last:04x}, {sc}, 0x{scx:x}),  #  {script_names[sc]}\n')
+
+    f.write('}\n')
+
+
+def make_property_ranges(unicode_chars, unicode_reserved, key, default=0):
+    """
+    Coalesce the code points of the repertoire and the reserved ranges with the same property value into ranges.
+
+    :param unicode_chars: the repertoire (dict of UnicodeChar) from make_ucd_map
+    :param unicode_reserved: the reserved ranges (dict of UnicodeReserved) from make_ucd_map
+    :param key: function that returns the property value for a UnicodeChar or UnicodeReserved
+    :param default: ranges with this value are left out (it's the value for code points not in the ranges)
+    :return: list of (first code point, last code point, value) tuples, sorted by code point
+    """
+    ranges = make_range_list(unicode_chars, key)
+    ranges += [(int(ur.first_code_point, 16), int(ur.last_code_point, 16), key(ur)) for ur in unicode_reserved.values()]
+    return merge_ranges(ranges, default)
+
+
+def merge_ranges(ranges, default=0):
+    """
+    Coalesce adjacent ranges with the same property value.
+
+    :param ranges: list of (first code point, last code point, value) tuples. The ranges must not overlap.
+    :param default: ranges with this value are left out (it's the value for code points not in the ranges)
+    :return: list of (first code point, last code point, value) tuples, sorted by code point
+    """
+    merged = []
+    for first, last, value in sorted(ranges):
+        if merged and merged[-1][1] == first - 1 and merged[-1][2] == value:
+            merged[-1] = (merged[-1][0], last, value)
+        else:
+            merged.append((first, last, value))
+
+    return [r for r in merged if r[2] != default]
+
+
+# Bidi_Class values, in the order of table 4 of UAX #9 (http://www.unicode.org/reports/tr9/). The index of the class
+# in the tuple is the bidi class id. L is first, as it's the default for code points not in the map.
+BIDI_CLASS_NAMES = ('L', 'R', 'AL', 'EN', 'ES', 'ET', 'AN', 'CS', 'NSM', 'BN', 'B', 'S', 'WS', 'ON', 'LRE', 'LRO',
+                    'RLE', 'RLO', 'PDF', 'LRI', 'RLI', 'FSI', 'PDI')
+
+
+def make_bidi_class_map(unicode_chars, unicode_reserved):
+    """
+    Create the bidi class map from the bc (Bidi_Class) attributes of the repertoire and the reserved code points.
+
+    Unassigned code points have bidi classes too (e.g. R in the Hebrew blocks), so the reserved ranges are included.
+    Ranges of L (the most common class) are left out, so the map only has the other classes.
+
+    :param unicode_chars: the repertoire (dict of UnicodeChar) from make_ucd_map
+    :param unicode_reserved: the reserved ranges (dict of UnicodeReserved) from make_ucd_map
+    :return: the bidi class ranges (list of (first, last, bidi class id)), with ids from BIDI_CLASS_NAMES
+    """
+    class_ids = {name: i for i, name in enumerate(BIDI_CLASS_NAMES)}
+    return make_property_ranges(unicode_chars, unicode_reserved, lambda u: class_ids[u.bidi_class])
+
+
+def write_bidi_class_map(bidi_class_map, f):
+    f.write('\n\n# tuple of Unicode Bidi_Class (short) names. The index of the class in the tuple is the bidi class id.\n')
+    f.write('bidi_class_names = (\n')
+    for name in BIDI_CLASS_NAMES:
+        f.write(f' "{name}",\n')
+    f.write(')\n')
+
+    f.write('\n\n# dictionary of Unicode bidi classes\n')
+    f.write('# entries are: key: (f, l, bc), where\n')
+    f.write('#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.\n')
+    f.write('#     bc - the bidi class id.\n')
+    f.write('# code points not in the map have bidi class L.\n')
+    f.write('bidi_class_map = {\n')
+
+    for first, last, bc in bidi_class_map:
+        f.write(f' 0x{first:04x}: (0x{first:04x}, 0x{last:04x}, {bc}),  #  {BIDI_CLASS_NAMES[bc]}\n')
+
+    f.write('}\n')
+
+
+# Grapheme_Cluster_Break values (short names.) The index of the value in the tuple is the grapheme break id. XX
+# (Other) is first, as it's the default for code points not in the map. ExtPict isn't a Grapheme_Cluster_Break
+# value: it's used for the Extended_Pictographic characters (which are all XX), as the segmentation rules need both.
+GRAPHEME_BREAK_NAMES = ('XX', 'CR', 'LF', 'CN', 'EX', 'ZWJ', 'RI', 'PP', 'SM', 'L', 'V', 'T', 'LV', 'LVT', 'ExtPict')
+
+
+def make_grapheme_break_map(unicode_chars, unicode_reserved, emoji_map):
+    """
+    Create the grapheme break map from the GCB (Grapheme_Cluster_Break) attributes of the repertoire and the reserved
+    code points (some unassigned code points are Control), and the Extended_Pictographic property from emoji-data.txt
+    (the UCD XML doesn't have it for 11.0. It includes unassigned code points in the emoji blocks.)
+
+    :param unicode_chars: the repertoire (dict of UnicodeChar) from make_ucd_map
+    :param unicode_reserved: the reserved ranges (dict of UnicodeReserved) from make_ucd_map
+    :param emoji_map: the emoji property ranges from make_emoji_map
+    :return: the grapheme break ranges (list of (first, last, grapheme break id)), with ids from GRAPHEME_BREAK_NAMES
+    """
+    break_ids = {name: i for i, name in enumerate(GRAPHEME_BREAK_NAMES)}
+    other, ext_pict = break_ids['XX'], break_ids['ExtPict']
+    ext_pict_bit = 1 << EMOJI_PROPERTY_NAMES.index('Extended_Pictographic')
+    ext_pict_ranges = [(first, last) for first, last, mask in emoji_map if mask & ext_pict_bit]
+
+    ranges = []
+    for first, last, gcb in make_property_ranges(unicode_chars, unicode_reserved,
+                                                 lambda u: break_ids[u.grapheme_cluster_break], default=None):
+        if gcb != other:
+            ranges.append((first, last, gcb))
+            continue
+
+        # split the XX (Other) ranges at the Extended_Pictographic ranges
+        cp = first
+        for ep_first, ep_last in ext_pict_ranges:
+            if ep_last < cp or ep_first > last:
+                continue
+            if ep_first > cp:
+                ranges.append((cp, ep_first - 1, other))
+            ranges.append((max(ep_first, cp), min(ep_last, last), ext_pict))
+            cp = min(ep_last, last) + 1
+        if cp <= last:
+            ranges.append((cp, last, other))
+
+    return merge_ranges(ranges)
+
+
+def write_grapheme_break_map(grapheme_break_map, f):
+    f.write('\n\n# tuple of Unicode Grapheme_Cluster_Break (short) names, plus ExtPict for the Extended_Pictographic\n')
+    f.write('# characters. The index of the name in the tuple is the grapheme break id.\n')
+    f.write('grapheme_break_names = (\n')
+    for name in GRAPHEME_BREAK_NAMES:
+        f.write(f' "{name}",\n')
+    f.write(')\n')
+
+    f.write('\n\n# dictionary of Unicode grapheme breaks\n')
+    f.write('# entries are: key: (f, l, gcb), where\n')
+    f.write('#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.\n')
+    f.write('#     gcb - the grapheme break id.\n')
+    f.write('# code points not in the map are XX (Other.)\n')
+    f.write('grapheme_break_map = {\n')
+
+    for first, last, gcb in grapheme_break_map:
+        f.write(f' 0x{first:04x}: (0x{first:04x}, 0x{last:04x}, {gcb}),  #  {GRAPHEME_BREAK_NAMES[gcb]}\n')
+
+    f.write('}\n')
+
+
+def make_identifier_status_map():
+    # make dictionary of identifier status blocks
+    # line is either:
+    # 0027          ; Allowed    # 1.1        APOSTROPHE
+    # 002D..002E    ; Allowed    # 1.1    [2] HYPHEN-MINUS..FULL STOP
+    filename = Path('./import/IdentifierStatus.txt').resolve()
+    isl = []
+
+    with open(filename, 'r', encoding='utf8') as f:
+        for l in f:
+            if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
+                continue
+
+            # parse the line - TODO - parse comment
+            semicolon_idx = l.find(';')
+            hash_idx = l.find('#')
+
+            code_points = l[0:semicolon_idx].strip()
+            status = l[semicolon_idx+1: hash_idx].strip()
+            comment = l[hash_idx+13:].strip()
+
+            dots_idx = code_points.find('..')
+            if dots_idx == -1: # only a single code point
+                first_code_point = int(code_points, 16)
+                last_code_point = None
+            else:
+                first_code_point = int(code_points[:dots_idx], 16)
+                last_code_point = int(code_points[dots_idx+2:], 16)
+
+            ub = UnicodeIdentifierStatus(first_code_point, last_code_point, status)
+            isl.append( (ub, comment))
+
+    return isl
+
+
+def write_identifier_status_map(ism, f):
+    f.write('\n\n# dictionary of Unicode identifier statuses\n')
+    f.write('# entries are: key: (f, l, s), where\n')
+    f.write('#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.\n')
+    f.write('#     status - the identifier status for the block.\n')
+    f.write('identifier_status_map = {\n')
+
+    for v in ism:
+        ub, comment = v
+        fcp_str = f'0x{ub.first_code_point:04x}'
+
+        if ub.last_code_point is None:
+            lcp_str = 'None'
+        else:
+            lcp_str = f'0x{ub.last_code_point:04x}'
+
+        f.write(f' {fcp_str}: ({fcp_str}, {lcp_str}, "{ub.status}"), #  {comment}\n')
+
+    f.write('}\n')
+
+
+def make_identifier_type_map():
+    """
+    read in IdentifierType.txt data. Create emoji map.
+
+    :return: identifier type map (list)
+    """
+    filename = Path('./import/IdentifierType.txt').resolve()
+    isl = []
+
+    with open(filename, 'r', encoding='utf8') as f:
+        for l in f:
+            if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
+                continue
+
+            # parse the line - TODO - parse comment
+            semicolon_idx = l.find(';')
+            hash_idx = l.find('#')
+
+            code_points = l[0:semicolon_idx].strip()
+            type_str = l[semicolon_idx+1: hash_idx].strip()
+            types = type_str.split()
+            comment = l[hash_idx+12:].strip()
+
+            # set tags
+            deprecated = technical = obsolete = inclusion = exclusion = limited_use = \
+                uncommon_use = not_NFKC = not_XID = recommended = default_Ignorable = 0
+
+            for t in types:
+                if t == 'Not_XID':  # 816
+                    not_XID = 1
+                elif t == 'Recommended': # 509
+                    recommended = 1
+                elif t == 'Exclusion': # 387
+                    exclusion = 1
+                elif t == 'Not_NFKC': # 384
+                    not_NFKC = 1
+                elif t == 'Technical': # 277
+                    technical = 1
+                elif t == 'Obsolete': # 196
+                    obsolete = 1
+                elif t == 'Limited_Use': # 165
+                    limited_use = 1
+                elif t == 'Uncommon_Use': # 109
+                    uncommon_use = 1
+                elif t == 'Inclusion': # 18
+                    inclusion = 1
+                elif t == 'Default_Ignorable':  # 32
+                    default_Ignorable = 1
+                elif t == 'Deprecated': # 12
+                    deprecated = 1
+
+            allowed = inclusion or recommended
+
+            dots_idx = code_points.find('..')
+            if dots_idx == -1: # only a single code point
+                first_code_point = int(code_points, 16)
+                last_code_point = None
+            else:
+                first_code_point = int(code_points[:dots_idx], 16)
+                last_code_point = int(code_points[dots_idx+2:], 16)
+
+            ub = UnicodeIdentifierType(first_code_point, last_code_point, allowed, deprecated, technical, obsolete,
+                                       inclusion, exclusion, limited_use, uncommon_use, not_NFKC, not_XID,
+                                       recommended, default_Ignorable)
+            isl.append( (ub, comment))
+
+    return isl
+
+
+def write_identifier_type_map(itm, f):
+    f.write('\n\n# dictionary of Unicode identifier types\n')
+    f.write('# entries are: key: (f, l, types), where\n')
+    f.write('#     key - the first code point in the block, f - the first code point of the block, l - the last code point of the block.\n')
+    f.write('#     types - types is a list of ints, with 0 for False and 1 for True for the following types for the identifier.\n')
+    f.write('#        allowed, deprecated, technical, obsolete, inclusion, exclusion, limited_use, uncommon_use, not_NFKC, not_XID, recommended, default_Ignorable\n')
+
+    f.write('identifier_type_map = {\n')
+
+    for v in itm:
+        ub, comment = v
+        fcp_str = f'0x{ub.first_code_point:04x}'
+
+        if ub.last_code_point is None:
+            lcp_str = 'None'
+        else:
+            lcp_str = f'0x{ub.last_code_point:04x}'
+
+        tag_vector = f'{ub.allowed},{ub.deprecated},{ub.technical},{ub.obsolete},{ub.inclusion},{ub.exclusion},' \
+            f'{ub.limited_use},{ub.uncommon_use},{ub.not_NFKC},{ub.not_XID},{ub.recommended},{ub.default_Ignorable}'
+
+        f.write(f' {fcp_str}: ({fcp_str}, {lcp_str}, {tag_vector}), #  {comment}\n')
+
+    f.write('}\n')
+
+
+# emoji properties (from emoji-data.txt, see: https://www.unicode.org/reports/tr51/#Emoji_Properties). The emoji map
+# has the properties of each range as a bitmask, where bit i is the property at index i in the tuple.
+EMOJI_PROPERTY_NAMES = ('Emoji', 'Emoji_Presentation', 'Emoji_Modifier', 'Emoji_Modifier_Base', 'Emoji_Component',
+                        'Extended_Pictographic')
+
+
+def make_emoji_map():
+    """
+    read in emoji-data.txt data. Create emoji map.
+
+    Each line of the file has a code point or range of code points and one property. The properties overlap (e.g.
+    most Emoji are also Extended_Pictographic), so the ranges are split where the set of properties changes.
+
+    :return: emoji map (list of (first code point, last code point, property mask)), sorted by code point
+    """
+    filename = Path('./import/emoji-data.txt').resolve()
+    property_bits = {name: 1 << i for i, name in enumerate(EMOJI_PROPERTY_NAMES)}
+    masks = {}      # code point -> property mask
+
+    with open(filename, 'r', encoding='utf8') as f:
+        for l in f:
+            if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
+                continue
+
+            semicolon_idx = l.find(';')
+            hash_idx = l.find('#')
+
+            code_points = l[0:semicolon_idx].strip()
+            property_name = l[semicolon_idx+1: hash_idx].strip()
+
+            if property_name not in property_bits:
+                print(f'unknown emoji property={property_name}')
+                continue
+
+            dots_idx = code_points.find('..')
+            if dots_idx == -1: # only a single code point
+                first_code_point = last_code_point = int(code_points, 16)
+            else:
+                first_code_point = int(code_points[:dots_idx], 16)
+                last_code_point = int(code_points[dots_idx+2:], 16)
+
+            for cp in range(first_code_point, last_code_point + 1):
+                masks[cp] = masks.get(cp, 0) | property_bits[property_name]
+
+    ranges = []
+    for cp in sorted(masks):
+        if ranges and ranges[-1][1] == cp - 1 and ranges[-1][2] == masks[cp]:
+            ranges[-1] = (ranges[-1][0], cp, masks[cp])
+        else:
+            ranges.append((cp, cp, masks[cp]))
+
+    return ranges
+
+
+def write_emoji_map(emoji_map, f):
+    f.write('\n\n# tuple of Unicode emoji property names. Bit i of a property mask is the property at index i.\n')
+    f.write('emoji_property_names = (\n')
+    for name in EMOJI_PROPERTY_NAMES:
+        f.write(f' "{name}",\n')
+    f.write(')\n')
+
+    f.write('\n\n# dictionary of Unicode emoji properties\n')
+    f.write('# entries are: key: (f, l, p), where\n')
+    f.write('#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.\n')
+    f.write('#     p - the emoji properties of the range, as a bitmask.\n')
+    f.write('# code points not in the map have none of the emoji properties.\n')
+    f.write('emoji_map = {\n')
+
+    for first, last, mask in emoji_map:
+        names = ', '.join(name for i, name in enumerate(EMOJI_PROPERTY_NAMES) if mask >> i & 1)
+        f.write(f' 0x{first:04x}: (0x{first:04x}, 0x{last:04x}, 0x{mask:02x}),  #  {names}\n')
+
+    f.write('}\n')
+
+
+_emoji_sequence_comment = re.compile(r'#\s*E?\d+\.\d+')
+
+
+def make_emoji_sequence_map():
+    """
+    read in emoji-sequences.txt and emoji-zwj-sequences.txt data. Create emoji sequence map.
+
+    Each data line has a code point sequence (or a range of single code points), the type of the sequence and its
+    name:
+
+        1F1E6 1F1E8   ; Emoji_Flag_Sequence      ; flag: Ascension Island      #  6.0  [1] (🇦🇨)
+
+    :return: emoji sequence types (list of the types, in the order they're first seen) and the emoji sequence map
+        (dict) - key: tuple of code points, value: (type id, name)
+    """
+    types = []
+    sequences = {}
+
+    for filename in (Path('./import/emoji-sequences.txt').resolve(), Path('./import/emoji-zwj-sequences.txt').resolve()):
+        with open(filename, 'r', encoding='utf8') as f:
+            for l in f:
+                if l[0] in {'\uFEFF', '#', '\n'}:  # comment or blank line
+                    continue
+
+                # the comment starts at the '#' before the version (a keycap name can be a '#' too)
+                m = _emoji_sequence_comment.search(l)
+                fields = (l if m is None else l[:m.start()]).split(';')
+
+                if len(fields) < 3:
+                    continue
+
+                code_points = fields[0].strip()
+                type_str = fields[1].strip()
+                name = fields[2].strip()
+
+                if type_str not in types:
+                    types.append(type_str)
+
+                dots_idx = code_points.find('..')
+                if dots_idx == -1:
+                    cps_list = [tuple(int(cp, 16) for cp in code_points.split())]
+                else:  # a range of single code points
+                    cps_list = [(cp,) for cp in range(int(code_points[:dots_idx], 16), int(code_points[dots_idx+2:], 16) + 1)]
+
+                for cps in cps_list:
+                    sequences[cps] = (types.index(type_str), name)
+
+    return types, sequences
+
+
+def write_emoji_sequence_map(emoji_sequence_map, f):
+    types, sequences = emoji_sequence_map
+
+    f.write('\n\n# tuple of emoji sequence types. The index of the type in the tuple is the type id.\n')
+    f.write('emoji_sequence_types = (\n')
+    for name in types:
+        f.write(f' "{name}",\n')
+    f.write(')\n')
+
+    f.write('\n\n# dictionary of RGI emoji sequences (from emoji-sequences.txt and emoji-zwj-sequences.txt)\n')
+    f.write('# entries are: key: (t, name), where\n')
+    f.write('#     key - the code points of the sequence, t - the type id of the sequence, name - the name of the sequence.\n')
+    f.write('emoji_sequence_map = {\n')
+
+    for cps, (type_id, name) in sequences.items():
+        key = ', '.join(f'0x{cp:04x}' for cp in cps)
+        f.write(f' ({key},): ({type_id}, {name!r}),\n')
+
+    f.write('}\n')
+
+
+if __name__ == '__main__':
+    # intentional_map = make_intentional_map()
+    # with open('intentional_map.py', 'w') as f:
+    #     write_intentional_map_file(intentional_map, f)
+    #
+    # confusables_map = make_confusables_map()
+    # with open('confusables_map.py', 'w') as f:
+    #     write_confusables_map(confusables_map, f)
+    #
+    # # ucd.nonunihan.flat.xml
+    # rep_map, reserved_map, block_map = make_ucd_map()
+    #
+    # with open('repertoire_map.py', 'w') as f:
+    #     write_repertoire_map(rep_map, f)
+    #
+    # with open('reserved_map.py', 'w') as f:
+    #     write_reserved_map(reserved_map, f)
+    #
+    # with open('block_map.py', 'w') as f:
+    #     write_block_map(block_map, f)
+    #
+    # with open('script_map.py', 'w') as f:
+    #     write_script_map(make_script_map(rep_map), f)
+    #
+    # with open('bidi_class_map.py', 'w') as f:
+    #     write_bidi_class_map(make_bidi_class_map(rep_map, reserved_map), f)
+    #
+    # with open('grapheme_break_map.py', 'w') as f:
+    #     write_grapheme_break_map(make_grapheme_break_map(rep_map, reserved_map, make_emoji_map()), f)
+    #
+    # id_status_map = make_identifier_status_map()
+    #
+    # with open('identifier_status_map.py', 'w') as f:
+    #     write_identifier_status_map(id_status_map, f)
+
+    id_type_map = make_identifier_type_map()
+
+    with open('identifier_type_map.py', 'w') as f:
+        write_identifier_type_map(id_type_map, f)
+
+    # emoji_map = make_emoji_map()
+    #
+    # with open('emoji_map.py', 'w') as f:
+    #     write_emoji_map(emoji_map, f)
+    #
+    # with open('emoji_sequence_map.py', 'w') as f:
+    #     write_emoji_sequence_map(make_emoji_sequence_map(), f)
+
@@ -1,741 +1,741 @@
-
-
-# dictionary of reserved Unicode character blocks (reserved)
-# fields are: n - name, t - type,  c - code_point, l - last_code_point (for ranges or None)
-#     a - alpha, m - math, nc - non_char, d - deprecated, xs - XID_start, xc - XID_Continue, b - block
-reserved_map = {
- 0x0378: ("", "reserved", 0x0378, 0x0379, 0, 0, 00, 0, 0, "Greek"),
- 0x0380: ("", "reserved", 0x0380, 0x0383, 0, 0, 00, 0, 0, "Greek"),
- 0x038B: ("", "reserved", 0x038B, 0x038B, 0, 0, 00, 0, 0, "Greek"),
- 0x038D: ("", "reserved", 0x038D, 0x038D, 0, 0, 00, 0, 0, "Greek"),
- 0x03A2: ("", "reserved", 0x03A2, 0x03A2, 0, 0, 00, 0, 0, "Greek"),
- 0x0530: ("", "reserved", 0x0530, 0x0530, 0, 0, 00, 0, 0, "Armenian"),
- 0x0557: ("", "reserved", 0x0557, 0x0558, 0, 0, 00, 0, 0, "Armenian"),
- 0x058B: ("", "reserved", 0x058B, 0x058C, 0, 0, 00, 0, 0, "Armenian"),
- 0x0590: ("", "reserved", 0x0590, 0x0590, 0, 0, 00, 0, 0, "Hebrew"),
- 0x05C8: ("", "reserved", 0x05C8, 0x05CF, 0, 0, 00, 0, 0, "Hebrew"),
- 0x05EB: ("", "reserved", 0x05EB, 0x05EE, 0, 0, 00, 0, 0, "Hebrew"),
- 0x05F5: ("", "reserved", 0x05F5, 0x05FF, 0, 0, 00, 0, 0, "Hebrew"),
- 0x061D: ("", "reserved", 0x061D, 0x061D, 0, 0, 00, 0, 0, "Arabic"),
- 0x070E: ("", "reserved", 0x070E, 0x070E, 0, 0, 00, 0, 0, "Syriac"),
- 0x074B: ("", "reserved", 0x074B, 0x074C, 0, 0, 00, 0, 0, "Syriac"),
- 0x07B2: ("", "reserved", 0x07B2, 0x07BF, 0, 0, 00, 0, 0, "Thaana"),
- 0x07FB: ("", "reserved", 0x07FB, 0x07FC, 0, 0, 00, 0, 0, "NKo"),
- 0x082E: ("", "reserved", 0x082E, 0x082F, 0, 0, 00, 0, 0, "Samaritan"),
- 0x083F: ("", "reserved", 0x083F, 0x083F, 0, 0, 00, 0, 0, "Samaritan"),
- 0x085C: ("", "reserved", 0x085C, 0x085D, 0, 0, 00, 0, 0, "Mandaic"),
- 0x085F: ("", "reserved", 0x085F, 0x085F, 0, 0, 00, 0, 0, "Mandaic"),
- 0x086B: ("", "reserved", 0x086B, 0x086F, 0, 0, 00, 0, 0, "Syriac_Sup"),
- 0x0870: ("", "reserved", 0x0870, 0x089F, 0, 0, 00, 0, 0, "NB"),
- 0x08B5: ("", "reserved", 0x08B5, 0x08B5, 0, 0, 00, 0, 0, "Arabic_Ext_A"),
- 0x08BE: ("", "reserved", 0x08BE, 0x08D2, 0, 0, 00, 0, 0, "Arabic_Ext_A"),
- 0x0984: ("", "reserved", 0x0984, 0x0984, 0, 0, 00, 0, 0, "Bengali"),
- 0x098D: ("", "reserved", 0x098D, 0x098E, 0, 0, 00, 0, 0, "Bengali"),
- 0x0991: ("", "reserved", 0x0991, 0x0992, 0, 0, 00, 0, 0, "Bengali"),
- 0x09A9: ("", "reserved", 0x09A9, 0x09A9, 0, 0, 00, 0, 0, "Bengali"),
- 0x09B1: ("", "reserved", 0x09B1, 0x09B1, 0, 0, 00, 0, 0, "Bengali"),
- 0x09B3: ("", "reserved", 0x09B3, 0x09B5, 0, 0, 00, 0, 0, "Bengali"),
- 0x09BA: ("", "reserved", 0x09BA, 0x09BB, 0, 0, 00, 0, 0, "Bengali"),
- 0x09C5: ("", "reserved", 0x09C5, 0x09C6, 0, 0, 00, 0, 0, "Bengali"),
- 0x09C9: ("", "reserved", 0x09C9, 0x09CA, 0, 0, 00, 0, 0, "Bengali"),
- 0x09CF: ("", "reserved", 0x09CF, 0x09D6, 0, 0, 00, 0, 0, "Bengali"),
- 0x09D8: ("", "reserved", 0x09D8, 0x09DB, 0, 0, 00, 0, 0, "Bengali"),
- 0x09DE: ("", "reserved", 0x09DE, 0x09DE, 0, 0, 00, 0, 0, "Bengali"),
- 0x09E4: ("", "reserved", 0x09E4, 0x09E5, 0, 0, 00, 0, 0, "Bengali"),
- 0x09FF: ("", "reserved", 0x09FF, 0x09FF, 0, 0, 00, 0, 0, "Bengali"),
- 0x0A00: ("", "reserved", 0x0A00, 0x0A00, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A04: ("", "reserved", 0x0A04, 0x0A04, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A0B: ("", "reserved", 0x0A0B, 0x0A0E, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A11: ("", "reserved", 0x0A11, 0x0A12, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A29: ("", "reserved", 0x0A29, 0x0A29, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A31: ("", "reserved", 0x0A31, 0x0A31, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A34: ("", "reserved", 0x0A34, 0x0A34, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A37: ("", "reserved", 0x0A37, 0x0A37, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A3A: ("", "reserved", 0x0A3A, 0x0A3B, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A3D: ("", "reserved", 0x0A3D, 0x0A3D, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A43: ("", "reserved", 0x0A43, 0x0A46, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A49: ("", "reserved", 0x0A49, 0x0A4A, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A4E: ("", "reserved", 0x0A4E, 0x0A50, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A52: ("", "reserved", 0x0A52, 0x0A58, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A5D: ("", "reserved", 0x0A5D, 0x0A5D, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A5F: ("", "reserved", 0x0A5F, 0x0A65, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A77: ("", "reserved", 0x0A77, 0x0A7F, 0, 0, 00, 0, 0, "Gurmukhi"),
- 0x0A80: ("", "reserved", 0x0A80, 0x0A80, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0A84: ("", "reserved", 0x0A84, 0x0A84, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0A8E: ("", "reserved", 0x0A8E, 0x0A8E, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0A92: ("", "reserved", 0x0A92, 0x0A92, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AA9: ("", "reserved", 0x0AA9, 0x0AA9, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AB1: ("", "reserved", 0x0AB1, 0x0AB1, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AB4: ("", "reserved", 0x0AB4, 0x0AB4, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0ABA: ("", "reserved", 0x0ABA, 0x0ABB, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AC6: ("", "reserved", 0x0AC6, 0x0AC6, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0ACA: ("", "reserved", 0x0ACA, 0x0ACA, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0ACE: ("", "reserved", 0x0ACE, 0x0ACF, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AD1: ("", "reserved", 0x0AD1, 0x0ADF, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AE4: ("", "reserved", 0x0AE4, 0x0AE5, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0AF2: ("", "reserved", 0x0AF2, 0x0AF8, 0, 0, 00, 0, 0, "Gujarati"),
- 0x0B00: ("", "reserved", 0x0B00, 0x0B00, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B04: ("", "reserved", 0x0B04, 0x0B04, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B0D: ("", "reserved", 0x0B0D, 0x0B0E, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B11: ("", "reserved", 0x0B11, 0x0B12, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B29: ("", "reserved", 0x0B29, 0x0B29, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B31: ("", "reserved", 0x0B31, 0x0B31, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B34: ("", "reserved", 0x0B34, 0x0B34, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B3A: ("", "reserved", 0x0B3A, 0x0B3B, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B45: ("", "reserved", 0x0B45, 0x0B46, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B49: ("", "reserved", 0x0B49, 0x0B4A, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B4E: ("", "reserved", 0x0B4E, 0x0B55, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B58: ("", "reserved", 0x0B58, 0x0B5B, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B5E: ("", "reserved", 0x0B5E, 0x0B5E, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B64: ("", "reserved", 0x0B64, 0x0B65, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B78: ("", "reserved", 0x0B78, 0x0B7F, 0, 0, 00, 0, 0, "Oriya"),
- 0x0B80: ("", "reserved", 0x0B80, 0x0B81, 0, 0, 00, 0, 0, "Tamil"),
- 0x0B84: ("", "reserved", 0x0B84, 0x0B84, 0, 0, 00, 0, 0, "Tamil"),
- 0x0B8B: ("", "reserved", 0x0B8B, 0x0B8D, 0, 0, 00, 0, 0, "Tamil"),
- 0x0B91: ("", "reserved", 0x0B91, 0x0B91, 0, 0, 00, 0, 0, "Tamil"),
- 0x0B96: ("", "reserved", 0x0B96, 0x0B98, 0, 0, 00, 0, 0, "Tamil"),
- 0x0B9B: ("", "reserved", 0x0B9B, 0x0B9B, 0, 0, 00, 0, 0, "Tamil"),
- 0x0B9D: ("", "reserved", 0x0B9D, 0x0B9D, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BA0: ("", "reserved", 0x0BA0, 0x0BA2, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BA5: ("", "reserved", 0x0BA5, 0x0BA7, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BAB: ("", "reserved", 0x0BAB, 0x0BAD, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BBA: ("", "reserved", 0x0BBA, 0x0BBD, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BC3: ("", "reserved", 0x0BC3, 0x0BC5, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BC9: ("", "reserved", 0x0BC9, 0x0BC9, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BCE: ("", "reserved", 0x0BCE, 0x0BCF, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BD1: ("", "reserved", 0x0BD1, 0x0BD6, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BD8: ("", "reserved", 0x0BD8, 0x0BE5, 0, 0, 00, 0, 0, "Tamil"),
- 0x0BFB: ("", "reserved", 0x0BFB, 0x0BFF, 0, 0, 00, 0, 0, "Tamil"),
- 0x0C0D: ("", "reserved", 0x0C0D, 0x0C0D, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C11: ("", "reserved", 0x0C11, 0x0C11, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C29: ("", "reserved", 0x0C29, 0x0C29, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C3A: ("", "reserved", 0x0C3A, 0x0C3C, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C45: ("", "reserved", 0x0C45, 0x0C45, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C49: ("", "reserved", 0x0C49, 0x0C49, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C4E: ("", "reserved", 0x0C4E, 0x0C54, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C57: ("", "reserved", 0x0C57, 0x0C57, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C5B: ("", "reserved", 0x0C5B, 0x0C5F, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C64: ("", "reserved", 0x0C64, 0x0C65, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C70: ("", "reserved", 0x0C70, 0x0C77, 0, 0, 00, 0, 0, "Telugu"),
- 0x0C8D: ("", "reserved", 0x0C8D, 0x0C8D, 0, 0, 00, 0, 0, "Kannada"),
- 0x0C91: ("", "reserved", 0x0C91, 0x0C91, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CA9: ("", "reserved", 0x0CA9, 0x0CA9, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CB4: ("", "reserved", 0x0CB4, 0x0CB4, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CBA: ("", "reserved", 0x0CBA, 0x0CBB, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CC5: ("", "reserved", 0x0CC5, 0x0CC5, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CC9: ("", "reserved", 0x0CC9, 0x0CC9, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CCE: ("", "reserved", 0x0CCE, 0x0CD4, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CD7: ("", "reserved", 0x0CD7, 0x0CDD, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CDF: ("", "reserved", 0x0CDF, 0x0CDF, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CE4: ("", "reserved", 0x0CE4, 0x0CE5, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CF0: ("", "reserved", 0x0CF0, 0x0CF0, 0, 0, 00, 0, 0, "Kannada"),
- 0x0CF3: ("", "reserved", 0x0CF3, 0x0CFF, 0, 0, 00, 0, 0, "Kannada"),
- 0x0D04: ("", "reserved", 0x0D04, 0x0D04, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D0D: ("", "reserved", 0x0D0D, 0x0D0D, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D11: ("", "reserved", 0x0D11, 0x0D11, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D45: ("", "reserved", 0x0D45, 0x0D45, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D49: ("", "reserved", 0x0D49, 0x0D49, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D50: ("", "reserved", 0x0D50, 0x0D53, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D64: ("", "reserved", 0x0D64, 0x0D65, 0, 0, 00, 0, 0, "Malayalam"),
- 0x0D80: ("", "reserved", 0x0D80, 0x0D81, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0D84: ("", "reserved", 0x0D84, 0x0D84, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0D97: ("", "reserved", 0x0D97, 0x0D99, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DB2: ("", "reserved", 0x0DB2, 0x0DB2, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DBC: ("", "reserved", 0x0DBC, 0x0DBC, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DBE: ("", "reserved", 0x0DBE, 0x0DBF, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DC7: ("", "reserved", 0x0DC7, 0x0DC9, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DCB: ("", "reserved", 0x0DCB, 0x0DCE, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DD5: ("", "reserved", 0x0DD5, 0x0DD5, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DD7: ("", "reserved", 0x0DD7, 0x0DD7, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DE0: ("", "reserved", 0x0DE0, 0x0DE5, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DF0: ("", "reserved", 0x0DF0, 0x0DF1, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0DF5: ("", "reserved", 0x0DF5, 0x0DFF, 0, 0, 00, 0, 0, "Sinhala"),
- 0x0E00: ("", "reserved", 0x0E00, 0x0E00, 0, 0, 00, 0, 0, "Thai"),
- 0x0E3B: ("", "reserved", 0x0E3B, 0x0E3E, 0, 0, 00, 0, 0, "Thai"),
- 0x0E5C: ("", "reserved", 0x0E5C, 0x0E7F, 0, 0, 00, 0, 0, "Thai"),
- 0x0E80: ("", "reserved", 0x0E80, 0x0E80, 0, 0, 00, 0, 0, "Lao"),
- 0x0E83: ("", "reserved", 0x0E83, 0x0E83, 0, 0, 00, 0, 0, "Lao"),
- 0x0E85: ("", "reserved", 0x0E85, 0x0E86, 0, 0, 00, 0, 0, "Lao"),
- 0x0E89: ("", "reserved", 0x0E89, 0x0E89, 0, 0, 00, 0, 0, "Lao"),
- 0x0E8B: ("", "reserved", 0x0E8B, 0x0E8C, 0, 0, 00, 0, 0, "Lao"),
- 0x0E8E: ("", "reserved", 0x0E8E, 0x0E93, 0, 0, 00, 0, 0, "Lao"),
- 0x0E98: ("", "reserved", 0x0E98, 0x0E98, 0, 0, 00, 0, 0, "Lao"),
- 0x0EA0: ("", "reserved", 0x0EA0, 0x0EA0, 0, 0, 00, 0, 0, "Lao"),
- 0x0EA4: ("", "reserved", 0x0EA4, 0x0EA4, 0, 0, 00, 0, 0, "Lao"),
- 0x0EA6: ("", "reserved", 0x0EA6, 0x0EA6, 0, 0, 00, 0, 0, "Lao"),
- 0x0EA8: ("", "reserved", 0x0EA8, 0x0EA9, 0, 0, 00, 0, 0, "Lao"),
- 0x0EAC: ("", "reserved", 0x0EAC, 0x0EAC, 0, 0, 00, 0, 0, "Lao"),
- 0x0EBA: ("", "reserved", 0x0EBA, 0x0EBA, 0, 0, 00, 0, 0, "Lao"),
- 0x0EBE: ("", "reserved", 0x0EBE, 0x0EBF, 0, 0, 00, 0, 0, "Lao"),
- 0x0EC5: ("", "reserved", 0x0EC5, 0x0EC5, 0, 0, 00, 0, 0, "Lao"),
- 0x0EC7: ("", "reserved", 0x0EC7, 0x0EC7, 0, 0, 00, 0, 0, "Lao"),
- 0x0ECE: ("", "reserved", 0x0ECE, 0x0ECF, 0, 0, 00, 0, 0, "Lao"),
- 0x0EDA: ("", "reserved", 0x0EDA, 0x0EDB, 0, 0, 00, 0, 0, "Lao"),
- 0x0EE0: ("", "reserved", 0x0EE0, 0x0EFF, 0, 0, 00, 0, 0, "Lao"),
- 0x0F48: ("", "reserved", 0x0F48, 0x0F48, 0, 0, 00, 0, 0, "Tibetan"),
- 0x0F6D: ("", "reserved", 0x0F6D, 0x0F70, 0, 0, 00, 0, 0, "Tibetan"),
- 0x0F98: ("", "reserved", 0x0F98, 0x0F98, 0, 0, 00, 0, 0, "Tibetan"),
- 0x0FBD: ("", "reserved", 0x0FBD, 0x0FBD, 0, 0, 00, 0, 0, "Tibetan"),
- 0x0FCD: ("", "reserved", 0x0FCD, 0x0FCD, 0, 0, 00, 0, 0, "Tibetan"),
- 0x0FDB: ("", "reserved", 0x0FDB, 0x0FFF, 0, 0, 00, 0, 0, "Tibetan"),
- 0x10C6: ("", "reserved", 0x10C6, 0x10C6, 0, 0, 00, 0, 0, "Georgian"),
- 0x10C8: ("", "reserved", 0x10C8, 0x10CC, 0, 0, 00, 0, 0, "Georgian"),
- 0x10CE: ("", "reserved", 0x10CE, 0x10CF, 0, 0, 00, 0, 0, "Georgian"),
- 0x1249: ("", "reserved", 0x1249, 0x1249, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x124E: ("", "reserved", 0x124E, 0x124F, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x1257: ("", "reserved", 0x1257, 0x1257, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x1259: ("", "reserved", 0x1259, 0x1259, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x125E: ("", "reserved", 0x125E, 0x125F, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x1289: ("", "reserved", 0x1289, 0x1289, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x128E: ("", "reserved", 0x128E, 0x128F, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x12B1: ("", "reserved", 0x12B1, 0x12B1, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x12B6: ("", "reserved", 0x12B6, 0x12B7, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x12BF: ("", "reserved", 0x12BF, 0x12BF, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x12C1: ("", "reserved", 0x12C1, 0x12C1, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x12C6: ("", "reserved", 0x12C6, 0x12C7, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x12D7: ("", "reserved", 0x12D7, 0x12D7, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x1311: ("", "reserved", 0x1311, 0x1311, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x1316: ("", "reserved", 0x1316, 0x1317, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x135B: ("", "reserved", 0x135B, 0x135C, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x137D: ("", "reserved", 0x137D, 0x137F, 0, 0, 00, 0, 0, "Ethiopic"),
- 0x139A: ("", "reserved", 0x139A, 0x139F, 0, 0, 00, 0, 0, "Ethiopic_Sup"),
- 0x13F6: ("", "reserved", 0x13F6, 0x13F7, 0, 0, 00, 0, 0, "Cherokee"),
- 0x13FE: ("", "reserved", 0x13FE, 0x13FF, 0, 0, 00, 0, 0, "Cherokee"),
- 0x169D: ("", "reserved", 0x169D, 0x169F, 0, 0, 00, 0, 0, "Ogham"),
- 0x16F9: ("", "reserved", 0x16F9, 0x16FF, 0, 0, 00, 0, 0, "Runic"),
- 0x170D: ("", "reserved", 0x170D, 0x170D, 0, 0, 00, 0, 0, "Tagalog"),
- 0x1715: ("", "reserved", 0x1715, 0x171F, 0, 0, 00, 0, 0, "Tagalog"),
- 0x1737: ("", "reserved", 0x1737, 0x173F, 0, 0, 00, 0, 0, "Hanunoo"),
- 0x1754: ("", "reserved", 0x1754, 0x175F, 0, 0, 00, 0, 0, "Buhid"),
- 0x176D: ("", "reserved", 0x176D, 0x176D, 0, 0, 00, 0, 0, "Tagbanwa"),
- 0x1771: ("", "reserved", 0x1771, 0x1771, 0, 0, 00, 0, 0, "Tagbanwa"),
- 0x1774: ("", "reserved", 0x1774, 0x177F, 0, 0, 00, 0, 0, "Tagbanwa"),
- 0x17DE: ("", "reserved", 0x17DE, 0x17DF, 0, 0, 00, 0, 0, "Khmer"),
- 0x17EA: ("", "reserved", 0x17EA, 0x17EF, 0, 0, 00, 0, 0, "Khmer"),
- 0x17FA: ("", "reserved", 0x17FA, 0x17FF, 0, 0, 00, 0, 0, "Khmer"),
- 0x180F: ("", "reserved", 0x180F, 0x180F, 0, 0, 00, 0, 0, "Mongolian"),
- 0x181A: ("", "reserved", 0x181A, 0x181F, 0, 0, 00, 0, 0, "Mongolian"),
- 0x1879: ("", "reserved", 0x1879, 0x187F, 0, 0, 00, 0, 0, "Mongolian"),
- 0x18AB: ("", "reserved", 0x18AB, 0x18AF, 0, 0, 00, 0, 0, "Mongolian"),
- 0x18F6: ("", "reserved", 0x18F6, 0x18FF, 0, 0, 00, 0, 0, "UCAS_Ext"),
- 0x191F: ("", "reserved", 0x191F, 0x191F, 0, 0, 00, 0, 0, "Limbu"),
- 0x192C: ("", "reserved", 0x192C, 0x192F, 0, 0, 00, 0, 0, "Limbu"),
- 0x193C: ("", "reserved", 0x193C, 0x193F, 0, 0, 00, 0, 0, "Limbu"),
- 0x1941: ("", "reserved", 0x1941, 0x1943, 0, 0, 00, 0, 0, "Limbu"),
- 0x196E: ("", "reserved", 0x196E, 0x196F, 0, 0, 00, 0, 0, "Tai_Le"),
- 0x1975: ("", "reserved", 0x1975, 0x197F, 0, 0, 00, 0, 0, "Tai_Le"),
- 0x19AC: ("", "reserved", 0x19AC, 0x19AF, 0, 0, 00, 0, 0, "New_Tai_Lue"),
- 0x19CA: ("", "reserved", 0x19CA, 0x19CF, 0, 0, 00, 0, 0, "New_Tai_Lue"),
- 0x19DB: ("", "reserved", 0x19DB, 0x19DD, 0, 0, 00, 0, 0, "New_Tai_Lue"),
- 0x1A1C: ("", "reserved", 0x1A1C, 0x1A1D, 0, 0, 00, 0, 0, "Buginese"),
- 0x1A5F: ("", "reserved", 0x1A5F, 0x1A5F, 0, 0, 00, 0, 0, "Tai_Tham"),
- 0x1A7D: ("", "reserved", 0x1A7D, 0x1A7E, 0, 0, 00, 0, 0, "Tai_Tham"),
- 0x1A8A: ("", "reserved", 0x1A8A, 0x1A8F, 0, 0, 00, 0, 0, "Tai_Tham"),
- 0x1A9A: ("", "reserved", 0x1A9A, 0x1A9F, 0, 0, 00, 0, 0, "Tai_Tham"),
- 0x1AAE: ("", "reserved", 0x1AAE, 0x1AAF, 0, 0, 00, 0, 0, "Tai_Tham"),
- 0x1ABF: ("", "reserved", 0x1ABF, 0x1AFF, 0, 0, 00, 0, 0, "Diacriticals_Ext"),
- 0x1B4C: ("", "reserved", 0x1B4C, 0x1B4F, 0, 0, 00, 0, 0, "Balinese"),
- 0x1B7D: ("", "reserved", 0x1B7D, 0x1B7F, 0, 0, 00, 0, 0, "Balinese"),
- 0x1BF4: ("", "reserved", 0x1BF4, 0x1BFB, 0, 0, 00, 0, 0, "Batak"),
- 0x1C38: ("", "reserved", 0x1C38, 0x1C3A, 0, 0, 00, 0, 0, "Lepcha"),
- 0x1C4A: ("", "reserved", 0x1C4A, 0x1C4C, 0, 0, 00, 0, 0, "Lepcha"),
- 0x1C89: ("", "reserved", 0x1C89, 0x1C8F, 0, 0, 00, 0, 0, "Cyrillic_Ext_C"),
- 0x1CBB: ("", "reserved", 0x1CBB, 0x1CBC, 0, 0, 00, 0, 0, "Georgian_Ext"),
- 0x1CC8: ("", "reserved", 0x1CC8, 0x1CCF, 0, 0, 00, 0, 0, "Sundanese_Sup"),
- 0x1CFA: ("", "reserved", 0x1CFA, 0x1CFF, 0, 0, 00, 0, 0, "Vedic_Ext"),
- 0x1DFA: ("", "reserved", 0x1DFA, 0x1DFA, 0, 0, 00, 0, 0, "Diacriticals_Sup"),
- 0x1F16: ("", "reserved", 0x1F16, 0x1F17, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F1E: ("", "reserved", 0x1F1E, 0x1F1F, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F46: ("", "reserved", 0x1F46, 0x1F47, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F4E: ("", "reserved", 0x1F4E, 0x1F4F, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F58: ("", "reserved", 0x1F58, 0x1F58, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F5A: ("", "reserved", 0x1F5A, 0x1F5A, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F5C: ("", "reserved", 0x1F5C, 0x1F5C, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F5E: ("", "reserved", 0x1F5E, 0x1F5E, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1F7E: ("", "reserved", 0x1F7E, 0x1F7F, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FB5: ("", "reserved", 0x1FB5, 0x1FB5, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FC5: ("", "reserved", 0x1FC5, 0x1FC5, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FD4: ("", "reserved", 0x1FD4, 0x1FD5, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FDC: ("", "reserved", 0x1FDC, 0x1FDC, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FF0: ("", "reserved", 0x1FF0, 0x1FF1, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FF5: ("", "reserved", 0x1FF5, 0x1FF5, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x1FFF: ("", "reserved", 0x1FFF, 0x1FFF, 0, 0, 00, 0, 0, "Greek_Ext"),
- 0x2065: ("", "reserved", 0x2065, 0x2065, 0, 0, 00, 0, 0, "Punctuation"),
- 0x2072: ("", "reserved", 0x2072, 0x2073, 0, 0, 00, 0, 0, "Super_And_Sub"),
- 0x208F: ("", "reserved", 0x208F, 0x208F, 0, 0, 00, 0, 0, "Super_And_Sub"),
- 0x209D: ("", "reserved", 0x209D, 0x209F, 0, 0, 00, 0, 0, "Super_And_Sub"),
- 0x20C0: ("", "reserved", 0x20C0, 0x20CF, 0, 0, 00, 0, 0, "Currency_Symbols"),
- 0x20F1: ("", "reserved", 0x20F1, 0x20FF, 0, 0, 00, 0, 0, "Diacriticals_For_Symbols"),
- 0x218C: ("", "reserved", 0x218C, 0x218F, 0, 0, 00, 0, 0, "Number_Forms"),
- 0x2427: ("", "reserved", 0x2427, 0x243F, 0, 0, 00, 0, 0, "Control_Pictures"),
- 0x244B: ("", "reserved", 0x244B, 0x245F, 0, 0, 00, 0, 0, "OCR"),
- 0x2B74: ("", "reserved", 0x2B74, 0x2B75, 0, 0, 00, 0, 0, "Misc_Arrows"),
- 0x2B96: ("", "reserved", 0x2B96, 0x2B97, 0, 0, 00, 0, 0, "Misc_Arrows"),
- 0x2BC9: ("", "reserved", 0x2BC9, 0x2BC9, 0, 0, 00, 0, 0, "Misc_Arrows"),
- 0x2BFF: ("", "reserved", 0x2BFF, 0x2BFF, 0, 0, 00, 0, 0, "Misc_Arrows"),
- 0x2C2F: ("", "reserved", 0x2C2F, 0x2C2F, 0, 0, 00, 0, 0, "Glagolitic"),
- 0x2C5F: ("", "reserved", 0x2C5F, 0x2C5F, 0, 0, 00, 0, 0, "Glagolitic"),
- 0x2CF4: ("", "reserved", 0x2CF4, 0x2CF8, 0, 0, 00, 0, 0, "Coptic"),
- 0x2D26: ("", "reserved", 0x2D26, 0x2D26, 0, 0, 00, 0, 0, "Georgian_Sup"),
- 0x2D28: ("", "reserved", 0x2D28, 0x2D2C, 0, 0, 00, 0, 0, "Georgian_Sup"),
- 0x2D2E: ("", "reserved", 0x2D2E, 0x2D2F, 0, 0, 00, 0, 0, "Georgian_Sup"),
- 0x2D68: ("", "reserved", 0x2D68, 0x2D6E, 0, 0, 00, 0, 0, "Tifinagh"),
- 0x2D71: ("", "reserved", 0x2D71, 0x2D7E, 0, 0, 00, 0, 0, "Tifinagh"),
- 0x2D97: ("", "reserved", 0x2D97, 0x2D9F, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DA7: ("", "reserved", 0x2DA7, 0x2DA7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DAF: ("", "reserved", 0x2DAF, 0x2DAF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DB7: ("", "reserved", 0x2DB7, 0x2DB7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DBF: ("", "reserved", 0x2DBF, 0x2DBF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DC7: ("", "reserved", 0x2DC7, 0x2DC7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DCF: ("", "reserved", 0x2DCF, 0x2DCF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DD7: ("", "reserved", 0x2DD7, 0x2DD7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2DDF: ("", "reserved", 0x2DDF, 0x2DDF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
- 0x2E4F: ("", "reserved", 0x2E4F, 0x2E7F, 0, 0, 00, 0, 0, "Sup_Punctuation"),
- 0x2E9A: ("", "reserved", 0x2E9A, 0x2E9A, 0, 0, 00, 0, 0, "CJK_Radicals_Sup"),
- 0x2EF4: ("", "reserved", 0x2EF4, 0x2EFF, 0, 0, 00, 0, 0, "CJK_Radicals_Sup"),
- 0x2FD6: ("", "reserved", 0x2FD6, 0x2FDF, 0, 0, 00, 0, 0, "Kangxi"),
- 0x2FE0: ("", "reserved", 0x2FE0, 0x2FEF, 0, 0, 00, 0, 0, "NB"),
- 0x2FFC: ("", "reserved", 0x2FFC, 0x2FFF, 0, 0, 00, 0, 0, "IDC"),
- 0x3040: ("", "reserved", 0x3040, 0x3040, 0, 0, 00, 0, 0, "Hiragana"),
- 0x3097: ("", "reserved", 0x3097, 0x3098, 0, 0, 00, 0, 0, "Hiragana"),
- 0x3100: ("", "reserved", 0x3100, 0x3104, 0, 0, 00, 0, 0, "Bopomofo"),
- 0x3130: ("", "reserved", 0x3130, 0x3130, 0, 0, 00, 0, 0, "Compat_Jamo"),
- 0x318F: ("", "reserved", 0x318F, 0x318F, 0, 0, 00, 0, 0, "Compat_Jamo"),
- 0x31BB: ("", "reserved", 0x31BB, 0x31BF, 0, 0, 00, 0, 0, "Bopomofo_Ext"),
- 0x31E4: ("", "reserved", 0x31E4, 0x31EF, 0, 0, 00, 0, 0, "CJK_Strokes"),
- 0x321F: ("", "reserved", 0x321F, 0x321F, 0, 0, 00, 0, 0, "Enclosed_CJK"),
- 0x32FF: ("", "reserved", 0x32FF, 0x32FF, 0, 0, 00, 0, 0, "Enclosed_CJK"),
- 0x4DB6: ("", "reserved", 0x4DB6, 0x4DBF, 0, 0, 00, 0, 0, "CJK_Ext_A"),
- 0x9FF0: ("", "reserved", 0x9FF0, 0x9FFF, 0, 0, 00, 0, 0, "CJK"),
- 0xA48D: ("", "reserved", 0xA48D, 0xA48F, 0, 0, 00, 0, 0, "Yi_Syllables"),
- 0xA4C7: ("", "reserved", 0xA4C7, 0xA4CF, 0, 0, 00, 0, 0, "Yi_Radicals"),
- 0xA62C: ("", "reserved", 0xA62C, 0xA63F, 0, 0, 00, 0, 0, "Vai"),
- 0xA6F8: ("", "reserved", 0xA6F8, 0xA6FF, 0, 0, 00, 0, 0, "Bamum"),
- 0xA7BA: ("", "reserved", 0xA7BA, 0xA7F6, 0, 0, 00, 0, 0, "Latin_Ext_D"),
- 0xA82C: ("", "reserved", 0xA82C, 0xA82F, 0, 0, 00, 0, 0, "Syloti_Nagri"),
- 0xA83A: ("", "reserved", 0xA83A, 0xA83F, 0, 0, 00, 0, 0, "Indic_Number_Forms"),
- 0xA878: ("", "reserved", 0xA878, 0xA87F, 0, 0, 00, 0, 0, "Phags_Pa"),
- 0xA8C6: ("", "reserved", 0xA8C6, 0xA8CD, 0, 0, 00, 0, 0, "Saurashtra"),
- 0xA8DA: ("", "reserved", 0xA8DA, 0xA8DF, 0, 0, 00, 0, 0, "Saurashtra"),
- 0xA954: ("", "reserved", 0xA954, 0xA95E, 0, 0, 00, 0, 0, "Rejang"),
- 0xA97D: ("", "reserved", 0xA97D, 0xA97F, 0, 0, 00, 0, 0, "Jamo_Ext_A"),
- 0xA9CE: ("", "reserved", 0xA9CE, 0xA9CE, 0, 0, 00, 0, 0, "Javanese"),
- 0xA9DA: ("", "reserved", 0xA9DA, 0xA9DD, 0, 0, 00, 0, 0, "Javanese"),
- 0xA9FF: ("", "reserved", 0xA9FF, 0xA9FF, 0, 0, 00, 0, 0, "Myanmar_Ext_B"),
- 0xAA37: ("", "reserved", 0xAA37, 0xAA3F, 0, 0, 00, 0, 0, "Cham"),
- 0xAA4E: ("", "reserved", 0xAA4E, 0xAA4F, 0, 0, 00, 0, 0, "Cham"),
- 0xAA5A: ("", "reserved", 0xAA5A, 0xAA5B, 0, 0, 00, 0, 0, "Cham"),
- 0xAAC3: ("", "reserved", 0xAAC3, 0xAADA, 0, 0, 00, 0, 0, "Tai_Viet"),
- 0xAAF7: ("", "reserved", 0xAAF7, 0xAAFF, 0, 0, 00, 0, 0, "Meetei_Mayek_Ext"),
- 0xAB00: ("", "reserved", 0xAB00, 0xAB00, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
- 0xAB07: ("", "reserved", 0xAB07, 0xAB08, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
- 0xAB0F: ("", "reserved", 0xAB0F, 0xAB10, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
- 0xAB17: ("", "reserved", 0xAB17, 0xAB1F, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
- 0xAB27: ("", "reserved", 0xAB27, 0xAB27, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
- 0xAB2F: ("", "reserved", 0xAB2F, 0xAB2F, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
- 0xAB66: ("", "reserved", 0xAB66, 0xAB6F, 0, 0, 00, 0, 0, "Latin_Ext_E"),
- 0xABEE: ("", "reserved", 0xABEE, 0xABEF, 0, 0, 00, 0, 0, "Meetei_Mayek"),
- 0xABFA: ("", "reserved", 0xABFA, 0xABFF, 0, 0, 00, 0, 0, "Meetei_Mayek"),
- 0xD7A4: ("", "reserved", 0xD7A4, 0xD7AF, 0, 0, 00, 0, 0, "Hangul"),
- 0xD7C7: ("", "reserved", 0xD7C7, 0xD7CA, 0, 0, 00, 0, 0, "Jamo_Ext_B"),
- 0xD7FC: ("", "reserved", 0xD7FC, 0xD7FF, 0, 0, 00, 0, 0, "Jamo_Ext_B"),
- 0xD800: ("", "surrogate", 0xD800, 0xDB7F, 0, 0, 00, 0, 0, "High_Surrogates"),
- 0xDB80: ("", "surrogate", 0xDB80, 0xDBFF, 0, 0, 00, 0, 0, "High_PU_Surrogates"),
- 0xDC00: ("", "surrogate", 0xDC00, 0xDFFF, 0, 0, 00, 0, 0, "Low_Surrogates"),
- 0xFA6E: ("", "reserved", 0xFA6E, 0xFA6F, 0, 0, 00, 0, 0, "CJK_Compat_Ideographs"),
- 0xFADA: ("", "reserved", 0xFADA, 0xFAFF, 0, 0, 00, 0, 0, "CJK_Compat_Ideographs"),
- 0xFB07: ("", "reserved", 0xFB07, 0xFB12, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFB18: ("", "reserved", 0xFB18, 0xFB1C, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFB37: ("", "reserved", 0xFB37, 0xFB37, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFB3D: ("", "reserved", 0xFB3D, 0xFB3D, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFB3F: ("", "reserved", 0xFB3F, 0xFB3F, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFB42: ("", "reserved", 0xFB42, 0xFB42, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFB45: ("", "reserved", 0xFB45, 0xFB45, 0, 0, 00, 0, 0, "Alphabetic_PF"),
- 0xFBC2: ("", "reserved", 0xFBC2, 0xFBD2, 0, 0, 00, 0, 0, "Arabic_PF_A"),
- 0xFD40: ("", "reserved", 0xFD40, 0xFD4F, 0, 0, 00, 0, 0, "Arabic_PF_A"),
- 0xFD90: ("", "reserved", 0xFD90, 0xFD91, 0, 0, 00, 0, 0, "Arabic_PF_A"),
- 0xFDC8: ("", "reserved", 0xFDC8, 0xFDCF, 0, 0, 00, 0, 0, "Arabic_PF_A"),
- 0xFDD0: ("", "noncharacter", 0xFDD0, 0xFDEF, 0, 0, 10, 0, 0, "Arabic_PF_A"),
- 0xFDFE: ("", "reserved", 0xFDFE, 0xFDFF, 0, 0, 00, 0, 0, "Arabic_PF_A"),
- 0xFE1A: ("", "reserved", 0xFE1A, 0xFE1F, 0, 0, 00, 0, 0, "Vertical_Forms"),
- 0xFE53: ("", "reserved", 0xFE53, 0xFE53, 0, 0, 00, 0, 0, "Small_Forms"),
- 0xFE67: ("", "reserved", 0xFE67, 0xFE67, 0, 0, 00, 0, 0, "Small_Forms"),
- 0xFE6C: ("", "reserved", 0xFE6C, 0xFE6F, 0, 0, 00, 0, 0, "Small_Forms"),
- 0xFE75: ("", "reserved", 0xFE75, 0xFE75, 0, 0, 00, 0, 0, "Arabic_PF_B"),
- 0xFEFD: ("", "reserved", 0xFEFD, 0xFEFE, 0, 0, 00, 0, 0, "Arabic_PF_B"),
- 0xFF00: ("", "reserved", 0xFF00, 0xFF00, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFBF: ("", "reserved", 0xFFBF, 0xFFC1, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFC8: ("", "reserved", 0xFFC8, 0xFFC9, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFD0: ("", "reserved", 0xFFD0, 0xFFD1, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFD8: ("", "reserved", 0xFFD8, 0xFFD9, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFDD: ("", "reserved", 0xFFDD, 0xFFDF, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFE7: ("", "reserved", 0xFFE7, 0xFFE7, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFEF: ("", "reserved", 0xFFEF, 0xFFEF, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
- 0xFFF0: ("", "reserved", 0xFFF0, 0xFFF8, 0, 0, 00, 0, 0, "Specials"),
- 0xFFFE: ("", "noncharacter", 0xFFFE, 0xFFFF, 0, 0, 10, 0, 0, "Specials"),
- 0x1000C: ("", "reserved", 0x1000C, 0x1000C, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
- 0x10027: ("", "reserved", 0x10027, 0x10027, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
- 0x1003B: ("", "reserved", 0x1003B, 0x1003B, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
- 0x1003E: ("", "reserved", 0x1003E, 0x1003E, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
- 0x1004E: ("", "reserved", 0x1004E, 0x1004F, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
- 0x1005E: ("", "reserved", 0x1005E, 0x1007F, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
- 0x100FB: ("", "reserved", 0x100FB, 0x100FF, 0, 0, 00, 0, 0, "Linear_B_Ideograms"),
- 0x10103: ("", "reserved", 0x10103, 0x10106, 0, 0, 00, 0, 0, "Aegean_Numbers"),
- 0x10134: ("", "reserved", 0x10134, 0x10136, 0, 0, 00, 0, 0, "Aegean_Numbers"),
- 0x1018F: ("", "reserved", 0x1018F, 0x1018F, 0, 0, 00, 0, 0, "Ancient_Greek_Numbers"),
- 0x1019C: ("", "reserved", 0x1019C, 0x1019F, 0, 0, 00, 0, 0, "Ancient_Symbols"),
- 0x101A1: ("", "reserved", 0x101A1, 0x101CF, 0, 0, 00, 0, 0, "Ancient_Symbols"),
- 0x101FE: ("", "reserved", 0x101FE, 0x101FF, 0, 0, 00, 0, 0, "Phaistos"),
- 0x10200: ("", "reserved", 0x10200, 0x1027F, 0, 0, 00, 0, 0, "NB"),
- 0x1029D: ("", "reserved", 0x1029D, 0x1029F, 0, 0, 00, 0, 0, "Lycian"),
- 0x102D1: ("", "reserved", 0x102D1, 0x102DF, 0, 0, 00, 0, 0, "Carian"),
- 0x102FC: ("", "reserved", 0x102FC, 0x102FF, 0, 0, 00, 0, 0, "Coptic_Epact_Numbers"),
- 0x10324: ("", "reserved", 0x10324, 0x1032C, 0, 0, 00, 0, 0, "Old_Italic"),
- 0x1034B: ("", "reserved", 0x1034B, 0x1034F, 0, 0, 00, 0, 0, "Gothic"),
- 0x1037B: ("", "reserved", 0x1037B, 0x1037F, 0, 0, 00, 0, 0, "Old_Permic"),
- 0x1039E: ("", "reserved", 0x1039E, 0x1039E, 0, 0, 00, 0, 0, "Ugaritic"),
- 0x103C4: ("", "reserved", 0x103C4, 0x103C7, 0, 0, 00, 0, 0, "Old_Persian"),
- 0x103D6: ("", "reserved", 0x103D6, 0x103DF, 0, 0, 00, 0, 0, "Old_Persian"),
- 0x103E0: ("", "reserved", 0x103E0, 0x103FF, 0, 0, 00, 0, 0, "NB"),
- 0x1049E: ("", "reserved", 0x1049E, 0x1049F, 0, 0, 00, 0, 0, "Osmanya"),
- 0x104AA: ("", "reserved", 0x104AA, 0x104AF, 0, 0, 00, 0, 0, "Osmanya"),
- 0x104D4: ("", "reserved", 0x104D4, 0x104D7, 0, 0, 00, 0, 0, "Osage"),
- 0x104FC: ("", "reserved", 0x104FC, 0x104FF, 0, 0, 00, 0, 0, "Osage"),
- 0x10528: ("", "reserved", 0x10528, 0x1052F, 0, 0, 00, 0, 0, "Elbasan"),
- 0x10564: ("", "reserved", 0x10564, 0x1056E, 0, 0, 00, 0, 0, "Caucasian_Albanian"),
- 0x10570: ("", "reserved", 0x10570, 0x105FF, 0, 0, 00, 0, 0, "NB"),
- 0x10737: ("", "reserved", 0x10737, 0x1073F, 0, 0, 00, 0, 0, "Linear_A"),
- 0x10756: ("", "reserved", 0x10756, 0x1075F, 0, 0, 00, 0, 0, "Linear_A"),
- 0x10768: ("", "reserved", 0x10768, 0x1077F, 0, 0, 00, 0, 0, "Linear_A"),
- 0x10780: ("", "reserved", 0x10780, 0x107FF, 0, 0, 00, 0, 0, "NB"),
- 0x10806: ("", "reserved", 0x10806, 0x10807, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
- 0x10809: ("", "reserved", 0x10809, 0x10809, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
- 0x10836: ("", "reserved", 0x10836, 0x10836, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
- 0x10839: ("", "reserved", 0x10839, 0x1083B, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
- 0x1083D: ("", "reserved", 0x1083D, 0x1083E, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
- 0x10856: ("", "reserved", 0x10856, 0x10856, 0, 0, 00, 0, 0, "Imperial_Aramaic"),
- 0x1089F: ("", "reserved", 0x1089F, 0x108A6, 0, 0, 00, 0, 0, "Nabataean"),
- 0x108B0: ("", "reserved", 0x108B0, 0x108DF, 0, 0, 00, 0, 0, "NB"),
- 0x108F3: ("", "reserved", 0x108F3, 0x108F3, 0, 0, 00, 0, 0, "Hatran"),
- 0x108F6: ("", "reserved", 0x108F6, 0x108FA, 0, 0, 00, 0, 0, "Hatran"),
- 0x1091C: ("", "reserved", 0x1091C, 0x1091E, 0, 0, 00, 0, 0, "Phoenician"),
- 0x1093A: ("", "reserved", 0x1093A, 0x1093E, 0, 0, 00, 0, 0, "Lydian"),
- 0x10940: ("", "reserved", 0x10940, 0x1097F, 0, 0, 00, 0, 0, "NB"),
- 0x109B8: ("", "reserved", 0x109B8, 0x109BB, 0, 0, 00, 0, 0, "Meroitic_Cursive"),
- 0x109D0: ("", "reserved", 0x109D0, 0x109D1, 0, 0, 00, 0, 0, "Meroitic_Cursive"),
- 0x10A04: ("", "reserved", 0x10A04, 0x10A04, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A07: ("", "reserved", 0x10A07, 0x10A0B, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A14: ("", "reserved", 0x10A14, 0x10A14, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A18: ("", "reserved", 0x10A18, 0x10A18, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A36: ("", "reserved", 0x10A36, 0x10A37, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A3B: ("", "reserved", 0x10A3B, 0x10A3E, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A49: ("", "reserved", 0x10A49, 0x10A4F, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10A59: ("", "reserved", 0x10A59, 0x10A5F, 0, 0, 00, 0, 0, "Kharoshthi"),
- 0x10AA0: ("", "reserved", 0x10AA0, 0x10ABF, 0, 0, 00, 0, 0, "NB"),
- 0x10AE7: ("", "reserved", 0x10AE7, 0x10AEA, 0, 0, 00, 0, 0, "Manichaean"),
- 0x10AF7: ("", "reserved", 0x10AF7, 0x10AFF, 0, 0, 00, 0, 0, "Manichaean"),
- 0x10B36: ("", "reserved", 0x10B36, 0x10B38, 0, 0, 00, 0, 0, "Avestan"),
- 0x10B56: ("", "reserved", 0x10B56, 0x10B57, 0, 0, 00, 0, 0, "Inscriptional_Parthian"),
- 0x10B73: ("", "reserved", 0x10B73, 0x10B77, 0, 0, 00, 0, 0, "Inscriptional_Pahlavi"),
- 0x10B92: ("", "reserved", 0x10B92, 0x10B98, 0, 0, 00, 0, 0, "Psalter_Pahlavi"),
- 0x10B9D: ("", "reserved", 0x10B9D, 0x10BA8, 0, 0, 00, 0, 0, "Psalter_Pahlavi"),
- 0x10BB0: ("", "reserved", 0x10BB0, 0x10BFF, 0, 0, 00, 0, 0, "NB"),
- 0x10C49: ("", "reserved", 0x10C49, 0x10C4F, 0, 0, 00, 0, 0, "Old_Turkic"),
- 0x10C50: ("", "reserved", 0x10C50, 0x10C7F, 0, 0, 00, 0, 0, "NB"),
- 0x10CB3: ("", "reserved", 0x10CB3, 0x10CBF, 0, 0, 00, 0, 0, "Old_Hungarian"),
- 0x10CF3: ("", "reserved", 0x10CF3, 0x10CF9, 0, 0, 00, 0, 0, "Old_Hungarian"),
- 0x10D28: ("", "reserved", 0x10D28, 0x10D2F, 0, 0, 00, 0, 0, "Hanifi_Rohingya"),
- 0x10D3A: ("", "reserved", 0x10D3A, 0x10D3F, 0, 0, 00, 0, 0, "Hanifi_Rohingya"),
- 0x10D40: ("", "reserved", 0x10D40, 0x10E5F, 0, 0, 00, 0, 0, "NB"),
- 0x10E7F: ("", "reserved", 0x10E7F, 0x10E7F, 0, 0, 00, 0, 0, "Rumi"),
- 0x10E80: ("", "reserved", 0x10E80, 0x10EFF, 0, 0, 00, 0, 0, "NB"),
- 0x10F28: ("", "reserved", 0x10F28, 0x10F2F, 0, 0, 00, 0, 0, "Old_Sogdian"),
- 0x10F5A: ("", "reserved", 0x10F5A, 0x10F6F, 0, 0, 00, 0, 0, "Sogdian"),
- 0x10F70: ("", "reserved", 0x10F70, 0x10FFF, 0, 0, 00, 0, 0, "NB"),
- 0x1104E: ("", "reserved", 0x1104E, 0x11051, 0, 0, 00, 0, 0, "Brahmi"),
- 0x11070: ("", "reserved", 0x11070, 0x1107E, 0, 0, 00, 0, 0, "Brahmi"),
- 0x110C2: ("", "reserved", 0x110C2, 0x110CC, 0, 0, 00, 0, 0, "Kaithi"),
- 0x110CE: ("", "reserved", 0x110CE, 0x110CF, 0, 0, 00, 0, 0, "Kaithi"),
- 0x110E9: ("", "reserved", 0x110E9, 0x110EF, 0, 0, 00, 0, 0, "Sora_Sompeng"),
- 0x110FA: ("", "reserved", 0x110FA, 0x110FF, 0, 0, 00, 0, 0, "Sora_Sompeng"),
- 0x11135: ("", "reserved", 0x11135, 0x11135, 0, 0, 00, 0, 0, "Chakma"),
- 0x11147: ("", "reserved", 0x11147, 0x1114F, 0, 0, 00, 0, 0, "Chakma"),
- 0x11177: ("", "reserved", 0x11177, 0x1117F, 0, 0, 00, 0, 0, "Mahajani"),
- 0x111CE: ("", "reserved", 0x111CE, 0x111CF, 0, 0, 00, 0, 0, "Sharada"),
- 0x111E0: ("", "reserved", 0x111E0, 0x111E0, 0, 0, 00, 0, 0, "Sinhala_Archaic_Numbers"),
- 0x111F5: ("", "reserved", 0x111F5, 0x111FF, 0, 0, 00, 0, 0, "Sinhala_Archaic_Numbers"),
- 0x11212: ("", "reserved", 0x11212, 0x11212, 0, 0, 00, 0, 0, "Khojki"),
- 0x1123F: ("", "reserved", 0x1123F, 0x1124F, 0, 0, 00, 0, 0, "Khojki"),
- 0x11250: ("", "reserved", 0x11250, 0x1127F, 0, 0, 00, 0, 0, "NB"),
- 0x11287: ("", "reserved", 0x11287, 0x11287, 0, 0, 00, 0, 0, "Multani"),
- 0x11289: ("", "reserved", 0x11289, 0x11289, 0, 0, 00, 0, 0, "Multani"),
- 0x1128E: ("", "reserved", 0x1128E, 0x1128E, 0, 0, 00, 0, 0, "Multani"),
- 0x1129E: ("", "reserved", 0x1129E, 0x1129E, 0, 0, 00, 0, 0, "Multani"),
- 0x112AA: ("", "reserved", 0x112AA, 0x112AF, 0, 0, 00, 0, 0, "Multani"),
- 0x112EB: ("", "reserved", 0x112EB, 0x112EF, 0, 0, 00, 0, 0, "Khudawadi"),
- 0x112FA: ("", "reserved", 0x112FA, 0x112FF, 0, 0, 00, 0, 0, "Khudawadi"),
- 0x11304: ("", "reserved", 0x11304, 0x11304, 0, 0, 00, 0, 0, "Grantha"),
- 0x1130D: ("", "reserved", 0x1130D, 0x1130E, 0, 0, 00, 0, 0, "Grantha"),
- 0x11311: ("", "reserved", 0x11311, 0x11312, 0, 0, 00, 0, 0, "Grantha"),
- 0x11329: ("", "reserved", 0x11329, 0x11329, 0, 0, 00, 0, 0, "Grantha"),
- 0x11331: ("", "reserved", 0x11331, 0x11331, 0, 0, 00, 0, 0, "Grantha"),
- 0x11334: ("", "reserved", 0x11334, 0x11334, 0, 0, 00, 0, 0, "Grantha"),
- 0x1133A: ("", "reserved", 0x1133A, 0x1133A, 0, 0, 00, 0, 0, "Grantha"),
- 0x11345: ("", "reserved", 0x11345, 0x11346, 0, 0, 00, 0, 0, "Grantha"),
- 0x11349: ("", "reserved", 0x11349, 0x1134A, 0, 0, 00, 0, 0, "Grantha"),
- 0x1134E: ("", "reserved", 0x1134E, 0x1134F, 0, 0, 00, 0, 0, "Grantha"),
- 0x11351: ("", "reserved", 0x11351, 0x11356, 0, 0, 00, 0, 0, "Grantha"),
- 0x11358: ("", "reserved", 0x11358, 0x1135C, 0, 0, 00, 0, 0, "Grantha"),
- 0x11364: ("", "reserved", 0x11364, 0x11365, 0, 0, 00, 0, 0, "Grantha"),
- 0x1136D: ("", "reserved", 0x1136D, 0x1136F, 0, 0, 00, 0, 0, "Grantha"),
- 0x11375: ("", "reserved", 0x11375, 0x1137F, 0, 0, 00, 0, 0, "Grantha"),
- 0x11380: ("", "reserved", 0x11380, 0x113FF, 0, 0, 00, 0, 0, "NB"),
- 0x1145A: ("", "reserved", 0x1145A, 0x1145A, 0, 0, 00, 0, 0, "Newa"),
- 0x1145C: ("", "reserved", 0x1145C, 0x1145C, 0, 0, 00, 0, 0, "Newa"),
- 0x1145F: ("", "reserved", 0x1145F, 0x1147F, 0, 0, 00, 0, 0, "Newa"),
- 0x114C8: ("", "reserved", 0x114C8, 0x114CF, 0, 0, 00, 0, 0, "Tirhuta"),
- 0x114DA: ("", "reserved", 0x114DA, 0x114DF, 0, 0, 00, 0, 0, "Tirhuta"),
- 0x114E0: ("", "reserved", 0x114E0, 0x1157F, 0, 0, 00, 0, 0, "NB"),
- 0x115B6: ("", "reserved", 0x115B6, 0x115B7, 0, 0, 00, 0, 0, "Siddham"),
- 0x115DE: ("", "reserved", 0x115DE, 0x115FF, 0, 0, 00, 0, 0, "Siddham"),
- 0x11645: ("", "reserved", 0x11645, 0x1164F, 0, 0, 00, 0, 0, "Modi"),
- 0x1165A: ("", "reserved", 0x1165A, 0x1165F, 0, 0, 00, 0, 0, "Modi"),
- 0x1166D: ("", "reserved", 0x1166D, 0x1167F, 0, 0, 00, 0, 0, "Mongolian_Sup"),
- 0x116B8: ("", "reserved", 0x116B8, 0x116BF, 0, 0, 00, 0, 0, "Takri"),
- 0x116CA: ("", "reserved", 0x116CA, 0x116CF, 0, 0, 00, 0, 0, "Takri"),
- 0x116D0: ("", "reserved", 0x116D0, 0x116FF, 0, 0, 00, 0, 0, "NB"),
- 0x1171B: ("", "reserved", 0x1171B, 0x1171C, 0, 0, 00, 0, 0, "Ahom"),
- 0x1172C: ("", "reserved", 0x1172C, 0x1172F, 0, 0, 00, 0, 0, "Ahom"),
- 0x11740: ("", "reserved", 0x11740, 0x117FF, 0, 0, 00, 0, 0, "NB"),
- 0x1183C: ("", "reserved", 0x1183C, 0x1184F, 0, 0, 00, 0, 0, "Dogra"),
- 0x11850: ("", "reserved", 0x11850, 0x1189F, 0, 0, 00, 0, 0, "NB"),
- 0x118F3: ("", "reserved", 0x118F3, 0x118FE, 0, 0, 00, 0, 0, "Warang_Citi"),
- 0x11900: ("", "reserved", 0x11900, 0x119FF, 0, 0, 00, 0, 0, "NB"),
- 0x11A48: ("", "reserved", 0x11A48, 0x11A4F, 0, 0, 00, 0, 0, "Zanabazar_Square"),
- 0x11A84: ("", "reserved", 0x11A84, 0x11A85, 0, 0, 00, 0, 0, "Soyombo"),
- 0x11AA3: ("", "reserved", 0x11AA3, 0x11AAF, 0, 0, 00, 0, 0, "Soyombo"),
- 0x11AB0: ("", "reserved", 0x11AB0, 0x11ABF, 0, 0, 00, 0, 0, "NB"),
- 0x11AF9: ("", "reserved", 0x11AF9, 0x11AFF, 0, 0, 00, 0, 0, "Pau_Cin_Hau"),
- 0x11B00: ("", "reserved", 0x11B00, 0x11BFF, 0, 0, 00, 0, 0, "NB"),
- 0x11C09: ("", "reserved", 0x11C09, 0x11C09, 0, 0, 00, 0, 0, "Bhaiksuki"),
- 0x11C37: ("", "reserved", 0x11C37, 0x11C37, 0, 0, 00, 0, 0, "Bhaiksuki"),
- 0x11C46: ("", "reserved", 0x11C46, 0x11C4F, 0, 0, 00, 0, 0, "Bhaiksuki"),
- 0x11C6D: ("", "reserved", 0x11C6D, 0x11C6F, 0, 0, 00, 0, 0, "Bhaiksuki"),
- 0x11C90: ("", "reserved", 0x11C90, 0x11C91, 0, 0, 00, 0, 0, "Marchen"),
- 0x11CA8: ("", "reserved", 0x11CA8, 0x11CA8, 0, 0, 00, 0, 0, "Marchen"),
- 0x11CB7: ("", "reserved", 0x11CB7, 0x11CBF, 0, 0, 00, 0, 0, "Marchen"),
- 0x11CC0: ("", "reserved", 0x11CC0, 0x11CFF, 0, 0, 00, 0, 0, "NB"),
- 0x11D07: ("", "reserved", 0x11D07, 0x11D07, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D0A: ("", "reserved", 0x11D0A, 0x11D0A, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D37: ("", "reserved", 0x11D37, 0x11D39, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D3B: ("", "reserved", 0x11D3B, 0x11D3B, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D3E: ("", "reserved", 0x11D3E, 0x11D3E, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D48: ("", "reserved", 0x11D48, 0x11D4F, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D5A: ("", "reserved", 0x11D5A, 0x11D5F, 0, 0, 00, 0, 0, "Masaram_Gondi"),
- 0x11D66: ("", "reserved", 0x11D66, 0x11D66, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
- 0x11D69: ("", "reserved", 0x11D69, 0x11D69, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
- 0x11D8F: ("", "reserved", 0x11D8F, 0x11D8F, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
- 0x11D92: ("", "reserved", 0x11D92, 0x11D92, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
- 0x11D99: ("", "reserved", 0x11D99, 0x11D9F, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
- 0x11DAA: ("", "reserved", 0x11DAA, 0x11DAF, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
- 0x11DB0: ("", "reserved", 0x11DB0, 0x11EDF, 0, 0, 00, 0, 0, "NB"),
- 0x11EF9: ("", "reserved", 0x11EF9, 0x11EFF, 0, 0, 00, 0, 0, "Makasar"),
- 0x11F00: ("", "reserved", 0x11F00, 0x11FFF, 0, 0, 00, 0, 0, "NB"),
- 0x1239A: ("", "reserved", 0x1239A, 0x123FF, 0, 0, 00, 0, 0, "Cuneiform"),
- 0x1246F: ("", "reserved", 0x1246F, 0x1246F, 0, 0, 00, 0, 0, "Cuneiform_Numbers"),
- 0x12475: ("", "reserved", 0x12475, 0x1247F, 0, 0, 00, 0, 0, "Cuneiform_Numbers"),
- 0x12544: ("", "reserved", 0x12544, 0x1254F, 0, 0, 00, 0, 0, "Early_Dynastic_Cuneiform"),
- 0x12550: ("", "reserved", 0x12550, 0x12FFF, 0, 0, 00, 0, 0, "NB"),
- 0x1342F: ("", "reserved", 0x1342F, 0x1342F, 0, 0, 00, 0, 0, "Egyptian_Hieroglyphs"),
- 0x13430: ("", "reserved", 0x13430, 0x143FF, 0, 0, 00, 0, 0, "NB"),
- 0x14647: ("", "reserved", 0x14647, 0x1467F, 0, 0, 00, 0, 0, "Anatolian_Hieroglyphs"),
- 0x14680: ("", "reserved", 0x14680, 0x167FF, 0, 0, 00, 0, 0, "NB"),
- 0x16A39: ("", "reserved", 0x16A39, 0x16A3F, 0, 0, 00, 0, 0, "Bamum_Sup"),
- 0x16A5F: ("", "reserved", 0x16A5F, 0x16A5F, 0, 0, 00, 0, 0, "Mro"),
- 0x16A6A: ("", "reserved", 0x16A6A, 0x16A6D, 0, 0, 00, 0, 0, "Mro"),
- 0x16A70: ("", "reserved", 0x16A70, 0x16ACF, 0, 0, 00, 0, 0, "NB"),
- 0x16AEE: ("", "reserved", 0x16AEE, 0x16AEF, 0, 0, 00, 0, 0, "Bassa_Vah"),
- 0x16AF6: ("", "reserved", 0x16AF6, 0x16AFF, 0, 0, 00, 0, 0, "Bassa_Vah"),
- 0x16B46: ("", "reserved", 0x16B46, 0x16B4F, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
- 0x16B5A: ("", "reserved", 0x16B5A, 0x16B5A, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
- 0x16B62: ("", "reserved", 0x16B62, 0x16B62, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
- 0x16B78: ("", "reserved", 0x16B78, 0x16B7C, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
- 0x16B90: ("", "reserved", 0x16B90, 0x16E3F, 0, 0, 00, 0, 0, "NB"),
- 0x16E9B: ("", "reserved", 0x16E9B, 0x16E9F, 0, 0, 00, 0, 0, "Medefaidrin"),
- 0x16EA0: ("", "reserved", 0x16EA0, 0x16EFF, 0, 0, 00, 0, 0, "NB"),
- 0x16F45: ("", "reserved", 0x16F45, 0x16F4F, 0, 0, 00, 0, 0, "Miao"),
- 0x16F7F: ("", "reserved", 0x16F7F, 0x16F8E, 0, 0, 00, 0, 0, "Miao"),
- 0x16FA0: ("", "reserved", 0x16FA0, 0x16FDF, 0, 0, 00, 0, 0, "NB"),
- 0x16FE2: ("", "reserved", 0x16FE2, 0x16FFF, 0, 0, 00, 0, 0, "Ideographic_Symbols"),
- 0x187F2: ("", "reserved", 0x187F2, 0x187FF, 0, 0, 00, 0, 0, "Tangut"),
- 0x18AF3: ("", "reserved", 0x18AF3, 0x18AFF, 0, 0, 00, 0, 0, "Tangut_Components"),
- 0x18B00: ("", "reserved", 0x18B00, 0x1AFFF, 0, 0, 00, 0, 0, "NB"),
- 0x1B11F: ("", "reserved", 0x1B11F, 0x1B12F, 0, 0, 00, 0, 0, "Kana_Ext_A"),
- 0x1B130: ("", "reserved", 0x1B130, 0x1B16F, 0, 0, 00, 0, 0, "NB"),
- 0x1B2FC: ("", "reserved", 0x1B2FC, 0x1B2FF, 0, 0, 00, 0, 0, "Nushu"),
- 0x1B300: ("", "reserved", 0x1B300, 0x1BBFF, 0, 0, 00, 0, 0, "NB"),
- 0x1BC6B: ("", "reserved", 0x1BC6B, 0x1BC6F, 0, 0, 00, 0, 0, "Duployan"),
- 0x1BC7D: ("", "reserved", 0x1BC7D, 0x1BC7F, 0, 0, 00, 0, 0, "Duployan"),
- 0x1BC89: ("", "reserved", 0x1BC89, 0x1BC8F, 0, 0, 00, 0, 0, "Duployan"),
- 0x1BC9A: ("", "reserved", 0x1BC9A, 0x1BC9B, 0, 0, 00, 0, 0, "Duployan"),
- 0x1BCA4: ("", "reserved", 0x1BCA4, 0x1BCAF, 0, 0, 00, 0, 0, "Shorthand_Format_Controls"),
- 0x1BCB0: ("", "reserved", 0x1BCB0, 0x1CFFF, 0, 0, 00, 0, 0, "NB"),
- 0x1D0F6: ("", "reserved", 0x1D0F6, 0x1D0FF, 0, 0, 00, 0, 0, "Byzantine_Music"),
- 0x1D127: ("", "reserved", 0x1D127, 0x1D128, 0, 0, 00, 0, 0, "Music"),
- 0x1D1E9: ("", "reserved", 0x1D1E9, 0x1D1FF, 0, 0, 00, 0, 0, "Music"),
- 0x1D246: ("", "reserved", 0x1D246, 0x1D24F, 0, 0, 00, 0, 0, "Ancient_Greek_Music"),
- 0x1D250: ("", "reserved", 0x1D250, 0x1D2DF, 0, 0, 00, 0, 0, "NB"),
- 0x1D2F4: ("", "reserved", 0x1D2F4, 0x1D2FF, 0, 0, 00, 0, 0, "Mayan_Numerals"),
- 0x1D357: ("", "reserved", 0x1D357, 0x1D35F, 0, 0, 00, 0, 0, "Tai_Xuan_Jing"),
- 0x1D379: ("", "reserved", 0x1D379, 0x1D37F, 0, 0, 00, 0, 0, "Counting_Rod"),
- 0x1D380: ("", "reserved", 0x1D380, 0x1D3FF, 0, 0, 00, 0, 0, "NB"),
- 0x1D455: ("", "reserved", 0x1D455, 0x1D455, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D49D: ("", "reserved", 0x1D49D, 0x1D49D, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4A0: ("", "reserved", 0x1D4A0, 0x1D4A1, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4A3: ("", "reserved", 0x1D4A3, 0x1D4A4, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4A7: ("", "reserved", 0x1D4A7, 0x1D4A8, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4AD: ("", "reserved", 0x1D4AD, 0x1D4AD, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4BA: ("", "reserved", 0x1D4BA, 0x1D4BA, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4BC: ("", "reserved", 0x1D4BC, 0x1D4BC, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D4C4: ("", "reserved", 0x1D4C4, 0x1D4C4, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D506: ("", "reserved", 0x1D506, 0x1D506, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D50B: ("", "reserved", 0x1D50B, 0x1D50C, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D515: ("", "reserved", 0x1D515, 0x1D515, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D51D: ("", "reserved", 0x1D51D, 0x1D51D, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D53A: ("", "reserved", 0x1D53A, 0x1D53A, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D53F: ("", "reserved", 0x1D53F, 0x1D53F, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D545: ("", "reserved", 0x1D545, 0x1D545, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D547: ("", "reserved", 0x1D547, 0x1D549, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D551: ("", "reserved", 0x1D551, 0x1D551, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D6A6: ("", "reserved", 0x1D6A6, 0x1D6A7, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1D7CC: ("", "reserved", 0x1D7CC, 0x1D7CD, 0, 0, 00, 0, 0, "Math_Alphanum"),
- 0x1DA8C: ("", "reserved", 0x1DA8C, 0x1DA9A, 0, 0, 00, 0, 0, "Sutton_SignWriting"),
- 0x1DAA0: ("", "reserved", 0x1DAA0, 0x1DAA0, 0, 0, 00, 0, 0, "Sutton_SignWriting"),
- 0x1DAB0: ("", "reserved", 0x1DAB0, 0x1DFFF, 0, 0, 00, 0, 0, "NB"),
- 0x1E007: ("", "reserved", 0x1E007, 0x1E007, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
- 0x1E019: ("", "reserved", 0x1E019, 0x1E01A, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
- 0x1E022: ("", "reserved", 0x1E022, 0x1E022, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
- 0x1E025: ("", "reserved", 0x1E025, 0x1E025, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
- 0x1E02B: ("", "reserved", 0x1E02B, 0x1E02F, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
- 0x1E030: ("", "reserved", 0x1E030, 0x1E7FF, 0, 0, 00, 0, 0, "NB"),
- 0x1E8C5: ("", "reserved", 0x1E8C5, 0x1E8C6, 0, 0, 00, 0, 0, "Mende_Kikakui"),
- 0x1E8D7: ("", "reserved", 0x1E8D7, 0x1E8DF, 0, 0, 00, 0, 0, "Mende_Kikakui"),
- 0x1E8E0: ("", "reserved", 0x1E8E0, 0x1E8FF, 0, 0, 00, 0, 0, "NB"),
- 0x1E94B: ("", "reserved", 0x1E94B, 0x1E94F, 0, 0, 00, 0, 0, "Adlam"),
- 0x1E95A: ("", "reserved", 0x1E95A, 0x1E95D, 0, 0, 00, 0, 0, "Adlam"),
- 0x1E960: ("", "reserved", 0x1E960, 0x1EC6F, 0, 0, 00, 0, 0, "NB"),
- 0x1EC70: ("", "reserved", 0x1EC70, 0x1EC70, 0, 0, 00, 0, 0, "Indic_Siyaq_Numbers"),
- 0x1ECB5: ("", "reserved", 0x1ECB5, 0x1ECBF, 0, 0, 00, 0, 0, "Indic_Siyaq_Numbers"),
- 0x1ECC0: ("", "reserved", 0x1ECC0, 0x1EDFF, 0, 0, 00, 0, 0, "NB"),
- 0x1EE04: ("", "reserved", 0x1EE04, 0x1EE04, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE20: ("", "reserved", 0x1EE20, 0x1EE20, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE23: ("", "reserved", 0x1EE23, 0x1EE23, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE25: ("", "reserved", 0x1EE25, 0x1EE26, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE28: ("", "reserved", 0x1EE28, 0x1EE28, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE33: ("", "reserved", 0x1EE33, 0x1EE33, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE38: ("", "reserved", 0x1EE38, 0x1EE38, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE3A: ("", "reserved", 0x1EE3A, 0x1EE3A, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE3C: ("", "reserved", 0x1EE3C, 0x1EE41, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE43: ("", "reserved", 0x1EE43, 0x1EE46, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE48: ("", "reserved", 0x1EE48, 0x1EE48, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE4A: ("", "reserved", 0x1EE4A, 0x1EE4A, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE4C: ("", "reserved", 0x1EE4C, 0x1EE4C, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE50: ("", "reserved", 0x1EE50, 0x1EE50, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE53: ("", "reserved", 0x1EE53, 0x1EE53, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE55: ("", "reserved", 0x1EE55, 0x1EE56, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE58: ("", "reserved", 0x1EE58, 0x1EE58, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE5A: ("", "reserved", 0x1EE5A, 0x1EE5A, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE5C: ("", "reserved", 0x1EE5C, 0x1EE5C, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE5E: ("", "reserved", 0x1EE5E, 0x1EE5E, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE60: ("", "reserved", 0x1EE60, 0x1EE60, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE63: ("", "reserved", 0x1EE63, 0x1EE63, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE65: ("", "reserved", 0x1EE65, 0x1EE66, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE6B: ("", "reserved", 0x1EE6B, 0x1EE6B, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE73: ("", "reserved", 0x1EE73, 0x1EE73, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE78: ("", "reserved", 0x1EE78, 0x1EE78, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE7D: ("", "reserved", 0x1EE7D, 0x1EE7D, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE7F: ("", "reserved", 0x1EE7F, 0x1EE7F, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE8A: ("", "reserved", 0x1EE8A, 0x1EE8A, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EE9C: ("", "reserved", 0x1EE9C, 0x1EEA0, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EEA4: ("", "reserved", 0x1EEA4, 0x1EEA4, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EEAA: ("", "reserved", 0x1EEAA, 0x1EEAA, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EEBC: ("", "reserved", 0x1EEBC, 0x1EEEF, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EEF2: ("", "reserved", 0x1EEF2, 0x1EEFF, 0, 0, 00, 0, 0, "Arabic_Math"),
- 0x1EF00: ("", "reserved", 0x1EF00, 0x1EFFF, 0, 0, 00, 0, 0, "NB"),
- 0x1F02C: ("", "reserved", 0x1F02C, 0x1F02F, 0, 0, 00, 0, 0, "Mahjong"),
- 0x1F094: ("", "reserved", 0x1F094, 0x1F09F, 0, 0, 00, 0, 0, "Domino"),
- 0x1F0AF: ("", "reserved", 0x1F0AF, 0x1F0B0, 0, 0, 00, 0, 0, "Playing_Cards"),
- 0x1F0C0: ("", "reserved", 0x1F0C0, 0x1F0C0, 0, 0, 00, 0, 0, "Playing_Cards"),
- 0x1F0D0: ("", "reserved", 0x1F0D0, 0x1F0D0, 0, 0, 00, 0, 0, "Playing_Cards"),
- 0x1F0F6: ("", "reserved", 0x1F0F6, 0x1F0FF, 0, 0, 00, 0, 0, "Playing_Cards"),
- 0x1F10D: ("", "reserved", 0x1F10D, 0x1F10F, 0, 0, 00, 0, 0, "Enclosed_Alphanum_Sup"),
- 0x1F16C: ("", "reserved", 0x1F16C, 0x1F16F, 0, 0, 00, 0, 0, "Enclosed_Alphanum_Sup"),
- 0x1F1AD: ("", "reserved", 0x1F1AD, 0x1F1E5, 0, 0, 00, 0, 0, "Enclosed_Alphanum_Sup"),
- 0x1F203: ("", "reserved", 0x1F203, 0x1F20F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
- 0x1F23C: ("", "reserved", 0x1F23C, 0x1F23F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
- 0x1F249: ("", "reserved", 0x1F249, 0x1F24F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
- 0x1F252: ("", "reserved", 0x1F252, 0x1F25F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
- 0x1F266: ("", "reserved", 0x1F266, 0x1F2FF, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
- 0x1F6D5: ("", "reserved", 0x1F6D5, 0x1F6DF, 0, 0, 00, 0, 0, "Transport_And_Map"),
- 0x1F6ED: ("", "reserved", 0x1F6ED, 0x1F6EF, 0, 0, 00, 0, 0, "Transport_And_Map"),
- 0x1F6FA: ("", "reserved", 0x1F6FA, 0x1F6FF, 0, 0, 00, 0, 0, "Transport_And_Map"),
- 0x1F774: ("", "reserved", 0x1F774, 0x1F77F, 0, 0, 00, 0, 0, "Alchemical"),
- 0x1F7D9: ("", "reserved", 0x1F7D9, 0x1F7FF, 0, 0, 00, 0, 0, "Geometric_Shapes_Ext"),
- 0x1F80C: ("", "reserved", 0x1F80C, 0x1F80F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
- 0x1F848: ("", "reserved", 0x1F848, 0x1F84F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
- 0x1F85A: ("", "reserved", 0x1F85A, 0x1F85F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
- 0x1F888: ("", "reserved", 0x1F888, 0x1F88F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
- 0x1F8AE: ("", "reserved", 0x1F8AE, 0x1F8FF, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
- 0x1F90C: ("", "reserved", 0x1F90C, 0x1F90F, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F93F: ("", "reserved", 0x1F93F, 0x1F93F, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F971: ("", "reserved", 0x1F971, 0x1F972, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F977: ("", "reserved", 0x1F977, 0x1F979, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F97B: ("", "reserved", 0x1F97B, 0x1F97B, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F9A3: ("", "reserved", 0x1F9A3, 0x1F9AF, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F9BA: ("", "reserved", 0x1F9BA, 0x1F9BF, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1F9C3: ("", "reserved", 0x1F9C3, 0x1F9CF, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
- 0x1FA00: ("", "reserved", 0x1FA00, 0x1FA5F, 0, 0, 00, 0, 0, "Chess_Symbols"),
- 0x1FA6E: ("", "reserved", 0x1FA6E, 0x1FA6F, 0, 0, 00, 0, 0, "Chess_Symbols"),
- 0x1FA70: ("", "reserved", 0x1FA70, 0x1FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x1FFFE: ("", "noncharacter", 0x1FFFE, 0x1FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x2A6D7: ("", "reserved", 0x2A6D7, 0x2A6DF, 0, 0, 00, 0, 0, "CJK_Ext_B"),
- 0x2A6E0: ("", "reserved", 0x2A6E0, 0x2A6FF, 0, 0, 00, 0, 0, "NB"),
- 0x2B735: ("", "reserved", 0x2B735, 0x2B73F, 0, 0, 00, 0, 0, "CJK_Ext_C"),
- 0x2B81E: ("", "reserved", 0x2B81E, 0x2B81F, 0, 0, 00, 0, 0, "CJK_Ext_D"),
- 0x2CEA2: ("", "reserved", 0x2CEA2, 0x2CEAF, 0, 0, 00, 0, 0, "CJK_Ext_E"),
- 0x2EBE1: ("", "reserved", 0x2EBE1, 0x2EBEF, 0, 0, 00, 0, 0, "CJK_Ext_F"),
- 0x2EBF0: ("", "reserved", 0x2EBF0, 0x2F7FF, 0, 0, 00, 0, 0, "NB"),
- 0x2FA1E: ("", "reserved", 0x2FA1E, 0x2FA1F, 0, 0, 00, 0, 0, "CJK_Compat_Ideographs_Sup"),
- 0x2FA20: ("", "reserved", 0x2FA20, 0x2FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x2FFFE: ("", "noncharacter", 0x2FFFE, 0x2FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x30000: ("", "reserved", 0x30000, 0x3FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x3FFFE: ("", "noncharacter", 0x3FFFE, 0x3FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x40000: ("", "reserved", 0x40000, 0x4FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x4FFFE: ("", "noncharacter", 0x4FFFE, 0x4FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x50000: ("", "reserved", 0x50000, 0x5FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x5FFFE: ("", "noncharacter", 0x5FFFE, 0x5FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x60000: ("", "reserved", 0x60000, 0x6FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x6FFFE: ("", "noncharacter", 0x6FFFE, 0x6FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x70000: ("", "reserved", 0x70000, 0x7FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x7FFFE: ("", "noncharacter", 0x7FFFE, 0x7FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x80000: ("", "reserved", 0x80000, 0x8FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x8FFFE: ("", "noncharacter", 0x8FFFE, 0x8FFFF, 0, 0, 10, 0, 0, "NB"),
- 0x90000: ("", "reserved", 0x90000, 0x9FFFD, 0, 0, 00, 0, 0, "NB"),
- 0x9FFFE: ("", "noncharacter", 0x9FFFE, 0x9FFFF, 0, 0, 10, 0, 0, "NB"),
- 0xA0000: ("", "reserved", 0xA0000, 0xAFFFD, 0, 0, 00, 0, 0, "NB"),
- 0xAFFFE: ("", "noncharacter", 0xAFFFE, 0xAFFFF, 0, 0, 10, 0, 0, "NB"),
- 0xB0000: ("", "reserved", 0xB0000, 0xBFFFD, 0, 0, 00, 0, 0, "NB"),
- 0xBFFFE: ("", "noncharacter", 0xBFFFE, 0xBFFFF, 0, 0, 10, 0, 0, "NB"),
- 0xC0000: ("", "reserved", 0xC0000, 0xCFFFD, 0, 0, 00, 0, 0, "NB"),
- 0xCFFFE: ("", "noncharacter", 0xCFFFE, 0xCFFFF, 0, 0, 10, 0, 0, "NB"),
- 0xD0000: ("", "reserved", 0xD0000, 0xDFFFD, 0, 0, 00, 0, 0, "NB"),
- 0xDFFFE: ("", "noncharacter", 0xDFFFE, 0xDFFFF, 0, 0, 10, 0, 0, "NB"),
- 0xE0000: ("", "reserved", 0xE0000, 0xE0000, 0, 0, 00, 0, 0, "Tags"),
- 0xE0002: ("", "reserved", 0xE0002, 0xE001F, 0, 0, 00, 0, 0, "Tags"),
- 0xE0080: ("", "reserved", 0xE0080, 0xE00FF, 0, 0, 00, 0, 0, "NB"),
- 0xE01F0: ("", "reserved", 0xE01F0, 0xE0FFF, 0, 0, 00, 0, 0, "NB"),
- 0xE1000: ("", "reserved", 0xE1000, 0xEFFFD, 0, 0, 00, 0, 0, "NB"),
- 0xEFFFE: ("", "noncharacter", 0xEFFFE, 0xEFFFF, 0, 0, 10, 0, 0, "NB"),
- 0xFFFFE: ("", "noncharacter", 0xFFFFE, 0xFFFFF, 0, 0, 10, 0, 0, "Sup_PUA_A"),
- 0x10FFFE: ("", "noncharacter", 0x10FFFE, 0x10FFFF, 0, 0, 10, 0, 0, "Sup_PUA_B"),
-}
+
+
+# dictionary of reserved Unicode character blocks (reserved)
+# fields are: n - name, t - type,  c - code_point, l - last_code_point (for ranges or None)
+#     a - alpha, m - math, nc - non_char, d - deprecated, xs - XID_start, xc - XID_Continue, b - block
+reserved_map = {
+ 0x0378: ("", "reserved", 0x0378, 0x0379, 0, 0, 00, 0, 0, "Greek"),
+ 0x0380: ("", "reserved", 0x0380, 0x0383, 0, 0, 00, 0, 0, "Greek"),
+ 0x038B: ("", "reserved", 0x038B, 0x038B, 0, 0, 00, 0, 0, "Greek"),
+ 0x038D: ("", "reserved", 0x038D, 0x038D, 0, 0, 00, 0, 0, "Greek"),
+ 0x03A2: ("", "reserved", 0x03A2, 0x03A2, 0, 0, 00, 0, 0, "Greek"),
+ 0x0530: ("", "reserved", 0x0530, 0x0530, 0, 0, 00, 0, 0, "Armenian"),
+ 0x0557: ("", "reserved", 0x0557, 0x0558, 0, 0, 00, 0, 0, "Armenian"),
+ 0x058B: ("", "reserved", 0x058B, 0x058C, 0, 0, 00, 0, 0, "Armenian"),
+ 0x0590: ("", "reserved", 0x0590, 0x0590, 0, 0, 00, 0, 0, "Hebrew"),
+ 0x05C8: ("", "reserved", 0x05C8, 0x05CF, 0, 0, 00, 0, 0, "Hebrew"),
+ 0x05EB: ("", "reserved", 0x05EB, 0x05EE, 0, 0, 00, 0, 0, "Hebrew"),
+ 0x05F5: ("", "reserved", 0x05F5, 0x05FF, 0, 0, 00, 0, 0, "Hebrew"),
+ 0x061D: ("", "reserved", 0x061D, 0x061D, 0, 0, 00, 0, 0, "Arabic"),
+ 0x070E: ("", "reserved", 0x070E, 0x070E, 0, 0, 00, 0, 0, "Syriac"),
+ 0x074B: ("", "reserved", 0x074B, 0x074C, 0, 0, 00, 0, 0, "Syriac"),
+ 0x07B2: ("", "reserved", 0x07B2, 0x07BF, 0, 0, 00, 0, 0, "Thaana"),
+ 0x07FB: ("", "reserved", 0x07FB, 0x07FC, 0, 0, 00, 0, 0, "NKo"),
+ 0x082E: ("", "reserved", 0x082E, 0x082F, 0, 0, 00, 0, 0, "Samaritan"),
+ 0x083F: ("", "reserved", 0x083F, 0x083F, 0, 0, 00, 0, 0, "Samaritan"),
+ 0x085C: ("", "reserved", 0x085C, 0x085D, 0, 0, 00, 0, 0, "Mandaic"),
+ 0x085F: ("", "reserved", 0x085F, 0x085F, 0, 0, 00, 0, 0, "Mandaic"),
+ 0x086B: ("", "reserved", 0x086B, 0x086F, 0, 0, 00, 0, 0, "Syriac_Sup"),
+ 0x0870: ("", "reserved", 0x0870, 0x089F, 0, 0, 00, 0, 0, "NB"),
+ 0x08B5: ("", "reserved", 0x08B5, 0x08B5, 0, 0, 00, 0, 0, "Arabic_Ext_A"),
+ 0x08BE: ("", "reserved", 0x08BE, 0x08D2, 0, 0, 00, 0, 0, "Arabic_Ext_A"),
+ 0x0984: ("", "reserved", 0x0984, 0x0984, 0, 0, 00, 0, 0, "Bengali"),
+ 0x098D: ("", "reserved", 0x098D, 0x098E, 0, 0, 00, 0, 0, "Bengali"),
+ 0x0991: ("", "reserved", 0x0991, 0x0992, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09A9: ("", "reserved", 0x09A9, 0x09A9, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09B1: ("", "reserved", 0x09B1, 0x09B1, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09B3: ("", "reserved", 0x09B3, 0x09B5, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09BA: ("", "reserved", 0x09BA, 0x09BB, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09C5: ("", "reserved", 0x09C5, 0x09C6, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09C9: ("", "reserved", 0x09C9, 0x09CA, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09CF: ("", "reserved", 0x09CF, 0x09D6, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09D8: ("", "reserved", 0x09D8, 0x09DB, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09DE: ("", "reserved", 0x09DE, 0x09DE, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09E4: ("", "reserved", 0x09E4, 0x09E5, 0, 0, 00, 0, 0, "Bengali"),
+ 0x09FF: ("", "reserved", 0x09FF, 0x09FF, 0, 0, 00, 0, 0, "Bengali"),
+ 0x0A00: ("", "reserved", 0x0A00, 0x0A00, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A04: ("", "reserved", 0x0A04, 0x0A04, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A0B: ("", "reserved", 0x0A0B, 0x0A0E, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A11: ("", "reserved", 0x0A11, 0x0A12, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A29: ("", "reserved", 0x0A29, 0x0A29, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A31: ("", "reserved", 0x0A31, 0x0A31, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A34: ("", "reserved", 0x0A34, 0x0A34, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A37: ("", "reserved", 0x0A37, 0x0A37, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A3A: ("", "reserved", 0x0A3A, 0x0A3B, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A3D: ("", "reserved", 0x0A3D, 0x0A3D, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A43: ("", "reserved", 0x0A43, 0x0A46, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A49: ("", "reserved", 0x0A49, 0x0A4A, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A4E: ("", "reserved", 0x0A4E, 0x0A50, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A52: ("", "reserved", 0x0A52, 0x0A58, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A5D: ("", "reserved", 0x0A5D, 0x0A5D, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A5F: ("", "reserved", 0x0A5F, 0x0A65, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A77: ("", "reserved", 0x0A77, 0x0A7F, 0, 0, 00, 0, 0, "Gurmukhi"),
+ 0x0A80: ("", "reserved", 0x0A80, 0x0A80, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0A84: ("", "reserved", 0x0A84, 0x0A84, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0A8E: ("", "reserved", 0x0A8E, 0x0A8E, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0A92: ("", "reserved", 0x0A92, 0x0A92, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AA9: ("", "reserved", 0x0AA9, 0x0AA9, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AB1: ("", "reserved", 0x0AB1, 0x0AB1, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AB4: ("", "reserved", 0x0AB4, 0x0AB4, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0ABA: ("", "reserved", 0x0ABA, 0x0ABB, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AC6: ("", "reserved", 0x0AC6, 0x0AC6, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0ACA: ("", "reserved", 0x0ACA, 0x0ACA, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0ACE: ("", "reserved", 0x0ACE, 0x0ACF, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AD1: ("", "reserved", 0x0AD1, 0x0ADF, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AE4: ("", "reserved", 0x0AE4, 0x0AE5, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0AF2: ("", "reserved", 0x0AF2, 0x0AF8, 0, 0, 00, 0, 0, "Gujarati"),
+ 0x0B00: ("", "reserved", 0x0B00, 0x0B00, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B04: ("", "reserved", 0x0B04, 0x0B04, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B0D: ("", "reserved", 0x0B0D, 0x0B0E, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B11: ("", "reserved", 0x0B11, 0x0B12, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B29: ("", "reserved", 0x0B29, 0x0B29, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B31: ("", "reserved", 0x0B31, 0x0B31, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B34: ("", "reserved", 0x0B34, 0x0B34, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B3A: ("", "reserved", 0x0B3A, 0x0B3B, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B45: ("", "reserved", 0x0B45, 0x0B46, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B49: ("", "reserved", 0x0B49, 0x0B4A, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B4E: ("", "reserved", 0x0B4E, 0x0B55, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B58: ("", "reserved", 0x0B58, 0x0B5B, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B5E: ("", "reserved", 0x0B5E, 0x0B5E, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B64: ("", "reserved", 0x0B64, 0x0B65, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B78: ("", "reserved", 0x0B78, 0x0B7F, 0, 0, 00, 0, 0, "Oriya"),
+ 0x0B80: ("", "reserved", 0x0B80, 0x0B81, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0B84: ("", "reserved", 0x0B84, 0x0B84, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0B8B: ("", "reserved", 0x0B8B, 0x0B8D, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0B91: ("", "reserved", 0x0B91, 0x0B91, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0B96: ("", "reserved", 0x0B96, 0x0B98, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0B9B: ("", "reserved", 0x0B9B, 0x0B9B, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0B9D: ("", "reserved", 0x0B9D, 0x0B9D, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BA0: ("", "reserved", 0x0BA0, 0x0BA2, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BA5: ("", "reserved", 0x0BA5, 0x0BA7, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BAB: ("", "reserved", 0x0BAB, 0x0BAD, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BBA: ("", "reserved", 0x0BBA, 0x0BBD, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BC3: ("", "reserved", 0x0BC3, 0x0BC5, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BC9: ("", "reserved", 0x0BC9, 0x0BC9, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BCE: ("", "reserved", 0x0BCE, 0x0BCF, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BD1: ("", "reserved", 0x0BD1, 0x0BD6, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BD8: ("", "reserved", 0x0BD8, 0x0BE5, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0BFB: ("", "reserved", 0x0BFB, 0x0BFF, 0, 0, 00, 0, 0, "Tamil"),
+ 0x0C0D: ("", "reserved", 0x0C0D, 0x0C0D, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C11: ("", "reserved", 0x0C11, 0x0C11, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C29: ("", "reserved", 0x0C29, 0x0C29, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C3A: ("", "reserved", 0x0C3A, 0x0C3C, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C45: ("", "reserved", 0x0C45, 0x0C45, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C49: ("", "reserved", 0x0C49, 0x0C49, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C4E: ("", "reserved", 0x0C4E, 0x0C54, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C57: ("", "reserved", 0x0C57, 0x0C57, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C5B: ("", "reserved", 0x0C5B, 0x0C5F, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C64: ("", "reserved", 0x0C64, 0x0C65, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C70: ("", "reserved", 0x0C70, 0x0C77, 0, 0, 00, 0, 0, "Telugu"),
+ 0x0C8D: ("", "reserved", 0x0C8D, 0x0C8D, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0C91: ("", "reserved", 0x0C91, 0x0C91, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CA9: ("", "reserved", 0x0CA9, 0x0CA9, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CB4: ("", "reserved", 0x0CB4, 0x0CB4, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CBA: ("", "reserved", 0x0CBA, 0x0CBB, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CC5: ("", "reserved", 0x0CC5, 0x0CC5, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CC9: ("", "reserved", 0x0CC9, 0x0CC9, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CCE: ("", "reserved", 0x0CCE, 0x0CD4, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CD7: ("", "reserved", 0x0CD7, 0x0CDD, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CDF: ("", "reserved", 0x0CDF, 0x0CDF, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CE4: ("", "reserved", 0x0CE4, 0x0CE5, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CF0: ("", "reserved", 0x0CF0, 0x0CF0, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0CF3: ("", "reserved", 0x0CF3, 0x0CFF, 0, 0, 00, 0, 0, "Kannada"),
+ 0x0D04: ("", "reserved", 0x0D04, 0x0D04, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D0D: ("", "reserved", 0x0D0D, 0x0D0D, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D11: ("", "reserved", 0x0D11, 0x0D11, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D45: ("", "reserved", 0x0D45, 0x0D45, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D49: ("", "reserved", 0x0D49, 0x0D49, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D50: ("", "reserved", 0x0D50, 0x0D53, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D64: ("", "reserved", 0x0D64, 0x0D65, 0, 0, 00, 0, 0, "Malayalam"),
+ 0x0D80: ("", "reserved", 0x0D80, 0x0D81, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0D84: ("", "reserved", 0x0D84, 0x0D84, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0D97: ("", "reserved", 0x0D97, 0x0D99, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DB2: ("", "reserved", 0x0DB2, 0x0DB2, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DBC: ("", "reserved", 0x0DBC, 0x0DBC, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DBE: ("", "reserved", 0x0DBE, 0x0DBF, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DC7: ("", "reserved", 0x0DC7, 0x0DC9, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DCB: ("", "reserved", 0x0DCB, 0x0DCE, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DD5: ("", "reserved", 0x0DD5, 0x0DD5, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DD7: ("", "reserved", 0x0DD7, 0x0DD7, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DE0: ("", "reserved", 0x0DE0, 0x0DE5, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DF0: ("", "reserved", 0x0DF0, 0x0DF1, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0DF5: ("", "reserved", 0x0DF5, 0x0DFF, 0, 0, 00, 0, 0, "Sinhala"),
+ 0x0E00: ("", "reserved", 0x0E00, 0x0E00, 0, 0, 00, 0, 0, "Thai"),
+ 0x0E3B: ("", "reserved", 0x0E3B, 0x0E3E, 0, 0, 00, 0, 0, "Thai"),
+ 0x0E5C: ("", "reserved", 0x0E5C, 0x0E7F, 0, 0, 00, 0, 0, "Thai"),
+ 0x0E80: ("", "reserved", 0x0E80, 0x0E80, 0, 0, 00, 0, 0, "Lao"),
+ 0x0E83: ("", "reserved", 0x0E83, 0x0E83, 0, 0, 00, 0, 0, "Lao"),
+ 0x0E85: ("", "reserved", 0x0E85, 0x0E86, 0, 0, 00, 0, 0, "Lao"),
+ 0x0E89: ("", "reserved", 0x0E89, 0x0E89, 0, 0, 00, 0, 0, "Lao"),
+ 0x0E8B: ("", "reserved", 0x0E8B, 0x0E8C, 0, 0, 00, 0, 0, "Lao"),
+ 0x0E8E: ("", "reserved", 0x0E8E, 0x0E93, 0, 0, 00, 0, 0, "Lao"),
+ 0x0E98: ("", "reserved", 0x0E98, 0x0E98, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EA0: ("", "reserved", 0x0EA0, 0x0EA0, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EA4: ("", "reserved", 0x0EA4, 0x0EA4, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EA6: ("", "reserved", 0x0EA6, 0x0EA6, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EA8: ("", "reserved", 0x0EA8, 0x0EA9, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EAC: ("", "reserved", 0x0EAC, 0x0EAC, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EBA: ("", "reserved", 0x0EBA, 0x0EBA, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EBE: ("", "reserved", 0x0EBE, 0x0EBF, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EC5: ("", "reserved", 0x0EC5, 0x0EC5, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EC7: ("", "reserved", 0x0EC7, 0x0EC7, 0, 0, 00, 0, 0, "Lao"),
+ 0x0ECE: ("", "reserved", 0x0ECE, 0x0ECF, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EDA: ("", "reserved", 0x0EDA, 0x0EDB, 0, 0, 00, 0, 0, "Lao"),
+ 0x0EE0: ("", "reserved", 0x0EE0, 0x0EFF, 0, 0, 00, 0, 0, "Lao"),
+ 0x0F48: ("", "reserved", 0x0F48, 0x0F48, 0, 0, 00, 0, 0, "Tibetan"),
+ 0x0F6D: ("", "reserved", 0x0F6D, 0x0F70, 0, 0, 00, 0, 0, "Tibetan"),
+ 0x0F98: ("", "reserved", 0x0F98, 0x0F98, 0, 0, 00, 0, 0, "Tibetan"),
+ 0x0FBD: ("", "reserved", 0x0FBD, 0x0FBD, 0, 0, 00, 0, 0, "Tibetan"),
+ 0x0FCD: ("", "reserved", 0x0FCD, 0x0FCD, 0, 0, 00, 0, 0, "Tibetan"),
+ 0x0FDB: ("", "reserved", 0x0FDB, 0x0FFF, 0, 0, 00, 0, 0, "Tibetan"),
+ 0x10C6: ("", "reserved", 0x10C6, 0x10C6, 0, 0, 00, 0, 0, "Georgian"),
+ 0x10C8: ("", "reserved", 0x10C8, 0x10CC, 0, 0, 00, 0, 0, "Georgian"),
+ 0x10CE: ("", "reserved", 0x10CE, 0x10CF, 0, 0, 00, 0, 0, "Georgian"),
+ 0x1249: ("", "reserved", 0x1249, 0x1249, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x124E: ("", "reserved", 0x124E, 0x124F, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x1257: ("", "reserved", 0x1257, 0x1257, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x1259: ("", "reserved", 0x1259, 0x1259, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x125E: ("", "reserved", 0x125E, 0x125F, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x1289: ("", "reserved", 0x1289, 0x1289, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x128E: ("", "reserved", 0x128E, 0x128F, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x12B1: ("", "reserved", 0x12B1, 0x12B1, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x12B6: ("", "reserved", 0x12B6, 0x12B7, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x12BF: ("", "reserved", 0x12BF, 0x12BF, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x12C1: ("", "reserved", 0x12C1, 0x12C1, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x12C6: ("", "reserved", 0x12C6, 0x12C7, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x12D7: ("", "reserved", 0x12D7, 0x12D7, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x1311: ("", "reserved", 0x1311, 0x1311, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x1316: ("", "reserved", 0x1316, 0x1317, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x135B: ("", "reserved", 0x135B, 0x135C, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x137D: ("", "reserved", 0x137D, 0x137F, 0, 0, 00, 0, 0, "Ethiopic"),
+ 0x139A: ("", "reserved", 0x139A, 0x139F, 0, 0, 00, 0, 0, "Ethiopic_Sup"),
+ 0x13F6: ("", "reserved", 0x13F6, 0x13F7, 0, 0, 00, 0, 0, "Cherokee"),
+ 0x13FE: ("", "reserved", 0x13FE, 0x13FF, 0, 0, 00, 0, 0, "Cherokee"),
+ 0x169D: ("", "reserved", 0x169D, 0x169F, 0, 0, 00, 0, 0, "Ogham"),
+ 0x16F9: ("", "reserved", 0x16F9, 0x16FF, 0, 0, 00, 0, 0, "Runic"),
+ 0x170D: ("", "reserved", 0x170D, 0x170D, 0, 0, 00, 0, 0, "Tagalog"),
+ 0x1715: ("", "reserved", 0x1715, 0x171F, 0, 0, 00, 0, 0, "Tagalog"),
+ 0x1737: ("", "reserved", 0x1737, 0x173F, 0, 0, 00, 0, 0, "Hanunoo"),
+ 0x1754: ("", "reserved", 0x1754, 0x175F, 0, 0, 00, 0, 0, "Buhid"),
+ 0x176D: ("", "reserved", 0x176D, 0x176D, 0, 0, 00, 0, 0, "Tagbanwa"),
+ 0x1771: ("", "reserved", 0x1771, 0x1771, 0, 0, 00, 0, 0, "Tagbanwa"),
+ 0x1774: ("", "reserved", 0x1774, 0x177F, 0, 0, 00, 0, 0, "Tagbanwa"),
+ 0x17DE: ("", "reserved", 0x17DE, 0x17DF, 0, 0, 00, 0, 0, "Khmer"),
+ 0x17EA: ("", "reserved", 0x17EA, 0x17EF, 0, 0, 00, 0, 0, "Khmer"),
+ 0x17FA: ("", "reserved", 0x17FA, 0x17FF, 0, 0, 00, 0, 0, "Khmer"),
+ 0x180F: ("", "reserved", 0x180F, 0x180F, 0, 0, 00, 0, 0, "Mongolian"),
+ 0x181A: ("", "reserved", 0x181A, 0x181F, 0, 0, 00, 0, 0, "Mongolian"),
+ 0x1879: ("", "reserved", 0x1879, 0x187F, 0, 0, 00, 0, 0, "Mongolian"),
+ 0x18AB: ("", "reserved", 0x18AB, 0x18AF, 0, 0, 00, 0, 0, "Mongolian"),
+ 0x18F6: ("", "reserved", 0x18F6, 0x18FF, 0, 0, 00, 0, 0, "UCAS_Ext"),
+ 0x191F: ("", "reserved", 0x191F, 0x191F, 0, 0, 00, 0, 0, "Limbu"),
+ 0x192C: ("", "reserved", 0x192C, 0x192F, 0, 0, 00, 0, 0, "Limbu"),
+ 0x193C: ("", "reserved", 0x193C, 0x193F, 0, 0, 00, 0, 0, "Limbu"),
+ 0x1941: ("", "reserved", 0x1941, 0x1943, 0, 0, 00, 0, 0, "Limbu"),
+ 0x196E: ("", "reserved", 0x196E, 0x196F, 0, 0, 00, 0, 0, "Tai_Le"),
+ 0x1975: ("", "reserved", 0x1975, 0x197F, 0, 0, 00, 0, 0, "Tai_Le"),
+ 0x19AC: ("", "reserved", 0x19AC, 0x19AF, 0, 0, 00, 0, 0, "New_Tai_Lue"),
+ 0x19CA: ("", "reserved", 0x19CA, 0x19CF, 0, 0, 00, 0, 0, "New_Tai_Lue"),
+ 0x19DB: ("", "reserved", 0x19DB, 0x19DD, 0, 0, 00, 0, 0, "New_Tai_Lue"),
+ 0x1A1C: ("", "reserved", 0x1A1C, 0x1A1D, 0, 0, 00, 0, 0, "Buginese"),
+ 0x1A5F: ("", "reserved", 0x1A5F, 0x1A5F, 0, 0, 00, 0, 0, "Tai_Tham"),
+ 0x1A7D: ("", "reserved", 0x1A7D, 0x1A7E, 0, 0, 00, 0, 0, "Tai_Tham"),
+ 0x1A8A: ("", "reserved", 0x1A8A, 0x1A8F, 0, 0, 00, 0, 0, "Tai_Tham"),
+ 0x1A9A: ("", "reserved", 0x1A9A, 0x1A9F, 0, 0, 00, 0, 0, "Tai_Tham"),
+ 0x1AAE: ("", "reserved", 0x1AAE, 0x1AAF, 0, 0, 00, 0, 0, "Tai_Tham"),
+ 0x1ABF: ("", "reserved", 0x1ABF, 0x1AFF, 0, 0, 00, 0, 0, "Diacriticals_Ext"),
+ 0x1B4C: ("", "reserved", 0x1B4C, 0x1B4F, 0, 0, 00, 0, 0, "Balinese"),
+ 0x1B7D: ("", "reserved", 0x1B7D, 0x1B7F, 0, 0, 00, 0, 0, "Balinese"),
+ 0x1BF4: ("", "reserved", 0x1BF4, 0x1BFB, 0, 0, 00, 0, 0, "Batak"),
+ 0x1C38: ("", "reserved", 0x1C38, 0x1C3A, 0, 0, 00, 0, 0, "Lepcha"),
+ 0x1C4A: ("", "reserved", 0x1C4A, 0x1C4C, 0, 0, 00, 0, 0, "Lepcha"),
+ 0x1C89: ("", "reserved", 0x1C89, 0x1C8F, 0, 0, 00, 0, 0, "Cyrillic_Ext_C"),
+ 0x1CBB: ("", "reserved", 0x1CBB, 0x1CBC, 0, 0, 00, 0, 0, "Georgian_Ext"),
+ 0x1CC8: ("", "reserved", 0x1CC8, 0x1CCF, 0, 0, 00, 0, 0, "Sundanese_Sup"),
+ 0x1CFA: ("", "reserved", 0x1CFA, 0x1CFF, 0, 0, 00, 0, 0, "Vedic_Ext"),
+ 0x1DFA: ("", "reserved", 0x1DFA, 0x1DFA, 0, 0, 00, 0, 0, "Diacriticals_Sup"),
+ 0x1F16: ("", "reserved", 0x1F16, 0x1F17, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F1E: ("", "reserved", 0x1F1E, 0x1F1F, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F46: ("", "reserved", 0x1F46, 0x1F47, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F4E: ("", "reserved", 0x1F4E, 0x1F4F, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F58: ("", "reserved", 0x1F58, 0x1F58, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F5A: ("", "reserved", 0x1F5A, 0x1F5A, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F5C: ("", "reserved", 0x1F5C, 0x1F5C, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F5E: ("", "reserved", 0x1F5E, 0x1F5E, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1F7E: ("", "reserved", 0x1F7E, 0x1F7F, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FB5: ("", "reserved", 0x1FB5, 0x1FB5, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FC5: ("", "reserved", 0x1FC5, 0x1FC5, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FD4: ("", "reserved", 0x1FD4, 0x1FD5, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FDC: ("", "reserved", 0x1FDC, 0x1FDC, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FF0: ("", "reserved", 0x1FF0, 0x1FF1, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FF5: ("", "reserved", 0x1FF5, 0x1FF5, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x1FFF: ("", "reserved", 0x1FFF, 0x1FFF, 0, 0, 00, 0, 0, "Greek_Ext"),
+ 0x2065: ("", "reserved", 0x2065, 0x2065, 0, 0, 00, 0, 0, "Punctuation"),
+ 0x2072: ("", "reserved", 0x2072, 0x2073, 0, 0, 00, 0, 0, "Super_And_Sub"),
+ 0x208F: ("", "reserved", 0x208F, 0x208F, 0, 0, 00, 0, 0, "Super_And_Sub"),
+ 0x209D: ("", "reserved", 0x209D, 0x209F, 0, 0, 00, 0, 0, "Super_And_Sub"),
+ 0x20C0: ("", "reserved", 0x20C0, 0x20CF, 0, 0, 00, 0, 0, "Currency_Symbols"),
+ 0x20F1: ("", "reserved", 0x20F1, 0x20FF, 0, 0, 00, 0, 0, "Diacriticals_For_Symbols"),
+ 0x218C: ("", "reserved", 0x218C, 0x218F, 0, 0, 00, 0, 0, "Number_Forms"),
+ 0x2427: ("", "reserved", 0x2427, 0x243F, 0, 0, 00, 0, 0, "Control_Pictures"),
+ 0x244B: ("", "reserved", 0x244B, 0x245F, 0, 0, 00, 0, 0, "OCR"),
+ 0x2B74: ("", "reserved", 0x2B74, 0x2B75, 0, 0, 00, 0, 0, "Misc_Arrows"),
+ 0x2B96: ("", "reserved", 0x2B96, 0x2B97, 0, 0, 00, 0, 0, "Misc_Arrows"),
+ 0x2BC9: ("", "reserved", 0x2BC9, 0x2BC9, 0, 0, 00, 0, 0, "Misc_Arrows"),
+ 0x2BFF: ("", "reserved", 0x2BFF, 0x2BFF, 0, 0, 00, 0, 0, "Misc_Arrows"),
+ 0x2C2F: ("", "reserved", 0x2C2F, 0x2C2F, 0, 0, 00, 0, 0, "Glagolitic"),
+ 0x2C5F: ("", "reserved", 0x2C5F, 0x2C5F, 0, 0, 00, 0, 0, "Glagolitic"),
+ 0x2CF4: ("", "reserved", 0x2CF4, 0x2CF8, 0, 0, 00, 0, 0, "Coptic"),
+ 0x2D26: ("", "reserved", 0x2D26, 0x2D26, 0, 0, 00, 0, 0, "Georgian_Sup"),
+ 0x2D28: ("", "reserved", 0x2D28, 0x2D2C, 0, 0, 00, 0, 0, "Georgian_Sup"),
+ 0x2D2E: ("", "reserved", 0x2D2E, 0x2D2F, 0, 0, 00, 0, 0, "Georgian_Sup"),
+ 0x2D68: ("", "reserved", 0x2D68, 0x2D6E, 0, 0, 00, 0, 0, "Tifinagh"),
+ 0x2D71: ("", "reserved", 0x2D71, 0x2D7E, 0, 0, 00, 0, 0, "Tifinagh"),
+ 0x2D97: ("", "reserved", 0x2D97, 0x2D9F, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DA7: ("", "reserved", 0x2DA7, 0x2DA7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DAF: ("", "reserved", 0x2DAF, 0x2DAF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DB7: ("", "reserved", 0x2DB7, 0x2DB7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DBF: ("", "reserved", 0x2DBF, 0x2DBF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DC7: ("", "reserved", 0x2DC7, 0x2DC7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DCF: ("", "reserved", 0x2DCF, 0x2DCF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DD7: ("", "reserved", 0x2DD7, 0x2DD7, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2DDF: ("", "reserved", 0x2DDF, 0x2DDF, 0, 0, 00, 0, 0, "Ethiopic_Ext"),
+ 0x2E4F: ("", "reserved", 0x2E4F, 0x2E7F, 0, 0, 00, 0, 0, "Sup_Punctuation"),
+ 0x2E9A: ("", "reserved", 0x2E9A, 0x2E9A, 0, 0, 00, 0, 0, "CJK_Radicals_Sup"),
+ 0x2EF4: ("", "reserved", 0x2EF4, 0x2EFF, 0, 0, 00, 0, 0, "CJK_Radicals_Sup"),
+ 0x2FD6: ("", "reserved", 0x2FD6, 0x2FDF, 0, 0, 00, 0, 0, "Kangxi"),
+ 0x2FE0: ("", "reserved", 0x2FE0, 0x2FEF, 0, 0, 00, 0, 0, "NB"),
+ 0x2FFC: ("", "reserved", 0x2FFC, 0x2FFF, 0, 0, 00, 0, 0, "IDC"),
+ 0x3040: ("", "reserved", 0x3040, 0x3040, 0, 0, 00, 0, 0, "Hiragana"),
+ 0x3097: ("", "reserved", 0x3097, 0x3098, 0, 0, 00, 0, 0, "Hiragana"),
+ 0x3100: ("", "reserved", 0x3100, 0x3104, 0, 0, 00, 0, 0, "Bopomofo"),
+ 0x3130: ("", "reserved", 0x3130, 0x3130, 0, 0, 00, 0, 0, "Compat_Jamo"),
+ 0x318F: ("", "reserved", 0x318F, 0x318F, 0, 0, 00, 0, 0, "Compat_Jamo"),
+ 0x31BB: ("", "reserved", 0x31BB, 0x31BF, 0, 0, 00, 0, 0, "Bopomofo_Ext"),
+ 0x31E4: ("", "reserved", 0x31E4, 0x31EF, 0, 0, 00, 0, 0, "CJK_Strokes"),
+ 0x321F: ("", "reserved", 0x321F, 0x321F, 0, 0, 00, 0, 0, "Enclosed_CJK"),
+ 0x32FF: ("", "reserved", 0x32FF, 0x32FF, 0, 0, 00, 0, 0, "Enclosed_CJK"),
+ 0x4DB6: ("", "reserved", 0x4DB6, 0x4DBF, 0, 0, 00, 0, 0, "CJK_Ext_A"),
+ 0x9FF0: ("", "reserved", 0x9FF0, 0x9FFF, 0, 0, 00, 0, 0, "CJK"),
+ 0xA48D: ("", "reserved", 0xA48D, 0xA48F, 0, 0, 00, 0, 0, "Yi_Syllables"),
+ 0xA4C7: ("", "reserved", 0xA4C7, 0xA4CF, 0, 0, 00, 0, 0, "Yi_Radicals"),
+ 0xA62C: ("", "reserved", 0xA62C, 0xA63F, 0, 0, 00, 0, 0, "Vai"),
+ 0xA6F8: ("", "reserved", 0xA6F8, 0xA6FF, 0, 0, 00, 0, 0, "Bamum"),
+ 0xA7BA: ("", "reserved", 0xA7BA, 0xA7F6, 0, 0, 00, 0, 0, "Latin_Ext_D"),
+ 0xA82C: ("", "reserved", 0xA82C, 0xA82F, 0, 0, 00, 0, 0, "Syloti_Nagri"),
+ 0xA83A: ("", "reserved", 0xA83A, 0xA83F, 0, 0, 00, 0, 0, "Indic_Number_Forms"),
+ 0xA878: ("", "reserved", 0xA878, 0xA87F, 0, 0, 00, 0, 0, "Phags_Pa"),
+ 0xA8C6: ("", "reserved", 0xA8C6, 0xA8CD, 0, 0, 00, 0, 0, "Saurashtra"),
+ 0xA8DA: ("", "reserved", 0xA8DA, 0xA8DF, 0, 0, 00, 0, 0, "Saurashtra"),
+ 0xA954: ("", "reserved", 0xA954, 0xA95E, 0, 0, 00, 0, 0, "Rejang"),
+ 0xA97D: ("", "reserved", 0xA97D, 0xA97F, 0, 0, 00, 0, 0, "Jamo_Ext_A"),
+ 0xA9CE: ("", "reserved", 0xA9CE, 0xA9CE, 0, 0, 00, 0, 0, "Javanese"),
+ 0xA9DA: ("", "reserved", 0xA9DA, 0xA9DD, 0, 0, 00, 0, 0, "Javanese"),
+ 0xA9FF: ("", "reserved", 0xA9FF, 0xA9FF, 0, 0, 00, 0, 0, "Myanmar_Ext_B"),
+ 0xAA37: ("", "reserved", 0xAA37, 0xAA3F, 0, 0, 00, 0, 0, "Cham"),
+ 0xAA4E: ("", "reserved", 0xAA4E, 0xAA4F, 0, 0, 00, 0, 0, "Cham"),
+ 0xAA5A: ("", "reserved", 0xAA5A, 0xAA5B, 0, 0, 00, 0, 0, "Cham"),
+ 0xAAC3: ("", "reserved", 0xAAC3, 0xAADA, 0, 0, 00, 0, 0, "Tai_Viet"),
+ 0xAAF7: ("", "reserved", 0xAAF7, 0xAAFF, 0, 0, 00, 0, 0, "Meetei_Mayek_Ext"),
+ 0xAB00: ("", "reserved", 0xAB00, 0xAB00, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
+ 0xAB07: ("", "reserved", 0xAB07, 0xAB08, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
+ 0xAB0F: ("", "reserved", 0xAB0F, 0xAB10, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
+ 0xAB17: ("", "reserved", 0xAB17, 0xAB1F, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
+ 0xAB27: ("", "reserved", 0xAB27, 0xAB27, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
+ 0xAB2F: ("", "reserved", 0xAB2F, 0xAB2F, 0, 0, 00, 0, 0, "Ethiopic_Ext_A"),
+ 0xAB66: ("", "reserved", 0xAB66, 0xAB6F, 0, 0, 00, 0, 0, "Latin_Ext_E"),
+ 0xABEE: ("", "reserved", 0xABEE, 0xABEF, 0, 0, 00, 0, 0, "Meetei_Mayek"),
+ 0xABFA: ("", "reserved", 0xABFA, 0xABFF, 0, 0, 00, 0, 0, "Meetei_Mayek"),
+ 0xD7A4: ("", "reserved", 0xD7A4, 0xD7AF, 0, 0, 00, 0, 0, "Hangul"),
+ 0xD7C7: ("", "reserved", 0xD7C7, 0xD7CA, 0, 0, 00, 0, 0, "Jamo_Ext_B"),
+ 0xD7FC: ("", "reserved", 0xD7FC, 0xD7FF, 0, 0, 00, 0, 0, "Jamo_Ext_B"),
+ 0xD800: ("", "surrogate", 0xD800, 0xDB7F, 0, 0, 00, 0, 0, "High_Surrogates"),
+ 0xDB80: ("", "surrogate", 0xDB80, 0xDBFF, 0, 0, 00, 0, 0, "High_PU_Surrogates"),
+ 0xDC00: ("", "surrogate", 0xDC00, 0xDFFF, 0, 0, 00, 0, 0, "Low_Surrogates"),
+ 0xFA6E: ("", "reserved", 0xFA6E, 0xFA6F, 0, 0, 00, 0, 0, "CJK_Compat_Ideographs"),
+ 0xFADA: ("", "reserved", 0xFADA, 0xFAFF, 0, 0, 00, 0, 0, "CJK_Compat_Ideographs"),
+ 0xFB07: ("", "reserved", 0xFB07, 0xFB12, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFB18: ("", "reserved", 0xFB18, 0xFB1C, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFB37: ("", "reserved", 0xFB37, 0xFB37, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFB3D: ("", "reserved", 0xFB3D, 0xFB3D, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFB3F: ("", "reserved", 0xFB3F, 0xFB3F, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFB42: ("", "reserved", 0xFB42, 0xFB42, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFB45: ("", "reserved", 0xFB45, 0xFB45, 0, 0, 00, 0, 0, "Alphabetic_PF"),
+ 0xFBC2: ("", "reserved", 0xFBC2, 0xFBD2, 0, 0, 00, 0, 0, "Arabic_PF_A"),
+ 0xFD40: ("", "reserved", 0xFD40, 0xFD4F, 0, 0, 00, 0, 0, "Arabic_PF_A"),
+ 0xFD90: ("", "reserved", 0xFD90, 0xFD91, 0, 0, 00, 0, 0, "Arabic_PF_A"),
+ 0xFDC8: ("", "reserved", 0xFDC8, 0xFDCF, 0, 0, 00, 0, 0, "Arabic_PF_A"),
+ 0xFDD0: ("", "noncharacter", 0xFDD0, 0xFDEF, 0, 0, 10, 0, 0, "Arabic_PF_A"),
+ 0xFDFE: ("", "reserved", 0xFDFE, 0xFDFF, 0, 0, 00, 0, 0, "Arabic_PF_A"),
+ 0xFE1A: ("", "reserved", 0xFE1A, 0xFE1F, 0, 0, 00, 0, 0, "Vertical_Forms"),
+ 0xFE53: ("", "reserved", 0xFE53, 0xFE53, 0, 0, 00, 0, 0, "Small_Forms"),
+ 0xFE67: ("", "reserved", 0xFE67, 0xFE67, 0, 0, 00, 0, 0, "Small_Forms"),
+ 0xFE6C: ("", "reserved", 0xFE6C, 0xFE6F, 0, 0, 00, 0, 0, "Small_Forms"),
+ 0xFE75: ("", "reserved", 0xFE75, 0xFE75, 0, 0, 00, 0, 0, "Arabic_PF_B"),
+ 0xFEFD: ("", "reserved", 0xFEFD, 0xFEFE, 0, 0, 00, 0, 0, "Arabic_PF_B"),
+ 0xFF00: ("", "reserved", 0xFF00, 0xFF00, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFBF: ("", "reserved", 0xFFBF, 0xFFC1, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFC8: ("", "reserved", 0xFFC8, 0xFFC9, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFD0: ("", "reserved", 0xFFD0, 0xFFD1, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFD8: ("", "reserved", 0xFFD8, 0xFFD9, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFDD: ("", "reserved", 0xFFDD, 0xFFDF, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFE7: ("", "reserved", 0xFFE7, 0xFFE7, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFEF: ("", "reserved", 0xFFEF, 0xFFEF, 0, 0, 00, 0, 0, "Half_And_Full_Forms"),
+ 0xFFF0: ("", "reserved", 0xFFF0, 0xFFF8, 0, 0, 00, 0, 0, "Specials"),
+ 0xFFFE: ("", "noncharacter", 0xFFFE, 0xFFFF, 0, 0, 10, 0, 0, "Specials"),
+ 0x1000C: ("", "reserved", 0x1000C, 0x1000C, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
+ 0x10027: ("", "reserved", 0x10027, 0x10027, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
+ 0x1003B: ("", "reserved", 0x1003B, 0x1003B, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
+ 0x1003E: ("", "reserved", 0x1003E, 0x1003E, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
+ 0x1004E: ("", "reserved", 0x1004E, 0x1004F, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
+ 0x1005E: ("", "reserved", 0x1005E, 0x1007F, 0, 0, 00, 0, 0, "Linear_B_Syllabary"),
+ 0x100FB: ("", "reserved", 0x100FB, 0x100FF, 0, 0, 00, 0, 0, "Linear_B_Ideograms"),
+ 0x10103: ("", "reserved", 0x10103, 0x10106, 0, 0, 00, 0, 0, "Aegean_Numbers"),
+ 0x10134: ("", "reserved", 0x10134, 0x10136, 0, 0, 00, 0, 0, "Aegean_Numbers"),
+ 0x1018F: ("", "reserved", 0x1018F, 0x1018F, 0, 0, 00, 0, 0, "Ancient_Greek_Numbers"),
+ 0x1019C: ("", "reserved", 0x1019C, 0x1019F, 0, 0, 00, 0, 0, "Ancient_Symbols"),
+ 0x101A1: ("", "reserved", 0x101A1, 0x101CF, 0, 0, 00, 0, 0, "Ancient_Symbols"),
+ 0x101FE: ("", "reserved", 0x101FE, 0x101FF, 0, 0, 00, 0, 0, "Phaistos"),
+ 0x10200: ("", "reserved", 0x10200, 0x1027F, 0, 0, 00, 0, 0, "NB"),
+ 0x1029D: ("", "reserved", 0x1029D, 0x1029F, 0, 0, 00, 0, 0, "Lycian"),
+ 0x102D1: ("", "reserved", 0x102D1, 0x102DF, 0, 0, 00, 0, 0, "Carian"),
+ 0x102FC: ("", "reserved", 0x102FC, 0x102FF, 0, 0, 00, 0, 0, "Coptic_Epact_Numbers"),
+ 0x10324: ("", "reserved", 0x10324, 0x1032C, 0, 0, 00, 0, 0, "Old_Italic"),
+ 0x1034B: ("", "reserved", 0x1034B, 0x1034F, 0, 0, 00, 0, 0, "Gothic"),
+ 0x1037B: ("", "reserved", 0x1037B, 0x1037F, 0, 0, 00, 0, 0, "Old_Permic"),
+ 0x1039E: ("", "reserved", 0x1039E, 0x1039E, 0, 0, 00, 0, 0, "Ugaritic"),
+ 0x103C4: ("", "reserved", 0x103C4, 0x103C7, 0, 0, 00, 0, 0, "Old_Persian"),
+ 0x103D6: ("", "reserved", 0x103D6, 0x103DF, 0, 0, 00, 0, 0, "Old_Persian"),
+ 0x103E0: ("", "reserved", 0x103E0, 0x103FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1049E: ("", "reserved", 0x1049E, 0x1049F, 0, 0, 00, 0, 0, "Osmanya"),
+ 0x104AA: ("", "reserved", 0x104AA, 0x104AF, 0, 0, 00, 0, 0, "Osmanya"),
+ 0x104D4: ("", "reserved", 0x104D4, 0x104D7, 0, 0, 00, 0, 0, "Osage"),
+ 0x104FC: ("", "reserved", 0x104FC, 0x104FF, 0, 0, 00, 0, 0, "Osage"),
+ 0x10528: ("", "reserved", 0x10528, 0x1052F, 0, 0, 00, 0, 0, "Elbasan"),
+ 0x10564: ("", "reserved", 0x10564, 0x1056E, 0, 0, 00, 0, 0, "Caucasian_Albanian"),
+ 0x10570: ("", "reserved", 0x10570, 0x105FF, 0, 0, 00, 0, 0, "NB"),
+ 0x10737: ("", "reserved", 0x10737, 0x1073F, 0, 0, 00, 0, 0, "Linear_A"),
+ 0x10756: ("", "reserved", 0x10756, 0x1075F, 0, 0, 00, 0, 0, "Linear_A"),
+ 0x10768: ("", "reserved", 0x10768, 0x1077F, 0, 0, 00, 0, 0, "Linear_A"),
+ 0x10780: ("", "reserved", 0x10780, 0x107FF, 0, 0, 00, 0, 0, "NB"),
+ 0x10806: ("", "reserved", 0x10806, 0x10807, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
+ 0x10809: ("", "reserved", 0x10809, 0x10809, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
+ 0x10836: ("", "reserved", 0x10836, 0x10836, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
+ 0x10839: ("", "reserved", 0x10839, 0x1083B, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
+ 0x1083D: ("", "reserved", 0x1083D, 0x1083E, 0, 0, 00, 0, 0, "Cypriot_Syllabary"),
+ 0x10856: ("", "reserved", 0x10856, 0x10856, 0, 0, 00, 0, 0, "Imperial_Aramaic"),
+ 0x1089F: ("", "reserved", 0x1089F, 0x108A6, 0, 0, 00, 0, 0, "Nabataean"),
+ 0x108B0: ("", "reserved", 0x108B0, 0x108DF, 0, 0, 00, 0, 0, "NB"),
+ 0x108F3: ("", "reserved", 0x108F3, 0x108F3, 0, 0, 00, 0, 0, "Hatran"),
+ 0x108F6: ("", "reserved", 0x108F6, 0x108FA, 0, 0, 00, 0, 0, "Hatran"),
+ 0x1091C: ("", "reserved", 0x1091C, 0x1091E, 0, 0, 00, 0, 0, "Phoenician"),
+ 0x1093A: ("", "reserved", 0x1093A, 0x1093E, 0, 0, 00, 0, 0, "Lydian"),
+ 0x10940: ("", "reserved", 0x10940, 0x1097F, 0, 0, 00, 0, 0, "NB"),
+ 0x109B8: ("", "reserved", 0x109B8, 0x109BB, 0, 0, 00, 0, 0, "Meroitic_Cursive"),
+ 0x109D0: ("", "reserved", 0x109D0, 0x109D1, 0, 0, 00, 0, 0, "Meroitic_Cursive"),
+ 0x10A04: ("", "reserved", 0x10A04, 0x10A04, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A07: ("", "reserved", 0x10A07, 0x10A0B, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A14: ("", "reserved", 0x10A14, 0x10A14, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A18: ("", "reserved", 0x10A18, 0x10A18, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A36: ("", "reserved", 0x10A36, 0x10A37, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A3B: ("", "reserved", 0x10A3B, 0x10A3E, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A49: ("", "reserved", 0x10A49, 0x10A4F, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10A59: ("", "reserved", 0x10A59, 0x10A5F, 0, 0, 00, 0, 0, "Kharoshthi"),
+ 0x10AA0: ("", "reserved", 0x10AA0, 0x10ABF, 0, 0, 00, 0, 0, "NB"),
+ 0x10AE7: ("", "reserved", 0x10AE7, 0x10AEA, 0, 0, 00, 0, 0, "Manichaean"),
+ 0x10AF7: ("", "reserved", 0x10AF7, 0x10AFF, 0, 0, 00, 0, 0, "Manichaean"),
+ 0x10B36: ("", "reserved", 0x10B36, 0x10B38, 0, 0, 00, 0, 0, "Avestan"),
+ 0x10B56: ("", "reserved", 0x10B56, 0x10B57, 0, 0, 00, 0, 0, "Inscriptional_Parthian"),
+ 0x10B73: ("", "reserved", 0x10B73, 0x10B77, 0, 0, 00, 0, 0, "Inscriptional_Pahlavi"),
+ 0x10B92: ("", "reserved", 0x10B92, 0x10B98, 0, 0, 00, 0, 0, "Psalter_Pahlavi"),
+ 0x10B9D: ("", "reserved", 0x10B9D, 0x10BA8, 0, 0, 00, 0, 0, "Psalter_Pahlavi"),
+ 0x10BB0: ("", "reserved", 0x10BB0, 0x10BFF, 0, 0, 00, 0, 0, "NB"),
+ 0x10C49: ("", "reserved", 0x10C49, 0x10C4F, 0, 0, 00, 0, 0, "Old_Turkic"),
+ 0x10C50: ("", "reserved", 0x10C50, 0x10C7F, 0, 0, 00, 0, 0, "NB"),
+ 0x10CB3: ("", "reserved", 0x10CB3, 0x10CBF, 0, 0, 00, 0, 0, "Old_Hungarian"),
+ 0x10CF3: ("", "reserved", 0x10CF3, 0x10CF9, 0, 0, 00, 0, 0, "Old_Hungarian"),
+ 0x10D28: ("", "reserved", 0x10D28, 0x10D2F, 0, 0, 00, 0, 0, "Hanifi_Rohingya"),
+ 0x10D3A: ("", "reserved", 0x10D3A, 0x10D3F, 0, 0, 00, 0, 0, "Hanifi_Rohingya"),
+ 0x10D40: ("", "reserved", 0x10D40, 0x10E5F, 0, 0, 00, 0, 0, "NB"),
+ 0x10E7F: ("", "reserved", 0x10E7F, 0x10E7F, 0, 0, 00, 0, 0, "Rumi"),
+ 0x10E80: ("", "reserved", 0x10E80, 0x10EFF, 0, 0, 00, 0, 0, "NB"),
+ 0x10F28: ("", "reserved", 0x10F28, 0x10F2F, 0, 0, 00, 0, 0, "Old_Sogdian"),
+ 0x10F5A: ("", "reserved", 0x10F5A, 0x10F6F, 0, 0, 00, 0, 0, "Sogdian"),
+ 0x10F70: ("", "reserved", 0x10F70, 0x10FFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1104E: ("", "reserved", 0x1104E, 0x11051, 0, 0, 00, 0, 0, "Brahmi"),
+ 0x11070: ("", "reserved", 0x11070, 0x1107E, 0, 0, 00, 0, 0, "Brahmi"),
+ 0x110C2: ("", "reserved", 0x110C2, 0x110CC, 0, 0, 00, 0, 0, "Kaithi"),
+ 0x110CE: ("", "reserved", 0x110CE, 0x110CF, 0, 0, 00, 0, 0, "Kaithi"),
+ 0x110E9: ("", "reserved", 0x110E9, 0x110EF, 0, 0, 00, 0, 0, "Sora_Sompeng"),
+ 0x110FA: ("", "reserved", 0x110FA, 0x110FF, 0, 0, 00, 0, 0, "Sora_Sompeng"),
+ 0x11135: ("", "reserved", 0x11135, 0x11135, 0, 0, 00, 0, 0, "Chakma"),
+ 0x11147: ("", "reserved", 0x11147, 0x1114F, 0, 0, 00, 0, 0, "Chakma"),
+ 0x11177: ("", "reserved", 0x11177, 0x1117F, 0, 0, 00, 0, 0, "Mahajani"),
+ 0x111CE: ("", "reserved", 0x111CE, 0x111CF, 0, 0, 00, 0, 0, "Sharada"),
+ 0x111E0: ("", "reserved", 0x111E0, 0x111E0, 0, 0, 00, 0, 0, "Sinhala_Archaic_Numbers"),
+ 0x111F5: ("", "reserved", 0x111F5, 0x111FF, 0, 0, 00, 0, 0, "Sinhala_Archaic_Numbers"),
+ 0x11212: ("", "reserved", 0x11212, 0x11212, 0, 0, 00, 0, 0, "Khojki"),
+ 0x1123F: ("", "reserved", 0x1123F, 0x1124F, 0, 0, 00, 0, 0, "Khojki"),
+ 0x11250: ("", "reserved", 0x11250, 0x1127F, 0, 0, 00, 0, 0, "NB"),
+ 0x11287: ("", "reserved", 0x11287, 0x11287, 0, 0, 00, 0, 0, "Multani"),
+ 0x11289: ("", "reserved", 0x11289, 0x11289, 0, 0, 00, 0, 0, "Multani"),
+ 0x1128E: ("", "reserved", 0x1128E, 0x1128E, 0, 0, 00, 0, 0, "Multani"),
+ 0x1129E: ("", "reserved", 0x1129E, 0x1129E, 0, 0, 00, 0, 0, "Multani"),
+ 0x112AA: ("", "reserved", 0x112AA, 0x112AF, 0, 0, 00, 0, 0, "Multani"),
+ 0x112EB: ("", "reserved", 0x112EB, 0x112EF, 0, 0, 00, 0, 0, "Khudawadi"),
+ 0x112FA: ("", "reserved", 0x112FA, 0x112FF, 0, 0, 00, 0, 0, "Khudawadi"),
+ 0x11304: ("", "reserved", 0x11304, 0x11304, 0, 0, 00, 0, 0, "Grantha"),
+ 0x1130D: ("", "reserved", 0x1130D, 0x1130E, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11311: ("", "reserved", 0x11311, 0x11312, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11329: ("", "reserved", 0x11329, 0x11329, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11331: ("", "reserved", 0x11331, 0x11331, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11334: ("", "reserved", 0x11334, 0x11334, 0, 0, 00, 0, 0, "Grantha"),
+ 0x1133A: ("", "reserved", 0x1133A, 0x1133A, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11345: ("", "reserved", 0x11345, 0x11346, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11349: ("", "reserved", 0x11349, 0x1134A, 0, 0, 00, 0, 0, "Grantha"),
+ 0x1134E: ("", "reserved", 0x1134E, 0x1134F, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11351: ("", "reserved", 0x11351, 0x11356, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11358: ("", "reserved", 0x11358, 0x1135C, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11364: ("", "reserved", 0x11364, 0x11365, 0, 0, 00, 0, 0, "Grantha"),
+ 0x1136D: ("", "reserved", 0x1136D, 0x1136F, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11375: ("", "reserved", 0x11375, 0x1137F, 0, 0, 00, 0, 0, "Grantha"),
+ 0x11380: ("", "reserved", 0x11380, 0x113FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1145A: ("", "reserved", 0x1145A, 0x1145A, 0, 0, 00, 0, 0, "Newa"),
+ 0x1145C: ("", "reserved", 0x1145C, 0x1145C, 0, 0, 00, 0, 0, "Newa"),
+ 0x1145F: ("", "reserved", 0x1145F, 0x1147F, 0, 0, 00, 0, 0, "Newa"),
+ 0x114C8: ("", "reserved", 0x114C8, 0x114CF, 0, 0, 00, 0, 0, "Tirhuta"),
+ 0x114DA: ("", "reserved", 0x114DA, 0x114DF, 0, 0, 00, 0, 0, "Tirhuta"),
+ 0x114E0: ("", "reserved", 0x114E0, 0x1157F, 0, 0, 00, 0, 0, "NB"),
+ 0x115B6: ("", "reserved", 0x115B6, 0x115B7, 0, 0, 00, 0, 0, "Siddham"),
+ 0x115DE: ("", "reserved", 0x115DE, 0x115FF, 0, 0, 00, 0, 0, "Siddham"),
+ 0x11645: ("", "reserved", 0x11645, 0x1164F, 0, 0, 00, 0, 0, "Modi"),
+ 0x1165A: ("", "reserved", 0x1165A, 0x1165F, 0, 0, 00, 0, 0, "Modi"),
+ 0x1166D: ("", "reserved", 0x1166D, 0x1167F, 0, 0, 00, 0, 0, "Mongolian_Sup"),
+ 0x116B8: ("", "reserved", 0x116B8, 0x116BF, 0, 0, 00, 0, 0, "Takri"),
+ 0x116CA: ("", "reserved", 0x116CA, 0x116CF, 0, 0, 00, 0, 0, "Takri"),
+ 0x116D0: ("", "reserved", 0x116D0, 0x116FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1171B: ("", "reserved", 0x1171B, 0x1171C, 0, 0, 00, 0, 0, "Ahom"),
+ 0x1172C: ("", "reserved", 0x1172C, 0x1172F, 0, 0, 00, 0, 0, "Ahom"),
+ 0x11740: ("", "reserved", 0x11740, 0x117FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1183C: ("", "reserved", 0x1183C, 0x1184F, 0, 0, 00, 0, 0, "Dogra"),
+ 0x11850: ("", "reserved", 0x11850, 0x1189F, 0, 0, 00, 0, 0, "NB"),
+ 0x118F3: ("", "reserved", 0x118F3, 0x118FE, 0, 0, 00, 0, 0, "Warang_Citi"),
+ 0x11900: ("", "reserved", 0x11900, 0x119FF, 0, 0, 00, 0, 0, "NB"),
+ 0x11A48: ("", "reserved", 0x11A48, 0x11A4F, 0, 0, 00, 0, 0, "Zanabazar_Square"),
+ 0x11A84: ("", "reserved", 0x11A84, 0x11A85, 0, 0, 00, 0, 0, "Soyombo"),
+ 0x11AA3: ("", "reserved", 0x11AA3, 0x11AAF, 0, 0, 00, 0, 0, "Soyombo"),
+ 0x11AB0: ("", "reserved", 0x11AB0, 0x11ABF, 0, 0, 00, 0, 0, "NB"),
+ 0x11AF9: ("", "reserved", 0x11AF9, 0x11AFF, 0, 0, 00, 0, 0, "Pau_Cin_Hau"),
+ 0x11B00: ("", "reserved", 0x11B00, 0x11BFF, 0, 0, 00, 0, 0, "NB"),
+ 0x11C09: ("", "reserved", 0x11C09, 0x11C09, 0, 0, 00, 0, 0, "Bhaiksuki"),
+ 0x11C37: ("", "reserved", 0x11C37, 0x11C37, 0, 0, 00, 0, 0, "Bhaiksuki"),
+ 0x11C46: ("", "reserved", 0x11C46, 0x11C4F, 0, 0, 00, 0, 0, "Bhaiksuki"),
+ 0x11C6D: ("", "reserved", 0x11C6D, 0x11C6F, 0, 0, 00, 0, 0, "Bhaiksuki"),
+ 0x11C90: ("", "reserved", 0x11C90, 0x11C91, 0, 0, 00, 0, 0, "Marchen"),
+ 0x11CA8: ("", "reserved", 0x11CA8, 0x11CA8, 0, 0, 00, 0, 0, "Marchen"),
+ 0x11CB7: ("", "reserved", 0x11CB7, 0x11CBF, 0, 0, 00, 0, 0, "Marchen"),
+ 0x11CC0: ("", "reserved", 0x11CC0, 0x11CFF, 0, 0, 00, 0, 0, "NB"),
+ 0x11D07: ("", "reserved", 0x11D07, 0x11D07, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D0A: ("", "reserved", 0x11D0A, 0x11D0A, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D37: ("", "reserved", 0x11D37, 0x11D39, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D3B: ("", "reserved", 0x11D3B, 0x11D3B, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D3E: ("", "reserved", 0x11D3E, 0x11D3E, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D48: ("", "reserved", 0x11D48, 0x11D4F, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D5A: ("", "reserved", 0x11D5A, 0x11D5F, 0, 0, 00, 0, 0, "Masaram_Gondi"),
+ 0x11D66: ("", "reserved", 0x11D66, 0x11D66, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
+ 0x11D69: ("", "reserved", 0x11D69, 0x11D69, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
+ 0x11D8F: ("", "reserved", 0x11D8F, 0x11D8F, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
+ 0x11D92: ("", "reserved", 0x11D92, 0x11D92, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
+ 0x11D99: ("", "reserved", 0x11D99, 0x11D9F, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
+ 0x11DAA: ("", "reserved", 0x11DAA, 0x11DAF, 0, 0, 00, 0, 0, "Gunjala_Gondi"),
+ 0x11DB0: ("", "reserved", 0x11DB0, 0x11EDF, 0, 0, 00, 0, 0, "NB"),
+ 0x11EF9: ("", "reserved", 0x11EF9, 0x11EFF, 0, 0, 00, 0, 0, "Makasar"),
+ 0x11F00: ("", "reserved", 0x11F00, 0x11FFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1239A: ("", "reserved", 0x1239A, 0x123FF, 0, 0, 00, 0, 0, "Cuneiform"),
+ 0x1246F: ("", "reserved", 0x1246F, 0x1246F, 0, 0, 00, 0, 0, "Cuneiform_Numbers"),
+ 0x12475: ("", "reserved", 0x12475, 0x1247F, 0, 0, 00, 0, 0, "Cuneiform_Numbers"),
+ 0x12544: ("", "reserved", 0x12544, 0x1254F, 0, 0, 00, 0, 0, "Early_Dynastic_Cuneiform"),
+ 0x12550: ("", "reserved", 0x12550, 0x12FFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1342F: ("", "reserved", 0x1342F, 0x1342F, 0, 0, 00, 0, 0, "Egyptian_Hieroglyphs"),
+ 0x13430: ("", "reserved", 0x13430, 0x143FF, 0, 0, 00, 0, 0, "NB"),
+ 0x14647: ("", "reserved", 0x14647, 0x1467F, 0, 0, 00, 0, 0, "Anatolian_Hieroglyphs"),
+ 0x14680: ("", "reserved", 0x14680, 0x167FF, 0, 0, 00, 0, 0, "NB"),
+ 0x16A39: ("", "reserved", 0x16A39, 0x16A3F, 0, 0, 00, 0, 0, "Bamum_Sup"),
+ 0x16A5F: ("", "reserved", 0x16A5F, 0x16A5F, 0, 0, 00, 0, 0, "Mro"),
+ 0x16A6A: ("", "reserved", 0x16A6A, 0x16A6D, 0, 0, 00, 0, 0, "Mro"),
+ 0x16A70: ("", "reserved", 0x16A70, 0x16ACF, 0, 0, 00, 0, 0, "NB"),
+ 0x16AEE: ("", "reserved", 0x16AEE, 0x16AEF, 0, 0, 00, 0, 0, "Bassa_Vah"),
+ 0x16AF6: ("", "reserved", 0x16AF6, 0x16AFF, 0, 0, 00, 0, 0, "Bassa_Vah"),
+ 0x16B46: ("", "reserved", 0x16B46, 0x16B4F, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
+ 0x16B5A: ("", "reserved", 0x16B5A, 0x16B5A, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
+ 0x16B62: ("", "reserved", 0x16B62, 0x16B62, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
+ 0x16B78: ("", "reserved", 0x16B78, 0x16B7C, 0, 0, 00, 0, 0, "Pahawh_Hmong"),
+ 0x16B90: ("", "reserved", 0x16B90, 0x16E3F, 0, 0, 00, 0, 0, "NB"),
+ 0x16E9B: ("", "reserved", 0x16E9B, 0x16E9F, 0, 0, 00, 0, 0, "Medefaidrin"),
+ 0x16EA0: ("", "reserved", 0x16EA0, 0x16EFF, 0, 0, 00, 0, 0, "NB"),
+ 0x16F45: ("", "reserved", 0x16F45, 0x16F4F, 0, 0, 00, 0, 0, "Miao"),
+ 0x16F7F: ("", "reserved", 0x16F7F, 0x16F8E, 0, 0, 00, 0, 0, "Miao"),
+ 0x16FA0: ("", "reserved", 0x16FA0, 0x16FDF, 0, 0, 00, 0, 0, "NB"),
+ 0x16FE2: ("", "reserved", 0x16FE2, 0x16FFF, 0, 0, 00, 0, 0, "Ideographic_Symbols"),
+ 0x187F2: ("", "reserved", 0x187F2, 0x187FF, 0, 0, 00, 0, 0, "Tangut"),
+ 0x18AF3: ("", "reserved", 0x18AF3, 0x18AFF, 0, 0, 00, 0, 0, "Tangut_Components"),
+ 0x18B00: ("", "reserved", 0x18B00, 0x1AFFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1B11F: ("", "reserved", 0x1B11F, 0x1B12F, 0, 0, 00, 0, 0, "Kana_Ext_A"),
+ 0x1B130: ("", "reserved", 0x1B130, 0x1B16F, 0, 0, 00, 0, 0, "NB"),
+ 0x1B2FC: ("", "reserved", 0x1B2FC, 0x1B2FF, 0, 0, 00, 0, 0, "Nushu"),
+ 0x1B300: ("", "reserved", 0x1B300, 0x1BBFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1BC6B: ("", "reserved", 0x1BC6B, 0x1BC6F, 0, 0, 00, 0, 0, "Duployan"),
+ 0x1BC7D: ("", "reserved", 0x1BC7D, 0x1BC7F, 0, 0, 00, 0, 0, "Duployan"),
+ 0x1BC89: ("", "reserved", 0x1BC89, 0x1BC8F, 0, 0, 00, 0, 0, "Duployan"),
+ 0x1BC9A: ("", "reserved", 0x1BC9A, 0x1BC9B, 0, 0, 00, 0, 0, "Duployan"),
+ 0x1BCA4: ("", "reserved", 0x1BCA4, 0x1BCAF, 0, 0, 00, 0, 0, "Shorthand_Format_Controls"),
+ 0x1BCB0: ("", "reserved", 0x1BCB0, 0x1CFFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1D0F6: ("", "reserved", 0x1D0F6, 0x1D0FF, 0, 0, 00, 0, 0, "Byzantine_Music"),
+ 0x1D127: ("", "reserved", 0x1D127, 0x1D128, 0, 0, 00, 0, 0, "Music"),
+ 0x1D1E9: ("", "reserved", 0x1D1E9, 0x1D1FF, 0, 0, 00, 0, 0, "Music"),
+ 0x1D246: ("", "reserved", 0x1D246, 0x1D24F, 0, 0, 00, 0, 0, "Ancient_Greek_Music"),
+ 0x1D250: ("", "reserved", 0x1D250, 0x1D2DF, 0, 0, 00, 0, 0, "NB"),
+ 0x1D2F4: ("", "reserved", 0x1D2F4, 0x1D2FF, 0, 0, 00, 0, 0, "Mayan_Numerals"),
+ 0x1D357: ("", "reserved", 0x1D357, 0x1D35F, 0, 0, 00, 0, 0, "Tai_Xuan_Jing"),
+ 0x1D379: ("", "reserved", 0x1D379, 0x1D37F, 0, 0, 00, 0, 0, "Counting_Rod"),
+ 0x1D380: ("", "reserved", 0x1D380, 0x1D3FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1D455: ("", "reserved", 0x1D455, 0x1D455, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D49D: ("", "reserved", 0x1D49D, 0x1D49D, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4A0: ("", "reserved", 0x1D4A0, 0x1D4A1, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4A3: ("", "reserved", 0x1D4A3, 0x1D4A4, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4A7: ("", "reserved", 0x1D4A7, 0x1D4A8, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4AD: ("", "reserved", 0x1D4AD, 0x1D4AD, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4BA: ("", "reserved", 0x1D4BA, 0x1D4BA, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4BC: ("", "reserved", 0x1D4BC, 0x1D4BC, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D4C4: ("", "reserved", 0x1D4C4, 0x1D4C4, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D506: ("", "reserved", 0x1D506, 0x1D506, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D50B: ("", "reserved", 0x1D50B, 0x1D50C, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D515: ("", "reserved", 0x1D515, 0x1D515, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D51D: ("", "reserved", 0x1D51D, 0x1D51D, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D53A: ("", "reserved", 0x1D53A, 0x1D53A, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D53F: ("", "reserved", 0x1D53F, 0x1D53F, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D545: ("", "reserved", 0x1D545, 0x1D545, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D547: ("", "reserved", 0x1D547, 0x1D549, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D551: ("", "reserved", 0x1D551, 0x1D551, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D6A6: ("", "reserved", 0x1D6A6, 0x1D6A7, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1D7CC: ("", "reserved", 0x1D7CC, 0x1D7CD, 0, 0, 00, 0, 0, "Math_Alphanum"),
+ 0x1DA8C: ("", "reserved", 0x1DA8C, 0x1DA9A, 0, 0, 00, 0, 0, "Sutton_SignWriting"),
+ 0x1DAA0: ("", "reserved", 0x1DAA0, 0x1DAA0, 0, 0, 00, 0, 0, "Sutton_SignWriting"),
+ 0x1DAB0: ("", "reserved", 0x1DAB0, 0x1DFFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1E007: ("", "reserved", 0x1E007, 0x1E007, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
+ 0x1E019: ("", "reserved", 0x1E019, 0x1E01A, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
+ 0x1E022: ("", "reserved", 0x1E022, 0x1E022, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
+ 0x1E025: ("", "reserved", 0x1E025, 0x1E025, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
+ 0x1E02B: ("", "reserved", 0x1E02B, 0x1E02F, 0, 0, 00, 0, 0, "Glagolitic_Sup"),
+ 0x1E030: ("", "reserved", 0x1E030, 0x1E7FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1E8C5: ("", "reserved", 0x1E8C5, 0x1E8C6, 0, 0, 00, 0, 0, "Mende_Kikakui"),
+ 0x1E8D7: ("", "reserved", 0x1E8D7, 0x1E8DF, 0, 0, 00, 0, 0, "Mende_Kikakui"),
+ 0x1E8E0: ("", "reserved", 0x1E8E0, 0x1E8FF, 0, 0, 00, 0, 0, "NB"),
+ 0x1E94B: ("", "reserved", 0x1E94B, 0x1E94F, 0, 0, 00, 0, 0, "Adlam"),
+ 0x1E95A: ("", "reserved", 0x1E95A, 0x1E95D, 0, 0, 00, 0, 0, "Adlam"),
+ 0x1E960: ("", "reserved", 0x1E960, 0x1EC6F, 0, 0, 00, 0, 0, "NB"),
+ 0x1EC70: ("", "reserved", 0x1EC70, 0x1EC70, 0, 0, 00, 0, 0, "Indic_Siyaq_Numbers"),
+ 0x1ECB5: ("", "reserved", 0x1ECB5, 0x1ECBF, 0, 0, 00, 0, 0, "Indic_Siyaq_Numbers"),
+ 0x1ECC0: ("", "reserved", 0x1ECC0, 0x1EDFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1EE04: ("", "reserved", 0x1EE04, 0x1EE04, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE20: ("", "reserved", 0x1EE20, 0x1EE20, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE23: ("", "reserved", 0x1EE23, 0x1EE23, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE25: ("", "reserved", 0x1EE25, 0x1EE26, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE28: ("", "reserved", 0x1EE28, 0x1EE28, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE33: ("", "reserved", 0x1EE33, 0x1EE33, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE38: ("", "reserved", 0x1EE38, 0x1EE38, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE3A: ("", "reserved", 0x1EE3A, 0x1EE3A, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE3C: ("", "reserved", 0x1EE3C, 0x1EE41, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE43: ("", "reserved", 0x1EE43, 0x1EE46, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE48: ("", "reserved", 0x1EE48, 0x1EE48, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE4A: ("", "reserved", 0x1EE4A, 0x1EE4A, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE4C: ("", "reserved", 0x1EE4C, 0x1EE4C, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE50: ("", "reserved", 0x1EE50, 0x1EE50, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE53: ("", "reserved", 0x1EE53, 0x1EE53, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE55: ("", "reserved", 0x1EE55, 0x1EE56, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE58: ("", "reserved", 0x1EE58, 0x1EE58, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE5A: ("", "reserved", 0x1EE5A, 0x1EE5A, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE5C: ("", "reserved", 0x1EE5C, 0x1EE5C, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE5E: ("", "reserved", 0x1EE5E, 0x1EE5E, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE60: ("", "reserved", 0x1EE60, 0x1EE60, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE63: ("", "reserved", 0x1EE63, 0x1EE63, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE65: ("", "reserved", 0x1EE65, 0x1EE66, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE6B: ("", "reserved", 0x1EE6B, 0x1EE6B, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE73: ("", "reserved", 0x1EE73, 0x1EE73, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE78: ("", "reserved", 0x1EE78, 0x1EE78, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE7D: ("", "reserved", 0x1EE7D, 0x1EE7D, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE7F: ("", "reserved", 0x1EE7F, 0x1EE7F, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE8A: ("", "reserved", 0x1EE8A, 0x1EE8A, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EE9C: ("", "reserved", 0x1EE9C, 0x1EEA0, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EEA4: ("", "reserved", 0x1EEA4, 0x1EEA4, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EEAA: ("", "reserved", 0x1EEAA, 0x1EEAA, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EEBC: ("", "reserved", 0x1EEBC, 0x1EEEF, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EEF2: ("", "reserved", 0x1EEF2, 0x1EEFF, 0, 0, 00, 0, 0, "Arabic_Math"),
+ 0x1EF00: ("", "reserved", 0x1EF00, 0x1EFFF, 0, 0, 00, 0, 0, "NB"),
+ 0x1F02C: ("", "reserved", 0x1F02C, 0x1F02F, 0, 0, 00, 0, 0, "Mahjong"),
+ 0x1F094: ("", "reserved", 0x1F094, 0x1F09F, 0, 0, 00, 0, 0, "Domino"),
+ 0x1F0AF: ("", "reserved", 0x1F0AF, 0x1F0B0, 0, 0, 00, 0, 0, "Playing_Cards"),
+ 0x1F0C0: ("", "reserved", 0x1F0C0, 0x1F0C0, 0, 0, 00, 0, 0, "Playing_Cards"),
+ 0x1F0D0: ("", "reserved", 0x1F0D0, 0x1F0D0, 0, 0, 00, 0, 0, "Playing_Cards"),
+ 0x1F0F6: ("", "reserved", 0x1F0F6, 0x1F0FF, 0, 0, 00, 0, 0, "Playing_Cards"),
+ 0x1F10D: ("", "reserved", 0x1F10D, 0x1F10F, 0, 0, 00, 0, 0, "Enclosed_Alphanum_Sup"),
+ 0x1F16C: ("", "reserved", 0x1F16C, 0x1F16F, 0, 0, 00, 0, 0, "Enclosed_Alphanum_Sup"),
+ 0x1F1AD: ("", "reserved", 0x1F1AD, 0x1F1E5, 0, 0, 00, 0, 0, "Enclosed_Alphanum_Sup"),
+ 0x1F203: ("", "reserved", 0x1F203, 0x1F20F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
+ 0x1F23C: ("", "reserved", 0x1F23C, 0x1F23F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
+ 0x1F249: ("", "reserved", 0x1F249, 0x1F24F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
+ 0x1F252: ("", "reserved", 0x1F252, 0x1F25F, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
+ 0x1F266: ("", "reserved", 0x1F266, 0x1F2FF, 0, 0, 00, 0, 0, "Enclosed_Ideographic_Sup"),
+ 0x1F6D5: ("", "reserved", 0x1F6D5, 0x1F6DF, 0, 0, 00, 0, 0, "Transport_And_Map"),
+ 0x1F6ED: ("", "reserved", 0x1F6ED, 0x1F6EF, 0, 0, 00, 0, 0, "Transport_And_Map"),
+ 0x1F6FA: ("", "reserved", 0x1F6FA, 0x1F6FF, 0, 0, 00, 0, 0, "Transport_And_Map"),
+ 0x1F774: ("", "reserved", 0x1F774, 0x1F77F, 0, 0, 00, 0, 0, "Alchemical"),
+ 0x1F7D9: ("", "reserved", 0x1F7D9, 0x1F7FF, 0, 0, 00, 0, 0, "Geometric_Shapes_Ext"),
+ 0x1F80C: ("", "reserved", 0x1F80C, 0x1F80F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
+ 0x1F848: ("", "reserved", 0x1F848, 0x1F84F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
+ 0x1F85A: ("", "reserved", 0x1F85A, 0x1F85F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
+ 0x1F888: ("", "reserved", 0x1F888, 0x1F88F, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
+ 0x1F8AE: ("", "reserved", 0x1F8AE, 0x1F8FF, 0, 0, 00, 0, 0, "Sup_Arrows_C"),
+ 0x1F90C: ("", "reserved", 0x1F90C, 0x1F90F, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F93F: ("", "reserved", 0x1F93F, 0x1F93F, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F971: ("", "reserved", 0x1F971, 0x1F972, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F977: ("", "reserved", 0x1F977, 0x1F979, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F97B: ("", "reserved", 0x1F97B, 0x1F97B, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F9A3: ("", "reserved", 0x1F9A3, 0x1F9AF, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F9BA: ("", "reserved", 0x1F9BA, 0x1F9BF, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1F9C3: ("", "reserved", 0x1F9C3, 0x1F9CF, 0, 0, 00, 0, 0, "Sup_Symbols_And_Pictographs"),
+ 0x1FA00: ("", "reserved", 0x1FA00, 0x1FA5F, 0, 0, 00, 0, 0, "Chess_Symbols"),
+ 0x1FA6E: ("", "reserved", 0x1FA6E, 0x1FA6F, 0, 0, 00, 0, 0, "Chess_Symbols"),
+ 0x1FA70: ("", "reserved", 0x1FA70, 0x1FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x1FFFE: ("", "noncharacter", 0x1FFFE, 0x1FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x2A6D7: ("", "reserved", 0x2A6D7, 0x2A6DF, 0, 0, 00, 0, 0, "CJK_Ext_B"),
+ 0x2A6E0: ("", "reserved", 0x2A6E0, 0x2A6FF, 0, 0, 00, 0, 0, "NB"),
+ 0x2B735: ("", "reserved", 0x2B735, 0x2B73F, 0, 0, 00, 0, 0, "CJK_Ext_C"),
+ 0x2B81E: ("", "reserved", 0x2B81E, 0x2B81F, 0, 0, 00, 0, 0, "CJK_Ext_D"),
+ 0x2CEA2: ("", "reserved", 0x2CEA2, 0x2CEAF, 0, 0, 00, 0, 0, "CJK_Ext_E"),
+ 0x2EBE1: ("", "reserved", 0x2EBE1, 0x2EBEF, 0, 0, 00, 0, 0, "CJK_Ext_F"),
+ 0x2EBF0: ("", "reserved", 0x2EBF0, 0x2F7FF, 0, 0, 00, 0, 0, "NB"),
+ 0x2FA1E: ("", "reserved", 0x2FA1E, 0x2FA1F, 0, 0, 00, 0, 0, "CJK_Compat_Ideographs_Sup"),
+ 0x2FA20: ("", "reserved", 0x2FA20, 0x2FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x2FFFE: ("", "noncharacter", 0x2FFFE, 0x2FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x30000: ("", "reserved", 0x30000, 0x3FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x3FFFE: ("", "noncharacter", 0x3FFFE, 0x3FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x40000: ("", "reserved", 0x40000, 0x4FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x4FFFE: ("", "noncharacter", 0x4FFFE, 0x4FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x50000: ("", "reserved", 0x50000, 0x5FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x5FFFE: ("", "noncharacter", 0x5FFFE, 0x5FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x60000: ("", "reserved", 0x60000, 0x6FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x6FFFE: ("", "noncharacter", 0x6FFFE, 0x6FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x70000: ("", "reserved", 0x70000, 0x7FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x7FFFE: ("", "noncharacter", 0x7FFFE, 0x7FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x80000: ("", "reserved", 0x80000, 0x8FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x8FFFE: ("", "noncharacter", 0x8FFFE, 0x8FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0x90000: ("", "reserved", 0x90000, 0x9FFFD, 0, 0, 00, 0, 0, "NB"),
+ 0x9FFFE: ("", "noncharacter", 0x9FFFE, 0x9FFFF, 0, 0, 10, 0, 0, "NB"),
+ 0xA0000: ("", "reserved", 0xA0000, 0xAFFFD, 0, 0, 00, 0, 0, "NB"),
+ 0xAFFFE: ("", "noncharacter", 0xAFFFE, 0xAFFFF, 0, 0, 10, 0, 0, "NB"),
+ 0xB0000: ("", "reserved", 0xB0000, 0xBFFFD, 0, 0, 00, 0, 0, "NB"),
+ 0xBFFFE: ("", "noncharacter", 0xBFFFE, 0xBFFFF, 0, 0, 10, 0, 0, "NB"),
+ 0xC0000: ("", "reserved", 0xC0000, 0xCFFFD, 0, 0, 00, 0, 0, "NB"),
+ 0xCFFFE: ("", "noncharacter", 0xCFFFE, 0xCFFFF, 0, 0, 10, 0, 0, "NB"),
+ 0xD0000: ("", "reserved", 0xD0000, 0xDFFFD, 0, 0, 00, 0, 0, "NB"),
+ 0xDFFFE: ("", "noncharacter", 0xDFFFE, 0xDFFFF, 0, 0, 10, 0, 0, "NB"),
+ 0xE0000: ("", "reserved", 0xE0000, 0xE0000, 0, 0, 00, 0, 0, "Tags"),
+ 0xE0002: ("", "reserved", 0xE0002, 0xE001F, 0, 0, 00, 0, 0, "Tags"),
+ 0xE0080: ("", "reserved", 0xE0080, 0xE00FF, 0, 0, 00, 0, 0, "NB"),
+ 0xE01F0: ("", "reserved", 0xE01F0, 0xE0FFF, 0, 0, 00, 0, 0, "NB"),
+ 0xE1000: ("", "reserved", 0xE1000, 0xEFFFD, 0, 0, 00, 0, 0, "NB"),
+ 0xEFFFE: ("", "noncharacter", 0xEFFFE, 0xEFFFF, 0, 0, 10, 0, 0, "NB"),
+ 0xFFFFE: ("", "noncharacter", 0xFFFFE, 0xFFFFF, 0, 0, 10, 0, 0, "Sup_PUA_A"),
+ 0x10FFFE: ("", "noncharacter", 0x10FFFE, 0x10FFFF, 0, 0, 10, 0, 0, "Sup_PUA_B"),
+}
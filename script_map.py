@@ -0,0 +1,1130 @@
+
+
+# tuple of Unicode script (short) names. The index of the script in the tuple is the script id.
+script_names = (
+ "Zyyy",
+ "Zinh",
+ "Adlm",
+ "Aghb",
+ "Ahom",
+ "Arab",
+ "Armi",
+ "Armn",
+ "Avst",
+ "Bali",
+ "Bamu",
+ "Bass",
+ "Batk",
+ "Beng",
+ "Bhks",
+ "Bopo",
+ "Brah",
+ "Brai",
+ "Bugi",
+ "Buhd",
+ "Cakm",
+ "Cans",
+ "Cari",
+ "Cham",
+ "Cher",
+ "Copt",
+ "Cprt",
+ "Cyrl",
+ "Deva",
+ "Dogr",
+ "Dsrt",
+ "Dupl",
+ "Egyp",
+ "Elba",
+ "Ethi",
+ "Geor",
+ "Glag",
+ "Gong",
+ "Gonm",
+ "Goth",
+ "Gran",
+ "Grek",
+ "Gujr",
+ "Guru",
+ "Hang",
+ "Hani",
+ "Hano",
+ "Hatr",
+ "Hebr",
+ "Hira",
+ "Hluw",
+ "Hmng",
+ "Hung",
+ "Ital",
+ "Java",
+ "Kali",
+ "Kana",
+ "Khar",
+ "Khmr",
+ "Khoj",
+ "Knda",
+ "Kthi",
+ "Lana",
+ "Laoo",
+ "Latn",
+ "Lepc",
+ "Limb",
+ "Lina",
+ "Linb",
+ "Lisu",
+ "Lyci",
+ "Lydi",
+ "Mahj",
+ "Maka",
+ "Mand",
+ "Mani",
+ "Marc",
+ "Medf",
+ "Mend",
+ "Merc",
+ "Mero",
+ "Mlym",
+ "Modi",
+ "Mong",
+ "Mroo",
+ "Mtei",
+ "Mult",
+ "Mymr",
+ "Narb",
+ "Nbat",
+ "Newa",
+ "Nkoo",
+ "Nshu",
+ "Ogam",
+ "Olck",
+ "Orkh",
+ "Orya",
+ "Osge",
+ "Osma",
+ "Palm",
+ "Pauc",
+ "Perm",
+ "Phag",
+ "Phli",
+ "Phlp",
+ "Phnx",
+ "Plrd",
+ "Prti",
+ "Rjng",
+ "Rohg",
+ "Runr",
+ "Samr",
+ "Sarb",
+ "Saur",
+ "Sgnw",
+ "Shaw",
+ "Shrd",
+ "Sidd",
+ "Sind",
+ "Sinh",
+ "Sogd",
+ "Sogo",
+ "Sora",
+ "Soyo",
+ "Sund",
+ "Sylo",
+ "Syrc",
+ "Tagb",
+ "Takr",
+ "Tale",
+ "Talu",
+ "Taml",
+ "Tang",
+ "Tavt",
+ "Telu",
+ "Tfng",
+ "Tglg",
+ "Thaa",
+ "Thai",
+ "Tibt",
+ "Tirh",
+ "Ugar",
+ "Vaii",
+ "Wara",
+ "Xpeo",
+ "Xsux",
+ "Yiii",
+ "Zanb",
+ "Zzzz",
+)
+
+
+# dictionary of Unicode scripts
+# entries are: key: (f, l, sc, scx), where
+#     key - the first code point in the range, f - the first code point of the range, l - the last code point of the range.
+#     sc - the script id of the Script property, scx - the Script_Extensions property as a bitmask of script ids.
+# code points not in the map are unassigned (script Unknown.)
+script_map = {
+ 0x0000: (0x0000, 0x0040, 0, 0x1),  #  Zyyy
+ 0x0041: (0x0041, 0x005a, 64, 0x10000000000000000),  #  Latn
+ 0x005b: (0x005b, 0x0060, 0, 0x1),  #  Zyyy
+ 0x0061: (0x0061, 0x007a, 64, 0x10000000000000000),  #  Latn
+ 0x007b: (0x007b, 0x00a9, 0, 0x1),  #  Zyyy
+ 0x00aa: (0x00aa, 0x00aa, 64, 0x10000000000000000),  #  Latn
+ 0x00ab: (0x00ab, 0x00b9, 0, 0x1),  #  Zyyy
+ 0x00ba: (0x00ba, 0x00ba, 64, 0x10000000000000000),  #  Latn
+ 0x00bb: (0x00bb, 0x00bf, 0, 0x1),  #  Zyyy
+ 0x00c0: (0x00c0, 0x00d6, 64, 0x10000000000000000),  #  Latn
+ 0x00d7: (0x00d7, 0x00d7, 0, 0x1),  #  Zyyy
+ 0x00d8: (0x00d8, 0x00f6, 64, 0x10000000000000000),  #  Latn
+ 0x00f7: (0x00f7, 0x00f7, 0, 0x1),  #  Zyyy
+ 0x00f8: (0x00f8, 0x02b8, 64, 0x10000000000000000),  #  Latn
+ 0x02b9: (0x02b9, 0x02df, 0, 0x1),  #  Zyyy
+ 0x02e0: (0x02e0, 0x02e4, 64, 0x10000000000000000),  #  Latn
+ 0x02e5: (0x02e5, 0x02e9, 0, 0x1),  #  Zyyy
+ 0x02ea: (0x02ea, 0x02eb, 15, 0x8000),  #  Bopo
+ 0x02ec: (0x02ec, 0x02ff, 0, 0x1),  #  Zyyy
+ 0x0300: (0x0300, 0x0341, 1, 0x2),  #  Zinh
+ 0x0342: (0x0342, 0x0342, 1, 0x20000000000),  #  Zinh
+ 0x0343: (0x0343, 0x0344, 1, 0x2),  #  Zinh
+ 0x0345: (0x0345, 0x0345, 1, 0x20000000000),  #  Zinh
+ 0x0346: (0x0346, 0x0362, 1, 0x2),  #  Zinh
+ 0x0363: (0x0363, 0x036f, 1, 0x10000000000000000),  #  Zinh
+ 0x0370: (0x0370, 0x0373, 41, 0x20000000000),  #  Grek
+ 0x0374: (0x0374, 0x0374, 0, 0x1),  #  Zyyy
+ 0x0375: (0x0375, 0x0377, 41, 0x20000000000),  #  Grek
+ 0x037a: (0x037a, 0x037d, 41, 0x20000000000),  #  Grek
+ 0x037e: (0x037e, 0x037e, 0, 0x1),  #  Zyyy
+ 0x037f: (0x037f, 0x037f, 41, 0x20000000000),  #  Grek
+ 0x0384: (0x0384, 0x0384, 41, 0x20000000000),  #  Grek
+ 0x0385: (0x0385, 0x0385, 0, 0x1),  #  Zyyy
+ 0x0386: (0x0386, 0x0386, 41, 0x20000000000),  #  Grek
+ 0x0387: (0x0387, 0x0387, 0, 0x1),  #  Zyyy
+ 0x0388: (0x0388, 0x038a, 41, 0x20000000000),  #  Grek
+ 0x038c: (0x038c, 0x038c, 41, 0x20000000000),  #  Grek
+ 0x038e: (0x038e, 0x03a1, 41, 0x20000000000),  #  Grek
+ 0x03a3: (0x03a3, 0x03e1, 41, 0x20000000000),  #  Grek
+ 0x03e2: (0x03e2, 0x03ef, 25, 0x2000000),  #  Copt
+ 0x03f0: (0x03f0, 0x03ff, 41, 0x20000000000),  #  Grek
+ 0x0400: (0x0400, 0x0482, 27, 0x8000000),  #  Cyrl
+ 0x0483: (0x0483, 0x0483, 27, 0x20000000000000000008000000),  #  Cyrl
+ 0x0484: (0x0484, 0x0484, 27, 0x1008000000),  #  Cyrl
+ 0x0485: (0x0485, 0x0486, 1, 0x10000000008000000),  #  Zinh
+ 0x0487: (0x0487, 0x0487, 27, 0x1008000000),  #  Cyrl
+ 0x0488: (0x0488, 0x052f, 27, 0x8000000),  #  Cyrl
+ 0x0531: (0x0531, 0x0556, 7, 0x80),  #  Armn
+ 0x0559: (0x0559, 0x0588, 7, 0x80),  #  Armn
+ 0x0589: (0x0589, 0x0589, 0, 0x800000080),  #  Zyyy
+ 0x058a: (0x058a, 0x058a, 7, 0x80),  #  Armn
+ 0x058d: (0x058d, 0x058f, 7, 0x80),  #  Armn
+ 0x0591: (0x0591, 0x05c7, 48, 0x1000000000000),  #  Hebr
+ 0x05d0: (0x05d0, 0x05ea, 48, 0x1000000000000),  #  Hebr
+ 0x05ef: (0x05ef, 0x05f4, 48, 0x1000000000000),  #  Hebr
+ 0x0600: (0x0600, 0x0604, 5, 0x20),  #  Arab
+ 0x0605: (0x0605, 0x0605, 0, 0x1),  #  Zyyy
+ 0x0606: (0x0606, 0x060b, 5, 0x20),  #  Arab
+ 0x060c: (0x060c, 0x060c, 0, 0x20040002000000000000000000000000020),  #  Zyyy
+ 0x060d: (0x060d, 0x061a, 5, 0x20),  #  Arab
+ 0x061b: (0x061b, 0x061b, 0, 0x20040002000000000000000000000000020),  #  Zyyy
+ 0x061c: (0x061c, 0x061c, 5, 0x20040000000000000000000000000000020),  #  Arab
+ 0x061e: (0x061e, 0x061e, 5, 0x20),  #  Arab
+ 0x061f: (0x061f, 0x061f, 0, 0x20040002000000000000000000000000020),  #  Zyyy
+ 0x0620: (0x0620, 0x063f, 5, 0x20),  #  Arab
+ 0x0640: (0x0640, 0x0640, 0, 0x4100210000000c000000000000000024),  #  Zyyy
+ 0x0641: (0x0641, 0x064a, 5, 0x20),  #  Arab
+ 0x064b: (0x064b, 0x0655, 1, 0x40000000000000000000000000000020),  #  Zinh
+ 0x0656: (0x0656, 0x065f, 5, 0x20),  #  Arab
+ 0x0660: (0x0660, 0x0669, 5, 0x20000000000000000000000000000000020),  #  Arab
+ 0x066a: (0x066a, 0x066f, 5, 0x20),  #  Arab
+ 0x0670: (0x0670, 0x0670, 1, 0x40000000000000000000000000000020),  #  Zinh
+ 0x0671: (0x0671, 0x06d3, 5, 0x20),  #  Arab
+ 0x06d4: (0x06d4, 0x06d4, 5, 0x2000000000000000000000000020),  #  Arab
+ 0x06d5: (0x06d5, 0x06dc, 5, 0x20),  #  Arab
+ 0x06dd: (0x06dd, 0x06dd, 0, 0x1),  #  Zyyy
+ 0x06de: (0x06de, 0x06ff, 5, 0x20),  #  Arab
+ 0x0700: (0x0700, 0x070d, 126, 0x40000000000000000000000000000000),  #  Syrc
+ 0x070f: (0x070f, 0x074a, 126, 0x40000000000000000000000000000000),  #  Syrc
+ 0x074d: (0x074d, 0x074f, 126, 0x40000000000000000000000000000000),  #  Syrc
+ 0x0750: (0x0750, 0x077f, 5, 0x20),  #  Arab
+ 0x0780: (0x0780, 0x07b1, 137, 0x20000000000000000000000000000000000),  #  Thaa
+ 0x07c0: (0x07c0, 0x07fa, 91, 0x80000000000000000000000),  #  Nkoo
+ 0x07fd: (0x07fd, 0x07ff, 91, 0x80000000000000000000000),  #  Nkoo
+ 0x0800: (0x0800, 0x082d, 111, 0x8000000000000000000000000000),  #  Samr
+ 0x0830: (0x0830, 0x083e, 111, 0x8000000000000000000000000000),  #  Samr
+ 0x0840: (0x0840, 0x085b, 74, 0x4000000000000000000),  #  Mand
+ 0x085e: (0x085e, 0x085e, 74, 0x4000000000000000000),  #  Mand
+ 0x0860: (0x0860, 0x086a, 126, 0x40000000000000000000000000000000),  #  Syrc
+ 0x08a0: (0x08a0, 0x08b4, 5, 0x20),  #  Arab
+ 0x08b6: (0x08b6, 0x08bd, 5, 0x20),  #  Arab
+ 0x08d3: (0x08d3, 0x08e1, 5, 0x20),  #  Arab
+ 0x08e2: (0x08e2, 0x08e2, 0, 0x1),  #  Zyyy
+ 0x08e3: (0x08e3, 0x08ff, 5, 0x20),  #  Arab
+ 0x0900: (0x0900, 0x0950, 28, 0x10000000),  #  Deva
+ 0x0951: (0x0951, 0x0951, 1, 0x1048001000010002000110000d0010002000),  #  Zinh
+ 0x0952: (0x0952, 0x0952, 1, 0x1048000000010002000110000d0010002000),  #  Zinh
+ 0x0953: (0x0953, 0x0963, 28, 0x10000000),  #  Deva
+ 0x0964: (0x0964, 0x0964, 0, 0x104920c000010002010010000d2030002000),  #  Zyyy
+ 0x0965: (0x0965, 0x0965, 0, 0x104920c000010002010410000d2030002000),  #  Zyyy
+ 0x0966: (0x0966, 0x096f, 28, 0x1002000000030000000),  #  Deva
+ 0x0970: (0x0970, 0x097f, 28, 0x10000000),  #  Deva
+ 0x0980: (0x0980, 0x0983, 13, 0x2000),  #  Beng
+ 0x0985: (0x0985, 0x098c, 13, 0x2000),  #  Beng
+ 0x098f: (0x098f, 0x0990, 13, 0x2000),  #  Beng
+ 0x0993: (0x0993, 0x09a8, 13, 0x2000),  #  Beng
+ 0x09aa: (0x09aa, 0x09b0, 13, 0x2000),  #  Beng
+ 0x09b2: (0x09b2, 0x09b2, 13, 0x2000),  #  Beng
+ 0x09b6: (0x09b6, 0x09b9, 13, 0x2000),  #  Beng
+ 0x09bc: (0x09bc, 0x09c4, 13, 0x2000),  #  Beng
+ 0x09c7: (0x09c7, 0x09c8, 13, 0x2000),  #  Beng
+ 0x09cb: (0x09cb, 0x09ce, 13, 0x2000),  #  Beng
+ 0x09d7: (0x09d7, 0x09d7, 13, 0x2000),  #  Beng
+ 0x09dc: (0x09dc, 0x09dd, 13, 0x2000),  #  Beng
+ 0x09df: (0x09df, 0x09e3, 13, 0x2000),  #  Beng
+ 0x09e6: (0x09e6, 0x09ef, 13, 0x20000000000000000000000000102000),  #  Beng
+ 0x09f0: (0x09f0, 0x09fe, 13, 0x2000),  #  Beng
+ 0x0a01: (0x0a01, 0x0a03, 43, 0x80000000000),  #  Guru
+ 0x0a05: (0x0a05, 0x0a0a, 43, 0x80000000000),  #  Guru
+ 0x0a0f: (0x0a0f, 0x0a10, 43, 0x80000000000),  #  Guru
+ 0x0a13: (0x0a13, 0x0a28, 43, 0x80000000000),  #  Guru
+ 0x0a2a: (0x0a2a, 0x0a30, 43, 0x80000000000),  #  Guru
+ 0x0a32: (0x0a32, 0x0a33, 43, 0x80000000000),  #  Guru
+ 0x0a35: (0x0a35, 0x0a36, 43, 0x80000000000),  #  Guru
+ 0x0a38: (0x0a38, 0x0a39, 43, 0x80000000000),  #  Guru
+ 0x0a3c: (0x0a3c, 0x0a3c, 43, 0x80000000000),  #  Guru
+ 0x0a3e: (0x0a3e, 0x0a42, 43, 0x80000000000),  #  Guru
+ 0x0a47: (0x0a47, 0x0a48, 43, 0x80000000000),  #  Guru
+ 0x0a4b: (0x0a4b, 0x0a4d, 43, 0x80000000000),  #  Guru
+ 0x0a51: (0x0a51, 0x0a51, 43, 0x80000000000),  #  Guru
+ 0x0a59: (0x0a59, 0x0a5c, 43, 0x80000000000),  #  Guru
+ 0x0a5e: (0x0a5e, 0x0a5e, 43, 0x80000000000),  #  Guru
+ 0x0a66: (0x0a66, 0x0a6f, 43, 0x4000000000080000000000),  #  Guru
+ 0x0a70: (0x0a70, 0x0a76, 43, 0x80000000000),  #  Guru
+ 0x0a81: (0x0a81, 0x0a83, 42, 0x40000000000),  #  Gujr
+ 0x0a85: (0x0a85, 0x0a8d, 42, 0x40000000000),  #  Gujr
+ 0x0a8f: (0x0a8f, 0x0a91, 42, 0x40000000000),  #  Gujr
+ 0x0a93: (0x0a93, 0x0aa8, 42, 0x40000000000),  #  Gujr
+ 0x0aaa: (0x0aaa, 0x0ab0, 42, 0x40000000000),  #  Gujr
+ 0x0ab2: (0x0ab2, 0x0ab3, 42, 0x40000000000),  #  Gujr
+ 0x0ab5: (0x0ab5, 0x0ab9, 42, 0x40000000000),  #  Gujr
+ 0x0abc: (0x0abc, 0x0ac5, 42, 0x40000000000),  #  Gujr
+ 0x0ac7: (0x0ac7, 0x0ac9, 42, 0x40000000000),  #  Gujr
+ 0x0acb: (0x0acb, 0x0acd, 42, 0x40000000000),  #  Gujr
+ 0x0ad0: (0x0ad0, 0x0ad0, 42, 0x40000000000),  #  Gujr
+ 0x0ae0: (0x0ae0, 0x0ae3, 42, 0x40000000000),  #  Gujr
+ 0x0ae6: (0x0ae6, 0x0aef, 42, 0x800040000000000),  #  Gujr
+ 0x0af0: (0x0af0, 0x0af1, 42, 0x40000000000),  #  Gujr
+ 0x0af9: (0x0af9, 0x0aff, 42, 0x40000000000),  #  Gujr
+ 0x0b01: (0x0b01, 0x0b03, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b05: (0x0b05, 0x0b0c, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b0f: (0x0b0f, 0x0b10, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b13: (0x0b13, 0x0b28, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b2a: (0x0b2a, 0x0b30, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b32: (0x0b32, 0x0b33, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b35: (0x0b35, 0x0b39, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b3c: (0x0b3c, 0x0b44, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b47: (0x0b47, 0x0b48, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b4b: (0x0b4b, 0x0b4d, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b56: (0x0b56, 0x0b57, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b5c: (0x0b5c, 0x0b5d, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b5f: (0x0b5f, 0x0b63, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b66: (0x0b66, 0x0b77, 96, 0x1000000000000000000000000),  #  Orya
+ 0x0b82: (0x0b82, 0x0b83, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0b85: (0x0b85, 0x0b8a, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0b8e: (0x0b8e, 0x0b90, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0b92: (0x0b92, 0x0b95, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0b99: (0x0b99, 0x0b9a, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0b9c: (0x0b9c, 0x0b9c, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0b9e: (0x0b9e, 0x0b9f, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0ba3: (0x0ba3, 0x0ba4, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0ba8: (0x0ba8, 0x0baa, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0bae: (0x0bae, 0x0bb9, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0bbe: (0x0bbe, 0x0bc2, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0bc6: (0x0bc6, 0x0bc8, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0bca: (0x0bca, 0x0bcd, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0bd0: (0x0bd0, 0x0bd0, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0bd7: (0x0bd7, 0x0bd7, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0be6: (0x0be6, 0x0bf3, 131, 0x800000000000000000000010000000000),  #  Taml
+ 0x0bf4: (0x0bf4, 0x0bfa, 131, 0x800000000000000000000000000000000),  #  Taml
+ 0x0c00: (0x0c00, 0x0c0c, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c0e: (0x0c0e, 0x0c10, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c12: (0x0c12, 0x0c28, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c2a: (0x0c2a, 0x0c39, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c3d: (0x0c3d, 0x0c44, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c46: (0x0c46, 0x0c48, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c4a: (0x0c4a, 0x0c4d, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c55: (0x0c55, 0x0c56, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c58: (0x0c58, 0x0c5a, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c60: (0x0c60, 0x0c63, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c66: (0x0c66, 0x0c6f, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c78: (0x0c78, 0x0c7f, 134, 0x4000000000000000000000000000000000),  #  Telu
+ 0x0c80: (0x0c80, 0x0c8c, 60, 0x1000000000000000),  #  Knda
+ 0x0c8e: (0x0c8e, 0x0c90, 60, 0x1000000000000000),  #  Knda
+ 0x0c92: (0x0c92, 0x0ca8, 60, 0x1000000000000000),  #  Knda
+ 0x0caa: (0x0caa, 0x0cb3, 60, 0x1000000000000000),  #  Knda
+ 0x0cb5: (0x0cb5, 0x0cb9, 60, 0x1000000000000000),  #  Knda
+ 0x0cbc: (0x0cbc, 0x0cc4, 60, 0x1000000000000000),  #  Knda
+ 0x0cc6: (0x0cc6, 0x0cc8, 60, 0x1000000000000000),  #  Knda
+ 0x0cca: (0x0cca, 0x0ccd, 60, 0x1000000000000000),  #  Knda
+ 0x0cd5: (0x0cd5, 0x0cd6, 60, 0x1000000000000000),  #  Knda
+ 0x0cde: (0x0cde, 0x0cde, 60, 0x1000000000000000),  #  Knda
+ 0x0ce0: (0x0ce0, 0x0ce3, 60, 0x1000000000000000),  #  Knda
+ 0x0ce6: (0x0ce6, 0x0cef, 60, 0x1000000000000000),  #  Knda
+ 0x0cf1: (0x0cf1, 0x0cf2, 60, 0x1000000000000000),  #  Knda
+ 0x0d00: (0x0d00, 0x0d03, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d05: (0x0d05, 0x0d0c, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d0e: (0x0d0e, 0x0d10, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d12: (0x0d12, 0x0d44, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d46: (0x0d46, 0x0d48, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d4a: (0x0d4a, 0x0d4f, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d54: (0x0d54, 0x0d63, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d66: (0x0d66, 0x0d7f, 81, 0x200000000000000000000),  #  Mlym
+ 0x0d82: (0x0d82, 0x0d83, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0d85: (0x0d85, 0x0d96, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0d9a: (0x0d9a, 0x0db1, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0db3: (0x0db3, 0x0dbb, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0dbd: (0x0dbd, 0x0dbd, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0dc0: (0x0dc0, 0x0dc6, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0dca: (0x0dca, 0x0dca, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0dcf: (0x0dcf, 0x0dd4, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0dd6: (0x0dd6, 0x0dd6, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0dd8: (0x0dd8, 0x0ddf, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0de6: (0x0de6, 0x0def, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0df2: (0x0df2, 0x0df4, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x0e01: (0x0e01, 0x0e3a, 138, 0x40000000000000000000000000000000000),  #  Thai
+ 0x0e3f: (0x0e3f, 0x0e3f, 0, 0x1),  #  Zyyy
+ 0x0e40: (0x0e40, 0x0e5b, 138, 0x40000000000000000000000000000000000),  #  Thai
+ 0x0e81: (0x0e81, 0x0e82, 63, 0x8000000000000000),  #  Laoo
+ 0x0e84: (0x0e84, 0x0e84, 63, 0x8000000000000000),  #  Laoo
+ 0x0e87: (0x0e87, 0x0e88, 63, 0x8000000000000000),  #  Laoo
+ 0x0e8a: (0x0e8a, 0x0e8a, 63, 0x8000000000000000),  #  Laoo
+ 0x0e8d: (0x0e8d, 0x0e8d, 63, 0x8000000000000000),  #  Laoo
+ 0x0e94: (0x0e94, 0x0e97, 63, 0x8000000000000000),  #  Laoo
+ 0x0e99: (0x0e99, 0x0e9f, 63, 0x8000000000000000),  #  Laoo
+ 0x0ea1: (0x0ea1, 0x0ea3, 63, 0x8000000000000000),  #  Laoo
+ 0x0ea5: (0x0ea5, 0x0ea5, 63, 0x8000000000000000),  #  Laoo
+ 0x0ea7: (0x0ea7, 0x0ea7, 63, 0x8000000000000000),  #  Laoo
+ 0x0eaa: (0x0eaa, 0x0eab, 63, 0x8000000000000000),  #  Laoo
+ 0x0ead: (0x0ead, 0x0eb9, 63, 0x8000000000000000),  #  Laoo
+ 0x0ebb: (0x0ebb, 0x0ebd, 63, 0x8000000000000000),  #  Laoo
+ 0x0ec0: (0x0ec0, 0x0ec4, 63, 0x8000000000000000),  #  Laoo
+ 0x0ec6: (0x0ec6, 0x0ec6, 63, 0x8000000000000000),  #  Laoo
+ 0x0ec8: (0x0ec8, 0x0ecd, 63, 0x8000000000000000),  #  Laoo
+ 0x0ed0: (0x0ed0, 0x0ed9, 63, 0x8000000000000000),  #  Laoo
+ 0x0edc: (0x0edc, 0x0edf, 63, 0x8000000000000000),  #  Laoo
+ 0x0f00: (0x0f00, 0x0f47, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x0f49: (0x0f49, 0x0f6c, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x0f71: (0x0f71, 0x0f97, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x0f99: (0x0f99, 0x0fbc, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x0fbe: (0x0fbe, 0x0fcc, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x0fce: (0x0fce, 0x0fd4, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x0fd5: (0x0fd5, 0x0fd8, 0, 0x1),  #  Zyyy
+ 0x0fd9: (0x0fd9, 0x0fda, 139, 0x80000000000000000000000000000000000),  #  Tibt
+ 0x1000: (0x1000, 0x103f, 87, 0x8000000000000000000000),  #  Mymr
+ 0x1040: (0x1040, 0x1049, 87, 0x200000000008000000000000000100000),  #  Mymr
+ 0x104a: (0x104a, 0x109f, 87, 0x8000000000000000000000),  #  Mymr
+ 0x10a0: (0x10a0, 0x10c5, 35, 0x800000000),  #  Geor
+ 0x10c7: (0x10c7, 0x10c7, 35, 0x800000000),  #  Geor
+ 0x10cd: (0x10cd, 0x10cd, 35, 0x800000000),  #  Geor
+ 0x10d0: (0x10d0, 0x10fa, 35, 0x800000000),  #  Geor
+ 0x10fb: (0x10fb, 0x10fb, 0, 0x10000000800000000),  #  Zyyy
+ 0x10fc: (0x10fc, 0x10ff, 35, 0x800000000),  #  Geor
+ 0x1100: (0x1100, 0x11ff, 44, 0x100000000000),  #  Hang
+ 0x1200: (0x1200, 0x1248, 34, 0x400000000),  #  Ethi
+ 0x124a: (0x124a, 0x124d, 34, 0x400000000),  #  Ethi
+ 0x1250: (0x1250, 0x1256, 34, 0x400000000),  #  Ethi
+ 0x1258: (0x1258, 0x1258, 34, 0x400000000),  #  Ethi
+ 0x125a: (0x125a, 0x125d, 34, 0x400000000),  #  Ethi
+ 0x1260: (0x1260, 0x1288, 34, 0x400000000),  #  Ethi
+ 0x128a: (0x128a, 0x128d, 34, 0x400000000),  #  Ethi
+ 0x1290: (0x1290, 0x12b0, 34, 0x400000000),  #  Ethi
+ 0x12b2: (0x12b2, 0x12b5, 34, 0x400000000),  #  Ethi
+ 0x12b8: (0x12b8, 0x12be, 34, 0x400000000),  #  Ethi
+ 0x12c0: (0x12c0, 0x12c0, 34, 0x400000000),  #  Ethi
+ 0x12c2: (0x12c2, 0x12c5, 34, 0x400000000),  #  Ethi
+ 0x12c8: (0x12c8, 0x12d6, 34, 0x400000000),  #  Ethi
+ 0x12d8: (0x12d8, 0x1310, 34, 0x400000000),  #  Ethi
+ 0x1312: (0x1312, 0x1315, 34, 0x400000000),  #  Ethi
+ 0x1318: (0x1318, 0x135a, 34, 0x400000000),  #  Ethi
+ 0x135d: (0x135d, 0x137c, 34, 0x400000000),  #  Ethi
+ 0x1380: (0x1380, 0x1399, 34, 0x400000000),  #  Ethi
+ 0x13a0: (0x13a0, 0x13f5, 24, 0x1000000),  #  Cher
+ 0x13f8: (0x13f8, 0x13fd, 24, 0x1000000),  #  Cher
+ 0x1400: (0x1400, 0x167f, 21, 0x200000),  #  Cans
+ 0x1680: (0x1680, 0x169c, 93, 0x200000000000000000000000),  #  Ogam
+ 0x16a0: (0x16a0, 0x16ea, 110, 0x4000000000000000000000000000),  #  Runr
+ 0x16eb: (0x16eb, 0x16ed, 0, 0x1),  #  Zyyy
+ 0x16ee: (0x16ee, 0x16f8, 110, 0x4000000000000000000000000000),  #  Runr
+ 0x1700: (0x1700, 0x170c, 136, 0x10000000000000000000000000000000000),  #  Tglg
+ 0x170e: (0x170e, 0x1714, 136, 0x10000000000000000000000000000000000),  #  Tglg
+ 0x1720: (0x1720, 0x1734, 46, 0x400000000000),  #  Hano
+ 0x1735: (0x1735, 0x1736, 0, 0x10080000000000000000000400000080000),  #  Zyyy
+ 0x1740: (0x1740, 0x1753, 19, 0x80000),  #  Buhd
+ 0x1760: (0x1760, 0x176c, 127, 0x80000000000000000000000000000000),  #  Tagb
+ 0x176e: (0x176e, 0x1770, 127, 0x80000000000000000000000000000000),  #  Tagb
+ 0x1772: (0x1772, 0x1773, 127, 0x80000000000000000000000000000000),  #  Tagb
+ 0x1780: (0x1780, 0x17dd, 58, 0x400000000000000),  #  Khmr
+ 0x17e0: (0x17e0, 0x17e9, 58, 0x400000000000000),  #  Khmr
+ 0x17f0: (0x17f0, 0x17f9, 58, 0x400000000000000),  #  Khmr
+ 0x1800: (0x1800, 0x1801, 83, 0x800000000000000000000),  #  Mong
+ 0x1802: (0x1802, 0x1803, 0, 0x40000800000000000000000000),  #  Zyyy
+ 0x1804: (0x1804, 0x1804, 83, 0x800000000000000000000),  #  Mong
+ 0x1805: (0x1805, 0x1805, 0, 0x40000800000000000000000000),  #  Zyyy
+ 0x1806: (0x1806, 0x180e, 83, 0x800000000000000000000),  #  Mong
+ 0x1810: (0x1810, 0x1819, 83, 0x800000000000000000000),  #  Mong
+ 0x1820: (0x1820, 0x1878, 83, 0x800000000000000000000),  #  Mong
+ 0x1880: (0x1880, 0x18aa, 83, 0x800000000000000000000),  #  Mong
+ 0x18b0: (0x18b0, 0x18f5, 21, 0x200000),  #  Cans
+ 0x1900: (0x1900, 0x191e, 66, 0x40000000000000000),  #  Limb
+ 0x1920: (0x1920, 0x192b, 66, 0x40000000000000000),  #  Limb
+ 0x1930: (0x1930, 0x193b, 66, 0x40000000000000000),  #  Limb
+ 0x1940: (0x1940, 0x1940, 66, 0x40000000000000000),  #  Limb
+ 0x1944: (0x1944, 0x194f, 66, 0x40000000000000000),  #  Limb
+ 0x1950: (0x1950, 0x196d, 129, 0x200000000000000000000000000000000),  #  Tale
+ 0x1970: (0x1970, 0x1974, 129, 0x200000000000000000000000000000000),  #  Tale
+ 0x1980: (0x1980, 0x19ab, 130, 0x400000000000000000000000000000000),  #  Talu
+ 0x19b0: (0x19b0, 0x19c9, 130, 0x400000000000000000000000000000000),  #  Talu
+ 0x19d0: (0x19d0, 0x19da, 130, 0x400000000000000000000000000000000),  #  Talu
+ 0x19de: (0x19de, 0x19df, 130, 0x400000000000000000000000000000000),  #  Talu
+ 0x19e0: (0x19e0, 0x19ff, 58, 0x400000000000000),  #  Khmr
+ 0x1a00: (0x1a00, 0x1a1b, 18, 0x40000),  #  Bugi
+ 0x1a1e: (0x1a1e, 0x1a1f, 18, 0x40000),  #  Bugi
+ 0x1a20: (0x1a20, 0x1a5e, 62, 0x4000000000000000),  #  Lana
+ 0x1a60: (0x1a60, 0x1a7c, 62, 0x4000000000000000),  #  Lana
+ 0x1a7f: (0x1a7f, 0x1a89, 62, 0x4000000000000000),  #  Lana
+ 0x1a90: (0x1a90, 0x1a99, 62, 0x4000000000000000),  #  Lana
+ 0x1aa0: (0x1aa0, 0x1aad, 62, 0x4000000000000000),  #  Lana
+ 0x1ab0: (0x1ab0, 0x1abe, 1, 0x2),  #  Zinh
+ 0x1b00: (0x1b00, 0x1b4b, 9, 0x200),  #  Bali
+ 0x1b50: (0x1b50, 0x1b7c, 9, 0x200),  #  Bali
+ 0x1b80: (0x1b80, 0x1bbf, 124, 0x10000000000000000000000000000000),  #  Sund
+ 0x1bc0: (0x1bc0, 0x1bf3, 12, 0x1000),  #  Batk
+ 0x1bfc: (0x1bfc, 0x1bff, 12, 0x1000),  #  Batk
+ 0x1c00: (0x1c00, 0x1c37, 65, 0x20000000000000000),  #  Lepc
+ 0x1c3b: (0x1c3b, 0x1c49, 65, 0x20000000000000000),  #  Lepc
+ 0x1c4d: (0x1c4d, 0x1c4f, 65, 0x20000000000000000),  #  Lepc
+ 0x1c50: (0x1c50, 0x1c7f, 94, 0x400000000000000000000000),  #  Olck
+ 0x1c80: (0x1c80, 0x1c88, 27, 0x8000000),  #  Cyrl
+ 0x1c90: (0x1c90, 0x1cba, 35, 0x800000000),  #  Geor
+ 0x1cbd: (0x1cbd, 0x1cbf, 35, 0x800000000),  #  Geor
+ 0x1cc0: (0x1cc0, 0x1cc7, 124, 0x10000000000000000000000000000000),  #  Sund
+ 0x1cd0: (0x1cd0, 0x1cd0, 1, 0x1000010010002000),  #  Zinh
+ 0x1cd1: (0x1cd1, 0x1cd1, 1, 0x10000000),  #  Zinh
+ 0x1cd2: (0x1cd2, 0x1cd2, 1, 0x1000010010002000),  #  Zinh
+ 0x1cd3: (0x1cd3, 0x1cd3, 0, 0x10010000000),  #  Zyyy
+ 0x1cd4: (0x1cd4, 0x1cd4, 1, 0x10000000),  #  Zinh
+ 0x1cd5: (0x1cd5, 0x1cd6, 1, 0x10002000),  #  Zinh
+ 0x1cd7: (0x1cd7, 0x1cd7, 1, 0x100000000000000000000010000000),  #  Zinh
+ 0x1cd8: (0x1cd8, 0x1cd8, 1, 0x10002000),  #  Zinh
+ 0x1cd9: (0x1cd9, 0x1cd9, 1, 0x100000000000000000000010000000),  #  Zinh
+ 0x1cda: (0x1cda, 0x1cda, 1, 0x4800000001000200001000000010000000),  #  Zinh
+ 0x1cdb: (0x1cdb, 0x1cdb, 1, 0x10000000),  #  Zinh
+ 0x1cdc: (0x1cdc, 0x1cdd, 1, 0x100000000000000000000010000000),  #  Zinh
+ 0x1cde: (0x1cde, 0x1cdf, 1, 0x10000000),  #  Zinh
+ 0x1ce0: (0x1ce0, 0x1ce0, 1, 0x100000000000000000000010000000),  #  Zinh
+ 0x1ce1: (0x1ce1, 0x1ce1, 0, 0x10002000),  #  Zyyy
+ 0x1ce2: (0x1ce2, 0x1ce8, 1, 0x10000000),  #  Zinh
+ 0x1ce9: (0x1ce9, 0x1ce9, 0, 0x10000000),  #  Zyyy
+ 0x1cea: (0x1cea, 0x1cea, 0, 0x10002000),  #  Zyyy
+ 0x1ceb: (0x1ceb, 0x1cec, 0, 0x10000000),  #  Zyyy
+ 0x1ced: (0x1ced, 0x1ced, 1, 0x10002000),  #  Zinh
+ 0x1cee: (0x1cee, 0x1cf1, 0, 0x10000000),  #  Zyyy
+ 0x1cf2: (0x1cf2, 0x1cf3, 0, 0x10010000000),  #  Zyyy
+ 0x1cf4: (0x1cf4, 0x1cf4, 1, 0x1000010010000000),  #  Zinh
+ 0x1cf5: (0x1cf5, 0x1cf6, 0, 0x10002000),  #  Zyyy
+ 0x1cf7: (0x1cf7, 0x1cf7, 0, 0x2000),  #  Zyyy
+ 0x1cf8: (0x1cf8, 0x1cf9, 1, 0x10010000000),  #  Zinh
+ 0x1d00: (0x1d00, 0x1d25, 64, 0x10000000000000000),  #  Latn
+ 0x1d26: (0x1d26, 0x1d2a, 41, 0x20000000000),  #  Grek
+ 0x1d2b: (0x1d2b, 0x1d2b, 27, 0x8000000),  #  Cyrl
+ 0x1d2c: (0x1d2c, 0x1d5c, 64, 0x10000000000000000),  #  Latn
+ 0x1d5d: (0x1d5d, 0x1d61, 41, 0x20000000000),  #  Grek
+ 0x1d62: (0x1d62, 0x1d65, 64, 0x10000000000000000),  #  Latn
+ 0x1d66: (0x1d66, 0x1d6a, 41, 0x20000000000),  #  Grek
+ 0x1d6b: (0x1d6b, 0x1d77, 64, 0x10000000000000000),  #  Latn
+ 0x1d78: (0x1d78, 0x1d78, 27, 0x8000000),  #  Cyrl
+ 0x1d79: (0x1d79, 0x1dbe, 64, 0x10000000000000000),  #  Latn
+ 0x1dbf: (0x1dbf, 0x1dbf, 41, 0x20000000000),  #  Grek
+ 0x1dc0: (0x1dc0, 0x1dc1, 1, 0x20000000000),  #  Zinh
+ 0x1dc2: (0x1dc2, 0x1df9, 1, 0x2),  #  Zinh
+ 0x1dfb: (0x1dfb, 0x1dff, 1, 0x2),  #  Zinh
+ 0x1e00: (0x1e00, 0x1eff, 64, 0x10000000000000000),  #  Latn
+ 0x1f00: (0x1f00, 0x1f15, 41, 0x20000000000),  #  Grek
+ 0x1f18: (0x1f18, 0x1f1d, 41, 0x20000000000),  #  Grek
+ 0x1f20: (0x1f20, 0x1f45, 41, 0x20000000000),  #  Grek
+ 0x1f48: (0x1f48, 0x1f4d, 41, 0x20000000000),  #  Grek
+ 0x1f50: (0x1f50, 0x1f57, 41, 0x20000000000),  #  Grek
+ 0x1f59: (0x1f59, 0x1f59, 41, 0x20000000000),  #  Grek
+ 0x1f5b: (0x1f5b, 0x1f5b, 41, 0x20000000000),  #  Grek
+ 0x1f5d: (0x1f5d, 0x1f5d, 41, 0x20000000000),  #  Grek
+ 0x1f5f: (0x1f5f, 0x1f7d, 41, 0x20000000000),  #  Grek
+ 0x1f80: (0x1f80, 0x1fb4, 41, 0x20000000000),  #  Grek
+ 0x1fb6: (0x1fb6, 0x1fc4, 41, 0x20000000000),  #  Grek
+ 0x1fc6: (0x1fc6, 0x1fd3, 41, 0x20000000000),  #  Grek
+ 0x1fd6: (0x1fd6, 0x1fdb, 41, 0x20000000000),  #  Grek
+ 0x1fdd: (0x1fdd, 0x1fef, 41, 0x20000000000),  #  Grek
+ 0x1ff2: (0x1ff2, 0x1ff4, 41, 0x20000000000),  #  Grek
+ 0x1ff6: (0x1ff6, 0x1ffe, 41, 0x20000000000),  #  Grek
+ 0x2000: (0x2000, 0x200b, 0, 0x1),  #  Zyyy
+ 0x200c: (0x200c, 0x200d, 1, 0x2),  #  Zinh
+ 0x200e: (0x200e, 0x2064, 0, 0x1),  #  Zyyy
+ 0x2066: (0x2066, 0x2070, 0, 0x1),  #  Zyyy
+ 0x2071: (0x2071, 0x2071, 64, 0x10000000000000000),  #  Latn
+ 0x2074: (0x2074, 0x207e, 0, 0x1),  #  Zyyy
+ 0x207f: (0x207f, 0x207f, 64, 0x10000000000000000),  #  Latn
+ 0x2080: (0x2080, 0x208e, 0, 0x1),  #  Zyyy
+ 0x2090: (0x2090, 0x209c, 64, 0x10000000000000000),  #  Latn
+ 0x20a0: (0x20a0, 0x20bf, 0, 0x1),  #  Zyyy
+ 0x20d0: (0x20d0, 0x20ef, 1, 0x2),  #  Zinh
+ 0x20f0: (0x20f0, 0x20f0, 1, 0x10000010010000000),  #  Zinh
+ 0x2100: (0x2100, 0x2125, 0, 0x1),  #  Zyyy
+ 0x2126: (0x2126, 0x2126, 41, 0x20000000000),  #  Grek
+ 0x2127: (0x2127, 0x2129, 0, 0x1),  #  Zyyy
+ 0x212a: (0x212a, 0x212b, 64, 0x10000000000000000),  #  Latn
+ 0x212c: (0x212c, 0x2131, 0, 0x1),  #  Zyyy
+ 0x2132: (0x2132, 0x2132, 64, 0x10000000000000000),  #  Latn
+ 0x2133: (0x2133, 0x214d, 0, 0x1),  #  Zyyy
+ 0x214e: (0x214e, 0x214e, 64, 0x10000000000000000),  #  Latn
+ 0x214f: (0x214f, 0x215f, 0, 0x1),  #  Zyyy
+ 0x2160: (0x2160, 0x2188, 64, 0x10000000000000000),  #  Latn
+ 0x2189: (0x2189, 0x218b, 0, 0x1),  #  Zyyy
+ 0x2190: (0x2190, 0x2426, 0, 0x1),  #  Zyyy
+ 0x2440: (0x2440, 0x244a, 0, 0x1),  #  Zyyy
+ 0x2460: (0x2460, 0x27ff, 0, 0x1),  #  Zyyy
+ 0x2800: (0x2800, 0x28ff, 17, 0x20000),  #  Brai
+ 0x2900: (0x2900, 0x2b73, 0, 0x1),  #  Zyyy
+ 0x2b76: (0x2b76, 0x2b95, 0, 0x1),  #  Zyyy
+ 0x2b98: (0x2b98, 0x2bc8, 0, 0x1),  #  Zyyy
+ 0x2bca: (0x2bca, 0x2bfe, 0, 0x1),  #  Zyyy
+ 0x2c00: (0x2c00, 0x2c2e, 36, 0x1000000000),  #  Glag
+ 0x2c30: (0x2c30, 0x2c5e, 36, 0x1000000000),  #  Glag
+ 0x2c60: (0x2c60, 0x2c7f, 64, 0x10000000000000000),  #  Latn
+ 0x2c80: (0x2c80, 0x2cf3, 25, 0x2000000),  #  Copt
+ 0x2cf9: (0x2cf9, 0x2cff, 25, 0x2000000),  #  Copt
+ 0x2d00: (0x2d00, 0x2d25, 35, 0x800000000),  #  Geor
+ 0x2d27: (0x2d27, 0x2d27, 35, 0x800000000),  #  Geor
+ 0x2d2d: (0x2d2d, 0x2d2d, 35, 0x800000000),  #  Geor
+ 0x2d30: (0x2d30, 0x2d67, 135, 0x8000000000000000000000000000000000),  #  Tfng
+ 0x2d6f: (0x2d6f, 0x2d70, 135, 0x8000000000000000000000000000000000),  #  Tfng
+ 0x2d7f: (0x2d7f, 0x2d7f, 135, 0x8000000000000000000000000000000000),  #  Tfng
+ 0x2d80: (0x2d80, 0x2d96, 34, 0x400000000),  #  Ethi
+ 0x2da0: (0x2da0, 0x2da6, 34, 0x400000000),  #  Ethi
+ 0x2da8: (0x2da8, 0x2dae, 34, 0x400000000),  #  Ethi
+ 0x2db0: (0x2db0, 0x2db6, 34, 0x400000000),  #  Ethi
+ 0x2db8: (0x2db8, 0x2dbe, 34, 0x400000000),  #  Ethi
+ 0x2dc0: (0x2dc0, 0x2dc6, 34, 0x400000000),  #  Ethi
+ 0x2dc8: (0x2dc8, 0x2dce, 34, 0x400000000),  #  Ethi
+ 0x2dd0: (0x2dd0, 0x2dd6, 34, 0x400000000),  #  Ethi
+ 0x2dd8: (0x2dd8, 0x2dde, 34, 0x400000000),  #  Ethi
+ 0x2de0: (0x2de0, 0x2dff, 27, 0x8000000),  #  Cyrl
+ 0x2e00: (0x2e00, 0x2e42, 0, 0x1),  #  Zyyy
+ 0x2e43: (0x2e43, 0x2e43, 0, 0x1008000000),  #  Zyyy
+ 0x2e44: (0x2e44, 0x2e4e, 0, 0x1),  #  Zyyy
+ 0x2e80: (0x2e80, 0x2e99, 45, 0x200000000000),  #  Hani
+ 0x2e9b: (0x2e9b, 0x2ef3, 45, 0x200000000000),  #  Hani
+ 0x2f00: (0x2f00, 0x2fd5, 45, 0x200000000000),  #  Hani
+ 0x2ff0: (0x2ff0, 0x2ffb, 0, 0x1),  #  Zyyy
+ 0x3000: (0x3000, 0x3000, 0, 0x1),  #  Zyyy
+ 0x3001: (0x3001, 0x3002, 0, 0x4000000000000000000000102300000008000),  #  Zyyy
+ 0x3003: (0x3003, 0x3003, 0, 0x102300000008000),  #  Zyyy
+ 0x3004: (0x3004, 0x3004, 0, 0x1),  #  Zyyy
+ 0x3005: (0x3005, 0x3005, 45, 0x200000000000),  #  Hani
+ 0x3006: (0x3006, 0x3006, 0, 0x200000000000),  #  Zyyy
+ 0x3007: (0x3007, 0x3007, 45, 0x200000000000),  #  Hani
+ 0x3008: (0x3008, 0x3011, 0, 0x4000000000000000000000102300000008000),  #  Zyyy
+ 0x3012: (0x3012, 0x3012, 0, 0x1),  #  Zyyy
+ 0x3013: (0x3013, 0x3013, 0, 0x102300000008000),  #  Zyyy
+ 0x3014: (0x3014, 0x301b, 0, 0x4000000000000000000000102300000008000),  #  Zyyy
+ 0x301c: (0x301c, 0x301f, 0, 0x102300000008000),  #  Zyyy
+ 0x3020: (0x3020, 0x3020, 0, 0x1),  #  Zyyy
+ 0x3021: (0x3021, 0x3029, 45, 0x200000000000),  #  Hani
+ 0x302a: (0x302a, 0x302d, 1, 0x200000008000),  #  Zinh
+ 0x302e: (0x302e, 0x302f, 44, 0x100000000000),  #  Hang
+ 0x3030: (0x3030, 0x3030, 0, 0x102300000008000),  #  Zyyy
+ 0x3031: (0x3031, 0x3035, 0, 0x102000000000000),  #  Zyyy
+ 0x3036: (0x3036, 0x3036, 0, 0x1),  #  Zyyy
+ 0x3037: (0x3037, 0x3037, 0, 0x102300000008000),  #  Zyyy
+ 0x3038: (0x3038, 0x303b, 45, 0x200000000000),  #  Hani
+ 0x303c: (0x303c, 0x303d, 0, 0x102200000000000),  #  Zyyy
+ 0x303e: (0x303e, 0x303f, 0, 0x200000000000),  #  Zyyy
+ 0x3041: (0x3041, 0x3096, 49, 0x2000000000000),  #  Hira
+ 0x3099: (0x3099, 0x309a, 1, 0x102000000000000),  #  Zinh
+ 0x309b: (0x309b, 0x309c, 0, 0x102000000000000),  #  Zyyy
+ 0x309d: (0x309d, 0x309f, 49, 0x2000000000000),  #  Hira
+ 0x30a0: (0x30a0, 0x30a0, 0, 0x102000000000000),  #  Zyyy
+ 0x30a1: (0x30a1, 0x30fa, 56, 0x100000000000000),  #  Kana
+ 0x30fb: (0x30fb, 0x30fb, 0, 0x4000000000000000000000102300000008000),  #  Zyyy
+ 0x30fc: (0x30fc, 0x30fc, 0, 0x102000000000000),  #  Zyyy
+ 0x30fd: (0x30fd, 0x30ff, 56, 0x100000000000000),  #  Kana
+ 0x3105: (0x3105, 0x312f, 15, 0x8000),  #  Bopo
+ 0x3131: (0x3131, 0x318e, 44, 0x100000000000),  #  Hang
+ 0x3190: (0x3190, 0x319f, 0, 0x200000000000),  #  Zyyy
+ 0x31a0: (0x31a0, 0x31ba, 15, 0x8000),  #  Bopo
+ 0x31c0: (0x31c0, 0x31e3, 0, 0x200000000000),  #  Zyyy
+ 0x31f0: (0x31f0, 0x31ff, 56, 0x100000000000000),  #  Kana
+ 0x3200: (0x3200, 0x321e, 44, 0x100000000000),  #  Hang
+ 0x3220: (0x3220, 0x3247, 0, 0x200000000000),  #  Zyyy
+ 0x3248: (0x3248, 0x325f, 0, 0x1),  #  Zyyy
+ 0x3260: (0x3260, 0x327e, 44, 0x100000000000),  #  Hang
+ 0x327f: (0x327f, 0x327f, 0, 0x1),  #  Zyyy
+ 0x3280: (0x3280, 0x32b0, 0, 0x200000000000),  #  Zyyy
+ 0x32b1: (0x32b1, 0x32bf, 0, 0x1),  #  Zyyy
+ 0x32c0: (0x32c0, 0x32cb, 0, 0x200000000000),  #  Zyyy
+ 0x32cc: (0x32cc, 0x32cf, 0, 0x1),  #  Zyyy
+ 0x32d0: (0x32d0, 0x32fe, 56, 0x100000000000000),  #  Kana
+ 0x3300: (0x3300, 0x3357, 56, 0x100000000000000),  #  Kana
+ 0x3358: (0x3358, 0x3370, 0, 0x200000000000),  #  Zyyy
+ 0x3371: (0x3371, 0x337a, 0, 0x1),  #  Zyyy
+ 0x337b: (0x337b, 0x337f, 0, 0x200000000000),  #  Zyyy
+ 0x3380: (0x3380, 0x33df, 0, 0x1),  #  Zyyy
+ 0x33e0: (0x33e0, 0x33fe, 0, 0x200000000000),  #  Zyyy
+ 0x33ff: (0x33ff, 0x33ff, 0, 0x1),  #  Zyyy
+ 0x3400: (0x3400, 0x4db5, 45, 0x200000000000),  #  Hani
+ 0x4dc0: (0x4dc0, 0x4dff, 0, 0x1),  #  Zyyy
+ 0x4e00: (0x4e00, 0x9fef, 45, 0x200000000000),  #  Hani
+ 0xa000: (0xa000, 0xa48c, 146, 0x4000000000000000000000000000000000000),  #  Yiii
+ 0xa490: (0xa490, 0xa4c6, 146, 0x4000000000000000000000000000000000000),  #  Yiii
+ 0xa4d0: (0xa4d0, 0xa4ff, 69, 0x200000000000000000),  #  Lisu
+ 0xa500: (0xa500, 0xa62b, 142, 0x400000000000000000000000000000000000),  #  Vaii
+ 0xa640: (0xa640, 0xa66e, 27, 0x8000000),  #  Cyrl
+ 0xa66f: (0xa66f, 0xa66f, 27, 0x1008000000),  #  Cyrl
+ 0xa670: (0xa670, 0xa69f, 27, 0x8000000),  #  Cyrl
+ 0xa6a0: (0xa6a0, 0xa6f7, 10, 0x400),  #  Bamu
+ 0xa700: (0xa700, 0xa721, 0, 0x1),  #  Zyyy
+ 0xa722: (0xa722, 0xa787, 64, 0x10000000000000000),  #  Latn
+ 0xa788: (0xa788, 0xa78a, 0, 0x1),  #  Zyyy
+ 0xa78b: (0xa78b, 0xa7b9, 64, 0x10000000000000000),  #  Latn
+ 0xa7f7: (0xa7f7, 0xa7ff, 64, 0x10000000000000000),  #  Latn
+ 0xa800: (0xa800, 0xa82b, 125, 0x20000000000000000000000000000000),  #  Sylo
+ 0xa830: (0xa830, 0xa832, 0, 0x1001004000000006010038000c0030000000),  #  Zyyy
+ 0xa833: (0xa833, 0xa835, 0, 0x1001004000000004010038000c0030000000),  #  Zyyy
+ 0xa836: (0xa836, 0xa839, 0, 0x1001004000000004010028000c0030000000),  #  Zyyy
+ 0xa840: (0xa840, 0xa877, 102, 0x40000000000000000000000000),  #  Phag
+ 0xa880: (0xa880, 0xa8c5, 113, 0x20000000000000000000000000000),  #  Saur
+ 0xa8ce: (0xa8ce, 0xa8d9, 113, 0x20000000000000000000000000000),  #  Saur
+ 0xa8e0: (0xa8e0, 0xa8f0, 28, 0x10000000),  #  Deva
+ 0xa8f1: (0xa8f1, 0xa8f1, 28, 0x10002000),  #  Deva
+ 0xa8f2: (0xa8f2, 0xa8f2, 28, 0x10000000),  #  Deva
+ 0xa8f3: (0xa8f3, 0xa8f3, 28, 0x800000000000000000000000010000000),  #  Deva
+ 0xa8f4: (0xa8f4, 0xa8ff, 28, 0x10000000),  #  Deva
+ 0xa900: (0xa900, 0xa92d, 55, 0x80000000000000),  #  Kali
+ 0xa92e: (0xa92e, 0xa92e, 0, 0x8000010080000000000000),  #  Zyyy
+ 0xa92f: (0xa92f, 0xa92f, 55, 0x80000000000000),  #  Kali
+ 0xa930: (0xa930, 0xa953, 108, 0x1000000000000000000000000000),  #  Rjng
+ 0xa95f: (0xa95f, 0xa95f, 108, 0x1000000000000000000000000000),  #  Rjng
+ 0xa960: (0xa960, 0xa97c, 44, 0x100000000000),  #  Hang
+ 0xa980: (0xa980, 0xa9cd, 54, 0x40000000000000),  #  Java
+ 0xa9cf: (0xa9cf, 0xa9cf, 0, 0x40000000040000),  #  Zyyy
+ 0xa9d0: (0xa9d0, 0xa9d9, 54, 0x40000000000000),  #  Java
+ 0xa9de: (0xa9de, 0xa9df, 54, 0x40000000000000),  #  Java
+ 0xa9e0: (0xa9e0, 0xa9fe, 87, 0x8000000000000000000000),  #  Mymr
+ 0xaa00: (0xaa00, 0xaa36, 23, 0x800000),  #  Cham
+ 0xaa40: (0xaa40, 0xaa4d, 23, 0x800000),  #  Cham
+ 0xaa50: (0xaa50, 0xaa59, 23, 0x800000),  #  Cham
+ 0xaa5c: (0xaa5c, 0xaa5f, 23, 0x800000),  #  Cham
+ 0xaa60: (0xaa60, 0xaa7f, 87, 0x8000000000000000000000),  #  Mymr
+ 0xaa80: (0xaa80, 0xaac2, 133, 0x2000000000000000000000000000000000),  #  Tavt
+ 0xaadb: (0xaadb, 0xaadf, 133, 0x2000000000000000000000000000000000),  #  Tavt
+ 0xaae0: (0xaae0, 0xaaf6, 85, 0x2000000000000000000000),  #  Mtei
+ 0xab01: (0xab01, 0xab06, 34, 0x400000000),  #  Ethi
+ 0xab09: (0xab09, 0xab0e, 34, 0x400000000),  #  Ethi
+ 0xab11: (0xab11, 0xab16, 34, 0x400000000),  #  Ethi
+ 0xab20: (0xab20, 0xab26, 34, 0x400000000),  #  Ethi
+ 0xab28: (0xab28, 0xab2e, 34, 0x400000000),  #  Ethi
+ 0xab30: (0xab30, 0xab5a, 64, 0x10000000000000000),  #  Latn
+ 0xab5b: (0xab5b, 0xab5b, 0, 0x1),  #  Zyyy
+ 0xab5c: (0xab5c, 0xab64, 64, 0x10000000000000000),  #  Latn
+ 0xab65: (0xab65, 0xab65, 41, 0x20000000000),  #  Grek
+ 0xab70: (0xab70, 0xabbf, 24, 0x1000000),  #  Cher
+ 0xabc0: (0xabc0, 0xabed, 85, 0x2000000000000000000000),  #  Mtei
+ 0xabf0: (0xabf0, 0xabf9, 85, 0x2000000000000000000000),  #  Mtei
+ 0xac00: (0xac00, 0xd7a3, 44, 0x100000000000),  #  Hang
+ 0xd7b0: (0xd7b0, 0xd7c6, 44, 0x100000000000),  #  Hang
+ 0xd7cb: (0xd7cb, 0xd7fb, 44, 0x100000000000),  #  Hang
+ 0xe000: (0xe000, 0xf8ff, 148, 0x10000000000000000000000000000000000000),  #  Zzzz
+ 0xf900: (0xf900, 0xfa6d, 45, 0x200000000000),  #  Hani
+ 0xfa70: (0xfa70, 0xfad9, 45, 0x200000000000),  #  Hani
+ 0xfb00: (0xfb00, 0xfb06, 64, 0x10000000000000000),  #  Latn
+ 0xfb13: (0xfb13, 0xfb17, 7, 0x80),  #  Armn
+ 0xfb1d: (0xfb1d, 0xfb36, 48, 0x1000000000000),  #  Hebr
+ 0xfb38: (0xfb38, 0xfb3c, 48, 0x1000000000000),  #  Hebr
+ 0xfb3e: (0xfb3e, 0xfb3e, 48, 0x1000000000000),  #  Hebr
+ 0xfb40: (0xfb40, 0xfb41, 48, 0x1000000000000),  #  Hebr
+ 0xfb43: (0xfb43, 0xfb44, 48, 0x1000000000000),  #  Hebr
+ 0xfb46: (0xfb46, 0xfb4f, 48, 0x1000000000000),  #  Hebr
+ 0xfb50: (0xfb50, 0xfbc1, 5, 0x20),  #  Arab
+ 0xfbd3: (0xfbd3, 0xfd3d, 5, 0x20),  #  Arab
+ 0xfd3e: (0xfd3e, 0xfd3f, 0, 0x1),  #  Zyyy
+ 0xfd50: (0xfd50, 0xfd8f, 5, 0x20),  #  Arab
+ 0xfd92: (0xfd92, 0xfdc7, 5, 0x20),  #  Arab
+ 0xfdf0: (0xfdf0, 0xfdf1, 5, 0x20),  #  Arab
+ 0xfdf2: (0xfdf2, 0xfdf2, 5, 0x20000000000000000000000000000000020),  #  Arab
+ 0xfdf3: (0xfdf3, 0xfdfc, 5, 0x20),  #  Arab
+ 0xfdfd: (0xfdfd, 0xfdfd, 5, 0x20000000000000000000000000000000020),  #  Arab
+ 0xfe00: (0xfe00, 0xfe0f, 1, 0x2),  #  Zinh
+ 0xfe10: (0xfe10, 0xfe19, 0, 0x1),  #  Zyyy
+ 0xfe20: (0xfe20, 0xfe2d, 1, 0x2),  #  Zinh
+ 0xfe2e: (0xfe2e, 0xfe2f, 27, 0x8000000),  #  Cyrl
+ 0xfe30: (0xfe30, 0xfe44, 0, 0x1),  #  Zyyy
+ 0xfe45: (0xfe45, 0xfe46, 0, 0x102300000008000),  #  Zyyy
+ 0xfe47: (0xfe47, 0xfe52, 0, 0x1),  #  Zyyy
+ 0xfe54: (0xfe54, 0xfe66, 0, 0x1),  #  Zyyy
+ 0xfe68: (0xfe68, 0xfe6b, 0, 0x1),  #  Zyyy
+ 0xfe70: (0xfe70, 0xfe74, 5, 0x20),  #  Arab
+ 0xfe76: (0xfe76, 0xfefc, 5, 0x20),  #  Arab
+ 0xfeff: (0xfeff, 0xfeff, 0, 0x1),  #  Zyyy
+ 0xff01: (0xff01, 0xff20, 0, 0x1),  #  Zyyy
+ 0xff21: (0xff21, 0xff3a, 64, 0x10000000000000000),  #  Latn
+ 0xff3b: (0xff3b, 0xff40, 0, 0x1),  #  Zyyy
+ 0xff41: (0xff41, 0xff5a, 64, 0x10000000000000000),  #  Latn
+ 0xff5b: (0xff5b, 0xff60, 0, 0x1),  #  Zyyy
+ 0xff61: (0xff61, 0xff65, 0, 0x4000000000000000000000102300000008000),  #  Zyyy
+ 0xff66: (0xff66, 0xff6f, 56, 0x100000000000000),  #  Kana
+ 0xff70: (0xff70, 0xff70, 0, 0x102000000000000),  #  Zyyy
+ 0xff71: (0xff71, 0xff9d, 56, 0x100000000000000),  #  Kana
+ 0xff9e: (0xff9e, 0xff9f, 0, 0x102000000000000),  #  Zyyy
+ 0xffa0: (0xffa0, 0xffbe, 44, 0x100000000000),  #  Hang
+ 0xffc2: (0xffc2, 0xffc7, 44, 0x100000000000),  #  Hang
+ 0xffca: (0xffca, 0xffcf, 44, 0x100000000000),  #  Hang
+ 0xffd2: (0xffd2, 0xffd7, 44, 0x100000000000),  #  Hang
+ 0xffda: (0xffda, 0xffdc, 44, 0x100000000000),  #  Hang
+ 0xffe0: (0xffe0, 0xffe6, 0, 0x1),  #  Zyyy
+ 0xffe8: (0xffe8, 0xffee, 0, 0x1),  #  Zyyy
+ 0xfff9: (0xfff9, 0xfffd, 0, 0x1),  #  Zyyy
+ 0x10000: (0x10000, 0x1000b, 68, 0x100000000000000000),  #  Linb
+ 0x1000d: (0x1000d, 0x10026, 68, 0x100000000000000000),  #  Linb
+ 0x10028: (0x10028, 0x1003a, 68, 0x100000000000000000),  #  Linb
+ 0x1003c: (0x1003c, 0x1003d, 68, 0x100000000000000000),  #  Linb
+ 0x1003f: (0x1003f, 0x1004d, 68, 0x100000000000000000),  #  Linb
+ 0x10050: (0x10050, 0x1005d, 68, 0x100000000000000000),  #  Linb
+ 0x10080: (0x10080, 0x100fa, 68, 0x100000000000000000),  #  Linb
+ 0x10100: (0x10100, 0x10102, 0, 0x100000000004000000),  #  Zyyy
+ 0x10107: (0x10107, 0x10133, 0, 0x180000000004000000),  #  Zyyy
+ 0x10137: (0x10137, 0x1013f, 0, 0x100000000004000000),  #  Zyyy
+ 0x10140: (0x10140, 0x1018e, 41, 0x20000000000),  #  Grek
+ 0x10190: (0x10190, 0x1019b, 0, 0x1),  #  Zyyy
+ 0x101a0: (0x101a0, 0x101a0, 41, 0x20000000000),  #  Grek
+ 0x101d0: (0x101d0, 0x101fc, 0, 0x1),  #  Zyyy
+ 0x101fd: (0x101fd, 0x101fd, 1, 0x2),  #  Zinh
+ 0x10280: (0x10280, 0x1029c, 70, 0x400000000000000000),  #  Lyci
+ 0x102a0: (0x102a0, 0x102d0, 22, 0x400000),  #  Cari
+ 0x102e0: (0x102e0, 0x102e0, 1, 0x2000020),  #  Zinh
+ 0x102e1: (0x102e1, 0x102fb, 0, 0x2000020),  #  Zyyy
+ 0x10300: (0x10300, 0x10323, 53, 0x20000000000000),  #  Ital
+ 0x1032d: (0x1032d, 0x1032f, 53, 0x20000000000000),  #  Ital
+ 0x10330: (0x10330, 0x1034a, 39, 0x8000000000),  #  Goth
+ 0x10350: (0x10350, 0x1037a, 101, 0x20000000000000000000000000),  #  Perm
+ 0x10380: (0x10380, 0x1039d, 141, 0x200000000000000000000000000000000000),  #  Ugar
+ 0x1039f: (0x1039f, 0x1039f, 141, 0x200000000000000000000000000000000000),  #  Ugar
+ 0x103a0: (0x103a0, 0x103c3, 144, 0x1000000000000000000000000000000000000),  #  Xpeo
+ 0x103c8: (0x103c8, 0x103d5, 144, 0x1000000000000000000000000000000000000),  #  Xpeo
+ 0x10400: (0x10400, 0x1044f, 30, 0x40000000),  #  Dsrt
+ 0x10450: (0x10450, 0x1047f, 115, 0x80000000000000000000000000000),  #  Shaw
+ 0x10480: (0x10480, 0x1049d, 98, 0x4000000000000000000000000),  #  Osma
+ 0x104a0: (0x104a0, 0x104a9, 98, 0x4000000000000000000000000),  #  Osma
+ 0x104b0: (0x104b0, 0x104d3, 97, 0x2000000000000000000000000),  #  Osge
+ 0x104d8: (0x104d8, 0x104fb, 97, 0x2000000000000000000000000),  #  Osge
+ 0x10500: (0x10500, 0x10527, 33, 0x200000000),  #  Elba
+ 0x10530: (0x10530, 0x10563, 3, 0x8),  #  Aghb
+ 0x1056f: (0x1056f, 0x1056f, 3, 0x8),  #  Aghb
+ 0x10600: (0x10600, 0x10736, 67, 0x80000000000000000),  #  Lina
+ 0x10740: (0x10740, 0x10755, 67, 0x80000000000000000),  #  Lina
+ 0x10760: (0x10760, 0x10767, 67, 0x80000000000000000),  #  Lina
+ 0x10800: (0x10800, 0x10805, 26, 0x4000000),  #  Cprt
+ 0x10808: (0x10808, 0x10808, 26, 0x4000000),  #  Cprt
+ 0x1080a: (0x1080a, 0x10835, 26, 0x4000000),  #  Cprt
+ 0x10837: (0x10837, 0x10838, 26, 0x4000000),  #  Cprt
+ 0x1083c: (0x1083c, 0x1083c, 26, 0x4000000),  #  Cprt
+ 0x1083f: (0x1083f, 0x1083f, 26, 0x4000000),  #  Cprt
+ 0x10840: (0x10840, 0x10855, 6, 0x40),  #  Armi
+ 0x10857: (0x10857, 0x1085f, 6, 0x40),  #  Armi
+ 0x10860: (0x10860, 0x1087f, 99, 0x8000000000000000000000000),  #  Palm
+ 0x10880: (0x10880, 0x1089e, 89, 0x20000000000000000000000),  #  Nbat
+ 0x108a7: (0x108a7, 0x108af, 89, 0x20000000000000000000000),  #  Nbat
+ 0x108e0: (0x108e0, 0x108f2, 47, 0x800000000000),  #  Hatr
+ 0x108f4: (0x108f4, 0x108f5, 47, 0x800000000000),  #  Hatr
+ 0x108fb: (0x108fb, 0x108ff, 47, 0x800000000000),  #  Hatr
+ 0x10900: (0x10900, 0x1091b, 105, 0x200000000000000000000000000),  #  Phnx
+ 0x1091f: (0x1091f, 0x1091f, 105, 0x200000000000000000000000000),  #  Phnx
+ 0x10920: (0x10920, 0x10939, 71, 0x800000000000000000),  #  Lydi
+ 0x1093f: (0x1093f, 0x1093f, 71, 0x800000000000000000),  #  Lydi
+ 0x10980: (0x10980, 0x1099f, 80, 0x100000000000000000000),  #  Mero
+ 0x109a0: (0x109a0, 0x109b7, 79, 0x80000000000000000000),  #  Merc
+ 0x109bc: (0x109bc, 0x109cf, 79, 0x80000000000000000000),  #  Merc
+ 0x109d2: (0x109d2, 0x109ff, 79, 0x80000000000000000000),  #  Merc
+ 0x10a00: (0x10a00, 0x10a03, 57, 0x200000000000000),  #  Khar
+ 0x10a05: (0x10a05, 0x10a06, 57, 0x200000000000000),  #  Khar
+ 0x10a0c: (0x10a0c, 0x10a13, 57, 0x200000000000000),  #  Khar
+ 0x10a15: (0x10a15, 0x10a17, 57, 0x200000000000000),  #  Khar
+ 0x10a19: (0x10a19, 0x10a35, 57, 0x200000000000000),  #  Khar
+ 0x10a38: (0x10a38, 0x10a3a, 57, 0x200000000000000),  #  Khar
+ 0x10a3f: (0x10a3f, 0x10a48, 57, 0x200000000000000),  #  Khar
+ 0x10a50: (0x10a50, 0x10a58, 57, 0x200000000000000),  #  Khar
+ 0x10a60: (0x10a60, 0x10a7f, 112, 0x10000000000000000000000000000),  #  Sarb
+ 0x10a80: (0x10a80, 0x10a9f, 88, 0x10000000000000000000000),  #  Narb
+ 0x10ac0: (0x10ac0, 0x10ae6, 75, 0x8000000000000000000),  #  Mani
+ 0x10aeb: (0x10aeb, 0x10af6, 75, 0x8000000000000000000),  #  Mani
+ 0x10b00: (0x10b00, 0x10b35, 8, 0x100),  #  Avst
+ 0x10b39: (0x10b39, 0x10b3f, 8, 0x100),  #  Avst
+ 0x10b40: (0x10b40, 0x10b55, 107, 0x800000000000000000000000000),  #  Prti
+ 0x10b58: (0x10b58, 0x10b5f, 107, 0x800000000000000000000000000),  #  Prti
+ 0x10b60: (0x10b60, 0x10b72, 103, 0x80000000000000000000000000),  #  Phli
+ 0x10b78: (0x10b78, 0x10b7f, 103, 0x80000000000000000000000000),  #  Phli
+ 0x10b80: (0x10b80, 0x10b91, 104, 0x100000000000000000000000000),  #  Phlp
+ 0x10b99: (0x10b99, 0x10b9c, 104, 0x100000000000000000000000000),  #  Phlp
+ 0x10ba9: (0x10ba9, 0x10baf, 104, 0x100000000000000000000000000),  #  Phlp
+ 0x10c00: (0x10c00, 0x10c48, 95, 0x800000000000000000000000),  #  Orkh
+ 0x10c80: (0x10c80, 0x10cb2, 52, 0x10000000000000),  #  Hung
+ 0x10cc0: (0x10cc0, 0x10cf2, 52, 0x10000000000000),  #  Hung
+ 0x10cfa: (0x10cfa, 0x10cff, 52, 0x10000000000000),  #  Hung
+ 0x10d00: (0x10d00, 0x10d27, 109, 0x2000000000000000000000000000),  #  Rohg
+ 0x10d30: (0x10d30, 0x10d39, 109, 0x2000000000000000000000000000),  #  Rohg
+ 0x10e60: (0x10e60, 0x10e7e, 5, 0x20),  #  Arab
+ 0x10f00: (0x10f00, 0x10f27, 121, 0x2000000000000000000000000000000),  #  Sogo
+ 0x10f30: (0x10f30, 0x10f59, 120, 0x1000000000000000000000000000000),  #  Sogd
+ 0x11000: (0x11000, 0x1104d, 16, 0x10000),  #  Brah
+ 0x11052: (0x11052, 0x1106f, 16, 0x10000),  #  Brah
+ 0x1107f: (0x1107f, 0x1107f, 16, 0x10000),  #  Brah
+ 0x11080: (0x11080, 0x110c1, 61, 0x2000000000000000),  #  Kthi
+ 0x110cd: (0x110cd, 0x110cd, 61, 0x2000000000000000),  #  Kthi
+ 0x110d0: (0x110d0, 0x110e8, 122, 0x4000000000000000000000000000000),  #  Sora
+ 0x110f0: (0x110f0, 0x110f9, 122, 0x4000000000000000000000000000000),  #  Sora
+ 0x11100: (0x11100, 0x11134, 20, 0x100000),  #  Cakm
+ 0x11136: (0x11136, 0x11146, 20, 0x100000),  #  Cakm
+ 0x11150: (0x11150, 0x11176, 72, 0x1000000000000000000),  #  Mahj
+ 0x11180: (0x11180, 0x111cd, 116, 0x100000000000000000000000000000),  #  Shrd
+ 0x111d0: (0x111d0, 0x111df, 116, 0x100000000000000000000000000000),  #  Shrd
+ 0x111e1: (0x111e1, 0x111f4, 119, 0x800000000000000000000000000000),  #  Sinh
+ 0x11200: (0x11200, 0x11211, 59, 0x800000000000000),  #  Khoj
+ 0x11213: (0x11213, 0x1123e, 59, 0x800000000000000),  #  Khoj
+ 0x11280: (0x11280, 0x11286, 86, 0x4000000000000000000000),  #  Mult
+ 0x11288: (0x11288, 0x11288, 86, 0x4000000000000000000000),  #  Mult
+ 0x1128a: (0x1128a, 0x1128d, 86, 0x4000000000000000000000),  #  Mult
+ 0x1128f: (0x1128f, 0x1129d, 86, 0x4000000000000000000000),  #  Mult
+ 0x1129f: (0x1129f, 0x112a9, 86, 0x4000000000000000000000),  #  Mult
+ 0x112b0: (0x112b0, 0x112ea, 118, 0x400000000000000000000000000000),  #  Sind
+ 0x112f0: (0x112f0, 0x112f9, 118, 0x400000000000000000000000000000),  #  Sind
+ 0x11300: (0x11300, 0x11300, 40, 0x10000000000),  #  Gran
+ 0x11301: (0x11301, 0x11301, 40, 0x800000000000000000000010000000000),  #  Gran
+ 0x11302: (0x11302, 0x11302, 40, 0x10000000000),  #  Gran
+ 0x11303: (0x11303, 0x11303, 40, 0x800000000000000000000010000000000),  #  Gran
+ 0x11305: (0x11305, 0x1130c, 40, 0x10000000000),  #  Gran
+ 0x1130f: (0x1130f, 0x11310, 40, 0x10000000000),  #  Gran
+ 0x11313: (0x11313, 0x11328, 40, 0x10000000000),  #  Gran
+ 0x1132a: (0x1132a, 0x11330, 40, 0x10000000000),  #  Gran
+ 0x11332: (0x11332, 0x11333, 40, 0x10000000000),  #  Gran
+ 0x11335: (0x11335, 0x11339, 40, 0x10000000000),  #  Gran
+ 0x1133b: (0x1133b, 0x1133b, 1, 0x800000000000000000000010000000000),  #  Zinh
+ 0x1133c: (0x1133c, 0x1133c, 40, 0x800000000000000000000010000000000),  #  Gran
+ 0x1133d: (0x1133d, 0x11344, 40, 0x10000000000),  #  Gran
+ 0x11347: (0x11347, 0x11348, 40, 0x10000000000),  #  Gran
+ 0x1134b: (0x1134b, 0x1134d, 40, 0x10000000000),  #  Gran
+ 0x11350: (0x11350, 0x11350, 40, 0x10000000000),  #  Gran
+ 0x11357: (0x11357, 0x11357, 40, 0x10000000000),  #  Gran
+ 0x1135d: (0x1135d, 0x11363, 40, 0x10000000000),  #  Gran
+ 0x11366: (0x11366, 0x1136c, 40, 0x10000000000),  #  Gran
+ 0x11370: (0x11370, 0x11374, 40, 0x10000000000),  #  Gran
+ 0x11400: (0x11400, 0x11459, 90, 0x40000000000000000000000),  #  Newa
+ 0x1145b: (0x1145b, 0x1145b, 90, 0x40000000000000000000000),  #  Newa
+ 0x1145d: (0x1145d, 0x1145e, 90, 0x40000000000000000000000),  #  Newa
+ 0x11480: (0x11480, 0x114c7, 140, 0x100000000000000000000000000000000000),  #  Tirh
+ 0x114d0: (0x114d0, 0x114d9, 140, 0x100000000000000000000000000000000000),  #  Tirh
+ 0x11580: (0x11580, 0x115b5, 117, 0x200000000000000000000000000000),  #  Sidd
+ 0x115b8: (0x115b8, 0x115dd, 117, 0x200000000000000000000000000000),  #  Sidd
+ 0x11600: (0x11600, 0x11644, 82, 0x400000000000000000000),  #  Modi
+ 0x11650: (0x11650, 0x11659, 82, 0x400000000000000000000),  #  Modi
+ 0x11660: (0x11660, 0x1166c, 83, 0x800000000000000000000),  #  Mong
+ 0x11680: (0x11680, 0x116b7, 128, 0x100000000000000000000000000000000),  #  Takr
+ 0x116c0: (0x116c0, 0x116c9, 128, 0x100000000000000000000000000000000),  #  Takr
+ 0x11700: (0x11700, 0x1171a, 4, 0x10),  #  Ahom
+ 0x1171d: (0x1171d, 0x1172b, 4, 0x10),  #  Ahom
+ 0x11730: (0x11730, 0x1173f, 4, 0x10),  #  Ahom
+ 0x11800: (0x11800, 0x1183b, 29, 0x20000000),  #  Dogr
+ 0x118a0: (0x118a0, 0x118f2, 143, 0x800000000000000000000000000000000000),  #  Wara
+ 0x118ff: (0x118ff, 0x118ff, 143, 0x800000000000000000000000000000000000),  #  Wara
+ 0x11a00: (0x11a00, 0x11a47, 147, 0x8000000000000000000000000000000000000),  #  Zanb
+ 0x11a50: (0x11a50, 0x11a83, 123, 0x8000000000000000000000000000000),  #  Soyo
+ 0x11a86: (0x11a86, 0x11aa2, 123, 0x8000000000000000000000000000000),  #  Soyo
+ 0x11ac0: (0x11ac0, 0x11af8, 100, 0x10000000000000000000000000),  #  Pauc
+ 0x11c00: (0x11c00, 0x11c08, 14, 0x4000),  #  Bhks
+ 0x11c0a: (0x11c0a, 0x11c36, 14, 0x4000),  #  Bhks
+ 0x11c38: (0x11c38, 0x11c45, 14, 0x4000),  #  Bhks
+ 0x11c50: (0x11c50, 0x11c6c, 14, 0x4000),  #  Bhks
+ 0x11c70: (0x11c70, 0x11c8f, 76, 0x10000000000000000000),  #  Marc
+ 0x11c92: (0x11c92, 0x11ca7, 76, 0x10000000000000000000),  #  Marc
+ 0x11ca9: (0x11ca9, 0x11cb6, 76, 0x10000000000000000000),  #  Marc
+ 0x11d00: (0x11d00, 0x11d06, 38, 0x4000000000),  #  Gonm
+ 0x11d08: (0x11d08, 0x11d09, 38, 0x4000000000),  #  Gonm
+ 0x11d0b: (0x11d0b, 0x11d36, 38, 0x4000000000),  #  Gonm
+ 0x11d3a: (0x11d3a, 0x11d3a, 38, 0x4000000000),  #  Gonm
+ 0x11d3c: (0x11d3c, 0x11d3d, 38, 0x4000000000),  #  Gonm
+ 0x11d3f: (0x11d3f, 0x11d47, 38, 0x4000000000),  #  Gonm
+ 0x11d50: (0x11d50, 0x11d59, 38, 0x4000000000),  #  Gonm
+ 0x11d60: (0x11d60, 0x11d65, 37, 0x2000000000),  #  Gong
+ 0x11d67: (0x11d67, 0x11d68, 37, 0x2000000000),  #  Gong
+ 0x11d6a: (0x11d6a, 0x11d8e, 37, 0x2000000000),  #  Gong
+ 0x11d90: (0x11d90, 0x11d91, 37, 0x2000000000),  #  Gong
+ 0x11d93: (0x11d93, 0x11d98, 37, 0x2000000000),  #  Gong
+ 0x11da0: (0x11da0, 0x11da9, 37, 0x2000000000),  #  Gong
+ 0x11ee0: (0x11ee0, 0x11ef8, 73, 0x2000000000000000000),  #  Maka
+ 0x12000: (0x12000, 0x12399, 145, 0x2000000000000000000000000000000000000),  #  Xsux
+ 0x12400: (0x12400, 0x1246e, 145, 0x2000000000000000000000000000000000000),  #  Xsux
+ 0x12470: (0x12470, 0x12474, 145, 0x2000000000000000000000000000000000000),  #  Xsux
+ 0x12480: (0x12480, 0x12543, 145, 0x2000000000000000000000000000000000000),  #  Xsux
+ 0x13000: (0x13000, 0x1342e, 32, 0x100000000),  #  Egyp
+ 0x14400: (0x14400, 0x14646, 50, 0x4000000000000),  #  Hluw
+ 0x16800: (0x16800, 0x16a38, 10, 0x400),  #  Bamu
+ 0x16a40: (0x16a40, 0x16a5e, 84, 0x1000000000000000000000),  #  Mroo
+ 0x16a60: (0x16a60, 0x16a69, 84, 0x1000000000000000000000),  #  Mroo
+ 0x16a6e: (0x16a6e, 0x16a6f, 84, 0x1000000000000000000000),  #  Mroo
+ 0x16ad0: (0x16ad0, 0x16aed, 11, 0x800),  #  Bass
+ 0x16af0: (0x16af0, 0x16af5, 11, 0x800),  #  Bass
+ 0x16b00: (0x16b00, 0x16b45, 51, 0x8000000000000),  #  Hmng
+ 0x16b50: (0x16b50, 0x16b59, 51, 0x8000000000000),  #  Hmng
+ 0x16b5b: (0x16b5b, 0x16b61, 51, 0x8000000000000),  #  Hmng
+ 0x16b63: (0x16b63, 0x16b77, 51, 0x8000000000000),  #  Hmng
+ 0x16b7d: (0x16b7d, 0x16b8f, 51, 0x8000000000000),  #  Hmng
+ 0x16e40: (0x16e40, 0x16e9a, 77, 0x20000000000000000000),  #  Medf
+ 0x16f00: (0x16f00, 0x16f44, 106, 0x400000000000000000000000000),  #  Plrd
+ 0x16f50: (0x16f50, 0x16f7e, 106, 0x400000000000000000000000000),  #  Plrd
+ 0x16f8f: (0x16f8f, 0x16f9f, 106, 0x400000000000000000000000000),  #  Plrd
+ 0x16fe0: (0x16fe0, 0x16fe0, 132, 0x1000000000000000000000000000000000),  #  Tang
+ 0x16fe1: (0x16fe1, 0x16fe1, 92, 0x100000000000000000000000),  #  Nshu
+ 0x17000: (0x17000, 0x187f1, 132, 0x1000000000000000000000000000000000),  #  Tang
+ 0x18800: (0x18800, 0x18af2, 132, 0x1000000000000000000000000000000000),  #  Tang
+ 0x1b000: (0x1b000, 0x1b000, 56, 0x100000000000000),  #  Kana
+ 0x1b001: (0x1b001, 0x1b11e, 49, 0x2000000000000),  #  Hira
+ 0x1b170: (0x1b170, 0x1b2fb, 92, 0x100000000000000000000000),  #  Nshu
+ 0x1bc00: (0x1bc00, 0x1bc6a, 31, 0x80000000),  #  Dupl
+ 0x1bc70: (0x1bc70, 0x1bc7c, 31, 0x80000000),  #  Dupl
+ 0x1bc80: (0x1bc80, 0x1bc88, 31, 0x80000000),  #  Dupl
+ 0x1bc90: (0x1bc90, 0x1bc99, 31, 0x80000000),  #  Dupl
+ 0x1bc9c: (0x1bc9c, 0x1bc9f, 31, 0x80000000),  #  Dupl
+ 0x1bca0: (0x1bca0, 0x1bca3, 0, 0x80000000),  #  Zyyy
+ 0x1d000: (0x1d000, 0x1d0f5, 0, 0x1),  #  Zyyy
+ 0x1d100: (0x1d100, 0x1d126, 0, 0x1),  #  Zyyy
+ 0x1d129: (0x1d129, 0x1d166, 0, 0x1),  #  Zyyy
+ 0x1d167: (0x1d167, 0x1d169, 1, 0x2),  #  Zinh
+ 0x1d16a: (0x1d16a, 0x1d17a, 0, 0x1),  #  Zyyy
+ 0x1d17b: (0x1d17b, 0x1d182, 1, 0x2),  #  Zinh
+ 0x1d183: (0x1d183, 0x1d184, 0, 0x1),  #  Zyyy
+ 0x1d185: (0x1d185, 0x1d18b, 1, 0x2),  #  Zinh
+ 0x1d18c: (0x1d18c, 0x1d1a9, 0, 0x1),  #  Zyyy
+ 0x1d1aa: (0x1d1aa, 0x1d1ad, 1, 0x2),  #  Zinh
+ 0x1d1ae: (0x1d1ae, 0x1d1e8, 0, 0x1),  #  Zyyy
+ 0x1d200: (0x1d200, 0x1d245, 41, 0x20000000000),  #  Grek
+ 0x1d2e0: (0x1d2e0, 0x1d2f3, 0, 0x1),  #  Zyyy
+ 0x1d300: (0x1d300, 0x1d356, 0, 0x1),  #  Zyyy
+ 0x1d360: (0x1d360, 0x1d371, 0, 0x200000000000),  #  Zyyy
+ 0x1d372: (0x1d372, 0x1d378, 0, 0x1),  #  Zyyy
+ 0x1d400: (0x1d400, 0x1d454, 0, 0x1),  #  Zyyy
+ 0x1d456: (0x1d456, 0x1d49c, 0, 0x1),  #  Zyyy
+ 0x1d49e: (0x1d49e, 0x1d49f, 0, 0x1),  #  Zyyy
+ 0x1d4a2: (0x1d4a2, 0x1d4a2, 0, 0x1),  #  Zyyy
+ 0x1d4a5: (0x1d4a5, 0x1d4a6, 0, 0x1),  #  Zyyy
+ 0x1d4a9: (0x1d4a9, 0x1d4ac, 0, 0x1),  #  Zyyy
+ 0x1d4ae: (0x1d4ae, 0x1d4b9, 0, 0x1),  #  Zyyy
+ 0x1d4bb: (0x1d4bb, 0x1d4bb, 0, 0x1),  #  Zyyy
+ 0x1d4bd: (0x1d4bd, 0x1d4c3, 0, 0x1),  #  Zyyy
+ 0x1d4c5: (0x1d4c5, 0x1d505, 0, 0x1),  #  Zyyy
+ 0x1d507: (0x1d507, 0x1d50a, 0, 0x1),  #  Zyyy
+ 0x1d50d: (0x1d50d, 0x1d514, 0, 0x1),  #  Zyyy
+ 0x1d516: (0x1d516, 0x1d51c, 0, 0x1),  #  Zyyy
+ 0x1d51e: (0x1d51e, 0x1d539, 0, 0x1),  #  Zyyy
+ 0x1d53b: (0x1d53b, 0x1d53e, 0, 0x1),  #  Zyyy
+ 0x1d540: (0x1d540, 0x1d544, 0, 0x1),  #  Zyyy
+ 0x1d546: (0x1d546, 0x1d546, 0, 0x1),  #  Zyyy
+ 0x1d54a: (0x1d54a, 0x1d550, 0, 0x1),  #  Zyyy
+ 0x1d552: (0x1d552, 0x1d6a5, 0, 0x1),  #  Zyyy
+ 0x1d6a8: (0x1d6a8, 0x1d7cb, 0, 0x1),  #  Zyyy
+ 0x1d7ce: (0x1d7ce, 0x1d7ff, 0, 0x1),  #  Zyyy
+ 0x1d800: (0x1d800, 0x1da8b, 114, 0x40000000000000000000000000000),  #  Sgnw
+ 0x1da9b: (0x1da9b, 0x1da9f, 114, 0x40000000000000000000000000000),  #  Sgnw
+ 0x1daa1: (0x1daa1, 0x1daaf, 114, 0x40000000000000000000000000000),  #  Sgnw
+ 0x1e000: (0x1e000, 0x1e006, 36, 0x1000000000),  #  Glag
+ 0x1e008: (0x1e008, 0x1e018, 36, 0x1000000000),  #  Glag
+ 0x1e01b: (0x1e01b, 0x1e021, 36, 0x1000000000),  #  Glag
+ 0x1e023: (0x1e023, 0x1e024, 36, 0x1000000000),  #  Glag
+ 0x1e026: (0x1e026, 0x1e02a, 36, 0x1000000000),  #  Glag
+ 0x1e800: (0x1e800, 0x1e8c4, 78, 0x40000000000000000000),  #  Mend
+ 0x1e8c7: (0x1e8c7, 0x1e8d6, 78, 0x40000000000000000000),  #  Mend
+ 0x1e900: (0x1e900, 0x1e94a, 2, 0x4),  #  Adlm
+ 0x1e950: (0x1e950, 0x1e959, 2, 0x4),  #  Adlm
+ 0x1e95e: (0x1e95e, 0x1e95f, 2, 0x4),  #  Adlm
+ 0x1ec71: (0x1ec71, 0x1ecb4, 0, 0x1),  #  Zyyy
+ 0x1ee00: (0x1ee00, 0x1ee03, 5, 0x20),  #  Arab
+ 0x1ee05: (0x1ee05, 0x1ee1f, 5, 0x20),  #  Arab
+ 0x1ee21: (0x1ee21, 0x1ee22, 5, 0x20),  #  Arab
+ 0x1ee24: (0x1ee24, 0x1ee24, 5, 0x20),  #  Arab
+ 0x1ee27: (0x1ee27, 0x1ee27, 5, 0x20),  #  Arab
+ 0x1ee29: (0x1ee29, 0x1ee32, 5, 0x20),  #  Arab
+ 0x1ee34: (0x1ee34, 0x1ee37, 5, 0x20),  #  Arab
+ 0x1ee39: (0x1ee39, 0x1ee39, 5, 0x20),  #  Arab
+ 0x1ee3b: (0x1ee3b, 0x1ee3b, 5, 0x20),  #  Arab
+ 0x1ee42: (0x1ee42, 0x1ee42, 5, 0x20),  #  Arab
+ 0x1ee47: (0x1ee47, 0x1ee47, 5, 0x20),  #  Arab
+ 0x1ee49: (0x1ee49, 0x1ee49, 5, 0x20),  #  Arab
+ 0x1ee4b: (0x1ee4b, 0x1ee4b, 5, 0x20),  #  Arab
+ 0x1ee4d: (0x1ee4d, 0x1ee4f, 5, 0x20),  #  Arab
+ 0x1ee51: (0x1ee51, 0x1ee52, 5, 0x20),  #  Arab
+ 0x1ee54: (0x1ee54, 0x1ee54, 5, 0x20),  #  Arab
+ 0x1ee57: (0x1ee57, 0x1ee57, 5, 0x20),  #  Arab
+ 0x1ee59: (0x1ee59, 0x1ee59, 5, 0x20),  #  Arab
+ 0x1ee5b: (0x1ee5b, 0x1ee5b, 5, 0x20),  #  Arab
+ 0x1ee5d: (0x1ee5d, 0x1ee5d, 5, 0x20),  #  Arab
+ 0x1ee5f: (0x1ee5f, 0x1ee5f, 5, 0x20),  #  Arab
+ 0x1ee61: (0x1ee61, 0x1ee62, 5, 0x20),  #  Arab
+ 0x1ee64: (0x1ee64, 0x1ee64, 5, 0x20),  #  Arab
+ 0x1ee67: (0x1ee67, 0x1ee6a, 5, 0x20),  #  Arab
+ 0x1ee6c: (0x1ee6c, 0x1ee72, 5, 0x20),  #  Arab
+ 0x1ee74: (0x1ee74, 0x1ee77, 5, 0x20),  #  Arab
+ 0x1ee79: (0x1ee79, 0x1ee7c, 5, 0x20),  #  Arab
+ 0x1ee7e: (0x1ee7e, 0x1ee7e, 5, 0x20),  #  Arab
+ 0x1ee80: (0x1ee80, 0x1ee89, 5, 0x20),  #  Arab
+ 0x1ee8b: (0x1ee8b, 0x1ee9b, 5, 0x20),  #  Arab
+ 0x1eea1: (0x1eea1, 0x1eea3, 5, 0x20),  #  Arab
+ 0x1eea5: (0x1eea5, 0x1eea9, 5, 0x20),  #  Arab
+ 0x1eeab: (0x1eeab, 0x1eebb, 5, 0x20),  #  Arab
+ 0x1eef0: (0x1eef0, 0x1eef1, 5, 0x20),  #  Arab
+ 0x1f000: (0x1f000, 0x1f02b, 0, 0x1),  #  Zyyy
+ 0x1f030: (0x1f030, 0x1f093, 0, 0x1),  #  Zyyy
+ 0x1f0a0: (0x1f0a0, 0x1f0ae, 0, 0x1),  #  Zyyy
+ 0x1f0b1: (0x1f0b1, 0x1f0bf, 0, 0x1),  #  Zyyy
+ 0x1f0c1: (0x1f0c1, 0x1f0cf, 0, 0x1),  #  Zyyy
+ 0x1f0d1: (0x1f0d1, 0x1f0f5, 0, 0x1),  #  Zyyy
+ 0x1f100: (0x1f100, 0x1f10c, 0, 0x1),  #  Zyyy
+ 0x1f110: (0x1f110, 0x1f16b, 0, 0x1),  #  Zyyy
+ 0x1f170: (0x1f170, 0x1f1ac, 0, 0x1),  #  Zyyy
+ 0x1f1e6: (0x1f1e6, 0x1f1ff, 0, 0x1),  #  Zyyy
+ 0x1f200: (0x1f200, 0x1f200, 49, 0x2000000000000),  #  Hira
+ 0x1f201: (0x1f201, 0x1f202, 0, 0x1),  #  Zyyy
+ 0x1f210: (0x1f210, 0x1f23b, 0, 0x1),  #  Zyyy
+ 0x1f240: (0x1f240, 0x1f248, 0, 0x1),  #  Zyyy
+ 0x1f250: (0x1f250, 0x1f251, 0, 0x200000000000),  #  Zyyy
+ 0x1f260: (0x1f260, 0x1f265, 0, 0x1),  #  Zyyy
+ 0x1f300: (0x1f300, 0x1f6d4, 0, 0x1),  #  Zyyy
+ 0x1f6e0: (0x1f6e0, 0x1f6ec, 0, 0x1),  #  Zyyy
+ 0x1f6f0: (0x1f6f0, 0x1f6f9, 0, 0x1),  #  Zyyy
+ 0x1f700: (0x1f700, 0x1f773, 0, 0x1),  #  Zyyy
+ 0x1f780: (0x1f780, 0x1f7d8, 0, 0x1),  #  Zyyy
+ 0x1f800: (0x1f800, 0x1f80b, 0, 0x1),  #  Zyyy
+ 0x1f810: (0x1f810, 0x1f847, 0, 0x1),  #  Zyyy
+ 0x1f850: (0x1f850, 0x1f859, 0, 0x1),  #  Zyyy
+ 0x1f860: (0x1f860, 0x1f887, 0, 0x1),  #  Zyyy
+ 0x1f890: (0x1f890, 0x1f8ad, 0, 0x1),  #  Zyyy
+ 0x1f900: (0x1f900, 0x1f90b, 0, 0x1),  #  Zyyy
+ 0x1f910: (0x1f910, 0x1f93e, 0, 0x1),  #  Zyyy
+ 0x1f940: (0x1f940, 0x1f970, 0, 0x1),  #  Zyyy
+ 0x1f973: (0x1f973, 0x1f976, 0, 0x1),  #  Zyyy
+ 0x1f97a: (0x1f97a, 0x1f97a, 0, 0x1),  #  Zyyy
+ 0x1f97c: (0x1f97c, 0x1f9a2, 0, 0x1),  #  Zyyy
+ 0x1f9b0: (0x1f9b0, 0x1f9b9, 0, 0x1),  #  Zyyy
+ 0x1f9c0: (0x1f9c0, 0x1f9c2, 0, 0x1),  #  Zyyy
+ 0x1f9d0: (0x1f9d0, 0x1f9ff, 0, 0x1),  #  Zyyy
+ 0x1fa60: (0x1fa60, 0x1fa6d, 0, 0x1),  #  Zyyy
+ 0x20000: (0x20000, 0x2a6d6, 45, 0x200000000000),  #  Hani
+ 0x2a700: (0x2a700, 0x2b734, 45, 0x200000000000),  #  Hani
+ 0x2b740: (0x2b740, 0x2b81d, 45, 0x200000000000),  #  Hani
+ 0x2b820: (0x2b820, 0x2cea1, 45, 0x200000000000),  #  Hani
+ 0x2ceb0: (0x2ceb0, 0x2ebe0, 45, 0x200000000000),  #  Hani
+ 0x2f800: (0x2f800, 0x2fa1d, 45, 0x200000000000),  #  Hani
+ 0xe0001: (0xe0001, 0xe0001, 0, 0x1),  #  Zyyy
+ 0xe0020: (0xe0020, 0xe007f, 0, 0x1),  #  Zyyy
+ 0xe0100: (0xe0100, 0xe01ef, 1, 0x2),  #  Zinh
+ 0xf0000: (0xf0000, 0xffffd, 148, 0x10000000000000000000000000000000000000),  #  Zzzz
+ 0x100000: (0x100000, 0x10fffd, 148, 0x10000000000000000000000000000000000000),  #  Zzzz
+}
@@ -1,196 +1,999 @@
-"""
-Read Unicode UCD format
-
-Test files created by parse_unicode_dot_org_files.
-
-
-TODO
-    - test repertoire_map - non_char, math, etc.
-    - how to get which reserved block a character is in?
-
-"""
-
-from repertoire_map import repertoire_map
-from intentional_map import intentional_map
-from block_map import block_map
-from identifier_status_map import identifier_status_map
-
-from more_unicodedata import is_intentional_confusion, fix_intention_confusion, show_intentional_confusion
-from more_unicodedata import in_block, blocks
-# from more_unicodedata import get_unicode_char
-from more_unicodedata import in_reserved, is_safe_identifier, in_identifier_range, is_safe_string
-
-PAULO_STRING = b'S\xe30 Paulo'.decode('cp1252')
-MONTREAL_STRING = b'Montr\xe9al'.decode('cp1252')
-INTENTIONAL_FACEBOOK_STR = 'f\u0430\u0441\u0435bo\u03bfk'
-INTENTIONAL_BIGBIRD_STR = '\u1d2e\u1d35\u1d33\u1d2e\u1d35\u1d3f\u1d30'
-RESERVED_STRING = '\u03A2\u0530\u05EB\u05EC\u05EE'
-PROG_NOT_IDMOD_STRING_1 = '\u00aa\u00b5\u0133'
-PROG_NOT_IDMOD_STRING_2 = 'h\u00aa\u00b5\u0133'
-ALLOWED_STRING = '\u00c0\u00c1\u00d6'
-NOT_ALLOWED_STRING = '\u00c0\u00c1\u00d6\u00aa'
-OUT_OF_RANGE_STRING_1 = '\u7465\u12354'
-OUT_OF_RANGE_STRING_2 = '\u2CEB1'
-
-
-def test_is_intentional_confusion():
-    assert(is_intentional_confusion('\u0430') is True)
-    assert(is_intentional_confusion('f') is False)
-    assert(is_intentional_confusion('\xe9') is False)
-    assert(is_intentional_confusion('facebook') is False)
-    assert(is_intentional_confusion(INTENTIONAL_FACEBOOK_STR) is True)
-    assert(is_intentional_confusion(INTENTIONAL_BIGBIRD_STR) is False)  # it's not safe but not in the list!
-    assert(is_intentional_confusion(RESERVED_STRING) is False)
-    assert(is_intentional_confusion(OUT_OF_RANGE_STRING_1) is False)
-    assert(is_intentional_confusion(OUT_OF_RANGE_STRING_2) is False)
-
-
-def test_fix_intentional_confusion():
-    ds = fix_intention_confusion('\u0430')
-    assert (ds == 'a')
-
-    ds = fix_intention_confusion('\xe9')
-    assert (ds == '\xe9')
-
-    ds = fix_intention_confusion('f')
-    assert (ds == 'f')
-
-    bad_str_1 = '\u0391\u0392\u0421\u0430\u01c3'  # ABCa!
-    good_str = fix_intention_confusion(bad_str_1)
-    assert (good_str == 'ABCa!')
-
-    str_2 = b'S\xe30 Paulo'.decode('cp1252')
-    good_str = fix_intention_confusion(PAULO_STRING)
-    assert (good_str == PAULO_STRING)
-
-    str_3 = b'Montr\xe9al'.decode('cp1252')
-    good_str = fix_intention_confusion(MONTREAL_STRING)
-    assert (good_str == MONTREAL_STRING)
-
-    good_str = fix_intention_confusion(INTENTIONAL_FACEBOOK_STR)
-    assert (good_str == 'facebook')
-
-    good_str = fix_intention_confusion(INTENTIONAL_BIGBIRD_STR)
-    assert (good_str != 'BIGBIRD')  # fails -- MODIFIER LETTER CAPITAL B not in intention.txt - get caugjt with NOT_XID in indentifyertype?
-
-
-def test_show_intentional_confusion():
-    a = show_intentional_confusion('\u0430')
-    assert (len(a)==1)
-
-    a = show_intentional_confusion('f')
-    assert (len(a)==0)
-
-    a = show_intentional_confusion(INTENTIONAL_FACEBOOK_STR)
-    assert (len(a) == 4)
-
-    a = show_intentional_confusion(INTENTIONAL_BIGBIRD_STR) # confusing but no chars in intentional list
-    assert (len(a) == 0)
-
-
-def test_block_map(block_map):
-    assert(in_block('facebook', "Basic Latin")==True)
-    assert(in_block(INTENTIONAL_FACEBOOK_STR[1:3], "Cyrillic")==True)
-    assert(in_block(INTENTIONAL_BIGBIRD_STR, "Phonetic Extensions")==True)
-    assert(in_block('\xe9', "Latin-1 Supplement")==True)
-    assert(in_block('\xe9', "Basic Latin")==False)
-
-    bs = blocks('facebook')
-    assert(bs=={'ASCII'})
-
-    bs = blocks(INTENTIONAL_FACEBOOK_STR)
-    assert (bs == {'Cyrillic', 'ASCII', 'Greek'})
-
-    bs = blocks(INTENTIONAL_BIGBIRD_STR)
-    assert (bs == {'Phonetic_Ext'})
-
-    bs = blocks('\xe9')
-    assert (bs == {'Latin_1_Sup'})
-
-
-def test_reserved_block():
-    assert(in_reserved('facebook')==False)
-    assert(in_reserved(RESERVED_STRING)==True)
-    assert(in_reserved('\u0378')==True)
-
-def test_identifiers():
-    result = is_safe_identifier('facebook', level='ascii', allowed_chars=None)
-    assert(result)
-
-    result = is_safe_identifier(INTENTIONAL_FACEBOOK_STR, level='ascii', allowed_chars=None) is True
-    assert (result is False)
-
-    assert(is_safe_identifier('\xe9', level='ascii', allowed_chars=None) is True)
-    assert(is_safe_identifier('\xe9\xe9', level='programming', allowed_chars=None) is True)
-    # assert(is_identifier('\xe9\u00F1', level='programming', allowed_chars=None) is False)
-
-    assert(is_safe_identifier('\xe9\u0300', level='ascii', allowed_chars=None) is False)
-    assert(is_safe_identifier('\xe9\u0300', level='programming', allowed_chars=None) is True)
-
-    assert(is_safe_identifier(OUT_OF_RANGE_STRING_1, level='ascii', allowed_chars=None) is False)
-    assert(is_safe_identifier(OUT_OF_RANGE_STRING_1, level='programming', allowed_chars=None) is False)
-    assert(is_safe_identifier(OUT_OF_RANGE_STRING_1, level='idmod', allowed_chars=None) is True)
-    assert(is_safe_identifier(OUT_OF_RANGE_STRING_2, level='idmod', allowed_chars=None) is False)
-
-    assert(is_safe_identifier('\u0100', level='ascii', allowed_chars=None) is False)
-    assert(is_safe_identifier('\u0100', level='ascii', allowed_chars=['\u0100']) is True)
-    assert(is_safe_identifier('\u0100', level='programming', allowed_chars=None) is True)
-    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_1, level='programming', allowed_chars=None) is True)
-    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='programming', allowed_chars=None) is True)
-    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_1, level='idmod', allowed_chars=None) is False)
-    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='idmod', allowed_chars=None) is False)
-    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='idmod', allowed_chars=['\u00aa', '\u00b5', '\u0133']) is True)
-
-def test_safe_strings():
-    assert(is_safe_string('facebook', level='ascii', allowed_chars=None) is True)
-
-    assert(is_safe_string(PAULO_STRING, level='ascii', allowed_chars=None) is False)
-    assert(is_safe_string(PAULO_STRING, level='latin', allowed_chars=None) is True)
-
-    assert (is_safe_string(MONTREAL_STRING, level='ascii', allowed_chars=None) is False)
-    assert (is_safe_string(MONTREAL_STRING, level='latin', allowed_chars=None) is True)
-
-    assert(is_safe_string(INTENTIONAL_FACEBOOK_STR, level='ascii', allowed_chars=None) is False)
-    assert(is_safe_string(INTENTIONAL_FACEBOOK_STR, level='unrestricted', allowed_chars=None) is True)
-
-    assert (is_safe_string('\xe9', level='ascii', allowed_chars=None) is False)
-    assert (is_safe_string('\xe9', level='latin', allowed_chars=None) is True)
-
-    assert (is_safe_string('\xe9\u0300', level='latin', allowed_chars=None) is False) # \u0300 in Diacriticals
-    assert (is_safe_string('\xe9\u0300', level='latin', allowed_chars=['\u0300']) is True)
-
-    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='ascii', allowed_chars=None) is False)
-    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='latin', allowed_chars=None) is False)
-    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='allowed', allowed_chars=None) is False)
-    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='unrestricted', allowed_chars=None) is True)
-
-    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='ascii', allowed_chars=None) is False)
-    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='latin', allowed_chars=None) is True)
-    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='allowed', allowed_chars=None) is False)
-    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='unrestricted', allowed_chars=None) is True)
-
-    assert (is_safe_string(ALLOWED_STRING, level='allowed', allowed_chars=None) is True)
-    assert (is_safe_string(NOT_ALLOWED_STRING, level='allowed', allowed_chars=None) is False)
-    assert (is_safe_string(NOT_ALLOWED_STRING, level='allowed', allowed_chars=['\u00AA']) is True)
-
-
-# def find_prog_not_idmod():
-#     # utility function to find characters that are valid in programming IDs (XID_Start or XID_Continue) but not
-#     #   for idmod (i.e. not in an allowed indentifier_status block
-#     exceptions = []
-#     for c in repertoire_map.keys():
-#         uc = get_unicode_char(c, repertoire_map)
-#         in_idr = in_identifier_range(chr(c))
-#         if uc.xid_continue == 1 and not in_idr:
-#             exceptions.append(c)
-#     return exceptions
-
-
-if __name__ == '__main__':
-    test_is_intentional_confusion()
-    test_fix_intentional_confusion()
-    test_show_intentional_confusion()
-    test_block_map(block_map)
-    test_reserved_block()
-    test_identifiers()
-    test_safe_strings()
\ No newline at end of file
+"""
+Read Unicode UCD format
+
+Test files created by parse_unicode_dot_org_files.
+
+
+TODO
+    - test repertoire_map - non_char, math, etc.
+    - how to get which reserved block a character is in?
+
+"""
+
+import json
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from repertoire_map import repertoire_map
+from intentional_map import intentional_map
+from block_map import block_map
+from identifier_status_map import identifier_status_map
+
+from more_unicodedata import is_intentional_confusion, fix_intention_confusion, show_intentional_confusion
+from more_unicodedata import skeleton, is_confusable, fix_sequence_confusion, show_sequence_confusion
+from more_unicodedata import in_block, blocks
+from more_unicodedata import get_script, get_script_extensions, resolved_script_set, is_mixed_script
+from more_unicodedata import restriction_level
+from more_unicodedata import analyze, block_names_from_mask, identifier_types_from_mask
+from more_unicodedata import first_violation, iter_violations, first_identifier_violation, iter_identifier_violations
+from more_unicodedata import first_reserved, iter_reserved
+from more_unicodedata import ABORTED
+from more_unicodedata import get_bidi_class, direction_profile, is_mixed_direction
+from more_unicodedata import iter_graphemes, iter_grapheme_spans, show_grapheme_confusion
+from more_unicodedata import emoji_properties, is_emoji, is_emoji_presentation, is_emoji_modifier
+from more_unicodedata import is_emoji_modifier_base, is_emoji_component, is_extended_pictographic, emoji_char_set
+from more_unicodedata import emoji_sequence_type, iter_emoji_sequences, replace_emoji_sequences
+from more_unicodedata import is_safe_bytes, first_byte_violation, iter_byte_violations
+from more_unicodedata import is_safe_identifier_bytes, iter_identifier_byte_violations
+from more_unicodedata_utf8 import iter_utf8, is_valid_utf8
+from more_unicodedata_policy import IdentifierAutomaton, IdentifierValidator
+from more_unicodedata_document import DocumentChecker
+from more_unicodedata_cli import lint_source, run_cached, _lint_file, main as cli_main
+from more_unicodedata_cli import scan_text, _scan_file, load_cache
+from more_unicodedata_bidi import iter_bidi_violations, first_bidi_violation, is_safe_bidi, has_bidi_controls
+from more_unicodedata_index import ConfusableIndex, SqliteConfusableIndex, SkeletonBloomFilter
+from more_unicodedata_matcher import SequenceAutomaton
+from more_unicodedata_policy import SafetyPolicy
+from more_unicodedata_tables import CharSet, RangeIndex
+# from more_unicodedata import get_unicode_char
+from more_unicodedata import in_reserved, is_safe_identifier, in_identifier_range, is_safe_string
+
+PAULO_STRING = b'S\xe30 Paulo'.decode('cp1252')
+MONTREAL_STRING = b'Montr\xe9al'.decode('cp1252')
+INTENTIONAL_FACEBOOK_STR = 'f\u0430\u0441\u0435bo\u03bfk'
+INTENTIONAL_BIGBIRD_STR = '\u1d2e\u1d35\u1d33\u1d2e\u1d35\u1d3f\u1d30'
+RESERVED_STRING = '\u03A2\u0530\u05EB\u05EC\u05EE'
+PROG_NOT_IDMOD_STRING_1 = '\u00aa\u00b5\u0133'
+PROG_NOT_IDMOD_STRING_2 = 'h\u00aa\u00b5\u0133'
+ALLOWED_STRING = '\u00c0\u00c1\u00d6'
+NOT_ALLOWED_STRING = '\u00c0\u00c1\u00d6\u00aa'
+OUT_OF_RANGE_STRING_1 = '\u7465\u12354'
+OUT_OF_RANGE_STRING_2 = '\u2CEB1'
+
+
+def test_is_intentional_confusion():
+    assert(is_intentional_confusion('\u0430') is True)
+    assert(is_intentional_confusion('f') is False)
+    assert(is_intentional_confusion('\xe9') is False)
+    assert(is_intentional_confusion('facebook') is False)
+    assert(is_intentional_confusion(INTENTIONAL_FACEBOOK_STR) is True)
+    assert(is_intentional_confusion(INTENTIONAL_BIGBIRD_STR) is False)  # it's not safe but not in the list!
+    assert(is_intentional_confusion(RESERVED_STRING) is False)
+    assert(is_intentional_confusion(OUT_OF_RANGE_STRING_1) is False)
+    assert(is_intentional_confusion(OUT_OF_RANGE_STRING_2) is False)
+
+
+def test_fix_intentional_confusion():
+    ds = fix_intention_confusion('\u0430')
+    assert (ds == 'a')
+
+    ds = fix_intention_confusion('\xe9')
+    assert (ds == '\xe9')
+
+    ds = fix_intention_confusion('f')
+    assert (ds == 'f')
+
+    bad_str_1 = '\u0391\u0392\u0421\u0430\u01c3'  # ABCa!
+    good_str = fix_intention_confusion(bad_str_1)
+    assert (good_str == 'ABCa!')
+
+    str_2 = b'S\xe30 Paulo'.decode('cp1252')
+    good_str = fix_intention_confusion(PAULO_STRING)
+    assert (good_str == PAULO_STRING)
+
+    str_3 = b'Montr\xe9al'.decode('cp1252')
+    good_str = fix_intention_confusion(MONTREAL_STRING)
+    assert (good_str == MONTREAL_STRING)
+
+    good_str = fix_intention_confusion(INTENTIONAL_FACEBOOK_STR)
+    assert (good_str == 'facebook')
+
+    good_str = fix_intention_confusion(INTENTIONAL_BIGBIRD_STR)
+    assert (good_str != 'BIGBIRD')  # fails -- MODIFIER LETTER CAPITAL B not in intention.txt - get caugjt with NOT_XID in indentifyertype?
+
+
+def test_show_intentional_confusion():
+    a = show_intentional_confusion('\u0430')
+    assert (len(a)==1)
+
+    a = show_intentional_confusion('f')
+    assert (len(a)==0)
+
+    a = show_intentional_confusion(INTENTIONAL_FACEBOOK_STR)
+    assert (len(a) == 4)
+
+    a = show_intentional_confusion(INTENTIONAL_BIGBIRD_STR) # confusing but no chars in intentional list
+    assert (len(a) == 0)
+
+
+def test_skeleton():
+    assert(skeleton('facebook') == skeleton(INTENTIONAL_FACEBOOK_STR))
+    assert(skeleton('\u0430') == skeleton('a'))
+    assert(skeleton('') == '')
+    assert(skeleton(MONTREAL_STRING) == skeleton('Montre\u0301al'))  # NFD before and after mapping
+    assert(skeleton('rn') == skeleton('m'))  # multi-code-point prototype
+
+    assert(is_confusable('\u0391\u0392\u0421', 'ABC') is True)
+    assert(is_confusable('facebook', 'facebank') is False)
+
+
+def test_confusable_index():
+    index = ConfusableIndex.from_iterable(['facebook', 'paypal', 'google'])
+    assert(len(index) == 3)
+    assert(index.collisions(INTENTIONAL_FACEBOOK_STR) == {'facebook'})
+    assert(index.collisions('facebook') == set())  # a string doesn't collide with itself
+    assert(index.has_collision('yahoo') is False)
+
+    assert(index.add(INTENTIONAL_FACEBOOK_STR) is True)
+    assert(index.add(INTENTIONAL_FACEBOOK_STR) is False)
+    assert(index.collisions('facebook') == {INTENTIONAL_FACEBOOK_STR})
+    assert(index.collisions('f\u0430cebook') == {'facebook', INTENTIONAL_FACEBOOK_STR})
+
+    index.remove('facebook')
+    assert('facebook' not in index)
+    assert(index.collisions('facebook') == {INTENTIONAL_FACEBOOK_STR})
+    index.discard(INTENTIONAL_FACEBOOK_STR)
+    assert(index.has_collision('facebook') is False)
+
+    index.compact()
+    assert(set(index) == {'paypal', 'google'})
+    assert(index.collisions('p\u0430yp\u0430l') == {'paypal'})
+
+    # prototypes of more than one code point, and ascii confusables
+    index.add('modern')
+    assert(index.collisions('rnodern') == {'modern'})
+    assert(index.collisions('paypa1') == {'paypal'} and index.collisions('paypaI') == {'paypal'})
+
+
+def test_sqlite_confusable_index():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'names.db')
+
+        with SqliteConfusableIndex(path, batch_size=2) as index:
+            assert(index.add_many(['facebook', 'paypal', 'google', 'paypal']) == 3)
+            assert(index.add('yahoo') is True)
+            assert(index.add('yahoo') is False)
+            assert(len(index) == 4)
+            assert(index.needs_rebuild() is False)
+            assert(index.collisions(INTENTIONAL_FACEBOOK_STR) == {'facebook'})
+            assert(index.collisions('facebook') == set())
+            index.remove('yahoo')
+            assert('yahoo' not in index)
+            index.add('modern')
+            assert(index.collisions('rnodern') == {'modern'} and index.collisions('paypa1') == {'paypal'})
+
+            # simulate skeletons computed with older data
+            with index._con:
+                index._con.execute("UPDATE meta SET value = '10.0.0' WHERE key = 'data_version'")
+                index._con.execute("UPDATE strings SET skeleton = 'x' WHERE string = 'paypal'")
+            assert(index.needs_rebuild() is True)
+            assert(index.rebuild() == 1)
+            assert(index.needs_rebuild() is False)
+            assert(index.has_collision('p\u0430yp\u0430l') is True)
+
+            index.build_prefilter()
+            assert(index.collisions(INTENTIONAL_FACEBOOK_STR) == {'facebook'})
+            index.add('google')
+            assert(index.has_collision('g\u03bf\u03bfgle') is True)
+
+        with SqliteConfusableIndex(path, read_only=True) as reader:
+            assert(reader.collisions(INTENTIONAL_FACEBOOK_STR) == {'facebook'})
+            assert(reader.has_collision('yahoo') is False)
+            assert(reader.has_collision('rnodern') is True)
+
+
+def test_skeleton_bloom_filter():
+    names = [f'user{i}' for i in range(1000)]
+    bf = SkeletonBloomFilter(len(names), error_rate=0.01)
+    bf.update(skeleton(n) for n in names)
+    assert(all(skeleton(n) in bf for n in names))  # no false negatives
+
+    false_positives = sum(skeleton(f'other{i}') in bf for i in range(10000))
+    assert(false_positives < 300)
+
+    bf2 = SkeletonBloomFilter.from_bytes(bf.to_bytes())
+    assert(all(skeleton(n) in bf2 for n in names))
+    assert(bf2.to_bytes() == bf.to_bytes())
+
+    for capacity, error_rate in ((2 ** 32, 0.01), (10, 1e-100)):  # too big for the header
+        try:
+            SkeletonBloomFilter(capacity, error_rate=error_rate)
+            assert(False)
+        except ValueError:
+            pass
+
+    index = ConfusableIndex(['facebook', 'paypal', 'modern'])
+    bf = index.build_prefilter(error_rate=0.001)
+    assert(all(skeleton(s) in bf for s in index))  # the filter's keys are the index's skeletons
+    assert(index.collisions(INTENTIONAL_FACEBOOK_STR) == {'facebook'})
+    assert(index.collisions('rnodern') == {'modern'} and index.has_collision('paypa1') is True)
+    index.add('google')
+    assert(index.has_collision('g\u03bf\u03bfgle') is True)
+    assert(index.has_collision('yahoo') is False)
+
+
+def test_sequence_automaton():
+    sa = SequenceAutomaton({'a': 1, 'ab': 2, 'bc': 3, 'abcd': 4})
+    assert(sa.find_all('abc') == [(0, 2, 2)])  # leftmost-longest, no overlaps
+    assert(sa.find_all('xabcdbc') == [(1, 5, 4), (5, 7, 3)])
+    assert(sa.find_all('abx') == [(0, 2, 2)])
+    assert(sa.find_all('') == [])
+    assert(sa.contains_match('xyz') is False)
+    assert(sa.replace('zabcz', lambda v: str(v)) == 'z2cz')
+
+
+def test_sequence_confusion():
+    assert(fix_sequence_confusion(INTENTIONAL_FACEBOOK_STR) == 'facebook')
+    assert(fix_sequence_confusion('facebook') == 'facebook')
+    assert(fix_sequence_confusion(MONTREAL_STRING) == MONTREAL_STRING)
+
+    a = show_sequence_confusion('modern')
+    assert((0, 1, 'm', ('rn',)) in a)
+    assert([(t[0], t[1], t[2]) for t in a] == [(0, 1, 'm'), (4, 6, 'rn')] and 'm' in a[1][3])
+
+    a = show_sequence_confusion(INTENTIONAL_FACEBOOK_STR)
+    assert([t[0] for t in a if t[1] - t[0] == 1 and t[2] > '\x7f'] == [1, 2, 3, 6])
+
+
+def test_block_map(block_map):
+    assert(in_block('facebook', "Basic Latin")==True)
+    assert(in_block(INTENTIONAL_FACEBOOK_STR[1:3], "Cyrillic")==True)
+    assert(in_block(INTENTIONAL_BIGBIRD_STR, "Phonetic Extensions")==True)
+    assert(in_block('\xe9', "Latin-1 Supplement")==True)
+    assert(in_block('\xe9', "Basic Latin")==False)
+
+    bs = blocks('facebook')
+    assert(bs=={'ASCII'})
+
+    bs = blocks(INTENTIONAL_FACEBOOK_STR)
+    assert (bs == {'Cyrillic', 'ASCII', 'Greek'})
+
+    bs = blocks(INTENTIONAL_BIGBIRD_STR)
+    assert (bs == {'Phonetic_Ext'})
+
+    bs = blocks('\xe9')
+    assert (bs == {'Latin_1_Sup'})
+
+
+def test_scripts():
+    assert(get_script('a') == 'Latn')
+    assert(get_script('\u0430') == 'Cyrl')
+    assert(get_script('1') == 'Zyyy')
+    assert(get_script('\u0378') == 'Zzzz')  # unassigned
+    assert(get_script_extensions('\u0660') == {'Arab', 'Thaa'})
+
+    assert('Latn' in resolved_script_set('facebook'))
+    assert(resolved_script_set(INTENTIONAL_FACEBOOK_STR) == set())
+    assert(is_mixed_script(INTENTIONAL_FACEBOOK_STR) is True)
+    assert(is_mixed_script(MONTREAL_STRING) is False)
+    assert(is_mixed_script('Montre\u0301al') is False)  # inherited combining mark
+    assert(is_mixed_script('\u0661\u0662\u0628') is False)  # Arabic-Indic digits with Arabic letter
+    assert(resolved_script_set('123') >= {'Latn', 'Cyrl', 'Grek'})  # Common is in every script
+    assert(not resolved_script_set('1\u0301') & {'Zzzz', 'Zyyy', 'Zinh'})  # no pseudo scripts for Common/Inherited
+    assert(resolved_script_set('\u30ab\u30fc\u304b\u6f22') == {'Jpan'})  # Katakana, Hiragana and Han
+    assert(resolved_script_set('\uac00\u6f22') == {'Kore'})
+    assert(is_mixed_script('\u30ab\uac00') is True)
+
+
+def test_restriction_level():
+    assert(restriction_level('facebook') == 'ascii_only')
+    assert(restriction_level('face book!') == 'ascii_only')
+    assert(restriction_level(MONTREAL_STRING) == 'single_script')
+    assert(restriction_level('\u0430\u0431') == 'single_script')
+    assert(restriction_level('abc\u6f22') == 'highly_restrictive')
+    assert(restriction_level('abc\u6f22\u304b\u30ab') == 'highly_restrictive')
+    assert(restriction_level('abc\uac00\u6f22') == 'highly_restrictive')
+    assert(restriction_level('abc\u0915') == 'moderately_restrictive')
+    assert(restriction_level(INTENTIONAL_FACEBOOK_STR) == 'minimally_restrictive')  # Latin, Cyrillic and Greek
+    assert(restriction_level('abc\u0915\u0628') == 'minimally_restrictive')
+    assert(restriction_level('Montr\xe9al!') == 'unrestricted')  # ! is not in the identifier profile
+    assert(restriction_level('\u0378') == 'unrestricted')
+
+
+def test_reserved_block():
+    assert(in_reserved('facebook')==False)
+    assert(in_reserved(RESERVED_STRING)==True)
+    assert(in_reserved('\u0378')==True)
+
+def test_identifiers():
+    result = is_safe_identifier('facebook', level='ascii', allowed_chars=None)
+    assert(result)
+
+    result = is_safe_identifier(INTENTIONAL_FACEBOOK_STR, level='ascii', allowed_chars=None) is True
+    assert (result is False)
+
+    assert(is_safe_identifier('\xe9', level='ascii', allowed_chars=None) is False)
+    assert(is_safe_identifier('\xe9\xe9', level='programming', allowed_chars=None) is True)
+    # assert(is_identifier('\xe9\u00F1', level='programming', allowed_chars=None) is False)
+
+    assert(is_safe_identifier('\xe9\u0300', level='ascii', allowed_chars=None) is False)
+    assert(is_safe_identifier('\xe9\u0300', level='programming', allowed_chars=None) is True)
+
+    assert(is_safe_identifier(OUT_OF_RANGE_STRING_1, level='ascii', allowed_chars=None) is False)
+    # U+7465 is inside the CJK Unified Ideographs range entry of the repertoire, and is XID_Start like the rest of it
+    assert(is_safe_identifier(OUT_OF_RANGE_STRING_1, level='programming', allowed_chars=None) is True)
+    assert(is_safe_identifier(OUT_OF_RANGE_STRING_1, level='idmod', allowed_chars=None) is True)
+    assert(is_safe_identifier(OUT_OF_RANGE_STRING_2, level='idmod', allowed_chars=None) is False)
+
+    assert(is_safe_identifier('\u0100', level='ascii', allowed_chars=None) is False)
+    assert(is_safe_identifier('\u0100', level='ascii', allowed_chars=['\u0100']) is True)
+    assert(is_safe_identifier('\u0100', level='programming', allowed_chars=None) is True)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_1, level='programming', allowed_chars=None) is True)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='programming', allowed_chars=None) is True)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_1, level='idmod', allowed_chars=None) is False)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='idmod', allowed_chars=None) is False)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='idmod', allowed_chars=['\u00aa', '\u00b5', '\u0133']) is True)
+
+def test_safe_strings():
+    assert(is_safe_string('facebook', level='ascii', allowed_chars=None) is True)
+
+    assert(is_safe_string(PAULO_STRING, level='ascii', allowed_chars=None) is False)
+    assert(is_safe_string(PAULO_STRING, level='latin', allowed_chars=None) is True)
+
+    assert (is_safe_string(MONTREAL_STRING, level='ascii', allowed_chars=None) is False)
+    assert (is_safe_string(MONTREAL_STRING, level='latin', allowed_chars=None) is True)
+
+    assert(is_safe_string(INTENTIONAL_FACEBOOK_STR, level='ascii', allowed_chars=None) is False)
+    assert(is_safe_string(INTENTIONAL_FACEBOOK_STR, level='unrestricted', allowed_chars=None) is True)
+
+    assert (is_safe_string('\xe9', level='ascii', allowed_chars=None) is False)
+    assert (is_safe_string('\xe9', level='latin', allowed_chars=None) is True)
+
+    assert (is_safe_string('\xe9\u0300', level='latin', allowed_chars=None) is False) # \u0300 in Diacriticals
+    assert (is_safe_string('\xe9\u0300', level='latin', allowed_chars=['\u0300']) is True)
+
+    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='ascii', allowed_chars=None) is False)
+    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='latin', allowed_chars=None) is False)
+    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='allowed', allowed_chars=None) is True)  # all Recommended
+    assert (is_safe_string(OUT_OF_RANGE_STRING_1, level='unrestricted', allowed_chars=None) is True)
+
+    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='ascii', allowed_chars=None) is False)
+    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='latin', allowed_chars=None) is True)
+    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='allowed', allowed_chars=None) is False)
+    assert (is_safe_string(PROG_NOT_IDMOD_STRING_1, level='unrestricted', allowed_chars=None) is True)
+
+    assert (is_safe_string(ALLOWED_STRING, level='allowed', allowed_chars=None) is True)
+    assert (is_safe_string(NOT_ALLOWED_STRING, level='allowed', allowed_chars=None) is False)
+    assert (is_safe_string(NOT_ALLOWED_STRING, level='allowed', allowed_chars=['\u00AA']) is True)
+
+
+def test_safety_policy():
+    strings = ['facebook', PAULO_STRING, MONTREAL_STRING, INTENTIONAL_FACEBOOK_STR, '\xe9\u0300', OUT_OF_RANGE_STRING_2,
+               PROG_NOT_IDMOD_STRING_1, ALLOWED_STRING, NOT_ALLOWED_STRING, '', '\U0002a700\U0001d400']
+
+    for level in ('ascii', 'latin', 'allowed', 'unrestricted'):
+        policy = SafetyPolicy(level=level)
+        assert(policy.check_many(strings) == [is_safe_string(s, level=level) for s in strings])
+
+    # identifier types are looked up by range, so characters in large ranges (e.g. CJK) are found
+    assert(SafetyPolicy(level='allowed').check('\u7465\u1235') is True)
+
+    policy = SafetyPolicy(level='latin', allowed_chars=['\u0300'])
+    assert(policy.check('\xe9\u0300') is True)
+    assert(policy.first_violation('abc\u0430') == (3, 0x430, 'not_latin'))
+    assert(policy.first_violation('abc') is None)
+
+    policy = SafetyPolicy(level='unrestricted', banned_types=['not_XID'])
+    assert(policy.check('facebook') is True)
+    assert(policy.first_violation('face book') == (4, 0x20, 'banned_type'))
+
+    policy = SafetyPolicy(level='allowed', allowed_chars=['\u00aa'])
+    policy2 = pickle.loads(pickle.dumps(policy))
+    assert(policy2.check(NOT_ALLOWED_STRING) is True)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'policy.pickle')
+        policy.save(path)
+        policy3 = SafetyPolicy.load(path)
+        assert(policy3.check_many([ALLOWED_STRING, PROG_NOT_IDMOD_STRING_1]) == [True, False])
+
+
+def test_charset():
+    cs = CharSet('abc', ranges=[('x', 'z'), (0x400, 0x4ff)])
+    assert('a' in cs and 'y' in cs and '\u0430' in cs and 0x430 in cs)
+    assert('d' not in cs and 'ab' not in cs and '\u0500' not in cs)
+    assert(len(cs) == 6 + 256)
+    assert(cs.ranges == ((0x61, 0x63), (0x78, 0x7a), (0x400, 0x4ff)))
+
+    cyrillic = CharSet(blocks=['Cyrillic'])
+    assert(cs & cyrillic == cyrillic)
+    assert((cs - cyrillic) == CharSet('abcxyz'))
+    assert((CharSet('ab') | CharSet('bc')) == CharSet(ranges=[('a', 'c')]))
+    assert(not (CharSet('ab') & CharSet('cd')))
+    assert(pickle.loads(pickle.dumps(cs)) == cs)
+
+    recommended = CharSet(identifier_types=['recommended'])
+    assert('a' in recommended and '\u00aa' not in recommended)
+
+    # works as allowed_chars
+    assert(is_safe_string('\xe9\u0300', level='latin', allowed_chars=CharSet(blocks=['Combining Diacritical Marks'])) is True)
+    assert(is_safe_string(NOT_ALLOWED_STRING, level='allowed', allowed_chars=CharSet('\u00aa')) is True)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='idmod', allowed_chars=CharSet('\u00aa\u00b5\u0133')) is True)
+    assert(SafetyPolicy(level='ascii', allowed_chars=cyrillic).check(INTENTIONAL_FACEBOOK_STR[:3]) is True)
+
+
+def test_analyze():
+    r = analyze(INTENTIONAL_FACEBOOK_STR)
+    assert(r.length == len(INTENTIONAL_FACEBOOK_STR))
+    assert(r.confusable_positions == tuple(t[0] for t in show_intentional_confusion(INTENTIONAL_FACEBOOK_STR)))
+    assert(r.blocks == blocks(INTENTIONAL_FACEBOOK_STR))
+    assert(block_names_from_mask(r.block_mask) == {'Basic Latin', 'Cyrillic', 'Greek and Coptic'})
+    assert(r.reserved_positions == r.surrogate_positions == r.noncharacter_positions == ())
+    assert('recommended' in identifier_types_from_mask(r.identifier_types_and))
+    assert(r.safety_level == 'allowed')
+
+    r = analyze('a\u0378\ud800\ufffe')
+    assert(r.reserved_positions == (1,) and r.surrogate_positions == (2,) and r.noncharacter_positions == (3,))
+    assert(r.safety_level == 'unrestricted')
+
+    r = analyze('face book')
+    assert(r.safety_level == 'ascii')
+    assert('not_XID' in identifier_types_from_mask(r.identifier_types_or))
+    assert('not_XID' not in identifier_types_from_mask(r.identifier_types_and))
+
+    for s in ('facebook', PAULO_STRING, MONTREAL_STRING, PROG_NOT_IDMOD_STRING_1, ALLOWED_STRING, NOT_ALLOWED_STRING):
+        level = analyze(s).safety_level
+        assert(is_safe_string(s, level=level) is True)
+
+    assert(analyze('\xe9\u0300', allowed_chars=['\u0300']).safety_level == 'latin')
+    assert(analyze('').safety_level == 'ascii')
+
+
+def test_violations():
+    assert(first_violation('facebook', level='ascii') is None)
+    assert(first_violation(INTENTIONAL_FACEBOOK_STR, level='ascii') == (1, 0x0430, 'not_ascii'))
+    assert([v.index for v in iter_violations(INTENTIONAL_FACEBOOK_STR, level='ascii')] == [1, 2, 3, 6])
+    assert(list(iter_violations(INTENTIONAL_FACEBOOK_STR, level='unrestricted')) == [])
+    assert(first_violation(MONTREAL_STRING, level='latin') is None)
+    assert(first_violation(INTENTIONAL_FACEBOOK_STR, level='latin').reason == 'not_latin')
+    assert(first_violation(NOT_ALLOWED_STRING, level='allowed') == (3, 0x00aa, 'not_allowed'))
+    assert(first_violation('\u0100', level='ascii', allowed_chars=['\u0100']) is None)
+
+    for s in ('facebook', PAULO_STRING, MONTREAL_STRING, INTENTIONAL_FACEBOOK_STR, PROG_NOT_IDMOD_STRING_1,
+              ALLOWED_STRING, NOT_ALLOWED_STRING, OUT_OF_RANGE_STRING_2):
+        for level in ('ascii', 'latin', 'allowed', 'unrestricted'):
+            assert((first_violation(s, level=level) is None) == is_safe_string(s, level=level))
+
+    # the allowed level is checked the same way by both: at the edges and middle of each identifier_status_map range
+    assert(is_safe_string("don't", level='allowed') and first_violation("don't", level='allowed') is None)
+    code_points = {0x0378, 0x6f22, 0xd800, 0xfffe, 0x20000, 0x10ffff}
+    for first, last, _ in identifier_status_map.values():
+        last = first if last is None else last
+        code_points.update((first - 1, first, (first + last) // 2, last, last + 1))
+    for cp in code_points:
+        c = chr(cp)
+        assert(is_safe_string(c, level='allowed') == (first_violation(c, level='allowed') is None))
+
+    # stops at the first violation
+    violations = iter_violations(c for c in 'ab\u0430' + '\ud800' * 10)
+    assert(next(violations).index == 2)
+
+    assert(first_identifier_violation('facebook') is None)
+    assert(first_identifier_violation('1abc', level='programming') == (0, ord('1'), 'not_xid_start'))
+    assert(first_identifier_violation('ab-c', level='programming') == (2, ord('-'), 'not_xid_continue'))
+    assert(first_identifier_violation('ab-c', level='programming', allowed_chars='-') is None)
+    assert(first_identifier_violation(PROG_NOT_IDMOD_STRING_2, level='programming') is None)
+    assert([v.index for v in iter_identifier_violations(PROG_NOT_IDMOD_STRING_2, level='idmod')] == [1, 2, 3])
+
+    # an empty string isn't a programming identifier
+    assert(first_identifier_violation('', level='programming') == (0, None, 'empty'))
+    assert(list(iter_identifier_violations('', level='programming')) == [(0, None, 'empty')])
+    assert(first_identifier_violation('') is None and first_identifier_violation('', level='idmod') is None)
+
+    try:
+        first_identifier_violation('abc', level='latin')
+        assert(False)
+    except ValueError:
+        pass
+
+    assert(first_reserved('abc') is None)
+    assert(list(iter_reserved('a\u0378\ud800\ufffe')) == [(1, 0x0378, 'reserved'), (2, 0xd800, 'surrogate'),
+                                                           (3, 0xfffe, 'noncharacter')])
+
+
+def test_bounded():
+    long_str = '\U0001d5ba' * 100000
+
+    assert(is_safe_string('facebook', level='ascii', max_len=10) is True)
+    assert(is_safe_string(long_str, level='latin', max_len=10) is ABORTED)
+    assert(blocks(long_str, max_len=10) is ABORTED)
+    assert(is_confusable('facebook', long_str, max_len=10) is ABORTED)
+    assert(list(iter_violations(long_str, max_len=10)) == [ABORTED])
+
+    # deadline already passed, or a budget too small to finish
+    assert(show_intentional_confusion(INTENTIONAL_FACEBOOK_STR, deadline=time.monotonic() - 1) is ABORTED)
+    assert(show_intentional_confusion(long_str, budget=0.0) is ABORTED)
+    assert(analyze(long_str * 10, budget=0.001) is ABORTED)
+    assert(first_violation(INTENTIONAL_FACEBOOK_STR, budget=10) == (1, 0x0430, 'not_ascii'))
+    assert(list(iter_reserved('a\u0378', budget=10)) == [(1, 0x0378, 'reserved')])
+
+    # results are the same as unbounded calls, and strings returned are plain str
+    assert(fix_intention_confusion(INTENTIONAL_FACEBOOK_STR, budget=10) == 'facebook')
+    assert(type(fix_sequence_confusion('facebook', budget=10)) is str)
+    assert(restriction_level(INTENTIONAL_FACEBOOK_STR, deadline=time.monotonic() + 10) ==
+           restriction_level(INTENTIONAL_FACEBOOK_STR))
+
+    # the compiled policies, the collision indexes and the bidi checks take the same arguments
+    policy = SafetyPolicy(level='latin')
+    assert(policy.check(long_str, max_len=10) is ABORTED and policy.check(MONTREAL_STRING, max_len=10) is True)
+    assert(policy.first_violation(long_str, deadline=time.monotonic() - 1) is ABORTED)
+    assert(list(policy.iter_violations(long_str, budget=0.0)) == [ABORTED])
+    assert(policy.check_many(['facebook', long_str], max_len=10) == [True, ABORTED])
+    index = ConfusableIndex(['facebook'])
+    assert(index.collisions(long_str, max_len=10) is ABORTED and index.has_collision(long_str, max_len=10) is ABORTED)
+    assert(index.collisions(INTENTIONAL_FACEBOOK_STR, budget=10) == {'facebook'})
+    assert(is_safe_bidi('\u202e' * 1000, max_len=10) is ABORTED)
+    assert(is_safe_bidi(b'\xe2\x80\xae' * 1000, max_len=10) is ABORTED)
+    assert(list(iter_bidi_violations('a\u202e', deadline=time.monotonic() - 1)) == [ABORTED])
+    assert(first_bidi_violation('a\u202e', budget=10) == (1, 0x202e, 'unterminated_bidi'))
+    assert(has_bidi_controls('x' * 100, marks=True, max_len=10) is ABORTED)
+
+    try:
+        if is_safe_string(long_str, max_len=10):
+            pass
+        assert(False)
+    except TypeError:
+        pass
+
+
+def test_utf8():
+    s = 'a\xe9\u0800\uffff\U00010000\U0010ffff'
+    b = s.encode('utf-8')
+    assert([cp for offset, cp, error in iter_utf8(b)] == [ord(c) for c in s])
+    assert([offset for offset, cp, error in iter_utf8(b)] == [0, 1, 3, 6, 9, 13])
+    assert(is_valid_utf8(b) and is_valid_utf8(bytearray(b)) and is_valid_utf8(memoryview(b)))
+
+    bad = b'a\xed\xa0\x80b\xc0\xafc\xe0\x80\x80d\xc3e\x80\x80f\xf4\x90\x80\x80g\xe2\x82'
+    assert([(offset, error) for offset, cp, error in iter_utf8(bad) if error] ==
+           [(1, 'surrogate'), (5, 'overlong'), (8, 'overlong'), (12, 'ill_formed'), (14, 'ill_formed'),
+            (17, 'ill_formed'), (22, 'ill_formed')])
+    assert(bytes(cp for offset, cp, error in iter_utf8(bad) if not error) == b'abcdefg')
+
+    for b in (b'\xc0\x80', b'\xed\xbf\xbf', b'\xf4\x90\x80\x80', b'\xf8\x88\x80\x80\x80', b'\xe0\xa0'):
+        assert(is_valid_utf8(b) is False)
+
+
+def test_safe_bytes():
+    for s in ('facebook', PAULO_STRING, MONTREAL_STRING, INTENTIONAL_FACEBOOK_STR, NOT_ALLOWED_STRING):
+        for level in ('ascii', 'latin', 'allowed', 'unrestricted'):
+            assert(is_safe_bytes(s.encode('utf-8'), level=level) is (first_violation(s, level=level) is None))
+
+    b = INTENTIONAL_FACEBOOK_STR.encode('utf-8')
+    assert(first_byte_violation(b, level='ascii') == (1, 0x0430, 'not_ascii'))
+    assert([v.index for v in iter_byte_violations(b, level='latin')] == [1, 3, 5, 9])
+    assert(is_safe_bytes(b, level='ascii', allowed_chars='\u0430\u0441\u0435\u03bf') is True)
+
+    assert(is_safe_bytes(b'ab\xc0\xafcd', level='unrestricted') is False)
+    assert(first_byte_violation(b'ab\xed\xa0\x80', level='unrestricted') == (2, None, 'surrogate'))
+    assert(is_safe_bytes(b'x' * 100, max_len=10) is ABORTED)
+
+    assert(is_safe_identifier_bytes(b'facebook') is True)
+    assert(is_safe_identifier_bytes(b'1abc', level='programming') is False)
+    assert(is_safe_identifier_bytes(PROG_NOT_IDMOD_STRING_2.encode('utf-8'), level='programming') is True)
+    assert([v.index for v in iter_identifier_byte_violations(PROG_NOT_IDMOD_STRING_2.encode('utf-8'),
+                                                             level='idmod')] == [1, 3, 5])
+
+    # the str and bytes checks agree on empty input
+    for level in ('ascii', 'programming', 'idmod'):
+        assert(is_safe_identifier_bytes(b'', level) == is_safe_identifier('', level))
+        assert(is_safe_identifier_bytes(memoryview(b''), level) == is_safe_identifier('', level))
+    assert(list(iter_identifier_byte_violations(b'', level='programming')) == [(0, None, 'empty')])
+
+
+def test_code_point_paths():
+    # ascii, BMP, astral and lone surrogate strings give the same results on the ascii, UTF-32 and deadline paths
+    strings = ('facebook', INTENTIONAL_FACEBOOK_STR, MONTREAL_STRING, RESERVED_STRING, 'a\U0001d5ba\ud800\u0378',
+               INTENTIONAL_FACEBOOK_STR * 300)
+    deadline = time.monotonic() + 60
+
+    for s in strings:
+        for func in (is_intentional_confusion, show_intentional_confusion, in_reserved, resolved_script_set,
+                     restriction_level, analyze, first_reserved):
+            assert(func(s) == func(s, deadline=deadline))
+        assert(list(iter_violations(s, level='latin')) == list(iter_violations(s, level='latin', deadline=deadline)))
+
+    assert(blocks(INTENTIONAL_FACEBOOK_STR * 300) == blocks(INTENTIONAL_FACEBOOK_STR * 300, deadline=deadline))
+    assert(show_intentional_confusion('\U0001d5ba' + INTENTIONAL_FACEBOOK_STR)[0][0] == 2)
+    assert(in_block('\x00\x7f', 'Basic Latin') is True and in_block('a\x80', 'Basic Latin') is False)
+    assert(is_safe_string(INTENTIONAL_FACEBOOK_STR, level='ascii', allowed_chars='\u0430\u0441\u0435\u03bf') is True)
+    assert(in_reserved('\U0010ffff') is True)  # noncharacter, after the last reserved_map key
+
+
+def test_programming_identifiers():
+    # differential test of the 'programming' level: the automaton's precomputed classes against the repertoire map for
+    # every code point
+    automaton = IdentifierAutomaton('programming')
+    repertoire_index = RangeIndex.from_map(repertoire_map, first_idx=2, last_idx=3)
+
+    for cp in range(0x110000):
+        rmc = repertoire_index.lookup(cp)
+        cls = automaton.char_class(cp)
+        assert((cls == 1) == bool(rmc and rmc[8]))
+        assert((cls in (1, 2)) == bool(rmc and (rmc[8] or rmc[9])))
+
+    assert(is_safe_identifier('', level='programming') is False)
+    assert(is_safe_identifier('abc1', level='programming') is True)
+    assert(is_safe_identifier('1abc', level='programming') is False)
+    assert(is_safe_identifier('_abc', level='programming') is False)
+    assert(is_safe_identifier('ab-c', level='programming') is False)
+    assert(is_safe_identifier('ab-c', level='programming', allowed_chars=['-']) is True)
+    assert(is_safe_identifier('\U0001d5ba\u0300', level='programming') is True)
+    assert(is_safe_identifier('\u6f22\u5b57', level='programming') is True)  # inside the CJK ideograph range
+
+
+def test_identifier_automaton():
+    for level in ('ascii', 'programming', 'idmod'):
+        for allowed_chars in (None, ['-', '\u00aa'], CharSet(ranges=[('\U0001d5ba', '\U0001d5bb')])):
+            automaton = IdentifierAutomaton(level, allowed_chars)
+            for s in ('facebook', INTENTIONAL_FACEBOOK_STR, PROG_NOT_IDMOD_STRING_1, PROG_NOT_IDMOD_STRING_2, 'ab-c',
+                      '1abc', '\U0001d5ba\u0300', 'a\U0001d5bb', ''):
+                state = automaton.run(s)
+
+                # batch, incremental (in pieces) and per code point agree
+                assert(automaton.match(s) == automaton.accepts(state))
+                assert(automaton.run(s[2:], automaton.run(s[:2])) == state)
+                step_state = automaton.START
+                for c in s:
+                    step_state = automaton.step(step_state, ord(c))
+                assert(automaton.accepts(step_state) == automaton.accepts(state))
+
+                violations = [automaton.violation_reason(ord(c), i == 0) for i, c in enumerate(s)]
+                assert(automaton.accepts(state) == (not any(violations) and (bool(s) or level != 'programming')))
+
+    automaton = IdentifierAutomaton('programming')
+    assert(automaton.run('1') == automaton.REJECT)
+    assert(automaton.run('a\u0300') == automaton.CONTINUE)
+    assert(automaton.violation_reason(ord('1'), first=True) == 'not_xid_start')
+    assert(automaton.violation_reason(ord('1')) is None)
+
+    assert(is_safe_identifier('\u0100', level='ascii', allowed_chars=['\u0100']) is True)
+    assert(is_safe_identifier(PROG_NOT_IDMOD_STRING_2, level='idmod', allowed_chars=CharSet('\u00aa\u00b5\u0133')))
+
+
+def test_identifier_validator():
+    v = IdentifierValidator(level='programming')
+    assert(v.is_valid is False and v.first_violation() is None)
+
+    v.append('us')
+    assert(v.is_valid and v.text == 'us')
+    v.append('-')
+    assert(v.is_valid is False and v.first_violation() == (2, ord('-'), 'not_xid_continue'))
+    v.append('er')
+    assert(v.is_valid is False)
+    v.backspace(3)
+    assert(v.is_valid and v.text == 'us' and v.first_violation() is None)
+    v.update('1us')
+    assert(v.is_valid is False and v.first_violation() == (0, ord('1'), 'not_xid_start'))
+    v.update('user\u0300')
+    assert(v.is_valid and len(v) == 5)
+    v.clear()
+    assert(v.text == '' and v.is_valid is False)
+
+    # random edits agree with is_safe_identifier on the whole text
+    random.seed(42)
+    alphabet = 'ab1_-\u0300\u00aa\u0430\U0001d5ba'
+    for level in ('ascii', 'programming', 'idmod'):
+        v = IdentifierValidator(level=level, allowed_chars='-')
+        for _ in range(500):
+            edit = random.random()
+            if edit < 0.5:
+                v.append(random.choice(alphabet))
+            elif edit < 0.8:
+                v.backspace(random.randint(1, 2))
+            else:
+                text = v.text
+                i = random.randint(0, len(text))
+                v.update(text[:i] + random.choice(alphabet) + text[i:])
+
+            assert(v.is_valid == is_safe_identifier(v.text, level=level, allowed_chars='-'))
+            violation = v.first_violation()
+            expected = first_identifier_violation(v.text, level=level, allowed_chars='-')
+            assert(violation == expected or (violation is None and not v.text))
+
+
+def test_document_checker():
+    doc = DocumentChecker('ab\u0430cd\u0378', chunk_size=4)
+    assert([(f.offset, f.kind) for f in doc.findings()] == [(2, 'intentional'), (5, 'reserved')])
+    assert(doc.findings()[0].detail == 'a')
+
+    edit = doc.insert(0, 'xx')
+    assert(edit.delta == 2 and doc.text == 'xxab\u0430cd\u0378')
+    assert([f.offset for f in doc.findings()] == [4, 7])
+
+    # random edits agree with checking the whole text
+    random.seed(7)
+    alphabet = 'abc \u0430\u03bf\u0378\ud800\ufffe'
+    for chunk_size in (2, 5, 64):
+        doc = DocumentChecker(chunk_size=chunk_size)
+        findings = doc.findings()
+        for _ in range(200):
+            length = len(doc)
+            start = random.randint(0, length)
+            end = random.randint(start, min(length, start + 8))
+            text = ''.join(random.choice(alphabet) for _ in range(random.randint(0, 12)))
+            edit = doc.replace(start, end, text)
+
+            assert(len(doc) == len(doc.text))
+            findings = DocumentChecker.apply_edit(findings, edit)
+            assert(findings == doc.findings() == DocumentChecker(doc.text, chunk_size=1000).findings())
+            assert(all(len(chunk) < 2 * chunk_size for chunk in doc._chunks))
+
+    try:
+        doc.delete(0, len(doc) + 1)
+        assert(False)
+    except IndexError:
+        pass
+
+
+def test_lint_identifiers():
+    source = 'f\u0430cebook = 1\nfacebook = 2\nx\u02cay = 3\nok_\u00e9 = f\u0430cebook\n'
+    findings = lint_source(source, 'a.py')
+    assert([(f.line, f.reason, f.detail) for f in findings] == [(1, 'intentional_confusion', 'facebook'),
+                                                                (1, 'confusable_identifier', 'facebook'),
+                                                                (3, 'not_idmod', 'not_allowed')])
+    assert(lint_source(source.encode('utf-8'), 'a.py') == findings)
+    assert(lint_source('# -*- coding: latin-1 -*-\nok_\xe9 = 1\n'.encode('latin-1')) == [])
+    assert(lint_source('def f(:\n')[0].reason == 'tokenize_error')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for i in range(4):
+            paths.append(os.path.join(tmp_dir, f'm{i}.py'))
+            with open(paths[-1], 'w', encoding='utf-8') as f:
+                f.write(source if i % 2 else 'ok = 1\n')
+
+        cache_file = os.path.join(tmp_dir, 'cache.json')
+        findings = run_cached(_lint_file, paths, cache_file=cache_file, jobs=2)
+        assert([len(findings[p]) for p in paths] == [0, 3, 0, 3])
+
+        # unchanged files come from the cache
+        cached = load_cache(cache_file)
+        assert(_lint_file((paths[1], cached[paths[1]][0]))[2] is None)
+        assert(run_cached(_lint_file, paths, cache_file=cache_file, jobs=1) == findings)
+
+        assert(cli_main(['lint-identifiers', '--no-cache', '-j', '1', paths[0]]) == 0)
+        assert(cli_main(['lint-identifiers', '--cache', cache_file, '-j', '1', tmp_dir]) == 1)
+
+
+def test_scan():
+    text = 'ascii line\nf\u0430cebook \u0378 \u0149\n'
+    findings = scan_text(text, 'a.txt')
+    assert([(f.line, f.column, f.text, f.reason, f.detail) for f in findings] == [
+        (2, 1, '\u0430', 'intentional_confusion', 'a'), (2, 9, '\u0378', 'reserved', ''),
+        (2, 11, '\u0149', 'banned_type', 'deprecated,obsolete')])
+    assert(scan_text(text, 'a.txt', banned_types=()) == findings[:2])
+    assert(scan_text('just ascii\n') == [])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.mkdir(os.path.join(tmp_dir, '.hidden'))
+        contents = {'a.txt': text.encode('utf-8'), 'b.txt': b'ascii\n', 'c.bin': b'\0\x80\xff',
+                    'd.txt': b'ok\nab\xffc\n', os.path.join('.hidden', 'e.txt'): text.encode('utf-8')}
+        for name, data in contents.items():
+            with open(os.path.join(tmp_dir, name), 'wb') as f:
+                f.write(data)
+
+        paths = [os.path.join(tmp_dir, name) for name in ('a.txt', 'b.txt', 'c.bin', 'd.txt')]
+        assert(_scan_file((paths[0], None))[2] == scan_text(text, paths[0]))
+        assert(_scan_file((paths[2], None))[2] == [])
+        assert([(f.line, f.column, f.reason) for f in _scan_file((paths[3], None))[2]] == [(2, 2, 'not_utf8')])
+
+        cache_file = os.path.join(tmp_dir, 'cache.json')
+        findings = run_cached(_scan_file, paths, cache_file=cache_file, jobs=2, section='scan')
+        assert([len(findings[p]) for p in paths] == [3, 0, 0, 1])
+        assert(run_cached(_scan_file, paths, cache_file=cache_file, jobs=1, section='scan') == findings)
+
+        # sections of the cache file are kept separately
+        run_cached(_lint_file, paths[:1], cache_file=cache_file, jobs=1)
+        assert(sorted(load_cache(cache_file, 'scan')) == sorted(paths))
+        assert(sorted(load_cache(cache_file)) == paths[:1])
+
+        # a changed file is checked again
+        with open(paths[1], 'a', encoding='utf-8') as f:
+            f.write('\u0430\n')
+        os.utime(paths[1], ns=(0, 0))
+        findings = run_cached(_scan_file, paths, cache_file=cache_file, jobs=1, section='scan')
+        assert([f.reason for f in findings[paths[1]]] == ['intentional_confusion'])
+
+        assert(cli_main(['scan', '--no-cache', '-j', '1', paths[2]]) == 0)
+        assert(cli_main(['scan', '--cache', cache_file, '-j', '1', tmp_dir, '--banned-types']) == 1)
+
+
+def test_bidi():
+    # the classic Trojan Source example: an RLO in a comment that isn't closed on its line
+    source = 'access_level = "user"\nif access_level != "none\u202e \u2066// check\u2069 \u2066":\n    pass\n'
+    assert([tuple(v) for v in iter_bidi_violations(source)] == [(46, 0x202e, 'unterminated_bidi'),
+                                                                  (59, 0x2066, 'unterminated_bidi')])
+    data = source.encode('utf-8')
+    assert([(v.index, v.code_point, v.reason) for v in iter_bidi_violations(data)] ==
+           [(46, 0x202e, 'unterminated_bidi'), (65, 0x2066, 'unterminated_bidi')])
+    assert(list(iter_bidi_violations(memoryview(data))) == list(iter_bidi_violations(data)))
+
+    assert(is_safe_bidi('abc \u202bdef\u202c \u2067ghi\u2069'))
+    assert(is_safe_bidi('abc') and is_safe_bidi(b'abc \xe2\x80\x99') and is_safe_bidi(''))
+    assert(first_bidi_violation('x\u202c') == (1, 0x202c, 'unmatched_bidi'))
+    assert(first_bidi_violation('\u2069') == (0, 0x2069, 'unmatched_bidi'))
+    assert(first_bidi_violation('\u202e\u2029\u202c').reason == 'unterminated_bidi')
+
+    # a PDF can't close an embedding outside an isolate, and a PDI closes the embeddings in its isolate
+    assert([tuple(v) for v in iter_bidi_violations('\u202a\u2066\u202c\u2069\u202c')] == [(2, 0x202c, 'unmatched_bidi')])
+    assert([tuple(v) for v in iter_bidi_violations('\u2066\u202b\u2069')] == [(1, 0x202b, 'unterminated_bidi')])
+
+    # ill-formed UTF-8 around the controls doesn't matter
+    assert(first_bidi_violation(b'\xff\xe2\x80\xae\xe2') == (1, 0x202e, 'unterminated_bidi'))
+
+    assert(has_bidi_controls('a\u202ab\u202c') and not has_bidi_controls('a\u200fb'))
+    assert(has_bidi_controls('a\u200fb', marks=True) and has_bidi_controls('a\u200fb'.encode('utf-8'), marks=True))
+    assert(has_bidi_controls(b'\xe2\x81\xa9') and not has_bidi_controls(b'\xe2\x80\x99\xe2\x81\x80'))
+
+    findings = scan_text(source, 'a.py', banned_types=())
+    assert([(f.line, f.column, f.reason, f.detail) for f in findings] == [(2, 24, 'unterminated_bidi', 'RLO'),
+                                                                          (2, 37, 'unterminated_bidi', 'LRI')])
+
+
+def test_direction_profile():
+    assert([get_bidi_class(c) for c in 'a\u05d0\u0627 1\u0301\u202e\U0001e900'] == ['L', 'R', 'AL', 'WS', 'EN', 'NSM',
+                                                                                'RLO', 'R'])
+
+    profile = direction_profile('abc \u05d0\u05d1 12')
+    assert(profile.length == 9 and profile.ltr == 3 and profile.rtl == 2 and profile.direction == 'mixed')
+    assert(profile.counts == {'L': 3, 'R': 2, 'WS': 2, 'EN': 2})
+    assert(direction_profile('\u0627\u0644 1').direction == 'rtl')
+    assert(direction_profile('example.com').direction == 'ltr')
+    assert(direction_profile('123-456').direction == 'neutral')
+    assert(direction_profile('').counts == {} and direction_profile('').direction == 'neutral')
+
+    # astral characters, and the same counts one character at a time
+    s = 'a\U0001e900\u05d0\U0001f600!'
+    profile = direction_profile(s)
+    assert(profile.ltr == 1 and profile.rtl == 2 and profile.counts['ON'] == 2)
+    counts = {}
+    for c in s:
+        counts[get_bidi_class(c)] = counts.get(get_bidi_class(c), 0) + 1
+    assert(profile.counts == counts)
+
+    assert(is_mixed_direction('paypal\u05d0.com') and not is_mixed_direction('paypal.com'))
+    assert(is_mixed_direction('a' * 100 + '\u05d0', max_len=10) is ABORTED)
+
+
+def test_graphemes():
+    assert(list(iter_graphemes('ab\r\nc\n')) == ['a', 'b', '\r\n', 'c', '\n'])
+    assert(list(iter_graphemes('')) == [])
+
+    # combining marks, spacing marks and prepended characters stay with their base (GB9, GB9a, GB9b)
+    assert(list(iter_graphemes('e\u0301x\u0915\u093f\u0600\u0661')) == ['e\u0301', 'x', '\u0915\u093f', '\u0600\u0661'])
+    assert(list(iter_graphemes('\n\u0301')) == ['\n', '\u0301'])     # but not with controls (GB4)
+
+    # hangul syllables (GB6, GB7, GB8)
+    assert(list(iter_graphemes('\u1100\u1161\u11a8\uac00\u11a8\uac01\u1100')) == ['\u1100\u1161\u11a8', '\uac00\u11a8',
+                                                                                '\uac01', '\u1100'])
+
+    # emoji ZWJ sequences and modifiers (GB11), and flags (GB12, GB13)
+    family = '\U0001f468\u200d\U0001f469\u200d\U0001f467'
+    assert(list(iter_graphemes(family + '\U0001f44d\U0001f3fd!')) == [family, '\U0001f44d\U0001f3fd', '!'])
+    assert(list(iter_graphemes('a\u200d\U0001f469')) == ['a\u200d', '\U0001f469'])
+    flags = '\U0001f1fa\U0001f1f8\U0001f1eb\U0001f1f7\U0001f1ec'
+    assert(list(iter_graphemes(flags)) == [flags[0:2], flags[2:4], flags[4:]])
+
+    s = 'x\u0430\u0301y' * 3
+    assert(list(iter_grapheme_spans(s)) == [(i + j, i + k) for i in range(0, 12, 4) for j, k in ((0, 1), (1, 3), (3, 4))])
+    assert(show_grapheme_confusion('f\u0430\u0301ce') == [(1, '\u0430\u0301', 'a\u0301')])
+    assert(show_grapheme_confusion('face') == [])
+    assert(list(iter_graphemes('e\u0301' * 10, max_len=5)) == [ABORTED])
+
+
+def test_emoji_properties():
+    assert(emoji_properties('\U0001f600') == {'Emoji', 'Emoji_Presentation', 'Extended_Pictographic'})
+    assert(emoji_properties('\U0001f3fd') == {'Emoji', 'Emoji_Presentation', 'Emoji_Modifier', 'Emoji_Component'})
+    assert(emoji_properties('a') == frozenset())
+
+    assert(is_emoji('\u2764') and not is_emoji_presentation('\u2764') and is_emoji_presentation('\u231a'))
+    assert(is_emoji('7') and is_emoji_component('7') and not is_extended_pictographic('7'))
+    assert(is_emoji_modifier('\U0001f3fb') and not is_emoji_modifier('\U0001f600'))
+    assert(is_emoji_modifier_base('\u261d') and not is_emoji_modifier_base('\u2764'))
+    assert(is_emoji_component('\u200d') and not is_emoji('\u200d'))
+    assert(is_extended_pictographic('\U0001fc00') and not is_emoji('\U0001fc00'))   # reserved for future emoji
+
+    emoji = emoji_char_set()
+    assert('\U0001f600' in emoji and '\u2764' in emoji and '\u200d' not in emoji and 'a' not in emoji)
+    presentation = emoji_char_set('Emoji_Presentation')
+    assert('\u231a' in presentation and '\u2764' not in presentation)
+    assert(is_safe_string('hi \U0001f600', level='ascii', allowed_chars=emoji))
+    try:
+        emoji_char_set('Emoji_Sequence')
+        assert(False)
+    except ValueError:
+        pass
+
+
+def test_emoji_sequences():
+    family = '\U0001f468\u200d\U0001f469\u200d\U0001f467'
+    flag = '\U0001f1eb\U0001f1f7'
+    keycap = '1\ufe0f\u20e3'
+    england = '\U0001f3f4\U000e0067\U000e0062\U000e0065\U000e006e\U000e0067\U000e007f'
+
+    assert(emoji_sequence_type(family) == 'Emoji_ZWJ_Sequence')
+    assert(emoji_sequence_type(flag) == 'Emoji_Flag_Sequence')
+    assert(emoji_sequence_type('1\ufe0f\u20e3') == 'Emoji_Keycap_Sequence')
+    assert(emoji_sequence_type('\U0001f600') is None)     # single emoji aren't sequences (no Basic_Emoji in 11.0)
+    assert(emoji_sequence_type('\U0001f9d1\u200d\U0001f91d\u200d\U0001f9d1') is None)     # added in 12.0
+    assert(emoji_sequence_type(family[:3]) is None and emoji_sequence_type('a') is None)
+
+    # longest match: the family is one sequence, not three people
+    s = f'hi {family}! {flag}{keycap} {england}\U0001f44d\U0001f3fd\U0001f44d'
+    matches = list(iter_emoji_sequences(s))
+    assert([s[start:end] for start, end, _ in matches] == [family, flag, keycap, england, '\U0001f44d\U0001f3fd'])
+    assert([t for _, _, t in matches] == ['Emoji_ZWJ_Sequence', 'Emoji_Flag_Sequence', 'Emoji_Keycap_Sequence',
+                                          'Emoji_Tag_Sequence', 'Emoji_Modifier_Sequence'])
+    assert(list(iter_emoji_sequences(family + '\u200d\U0001f466'))[0][1] == 7)   # the family of four
+
+    # an unpaired regional indicator, or a ZWJ sequence that isn't RGI
+    assert(list(iter_emoji_sequences('\U0001f1eb')) == [])
+    assert(list(iter_emoji_sequences('\U0001f469\u200d\U0001f600')) == [])
+    assert(list(iter_emoji_sequences('just ascii 1')) == [] and list(iter_emoji_sequences('\u00e9t\u00e9')) == [])
+
+    assert(replace_emoji_sequences(s) == 'hi !  \U0001f44d')
+    assert(replace_emoji_sequences('a' + family + 'b', '?') == 'a?b')
+    assert(replace_emoji_sequences('caf\u00e9') == 'caf\u00e9')
+    assert(is_safe_string(replace_emoji_sequences('ok ' + flag + keycap), level='ascii'))
+
+
+# def find_prog_not_idmod():
+#     # utility function to find characters that are valid in programming IDs (XID_Start or XID_Continue) but not
+#     #   for idmod (i.e. not in an allowed indentifier_status block
+#     exceptions = []
+#     for c in repertoire_map.keys():
+#         uc = get_unicode_char(c, repertoire_map)
+#         in_idr = in_identifier_range(chr(c))
+#         if uc.xid_continue == 1 and not in_idr:
+#             exceptions.append(c)
+#     return exceptions
+
+
+if __name__ == '__main__':
+    test_is_intentional_confusion()
+    test_fix_intentional_confusion()
+    test_show_intentional_confusion()
+    test_skeleton()
+    test_confusable_index()
+    test_sqlite_confusable_index()
+    test_skeleton_bloom_filter()
+    test_sequence_automaton()
+    test_sequence_confusion()
+    test_block_map(block_map)
+    test_scripts()
+    test_restriction_level()
+    test_reserved_block()
+    test_identifiers()
+    test_safe_strings()
+    test_safety_policy()
+    test_charset()
+    test_analyze()
+    test_violations()
+    test_bounded()
+    test_utf8()
+    test_safe_bytes()
+    test_code_point_paths()
+    test_programming_identifiers()
+    test_identifier_automaton()
+    test_identifier_validator()
+    test_document_checker()
+    test_lint_identifiers()
+    test_scan()
+    test_bidi()
+    test_direction_profile()
+    test_graphemes()
+    test_emoji_properties()
+    test_emoji_sequences()